@@ -13,7 +13,7 @@ from Compiler.types import _bitint, _number, _fix, _structure, _bit, _vec, sint,
 from Compiler.types import vectorized_classmethod
 from Compiler.program import Tape, Program
 from Compiler.exceptions import *
-from Compiler import util, oram, floatingpoint, library, comparison
+from Compiler import util, floatingpoint, library, comparison
 from Compiler import instructions_base
 import Compiler.GC.instructions as inst
 import operator
@@ -1105,31 +1105,6 @@ cbits.bit_type = cbit
 sbit.clear_type = cbit
 sbits.default_type = sbits
 
-class bitsBlock(oram.Block):
-    def __init__(self, value, start, lengths, entries_per_block):
-        self.value_type = type(value)
-        oram.Block.__init__(self, value, lengths)
-        length = sum(self.lengths)
-        used_bits = entries_per_block * length
-        self.value_bits = self.value.bit_decompose(used_bits)
-        start_length = util.log2(entries_per_block)
-        self.start_bits = util.bit_decompose(start, start_length)
-        self.start_demux = oram.demux_list(self.start_bits)
-        self.entries = [sbits.bit_compose(self.value_bits[i*length:][:length]) \
-                        for i in range(entries_per_block)]
-        self.mul_entries = list(map(operator.mul, self.start_demux, self.entries))
-        self.bits = sum(self.mul_entries).bit_decompose()
-        self.mul_value = sbits.compose(self.mul_entries, sum(self.lengths))
-        self.anti_value = self.mul_value + self.value
-    def set_slice(self, value):
-        value = sbits.compose(util.tuplify(value), sum(self.lengths))
-        for i,b in enumerate(self.start_bits):
-            value = b.if_else(value << (2**i * sum(self.lengths)), value)
-        self.value = value + self.anti_value
-        return self
-
-oram.block_types[sbits] = bitsBlock
-
 class dyn_sbits(sbits):
     pass
 
@@ -1603,3 +1578,10 @@ class cbitfloat:
 
     def output(self):
         inst.print_float_plainb(self.v, self.p, self.z, self.s, self.nan)
+
+def __getattr__(name):
+    # moved to Compiler.oram so that the ORAM code is only imported on use
+    if name == 'bitsBlock':
+        from Compiler.oram import bitsBlock
+        return bitsBlock
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
@@ -103,9 +103,99 @@ class AllocRange:
                           (len(regs), self.top - size - base, base))
                 break
 
+class IntervalRange:
+    """ Register range reusing freed registers for any size.
+
+    Freed registers are merged with adjacent free registers, and a
+    request is served by the smallest free block that is large enough.
+    Free blocks are kept in bins by the binary logarithm of their size.
+    Free registers at the top are returned to the range immediately. """
+    def __init__(self, base=0):
+        self.base = base
+        self.top = base
+        self.limit = base
+        self.grow = True
+        self.bins = [defaultdict(set) for i in range(64)]
+        # bit i is set if bin i is not empty
+        self.used_bins = 0
+        self.by_start = {}
+        self.by_end = {}
+
+    def add_block(self, start, size):
+        logsize = size.bit_length() - 1
+        self.bins[logsize][size].add(start)
+        self.used_bins |= 1 << logsize
+        self.by_start[start] = size
+        self.by_end[start + size] = start
+
+    def remove_block(self, start):
+        size = self.by_start.pop(start)
+        del self.by_end[start + size]
+        logsize = size.bit_length() - 1
+        blocks = self.bins[logsize]
+        blocks[size].remove(start)
+        if not blocks[size]:
+            del blocks[size]
+            if not blocks:
+                self.used_bins &= ~(1 << logsize)
+        return size
+
+    def best_fit(self, size):
+        logsize = size.bit_length() - 1
+        if size in self.bins[logsize]:
+            return size
+        if self.used_bins >> logsize & 1:
+            fitting = [x for x in self.bins[logsize] if x >= size]
+            if fitting:
+                return min(fitting)
+        larger = self.used_bins >> (logsize + 1)
+        if larger:
+            logsize += (larger & -larger).bit_length()
+            return min(self.bins[logsize])
+
+    def alloc(self, size):
+        block_size = self.best_fit(size)
+        if block_size is not None:
+            start = next(iter(self.bins[block_size.bit_length() - 1]
+                              [block_size]))
+            self.remove_block(start)
+            if block_size > size:
+                self.add_block(start + size, block_size - size)
+            return start
+        elif self.grow or self.top + size <= self.limit:
+            res = self.top
+            self.top += size
+            self.limit = max(self.limit, self.top)
+            if res >= REG_MAX:
+                raise RegisterOverflowError(size)
+            return res
+
+    def free(self, base, size):
+        assert self.base <= base < self.top
+        if base in self.by_end:
+            start = self.by_end[base]
+            size += self.remove_block(start)
+            base = start
+        if base + size in self.by_start:
+            size += self.remove_block(base + size)
+        if base + size == self.top:
+            self.top = base
+        else:
+            self.add_block(base, size)
+
+    def stop_growing(self):
+        self.grow = False
+
+    def consolidate(self):
+        pass
+
 class AllocPool:
     def __init__(self, parent=None):
-        self.ranges = defaultdict(lambda: [AllocRange()])
+        if program.Program.prog.options.interval_allocation:
+            self.range_type = IntervalRange
+        else:
+            self.range_type = AllocRange
+        self.ranges = defaultdict(lambda: [self.range_type()])
         self.by_base = {}
         self.parent = parent
 
@@ -117,12 +207,16 @@ class AllocPool:
                 return res
 
     def free(self, reg):
+        """ Free register.
+
+        :returns: whether the register was found """
         try:
             r = self.by_base.pop((reg.reg_type, reg.i))
             r.free(reg.i, reg.size)
+            return True
         except KeyError:
             try:
-                self.parent.free(reg)
+                return self.parent.free(reg)
             except:
                 if program.Program.prog.options.debug:
                     print('Error with freeing register with trace:')
@@ -135,7 +229,7 @@ class AllocPool:
             assert (n >= r.limit)
             if r.limit < n:
                 r.stop_growing()
-                self.ranges[t].append(AllocRange(n))
+                self.ranges[t].append(self.range_type(n))
 
     def consolidate(self):
         for r in self.ranges.values():
@@ -144,7 +238,7 @@ class AllocPool:
 
     def n_fragments(self):
         if self.ranges:
-            return max(len(r) for r in self.ranges)
+            return max(len(r) for r in self.ranges.values())
         else:
             return 0
 
@@ -154,12 +248,14 @@ class StraightlineAllocator:
     def __init__(self, n, program):
         self.alloc = dict_by_id()
         self.max_usage = defaultdict(lambda: 0)
-        self.defined = dict_by_id()
+        self.defined = set_by_id()
         self.dealloc = set_by_id()
         assert(n == REG_MAX)
         self.program = program
         self.old_pool = None
         self.unused = defaultdict(lambda: 0)
+        self.live = defaultdict(lambda: 0)
+        self.max_live = defaultdict(lambda: 0)
 
     def alloc_reg(self, reg, free):
         base = reg.vectorbase
@@ -171,6 +267,9 @@ class StraightlineAllocator:
         size = base.size
         res = free.alloc(reg_type, size)
         self.alloc[base] = res
+        self.live[reg_type] += size
+        if self.live[reg_type] > self.max_live[reg_type]:
+            self.max_live[reg_type] = self.live[reg_type]
 
         base.i = self.alloc[base]
 
@@ -184,7 +283,7 @@ class StraightlineAllocator:
             self.dealloc |= reg.vector
         else:
             self.dealloc.add(reg)
-        reg.duplicates.remove(reg)
+        reg.remove_duplicate()
         base = reg.vectorbase
 
         seen = set_by_id()
@@ -211,13 +310,14 @@ class StraightlineAllocator:
 
         if reg not in self.program.base_addresses \
            and not isinstance(inst, call_arg):
-            free.free(base)
+            if free.free(base):
+                self.live[base.reg_type] -= base.size
         if inst.is_vec() and base.vector:
-            self.defined[base] = inst
+            self.defined.add(base)
             for i in base.vector:
-                self.defined[i] = inst
+                self.defined.add(i)
         else:
-            self.defined[reg] = inst
+            self.defined.add(reg)
 
     def process(self, program, alloc_pool):
         self.update_usage(alloc_pool)
@@ -298,6 +398,17 @@ class StraightlineAllocator:
             p(sizes)
             print('Unused instructions:', dict(self.unused))
 
+    def report(self, name):
+        """ Print the number of registers per type compared to the
+        maximal number of registers in use at the same time. The
+        difference is lost to fragmentation. """
+        for t, n in sorted(self.max_usage.items()):
+            if n:
+                print('Register fragmentation in %s: %s %d allocated, '
+                      '%d live, %.1f%% unused' %
+                      (name, t, n, self.max_live[t],
+                       100 * (n - self.max_live[t]) / n))
+
 def determine_scope(block, options):
     last_def = defaultdict_by_id(lambda: -1)
     used_from_scope = set_by_id()
@@ -334,6 +445,571 @@ def determine_scope(block, options):
 
     block.used_from_scope = used_from_scope
 
+def eliminate_dead_code_in_tape(tape):
+    """ Remove instructions whose results are not used anywhere in the
+    tape. Unlike :py:meth:`Merger.eliminate_dead_code`, this covers
+    registers used across basic blocks, for example values computed
+    before a loop but not used after it. Liveness is determined
+    independently of the control flow, so a register counts as used if
+    any remaining instruction reads it. This has to run before
+    :py:func:`determine_scope`, which prevents eliminating registers
+    used in other blocks.
+
+    :returns: number of eliminated instructions
+    """
+    def units(reg):
+        res = list(reg.get_all())
+        for dup in reg.duplicates:
+            for x in dup.get_all():
+                res.extend(x.duplicates)
+        return res
+
+    live = set()
+    todo = []
+    defs = defaultdict(list)
+
+    def use(reg):
+        for x in units(reg):
+            if id(x) not in live:
+                live.add(id(x))
+                todo.append(id(x))
+
+    dead = []
+    for block in tape.basicblocks:
+        for i, inst in enumerate(block.instructions):
+            outputs = list(inst.get_def())
+            if outputs and not isinstance(
+                    inst, (DoNotEliminateInstruction, prep_class)) and \
+                    all(x.can_eliminate for reg in outputs
+                        for x in units(reg)):
+                key = block, i
+                dead.append(key)
+                for reg in outputs:
+                    for x in units(reg):
+                        defs[id(x)].append(key)
+            else:
+                for reg in inst.get_used():
+                    use(reg)
+        if block.exit_condition is not None:
+            for reg in block.exit_condition.get_used():
+                use(reg)
+    for reg in tape.return_values:
+        use(reg)
+    for reg in tape.program.base_addresses:
+        if reg.program is tape:
+            use(reg)
+
+    alive = set()
+    while todo:
+        for block, i in defs.pop(todo.pop(), ()):
+            if (id(block), i) not in alive:
+                alive.add((id(block), i))
+                for reg in block.instructions[i].get_used():
+                    use(reg)
+
+    eliminate = defaultdict(set)
+    stats = defaultdict(lambda: 0)
+    for block, i in dead:
+        if (id(block), i) not in alive:
+            eliminate[block].add(i)
+            stats[type(block.instructions[i]).__name__] += 1
+    for block, indices in eliminate.items():
+        block.instructions = [inst for i, inst in
+                              enumerate(block.instructions)
+                              if i not in indices]
+    count = sum(stats.values())
+    if count and tape.program.verbose:
+        print('Eliminated %d dead instructions in tape %s: %s' %
+              (count, tape.name, dict(stats)))
+    return count
+
+# instructions without side effects other than communication
+pure_instructions = (
+    AddBase, SubBase, MulBase, ClearImmediate, SharedImmediate,
+    IntegerInstruction, UnaryComparisonInstruction, ldi_class, ldsi_class,
+    ldint_class, andc_class, orc_class, xorc_class, notc_class, shlc_class,
+    shrc_class, convint_class, convmodp_class, legendrec_class,
+    bitdecint_class, muls_class, mulrs_class, asm_open_class)
+
+def is_cisc(inst):
+    """ Whether an instruction is a mergeable CISC instruction (see
+    :py:func:`~Compiler.instructions_base.cisc`). """
+    return isinstance(inst, Mergeable) and not isinstance(inst, Instruction)
+
+def register_units(reg):
+    """ Registers that are written when writing :py:obj:`reg`, that
+    is, the vector elements and the registers linked to them. """
+    for x in reg.get_all():
+        yield x
+        for dup in x.duplicates:
+            if dup is not x:
+                yield dup
+
+def unskipped_blocks(blocks):
+    """ Determine which blocks in a sequence cannot be skipped by a
+    jump, that is, whether every execution from the first to a later
+    block in the sequence passes through them.
+
+    :param blocks: consecutive basic blocks of a tape
+    :returns: list of bools or None if there are jumps with unknown
+      targets such as function returns
+    """
+    index = dict((id(block), i) for i, block in enumerate(blocks))
+    skipped = [0] * (len(blocks) + 1)
+    for i, block in enumerate(blocks):
+        if block.previous_block is not None or \
+           (block.exit_condition is not None and block.exit_block is None):
+            return None
+        if block.exit_block is not None:
+            target = index.get(id(block.exit_block), len(blocks))
+            if target > i + 1:
+                skipped[i + 1] += 1
+                skipped[target] -= 1
+    res = []
+    for x in itertools.accumulate(skipped[:-1]):
+        res.append(x == 0)
+    return res
+
+def propagate_constants(tape):
+    """ Compute clear instructions (cint, regint, and cgf2n) on values
+    known at compile time and replace them by loading the result. A
+    value is known if it has been loaded or computed earlier in the
+    same basic block or if it is loaded or computed by the only
+    instruction writing the register in a basic block that is always
+    executed before. Loading constants that are not used anywhere
+    afterwards is removed. This has to run before
+    :py:func:`determine_scope`.
+
+    :returns: number of folded and removed instructions
+    """
+    program = tape.program
+    if int(program.options.ring or 0):
+        modulus = 2 ** int(program.options.ring)
+    else:
+        # unknown if None
+        modulus = program.prime
+    loads = {'c': ldi, 'ci': ldint, 'cg': gldi}
+    max_immediate = 2 ** 31
+
+    def reduce_clear(x):
+        if modulus:
+            x %= modulus
+            if x > modulus // 2:
+                x -= modulus
+        return x
+
+    def reduce_int(x):
+        return (x + 2 ** 63) % 2 ** 64 - 2 ** 63
+
+    def canonical(x):
+        # representative used by shifts and bitwise operations
+        if x is not None and 0 <= x and (modulus or x < max_immediate):
+            return x
+
+    n_defs = defaultdict(lambda: 0)
+    for block in tape.basicblocks:
+        for inst in block.instructions:
+            for reg in inst.get_def():
+                for x in register_units(reg):
+                    n_defs[id(x)] += 1
+
+    # blocks executed before all blocks after them
+    dominating = unskipped_blocks(tape.basicblocks) or \
+        [False] * len(tape.basicblocks)
+
+    def get(reg):
+        res = set()
+        for x in reg.get_all():
+            if id(x) in known:
+                res.add(known[id(x)])
+            elif n_defs[id(x)] == 1 and id(x) in known_before:
+                res.add(known_before[id(x)])
+            else:
+                return None
+        if len(res) == 1:
+            return res.pop()
+
+    def set_value(reg, value, dominate):
+        for x in register_units(reg):
+            known[id(x)] = value
+            if dominate and value is not None and n_defs[id(x)] == 1:
+                known_before[id(x)] = value
+
+    def fold(inst, reg_type):
+        args = inst.args
+        if isinstance(inst, (ldi_class, ldint_class)):
+            if reg_type != 'cg' or args[1] >= 0:
+                return args[1]
+        elif isinstance(inst, IntegerInstruction):
+            a, b = get(args[1]), get(args[2])
+            if a is None or b is None:
+                return None
+            if isinstance(inst, divint_class):
+                if a >= 0 and b > 0:
+                    return a // b
+            else:
+                return reduce_int(int(inst.op(a, b)))
+        elif isinstance(inst, eqzc_class):
+            a = get(args[1])
+            if a is not None:
+                return int(a == 0)
+        elif isinstance(inst, ltzc_class):
+            a = get(args[1])
+            if a is not None:
+                return int(a < 0)
+        elif reg_type == 'cg':
+            if isinstance(inst, convint_class):
+                # no modular reduction in GF(2^n)
+                a = get(args[1])
+                if a is not None and 0 <= a < max_immediate:
+                    return a
+            # addition and subtraction are XOR in characteristic two
+            elif isinstance(inst, (addc_class, subc_class)):
+                a, b = get(args[1]), get(args[2])
+                if a is not None and b is not None:
+                    return a ^ b
+            elif isinstance(inst, (addci_class, subci_class, subcfi_class,
+                                   xorci_class)):
+                a = get(args[1])
+                if a is not None and args[2] >= 0:
+                    return a ^ args[2]
+        elif isinstance(inst, convint_class):
+            a = get(args[1])
+            if a is not None:
+                return reduce_clear(a)
+        elif isinstance(inst, convmodp_class):
+            # the virtual machine truncates to the bit length (0 for 64)
+            a = canonical(get(args[1]))
+            n_bits = args[2] or 64
+            if a is not None and n_bits <= 64 and a < 2 ** (n_bits - 1):
+                return a
+        elif isinstance(inst, (addc_class, subc_class, mulc_class)):
+            a, b = get(args[1]), get(args[2])
+            if a is not None and b is not None:
+                op = {addc_class: operator.add, subc_class: operator.sub,
+                      mulc_class: operator.mul}
+                for cls in op:
+                    if isinstance(inst, cls):
+                        return reduce_clear(op[cls](a, b))
+        elif isinstance(inst, (addci_class, subci_class, subcfi_class,
+                               mulci_class)):
+            a = get(args[1])
+            if a is not None:
+                return reduce_clear(getattr(a, inst.op)(args[2]))
+        elif isinstance(inst, shlci_class):
+            a = get(args[1])
+            if a is not None and 0 <= args[2] < 2 ** 16:
+                return reduce_clear(a << args[2])
+        elif isinstance(inst, (shrci_class, andci_class, orci_class,
+                               xorci_class, modci_class)):
+            a = canonical(get(args[1]))
+            if a is not None and (args[2] > 0 or (
+                    args[2] == 0 and not isinstance(inst, modci_class))):
+                return getattr(a, inst.op)(args[2])
+        elif isinstance(inst, (andc_class, orc_class, xorc_class,
+                               shrc_class)):
+            a, b = canonical(get(args[1])), canonical(get(args[2]))
+            if a is not None and b is not None:
+                op = {andc_class: operator.and_, orc_class: operator.or_,
+                      xorc_class: operator.xor, shrc_class: operator.rshift}
+                for cls in op:
+                    if isinstance(inst, cls):
+                        return op[cls](a, b)
+
+    known_before = {}
+    folded = 0
+    for i, block in enumerate(tape.basicblocks):
+        known = {}
+        for j, inst in enumerate(block.instructions):
+            outputs = list(inst.get_def())
+            value = None
+            if len(outputs) == 1 and outputs[0].reg_type in loads and \
+               isinstance(inst, Instruction):
+                value = fold(inst, outputs[0].reg_type)
+            if value is not None and not isinstance(
+                    inst, (ldi_class, ldint_class)):
+                if -max_immediate < value < max_immediate:
+                    new = loads[outputs[0].reg_type](outputs[0], value,
+                                                     add_to_prog=False)
+                    new.caller = inst.caller
+                    block.instructions[j] = new
+                    folded += 1
+                elif not modulus and abs(value) >= 2 ** 64:
+                    # avoid computing with large numbers
+                    value = None
+            for reg in outputs:
+                set_value(reg, value, dominating[i])
+
+    used = set()
+
+    def use(reg):
+        for x in register_units(reg):
+            used.add(id(x))
+
+    for block in tape.basicblocks:
+        for inst in block.instructions:
+            for reg in inst.get_used():
+                use(reg)
+        if block.exit_condition is not None:
+            for reg in block.exit_condition.get_used():
+                use(reg)
+    for reg in tape.return_values:
+        use(reg)
+    for reg in program.base_addresses:
+        if reg.program is tape:
+            use(reg)
+
+    removed = 0
+    for block in tape.basicblocks:
+        instructions = []
+        for inst in block.instructions:
+            if isinstance(inst, (ldi_class, ldint_class)) and \
+               all(x.can_eliminate and id(x) not in used
+                   for x in register_units(inst.args[0])):
+                removed += 1
+            else:
+                instructions.append(inst)
+        block.instructions = instructions
+
+    if (folded or removed) and program.verbose:
+        print('Folded %d instructions and removed %d loads of unused '
+              'constants in tape %s' % (folded, removed, tape.name))
+    return folded + removed
+
+def hoist_loop_invariants(tape):
+    """ Move instructions that compute the same in every iteration of
+    a loop to the block before the loop. A loop consists of the blocks
+    from a block to the block jumping back to it, and the block before
+    has to be the scope of the first block, which is the case for
+    :py:func:`~Compiler.library.do_while` and the loops based on it.
+    Only instructions without side effects other than communication
+    are moved if they are executed in every iteration, their inputs are
+    not written within the loop, and they are the only instruction
+    writing their results. Inner loops are processed first, so
+    instructions can move out of several loops. This has to run before
+    :py:func:`determine_scope`.
+
+    :returns: number of moved instructions
+    """
+    blocks = tape.basicblocks
+    # instructions that might fail
+    unsafe = (InvertInstruction, divint_class, modci_class)
+    index = dict((id(block), i) for i, block in enumerate(blocks))
+    entries = defaultdict(list)
+    loops = []
+    for i, block in enumerate(blocks):
+        if block.exit_block is not None:
+            start = index[id(block.exit_block)]
+            entries[start].append(i)
+            if start <= i:
+                loops.append((i - start, start, i))
+    loops.sort()
+
+    n_defs = defaultdict(lambda: 0)
+    for block in blocks:
+        for inst in block.instructions:
+            for reg in inst.get_def():
+                for x in register_units(reg):
+                    n_defs[id(x)] += 1
+
+    moved = {}
+    for _, start, end in loops:
+        if start == 0:
+            continue
+        before = blocks[start - 1]
+        if blocks[start].scope is not before or \
+           before.exit_condition is not None or \
+           any(not start <= i <= end for i in entries[start]):
+            continue
+        body = blocks[start:end + 1]
+        executed = unskipped_blocks(body)
+        if executed is None or any(
+                block.exit_block is not None and
+                not start <= index[id(block.exit_block)] <= end + 1
+                for block in body):
+            # function calls
+            continue
+        written = set()
+        for block in body:
+            for inst in block.instructions:
+                for reg in inst.get_def():
+                    for x in register_units(reg):
+                        written.add(id(x))
+        for block, always in zip(body, executed):
+            if not always:
+                continue
+            remaining = []
+            for inst in block.instructions:
+                outputs = list(inst.get_def())
+                if outputs and \
+                   (is_cisc(inst) or isinstance(inst, pure_instructions)) \
+                   and not isinstance(inst, unsafe) and \
+                   all(n_defs[id(x)] == 1 for reg in outputs
+                       for x in register_units(reg)) and \
+                   not any(id(x) in written for reg in inst.get_used()
+                           for x in register_units(reg)):
+                    before.instructions.append(inst)
+                    for reg in outputs:
+                        for x in register_units(reg):
+                            written.discard(id(x))
+                    moved[id(inst)] = inst
+                else:
+                    remaining.append(inst)
+            block.instructions = remaining
+
+    stats = defaultdict(lambda: 0)
+    for inst in moved.values():
+        stats[type(inst).__name__] += 1
+    count = len(moved)
+    if count and tape.program.verbose:
+        print('Moved %d loop-invariant instructions in tape %s: %s' %
+              (count, tape.name, dict(stats)))
+    return count
+
+def eliminate_common_subexpressions(tape):
+    """ Replace instructions computing the same as an earlier
+    instruction in the same basic block by moving the earlier result.
+    This covers arithmetic instructions without side effects such as
+    loading constants, local computation, multiplication, opening,
+    and CISC instructions like comparisons. Registers are numbered by
+    value so that instructions on copies of the same value are
+    recognized, and constants are only numbered but not replaced
+    because loading them is as cheap as moving. This has to run before
+    :py:func:`determine_scope`.
+
+    :returns: number of replaced instructions
+    """
+    moves = {'s': movs, 'c': movc, 'ci': movint, 'sg': gmovs, 'cg': gmovc}
+    constants = (ldi_class, ldsi_class, ldint_class)
+    commutative = (addc_class, adds_class, mulc_class, addint_class,
+                   mulint_class, eqc_class)
+    Tape = Compiler.program.Tape
+    numbers = itertools.count()
+
+    def value(reg):
+        res = []
+        for x in reg.get_all():
+            if id(x) not in values:
+                values[id(x)] = next(numbers)
+            res.append(values[id(x)])
+        return tuple(res)
+
+    def assign(reg, new):
+        for x, number in zip(reg.get_all(), new):
+            values[id(x)] = number
+            for dup in x.duplicates:
+                values[id(dup)] = number
+
+    def define(reg):
+        assign(reg, [next(numbers) for x in reg.get_all()])
+
+    def get_key(inst):
+        if is_cisc(inst):
+            # no argument format
+            args = inst.args[len(inst.get_def()):]
+            args = tuple(value(arg) if isinstance(arg, Tape.Register)
+                         else arg for arg in args)
+            return inst.function, inst.security, args, \
+                tuple(sorted(inst.kwargs.items()))
+        elif not isinstance(inst, pure_instructions):
+            return None
+        args = []
+        for arg, f in zip(inst.args, inst.arg_format):
+            if format_str_is_writeable(f):
+                args.append(f)
+            elif format_str_is_reg(f):
+                args.append(value(arg))
+            else:
+                args.append(arg)
+        if isinstance(inst, commutative):
+            args[1:] = sorted(args[1:])
+        elif isinstance(inst, muls_class):
+            for i in range(2, len(args), 4):
+                args[i:i + 2] = sorted(args[i:i + 2])
+        return type(inst), inst.get_size(), tuple(args)
+
+    stats = defaultdict(lambda: 0)
+    saved = Tape.ReqNode('common subexpression elimination')
+    saved.num = Tape.ReqNum()
+    for block in tape.basicblocks:
+        values = {}
+        available = {}
+        instructions = []
+        for inst in block.instructions:
+            outputs = list(inst.get_def())
+            key = None
+            if outputs and all(reg.reg_type in moves for reg in outputs):
+                key = get_key(inst)
+                try:
+                    hash(key)
+                except TypeError:
+                    key = None
+            if key is None:
+                instructions.append(inst)
+                for reg in outputs:
+                    define(reg)
+                continue
+            if key in available:
+                regs, numbers_before = available[key]
+                if [value(reg) for reg in regs] == numbers_before:
+                    if isinstance(inst, constants):
+                        instructions.append(inst)
+                    else:
+                        for dest, source in zip(outputs, regs):
+                            if dest is not source:
+                                move = moves[dest.reg_type](
+                                    dest, source, add_to_prog=False)
+                                move.caller = inst.caller
+                                instructions.append(move)
+                        stats[type(inst).__name__] += 1
+                        inst.add_usage(saved)
+                    for dest, source in zip(outputs, regs):
+                        if len(dest.get_all()) == len(source.get_all()):
+                            assign(dest, value(source))
+                        else:
+                            define(dest)
+                    continue
+            instructions.append(inst)
+            for reg in outputs:
+                define(reg)
+            available[key] = outputs, [value(reg) for reg in outputs]
+        block.instructions = instructions
+
+    count = sum(stats.values())
+    if count and tape.program.verbose:
+        print('Eliminated %d common subexpressions in tape %s: %s' %
+              (count, tape.name, dict(stats)))
+        if saved.num:
+            print('Saved preprocessing in tape %s: %s' % (
+                tape.name, ', '.join(x.strip() for x in saved.num.pretty())))
+    return count
+
+def format_critical_path(path, name):
+    """ Describe the result of :py:meth:`Merger.critical_path` in
+    lines of text. Consecutive rounds of the same instruction from the
+    same source line are combined. """
+    res = ['Critical path in %s: %d rounds (%s)' % (
+        name, path['rounds'], ', '.join(
+            '%s %d' % x for x in sorted(path['types'].items(),
+                                        key=lambda x: -x[1])))]
+    groups = []
+    for step in path['path']:
+        key = step['instruction'], step['size'], step['source']
+        if groups and groups[-1][0] == key and step['dependent']:
+            groups[-1][2] = step['round']
+        else:
+            groups.append([key, step['round'], step['round'],
+                           step['dependent']])
+    for key, first, last, dependent in groups:
+        if first == last:
+            rounds = 'round %d' % first
+        else:
+            rounds = 'rounds %d-%d' % (first, last)
+        res.append('  %s: %s of size %d%s%s' % (
+            rounds, key[0], key[1], ' at ' + key[2] if key[2] else '',
+            '' if dependent else ' (independent of the previous round)'))
+    return res
+
 class Merger:
     def __init__(self, block, options, merge_classes):
         self.block = block
@@ -345,6 +1021,7 @@ class Merger:
             self.max_parallel_open = float('inf')
         self.counter = defaultdict(lambda: 0)
         self.rounds = defaultdict(lambda: 0)
+        self.merged = []
         self.dependency_graph(merge_classes)
 
     def do_merge(self, merges_iter):
@@ -361,6 +1038,8 @@ class Merger:
         except StopIteration:
             return mergecount, None
 
+        if len(merge) > 1:
+            self.merged.append(merge)
         for i in merges_iter:
             instructions[n].merge(instructions[i])
             instructions[i] = None
@@ -390,6 +1069,16 @@ class Merger:
         for node in merge_nodes:
             merges[depths[node]].append(node)
 
+        if self.options.critical_path:
+            self.block.critical_path = self.critical_path(merges)
+
+        if self.options.cost_profile:
+            from Compiler.cost_profile import add_rounds, get_trace
+            for merge in merges.values():
+                traces = set(get_trace(instructions[i]) for i in merge)
+                for trace in traces:
+                    add_rounds(self.block, trace, 1 / len(traces))
+
         # after merging, the first element in merges[i] remains for each depth i,
         # all others are removed from instructions and G
         last_nodes = [None, None]
@@ -408,13 +1097,173 @@ class Merger:
 
         if len(instructions) > 1000000:
             print("Topological sort ...")
-        order = Compiler.graph.topological_sort(G, preorder)
+        with self.block.parent.program.phase("topological sort"):
+            order = Compiler.graph.topological_sort(G, preorder)
+        if self.options.pressure_scheduling:
+            with self.block.parent.program.phase("scheduling"):
+                order = self.reduce_pressure(order)
         instructions[:] = [instructions[i] for i in order if instructions[i] is not None]
         if len(instructions) > 1000000:
             print("Done at", time.asctime())
 
         return len(merges)
 
+    def critical_path(self, merges):
+        """ Describe a longest chain of rounds in the block before
+        merging. The chain follows the dependencies from the last
+        round backwards. If an instruction does not depend on the
+        previous round but has to wait for it because rounds of
+        different instruction types cannot be merged, the chain
+        continues with the previous round.
+
+        :param merges: instructions to merge per depth
+        :returns: dictionary with the block name, the number of rounds,
+          the rounds per instruction type, and the path from the first
+          to the last round
+        """
+        G = self.G
+        depths = self.depths
+        open_nodes = self.open_nodes
+        levels = sorted(merges)
+        round_of = dict((depth, i + 1) for i, depth in enumerate(levels))
+        types = defaultdict(lambda: 0)
+        for merge in merges.values():
+            types[type(self.instructions[merge[0]]).__name__] += 1
+        n = merges[levels[-1]][0]
+        path = []
+        while True:
+            path.append([n, True])
+            r = round_of[depths[n]]
+            if r == 1:
+                break
+            m = n
+            while m is not None and (m == n or m not in open_nodes):
+                preds = G.pred[m]
+                m = None
+                if preds:
+                    # util.max shadows the built-in
+                    m = sorted(preds, key=lambda i: (depths[i], i))[-1]
+                    if depths[m] == 0:
+                        m = None
+            if m is None or round_of[depths[m]] != r - 1:
+                path[-1][1] = False
+                m = merges[levels[r - 2]][0]
+            n = m
+        res = []
+        for (n, dependent) in reversed(path):
+            inst = self.instructions[n]
+            res.append(dict(round=round_of[depths[n]],
+                            instruction=type(inst).__name__,
+                            size=inst.get_size(),
+                            source=source_location(inst.caller),
+                            dependent=dependent))
+        return dict(block=self.block.name, rounds=len(merges),
+                    types=dict(types), path=res)
+
+    def reduce_pressure(self, order):
+        """ Choose a topological order of the instructions that keeps
+        fewer registers in use at the same time. The order is built
+        backwards from the end of the block. Among the instructions
+        whose successors have been placed, the one is chosen that
+        ends the most register space by defining its results minus
+        the space of arguments not used by an instruction placed
+        already. Ties are broken by the given order. The given order
+        is kept if the new one does not need fewer registers. The
+        number of rounds does not depend on the order.
+
+        :param order: topological order of the instruction indices
+        :returns: new topological order
+        """
+        G = self.G
+        instructions = self.instructions
+        nodes = [i for i in order if instructions[i] is not None]
+        n = len(instructions)
+        rank = [0] * n
+        uses = [()] * n
+        results = [()] * n
+        defined = [0] * n
+        n_succ = [0] * n
+        regs = {}
+        readers = defaultdict(list)
+        for k, i in enumerate(nodes):
+            rank[i] = k
+            inst = instructions[i]
+            for attr, get in ((uses, inst.get_used), (results, inst.get_def)):
+                ids = {}
+                for reg in get():
+                    base = reg.vectorbase
+                    ids[id(base)] = base
+                for x, base in ids.items():
+                    regs[x] = base.reg_type, base.size or 1
+                attr[i] = tuple(ids)
+            for x in uses[i]:
+                readers[x].append(i)
+            defined[i] = sum(regs[x][1] for x in results[i])
+            for j in G[i]:
+                if instructions[j] is not None:
+                    n_succ[i] += 1
+        live = set()
+
+        def priority(i):
+            new = sum(regs[x][1] for x in uses[i] if x not in live)
+            return new - defined[i], -rank[i], i
+
+        ready = [priority(i) for i in nodes if not n_succ[i]]
+        heapq.heapify(ready)
+        done = bytearray(n)
+        res = []
+        while ready:
+            i = heapq.heappop(ready)[2]
+            if done[i]:
+                continue
+            done[i] = 1
+            res.append(i)
+            for x in uses[i]:
+                if x not in live:
+                    live.add(x)
+                    # other readers do not extend the live range anymore
+                    for j in readers[x]:
+                        if not done[j] and not n_succ[j]:
+                            heapq.heappush(ready, priority(j))
+            for j in G.pred[i]:
+                if instructions[j] is not None:
+                    n_succ[j] -= 1
+                    if not n_succ[j]:
+                        heapq.heappush(ready, priority(j))
+        assert len(res) == len(nodes)
+        res.reverse()
+
+        def pressure(order):
+            """ Sum over the register types of the maximal number of
+            registers in use at the same time. Registers defined
+            outside the block are ignored, and results not used in
+            the block are in use until the end. """
+            remaining = dict((x, len(y)) for x, y in readers.items())
+            in_use = defaultdict(lambda: 0)
+            peak = defaultdict(lambda: 0)
+            for i in order:
+                for x in results[i]:
+                    reg_type, size = regs[x]
+                    in_use[reg_type] += size
+                    peak[reg_type] = max(peak[reg_type], in_use[reg_type])
+                for x in uses[i]:
+                    remaining[x] -= 1
+                    if not remaining[x] and x in defined_here:
+                        reg_type, size = regs[x]
+                        in_use[reg_type] -= size
+            return sum(peak.values())
+
+        defined_here = set(x for i in nodes for x in results[i])
+        before = pressure(nodes)
+        after = pressure(res)
+        if self.block.parent.program.verbose:
+            print('Scheduling %s for %d instead of %d registers' %
+                  (self.block.name, after, before))
+        if after < before:
+            return res
+        else:
+            return nodes
+
     def dependency_graph(self, merge_classes):
         """ Create the program dependency graph. """
         block = self.block
@@ -427,7 +1276,10 @@ class Merger:
                                 triple='green', square='green', bit='green',\
                                 asm_input='lightgreen')
 
-        G = Compiler.graph.SparseDiGraph(len(block.instructions))
+        if options.compact_graph:
+            G = Compiler.graph.CompactDiGraph(len(block.instructions))
+        else:
+            G = Compiler.graph.SparseDiGraph(len(block.instructions))
         self.G = G
 
         reg_nodes = {}
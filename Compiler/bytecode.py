@@ -0,0 +1,237 @@
+"""
+This module contains the reader for bytecode files used by the
+analysis scripts such as :file:`Scripts/decompile.py`,
+:file:`Scripts/memory-usage.py`, and :file:`Scripts/prep-usage.py`
+via :py:meth:`~Compiler.program.Tape.read_instructions`.
+
+The files are memory-mapped instead of read argument by argument. The
+arguments of an instruction are decoded with a single call to a
+precompiled :py:class:`struct.Struct` whenever the formats of all
+arguments are known from the opcode and the number of arguments,
+which is the case for all instructions except those with a format
+depending on the arguments themselves (see
+:py:meth:`~Compiler.instructions_base.DynFormatInstruction.dynamic_arg_format`).
+The compiled layouts are cached across instructions and files.
+
+The resulting instructions are
+:py:class:`~Compiler.instructions_base.ParsedInstruction` objects,
+that is, the same as when reading a file sequentially.
+"""
+
+import itertools
+import mmap
+import struct
+
+from Compiler import instructions_base as inst_base
+
+header = struct.Struct('>Q')
+count = struct.Struct('>I')
+code_mask = (1 << inst_base.Instruction.code_length) - 1
+
+
+def struct_code(format_str):
+    """ Code for :py:mod:`struct` of a fixed-size argument format or
+    ``None``. """
+    cls = inst_base.ArgFormats[format_str]
+    if issubclass(cls, inst_base.VarString):
+        return None
+    elif issubclass(cls, inst_base.String):
+        return '%ds' % cls.length
+    elif issubclass(cls, inst_base.LongArgFormat):
+        return 'q'
+    elif issubclass(cls, inst_base.IntArgFormat):
+        return 'i'
+    elif issubclass(cls, inst_base.RegisterArgFormat):
+        return 'I'
+    else:
+        return None
+
+
+def arg_maker(format_str):
+    """ Function creating an argument object from a decoded value. """
+    cls = inst_base.ArgFormats[format_str]
+    new = cls.__new__
+    if issubclass(cls, inst_base.String):
+        def make(value):
+            res = new(cls)
+            res.str = str(value[0:value.find(b'\0')], 'ascii')
+            return res
+    else:
+        def make(value):
+            res = new(cls)
+            res.i = value
+            return res
+    return make
+
+
+class Layout(object):
+    """ Precompiled decoding of a sequence of argument formats. """
+
+    cache = {}
+
+    @classmethod
+    def get(cls, formats):
+        """ Cached layout or ``None`` if the size of an argument is not
+        fixed. """
+        try:
+            return cls.cache[formats]
+        except KeyError:
+            codes = [struct_code(x) for x in formats]
+            if None in codes:
+                res = None
+            else:
+                res = cls(formats, codes)
+            cls.cache[formats] = res
+            return res
+
+    def __init__(self, formats, codes):
+        self.struct = struct.Struct('>' + ''.join(codes))
+        self.size = self.struct.size
+        makers = {}
+        for x in set(formats):
+            makers[x] = arg_maker(x)
+        self.makers = [makers[x] for x in formats]
+
+    def decode(self, buf, offset):
+        values = self.struct.unpack_from(buf, offset)
+        return [make(value) for make, value in zip(self.makers, values)]
+
+
+class InstructionFormat(object):
+    """ Decoding of an instruction type.
+
+    :param t: instruction class
+    """
+
+    def __init__(self, t):
+        self.type = t
+        try:
+            self.n_args = len(t.arg_format)
+            self.var_args = False
+        except:
+            self.n_args = None
+            self.var_args = True
+        self.static = True
+        self.shared = False
+        try:
+            arg_format = iter(t.arg_format)
+            # iterators such as itertools.cycle keep their position
+            self.shared = arg_format is t.arg_format
+        except:
+            if t.__name__ != 'cisc':
+                self.static = False
+        self.layouts = {}
+
+    def formats(self, n_args):
+        t = self.type
+        if t.__name__ == 'cisc':
+            return ('str',) + ('int',) * (n_args - 1)
+        return tuple(itertools.islice(iter(t.arg_format), n_args))
+
+    def layout(self, n_args):
+        """ Argument formats and layout or ``None``. """
+        if self.shared:
+            formats = self.formats(n_args)
+            return formats, Layout.get(formats)
+        try:
+            return self.layouts[n_args]
+        except KeyError:
+            formats = self.formats(n_args)
+            res = self.layouts[n_args] = formats, Layout.get(formats)
+            return res
+
+    def decode(self, inst, buf, offset):
+        """ Decode the arguments of *inst* starting at *offset* and
+        return the offset after the instruction. """
+        if self.var_args:
+            n_args = count.unpack_from(buf, offset)[0]
+            offset += 4
+        else:
+            n_args = self.n_args
+        if self.static:
+            formats, layout = self.layout(n_args)
+            if layout:
+                inst.args = layout.decode(buf, offset)
+                return offset + layout.size
+            formats = iter(formats)
+        else:
+            def arg_iter():
+                i = 0
+                while True:
+                    try:
+                        yield inst.args[i].i
+                    except AttributeError:
+                        yield None
+                    i += 1
+            formats = self.type.dynamic_arg_format(arg_iter())
+        inst.args = []
+        for i in range(n_args):
+            format_str = next(formats)
+            if issubclass(inst_base.ArgFormats[format_str],
+                          inst_base.VarString):
+                length = count.unpack_from(buf, offset)[0]
+                arg = inst_base.VarString.__new__(inst_base.VarString)
+                arg.str = str(buf[offset + 4:offset + 4 + length], 'ascii')
+                offset += 4 + length
+            else:
+                layout = Layout.get((format_str,))
+                arg = layout.decode(buf, offset)[0]
+                offset += layout.size
+            inst.args.append(arg)
+        return offset
+
+
+class BytecodeReader(object):
+    """ Iterator over the instructions in a bytecode file.
+
+    :param filename: path of the bytecode file
+    """
+
+    formats = {}
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    @classmethod
+    def get_format(cls, code):
+        try:
+            return cls.formats[code]
+        except KeyError:
+            t = inst_base.ParsedInstruction.get_reverse_opcodes()[code]
+            res = cls.formats[code] = InstructionFormat(t)
+            return res
+
+    def __iter__(self):
+        with open(self.filename, 'rb') as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty file
+                return
+        with buf:
+            yield from self.decode(buf)
+
+    def decode(self, buf):
+        """ Iterate over the instructions in a buffer. """
+        end = len(buf)
+        offset = 0
+        new = inst_base.ParsedInstruction.__new__
+        cls = inst_base.ParsedInstruction
+        get_format = self.get_format
+        unpack = header.unpack_from
+        while offset < end:
+            full_code = unpack(buf, offset)[0]
+            inst = new(cls)
+            inst.code = code = full_code & code_mask
+            inst.size = full_code >> inst_base.Instruction.code_length
+            fmt = get_format(code)
+            inst.type = fmt.type
+            inst.var_args = fmt.var_args
+            offset = fmt.decode(inst, buf, offset + 8)
+            yield inst
+
+
+def read_tape(tapename):
+    """ Iterate over the instructions of a tape in
+    :file:`Programs/Bytecode`. """
+    return iter(BytecodeReader('Programs/Bytecode/%s.bc' % tapename))
@@ -0,0 +1,504 @@
+"""
+This module contains the on-disk cache used by :file:`compile.py` to
+avoid recompiling unchanged programs. Entries are addressed by a hash
+of everything known to influence the output, that is, the source
+file, the compiler itself, the options, and the program arguments.
+
+Note that the cache cannot track files read by the high-level code at
+compile time, for example, user modules imported from the program
+directory. Disable the cache if a program depends on such files.
+
+Furthermore, tapes are cached individually after optimization. This
+allows reusing tapes that haven't changed when other parts of a
+program have. The key is computed from the instructions before
+optimization (see :py:class:`TapeFingerprint`).
+"""
+
+import array
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+import types
+
+from .instructions_base import CachedInstruction, Instruction, Mergeable
+from .program import Tape
+
+
+class Uncacheable(Exception):
+    """ The optimization of a tape depends on state without canonical
+    description. """
+    pass
+
+
+def encode_req_num(req_num):
+    if req_num is None:
+        return None
+    return [[list(key), num] for key, num in req_num.items()]
+
+
+def decode_req_num(encoded):
+    if encoded is None:
+        return None
+    res = Tape.ReqNum()
+    for key, num in encoded:
+        res[tuple(tuple(x) if isinstance(x, list) else x
+                  for x in key)] = num
+    return res
+
+
+class CompilationCache:
+    """ Content-addressed store for compiled programs.
+
+    :param directory: cache directory (created if needed)
+    :param max_size: maximal total size in megabytes (default: unlimited)
+    :param max_age: maximal age in days since the last use
+        (default: unlimited)
+    """
+    meta_name = "meta.json"
+    version = 1
+    # options not affecting the output
+    neutral_options = ("compile_jobs", "compact_graph", "stream_bytecode",
+                       "profile_phases", "register_report", "estimate",
+                       "latency", "bandwidth", "estimate_file")
+    _compiler_digest = None
+
+    def __init__(self, directory, max_size=None, max_age=None):
+        self.directory = directory
+        self.max_size = None if max_size is None else \
+            float(max_size) * 2 ** 20
+        self.max_age = None if max_age is None else \
+            float(max_age) * 24 * 3600
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def compiler_digest(cls):
+        """ Hash of all modules of the compiler package. """
+        if cls._compiler_digest is None:
+            root = os.path.dirname(os.path.abspath(__file__))
+            h = hashlib.sha256()
+            for filename in sorted(glob.glob(root + "/**/*.py",
+                                             recursive=True)):
+                h.update(os.path.relpath(filename, root).encode())
+                with open(filename, "rb") as f:
+                    h.update(f.read())
+            cls._compiler_digest = h.hexdigest()
+        return cls._compiler_digest
+
+    def key(self, *parts):
+        """ Compute the key for an entry from strings or bytes. """
+        h = hashlib.sha256()
+        h.update(b"%d\0" % self.version)
+        h.update(self.compiler_digest().encode())
+        h.update(("%d.%d" % sys.version_info[:2]).encode())
+        for part in parts:
+            if isinstance(part, str):
+                part = part.encode()
+            h.update(b"%d\0" % len(part))
+            h.update(part)
+        return h.hexdigest()
+
+    def entry_dir(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def lookup(self, key):
+        """ Return metadata of an entry or :py:obj:`None` if absent.
+        Marks the entry as recently used. """
+        meta_file = os.path.join(self.entry_dir(key), self.meta_name)
+        try:
+            with open(meta_file) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(meta_file)
+        except OSError:
+            pass
+        return meta
+
+    def restore(self, key):
+        """ Copy the files of an entry back to their original location.
+
+        :returns: metadata or :py:obj:`None` if the entry is absent
+        """
+        meta = self.lookup(key)
+        if meta is None:
+            return None
+        entry = self.entry_dir(key)
+        try:
+            for i, filename in enumerate(meta["files"]):
+                dirname = os.path.dirname(filename)
+                if dirname:
+                    os.makedirs(dirname, exist_ok=True)
+                shutil.copyfile(os.path.join(entry, str(i)), filename)
+        except (OSError, KeyError):
+            return None
+        return meta
+
+    def store(self, key, files=(), blobs=(), **meta):
+        """ Store files and byte strings under key together with metadata.
+
+        :param files: list of paths relative to the working directory
+        :param blobs: list of byte strings (see :py:func:`read_blob`)
+        :param meta: JSON-serializable metadata
+        """
+        entry = self.entry_dir(key)
+        tmp = "%s.tmp-%d" % (entry, os.getpid())
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        try:
+            for i, filename in enumerate(files):
+                shutil.copyfile(filename, os.path.join(tmp, str(i)))
+            for i, blob in enumerate(blobs):
+                with open(os.path.join(tmp, "blob%d" % i), "wb") as f:
+                    f.write(blob)
+            meta["files"] = list(files)
+            meta["time"] = time.time()
+            with open(os.path.join(tmp, self.meta_name), "w") as f:
+                json.dump(meta, f)
+            shutil.rmtree(entry, ignore_errors=True)
+            os.rename(tmp, entry)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+    def read_blob(self, key, i):
+        with open(os.path.join(self.entry_dir(key), "blob%d" % i), "rb") as f:
+            return f.read()
+
+    def entries(self):
+        """ List of (last use, size, path) of all entries. """
+        res = []
+        for entry in glob.glob(os.path.join(self.directory, "??", "*")):
+            meta_file = os.path.join(entry, self.meta_name)
+            if not os.path.exists(meta_file):
+                continue
+            size = 0
+            for filename in os.listdir(entry):
+                size += os.path.getsize(os.path.join(entry, filename))
+            res.append((os.path.getmtime(meta_file), size, entry))
+        return res
+
+    def evict(self):
+        """ Remove entries exceeding the age limit and then the least
+        recently used until the size limit is met. """
+        if self.max_size is None and self.max_age is None:
+            return
+        entries = sorted(self.entries())
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        for used, size, entry in entries:
+            too_old = self.max_age is not None and now - used > self.max_age
+            too_big = self.max_size is not None and total > self.max_size
+            if too_old or too_big:
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+
+    def tape_key(self, tape):
+        """ Key for a tape before optimization.
+
+        :returns: key and list of registers visible to other tapes or
+            :py:obj:`None` if the tape cannot be cached
+        """
+        try:
+            fingerprint = TapeFingerprint(tape)
+            return self.key(fingerprint.digest()), fingerprint.exports
+        except Uncacheable as e:
+            if tape.program.verbose:
+                print("Cannot cache tape %s: %s" % (tape.name, e))
+            return None, None
+
+    @staticmethod
+    def snapshot(program):
+        """ Program state that optimizing a cacheable tape must not
+        change. """
+        return len(program.tapes), program.tape_counter, \
+            dict(program.allocated_mem), \
+            len(program.allocated_mem_blocks), \
+            len(program.base_addresses.content), program.n_threads
+
+    @staticmethod
+    def tape_refs(tape):
+        """ Tapes referenced by optimized tape. """
+        from .instructions import call_tape, run_tape
+        res = set()
+        for inst in tape._get_instructions():
+            if isinstance(inst, run_tape):
+                res.update(inst.args[1::3])
+            elif isinstance(inst, call_tape):
+                res.add(inst.args[0])
+        return sorted(res)
+
+    @staticmethod
+    def tape_ref(tape):
+        """ Description of a finished tape in JSON form. """
+        req_num = tape.req_tree.aggregated
+        if req_num is None or getattr(tape, "hash", None) is None:
+            raise Uncacheable("reference to unfinished tape %s" % tape.name)
+        return json.loads(json.dumps([tape.hash.hex(),
+                                      encode_req_num(req_num)]))
+
+    def store_tape(self, tape, key, exports, snapshot):
+        """ Store optimized tape unless the optimization had side
+        effects. """
+        program = tape.program
+        if self.snapshot(program) != snapshot:
+            if program.verbose:
+                print("Cannot cache tape %s due to side effects" % tape.name)
+            return
+        try:
+            refs = [[i] + self.tape_ref(program.tapes[i])
+                    for i in self.tape_refs(tape)]
+        except Uncacheable:
+            return
+        code = []
+        lengths = array.array("Q")
+        for inst in tape._get_instructions():
+            if inst is not None:
+                code.append(bytes(inst.get_bytes()))
+                lengths.append(len(code[-1]))
+        self.store(key, blobs=[b"".join(code), lengths.tobytes()],
+                   exports=[reg.i for reg in exports],
+                   req_num=encode_req_num(tape.req_num),
+                   req_bit_length=dict(tape.req_bit_length),
+                   used_security=program.used_security,
+                   relevant_opts=sorted(program.relevant_opts),
+                   reg_usage=tape.reg_usage,
+                   req_tree=tape.serialized_req_tree, refs=refs)
+
+    def restore_tape(self, tape, key, exports):
+        """ Replace the blocks of a tape by the optimized version if
+        available.
+
+        :returns: whether the tape was restored
+        """
+        program = tape.program
+        meta = self.lookup(key)
+        if meta is None or len(meta["exports"]) != len(exports):
+            return False
+        for ref in meta["refs"]:
+            i = ref[0]
+            try:
+                if i >= len(program.tapes) or \
+                   self.tape_ref(program.tapes[i]) != ref[1:]:
+                    return False
+            except Uncacheable:
+                return False
+        try:
+            code = self.read_blob(key, 0)
+            lengths = array.array("Q")
+            lengths.frombytes(self.read_blob(key, 1))
+        except OSError:
+            return False
+        instructions = []
+        start = 0
+        for length in lengths:
+            instructions.append(CachedInstruction(code[start:start + length]))
+            start += length
+        for reg, i in zip(exports, meta["exports"]):
+            reg.i = i
+        program.used_security = max(program.used_security,
+                                    meta["used_security"])
+        program.relevant_opts.update(meta["relevant_opts"])
+        tape.restore_optimized(instructions, decode_req_num(meta["req_num"]),
+                               meta["req_bit_length"])
+        tape.reg_usage = meta["reg_usage"]
+        tape.serialized_req_tree = meta["req_tree"]
+        return True
+
+
+class TapeFingerprint:
+    """ Canonical description of a tape before optimization. Registers
+    are described by the numbers assigned on creation, and blocks and
+    instructions by their position. Any object without canonical
+    description makes the tape uncacheable. """
+
+    scalars = (type(None), bool, int, float, str)
+    ignored_options = ("asmoutfile", "outfile", "profile", "metadata") + \
+        CompilationCache.neutral_options
+    ignored_slots = ("caller", "arg_format", "code")
+    ignored_program_attrs = ("tape_counter", "saved", "n_threads",
+                             "used_security", "name", "infile",
+                             "programs_dir", "cache_status", "hash",
+                             "tape_cache_hits", "tape_cache_misses",
+                             "compile_jobs", "stream_bytecode")
+
+    def __init__(self, tape):
+        self.tape = tape
+        self.program = tape.program
+        self.blocks = dict((id(block), i)
+                           for i, block in enumerate(tape.basicblocks))
+        self.positions = {}
+        for i, block in enumerate(tape.basicblocks):
+            for j, inst in enumerate(block.instructions):
+                self.positions[id(inst)] = i, j
+        self.tape_nodes = dict((id(t.req_tree), i)
+                               for i, t in enumerate(self.program.tapes))
+        self.objects = {}
+        self.classes = {}
+        self.slots = {}
+        self.exports = tape.exported_registers()
+
+    def digest(self):
+        from . import types as ctypes
+        tape = self.tape
+        program = self.program
+        h = hashlib.sha256()
+        update = lambda x: h.update(x.encode() + b"\0")
+        options = dict((k, v) for k, v in vars(program.options).items()
+                       if not k.startswith("cache") and
+                       k not in self.ignored_options)
+        update(self.enc(options))
+        update(self.enc(dict(
+            (k, v) for k, v in vars(program).items()
+            if type(v) in self.scalars and
+            k not in self.ignored_program_attrs)))
+        update(self.enc(program.non_linear))
+        update(self.enc(program.to_merge))
+        update(self.enc([ctypes.sfix, ctypes.cfix, ctypes.sfloat]))
+        update(self.enc([tape.merge_opens, tape.singular, len(tape.if_states),
+                         dict(tape.req_bit_length), tape.return_values]))
+        update(self.enc([reg for reg in program.base_addresses
+                         if reg.program is tape]))
+        update(self.enc(dict((self.blocks[id(block)], addr) for block, addr
+                             in tape.function_basicblocks.items())))
+        for block in tape.basicblocks:
+            update(self.block(block))
+            for inst in block.instructions:
+                update(self.instruction(inst))
+        update(self.req_node(tape.req_tree, {}))
+        return h.digest()
+
+    def ident(self, x):
+        return self.objects.setdefault(id(x), (len(self.objects), x))[0]
+
+    def enc(self, x):
+        t = type(x)
+        if t in self.scalars:
+            return repr(x)
+        elif isinstance(x, Tape.Register):
+            return self.register(x)
+        elif t in (list, tuple):
+            return "[%s]" % ",".join(self.enc(y) for y in x)
+        elif isinstance(x, dict):
+            return "{%s}" % ",".join(sorted(
+                "%s:%s" % (self.enc(k), self.enc(v)) for k, v in x.items()))
+        elif isinstance(x, type):
+            return self.cls(x)
+        elif isinstance(x, (Instruction, Mergeable)):
+            if id(x) in self.positions:
+                return "I%d.%d" % self.positions[id(x)]
+            else:
+                return self.instruction(x)
+        elif isinstance(x, Tape.BasicBlock):
+            try:
+                return "B%d" % self.blocks[id(x)]
+            except KeyError:
+                raise Uncacheable("reference to foreign block")
+        elif isinstance(x, types.FunctionType):
+            return self.function(x)
+        elif isinstance(x, types.CodeType):
+            return "<%s>" % ",".join((x.co_code.hex(), self.enc(x.co_consts),
+                                      self.enc(x.co_names)))
+        elif isinstance(x, types.BuiltinFunctionType):
+            return x.__qualname__
+        elif t is object:
+            return "O%d" % self.ident(x)
+        elif t.__module__ == "Compiler.non_linear":
+            return self.cls(t) + self.enc(vars(x))
+        else:
+            raise Uncacheable("cannot describe %s" % t.__name__)
+
+    def register(self, reg):
+        if reg.program is not self.tape:
+            return "X%s%s:%s" % (reg.reg_type, reg.i, reg.size)
+        base = reg.vectorbase
+        res = "R%s%s:%s:%s:%d:%d" % (
+            reg.reg_type, reg.i, reg.size, base.i if base is not reg else "",
+            reg.relative_i, reg.can_eliminate)
+        for x in reg.vector or [reg]:
+            res += "[%s]" % ",".join(sorted(
+                "%s%s:%s" % (dup.reg_type, dup.i, dup.size)
+                for dup in x.duplicates if dup is not x))
+        return res
+
+    def cls(self, t):
+        if t not in self.classes:
+            self.classes[t] = "%s.%s{%s}" % (t.__module__, t.__name__, ",".join(
+                "%s=%r" % (k, v) for k, v in sorted(vars(t).items())
+                if type(v) in self.scalars and not k.startswith("__")))
+        return self.classes[t]
+
+    def function(self, f):
+        if f.__closure__:
+            closure = []
+            for cell in f.__closure__:
+                try:
+                    closure.append(cell.cell_contents)
+                except ValueError:
+                    closure.append(None)
+        else:
+            closure = None
+        return "%s.%s(%s)" % (f.__module__, f.__qualname__, ",".join(
+            self.enc(x) for x in (f.__code__, f.__defaults__, closure)))
+
+    def instruction(self, inst):
+        from .instructions import call_tape, run_tape
+        t = type(inst)
+        if t not in self.slots:
+            self.slots[t] = [slot for c in t.__mro__
+                             for slot in c.__dict__.get("__slots__", ())
+                             if slot not in self.ignored_slots]
+        res = [self.cls(t)]
+        for name in self.slots[t]:
+            try:
+                res.append("%s=%s" % (name, self.enc(getattr(inst, name))))
+            except AttributeError:
+                pass
+        for name, value in sorted(getattr(inst, "__dict__", {}).items()):
+            if name != "caller":
+                res.append("%s=%s" % (name, self.enc(value)))
+        if isinstance(inst, run_tape):
+            refs = inst.args[1::3]
+        elif isinstance(inst, call_tape):
+            refs = inst.args[:1]
+        else:
+            refs = []
+        for i in refs:
+            res.append(self.enc(CompilationCache.tape_ref(
+                self.program.tapes[i])))
+        return "(%s)" % ";".join(res)
+
+    def block(self, block):
+        attrs = [block.scope, self.ident(block.alloc_pool),
+                 self.ident(block.alloc_pool.parent)
+                 if block.alloc_pool.parent else None,
+                 self.ident(block.req_node), block.exit_condition,
+                 block.exit_block, block.previous_block,
+                 getattr(block, "sub_block", None),
+                 getattr(block, "return_address_store", None),
+                 block.n_rounds, block.n_to_merge, dict(block.rounds),
+                 block.warn_about_mem]
+        return "B" + self.enc(attrs)
+
+    def req_node(self, node, seen):
+        if node is not self.tape.req_tree and id(node) in self.tape_nodes:
+            i = self.tape_nodes[id(node)]
+            return "T%d%s" % (i, self.enc(CompilationCache.tape_ref(
+                self.program.tapes[i])))
+        if id(node) in seen:
+            return "N%d" % seen[id(node)]
+        seen[id(node)] = len(seen)
+        res = [self.enc(None if node.num is None else dict(node.num)),
+               self.enc([self.blocks.get(id(block)) for block in node.blocks])]
+        for child in node._children:
+            if isinstance(child, Tape.ReqChild):
+                res.append("C%s[%s]" % (
+                    self.enc(child.aggregator),
+                    ",".join(self.req_node(x, seen) for x in child.nodes)))
+            else:
+                res.append(self.req_node(child, seen))
+        return "N(%s)" % ";".join(res)
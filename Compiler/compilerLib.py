@@ -1,10 +1,8 @@
-import inspect
 import os
 import re
 import sys
-import tempfile
-import subprocess
 from optparse import OptionParser
+from types import FunctionType
 
 from Compiler.exceptions import CompilerError
 
@@ -13,6 +11,8 @@ from .program import Program, defaults
 
 
 class Compiler:
+    _symbols = None
+
     def __init__(self, custom_args=None, usage=None, execute=False,
                  split_args=False):
         if usage:
@@ -117,6 +117,32 @@ class Compiler:
             default=defaults.dead_code_elimination,
             help="eliminate instructions with unused result",
         )
+        parser.add_option(
+            "--licm",
+            "--loop-invariant-code-motion",
+            action="store_true",
+            dest="loop_invariant_code_motion",
+            default=defaults.loop_invariant_code_motion,
+            help="move computation that is the same in every iteration "
+            "out of loops",
+        )
+        parser.add_option(
+            "--constant-propagation",
+            action="store_true",
+            dest="constant_propagation",
+            default=defaults.constant_propagation,
+            help="compute clear instructions on values known at compile "
+            "time",
+        )
+        parser.add_option(
+            "--cse",
+            "--common-subexpression-elimination",
+            action="store_true",
+            dest="common_subexpression_elimination",
+            default=defaults.common_subexpression_elimination,
+            help="replace instructions repeating a computation in the "
+            "same basic block by moving the earlier result",
+        )
         parser.add_option(
             "-p",
             "--profile",
@@ -124,6 +150,67 @@ class Compiler:
             dest="profile",
             help="profile compilation",
         )
+        parser.add_option(
+            "--profile-phases",
+            dest="profile_phases",
+            default=defaults.profile_phases,
+            help="write the time and peak memory of the compilation "
+            "phases to the given file as JSON",
+        )
+        parser.add_option(
+            "--cost-profile",
+            dest="cost_profile",
+            default=defaults.cost_profile,
+            help="write the requirements and rounds per source line as "
+            "folded stacks to files starting with the given prefix",
+        )
+        parser.add_option(
+            "--critical-path",
+            dest="critical_path",
+            default=defaults.critical_path,
+            help="output the longest chain of rounds of the basic blocks "
+            "with the most rounds and write it for all blocks to the "
+            "given file as JSON",
+        )
+        parser.add_option(
+            "--estimate",
+            dest="estimate",
+            default=defaults.estimate,
+            help="estimate the communication and time for the given "
+            "protocol (e.g., semi2k) and output it as JSON",
+        )
+        parser.add_option(
+            "--latency",
+            dest="latency",
+            type="float",
+            default=defaults.latency,
+            help="network latency in milliseconds for --estimate "
+            "(default: %default)",
+        )
+        parser.add_option(
+            "--bandwidth",
+            dest="bandwidth",
+            type="float",
+            default=defaults.bandwidth,
+            help="network bandwidth in Mbit/s for --estimate "
+            "(default: %default)",
+        )
+        parser.add_option(
+            "--estimate-file",
+            dest="estimate_file",
+            default=defaults.estimate_file,
+            help="write the result of --estimate to the given file "
+            "instead of the standard output",
+        )
+        parser.add_option(
+            "--metadata",
+            action="store_true",
+            dest="metadata",
+            default=defaults.metadata,
+            help="write the requirements, rounds, register and memory "
+            "usage, and threads of the tapes to a JSON file next to the "
+            "schedule",
+        )
         parser.add_option(
             "-s",
             "--stop",
@@ -233,6 +320,73 @@ class Compiler:
             dest="flow_optimization",
             help="optimize control flow",
         )
+        parser.add_option(
+            "--compact-graph",
+            action="store_true",
+            dest="compact_graph",
+            default=defaults.compact_graph,
+            help="use less memory for the dependency graph when "
+            "merging instructions",
+        )
+        parser.add_option(
+            "--stream-bytecode",
+            action="store_true",
+            dest="stream_bytecode",
+            default=defaults.stream_bytecode,
+            help="encode basic blocks as soon as their registers are "
+            "allocated to save memory",
+        )
+        parser.add_option(
+            "--interval-allocation",
+            action="store_true",
+            dest="interval_allocation",
+            default=defaults.interval_allocation,
+            help="reuse freed registers of any size to reduce the "
+            "number of registers",
+        )
+        parser.add_option(
+            "--pressure-scheduling",
+            action="store_true",
+            dest="pressure_scheduling",
+            default=defaults.pressure_scheduling,
+            help="order instructions after merging to reduce the number "
+            "of registers in use at the same time",
+        )
+        parser.add_option(
+            "--register-report",
+            action="store_true",
+            dest="register_report",
+            default=defaults.register_report,
+            help="report the register fragmentation per tape",
+        )
+        parser.add_option(
+            "--cache-dir",
+            dest="cache_dir",
+            help="reuse compilation results for unchanged programs "
+            "stored in the given directory",
+        )
+        parser.add_option(
+            "--cache-max-size",
+            dest="cache_max_size",
+            default=defaults.cache_max_size,
+            help="maximal size of the compilation cache in MB "
+            "(default: %default)",
+        )
+        parser.add_option(
+            "--cache-max-age",
+            dest="cache_max_age",
+            default=defaults.cache_max_age,
+            help="remove cache entries not used for the given number "
+            "of days (default: %default)",
+        )
+        parser.add_option(
+            "--compile-jobs",
+            dest="compile_jobs",
+            type="int",
+            default=defaults.compile_jobs,
+            help="optimize tapes in the given number of processes "
+            "(default: 1)",
+        )
         parser.add_option(
             "-v",
             "--verbose",
@@ -316,6 +470,13 @@ class Compiler:
                         "ring option not compatible with %s" % protocol)
             if protocol == "emulate":
                 self.options.keep_cisc = ''
+        if self.options.estimate:
+            # after -E, which may choose the domain
+            from .estimate import check_domain
+            try:
+                check_domain(self.options.estimate, self.options)
+            except CompilerError as e:
+                self.parser.error(str(e))
 
     def build_program(self, name=None):
         self.prog = Program(self.args, self.options, name=name)
@@ -332,29 +493,33 @@ class Compiler:
             if self.options.execute.find("dealer") >= 0:
                 self.prog.use_edabit(True)
 
-    def build_vars(self):
-        from . import comparison, floatingpoint, instructions, library, types
-
-        # add all instructions to the program VARS dictionary
-        instr_classes = [
-            t[1] for t in inspect.getmembers(instructions, inspect.isclass)
-        ]
-
-        for mod in (types, GC_types):
-            instr_classes += [
-                t[1]
-                for t in inspect.getmembers(mod, inspect.isclass)
-                if t[1].__module__ == mod.__name__
-            ]
+    @classmethod
+    def symbols(cls):
+        """ Instructions, types, and library functions available in
+        programs. The result is computed once per process. """
+        if cls._symbols is None:
+            from . import instructions, library, types
+
+            def members(mod, kind, own=True):
+                return [
+                    t for _, t in sorted(vars(mod).items())
+                    if isinstance(t, kind) and
+                    (not own or t.__module__ == mod.__name__)
+                ]
+
+            # add all instructions to the program VARS dictionary
+            instr_classes = members(instructions, type, own=False)
+            for mod in (types, GC_types):
+                instr_classes += members(mod, type)
+            instr_classes += members(library, FunctionType)
+
+            cls._symbols = dict((op.__name__, op) for op in instr_classes)
+        return cls._symbols
 
-        instr_classes += [
-            t[1]
-            for t in inspect.getmembers(library, inspect.isfunction)
-            if t[1].__module__ == library.__name__
-        ]
+    def build_vars(self):
+        from . import comparison, floatingpoint, instructions, types
 
-        for op in instr_classes:
-            self.VARS[op.__name__] = op
+        self.VARS.update(self.symbols())
 
         # backward compatibility for deprecated classes
         self.VARS["sbitint"] = GC_types.sbitintvec
@@ -422,6 +587,14 @@ class Compiler:
         self.prog.sint = self.sint
         self.prog.sfix = self.sfix
 
+        cache = self.get_cache()
+        if cache:
+            key = self.cache_key(cache)
+            meta = cache.restore(key)
+            if meta is not None:
+                return self.restore_compile(meta)
+            self.prog.cache_status = "miss"
+
         with open(self.prog.infile, "r") as f:
             changed = False
             if self.options.flow_optimization:
@@ -464,6 +637,7 @@ class Compiler:
                             continue
                     output.append(line)
                 if changed:
+                    import tempfile
                     infile = tempfile.NamedTemporaryFile("w+", delete=False)
                     for line in output:
                         infile.write(line)
@@ -476,12 +650,64 @@ class Compiler:
         # make compiler modules directly accessible
         sys.path.insert(0, "%s/Compiler" % self.root)
         # create the tapes
-        exec(compile(infile.read(), infile.name, "exec"), self.VARS)
+        with self.prog.phase("source", file=self.prog.infile):
+            exec(compile(infile.read(), infile.name, "exec"), self.VARS)
 
         if changed and not self.options.debug:
             os.unlink(infile.name)
 
-        return self.finalize_compile()
+        self.finalize_compile()
+        if cache and self.cacheable():
+            from .cache import encode_req_num
+            from .estimate import get_inputs
+            inputs = get_inputs(self.prog)
+            inputs.pop("req_num")
+            inputs["tapes"] = [[name, encode_req_num(req_num)]
+                               for name, req_num in inputs["tapes"]]
+            cache.store(key, self.prog.output_files, hash=self.prog.hash,
+                        req_num=encode_req_num(self.prog.req_num),
+                        allocated_mem=dict(self.prog.allocated_mem),
+                        estimate=inputs)
+        return self.prog
+
+    def get_cache(self):
+        return self.prog.cache
+
+    def cache_key(self, cache):
+        """ Key covering everything that influences the compiler output
+        apart from the compiler itself. """
+        import json
+        with open(self.prog.infile, "rb") as f:
+            source = f.read()
+        options = dict((k, v) for k, v in vars(self.options).items()
+                       if not k.startswith("cache") and
+                       k not in cache.neutral_options)
+        return cache.key(source, json.dumps(options, sort_keys=True,
+                                            default=str),
+                         json.dumps(self.prog.args), self.prog.name,
+                         os.getenv("PLAYERS", ""))
+
+    def cacheable(self):
+        """ Whether the result only consists of bytecode and schedule. """
+        return self.prog.public_input_file is None and \
+            not self.prog.input_files and not self.options.asmoutfile
+
+    def restore_compile(self, meta):
+        from .cache import decode_req_num
+        for filename in meta["files"]:
+            print("Restored", filename)
+        print("Hash:", meta["hash"])
+        print("Compilation cache: hit")
+        self.prog.hash = meta["hash"]
+        self.prog.req_num = decode_req_num(meta["req_num"])
+        self.prog.allocated_mem.update(meta.get("allocated_mem", {}))
+        inputs = dict(meta["estimate"], req_num=self.prog.req_num or {})
+        inputs["tapes"] = [(name, decode_req_num(req_num))
+                           for name, req_num in inputs["tapes"]]
+        self.print_requirements()
+        self.write_estimate(inputs)
+        self.write_phase_profile()
+        return self.prog
 
     def register_function(self, name=None):
         """
@@ -510,12 +736,54 @@ class Compiler:
         print(
             "Compiling: {} from {}".format(self.compile_name, self.compile_func.__name__)
         )
-        self.compile_function()
+        with self.prog.phase("source", function=self.compile_name):
+            self.compile_function()
         self.finalize_compile()
 
     def finalize_compile(self):
-        self.prog.finalize()
+        with self.prog.phase("finalize"):
+            self.prog.finalize()
+        self.print_requirements()
+        self.write_cost_profile()
+        self.write_critical_paths()
+        self.write_estimate()
+        self.write_phase_profile()
+        return self.prog
 
+    def write_phase_profile(self):
+        if self.prog.profiler:
+            self.prog.profiler.write(self.options.profile_phases, self.prog)
+
+    def write_cost_profile(self):
+        if self.options.cost_profile:
+            from .cost_profile import CostProfile
+            CostProfile(self.prog).write(self.options.cost_profile)
+
+    def write_critical_paths(self, n_blocks=5):
+        if self.options.critical_path:
+            import json
+            from .allocator import format_critical_path
+            paths = [dict(tape=tape.name, **path)
+                     for tape in self.prog.tapes
+                     for path in tape.critical_paths]
+            paths.sort(key=lambda x: -x["rounds"])
+            for path in paths[:n_blocks]:
+                for line in format_critical_path(path, path["block"]):
+                    print(line)
+            filename = self.options.critical_path
+            print("Writing critical paths to", filename)
+            with open(filename, "w") as f:
+                json.dump(dict(program=self.prog.name, blocks=paths), f,
+                          indent=1)
+
+    def write_estimate(self, inputs=None):
+        if self.options.estimate:
+            from .estimate import write
+            write(self.prog, self.options.estimate, self.options.latency,
+                  self.options.bandwidth, self.options.estimate_file,
+                  inputs)
+
+    def print_requirements(self):
         if self.prog.req_num:
             print("Program requires at most:")
             for x in self.prog.req_num.pretty():
@@ -526,8 +794,6 @@ class Compiler:
             print("Cost:", 0 if self.prog.req_num is None else self.prog.req_num.cost())
             print("Memory size:", dict(self.prog.allocated_mem))
 
-        return self.prog
-
     match = {
         "ring": "replicated-ring",
         "rep-field": "replicated-field",
@@ -552,6 +818,7 @@ class Compiler:
         executable = self.executable_from_protocol(self.options.execute)
         if not os.path.exists("%s/%s" % (self.root, executable)):
             print("Creating binary for virtual machine...")
+            import subprocess
             try:
                 subprocess.run(["make", executable], check=True, cwd=self.root)
             except:
@@ -625,7 +892,6 @@ class Compiler:
 
         import threading
         import random
-        import io
 
         def run_and_capture_outputs(outputs, fn, i):
             out = fn(i)
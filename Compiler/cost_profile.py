@@ -0,0 +1,169 @@
+"""
+This module contains the attribution of costs to source lines used by
+:file:`compile.py` with ``--cost-profile``. Every instruction carries
+the call stack at its creation (see :py:func:`~Compiler.util.get_trace`),
+and the requirements of the instruction (see
+:py:meth:`~Compiler.program.Tape.ReqNum.pretty`) are added to the
+stack. Rounds are attributed when merging instructions: a round is
+split evenly between the distinct stacks of the instructions merged
+into it, so a stack is charged for every round it shares. The numbers
+are then aggregated like the requirements of the program, that is,
+multiplied by the number of iterations of loops, taking the maximum
+of both branches of run-time conditionals, and including the tapes
+run in threads or called.
+
+Instructions resulting from CISC instructions (see :option:`-C`) are
+attributed to the stack of the CISC instruction with an additional
+frame ``<cisc>`` naming the function such as ``LTZ``. If several CISC
+instructions are merged or the expansion is reused, the first one is
+charged.
+
+The result is written as folded stacks, one file per kind of
+requirement, which can be read by flame graph tools such as
+``flamegraph.pl`` or speedscope. Every line consists of the frames
+from outermost to innermost separated by semicolons and the number,
+for example::
+
+  <module> (Programs/Source/tutorial.mpc:12);__lt__ (Compiler/types.py:2016) 42
+
+Stacks with a number that cannot be determined at compile time, for
+example because of loops with a run-time number of iterations, are
+not included.
+"""
+
+import os
+from collections import defaultdict
+
+from Compiler.allocator import is_cisc
+
+# frames of running the compiler rather than the program
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+compiler_files = set(os.path.join(root, x) for x in
+                     ("compile.py", os.path.join("Compiler", "compilerLib.py")))
+
+
+def get_trace(inst):
+    """ Stack to attribute the cost of an instruction to. """
+    if is_cisc(inst):
+        return cisc_trace(inst)
+    else:
+        return inst.caller
+
+
+def cisc_trace(inst):
+    """ Stack for instructions resulting from a CISC instruction. """
+    if inst.caller is None:
+        return None
+    return (("<cisc>", 0, inst.function.__name__),) + inst.caller
+
+
+def add_rounds(block, trace, n):
+    """ Attribute *n* rounds in *block* to *trace*. """
+    if block.round_profile is None:
+        block.round_profile = defaultdict(lambda: 0)
+    block.round_profile[trace] += n
+
+
+class CostProfile(object):
+    """ Aggregation of the costs per stack over the requirement trees
+    of the tapes.
+
+    :param program: :py:class:`~Compiler.program.Program` instance
+    """
+
+    def __init__(self, program):
+        from Compiler.program import Tape
+        self.program = program
+        self.Tape = Tape
+        self.aggregated = {}
+        self.running = set()
+
+    def block_usage(self, block):
+        Tape = self.Tape
+        res = Tape.ReqNum()
+        req_node = Tape.ReqNode("")
+        instructions = list(block.usage_instructions)
+        if not block.purged:
+            instructions += block.instructions
+        from Compiler.instructions import call_tape
+        for inst in instructions:
+            if inst is None:
+                continue
+            if isinstance(inst, call_tape):
+                res += self.aggregate(
+                    self.program.tapes[inst.args[0]].req_tree)
+                continue
+            req_node.num = Tape.ReqNum()
+            inst.add_usage(req_node)
+            trace = get_trace(inst)
+            for req, num in req_node.num.items():
+                res[trace, req] += num
+        for trace, n in (block.round_profile or {}).items():
+            res[trace, ("all", "round")] += n
+        return res
+
+    def aggregate(self, node):
+        """ Costs per stack and requirement for a node in the
+        requirement tree. """
+        key = id(node)
+        if key in self.aggregated:
+            return self.aggregated[key]
+        if key in self.running:
+            # recursion
+            return self.Tape.ReqNum()
+        self.running.add(key)
+        res = self.Tape.ReqNum()
+        for block in node.blocks:
+            res += self.block_usage(block)
+        for child in node._children:
+            if isinstance(child, self.Tape.ReqNode):
+                res += self.aggregate(child)
+            else:
+                res += child.aggregator(
+                    [self.aggregate(x) for x in child.nodes])
+        self.running.remove(key)
+        self.aggregated[key] = res
+        return res
+
+    @staticmethod
+    def format_frame(frame):
+        filename = frame[0]
+        if filename == "<cisc>":
+            return "%s (%s)" % (frame[2], filename)
+        if not filename.startswith("<"):
+            filename = os.path.relpath(filename)
+        return "%s (%s:%d)" % (frame[2], filename, frame[1])
+
+    def format_trace(self, trace):
+        if trace is None:
+            return "<unknown>"
+        frames = [x for x in reversed(trace)
+                  if os.path.abspath(x[0]) not in compiler_files]
+        return ";".join(self.format_frame(x) for x in frames)
+
+    def write(self, prefix):
+        """ Write folded stacks to ``<prefix>-<requirement>.folded``. """
+        res = self.aggregate(self.program.tapes[0].req_tree)
+        by_req = defaultdict(lambda: defaultdict(lambda: 0))
+        unknown = 0
+        for (trace, req), num in res.items():
+            if num == float("inf") or num != num or num < 0:
+                unknown += 1
+            elif num:
+                by_req[req][self.format_trace(trace)] += num
+        for req in sorted(by_req, key=str):
+            name = "-".join(
+                "x".join(str(y) for y in x) if isinstance(x, tuple)
+                else str(x) for x in req if x != "all")
+            filename = "%s-%s.folded" % (prefix, name)
+            print("Writing cost profile to", filename)
+            with open(filename, "w") as f:
+                for stack, num in sorted(by_req[req].items()):
+                    if num == int(num):
+                        num = "%d" % num
+                    else:
+                        num = ("%.3f" % num).rstrip("0").rstrip(".")
+                    print(stack, num, file=f)
+        if unknown:
+            print("%d costs per source line are unknown at compile time "
+                  "and not included in the cost profile" % unknown)
@@ -0,0 +1,281 @@
+"""
+This module contains the cost models used by :file:`compile.py` with
+``--estimate``. They combine the preprocessing requirements and the
+number of rounds computed by the compiler (see
+:py:meth:`~Compiler.program.Tape.ReqNum.pretty`) with the
+communication of a protocol per operation in order to predict the
+data sent and the time of the online and the offline phase.
+
+The models only cover communication. The offline communication of
+protocols based on oblivious transfer is approximated by the number
+of correlated oblivious transfers of the size of a share needed per
+triple, and random bits are assumed to cost as much as a
+triple. Computation, the cost of checking correctness, and the rounds
+of the offline phase are not considered. Rounds of tapes running in
+parallel are added up. The estimates are therefore only meant for
+comparing protocols and programs and for planning the order of
+magnitude of resources.
+
+The result is a JSON object with the following keys:
+
+``program``, ``protocol``, ``parties``, ``latency``, ``bandwidth``
+  Parameters of the estimate with the latency in milliseconds and the
+  bandwidth in Mbit/s per party. The number of parties is taken from
+  the environment variable ``PLAYERS`` for protocols supporting any
+  number.
+
+``share_bits``
+  Bit length of a share per computation domain (``modp``,
+  ``gf2n``, or ``bit``).
+
+``total``
+  Estimate for the whole program.
+
+``tapes``
+  Estimates for a single run of every tape.
+
+Every estimate contains ``rounds`` as well as ``online`` and
+``offline``, which in turn contain ``bytes`` sent per party and the
+``time`` in seconds. ``time`` is the sum of both phases. Values are
+``null`` if they cannot be determined at compile time, for example
+because of loops with a run-time number of iterations. ``ignored``
+lists the requirements not covered by the model of the protocol.
+"""
+
+import json
+import math
+import os
+
+from Compiler.exceptions import CompilerError
+
+kappa = 128
+
+
+def ot_triple(k, n, tau=1):
+    """ Bits sent per party for a triple with shares of length *k* using
+    correlated oblivious transfer with every other party. """
+    return tau * 2 * (n - 1) * k * (k + kappa)
+
+
+class Protocol(object):
+    """ Communication model of a protocol.
+
+    :param domains: computation domains supported (``ring``, ``field``,
+      ``binary``)
+    :param parties: number of parties
+    :param open: shares sent per party for opening a value
+    :param triple: shares sent per party for a multiplication online
+    :param offline: function of share length and number of parties
+      returning the bits sent per party for a triple offline
+    :param extra: bits added to the length of a share
+    :param shares: elements stored per party for a secret value
+      including MACs (used by :file:`Scripts/memory-usage.py`)
+    """
+
+    def __init__(self, domains, parties, open, triple, offline=None,
+                 extra=0, shares=1):
+        self.domains = domains
+        self.parties = parties
+        self.open = open
+        self.triple = triple
+        self.offline = offline or (lambda k, n: 0)
+        self.extra = extra
+        self.shares = shares
+
+    def share_bits(self, domain, options, inputs):
+        if domain == "bit":
+            return 1
+        elif domain == "gf2n":
+            return inputs["galois_length"]
+        elif options.ring:
+            return int(options.ring) + self.extra
+        else:
+            # prime fields are stored in words
+            return int(math.ceil(inputs["prime_length"] / 64) * 64)
+
+
+def semi_honest(domains):
+    return lambda n=2: Protocol(domains, n, n - 1, 2 * (n - 1), ot_triple)
+
+
+def malicious(domains, tau=3, extra=0):
+    return lambda n=2: Protocol(domains, n, n - 1, 2 * (n - 1),
+                                lambda k, n: ot_triple(k, n, tau),
+                                extra=extra, shares=2)
+
+
+def shamir(factor):
+    return lambda n=3: Protocol(("field",), n, factor * (n - 1),
+                                factor * (n - 1))
+
+
+protocols = {
+    "ring": Protocol(("ring",), 3, 1, 1, shares=2),
+    "rep-field": Protocol(("field",), 3, 1, 1, shares=2),
+    "replicated": Protocol(("binary",), 3, 1, 1, shares=2),
+    "rep4-ring": Protocol(("ring",), 4, 1, 2, shares=3),
+    "shamir": shamir(1),
+    "mal-rep-ring": Protocol(("ring",), 3, 2, 2, lambda k, n: 2 * k,
+                             shares=2),
+    "mal-rep-field": Protocol(("field",), 3, 2, 2, lambda k, n: 2 * k,
+                              shares=2),
+    "ps-rep-ring": Protocol(("ring",), 3, 2, 2, shares=2),
+    "ps-rep-field": Protocol(("field",), 3, 2, 2, shares=2),
+    "sy-rep-ring": Protocol(("ring",), 3, 2, 2, extra=40, shares=4),
+    "mal-shamir": shamir(2),
+    "semi": semi_honest(("field",)),
+    "semi2k": semi_honest(("ring",)),
+    "semi-bin": semi_honest(("binary",)),
+    "mascot": malicious(("field",)),
+    "spdz2k": malicious(("ring",), tau=1, extra=64),
+    "tinier": malicious(("binary",), tau=4),
+}
+
+
+def estimate_req(req_num, protocol, share_bits, latency, bandwidth):
+    """ Estimate for requirements in the format of
+    :py:class:`~Compiler.program.Tape.ReqNum`. """
+    n = protocol.parties
+    online = offline = 0
+    ignored = []
+    for req, num in req_num.items():
+        domain = req[0]
+        if domain == "all" or req[1] == "round":
+            continue
+        if domain in ("edabit", "sedabit"):
+            # one bit per bit of the edabit and one in the arithmetic domain
+            k = share_bits["modp"]
+            offline += num * (req[1] * protocol.offline(1, n) +
+                              protocol.offline(k, n))
+            continue
+        if domain == "matmul":
+            a, b, c = req[1]
+            k = share_bits["modp"]
+            if protocol.offline(k, n):
+                online += num * (a * b + b * c) * protocol.open * k
+                offline += num * a * b * c * protocol.offline(k, n)
+            else:
+                online += num * a * c * protocol.triple * k
+            continue
+        if domain not in share_bits:
+            ignored.append(list(req))
+            continue
+        k = share_bits[domain]
+        if req[1] in ("triple", "square"):
+            online += num * protocol.triple * k
+            offline += num * protocol.offline(k, n)
+        elif req[1] in ("bit", "dabit", "mixed"):
+            offline += num * (protocol.offline(k, n) or
+                              protocol.triple * k)
+        elif req[1] == "inverse":
+            online += num * (protocol.triple + protocol.open) * k
+            offline += num * protocol.offline(k, n)
+        elif req[1] == "open":
+            online += num * protocol.open * k
+        elif req[1] == "input":
+            # the inputting party sends to all others
+            online += num * (n - 1) * k / n
+        else:
+            ignored.append(list(req))
+    rounds = req_num.get(("all", "round"), 0)
+
+    def finite(x):
+        # unknown numbers lead to infinity or NaN
+        return None if x == float("inf") or x != x or x < 0 else x
+
+    def phase(bits, rounds=0):
+        if finite(bits) is None or finite(rounds) is None:
+            return dict(bytes=None, time=None)
+        return dict(bytes=int(math.ceil(bits / 8)),
+                    time=rounds * latency / 1e3 + bits / bandwidth / 1e6)
+
+    res = dict(rounds=finite(rounds), online=phase(online, rounds),
+               offline=phase(offline))
+    times = [res[x]["time"] for x in ("online", "offline")]
+    res["time"] = None if None in times else sum(times)
+    if ignored:
+        res["ignored"] = sorted(ignored, key=str)
+    return res
+
+
+def get_protocol(protocol):
+    """ Model of a protocol named as for ``-E``. """
+    if protocol not in protocols:
+        raise CompilerError("no cost model for protocol %s, "
+                            "available: %s" %
+                            (protocol, ", ".join(sorted(protocols))))
+    model = protocols[protocol]
+    if not isinstance(model, Protocol):
+        # number of parties as for Scripts/<protocol>.sh
+        if os.getenv("PLAYERS"):
+            model = model(int(os.getenv("PLAYERS")))
+        else:
+            model = model()
+    return model
+
+
+def check_domain(protocol, options):
+    """ Raise an error if a protocol does not support the computation
+    domain chosen by the compiler options. """
+    model = get_protocol(protocol)
+    domain = "ring" if options.ring else "binary" \
+        if options.binary or options.garbled else "field"
+    if domain not in model.domains:
+        raise CompilerError("protocol %s does not support computation "
+                            "in this domain (%s)" % (protocol, domain))
+    return model
+
+
+def get_inputs(program):
+    """ Properties of a compiled program needed for an estimate
+    besides the options. They are stored in the compilation cache in
+    order to estimate programs restored from it. """
+    if program.prime:
+        prime_length = program.prime.bit_length()
+    else:
+        prime_length = max([tape.req_bit_length["p"]
+                            for tape in program.tapes] or [0]) or \
+            program.bit_length + program._security
+    return dict(prime_length=prime_length,
+                galois_length=program.galois_length,
+                req_num=program.req_num or {},
+                tapes=[(tape.name, tape.req_num) for tape in program.tapes
+                       if getattr(tape, "req_num", None) is not None])
+
+
+def estimate(program, protocol, latency, bandwidth, inputs=None):
+    """ Estimate the communication and time of a compiled program.
+
+    :param program: :py:class:`~Compiler.program.Program` instance
+    :param protocol: name as used for ``-E``
+    :param latency: latency in milliseconds
+    :param bandwidth: bandwidth in Mbit/s
+    :param inputs: result of :py:func:`get_inputs` (default: computed
+      from *program*)
+    :returns: dictionary as described above
+    """
+    model = check_domain(protocol, program.options)
+    if inputs is None:
+        inputs = get_inputs(program)
+    share_bits = dict((x, model.share_bits(x, program.options, inputs))
+                      for x in ("modp", "gf2n", "bit"))
+    res = dict(program=program.name, protocol=protocol,
+               parties=model.parties, latency=latency,
+               bandwidth=bandwidth, share_bits=share_bits)
+    args = model, share_bits, latency, bandwidth
+    res["total"] = estimate_req(inputs["req_num"], *args)
+    res["tapes"] = [dict(tape=name, **estimate_req(req_num, *args))
+                    for name, req_num in inputs["tapes"]]
+    return res
+
+
+def write(program, protocol, latency, bandwidth, filename=None,
+          inputs=None):
+    """ Write estimate as JSON to *filename* or standard output. """
+    res = estimate(program, protocol, latency, bandwidth, inputs)
+    if filename:
+        print("Writing estimate to", filename)
+        with open(filename, "w") as f:
+            json.dump(res, f, indent=1)
+    else:
+        print(json.dumps(res, indent=1))
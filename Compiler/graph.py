@@ -1,4 +1,4 @@
-import heapq
+import array
 import collections
 from Compiler.exceptions import *
 
@@ -102,59 +102,255 @@ class SparseDiGraph(object):
         return len(self.succ[i])
 
 
+class ConstantWeights(object):
+    """ Weights of a graph where all edges have the same weight. """
+    def __init__(self, value=1):
+        self.value = value
+
+    def __getitem__(self, edge):
+        return self.value
+
+    def __setitem__(self, edge, weight):
+        if weight != self.value:
+            raise GraphError('Only constant weights supported')
+
+    def negate(self):
+        self.value = -self.value
+
+
+class CompactDiGraph(object):
+    """ Directed graph with the interface of :py:class:`SparseDiGraph`
+    storing the edges in arrays in compressed sparse row (CSR) format.
+    This uses considerably less memory for large graphs.
+
+    Initially, edges should be added in order of the target node,
+    which allows to build the predecessor lists directly. The
+    successor lists are built when first needed. Any edges added later
+    are stored separately. All edges have weight one.
+
+    Removing a node keeps its outgoing edges as in
+    :py:class:`SparseDiGraph`, which is relevant for the order of a
+    topological sort.
+    """
+    def __init__(self, max_nodes, default_attributes=None):
+        if default_attributes is None:
+            default_attributes = { 'merges': None }
+        self.default_attributes = default_attributes
+        self.n = max_nodes
+        self.attributes = {}
+        self.weights = ConstantWeights()
+        # edges by target node
+        self.pred_ptr = array.array('Q', [0])
+        self.pred_nodes = array.array('I')
+        # last target for each source plus one to detect duplicates
+        self.last_target = array.array('I', bytes(4 * self.n))
+        self.succ_ptr = None
+        self.succ_nodes = None
+        self.extra_succ = collections.defaultdict(list)
+        self.extra_pred = collections.defaultdict(list)
+        self.deleted = set()
+        # sequence number of removal, zero for present nodes
+        self.removed = array.array('I', bytes(4 * self.n))
+        self.n_removed = 0
+        self.pred = CompactDiGraph.Predecessors(self)
+
+    class Predecessors(object):
+        def __init__(self, graph):
+            self.graph = graph
+
+        def __getitem__(self, j):
+            return self.graph.get_pred(j)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        """ Get list of the neighbours of node i """
+        self.freeze()
+        res = self.succ_nodes[self.succ_ptr[i]:self.succ_ptr[i + 1]].tolist()
+        if self.deleted:
+            deleted = self.deleted
+            res = [j for j in res if (i, j) not in deleted]
+        extra = self.extra_succ.get(i)
+        if extra:
+            res += extra
+        if self.n_removed:
+            removed = self.removed
+            since = removed[i]
+            if since:
+                res = [j for j in res if not removed[j] or removed[j] > since]
+            else:
+                res = [j for j in res if not removed[j]]
+        return res
+
+    def __contains__(self, i):
+        return i >= 0 and i < self.n
+
+    def get_pred(self, j):
+        if self.removed[j]:
+            return []
+        n_targets = len(self.pred_ptr) - 1
+        if j < n_targets:
+            nodes = self.pred_nodes[self.pred_ptr[j]:self.pred_ptr[j + 1]]
+        elif j == n_targets:
+            nodes = self.pred_nodes[self.pred_ptr[j]:]
+        else:
+            nodes = []
+        removed = self.removed
+        deleted = self.deleted
+        res = [i for i in nodes if not removed[i] and
+               (not deleted or (i, j) not in deleted)]
+        res += [i for i in self.extra_pred.get(j, ()) if not removed[i]]
+        return res
+
+    def add_node(self, i, **attr):
+        if i >= self.n:
+            raise CompilerError('Cannot add node %d to graph of size %d' % (i, self.n))
+        for a,value in list(attr.items()):
+            self.set_attr(i, a, value)
+
+    def set_attr(self, i, attr, value):
+        if attr in self.default_attributes:
+            self.attributes[i, attr] = value
+        else:
+            raise CompilerError('Invalid attribute %s for graph node' % attr)
+
+    def get_attr(self, i, attr):
+        try:
+            return self.attributes[i, attr]
+        except KeyError:
+            return self.default_attributes[attr]
+
+    def remove_node(self, i):
+        """ Remove node i and all incoming edges """
+        self.freeze()
+        self.n_removed += 1
+        self.removed[i] = self.n_removed
+        for attr in self.default_attributes:
+            self.attributes.pop((i, attr), None)
+
+    def add_edge(self, i, j, weight=1):
+        self.weights[i, j] = weight
+        if self.succ_ptr is None:
+            n_targets = len(self.pred_ptr) - 1
+            if j >= n_targets:
+                for k in range(n_targets, j):
+                    self.pred_ptr.append(len(self.pred_nodes))
+                if self.last_target[i] != j + 1:
+                    self.last_target[i] = j + 1
+                    self.pred_nodes.append(i)
+                return
+            self.freeze()
+        if j not in self[i]:
+            self.extra_succ[i].append(j)
+            self.extra_pred[j].append(i)
+
+    def add_edges_from(self, tuples):
+        for edge in tuples:
+            self.add_edge(*edge)
+
+    def remove_edge(self, i, j):
+        self.freeze()
+        if j in self.extra_succ.get(i, ()):
+            self.extra_succ[i].remove(j)
+            self.extra_pred[j].remove(i)
+        else:
+            self.deleted.add((i, j))
+
+    def remove_edges_from(self, pairs):
+        for i,j in pairs:
+            self.remove_edge(i, j)
+
+    def degree(self, i):
+        return len(self[i])
+
+    def freeze(self):
+        """ Build successor lists from the predecessor lists. """
+        if self.succ_ptr is not None:
+            return
+        while len(self.pred_ptr) <= self.n:
+            self.pred_ptr.append(len(self.pred_nodes))
+        self.last_target = None
+        counts = array.array('Q', bytes(8 * (self.n + 1)))
+        for i in self.pred_nodes:
+            counts[i + 1] += 1
+        for i in range(self.n):
+            counts[i + 1] += counts[i]
+        self.succ_ptr = array.array('Q', counts)
+        self.succ_nodes = array.array('I', bytes(4 * len(self.pred_nodes)))
+        pred_ptr = self.pred_ptr
+        pred_nodes = self.pred_nodes
+        succ_nodes = self.succ_nodes
+        for j in range(self.n):
+            for k in range(pred_ptr[j], pred_ptr[j + 1]):
+                i = pred_nodes[k]
+                succ_nodes[counts[i]] = j
+                counts[i] += 1
+
+
 def topological_sort(G, nbunch=None, pref=None):
-    seen={}
-    order_explored=[] # provide order and 
-    explored={}       # fast search without more general priorityDictionary
-    
+    """ Topological order by depth-first search from the nodes in
+    *nbunch* (default: all nodes in reverse order). The search state
+    is kept in an array indexed by node, and the successors of every
+    node are only considered once, which makes this linear in the
+    size of the graph.
+
+    :param pref: dictionary of preferred order of successors
+    """
+    # 0: not seen, 1: seen, 2: explored
+    state = bytearray(len(G))
+    order = []
+
     if pref is None:
-        def get_children(node):
-            return G[node]
+        get_children = G.__getitem__
     else:
         def get_children(node):
             if node in pref:
                 pref_set = set(pref[node])
-                for i in G[node]:
-                    if i not in pref_set:
-                        yield i
-                for i in reversed(pref[node]):
-                    yield i
+                res = [i for i in G[node] if i not in pref_set]
+                res.extend(reversed(pref[node]))
+                return res
             else:
-                for i in G[node]:
-                    yield i
+                return G[node]
 
     if nbunch is None:
-        nbunch = reversed(list(range(len(G))))
-    for v in nbunch:     # process all vertices in G
-        if v in explored: 
+        nbunch = range(len(G) - 1, -1, -1)
+    for v in nbunch:
+        if state[v] == 2:
             continue
-        fringe=[v]   # nodes yet to look at
+        fringe = [v]
         while fringe:
-            w=fringe[-1]  # depth first search
-            if w in explored: # already looked down this branch
+            w = fringe[-1]
+            s = state[w]
+            if s:
+                if s == 1:
+                    # back from successors, which are all explored now
+                    state[w] = 2
+                    order.append(w)
+                # otherwise, already looked down this branch
                 fringe.pop()
                 continue
-            seen[w]=1     # mark as seen
-            # Check successors for cycles and for new nodes
-            new_nodes=[]
+            state[w] = 1
+            n_fringe = len(fringe)
             for n in get_children(w):
-                if n not in explored:
-                    if n in seen: #CYCLE !!
+                s = state[n]
+                if s != 2:
+                    if s:
                         raise GraphError("Graph contains a cycle at %d (%s,%s)." % \
-                                                        (n, G[n], G.pred[n]))
-                    new_nodes.append(n)
-            if new_nodes:   # Add new_nodes to fringe
-                fringe.extend(new_nodes)
-            else:           # No new nodes so w is fully explored
-                explored[w]=1
-                order_explored.append(w)
-                fringe.pop()    # done considering this node
-    
-    order_explored.reverse() # reverse order explored
-    return order_explored
-
-def dag_shortest_paths(G, source):
-    top_order = topological_sort(G)
+                                         (n, G[n], G.pred[n]))
+                    fringe.append(n)
+            if len(fringe) == n_fringe:
+                # no new nodes, so w is fully explored
+                state[w] = 2
+                order.append(w)
+                fringe.pop()
+
+    order.reverse()
+    return order
+
+def dag_shortest_paths(G, source, top_order=None):
+    if top_order is None:
+        top_order = topological_sort(G)
     dist = [None] * len(G)
     dist[source] = 0
     for u in top_order:
@@ -165,14 +361,12 @@ def dag_shortest_paths(G, source):
                 dist[v] = dist[u] + G.weights[(u,v)]
     return dist
 
-def reverse_dag_shortest_paths(G, source):
-    top_order = reversed(topological_sort(G))
+def reverse_dag_shortest_paths(G, source, top_order=None):
+    if top_order is None:
+        top_order = topological_sort(G)
     dist = [None] * len(G)
     dist[source] = 0
-    for u in top_order:
-        if u ==68273:
-            print('dist[68273]', dist[u])
-            print('pred[u]', G.pred[u])
+    for u in reversed(top_order):
         if dist[u] is None:
             continue
         for v in G.pred[u]:
@@ -180,38 +374,48 @@ def reverse_dag_shortest_paths(G, source):
                 dist[v] = dist[u] + G.weights[(v,u)]
     return dist
 
-def single_source_longest_paths(G, source, reverse=False):
-    # make weights negative, then do shortest paths
-    for edge in G.weights:
-        G.weights[edge] = -G.weights[edge]
+def negate_weights(G):
+    if isinstance(G.weights, ConstantWeights):
+        G.weights.negate()
+    else:
+        for edge in G.weights:
+            G.weights[edge] = -G.weights[edge]
+
+def single_source_longest_paths(G, source, reverse=False, top_order=None):
+    """ Longest paths from *source* in one pass over a topological
+    order, with zero for unreachable nodes. """
+    if top_order is None:
+        top_order = topological_sort(G)
+    weights = G.weights
+    dist = [None] * len(G)
+    dist[source] = 0
     if reverse:
-        dist = reverse_dag_shortest_paths(G, source)
+        for u in reversed(top_order):
+            d = dist[u]
+            if d is None:
+                continue
+            for v in G.pred[u]:
+                if dist[v] is None or dist[v] < d + weights[(v,u)]:
+                    dist[v] = d + weights[(v,u)]
     else:
-        dist = dag_shortest_paths(G, source)
-    #dist = johnson(G, sources)
-    # reset weights
-    for edge in G.weights:
-        G.weights[edge] = -G.weights[edge]
-    for i,n in enumerate(dist):
-        if n is None:
-            dist[i] = 0
-        else:
-            dist[i] = -dist[i]
-    #for k, v in dist.iteritems():
-    #    dist[k] = -v
-    return dist
+        for u in top_order:
+            d = dist[u]
+            if d is None:
+                continue
+            for v in G[u]:
+                if dist[v] is None or dist[v] < d + weights[(u,v)]:
+                    dist[v] = d + weights[(u,v)]
+    return [0 if d is None else d for d in dist]
 
 
 def longest_paths(G, sources=None):
     # make weights negative, then do shortest paths
-    for edge in G.weights:
-        G.weights[edge] = -G.weights[edge]
+    top_order = topological_sort(G)
+    negate_weights(G)
     dist = {}
     for source in sources:
-        print(('%s, ' % source), end=' ')
-        dist[source] = dag_shortest_paths(G, source)
+        dist[source] = dag_shortest_paths(G, source, top_order)
     #dist = johnson(G, sources)
     # reset weights
-    for edge in G.weights:
-        G.weights[edge] = -G.weights[edge]
+    negate_weights(G)
     return dist
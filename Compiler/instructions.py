@@ -155,6 +155,7 @@ class ldmci(base.ReadMemoryInstruction, base.IndirectMemoryInstruction):
     :param: memory address base (regint)
 
     """
+    __slots__ = []
     code = base.opcodes['LDMCI']
     arg_format = ['cw','ci']
     direct = staticmethod(ldmc)
@@ -169,6 +170,7 @@ class ldmsi(base.ReadMemoryInstruction, base.IndirectMemoryInstruction):
     :param: memory address base (regint)
 
     """
+    __slots__ = []
     code = base.opcodes['LDMSI']
     arg_format = ['sw','ci']
     direct = staticmethod(ldms)
@@ -183,6 +185,7 @@ class stmci(base.WriteMemoryInstruction, base.IndirectMemoryInstruction):
     :param: memory address base (regint)
 
     """
+    __slots__ = []
     code = base.opcodes['STMCI']
     arg_format = ['c','ci']
     direct = staticmethod(stmc)
@@ -197,6 +200,7 @@ class stmsi(base.WriteMemoryInstruction, base.IndirectMemoryInstruction):
     :param: memory address base (regint)
 
     """
+    __slots__ = []
     code = base.opcodes['STMSI']
     arg_format = ['s','ci']
     direct = staticmethod(stms)
@@ -211,6 +215,7 @@ class ldminti(base.ReadMemoryInstruction, base.IndirectMemoryInstruction):
     :param: memory address base (regint)
 
     """
+    __slots__ = []
     code = base.opcodes['LDMINTI']
     arg_format = ['ciw','ci']
     direct = staticmethod(ldmint)
@@ -225,6 +230,7 @@ class stminti(base.WriteMemoryInstruction, base.IndirectMemoryInstruction):
     :param: memory address base (regint)
 
     """
+    __slots__ = []
     code = base.opcodes['STMINTI']
     arg_format = ['ci','ci']
     direct = staticmethod(stmint)
@@ -232,6 +238,7 @@ class stminti(base.WriteMemoryInstruction, base.IndirectMemoryInstruction):
 @base.vectorize
 class gldmci(base.ReadMemoryInstruction, base.IndirectMemoryInstruction):
     r""" Assigns register $c_i$ the value in memory \verb+C[cj]+. """
+    __slots__ = []
     code = base.opcodes['LDMCI'] + 0x100
     arg_format = ['cgw','ci']
     direct = staticmethod(gldmc)
@@ -239,6 +246,7 @@ class gldmci(base.ReadMemoryInstruction, base.IndirectMemoryInstruction):
 @base.vectorize
 class gldmsi(base.ReadMemoryInstruction, base.IndirectMemoryInstruction):
     r""" Assigns register $s_i$ the value in memory \verb+S[cj]+. """
+    __slots__ = []
     code = base.opcodes['LDMSI'] + 0x100
     arg_format = ['sgw','ci']
     direct = staticmethod(gldms)
@@ -246,6 +254,7 @@ class gldmsi(base.ReadMemoryInstruction, base.IndirectMemoryInstruction):
 @base.vectorize
 class gstmci(base.WriteMemoryInstruction, base.IndirectMemoryInstruction):
     r""" Sets \verb+C[cj]+ to be the value $c_i$. """
+    __slots__ = []
     code = base.opcodes['STMCI'] + 0x100
     arg_format = ['cg','ci']
     direct = staticmethod(gstmc)
@@ -253,6 +262,7 @@ class gstmci(base.WriteMemoryInstruction, base.IndirectMemoryInstruction):
 @base.vectorize
 class gstmsi(base.WriteMemoryInstruction, base.IndirectMemoryInstruction):
     r""" Sets \verb+S[cj]+ to be the value $s_i$. """
+    __slots__ = []
     code = base.opcodes['STMSI'] + 0x100
     arg_format = ['sg','ci']
     direct = staticmethod(gstms)
@@ -299,6 +309,7 @@ class pushint(base.StackInstruction):
 
     :param: source (regint)
     """
+    __slots__ = []
     code = base.opcodes['PUSHINT']
     arg_format = ['ci']
 
@@ -309,6 +320,7 @@ class popint(base.StackInstruction):
 
     :param: destination (regint)
     """
+    __slots__ = []
     code = base.opcodes['POPINT']
     arg_format = ['ciw']
 
@@ -323,6 +335,7 @@ class ldtn(base.Instruction):
 
     :param: destination (regint)
     """
+    __slots__ = []
     code = base.opcodes['LDTN']
     arg_format = ['ciw']
 
@@ -333,6 +346,7 @@ class ldarg(base.Instruction):
 
     :param: destination (regint)
     """
+    __slots__ = []
     code = base.opcodes['LDARG']
     arg_format = ['ciw']
 
@@ -342,6 +356,7 @@ class starg(base.Instruction):
 
     :param: source (regint)
     """
+    __slots__ = []
     code = base.opcodes['STARG']
     arg_format = ['ci']
 
@@ -353,6 +368,7 @@ class cmdlinearg(base.Instruction):
     :param: index (regint)
 
     """
+    __slots__ = []
     code = base.opcodes['CMDLINEARG']
     arg_format = ['ciw','ci']
 
@@ -364,6 +380,7 @@ class reqbl(base.Instruction):
 
     :param: requirement (int)
     """
+    __slots__ = []
     code = base.opcodes['REQBL']
     arg_format = ['int']
 
@@ -373,12 +390,14 @@ class active(base.Instruction):
 
     :param: 0 for no, 1 for yes
     """
+    __slots__ = []
     code = base.opcodes['ACTIVE']
     arg_format = ['int']
 
 class time(base.IOInstruction):
 
     """ Output time since start of computation. """
+    __slots__ = []
     code = base.opcodes['TIME']
     arg_format = []
 
@@ -387,6 +406,7 @@ class start(base.Instruction):
 
     :param: timer number (int)
     """
+    __slots__ = []
     code = base.opcodes['START']
     arg_format = ['i']
 
@@ -395,6 +415,7 @@ class stop(base.Instruction):
 
     :param: timer number (int)
     """
+    __slots__ = []
     code = base.opcodes['STOP']
     arg_format = ['i']
 
@@ -407,6 +428,7 @@ class use(base.Instruction):
     :param: type (0: triple, 1: square, 2: bit, 3: inverse, 6: daBit)
     :param: number (int, -1 for unknown)
     """
+    __slots__ = []
     code = base.opcodes['USE']
     arg_format = ['int','int','long']
 
@@ -426,6 +448,7 @@ class use_inp(base.Instruction):
     :param: input player (int)
     :param: number (int, -1 for unknown)
     """
+    __slots__ = []
     code = base.opcodes['USE_INP']
     arg_format = ['int','int','long']
 
@@ -445,6 +468,7 @@ class use_edabit(base.Instruction):
     :param: length (int)
     :param: number (int, -1 for unknown)
     """
+    __slots__ = []
     code = base.opcodes['USE_EDABIT']
     arg_format = ['int','int','long']
 
@@ -461,6 +485,7 @@ class use_matmul(base.Instruction):
     :param: number of right-hand columns (int)
     :param: number (int, -1 for unknown)
     """
+    __slots__ = []
     code = base.opcodes['USE_MATMUL']
     arg_format = ['int','int','int','long']
 
@@ -477,6 +502,7 @@ class run_tape(base.Instruction):
     :param: tape argument (int)
     :param: (repeat the last three)...
     """
+    __slots__ = []
     code = base.opcodes['RUN_TAPE']
     arg_format = tools.cycle(['int','int','int'])
 
@@ -485,6 +511,7 @@ class join_tape(base.Instruction):
 
     :param: virtual machine thread number (int)
     """
+    __slots__ = []
     code = base.opcodes['JOIN_TAPE']
     arg_format = ['int']
 
@@ -502,6 +529,7 @@ class call_tape(base.DoNotEliminateInstruction):
     :param: (repeat from direction)
 
     """
+    __slots__ = []
     code = base.opcodes['CALL_TAPE']
     arg_format = tools.chain(['int', 'ci'],
                              tools.cycle(['int','int','int','*w','*']))
@@ -544,6 +572,7 @@ class call_arg(base.DoNotEliminateInstruction, base.VectorInstruction):
     :param: register type (see :py:obj:`vm_types`)
 
     """
+    __slots__ = []
     code = base.opcodes['CALL_ARG']
     arg_format = ['*w','int']
 
@@ -556,14 +585,17 @@ class crash(base.IOInstruction):
     """ Crash runtime if the value in the register is not zero.
 
     :param: Crash condition (regint)"""
+    __slots__ = []
     code = base.opcodes['CRASH']
     arg_format = ['ci']
 
 class start_grind(base.IOInstruction):
+    __slots__ = []
     code = base.opcodes['STARTGRIND']
     arg_format = []
 
 class stop_grind(base.IOInstruction):
+    __slots__ = []
     code = base.opcodes['STOPGRIND']
     arg_format = []
 
@@ -574,6 +606,7 @@ class use_prep(base.Instruction):
     :param: tag (16 bytes / 4 units, cut off at first zero byte)
     :param: number of items to use (int, -1 for unknown)
     """
+    __slots__ = []
     code = base.opcodes['USE_PREP']
     arg_format = ['str','long']
 
@@ -587,6 +620,7 @@ class nplayers(base.Instruction):
 
     :param: destination (regint)
     """
+    __slots__ = []
     code = base.opcodes['NPLAYERS']
     arg_format = ['ciw']
 
@@ -595,6 +629,7 @@ class threshold(base.Instruction):
 
     :param: destination (regint)
     """
+    __slots__ = []
     code = base.opcodes['THRESHOLD']
     arg_format = ['ciw']
 
@@ -603,6 +638,7 @@ class playerid(base.Instruction):
 
     :param: destination (regint)
     """
+    __slots__ = []
     code = base.opcodes['PLAYERID']
     arg_format = ['ciw']
 
@@ -1264,6 +1300,7 @@ class gbittriple(base.DataInstruction):
 class gbitgf2ntriple(base.DataInstruction):
     r""" Load secret variables $s_i$, $s_j$ and $s_k$
     with the next GF(2) and GF(2^n) multiplication triple. """
+    __slots__ = []
     code = base.opcodes['GBITGF2NTRIPLE']
     arg_format = ['sgw','sgw','sgw']
     data_type = 'bitgf2ntriple'
@@ -1553,6 +1590,7 @@ class inputmixed(inputmixed_base):
     :param: (repeat from type parameter)...
 
     """
+    __slots__ = []
     code = base.opcodes['INPUTMIXED']
     player_arg_type = 'p'
 
@@ -1584,6 +1622,7 @@ class inputmixedreg(inputmixed_base):
     :param: (repeat from type parameter)...
 
     """
+    __slots__ = []
     code = base.opcodes['INPUTMIXEDREG']
     player_arg_type = 'ci'
     is_vec = lambda self: True
@@ -1745,6 +1784,7 @@ class cond_print_plain(base.IOInstruction):
     :param: source (cint)
     :param: precision (cint)
     """
+    __slots__ = ['size']
     code = base.opcodes['CONDPRINTPLAIN']
     arg_format = ['c', 'c', 'c']
 
@@ -1794,6 +1834,7 @@ class print_char(base.IOInstruction):
 
     :param: byte (int)
     """
+    __slots__ = []
     code = base.opcodes['PRINTCHR']
     arg_format = ['int']
 
@@ -1805,6 +1846,7 @@ class print_char4(base.IOInstruction):
 
     :param: four bytes (int)
     """
+    __slots__ = []
     code = base.opcodes['PRINTSTR']
     arg_format = ['int']
 
@@ -1817,6 +1859,7 @@ class cond_print_str(base.IOInstruction):
     :param: condition (cint, no output if zero)
     :param: four bytes (int)
     """
+    __slots__ = []
     code = base.opcodes['CONDPRINTSTR']
     arg_format = ['c', 'int']
 
@@ -2545,6 +2588,7 @@ class dotprods(base.VarArgsInstruction, base.DataInstruction,
                 yield reg
 
 class matmul_base(base.DataInstruction):
+    __slots__ = []
     data_type = 'triple'
     is_vec = lambda self: True
 
@@ -2562,6 +2606,7 @@ class matmuls(matmul_base, base.Mergeable):
     :param: number of columns in first factor and rows in second factor (int)
     :param: number of columns in second factor and result (int)
     """
+    __slots__ = []
     code = base.opcodes['MATMULS']
     arg_format = itertools.cycle(['sw','s','s','int','int','int'])
 
@@ -2585,6 +2630,7 @@ class matmulsm(matmul_base, base.Mergeable):
     :param: total number of columns in the first factor, equal to used number of columns when all columns are used (int)
     :param: total number of columns in the second factor, equal to used number of columns when all columns are used (int)
     """
+    __slots__ = ['first_factor_base_addresses', 'second_factor_base_addresses', 'indices_values']
     code = base.opcodes['MATMULSM']
     arg_format = itertools.cycle(['sw','ci','ci','int','int','int','ci','ci','ci','ci',
                                   'int','int'])
@@ -2642,6 +2688,7 @@ class conv2ds(base.DataInstruction, base.VarArgsInstruction, base.Mergeable):
     :param: repeat from result...
 
     """
+    __slots__ = []
     code = base.opcodes['CONV2DS']
     arg_format = itertools.cycle(['sw','s','s','int','int','int','int','int',
                                   'int','int','int','int','int','int','int'])
@@ -2681,6 +2728,7 @@ class trunc_pr(base.VarArgsInstruction):
     arg_format = tools.cycle(['sw','s','int','int'])
 
 class shuffle_base(base.DataInstruction):
+    __slots__ = []
     n_relevant_parties = 2
 
     @staticmethod
@@ -2775,6 +2823,7 @@ class delshuffle(base.Instruction):
     :param: handle (regint)
 
     """
+    __slots__ = []
     code = base.opcodes['DELSHUFFLE']
     arg_format = ['ci']
 
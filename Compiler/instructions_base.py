@@ -1,11 +1,11 @@
 import itertools
 from random import randint
 import time
-import inspect
 import functools
 import copy
 import sys
 import struct
+import io
 from Compiler.exceptions import *
 from Compiler.config import *
 from Compiler import util
@@ -286,7 +286,7 @@ def vectorize(instruction, global_dict=None):
     """ Decorator to vectorize instructions. """
 
     if global_dict is None:
-        global_dict = inspect.getmodule(instruction).__dict__
+        global_dict = sys.modules[instruction.__module__].__dict__
 
     class Vectorized_Instruction(instruction):
         __slots__ = ['size']
@@ -350,7 +350,7 @@ def gf2n(instruction):
 
         Adds the new GF_2^n instruction to the globals dictionary. Also adds a
         vectorized GF_2^n instruction if a modp version exists. """
-    global_dict = inspect.getmodule(instruction).__dict__
+    global_dict = sys.modules[instruction.__module__].__dict__
 
     if 'v' + instruction.__name__ in global_dict:
         vectorized = True
@@ -436,7 +436,7 @@ def gf2n(instruction):
     #return instruction
 
 class Mergeable:
-    pass
+    __slots__ = []
 
 def cisc(function, n_outputs=1):
     class MergeCISC(Mergeable):
@@ -457,7 +457,7 @@ def cisc(function, n_outputs=1):
                 else:
                     self.params.append(arg)
             self.function = function
-            self.caller = None
+            self.caller = util.get_trace() if program.DEBUG else None
             program.curr_block.instructions.append(self)
 
         def get_def(self):
@@ -641,6 +641,11 @@ def cisc(function, n_outputs=1):
                 except:
                     print([call[0][0].vector_size() for call in self.calls])
                     raise
+            if program.options.cost_profile or \
+               program.options.critical_path:
+                # attribute the expansion to the origin
+                from Compiler.cost_profile import cisc_trace
+                program.cisc_trace = cisc_trace(self)
             if program.cisc_to_function and \
                (program.curr_tape.singular or program.n_running_threads):
                 if (program.options.garbled or program.options.binary or \
@@ -651,12 +656,17 @@ def cisc(function, n_outputs=1):
             else:
                 self.new_instructions(size, new_regs)
                 program.curr_block.n_rounds += self.n_rounds - 1
+                if program.cisc_trace:
+                    from Compiler.cost_profile import add_rounds
+                    add_rounds(program.curr_block, program.cisc_trace,
+                               self.n_rounds - 1)
             base = 0
             for call in self.calls:
                 for i in range(n_outputs):
                     reg = call[0][i]
                     reg.copy_from_part(new_regs[i], base, reg.vector_size())
                 base += reg.vector_size()
+            program.cisc_trace = None
             tape.start_new_basicblock()
 
         def add_usage(self, *args):
@@ -991,7 +1001,7 @@ class Instruction(object):
         if kwargs.get('add_to_prog', True):
             program.curr_block.instructions.append(self)
         if program.DEBUG:
-            self.caller = [frame[1:] for frame in inspect.stack()[1:]]
+            self.caller = program.cisc_trace or util.get_trace()
         else:
             self.caller = None
         
@@ -1136,23 +1146,29 @@ class Instruction(object):
 class ParsedInstruction:
     reverse_opcodes = {}
 
-    def __init__(self, f):
-        cls = type(self)
+    @classmethod
+    def get_reverse_opcodes(cls):
+        """ Instruction classes by opcode. """
         from Compiler import instructions
         from Compiler.GC import instructions as gc_inst
         if not cls.reverse_opcodes:
             for module in instructions, gc_inst:
-                for x, y in inspect.getmodule(module).__dict__.items():
-                    if inspect.isclass(y) and y.__name__[0] != 'v':
+                for x, y in module.__dict__.items():
+                    if isinstance(y, type) and y.__name__[0] != 'v':
                         try:
                             cls.reverse_opcodes[y.code] = y
                         except AttributeError:
                             pass
+        return cls.reverse_opcodes
+
+    def __init__(self, f):
+        cls = type(self)
+        reverse_opcodes = cls.get_reverse_opcodes()
         read = lambda: struct.unpack('>I', f.read(4))[0]
         full_code = struct.unpack('>Q', f.read(8))[0]
         self.code = full_code % (1 << Instruction.code_length)
         self.size = full_code >> Instruction.code_length
-        self.type = cls.reverse_opcodes[self.code]
+        self.type = reverse_opcodes[self.code]
         t = self.type
         name = t.__name__
         try:
@@ -1193,7 +1209,30 @@ class ParsedInstruction:
     def get_usage(self):
         return self.type.get_usage(self.args)
 
+class CachedInstruction:
+    """ Encoded instruction restored from the compilation cache. """
+    __slots__ = ['code']
+
+    def __init__(self, code):
+        self.code = code
+
+    def get_bytes(self):
+        return self.code
+
+    def get_def(self):
+        return []
+
+    def get_used(self):
+        return []
+
+    def add_usage(self, req_node):
+        pass
+
+    def __str__(self):
+        return str(ParsedInstruction(io.BytesIO(self.code)))
+
 class VarArgsInstruction(Instruction):
+    __slots__ = []
     def has_var_args(self):
         return True
 
@@ -1205,6 +1244,7 @@ class VectorInstruction(Instruction):
         return super(VectorInstruction, self).get_code(len(self.args[0]))
 
 class Ciscable(Instruction):
+    __slots__ = []
     def copy(self, size, subs):
         return type(self)(*self.get_new_args(size, subs), copying=True)
 
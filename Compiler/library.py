@@ -9,7 +9,7 @@ from Compiler.util import tuplify,untuplify,is_zero
 from Compiler.allocator import RegintOptimizer, AllocPool
 from Compiler.program import Tape
 from Compiler import instructions,instructions_base,comparison,util,types
-import inspect,math
+import math
 import random
 import collections
 import operator
@@ -497,6 +497,7 @@ class FunctionCallTape(FunctionTape):
             elif isinstance(x, types._vectorizable):
                 call_args += [0, base.vm_types['ci'], 1,
                               x.address, regint.conv(y.address)]
+        get_tape().called_tapes.add(tape_handle)
         call_tape(tape_handle, regint(0),
                   *call_args)
         break_point('call-%s' % self.name)
@@ -1566,7 +1567,7 @@ def if_then(condition):
                                                    name='if-block')
     state.has_else = False
     state.closed_if = False
-    state.caller = [frame[1:] for frame in inspect.stack()[1:]]
+    state.caller = util.get_trace()
     instructions.program.curr_tape.if_states.append(state)
 
 def else_then():
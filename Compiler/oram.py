@@ -23,7 +23,8 @@ from Compiler.types import *
 from Compiler.types import _secret, _register
 from Compiler.library import *
 from Compiler.program import Program
-from Compiler import floatingpoint,comparison,permutation
+from Compiler import floatingpoint,comparison,permutation,util
+from Compiler.GC.types import sbits
 
 from Compiler.util import *
 
@@ -159,8 +160,33 @@ class gf2nBlock(Block):
         self.value = self.lower + value * self.adjust + upper
         return self
 
+class bitsBlock(Block):
+    """ Bit slicing for binary circuits. """
+    def __init__(self, value, start, lengths, entries_per_block):
+        self.value_type = type(value)
+        Block.__init__(self, value, lengths)
+        length = sum(self.lengths)
+        used_bits = entries_per_block * length
+        self.value_bits = self.value.bit_decompose(used_bits)
+        start_length = util.log2(entries_per_block)
+        self.start_bits = util.bit_decompose(start, start_length)
+        self.start_demux = demux_list(self.start_bits)
+        self.entries = [sbits.bit_compose(self.value_bits[i*length:][:length]) \
+                        for i in range(entries_per_block)]
+        self.mul_entries = list(map(operator.mul, self.start_demux, self.entries))
+        self.bits = sum(self.mul_entries).bit_decompose()
+        self.mul_value = sbits.compose(self.mul_entries, sum(self.lengths))
+        self.anti_value = self.mul_value + self.value
+    def set_slice(self, value):
+        value = sbits.compose(util.tuplify(value), sum(self.lengths))
+        for i,b in enumerate(self.start_bits):
+            value = b.if_else(value << (2**i * sum(self.lengths)), value)
+        self.value = value + self.anti_value
+        return self
+
 block_types = { sint: intBlock,
                 sgf2n: gf2nBlock,
+                sbits: bitsBlock,
 }
 
 def get_block(x, y, *args):
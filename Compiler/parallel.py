@@ -0,0 +1,287 @@
+"""
+This module contains the process pools used by :file:`compile.py` with
+``--compile-jobs``. Work is done in forked worker processes, which
+inherit the whole compiler state. Only the results visible to the
+rest of the program are sent back.
+
+:py:class:`TapeJobs` optimizes and writes whole tapes. The results
+are the numbers of registers accessed by other tapes, the
+requirements, and the hash of the bytecode. Tapes are submitted in
+the order they are finished, and a tape referring to others is only
+submitted when the results of those are back. Optimizing a tape with
+mergeable CISC instructions changes the state of the program, which
+is why such tapes are processed in the main process.
+
+:py:class:`BlockJobs` merges large basic blocks of a tape in
+parallel. The results are the groups of merged instructions and the
+resulting order, which are replayed in the main process.
+"""
+
+import array
+import multiprocessing
+import os
+import sys
+import traceback
+
+from .exceptions import CompilerError
+from .instructions_base import Mergeable
+
+
+def available():
+    """ Whether the platform supports forking workers. """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+class Job:
+    """ Call a function in a forked process.
+
+    :param function: function returning a picklable result
+    :param name: description for error messages
+    """
+
+    context = multiprocessing.get_context("fork") if available() else None
+
+    def __init__(self, function, name, *args):
+        self.name = name
+        self.receiver, sender = self.context.Pipe(duplex=False)
+        sys.stdout.flush()
+        self.process = self.context.Process(target=self.run,
+                                            args=(function, sender) + args)
+        self.process.start()
+        sender.close()
+
+    @staticmethod
+    def run(function, sender, *args):
+        try:
+            sender.send(dict(result=function(*args)))
+        except BaseException as e:
+            sender.send(dict(error="".join(traceback.format_exception(
+                type(e), e, e.__traceback__))))
+        finally:
+            sender.close()
+            sys.stdout.flush()
+            os._exit(0)
+
+    def wait(self):
+        """ Return the result or raise an exception. """
+        try:
+            res = self.receiver.recv()
+        except EOFError:
+            res = dict(error="worker process failed")
+        self.receiver.close()
+        self.process.join()
+        if "error" in res:
+            raise CompilerError("%s failed:\n%s" % (self.name, res["error"]))
+        return res["result"]
+
+    def abort(self):
+        self.process.terminate()
+        self.process.join()
+        self.receiver.close()
+
+
+class TapeJobs:
+    """ Optimize and write tapes in up to *n_jobs* worker processes.
+
+    :param program: :py:class:`~Compiler.program.Program` instance
+    :param n_jobs: maximal number of concurrent workers
+    """
+
+    def __init__(self, program, n_jobs):
+        self.program = program
+        self.n_jobs = n_jobs
+        self.pending = []
+
+    available = staticmethod(available)
+
+    @staticmethod
+    def suitable(tape):
+        """ Whether optimizing a tape leaves the program unchanged. """
+        for block in tape.basicblocks:
+            for inst in block.instructions:
+                if isinstance(inst, Mergeable):
+                    return False
+        return bool(tape.basicblocks) and not tape.if_states
+
+    @staticmethod
+    def references(tape):
+        """ Tapes run or called by a tape. """
+        from .cache import CompilationCache
+        return set(CompilationCache.tape_refs(tape))
+
+    def submit(self, tape):
+        """ Optimize and write a tape in the background if possible.
+        Otherwise, wait for the pending jobs and do it directly.
+
+        :returns: whether the tape has been submitted
+        """
+        if not self.suitable(tape):
+            self.finish()
+            return False
+        refs = self.references(tape)
+        while any(index in refs for index, _ in self.pending):
+            self.collect()
+        while len(self.pending) >= self.n_jobs:
+            self.collect()
+        index = self.program.tapes.index(tape)
+        job = Job(self.run, "Optimizing tape %s" % tape.name, tape)
+        self.pending.append((index, job))
+        return True
+
+    def run(self, tape):
+        """ Worker process. """
+        program = self.program
+        program.curr_tape = tape
+        program.compile_jobs = 1
+        if program.profiler:
+            program.profiler.restart()
+        hits = program.tape_cache_hits
+        misses = program.tape_cache_misses
+        exports = tape.exported_registers()
+        tape.optimize(program.options)
+        tape.write_bytes()
+        if program.options.asmoutfile:
+            tape.write_str(program.options.asmoutfile + "-" + tape.name)
+        return dict(
+            exports=[reg.i for reg in exports],
+            req_num=dict(tape.req_num or {}),
+            req_bit_length=dict(tape.req_bit_length),
+            size=len(tape), hash=tape.hash,
+            used_security=program.used_security,
+            relevant_opts=program.relevant_opts,
+            cache_hits=program.tape_cache_hits - hits,
+            cache_misses=program.tape_cache_misses - misses,
+            critical_paths=tape.critical_paths,
+            reg_usage=tape.reg_usage,
+            serialized_req_tree=tape.serialized_req_tree,
+            profile=program.profiler and program.profiler.results())
+
+    def collect(self):
+        """ Wait for the oldest job and apply its results. """
+        index, job = self.pending.pop(0)
+        try:
+            res = job.wait()
+        except CompilerError:
+            self.abort()
+            raise
+        program = self.program
+        tape = program.tapes[index]
+        for reg, i in zip(tape.exported_registers(), res["exports"]):
+            reg.i = i
+        program.used_security = max(program.used_security,
+                                    res["used_security"])
+        program.relevant_opts.update(res["relevant_opts"])
+        program.tape_cache_hits += res["cache_hits"]
+        program.tape_cache_misses += res["cache_misses"]
+        if program.profiler:
+            program.profiler.add(res["profile"], job.process.pid, top=True)
+        tape.restore_optimized([], tape.ReqNum(res["req_num"]),
+                               res["req_bit_length"])
+        tape.hash = res["hash"]
+        tape.critical_paths = res["critical_paths"]
+        tape.reg_usage = res["reg_usage"]
+        tape.serialized_req_tree = res["serialized_req_tree"]
+        tape.purge()
+        tape.size = res["size"]
+
+    def finish(self):
+        """ Wait for all pending jobs. """
+        while self.pending:
+            self.collect()
+
+    def abort(self):
+        for _, job in self.pending:
+            job.abort()
+        self.pending = []
+
+
+class BlockJobs:
+    """ Eliminate dead code and merge instructions of the basic blocks
+    of a tape with blocks of at least :py:attr:`min_size` instructions
+    processed in up to *n_jobs* worker processes.
+
+    Merging instructions of different vector sizes creates the
+    registers for the vector elements, which changes the dependency
+    graph of later blocks using them. Workers started before this
+    happens are therefore restarted.
+
+    :param tape: :py:class:`~Compiler.program.Tape` instance
+    :param n_jobs: maximal number of concurrent workers
+    """
+
+    min_size = 10000
+
+    def __init__(self, tape, n_jobs):
+        self.tape = tape
+        self.n_jobs = n_jobs
+
+    def merge(self, options):
+        tape = self.tape
+        blocks = tape.basicblocks
+        queue = [i for i, block in enumerate(blocks)
+                 if len(block.instructions) >= self.min_size]
+        if len(queue) < 2:
+            for i in range(len(blocks)):
+                tape.merge_block(i, options)
+            return
+        pending = {}
+
+        def fill():
+            while queue and len(pending) < self.n_jobs:
+                i = queue.pop(0)
+                pending[i] = Job(self.run, "Merging block %s" %
+                                 blocks[i].name, i, options)
+
+        try:
+            fill()
+            for i, block in enumerate(blocks):
+                n_vectors = tape.Register.n_vectors
+                if i in pending:
+                    job = pending.pop(i)
+                    self.replay(block, job.wait(), job.process.pid)
+                else:
+                    if queue and queue[0] == i:
+                        queue.pop(0)
+                    tape.merge_block(i, options)
+                if tape.Register.n_vectors != n_vectors:
+                    for j in sorted(pending, reverse=True):
+                        pending.pop(j).abort()
+                        queue.insert(0, j)
+                fill()
+        finally:
+            for job in pending.values():
+                job.abort()
+
+    def run(self, i, options):
+        """ Worker process. """
+        profiler = self.tape.program.profiler
+        if profiler:
+            profiler.restart()
+        block = self.tape.basicblocks[i]
+        index = dict((id(inst), j)
+                     for j, inst in enumerate(block.instructions))
+        merged = self.tape.merge_block(i, options)
+        order = array.array("L", (index[id(inst)]
+                                  for inst in block.instructions))
+        return dict(merged=merged, order=order, n_rounds=block.n_rounds,
+                    n_to_merge=block.n_to_merge,
+                    rounds=dict(block.rounds),
+                    critical_path=block.critical_path,
+                    warned=self.tape.warned_about_mem,
+                    profile=profiler and profiler.results())
+
+    def replay(self, block, res, worker):
+        """ Apply the result of a worker. """
+        instructions = block.instructions
+        for merge in res["merged"]:
+            n = merge[0]
+            for i in merge[1:]:
+                instructions[n].merge(instructions[i])
+        block.instructions = [instructions[i] for i in res["order"]]
+        block.n_rounds = res["n_rounds"]
+        block.n_to_merge = res["n_to_merge"]
+        block.rounds = self.tape.ReqNum(res["rounds"])
+        block.critical_path = res["critical_path"]
+        self.tape.warned_about_mem |= res["warned"]
+        if self.tape.program.profiler:
+            self.tape.program.profiler.add(res["profile"], worker)
@@ -0,0 +1,156 @@
+"""
+This module contains the recorder used by :file:`compile.py` with
+``--profile-phases``. It measures the wall time and the peak memory
+of the compilation phases and writes them to a JSON file. Phases are
+nested: the optimization of a tape contains the merging of its basic
+blocks, which in turn contains the dependency graph, dead code
+elimination, merging, and topological sort for every block.
+
+Every phase is a JSON object with the following keys:
+
+``phase``
+  Name of the phase such as ``source``, ``optimize``, ``merge``,
+  ``topological sort``, ``scheduling``, ``cisc``, ``allocation``,
+  ``requirements``, or ``write``.
+
+``time``
+  Wall time in seconds including the nested phases.
+
+``peak_memory``
+  Peak resident memory in bytes during the phase.
+
+``phases``
+  Nested phases if any.
+
+Further keys describe what the phase worked on, for example ``tape``,
+``block``, and ``instructions``. Phases run in worker processes with
+``--compile-jobs`` have ``worker`` set to the process id. Their
+times overlap with the phases of the main process.
+"""
+
+import contextlib
+import json
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class PhaseProfiler:
+    """ Record the wall time and peak memory of nested compilation
+    phases.
+
+    The peak memory of a phase is measured by resetting the high-water
+    mark of the resident memory of the process at the start of the
+    phase, which is supported by Linux. This also affects the peak
+    reported by :py:func:`resource.getrusage` for the compiler
+    process. Otherwise, the peak of the process up to the end of the
+    phase is reported, which is indicated by ``memory`` being
+    ``process`` in the report.
+    """
+
+    def __init__(self):
+        self.resettable = self.reset_peak()
+        self.restart()
+
+    def restart(self):
+        """ Start a new report, e.g., in a worker process. """
+        self.root = dict(phase="compilation", phases=[])
+        self.stack = []
+        self.start(self.root)
+
+    @staticmethod
+    def reset_peak():
+        try:
+            with open("/proc/self/clear_refs", "w") as f:
+                f.write("5")
+            return True
+        except OSError:
+            return False
+
+    def peak(self):
+        """ Peak resident memory in bytes since the last reset. """
+        if self.resettable:
+            with open("/proc/self/status") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) * 1024
+        if resource is None:
+            return 0
+        res = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            return res
+        else:
+            return res * 1024
+
+    def start(self, entry):
+        if self.stack:
+            parent = self.stack[-1][0]
+            parent["phases"].append(entry)
+            parent["peak_memory"] = max(parent["peak_memory"], self.peak())
+            if self.resettable:
+                self.reset_peak()
+        entry["peak_memory"] = 0
+        self.stack.append((entry, time.perf_counter()))
+
+    def finish(self):
+        entry, start = self.stack.pop()
+        entry["time"] = time.perf_counter() - start
+        entry["peak_memory"] = max(entry["peak_memory"], self.peak())
+        if not entry["phases"]:
+            del entry["phases"]
+        if self.stack:
+            parent = self.stack[-1][0]
+            parent["peak_memory"] = max(parent["peak_memory"],
+                                        entry["peak_memory"])
+
+    @contextlib.contextmanager
+    def phase(self, name, **info):
+        """ Context manager recording a phase.
+
+        :param name: name of the phase
+        :param info: further information on the phase
+        """
+        entry = dict(phase=name, **info)
+        entry["phases"] = []
+        self.start(entry)
+        try:
+            yield entry
+        finally:
+            self.finish()
+
+    def results(self):
+        """ Phases recorded since the last (re)start. """
+        return self.root["phases"]
+
+    def add(self, phases, worker, top=False):
+        """ Add phases recorded in a worker process.
+
+        :param phases: result of :py:meth:`results` in the worker
+        :param worker: process id of the worker
+        :param top: add to the top level instead of the current phase
+        """
+        entry = self.root if top else self.stack[-1][0]
+        for phase in phases:
+            phase["worker"] = worker
+            entry["phases"].append(phase)
+
+    def write(self, filename, program):
+        """ Write the report as JSON.
+
+        :param filename: output file
+        :param program: :py:class:`~Compiler.program.Program` instance
+        """
+        root, start = self.stack[0]
+        report = dict(
+            program=program.name, args=sys.argv,
+            memory="phase" if self.resettable else "process",
+            time=time.perf_counter() - start,
+            peak_memory=max(root["peak_memory"], self.peak()),
+            phases=root["phases"])
+        print("Writing phase profile to", filename)
+        with open(filename, "w") as f:
+            json.dump(report, f, indent=1)
@@ -4,13 +4,14 @@ blocks and registers. Most relevant is the central :py:class:`Program`
 object that holds various properties of the computation.
 """
 
-import inspect
+import contextlib
 import itertools
 import math
 import os
 import re
 import sys
 import hashlib
+import json
 import random
 from collections import defaultdict, deque
 from functools import reduce
@@ -64,11 +65,31 @@ class defaults:
     preserve_mem_order = False
     max_parallel_open = 0
     dead_code_elimination = False
+    common_subexpression_elimination = False
+    constant_propagation = False
+    loop_invariant_code_motion = False
     noreallocate = False
     asmoutfile = None
     stop = False
     insecure = False
     keep_cisc = False
+    cache_dir = None
+    cache_max_size = 1024
+    cache_max_age = 30
+    compile_jobs = 1
+    compact_graph = False
+    stream_bytecode = False
+    interval_allocation = False
+    pressure_scheduling = False
+    register_report = False
+    profile_phases = None
+    cost_profile = None
+    critical_path = None
+    estimate = None
+    latency = 1
+    bandwidth = 1000
+    estimate_file = None
+    metadata = False
 
 
 class Program(object):
@@ -154,7 +175,10 @@ class Program(object):
             print("Galois length:", self.galois_length)
         self.tape_counter = 0
         self._curr_tape = None
-        self.DEBUG = options.debug
+        # the reports need the traces of all instructions
+        self.DEBUG = options.debug or bool(options.cost_profile) or \
+            bool(options.critical_path)
+        self.cisc_trace = None
         self.allocated_mem = RegType.create_dict(lambda: USER_MEM)
         self.free_mem_blocks = defaultdict(al.BlockAllocator)
         self.later_mem_blocks = defaultdict(list)
@@ -231,6 +255,39 @@ class Program(object):
             self.options.cisc = not self.options.optimize_hard
         self.use_tape_calls = True
         self.force_cisc_tape = False
+        self.cache_status = None
+        self.output_files = []
+        if options.cache_dir and not options.cost_profile and \
+           not options.critical_path:
+            from .cache import CompilationCache
+            self.cache = CompilationCache(options.cache_dir,
+                                          options.cache_max_size,
+                                          options.cache_max_age)
+        else:
+            self.cache = None
+        self.tape_cache_hits = 0
+        self.tape_cache_misses = 0
+        self.tape_jobs = None
+        self.compile_jobs = int(options.compile_jobs or 1)
+        if options.cost_profile:
+            # workers don't return the costs per instruction
+            self.compile_jobs = 1
+        if self.compile_jobs > 1:
+            from .parallel import TapeJobs
+            if TapeJobs.available():
+                self.tape_jobs = TapeJobs(self, self.compile_jobs)
+            else:
+                print("Cannot compile in parallel on this platform")
+                self.compile_jobs = 1
+        # the assembly output needs the instructions
+        self.stream_bytecode = bool(options.stream_bytecode and
+                                    not options.asmoutfile and
+                                    not options.cost_profile)
+        if options.profile_phases:
+            from .profiling import PhaseProfiler
+            self.profiler = PhaseProfiler()
+        else:
+            self.profiler = None
 
         Program.prog = self
         from . import comparison, instructions, instructions_base, types
@@ -244,6 +301,14 @@ class Program(object):
     def get_args(self):
         return self.args
 
+    def phase(self, name, **info):
+        """ Context manager recording a compilation phase for
+        ``--profile-phases``. """
+        if self.profiler:
+            return self.profiler.phase(name, **info)
+        else:
+            return contextlib.nullcontext()
+
     def max_par_tapes(self):
         """Upper bound on number of tapes that will be run in parallel.
         (Excludes empty tapes)"""
@@ -389,14 +454,17 @@ class Program(object):
             else:
                 thread_numbers.append(self.n_threads)
                 self.n_threads += 1
+        self.curr_tape.thread_tapes.update(arg[0] for arg in args)
         self.curr_tape.start_new_basicblock(name="pre-run_tape")
         Compiler.instructions.run_tape(
             *sum(([x] + list(y) for x, y in zip(thread_numbers, args)), [])
         )
         self.curr_tape.start_new_basicblock(name="post-run_tape")
+        req_node = self.curr_block.req_node
+        self.curr_tape.launches[id(req_node)].append(
+            [arg[0] for arg in args])
         for arg in args:
-            self.curr_block.req_node.children.append(
-                self.tapes[arg[0]].req_tree)
+            req_node.children.append(self.tapes[arg[0]].req_tree)
         return thread_numbers
 
     def join_tape(self, thread_number):
@@ -450,13 +518,79 @@ class Program(object):
         for tape in self.tapes:
             tape.write_bytes()
             h.update(tape.hash)
-        print('Hash:', h.hexdigest())
+        self.hash = h.hexdigest()
+        self.output_files = [sch_filename] + \
+            [tape.outfile for tape in self.tapes]
+        if self.options.metadata:
+            self.output_files.append(self.write_metadata())
+        print('Hash:', self.hash)
+        if self.cache_status:
+            print('Compilation cache:', self.cache_status)
+        if self.tape_cache_hits or self.tape_cache_misses:
+            print('Tape cache: %d hits, %d misses' %
+                  (self.tape_cache_hits, self.tape_cache_misses))
+
+    @staticmethod
+    def encode_req_num(req_num):
+        """ Requirements as list of pairs for JSON with :py:obj:`None`
+        for unknown numbers. """
+        res = []
+        for req, num in sorted((req_num or {}).items(), key=str):
+            if num == float("inf") or num != num or num < 0:
+                num = None
+            res.append([list(req), num])
+        return res
+
+    @staticmethod
+    def decode_req_num(encoded):
+        res = Tape.ReqNum()
+        for req, num in encoded:
+            res[tuple(tuple(x) if isinstance(x, list) else x
+                      for x in req)] = float("inf") if num is None else num
+        return res
+
+    def write_metadata(self):
+        """ Write the requirements, rounds, register and memory usage,
+        and the threads of the tapes next to the schedule. """
+        filename = self.programs_dir + "/Schedules/%s.json" % self.name
+        print("Writing to", filename)
+
+        def rounds(req_num):
+            return self.encode_req_num(
+                {("all", "round"): (req_num or {}).get(("all", "round"), 0)}
+            )[0][1]
+
+        tapes = []
+        for tape in self.tapes:
+            tapes.append(dict(
+                name=tape.name, size=len(tape),
+                req_num=self.encode_req_num(tape.req_num),
+                rounds=rounds(tape.req_num),
+                registers=dict(tape.reg_usage),
+                threads=sorted(tape.thread_tapes),
+                calls=sorted(tape.called_tapes),
+                req_tree=tape.serialized_req_tree))
+        res = dict(program=self.name, hash=self.hash,
+                   n_threads=self.max_par_tapes(),
+                   allocated_mem=dict((t, n) for t, n in
+                                      sorted(self.allocated_mem.items())),
+                   req_num=self.encode_req_num(self.req_num),
+                   rounds=rounds(self.req_num), tapes=tapes)
+        with open(filename, "w") as f:
+            json.dump(res, f, indent=1)
+        return filename
 
     def finalize_tape(self, tape):
+        if self.tape_jobs and not tape.purged and \
+           self.tape_jobs.submit(tape):
+            return
         if not tape.purged:
             curr_tape = self.curr_tape
             self.curr_tape = tape
+            # tapes created during optimization are needed immediately
+            tape_jobs, self.tape_jobs = self.tape_jobs, None
             tape.optimize(self.options)
+            self.tape_jobs = tape_jobs
             self.curr_tape = curr_tape
             tape.write_bytes()
             if self.options.asmoutfile:
@@ -552,20 +686,30 @@ class Program(object):
         self.later_mem_blocks.clear()
 
     def finalize(self):
+        if self.tape_jobs:
+            self.tape_jobs.finish()
+            self.tape_jobs = None
+
         # optimize the tapes
         for tape in self.tapes:
             tape.optimize(self.options)
+            if self.stream_bytecode and not tape.purged and \
+               tape is not self.curr_tape:
+                tape.write_bytes()
+                tape.purge()
 
         if self.tapes:
             self.update_req(self.curr_tape)
 
         # finalize the memory
-        self.finalize_memory()
+        with self.phase("memory"):
+            self.finalize_memory()
 
         # communicate protocol compability
         Compiler.instructions.active(self._always_active)
 
-        self.write_bytes()
+        with self.phase("output"):
+            self.write_bytes()
 
         if self.options.asmoutfile:
             for tape in self.tapes:
@@ -575,6 +719,9 @@ class Program(object):
         if self.public_input_file is not None:
             self.public_input_file.close()
 
+        if self.cache:
+            self.cache.evict()
+
     def finalize_memory(self):
         self.curr_tape.start_new_basicblock(None, "memory-usage",
                                             req_node=self.curr_tape.req_tree)
@@ -586,11 +733,15 @@ class Program(object):
                          mem_type not in ('s', 'sg', 'c', 'cg')):
                 # print "Memory of type '%s' of size %d" % (mem_type, size)
                 if mem_type in self.types:
-                    self.types[mem_type].load_mem(size - 1, mem_type)
+                    reg = self.types[mem_type].load_mem(size - 1, mem_type)
                 else:
                     from Compiler.types import _get_type
 
-                    _get_type(mem_type).load_mem(size - 1, mem_type)
+                    reg = _get_type(mem_type).load_mem(size - 1, mem_type)
+                # not covered by the register allocation
+                usage = self.curr_tape.reg_usage
+                usage[reg.reg_type] = max(usage.get(reg.reg_type, 0),
+                                          reg.i + (reg.size or 1))
         if self.verbose:
             if self.saved:
                 print("Saved %s memory units through reallocation" % self.saved)
@@ -785,13 +936,17 @@ class Program(object):
         self._always_active = False
 
     @staticmethod
-    def read_schedule(schedule):
+    def schedule_filename(schedule):
         m = re.search(r"([^/]*)\.mpc", schedule)
         if m:
             schedule = m.group(1)
         if not os.path.exists(schedule):
             schedule = "Programs/Schedules/%s.sch" % schedule
+        return schedule
 
+    @classmethod
+    def read_schedule(cls, schedule):
+        schedule = cls.schedule_filename(schedule)
         try:
             return open(schedule).readlines()
         except FileNotFoundError:
@@ -811,6 +966,28 @@ class Program(object):
     def read_n_threads(cls, schedule):
         return int(cls.read_schedule(schedule)[0])
 
+    @classmethod
+    def read_metadata(cls, schedule):
+        """ Metadata written with ``--metadata`` or :py:obj:`None` if
+        not available or outdated. The requirements are converted to
+        :py:class:`~Compiler.program.Tape.ReqNum` with unknown numbers
+        set to infinity. """
+        lines = cls.read_schedule(schedule)
+        filename = re.sub(r"\.sch$", "", cls.schedule_filename(schedule)) + \
+            ".json"
+        try:
+            with open(filename) as f:
+                res = json.load(f)
+        except FileNotFoundError:
+            return None
+        if ["%s:%d" % (tape["name"], tape["size"])
+            for tape in res["tapes"]] != lines[2].split():
+            return None
+        res["req_num"] = cls.decode_req_num(res["req_num"])
+        for tape in res["tapes"]:
+            tape["req_num"] = cls.decode_req_num(tape["req_num"])
+        return res
+
     @classmethod
     def read_domain_size(cls, schedule):
         from Compiler.instructions import reqbl_class
@@ -841,6 +1018,13 @@ class Tape:
         self.merge_opens = True
         self.if_states = []
         self.req_bit_length = defaultdict(lambda: 0)
+        self.critical_paths = []
+        self.reg_usage = {}
+        self.thread_tapes = set()
+        self.called_tapes = set()
+        # tape numbers of every start per requirement node
+        self.launches = defaultdict(list)
+        self.serialized_req_tree = None
         self.bit_length_reason = None
         self.function_basicblocks = {}
         self.functions = []
@@ -850,6 +1034,8 @@ class Tape:
         self.warned_about_mem = False
         self.return_values = []
         self.ran_threads = False
+        self.stream = False
+        self.spool = None
 
     class BasicBlock(object):
         def __init__(self, parent, name, scope, exit_condition=None,
@@ -872,11 +1058,18 @@ class Tape:
             self.n_rounds = 0
             self.n_to_merge = 0
             self.rounds = Tape.ReqNum()
+            self.round_profile = None
+            self.critical_path = None
             self.warn_about_mem = parent.program.warn_about_mem[-1]
             self.req_node = req_node
             self.used_from_scope = set()
+            self.usage_instructions = []
+            self.usage = None
+            self.encoded = None
 
         def __len__(self):
+            if self.encoded:
+                return len(self.instructions) + self.encoded[2]
             return len(self.instructions)
 
         def new_reg(self, reg_type, size=None):
@@ -913,15 +1106,18 @@ class Tape:
             offset = self.get_offset(self.exit_block)
             self.exit_condition.set_relative_jump(offset)
 
-        def purge(self, retain_usage=True):
+        def retain_usage(self):
             def relevant(inst):
                 req_node = Tape.ReqNode("")
                 req_node.num = Tape.ReqNum()
                 inst.add_usage(req_node)
                 return req_node.num != {}
 
+            self.usage_instructions += filter(relevant, self.instructions)
+
+        def purge(self, retain_usage=True):
             if retain_usage:
-                self.usage_instructions = list(filter(relevant, self.instructions))
+                self.retain_usage()
             else:
                 self.usage_instructions = []
             if len(self.usage_instructions) > 1000 and \
@@ -930,13 +1126,37 @@ class Tape:
             del self.instructions
             self.purged = True
 
+        def encode(self, spool):
+            """ Write the byte encoding to *spool* and replace the
+            instructions by their requirements. This requires the
+            register allocation to be finished. """
+            assert not self.encoded
+            req_node = Tape.ReqNode("")
+            req_node.num = Tape.ReqNum()
+            offset = spool.tell()
+            for inst in self.instructions:
+                if inst is not None:
+                    spool.write(inst.get_bytes())
+                    if isinstance(inst, Compiler.instructions.call_tape):
+                        # requirements of the called tape might change
+                        self.usage_instructions.append(inst)
+                    else:
+                        inst.add_usage(req_node)
+            self.encoded = offset, spool.tell() - offset, \
+                len(self.instructions)
+            self.usage = req_node.num
+            # the list might be shared after expanding CISC instructions
+            del self.instructions[:]
+
         def add_usage(self, req_node):
-            if self.purged:
-                instructions = self.usage_instructions
-            else:
-                instructions = self.instructions
+            instructions = self.usage_instructions
+            if not self.purged:
+                instructions = itertools.chain(instructions,
+                                               self.instructions)
             for inst in instructions:
                 inst.add_usage(req_node)
+            if self.usage:
+                req_node.num += self.usage
             req_node.num["all", "round"] += self.n_rounds
             req_node.num["all", "inv"] += self.n_to_merge
             req_node.num += self.rounds
@@ -1019,6 +1239,9 @@ class Tape:
         self._is_empty = len(self.basicblocks) == 0
         del self.basicblocks
         del self.active_basicblock
+        if self.spool:
+            self.spool.close()
+            self.spool = None
         self.purged = True
 
     def unpurged(function):
@@ -1031,6 +1254,126 @@ class Tape:
 
     @unpurged
     def optimize(self, options):
+        """ Optimize the tape or restore the result from the cache. """
+        with self.program.phase("optimize", tape=self.name,
+                                blocks=len(self.basicblocks)):
+            self._optimize(options)
+
+    def _optimize(self, options):
+        cache = self.program.cache
+        key = None
+        if cache and self.basicblocks and not self.if_states:
+            key, exports = cache.tape_key(self)
+            if key and cache.restore_tape(self, key, exports):
+                self.program.tape_cache_hits += 1
+                if self.program.verbose:
+                    print("Restored tape %s from cache" % self.name)
+                return
+            self.program.tape_cache_misses += 1
+            snapshot = cache.snapshot(self.program)
+        # storing in the cache needs the instructions
+        self.stream = self.program.stream_bytecode and not key
+        self.optimize_uncached(options)
+        if key:
+            cache.store_tape(self, key, exports, snapshot)
+
+    def exported_registers(self):
+        """ Registers accessed by other tapes. """
+        from .instructions import call_arg
+        res = list(self.return_values)
+        for inst in self._get_instructions():
+            if isinstance(inst, call_arg):
+                res.append(inst.args[0])
+        return res
+
+    def restore_optimized(self, instructions, req_num, req_bit_length):
+        """ Replace the blocks by optimized instructions from the
+        cache. """
+        block = self.BasicBlock(self, self.name + "-cached", None,
+                                req_node=self.req_tree)
+        block.instructions = instructions
+        block.rounds = req_num
+        self.basicblocks = [block]
+        self.active_basicblock = block
+        self.req_tree._children = []
+        self.req_tree.blocks = []
+        self.req_tree.num = None
+        self.req_tree.aggregated = None
+        self.req_tree.add_block(block)
+        self.req_num = self.req_tree.aggregate()
+        for x, bl in req_bit_length.items():
+            self.req_bit_length[x] = max(self.req_bit_length[x], bl)
+
+    def merge_block(self, i, options):
+        """ Eliminate dead code in and merge instructions of a basic
+        block.
+
+        :param i: index of the block
+        :returns: groups of merged instruction indices
+        """
+        block = self.basicblocks[i]
+        if len(block.instructions) > 0 and self.program.verbose:
+            print(
+                "Processing basic block %s, %d/%d, %d instructions"
+                % (
+                    block.name,
+                    i,
+                    len(self.basicblocks),
+                    len(block.instructions),
+                )
+            )
+        with self.program.phase("block", block=block.name, index=i,
+                                instructions=len(block.instructions)):
+            return self._merge_block(block, options)
+
+    def _merge_block(self, block, options):
+        phase = self.program.phase
+        # the next call is necessary for allocation later even without merging
+        with phase("dependency graph"):
+            merger = al.Merger(block, options, tuple(self.program.to_merge))
+        if options.dead_code_elimination:
+            if len(block.instructions) > 1000000:
+                print("Eliminate dead code...")
+            with phase("dead code elimination"):
+                merger.eliminate_dead_code()
+        if options.merge_opens and self.merge_opens:
+            if len(block.instructions) == 0:
+                block.used_from_scope = util.set_by_id()
+                return []
+            if len(block.instructions) > 1000000:
+                print("Merging instructions...")
+            with phase("merge"):
+                numrounds = merger.longest_paths_merge()
+            block.n_rounds = numrounds
+            block.n_to_merge = len(merger.open_nodes)
+            if options.verbose:
+                block.rounds = merger.req_num
+            if merger.counter and self.program.verbose:
+                print(
+                    "Block requires",
+                    ", ".join(
+                        "%d %s" % (y, x.__name__)
+                        for x, y in list(merger.counter.items())
+                    ),
+                )
+            if merger.counter and self.program.verbose:
+                print(
+                    "Block requires %s rounds"
+                    % ", ".join(
+                        "%d %s" % (y, x.__name__)
+                        for x, y in list(merger.rounds.items())
+                    )
+                )
+        # free memory
+        merged = merger.merged
+        merger = None
+        if options.dead_code_elimination:
+            block.instructions = [
+                x for x in block.instructions if x is not None
+            ]
+        return merged
+
+    def optimize_uncached(self, options):
         if len(self.basicblocks) == 0:
             print("Tape %s is empty" % self.name)
             return
@@ -1050,67 +1393,43 @@ class Tape:
                 "Processing tape", self.name, "with %d blocks" % len(self.basicblocks)
             )
 
-        for block in self.basicblocks:
-            al.determine_scope(block, options)
+        phase = self.program.phase
+        if options.constant_propagation:
+            with phase("constant propagation"):
+                al.propagate_constants(self)
+        if options.common_subexpression_elimination:
+            with phase("common subexpression elimination"):
+                al.eliminate_common_subexpressions(self)
+        if options.loop_invariant_code_motion:
+            with phase("loop-invariant code motion"):
+                al.hoist_loop_invariants(self)
+        if options.dead_code_elimination:
+            with phase("dead code elimination"):
+                al.eliminate_dead_code_in_tape(self)
+        with phase("scope"):
+            for block in self.basicblocks:
+                al.determine_scope(block, options)
 
         # merge open instructions
         # need to do this if there are several blocks
         if (options.merge_opens and self.merge_opens) or options.dead_code_elimination:
-            for i, block in enumerate(self.basicblocks):
-                if len(block.instructions) > 0 and self.program.verbose:
-                    print(
-                        "Processing basic block %s, %d/%d, %d instructions"
-                        % (
-                            block.name,
-                            i,
-                            len(self.basicblocks),
-                            len(block.instructions),
-                        )
-                    )
-                # the next call is necessary for allocation later even without merging
-                merger = al.Merger(block, options, tuple(self.program.to_merge))
-                if options.dead_code_elimination:
-                    if len(block.instructions) > 1000000:
-                        print("Eliminate dead code...")
-                    merger.eliminate_dead_code()
-                if options.merge_opens and self.merge_opens:
-                    if len(block.instructions) == 0:
-                        block.used_from_scope = util.set_by_id()
-                        continue
-                    if len(block.instructions) > 1000000:
-                        print("Merging instructions...")
-                    numrounds = merger.longest_paths_merge()
-                    block.n_rounds = numrounds
-                    block.n_to_merge = len(merger.open_nodes)
-                    if options.verbose:
-                        block.rounds = merger.req_num
-                    if merger.counter and self.program.verbose:
-                        print(
-                            "Block requires",
-                            ", ".join(
-                                "%d %s" % (y, x.__name__)
-                                for x, y in list(merger.counter.items())
-                            ),
-                        )
-                    if merger.counter and self.program.verbose:
-                        print(
-                            "Block requires %s rounds"
-                            % ", ".join(
-                                "%d %s" % (y, x.__name__)
-                                for x, y in list(merger.rounds.items())
-                            )
-                        )
-                # free memory
-                merger = None
-                if options.dead_code_elimination:
-                    block.instructions = [
-                        x for x in block.instructions if x is not None
-                    ]
+            with phase("merge"):
+                if self.program.compile_jobs > 1:
+                    from .parallel import BlockJobs
+                    BlockJobs(self, self.program.compile_jobs).merge(options)
+                else:
+                    for i in range(len(self.basicblocks)):
+                        self.merge_block(i, options)
+            if options.critical_path:
+                self.critical_paths = [
+                    block.critical_path for block in self.basicblocks
+                    if block.critical_path]
         if not (options.merge_opens and self.merge_opens):
             print("Not merging instructions in tape %s" % self.name)
 
         if options.cisc:
-            self.expand_cisc()
+            with phase("cisc"):
+                self.expand_cisc()
 
         # add jumps
         offset = 0
@@ -1128,9 +1447,17 @@ class Tape:
         # now remove any empty blocks (must be done after setting jumps)
         self.basicblocks = [x for x in self.basicblocks if len(x.instructions) != 0]
 
-        # allocate registers
+        with phase("allocation"):
+            self.allocate_registers(options)
+        with phase("requirements"):
+            self.add_requirements()
+
+    def allocate_registers(self, options):
+        """ Allocate the registers of all basic blocks. """
+        phase = self.program.phase
         reg_counts = self.count_regs()
         if options.noreallocate:
+            self.reg_usage = dict(reg_counts)
             if self.program.verbose:
                 print("Tape register usage:", dict(reg_counts))
         else:
@@ -1189,7 +1516,12 @@ class Tape:
                     ):
                         alloc_loop(block.exit_block.scope)
                 usage = allocator.max_usage.copy()
-                allocator.process(block.instructions, block.alloc_pool)
+                with phase("block", block=block.name,
+                           instructions=len(block.instructions)):
+                    allocator.process(block.instructions, block.alloc_pool)
+                    if self.stream:
+                        # register numbers in the block are final now
+                        block.encode(self.get_spool())
                 if self.program.verbose and usage != allocator.max_usage:
                     print("Allocated registers in %s " % block.name, end="")
                     for t, n in allocator.max_usage.items():
@@ -1197,18 +1529,81 @@ class Tape:
                             print("%s:%d " % (t, n - usage[t]), end="")
                     print()
             allocator.finalize(options)
+            self.reg_usage = dict(allocator.max_usage)
+            if options.register_report:
+                allocator.report(self.name)
             if self.program.verbose:
                 print("Tape register usage:", dict(allocator.max_usage))
                 scopes = set(block.alloc_pool for block in self.basicblocks)
                 n_fragments = sum(scope.n_fragments() for scope in scopes)
                 print("%d register fragments in %d scopes" % (n_fragments, len(scopes)))
 
-        # offline data requirements
+    def serialize_req_tree(self):
+        """ Aggregated requirement tree in JSON form as a list of
+        nodes starting with the root. Every node contains the
+        requirements of its blocks including called tapes and the
+        children in order of creation, which are one of the following:
+
+        ``{"node": i}``
+          Node *i* such as a function.
+        ``{"loop": n, "node": i}``
+          Node *i* repeated *n* times or :py:obj:`None` if unknown.
+        ``{"max": [i, j]}``
+          Branches of a run-time condition.
+        ``{"run": [t, ...]}``
+          Tapes with the given indices run in parallel threads.
+        """
+        tapes = dict((id(tape.req_tree), i)
+                     for i, tape in enumerate(self.program.tapes))
+        nodes = []
+        index = {}
+        key = ("all", "round")
+
+        def add(node):
+            if id(node) in index:
+                return index[id(node)]
+            i = index[id(node)] = len(nodes)
+            res = dict(req=self.program.encode_req_num(node.num))
+            nodes.append(res)
+            children = []
+            launches = iter(self.launches.get(id(node), []))
+            it = iter(node._children)
+            for child in it:
+                if isinstance(child, Tape.ReqNode):
+                    if id(child) in tapes:
+                        # tapes started together follow each other
+                        run = next(launches, None)
+                        if run is None or [tapes[id(child)]] + [
+                                tapes.get(id(next(it, None)))
+                                for j in range(len(run) - 1)] != run:
+                            raise CompilerError(
+                                "tape start not found in requirements")
+                        children.append(dict(run=run))
+                    else:
+                        children.append(dict(node=add(child)))
+                elif len(child.nodes) == 1:
+                    n = child.aggregator([Tape.ReqNum({key: 1})])[key]
+                    if n == float("inf"):
+                        n = None
+                    children.append(dict(loop=n, node=add(child.nodes[0])))
+                else:
+                    children.append(dict(max=[add(x) for x in child.nodes]))
+            res["children"] = children
+            return i
+
+        add(self.req_tree)
+        return nodes
+
+    def add_requirements(self):
+        """ Aggregate the offline data requirements and add the
+        corresponding instructions. """
         if self.program.verbose:
             print("Compile offline data requirements...")
         for block in self.basicblocks:
             block.req_node.add_block(block)
         self.req_num = self.req_tree.aggregate()
+        if self.program.options.metadata:
+            self.serialized_req_tree = self.serialize_req_tree()
         if self.program.verbose:
             print("Tape requires", self.req_num)
         for req, num in sorted(self.req_num.items()):
@@ -1298,12 +1693,32 @@ class Tape:
         """Get the encoding of the program, in human-readable format."""
         return [i.get_encoding() for i in self._get_instructions() if i is not None]
 
+    def get_spool(self):
+        """ Temporary file for the encoding of finished blocks. """
+        if self.spool is None:
+            import tempfile
+            self.spool = tempfile.TemporaryFile()
+        return self.spool
+
+    @unpurged
+    def _get_bytes(self):
+        for block in self.basicblocks:
+            if block.encoded:
+                offset, length, _ = block.encoded
+                self.spool.seek(offset)
+                while length:
+                    chunk = self.spool.read(min(length, 2 ** 20))
+                    length -= len(chunk)
+                    yield chunk
+                self.spool.seek(0, os.SEEK_END)
+            for i in block.instructions:
+                if i is not None:
+                    yield i.get_bytes()
+
     @unpurged
     def get_bytes(self):
         """Get the byte encoding of the program as an actual string of bytes."""
-        return b"".join(
-            i.get_bytes() for i in self._get_instructions() if i is not None
-        )
+        return b"".join(self._get_bytes())
 
     @unpurged
     def write_encoding(self, filename):
@@ -1339,14 +1754,13 @@ class Tape:
             filename = self.program.programs_dir + "/Bytecode/" + filename
         print("Writing to", filename)
         sys.stdout.flush()
-        f = open(filename, "wb")
-        h = hashlib.sha256()
-        for i in self._get_instructions():
-            if i is not None:
-                b = i.get_bytes()
+        with self.program.phase("write", tape=self.name):
+            f = open(filename, "wb")
+            h = hashlib.sha256()
+            for b in self._get_bytes():
                 f.write(b)
                 h.update(b)
-        f.close()
+            f.close()
         self.hash = h.digest()
 
     def new_reg(self, reg_type, size=None):
@@ -1542,9 +1956,8 @@ class Tape:
 
     @staticmethod
     def read_instructions(tapename):
-        tape = open("Programs/Bytecode/%s.bc" % tapename, "rb")
-        while tape.peek():
-            yield inst_base.ParsedInstruction(tape)
+        from Compiler.bytecode import read_tape
+        return read_tape(tapename)
 
     class _no_truth(object):
         __slots__ = []
@@ -1589,10 +2002,11 @@ class Tape:
             "vectorbase",
             "caller",
             "can_eliminate",
-            "duplicates",
+            "_duplicates",
             "block",
         ]
         maximum_size = 2 ** (64 - inst_base.Instruction.code_length) - 1
+        n_vectors = 0
 
         def __init__(self, reg_type, program, size=None, i=None):
             """Creates a new register.
@@ -1619,11 +2033,11 @@ class Tape:
                 program.reg_counter[reg_type] += size
             else:
                 self.i = float("inf")
-            self.vector = []
+            self.vector = ()
             self.can_eliminate = True
-            self.duplicates = util.set_by_id([self])
+            self._duplicates = None
             if Program.prog.DEBUG:
-                self.caller = [frame[1:] for frame in inspect.stack()[1:]]
+                self.caller = util.get_trace()
             else:
                 self.caller = None
 
@@ -1635,6 +2049,22 @@ class Tape:
         def i(self, value):
             self.vectorbase.absolute_i = value - self.relative_i
 
+        @property
+        def duplicates(self):
+            """ Registers linked to this one (see :py:meth:`link`)
+            including itself until deallocation. Only stored if
+            necessary. """
+            if self._duplicates is None:
+                return (self,)
+            return self._duplicates
+
+        def remove_duplicate(self):
+            """ Remove register from its duplicates. """
+            if self._duplicates is None:
+                self._duplicates = ()
+            else:
+                self._duplicates.remove(self)
+
         def set_size(self, size):
             if self.size == size:
                 return
@@ -1673,6 +2103,7 @@ class Tape:
                 self.vector = [self]
                 return
             self.vector = []
+            Tape.Register.n_vectors += 1
             for i in range(self.size):
                 reg = self._new_by_number(self.i + i)
                 reg.set_vectorbase(self)
@@ -1702,9 +2133,11 @@ class Tape:
                 raise CompilerError("reallocation necessary for linking, "
                                     "remove option -u")
             assert self.reg_type == other.reg_type
-            self.duplicates |= other.duplicates
-            for dup in self.duplicates:
-                dup.duplicates = self.duplicates
+            if self._duplicates is None:
+                self._duplicates = util.set_by_id([self])
+            self._duplicates |= other.duplicates
+            for dup in self._duplicates:
+                dup._duplicates = self._duplicates
 
         def update(self, other):
             """
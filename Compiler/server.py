@@ -0,0 +1,224 @@
+"""
+This module contains the compile server started by
+:file:`Scripts/compile-server.py`. The server imports the compiler
+once and compiles every request in a forked process. Each compilation
+thus starts with the state of the compiler after importing it, so
+that nothing done by one program such as setting the fixed-point
+precision affects the next, while the cost of starting Python and
+importing the compiler is only paid once.
+
+For the same reason, state built while compiling does not carry over
+to the next request. This includes the expanded CISC instructions,
+which depend on the options of a program without being keyed by them.
+Optimized tapes can be shared nevertheless via the on-disk cache of
+:py:mod:`Compiler.cache`, which covers everything influencing the
+output in its keys. Requests without ``--cache-dir`` use the cache
+directory of the server if one is given.
+
+:file:`Scripts/compile-client.py` sends requests to the server. A
+request consists of a JSON object terminated by a newline with the
+command line (``args``, the equivalent of :py:obj:`sys.argv` for
+:file:`compile.py`), the working directory (``cwd``), and the
+environment (``env``). The standard input, output, and error of the
+client are passed along with the request, so the output of the
+compilation goes directly to the client. The server replies with the
+exit status as decimal number followed by a newline.
+"""
+
+import array
+import importlib
+import json
+import os
+import runpy
+import signal
+import socket
+import sys
+import traceback
+import zlib
+
+from .exceptions import CompilerError
+
+root = os.path.realpath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def default_socket():
+    """ Path of the socket for this copy of the compiler. This has
+    to match :file:`Scripts/compile-client.py`. """
+    return os.environ.get("COMPILE_SERVER_SOCKET") or os.path.join(
+        os.environ.get("TMPDIR", "/tmp"), "mp-spdz-compile-%d-%08x.sock" %
+        (os.getuid(), zlib.crc32(root.encode())))
+
+
+class CompileServer:
+    """ Compile programs requested via a Unix socket.
+
+    :param path: socket path (default: :py:func:`default_socket`)
+    :param n_jobs: maximal number of concurrent compilations
+      (default: number of CPUs)
+    :param preload: modules to import in addition to the core
+      compiler (default: :py:attr:`preload`)
+    :param cache_dir: compilation cache for requests without
+      ``--cache-dir`` (default: none)
+    """
+
+    preload = ("Compiler.ml", "Compiler.mpc_math", "Compiler.oram",
+               "Compiler.circuit_oram", "Compiler.path_oram",
+               "Compiler.sqrt_oram", "Compiler.decision_tree",
+               "Compiler.sorting")
+
+    def __init__(self, path=None, n_jobs=None, preload=None, cache_dir=None):
+        from .cache import CompilationCache
+        from .compilerLib import Compiler
+        self.path = path or default_socket()
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.cache_dir = cache_dir and os.path.abspath(cache_dir)
+        self.jobs = set()
+        self.sock = None
+        for module in self.preload if preload is None else preload:
+            importlib.import_module(module)
+        Compiler.symbols()
+        CompilationCache.compiler_digest()
+        self.modules = self.module_times()
+
+    @staticmethod
+    def module_times():
+        """ Modification times of the loaded modules of the compiler. """
+        res = {}
+        for module in list(sys.modules.values()):
+            filename = getattr(module, "__file__", None)
+            if filename and \
+               os.path.realpath(filename).startswith(root + os.sep):
+                res[filename] = os.stat(filename).st_mtime_ns
+        return res
+
+    def changed(self):
+        """ Whether the compiler has changed since starting. """
+        try:
+            return any(os.stat(filename).st_mtime_ns != mtime
+                       for filename, mtime in self.modules.items())
+        except OSError:
+            return True
+
+    def bind(self):
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                os.unlink(self.path)
+            else:
+                raise CompilerError("compile server already running on %s" %
+                                    self.path)
+            finally:
+                probe.close()
+        self.sock = socket.socket(socket.AF_UNIX)
+        # only the owner may run programs
+        umask = os.umask(0o177)
+        try:
+            self.sock.bind(self.path)
+        finally:
+            os.umask(umask)
+        self.sock.listen()
+
+    def serve(self):
+        """ Handle requests until interrupted. """
+        self.bind()
+        signal.signal(signal.SIGTERM, lambda *args: sys.exit())
+        print("Compile server listening on", self.path)
+        sys.stdout.flush()
+        try:
+            while True:
+                conn, _ = self.sock.accept()
+                while len(self.jobs) >= self.n_jobs:
+                    self.jobs.discard(os.waitpid(-1, 0)[0])
+                pid = os.fork()
+                if pid == 0:
+                    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                    self.sock.close()
+                    self.handle(conn)
+                conn.close()
+                self.jobs.add(pid)
+                self.reap()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.sock.close()
+            os.unlink(self.path)
+
+    def reap(self):
+        """ Collect finished compilations. """
+        for pid in list(self.jobs):
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                self.jobs.remove(pid)
+
+    @staticmethod
+    def receive(conn):
+        """ Read a request and the file descriptors sent with it. """
+        fds = array.array("i")
+        data, ancdata, _, _ = conn.recvmsg(
+            2 ** 16, socket.CMSG_LEN(3 * fds.itemsize))
+        for level, kind, cdata in ancdata:
+            if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+                fds.frombytes(cdata[:len(cdata) - len(cdata) % fds.itemsize])
+        while data and not data.endswith(b"\n"):
+            chunk = conn.recv(2 ** 16)
+            if not chunk:
+                break
+            data += chunk
+        return json.loads(data) if data else None, list(fds)
+
+    def handle(self, conn):
+        """ Compile a request in the forked process and exit. """
+        status = 1
+        try:
+            request, fds = self.receive(conn)
+            if request is None:
+                os._exit(0)
+            for i, fd in enumerate(fds):
+                os.dup2(fd, i)
+                os.close(fd)
+            sys.stdin = open(0, closefd=False)
+            sys.stdout = open(1, "w", closefd=False)
+            sys.stderr = open(2, "w", buffering=1, closefd=False)
+            status = self.compile(request)
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                conn.sendall(b"%d\n" % status)
+            except (OSError, ValueError):
+                pass
+            os._exit(0)
+
+    def compile(self, request):
+        """ Run :file:`compile.py` as requested.
+
+        :returns: exit status
+        """
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        args = request["args"]
+        compile_py = os.path.join(root, "compile.py")
+        if self.cache_dir and not any(
+                arg.startswith("--cache-dir") for arg in args[1:]):
+            args = args[:1] + ["--cache-dir=" + self.cache_dir] + args[1:]
+        if self.changed():
+            print("Compiler changed since starting the compile server, "
+                  "compiling without it", file=sys.stderr)
+            import subprocess
+            return subprocess.call([sys.executable, compile_py] + args[1:])
+        sys.argv = list(args)
+        try:
+            runpy.run_path(compile_py, run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                return 0
+            elif isinstance(e.code, int):
+                return e.code
+            else:
+                print(e.code, file=sys.stderr)
+                return 1
+        return 0
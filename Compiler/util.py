@@ -1,15 +1,54 @@
 import math
 import operator
+import sys
 from functools import reduce
 
+_frames = {}
+_traces = {}
+
+def get_trace(depth=1):
+    """ Call stack of the caller as tuple of (file name, line number,
+    function name) starting with the innermost frame. Identical
+    frames and stacks are shared, and the source lines are only read
+    when formatting.
+
+    :param depth: number of innermost frames to skip (default: the
+      caller of the caller)
+    """
+    frame = sys._getframe(depth + 1)
+    res = []
+    while frame is not None:
+        code = frame.f_code
+        key = code.co_filename, frame.f_lineno, code.co_name
+        res.append(_frames.setdefault(key, key))
+        frame = frame.f_back
+    res = tuple(res)
+    return _traces.setdefault(res, res)
+
 def format_trace(trace, prefix='  '):
     if trace is None:
         return '<omitted>'
     else:
+        import linecache
         return ''.join('\n%sFile "%s", line %s, in %s\n%s  %s' %
-                       (prefix,i[0],i[1],i[2],prefix,i[3][0].strip()) \
+                       (prefix,i[0],i[1],i[2],prefix,
+                        linecache.getline(i[0], i[1]).strip()) \
                            for i in reversed(trace))
 
+def source_location(trace):
+    """ Innermost frame of a trace outside the compiler as
+    ``<file>:<line>`` or ``None``. """
+    if trace is None:
+        return None
+    import os
+    compiler = os.path.dirname(os.path.abspath(__file__))
+    for frame in trace:
+        filename = os.path.abspath(frame[0])
+        if not filename.startswith(compiler + os.sep) and \
+           os.path.basename(filename) != 'compile.py' and \
+           not frame[0].startswith('<'):
+            return '%s:%d' % (os.path.relpath(frame[0]), frame[1])
+
 def tuplify(x):
     if isinstance(x, (list, tuple)):
         return tuple(x)
@@ -242,6 +281,8 @@ def find_in_dict(d, v):
     return list(d.keys())[list(d.values()).index(v)]
 
 class set_by_id(object):
+    __slots__ = ['content']
+
     def __init__(self, init=[]):
         self.content = {}
         for x in init:
@@ -274,6 +315,8 @@ class set_by_id(object):
         return self
 
 class dict_by_id(object):
+    __slots__ = ['content']
+
     def __init__(self):
         self.content = {}
 
@@ -293,6 +336,8 @@ class dict_by_id(object):
         return self.keys()
 
 class defaultdict_by_id(dict_by_id):
+    __slots__ = ['default']
+
     def __init__(self, default):
         dict_by_id.__init__(self)
         self.default = default
@@ -0,0 +1,34 @@
+ldint ci1, 1 # 0
+ldint ci0, 0 # 1
+jmpeqz ci0, 5 # 2
+ldint ci2, 7 # 3
+ldint ci3, 0 # 4
+divint ci0, ci2, ci3 # 5
+print_int ci0 # 6
+print_char 10 # 7
+ldi c0, 300 # 8
+convmodp ci0, c0, 8 # 9
+ldint ci2, -5 # 10
+gconvint cg1, ci2 # 11
+gldi cg0, 5 # 12
+print_int ci1 # 13
+print_char 32 # 14
+print_int ci0 # 15
+print_char 32 # 16
+gprint_reg_plain cg1 # 17
+print_char 32 # 18
+gprint_reg_plain cg0 # 19
+print_char 10 # 20
+ldint ci2, 0 # 21
+crash ci2 # 22
+ldint ci1, 44 # 23
+eqc ci2, ci0, ci1 # 24
+ldint ci1, 1 # 25
+subint ci0, ci1, ci2 # 26
+crash ci0 # 27
+ldmc c0, 8191 # 28
+gldmc cg0, 8191 # 29
+ldmint ci0, 8191 # 30
+ldms s0, 8191 # 31
+gldms sg0, 8191 # 32
+active 1 # 33
@@ -0,0 +1,50 @@
+ldint ci8, -3 # 0
+convint c0, ci8 # 1
+movc c1, c0 # 2
+gconvint cg0, ci8 # 3
+print_reg_plain c0 # 4
+print_char 32 # 5
+print_reg_plain c1 # 6
+print_char 32 # 7
+gprint_reg_plain cg0 # 8
+print_char 10 # 9
+convmodp ci8, c0, 64 # 10
+ldint ci6, 1 # 11
+ldint ci7, 65536 # 12
+mulint ci5, ci7, ci7 # 13
+mulint ci7, ci6, ci5 # 14
+ldint ci4, 0 # 15
+addint ci6, ci7, ci4 # 16
+ldint ci3, 65536 # 17
+movint ci2, ci5 # 18
+mulint ci4, ci6, ci2 # 19
+ldint ci1, -3 # 20
+addint ci3, ci4, ci1 # 21
+eqc ci2, ci8, ci3 # 22
+shrci c1, c0, 64 # 23
+ldint ci0, 1 # 24
+subint ci1, ci0, ci2 # 25
+crash ci1 # 26
+movint ci0, ci8 # 27
+ldint ci0, 1 # 28
+ldint ci0, 65536 # 29
+movint ci0, ci5 # 30
+movint ci0, ci7 # 31
+ldint ci0, 0 # 32
+movint ci0, ci6 # 33
+ldint ci0, 65536 # 34
+movint ci0, ci5 # 35
+movint ci0, ci4 # 36
+ldint ci0, -3 # 37
+movint ci0, ci3 # 38
+movint ci0, ci2 # 39
+movc c0, c1 # 40
+ldint ci0, 1 # 41
+movint ci0, ci1 # 42
+crash ci0 # 43
+ldmc c0, 8191 # 44
+gldmc cg0, 8191 # 45
+ldmint ci0, 8191 # 46
+ldms s0, 8191 # 47
+gldms sg0, 8191 # 48
+active 1 # 49
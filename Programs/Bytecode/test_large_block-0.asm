@@ -0,0 +1,18065 @@
+ldsi s0, 0 # 0
+ldsi s3002, 1 # 1
+ldsi s3004, 2 # 2
+ldsi s3006, 3 # 3
+ldsi s3008, 4 # 4
+ldsi s3010, 5 # 5
+ldsi s3012, 6 # 6
+ldsi s3014, 7 # 7
+ldsi s3016, 8 # 8
+ldsi s3018, 9 # 9
+ldsi s3020, 10 # 10
+ldsi s3022, 11 # 11
+ldsi s3024, 12 # 12
+ldsi s3026, 13 # 13
+ldsi s3028, 14 # 14
+ldsi s3030, 15 # 15
+ldsi s3032, 16 # 16
+ldsi s3034, 17 # 17
+ldsi s3036, 18 # 18
+ldsi s3038, 19 # 19
+ldsi s3040, 20 # 20
+ldsi s3042, 21 # 21
+ldsi s3044, 22 # 22
+ldsi s3046, 23 # 23
+ldsi s3048, 24 # 24
+ldsi s3050, 25 # 25
+ldsi s3052, 26 # 26
+ldsi s3054, 27 # 27
+ldsi s3056, 28 # 28
+ldsi s3058, 29 # 29
+ldsi s3060, 30 # 30
+ldsi s3062, 31 # 31
+ldsi s3064, 32 # 32
+ldsi s3066, 33 # 33
+ldsi s3068, 34 # 34
+ldsi s3070, 35 # 35
+ldsi s3072, 36 # 36
+ldsi s3074, 37 # 37
+ldsi s3076, 38 # 38
+ldsi s3078, 39 # 39
+ldsi s3080, 40 # 40
+ldsi s3082, 41 # 41
+ldsi s3084, 42 # 42
+ldsi s3086, 43 # 43
+ldsi s3088, 44 # 44
+ldsi s3090, 45 # 45
+ldsi s3092, 46 # 46
+ldsi s3094, 47 # 47
+ldsi s3096, 48 # 48
+ldsi s3098, 49 # 49
+ldsi s3100, 50 # 50
+ldsi s3102, 51 # 51
+ldsi s3104, 52 # 52
+ldsi s3106, 53 # 53
+ldsi s3108, 54 # 54
+ldsi s3110, 55 # 55
+ldsi s3112, 56 # 56
+ldsi s3114, 57 # 57
+ldsi s3116, 58 # 58
+ldsi s3118, 59 # 59
+ldsi s3120, 60 # 60
+ldsi s3122, 61 # 61
+ldsi s3124, 62 # 62
+ldsi s3126, 63 # 63
+ldsi s3128, 64 # 64
+ldsi s3130, 65 # 65
+ldsi s3132, 66 # 66
+ldsi s3134, 67 # 67
+ldsi s3136, 68 # 68
+ldsi s3138, 69 # 69
+ldsi s3140, 70 # 70
+ldsi s3142, 71 # 71
+ldsi s3144, 72 # 72
+ldsi s3146, 73 # 73
+ldsi s3148, 74 # 74
+ldsi s3150, 75 # 75
+ldsi s3152, 76 # 76
+ldsi s3154, 77 # 77
+ldsi s3156, 78 # 78
+ldsi s3158, 79 # 79
+ldsi s3160, 80 # 80
+ldsi s3162, 81 # 81
+ldsi s3164, 82 # 82
+ldsi s3166, 83 # 83
+ldsi s3168, 84 # 84
+ldsi s3170, 85 # 85
+ldsi s3172, 86 # 86
+ldsi s3174, 87 # 87
+ldsi s3176, 88 # 88
+ldsi s3178, 89 # 89
+ldsi s3180, 90 # 90
+ldsi s3182, 91 # 91
+ldsi s3184, 92 # 92
+ldsi s3186, 93 # 93
+ldsi s3188, 94 # 94
+ldsi s3190, 95 # 95
+ldsi s3192, 96 # 96
+ldsi s3194, 97 # 97
+ldsi s3196, 98 # 98
+ldsi s3198, 99 # 99
+ldsi s3200, 100 # 100
+ldsi s3202, 101 # 101
+ldsi s3204, 102 # 102
+ldsi s3206, 103 # 103
+ldsi s3208, 104 # 104
+ldsi s3210, 105 # 105
+ldsi s3212, 106 # 106
+ldsi s3214, 107 # 107
+ldsi s3216, 108 # 108
+ldsi s3218, 109 # 109
+ldsi s3220, 110 # 110
+ldsi s3222, 111 # 111
+ldsi s3224, 112 # 112
+ldsi s3226, 113 # 113
+ldsi s3228, 114 # 114
+ldsi s3230, 115 # 115
+ldsi s3232, 116 # 116
+ldsi s3234, 117 # 117
+ldsi s3236, 118 # 118
+ldsi s3238, 119 # 119
+ldsi s3240, 120 # 120
+ldsi s3242, 121 # 121
+ldsi s3244, 122 # 122
+ldsi s3246, 123 # 123
+ldsi s3248, 124 # 124
+ldsi s3250, 125 # 125
+ldsi s3252, 126 # 126
+ldsi s3254, 127 # 127
+ldsi s3256, 128 # 128
+ldsi s3258, 129 # 129
+ldsi s3260, 130 # 130
+ldsi s3262, 131 # 131
+ldsi s3264, 132 # 132
+ldsi s3266, 133 # 133
+ldsi s3268, 134 # 134
+ldsi s3270, 135 # 135
+ldsi s3272, 136 # 136
+ldsi s3274, 137 # 137
+ldsi s3276, 138 # 138
+ldsi s3278, 139 # 139
+ldsi s3280, 140 # 140
+ldsi s3282, 141 # 141
+ldsi s3284, 142 # 142
+ldsi s3286, 143 # 143
+ldsi s3288, 144 # 144
+ldsi s3290, 145 # 145
+ldsi s3292, 146 # 146
+ldsi s3294, 147 # 147
+ldsi s3296, 148 # 148
+ldsi s3298, 149 # 149
+ldsi s3300, 150 # 150
+ldsi s3302, 151 # 151
+ldsi s3304, 152 # 152
+ldsi s3306, 153 # 153
+ldsi s3308, 154 # 154
+ldsi s3310, 155 # 155
+ldsi s3312, 156 # 156
+ldsi s3314, 157 # 157
+ldsi s3316, 158 # 158
+ldsi s3318, 159 # 159
+ldsi s3320, 160 # 160
+ldsi s3322, 161 # 161
+ldsi s3324, 162 # 162
+ldsi s3326, 163 # 163
+ldsi s3328, 164 # 164
+ldsi s3330, 165 # 165
+ldsi s3332, 166 # 166
+ldsi s3334, 167 # 167
+ldsi s3336, 168 # 168
+ldsi s3338, 169 # 169
+ldsi s3340, 170 # 170
+ldsi s3342, 171 # 171
+ldsi s3344, 172 # 172
+ldsi s3346, 173 # 173
+ldsi s3348, 174 # 174
+ldsi s3350, 175 # 175
+ldsi s3352, 176 # 176
+ldsi s3354, 177 # 177
+ldsi s3356, 178 # 178
+ldsi s3358, 179 # 179
+ldsi s3360, 180 # 180
+ldsi s3362, 181 # 181
+ldsi s3364, 182 # 182
+ldsi s3366, 183 # 183
+ldsi s3368, 184 # 184
+ldsi s3370, 185 # 185
+ldsi s3372, 186 # 186
+ldsi s3374, 187 # 187
+ldsi s3376, 188 # 188
+ldsi s3378, 189 # 189
+ldsi s3380, 190 # 190
+ldsi s3382, 191 # 191
+ldsi s3384, 192 # 192
+ldsi s3386, 193 # 193
+ldsi s3388, 194 # 194
+ldsi s3390, 195 # 195
+ldsi s3392, 196 # 196
+ldsi s3394, 197 # 197
+ldsi s3396, 198 # 198
+ldsi s3398, 199 # 199
+ldsi s3400, 200 # 200
+ldsi s3402, 201 # 201
+ldsi s3404, 202 # 202
+ldsi s3406, 203 # 203
+ldsi s3408, 204 # 204
+ldsi s3410, 205 # 205
+ldsi s3412, 206 # 206
+ldsi s3414, 207 # 207
+ldsi s3416, 208 # 208
+ldsi s3418, 209 # 209
+ldsi s3420, 210 # 210
+ldsi s3422, 211 # 211
+ldsi s3424, 212 # 212
+ldsi s3426, 213 # 213
+ldsi s3428, 214 # 214
+ldsi s3430, 215 # 215
+ldsi s3432, 216 # 216
+ldsi s3434, 217 # 217
+ldsi s3436, 218 # 218
+ldsi s3438, 219 # 219
+ldsi s3440, 220 # 220
+ldsi s3442, 221 # 221
+ldsi s3444, 222 # 222
+ldsi s3446, 223 # 223
+ldsi s3448, 224 # 224
+ldsi s3450, 225 # 225
+ldsi s3452, 226 # 226
+ldsi s3454, 227 # 227
+ldsi s3456, 228 # 228
+ldsi s3458, 229 # 229
+ldsi s3460, 230 # 230
+ldsi s3462, 231 # 231
+ldsi s3464, 232 # 232
+ldsi s3466, 233 # 233
+ldsi s3468, 234 # 234
+ldsi s3470, 235 # 235
+ldsi s3472, 236 # 236
+ldsi s3474, 237 # 237
+ldsi s3476, 238 # 238
+ldsi s3478, 239 # 239
+ldsi s3480, 240 # 240
+ldsi s3482, 241 # 241
+ldsi s3484, 242 # 242
+ldsi s3486, 243 # 243
+ldsi s3488, 244 # 244
+ldsi s3490, 245 # 245
+ldsi s3492, 246 # 246
+ldsi s3494, 247 # 247
+ldsi s3496, 248 # 248
+ldsi s3498, 249 # 249
+ldsi s3500, 250 # 250
+ldsi s3502, 251 # 251
+ldsi s3504, 252 # 252
+ldsi s3506, 253 # 253
+ldsi s3508, 254 # 254
+ldsi s3510, 255 # 255
+ldsi s3512, 256 # 256
+ldsi s3514, 257 # 257
+ldsi s3516, 258 # 258
+ldsi s3518, 259 # 259
+ldsi s3520, 260 # 260
+ldsi s3522, 261 # 261
+ldsi s3524, 262 # 262
+ldsi s3526, 263 # 263
+ldsi s3528, 264 # 264
+ldsi s3530, 265 # 265
+ldsi s3532, 266 # 266
+ldsi s3534, 267 # 267
+ldsi s3536, 268 # 268
+ldsi s3538, 269 # 269
+ldsi s3540, 270 # 270
+ldsi s3542, 271 # 271
+ldsi s3544, 272 # 272
+ldsi s3546, 273 # 273
+ldsi s3548, 274 # 274
+ldsi s3550, 275 # 275
+ldsi s3552, 276 # 276
+ldsi s3554, 277 # 277
+ldsi s3556, 278 # 278
+ldsi s3558, 279 # 279
+ldsi s3560, 280 # 280
+ldsi s3562, 281 # 281
+ldsi s3564, 282 # 282
+ldsi s3566, 283 # 283
+ldsi s3568, 284 # 284
+ldsi s3570, 285 # 285
+ldsi s3572, 286 # 286
+ldsi s3574, 287 # 287
+ldsi s3576, 288 # 288
+ldsi s3578, 289 # 289
+ldsi s3580, 290 # 290
+ldsi s3582, 291 # 291
+ldsi s3584, 292 # 292
+ldsi s3586, 293 # 293
+ldsi s3588, 294 # 294
+ldsi s3590, 295 # 295
+ldsi s3592, 296 # 296
+ldsi s3594, 297 # 297
+ldsi s3596, 298 # 298
+ldsi s3598, 299 # 299
+ldsi s3600, 300 # 300
+ldsi s3602, 301 # 301
+ldsi s3604, 302 # 302
+ldsi s3606, 303 # 303
+ldsi s3608, 304 # 304
+ldsi s3610, 305 # 305
+ldsi s3612, 306 # 306
+ldsi s3614, 307 # 307
+ldsi s3616, 308 # 308
+ldsi s3618, 309 # 309
+ldsi s3620, 310 # 310
+ldsi s3622, 311 # 311
+ldsi s3624, 312 # 312
+ldsi s3626, 313 # 313
+ldsi s3628, 314 # 314
+ldsi s3630, 315 # 315
+ldsi s3632, 316 # 316
+ldsi s3634, 317 # 317
+ldsi s3636, 318 # 318
+ldsi s3638, 319 # 319
+ldsi s3640, 320 # 320
+ldsi s3642, 321 # 321
+ldsi s3644, 322 # 322
+ldsi s3646, 323 # 323
+ldsi s3648, 324 # 324
+ldsi s3650, 325 # 325
+ldsi s3652, 326 # 326
+ldsi s3654, 327 # 327
+ldsi s3656, 328 # 328
+ldsi s3658, 329 # 329
+ldsi s3660, 330 # 330
+ldsi s3662, 331 # 331
+ldsi s3664, 332 # 332
+ldsi s3666, 333 # 333
+ldsi s3668, 334 # 334
+ldsi s3670, 335 # 335
+ldsi s3672, 336 # 336
+ldsi s3674, 337 # 337
+ldsi s3676, 338 # 338
+ldsi s3678, 339 # 339
+ldsi s3680, 340 # 340
+ldsi s3682, 341 # 341
+ldsi s3684, 342 # 342
+ldsi s3686, 343 # 343
+ldsi s3688, 344 # 344
+ldsi s3690, 345 # 345
+ldsi s3692, 346 # 346
+ldsi s3694, 347 # 347
+ldsi s3696, 348 # 348
+ldsi s3698, 349 # 349
+ldsi s3700, 350 # 350
+ldsi s3702, 351 # 351
+ldsi s3704, 352 # 352
+ldsi s3706, 353 # 353
+ldsi s3708, 354 # 354
+ldsi s3710, 355 # 355
+ldsi s3712, 356 # 356
+ldsi s3714, 357 # 357
+ldsi s3716, 358 # 358
+ldsi s3718, 359 # 359
+ldsi s3720, 360 # 360
+ldsi s3722, 361 # 361
+ldsi s3724, 362 # 362
+ldsi s3726, 363 # 363
+ldsi s3728, 364 # 364
+ldsi s3730, 365 # 365
+ldsi s3732, 366 # 366
+ldsi s3734, 367 # 367
+ldsi s3736, 368 # 368
+ldsi s3738, 369 # 369
+ldsi s3740, 370 # 370
+ldsi s3742, 371 # 371
+ldsi s3744, 372 # 372
+ldsi s3746, 373 # 373
+ldsi s3748, 374 # 374
+ldsi s3750, 375 # 375
+ldsi s3752, 376 # 376
+ldsi s3754, 377 # 377
+ldsi s3756, 378 # 378
+ldsi s3758, 379 # 379
+ldsi s3760, 380 # 380
+ldsi s3762, 381 # 381
+ldsi s3764, 382 # 382
+ldsi s3766, 383 # 383
+ldsi s3768, 384 # 384
+ldsi s3770, 385 # 385
+ldsi s3772, 386 # 386
+ldsi s3774, 387 # 387
+ldsi s3776, 388 # 388
+ldsi s3778, 389 # 389
+ldsi s3780, 390 # 390
+ldsi s3782, 391 # 391
+ldsi s3784, 392 # 392
+ldsi s3786, 393 # 393
+ldsi s3788, 394 # 394
+ldsi s3790, 395 # 395
+ldsi s3792, 396 # 396
+ldsi s3794, 397 # 397
+ldsi s3796, 398 # 398
+ldsi s3798, 399 # 399
+ldsi s3800, 400 # 400
+ldsi s3802, 401 # 401
+ldsi s3804, 402 # 402
+ldsi s3806, 403 # 403
+ldsi s3808, 404 # 404
+ldsi s3810, 405 # 405
+ldsi s3812, 406 # 406
+ldsi s3814, 407 # 407
+ldsi s3816, 408 # 408
+ldsi s3818, 409 # 409
+ldsi s3820, 410 # 410
+ldsi s3822, 411 # 411
+ldsi s3824, 412 # 412
+ldsi s3826, 413 # 413
+ldsi s3828, 414 # 414
+ldsi s3830, 415 # 415
+ldsi s3832, 416 # 416
+ldsi s3834, 417 # 417
+ldsi s3836, 418 # 418
+ldsi s3838, 419 # 419
+ldsi s3840, 420 # 420
+ldsi s3842, 421 # 421
+ldsi s3844, 422 # 422
+ldsi s3846, 423 # 423
+ldsi s3848, 424 # 424
+ldsi s3850, 425 # 425
+ldsi s3852, 426 # 426
+ldsi s3854, 427 # 427
+ldsi s3856, 428 # 428
+ldsi s3858, 429 # 429
+ldsi s3860, 430 # 430
+ldsi s3862, 431 # 431
+ldsi s3864, 432 # 432
+ldsi s3866, 433 # 433
+ldsi s3868, 434 # 434
+ldsi s3870, 435 # 435
+ldsi s3872, 436 # 436
+ldsi s3874, 437 # 437
+ldsi s3876, 438 # 438
+ldsi s3878, 439 # 439
+ldsi s3880, 440 # 440
+ldsi s3882, 441 # 441
+ldsi s3884, 442 # 442
+ldsi s3886, 443 # 443
+ldsi s3888, 444 # 444
+ldsi s3890, 445 # 445
+ldsi s3892, 446 # 446
+ldsi s3894, 447 # 447
+ldsi s3896, 448 # 448
+ldsi s3898, 449 # 449
+ldsi s3900, 450 # 450
+ldsi s3902, 451 # 451
+ldsi s3904, 452 # 452
+ldsi s3906, 453 # 453
+ldsi s3908, 454 # 454
+ldsi s3910, 455 # 455
+ldsi s3912, 456 # 456
+ldsi s3914, 457 # 457
+ldsi s3916, 458 # 458
+ldsi s3918, 459 # 459
+ldsi s3920, 460 # 460
+ldsi s3922, 461 # 461
+ldsi s3924, 462 # 462
+ldsi s3926, 463 # 463
+ldsi s3928, 464 # 464
+ldsi s3930, 465 # 465
+ldsi s3932, 466 # 466
+ldsi s3934, 467 # 467
+ldsi s3936, 468 # 468
+ldsi s3938, 469 # 469
+ldsi s3940, 470 # 470
+ldsi s3942, 471 # 471
+ldsi s3944, 472 # 472
+ldsi s3946, 473 # 473
+ldsi s3948, 474 # 474
+ldsi s3950, 475 # 475
+ldsi s3952, 476 # 476
+ldsi s3954, 477 # 477
+ldsi s3956, 478 # 478
+ldsi s3958, 479 # 479
+ldsi s3960, 480 # 480
+ldsi s3962, 481 # 481
+ldsi s3964, 482 # 482
+ldsi s3966, 483 # 483
+ldsi s3968, 484 # 484
+ldsi s3970, 485 # 485
+ldsi s3972, 486 # 486
+ldsi s3974, 487 # 487
+ldsi s3976, 488 # 488
+ldsi s3978, 489 # 489
+ldsi s3980, 490 # 490
+ldsi s3982, 491 # 491
+ldsi s3984, 492 # 492
+ldsi s3986, 493 # 493
+ldsi s3988, 494 # 494
+ldsi s3990, 495 # 495
+ldsi s3992, 496 # 496
+ldsi s3994, 497 # 497
+ldsi s3996, 498 # 498
+ldsi s3998, 499 # 499
+ldsi s4000, 500 # 500
+ldsi s4002, 501 # 501
+ldsi s4004, 502 # 502
+ldsi s4006, 503 # 503
+ldsi s4008, 504 # 504
+ldsi s4010, 505 # 505
+ldsi s4012, 506 # 506
+ldsi s4014, 507 # 507
+ldsi s4016, 508 # 508
+ldsi s4018, 509 # 509
+ldsi s4020, 510 # 510
+ldsi s4022, 511 # 511
+ldsi s4024, 512 # 512
+ldsi s4026, 513 # 513
+ldsi s4028, 514 # 514
+ldsi s4030, 515 # 515
+ldsi s4032, 516 # 516
+ldsi s4034, 517 # 517
+ldsi s4036, 518 # 518
+ldsi s4038, 519 # 519
+ldsi s4040, 520 # 520
+ldsi s4042, 521 # 521
+ldsi s4044, 522 # 522
+ldsi s4046, 523 # 523
+ldsi s4048, 524 # 524
+ldsi s4050, 525 # 525
+ldsi s4052, 526 # 526
+ldsi s4054, 527 # 527
+ldsi s4056, 528 # 528
+ldsi s4058, 529 # 529
+ldsi s4060, 530 # 530
+ldsi s4062, 531 # 531
+ldsi s4064, 532 # 532
+ldsi s4066, 533 # 533
+ldsi s4068, 534 # 534
+ldsi s4070, 535 # 535
+ldsi s4072, 536 # 536
+ldsi s4074, 537 # 537
+ldsi s4076, 538 # 538
+ldsi s4078, 539 # 539
+ldsi s4080, 540 # 540
+ldsi s4082, 541 # 541
+ldsi s4084, 542 # 542
+ldsi s4086, 543 # 543
+ldsi s4088, 544 # 544
+ldsi s4090, 545 # 545
+ldsi s4092, 546 # 546
+ldsi s4094, 547 # 547
+ldsi s4096, 548 # 548
+ldsi s4098, 549 # 549
+ldsi s4100, 550 # 550
+ldsi s4102, 551 # 551
+ldsi s4104, 552 # 552
+ldsi s4106, 553 # 553
+ldsi s4108, 554 # 554
+ldsi s4110, 555 # 555
+ldsi s4112, 556 # 556
+ldsi s4114, 557 # 557
+ldsi s4116, 558 # 558
+ldsi s4118, 559 # 559
+ldsi s4120, 560 # 560
+ldsi s4122, 561 # 561
+ldsi s4124, 562 # 562
+ldsi s4126, 563 # 563
+ldsi s4128, 564 # 564
+ldsi s4130, 565 # 565
+ldsi s4132, 566 # 566
+ldsi s4134, 567 # 567
+ldsi s4136, 568 # 568
+ldsi s4138, 569 # 569
+ldsi s4140, 570 # 570
+ldsi s4142, 571 # 571
+ldsi s4144, 572 # 572
+ldsi s4146, 573 # 573
+ldsi s4148, 574 # 574
+ldsi s4150, 575 # 575
+ldsi s4152, 576 # 576
+ldsi s4154, 577 # 577
+ldsi s4156, 578 # 578
+ldsi s4158, 579 # 579
+ldsi s4160, 580 # 580
+ldsi s4162, 581 # 581
+ldsi s4164, 582 # 582
+ldsi s4166, 583 # 583
+ldsi s4168, 584 # 584
+ldsi s4170, 585 # 585
+ldsi s4172, 586 # 586
+ldsi s4174, 587 # 587
+ldsi s4176, 588 # 588
+ldsi s4178, 589 # 589
+ldsi s4180, 590 # 590
+ldsi s4182, 591 # 591
+ldsi s4184, 592 # 592
+ldsi s4186, 593 # 593
+ldsi s4188, 594 # 594
+ldsi s4190, 595 # 595
+ldsi s4192, 596 # 596
+ldsi s4194, 597 # 597
+ldsi s4196, 598 # 598
+ldsi s4198, 599 # 599
+ldsi s4200, 600 # 600
+ldsi s4202, 601 # 601
+ldsi s4204, 602 # 602
+ldsi s4206, 603 # 603
+ldsi s4208, 604 # 604
+ldsi s4210, 605 # 605
+ldsi s4212, 606 # 606
+ldsi s4214, 607 # 607
+ldsi s4216, 608 # 608
+ldsi s4218, 609 # 609
+ldsi s4220, 610 # 610
+ldsi s4222, 611 # 611
+ldsi s4224, 612 # 612
+ldsi s4226, 613 # 613
+ldsi s4228, 614 # 614
+ldsi s4230, 615 # 615
+ldsi s4232, 616 # 616
+ldsi s4234, 617 # 617
+ldsi s4236, 618 # 618
+ldsi s4238, 619 # 619
+ldsi s4240, 620 # 620
+ldsi s4242, 621 # 621
+ldsi s4244, 622 # 622
+ldsi s4246, 623 # 623
+ldsi s4248, 624 # 624
+ldsi s4250, 625 # 625
+ldsi s4252, 626 # 626
+ldsi s4254, 627 # 627
+ldsi s4256, 628 # 628
+ldsi s4258, 629 # 629
+ldsi s4260, 630 # 630
+ldsi s4262, 631 # 631
+ldsi s4264, 632 # 632
+ldsi s4266, 633 # 633
+ldsi s4268, 634 # 634
+ldsi s4270, 635 # 635
+ldsi s4272, 636 # 636
+ldsi s4274, 637 # 637
+ldsi s4276, 638 # 638
+ldsi s4278, 639 # 639
+ldsi s4280, 640 # 640
+ldsi s4282, 641 # 641
+ldsi s4284, 642 # 642
+ldsi s4286, 643 # 643
+ldsi s4288, 644 # 644
+ldsi s4290, 645 # 645
+ldsi s4292, 646 # 646
+ldsi s4294, 647 # 647
+ldsi s4296, 648 # 648
+ldsi s4298, 649 # 649
+ldsi s4300, 650 # 650
+ldsi s4302, 651 # 651
+ldsi s4304, 652 # 652
+ldsi s4306, 653 # 653
+ldsi s4308, 654 # 654
+ldsi s4310, 655 # 655
+ldsi s4312, 656 # 656
+ldsi s4314, 657 # 657
+ldsi s4316, 658 # 658
+ldsi s4318, 659 # 659
+ldsi s4320, 660 # 660
+ldsi s4322, 661 # 661
+ldsi s4324, 662 # 662
+ldsi s4326, 663 # 663
+ldsi s4328, 664 # 664
+ldsi s4330, 665 # 665
+ldsi s4332, 666 # 666
+ldsi s4334, 667 # 667
+ldsi s4336, 668 # 668
+ldsi s4338, 669 # 669
+ldsi s4340, 670 # 670
+ldsi s4342, 671 # 671
+ldsi s4344, 672 # 672
+ldsi s4346, 673 # 673
+ldsi s4348, 674 # 674
+ldsi s4350, 675 # 675
+ldsi s4352, 676 # 676
+ldsi s4354, 677 # 677
+ldsi s4356, 678 # 678
+ldsi s4358, 679 # 679
+ldsi s4360, 680 # 680
+ldsi s4362, 681 # 681
+ldsi s4364, 682 # 682
+ldsi s4366, 683 # 683
+ldsi s4368, 684 # 684
+ldsi s4370, 685 # 685
+ldsi s4372, 686 # 686
+ldsi s4374, 687 # 687
+ldsi s4376, 688 # 688
+ldsi s4378, 689 # 689
+ldsi s4380, 690 # 690
+ldsi s4382, 691 # 691
+ldsi s4384, 692 # 692
+ldsi s4386, 693 # 693
+ldsi s4388, 694 # 694
+ldsi s4390, 695 # 695
+ldsi s4392, 696 # 696
+ldsi s4394, 697 # 697
+ldsi s4396, 698 # 698
+ldsi s4398, 699 # 699
+ldsi s4400, 700 # 700
+ldsi s4402, 701 # 701
+ldsi s4404, 702 # 702
+ldsi s4406, 703 # 703
+ldsi s4408, 704 # 704
+ldsi s4410, 705 # 705
+ldsi s4412, 706 # 706
+ldsi s4414, 707 # 707
+ldsi s4416, 708 # 708
+ldsi s4418, 709 # 709
+ldsi s4420, 710 # 710
+ldsi s4422, 711 # 711
+ldsi s4424, 712 # 712
+ldsi s4426, 713 # 713
+ldsi s4428, 714 # 714
+ldsi s4430, 715 # 715
+ldsi s4432, 716 # 716
+ldsi s4434, 717 # 717
+ldsi s4436, 718 # 718
+ldsi s4438, 719 # 719
+ldsi s4440, 720 # 720
+ldsi s4442, 721 # 721
+ldsi s4444, 722 # 722
+ldsi s4446, 723 # 723
+ldsi s4448, 724 # 724
+ldsi s4450, 725 # 725
+ldsi s4452, 726 # 726
+ldsi s4454, 727 # 727
+ldsi s4456, 728 # 728
+ldsi s4458, 729 # 729
+ldsi s4460, 730 # 730
+ldsi s4462, 731 # 731
+ldsi s4464, 732 # 732
+ldsi s4466, 733 # 733
+ldsi s4468, 734 # 734
+ldsi s4470, 735 # 735
+ldsi s4472, 736 # 736
+ldsi s4474, 737 # 737
+ldsi s4476, 738 # 738
+ldsi s4478, 739 # 739
+ldsi s4480, 740 # 740
+ldsi s4482, 741 # 741
+ldsi s4484, 742 # 742
+ldsi s4486, 743 # 743
+ldsi s4488, 744 # 744
+ldsi s4490, 745 # 745
+ldsi s4492, 746 # 746
+ldsi s4494, 747 # 747
+ldsi s4496, 748 # 748
+ldsi s4498, 749 # 749
+ldsi s4500, 750 # 750
+ldsi s4502, 751 # 751
+ldsi s4504, 752 # 752
+ldsi s4506, 753 # 753
+ldsi s4508, 754 # 754
+ldsi s4510, 755 # 755
+ldsi s4512, 756 # 756
+ldsi s4514, 757 # 757
+ldsi s4516, 758 # 758
+ldsi s4518, 759 # 759
+ldsi s4520, 760 # 760
+ldsi s4522, 761 # 761
+ldsi s4524, 762 # 762
+ldsi s4526, 763 # 763
+ldsi s4528, 764 # 764
+ldsi s4530, 765 # 765
+ldsi s4532, 766 # 766
+ldsi s4534, 767 # 767
+ldsi s4536, 768 # 768
+ldsi s4538, 769 # 769
+ldsi s4540, 770 # 770
+ldsi s4542, 771 # 771
+ldsi s4544, 772 # 772
+ldsi s4546, 773 # 773
+ldsi s4548, 774 # 774
+ldsi s4550, 775 # 775
+ldsi s4552, 776 # 776
+ldsi s4554, 777 # 777
+ldsi s4556, 778 # 778
+ldsi s4558, 779 # 779
+ldsi s4560, 780 # 780
+ldsi s4562, 781 # 781
+ldsi s4564, 782 # 782
+ldsi s4566, 783 # 783
+ldsi s4568, 784 # 784
+ldsi s4570, 785 # 785
+ldsi s4572, 786 # 786
+ldsi s4574, 787 # 787
+ldsi s4576, 788 # 788
+ldsi s4578, 789 # 789
+ldsi s4580, 790 # 790
+ldsi s4582, 791 # 791
+ldsi s4584, 792 # 792
+ldsi s4586, 793 # 793
+ldsi s4588, 794 # 794
+ldsi s4590, 795 # 795
+ldsi s4592, 796 # 796
+ldsi s4594, 797 # 797
+ldsi s4596, 798 # 798
+ldsi s4598, 799 # 799
+ldsi s4600, 800 # 800
+ldsi s4602, 801 # 801
+ldsi s4604, 802 # 802
+ldsi s4606, 803 # 803
+ldsi s4608, 804 # 804
+ldsi s4610, 805 # 805
+ldsi s4612, 806 # 806
+ldsi s4614, 807 # 807
+ldsi s4616, 808 # 808
+ldsi s4618, 809 # 809
+ldsi s4620, 810 # 810
+ldsi s4622, 811 # 811
+ldsi s4624, 812 # 812
+ldsi s4626, 813 # 813
+ldsi s4628, 814 # 814
+ldsi s4630, 815 # 815
+ldsi s4632, 816 # 816
+ldsi s4634, 817 # 817
+ldsi s4636, 818 # 818
+ldsi s4638, 819 # 819
+ldsi s4640, 820 # 820
+ldsi s4642, 821 # 821
+ldsi s4644, 822 # 822
+ldsi s4646, 823 # 823
+ldsi s4648, 824 # 824
+ldsi s4650, 825 # 825
+ldsi s4652, 826 # 826
+ldsi s4654, 827 # 827
+ldsi s4656, 828 # 828
+ldsi s4658, 829 # 829
+ldsi s4660, 830 # 830
+ldsi s4662, 831 # 831
+ldsi s4664, 832 # 832
+ldsi s4666, 833 # 833
+ldsi s4668, 834 # 834
+ldsi s4670, 835 # 835
+ldsi s4672, 836 # 836
+ldsi s4674, 837 # 837
+ldsi s4676, 838 # 838
+ldsi s4678, 839 # 839
+ldsi s4680, 840 # 840
+ldsi s4682, 841 # 841
+ldsi s4684, 842 # 842
+ldsi s4686, 843 # 843
+ldsi s4688, 844 # 844
+ldsi s4690, 845 # 845
+ldsi s4692, 846 # 846
+ldsi s4694, 847 # 847
+ldsi s4696, 848 # 848
+ldsi s4698, 849 # 849
+ldsi s4700, 850 # 850
+ldsi s4702, 851 # 851
+ldsi s4704, 852 # 852
+ldsi s4706, 853 # 853
+ldsi s4708, 854 # 854
+ldsi s4710, 855 # 855
+ldsi s4712, 856 # 856
+ldsi s4714, 857 # 857
+ldsi s4716, 858 # 858
+ldsi s4718, 859 # 859
+ldsi s4720, 860 # 860
+ldsi s4722, 861 # 861
+ldsi s4724, 862 # 862
+ldsi s4726, 863 # 863
+ldsi s4728, 864 # 864
+ldsi s4730, 865 # 865
+ldsi s4732, 866 # 866
+ldsi s4734, 867 # 867
+ldsi s4736, 868 # 868
+ldsi s4738, 869 # 869
+ldsi s4740, 870 # 870
+ldsi s4742, 871 # 871
+ldsi s4744, 872 # 872
+ldsi s4746, 873 # 873
+ldsi s4748, 874 # 874
+ldsi s4750, 875 # 875
+ldsi s4752, 876 # 876
+ldsi s4754, 877 # 877
+ldsi s4756, 878 # 878
+ldsi s4758, 879 # 879
+ldsi s4760, 880 # 880
+ldsi s4762, 881 # 881
+ldsi s4764, 882 # 882
+ldsi s4766, 883 # 883
+ldsi s4768, 884 # 884
+ldsi s4770, 885 # 885
+ldsi s4772, 886 # 886
+ldsi s4774, 887 # 887
+ldsi s4776, 888 # 888
+ldsi s4778, 889 # 889
+ldsi s4780, 890 # 890
+ldsi s4782, 891 # 891
+ldsi s4784, 892 # 892
+ldsi s4786, 893 # 893
+ldsi s4788, 894 # 894
+ldsi s4790, 895 # 895
+ldsi s4792, 896 # 896
+ldsi s4794, 897 # 897
+ldsi s4796, 898 # 898
+ldsi s4798, 899 # 899
+ldsi s4800, 900 # 900
+ldsi s4802, 901 # 901
+ldsi s4804, 902 # 902
+ldsi s4806, 903 # 903
+ldsi s4808, 904 # 904
+ldsi s4810, 905 # 905
+ldsi s4812, 906 # 906
+ldsi s4814, 907 # 907
+ldsi s4816, 908 # 908
+ldsi s4818, 909 # 909
+ldsi s4820, 910 # 910
+ldsi s4822, 911 # 911
+ldsi s4824, 912 # 912
+ldsi s4826, 913 # 913
+ldsi s4828, 914 # 914
+ldsi s4830, 915 # 915
+ldsi s4832, 916 # 916
+ldsi s4834, 917 # 917
+ldsi s4836, 918 # 918
+ldsi s4838, 919 # 919
+ldsi s4840, 920 # 920
+ldsi s4842, 921 # 921
+ldsi s4844, 922 # 922
+ldsi s4846, 923 # 923
+ldsi s4848, 924 # 924
+ldsi s4850, 925 # 925
+ldsi s4852, 926 # 926
+ldsi s4854, 927 # 927
+ldsi s4856, 928 # 928
+ldsi s4858, 929 # 929
+ldsi s4860, 930 # 930
+ldsi s4862, 931 # 931
+ldsi s4864, 932 # 932
+ldsi s4866, 933 # 933
+ldsi s4868, 934 # 934
+ldsi s4870, 935 # 935
+ldsi s4872, 936 # 936
+ldsi s4874, 937 # 937
+ldsi s4876, 938 # 938
+ldsi s4878, 939 # 939
+ldsi s4880, 940 # 940
+ldsi s4882, 941 # 941
+ldsi s4884, 942 # 942
+ldsi s4886, 943 # 943
+ldsi s4888, 944 # 944
+ldsi s4890, 945 # 945
+ldsi s4892, 946 # 946
+ldsi s4894, 947 # 947
+ldsi s4896, 948 # 948
+ldsi s4898, 949 # 949
+ldsi s4900, 950 # 950
+ldsi s4902, 951 # 951
+ldsi s4904, 952 # 952
+ldsi s4906, 953 # 953
+ldsi s4908, 954 # 954
+ldsi s4910, 955 # 955
+ldsi s4912, 956 # 956
+ldsi s4914, 957 # 957
+ldsi s4916, 958 # 958
+ldsi s4918, 959 # 959
+ldsi s4920, 960 # 960
+ldsi s4922, 961 # 961
+ldsi s4924, 962 # 962
+ldsi s4926, 963 # 963
+ldsi s4928, 964 # 964
+ldsi s4930, 965 # 965
+ldsi s4932, 966 # 966
+ldsi s4934, 967 # 967
+ldsi s4936, 968 # 968
+ldsi s4938, 969 # 969
+ldsi s4940, 970 # 970
+ldsi s4942, 971 # 971
+ldsi s4944, 972 # 972
+ldsi s4946, 973 # 973
+ldsi s4948, 974 # 974
+ldsi s4950, 975 # 975
+ldsi s4952, 976 # 976
+ldsi s4954, 977 # 977
+ldsi s4956, 978 # 978
+ldsi s4958, 979 # 979
+ldsi s4960, 980 # 980
+ldsi s4962, 981 # 981
+ldsi s4964, 982 # 982
+ldsi s4966, 983 # 983
+ldsi s4968, 984 # 984
+ldsi s4970, 985 # 985
+ldsi s4972, 986 # 986
+ldsi s4974, 987 # 987
+ldsi s4976, 988 # 988
+ldsi s4978, 989 # 989
+ldsi s4980, 990 # 990
+ldsi s4982, 991 # 991
+ldsi s4984, 992 # 992
+ldsi s4986, 993 # 993
+ldsi s4988, 994 # 994
+ldsi s4990, 995 # 995
+ldsi s4992, 996 # 996
+ldsi s4994, 997 # 997
+ldsi s4996, 998 # 998
+ldsi s4998, 999 # 999
+ldsi s5000, 1000 # 1000
+ldsi s5002, 1001 # 1001
+ldsi s5004, 1002 # 1002
+ldsi s5006, 1003 # 1003
+ldsi s5008, 1004 # 1004
+ldsi s5010, 1005 # 1005
+ldsi s5012, 1006 # 1006
+ldsi s5014, 1007 # 1007
+ldsi s5016, 1008 # 1008
+ldsi s5018, 1009 # 1009
+ldsi s5020, 1010 # 1010
+ldsi s5022, 1011 # 1011
+ldsi s5024, 1012 # 1012
+ldsi s5026, 1013 # 1013
+ldsi s5028, 1014 # 1014
+ldsi s5030, 1015 # 1015
+ldsi s5032, 1016 # 1016
+ldsi s5034, 1017 # 1017
+ldsi s5036, 1018 # 1018
+ldsi s5038, 1019 # 1019
+ldsi s5040, 1020 # 1020
+ldsi s5042, 1021 # 1021
+ldsi s5044, 1022 # 1022
+ldsi s5046, 1023 # 1023
+ldsi s5048, 1024 # 1024
+ldsi s5050, 1025 # 1025
+ldsi s5052, 1026 # 1026
+ldsi s5054, 1027 # 1027
+ldsi s5056, 1028 # 1028
+ldsi s5058, 1029 # 1029
+ldsi s5060, 1030 # 1030
+ldsi s5062, 1031 # 1031
+ldsi s5064, 1032 # 1032
+ldsi s5066, 1033 # 1033
+ldsi s5068, 1034 # 1034
+ldsi s5070, 1035 # 1035
+ldsi s5072, 1036 # 1036
+ldsi s5074, 1037 # 1037
+ldsi s5076, 1038 # 1038
+ldsi s5078, 1039 # 1039
+ldsi s5080, 1040 # 1040
+ldsi s5082, 1041 # 1041
+ldsi s5084, 1042 # 1042
+ldsi s5086, 1043 # 1043
+ldsi s5088, 1044 # 1044
+ldsi s5090, 1045 # 1045
+ldsi s5092, 1046 # 1046
+ldsi s5094, 1047 # 1047
+ldsi s5096, 1048 # 1048
+ldsi s5098, 1049 # 1049
+ldsi s5100, 1050 # 1050
+ldsi s5102, 1051 # 1051
+ldsi s5104, 1052 # 1052
+ldsi s5106, 1053 # 1053
+ldsi s5108, 1054 # 1054
+ldsi s5110, 1055 # 1055
+ldsi s5112, 1056 # 1056
+ldsi s5114, 1057 # 1057
+ldsi s5116, 1058 # 1058
+ldsi s5118, 1059 # 1059
+ldsi s5120, 1060 # 1060
+ldsi s5122, 1061 # 1061
+ldsi s5124, 1062 # 1062
+ldsi s5126, 1063 # 1063
+ldsi s5128, 1064 # 1064
+ldsi s5130, 1065 # 1065
+ldsi s5132, 1066 # 1066
+ldsi s5134, 1067 # 1067
+ldsi s5136, 1068 # 1068
+ldsi s5138, 1069 # 1069
+ldsi s5140, 1070 # 1070
+ldsi s5142, 1071 # 1071
+ldsi s5144, 1072 # 1072
+ldsi s5146, 1073 # 1073
+ldsi s5148, 1074 # 1074
+ldsi s5150, 1075 # 1075
+ldsi s5152, 1076 # 1076
+ldsi s5154, 1077 # 1077
+ldsi s5156, 1078 # 1078
+ldsi s5158, 1079 # 1079
+ldsi s5160, 1080 # 1080
+ldsi s5162, 1081 # 1081
+ldsi s5164, 1082 # 1082
+ldsi s5166, 1083 # 1083
+ldsi s5168, 1084 # 1084
+ldsi s5170, 1085 # 1085
+ldsi s5172, 1086 # 1086
+ldsi s5174, 1087 # 1087
+ldsi s5176, 1088 # 1088
+ldsi s5178, 1089 # 1089
+ldsi s5180, 1090 # 1090
+ldsi s5182, 1091 # 1091
+ldsi s5184, 1092 # 1092
+ldsi s5186, 1093 # 1093
+ldsi s5188, 1094 # 1094
+ldsi s5190, 1095 # 1095
+ldsi s5192, 1096 # 1096
+ldsi s5194, 1097 # 1097
+ldsi s5196, 1098 # 1098
+ldsi s5198, 1099 # 1099
+ldsi s5200, 1100 # 1100
+ldsi s5202, 1101 # 1101
+ldsi s5204, 1102 # 1102
+ldsi s5206, 1103 # 1103
+ldsi s5208, 1104 # 1104
+ldsi s5210, 1105 # 1105
+ldsi s5212, 1106 # 1106
+ldsi s5214, 1107 # 1107
+ldsi s5216, 1108 # 1108
+ldsi s5218, 1109 # 1109
+ldsi s5220, 1110 # 1110
+ldsi s5222, 1111 # 1111
+ldsi s5224, 1112 # 1112
+ldsi s5226, 1113 # 1113
+ldsi s5228, 1114 # 1114
+ldsi s5230, 1115 # 1115
+ldsi s5232, 1116 # 1116
+ldsi s5234, 1117 # 1117
+ldsi s5236, 1118 # 1118
+ldsi s5238, 1119 # 1119
+ldsi s5240, 1120 # 1120
+ldsi s5242, 1121 # 1121
+ldsi s5244, 1122 # 1122
+ldsi s5246, 1123 # 1123
+ldsi s5248, 1124 # 1124
+ldsi s5250, 1125 # 1125
+ldsi s5252, 1126 # 1126
+ldsi s5254, 1127 # 1127
+ldsi s5256, 1128 # 1128
+ldsi s5258, 1129 # 1129
+ldsi s5260, 1130 # 1130
+ldsi s5262, 1131 # 1131
+ldsi s5264, 1132 # 1132
+ldsi s5266, 1133 # 1133
+ldsi s5268, 1134 # 1134
+ldsi s5270, 1135 # 1135
+ldsi s5272, 1136 # 1136
+ldsi s5274, 1137 # 1137
+ldsi s5276, 1138 # 1138
+ldsi s5278, 1139 # 1139
+ldsi s5280, 1140 # 1140
+ldsi s5282, 1141 # 1141
+ldsi s5284, 1142 # 1142
+ldsi s5286, 1143 # 1143
+ldsi s5288, 1144 # 1144
+ldsi s5290, 1145 # 1145
+ldsi s5292, 1146 # 1146
+ldsi s5294, 1147 # 1147
+ldsi s5296, 1148 # 1148
+ldsi s5298, 1149 # 1149
+ldsi s5300, 1150 # 1150
+ldsi s5302, 1151 # 1151
+ldsi s5304, 1152 # 1152
+ldsi s5306, 1153 # 1153
+ldsi s5308, 1154 # 1154
+ldsi s5310, 1155 # 1155
+ldsi s5312, 1156 # 1156
+ldsi s5314, 1157 # 1157
+ldsi s5316, 1158 # 1158
+ldsi s5318, 1159 # 1159
+ldsi s5320, 1160 # 1160
+ldsi s5322, 1161 # 1161
+ldsi s5324, 1162 # 1162
+ldsi s5326, 1163 # 1163
+ldsi s5328, 1164 # 1164
+ldsi s5330, 1165 # 1165
+ldsi s5332, 1166 # 1166
+ldsi s5334, 1167 # 1167
+ldsi s5336, 1168 # 1168
+ldsi s5338, 1169 # 1169
+ldsi s5340, 1170 # 1170
+ldsi s5342, 1171 # 1171
+ldsi s5344, 1172 # 1172
+ldsi s5346, 1173 # 1173
+ldsi s5348, 1174 # 1174
+ldsi s5350, 1175 # 1175
+ldsi s5352, 1176 # 1176
+ldsi s5354, 1177 # 1177
+ldsi s5356, 1178 # 1178
+ldsi s5358, 1179 # 1179
+ldsi s5360, 1180 # 1180
+ldsi s5362, 1181 # 1181
+ldsi s5364, 1182 # 1182
+ldsi s5366, 1183 # 1183
+ldsi s5368, 1184 # 1184
+ldsi s5370, 1185 # 1185
+ldsi s5372, 1186 # 1186
+ldsi s5374, 1187 # 1187
+ldsi s5376, 1188 # 1188
+ldsi s5378, 1189 # 1189
+ldsi s5380, 1190 # 1190
+ldsi s5382, 1191 # 1191
+ldsi s5384, 1192 # 1192
+ldsi s5386, 1193 # 1193
+ldsi s5388, 1194 # 1194
+ldsi s5390, 1195 # 1195
+ldsi s5392, 1196 # 1196
+ldsi s5394, 1197 # 1197
+ldsi s5396, 1198 # 1198
+ldsi s5398, 1199 # 1199
+ldsi s5400, 1200 # 1200
+ldsi s5402, 1201 # 1201
+ldsi s5404, 1202 # 1202
+ldsi s5406, 1203 # 1203
+ldsi s5408, 1204 # 1204
+ldsi s5410, 1205 # 1205
+ldsi s5412, 1206 # 1206
+ldsi s5414, 1207 # 1207
+ldsi s5416, 1208 # 1208
+ldsi s5418, 1209 # 1209
+ldsi s5420, 1210 # 1210
+ldsi s5422, 1211 # 1211
+ldsi s5424, 1212 # 1212
+ldsi s5426, 1213 # 1213
+ldsi s5428, 1214 # 1214
+ldsi s5430, 1215 # 1215
+ldsi s5432, 1216 # 1216
+ldsi s5434, 1217 # 1217
+ldsi s5436, 1218 # 1218
+ldsi s5438, 1219 # 1219
+ldsi s5440, 1220 # 1220
+ldsi s5442, 1221 # 1221
+ldsi s5444, 1222 # 1222
+ldsi s5446, 1223 # 1223
+ldsi s5448, 1224 # 1224
+ldsi s5450, 1225 # 1225
+ldsi s5452, 1226 # 1226
+ldsi s5454, 1227 # 1227
+ldsi s5456, 1228 # 1228
+ldsi s5458, 1229 # 1229
+ldsi s5460, 1230 # 1230
+ldsi s5462, 1231 # 1231
+ldsi s5464, 1232 # 1232
+ldsi s5466, 1233 # 1233
+ldsi s5468, 1234 # 1234
+ldsi s5470, 1235 # 1235
+ldsi s5472, 1236 # 1236
+ldsi s5474, 1237 # 1237
+ldsi s5476, 1238 # 1238
+ldsi s5478, 1239 # 1239
+ldsi s5480, 1240 # 1240
+ldsi s5482, 1241 # 1241
+ldsi s5484, 1242 # 1242
+ldsi s5486, 1243 # 1243
+ldsi s5488, 1244 # 1244
+ldsi s5490, 1245 # 1245
+ldsi s5492, 1246 # 1246
+ldsi s5494, 1247 # 1247
+ldsi s5496, 1248 # 1248
+ldsi s5498, 1249 # 1249
+ldsi s5500, 1250 # 1250
+ldsi s5502, 1251 # 1251
+ldsi s5504, 1252 # 1252
+ldsi s5506, 1253 # 1253
+ldsi s5508, 1254 # 1254
+ldsi s5510, 1255 # 1255
+ldsi s5512, 1256 # 1256
+ldsi s5514, 1257 # 1257
+ldsi s5516, 1258 # 1258
+ldsi s5518, 1259 # 1259
+ldsi s5520, 1260 # 1260
+ldsi s5522, 1261 # 1261
+ldsi s5524, 1262 # 1262
+ldsi s5526, 1263 # 1263
+ldsi s5528, 1264 # 1264
+ldsi s5530, 1265 # 1265
+ldsi s5532, 1266 # 1266
+ldsi s5534, 1267 # 1267
+ldsi s5536, 1268 # 1268
+ldsi s5538, 1269 # 1269
+ldsi s5540, 1270 # 1270
+ldsi s5542, 1271 # 1271
+ldsi s5544, 1272 # 1272
+ldsi s5546, 1273 # 1273
+ldsi s5548, 1274 # 1274
+ldsi s5550, 1275 # 1275
+ldsi s5552, 1276 # 1276
+ldsi s5554, 1277 # 1277
+ldsi s5556, 1278 # 1278
+ldsi s5558, 1279 # 1279
+ldsi s5560, 1280 # 1280
+ldsi s5562, 1281 # 1281
+ldsi s5564, 1282 # 1282
+ldsi s5566, 1283 # 1283
+ldsi s5568, 1284 # 1284
+ldsi s5570, 1285 # 1285
+ldsi s5572, 1286 # 1286
+ldsi s5574, 1287 # 1287
+ldsi s5576, 1288 # 1288
+ldsi s5578, 1289 # 1289
+ldsi s5580, 1290 # 1290
+ldsi s5582, 1291 # 1291
+ldsi s5584, 1292 # 1292
+ldsi s5586, 1293 # 1293
+ldsi s5588, 1294 # 1294
+ldsi s5590, 1295 # 1295
+ldsi s5592, 1296 # 1296
+ldsi s5594, 1297 # 1297
+ldsi s5596, 1298 # 1298
+ldsi s5598, 1299 # 1299
+ldsi s5600, 1300 # 1300
+ldsi s5602, 1301 # 1301
+ldsi s5604, 1302 # 1302
+ldsi s5606, 1303 # 1303
+ldsi s5608, 1304 # 1304
+ldsi s5610, 1305 # 1305
+ldsi s5612, 1306 # 1306
+ldsi s5614, 1307 # 1307
+ldsi s5616, 1308 # 1308
+ldsi s5618, 1309 # 1309
+ldsi s5620, 1310 # 1310
+ldsi s5622, 1311 # 1311
+ldsi s5624, 1312 # 1312
+ldsi s5626, 1313 # 1313
+ldsi s5628, 1314 # 1314
+ldsi s5630, 1315 # 1315
+ldsi s5632, 1316 # 1316
+ldsi s5634, 1317 # 1317
+ldsi s5636, 1318 # 1318
+ldsi s5638, 1319 # 1319
+ldsi s5640, 1320 # 1320
+ldsi s5642, 1321 # 1321
+ldsi s5644, 1322 # 1322
+ldsi s5646, 1323 # 1323
+ldsi s5648, 1324 # 1324
+ldsi s5650, 1325 # 1325
+ldsi s5652, 1326 # 1326
+ldsi s5654, 1327 # 1327
+ldsi s5656, 1328 # 1328
+ldsi s5658, 1329 # 1329
+ldsi s5660, 1330 # 1330
+ldsi s5662, 1331 # 1331
+ldsi s5664, 1332 # 1332
+ldsi s5666, 1333 # 1333
+ldsi s5668, 1334 # 1334
+ldsi s5670, 1335 # 1335
+ldsi s5672, 1336 # 1336
+ldsi s5674, 1337 # 1337
+ldsi s5676, 1338 # 1338
+ldsi s5678, 1339 # 1339
+ldsi s5680, 1340 # 1340
+ldsi s5682, 1341 # 1341
+ldsi s5684, 1342 # 1342
+ldsi s5686, 1343 # 1343
+ldsi s5688, 1344 # 1344
+ldsi s5690, 1345 # 1345
+ldsi s5692, 1346 # 1346
+ldsi s5694, 1347 # 1347
+ldsi s5696, 1348 # 1348
+ldsi s5698, 1349 # 1349
+ldsi s5700, 1350 # 1350
+ldsi s5702, 1351 # 1351
+ldsi s5704, 1352 # 1352
+ldsi s5706, 1353 # 1353
+ldsi s5708, 1354 # 1354
+ldsi s5710, 1355 # 1355
+ldsi s5712, 1356 # 1356
+ldsi s5714, 1357 # 1357
+ldsi s5716, 1358 # 1358
+ldsi s5718, 1359 # 1359
+ldsi s5720, 1360 # 1360
+ldsi s5722, 1361 # 1361
+ldsi s5724, 1362 # 1362
+ldsi s5726, 1363 # 1363
+ldsi s5728, 1364 # 1364
+ldsi s5730, 1365 # 1365
+ldsi s5732, 1366 # 1366
+ldsi s5734, 1367 # 1367
+ldsi s5736, 1368 # 1368
+ldsi s5738, 1369 # 1369
+ldsi s5740, 1370 # 1370
+ldsi s5742, 1371 # 1371
+ldsi s5744, 1372 # 1372
+ldsi s5746, 1373 # 1373
+ldsi s5748, 1374 # 1374
+ldsi s5750, 1375 # 1375
+ldsi s5752, 1376 # 1376
+ldsi s5754, 1377 # 1377
+ldsi s5756, 1378 # 1378
+ldsi s5758, 1379 # 1379
+ldsi s5760, 1380 # 1380
+ldsi s5762, 1381 # 1381
+ldsi s5764, 1382 # 1382
+ldsi s5766, 1383 # 1383
+ldsi s5768, 1384 # 1384
+ldsi s5770, 1385 # 1385
+ldsi s5772, 1386 # 1386
+ldsi s5774, 1387 # 1387
+ldsi s5776, 1388 # 1388
+ldsi s5778, 1389 # 1389
+ldsi s5780, 1390 # 1390
+ldsi s5782, 1391 # 1391
+ldsi s5784, 1392 # 1392
+ldsi s5786, 1393 # 1393
+ldsi s5788, 1394 # 1394
+ldsi s5790, 1395 # 1395
+ldsi s5792, 1396 # 1396
+ldsi s5794, 1397 # 1397
+ldsi s5796, 1398 # 1398
+ldsi s5798, 1399 # 1399
+ldsi s5800, 1400 # 1400
+ldsi s5802, 1401 # 1401
+ldsi s5804, 1402 # 1402
+ldsi s5806, 1403 # 1403
+ldsi s5808, 1404 # 1404
+ldsi s5810, 1405 # 1405
+ldsi s5812, 1406 # 1406
+ldsi s5814, 1407 # 1407
+ldsi s5816, 1408 # 1408
+ldsi s5818, 1409 # 1409
+ldsi s5820, 1410 # 1410
+ldsi s5822, 1411 # 1411
+ldsi s5824, 1412 # 1412
+ldsi s5826, 1413 # 1413
+ldsi s5828, 1414 # 1414
+ldsi s5830, 1415 # 1415
+ldsi s5832, 1416 # 1416
+ldsi s5834, 1417 # 1417
+ldsi s5836, 1418 # 1418
+ldsi s5838, 1419 # 1419
+ldsi s5840, 1420 # 1420
+ldsi s5842, 1421 # 1421
+ldsi s5844, 1422 # 1422
+ldsi s5846, 1423 # 1423
+ldsi s5848, 1424 # 1424
+ldsi s5850, 1425 # 1425
+ldsi s5852, 1426 # 1426
+ldsi s5854, 1427 # 1427
+ldsi s5856, 1428 # 1428
+ldsi s5858, 1429 # 1429
+ldsi s5860, 1430 # 1430
+ldsi s5862, 1431 # 1431
+ldsi s5864, 1432 # 1432
+ldsi s5866, 1433 # 1433
+ldsi s5868, 1434 # 1434
+ldsi s5870, 1435 # 1435
+ldsi s5872, 1436 # 1436
+ldsi s5874, 1437 # 1437
+ldsi s5876, 1438 # 1438
+ldsi s5878, 1439 # 1439
+ldsi s5880, 1440 # 1440
+ldsi s5882, 1441 # 1441
+ldsi s5884, 1442 # 1442
+ldsi s5886, 1443 # 1443
+ldsi s5888, 1444 # 1444
+ldsi s5890, 1445 # 1445
+ldsi s5892, 1446 # 1446
+ldsi s5894, 1447 # 1447
+ldsi s5896, 1448 # 1448
+ldsi s5898, 1449 # 1449
+ldsi s5900, 1450 # 1450
+ldsi s5902, 1451 # 1451
+ldsi s5904, 1452 # 1452
+ldsi s5906, 1453 # 1453
+ldsi s5908, 1454 # 1454
+ldsi s5910, 1455 # 1455
+ldsi s5912, 1456 # 1456
+ldsi s5914, 1457 # 1457
+ldsi s5916, 1458 # 1458
+ldsi s5918, 1459 # 1459
+ldsi s5920, 1460 # 1460
+ldsi s5922, 1461 # 1461
+ldsi s5924, 1462 # 1462
+ldsi s5926, 1463 # 1463
+ldsi s5928, 1464 # 1464
+ldsi s5930, 1465 # 1465
+ldsi s5932, 1466 # 1466
+ldsi s5934, 1467 # 1467
+ldsi s5936, 1468 # 1468
+ldsi s5938, 1469 # 1469
+ldsi s5940, 1470 # 1470
+ldsi s5942, 1471 # 1471
+ldsi s5944, 1472 # 1472
+ldsi s5946, 1473 # 1473
+ldsi s5948, 1474 # 1474
+ldsi s5950, 1475 # 1475
+ldsi s5952, 1476 # 1476
+ldsi s5954, 1477 # 1477
+ldsi s5956, 1478 # 1478
+ldsi s5958, 1479 # 1479
+ldsi s5960, 1480 # 1480
+ldsi s5962, 1481 # 1481
+ldsi s5964, 1482 # 1482
+ldsi s5966, 1483 # 1483
+ldsi s5968, 1484 # 1484
+ldsi s5970, 1485 # 1485
+ldsi s5972, 1486 # 1486
+ldsi s5974, 1487 # 1487
+ldsi s5976, 1488 # 1488
+ldsi s5978, 1489 # 1489
+ldsi s5980, 1490 # 1490
+ldsi s5982, 1491 # 1491
+ldsi s5984, 1492 # 1492
+ldsi s5986, 1493 # 1493
+ldsi s5988, 1494 # 1494
+ldsi s5990, 1495 # 1495
+ldsi s5992, 1496 # 1496
+ldsi s5994, 1497 # 1497
+ldsi s5996, 1498 # 1498
+ldsi s5998, 1499 # 1499
+ldsi s6000, 1500 # 1500
+ldsi s6002, 1501 # 1501
+ldsi s6004, 1502 # 1502
+ldsi s6006, 1503 # 1503
+ldsi s6008, 1504 # 1504
+ldsi s6010, 1505 # 1505
+ldsi s6012, 1506 # 1506
+ldsi s6014, 1507 # 1507
+ldsi s6016, 1508 # 1508
+ldsi s6018, 1509 # 1509
+ldsi s6020, 1510 # 1510
+ldsi s6022, 1511 # 1511
+ldsi s6024, 1512 # 1512
+ldsi s6026, 1513 # 1513
+ldsi s6028, 1514 # 1514
+ldsi s6030, 1515 # 1515
+ldsi s6032, 1516 # 1516
+ldsi s6034, 1517 # 1517
+ldsi s6036, 1518 # 1518
+ldsi s6038, 1519 # 1519
+ldsi s6040, 1520 # 1520
+ldsi s6042, 1521 # 1521
+ldsi s6044, 1522 # 1522
+ldsi s6046, 1523 # 1523
+ldsi s6048, 1524 # 1524
+ldsi s6050, 1525 # 1525
+ldsi s6052, 1526 # 1526
+ldsi s6054, 1527 # 1527
+ldsi s6056, 1528 # 1528
+ldsi s6058, 1529 # 1529
+ldsi s6060, 1530 # 1530
+ldsi s6062, 1531 # 1531
+ldsi s6064, 1532 # 1532
+ldsi s6066, 1533 # 1533
+ldsi s6068, 1534 # 1534
+ldsi s6070, 1535 # 1535
+ldsi s6072, 1536 # 1536
+ldsi s6074, 1537 # 1537
+ldsi s6076, 1538 # 1538
+ldsi s6078, 1539 # 1539
+ldsi s6080, 1540 # 1540
+ldsi s6082, 1541 # 1541
+ldsi s6084, 1542 # 1542
+ldsi s6086, 1543 # 1543
+ldsi s6088, 1544 # 1544
+ldsi s6090, 1545 # 1545
+ldsi s6092, 1546 # 1546
+ldsi s6094, 1547 # 1547
+ldsi s6096, 1548 # 1548
+ldsi s6098, 1549 # 1549
+ldsi s6100, 1550 # 1550
+ldsi s6102, 1551 # 1551
+ldsi s6104, 1552 # 1552
+ldsi s6106, 1553 # 1553
+ldsi s6108, 1554 # 1554
+ldsi s6110, 1555 # 1555
+ldsi s6112, 1556 # 1556
+ldsi s6114, 1557 # 1557
+ldsi s6116, 1558 # 1558
+ldsi s6118, 1559 # 1559
+ldsi s6120, 1560 # 1560
+ldsi s6122, 1561 # 1561
+ldsi s6124, 1562 # 1562
+ldsi s6126, 1563 # 1563
+ldsi s6128, 1564 # 1564
+ldsi s6130, 1565 # 1565
+ldsi s6132, 1566 # 1566
+ldsi s6134, 1567 # 1567
+ldsi s6136, 1568 # 1568
+ldsi s6138, 1569 # 1569
+ldsi s6140, 1570 # 1570
+ldsi s6142, 1571 # 1571
+ldsi s6144, 1572 # 1572
+ldsi s6146, 1573 # 1573
+ldsi s6148, 1574 # 1574
+ldsi s6150, 1575 # 1575
+ldsi s6152, 1576 # 1576
+ldsi s6154, 1577 # 1577
+ldsi s6156, 1578 # 1578
+ldsi s6158, 1579 # 1579
+ldsi s6160, 1580 # 1580
+ldsi s6162, 1581 # 1581
+ldsi s6164, 1582 # 1582
+ldsi s6166, 1583 # 1583
+ldsi s6168, 1584 # 1584
+ldsi s6170, 1585 # 1585
+ldsi s6172, 1586 # 1586
+ldsi s6174, 1587 # 1587
+ldsi s6176, 1588 # 1588
+ldsi s6178, 1589 # 1589
+ldsi s6180, 1590 # 1590
+ldsi s6182, 1591 # 1591
+ldsi s6184, 1592 # 1592
+ldsi s6186, 1593 # 1593
+ldsi s6188, 1594 # 1594
+ldsi s6190, 1595 # 1595
+ldsi s6192, 1596 # 1596
+ldsi s6194, 1597 # 1597
+ldsi s6196, 1598 # 1598
+ldsi s6198, 1599 # 1599
+ldsi s6200, 1600 # 1600
+ldsi s6202, 1601 # 1601
+ldsi s6204, 1602 # 1602
+ldsi s6206, 1603 # 1603
+ldsi s6208, 1604 # 1604
+ldsi s6210, 1605 # 1605
+ldsi s6212, 1606 # 1606
+ldsi s6214, 1607 # 1607
+ldsi s6216, 1608 # 1608
+ldsi s6218, 1609 # 1609
+ldsi s6220, 1610 # 1610
+ldsi s6222, 1611 # 1611
+ldsi s6224, 1612 # 1612
+ldsi s6226, 1613 # 1613
+ldsi s6228, 1614 # 1614
+ldsi s6230, 1615 # 1615
+ldsi s6232, 1616 # 1616
+ldsi s6234, 1617 # 1617
+ldsi s6236, 1618 # 1618
+ldsi s6238, 1619 # 1619
+ldsi s6240, 1620 # 1620
+ldsi s6242, 1621 # 1621
+ldsi s6244, 1622 # 1622
+ldsi s6246, 1623 # 1623
+ldsi s6248, 1624 # 1624
+ldsi s6250, 1625 # 1625
+ldsi s6252, 1626 # 1626
+ldsi s6254, 1627 # 1627
+ldsi s6256, 1628 # 1628
+ldsi s6258, 1629 # 1629
+ldsi s6260, 1630 # 1630
+ldsi s6262, 1631 # 1631
+ldsi s6264, 1632 # 1632
+ldsi s6266, 1633 # 1633
+ldsi s6268, 1634 # 1634
+ldsi s6270, 1635 # 1635
+ldsi s6272, 1636 # 1636
+ldsi s6274, 1637 # 1637
+ldsi s6276, 1638 # 1638
+ldsi s6278, 1639 # 1639
+ldsi s6280, 1640 # 1640
+ldsi s6282, 1641 # 1641
+ldsi s6284, 1642 # 1642
+ldsi s6286, 1643 # 1643
+ldsi s6288, 1644 # 1644
+ldsi s6290, 1645 # 1645
+ldsi s6292, 1646 # 1646
+ldsi s6294, 1647 # 1647
+ldsi s6296, 1648 # 1648
+ldsi s6298, 1649 # 1649
+ldsi s6300, 1650 # 1650
+ldsi s6302, 1651 # 1651
+ldsi s6304, 1652 # 1652
+ldsi s6306, 1653 # 1653
+ldsi s6308, 1654 # 1654
+ldsi s6310, 1655 # 1655
+ldsi s6312, 1656 # 1656
+ldsi s6314, 1657 # 1657
+ldsi s6316, 1658 # 1658
+ldsi s6318, 1659 # 1659
+ldsi s6320, 1660 # 1660
+ldsi s6322, 1661 # 1661
+ldsi s6324, 1662 # 1662
+ldsi s6326, 1663 # 1663
+ldsi s6328, 1664 # 1664
+ldsi s6330, 1665 # 1665
+ldsi s6332, 1666 # 1666
+ldsi s6334, 1667 # 1667
+ldsi s6336, 1668 # 1668
+ldsi s6338, 1669 # 1669
+ldsi s6340, 1670 # 1670
+ldsi s6342, 1671 # 1671
+ldsi s6344, 1672 # 1672
+ldsi s6346, 1673 # 1673
+ldsi s6348, 1674 # 1674
+ldsi s6350, 1675 # 1675
+ldsi s6352, 1676 # 1676
+ldsi s6354, 1677 # 1677
+ldsi s6356, 1678 # 1678
+ldsi s6358, 1679 # 1679
+ldsi s6360, 1680 # 1680
+ldsi s6362, 1681 # 1681
+ldsi s6364, 1682 # 1682
+ldsi s6366, 1683 # 1683
+ldsi s6368, 1684 # 1684
+ldsi s6370, 1685 # 1685
+ldsi s6372, 1686 # 1686
+ldsi s6374, 1687 # 1687
+ldsi s6376, 1688 # 1688
+ldsi s6378, 1689 # 1689
+ldsi s6380, 1690 # 1690
+ldsi s6382, 1691 # 1691
+ldsi s6384, 1692 # 1692
+ldsi s6386, 1693 # 1693
+ldsi s6388, 1694 # 1694
+ldsi s6390, 1695 # 1695
+ldsi s6392, 1696 # 1696
+ldsi s6394, 1697 # 1697
+ldsi s6396, 1698 # 1698
+ldsi s6398, 1699 # 1699
+ldsi s6400, 1700 # 1700
+ldsi s6402, 1701 # 1701
+ldsi s6404, 1702 # 1702
+ldsi s6406, 1703 # 1703
+ldsi s6408, 1704 # 1704
+ldsi s6410, 1705 # 1705
+ldsi s6412, 1706 # 1706
+ldsi s6414, 1707 # 1707
+ldsi s6416, 1708 # 1708
+ldsi s6418, 1709 # 1709
+ldsi s6420, 1710 # 1710
+ldsi s6422, 1711 # 1711
+ldsi s6424, 1712 # 1712
+ldsi s6426, 1713 # 1713
+ldsi s6428, 1714 # 1714
+ldsi s6430, 1715 # 1715
+ldsi s6432, 1716 # 1716
+ldsi s6434, 1717 # 1717
+ldsi s6436, 1718 # 1718
+ldsi s6438, 1719 # 1719
+ldsi s6440, 1720 # 1720
+ldsi s6442, 1721 # 1721
+ldsi s6444, 1722 # 1722
+ldsi s6446, 1723 # 1723
+ldsi s6448, 1724 # 1724
+ldsi s6450, 1725 # 1725
+ldsi s6452, 1726 # 1726
+ldsi s6454, 1727 # 1727
+ldsi s6456, 1728 # 1728
+ldsi s6458, 1729 # 1729
+ldsi s6460, 1730 # 1730
+ldsi s6462, 1731 # 1731
+ldsi s6464, 1732 # 1732
+ldsi s6466, 1733 # 1733
+ldsi s6468, 1734 # 1734
+ldsi s6470, 1735 # 1735
+ldsi s6472, 1736 # 1736
+ldsi s6474, 1737 # 1737
+ldsi s6476, 1738 # 1738
+ldsi s6478, 1739 # 1739
+ldsi s6480, 1740 # 1740
+ldsi s6482, 1741 # 1741
+ldsi s6484, 1742 # 1742
+ldsi s6486, 1743 # 1743
+ldsi s6488, 1744 # 1744
+ldsi s6490, 1745 # 1745
+ldsi s6492, 1746 # 1746
+ldsi s6494, 1747 # 1747
+ldsi s6496, 1748 # 1748
+ldsi s6498, 1749 # 1749
+ldsi s6500, 1750 # 1750
+ldsi s6502, 1751 # 1751
+ldsi s6504, 1752 # 1752
+ldsi s6506, 1753 # 1753
+ldsi s6508, 1754 # 1754
+ldsi s6510, 1755 # 1755
+ldsi s6512, 1756 # 1756
+ldsi s6514, 1757 # 1757
+ldsi s6516, 1758 # 1758
+ldsi s6518, 1759 # 1759
+ldsi s6520, 1760 # 1760
+ldsi s6522, 1761 # 1761
+ldsi s6524, 1762 # 1762
+ldsi s6526, 1763 # 1763
+ldsi s6528, 1764 # 1764
+ldsi s6530, 1765 # 1765
+ldsi s6532, 1766 # 1766
+ldsi s6534, 1767 # 1767
+ldsi s6536, 1768 # 1768
+ldsi s6538, 1769 # 1769
+ldsi s6540, 1770 # 1770
+ldsi s6542, 1771 # 1771
+ldsi s6544, 1772 # 1772
+ldsi s6546, 1773 # 1773
+ldsi s6548, 1774 # 1774
+ldsi s6550, 1775 # 1775
+ldsi s6552, 1776 # 1776
+ldsi s6554, 1777 # 1777
+ldsi s6556, 1778 # 1778
+ldsi s6558, 1779 # 1779
+ldsi s6560, 1780 # 1780
+ldsi s6562, 1781 # 1781
+ldsi s6564, 1782 # 1782
+ldsi s6566, 1783 # 1783
+ldsi s6568, 1784 # 1784
+ldsi s6570, 1785 # 1785
+ldsi s6572, 1786 # 1786
+ldsi s6574, 1787 # 1787
+ldsi s6576, 1788 # 1788
+ldsi s6578, 1789 # 1789
+ldsi s6580, 1790 # 1790
+ldsi s6582, 1791 # 1791
+ldsi s6584, 1792 # 1792
+ldsi s6586, 1793 # 1793
+ldsi s6588, 1794 # 1794
+ldsi s6590, 1795 # 1795
+ldsi s6592, 1796 # 1796
+ldsi s6594, 1797 # 1797
+ldsi s6596, 1798 # 1798
+ldsi s6598, 1799 # 1799
+ldsi s6600, 1800 # 1800
+ldsi s6602, 1801 # 1801
+ldsi s6604, 1802 # 1802
+ldsi s6606, 1803 # 1803
+ldsi s6608, 1804 # 1804
+ldsi s6610, 1805 # 1805
+ldsi s6612, 1806 # 1806
+ldsi s6614, 1807 # 1807
+ldsi s6616, 1808 # 1808
+ldsi s6618, 1809 # 1809
+ldsi s6620, 1810 # 1810
+ldsi s6622, 1811 # 1811
+ldsi s6624, 1812 # 1812
+ldsi s6626, 1813 # 1813
+ldsi s6628, 1814 # 1814
+ldsi s6630, 1815 # 1815
+ldsi s6632, 1816 # 1816
+ldsi s6634, 1817 # 1817
+ldsi s6636, 1818 # 1818
+ldsi s6638, 1819 # 1819
+ldsi s6640, 1820 # 1820
+ldsi s6642, 1821 # 1821
+ldsi s6644, 1822 # 1822
+ldsi s6646, 1823 # 1823
+ldsi s6648, 1824 # 1824
+ldsi s6650, 1825 # 1825
+ldsi s6652, 1826 # 1826
+ldsi s6654, 1827 # 1827
+ldsi s6656, 1828 # 1828
+ldsi s6658, 1829 # 1829
+ldsi s6660, 1830 # 1830
+ldsi s6662, 1831 # 1831
+ldsi s6664, 1832 # 1832
+ldsi s6666, 1833 # 1833
+ldsi s6668, 1834 # 1834
+ldsi s6670, 1835 # 1835
+ldsi s6672, 1836 # 1836
+ldsi s6674, 1837 # 1837
+ldsi s6676, 1838 # 1838
+ldsi s6678, 1839 # 1839
+ldsi s6680, 1840 # 1840
+ldsi s6682, 1841 # 1841
+ldsi s6684, 1842 # 1842
+ldsi s6686, 1843 # 1843
+ldsi s6688, 1844 # 1844
+ldsi s6690, 1845 # 1845
+ldsi s6692, 1846 # 1846
+ldsi s6694, 1847 # 1847
+ldsi s6696, 1848 # 1848
+ldsi s6698, 1849 # 1849
+ldsi s6700, 1850 # 1850
+ldsi s6702, 1851 # 1851
+ldsi s6704, 1852 # 1852
+ldsi s6706, 1853 # 1853
+ldsi s6708, 1854 # 1854
+ldsi s6710, 1855 # 1855
+ldsi s6712, 1856 # 1856
+ldsi s6714, 1857 # 1857
+ldsi s6716, 1858 # 1858
+ldsi s6718, 1859 # 1859
+ldsi s6720, 1860 # 1860
+ldsi s6722, 1861 # 1861
+ldsi s6724, 1862 # 1862
+ldsi s6726, 1863 # 1863
+ldsi s6728, 1864 # 1864
+ldsi s6730, 1865 # 1865
+ldsi s6732, 1866 # 1866
+ldsi s6734, 1867 # 1867
+ldsi s6736, 1868 # 1868
+ldsi s6738, 1869 # 1869
+ldsi s6740, 1870 # 1870
+ldsi s6742, 1871 # 1871
+ldsi s6744, 1872 # 1872
+ldsi s6746, 1873 # 1873
+ldsi s6748, 1874 # 1874
+ldsi s6750, 1875 # 1875
+ldsi s6752, 1876 # 1876
+ldsi s6754, 1877 # 1877
+ldsi s6756, 1878 # 1878
+ldsi s6758, 1879 # 1879
+ldsi s6760, 1880 # 1880
+ldsi s6762, 1881 # 1881
+ldsi s6764, 1882 # 1882
+ldsi s6766, 1883 # 1883
+ldsi s6768, 1884 # 1884
+ldsi s6770, 1885 # 1885
+ldsi s6772, 1886 # 1886
+ldsi s6774, 1887 # 1887
+ldsi s6776, 1888 # 1888
+ldsi s6778, 1889 # 1889
+ldsi s6780, 1890 # 1890
+ldsi s6782, 1891 # 1891
+ldsi s6784, 1892 # 1892
+ldsi s6786, 1893 # 1893
+ldsi s6788, 1894 # 1894
+ldsi s6790, 1895 # 1895
+ldsi s6792, 1896 # 1896
+ldsi s6794, 1897 # 1897
+ldsi s6796, 1898 # 1898
+ldsi s6798, 1899 # 1899
+ldsi s6800, 1900 # 1900
+ldsi s6802, 1901 # 1901
+ldsi s6804, 1902 # 1902
+ldsi s6806, 1903 # 1903
+ldsi s6808, 1904 # 1904
+ldsi s6810, 1905 # 1905
+ldsi s6812, 1906 # 1906
+ldsi s6814, 1907 # 1907
+ldsi s6816, 1908 # 1908
+ldsi s6818, 1909 # 1909
+ldsi s6820, 1910 # 1910
+ldsi s6822, 1911 # 1911
+ldsi s6824, 1912 # 1912
+ldsi s6826, 1913 # 1913
+ldsi s6828, 1914 # 1914
+ldsi s6830, 1915 # 1915
+ldsi s6832, 1916 # 1916
+ldsi s6834, 1917 # 1917
+ldsi s6836, 1918 # 1918
+ldsi s6838, 1919 # 1919
+ldsi s6840, 1920 # 1920
+ldsi s6842, 1921 # 1921
+ldsi s6844, 1922 # 1922
+ldsi s6846, 1923 # 1923
+ldsi s6848, 1924 # 1924
+ldsi s6850, 1925 # 1925
+ldsi s6852, 1926 # 1926
+ldsi s6854, 1927 # 1927
+ldsi s6856, 1928 # 1928
+ldsi s6858, 1929 # 1929
+ldsi s6860, 1930 # 1930
+ldsi s6862, 1931 # 1931
+ldsi s6864, 1932 # 1932
+ldsi s6866, 1933 # 1933
+ldsi s6868, 1934 # 1934
+ldsi s6870, 1935 # 1935
+ldsi s6872, 1936 # 1936
+ldsi s6874, 1937 # 1937
+ldsi s6876, 1938 # 1938
+ldsi s6878, 1939 # 1939
+ldsi s6880, 1940 # 1940
+ldsi s6882, 1941 # 1941
+ldsi s6884, 1942 # 1942
+ldsi s6886, 1943 # 1943
+ldsi s6888, 1944 # 1944
+ldsi s6890, 1945 # 1945
+ldsi s6892, 1946 # 1946
+ldsi s6894, 1947 # 1947
+ldsi s6896, 1948 # 1948
+ldsi s6898, 1949 # 1949
+ldsi s6900, 1950 # 1950
+ldsi s6902, 1951 # 1951
+ldsi s6904, 1952 # 1952
+ldsi s6906, 1953 # 1953
+ldsi s6908, 1954 # 1954
+ldsi s6910, 1955 # 1955
+ldsi s6912, 1956 # 1956
+ldsi s6914, 1957 # 1957
+ldsi s6916, 1958 # 1958
+ldsi s6918, 1959 # 1959
+ldsi s6920, 1960 # 1960
+ldsi s6922, 1961 # 1961
+ldsi s6924, 1962 # 1962
+ldsi s6926, 1963 # 1963
+ldsi s6928, 1964 # 1964
+ldsi s6930, 1965 # 1965
+ldsi s6932, 1966 # 1966
+ldsi s6934, 1967 # 1967
+ldsi s6936, 1968 # 1968
+ldsi s6938, 1969 # 1969
+ldsi s6940, 1970 # 1970
+ldsi s6942, 1971 # 1971
+ldsi s6944, 1972 # 1972
+ldsi s6946, 1973 # 1973
+ldsi s6948, 1974 # 1974
+ldsi s6950, 1975 # 1975
+ldsi s6952, 1976 # 1976
+ldsi s6954, 1977 # 1977
+ldsi s6956, 1978 # 1978
+ldsi s6958, 1979 # 1979
+ldsi s6960, 1980 # 1980
+ldsi s6962, 1981 # 1981
+ldsi s6964, 1982 # 1982
+ldsi s6966, 1983 # 1983
+ldsi s6968, 1984 # 1984
+ldsi s6970, 1985 # 1985
+ldsi s6972, 1986 # 1986
+ldsi s6974, 1987 # 1987
+ldsi s6976, 1988 # 1988
+ldsi s6978, 1989 # 1989
+ldsi s6980, 1990 # 1990
+ldsi s6982, 1991 # 1991
+ldsi s6984, 1992 # 1992
+ldsi s6986, 1993 # 1993
+ldsi s6988, 1994 # 1994
+ldsi s6990, 1995 # 1995
+ldsi s6992, 1996 # 1996
+ldsi s6994, 1997 # 1997
+ldsi s6996, 1998 # 1998
+ldsi s6998, 1999 # 1999
+ldsi s7000, 2000 # 2000
+ldsi s7002, 2001 # 2001
+ldsi s7004, 2002 # 2002
+ldsi s7006, 2003 # 2003
+ldsi s7008, 2004 # 2004
+ldsi s7010, 2005 # 2005
+ldsi s7012, 2006 # 2006
+ldsi s7014, 2007 # 2007
+ldsi s7016, 2008 # 2008
+ldsi s7018, 2009 # 2009
+ldsi s7020, 2010 # 2010
+ldsi s7022, 2011 # 2011
+ldsi s7024, 2012 # 2012
+ldsi s7026, 2013 # 2013
+ldsi s7028, 2014 # 2014
+ldsi s7030, 2015 # 2015
+ldsi s7032, 2016 # 2016
+ldsi s7034, 2017 # 2017
+ldsi s7036, 2018 # 2018
+ldsi s7038, 2019 # 2019
+ldsi s7040, 2020 # 2020
+ldsi s7042, 2021 # 2021
+ldsi s7044, 2022 # 2022
+ldsi s7046, 2023 # 2023
+ldsi s7048, 2024 # 2024
+ldsi s7050, 2025 # 2025
+ldsi s7052, 2026 # 2026
+ldsi s7054, 2027 # 2027
+ldsi s7056, 2028 # 2028
+ldsi s7058, 2029 # 2029
+ldsi s7060, 2030 # 2030
+ldsi s7062, 2031 # 2031
+ldsi s7064, 2032 # 2032
+ldsi s7066, 2033 # 2033
+ldsi s7068, 2034 # 2034
+ldsi s7070, 2035 # 2035
+ldsi s7072, 2036 # 2036
+ldsi s7074, 2037 # 2037
+ldsi s7076, 2038 # 2038
+ldsi s7078, 2039 # 2039
+ldsi s7080, 2040 # 2040
+ldsi s7082, 2041 # 2041
+ldsi s7084, 2042 # 2042
+ldsi s7086, 2043 # 2043
+ldsi s7088, 2044 # 2044
+ldsi s7090, 2045 # 2045
+ldsi s7092, 2046 # 2046
+ldsi s7094, 2047 # 2047
+ldsi s7096, 2048 # 2048
+ldsi s7098, 2049 # 2049
+ldsi s7100, 2050 # 2050
+ldsi s7102, 2051 # 2051
+ldsi s7104, 2052 # 2052
+ldsi s7106, 2053 # 2053
+ldsi s7108, 2054 # 2054
+ldsi s7110, 2055 # 2055
+ldsi s7112, 2056 # 2056
+ldsi s7114, 2057 # 2057
+ldsi s7116, 2058 # 2058
+ldsi s7118, 2059 # 2059
+ldsi s7120, 2060 # 2060
+ldsi s7122, 2061 # 2061
+ldsi s7124, 2062 # 2062
+ldsi s7126, 2063 # 2063
+ldsi s7128, 2064 # 2064
+ldsi s7130, 2065 # 2065
+ldsi s7132, 2066 # 2066
+ldsi s7134, 2067 # 2067
+ldsi s7136, 2068 # 2068
+ldsi s7138, 2069 # 2069
+ldsi s7140, 2070 # 2070
+ldsi s7142, 2071 # 2071
+ldsi s7144, 2072 # 2072
+ldsi s7146, 2073 # 2073
+ldsi s7148, 2074 # 2074
+ldsi s7150, 2075 # 2075
+ldsi s7152, 2076 # 2076
+ldsi s7154, 2077 # 2077
+ldsi s7156, 2078 # 2078
+ldsi s7158, 2079 # 2079
+ldsi s7160, 2080 # 2080
+ldsi s7162, 2081 # 2081
+ldsi s7164, 2082 # 2082
+ldsi s7166, 2083 # 2083
+ldsi s7168, 2084 # 2084
+ldsi s7170, 2085 # 2085
+ldsi s7172, 2086 # 2086
+ldsi s7174, 2087 # 2087
+ldsi s7176, 2088 # 2088
+ldsi s7178, 2089 # 2089
+ldsi s7180, 2090 # 2090
+ldsi s7182, 2091 # 2091
+ldsi s7184, 2092 # 2092
+ldsi s7186, 2093 # 2093
+ldsi s7188, 2094 # 2094
+ldsi s7190, 2095 # 2095
+ldsi s7192, 2096 # 2096
+ldsi s7194, 2097 # 2097
+ldsi s7196, 2098 # 2098
+ldsi s7198, 2099 # 2099
+ldsi s7200, 2100 # 2100
+ldsi s7202, 2101 # 2101
+ldsi s7204, 2102 # 2102
+ldsi s7206, 2103 # 2103
+ldsi s7208, 2104 # 2104
+ldsi s7210, 2105 # 2105
+ldsi s7212, 2106 # 2106
+ldsi s7214, 2107 # 2107
+ldsi s7216, 2108 # 2108
+ldsi s7218, 2109 # 2109
+ldsi s7220, 2110 # 2110
+ldsi s7222, 2111 # 2111
+ldsi s7224, 2112 # 2112
+ldsi s7226, 2113 # 2113
+ldsi s7228, 2114 # 2114
+ldsi s7230, 2115 # 2115
+ldsi s7232, 2116 # 2116
+ldsi s7234, 2117 # 2117
+ldsi s7236, 2118 # 2118
+ldsi s7238, 2119 # 2119
+ldsi s7240, 2120 # 2120
+ldsi s7242, 2121 # 2121
+ldsi s7244, 2122 # 2122
+ldsi s7246, 2123 # 2123
+ldsi s7248, 2124 # 2124
+ldsi s7250, 2125 # 2125
+ldsi s7252, 2126 # 2126
+ldsi s7254, 2127 # 2127
+ldsi s7256, 2128 # 2128
+ldsi s7258, 2129 # 2129
+ldsi s7260, 2130 # 2130
+ldsi s7262, 2131 # 2131
+ldsi s7264, 2132 # 2132
+ldsi s7266, 2133 # 2133
+ldsi s7268, 2134 # 2134
+ldsi s7270, 2135 # 2135
+ldsi s7272, 2136 # 2136
+ldsi s7274, 2137 # 2137
+ldsi s7276, 2138 # 2138
+ldsi s7278, 2139 # 2139
+ldsi s7280, 2140 # 2140
+ldsi s7282, 2141 # 2141
+ldsi s7284, 2142 # 2142
+ldsi s7286, 2143 # 2143
+ldsi s7288, 2144 # 2144
+ldsi s7290, 2145 # 2145
+ldsi s7292, 2146 # 2146
+ldsi s7294, 2147 # 2147
+ldsi s7296, 2148 # 2148
+ldsi s7298, 2149 # 2149
+ldsi s7300, 2150 # 2150
+ldsi s7302, 2151 # 2151
+ldsi s7304, 2152 # 2152
+ldsi s7306, 2153 # 2153
+ldsi s7308, 2154 # 2154
+ldsi s7310, 2155 # 2155
+ldsi s7312, 2156 # 2156
+ldsi s7314, 2157 # 2157
+ldsi s7316, 2158 # 2158
+ldsi s7318, 2159 # 2159
+ldsi s7320, 2160 # 2160
+ldsi s7322, 2161 # 2161
+ldsi s7324, 2162 # 2162
+ldsi s7326, 2163 # 2163
+ldsi s7328, 2164 # 2164
+ldsi s7330, 2165 # 2165
+ldsi s7332, 2166 # 2166
+ldsi s7334, 2167 # 2167
+ldsi s7336, 2168 # 2168
+ldsi s7338, 2169 # 2169
+ldsi s7340, 2170 # 2170
+ldsi s7342, 2171 # 2171
+ldsi s7344, 2172 # 2172
+ldsi s7346, 2173 # 2173
+ldsi s7348, 2174 # 2174
+ldsi s7350, 2175 # 2175
+ldsi s7352, 2176 # 2176
+ldsi s7354, 2177 # 2177
+ldsi s7356, 2178 # 2178
+ldsi s7358, 2179 # 2179
+ldsi s7360, 2180 # 2180
+ldsi s7362, 2181 # 2181
+ldsi s7364, 2182 # 2182
+ldsi s7366, 2183 # 2183
+ldsi s7368, 2184 # 2184
+ldsi s7370, 2185 # 2185
+ldsi s7372, 2186 # 2186
+ldsi s7374, 2187 # 2187
+ldsi s7376, 2188 # 2188
+ldsi s7378, 2189 # 2189
+ldsi s7380, 2190 # 2190
+ldsi s7382, 2191 # 2191
+ldsi s7384, 2192 # 2192
+ldsi s7386, 2193 # 2193
+ldsi s7388, 2194 # 2194
+ldsi s7390, 2195 # 2195
+ldsi s7392, 2196 # 2196
+ldsi s7394, 2197 # 2197
+ldsi s7396, 2198 # 2198
+ldsi s7398, 2199 # 2199
+ldsi s7400, 2200 # 2200
+ldsi s7402, 2201 # 2201
+ldsi s7404, 2202 # 2202
+ldsi s7406, 2203 # 2203
+ldsi s7408, 2204 # 2204
+ldsi s7410, 2205 # 2205
+ldsi s7412, 2206 # 2206
+ldsi s7414, 2207 # 2207
+ldsi s7416, 2208 # 2208
+ldsi s7418, 2209 # 2209
+ldsi s7420, 2210 # 2210
+ldsi s7422, 2211 # 2211
+ldsi s7424, 2212 # 2212
+ldsi s7426, 2213 # 2213
+ldsi s7428, 2214 # 2214
+ldsi s7430, 2215 # 2215
+ldsi s7432, 2216 # 2216
+ldsi s7434, 2217 # 2217
+ldsi s7436, 2218 # 2218
+ldsi s7438, 2219 # 2219
+ldsi s7440, 2220 # 2220
+ldsi s7442, 2221 # 2221
+ldsi s7444, 2222 # 2222
+ldsi s7446, 2223 # 2223
+ldsi s7448, 2224 # 2224
+ldsi s7450, 2225 # 2225
+ldsi s7452, 2226 # 2226
+ldsi s7454, 2227 # 2227
+ldsi s7456, 2228 # 2228
+ldsi s7458, 2229 # 2229
+ldsi s7460, 2230 # 2230
+ldsi s7462, 2231 # 2231
+ldsi s7464, 2232 # 2232
+ldsi s7466, 2233 # 2233
+ldsi s7468, 2234 # 2234
+ldsi s7470, 2235 # 2235
+ldsi s7472, 2236 # 2236
+ldsi s7474, 2237 # 2237
+ldsi s7476, 2238 # 2238
+ldsi s7478, 2239 # 2239
+ldsi s7480, 2240 # 2240
+ldsi s7482, 2241 # 2241
+ldsi s7484, 2242 # 2242
+ldsi s7486, 2243 # 2243
+ldsi s7488, 2244 # 2244
+ldsi s7490, 2245 # 2245
+ldsi s7492, 2246 # 2246
+ldsi s7494, 2247 # 2247
+ldsi s7496, 2248 # 2248
+ldsi s7498, 2249 # 2249
+ldsi s7500, 2250 # 2250
+ldsi s7502, 2251 # 2251
+ldsi s7504, 2252 # 2252
+ldsi s7506, 2253 # 2253
+ldsi s7508, 2254 # 2254
+ldsi s7510, 2255 # 2255
+ldsi s7512, 2256 # 2256
+ldsi s7514, 2257 # 2257
+ldsi s7516, 2258 # 2258
+ldsi s7518, 2259 # 2259
+ldsi s7520, 2260 # 2260
+ldsi s7522, 2261 # 2261
+ldsi s7524, 2262 # 2262
+ldsi s7526, 2263 # 2263
+ldsi s7528, 2264 # 2264
+ldsi s7530, 2265 # 2265
+ldsi s7532, 2266 # 2266
+ldsi s7534, 2267 # 2267
+ldsi s7536, 2268 # 2268
+ldsi s7538, 2269 # 2269
+ldsi s7540, 2270 # 2270
+ldsi s7542, 2271 # 2271
+ldsi s7544, 2272 # 2272
+ldsi s7546, 2273 # 2273
+ldsi s7548, 2274 # 2274
+ldsi s7550, 2275 # 2275
+ldsi s7552, 2276 # 2276
+ldsi s7554, 2277 # 2277
+ldsi s7556, 2278 # 2278
+ldsi s7558, 2279 # 2279
+ldsi s7560, 2280 # 2280
+ldsi s7562, 2281 # 2281
+ldsi s7564, 2282 # 2282
+ldsi s7566, 2283 # 2283
+ldsi s7568, 2284 # 2284
+ldsi s7570, 2285 # 2285
+ldsi s7572, 2286 # 2286
+ldsi s7574, 2287 # 2287
+ldsi s7576, 2288 # 2288
+ldsi s7578, 2289 # 2289
+ldsi s7580, 2290 # 2290
+ldsi s7582, 2291 # 2291
+ldsi s7584, 2292 # 2292
+ldsi s7586, 2293 # 2293
+ldsi s7588, 2294 # 2294
+ldsi s7590, 2295 # 2295
+ldsi s7592, 2296 # 2296
+ldsi s7594, 2297 # 2297
+ldsi s7596, 2298 # 2298
+ldsi s7598, 2299 # 2299
+ldsi s7600, 2300 # 2300
+ldsi s7602, 2301 # 2301
+ldsi s7604, 2302 # 2302
+ldsi s7606, 2303 # 2303
+ldsi s7608, 2304 # 2304
+ldsi s7610, 2305 # 2305
+ldsi s7612, 2306 # 2306
+ldsi s7614, 2307 # 2307
+ldsi s7616, 2308 # 2308
+ldsi s7618, 2309 # 2309
+ldsi s7620, 2310 # 2310
+ldsi s7622, 2311 # 2311
+ldsi s7624, 2312 # 2312
+ldsi s7626, 2313 # 2313
+ldsi s7628, 2314 # 2314
+ldsi s7630, 2315 # 2315
+ldsi s7632, 2316 # 2316
+ldsi s7634, 2317 # 2317
+ldsi s7636, 2318 # 2318
+ldsi s7638, 2319 # 2319
+ldsi s7640, 2320 # 2320
+ldsi s7642, 2321 # 2321
+ldsi s7644, 2322 # 2322
+ldsi s7646, 2323 # 2323
+ldsi s7648, 2324 # 2324
+ldsi s7650, 2325 # 2325
+ldsi s7652, 2326 # 2326
+ldsi s7654, 2327 # 2327
+ldsi s7656, 2328 # 2328
+ldsi s7658, 2329 # 2329
+ldsi s7660, 2330 # 2330
+ldsi s7662, 2331 # 2331
+ldsi s7664, 2332 # 2332
+ldsi s7666, 2333 # 2333
+ldsi s7668, 2334 # 2334
+ldsi s7670, 2335 # 2335
+ldsi s7672, 2336 # 2336
+ldsi s7674, 2337 # 2337
+ldsi s7676, 2338 # 2338
+ldsi s7678, 2339 # 2339
+ldsi s7680, 2340 # 2340
+ldsi s7682, 2341 # 2341
+ldsi s7684, 2342 # 2342
+ldsi s7686, 2343 # 2343
+ldsi s7688, 2344 # 2344
+ldsi s7690, 2345 # 2345
+ldsi s7692, 2346 # 2346
+ldsi s7694, 2347 # 2347
+ldsi s7696, 2348 # 2348
+ldsi s7698, 2349 # 2349
+ldsi s7700, 2350 # 2350
+ldsi s7702, 2351 # 2351
+ldsi s7704, 2352 # 2352
+ldsi s7706, 2353 # 2353
+ldsi s7708, 2354 # 2354
+ldsi s7710, 2355 # 2355
+ldsi s7712, 2356 # 2356
+ldsi s7714, 2357 # 2357
+ldsi s7716, 2358 # 2358
+ldsi s7718, 2359 # 2359
+ldsi s7720, 2360 # 2360
+ldsi s7722, 2361 # 2361
+ldsi s7724, 2362 # 2362
+ldsi s7726, 2363 # 2363
+ldsi s7728, 2364 # 2364
+ldsi s7730, 2365 # 2365
+ldsi s7732, 2366 # 2366
+ldsi s7734, 2367 # 2367
+ldsi s7736, 2368 # 2368
+ldsi s7738, 2369 # 2369
+ldsi s7740, 2370 # 2370
+ldsi s7742, 2371 # 2371
+ldsi s7744, 2372 # 2372
+ldsi s7746, 2373 # 2373
+ldsi s7748, 2374 # 2374
+ldsi s7750, 2375 # 2375
+ldsi s7752, 2376 # 2376
+ldsi s7754, 2377 # 2377
+ldsi s7756, 2378 # 2378
+ldsi s7758, 2379 # 2379
+ldsi s7760, 2380 # 2380
+ldsi s7762, 2381 # 2381
+ldsi s7764, 2382 # 2382
+ldsi s7766, 2383 # 2383
+ldsi s7768, 2384 # 2384
+ldsi s7770, 2385 # 2385
+ldsi s7772, 2386 # 2386
+ldsi s7774, 2387 # 2387
+ldsi s7776, 2388 # 2388
+ldsi s7778, 2389 # 2389
+ldsi s7780, 2390 # 2390
+ldsi s7782, 2391 # 2391
+ldsi s7784, 2392 # 2392
+ldsi s7786, 2393 # 2393
+ldsi s7788, 2394 # 2394
+ldsi s7790, 2395 # 2395
+ldsi s7792, 2396 # 2396
+ldsi s7794, 2397 # 2397
+ldsi s7796, 2398 # 2398
+ldsi s7798, 2399 # 2399
+ldsi s7800, 2400 # 2400
+ldsi s7802, 2401 # 2401
+ldsi s7804, 2402 # 2402
+ldsi s7806, 2403 # 2403
+ldsi s7808, 2404 # 2404
+ldsi s7810, 2405 # 2405
+ldsi s7812, 2406 # 2406
+ldsi s7814, 2407 # 2407
+ldsi s7816, 2408 # 2408
+ldsi s7818, 2409 # 2409
+ldsi s7820, 2410 # 2410
+ldsi s7822, 2411 # 2411
+ldsi s7824, 2412 # 2412
+ldsi s7826, 2413 # 2413
+ldsi s7828, 2414 # 2414
+ldsi s7830, 2415 # 2415
+ldsi s7832, 2416 # 2416
+ldsi s7834, 2417 # 2417
+ldsi s7836, 2418 # 2418
+ldsi s7838, 2419 # 2419
+ldsi s7840, 2420 # 2420
+ldsi s7842, 2421 # 2421
+ldsi s7844, 2422 # 2422
+ldsi s7846, 2423 # 2423
+ldsi s7848, 2424 # 2424
+ldsi s7850, 2425 # 2425
+ldsi s7852, 2426 # 2426
+ldsi s7854, 2427 # 2427
+ldsi s7856, 2428 # 2428
+ldsi s7858, 2429 # 2429
+ldsi s7860, 2430 # 2430
+ldsi s7862, 2431 # 2431
+ldsi s7864, 2432 # 2432
+ldsi s7866, 2433 # 2433
+ldsi s7868, 2434 # 2434
+ldsi s7870, 2435 # 2435
+ldsi s7872, 2436 # 2436
+ldsi s7874, 2437 # 2437
+ldsi s7876, 2438 # 2438
+ldsi s7878, 2439 # 2439
+ldsi s7880, 2440 # 2440
+ldsi s7882, 2441 # 2441
+ldsi s7884, 2442 # 2442
+ldsi s7886, 2443 # 2443
+ldsi s7888, 2444 # 2444
+ldsi s7890, 2445 # 2445
+ldsi s7892, 2446 # 2446
+ldsi s7894, 2447 # 2447
+ldsi s7896, 2448 # 2448
+ldsi s7898, 2449 # 2449
+ldsi s7900, 2450 # 2450
+ldsi s7902, 2451 # 2451
+ldsi s7904, 2452 # 2452
+ldsi s7906, 2453 # 2453
+ldsi s7908, 2454 # 2454
+ldsi s7910, 2455 # 2455
+ldsi s7912, 2456 # 2456
+ldsi s7914, 2457 # 2457
+ldsi s7916, 2458 # 2458
+ldsi s7918, 2459 # 2459
+ldsi s7920, 2460 # 2460
+ldsi s7922, 2461 # 2461
+ldsi s7924, 2462 # 2462
+ldsi s7926, 2463 # 2463
+ldsi s7928, 2464 # 2464
+ldsi s7930, 2465 # 2465
+ldsi s7932, 2466 # 2466
+ldsi s7934, 2467 # 2467
+ldsi s7936, 2468 # 2468
+ldsi s7938, 2469 # 2469
+ldsi s7940, 2470 # 2470
+ldsi s7942, 2471 # 2471
+ldsi s7944, 2472 # 2472
+ldsi s7946, 2473 # 2473
+ldsi s7948, 2474 # 2474
+ldsi s7950, 2475 # 2475
+ldsi s7952, 2476 # 2476
+ldsi s7954, 2477 # 2477
+ldsi s7956, 2478 # 2478
+ldsi s7958, 2479 # 2479
+ldsi s7960, 2480 # 2480
+ldsi s7962, 2481 # 2481
+ldsi s7964, 2482 # 2482
+ldsi s7966, 2483 # 2483
+ldsi s7968, 2484 # 2484
+ldsi s7970, 2485 # 2485
+ldsi s7972, 2486 # 2486
+ldsi s7974, 2487 # 2487
+ldsi s7976, 2488 # 2488
+ldsi s7978, 2489 # 2489
+ldsi s7980, 2490 # 2490
+ldsi s7982, 2491 # 2491
+ldsi s7984, 2492 # 2492
+ldsi s7986, 2493 # 2493
+ldsi s7988, 2494 # 2494
+ldsi s7990, 2495 # 2495
+ldsi s7992, 2496 # 2496
+ldsi s7994, 2497 # 2497
+ldsi s7996, 2498 # 2498
+ldsi s7998, 2499 # 2499
+ldsi s8000, 2500 # 2500
+ldsi s8002, 2501 # 2501
+ldsi s8004, 2502 # 2502
+ldsi s8006, 2503 # 2503
+ldsi s8008, 2504 # 2504
+ldsi s8010, 2505 # 2505
+ldsi s8012, 2506 # 2506
+ldsi s8014, 2507 # 2507
+ldsi s8016, 2508 # 2508
+ldsi s8018, 2509 # 2509
+ldsi s8020, 2510 # 2510
+ldsi s8022, 2511 # 2511
+ldsi s8024, 2512 # 2512
+ldsi s8026, 2513 # 2513
+ldsi s8028, 2514 # 2514
+ldsi s8030, 2515 # 2515
+ldsi s8032, 2516 # 2516
+ldsi s8034, 2517 # 2517
+ldsi s8036, 2518 # 2518
+ldsi s8038, 2519 # 2519
+ldsi s8040, 2520 # 2520
+ldsi s8042, 2521 # 2521
+ldsi s8044, 2522 # 2522
+ldsi s8046, 2523 # 2523
+ldsi s8048, 2524 # 2524
+ldsi s8050, 2525 # 2525
+ldsi s8052, 2526 # 2526
+ldsi s8054, 2527 # 2527
+ldsi s8056, 2528 # 2528
+ldsi s8058, 2529 # 2529
+ldsi s8060, 2530 # 2530
+ldsi s8062, 2531 # 2531
+ldsi s8064, 2532 # 2532
+ldsi s8066, 2533 # 2533
+ldsi s8068, 2534 # 2534
+ldsi s8070, 2535 # 2535
+ldsi s8072, 2536 # 2536
+ldsi s8074, 2537 # 2537
+ldsi s8076, 2538 # 2538
+ldsi s8078, 2539 # 2539
+ldsi s8080, 2540 # 2540
+ldsi s8082, 2541 # 2541
+ldsi s8084, 2542 # 2542
+ldsi s8086, 2543 # 2543
+ldsi s8088, 2544 # 2544
+ldsi s8090, 2545 # 2545
+ldsi s8092, 2546 # 2546
+ldsi s8094, 2547 # 2547
+ldsi s8096, 2548 # 2548
+ldsi s8098, 2549 # 2549
+ldsi s8100, 2550 # 2550
+ldsi s8102, 2551 # 2551
+ldsi s8104, 2552 # 2552
+ldsi s8106, 2553 # 2553
+ldsi s8108, 2554 # 2554
+ldsi s8110, 2555 # 2555
+ldsi s8112, 2556 # 2556
+ldsi s8114, 2557 # 2557
+ldsi s8116, 2558 # 2558
+ldsi s8118, 2559 # 2559
+ldsi s8120, 2560 # 2560
+ldsi s8122, 2561 # 2561
+ldsi s8124, 2562 # 2562
+ldsi s8126, 2563 # 2563
+ldsi s8128, 2564 # 2564
+ldsi s8130, 2565 # 2565
+ldsi s8132, 2566 # 2566
+ldsi s8134, 2567 # 2567
+ldsi s8136, 2568 # 2568
+ldsi s8138, 2569 # 2569
+ldsi s8140, 2570 # 2570
+ldsi s8142, 2571 # 2571
+ldsi s8144, 2572 # 2572
+ldsi s8146, 2573 # 2573
+ldsi s8148, 2574 # 2574
+ldsi s8150, 2575 # 2575
+ldsi s8152, 2576 # 2576
+ldsi s8154, 2577 # 2577
+ldsi s8156, 2578 # 2578
+ldsi s8158, 2579 # 2579
+ldsi s8160, 2580 # 2580
+ldsi s8162, 2581 # 2581
+ldsi s8164, 2582 # 2582
+ldsi s8166, 2583 # 2583
+ldsi s8168, 2584 # 2584
+ldsi s8170, 2585 # 2585
+ldsi s8172, 2586 # 2586
+ldsi s8174, 2587 # 2587
+ldsi s8176, 2588 # 2588
+ldsi s8178, 2589 # 2589
+ldsi s8180, 2590 # 2590
+ldsi s8182, 2591 # 2591
+ldsi s8184, 2592 # 2592
+ldsi s8186, 2593 # 2593
+ldsi s8188, 2594 # 2594
+ldsi s8190, 2595 # 2595
+ldsi s8192, 2596 # 2596
+ldsi s8194, 2597 # 2597
+ldsi s8196, 2598 # 2598
+ldsi s8198, 2599 # 2599
+ldsi s8200, 2600 # 2600
+ldsi s8202, 2601 # 2601
+ldsi s8204, 2602 # 2602
+ldsi s8206, 2603 # 2603
+ldsi s8208, 2604 # 2604
+ldsi s8210, 2605 # 2605
+ldsi s8212, 2606 # 2606
+ldsi s8214, 2607 # 2607
+ldsi s8216, 2608 # 2608
+ldsi s8218, 2609 # 2609
+ldsi s8220, 2610 # 2610
+ldsi s8222, 2611 # 2611
+ldsi s8224, 2612 # 2612
+ldsi s8226, 2613 # 2613
+ldsi s8228, 2614 # 2614
+ldsi s8230, 2615 # 2615
+ldsi s8232, 2616 # 2616
+ldsi s8234, 2617 # 2617
+ldsi s8236, 2618 # 2618
+ldsi s8238, 2619 # 2619
+ldsi s8240, 2620 # 2620
+ldsi s8242, 2621 # 2621
+ldsi s8244, 2622 # 2622
+ldsi s8246, 2623 # 2623
+ldsi s8248, 2624 # 2624
+ldsi s8250, 2625 # 2625
+ldsi s8252, 2626 # 2626
+ldsi s8254, 2627 # 2627
+ldsi s8256, 2628 # 2628
+ldsi s8258, 2629 # 2629
+ldsi s8260, 2630 # 2630
+ldsi s8262, 2631 # 2631
+ldsi s8264, 2632 # 2632
+ldsi s8266, 2633 # 2633
+ldsi s8268, 2634 # 2634
+ldsi s8270, 2635 # 2635
+ldsi s8272, 2636 # 2636
+ldsi s8274, 2637 # 2637
+ldsi s8276, 2638 # 2638
+ldsi s8278, 2639 # 2639
+ldsi s8280, 2640 # 2640
+ldsi s8282, 2641 # 2641
+ldsi s8284, 2642 # 2642
+ldsi s8286, 2643 # 2643
+ldsi s8288, 2644 # 2644
+ldsi s8290, 2645 # 2645
+ldsi s8292, 2646 # 2646
+ldsi s8294, 2647 # 2647
+ldsi s8296, 2648 # 2648
+ldsi s8298, 2649 # 2649
+ldsi s8300, 2650 # 2650
+ldsi s8302, 2651 # 2651
+ldsi s8304, 2652 # 2652
+ldsi s8306, 2653 # 2653
+ldsi s8308, 2654 # 2654
+ldsi s8310, 2655 # 2655
+ldsi s8312, 2656 # 2656
+ldsi s8314, 2657 # 2657
+ldsi s8316, 2658 # 2658
+ldsi s8318, 2659 # 2659
+ldsi s8320, 2660 # 2660
+ldsi s8322, 2661 # 2661
+ldsi s8324, 2662 # 2662
+ldsi s8326, 2663 # 2663
+ldsi s8328, 2664 # 2664
+ldsi s8330, 2665 # 2665
+ldsi s8332, 2666 # 2666
+ldsi s8334, 2667 # 2667
+ldsi s8336, 2668 # 2668
+ldsi s8338, 2669 # 2669
+ldsi s8340, 2670 # 2670
+ldsi s8342, 2671 # 2671
+ldsi s8344, 2672 # 2672
+ldsi s8346, 2673 # 2673
+ldsi s8348, 2674 # 2674
+ldsi s8350, 2675 # 2675
+ldsi s8352, 2676 # 2676
+ldsi s8354, 2677 # 2677
+ldsi s8356, 2678 # 2678
+ldsi s8358, 2679 # 2679
+ldsi s8360, 2680 # 2680
+ldsi s8362, 2681 # 2681
+ldsi s8364, 2682 # 2682
+ldsi s8366, 2683 # 2683
+ldsi s8368, 2684 # 2684
+ldsi s8370, 2685 # 2685
+ldsi s8372, 2686 # 2686
+ldsi s8374, 2687 # 2687
+ldsi s8376, 2688 # 2688
+ldsi s8378, 2689 # 2689
+ldsi s8380, 2690 # 2690
+ldsi s8382, 2691 # 2691
+ldsi s8384, 2692 # 2692
+ldsi s8386, 2693 # 2693
+ldsi s8388, 2694 # 2694
+ldsi s8390, 2695 # 2695
+ldsi s8392, 2696 # 2696
+ldsi s8394, 2697 # 2697
+ldsi s8396, 2698 # 2698
+ldsi s8398, 2699 # 2699
+ldsi s8400, 2700 # 2700
+ldsi s8402, 2701 # 2701
+ldsi s8404, 2702 # 2702
+ldsi s8406, 2703 # 2703
+ldsi s8408, 2704 # 2704
+ldsi s8410, 2705 # 2705
+ldsi s8412, 2706 # 2706
+ldsi s8414, 2707 # 2707
+ldsi s8416, 2708 # 2708
+ldsi s8418, 2709 # 2709
+ldsi s8420, 2710 # 2710
+ldsi s8422, 2711 # 2711
+ldsi s8424, 2712 # 2712
+ldsi s8426, 2713 # 2713
+ldsi s8428, 2714 # 2714
+ldsi s8430, 2715 # 2715
+ldsi s8432, 2716 # 2716
+ldsi s8434, 2717 # 2717
+ldsi s8436, 2718 # 2718
+ldsi s8438, 2719 # 2719
+ldsi s8440, 2720 # 2720
+ldsi s8442, 2721 # 2721
+ldsi s8444, 2722 # 2722
+ldsi s8446, 2723 # 2723
+ldsi s8448, 2724 # 2724
+ldsi s8450, 2725 # 2725
+ldsi s8452, 2726 # 2726
+ldsi s8454, 2727 # 2727
+ldsi s8456, 2728 # 2728
+ldsi s8458, 2729 # 2729
+ldsi s8460, 2730 # 2730
+ldsi s8462, 2731 # 2731
+ldsi s8464, 2732 # 2732
+ldsi s8466, 2733 # 2733
+ldsi s8468, 2734 # 2734
+ldsi s8470, 2735 # 2735
+ldsi s8472, 2736 # 2736
+ldsi s8474, 2737 # 2737
+ldsi s8476, 2738 # 2738
+ldsi s8478, 2739 # 2739
+ldsi s8480, 2740 # 2740
+ldsi s8482, 2741 # 2741
+ldsi s8484, 2742 # 2742
+ldsi s8486, 2743 # 2743
+ldsi s8488, 2744 # 2744
+ldsi s8490, 2745 # 2745
+ldsi s8492, 2746 # 2746
+ldsi s8494, 2747 # 2747
+ldsi s8496, 2748 # 2748
+ldsi s8498, 2749 # 2749
+ldsi s8500, 2750 # 2750
+ldsi s8502, 2751 # 2751
+ldsi s8504, 2752 # 2752
+ldsi s8506, 2753 # 2753
+ldsi s8508, 2754 # 2754
+ldsi s8510, 2755 # 2755
+ldsi s8512, 2756 # 2756
+ldsi s8514, 2757 # 2757
+ldsi s8516, 2758 # 2758
+ldsi s8518, 2759 # 2759
+ldsi s8520, 2760 # 2760
+ldsi s8522, 2761 # 2761
+ldsi s8524, 2762 # 2762
+ldsi s8526, 2763 # 2763
+ldsi s8528, 2764 # 2764
+ldsi s8530, 2765 # 2765
+ldsi s8532, 2766 # 2766
+ldsi s8534, 2767 # 2767
+ldsi s8536, 2768 # 2768
+ldsi s8538, 2769 # 2769
+ldsi s8540, 2770 # 2770
+ldsi s8542, 2771 # 2771
+ldsi s8544, 2772 # 2772
+ldsi s8546, 2773 # 2773
+ldsi s8548, 2774 # 2774
+ldsi s8550, 2775 # 2775
+ldsi s8552, 2776 # 2776
+ldsi s8554, 2777 # 2777
+ldsi s8556, 2778 # 2778
+ldsi s8558, 2779 # 2779
+ldsi s8560, 2780 # 2780
+ldsi s8562, 2781 # 2781
+ldsi s8564, 2782 # 2782
+ldsi s8566, 2783 # 2783
+ldsi s8568, 2784 # 2784
+ldsi s8570, 2785 # 2785
+ldsi s8572, 2786 # 2786
+ldsi s8574, 2787 # 2787
+ldsi s8576, 2788 # 2788
+ldsi s8578, 2789 # 2789
+ldsi s8580, 2790 # 2790
+ldsi s8582, 2791 # 2791
+ldsi s8584, 2792 # 2792
+ldsi s8586, 2793 # 2793
+ldsi s8588, 2794 # 2794
+ldsi s8590, 2795 # 2795
+ldsi s8592, 2796 # 2796
+ldsi s8594, 2797 # 2797
+ldsi s8596, 2798 # 2798
+ldsi s8598, 2799 # 2799
+ldsi s8600, 2800 # 2800
+ldsi s8602, 2801 # 2801
+ldsi s8604, 2802 # 2802
+ldsi s8606, 2803 # 2803
+ldsi s8608, 2804 # 2804
+ldsi s8610, 2805 # 2805
+ldsi s8612, 2806 # 2806
+ldsi s8614, 2807 # 2807
+ldsi s8616, 2808 # 2808
+ldsi s8618, 2809 # 2809
+ldsi s8620, 2810 # 2810
+ldsi s8622, 2811 # 2811
+ldsi s8624, 2812 # 2812
+ldsi s8626, 2813 # 2813
+ldsi s8628, 2814 # 2814
+ldsi s8630, 2815 # 2815
+ldsi s8632, 2816 # 2816
+ldsi s8634, 2817 # 2817
+ldsi s8636, 2818 # 2818
+ldsi s8638, 2819 # 2819
+ldsi s8640, 2820 # 2820
+ldsi s8642, 2821 # 2821
+ldsi s8644, 2822 # 2822
+ldsi s8646, 2823 # 2823
+ldsi s8648, 2824 # 2824
+ldsi s8650, 2825 # 2825
+ldsi s8652, 2826 # 2826
+ldsi s8654, 2827 # 2827
+ldsi s8656, 2828 # 2828
+ldsi s8658, 2829 # 2829
+ldsi s8660, 2830 # 2830
+ldsi s8662, 2831 # 2831
+ldsi s8664, 2832 # 2832
+ldsi s8666, 2833 # 2833
+ldsi s8668, 2834 # 2834
+ldsi s8670, 2835 # 2835
+ldsi s8672, 2836 # 2836
+ldsi s8674, 2837 # 2837
+ldsi s8676, 2838 # 2838
+ldsi s8678, 2839 # 2839
+ldsi s8680, 2840 # 2840
+ldsi s8682, 2841 # 2841
+ldsi s8684, 2842 # 2842
+ldsi s8686, 2843 # 2843
+ldsi s8688, 2844 # 2844
+ldsi s8690, 2845 # 2845
+ldsi s8692, 2846 # 2846
+ldsi s8694, 2847 # 2847
+ldsi s8696, 2848 # 2848
+ldsi s8698, 2849 # 2849
+ldsi s8700, 2850 # 2850
+ldsi s8702, 2851 # 2851
+ldsi s8704, 2852 # 2852
+ldsi s8706, 2853 # 2853
+ldsi s8708, 2854 # 2854
+ldsi s8710, 2855 # 2855
+ldsi s8712, 2856 # 2856
+ldsi s8714, 2857 # 2857
+ldsi s8716, 2858 # 2858
+ldsi s8718, 2859 # 2859
+ldsi s8720, 2860 # 2860
+ldsi s8722, 2861 # 2861
+ldsi s8724, 2862 # 2862
+ldsi s8726, 2863 # 2863
+ldsi s8728, 2864 # 2864
+ldsi s8730, 2865 # 2865
+ldsi s8732, 2866 # 2866
+ldsi s8734, 2867 # 2867
+ldsi s8736, 2868 # 2868
+ldsi s8738, 2869 # 2869
+ldsi s8740, 2870 # 2870
+ldsi s8742, 2871 # 2871
+ldsi s8744, 2872 # 2872
+ldsi s8746, 2873 # 2873
+ldsi s8748, 2874 # 2874
+ldsi s8750, 2875 # 2875
+ldsi s8752, 2876 # 2876
+ldsi s8754, 2877 # 2877
+ldsi s8756, 2878 # 2878
+ldsi s8758, 2879 # 2879
+ldsi s8760, 2880 # 2880
+ldsi s8762, 2881 # 2881
+ldsi s8764, 2882 # 2882
+ldsi s8766, 2883 # 2883
+ldsi s8768, 2884 # 2884
+ldsi s8770, 2885 # 2885
+ldsi s8772, 2886 # 2886
+ldsi s8774, 2887 # 2887
+ldsi s8776, 2888 # 2888
+ldsi s8778, 2889 # 2889
+ldsi s8780, 2890 # 2890
+ldsi s8782, 2891 # 2891
+ldsi s8784, 2892 # 2892
+ldsi s8786, 2893 # 2893
+ldsi s8788, 2894 # 2894
+ldsi s8790, 2895 # 2895
+ldsi s8792, 2896 # 2896
+ldsi s8794, 2897 # 2897
+ldsi s8796, 2898 # 2898
+ldsi s8798, 2899 # 2899
+ldsi s8800, 2900 # 2900
+ldsi s8802, 2901 # 2901
+ldsi s8804, 2902 # 2902
+ldsi s8806, 2903 # 2903
+ldsi s8808, 2904 # 2904
+ldsi s8810, 2905 # 2905
+ldsi s8812, 2906 # 2906
+ldsi s8814, 2907 # 2907
+ldsi s8816, 2908 # 2908
+ldsi s8818, 2909 # 2909
+ldsi s8820, 2910 # 2910
+ldsi s8822, 2911 # 2911
+ldsi s8824, 2912 # 2912
+ldsi s8826, 2913 # 2913
+ldsi s8828, 2914 # 2914
+ldsi s8830, 2915 # 2915
+ldsi s8832, 2916 # 2916
+ldsi s8834, 2917 # 2917
+ldsi s8836, 2918 # 2918
+ldsi s8838, 2919 # 2919
+ldsi s8840, 2920 # 2920
+ldsi s8842, 2921 # 2921
+ldsi s8844, 2922 # 2922
+ldsi s8846, 2923 # 2923
+ldsi s8848, 2924 # 2924
+ldsi s8850, 2925 # 2925
+ldsi s8852, 2926 # 2926
+ldsi s8854, 2927 # 2927
+ldsi s8856, 2928 # 2928
+ldsi s8858, 2929 # 2929
+ldsi s8860, 2930 # 2930
+ldsi s8862, 2931 # 2931
+ldsi s8864, 2932 # 2932
+ldsi s8866, 2933 # 2933
+ldsi s8868, 2934 # 2934
+ldsi s8870, 2935 # 2935
+ldsi s8872, 2936 # 2936
+ldsi s8874, 2937 # 2937
+ldsi s8876, 2938 # 2938
+ldsi s8878, 2939 # 2939
+ldsi s8880, 2940 # 2940
+ldsi s8882, 2941 # 2941
+ldsi s8884, 2942 # 2942
+ldsi s8886, 2943 # 2943
+ldsi s8888, 2944 # 2944
+ldsi s8890, 2945 # 2945
+ldsi s8892, 2946 # 2946
+ldsi s8894, 2947 # 2947
+ldsi s8896, 2948 # 2948
+ldsi s8898, 2949 # 2949
+ldsi s8900, 2950 # 2950
+ldsi s8902, 2951 # 2951
+ldsi s8904, 2952 # 2952
+ldsi s8906, 2953 # 2953
+ldsi s8908, 2954 # 2954
+ldsi s8910, 2955 # 2955
+ldsi s8912, 2956 # 2956
+ldsi s8914, 2957 # 2957
+ldsi s8916, 2958 # 2958
+ldsi s8918, 2959 # 2959
+ldsi s8920, 2960 # 2960
+ldsi s8922, 2961 # 2961
+ldsi s8924, 2962 # 2962
+ldsi s8926, 2963 # 2963
+ldsi s8928, 2964 # 2964
+ldsi s8930, 2965 # 2965
+ldsi s8932, 2966 # 2966
+ldsi s8934, 2967 # 2967
+ldsi s8936, 2968 # 2968
+ldsi s8938, 2969 # 2969
+ldsi s8940, 2970 # 2970
+ldsi s8942, 2971 # 2971
+ldsi s8944, 2972 # 2972
+ldsi s8946, 2973 # 2973
+ldsi s8948, 2974 # 2974
+ldsi s8950, 2975 # 2975
+ldsi s8952, 2976 # 2976
+ldsi s8954, 2977 # 2977
+ldsi s8956, 2978 # 2978
+ldsi s8958, 2979 # 2979
+ldsi s8960, 2980 # 2980
+ldsi s8962, 2981 # 2981
+ldsi s8964, 2982 # 2982
+ldsi s8966, 2983 # 2983
+ldsi s8968, 2984 # 2984
+ldsi s8970, 2985 # 2985
+ldsi s8972, 2986 # 2986
+ldsi s8974, 2987 # 2987
+ldsi s8976, 2988 # 2988
+ldsi s8978, 2989 # 2989
+ldsi s8980, 2990 # 2990
+ldsi s8982, 2991 # 2991
+ldsi s8984, 2992 # 2992
+ldsi s8986, 2993 # 2993
+ldsi s8988, 2994 # 2994
+ldsi s8990, 2995 # 2995
+ldsi s8992, 2996 # 2996
+ldsi s8994, 2997 # 2997
+ldsi s8996, 2998 # 2998
+ldsi s8998, 2999 # 2999
+addsi s3001, s0, 1 # 3000
+addsi s3003, s3002, 1 # 3001
+addsi s3005, s3004, 1 # 3002
+addsi s3007, s3006, 1 # 3003
+addsi s3009, s3008, 1 # 3004
+addsi s3011, s3010, 1 # 3005
+addsi s3013, s3012, 1 # 3006
+addsi s3015, s3014, 1 # 3007
+addsi s3017, s3016, 1 # 3008
+addsi s3019, s3018, 1 # 3009
+addsi s3021, s3020, 1 # 3010
+addsi s3023, s3022, 1 # 3011
+addsi s3025, s3024, 1 # 3012
+addsi s3027, s3026, 1 # 3013
+addsi s3029, s3028, 1 # 3014
+addsi s3031, s3030, 1 # 3015
+addsi s3033, s3032, 1 # 3016
+addsi s3035, s3034, 1 # 3017
+addsi s3037, s3036, 1 # 3018
+addsi s3039, s3038, 1 # 3019
+addsi s3041, s3040, 1 # 3020
+addsi s3043, s3042, 1 # 3021
+addsi s3045, s3044, 1 # 3022
+addsi s3047, s3046, 1 # 3023
+addsi s3049, s3048, 1 # 3024
+addsi s3051, s3050, 1 # 3025
+addsi s3053, s3052, 1 # 3026
+addsi s3055, s3054, 1 # 3027
+addsi s3057, s3056, 1 # 3028
+addsi s3059, s3058, 1 # 3029
+addsi s3061, s3060, 1 # 3030
+addsi s3063, s3062, 1 # 3031
+addsi s3065, s3064, 1 # 3032
+addsi s3067, s3066, 1 # 3033
+addsi s3069, s3068, 1 # 3034
+addsi s3071, s3070, 1 # 3035
+addsi s3073, s3072, 1 # 3036
+addsi s3075, s3074, 1 # 3037
+addsi s3077, s3076, 1 # 3038
+addsi s3079, s3078, 1 # 3039
+addsi s3081, s3080, 1 # 3040
+addsi s3083, s3082, 1 # 3041
+addsi s3085, s3084, 1 # 3042
+addsi s3087, s3086, 1 # 3043
+addsi s3089, s3088, 1 # 3044
+addsi s3091, s3090, 1 # 3045
+addsi s3093, s3092, 1 # 3046
+addsi s3095, s3094, 1 # 3047
+addsi s3097, s3096, 1 # 3048
+addsi s3099, s3098, 1 # 3049
+addsi s3101, s3100, 1 # 3050
+addsi s3103, s3102, 1 # 3051
+addsi s3105, s3104, 1 # 3052
+addsi s3107, s3106, 1 # 3053
+addsi s3109, s3108, 1 # 3054
+addsi s3111, s3110, 1 # 3055
+addsi s3113, s3112, 1 # 3056
+addsi s3115, s3114, 1 # 3057
+addsi s3117, s3116, 1 # 3058
+addsi s3119, s3118, 1 # 3059
+addsi s3121, s3120, 1 # 3060
+addsi s3123, s3122, 1 # 3061
+addsi s3125, s3124, 1 # 3062
+addsi s3127, s3126, 1 # 3063
+addsi s3129, s3128, 1 # 3064
+addsi s3131, s3130, 1 # 3065
+addsi s3133, s3132, 1 # 3066
+addsi s3135, s3134, 1 # 3067
+addsi s3137, s3136, 1 # 3068
+addsi s3139, s3138, 1 # 3069
+addsi s3141, s3140, 1 # 3070
+addsi s3143, s3142, 1 # 3071
+addsi s3145, s3144, 1 # 3072
+addsi s3147, s3146, 1 # 3073
+addsi s3149, s3148, 1 # 3074
+addsi s3151, s3150, 1 # 3075
+addsi s3153, s3152, 1 # 3076
+addsi s3155, s3154, 1 # 3077
+addsi s3157, s3156, 1 # 3078
+addsi s3159, s3158, 1 # 3079
+addsi s3161, s3160, 1 # 3080
+addsi s3163, s3162, 1 # 3081
+addsi s3165, s3164, 1 # 3082
+addsi s3167, s3166, 1 # 3083
+addsi s3169, s3168, 1 # 3084
+addsi s3171, s3170, 1 # 3085
+addsi s3173, s3172, 1 # 3086
+addsi s3175, s3174, 1 # 3087
+addsi s3177, s3176, 1 # 3088
+addsi s3179, s3178, 1 # 3089
+addsi s3181, s3180, 1 # 3090
+addsi s3183, s3182, 1 # 3091
+addsi s3185, s3184, 1 # 3092
+addsi s3187, s3186, 1 # 3093
+addsi s3189, s3188, 1 # 3094
+addsi s3191, s3190, 1 # 3095
+addsi s3193, s3192, 1 # 3096
+addsi s3195, s3194, 1 # 3097
+addsi s3197, s3196, 1 # 3098
+addsi s3199, s3198, 1 # 3099
+addsi s3201, s3200, 1 # 3100
+addsi s3203, s3202, 1 # 3101
+addsi s3205, s3204, 1 # 3102
+addsi s3207, s3206, 1 # 3103
+addsi s3209, s3208, 1 # 3104
+addsi s3211, s3210, 1 # 3105
+addsi s3213, s3212, 1 # 3106
+addsi s3215, s3214, 1 # 3107
+addsi s3217, s3216, 1 # 3108
+addsi s3219, s3218, 1 # 3109
+addsi s3221, s3220, 1 # 3110
+addsi s3223, s3222, 1 # 3111
+addsi s3225, s3224, 1 # 3112
+addsi s3227, s3226, 1 # 3113
+addsi s3229, s3228, 1 # 3114
+addsi s3231, s3230, 1 # 3115
+addsi s3233, s3232, 1 # 3116
+addsi s3235, s3234, 1 # 3117
+addsi s3237, s3236, 1 # 3118
+addsi s3239, s3238, 1 # 3119
+addsi s3241, s3240, 1 # 3120
+addsi s3243, s3242, 1 # 3121
+addsi s3245, s3244, 1 # 3122
+addsi s3247, s3246, 1 # 3123
+addsi s3249, s3248, 1 # 3124
+addsi s3251, s3250, 1 # 3125
+addsi s3253, s3252, 1 # 3126
+addsi s3255, s3254, 1 # 3127
+addsi s3257, s3256, 1 # 3128
+addsi s3259, s3258, 1 # 3129
+addsi s3261, s3260, 1 # 3130
+addsi s3263, s3262, 1 # 3131
+addsi s3265, s3264, 1 # 3132
+addsi s3267, s3266, 1 # 3133
+addsi s3269, s3268, 1 # 3134
+addsi s3271, s3270, 1 # 3135
+addsi s3273, s3272, 1 # 3136
+addsi s3275, s3274, 1 # 3137
+addsi s3277, s3276, 1 # 3138
+addsi s3279, s3278, 1 # 3139
+addsi s3281, s3280, 1 # 3140
+addsi s3283, s3282, 1 # 3141
+addsi s3285, s3284, 1 # 3142
+addsi s3287, s3286, 1 # 3143
+addsi s3289, s3288, 1 # 3144
+addsi s3291, s3290, 1 # 3145
+addsi s3293, s3292, 1 # 3146
+addsi s3295, s3294, 1 # 3147
+addsi s3297, s3296, 1 # 3148
+addsi s3299, s3298, 1 # 3149
+addsi s3301, s3300, 1 # 3150
+addsi s3303, s3302, 1 # 3151
+addsi s3305, s3304, 1 # 3152
+addsi s3307, s3306, 1 # 3153
+addsi s3309, s3308, 1 # 3154
+addsi s3311, s3310, 1 # 3155
+addsi s3313, s3312, 1 # 3156
+addsi s3315, s3314, 1 # 3157
+addsi s3317, s3316, 1 # 3158
+addsi s3319, s3318, 1 # 3159
+addsi s3321, s3320, 1 # 3160
+addsi s3323, s3322, 1 # 3161
+addsi s3325, s3324, 1 # 3162
+addsi s3327, s3326, 1 # 3163
+addsi s3329, s3328, 1 # 3164
+addsi s3331, s3330, 1 # 3165
+addsi s3333, s3332, 1 # 3166
+addsi s3335, s3334, 1 # 3167
+addsi s3337, s3336, 1 # 3168
+addsi s3339, s3338, 1 # 3169
+addsi s3341, s3340, 1 # 3170
+addsi s3343, s3342, 1 # 3171
+addsi s3345, s3344, 1 # 3172
+addsi s3347, s3346, 1 # 3173
+addsi s3349, s3348, 1 # 3174
+addsi s3351, s3350, 1 # 3175
+addsi s3353, s3352, 1 # 3176
+addsi s3355, s3354, 1 # 3177
+addsi s3357, s3356, 1 # 3178
+addsi s3359, s3358, 1 # 3179
+addsi s3361, s3360, 1 # 3180
+addsi s3363, s3362, 1 # 3181
+addsi s3365, s3364, 1 # 3182
+addsi s3367, s3366, 1 # 3183
+addsi s3369, s3368, 1 # 3184
+addsi s3371, s3370, 1 # 3185
+addsi s3373, s3372, 1 # 3186
+addsi s3375, s3374, 1 # 3187
+addsi s3377, s3376, 1 # 3188
+addsi s3379, s3378, 1 # 3189
+addsi s3381, s3380, 1 # 3190
+addsi s3383, s3382, 1 # 3191
+addsi s3385, s3384, 1 # 3192
+addsi s3387, s3386, 1 # 3193
+addsi s3389, s3388, 1 # 3194
+addsi s3391, s3390, 1 # 3195
+addsi s3393, s3392, 1 # 3196
+addsi s3395, s3394, 1 # 3197
+addsi s3397, s3396, 1 # 3198
+addsi s3399, s3398, 1 # 3199
+addsi s3401, s3400, 1 # 3200
+addsi s3403, s3402, 1 # 3201
+addsi s3405, s3404, 1 # 3202
+addsi s3407, s3406, 1 # 3203
+addsi s3409, s3408, 1 # 3204
+addsi s3411, s3410, 1 # 3205
+addsi s3413, s3412, 1 # 3206
+addsi s3415, s3414, 1 # 3207
+addsi s3417, s3416, 1 # 3208
+addsi s3419, s3418, 1 # 3209
+addsi s3421, s3420, 1 # 3210
+addsi s3423, s3422, 1 # 3211
+addsi s3425, s3424, 1 # 3212
+addsi s3427, s3426, 1 # 3213
+addsi s3429, s3428, 1 # 3214
+addsi s3431, s3430, 1 # 3215
+addsi s3433, s3432, 1 # 3216
+addsi s3435, s3434, 1 # 3217
+addsi s3437, s3436, 1 # 3218
+addsi s3439, s3438, 1 # 3219
+addsi s3441, s3440, 1 # 3220
+addsi s3443, s3442, 1 # 3221
+addsi s3445, s3444, 1 # 3222
+addsi s3447, s3446, 1 # 3223
+addsi s3449, s3448, 1 # 3224
+addsi s3451, s3450, 1 # 3225
+addsi s3453, s3452, 1 # 3226
+addsi s3455, s3454, 1 # 3227
+addsi s3457, s3456, 1 # 3228
+addsi s3459, s3458, 1 # 3229
+addsi s3461, s3460, 1 # 3230
+addsi s3463, s3462, 1 # 3231
+addsi s3465, s3464, 1 # 3232
+addsi s3467, s3466, 1 # 3233
+addsi s3469, s3468, 1 # 3234
+addsi s3471, s3470, 1 # 3235
+addsi s3473, s3472, 1 # 3236
+addsi s3475, s3474, 1 # 3237
+addsi s3477, s3476, 1 # 3238
+addsi s3479, s3478, 1 # 3239
+addsi s3481, s3480, 1 # 3240
+addsi s3483, s3482, 1 # 3241
+addsi s3485, s3484, 1 # 3242
+addsi s3487, s3486, 1 # 3243
+addsi s3489, s3488, 1 # 3244
+addsi s3491, s3490, 1 # 3245
+addsi s3493, s3492, 1 # 3246
+addsi s3495, s3494, 1 # 3247
+addsi s3497, s3496, 1 # 3248
+addsi s3499, s3498, 1 # 3249
+addsi s3501, s3500, 1 # 3250
+addsi s3503, s3502, 1 # 3251
+addsi s3505, s3504, 1 # 3252
+addsi s3507, s3506, 1 # 3253
+addsi s3509, s3508, 1 # 3254
+addsi s3511, s3510, 1 # 3255
+addsi s3513, s3512, 1 # 3256
+addsi s3515, s3514, 1 # 3257
+addsi s3517, s3516, 1 # 3258
+addsi s3519, s3518, 1 # 3259
+addsi s3521, s3520, 1 # 3260
+addsi s3523, s3522, 1 # 3261
+addsi s3525, s3524, 1 # 3262
+addsi s3527, s3526, 1 # 3263
+addsi s3529, s3528, 1 # 3264
+addsi s3531, s3530, 1 # 3265
+addsi s3533, s3532, 1 # 3266
+addsi s3535, s3534, 1 # 3267
+addsi s3537, s3536, 1 # 3268
+addsi s3539, s3538, 1 # 3269
+addsi s3541, s3540, 1 # 3270
+addsi s3543, s3542, 1 # 3271
+addsi s3545, s3544, 1 # 3272
+addsi s3547, s3546, 1 # 3273
+addsi s3549, s3548, 1 # 3274
+addsi s3551, s3550, 1 # 3275
+addsi s3553, s3552, 1 # 3276
+addsi s3555, s3554, 1 # 3277
+addsi s3557, s3556, 1 # 3278
+addsi s3559, s3558, 1 # 3279
+addsi s3561, s3560, 1 # 3280
+addsi s3563, s3562, 1 # 3281
+addsi s3565, s3564, 1 # 3282
+addsi s3567, s3566, 1 # 3283
+addsi s3569, s3568, 1 # 3284
+addsi s3571, s3570, 1 # 3285
+addsi s3573, s3572, 1 # 3286
+addsi s3575, s3574, 1 # 3287
+addsi s3577, s3576, 1 # 3288
+addsi s3579, s3578, 1 # 3289
+addsi s3581, s3580, 1 # 3290
+addsi s3583, s3582, 1 # 3291
+addsi s3585, s3584, 1 # 3292
+addsi s3587, s3586, 1 # 3293
+addsi s3589, s3588, 1 # 3294
+addsi s3591, s3590, 1 # 3295
+addsi s3593, s3592, 1 # 3296
+addsi s3595, s3594, 1 # 3297
+addsi s3597, s3596, 1 # 3298
+addsi s3599, s3598, 1 # 3299
+addsi s3601, s3600, 1 # 3300
+addsi s3603, s3602, 1 # 3301
+addsi s3605, s3604, 1 # 3302
+addsi s3607, s3606, 1 # 3303
+addsi s3609, s3608, 1 # 3304
+addsi s3611, s3610, 1 # 3305
+addsi s3613, s3612, 1 # 3306
+addsi s3615, s3614, 1 # 3307
+addsi s3617, s3616, 1 # 3308
+addsi s3619, s3618, 1 # 3309
+addsi s3621, s3620, 1 # 3310
+addsi s3623, s3622, 1 # 3311
+addsi s3625, s3624, 1 # 3312
+addsi s3627, s3626, 1 # 3313
+addsi s3629, s3628, 1 # 3314
+addsi s3631, s3630, 1 # 3315
+addsi s3633, s3632, 1 # 3316
+addsi s3635, s3634, 1 # 3317
+addsi s3637, s3636, 1 # 3318
+addsi s3639, s3638, 1 # 3319
+addsi s3641, s3640, 1 # 3320
+addsi s3643, s3642, 1 # 3321
+addsi s3645, s3644, 1 # 3322
+addsi s3647, s3646, 1 # 3323
+addsi s3649, s3648, 1 # 3324
+addsi s3651, s3650, 1 # 3325
+addsi s3653, s3652, 1 # 3326
+addsi s3655, s3654, 1 # 3327
+addsi s3657, s3656, 1 # 3328
+addsi s3659, s3658, 1 # 3329
+addsi s3661, s3660, 1 # 3330
+addsi s3663, s3662, 1 # 3331
+addsi s3665, s3664, 1 # 3332
+addsi s3667, s3666, 1 # 3333
+addsi s3669, s3668, 1 # 3334
+addsi s3671, s3670, 1 # 3335
+addsi s3673, s3672, 1 # 3336
+addsi s3675, s3674, 1 # 3337
+addsi s3677, s3676, 1 # 3338
+addsi s3679, s3678, 1 # 3339
+addsi s3681, s3680, 1 # 3340
+addsi s3683, s3682, 1 # 3341
+addsi s3685, s3684, 1 # 3342
+addsi s3687, s3686, 1 # 3343
+addsi s3689, s3688, 1 # 3344
+addsi s3691, s3690, 1 # 3345
+addsi s3693, s3692, 1 # 3346
+addsi s3695, s3694, 1 # 3347
+addsi s3697, s3696, 1 # 3348
+addsi s3699, s3698, 1 # 3349
+addsi s3701, s3700, 1 # 3350
+addsi s3703, s3702, 1 # 3351
+addsi s3705, s3704, 1 # 3352
+addsi s3707, s3706, 1 # 3353
+addsi s3709, s3708, 1 # 3354
+addsi s3711, s3710, 1 # 3355
+addsi s3713, s3712, 1 # 3356
+addsi s3715, s3714, 1 # 3357
+addsi s3717, s3716, 1 # 3358
+addsi s3719, s3718, 1 # 3359
+addsi s3721, s3720, 1 # 3360
+addsi s3723, s3722, 1 # 3361
+addsi s3725, s3724, 1 # 3362
+addsi s3727, s3726, 1 # 3363
+addsi s3729, s3728, 1 # 3364
+addsi s3731, s3730, 1 # 3365
+addsi s3733, s3732, 1 # 3366
+addsi s3735, s3734, 1 # 3367
+addsi s3737, s3736, 1 # 3368
+addsi s3739, s3738, 1 # 3369
+addsi s3741, s3740, 1 # 3370
+addsi s3743, s3742, 1 # 3371
+addsi s3745, s3744, 1 # 3372
+addsi s3747, s3746, 1 # 3373
+addsi s3749, s3748, 1 # 3374
+addsi s3751, s3750, 1 # 3375
+addsi s3753, s3752, 1 # 3376
+addsi s3755, s3754, 1 # 3377
+addsi s3757, s3756, 1 # 3378
+addsi s3759, s3758, 1 # 3379
+addsi s3761, s3760, 1 # 3380
+addsi s3763, s3762, 1 # 3381
+addsi s3765, s3764, 1 # 3382
+addsi s3767, s3766, 1 # 3383
+addsi s3769, s3768, 1 # 3384
+addsi s3771, s3770, 1 # 3385
+addsi s3773, s3772, 1 # 3386
+addsi s3775, s3774, 1 # 3387
+addsi s3777, s3776, 1 # 3388
+addsi s3779, s3778, 1 # 3389
+addsi s3781, s3780, 1 # 3390
+addsi s3783, s3782, 1 # 3391
+addsi s3785, s3784, 1 # 3392
+addsi s3787, s3786, 1 # 3393
+addsi s3789, s3788, 1 # 3394
+addsi s3791, s3790, 1 # 3395
+addsi s3793, s3792, 1 # 3396
+addsi s3795, s3794, 1 # 3397
+addsi s3797, s3796, 1 # 3398
+addsi s3799, s3798, 1 # 3399
+addsi s3801, s3800, 1 # 3400
+addsi s3803, s3802, 1 # 3401
+addsi s3805, s3804, 1 # 3402
+addsi s3807, s3806, 1 # 3403
+addsi s3809, s3808, 1 # 3404
+addsi s3811, s3810, 1 # 3405
+addsi s3813, s3812, 1 # 3406
+addsi s3815, s3814, 1 # 3407
+addsi s3817, s3816, 1 # 3408
+addsi s3819, s3818, 1 # 3409
+addsi s3821, s3820, 1 # 3410
+addsi s3823, s3822, 1 # 3411
+addsi s3825, s3824, 1 # 3412
+addsi s3827, s3826, 1 # 3413
+addsi s3829, s3828, 1 # 3414
+addsi s3831, s3830, 1 # 3415
+addsi s3833, s3832, 1 # 3416
+addsi s3835, s3834, 1 # 3417
+addsi s3837, s3836, 1 # 3418
+addsi s3839, s3838, 1 # 3419
+addsi s3841, s3840, 1 # 3420
+addsi s3843, s3842, 1 # 3421
+addsi s3845, s3844, 1 # 3422
+addsi s3847, s3846, 1 # 3423
+addsi s3849, s3848, 1 # 3424
+addsi s3851, s3850, 1 # 3425
+addsi s3853, s3852, 1 # 3426
+addsi s3855, s3854, 1 # 3427
+addsi s3857, s3856, 1 # 3428
+addsi s3859, s3858, 1 # 3429
+addsi s3861, s3860, 1 # 3430
+addsi s3863, s3862, 1 # 3431
+addsi s3865, s3864, 1 # 3432
+addsi s3867, s3866, 1 # 3433
+addsi s3869, s3868, 1 # 3434
+addsi s3871, s3870, 1 # 3435
+addsi s3873, s3872, 1 # 3436
+addsi s3875, s3874, 1 # 3437
+addsi s3877, s3876, 1 # 3438
+addsi s3879, s3878, 1 # 3439
+addsi s3881, s3880, 1 # 3440
+addsi s3883, s3882, 1 # 3441
+addsi s3885, s3884, 1 # 3442
+addsi s3887, s3886, 1 # 3443
+addsi s3889, s3888, 1 # 3444
+addsi s3891, s3890, 1 # 3445
+addsi s3893, s3892, 1 # 3446
+addsi s3895, s3894, 1 # 3447
+addsi s3897, s3896, 1 # 3448
+addsi s3899, s3898, 1 # 3449
+addsi s3901, s3900, 1 # 3450
+addsi s3903, s3902, 1 # 3451
+addsi s3905, s3904, 1 # 3452
+addsi s3907, s3906, 1 # 3453
+addsi s3909, s3908, 1 # 3454
+addsi s3911, s3910, 1 # 3455
+addsi s3913, s3912, 1 # 3456
+addsi s3915, s3914, 1 # 3457
+addsi s3917, s3916, 1 # 3458
+addsi s3919, s3918, 1 # 3459
+addsi s3921, s3920, 1 # 3460
+addsi s3923, s3922, 1 # 3461
+addsi s3925, s3924, 1 # 3462
+addsi s3927, s3926, 1 # 3463
+addsi s3929, s3928, 1 # 3464
+addsi s3931, s3930, 1 # 3465
+addsi s3933, s3932, 1 # 3466
+addsi s3935, s3934, 1 # 3467
+addsi s3937, s3936, 1 # 3468
+addsi s3939, s3938, 1 # 3469
+addsi s3941, s3940, 1 # 3470
+addsi s3943, s3942, 1 # 3471
+addsi s3945, s3944, 1 # 3472
+addsi s3947, s3946, 1 # 3473
+addsi s3949, s3948, 1 # 3474
+addsi s3951, s3950, 1 # 3475
+addsi s3953, s3952, 1 # 3476
+addsi s3955, s3954, 1 # 3477
+addsi s3957, s3956, 1 # 3478
+addsi s3959, s3958, 1 # 3479
+addsi s3961, s3960, 1 # 3480
+addsi s3963, s3962, 1 # 3481
+addsi s3965, s3964, 1 # 3482
+addsi s3967, s3966, 1 # 3483
+addsi s3969, s3968, 1 # 3484
+addsi s3971, s3970, 1 # 3485
+addsi s3973, s3972, 1 # 3486
+addsi s3975, s3974, 1 # 3487
+addsi s3977, s3976, 1 # 3488
+addsi s3979, s3978, 1 # 3489
+addsi s3981, s3980, 1 # 3490
+addsi s3983, s3982, 1 # 3491
+addsi s3985, s3984, 1 # 3492
+addsi s3987, s3986, 1 # 3493
+addsi s3989, s3988, 1 # 3494
+addsi s3991, s3990, 1 # 3495
+addsi s3993, s3992, 1 # 3496
+addsi s3995, s3994, 1 # 3497
+addsi s3997, s3996, 1 # 3498
+addsi s3999, s3998, 1 # 3499
+addsi s4001, s4000, 1 # 3500
+addsi s4003, s4002, 1 # 3501
+addsi s4005, s4004, 1 # 3502
+addsi s4007, s4006, 1 # 3503
+addsi s4009, s4008, 1 # 3504
+addsi s4011, s4010, 1 # 3505
+addsi s4013, s4012, 1 # 3506
+addsi s4015, s4014, 1 # 3507
+addsi s4017, s4016, 1 # 3508
+addsi s4019, s4018, 1 # 3509
+addsi s4021, s4020, 1 # 3510
+addsi s4023, s4022, 1 # 3511
+addsi s4025, s4024, 1 # 3512
+addsi s4027, s4026, 1 # 3513
+addsi s4029, s4028, 1 # 3514
+addsi s4031, s4030, 1 # 3515
+addsi s4033, s4032, 1 # 3516
+addsi s4035, s4034, 1 # 3517
+addsi s4037, s4036, 1 # 3518
+addsi s4039, s4038, 1 # 3519
+addsi s4041, s4040, 1 # 3520
+addsi s4043, s4042, 1 # 3521
+addsi s4045, s4044, 1 # 3522
+addsi s4047, s4046, 1 # 3523
+addsi s4049, s4048, 1 # 3524
+addsi s4051, s4050, 1 # 3525
+addsi s4053, s4052, 1 # 3526
+addsi s4055, s4054, 1 # 3527
+addsi s4057, s4056, 1 # 3528
+addsi s4059, s4058, 1 # 3529
+addsi s4061, s4060, 1 # 3530
+addsi s4063, s4062, 1 # 3531
+addsi s4065, s4064, 1 # 3532
+addsi s4067, s4066, 1 # 3533
+addsi s4069, s4068, 1 # 3534
+addsi s4071, s4070, 1 # 3535
+addsi s4073, s4072, 1 # 3536
+addsi s4075, s4074, 1 # 3537
+addsi s4077, s4076, 1 # 3538
+addsi s4079, s4078, 1 # 3539
+addsi s4081, s4080, 1 # 3540
+addsi s4083, s4082, 1 # 3541
+addsi s4085, s4084, 1 # 3542
+addsi s4087, s4086, 1 # 3543
+addsi s4089, s4088, 1 # 3544
+addsi s4091, s4090, 1 # 3545
+addsi s4093, s4092, 1 # 3546
+addsi s4095, s4094, 1 # 3547
+addsi s4097, s4096, 1 # 3548
+addsi s4099, s4098, 1 # 3549
+addsi s4101, s4100, 1 # 3550
+addsi s4103, s4102, 1 # 3551
+addsi s4105, s4104, 1 # 3552
+addsi s4107, s4106, 1 # 3553
+addsi s4109, s4108, 1 # 3554
+addsi s4111, s4110, 1 # 3555
+addsi s4113, s4112, 1 # 3556
+addsi s4115, s4114, 1 # 3557
+addsi s4117, s4116, 1 # 3558
+addsi s4119, s4118, 1 # 3559
+addsi s4121, s4120, 1 # 3560
+addsi s4123, s4122, 1 # 3561
+addsi s4125, s4124, 1 # 3562
+addsi s4127, s4126, 1 # 3563
+addsi s4129, s4128, 1 # 3564
+addsi s4131, s4130, 1 # 3565
+addsi s4133, s4132, 1 # 3566
+addsi s4135, s4134, 1 # 3567
+addsi s4137, s4136, 1 # 3568
+addsi s4139, s4138, 1 # 3569
+addsi s4141, s4140, 1 # 3570
+addsi s4143, s4142, 1 # 3571
+addsi s4145, s4144, 1 # 3572
+addsi s4147, s4146, 1 # 3573
+addsi s4149, s4148, 1 # 3574
+addsi s4151, s4150, 1 # 3575
+addsi s4153, s4152, 1 # 3576
+addsi s4155, s4154, 1 # 3577
+addsi s4157, s4156, 1 # 3578
+addsi s4159, s4158, 1 # 3579
+addsi s4161, s4160, 1 # 3580
+addsi s4163, s4162, 1 # 3581
+addsi s4165, s4164, 1 # 3582
+addsi s4167, s4166, 1 # 3583
+addsi s4169, s4168, 1 # 3584
+addsi s4171, s4170, 1 # 3585
+addsi s4173, s4172, 1 # 3586
+addsi s4175, s4174, 1 # 3587
+addsi s4177, s4176, 1 # 3588
+addsi s4179, s4178, 1 # 3589
+addsi s4181, s4180, 1 # 3590
+addsi s4183, s4182, 1 # 3591
+addsi s4185, s4184, 1 # 3592
+addsi s4187, s4186, 1 # 3593
+addsi s4189, s4188, 1 # 3594
+addsi s4191, s4190, 1 # 3595
+addsi s4193, s4192, 1 # 3596
+addsi s4195, s4194, 1 # 3597
+addsi s4197, s4196, 1 # 3598
+addsi s4199, s4198, 1 # 3599
+addsi s4201, s4200, 1 # 3600
+addsi s4203, s4202, 1 # 3601
+addsi s4205, s4204, 1 # 3602
+addsi s4207, s4206, 1 # 3603
+addsi s4209, s4208, 1 # 3604
+addsi s4211, s4210, 1 # 3605
+addsi s4213, s4212, 1 # 3606
+addsi s4215, s4214, 1 # 3607
+addsi s4217, s4216, 1 # 3608
+addsi s4219, s4218, 1 # 3609
+addsi s4221, s4220, 1 # 3610
+addsi s4223, s4222, 1 # 3611
+addsi s4225, s4224, 1 # 3612
+addsi s4227, s4226, 1 # 3613
+addsi s4229, s4228, 1 # 3614
+addsi s4231, s4230, 1 # 3615
+addsi s4233, s4232, 1 # 3616
+addsi s4235, s4234, 1 # 3617
+addsi s4237, s4236, 1 # 3618
+addsi s4239, s4238, 1 # 3619
+addsi s4241, s4240, 1 # 3620
+addsi s4243, s4242, 1 # 3621
+addsi s4245, s4244, 1 # 3622
+addsi s4247, s4246, 1 # 3623
+addsi s4249, s4248, 1 # 3624
+addsi s4251, s4250, 1 # 3625
+addsi s4253, s4252, 1 # 3626
+addsi s4255, s4254, 1 # 3627
+addsi s4257, s4256, 1 # 3628
+addsi s4259, s4258, 1 # 3629
+addsi s4261, s4260, 1 # 3630
+addsi s4263, s4262, 1 # 3631
+addsi s4265, s4264, 1 # 3632
+addsi s4267, s4266, 1 # 3633
+addsi s4269, s4268, 1 # 3634
+addsi s4271, s4270, 1 # 3635
+addsi s4273, s4272, 1 # 3636
+addsi s4275, s4274, 1 # 3637
+addsi s4277, s4276, 1 # 3638
+addsi s4279, s4278, 1 # 3639
+addsi s4281, s4280, 1 # 3640
+addsi s4283, s4282, 1 # 3641
+addsi s4285, s4284, 1 # 3642
+addsi s4287, s4286, 1 # 3643
+addsi s4289, s4288, 1 # 3644
+addsi s4291, s4290, 1 # 3645
+addsi s4293, s4292, 1 # 3646
+addsi s4295, s4294, 1 # 3647
+addsi s4297, s4296, 1 # 3648
+addsi s4299, s4298, 1 # 3649
+addsi s4301, s4300, 1 # 3650
+addsi s4303, s4302, 1 # 3651
+addsi s4305, s4304, 1 # 3652
+addsi s4307, s4306, 1 # 3653
+addsi s4309, s4308, 1 # 3654
+addsi s4311, s4310, 1 # 3655
+addsi s4313, s4312, 1 # 3656
+addsi s4315, s4314, 1 # 3657
+addsi s4317, s4316, 1 # 3658
+addsi s4319, s4318, 1 # 3659
+addsi s4321, s4320, 1 # 3660
+addsi s4323, s4322, 1 # 3661
+addsi s4325, s4324, 1 # 3662
+addsi s4327, s4326, 1 # 3663
+addsi s4329, s4328, 1 # 3664
+addsi s4331, s4330, 1 # 3665
+addsi s4333, s4332, 1 # 3666
+addsi s4335, s4334, 1 # 3667
+addsi s4337, s4336, 1 # 3668
+addsi s4339, s4338, 1 # 3669
+addsi s4341, s4340, 1 # 3670
+addsi s4343, s4342, 1 # 3671
+addsi s4345, s4344, 1 # 3672
+addsi s4347, s4346, 1 # 3673
+addsi s4349, s4348, 1 # 3674
+addsi s4351, s4350, 1 # 3675
+addsi s4353, s4352, 1 # 3676
+addsi s4355, s4354, 1 # 3677
+addsi s4357, s4356, 1 # 3678
+addsi s4359, s4358, 1 # 3679
+addsi s4361, s4360, 1 # 3680
+addsi s4363, s4362, 1 # 3681
+addsi s4365, s4364, 1 # 3682
+addsi s4367, s4366, 1 # 3683
+addsi s4369, s4368, 1 # 3684
+addsi s4371, s4370, 1 # 3685
+addsi s4373, s4372, 1 # 3686
+addsi s4375, s4374, 1 # 3687
+addsi s4377, s4376, 1 # 3688
+addsi s4379, s4378, 1 # 3689
+addsi s4381, s4380, 1 # 3690
+addsi s4383, s4382, 1 # 3691
+addsi s4385, s4384, 1 # 3692
+addsi s4387, s4386, 1 # 3693
+addsi s4389, s4388, 1 # 3694
+addsi s4391, s4390, 1 # 3695
+addsi s4393, s4392, 1 # 3696
+addsi s4395, s4394, 1 # 3697
+addsi s4397, s4396, 1 # 3698
+addsi s4399, s4398, 1 # 3699
+addsi s4401, s4400, 1 # 3700
+addsi s4403, s4402, 1 # 3701
+addsi s4405, s4404, 1 # 3702
+addsi s4407, s4406, 1 # 3703
+addsi s4409, s4408, 1 # 3704
+addsi s4411, s4410, 1 # 3705
+addsi s4413, s4412, 1 # 3706
+addsi s4415, s4414, 1 # 3707
+addsi s4417, s4416, 1 # 3708
+addsi s4419, s4418, 1 # 3709
+addsi s4421, s4420, 1 # 3710
+addsi s4423, s4422, 1 # 3711
+addsi s4425, s4424, 1 # 3712
+addsi s4427, s4426, 1 # 3713
+addsi s4429, s4428, 1 # 3714
+addsi s4431, s4430, 1 # 3715
+addsi s4433, s4432, 1 # 3716
+addsi s4435, s4434, 1 # 3717
+addsi s4437, s4436, 1 # 3718
+addsi s4439, s4438, 1 # 3719
+addsi s4441, s4440, 1 # 3720
+addsi s4443, s4442, 1 # 3721
+addsi s4445, s4444, 1 # 3722
+addsi s4447, s4446, 1 # 3723
+addsi s4449, s4448, 1 # 3724
+addsi s4451, s4450, 1 # 3725
+addsi s4453, s4452, 1 # 3726
+addsi s4455, s4454, 1 # 3727
+addsi s4457, s4456, 1 # 3728
+addsi s4459, s4458, 1 # 3729
+addsi s4461, s4460, 1 # 3730
+addsi s4463, s4462, 1 # 3731
+addsi s4465, s4464, 1 # 3732
+addsi s4467, s4466, 1 # 3733
+addsi s4469, s4468, 1 # 3734
+addsi s4471, s4470, 1 # 3735
+addsi s4473, s4472, 1 # 3736
+addsi s4475, s4474, 1 # 3737
+addsi s4477, s4476, 1 # 3738
+addsi s4479, s4478, 1 # 3739
+addsi s4481, s4480, 1 # 3740
+addsi s4483, s4482, 1 # 3741
+addsi s4485, s4484, 1 # 3742
+addsi s4487, s4486, 1 # 3743
+addsi s4489, s4488, 1 # 3744
+addsi s4491, s4490, 1 # 3745
+addsi s4493, s4492, 1 # 3746
+addsi s4495, s4494, 1 # 3747
+addsi s4497, s4496, 1 # 3748
+addsi s4499, s4498, 1 # 3749
+addsi s4501, s4500, 1 # 3750
+addsi s4503, s4502, 1 # 3751
+addsi s4505, s4504, 1 # 3752
+addsi s4507, s4506, 1 # 3753
+addsi s4509, s4508, 1 # 3754
+addsi s4511, s4510, 1 # 3755
+addsi s4513, s4512, 1 # 3756
+addsi s4515, s4514, 1 # 3757
+addsi s4517, s4516, 1 # 3758
+addsi s4519, s4518, 1 # 3759
+addsi s4521, s4520, 1 # 3760
+addsi s4523, s4522, 1 # 3761
+addsi s4525, s4524, 1 # 3762
+addsi s4527, s4526, 1 # 3763
+addsi s4529, s4528, 1 # 3764
+addsi s4531, s4530, 1 # 3765
+addsi s4533, s4532, 1 # 3766
+addsi s4535, s4534, 1 # 3767
+addsi s4537, s4536, 1 # 3768
+addsi s4539, s4538, 1 # 3769
+addsi s4541, s4540, 1 # 3770
+addsi s4543, s4542, 1 # 3771
+addsi s4545, s4544, 1 # 3772
+addsi s4547, s4546, 1 # 3773
+addsi s4549, s4548, 1 # 3774
+addsi s4551, s4550, 1 # 3775
+addsi s4553, s4552, 1 # 3776
+addsi s4555, s4554, 1 # 3777
+addsi s4557, s4556, 1 # 3778
+addsi s4559, s4558, 1 # 3779
+addsi s4561, s4560, 1 # 3780
+addsi s4563, s4562, 1 # 3781
+addsi s4565, s4564, 1 # 3782
+addsi s4567, s4566, 1 # 3783
+addsi s4569, s4568, 1 # 3784
+addsi s4571, s4570, 1 # 3785
+addsi s4573, s4572, 1 # 3786
+addsi s4575, s4574, 1 # 3787
+addsi s4577, s4576, 1 # 3788
+addsi s4579, s4578, 1 # 3789
+addsi s4581, s4580, 1 # 3790
+addsi s4583, s4582, 1 # 3791
+addsi s4585, s4584, 1 # 3792
+addsi s4587, s4586, 1 # 3793
+addsi s4589, s4588, 1 # 3794
+addsi s4591, s4590, 1 # 3795
+addsi s4593, s4592, 1 # 3796
+addsi s4595, s4594, 1 # 3797
+addsi s4597, s4596, 1 # 3798
+addsi s4599, s4598, 1 # 3799
+addsi s4601, s4600, 1 # 3800
+addsi s4603, s4602, 1 # 3801
+addsi s4605, s4604, 1 # 3802
+addsi s4607, s4606, 1 # 3803
+addsi s4609, s4608, 1 # 3804
+addsi s4611, s4610, 1 # 3805
+addsi s4613, s4612, 1 # 3806
+addsi s4615, s4614, 1 # 3807
+addsi s4617, s4616, 1 # 3808
+addsi s4619, s4618, 1 # 3809
+addsi s4621, s4620, 1 # 3810
+addsi s4623, s4622, 1 # 3811
+addsi s4625, s4624, 1 # 3812
+addsi s4627, s4626, 1 # 3813
+addsi s4629, s4628, 1 # 3814
+addsi s4631, s4630, 1 # 3815
+addsi s4633, s4632, 1 # 3816
+addsi s4635, s4634, 1 # 3817
+addsi s4637, s4636, 1 # 3818
+addsi s4639, s4638, 1 # 3819
+addsi s4641, s4640, 1 # 3820
+addsi s4643, s4642, 1 # 3821
+addsi s4645, s4644, 1 # 3822
+addsi s4647, s4646, 1 # 3823
+addsi s4649, s4648, 1 # 3824
+addsi s4651, s4650, 1 # 3825
+addsi s4653, s4652, 1 # 3826
+addsi s4655, s4654, 1 # 3827
+addsi s4657, s4656, 1 # 3828
+addsi s4659, s4658, 1 # 3829
+addsi s4661, s4660, 1 # 3830
+addsi s4663, s4662, 1 # 3831
+addsi s4665, s4664, 1 # 3832
+addsi s4667, s4666, 1 # 3833
+addsi s4669, s4668, 1 # 3834
+addsi s4671, s4670, 1 # 3835
+addsi s4673, s4672, 1 # 3836
+addsi s4675, s4674, 1 # 3837
+addsi s4677, s4676, 1 # 3838
+addsi s4679, s4678, 1 # 3839
+addsi s4681, s4680, 1 # 3840
+addsi s4683, s4682, 1 # 3841
+addsi s4685, s4684, 1 # 3842
+addsi s4687, s4686, 1 # 3843
+addsi s4689, s4688, 1 # 3844
+addsi s4691, s4690, 1 # 3845
+addsi s4693, s4692, 1 # 3846
+addsi s4695, s4694, 1 # 3847
+addsi s4697, s4696, 1 # 3848
+addsi s4699, s4698, 1 # 3849
+addsi s4701, s4700, 1 # 3850
+addsi s4703, s4702, 1 # 3851
+addsi s4705, s4704, 1 # 3852
+addsi s4707, s4706, 1 # 3853
+addsi s4709, s4708, 1 # 3854
+addsi s4711, s4710, 1 # 3855
+addsi s4713, s4712, 1 # 3856
+addsi s4715, s4714, 1 # 3857
+addsi s4717, s4716, 1 # 3858
+addsi s4719, s4718, 1 # 3859
+addsi s4721, s4720, 1 # 3860
+addsi s4723, s4722, 1 # 3861
+addsi s4725, s4724, 1 # 3862
+addsi s4727, s4726, 1 # 3863
+addsi s4729, s4728, 1 # 3864
+addsi s4731, s4730, 1 # 3865
+addsi s4733, s4732, 1 # 3866
+addsi s4735, s4734, 1 # 3867
+addsi s4737, s4736, 1 # 3868
+addsi s4739, s4738, 1 # 3869
+addsi s4741, s4740, 1 # 3870
+addsi s4743, s4742, 1 # 3871
+addsi s4745, s4744, 1 # 3872
+addsi s4747, s4746, 1 # 3873
+addsi s4749, s4748, 1 # 3874
+addsi s4751, s4750, 1 # 3875
+addsi s4753, s4752, 1 # 3876
+addsi s4755, s4754, 1 # 3877
+addsi s4757, s4756, 1 # 3878
+addsi s4759, s4758, 1 # 3879
+addsi s4761, s4760, 1 # 3880
+addsi s4763, s4762, 1 # 3881
+addsi s4765, s4764, 1 # 3882
+addsi s4767, s4766, 1 # 3883
+addsi s4769, s4768, 1 # 3884
+addsi s4771, s4770, 1 # 3885
+addsi s4773, s4772, 1 # 3886
+addsi s4775, s4774, 1 # 3887
+addsi s4777, s4776, 1 # 3888
+addsi s4779, s4778, 1 # 3889
+addsi s4781, s4780, 1 # 3890
+addsi s4783, s4782, 1 # 3891
+addsi s4785, s4784, 1 # 3892
+addsi s4787, s4786, 1 # 3893
+addsi s4789, s4788, 1 # 3894
+addsi s4791, s4790, 1 # 3895
+addsi s4793, s4792, 1 # 3896
+addsi s4795, s4794, 1 # 3897
+addsi s4797, s4796, 1 # 3898
+addsi s4799, s4798, 1 # 3899
+addsi s4801, s4800, 1 # 3900
+addsi s4803, s4802, 1 # 3901
+addsi s4805, s4804, 1 # 3902
+addsi s4807, s4806, 1 # 3903
+addsi s4809, s4808, 1 # 3904
+addsi s4811, s4810, 1 # 3905
+addsi s4813, s4812, 1 # 3906
+addsi s4815, s4814, 1 # 3907
+addsi s4817, s4816, 1 # 3908
+addsi s4819, s4818, 1 # 3909
+addsi s4821, s4820, 1 # 3910
+addsi s4823, s4822, 1 # 3911
+addsi s4825, s4824, 1 # 3912
+addsi s4827, s4826, 1 # 3913
+addsi s4829, s4828, 1 # 3914
+addsi s4831, s4830, 1 # 3915
+addsi s4833, s4832, 1 # 3916
+addsi s4835, s4834, 1 # 3917
+addsi s4837, s4836, 1 # 3918
+addsi s4839, s4838, 1 # 3919
+addsi s4841, s4840, 1 # 3920
+addsi s4843, s4842, 1 # 3921
+addsi s4845, s4844, 1 # 3922
+addsi s4847, s4846, 1 # 3923
+addsi s4849, s4848, 1 # 3924
+addsi s4851, s4850, 1 # 3925
+addsi s4853, s4852, 1 # 3926
+addsi s4855, s4854, 1 # 3927
+addsi s4857, s4856, 1 # 3928
+addsi s4859, s4858, 1 # 3929
+addsi s4861, s4860, 1 # 3930
+addsi s4863, s4862, 1 # 3931
+addsi s4865, s4864, 1 # 3932
+addsi s4867, s4866, 1 # 3933
+addsi s4869, s4868, 1 # 3934
+addsi s4871, s4870, 1 # 3935
+addsi s4873, s4872, 1 # 3936
+addsi s4875, s4874, 1 # 3937
+addsi s4877, s4876, 1 # 3938
+addsi s4879, s4878, 1 # 3939
+addsi s4881, s4880, 1 # 3940
+addsi s4883, s4882, 1 # 3941
+addsi s4885, s4884, 1 # 3942
+addsi s4887, s4886, 1 # 3943
+addsi s4889, s4888, 1 # 3944
+addsi s4891, s4890, 1 # 3945
+addsi s4893, s4892, 1 # 3946
+addsi s4895, s4894, 1 # 3947
+addsi s4897, s4896, 1 # 3948
+addsi s4899, s4898, 1 # 3949
+addsi s4901, s4900, 1 # 3950
+addsi s4903, s4902, 1 # 3951
+addsi s4905, s4904, 1 # 3952
+addsi s4907, s4906, 1 # 3953
+addsi s4909, s4908, 1 # 3954
+addsi s4911, s4910, 1 # 3955
+addsi s4913, s4912, 1 # 3956
+addsi s4915, s4914, 1 # 3957
+addsi s4917, s4916, 1 # 3958
+addsi s4919, s4918, 1 # 3959
+addsi s4921, s4920, 1 # 3960
+addsi s4923, s4922, 1 # 3961
+addsi s4925, s4924, 1 # 3962
+addsi s4927, s4926, 1 # 3963
+addsi s4929, s4928, 1 # 3964
+addsi s4931, s4930, 1 # 3965
+addsi s4933, s4932, 1 # 3966
+addsi s4935, s4934, 1 # 3967
+addsi s4937, s4936, 1 # 3968
+addsi s4939, s4938, 1 # 3969
+addsi s4941, s4940, 1 # 3970
+addsi s4943, s4942, 1 # 3971
+addsi s4945, s4944, 1 # 3972
+addsi s4947, s4946, 1 # 3973
+addsi s4949, s4948, 1 # 3974
+addsi s4951, s4950, 1 # 3975
+addsi s4953, s4952, 1 # 3976
+addsi s4955, s4954, 1 # 3977
+addsi s4957, s4956, 1 # 3978
+addsi s4959, s4958, 1 # 3979
+addsi s4961, s4960, 1 # 3980
+addsi s4963, s4962, 1 # 3981
+addsi s4965, s4964, 1 # 3982
+addsi s4967, s4966, 1 # 3983
+addsi s4969, s4968, 1 # 3984
+addsi s4971, s4970, 1 # 3985
+addsi s4973, s4972, 1 # 3986
+addsi s4975, s4974, 1 # 3987
+addsi s4977, s4976, 1 # 3988
+addsi s4979, s4978, 1 # 3989
+addsi s4981, s4980, 1 # 3990
+addsi s4983, s4982, 1 # 3991
+addsi s4985, s4984, 1 # 3992
+addsi s4987, s4986, 1 # 3993
+addsi s4989, s4988, 1 # 3994
+addsi s4991, s4990, 1 # 3995
+addsi s4993, s4992, 1 # 3996
+addsi s4995, s4994, 1 # 3997
+addsi s4997, s4996, 1 # 3998
+addsi s4999, s4998, 1 # 3999
+addsi s5001, s5000, 1 # 4000
+addsi s5003, s5002, 1 # 4001
+addsi s5005, s5004, 1 # 4002
+addsi s5007, s5006, 1 # 4003
+addsi s5009, s5008, 1 # 4004
+addsi s5011, s5010, 1 # 4005
+addsi s5013, s5012, 1 # 4006
+addsi s5015, s5014, 1 # 4007
+addsi s5017, s5016, 1 # 4008
+addsi s5019, s5018, 1 # 4009
+addsi s5021, s5020, 1 # 4010
+addsi s5023, s5022, 1 # 4011
+addsi s5025, s5024, 1 # 4012
+addsi s5027, s5026, 1 # 4013
+addsi s5029, s5028, 1 # 4014
+addsi s5031, s5030, 1 # 4015
+addsi s5033, s5032, 1 # 4016
+addsi s5035, s5034, 1 # 4017
+addsi s5037, s5036, 1 # 4018
+addsi s5039, s5038, 1 # 4019
+addsi s5041, s5040, 1 # 4020
+addsi s5043, s5042, 1 # 4021
+addsi s5045, s5044, 1 # 4022
+addsi s5047, s5046, 1 # 4023
+addsi s5049, s5048, 1 # 4024
+addsi s5051, s5050, 1 # 4025
+addsi s5053, s5052, 1 # 4026
+addsi s5055, s5054, 1 # 4027
+addsi s5057, s5056, 1 # 4028
+addsi s5059, s5058, 1 # 4029
+addsi s5061, s5060, 1 # 4030
+addsi s5063, s5062, 1 # 4031
+addsi s5065, s5064, 1 # 4032
+addsi s5067, s5066, 1 # 4033
+addsi s5069, s5068, 1 # 4034
+addsi s5071, s5070, 1 # 4035
+addsi s5073, s5072, 1 # 4036
+addsi s5075, s5074, 1 # 4037
+addsi s5077, s5076, 1 # 4038
+addsi s5079, s5078, 1 # 4039
+addsi s5081, s5080, 1 # 4040
+addsi s5083, s5082, 1 # 4041
+addsi s5085, s5084, 1 # 4042
+addsi s5087, s5086, 1 # 4043
+addsi s5089, s5088, 1 # 4044
+addsi s5091, s5090, 1 # 4045
+addsi s5093, s5092, 1 # 4046
+addsi s5095, s5094, 1 # 4047
+addsi s5097, s5096, 1 # 4048
+addsi s5099, s5098, 1 # 4049
+addsi s5101, s5100, 1 # 4050
+addsi s5103, s5102, 1 # 4051
+addsi s5105, s5104, 1 # 4052
+addsi s5107, s5106, 1 # 4053
+addsi s5109, s5108, 1 # 4054
+addsi s5111, s5110, 1 # 4055
+addsi s5113, s5112, 1 # 4056
+addsi s5115, s5114, 1 # 4057
+addsi s5117, s5116, 1 # 4058
+addsi s5119, s5118, 1 # 4059
+addsi s5121, s5120, 1 # 4060
+addsi s5123, s5122, 1 # 4061
+addsi s5125, s5124, 1 # 4062
+addsi s5127, s5126, 1 # 4063
+addsi s5129, s5128, 1 # 4064
+addsi s5131, s5130, 1 # 4065
+addsi s5133, s5132, 1 # 4066
+addsi s5135, s5134, 1 # 4067
+addsi s5137, s5136, 1 # 4068
+addsi s5139, s5138, 1 # 4069
+addsi s5141, s5140, 1 # 4070
+addsi s5143, s5142, 1 # 4071
+addsi s5145, s5144, 1 # 4072
+addsi s5147, s5146, 1 # 4073
+addsi s5149, s5148, 1 # 4074
+addsi s5151, s5150, 1 # 4075
+addsi s5153, s5152, 1 # 4076
+addsi s5155, s5154, 1 # 4077
+addsi s5157, s5156, 1 # 4078
+addsi s5159, s5158, 1 # 4079
+addsi s5161, s5160, 1 # 4080
+addsi s5163, s5162, 1 # 4081
+addsi s5165, s5164, 1 # 4082
+addsi s5167, s5166, 1 # 4083
+addsi s5169, s5168, 1 # 4084
+addsi s5171, s5170, 1 # 4085
+addsi s5173, s5172, 1 # 4086
+addsi s5175, s5174, 1 # 4087
+addsi s5177, s5176, 1 # 4088
+addsi s5179, s5178, 1 # 4089
+addsi s5181, s5180, 1 # 4090
+addsi s5183, s5182, 1 # 4091
+addsi s5185, s5184, 1 # 4092
+addsi s5187, s5186, 1 # 4093
+addsi s5189, s5188, 1 # 4094
+addsi s5191, s5190, 1 # 4095
+addsi s5193, s5192, 1 # 4096
+addsi s5195, s5194, 1 # 4097
+addsi s5197, s5196, 1 # 4098
+addsi s5199, s5198, 1 # 4099
+addsi s5201, s5200, 1 # 4100
+addsi s5203, s5202, 1 # 4101
+addsi s5205, s5204, 1 # 4102
+addsi s5207, s5206, 1 # 4103
+addsi s5209, s5208, 1 # 4104
+addsi s5211, s5210, 1 # 4105
+addsi s5213, s5212, 1 # 4106
+addsi s5215, s5214, 1 # 4107
+addsi s5217, s5216, 1 # 4108
+addsi s5219, s5218, 1 # 4109
+addsi s5221, s5220, 1 # 4110
+addsi s5223, s5222, 1 # 4111
+addsi s5225, s5224, 1 # 4112
+addsi s5227, s5226, 1 # 4113
+addsi s5229, s5228, 1 # 4114
+addsi s5231, s5230, 1 # 4115
+addsi s5233, s5232, 1 # 4116
+addsi s5235, s5234, 1 # 4117
+addsi s5237, s5236, 1 # 4118
+addsi s5239, s5238, 1 # 4119
+addsi s5241, s5240, 1 # 4120
+addsi s5243, s5242, 1 # 4121
+addsi s5245, s5244, 1 # 4122
+addsi s5247, s5246, 1 # 4123
+addsi s5249, s5248, 1 # 4124
+addsi s5251, s5250, 1 # 4125
+addsi s5253, s5252, 1 # 4126
+addsi s5255, s5254, 1 # 4127
+addsi s5257, s5256, 1 # 4128
+addsi s5259, s5258, 1 # 4129
+addsi s5261, s5260, 1 # 4130
+addsi s5263, s5262, 1 # 4131
+addsi s5265, s5264, 1 # 4132
+addsi s5267, s5266, 1 # 4133
+addsi s5269, s5268, 1 # 4134
+addsi s5271, s5270, 1 # 4135
+addsi s5273, s5272, 1 # 4136
+addsi s5275, s5274, 1 # 4137
+addsi s5277, s5276, 1 # 4138
+addsi s5279, s5278, 1 # 4139
+addsi s5281, s5280, 1 # 4140
+addsi s5283, s5282, 1 # 4141
+addsi s5285, s5284, 1 # 4142
+addsi s5287, s5286, 1 # 4143
+addsi s5289, s5288, 1 # 4144
+addsi s5291, s5290, 1 # 4145
+addsi s5293, s5292, 1 # 4146
+addsi s5295, s5294, 1 # 4147
+addsi s5297, s5296, 1 # 4148
+addsi s5299, s5298, 1 # 4149
+addsi s5301, s5300, 1 # 4150
+addsi s5303, s5302, 1 # 4151
+addsi s5305, s5304, 1 # 4152
+addsi s5307, s5306, 1 # 4153
+addsi s5309, s5308, 1 # 4154
+addsi s5311, s5310, 1 # 4155
+addsi s5313, s5312, 1 # 4156
+addsi s5315, s5314, 1 # 4157
+addsi s5317, s5316, 1 # 4158
+addsi s5319, s5318, 1 # 4159
+addsi s5321, s5320, 1 # 4160
+addsi s5323, s5322, 1 # 4161
+addsi s5325, s5324, 1 # 4162
+addsi s5327, s5326, 1 # 4163
+addsi s5329, s5328, 1 # 4164
+addsi s5331, s5330, 1 # 4165
+addsi s5333, s5332, 1 # 4166
+addsi s5335, s5334, 1 # 4167
+addsi s5337, s5336, 1 # 4168
+addsi s5339, s5338, 1 # 4169
+addsi s5341, s5340, 1 # 4170
+addsi s5343, s5342, 1 # 4171
+addsi s5345, s5344, 1 # 4172
+addsi s5347, s5346, 1 # 4173
+addsi s5349, s5348, 1 # 4174
+addsi s5351, s5350, 1 # 4175
+addsi s5353, s5352, 1 # 4176
+addsi s5355, s5354, 1 # 4177
+addsi s5357, s5356, 1 # 4178
+addsi s5359, s5358, 1 # 4179
+addsi s5361, s5360, 1 # 4180
+addsi s5363, s5362, 1 # 4181
+addsi s5365, s5364, 1 # 4182
+addsi s5367, s5366, 1 # 4183
+addsi s5369, s5368, 1 # 4184
+addsi s5371, s5370, 1 # 4185
+addsi s5373, s5372, 1 # 4186
+addsi s5375, s5374, 1 # 4187
+addsi s5377, s5376, 1 # 4188
+addsi s5379, s5378, 1 # 4189
+addsi s5381, s5380, 1 # 4190
+addsi s5383, s5382, 1 # 4191
+addsi s5385, s5384, 1 # 4192
+addsi s5387, s5386, 1 # 4193
+addsi s5389, s5388, 1 # 4194
+addsi s5391, s5390, 1 # 4195
+addsi s5393, s5392, 1 # 4196
+addsi s5395, s5394, 1 # 4197
+addsi s5397, s5396, 1 # 4198
+addsi s5399, s5398, 1 # 4199
+addsi s5401, s5400, 1 # 4200
+addsi s5403, s5402, 1 # 4201
+addsi s5405, s5404, 1 # 4202
+addsi s5407, s5406, 1 # 4203
+addsi s5409, s5408, 1 # 4204
+addsi s5411, s5410, 1 # 4205
+addsi s5413, s5412, 1 # 4206
+addsi s5415, s5414, 1 # 4207
+addsi s5417, s5416, 1 # 4208
+addsi s5419, s5418, 1 # 4209
+addsi s5421, s5420, 1 # 4210
+addsi s5423, s5422, 1 # 4211
+addsi s5425, s5424, 1 # 4212
+addsi s5427, s5426, 1 # 4213
+addsi s5429, s5428, 1 # 4214
+addsi s5431, s5430, 1 # 4215
+addsi s5433, s5432, 1 # 4216
+addsi s5435, s5434, 1 # 4217
+addsi s5437, s5436, 1 # 4218
+addsi s5439, s5438, 1 # 4219
+addsi s5441, s5440, 1 # 4220
+addsi s5443, s5442, 1 # 4221
+addsi s5445, s5444, 1 # 4222
+addsi s5447, s5446, 1 # 4223
+addsi s5449, s5448, 1 # 4224
+addsi s5451, s5450, 1 # 4225
+addsi s5453, s5452, 1 # 4226
+addsi s5455, s5454, 1 # 4227
+addsi s5457, s5456, 1 # 4228
+addsi s5459, s5458, 1 # 4229
+addsi s5461, s5460, 1 # 4230
+addsi s5463, s5462, 1 # 4231
+addsi s5465, s5464, 1 # 4232
+addsi s5467, s5466, 1 # 4233
+addsi s5469, s5468, 1 # 4234
+addsi s5471, s5470, 1 # 4235
+addsi s5473, s5472, 1 # 4236
+addsi s5475, s5474, 1 # 4237
+addsi s5477, s5476, 1 # 4238
+addsi s5479, s5478, 1 # 4239
+addsi s5481, s5480, 1 # 4240
+addsi s5483, s5482, 1 # 4241
+addsi s5485, s5484, 1 # 4242
+addsi s5487, s5486, 1 # 4243
+addsi s5489, s5488, 1 # 4244
+addsi s5491, s5490, 1 # 4245
+addsi s5493, s5492, 1 # 4246
+addsi s5495, s5494, 1 # 4247
+addsi s5497, s5496, 1 # 4248
+addsi s5499, s5498, 1 # 4249
+addsi s5501, s5500, 1 # 4250
+addsi s5503, s5502, 1 # 4251
+addsi s5505, s5504, 1 # 4252
+addsi s5507, s5506, 1 # 4253
+addsi s5509, s5508, 1 # 4254
+addsi s5511, s5510, 1 # 4255
+addsi s5513, s5512, 1 # 4256
+addsi s5515, s5514, 1 # 4257
+addsi s5517, s5516, 1 # 4258
+addsi s5519, s5518, 1 # 4259
+addsi s5521, s5520, 1 # 4260
+addsi s5523, s5522, 1 # 4261
+addsi s5525, s5524, 1 # 4262
+addsi s5527, s5526, 1 # 4263
+addsi s5529, s5528, 1 # 4264
+addsi s5531, s5530, 1 # 4265
+addsi s5533, s5532, 1 # 4266
+addsi s5535, s5534, 1 # 4267
+addsi s5537, s5536, 1 # 4268
+addsi s5539, s5538, 1 # 4269
+addsi s5541, s5540, 1 # 4270
+addsi s5543, s5542, 1 # 4271
+addsi s5545, s5544, 1 # 4272
+addsi s5547, s5546, 1 # 4273
+addsi s5549, s5548, 1 # 4274
+addsi s5551, s5550, 1 # 4275
+addsi s5553, s5552, 1 # 4276
+addsi s5555, s5554, 1 # 4277
+addsi s5557, s5556, 1 # 4278
+addsi s5559, s5558, 1 # 4279
+addsi s5561, s5560, 1 # 4280
+addsi s5563, s5562, 1 # 4281
+addsi s5565, s5564, 1 # 4282
+addsi s5567, s5566, 1 # 4283
+addsi s5569, s5568, 1 # 4284
+addsi s5571, s5570, 1 # 4285
+addsi s5573, s5572, 1 # 4286
+addsi s5575, s5574, 1 # 4287
+addsi s5577, s5576, 1 # 4288
+addsi s5579, s5578, 1 # 4289
+addsi s5581, s5580, 1 # 4290
+addsi s5583, s5582, 1 # 4291
+addsi s5585, s5584, 1 # 4292
+addsi s5587, s5586, 1 # 4293
+addsi s5589, s5588, 1 # 4294
+addsi s5591, s5590, 1 # 4295
+addsi s5593, s5592, 1 # 4296
+addsi s5595, s5594, 1 # 4297
+addsi s5597, s5596, 1 # 4298
+addsi s5599, s5598, 1 # 4299
+addsi s5601, s5600, 1 # 4300
+addsi s5603, s5602, 1 # 4301
+addsi s5605, s5604, 1 # 4302
+addsi s5607, s5606, 1 # 4303
+addsi s5609, s5608, 1 # 4304
+addsi s5611, s5610, 1 # 4305
+addsi s5613, s5612, 1 # 4306
+addsi s5615, s5614, 1 # 4307
+addsi s5617, s5616, 1 # 4308
+addsi s5619, s5618, 1 # 4309
+addsi s5621, s5620, 1 # 4310
+addsi s5623, s5622, 1 # 4311
+addsi s5625, s5624, 1 # 4312
+addsi s5627, s5626, 1 # 4313
+addsi s5629, s5628, 1 # 4314
+addsi s5631, s5630, 1 # 4315
+addsi s5633, s5632, 1 # 4316
+addsi s5635, s5634, 1 # 4317
+addsi s5637, s5636, 1 # 4318
+addsi s5639, s5638, 1 # 4319
+addsi s5641, s5640, 1 # 4320
+addsi s5643, s5642, 1 # 4321
+addsi s5645, s5644, 1 # 4322
+addsi s5647, s5646, 1 # 4323
+addsi s5649, s5648, 1 # 4324
+addsi s5651, s5650, 1 # 4325
+addsi s5653, s5652, 1 # 4326
+addsi s5655, s5654, 1 # 4327
+addsi s5657, s5656, 1 # 4328
+addsi s5659, s5658, 1 # 4329
+addsi s5661, s5660, 1 # 4330
+addsi s5663, s5662, 1 # 4331
+addsi s5665, s5664, 1 # 4332
+addsi s5667, s5666, 1 # 4333
+addsi s5669, s5668, 1 # 4334
+addsi s5671, s5670, 1 # 4335
+addsi s5673, s5672, 1 # 4336
+addsi s5675, s5674, 1 # 4337
+addsi s5677, s5676, 1 # 4338
+addsi s5679, s5678, 1 # 4339
+addsi s5681, s5680, 1 # 4340
+addsi s5683, s5682, 1 # 4341
+addsi s5685, s5684, 1 # 4342
+addsi s5687, s5686, 1 # 4343
+addsi s5689, s5688, 1 # 4344
+addsi s5691, s5690, 1 # 4345
+addsi s5693, s5692, 1 # 4346
+addsi s5695, s5694, 1 # 4347
+addsi s5697, s5696, 1 # 4348
+addsi s5699, s5698, 1 # 4349
+addsi s5701, s5700, 1 # 4350
+addsi s5703, s5702, 1 # 4351
+addsi s5705, s5704, 1 # 4352
+addsi s5707, s5706, 1 # 4353
+addsi s5709, s5708, 1 # 4354
+addsi s5711, s5710, 1 # 4355
+addsi s5713, s5712, 1 # 4356
+addsi s5715, s5714, 1 # 4357
+addsi s5717, s5716, 1 # 4358
+addsi s5719, s5718, 1 # 4359
+addsi s5721, s5720, 1 # 4360
+addsi s5723, s5722, 1 # 4361
+addsi s5725, s5724, 1 # 4362
+addsi s5727, s5726, 1 # 4363
+addsi s5729, s5728, 1 # 4364
+addsi s5731, s5730, 1 # 4365
+addsi s5733, s5732, 1 # 4366
+addsi s5735, s5734, 1 # 4367
+addsi s5737, s5736, 1 # 4368
+addsi s5739, s5738, 1 # 4369
+addsi s5741, s5740, 1 # 4370
+addsi s5743, s5742, 1 # 4371
+addsi s5745, s5744, 1 # 4372
+addsi s5747, s5746, 1 # 4373
+addsi s5749, s5748, 1 # 4374
+addsi s5751, s5750, 1 # 4375
+addsi s5753, s5752, 1 # 4376
+addsi s5755, s5754, 1 # 4377
+addsi s5757, s5756, 1 # 4378
+addsi s5759, s5758, 1 # 4379
+addsi s5761, s5760, 1 # 4380
+addsi s5763, s5762, 1 # 4381
+addsi s5765, s5764, 1 # 4382
+addsi s5767, s5766, 1 # 4383
+addsi s5769, s5768, 1 # 4384
+addsi s5771, s5770, 1 # 4385
+addsi s5773, s5772, 1 # 4386
+addsi s5775, s5774, 1 # 4387
+addsi s5777, s5776, 1 # 4388
+addsi s5779, s5778, 1 # 4389
+addsi s5781, s5780, 1 # 4390
+addsi s5783, s5782, 1 # 4391
+addsi s5785, s5784, 1 # 4392
+addsi s5787, s5786, 1 # 4393
+addsi s5789, s5788, 1 # 4394
+addsi s5791, s5790, 1 # 4395
+addsi s5793, s5792, 1 # 4396
+addsi s5795, s5794, 1 # 4397
+addsi s5797, s5796, 1 # 4398
+addsi s5799, s5798, 1 # 4399
+addsi s5801, s5800, 1 # 4400
+addsi s5803, s5802, 1 # 4401
+addsi s5805, s5804, 1 # 4402
+addsi s5807, s5806, 1 # 4403
+addsi s5809, s5808, 1 # 4404
+addsi s5811, s5810, 1 # 4405
+addsi s5813, s5812, 1 # 4406
+addsi s5815, s5814, 1 # 4407
+addsi s5817, s5816, 1 # 4408
+addsi s5819, s5818, 1 # 4409
+addsi s5821, s5820, 1 # 4410
+addsi s5823, s5822, 1 # 4411
+addsi s5825, s5824, 1 # 4412
+addsi s5827, s5826, 1 # 4413
+addsi s5829, s5828, 1 # 4414
+addsi s5831, s5830, 1 # 4415
+addsi s5833, s5832, 1 # 4416
+addsi s5835, s5834, 1 # 4417
+addsi s5837, s5836, 1 # 4418
+addsi s5839, s5838, 1 # 4419
+addsi s5841, s5840, 1 # 4420
+addsi s5843, s5842, 1 # 4421
+addsi s5845, s5844, 1 # 4422
+addsi s5847, s5846, 1 # 4423
+addsi s5849, s5848, 1 # 4424
+addsi s5851, s5850, 1 # 4425
+addsi s5853, s5852, 1 # 4426
+addsi s5855, s5854, 1 # 4427
+addsi s5857, s5856, 1 # 4428
+addsi s5859, s5858, 1 # 4429
+addsi s5861, s5860, 1 # 4430
+addsi s5863, s5862, 1 # 4431
+addsi s5865, s5864, 1 # 4432
+addsi s5867, s5866, 1 # 4433
+addsi s5869, s5868, 1 # 4434
+addsi s5871, s5870, 1 # 4435
+addsi s5873, s5872, 1 # 4436
+addsi s5875, s5874, 1 # 4437
+addsi s5877, s5876, 1 # 4438
+addsi s5879, s5878, 1 # 4439
+addsi s5881, s5880, 1 # 4440
+addsi s5883, s5882, 1 # 4441
+addsi s5885, s5884, 1 # 4442
+addsi s5887, s5886, 1 # 4443
+addsi s5889, s5888, 1 # 4444
+addsi s5891, s5890, 1 # 4445
+addsi s5893, s5892, 1 # 4446
+addsi s5895, s5894, 1 # 4447
+addsi s5897, s5896, 1 # 4448
+addsi s5899, s5898, 1 # 4449
+addsi s5901, s5900, 1 # 4450
+addsi s5903, s5902, 1 # 4451
+addsi s5905, s5904, 1 # 4452
+addsi s5907, s5906, 1 # 4453
+addsi s5909, s5908, 1 # 4454
+addsi s5911, s5910, 1 # 4455
+addsi s5913, s5912, 1 # 4456
+addsi s5915, s5914, 1 # 4457
+addsi s5917, s5916, 1 # 4458
+addsi s5919, s5918, 1 # 4459
+addsi s5921, s5920, 1 # 4460
+addsi s5923, s5922, 1 # 4461
+addsi s5925, s5924, 1 # 4462
+addsi s5927, s5926, 1 # 4463
+addsi s5929, s5928, 1 # 4464
+addsi s5931, s5930, 1 # 4465
+addsi s5933, s5932, 1 # 4466
+addsi s5935, s5934, 1 # 4467
+addsi s5937, s5936, 1 # 4468
+addsi s5939, s5938, 1 # 4469
+addsi s5941, s5940, 1 # 4470
+addsi s5943, s5942, 1 # 4471
+addsi s5945, s5944, 1 # 4472
+addsi s5947, s5946, 1 # 4473
+addsi s5949, s5948, 1 # 4474
+addsi s5951, s5950, 1 # 4475
+addsi s5953, s5952, 1 # 4476
+addsi s5955, s5954, 1 # 4477
+addsi s5957, s5956, 1 # 4478
+addsi s5959, s5958, 1 # 4479
+addsi s5961, s5960, 1 # 4480
+addsi s5963, s5962, 1 # 4481
+addsi s5965, s5964, 1 # 4482
+addsi s5967, s5966, 1 # 4483
+addsi s5969, s5968, 1 # 4484
+addsi s5971, s5970, 1 # 4485
+addsi s5973, s5972, 1 # 4486
+addsi s5975, s5974, 1 # 4487
+addsi s5977, s5976, 1 # 4488
+addsi s5979, s5978, 1 # 4489
+addsi s5981, s5980, 1 # 4490
+addsi s5983, s5982, 1 # 4491
+addsi s5985, s5984, 1 # 4492
+addsi s5987, s5986, 1 # 4493
+addsi s5989, s5988, 1 # 4494
+addsi s5991, s5990, 1 # 4495
+addsi s5993, s5992, 1 # 4496
+addsi s5995, s5994, 1 # 4497
+addsi s5997, s5996, 1 # 4498
+addsi s5999, s5998, 1 # 4499
+addsi s6001, s6000, 1 # 4500
+addsi s6003, s6002, 1 # 4501
+addsi s6005, s6004, 1 # 4502
+addsi s6007, s6006, 1 # 4503
+addsi s6009, s6008, 1 # 4504
+addsi s6011, s6010, 1 # 4505
+addsi s6013, s6012, 1 # 4506
+addsi s6015, s6014, 1 # 4507
+addsi s6017, s6016, 1 # 4508
+addsi s6019, s6018, 1 # 4509
+addsi s6021, s6020, 1 # 4510
+addsi s6023, s6022, 1 # 4511
+addsi s6025, s6024, 1 # 4512
+addsi s6027, s6026, 1 # 4513
+addsi s6029, s6028, 1 # 4514
+addsi s6031, s6030, 1 # 4515
+addsi s6033, s6032, 1 # 4516
+addsi s6035, s6034, 1 # 4517
+addsi s6037, s6036, 1 # 4518
+addsi s6039, s6038, 1 # 4519
+addsi s6041, s6040, 1 # 4520
+addsi s6043, s6042, 1 # 4521
+addsi s6045, s6044, 1 # 4522
+addsi s6047, s6046, 1 # 4523
+addsi s6049, s6048, 1 # 4524
+addsi s6051, s6050, 1 # 4525
+addsi s6053, s6052, 1 # 4526
+addsi s6055, s6054, 1 # 4527
+addsi s6057, s6056, 1 # 4528
+addsi s6059, s6058, 1 # 4529
+addsi s6061, s6060, 1 # 4530
+addsi s6063, s6062, 1 # 4531
+addsi s6065, s6064, 1 # 4532
+addsi s6067, s6066, 1 # 4533
+addsi s6069, s6068, 1 # 4534
+addsi s6071, s6070, 1 # 4535
+addsi s6073, s6072, 1 # 4536
+addsi s6075, s6074, 1 # 4537
+addsi s6077, s6076, 1 # 4538
+addsi s6079, s6078, 1 # 4539
+addsi s6081, s6080, 1 # 4540
+addsi s6083, s6082, 1 # 4541
+addsi s6085, s6084, 1 # 4542
+addsi s6087, s6086, 1 # 4543
+addsi s6089, s6088, 1 # 4544
+addsi s6091, s6090, 1 # 4545
+addsi s6093, s6092, 1 # 4546
+addsi s6095, s6094, 1 # 4547
+addsi s6097, s6096, 1 # 4548
+addsi s6099, s6098, 1 # 4549
+addsi s6101, s6100, 1 # 4550
+addsi s6103, s6102, 1 # 4551
+addsi s6105, s6104, 1 # 4552
+addsi s6107, s6106, 1 # 4553
+addsi s6109, s6108, 1 # 4554
+addsi s6111, s6110, 1 # 4555
+addsi s6113, s6112, 1 # 4556
+addsi s6115, s6114, 1 # 4557
+addsi s6117, s6116, 1 # 4558
+addsi s6119, s6118, 1 # 4559
+addsi s6121, s6120, 1 # 4560
+addsi s6123, s6122, 1 # 4561
+addsi s6125, s6124, 1 # 4562
+addsi s6127, s6126, 1 # 4563
+addsi s6129, s6128, 1 # 4564
+addsi s6131, s6130, 1 # 4565
+addsi s6133, s6132, 1 # 4566
+addsi s6135, s6134, 1 # 4567
+addsi s6137, s6136, 1 # 4568
+addsi s6139, s6138, 1 # 4569
+addsi s6141, s6140, 1 # 4570
+addsi s6143, s6142, 1 # 4571
+addsi s6145, s6144, 1 # 4572
+addsi s6147, s6146, 1 # 4573
+addsi s6149, s6148, 1 # 4574
+addsi s6151, s6150, 1 # 4575
+addsi s6153, s6152, 1 # 4576
+addsi s6155, s6154, 1 # 4577
+addsi s6157, s6156, 1 # 4578
+addsi s6159, s6158, 1 # 4579
+addsi s6161, s6160, 1 # 4580
+addsi s6163, s6162, 1 # 4581
+addsi s6165, s6164, 1 # 4582
+addsi s6167, s6166, 1 # 4583
+addsi s6169, s6168, 1 # 4584
+addsi s6171, s6170, 1 # 4585
+addsi s6173, s6172, 1 # 4586
+addsi s6175, s6174, 1 # 4587
+addsi s6177, s6176, 1 # 4588
+addsi s6179, s6178, 1 # 4589
+addsi s6181, s6180, 1 # 4590
+addsi s6183, s6182, 1 # 4591
+addsi s6185, s6184, 1 # 4592
+addsi s6187, s6186, 1 # 4593
+addsi s6189, s6188, 1 # 4594
+addsi s6191, s6190, 1 # 4595
+addsi s6193, s6192, 1 # 4596
+addsi s6195, s6194, 1 # 4597
+addsi s6197, s6196, 1 # 4598
+addsi s6199, s6198, 1 # 4599
+addsi s6201, s6200, 1 # 4600
+addsi s6203, s6202, 1 # 4601
+addsi s6205, s6204, 1 # 4602
+addsi s6207, s6206, 1 # 4603
+addsi s6209, s6208, 1 # 4604
+addsi s6211, s6210, 1 # 4605
+addsi s6213, s6212, 1 # 4606
+addsi s6215, s6214, 1 # 4607
+addsi s6217, s6216, 1 # 4608
+addsi s6219, s6218, 1 # 4609
+addsi s6221, s6220, 1 # 4610
+addsi s6223, s6222, 1 # 4611
+addsi s6225, s6224, 1 # 4612
+addsi s6227, s6226, 1 # 4613
+addsi s6229, s6228, 1 # 4614
+addsi s6231, s6230, 1 # 4615
+addsi s6233, s6232, 1 # 4616
+addsi s6235, s6234, 1 # 4617
+addsi s6237, s6236, 1 # 4618
+addsi s6239, s6238, 1 # 4619
+addsi s6241, s6240, 1 # 4620
+addsi s6243, s6242, 1 # 4621
+addsi s6245, s6244, 1 # 4622
+addsi s6247, s6246, 1 # 4623
+addsi s6249, s6248, 1 # 4624
+addsi s6251, s6250, 1 # 4625
+addsi s6253, s6252, 1 # 4626
+addsi s6255, s6254, 1 # 4627
+addsi s6257, s6256, 1 # 4628
+addsi s6259, s6258, 1 # 4629
+addsi s6261, s6260, 1 # 4630
+addsi s6263, s6262, 1 # 4631
+addsi s6265, s6264, 1 # 4632
+addsi s6267, s6266, 1 # 4633
+addsi s6269, s6268, 1 # 4634
+addsi s6271, s6270, 1 # 4635
+addsi s6273, s6272, 1 # 4636
+addsi s6275, s6274, 1 # 4637
+addsi s6277, s6276, 1 # 4638
+addsi s6279, s6278, 1 # 4639
+addsi s6281, s6280, 1 # 4640
+addsi s6283, s6282, 1 # 4641
+addsi s6285, s6284, 1 # 4642
+addsi s6287, s6286, 1 # 4643
+addsi s6289, s6288, 1 # 4644
+addsi s6291, s6290, 1 # 4645
+addsi s6293, s6292, 1 # 4646
+addsi s6295, s6294, 1 # 4647
+addsi s6297, s6296, 1 # 4648
+addsi s6299, s6298, 1 # 4649
+addsi s6301, s6300, 1 # 4650
+addsi s6303, s6302, 1 # 4651
+addsi s6305, s6304, 1 # 4652
+addsi s6307, s6306, 1 # 4653
+addsi s6309, s6308, 1 # 4654
+addsi s6311, s6310, 1 # 4655
+addsi s6313, s6312, 1 # 4656
+addsi s6315, s6314, 1 # 4657
+addsi s6317, s6316, 1 # 4658
+addsi s6319, s6318, 1 # 4659
+addsi s6321, s6320, 1 # 4660
+addsi s6323, s6322, 1 # 4661
+addsi s6325, s6324, 1 # 4662
+addsi s6327, s6326, 1 # 4663
+addsi s6329, s6328, 1 # 4664
+addsi s6331, s6330, 1 # 4665
+addsi s6333, s6332, 1 # 4666
+addsi s6335, s6334, 1 # 4667
+addsi s6337, s6336, 1 # 4668
+addsi s6339, s6338, 1 # 4669
+addsi s6341, s6340, 1 # 4670
+addsi s6343, s6342, 1 # 4671
+addsi s6345, s6344, 1 # 4672
+addsi s6347, s6346, 1 # 4673
+addsi s6349, s6348, 1 # 4674
+addsi s6351, s6350, 1 # 4675
+addsi s6353, s6352, 1 # 4676
+addsi s6355, s6354, 1 # 4677
+addsi s6357, s6356, 1 # 4678
+addsi s6359, s6358, 1 # 4679
+addsi s6361, s6360, 1 # 4680
+addsi s6363, s6362, 1 # 4681
+addsi s6365, s6364, 1 # 4682
+addsi s6367, s6366, 1 # 4683
+addsi s6369, s6368, 1 # 4684
+addsi s6371, s6370, 1 # 4685
+addsi s6373, s6372, 1 # 4686
+addsi s6375, s6374, 1 # 4687
+addsi s6377, s6376, 1 # 4688
+addsi s6379, s6378, 1 # 4689
+addsi s6381, s6380, 1 # 4690
+addsi s6383, s6382, 1 # 4691
+addsi s6385, s6384, 1 # 4692
+addsi s6387, s6386, 1 # 4693
+addsi s6389, s6388, 1 # 4694
+addsi s6391, s6390, 1 # 4695
+addsi s6393, s6392, 1 # 4696
+addsi s6395, s6394, 1 # 4697
+addsi s6397, s6396, 1 # 4698
+addsi s6399, s6398, 1 # 4699
+addsi s6401, s6400, 1 # 4700
+addsi s6403, s6402, 1 # 4701
+addsi s6405, s6404, 1 # 4702
+addsi s6407, s6406, 1 # 4703
+addsi s6409, s6408, 1 # 4704
+addsi s6411, s6410, 1 # 4705
+addsi s6413, s6412, 1 # 4706
+addsi s6415, s6414, 1 # 4707
+addsi s6417, s6416, 1 # 4708
+addsi s6419, s6418, 1 # 4709
+addsi s6421, s6420, 1 # 4710
+addsi s6423, s6422, 1 # 4711
+addsi s6425, s6424, 1 # 4712
+addsi s6427, s6426, 1 # 4713
+addsi s6429, s6428, 1 # 4714
+addsi s6431, s6430, 1 # 4715
+addsi s6433, s6432, 1 # 4716
+addsi s6435, s6434, 1 # 4717
+addsi s6437, s6436, 1 # 4718
+addsi s6439, s6438, 1 # 4719
+addsi s6441, s6440, 1 # 4720
+addsi s6443, s6442, 1 # 4721
+addsi s6445, s6444, 1 # 4722
+addsi s6447, s6446, 1 # 4723
+addsi s6449, s6448, 1 # 4724
+addsi s6451, s6450, 1 # 4725
+addsi s6453, s6452, 1 # 4726
+addsi s6455, s6454, 1 # 4727
+addsi s6457, s6456, 1 # 4728
+addsi s6459, s6458, 1 # 4729
+addsi s6461, s6460, 1 # 4730
+addsi s6463, s6462, 1 # 4731
+addsi s6465, s6464, 1 # 4732
+addsi s6467, s6466, 1 # 4733
+addsi s6469, s6468, 1 # 4734
+addsi s6471, s6470, 1 # 4735
+addsi s6473, s6472, 1 # 4736
+addsi s6475, s6474, 1 # 4737
+addsi s6477, s6476, 1 # 4738
+addsi s6479, s6478, 1 # 4739
+addsi s6481, s6480, 1 # 4740
+addsi s6483, s6482, 1 # 4741
+addsi s6485, s6484, 1 # 4742
+addsi s6487, s6486, 1 # 4743
+addsi s6489, s6488, 1 # 4744
+addsi s6491, s6490, 1 # 4745
+addsi s6493, s6492, 1 # 4746
+addsi s6495, s6494, 1 # 4747
+addsi s6497, s6496, 1 # 4748
+addsi s6499, s6498, 1 # 4749
+addsi s6501, s6500, 1 # 4750
+addsi s6503, s6502, 1 # 4751
+addsi s6505, s6504, 1 # 4752
+addsi s6507, s6506, 1 # 4753
+addsi s6509, s6508, 1 # 4754
+addsi s6511, s6510, 1 # 4755
+addsi s6513, s6512, 1 # 4756
+addsi s6515, s6514, 1 # 4757
+addsi s6517, s6516, 1 # 4758
+addsi s6519, s6518, 1 # 4759
+addsi s6521, s6520, 1 # 4760
+addsi s6523, s6522, 1 # 4761
+addsi s6525, s6524, 1 # 4762
+addsi s6527, s6526, 1 # 4763
+addsi s6529, s6528, 1 # 4764
+addsi s6531, s6530, 1 # 4765
+addsi s6533, s6532, 1 # 4766
+addsi s6535, s6534, 1 # 4767
+addsi s6537, s6536, 1 # 4768
+addsi s6539, s6538, 1 # 4769
+addsi s6541, s6540, 1 # 4770
+addsi s6543, s6542, 1 # 4771
+addsi s6545, s6544, 1 # 4772
+addsi s6547, s6546, 1 # 4773
+addsi s6549, s6548, 1 # 4774
+addsi s6551, s6550, 1 # 4775
+addsi s6553, s6552, 1 # 4776
+addsi s6555, s6554, 1 # 4777
+addsi s6557, s6556, 1 # 4778
+addsi s6559, s6558, 1 # 4779
+addsi s6561, s6560, 1 # 4780
+addsi s6563, s6562, 1 # 4781
+addsi s6565, s6564, 1 # 4782
+addsi s6567, s6566, 1 # 4783
+addsi s6569, s6568, 1 # 4784
+addsi s6571, s6570, 1 # 4785
+addsi s6573, s6572, 1 # 4786
+addsi s6575, s6574, 1 # 4787
+addsi s6577, s6576, 1 # 4788
+addsi s6579, s6578, 1 # 4789
+addsi s6581, s6580, 1 # 4790
+addsi s6583, s6582, 1 # 4791
+addsi s6585, s6584, 1 # 4792
+addsi s6587, s6586, 1 # 4793
+addsi s6589, s6588, 1 # 4794
+addsi s6591, s6590, 1 # 4795
+addsi s6593, s6592, 1 # 4796
+addsi s6595, s6594, 1 # 4797
+addsi s6597, s6596, 1 # 4798
+addsi s6599, s6598, 1 # 4799
+addsi s6601, s6600, 1 # 4800
+addsi s6603, s6602, 1 # 4801
+addsi s6605, s6604, 1 # 4802
+addsi s6607, s6606, 1 # 4803
+addsi s6609, s6608, 1 # 4804
+addsi s6611, s6610, 1 # 4805
+addsi s6613, s6612, 1 # 4806
+addsi s6615, s6614, 1 # 4807
+addsi s6617, s6616, 1 # 4808
+addsi s6619, s6618, 1 # 4809
+addsi s6621, s6620, 1 # 4810
+addsi s6623, s6622, 1 # 4811
+addsi s6625, s6624, 1 # 4812
+addsi s6627, s6626, 1 # 4813
+addsi s6629, s6628, 1 # 4814
+addsi s6631, s6630, 1 # 4815
+addsi s6633, s6632, 1 # 4816
+addsi s6635, s6634, 1 # 4817
+addsi s6637, s6636, 1 # 4818
+addsi s6639, s6638, 1 # 4819
+addsi s6641, s6640, 1 # 4820
+addsi s6643, s6642, 1 # 4821
+addsi s6645, s6644, 1 # 4822
+addsi s6647, s6646, 1 # 4823
+addsi s6649, s6648, 1 # 4824
+addsi s6651, s6650, 1 # 4825
+addsi s6653, s6652, 1 # 4826
+addsi s6655, s6654, 1 # 4827
+addsi s6657, s6656, 1 # 4828
+addsi s6659, s6658, 1 # 4829
+addsi s6661, s6660, 1 # 4830
+addsi s6663, s6662, 1 # 4831
+addsi s6665, s6664, 1 # 4832
+addsi s6667, s6666, 1 # 4833
+addsi s6669, s6668, 1 # 4834
+addsi s6671, s6670, 1 # 4835
+addsi s6673, s6672, 1 # 4836
+addsi s6675, s6674, 1 # 4837
+addsi s6677, s6676, 1 # 4838
+addsi s6679, s6678, 1 # 4839
+addsi s6681, s6680, 1 # 4840
+addsi s6683, s6682, 1 # 4841
+addsi s6685, s6684, 1 # 4842
+addsi s6687, s6686, 1 # 4843
+addsi s6689, s6688, 1 # 4844
+addsi s6691, s6690, 1 # 4845
+addsi s6693, s6692, 1 # 4846
+addsi s6695, s6694, 1 # 4847
+addsi s6697, s6696, 1 # 4848
+addsi s6699, s6698, 1 # 4849
+addsi s6701, s6700, 1 # 4850
+addsi s6703, s6702, 1 # 4851
+addsi s6705, s6704, 1 # 4852
+addsi s6707, s6706, 1 # 4853
+addsi s6709, s6708, 1 # 4854
+addsi s6711, s6710, 1 # 4855
+addsi s6713, s6712, 1 # 4856
+addsi s6715, s6714, 1 # 4857
+addsi s6717, s6716, 1 # 4858
+addsi s6719, s6718, 1 # 4859
+addsi s6721, s6720, 1 # 4860
+addsi s6723, s6722, 1 # 4861
+addsi s6725, s6724, 1 # 4862
+addsi s6727, s6726, 1 # 4863
+addsi s6729, s6728, 1 # 4864
+addsi s6731, s6730, 1 # 4865
+addsi s6733, s6732, 1 # 4866
+addsi s6735, s6734, 1 # 4867
+addsi s6737, s6736, 1 # 4868
+addsi s6739, s6738, 1 # 4869
+addsi s6741, s6740, 1 # 4870
+addsi s6743, s6742, 1 # 4871
+addsi s6745, s6744, 1 # 4872
+addsi s6747, s6746, 1 # 4873
+addsi s6749, s6748, 1 # 4874
+addsi s6751, s6750, 1 # 4875
+addsi s6753, s6752, 1 # 4876
+addsi s6755, s6754, 1 # 4877
+addsi s6757, s6756, 1 # 4878
+addsi s6759, s6758, 1 # 4879
+addsi s6761, s6760, 1 # 4880
+addsi s6763, s6762, 1 # 4881
+addsi s6765, s6764, 1 # 4882
+addsi s6767, s6766, 1 # 4883
+addsi s6769, s6768, 1 # 4884
+addsi s6771, s6770, 1 # 4885
+addsi s6773, s6772, 1 # 4886
+addsi s6775, s6774, 1 # 4887
+addsi s6777, s6776, 1 # 4888
+addsi s6779, s6778, 1 # 4889
+addsi s6781, s6780, 1 # 4890
+addsi s6783, s6782, 1 # 4891
+addsi s6785, s6784, 1 # 4892
+addsi s6787, s6786, 1 # 4893
+addsi s6789, s6788, 1 # 4894
+addsi s6791, s6790, 1 # 4895
+addsi s6793, s6792, 1 # 4896
+addsi s6795, s6794, 1 # 4897
+addsi s6797, s6796, 1 # 4898
+addsi s6799, s6798, 1 # 4899
+addsi s6801, s6800, 1 # 4900
+addsi s6803, s6802, 1 # 4901
+addsi s6805, s6804, 1 # 4902
+addsi s6807, s6806, 1 # 4903
+addsi s6809, s6808, 1 # 4904
+addsi s6811, s6810, 1 # 4905
+addsi s6813, s6812, 1 # 4906
+addsi s6815, s6814, 1 # 4907
+addsi s6817, s6816, 1 # 4908
+addsi s6819, s6818, 1 # 4909
+addsi s6821, s6820, 1 # 4910
+addsi s6823, s6822, 1 # 4911
+addsi s6825, s6824, 1 # 4912
+addsi s6827, s6826, 1 # 4913
+addsi s6829, s6828, 1 # 4914
+addsi s6831, s6830, 1 # 4915
+addsi s6833, s6832, 1 # 4916
+addsi s6835, s6834, 1 # 4917
+addsi s6837, s6836, 1 # 4918
+addsi s6839, s6838, 1 # 4919
+addsi s6841, s6840, 1 # 4920
+addsi s6843, s6842, 1 # 4921
+addsi s6845, s6844, 1 # 4922
+addsi s6847, s6846, 1 # 4923
+addsi s6849, s6848, 1 # 4924
+addsi s6851, s6850, 1 # 4925
+addsi s6853, s6852, 1 # 4926
+addsi s6855, s6854, 1 # 4927
+addsi s6857, s6856, 1 # 4928
+addsi s6859, s6858, 1 # 4929
+addsi s6861, s6860, 1 # 4930
+addsi s6863, s6862, 1 # 4931
+addsi s6865, s6864, 1 # 4932
+addsi s6867, s6866, 1 # 4933
+addsi s6869, s6868, 1 # 4934
+addsi s6871, s6870, 1 # 4935
+addsi s6873, s6872, 1 # 4936
+addsi s6875, s6874, 1 # 4937
+addsi s6877, s6876, 1 # 4938
+addsi s6879, s6878, 1 # 4939
+addsi s6881, s6880, 1 # 4940
+addsi s6883, s6882, 1 # 4941
+addsi s6885, s6884, 1 # 4942
+addsi s6887, s6886, 1 # 4943
+addsi s6889, s6888, 1 # 4944
+addsi s6891, s6890, 1 # 4945
+addsi s6893, s6892, 1 # 4946
+addsi s6895, s6894, 1 # 4947
+addsi s6897, s6896, 1 # 4948
+addsi s6899, s6898, 1 # 4949
+addsi s6901, s6900, 1 # 4950
+addsi s6903, s6902, 1 # 4951
+addsi s6905, s6904, 1 # 4952
+addsi s6907, s6906, 1 # 4953
+addsi s6909, s6908, 1 # 4954
+addsi s6911, s6910, 1 # 4955
+addsi s6913, s6912, 1 # 4956
+addsi s6915, s6914, 1 # 4957
+addsi s6917, s6916, 1 # 4958
+addsi s6919, s6918, 1 # 4959
+addsi s6921, s6920, 1 # 4960
+addsi s6923, s6922, 1 # 4961
+addsi s6925, s6924, 1 # 4962
+addsi s6927, s6926, 1 # 4963
+addsi s6929, s6928, 1 # 4964
+addsi s6931, s6930, 1 # 4965
+addsi s6933, s6932, 1 # 4966
+addsi s6935, s6934, 1 # 4967
+addsi s6937, s6936, 1 # 4968
+addsi s6939, s6938, 1 # 4969
+addsi s6941, s6940, 1 # 4970
+addsi s6943, s6942, 1 # 4971
+addsi s6945, s6944, 1 # 4972
+addsi s6947, s6946, 1 # 4973
+addsi s6949, s6948, 1 # 4974
+addsi s6951, s6950, 1 # 4975
+addsi s6953, s6952, 1 # 4976
+addsi s6955, s6954, 1 # 4977
+addsi s6957, s6956, 1 # 4978
+addsi s6959, s6958, 1 # 4979
+addsi s6961, s6960, 1 # 4980
+addsi s6963, s6962, 1 # 4981
+addsi s6965, s6964, 1 # 4982
+addsi s6967, s6966, 1 # 4983
+addsi s6969, s6968, 1 # 4984
+addsi s6971, s6970, 1 # 4985
+addsi s6973, s6972, 1 # 4986
+addsi s6975, s6974, 1 # 4987
+addsi s6977, s6976, 1 # 4988
+addsi s6979, s6978, 1 # 4989
+addsi s6981, s6980, 1 # 4990
+addsi s6983, s6982, 1 # 4991
+addsi s6985, s6984, 1 # 4992
+addsi s6987, s6986, 1 # 4993
+addsi s6989, s6988, 1 # 4994
+addsi s6991, s6990, 1 # 4995
+addsi s6993, s6992, 1 # 4996
+addsi s6995, s6994, 1 # 4997
+addsi s6997, s6996, 1 # 4998
+addsi s6999, s6998, 1 # 4999
+addsi s7001, s7000, 1 # 5000
+addsi s7003, s7002, 1 # 5001
+addsi s7005, s7004, 1 # 5002
+addsi s7007, s7006, 1 # 5003
+addsi s7009, s7008, 1 # 5004
+addsi s7011, s7010, 1 # 5005
+addsi s7013, s7012, 1 # 5006
+addsi s7015, s7014, 1 # 5007
+addsi s7017, s7016, 1 # 5008
+addsi s7019, s7018, 1 # 5009
+addsi s7021, s7020, 1 # 5010
+addsi s7023, s7022, 1 # 5011
+addsi s7025, s7024, 1 # 5012
+addsi s7027, s7026, 1 # 5013
+addsi s7029, s7028, 1 # 5014
+addsi s7031, s7030, 1 # 5015
+addsi s7033, s7032, 1 # 5016
+addsi s7035, s7034, 1 # 5017
+addsi s7037, s7036, 1 # 5018
+addsi s7039, s7038, 1 # 5019
+addsi s7041, s7040, 1 # 5020
+addsi s7043, s7042, 1 # 5021
+addsi s7045, s7044, 1 # 5022
+addsi s7047, s7046, 1 # 5023
+addsi s7049, s7048, 1 # 5024
+addsi s7051, s7050, 1 # 5025
+addsi s7053, s7052, 1 # 5026
+addsi s7055, s7054, 1 # 5027
+addsi s7057, s7056, 1 # 5028
+addsi s7059, s7058, 1 # 5029
+addsi s7061, s7060, 1 # 5030
+addsi s7063, s7062, 1 # 5031
+addsi s7065, s7064, 1 # 5032
+addsi s7067, s7066, 1 # 5033
+addsi s7069, s7068, 1 # 5034
+addsi s7071, s7070, 1 # 5035
+addsi s7073, s7072, 1 # 5036
+addsi s7075, s7074, 1 # 5037
+addsi s7077, s7076, 1 # 5038
+addsi s7079, s7078, 1 # 5039
+addsi s7081, s7080, 1 # 5040
+addsi s7083, s7082, 1 # 5041
+addsi s7085, s7084, 1 # 5042
+addsi s7087, s7086, 1 # 5043
+addsi s7089, s7088, 1 # 5044
+addsi s7091, s7090, 1 # 5045
+addsi s7093, s7092, 1 # 5046
+addsi s7095, s7094, 1 # 5047
+addsi s7097, s7096, 1 # 5048
+addsi s7099, s7098, 1 # 5049
+addsi s7101, s7100, 1 # 5050
+addsi s7103, s7102, 1 # 5051
+addsi s7105, s7104, 1 # 5052
+addsi s7107, s7106, 1 # 5053
+addsi s7109, s7108, 1 # 5054
+addsi s7111, s7110, 1 # 5055
+addsi s7113, s7112, 1 # 5056
+addsi s7115, s7114, 1 # 5057
+addsi s7117, s7116, 1 # 5058
+addsi s7119, s7118, 1 # 5059
+addsi s7121, s7120, 1 # 5060
+addsi s7123, s7122, 1 # 5061
+addsi s7125, s7124, 1 # 5062
+addsi s7127, s7126, 1 # 5063
+addsi s7129, s7128, 1 # 5064
+addsi s7131, s7130, 1 # 5065
+addsi s7133, s7132, 1 # 5066
+addsi s7135, s7134, 1 # 5067
+addsi s7137, s7136, 1 # 5068
+addsi s7139, s7138, 1 # 5069
+addsi s7141, s7140, 1 # 5070
+addsi s7143, s7142, 1 # 5071
+addsi s7145, s7144, 1 # 5072
+addsi s7147, s7146, 1 # 5073
+addsi s7149, s7148, 1 # 5074
+addsi s7151, s7150, 1 # 5075
+addsi s7153, s7152, 1 # 5076
+addsi s7155, s7154, 1 # 5077
+addsi s7157, s7156, 1 # 5078
+addsi s7159, s7158, 1 # 5079
+addsi s7161, s7160, 1 # 5080
+addsi s7163, s7162, 1 # 5081
+addsi s7165, s7164, 1 # 5082
+addsi s7167, s7166, 1 # 5083
+addsi s7169, s7168, 1 # 5084
+addsi s7171, s7170, 1 # 5085
+addsi s7173, s7172, 1 # 5086
+addsi s7175, s7174, 1 # 5087
+addsi s7177, s7176, 1 # 5088
+addsi s7179, s7178, 1 # 5089
+addsi s7181, s7180, 1 # 5090
+addsi s7183, s7182, 1 # 5091
+addsi s7185, s7184, 1 # 5092
+addsi s7187, s7186, 1 # 5093
+addsi s7189, s7188, 1 # 5094
+addsi s7191, s7190, 1 # 5095
+addsi s7193, s7192, 1 # 5096
+addsi s7195, s7194, 1 # 5097
+addsi s7197, s7196, 1 # 5098
+addsi s7199, s7198, 1 # 5099
+addsi s7201, s7200, 1 # 5100
+addsi s7203, s7202, 1 # 5101
+addsi s7205, s7204, 1 # 5102
+addsi s7207, s7206, 1 # 5103
+addsi s7209, s7208, 1 # 5104
+addsi s7211, s7210, 1 # 5105
+addsi s7213, s7212, 1 # 5106
+addsi s7215, s7214, 1 # 5107
+addsi s7217, s7216, 1 # 5108
+addsi s7219, s7218, 1 # 5109
+addsi s7221, s7220, 1 # 5110
+addsi s7223, s7222, 1 # 5111
+addsi s7225, s7224, 1 # 5112
+addsi s7227, s7226, 1 # 5113
+addsi s7229, s7228, 1 # 5114
+addsi s7231, s7230, 1 # 5115
+addsi s7233, s7232, 1 # 5116
+addsi s7235, s7234, 1 # 5117
+addsi s7237, s7236, 1 # 5118
+addsi s7239, s7238, 1 # 5119
+addsi s7241, s7240, 1 # 5120
+addsi s7243, s7242, 1 # 5121
+addsi s7245, s7244, 1 # 5122
+addsi s7247, s7246, 1 # 5123
+addsi s7249, s7248, 1 # 5124
+addsi s7251, s7250, 1 # 5125
+addsi s7253, s7252, 1 # 5126
+addsi s7255, s7254, 1 # 5127
+addsi s7257, s7256, 1 # 5128
+addsi s7259, s7258, 1 # 5129
+addsi s7261, s7260, 1 # 5130
+addsi s7263, s7262, 1 # 5131
+addsi s7265, s7264, 1 # 5132
+addsi s7267, s7266, 1 # 5133
+addsi s7269, s7268, 1 # 5134
+addsi s7271, s7270, 1 # 5135
+addsi s7273, s7272, 1 # 5136
+addsi s7275, s7274, 1 # 5137
+addsi s7277, s7276, 1 # 5138
+addsi s7279, s7278, 1 # 5139
+addsi s7281, s7280, 1 # 5140
+addsi s7283, s7282, 1 # 5141
+addsi s7285, s7284, 1 # 5142
+addsi s7287, s7286, 1 # 5143
+addsi s7289, s7288, 1 # 5144
+addsi s7291, s7290, 1 # 5145
+addsi s7293, s7292, 1 # 5146
+addsi s7295, s7294, 1 # 5147
+addsi s7297, s7296, 1 # 5148
+addsi s7299, s7298, 1 # 5149
+addsi s7301, s7300, 1 # 5150
+addsi s7303, s7302, 1 # 5151
+addsi s7305, s7304, 1 # 5152
+addsi s7307, s7306, 1 # 5153
+addsi s7309, s7308, 1 # 5154
+addsi s7311, s7310, 1 # 5155
+addsi s7313, s7312, 1 # 5156
+addsi s7315, s7314, 1 # 5157
+addsi s7317, s7316, 1 # 5158
+addsi s7319, s7318, 1 # 5159
+addsi s7321, s7320, 1 # 5160
+addsi s7323, s7322, 1 # 5161
+addsi s7325, s7324, 1 # 5162
+addsi s7327, s7326, 1 # 5163
+addsi s7329, s7328, 1 # 5164
+addsi s7331, s7330, 1 # 5165
+addsi s7333, s7332, 1 # 5166
+addsi s7335, s7334, 1 # 5167
+addsi s7337, s7336, 1 # 5168
+addsi s7339, s7338, 1 # 5169
+addsi s7341, s7340, 1 # 5170
+addsi s7343, s7342, 1 # 5171
+addsi s7345, s7344, 1 # 5172
+addsi s7347, s7346, 1 # 5173
+addsi s7349, s7348, 1 # 5174
+addsi s7351, s7350, 1 # 5175
+addsi s7353, s7352, 1 # 5176
+addsi s7355, s7354, 1 # 5177
+addsi s7357, s7356, 1 # 5178
+addsi s7359, s7358, 1 # 5179
+addsi s7361, s7360, 1 # 5180
+addsi s7363, s7362, 1 # 5181
+addsi s7365, s7364, 1 # 5182
+addsi s7367, s7366, 1 # 5183
+addsi s7369, s7368, 1 # 5184
+addsi s7371, s7370, 1 # 5185
+addsi s7373, s7372, 1 # 5186
+addsi s7375, s7374, 1 # 5187
+addsi s7377, s7376, 1 # 5188
+addsi s7379, s7378, 1 # 5189
+addsi s7381, s7380, 1 # 5190
+addsi s7383, s7382, 1 # 5191
+addsi s7385, s7384, 1 # 5192
+addsi s7387, s7386, 1 # 5193
+addsi s7389, s7388, 1 # 5194
+addsi s7391, s7390, 1 # 5195
+addsi s7393, s7392, 1 # 5196
+addsi s7395, s7394, 1 # 5197
+addsi s7397, s7396, 1 # 5198
+addsi s7399, s7398, 1 # 5199
+addsi s7401, s7400, 1 # 5200
+addsi s7403, s7402, 1 # 5201
+addsi s7405, s7404, 1 # 5202
+addsi s7407, s7406, 1 # 5203
+addsi s7409, s7408, 1 # 5204
+addsi s7411, s7410, 1 # 5205
+addsi s7413, s7412, 1 # 5206
+addsi s7415, s7414, 1 # 5207
+addsi s7417, s7416, 1 # 5208
+addsi s7419, s7418, 1 # 5209
+addsi s7421, s7420, 1 # 5210
+addsi s7423, s7422, 1 # 5211
+addsi s7425, s7424, 1 # 5212
+addsi s7427, s7426, 1 # 5213
+addsi s7429, s7428, 1 # 5214
+addsi s7431, s7430, 1 # 5215
+addsi s7433, s7432, 1 # 5216
+addsi s7435, s7434, 1 # 5217
+addsi s7437, s7436, 1 # 5218
+addsi s7439, s7438, 1 # 5219
+addsi s7441, s7440, 1 # 5220
+addsi s7443, s7442, 1 # 5221
+addsi s7445, s7444, 1 # 5222
+addsi s7447, s7446, 1 # 5223
+addsi s7449, s7448, 1 # 5224
+addsi s7451, s7450, 1 # 5225
+addsi s7453, s7452, 1 # 5226
+addsi s7455, s7454, 1 # 5227
+addsi s7457, s7456, 1 # 5228
+addsi s7459, s7458, 1 # 5229
+addsi s7461, s7460, 1 # 5230
+addsi s7463, s7462, 1 # 5231
+addsi s7465, s7464, 1 # 5232
+addsi s7467, s7466, 1 # 5233
+addsi s7469, s7468, 1 # 5234
+addsi s7471, s7470, 1 # 5235
+addsi s7473, s7472, 1 # 5236
+addsi s7475, s7474, 1 # 5237
+addsi s7477, s7476, 1 # 5238
+addsi s7479, s7478, 1 # 5239
+addsi s7481, s7480, 1 # 5240
+addsi s7483, s7482, 1 # 5241
+addsi s7485, s7484, 1 # 5242
+addsi s7487, s7486, 1 # 5243
+addsi s7489, s7488, 1 # 5244
+addsi s7491, s7490, 1 # 5245
+addsi s7493, s7492, 1 # 5246
+addsi s7495, s7494, 1 # 5247
+addsi s7497, s7496, 1 # 5248
+addsi s7499, s7498, 1 # 5249
+addsi s7501, s7500, 1 # 5250
+addsi s7503, s7502, 1 # 5251
+addsi s7505, s7504, 1 # 5252
+addsi s7507, s7506, 1 # 5253
+addsi s7509, s7508, 1 # 5254
+addsi s7511, s7510, 1 # 5255
+addsi s7513, s7512, 1 # 5256
+addsi s7515, s7514, 1 # 5257
+addsi s7517, s7516, 1 # 5258
+addsi s7519, s7518, 1 # 5259
+addsi s7521, s7520, 1 # 5260
+addsi s7523, s7522, 1 # 5261
+addsi s7525, s7524, 1 # 5262
+addsi s7527, s7526, 1 # 5263
+addsi s7529, s7528, 1 # 5264
+addsi s7531, s7530, 1 # 5265
+addsi s7533, s7532, 1 # 5266
+addsi s7535, s7534, 1 # 5267
+addsi s7537, s7536, 1 # 5268
+addsi s7539, s7538, 1 # 5269
+addsi s7541, s7540, 1 # 5270
+addsi s7543, s7542, 1 # 5271
+addsi s7545, s7544, 1 # 5272
+addsi s7547, s7546, 1 # 5273
+addsi s7549, s7548, 1 # 5274
+addsi s7551, s7550, 1 # 5275
+addsi s7553, s7552, 1 # 5276
+addsi s7555, s7554, 1 # 5277
+addsi s7557, s7556, 1 # 5278
+addsi s7559, s7558, 1 # 5279
+addsi s7561, s7560, 1 # 5280
+addsi s7563, s7562, 1 # 5281
+addsi s7565, s7564, 1 # 5282
+addsi s7567, s7566, 1 # 5283
+addsi s7569, s7568, 1 # 5284
+addsi s7571, s7570, 1 # 5285
+addsi s7573, s7572, 1 # 5286
+addsi s7575, s7574, 1 # 5287
+addsi s7577, s7576, 1 # 5288
+addsi s7579, s7578, 1 # 5289
+addsi s7581, s7580, 1 # 5290
+addsi s7583, s7582, 1 # 5291
+addsi s7585, s7584, 1 # 5292
+addsi s7587, s7586, 1 # 5293
+addsi s7589, s7588, 1 # 5294
+addsi s7591, s7590, 1 # 5295
+addsi s7593, s7592, 1 # 5296
+addsi s7595, s7594, 1 # 5297
+addsi s7597, s7596, 1 # 5298
+addsi s7599, s7598, 1 # 5299
+addsi s7601, s7600, 1 # 5300
+addsi s7603, s7602, 1 # 5301
+addsi s7605, s7604, 1 # 5302
+addsi s7607, s7606, 1 # 5303
+addsi s7609, s7608, 1 # 5304
+addsi s7611, s7610, 1 # 5305
+addsi s7613, s7612, 1 # 5306
+addsi s7615, s7614, 1 # 5307
+addsi s7617, s7616, 1 # 5308
+addsi s7619, s7618, 1 # 5309
+addsi s7621, s7620, 1 # 5310
+addsi s7623, s7622, 1 # 5311
+addsi s7625, s7624, 1 # 5312
+addsi s7627, s7626, 1 # 5313
+addsi s7629, s7628, 1 # 5314
+addsi s7631, s7630, 1 # 5315
+addsi s7633, s7632, 1 # 5316
+addsi s7635, s7634, 1 # 5317
+addsi s7637, s7636, 1 # 5318
+addsi s7639, s7638, 1 # 5319
+addsi s7641, s7640, 1 # 5320
+addsi s7643, s7642, 1 # 5321
+addsi s7645, s7644, 1 # 5322
+addsi s7647, s7646, 1 # 5323
+addsi s7649, s7648, 1 # 5324
+addsi s7651, s7650, 1 # 5325
+addsi s7653, s7652, 1 # 5326
+addsi s7655, s7654, 1 # 5327
+addsi s7657, s7656, 1 # 5328
+addsi s7659, s7658, 1 # 5329
+addsi s7661, s7660, 1 # 5330
+addsi s7663, s7662, 1 # 5331
+addsi s7665, s7664, 1 # 5332
+addsi s7667, s7666, 1 # 5333
+addsi s7669, s7668, 1 # 5334
+addsi s7671, s7670, 1 # 5335
+addsi s7673, s7672, 1 # 5336
+addsi s7675, s7674, 1 # 5337
+addsi s7677, s7676, 1 # 5338
+addsi s7679, s7678, 1 # 5339
+addsi s7681, s7680, 1 # 5340
+addsi s7683, s7682, 1 # 5341
+addsi s7685, s7684, 1 # 5342
+addsi s7687, s7686, 1 # 5343
+addsi s7689, s7688, 1 # 5344
+addsi s7691, s7690, 1 # 5345
+addsi s7693, s7692, 1 # 5346
+addsi s7695, s7694, 1 # 5347
+addsi s7697, s7696, 1 # 5348
+addsi s7699, s7698, 1 # 5349
+addsi s7701, s7700, 1 # 5350
+addsi s7703, s7702, 1 # 5351
+addsi s7705, s7704, 1 # 5352
+addsi s7707, s7706, 1 # 5353
+addsi s7709, s7708, 1 # 5354
+addsi s7711, s7710, 1 # 5355
+addsi s7713, s7712, 1 # 5356
+addsi s7715, s7714, 1 # 5357
+addsi s7717, s7716, 1 # 5358
+addsi s7719, s7718, 1 # 5359
+addsi s7721, s7720, 1 # 5360
+addsi s7723, s7722, 1 # 5361
+addsi s7725, s7724, 1 # 5362
+addsi s7727, s7726, 1 # 5363
+addsi s7729, s7728, 1 # 5364
+addsi s7731, s7730, 1 # 5365
+addsi s7733, s7732, 1 # 5366
+addsi s7735, s7734, 1 # 5367
+addsi s7737, s7736, 1 # 5368
+addsi s7739, s7738, 1 # 5369
+addsi s7741, s7740, 1 # 5370
+addsi s7743, s7742, 1 # 5371
+addsi s7745, s7744, 1 # 5372
+addsi s7747, s7746, 1 # 5373
+addsi s7749, s7748, 1 # 5374
+addsi s7751, s7750, 1 # 5375
+addsi s7753, s7752, 1 # 5376
+addsi s7755, s7754, 1 # 5377
+addsi s7757, s7756, 1 # 5378
+addsi s7759, s7758, 1 # 5379
+addsi s7761, s7760, 1 # 5380
+addsi s7763, s7762, 1 # 5381
+addsi s7765, s7764, 1 # 5382
+addsi s7767, s7766, 1 # 5383
+addsi s7769, s7768, 1 # 5384
+addsi s7771, s7770, 1 # 5385
+addsi s7773, s7772, 1 # 5386
+addsi s7775, s7774, 1 # 5387
+addsi s7777, s7776, 1 # 5388
+addsi s7779, s7778, 1 # 5389
+addsi s7781, s7780, 1 # 5390
+addsi s7783, s7782, 1 # 5391
+addsi s7785, s7784, 1 # 5392
+addsi s7787, s7786, 1 # 5393
+addsi s7789, s7788, 1 # 5394
+addsi s7791, s7790, 1 # 5395
+addsi s7793, s7792, 1 # 5396
+addsi s7795, s7794, 1 # 5397
+addsi s7797, s7796, 1 # 5398
+addsi s7799, s7798, 1 # 5399
+addsi s7801, s7800, 1 # 5400
+addsi s7803, s7802, 1 # 5401
+addsi s7805, s7804, 1 # 5402
+addsi s7807, s7806, 1 # 5403
+addsi s7809, s7808, 1 # 5404
+addsi s7811, s7810, 1 # 5405
+addsi s7813, s7812, 1 # 5406
+addsi s7815, s7814, 1 # 5407
+addsi s7817, s7816, 1 # 5408
+addsi s7819, s7818, 1 # 5409
+addsi s7821, s7820, 1 # 5410
+addsi s7823, s7822, 1 # 5411
+addsi s7825, s7824, 1 # 5412
+addsi s7827, s7826, 1 # 5413
+addsi s7829, s7828, 1 # 5414
+addsi s7831, s7830, 1 # 5415
+addsi s7833, s7832, 1 # 5416
+addsi s7835, s7834, 1 # 5417
+addsi s7837, s7836, 1 # 5418
+addsi s7839, s7838, 1 # 5419
+addsi s7841, s7840, 1 # 5420
+addsi s7843, s7842, 1 # 5421
+addsi s7845, s7844, 1 # 5422
+addsi s7847, s7846, 1 # 5423
+addsi s7849, s7848, 1 # 5424
+addsi s7851, s7850, 1 # 5425
+addsi s7853, s7852, 1 # 5426
+addsi s7855, s7854, 1 # 5427
+addsi s7857, s7856, 1 # 5428
+addsi s7859, s7858, 1 # 5429
+addsi s7861, s7860, 1 # 5430
+addsi s7863, s7862, 1 # 5431
+addsi s7865, s7864, 1 # 5432
+addsi s7867, s7866, 1 # 5433
+addsi s7869, s7868, 1 # 5434
+addsi s7871, s7870, 1 # 5435
+addsi s7873, s7872, 1 # 5436
+addsi s7875, s7874, 1 # 5437
+addsi s7877, s7876, 1 # 5438
+addsi s7879, s7878, 1 # 5439
+addsi s7881, s7880, 1 # 5440
+addsi s7883, s7882, 1 # 5441
+addsi s7885, s7884, 1 # 5442
+addsi s7887, s7886, 1 # 5443
+addsi s7889, s7888, 1 # 5444
+addsi s7891, s7890, 1 # 5445
+addsi s7893, s7892, 1 # 5446
+addsi s7895, s7894, 1 # 5447
+addsi s7897, s7896, 1 # 5448
+addsi s7899, s7898, 1 # 5449
+addsi s7901, s7900, 1 # 5450
+addsi s7903, s7902, 1 # 5451
+addsi s7905, s7904, 1 # 5452
+addsi s7907, s7906, 1 # 5453
+addsi s7909, s7908, 1 # 5454
+addsi s7911, s7910, 1 # 5455
+addsi s7913, s7912, 1 # 5456
+addsi s7915, s7914, 1 # 5457
+addsi s7917, s7916, 1 # 5458
+addsi s7919, s7918, 1 # 5459
+addsi s7921, s7920, 1 # 5460
+addsi s7923, s7922, 1 # 5461
+addsi s7925, s7924, 1 # 5462
+addsi s7927, s7926, 1 # 5463
+addsi s7929, s7928, 1 # 5464
+addsi s7931, s7930, 1 # 5465
+addsi s7933, s7932, 1 # 5466
+addsi s7935, s7934, 1 # 5467
+addsi s7937, s7936, 1 # 5468
+addsi s7939, s7938, 1 # 5469
+addsi s7941, s7940, 1 # 5470
+addsi s7943, s7942, 1 # 5471
+addsi s7945, s7944, 1 # 5472
+addsi s7947, s7946, 1 # 5473
+addsi s7949, s7948, 1 # 5474
+addsi s7951, s7950, 1 # 5475
+addsi s7953, s7952, 1 # 5476
+addsi s7955, s7954, 1 # 5477
+addsi s7957, s7956, 1 # 5478
+addsi s7959, s7958, 1 # 5479
+addsi s7961, s7960, 1 # 5480
+addsi s7963, s7962, 1 # 5481
+addsi s7965, s7964, 1 # 5482
+addsi s7967, s7966, 1 # 5483
+addsi s7969, s7968, 1 # 5484
+addsi s7971, s7970, 1 # 5485
+addsi s7973, s7972, 1 # 5486
+addsi s7975, s7974, 1 # 5487
+addsi s7977, s7976, 1 # 5488
+addsi s7979, s7978, 1 # 5489
+addsi s7981, s7980, 1 # 5490
+addsi s7983, s7982, 1 # 5491
+addsi s7985, s7984, 1 # 5492
+addsi s7987, s7986, 1 # 5493
+addsi s7989, s7988, 1 # 5494
+addsi s7991, s7990, 1 # 5495
+addsi s7993, s7992, 1 # 5496
+addsi s7995, s7994, 1 # 5497
+addsi s7997, s7996, 1 # 5498
+addsi s7999, s7998, 1 # 5499
+addsi s8001, s8000, 1 # 5500
+addsi s8003, s8002, 1 # 5501
+addsi s8005, s8004, 1 # 5502
+addsi s8007, s8006, 1 # 5503
+addsi s8009, s8008, 1 # 5504
+addsi s8011, s8010, 1 # 5505
+addsi s8013, s8012, 1 # 5506
+addsi s8015, s8014, 1 # 5507
+addsi s8017, s8016, 1 # 5508
+addsi s8019, s8018, 1 # 5509
+addsi s8021, s8020, 1 # 5510
+addsi s8023, s8022, 1 # 5511
+addsi s8025, s8024, 1 # 5512
+addsi s8027, s8026, 1 # 5513
+addsi s8029, s8028, 1 # 5514
+addsi s8031, s8030, 1 # 5515
+addsi s8033, s8032, 1 # 5516
+addsi s8035, s8034, 1 # 5517
+addsi s8037, s8036, 1 # 5518
+addsi s8039, s8038, 1 # 5519
+addsi s8041, s8040, 1 # 5520
+addsi s8043, s8042, 1 # 5521
+addsi s8045, s8044, 1 # 5522
+addsi s8047, s8046, 1 # 5523
+addsi s8049, s8048, 1 # 5524
+addsi s8051, s8050, 1 # 5525
+addsi s8053, s8052, 1 # 5526
+addsi s8055, s8054, 1 # 5527
+addsi s8057, s8056, 1 # 5528
+addsi s8059, s8058, 1 # 5529
+addsi s8061, s8060, 1 # 5530
+addsi s8063, s8062, 1 # 5531
+addsi s8065, s8064, 1 # 5532
+addsi s8067, s8066, 1 # 5533
+addsi s8069, s8068, 1 # 5534
+addsi s8071, s8070, 1 # 5535
+addsi s8073, s8072, 1 # 5536
+addsi s8075, s8074, 1 # 5537
+addsi s8077, s8076, 1 # 5538
+addsi s8079, s8078, 1 # 5539
+addsi s8081, s8080, 1 # 5540
+addsi s8083, s8082, 1 # 5541
+addsi s8085, s8084, 1 # 5542
+addsi s8087, s8086, 1 # 5543
+addsi s8089, s8088, 1 # 5544
+addsi s8091, s8090, 1 # 5545
+addsi s8093, s8092, 1 # 5546
+addsi s8095, s8094, 1 # 5547
+addsi s8097, s8096, 1 # 5548
+addsi s8099, s8098, 1 # 5549
+addsi s8101, s8100, 1 # 5550
+addsi s8103, s8102, 1 # 5551
+addsi s8105, s8104, 1 # 5552
+addsi s8107, s8106, 1 # 5553
+addsi s8109, s8108, 1 # 5554
+addsi s8111, s8110, 1 # 5555
+addsi s8113, s8112, 1 # 5556
+addsi s8115, s8114, 1 # 5557
+addsi s8117, s8116, 1 # 5558
+addsi s8119, s8118, 1 # 5559
+addsi s8121, s8120, 1 # 5560
+addsi s8123, s8122, 1 # 5561
+addsi s8125, s8124, 1 # 5562
+addsi s8127, s8126, 1 # 5563
+addsi s8129, s8128, 1 # 5564
+addsi s8131, s8130, 1 # 5565
+addsi s8133, s8132, 1 # 5566
+addsi s8135, s8134, 1 # 5567
+addsi s8137, s8136, 1 # 5568
+addsi s8139, s8138, 1 # 5569
+addsi s8141, s8140, 1 # 5570
+addsi s8143, s8142, 1 # 5571
+addsi s8145, s8144, 1 # 5572
+addsi s8147, s8146, 1 # 5573
+addsi s8149, s8148, 1 # 5574
+addsi s8151, s8150, 1 # 5575
+addsi s8153, s8152, 1 # 5576
+addsi s8155, s8154, 1 # 5577
+addsi s8157, s8156, 1 # 5578
+addsi s8159, s8158, 1 # 5579
+addsi s8161, s8160, 1 # 5580
+addsi s8163, s8162, 1 # 5581
+addsi s8165, s8164, 1 # 5582
+addsi s8167, s8166, 1 # 5583
+addsi s8169, s8168, 1 # 5584
+addsi s8171, s8170, 1 # 5585
+addsi s8173, s8172, 1 # 5586
+addsi s8175, s8174, 1 # 5587
+addsi s8177, s8176, 1 # 5588
+addsi s8179, s8178, 1 # 5589
+addsi s8181, s8180, 1 # 5590
+addsi s8183, s8182, 1 # 5591
+addsi s8185, s8184, 1 # 5592
+addsi s8187, s8186, 1 # 5593
+addsi s8189, s8188, 1 # 5594
+addsi s8191, s8190, 1 # 5595
+addsi s8193, s8192, 1 # 5596
+addsi s8195, s8194, 1 # 5597
+addsi s8197, s8196, 1 # 5598
+addsi s8199, s8198, 1 # 5599
+addsi s8201, s8200, 1 # 5600
+addsi s8203, s8202, 1 # 5601
+addsi s8205, s8204, 1 # 5602
+addsi s8207, s8206, 1 # 5603
+addsi s8209, s8208, 1 # 5604
+addsi s8211, s8210, 1 # 5605
+addsi s8213, s8212, 1 # 5606
+addsi s8215, s8214, 1 # 5607
+addsi s8217, s8216, 1 # 5608
+addsi s8219, s8218, 1 # 5609
+addsi s8221, s8220, 1 # 5610
+addsi s8223, s8222, 1 # 5611
+addsi s8225, s8224, 1 # 5612
+addsi s8227, s8226, 1 # 5613
+addsi s8229, s8228, 1 # 5614
+addsi s8231, s8230, 1 # 5615
+addsi s8233, s8232, 1 # 5616
+addsi s8235, s8234, 1 # 5617
+addsi s8237, s8236, 1 # 5618
+addsi s8239, s8238, 1 # 5619
+addsi s8241, s8240, 1 # 5620
+addsi s8243, s8242, 1 # 5621
+addsi s8245, s8244, 1 # 5622
+addsi s8247, s8246, 1 # 5623
+addsi s8249, s8248, 1 # 5624
+addsi s8251, s8250, 1 # 5625
+addsi s8253, s8252, 1 # 5626
+addsi s8255, s8254, 1 # 5627
+addsi s8257, s8256, 1 # 5628
+addsi s8259, s8258, 1 # 5629
+addsi s8261, s8260, 1 # 5630
+addsi s8263, s8262, 1 # 5631
+addsi s8265, s8264, 1 # 5632
+addsi s8267, s8266, 1 # 5633
+addsi s8269, s8268, 1 # 5634
+addsi s8271, s8270, 1 # 5635
+addsi s8273, s8272, 1 # 5636
+addsi s8275, s8274, 1 # 5637
+addsi s8277, s8276, 1 # 5638
+addsi s8279, s8278, 1 # 5639
+addsi s8281, s8280, 1 # 5640
+addsi s8283, s8282, 1 # 5641
+addsi s8285, s8284, 1 # 5642
+addsi s8287, s8286, 1 # 5643
+addsi s8289, s8288, 1 # 5644
+addsi s8291, s8290, 1 # 5645
+addsi s8293, s8292, 1 # 5646
+addsi s8295, s8294, 1 # 5647
+addsi s8297, s8296, 1 # 5648
+addsi s8299, s8298, 1 # 5649
+addsi s8301, s8300, 1 # 5650
+addsi s8303, s8302, 1 # 5651
+addsi s8305, s8304, 1 # 5652
+addsi s8307, s8306, 1 # 5653
+addsi s8309, s8308, 1 # 5654
+addsi s8311, s8310, 1 # 5655
+addsi s8313, s8312, 1 # 5656
+addsi s8315, s8314, 1 # 5657
+addsi s8317, s8316, 1 # 5658
+addsi s8319, s8318, 1 # 5659
+addsi s8321, s8320, 1 # 5660
+addsi s8323, s8322, 1 # 5661
+addsi s8325, s8324, 1 # 5662
+addsi s8327, s8326, 1 # 5663
+addsi s8329, s8328, 1 # 5664
+addsi s8331, s8330, 1 # 5665
+addsi s8333, s8332, 1 # 5666
+addsi s8335, s8334, 1 # 5667
+addsi s8337, s8336, 1 # 5668
+addsi s8339, s8338, 1 # 5669
+addsi s8341, s8340, 1 # 5670
+addsi s8343, s8342, 1 # 5671
+addsi s8345, s8344, 1 # 5672
+addsi s8347, s8346, 1 # 5673
+addsi s8349, s8348, 1 # 5674
+addsi s8351, s8350, 1 # 5675
+addsi s8353, s8352, 1 # 5676
+addsi s8355, s8354, 1 # 5677
+addsi s8357, s8356, 1 # 5678
+addsi s8359, s8358, 1 # 5679
+addsi s8361, s8360, 1 # 5680
+addsi s8363, s8362, 1 # 5681
+addsi s8365, s8364, 1 # 5682
+addsi s8367, s8366, 1 # 5683
+addsi s8369, s8368, 1 # 5684
+addsi s8371, s8370, 1 # 5685
+addsi s8373, s8372, 1 # 5686
+addsi s8375, s8374, 1 # 5687
+addsi s8377, s8376, 1 # 5688
+addsi s8379, s8378, 1 # 5689
+addsi s8381, s8380, 1 # 5690
+addsi s8383, s8382, 1 # 5691
+addsi s8385, s8384, 1 # 5692
+addsi s8387, s8386, 1 # 5693
+addsi s8389, s8388, 1 # 5694
+addsi s8391, s8390, 1 # 5695
+addsi s8393, s8392, 1 # 5696
+addsi s8395, s8394, 1 # 5697
+addsi s8397, s8396, 1 # 5698
+addsi s8399, s8398, 1 # 5699
+addsi s8401, s8400, 1 # 5700
+addsi s8403, s8402, 1 # 5701
+addsi s8405, s8404, 1 # 5702
+addsi s8407, s8406, 1 # 5703
+addsi s8409, s8408, 1 # 5704
+addsi s8411, s8410, 1 # 5705
+addsi s8413, s8412, 1 # 5706
+addsi s8415, s8414, 1 # 5707
+addsi s8417, s8416, 1 # 5708
+addsi s8419, s8418, 1 # 5709
+addsi s8421, s8420, 1 # 5710
+addsi s8423, s8422, 1 # 5711
+addsi s8425, s8424, 1 # 5712
+addsi s8427, s8426, 1 # 5713
+addsi s8429, s8428, 1 # 5714
+addsi s8431, s8430, 1 # 5715
+addsi s8433, s8432, 1 # 5716
+addsi s8435, s8434, 1 # 5717
+addsi s8437, s8436, 1 # 5718
+addsi s8439, s8438, 1 # 5719
+addsi s8441, s8440, 1 # 5720
+addsi s8443, s8442, 1 # 5721
+addsi s8445, s8444, 1 # 5722
+addsi s8447, s8446, 1 # 5723
+addsi s8449, s8448, 1 # 5724
+addsi s8451, s8450, 1 # 5725
+addsi s8453, s8452, 1 # 5726
+addsi s8455, s8454, 1 # 5727
+addsi s8457, s8456, 1 # 5728
+addsi s8459, s8458, 1 # 5729
+addsi s8461, s8460, 1 # 5730
+addsi s8463, s8462, 1 # 5731
+addsi s8465, s8464, 1 # 5732
+addsi s8467, s8466, 1 # 5733
+addsi s8469, s8468, 1 # 5734
+addsi s8471, s8470, 1 # 5735
+addsi s8473, s8472, 1 # 5736
+addsi s8475, s8474, 1 # 5737
+addsi s8477, s8476, 1 # 5738
+addsi s8479, s8478, 1 # 5739
+addsi s8481, s8480, 1 # 5740
+addsi s8483, s8482, 1 # 5741
+addsi s8485, s8484, 1 # 5742
+addsi s8487, s8486, 1 # 5743
+addsi s8489, s8488, 1 # 5744
+addsi s8491, s8490, 1 # 5745
+addsi s8493, s8492, 1 # 5746
+addsi s8495, s8494, 1 # 5747
+addsi s8497, s8496, 1 # 5748
+addsi s8499, s8498, 1 # 5749
+addsi s8501, s8500, 1 # 5750
+addsi s8503, s8502, 1 # 5751
+addsi s8505, s8504, 1 # 5752
+addsi s8507, s8506, 1 # 5753
+addsi s8509, s8508, 1 # 5754
+addsi s8511, s8510, 1 # 5755
+addsi s8513, s8512, 1 # 5756
+addsi s8515, s8514, 1 # 5757
+addsi s8517, s8516, 1 # 5758
+addsi s8519, s8518, 1 # 5759
+addsi s8521, s8520, 1 # 5760
+addsi s8523, s8522, 1 # 5761
+addsi s8525, s8524, 1 # 5762
+addsi s8527, s8526, 1 # 5763
+addsi s8529, s8528, 1 # 5764
+addsi s8531, s8530, 1 # 5765
+addsi s8533, s8532, 1 # 5766
+addsi s8535, s8534, 1 # 5767
+addsi s8537, s8536, 1 # 5768
+addsi s8539, s8538, 1 # 5769
+addsi s8541, s8540, 1 # 5770
+addsi s8543, s8542, 1 # 5771
+addsi s8545, s8544, 1 # 5772
+addsi s8547, s8546, 1 # 5773
+addsi s8549, s8548, 1 # 5774
+addsi s8551, s8550, 1 # 5775
+addsi s8553, s8552, 1 # 5776
+addsi s8555, s8554, 1 # 5777
+addsi s8557, s8556, 1 # 5778
+addsi s8559, s8558, 1 # 5779
+addsi s8561, s8560, 1 # 5780
+addsi s8563, s8562, 1 # 5781
+addsi s8565, s8564, 1 # 5782
+addsi s8567, s8566, 1 # 5783
+addsi s8569, s8568, 1 # 5784
+addsi s8571, s8570, 1 # 5785
+addsi s8573, s8572, 1 # 5786
+addsi s8575, s8574, 1 # 5787
+addsi s8577, s8576, 1 # 5788
+addsi s8579, s8578, 1 # 5789
+addsi s8581, s8580, 1 # 5790
+addsi s8583, s8582, 1 # 5791
+addsi s8585, s8584, 1 # 5792
+addsi s8587, s8586, 1 # 5793
+addsi s8589, s8588, 1 # 5794
+addsi s8591, s8590, 1 # 5795
+addsi s8593, s8592, 1 # 5796
+addsi s8595, s8594, 1 # 5797
+addsi s8597, s8596, 1 # 5798
+addsi s8599, s8598, 1 # 5799
+addsi s8601, s8600, 1 # 5800
+addsi s8603, s8602, 1 # 5801
+addsi s8605, s8604, 1 # 5802
+addsi s8607, s8606, 1 # 5803
+addsi s8609, s8608, 1 # 5804
+addsi s8611, s8610, 1 # 5805
+addsi s8613, s8612, 1 # 5806
+addsi s8615, s8614, 1 # 5807
+addsi s8617, s8616, 1 # 5808
+addsi s8619, s8618, 1 # 5809
+addsi s8621, s8620, 1 # 5810
+addsi s8623, s8622, 1 # 5811
+addsi s8625, s8624, 1 # 5812
+addsi s8627, s8626, 1 # 5813
+addsi s8629, s8628, 1 # 5814
+addsi s8631, s8630, 1 # 5815
+addsi s8633, s8632, 1 # 5816
+addsi s8635, s8634, 1 # 5817
+addsi s8637, s8636, 1 # 5818
+addsi s8639, s8638, 1 # 5819
+addsi s8641, s8640, 1 # 5820
+addsi s8643, s8642, 1 # 5821
+addsi s8645, s8644, 1 # 5822
+addsi s8647, s8646, 1 # 5823
+addsi s8649, s8648, 1 # 5824
+addsi s8651, s8650, 1 # 5825
+addsi s8653, s8652, 1 # 5826
+addsi s8655, s8654, 1 # 5827
+addsi s8657, s8656, 1 # 5828
+addsi s8659, s8658, 1 # 5829
+addsi s8661, s8660, 1 # 5830
+addsi s8663, s8662, 1 # 5831
+addsi s8665, s8664, 1 # 5832
+addsi s8667, s8666, 1 # 5833
+addsi s8669, s8668, 1 # 5834
+addsi s8671, s8670, 1 # 5835
+addsi s8673, s8672, 1 # 5836
+addsi s8675, s8674, 1 # 5837
+addsi s8677, s8676, 1 # 5838
+addsi s8679, s8678, 1 # 5839
+addsi s8681, s8680, 1 # 5840
+addsi s8683, s8682, 1 # 5841
+addsi s8685, s8684, 1 # 5842
+addsi s8687, s8686, 1 # 5843
+addsi s8689, s8688, 1 # 5844
+addsi s8691, s8690, 1 # 5845
+addsi s8693, s8692, 1 # 5846
+addsi s8695, s8694, 1 # 5847
+addsi s8697, s8696, 1 # 5848
+addsi s8699, s8698, 1 # 5849
+addsi s8701, s8700, 1 # 5850
+addsi s8703, s8702, 1 # 5851
+addsi s8705, s8704, 1 # 5852
+addsi s8707, s8706, 1 # 5853
+addsi s8709, s8708, 1 # 5854
+addsi s8711, s8710, 1 # 5855
+addsi s8713, s8712, 1 # 5856
+addsi s8715, s8714, 1 # 5857
+addsi s8717, s8716, 1 # 5858
+addsi s8719, s8718, 1 # 5859
+addsi s8721, s8720, 1 # 5860
+addsi s8723, s8722, 1 # 5861
+addsi s8725, s8724, 1 # 5862
+addsi s8727, s8726, 1 # 5863
+addsi s8729, s8728, 1 # 5864
+addsi s8731, s8730, 1 # 5865
+addsi s8733, s8732, 1 # 5866
+addsi s8735, s8734, 1 # 5867
+addsi s8737, s8736, 1 # 5868
+addsi s8739, s8738, 1 # 5869
+addsi s8741, s8740, 1 # 5870
+addsi s8743, s8742, 1 # 5871
+addsi s8745, s8744, 1 # 5872
+addsi s8747, s8746, 1 # 5873
+addsi s8749, s8748, 1 # 5874
+addsi s8751, s8750, 1 # 5875
+addsi s8753, s8752, 1 # 5876
+addsi s8755, s8754, 1 # 5877
+addsi s8757, s8756, 1 # 5878
+addsi s8759, s8758, 1 # 5879
+addsi s8761, s8760, 1 # 5880
+addsi s8763, s8762, 1 # 5881
+addsi s8765, s8764, 1 # 5882
+addsi s8767, s8766, 1 # 5883
+addsi s8769, s8768, 1 # 5884
+addsi s8771, s8770, 1 # 5885
+addsi s8773, s8772, 1 # 5886
+addsi s8775, s8774, 1 # 5887
+addsi s8777, s8776, 1 # 5888
+addsi s8779, s8778, 1 # 5889
+addsi s8781, s8780, 1 # 5890
+addsi s8783, s8782, 1 # 5891
+addsi s8785, s8784, 1 # 5892
+addsi s8787, s8786, 1 # 5893
+addsi s8789, s8788, 1 # 5894
+addsi s8791, s8790, 1 # 5895
+addsi s8793, s8792, 1 # 5896
+addsi s8795, s8794, 1 # 5897
+addsi s8797, s8796, 1 # 5898
+addsi s8799, s8798, 1 # 5899
+addsi s8801, s8800, 1 # 5900
+addsi s8803, s8802, 1 # 5901
+addsi s8805, s8804, 1 # 5902
+addsi s8807, s8806, 1 # 5903
+addsi s8809, s8808, 1 # 5904
+addsi s8811, s8810, 1 # 5905
+addsi s8813, s8812, 1 # 5906
+addsi s8815, s8814, 1 # 5907
+addsi s8817, s8816, 1 # 5908
+addsi s8819, s8818, 1 # 5909
+addsi s8821, s8820, 1 # 5910
+addsi s8823, s8822, 1 # 5911
+addsi s8825, s8824, 1 # 5912
+addsi s8827, s8826, 1 # 5913
+addsi s8829, s8828, 1 # 5914
+addsi s8831, s8830, 1 # 5915
+addsi s8833, s8832, 1 # 5916
+addsi s8835, s8834, 1 # 5917
+addsi s8837, s8836, 1 # 5918
+addsi s8839, s8838, 1 # 5919
+addsi s8841, s8840, 1 # 5920
+addsi s8843, s8842, 1 # 5921
+addsi s8845, s8844, 1 # 5922
+addsi s8847, s8846, 1 # 5923
+addsi s8849, s8848, 1 # 5924
+addsi s8851, s8850, 1 # 5925
+addsi s8853, s8852, 1 # 5926
+addsi s8855, s8854, 1 # 5927
+addsi s8857, s8856, 1 # 5928
+addsi s8859, s8858, 1 # 5929
+addsi s8861, s8860, 1 # 5930
+addsi s8863, s8862, 1 # 5931
+addsi s8865, s8864, 1 # 5932
+addsi s8867, s8866, 1 # 5933
+addsi s8869, s8868, 1 # 5934
+addsi s8871, s8870, 1 # 5935
+addsi s8873, s8872, 1 # 5936
+addsi s8875, s8874, 1 # 5937
+addsi s8877, s8876, 1 # 5938
+addsi s8879, s8878, 1 # 5939
+addsi s8881, s8880, 1 # 5940
+addsi s8883, s8882, 1 # 5941
+addsi s8885, s8884, 1 # 5942
+addsi s8887, s8886, 1 # 5943
+addsi s8889, s8888, 1 # 5944
+addsi s8891, s8890, 1 # 5945
+addsi s8893, s8892, 1 # 5946
+addsi s8895, s8894, 1 # 5947
+addsi s8897, s8896, 1 # 5948
+addsi s8899, s8898, 1 # 5949
+addsi s8901, s8900, 1 # 5950
+addsi s8903, s8902, 1 # 5951
+addsi s8905, s8904, 1 # 5952
+addsi s8907, s8906, 1 # 5953
+addsi s8909, s8908, 1 # 5954
+addsi s8911, s8910, 1 # 5955
+addsi s8913, s8912, 1 # 5956
+addsi s8915, s8914, 1 # 5957
+addsi s8917, s8916, 1 # 5958
+addsi s8919, s8918, 1 # 5959
+addsi s8921, s8920, 1 # 5960
+addsi s8923, s8922, 1 # 5961
+addsi s8925, s8924, 1 # 5962
+addsi s8927, s8926, 1 # 5963
+addsi s8929, s8928, 1 # 5964
+addsi s8931, s8930, 1 # 5965
+addsi s8933, s8932, 1 # 5966
+addsi s8935, s8934, 1 # 5967
+addsi s8937, s8936, 1 # 5968
+addsi s8939, s8938, 1 # 5969
+addsi s8941, s8940, 1 # 5970
+addsi s8943, s8942, 1 # 5971
+addsi s8945, s8944, 1 # 5972
+addsi s8947, s8946, 1 # 5973
+addsi s8949, s8948, 1 # 5974
+addsi s8951, s8950, 1 # 5975
+addsi s8953, s8952, 1 # 5976
+addsi s8955, s8954, 1 # 5977
+addsi s8957, s8956, 1 # 5978
+addsi s8959, s8958, 1 # 5979
+addsi s8961, s8960, 1 # 5980
+addsi s8963, s8962, 1 # 5981
+addsi s8965, s8964, 1 # 5982
+addsi s8967, s8966, 1 # 5983
+addsi s8969, s8968, 1 # 5984
+addsi s8971, s8970, 1 # 5985
+addsi s8973, s8972, 1 # 5986
+addsi s8975, s8974, 1 # 5987
+addsi s8977, s8976, 1 # 5988
+addsi s8979, s8978, 1 # 5989
+addsi s8981, s8980, 1 # 5990
+addsi s8983, s8982, 1 # 5991
+addsi s8985, s8984, 1 # 5992
+addsi s8987, s8986, 1 # 5993
+addsi s8989, s8988, 1 # 5994
+addsi s8991, s8990, 1 # 5995
+addsi s8993, s8992, 1 # 5996
+addsi s8995, s8994, 1 # 5997
+addsi s8997, s8996, 1 # 5998
+addsi s8999, s8998, 1 # 5999
+muls 12000, 1, s1, s0, s3001, 1, s3000, s3002, s3003, 1, s2999, s3004, s3005, 1, s2998, s3006, s3007, 1, s2997, s3008, s3009, 1, s2996, s3010, s3011, 1, s2995, s3012, s3013, 1, s2994, s3014, s3015, 1, s2993, s3016, s3017, 1, s2992, s3018, s3019, 1, s2991, s3020, s3021, 1, s2990, s3022, s3023, 1, s2989, s3024, s3025, 1, s2988, s3026, s3027, 1, s2987, s3028, s3029, 1, s2986, s3030, s3031, 1, s2985, s3032, s3033, 1, s2984, s3034, s3035, 1, s2983, s3036, s3037, 1, s2982, s3038, s3039, 1, s2981, s3040, s3041, 1, s2980, s3042, s3043, 1, s2979, s3044, s3045, 1, s2978, s3046, s3047, 1, s2977, s3048, s3049, 1, s2976, s3050, s3051, 1, s2975, s3052, s3053, 1, s2974, s3054, s3055, 1, s2973, s3056, s3057, 1, s2972, s3058, s3059, 1, s2971, s3060, s3061, 1, s2970, s3062, s3063, 1, s2969, s3064, s3065, 1, s2968, s3066, s3067, 1, s2967, s3068, s3069, 1, s2966, s3070, s3071, 1, s2965, s3072, s3073, 1, s2964, s3074, s3075, 1, s2963, s3076, s3077, 1, s2962, s3078, s3079, 1, s2961, s3080, s3081, 1, s2960, s3082, s3083, 1, s2959, s3084, s3085, 1, s2958, s3086, s3087, 1, s2957, s3088, s3089, 1, s2956, s3090, s3091, 1, s2955, s3092, s3093, 1, s2954, s3094, s3095, 1, s2953, s3096, s3097, 1, s2952, s3098, s3099, 1, s2951, s3100, s3101, 1, s2950, s3102, s3103, 1, s2949, s3104, s3105, 1, s2948, s3106, s3107, 1, s2947, s3108, s3109, 1, s2946, s3110, s3111, 1, s2945, s3112, s3113, 1, s2944, s3114, s3115, 1, s2943, s3116, s3117, 1, s2942, s3118, s3119, 1, s2941, s3120, s3121, 1, s2940, s3122, s3123, 1, s2939, s3124, s3125, 1, s2938, s3126, s3127, 1, s2937, s3128, s3129, 1, s2936, s3130, s3131, 1, s2935, s3132, s3133, 1, s2934, s3134, s3135, 1, s2933, s3136, s3137, 1, s2932, s3138, s3139, 1, s2931, s3140, s3141, 1, s2930, s3142, s3143, 1, s2929, s3144, s3145, 1, s2928, s3146, s3147, 1, s2927, s3148, s3149, 1, s2926, s3150, s3151, 1, s2925, s3152, s3153, 1, s2924, s3154, s3155, 1, s2923, s3156, s3157, 1, s2922, s3158, s3159, 1, s2921, s3160, s3161, 1, s2920, s3162, s3163, 1, s2919, s3164, s3165, 1, s2918, s3166, s3167, 1, s2917, s3168, s3169, 1, s2916, s3170, s3171, 1, s2915, s3172, s3173, 1, s2914, s3174, s3175, 1, s2913, s3176, s3177, 1, s2912, s3178, s3179, 1, s2911, s3180, s3181, 1, s2910, s3182, s3183, 1, s2909, s3184, s3185, 1, s2908, s3186, s3187, 1, s2907, s3188, s3189, 1, s2906, s3190, s3191, 1, s2905, s3192, s3193, 1, s2904, s3194, s3195, 1, s2903, s3196, s3197, 1, s2902, s3198, s3199, 1, s2901, s3200, s3201, 1, s2900, s3202, s3203, 1, s2899, s3204, s3205, 1, s2898, s3206, s3207, 1, s2897, s3208, s3209, 1, s2896, s3210, s3211, 1, s2895, s3212, s3213, 1, s2894, s3214, s3215, 1, s2893, s3216, s3217, 1, s2892, s3218, s3219, 1, s2891, s3220, s3221, 1, s2890, s3222, s3223, 1, s2889, s3224, s3225, 1, s2888, s3226, s3227, 1, s2887, s3228, s3229, 1, s2886, s3230, s3231, 1, s2885, s3232, s3233, 1, s2884, s3234, s3235, 1, s2883, s3236, s3237, 1, s2882, s3238, s3239, 1, s2881, s3240, s3241, 1, s2880, s3242, s3243, 1, s2879, s3244, s3245, 1, s2878, s3246, s3247, 1, s2877, s3248, s3249, 1, s2876, s3250, s3251, 1, s2875, s3252, s3253, 1, s2874, s3254, s3255, 1, s2873, s3256, s3257, 1, s2872, s3258, s3259, 1, s2871, s3260, s3261, 1, s2870, s3262, s3263, 1, s2869, s3264, s3265, 1, s2868, s3266, s3267, 1, s2867, s3268, s3269, 1, s2866, s3270, s3271, 1, s2865, s3272, s3273, 1, s2864, s3274, s3275, 1, s2863, s3276, s3277, 1, s2862, s3278, s3279, 1, s2861, s3280, s3281, 1, s2860, s3282, s3283, 1, s2859, s3284, s3285, 1, s2858, s3286, s3287, 1, s2857, s3288, s3289, 1, s2856, s3290, s3291, 1, s2855, s3292, s3293, 1, s2854, s3294, s3295, 1, s2853, s3296, s3297, 1, s2852, s3298, s3299, 1, s2851, s3300, s3301, 1, s2850, s3302, s3303, 1, s2849, s3304, s3305, 1, s2848, s3306, s3307, 1, s2847, s3308, s3309, 1, s2846, s3310, s3311, 1, s2845, s3312, s3313, 1, s2844, s3314, s3315, 1, s2843, s3316, s3317, 1, s2842, s3318, s3319, 1, s2841, s3320, s3321, 1, s2840, s3322, s3323, 1, s2839, s3324, s3325, 1, s2838, s3326, s3327, 1, s2837, s3328, s3329, 1, s2836, s3330, s3331, 1, s2835, s3332, s3333, 1, s2834, s3334, s3335, 1, s2833, s3336, s3337, 1, s2832, s3338, s3339, 1, s2831, s3340, s3341, 1, s2830, s3342, s3343, 1, s2829, s3344, s3345, 1, s2828, s3346, s3347, 1, s2827, s3348, s3349, 1, s2826, s3350, s3351, 1, s2825, s3352, s3353, 1, s2824, s3354, s3355, 1, s2823, s3356, s3357, 1, s2822, s3358, s3359, 1, s2821, s3360, s3361, 1, s2820, s3362, s3363, 1, s2819, s3364, s3365, 1, s2818, s3366, s3367, 1, s2817, s3368, s3369, 1, s2816, s3370, s3371, 1, s2815, s3372, s3373, 1, s2814, s3374, s3375, 1, s2813, s3376, s3377, 1, s2812, s3378, s3379, 1, s2811, s3380, s3381, 1, s2810, s3382, s3383, 1, s2809, s3384, s3385, 1, s2808, s3386, s3387, 1, s2807, s3388, s3389, 1, s2806, s3390, s3391, 1, s2805, s3392, s3393, 1, s2804, s3394, s3395, 1, s2803, s3396, s3397, 1, s2802, s3398, s3399, 1, s2801, s3400, s3401, 1, s2800, s3402, s3403, 1, s2799, s3404, s3405, 1, s2798, s3406, s3407, 1, s2797, s3408, s3409, 1, s2796, s3410, s3411, 1, s2795, s3412, s3413, 1, s2794, s3414, s3415, 1, s2793, s3416, s3417, 1, s2792, s3418, s3419, 1, s2791, s3420, s3421, 1, s2790, s3422, s3423, 1, s2789, s3424, s3425, 1, s2788, s3426, s3427, 1, s2787, s3428, s3429, 1, s2786, s3430, s3431, 1, s2785, s3432, s3433, 1, s2784, s3434, s3435, 1, s2783, s3436, s3437, 1, s2782, s3438, s3439, 1, s2781, s3440, s3441, 1, s2780, s3442, s3443, 1, s2779, s3444, s3445, 1, s2778, s3446, s3447, 1, s2777, s3448, s3449, 1, s2776, s3450, s3451, 1, s2775, s3452, s3453, 1, s2774, s3454, s3455, 1, s2773, s3456, s3457, 1, s2772, s3458, s3459, 1, s2771, s3460, s3461, 1, s2770, s3462, s3463, 1, s2769, s3464, s3465, 1, s2768, s3466, s3467, 1, s2767, s3468, s3469, 1, s2766, s3470, s3471, 1, s2765, s3472, s3473, 1, s2764, s3474, s3475, 1, s2763, s3476, s3477, 1, s2762, s3478, s3479, 1, s2761, s3480, s3481, 1, s2760, s3482, s3483, 1, s2759, s3484, s3485, 1, s2758, s3486, s3487, 1, s2757, s3488, s3489, 1, s2756, s3490, s3491, 1, s2755, s3492, s3493, 1, s2754, s3494, s3495, 1, s2753, s3496, s3497, 1, s2752, s3498, s3499, 1, s2751, s3500, s3501, 1, s2750, s3502, s3503, 1, s2749, s3504, s3505, 1, s2748, s3506, s3507, 1, s2747, s3508, s3509, 1, s2746, s3510, s3511, 1, s2745, s3512, s3513, 1, s2744, s3514, s3515, 1, s2743, s3516, s3517, 1, s2742, s3518, s3519, 1, s2741, s3520, s3521, 1, s2740, s3522, s3523, 1, s2739, s3524, s3525, 1, s2738, s3526, s3527, 1, s2737, s3528, s3529, 1, s2736, s3530, s3531, 1, s2735, s3532, s3533, 1, s2734, s3534, s3535, 1, s2733, s3536, s3537, 1, s2732, s3538, s3539, 1, s2731, s3540, s3541, 1, s2730, s3542, s3543, 1, s2729, s3544, s3545, 1, s2728, s3546, s3547, 1, s2727, s3548, s3549, 1, s2726, s3550, s3551, 1, s2725, s3552, s3553, 1, s2724, s3554, s3555, 1, s2723, s3556, s3557, 1, s2722, s3558, s3559, 1, s2721, s3560, s3561, 1, s2720, s3562, s3563, 1, s2719, s3564, s3565, 1, s2718, s3566, s3567, 1, s2717, s3568, s3569, 1, s2716, s3570, s3571, 1, s2715, s3572, s3573, 1, s2714, s3574, s3575, 1, s2713, s3576, s3577, 1, s2712, s3578, s3579, 1, s2711, s3580, s3581, 1, s2710, s3582, s3583, 1, s2709, s3584, s3585, 1, s2708, s3586, s3587, 1, s2707, s3588, s3589, 1, s2706, s3590, s3591, 1, s2705, s3592, s3593, 1, s2704, s3594, s3595, 1, s2703, s3596, s3597, 1, s2702, s3598, s3599, 1, s2701, s3600, s3601, 1, s2700, s3602, s3603, 1, s2699, s3604, s3605, 1, s2698, s3606, s3607, 1, s2697, s3608, s3609, 1, s2696, s3610, s3611, 1, s2695, s3612, s3613, 1, s2694, s3614, s3615, 1, s2693, s3616, s3617, 1, s2692, s3618, s3619, 1, s2691, s3620, s3621, 1, s2690, s3622, s3623, 1, s2689, s3624, s3625, 1, s2688, s3626, s3627, 1, s2687, s3628, s3629, 1, s2686, s3630, s3631, 1, s2685, s3632, s3633, 1, s2684, s3634, s3635, 1, s2683, s3636, s3637, 1, s2682, s3638, s3639, 1, s2681, s3640, s3641, 1, s2680, s3642, s3643, 1, s2679, s3644, s3645, 1, s2678, s3646, s3647, 1, s2677, s3648, s3649, 1, s2676, s3650, s3651, 1, s2675, s3652, s3653, 1, s2674, s3654, s3655, 1, s2673, s3656, s3657, 1, s2672, s3658, s3659, 1, s2671, s3660, s3661, 1, s2670, s3662, s3663, 1, s2669, s3664, s3665, 1, s2668, s3666, s3667, 1, s2667, s3668, s3669, 1, s2666, s3670, s3671, 1, s2665, s3672, s3673, 1, s2664, s3674, s3675, 1, s2663, s3676, s3677, 1, s2662, s3678, s3679, 1, s2661, s3680, s3681, 1, s2660, s3682, s3683, 1, s2659, s3684, s3685, 1, s2658, s3686, s3687, 1, s2657, s3688, s3689, 1, s2656, s3690, s3691, 1, s2655, s3692, s3693, 1, s2654, s3694, s3695, 1, s2653, s3696, s3697, 1, s2652, s3698, s3699, 1, s2651, s3700, s3701, 1, s2650, s3702, s3703, 1, s2649, s3704, s3705, 1, s2648, s3706, s3707, 1, s2647, s3708, s3709, 1, s2646, s3710, s3711, 1, s2645, s3712, s3713, 1, s2644, s3714, s3715, 1, s2643, s3716, s3717, 1, s2642, s3718, s3719, 1, s2641, s3720, s3721, 1, s2640, s3722, s3723, 1, s2639, s3724, s3725, 1, s2638, s3726, s3727, 1, s2637, s3728, s3729, 1, s2636, s3730, s3731, 1, s2635, s3732, s3733, 1, s2634, s3734, s3735, 1, s2633, s3736, s3737, 1, s2632, s3738, s3739, 1, s2631, s3740, s3741, 1, s2630, s3742, s3743, 1, s2629, s3744, s3745, 1, s2628, s3746, s3747, 1, s2627, s3748, s3749, 1, s2626, s3750, s3751, 1, s2625, s3752, s3753, 1, s2624, s3754, s3755, 1, s2623, s3756, s3757, 1, s2622, s3758, s3759, 1, s2621, s3760, s3761, 1, s2620, s3762, s3763, 1, s2619, s3764, s3765, 1, s2618, s3766, s3767, 1, s2617, s3768, s3769, 1, s2616, s3770, s3771, 1, s2615, s3772, s3773, 1, s2614, s3774, s3775, 1, s2613, s3776, s3777, 1, s2612, s3778, s3779, 1, s2611, s3780, s3781, 1, s2610, s3782, s3783, 1, s2609, s3784, s3785, 1, s2608, s3786, s3787, 1, s2607, s3788, s3789, 1, s2606, s3790, s3791, 1, s2605, s3792, s3793, 1, s2604, s3794, s3795, 1, s2603, s3796, s3797, 1, s2602, s3798, s3799, 1, s2601, s3800, s3801, 1, s2600, s3802, s3803, 1, s2599, s3804, s3805, 1, s2598, s3806, s3807, 1, s2597, s3808, s3809, 1, s2596, s3810, s3811, 1, s2595, s3812, s3813, 1, s2594, s3814, s3815, 1, s2593, s3816, s3817, 1, s2592, s3818, s3819, 1, s2591, s3820, s3821, 1, s2590, s3822, s3823, 1, s2589, s3824, s3825, 1, s2588, s3826, s3827, 1, s2587, s3828, s3829, 1, s2586, s3830, s3831, 1, s2585, s3832, s3833, 1, s2584, s3834, s3835, 1, s2583, s3836, s3837, 1, s2582, s3838, s3839, 1, s2581, s3840, s3841, 1, s2580, s3842, s3843, 1, s2579, s3844, s3845, 1, s2578, s3846, s3847, 1, s2577, s3848, s3849, 1, s2576, s3850, s3851, 1, s2575, s3852, s3853, 1, s2574, s3854, s3855, 1, s2573, s3856, s3857, 1, s2572, s3858, s3859, 1, s2571, s3860, s3861, 1, s2570, s3862, s3863, 1, s2569, s3864, s3865, 1, s2568, s3866, s3867, 1, s2567, s3868, s3869, 1, s2566, s3870, s3871, 1, s2565, s3872, s3873, 1, s2564, s3874, s3875, 1, s2563, s3876, s3877, 1, s2562, s3878, s3879, 1, s2561, s3880, s3881, 1, s2560, s3882, s3883, 1, s2559, s3884, s3885, 1, s2558, s3886, s3887, 1, s2557, s3888, s3889, 1, s2556, s3890, s3891, 1, s2555, s3892, s3893, 1, s2554, s3894, s3895, 1, s2553, s3896, s3897, 1, s2552, s3898, s3899, 1, s2551, s3900, s3901, 1, s2550, s3902, s3903, 1, s2549, s3904, s3905, 1, s2548, s3906, s3907, 1, s2547, s3908, s3909, 1, s2546, s3910, s3911, 1, s2545, s3912, s3913, 1, s2544, s3914, s3915, 1, s2543, s3916, s3917, 1, s2542, s3918, s3919, 1, s2541, s3920, s3921, 1, s2540, s3922, s3923, 1, s2539, s3924, s3925, 1, s2538, s3926, s3927, 1, s2537, s3928, s3929, 1, s2536, s3930, s3931, 1, s2535, s3932, s3933, 1, s2534, s3934, s3935, 1, s2533, s3936, s3937, 1, s2532, s3938, s3939, 1, s2531, s3940, s3941, 1, s2530, s3942, s3943, 1, s2529, s3944, s3945, 1, s2528, s3946, s3947, 1, s2527, s3948, s3949, 1, s2526, s3950, s3951, 1, s2525, s3952, s3953, 1, s2524, s3954, s3955, 1, s2523, s3956, s3957, 1, s2522, s3958, s3959, 1, s2521, s3960, s3961, 1, s2520, s3962, s3963, 1, s2519, s3964, s3965, 1, s2518, s3966, s3967, 1, s2517, s3968, s3969, 1, s2516, s3970, s3971, 1, s2515, s3972, s3973, 1, s2514, s3974, s3975, 1, s2513, s3976, s3977, 1, s2512, s3978, s3979, 1, s2511, s3980, s3981, 1, s2510, s3982, s3983, 1, s2509, s3984, s3985, 1, s2508, s3986, s3987, 1, s2507, s3988, s3989, 1, s2506, s3990, s3991, 1, s2505, s3992, s3993, 1, s2504, s3994, s3995, 1, s2503, s3996, s3997, 1, s2502, s3998, s3999, 1, s2501, s4000, s4001, 1, s2500, s4002, s4003, 1, s2499, s4004, s4005, 1, s2498, s4006, s4007, 1, s2497, s4008, s4009, 1, s2496, s4010, s4011, 1, s2495, s4012, s4013, 1, s2494, s4014, s4015, 1, s2493, s4016, s4017, 1, s2492, s4018, s4019, 1, s2491, s4020, s4021, 1, s2490, s4022, s4023, 1, s2489, s4024, s4025, 1, s2488, s4026, s4027, 1, s2487, s4028, s4029, 1, s2486, s4030, s4031, 1, s2485, s4032, s4033, 1, s2484, s4034, s4035, 1, s2483, s4036, s4037, 1, s2482, s4038, s4039, 1, s2481, s4040, s4041, 1, s2480, s4042, s4043, 1, s2479, s4044, s4045, 1, s2478, s4046, s4047, 1, s2477, s4048, s4049, 1, s2476, s4050, s4051, 1, s2475, s4052, s4053, 1, s2474, s4054, s4055, 1, s2473, s4056, s4057, 1, s2472, s4058, s4059, 1, s2471, s4060, s4061, 1, s2470, s4062, s4063, 1, s2469, s4064, s4065, 1, s2468, s4066, s4067, 1, s2467, s4068, s4069, 1, s2466, s4070, s4071, 1, s2465, s4072, s4073, 1, s2464, s4074, s4075, 1, s2463, s4076, s4077, 1, s2462, s4078, s4079, 1, s2461, s4080, s4081, 1, s2460, s4082, s4083, 1, s2459, s4084, s4085, 1, s2458, s4086, s4087, 1, s2457, s4088, s4089, 1, s2456, s4090, s4091, 1, s2455, s4092, s4093, 1, s2454, s4094, s4095, 1, s2453, s4096, s4097, 1, s2452, s4098, s4099, 1, s2451, s4100, s4101, 1, s2450, s4102, s4103, 1, s2449, s4104, s4105, 1, s2448, s4106, s4107, 1, s2447, s4108, s4109, 1, s2446, s4110, s4111, 1, s2445, s4112, s4113, 1, s2444, s4114, s4115, 1, s2443, s4116, s4117, 1, s2442, s4118, s4119, 1, s2441, s4120, s4121, 1, s2440, s4122, s4123, 1, s2439, s4124, s4125, 1, s2438, s4126, s4127, 1, s2437, s4128, s4129, 1, s2436, s4130, s4131, 1, s2435, s4132, s4133, 1, s2434, s4134, s4135, 1, s2433, s4136, s4137, 1, s2432, s4138, s4139, 1, s2431, s4140, s4141, 1, s2430, s4142, s4143, 1, s2429, s4144, s4145, 1, s2428, s4146, s4147, 1, s2427, s4148, s4149, 1, s2426, s4150, s4151, 1, s2425, s4152, s4153, 1, s2424, s4154, s4155, 1, s2423, s4156, s4157, 1, s2422, s4158, s4159, 1, s2421, s4160, s4161, 1, s2420, s4162, s4163, 1, s2419, s4164, s4165, 1, s2418, s4166, s4167, 1, s2417, s4168, s4169, 1, s2416, s4170, s4171, 1, s2415, s4172, s4173, 1, s2414, s4174, s4175, 1, s2413, s4176, s4177, 1, s2412, s4178, s4179, 1, s2411, s4180, s4181, 1, s2410, s4182, s4183, 1, s2409, s4184, s4185, 1, s2408, s4186, s4187, 1, s2407, s4188, s4189, 1, s2406, s4190, s4191, 1, s2405, s4192, s4193, 1, s2404, s4194, s4195, 1, s2403, s4196, s4197, 1, s2402, s4198, s4199, 1, s2401, s4200, s4201, 1, s2400, s4202, s4203, 1, s2399, s4204, s4205, 1, s2398, s4206, s4207, 1, s2397, s4208, s4209, 1, s2396, s4210, s4211, 1, s2395, s4212, s4213, 1, s2394, s4214, s4215, 1, s2393, s4216, s4217, 1, s2392, s4218, s4219, 1, s2391, s4220, s4221, 1, s2390, s4222, s4223, 1, s2389, s4224, s4225, 1, s2388, s4226, s4227, 1, s2387, s4228, s4229, 1, s2386, s4230, s4231, 1, s2385, s4232, s4233, 1, s2384, s4234, s4235, 1, s2383, s4236, s4237, 1, s2382, s4238, s4239, 1, s2381, s4240, s4241, 1, s2380, s4242, s4243, 1, s2379, s4244, s4245, 1, s2378, s4246, s4247, 1, s2377, s4248, s4249, 1, s2376, s4250, s4251, 1, s2375, s4252, s4253, 1, s2374, s4254, s4255, 1, s2373, s4256, s4257, 1, s2372, s4258, s4259, 1, s2371, s4260, s4261, 1, s2370, s4262, s4263, 1, s2369, s4264, s4265, 1, s2368, s4266, s4267, 1, s2367, s4268, s4269, 1, s2366, s4270, s4271, 1, s2365, s4272, s4273, 1, s2364, s4274, s4275, 1, s2363, s4276, s4277, 1, s2362, s4278, s4279, 1, s2361, s4280, s4281, 1, s2360, s4282, s4283, 1, s2359, s4284, s4285, 1, s2358, s4286, s4287, 1, s2357, s4288, s4289, 1, s2356, s4290, s4291, 1, s2355, s4292, s4293, 1, s2354, s4294, s4295, 1, s2353, s4296, s4297, 1, s2352, s4298, s4299, 1, s2351, s4300, s4301, 1, s2350, s4302, s4303, 1, s2349, s4304, s4305, 1, s2348, s4306, s4307, 1, s2347, s4308, s4309, 1, s2346, s4310, s4311, 1, s2345, s4312, s4313, 1, s2344, s4314, s4315, 1, s2343, s4316, s4317, 1, s2342, s4318, s4319, 1, s2341, s4320, s4321, 1, s2340, s4322, s4323, 1, s2339, s4324, s4325, 1, s2338, s4326, s4327, 1, s2337, s4328, s4329, 1, s2336, s4330, s4331, 1, s2335, s4332, s4333, 1, s2334, s4334, s4335, 1, s2333, s4336, s4337, 1, s2332, s4338, s4339, 1, s2331, s4340, s4341, 1, s2330, s4342, s4343, 1, s2329, s4344, s4345, 1, s2328, s4346, s4347, 1, s2327, s4348, s4349, 1, s2326, s4350, s4351, 1, s2325, s4352, s4353, 1, s2324, s4354, s4355, 1, s2323, s4356, s4357, 1, s2322, s4358, s4359, 1, s2321, s4360, s4361, 1, s2320, s4362, s4363, 1, s2319, s4364, s4365, 1, s2318, s4366, s4367, 1, s2317, s4368, s4369, 1, s2316, s4370, s4371, 1, s2315, s4372, s4373, 1, s2314, s4374, s4375, 1, s2313, s4376, s4377, 1, s2312, s4378, s4379, 1, s2311, s4380, s4381, 1, s2310, s4382, s4383, 1, s2309, s4384, s4385, 1, s2308, s4386, s4387, 1, s2307, s4388, s4389, 1, s2306, s4390, s4391, 1, s2305, s4392, s4393, 1, s2304, s4394, s4395, 1, s2303, s4396, s4397, 1, s2302, s4398, s4399, 1, s2301, s4400, s4401, 1, s2300, s4402, s4403, 1, s2299, s4404, s4405, 1, s2298, s4406, s4407, 1, s2297, s4408, s4409, 1, s2296, s4410, s4411, 1, s2295, s4412, s4413, 1, s2294, s4414, s4415, 1, s2293, s4416, s4417, 1, s2292, s4418, s4419, 1, s2291, s4420, s4421, 1, s2290, s4422, s4423, 1, s2289, s4424, s4425, 1, s2288, s4426, s4427, 1, s2287, s4428, s4429, 1, s2286, s4430, s4431, 1, s2285, s4432, s4433, 1, s2284, s4434, s4435, 1, s2283, s4436, s4437, 1, s2282, s4438, s4439, 1, s2281, s4440, s4441, 1, s2280, s4442, s4443, 1, s2279, s4444, s4445, 1, s2278, s4446, s4447, 1, s2277, s4448, s4449, 1, s2276, s4450, s4451, 1, s2275, s4452, s4453, 1, s2274, s4454, s4455, 1, s2273, s4456, s4457, 1, s2272, s4458, s4459, 1, s2271, s4460, s4461, 1, s2270, s4462, s4463, 1, s2269, s4464, s4465, 1, s2268, s4466, s4467, 1, s2267, s4468, s4469, 1, s2266, s4470, s4471, 1, s2265, s4472, s4473, 1, s2264, s4474, s4475, 1, s2263, s4476, s4477, 1, s2262, s4478, s4479, 1, s2261, s4480, s4481, 1, s2260, s4482, s4483, 1, s2259, s4484, s4485, 1, s2258, s4486, s4487, 1, s2257, s4488, s4489, 1, s2256, s4490, s4491, 1, s2255, s4492, s4493, 1, s2254, s4494, s4495, 1, s2253, s4496, s4497, 1, s2252, s4498, s4499, 1, s2251, s4500, s4501, 1, s2250, s4502, s4503, 1, s2249, s4504, s4505, 1, s2248, s4506, s4507, 1, s2247, s4508, s4509, 1, s2246, s4510, s4511, 1, s2245, s4512, s4513, 1, s2244, s4514, s4515, 1, s2243, s4516, s4517, 1, s2242, s4518, s4519, 1, s2241, s4520, s4521, 1, s2240, s4522, s4523, 1, s2239, s4524, s4525, 1, s2238, s4526, s4527, 1, s2237, s4528, s4529, 1, s2236, s4530, s4531, 1, s2235, s4532, s4533, 1, s2234, s4534, s4535, 1, s2233, s4536, s4537, 1, s2232, s4538, s4539, 1, s2231, s4540, s4541, 1, s2230, s4542, s4543, 1, s2229, s4544, s4545, 1, s2228, s4546, s4547, 1, s2227, s4548, s4549, 1, s2226, s4550, s4551, 1, s2225, s4552, s4553, 1, s2224, s4554, s4555, 1, s2223, s4556, s4557, 1, s2222, s4558, s4559, 1, s2221, s4560, s4561, 1, s2220, s4562, s4563, 1, s2219, s4564, s4565, 1, s2218, s4566, s4567, 1, s2217, s4568, s4569, 1, s2216, s4570, s4571, 1, s2215, s4572, s4573, 1, s2214, s4574, s4575, 1, s2213, s4576, s4577, 1, s2212, s4578, s4579, 1, s2211, s4580, s4581, 1, s2210, s4582, s4583, 1, s2209, s4584, s4585, 1, s2208, s4586, s4587, 1, s2207, s4588, s4589, 1, s2206, s4590, s4591, 1, s2205, s4592, s4593, 1, s2204, s4594, s4595, 1, s2203, s4596, s4597, 1, s2202, s4598, s4599, 1, s2201, s4600, s4601, 1, s2200, s4602, s4603, 1, s2199, s4604, s4605, 1, s2198, s4606, s4607, 1, s2197, s4608, s4609, 1, s2196, s4610, s4611, 1, s2195, s4612, s4613, 1, s2194, s4614, s4615, 1, s2193, s4616, s4617, 1, s2192, s4618, s4619, 1, s2191, s4620, s4621, 1, s2190, s4622, s4623, 1, s2189, s4624, s4625, 1, s2188, s4626, s4627, 1, s2187, s4628, s4629, 1, s2186, s4630, s4631, 1, s2185, s4632, s4633, 1, s2184, s4634, s4635, 1, s2183, s4636, s4637, 1, s2182, s4638, s4639, 1, s2181, s4640, s4641, 1, s2180, s4642, s4643, 1, s2179, s4644, s4645, 1, s2178, s4646, s4647, 1, s2177, s4648, s4649, 1, s2176, s4650, s4651, 1, s2175, s4652, s4653, 1, s2174, s4654, s4655, 1, s2173, s4656, s4657, 1, s2172, s4658, s4659, 1, s2171, s4660, s4661, 1, s2170, s4662, s4663, 1, s2169, s4664, s4665, 1, s2168, s4666, s4667, 1, s2167, s4668, s4669, 1, s2166, s4670, s4671, 1, s2165, s4672, s4673, 1, s2164, s4674, s4675, 1, s2163, s4676, s4677, 1, s2162, s4678, s4679, 1, s2161, s4680, s4681, 1, s2160, s4682, s4683, 1, s2159, s4684, s4685, 1, s2158, s4686, s4687, 1, s2157, s4688, s4689, 1, s2156, s4690, s4691, 1, s2155, s4692, s4693, 1, s2154, s4694, s4695, 1, s2153, s4696, s4697, 1, s2152, s4698, s4699, 1, s2151, s4700, s4701, 1, s2150, s4702, s4703, 1, s2149, s4704, s4705, 1, s2148, s4706, s4707, 1, s2147, s4708, s4709, 1, s2146, s4710, s4711, 1, s2145, s4712, s4713, 1, s2144, s4714, s4715, 1, s2143, s4716, s4717, 1, s2142, s4718, s4719, 1, s2141, s4720, s4721, 1, s2140, s4722, s4723, 1, s2139, s4724, s4725, 1, s2138, s4726, s4727, 1, s2137, s4728, s4729, 1, s2136, s4730, s4731, 1, s2135, s4732, s4733, 1, s2134, s4734, s4735, 1, s2133, s4736, s4737, 1, s2132, s4738, s4739, 1, s2131, s4740, s4741, 1, s2130, s4742, s4743, 1, s2129, s4744, s4745, 1, s2128, s4746, s4747, 1, s2127, s4748, s4749, 1, s2126, s4750, s4751, 1, s2125, s4752, s4753, 1, s2124, s4754, s4755, 1, s2123, s4756, s4757, 1, s2122, s4758, s4759, 1, s2121, s4760, s4761, 1, s2120, s4762, s4763, 1, s2119, s4764, s4765, 1, s2118, s4766, s4767, 1, s2117, s4768, s4769, 1, s2116, s4770, s4771, 1, s2115, s4772, s4773, 1, s2114, s4774, s4775, 1, s2113, s4776, s4777, 1, s2112, s4778, s4779, 1, s2111, s4780, s4781, 1, s2110, s4782, s4783, 1, s2109, s4784, s4785, 1, s2108, s4786, s4787, 1, s2107, s4788, s4789, 1, s2106, s4790, s4791, 1, s2105, s4792, s4793, 1, s2104, s4794, s4795, 1, s2103, s4796, s4797, 1, s2102, s4798, s4799, 1, s2101, s4800, s4801, 1, s2100, s4802, s4803, 1, s2099, s4804, s4805, 1, s2098, s4806, s4807, 1, s2097, s4808, s4809, 1, s2096, s4810, s4811, 1, s2095, s4812, s4813, 1, s2094, s4814, s4815, 1, s2093, s4816, s4817, 1, s2092, s4818, s4819, 1, s2091, s4820, s4821, 1, s2090, s4822, s4823, 1, s2089, s4824, s4825, 1, s2088, s4826, s4827, 1, s2087, s4828, s4829, 1, s2086, s4830, s4831, 1, s2085, s4832, s4833, 1, s2084, s4834, s4835, 1, s2083, s4836, s4837, 1, s2082, s4838, s4839, 1, s2081, s4840, s4841, 1, s2080, s4842, s4843, 1, s2079, s4844, s4845, 1, s2078, s4846, s4847, 1, s2077, s4848, s4849, 1, s2076, s4850, s4851, 1, s2075, s4852, s4853, 1, s2074, s4854, s4855, 1, s2073, s4856, s4857, 1, s2072, s4858, s4859, 1, s2071, s4860, s4861, 1, s2070, s4862, s4863, 1, s2069, s4864, s4865, 1, s2068, s4866, s4867, 1, s2067, s4868, s4869, 1, s2066, s4870, s4871, 1, s2065, s4872, s4873, 1, s2064, s4874, s4875, 1, s2063, s4876, s4877, 1, s2062, s4878, s4879, 1, s2061, s4880, s4881, 1, s2060, s4882, s4883, 1, s2059, s4884, s4885, 1, s2058, s4886, s4887, 1, s2057, s4888, s4889, 1, s2056, s4890, s4891, 1, s2055, s4892, s4893, 1, s2054, s4894, s4895, 1, s2053, s4896, s4897, 1, s2052, s4898, s4899, 1, s2051, s4900, s4901, 1, s2050, s4902, s4903, 1, s2049, s4904, s4905, 1, s2048, s4906, s4907, 1, s2047, s4908, s4909, 1, s2046, s4910, s4911, 1, s2045, s4912, s4913, 1, s2044, s4914, s4915, 1, s2043, s4916, s4917, 1, s2042, s4918, s4919, 1, s2041, s4920, s4921, 1, s2040, s4922, s4923, 1, s2039, s4924, s4925, 1, s2038, s4926, s4927, 1, s2037, s4928, s4929, 1, s2036, s4930, s4931, 1, s2035, s4932, s4933, 1, s2034, s4934, s4935, 1, s2033, s4936, s4937, 1, s2032, s4938, s4939, 1, s2031, s4940, s4941, 1, s2030, s4942, s4943, 1, s2029, s4944, s4945, 1, s2028, s4946, s4947, 1, s2027, s4948, s4949, 1, s2026, s4950, s4951, 1, s2025, s4952, s4953, 1, s2024, s4954, s4955, 1, s2023, s4956, s4957, 1, s2022, s4958, s4959, 1, s2021, s4960, s4961, 1, s2020, s4962, s4963, 1, s2019, s4964, s4965, 1, s2018, s4966, s4967, 1, s2017, s4968, s4969, 1, s2016, s4970, s4971, 1, s2015, s4972, s4973, 1, s2014, s4974, s4975, 1, s2013, s4976, s4977, 1, s2012, s4978, s4979, 1, s2011, s4980, s4981, 1, s2010, s4982, s4983, 1, s2009, s4984, s4985, 1, s2008, s4986, s4987, 1, s2007, s4988, s4989, 1, s2006, s4990, s4991, 1, s2005, s4992, s4993, 1, s2004, s4994, s4995, 1, s2003, s4996, s4997, 1, s2002, s4998, s4999, 1, s2001, s5000, s5001, 1, s2000, s5002, s5003, 1, s1999, s5004, s5005, 1, s1998, s5006, s5007, 1, s1997, s5008, s5009, 1, s1996, s5010, s5011, 1, s1995, s5012, s5013, 1, s1994, s5014, s5015, 1, s1993, s5016, s5017, 1, s1992, s5018, s5019, 1, s1991, s5020, s5021, 1, s1990, s5022, s5023, 1, s1989, s5024, s5025, 1, s1988, s5026, s5027, 1, s1987, s5028, s5029, 1, s1986, s5030, s5031, 1, s1985, s5032, s5033, 1, s1984, s5034, s5035, 1, s1983, s5036, s5037, 1, s1982, s5038, s5039, 1, s1981, s5040, s5041, 1, s1980, s5042, s5043, 1, s1979, s5044, s5045, 1, s1978, s5046, s5047, 1, s1977, s5048, s5049, 1, s1976, s5050, s5051, 1, s1975, s5052, s5053, 1, s1974, s5054, s5055, 1, s1973, s5056, s5057, 1, s1972, s5058, s5059, 1, s1971, s5060, s5061, 1, s1970, s5062, s5063, 1, s1969, s5064, s5065, 1, s1968, s5066, s5067, 1, s1967, s5068, s5069, 1, s1966, s5070, s5071, 1, s1965, s5072, s5073, 1, s1964, s5074, s5075, 1, s1963, s5076, s5077, 1, s1962, s5078, s5079, 1, s1961, s5080, s5081, 1, s1960, s5082, s5083, 1, s1959, s5084, s5085, 1, s1958, s5086, s5087, 1, s1957, s5088, s5089, 1, s1956, s5090, s5091, 1, s1955, s5092, s5093, 1, s1954, s5094, s5095, 1, s1953, s5096, s5097, 1, s1952, s5098, s5099, 1, s1951, s5100, s5101, 1, s1950, s5102, s5103, 1, s1949, s5104, s5105, 1, s1948, s5106, s5107, 1, s1947, s5108, s5109, 1, s1946, s5110, s5111, 1, s1945, s5112, s5113, 1, s1944, s5114, s5115, 1, s1943, s5116, s5117, 1, s1942, s5118, s5119, 1, s1941, s5120, s5121, 1, s1940, s5122, s5123, 1, s1939, s5124, s5125, 1, s1938, s5126, s5127, 1, s1937, s5128, s5129, 1, s1936, s5130, s5131, 1, s1935, s5132, s5133, 1, s1934, s5134, s5135, 1, s1933, s5136, s5137, 1, s1932, s5138, s5139, 1, s1931, s5140, s5141, 1, s1930, s5142, s5143, 1, s1929, s5144, s5145, 1, s1928, s5146, s5147, 1, s1927, s5148, s5149, 1, s1926, s5150, s5151, 1, s1925, s5152, s5153, 1, s1924, s5154, s5155, 1, s1923, s5156, s5157, 1, s1922, s5158, s5159, 1, s1921, s5160, s5161, 1, s1920, s5162, s5163, 1, s1919, s5164, s5165, 1, s1918, s5166, s5167, 1, s1917, s5168, s5169, 1, s1916, s5170, s5171, 1, s1915, s5172, s5173, 1, s1914, s5174, s5175, 1, s1913, s5176, s5177, 1, s1912, s5178, s5179, 1, s1911, s5180, s5181, 1, s1910, s5182, s5183, 1, s1909, s5184, s5185, 1, s1908, s5186, s5187, 1, s1907, s5188, s5189, 1, s1906, s5190, s5191, 1, s1905, s5192, s5193, 1, s1904, s5194, s5195, 1, s1903, s5196, s5197, 1, s1902, s5198, s5199, 1, s1901, s5200, s5201, 1, s1900, s5202, s5203, 1, s1899, s5204, s5205, 1, s1898, s5206, s5207, 1, s1897, s5208, s5209, 1, s1896, s5210, s5211, 1, s1895, s5212, s5213, 1, s1894, s5214, s5215, 1, s1893, s5216, s5217, 1, s1892, s5218, s5219, 1, s1891, s5220, s5221, 1, s1890, s5222, s5223, 1, s1889, s5224, s5225, 1, s1888, s5226, s5227, 1, s1887, s5228, s5229, 1, s1886, s5230, s5231, 1, s1885, s5232, s5233, 1, s1884, s5234, s5235, 1, s1883, s5236, s5237, 1, s1882, s5238, s5239, 1, s1881, s5240, s5241, 1, s1880, s5242, s5243, 1, s1879, s5244, s5245, 1, s1878, s5246, s5247, 1, s1877, s5248, s5249, 1, s1876, s5250, s5251, 1, s1875, s5252, s5253, 1, s1874, s5254, s5255, 1, s1873, s5256, s5257, 1, s1872, s5258, s5259, 1, s1871, s5260, s5261, 1, s1870, s5262, s5263, 1, s1869, s5264, s5265, 1, s1868, s5266, s5267, 1, s1867, s5268, s5269, 1, s1866, s5270, s5271, 1, s1865, s5272, s5273, 1, s1864, s5274, s5275, 1, s1863, s5276, s5277, 1, s1862, s5278, s5279, 1, s1861, s5280, s5281, 1, s1860, s5282, s5283, 1, s1859, s5284, s5285, 1, s1858, s5286, s5287, 1, s1857, s5288, s5289, 1, s1856, s5290, s5291, 1, s1855, s5292, s5293, 1, s1854, s5294, s5295, 1, s1853, s5296, s5297, 1, s1852, s5298, s5299, 1, s1851, s5300, s5301, 1, s1850, s5302, s5303, 1, s1849, s5304, s5305, 1, s1848, s5306, s5307, 1, s1847, s5308, s5309, 1, s1846, s5310, s5311, 1, s1845, s5312, s5313, 1, s1844, s5314, s5315, 1, s1843, s5316, s5317, 1, s1842, s5318, s5319, 1, s1841, s5320, s5321, 1, s1840, s5322, s5323, 1, s1839, s5324, s5325, 1, s1838, s5326, s5327, 1, s1837, s5328, s5329, 1, s1836, s5330, s5331, 1, s1835, s5332, s5333, 1, s1834, s5334, s5335, 1, s1833, s5336, s5337, 1, s1832, s5338, s5339, 1, s1831, s5340, s5341, 1, s1830, s5342, s5343, 1, s1829, s5344, s5345, 1, s1828, s5346, s5347, 1, s1827, s5348, s5349, 1, s1826, s5350, s5351, 1, s1825, s5352, s5353, 1, s1824, s5354, s5355, 1, s1823, s5356, s5357, 1, s1822, s5358, s5359, 1, s1821, s5360, s5361, 1, s1820, s5362, s5363, 1, s1819, s5364, s5365, 1, s1818, s5366, s5367, 1, s1817, s5368, s5369, 1, s1816, s5370, s5371, 1, s1815, s5372, s5373, 1, s1814, s5374, s5375, 1, s1813, s5376, s5377, 1, s1812, s5378, s5379, 1, s1811, s5380, s5381, 1, s1810, s5382, s5383, 1, s1809, s5384, s5385, 1, s1808, s5386, s5387, 1, s1807, s5388, s5389, 1, s1806, s5390, s5391, 1, s1805, s5392, s5393, 1, s1804, s5394, s5395, 1, s1803, s5396, s5397, 1, s1802, s5398, s5399, 1, s1801, s5400, s5401, 1, s1800, s5402, s5403, 1, s1799, s5404, s5405, 1, s1798, s5406, s5407, 1, s1797, s5408, s5409, 1, s1796, s5410, s5411, 1, s1795, s5412, s5413, 1, s1794, s5414, s5415, 1, s1793, s5416, s5417, 1, s1792, s5418, s5419, 1, s1791, s5420, s5421, 1, s1790, s5422, s5423, 1, s1789, s5424, s5425, 1, s1788, s5426, s5427, 1, s1787, s5428, s5429, 1, s1786, s5430, s5431, 1, s1785, s5432, s5433, 1, s1784, s5434, s5435, 1, s1783, s5436, s5437, 1, s1782, s5438, s5439, 1, s1781, s5440, s5441, 1, s1780, s5442, s5443, 1, s1779, s5444, s5445, 1, s1778, s5446, s5447, 1, s1777, s5448, s5449, 1, s1776, s5450, s5451, 1, s1775, s5452, s5453, 1, s1774, s5454, s5455, 1, s1773, s5456, s5457, 1, s1772, s5458, s5459, 1, s1771, s5460, s5461, 1, s1770, s5462, s5463, 1, s1769, s5464, s5465, 1, s1768, s5466, s5467, 1, s1767, s5468, s5469, 1, s1766, s5470, s5471, 1, s1765, s5472, s5473, 1, s1764, s5474, s5475, 1, s1763, s5476, s5477, 1, s1762, s5478, s5479, 1, s1761, s5480, s5481, 1, s1760, s5482, s5483, 1, s1759, s5484, s5485, 1, s1758, s5486, s5487, 1, s1757, s5488, s5489, 1, s1756, s5490, s5491, 1, s1755, s5492, s5493, 1, s1754, s5494, s5495, 1, s1753, s5496, s5497, 1, s1752, s5498, s5499, 1, s1751, s5500, s5501, 1, s1750, s5502, s5503, 1, s1749, s5504, s5505, 1, s1748, s5506, s5507, 1, s1747, s5508, s5509, 1, s1746, s5510, s5511, 1, s1745, s5512, s5513, 1, s1744, s5514, s5515, 1, s1743, s5516, s5517, 1, s1742, s5518, s5519, 1, s1741, s5520, s5521, 1, s1740, s5522, s5523, 1, s1739, s5524, s5525, 1, s1738, s5526, s5527, 1, s1737, s5528, s5529, 1, s1736, s5530, s5531, 1, s1735, s5532, s5533, 1, s1734, s5534, s5535, 1, s1733, s5536, s5537, 1, s1732, s5538, s5539, 1, s1731, s5540, s5541, 1, s1730, s5542, s5543, 1, s1729, s5544, s5545, 1, s1728, s5546, s5547, 1, s1727, s5548, s5549, 1, s1726, s5550, s5551, 1, s1725, s5552, s5553, 1, s1724, s5554, s5555, 1, s1723, s5556, s5557, 1, s1722, s5558, s5559, 1, s1721, s5560, s5561, 1, s1720, s5562, s5563, 1, s1719, s5564, s5565, 1, s1718, s5566, s5567, 1, s1717, s5568, s5569, 1, s1716, s5570, s5571, 1, s1715, s5572, s5573, 1, s1714, s5574, s5575, 1, s1713, s5576, s5577, 1, s1712, s5578, s5579, 1, s1711, s5580, s5581, 1, s1710, s5582, s5583, 1, s1709, s5584, s5585, 1, s1708, s5586, s5587, 1, s1707, s5588, s5589, 1, s1706, s5590, s5591, 1, s1705, s5592, s5593, 1, s1704, s5594, s5595, 1, s1703, s5596, s5597, 1, s1702, s5598, s5599, 1, s1701, s5600, s5601, 1, s1700, s5602, s5603, 1, s1699, s5604, s5605, 1, s1698, s5606, s5607, 1, s1697, s5608, s5609, 1, s1696, s5610, s5611, 1, s1695, s5612, s5613, 1, s1694, s5614, s5615, 1, s1693, s5616, s5617, 1, s1692, s5618, s5619, 1, s1691, s5620, s5621, 1, s1690, s5622, s5623, 1, s1689, s5624, s5625, 1, s1688, s5626, s5627, 1, s1687, s5628, s5629, 1, s1686, s5630, s5631, 1, s1685, s5632, s5633, 1, s1684, s5634, s5635, 1, s1683, s5636, s5637, 1, s1682, s5638, s5639, 1, s1681, s5640, s5641, 1, s1680, s5642, s5643, 1, s1679, s5644, s5645, 1, s1678, s5646, s5647, 1, s1677, s5648, s5649, 1, s1676, s5650, s5651, 1, s1675, s5652, s5653, 1, s1674, s5654, s5655, 1, s1673, s5656, s5657, 1, s1672, s5658, s5659, 1, s1671, s5660, s5661, 1, s1670, s5662, s5663, 1, s1669, s5664, s5665, 1, s1668, s5666, s5667, 1, s1667, s5668, s5669, 1, s1666, s5670, s5671, 1, s1665, s5672, s5673, 1, s1664, s5674, s5675, 1, s1663, s5676, s5677, 1, s1662, s5678, s5679, 1, s1661, s5680, s5681, 1, s1660, s5682, s5683, 1, s1659, s5684, s5685, 1, s1658, s5686, s5687, 1, s1657, s5688, s5689, 1, s1656, s5690, s5691, 1, s1655, s5692, s5693, 1, s1654, s5694, s5695, 1, s1653, s5696, s5697, 1, s1652, s5698, s5699, 1, s1651, s5700, s5701, 1, s1650, s5702, s5703, 1, s1649, s5704, s5705, 1, s1648, s5706, s5707, 1, s1647, s5708, s5709, 1, s1646, s5710, s5711, 1, s1645, s5712, s5713, 1, s1644, s5714, s5715, 1, s1643, s5716, s5717, 1, s1642, s5718, s5719, 1, s1641, s5720, s5721, 1, s1640, s5722, s5723, 1, s1639, s5724, s5725, 1, s1638, s5726, s5727, 1, s1637, s5728, s5729, 1, s1636, s5730, s5731, 1, s1635, s5732, s5733, 1, s1634, s5734, s5735, 1, s1633, s5736, s5737, 1, s1632, s5738, s5739, 1, s1631, s5740, s5741, 1, s1630, s5742, s5743, 1, s1629, s5744, s5745, 1, s1628, s5746, s5747, 1, s1627, s5748, s5749, 1, s1626, s5750, s5751, 1, s1625, s5752, s5753, 1, s1624, s5754, s5755, 1, s1623, s5756, s5757, 1, s1622, s5758, s5759, 1, s1621, s5760, s5761, 1, s1620, s5762, s5763, 1, s1619, s5764, s5765, 1, s1618, s5766, s5767, 1, s1617, s5768, s5769, 1, s1616, s5770, s5771, 1, s1615, s5772, s5773, 1, s1614, s5774, s5775, 1, s1613, s5776, s5777, 1, s1612, s5778, s5779, 1, s1611, s5780, s5781, 1, s1610, s5782, s5783, 1, s1609, s5784, s5785, 1, s1608, s5786, s5787, 1, s1607, s5788, s5789, 1, s1606, s5790, s5791, 1, s1605, s5792, s5793, 1, s1604, s5794, s5795, 1, s1603, s5796, s5797, 1, s1602, s5798, s5799, 1, s1601, s5800, s5801, 1, s1600, s5802, s5803, 1, s1599, s5804, s5805, 1, s1598, s5806, s5807, 1, s1597, s5808, s5809, 1, s1596, s5810, s5811, 1, s1595, s5812, s5813, 1, s1594, s5814, s5815, 1, s1593, s5816, s5817, 1, s1592, s5818, s5819, 1, s1591, s5820, s5821, 1, s1590, s5822, s5823, 1, s1589, s5824, s5825, 1, s1588, s5826, s5827, 1, s1587, s5828, s5829, 1, s1586, s5830, s5831, 1, s1585, s5832, s5833, 1, s1584, s5834, s5835, 1, s1583, s5836, s5837, 1, s1582, s5838, s5839, 1, s1581, s5840, s5841, 1, s1580, s5842, s5843, 1, s1579, s5844, s5845, 1, s1578, s5846, s5847, 1, s1577, s5848, s5849, 1, s1576, s5850, s5851, 1, s1575, s5852, s5853, 1, s1574, s5854, s5855, 1, s1573, s5856, s5857, 1, s1572, s5858, s5859, 1, s1571, s5860, s5861, 1, s1570, s5862, s5863, 1, s1569, s5864, s5865, 1, s1568, s5866, s5867, 1, s1567, s5868, s5869, 1, s1566, s5870, s5871, 1, s1565, s5872, s5873, 1, s1564, s5874, s5875, 1, s1563, s5876, s5877, 1, s1562, s5878, s5879, 1, s1561, s5880, s5881, 1, s1560, s5882, s5883, 1, s1559, s5884, s5885, 1, s1558, s5886, s5887, 1, s1557, s5888, s5889, 1, s1556, s5890, s5891, 1, s1555, s5892, s5893, 1, s1554, s5894, s5895, 1, s1553, s5896, s5897, 1, s1552, s5898, s5899, 1, s1551, s5900, s5901, 1, s1550, s5902, s5903, 1, s1549, s5904, s5905, 1, s1548, s5906, s5907, 1, s1547, s5908, s5909, 1, s1546, s5910, s5911, 1, s1545, s5912, s5913, 1, s1544, s5914, s5915, 1, s1543, s5916, s5917, 1, s1542, s5918, s5919, 1, s1541, s5920, s5921, 1, s1540, s5922, s5923, 1, s1539, s5924, s5925, 1, s1538, s5926, s5927, 1, s1537, s5928, s5929, 1, s1536, s5930, s5931, 1, s1535, s5932, s5933, 1, s1534, s5934, s5935, 1, s1533, s5936, s5937, 1, s1532, s5938, s5939, 1, s1531, s5940, s5941, 1, s1530, s5942, s5943, 1, s1529, s5944, s5945, 1, s1528, s5946, s5947, 1, s1527, s5948, s5949, 1, s1526, s5950, s5951, 1, s1525, s5952, s5953, 1, s1524, s5954, s5955, 1, s1523, s5956, s5957, 1, s1522, s5958, s5959, 1, s1521, s5960, s5961, 1, s1520, s5962, s5963, 1, s1519, s5964, s5965, 1, s1518, s5966, s5967, 1, s1517, s5968, s5969, 1, s1516, s5970, s5971, 1, s1515, s5972, s5973, 1, s1514, s5974, s5975, 1, s1513, s5976, s5977, 1, s1512, s5978, s5979, 1, s1511, s5980, s5981, 1, s1510, s5982, s5983, 1, s1509, s5984, s5985, 1, s1508, s5986, s5987, 1, s1507, s5988, s5989, 1, s1506, s5990, s5991, 1, s1505, s5992, s5993, 1, s1504, s5994, s5995, 1, s1503, s5996, s5997, 1, s1502, s5998, s5999, 1, s1501, s6000, s6001, 1, s1500, s6002, s6003, 1, s1499, s6004, s6005, 1, s1498, s6006, s6007, 1, s1497, s6008, s6009, 1, s1496, s6010, s6011, 1, s1495, s6012, s6013, 1, s1494, s6014, s6015, 1, s1493, s6016, s6017, 1, s1492, s6018, s6019, 1, s1491, s6020, s6021, 1, s1490, s6022, s6023, 1, s1489, s6024, s6025, 1, s1488, s6026, s6027, 1, s1487, s6028, s6029, 1, s1486, s6030, s6031, 1, s1485, s6032, s6033, 1, s1484, s6034, s6035, 1, s1483, s6036, s6037, 1, s1482, s6038, s6039, 1, s1481, s6040, s6041, 1, s1480, s6042, s6043, 1, s1479, s6044, s6045, 1, s1478, s6046, s6047, 1, s1477, s6048, s6049, 1, s1476, s6050, s6051, 1, s1475, s6052, s6053, 1, s1474, s6054, s6055, 1, s1473, s6056, s6057, 1, s1472, s6058, s6059, 1, s1471, s6060, s6061, 1, s1470, s6062, s6063, 1, s1469, s6064, s6065, 1, s1468, s6066, s6067, 1, s1467, s6068, s6069, 1, s1466, s6070, s6071, 1, s1465, s6072, s6073, 1, s1464, s6074, s6075, 1, s1463, s6076, s6077, 1, s1462, s6078, s6079, 1, s1461, s6080, s6081, 1, s1460, s6082, s6083, 1, s1459, s6084, s6085, 1, s1458, s6086, s6087, 1, s1457, s6088, s6089, 1, s1456, s6090, s6091, 1, s1455, s6092, s6093, 1, s1454, s6094, s6095, 1, s1453, s6096, s6097, 1, s1452, s6098, s6099, 1, s1451, s6100, s6101, 1, s1450, s6102, s6103, 1, s1449, s6104, s6105, 1, s1448, s6106, s6107, 1, s1447, s6108, s6109, 1, s1446, s6110, s6111, 1, s1445, s6112, s6113, 1, s1444, s6114, s6115, 1, s1443, s6116, s6117, 1, s1442, s6118, s6119, 1, s1441, s6120, s6121, 1, s1440, s6122, s6123, 1, s1439, s6124, s6125, 1, s1438, s6126, s6127, 1, s1437, s6128, s6129, 1, s1436, s6130, s6131, 1, s1435, s6132, s6133, 1, s1434, s6134, s6135, 1, s1433, s6136, s6137, 1, s1432, s6138, s6139, 1, s1431, s6140, s6141, 1, s1430, s6142, s6143, 1, s1429, s6144, s6145, 1, s1428, s6146, s6147, 1, s1427, s6148, s6149, 1, s1426, s6150, s6151, 1, s1425, s6152, s6153, 1, s1424, s6154, s6155, 1, s1423, s6156, s6157, 1, s1422, s6158, s6159, 1, s1421, s6160, s6161, 1, s1420, s6162, s6163, 1, s1419, s6164, s6165, 1, s1418, s6166, s6167, 1, s1417, s6168, s6169, 1, s1416, s6170, s6171, 1, s1415, s6172, s6173, 1, s1414, s6174, s6175, 1, s1413, s6176, s6177, 1, s1412, s6178, s6179, 1, s1411, s6180, s6181, 1, s1410, s6182, s6183, 1, s1409, s6184, s6185, 1, s1408, s6186, s6187, 1, s1407, s6188, s6189, 1, s1406, s6190, s6191, 1, s1405, s6192, s6193, 1, s1404, s6194, s6195, 1, s1403, s6196, s6197, 1, s1402, s6198, s6199, 1, s1401, s6200, s6201, 1, s1400, s6202, s6203, 1, s1399, s6204, s6205, 1, s1398, s6206, s6207, 1, s1397, s6208, s6209, 1, s1396, s6210, s6211, 1, s1395, s6212, s6213, 1, s1394, s6214, s6215, 1, s1393, s6216, s6217, 1, s1392, s6218, s6219, 1, s1391, s6220, s6221, 1, s1390, s6222, s6223, 1, s1389, s6224, s6225, 1, s1388, s6226, s6227, 1, s1387, s6228, s6229, 1, s1386, s6230, s6231, 1, s1385, s6232, s6233, 1, s1384, s6234, s6235, 1, s1383, s6236, s6237, 1, s1382, s6238, s6239, 1, s1381, s6240, s6241, 1, s1380, s6242, s6243, 1, s1379, s6244, s6245, 1, s1378, s6246, s6247, 1, s1377, s6248, s6249, 1, s1376, s6250, s6251, 1, s1375, s6252, s6253, 1, s1374, s6254, s6255, 1, s1373, s6256, s6257, 1, s1372, s6258, s6259, 1, s1371, s6260, s6261, 1, s1370, s6262, s6263, 1, s1369, s6264, s6265, 1, s1368, s6266, s6267, 1, s1367, s6268, s6269, 1, s1366, s6270, s6271, 1, s1365, s6272, s6273, 1, s1364, s6274, s6275, 1, s1363, s6276, s6277, 1, s1362, s6278, s6279, 1, s1361, s6280, s6281, 1, s1360, s6282, s6283, 1, s1359, s6284, s6285, 1, s1358, s6286, s6287, 1, s1357, s6288, s6289, 1, s1356, s6290, s6291, 1, s1355, s6292, s6293, 1, s1354, s6294, s6295, 1, s1353, s6296, s6297, 1, s1352, s6298, s6299, 1, s1351, s6300, s6301, 1, s1350, s6302, s6303, 1, s1349, s6304, s6305, 1, s1348, s6306, s6307, 1, s1347, s6308, s6309, 1, s1346, s6310, s6311, 1, s1345, s6312, s6313, 1, s1344, s6314, s6315, 1, s1343, s6316, s6317, 1, s1342, s6318, s6319, 1, s1341, s6320, s6321, 1, s1340, s6322, s6323, 1, s1339, s6324, s6325, 1, s1338, s6326, s6327, 1, s1337, s6328, s6329, 1, s1336, s6330, s6331, 1, s1335, s6332, s6333, 1, s1334, s6334, s6335, 1, s1333, s6336, s6337, 1, s1332, s6338, s6339, 1, s1331, s6340, s6341, 1, s1330, s6342, s6343, 1, s1329, s6344, s6345, 1, s1328, s6346, s6347, 1, s1327, s6348, s6349, 1, s1326, s6350, s6351, 1, s1325, s6352, s6353, 1, s1324, s6354, s6355, 1, s1323, s6356, s6357, 1, s1322, s6358, s6359, 1, s1321, s6360, s6361, 1, s1320, s6362, s6363, 1, s1319, s6364, s6365, 1, s1318, s6366, s6367, 1, s1317, s6368, s6369, 1, s1316, s6370, s6371, 1, s1315, s6372, s6373, 1, s1314, s6374, s6375, 1, s1313, s6376, s6377, 1, s1312, s6378, s6379, 1, s1311, s6380, s6381, 1, s1310, s6382, s6383, 1, s1309, s6384, s6385, 1, s1308, s6386, s6387, 1, s1307, s6388, s6389, 1, s1306, s6390, s6391, 1, s1305, s6392, s6393, 1, s1304, s6394, s6395, 1, s1303, s6396, s6397, 1, s1302, s6398, s6399, 1, s1301, s6400, s6401, 1, s1300, s6402, s6403, 1, s1299, s6404, s6405, 1, s1298, s6406, s6407, 1, s1297, s6408, s6409, 1, s1296, s6410, s6411, 1, s1295, s6412, s6413, 1, s1294, s6414, s6415, 1, s1293, s6416, s6417, 1, s1292, s6418, s6419, 1, s1291, s6420, s6421, 1, s1290, s6422, s6423, 1, s1289, s6424, s6425, 1, s1288, s6426, s6427, 1, s1287, s6428, s6429, 1, s1286, s6430, s6431, 1, s1285, s6432, s6433, 1, s1284, s6434, s6435, 1, s1283, s6436, s6437, 1, s1282, s6438, s6439, 1, s1281, s6440, s6441, 1, s1280, s6442, s6443, 1, s1279, s6444, s6445, 1, s1278, s6446, s6447, 1, s1277, s6448, s6449, 1, s1276, s6450, s6451, 1, s1275, s6452, s6453, 1, s1274, s6454, s6455, 1, s1273, s6456, s6457, 1, s1272, s6458, s6459, 1, s1271, s6460, s6461, 1, s1270, s6462, s6463, 1, s1269, s6464, s6465, 1, s1268, s6466, s6467, 1, s1267, s6468, s6469, 1, s1266, s6470, s6471, 1, s1265, s6472, s6473, 1, s1264, s6474, s6475, 1, s1263, s6476, s6477, 1, s1262, s6478, s6479, 1, s1261, s6480, s6481, 1, s1260, s6482, s6483, 1, s1259, s6484, s6485, 1, s1258, s6486, s6487, 1, s1257, s6488, s6489, 1, s1256, s6490, s6491, 1, s1255, s6492, s6493, 1, s1254, s6494, s6495, 1, s1253, s6496, s6497, 1, s1252, s6498, s6499, 1, s1251, s6500, s6501, 1, s1250, s6502, s6503, 1, s1249, s6504, s6505, 1, s1248, s6506, s6507, 1, s1247, s6508, s6509, 1, s1246, s6510, s6511, 1, s1245, s6512, s6513, 1, s1244, s6514, s6515, 1, s1243, s6516, s6517, 1, s1242, s6518, s6519, 1, s1241, s6520, s6521, 1, s1240, s6522, s6523, 1, s1239, s6524, s6525, 1, s1238, s6526, s6527, 1, s1237, s6528, s6529, 1, s1236, s6530, s6531, 1, s1235, s6532, s6533, 1, s1234, s6534, s6535, 1, s1233, s6536, s6537, 1, s1232, s6538, s6539, 1, s1231, s6540, s6541, 1, s1230, s6542, s6543, 1, s1229, s6544, s6545, 1, s1228, s6546, s6547, 1, s1227, s6548, s6549, 1, s1226, s6550, s6551, 1, s1225, s6552, s6553, 1, s1224, s6554, s6555, 1, s1223, s6556, s6557, 1, s1222, s6558, s6559, 1, s1221, s6560, s6561, 1, s1220, s6562, s6563, 1, s1219, s6564, s6565, 1, s1218, s6566, s6567, 1, s1217, s6568, s6569, 1, s1216, s6570, s6571, 1, s1215, s6572, s6573, 1, s1214, s6574, s6575, 1, s1213, s6576, s6577, 1, s1212, s6578, s6579, 1, s1211, s6580, s6581, 1, s1210, s6582, s6583, 1, s1209, s6584, s6585, 1, s1208, s6586, s6587, 1, s1207, s6588, s6589, 1, s1206, s6590, s6591, 1, s1205, s6592, s6593, 1, s1204, s6594, s6595, 1, s1203, s6596, s6597, 1, s1202, s6598, s6599, 1, s1201, s6600, s6601, 1, s1200, s6602, s6603, 1, s1199, s6604, s6605, 1, s1198, s6606, s6607, 1, s1197, s6608, s6609, 1, s1196, s6610, s6611, 1, s1195, s6612, s6613, 1, s1194, s6614, s6615, 1, s1193, s6616, s6617, 1, s1192, s6618, s6619, 1, s1191, s6620, s6621, 1, s1190, s6622, s6623, 1, s1189, s6624, s6625, 1, s1188, s6626, s6627, 1, s1187, s6628, s6629, 1, s1186, s6630, s6631, 1, s1185, s6632, s6633, 1, s1184, s6634, s6635, 1, s1183, s6636, s6637, 1, s1182, s6638, s6639, 1, s1181, s6640, s6641, 1, s1180, s6642, s6643, 1, s1179, s6644, s6645, 1, s1178, s6646, s6647, 1, s1177, s6648, s6649, 1, s1176, s6650, s6651, 1, s1175, s6652, s6653, 1, s1174, s6654, s6655, 1, s1173, s6656, s6657, 1, s1172, s6658, s6659, 1, s1171, s6660, s6661, 1, s1170, s6662, s6663, 1, s1169, s6664, s6665, 1, s1168, s6666, s6667, 1, s1167, s6668, s6669, 1, s1166, s6670, s6671, 1, s1165, s6672, s6673, 1, s1164, s6674, s6675, 1, s1163, s6676, s6677, 1, s1162, s6678, s6679, 1, s1161, s6680, s6681, 1, s1160, s6682, s6683, 1, s1159, s6684, s6685, 1, s1158, s6686, s6687, 1, s1157, s6688, s6689, 1, s1156, s6690, s6691, 1, s1155, s6692, s6693, 1, s1154, s6694, s6695, 1, s1153, s6696, s6697, 1, s1152, s6698, s6699, 1, s1151, s6700, s6701, 1, s1150, s6702, s6703, 1, s1149, s6704, s6705, 1, s1148, s6706, s6707, 1, s1147, s6708, s6709, 1, s1146, s6710, s6711, 1, s1145, s6712, s6713, 1, s1144, s6714, s6715, 1, s1143, s6716, s6717, 1, s1142, s6718, s6719, 1, s1141, s6720, s6721, 1, s1140, s6722, s6723, 1, s1139, s6724, s6725, 1, s1138, s6726, s6727, 1, s1137, s6728, s6729, 1, s1136, s6730, s6731, 1, s1135, s6732, s6733, 1, s1134, s6734, s6735, 1, s1133, s6736, s6737, 1, s1132, s6738, s6739, 1, s1131, s6740, s6741, 1, s1130, s6742, s6743, 1, s1129, s6744, s6745, 1, s1128, s6746, s6747, 1, s1127, s6748, s6749, 1, s1126, s6750, s6751, 1, s1125, s6752, s6753, 1, s1124, s6754, s6755, 1, s1123, s6756, s6757, 1, s1122, s6758, s6759, 1, s1121, s6760, s6761, 1, s1120, s6762, s6763, 1, s1119, s6764, s6765, 1, s1118, s6766, s6767, 1, s1117, s6768, s6769, 1, s1116, s6770, s6771, 1, s1115, s6772, s6773, 1, s1114, s6774, s6775, 1, s1113, s6776, s6777, 1, s1112, s6778, s6779, 1, s1111, s6780, s6781, 1, s1110, s6782, s6783, 1, s1109, s6784, s6785, 1, s1108, s6786, s6787, 1, s1107, s6788, s6789, 1, s1106, s6790, s6791, 1, s1105, s6792, s6793, 1, s1104, s6794, s6795, 1, s1103, s6796, s6797, 1, s1102, s6798, s6799, 1, s1101, s6800, s6801, 1, s1100, s6802, s6803, 1, s1099, s6804, s6805, 1, s1098, s6806, s6807, 1, s1097, s6808, s6809, 1, s1096, s6810, s6811, 1, s1095, s6812, s6813, 1, s1094, s6814, s6815, 1, s1093, s6816, s6817, 1, s1092, s6818, s6819, 1, s1091, s6820, s6821, 1, s1090, s6822, s6823, 1, s1089, s6824, s6825, 1, s1088, s6826, s6827, 1, s1087, s6828, s6829, 1, s1086, s6830, s6831, 1, s1085, s6832, s6833, 1, s1084, s6834, s6835, 1, s1083, s6836, s6837, 1, s1082, s6838, s6839, 1, s1081, s6840, s6841, 1, s1080, s6842, s6843, 1, s1079, s6844, s6845, 1, s1078, s6846, s6847, 1, s1077, s6848, s6849, 1, s1076, s6850, s6851, 1, s1075, s6852, s6853, 1, s1074, s6854, s6855, 1, s1073, s6856, s6857, 1, s1072, s6858, s6859, 1, s1071, s6860, s6861, 1, s1070, s6862, s6863, 1, s1069, s6864, s6865, 1, s1068, s6866, s6867, 1, s1067, s6868, s6869, 1, s1066, s6870, s6871, 1, s1065, s6872, s6873, 1, s1064, s6874, s6875, 1, s1063, s6876, s6877, 1, s1062, s6878, s6879, 1, s1061, s6880, s6881, 1, s1060, s6882, s6883, 1, s1059, s6884, s6885, 1, s1058, s6886, s6887, 1, s1057, s6888, s6889, 1, s1056, s6890, s6891, 1, s1055, s6892, s6893, 1, s1054, s6894, s6895, 1, s1053, s6896, s6897, 1, s1052, s6898, s6899, 1, s1051, s6900, s6901, 1, s1050, s6902, s6903, 1, s1049, s6904, s6905, 1, s1048, s6906, s6907, 1, s1047, s6908, s6909, 1, s1046, s6910, s6911, 1, s1045, s6912, s6913, 1, s1044, s6914, s6915, 1, s1043, s6916, s6917, 1, s1042, s6918, s6919, 1, s1041, s6920, s6921, 1, s1040, s6922, s6923, 1, s1039, s6924, s6925, 1, s1038, s6926, s6927, 1, s1037, s6928, s6929, 1, s1036, s6930, s6931, 1, s1035, s6932, s6933, 1, s1034, s6934, s6935, 1, s1033, s6936, s6937, 1, s1032, s6938, s6939, 1, s1031, s6940, s6941, 1, s1030, s6942, s6943, 1, s1029, s6944, s6945, 1, s1028, s6946, s6947, 1, s1027, s6948, s6949, 1, s1026, s6950, s6951, 1, s1025, s6952, s6953, 1, s1024, s6954, s6955, 1, s1023, s6956, s6957, 1, s1022, s6958, s6959, 1, s1021, s6960, s6961, 1, s1020, s6962, s6963, 1, s1019, s6964, s6965, 1, s1018, s6966, s6967, 1, s1017, s6968, s6969, 1, s1016, s6970, s6971, 1, s1015, s6972, s6973, 1, s1014, s6974, s6975, 1, s1013, s6976, s6977, 1, s1012, s6978, s6979, 1, s1011, s6980, s6981, 1, s1010, s6982, s6983, 1, s1009, s6984, s6985, 1, s1008, s6986, s6987, 1, s1007, s6988, s6989, 1, s1006, s6990, s6991, 1, s1005, s6992, s6993, 1, s1004, s6994, s6995, 1, s1003, s6996, s6997, 1, s1002, s6998, s6999, 1, s1001, s7000, s7001, 1, s1000, s7002, s7003, 1, s999, s7004, s7005, 1, s998, s7006, s7007, 1, s997, s7008, s7009, 1, s996, s7010, s7011, 1, s995, s7012, s7013, 1, s994, s7014, s7015, 1, s993, s7016, s7017, 1, s992, s7018, s7019, 1, s991, s7020, s7021, 1, s990, s7022, s7023, 1, s989, s7024, s7025, 1, s988, s7026, s7027, 1, s987, s7028, s7029, 1, s986, s7030, s7031, 1, s985, s7032, s7033, 1, s984, s7034, s7035, 1, s983, s7036, s7037, 1, s982, s7038, s7039, 1, s981, s7040, s7041, 1, s980, s7042, s7043, 1, s979, s7044, s7045, 1, s978, s7046, s7047, 1, s977, s7048, s7049, 1, s976, s7050, s7051, 1, s975, s7052, s7053, 1, s974, s7054, s7055, 1, s973, s7056, s7057, 1, s972, s7058, s7059, 1, s971, s7060, s7061, 1, s970, s7062, s7063, 1, s969, s7064, s7065, 1, s968, s7066, s7067, 1, s967, s7068, s7069, 1, s966, s7070, s7071, 1, s965, s7072, s7073, 1, s964, s7074, s7075, 1, s963, s7076, s7077, 1, s962, s7078, s7079, 1, s961, s7080, s7081, 1, s960, s7082, s7083, 1, s959, s7084, s7085, 1, s958, s7086, s7087, 1, s957, s7088, s7089, 1, s956, s7090, s7091, 1, s955, s7092, s7093, 1, s954, s7094, s7095, 1, s953, s7096, s7097, 1, s952, s7098, s7099, 1, s951, s7100, s7101, 1, s950, s7102, s7103, 1, s949, s7104, s7105, 1, s948, s7106, s7107, 1, s947, s7108, s7109, 1, s946, s7110, s7111, 1, s945, s7112, s7113, 1, s944, s7114, s7115, 1, s943, s7116, s7117, 1, s942, s7118, s7119, 1, s941, s7120, s7121, 1, s940, s7122, s7123, 1, s939, s7124, s7125, 1, s938, s7126, s7127, 1, s937, s7128, s7129, 1, s936, s7130, s7131, 1, s935, s7132, s7133, 1, s934, s7134, s7135, 1, s933, s7136, s7137, 1, s932, s7138, s7139, 1, s931, s7140, s7141, 1, s930, s7142, s7143, 1, s929, s7144, s7145, 1, s928, s7146, s7147, 1, s927, s7148, s7149, 1, s926, s7150, s7151, 1, s925, s7152, s7153, 1, s924, s7154, s7155, 1, s923, s7156, s7157, 1, s922, s7158, s7159, 1, s921, s7160, s7161, 1, s920, s7162, s7163, 1, s919, s7164, s7165, 1, s918, s7166, s7167, 1, s917, s7168, s7169, 1, s916, s7170, s7171, 1, s915, s7172, s7173, 1, s914, s7174, s7175, 1, s913, s7176, s7177, 1, s912, s7178, s7179, 1, s911, s7180, s7181, 1, s910, s7182, s7183, 1, s909, s7184, s7185, 1, s908, s7186, s7187, 1, s907, s7188, s7189, 1, s906, s7190, s7191, 1, s905, s7192, s7193, 1, s904, s7194, s7195, 1, s903, s7196, s7197, 1, s902, s7198, s7199, 1, s901, s7200, s7201, 1, s900, s7202, s7203, 1, s899, s7204, s7205, 1, s898, s7206, s7207, 1, s897, s7208, s7209, 1, s896, s7210, s7211, 1, s895, s7212, s7213, 1, s894, s7214, s7215, 1, s893, s7216, s7217, 1, s892, s7218, s7219, 1, s891, s7220, s7221, 1, s890, s7222, s7223, 1, s889, s7224, s7225, 1, s888, s7226, s7227, 1, s887, s7228, s7229, 1, s886, s7230, s7231, 1, s885, s7232, s7233, 1, s884, s7234, s7235, 1, s883, s7236, s7237, 1, s882, s7238, s7239, 1, s881, s7240, s7241, 1, s880, s7242, s7243, 1, s879, s7244, s7245, 1, s878, s7246, s7247, 1, s877, s7248, s7249, 1, s876, s7250, s7251, 1, s875, s7252, s7253, 1, s874, s7254, s7255, 1, s873, s7256, s7257, 1, s872, s7258, s7259, 1, s871, s7260, s7261, 1, s870, s7262, s7263, 1, s869, s7264, s7265, 1, s868, s7266, s7267, 1, s867, s7268, s7269, 1, s866, s7270, s7271, 1, s865, s7272, s7273, 1, s864, s7274, s7275, 1, s863, s7276, s7277, 1, s862, s7278, s7279, 1, s861, s7280, s7281, 1, s860, s7282, s7283, 1, s859, s7284, s7285, 1, s858, s7286, s7287, 1, s857, s7288, s7289, 1, s856, s7290, s7291, 1, s855, s7292, s7293, 1, s854, s7294, s7295, 1, s853, s7296, s7297, 1, s852, s7298, s7299, 1, s851, s7300, s7301, 1, s850, s7302, s7303, 1, s849, s7304, s7305, 1, s848, s7306, s7307, 1, s847, s7308, s7309, 1, s846, s7310, s7311, 1, s845, s7312, s7313, 1, s844, s7314, s7315, 1, s843, s7316, s7317, 1, s842, s7318, s7319, 1, s841, s7320, s7321, 1, s840, s7322, s7323, 1, s839, s7324, s7325, 1, s838, s7326, s7327, 1, s837, s7328, s7329, 1, s836, s7330, s7331, 1, s835, s7332, s7333, 1, s834, s7334, s7335, 1, s833, s7336, s7337, 1, s832, s7338, s7339, 1, s831, s7340, s7341, 1, s830, s7342, s7343, 1, s829, s7344, s7345, 1, s828, s7346, s7347, 1, s827, s7348, s7349, 1, s826, s7350, s7351, 1, s825, s7352, s7353, 1, s824, s7354, s7355, 1, s823, s7356, s7357, 1, s822, s7358, s7359, 1, s821, s7360, s7361, 1, s820, s7362, s7363, 1, s819, s7364, s7365, 1, s818, s7366, s7367, 1, s817, s7368, s7369, 1, s816, s7370, s7371, 1, s815, s7372, s7373, 1, s814, s7374, s7375, 1, s813, s7376, s7377, 1, s812, s7378, s7379, 1, s811, s7380, s7381, 1, s810, s7382, s7383, 1, s809, s7384, s7385, 1, s808, s7386, s7387, 1, s807, s7388, s7389, 1, s806, s7390, s7391, 1, s805, s7392, s7393, 1, s804, s7394, s7395, 1, s803, s7396, s7397, 1, s802, s7398, s7399, 1, s801, s7400, s7401, 1, s800, s7402, s7403, 1, s799, s7404, s7405, 1, s798, s7406, s7407, 1, s797, s7408, s7409, 1, s796, s7410, s7411, 1, s795, s7412, s7413, 1, s794, s7414, s7415, 1, s793, s7416, s7417, 1, s792, s7418, s7419, 1, s791, s7420, s7421, 1, s790, s7422, s7423, 1, s789, s7424, s7425, 1, s788, s7426, s7427, 1, s787, s7428, s7429, 1, s786, s7430, s7431, 1, s785, s7432, s7433, 1, s784, s7434, s7435, 1, s783, s7436, s7437, 1, s782, s7438, s7439, 1, s781, s7440, s7441, 1, s780, s7442, s7443, 1, s779, s7444, s7445, 1, s778, s7446, s7447, 1, s777, s7448, s7449, 1, s776, s7450, s7451, 1, s775, s7452, s7453, 1, s774, s7454, s7455, 1, s773, s7456, s7457, 1, s772, s7458, s7459, 1, s771, s7460, s7461, 1, s770, s7462, s7463, 1, s769, s7464, s7465, 1, s768, s7466, s7467, 1, s767, s7468, s7469, 1, s766, s7470, s7471, 1, s765, s7472, s7473, 1, s764, s7474, s7475, 1, s763, s7476, s7477, 1, s762, s7478, s7479, 1, s761, s7480, s7481, 1, s760, s7482, s7483, 1, s759, s7484, s7485, 1, s758, s7486, s7487, 1, s757, s7488, s7489, 1, s756, s7490, s7491, 1, s755, s7492, s7493, 1, s754, s7494, s7495, 1, s753, s7496, s7497, 1, s752, s7498, s7499, 1, s751, s7500, s7501, 1, s750, s7502, s7503, 1, s749, s7504, s7505, 1, s748, s7506, s7507, 1, s747, s7508, s7509, 1, s746, s7510, s7511, 1, s745, s7512, s7513, 1, s744, s7514, s7515, 1, s743, s7516, s7517, 1, s742, s7518, s7519, 1, s741, s7520, s7521, 1, s740, s7522, s7523, 1, s739, s7524, s7525, 1, s738, s7526, s7527, 1, s737, s7528, s7529, 1, s736, s7530, s7531, 1, s735, s7532, s7533, 1, s734, s7534, s7535, 1, s733, s7536, s7537, 1, s732, s7538, s7539, 1, s731, s7540, s7541, 1, s730, s7542, s7543, 1, s729, s7544, s7545, 1, s728, s7546, s7547, 1, s727, s7548, s7549, 1, s726, s7550, s7551, 1, s725, s7552, s7553, 1, s724, s7554, s7555, 1, s723, s7556, s7557, 1, s722, s7558, s7559, 1, s721, s7560, s7561, 1, s720, s7562, s7563, 1, s719, s7564, s7565, 1, s718, s7566, s7567, 1, s717, s7568, s7569, 1, s716, s7570, s7571, 1, s715, s7572, s7573, 1, s714, s7574, s7575, 1, s713, s7576, s7577, 1, s712, s7578, s7579, 1, s711, s7580, s7581, 1, s710, s7582, s7583, 1, s709, s7584, s7585, 1, s708, s7586, s7587, 1, s707, s7588, s7589, 1, s706, s7590, s7591, 1, s705, s7592, s7593, 1, s704, s7594, s7595, 1, s703, s7596, s7597, 1, s702, s7598, s7599, 1, s701, s7600, s7601, 1, s700, s7602, s7603, 1, s699, s7604, s7605, 1, s698, s7606, s7607, 1, s697, s7608, s7609, 1, s696, s7610, s7611, 1, s695, s7612, s7613, 1, s694, s7614, s7615, 1, s693, s7616, s7617, 1, s692, s7618, s7619, 1, s691, s7620, s7621, 1, s690, s7622, s7623, 1, s689, s7624, s7625, 1, s688, s7626, s7627, 1, s687, s7628, s7629, 1, s686, s7630, s7631, 1, s685, s7632, s7633, 1, s684, s7634, s7635, 1, s683, s7636, s7637, 1, s682, s7638, s7639, 1, s681, s7640, s7641, 1, s680, s7642, s7643, 1, s679, s7644, s7645, 1, s678, s7646, s7647, 1, s677, s7648, s7649, 1, s676, s7650, s7651, 1, s675, s7652, s7653, 1, s674, s7654, s7655, 1, s673, s7656, s7657, 1, s672, s7658, s7659, 1, s671, s7660, s7661, 1, s670, s7662, s7663, 1, s669, s7664, s7665, 1, s668, s7666, s7667, 1, s667, s7668, s7669, 1, s666, s7670, s7671, 1, s665, s7672, s7673, 1, s664, s7674, s7675, 1, s663, s7676, s7677, 1, s662, s7678, s7679, 1, s661, s7680, s7681, 1, s660, s7682, s7683, 1, s659, s7684, s7685, 1, s658, s7686, s7687, 1, s657, s7688, s7689, 1, s656, s7690, s7691, 1, s655, s7692, s7693, 1, s654, s7694, s7695, 1, s653, s7696, s7697, 1, s652, s7698, s7699, 1, s651, s7700, s7701, 1, s650, s7702, s7703, 1, s649, s7704, s7705, 1, s648, s7706, s7707, 1, s647, s7708, s7709, 1, s646, s7710, s7711, 1, s645, s7712, s7713, 1, s644, s7714, s7715, 1, s643, s7716, s7717, 1, s642, s7718, s7719, 1, s641, s7720, s7721, 1, s640, s7722, s7723, 1, s639, s7724, s7725, 1, s638, s7726, s7727, 1, s637, s7728, s7729, 1, s636, s7730, s7731, 1, s635, s7732, s7733, 1, s634, s7734, s7735, 1, s633, s7736, s7737, 1, s632, s7738, s7739, 1, s631, s7740, s7741, 1, s630, s7742, s7743, 1, s629, s7744, s7745, 1, s628, s7746, s7747, 1, s627, s7748, s7749, 1, s626, s7750, s7751, 1, s625, s7752, s7753, 1, s624, s7754, s7755, 1, s623, s7756, s7757, 1, s622, s7758, s7759, 1, s621, s7760, s7761, 1, s620, s7762, s7763, 1, s619, s7764, s7765, 1, s618, s7766, s7767, 1, s617, s7768, s7769, 1, s616, s7770, s7771, 1, s615, s7772, s7773, 1, s614, s7774, s7775, 1, s613, s7776, s7777, 1, s612, s7778, s7779, 1, s611, s7780, s7781, 1, s610, s7782, s7783, 1, s609, s7784, s7785, 1, s608, s7786, s7787, 1, s607, s7788, s7789, 1, s606, s7790, s7791, 1, s605, s7792, s7793, 1, s604, s7794, s7795, 1, s603, s7796, s7797, 1, s602, s7798, s7799, 1, s601, s7800, s7801, 1, s600, s7802, s7803, 1, s599, s7804, s7805, 1, s598, s7806, s7807, 1, s597, s7808, s7809, 1, s596, s7810, s7811, 1, s595, s7812, s7813, 1, s594, s7814, s7815, 1, s593, s7816, s7817, 1, s592, s7818, s7819, 1, s591, s7820, s7821, 1, s590, s7822, s7823, 1, s589, s7824, s7825, 1, s588, s7826, s7827, 1, s587, s7828, s7829, 1, s586, s7830, s7831, 1, s585, s7832, s7833, 1, s584, s7834, s7835, 1, s583, s7836, s7837, 1, s582, s7838, s7839, 1, s581, s7840, s7841, 1, s580, s7842, s7843, 1, s579, s7844, s7845, 1, s578, s7846, s7847, 1, s577, s7848, s7849, 1, s576, s7850, s7851, 1, s575, s7852, s7853, 1, s574, s7854, s7855, 1, s573, s7856, s7857, 1, s572, s7858, s7859, 1, s571, s7860, s7861, 1, s570, s7862, s7863, 1, s569, s7864, s7865, 1, s568, s7866, s7867, 1, s567, s7868, s7869, 1, s566, s7870, s7871, 1, s565, s7872, s7873, 1, s564, s7874, s7875, 1, s563, s7876, s7877, 1, s562, s7878, s7879, 1, s561, s7880, s7881, 1, s560, s7882, s7883, 1, s559, s7884, s7885, 1, s558, s7886, s7887, 1, s557, s7888, s7889, 1, s556, s7890, s7891, 1, s555, s7892, s7893, 1, s554, s7894, s7895, 1, s553, s7896, s7897, 1, s552, s7898, s7899, 1, s551, s7900, s7901, 1, s550, s7902, s7903, 1, s549, s7904, s7905, 1, s548, s7906, s7907, 1, s547, s7908, s7909, 1, s546, s7910, s7911, 1, s545, s7912, s7913, 1, s544, s7914, s7915, 1, s543, s7916, s7917, 1, s542, s7918, s7919, 1, s541, s7920, s7921, 1, s540, s7922, s7923, 1, s539, s7924, s7925, 1, s538, s7926, s7927, 1, s537, s7928, s7929, 1, s536, s7930, s7931, 1, s535, s7932, s7933, 1, s534, s7934, s7935, 1, s533, s7936, s7937, 1, s532, s7938, s7939, 1, s531, s7940, s7941, 1, s530, s7942, s7943, 1, s529, s7944, s7945, 1, s528, s7946, s7947, 1, s527, s7948, s7949, 1, s526, s7950, s7951, 1, s525, s7952, s7953, 1, s524, s7954, s7955, 1, s523, s7956, s7957, 1, s522, s7958, s7959, 1, s521, s7960, s7961, 1, s520, s7962, s7963, 1, s519, s7964, s7965, 1, s518, s7966, s7967, 1, s517, s7968, s7969, 1, s516, s7970, s7971, 1, s515, s7972, s7973, 1, s514, s7974, s7975, 1, s513, s7976, s7977, 1, s512, s7978, s7979, 1, s511, s7980, s7981, 1, s510, s7982, s7983, 1, s509, s7984, s7985, 1, s508, s7986, s7987, 1, s507, s7988, s7989, 1, s506, s7990, s7991, 1, s505, s7992, s7993, 1, s504, s7994, s7995, 1, s503, s7996, s7997, 1, s502, s7998, s7999, 1, s501, s8000, s8001, 1, s500, s8002, s8003, 1, s499, s8004, s8005, 1, s498, s8006, s8007, 1, s497, s8008, s8009, 1, s496, s8010, s8011, 1, s495, s8012, s8013, 1, s494, s8014, s8015, 1, s493, s8016, s8017, 1, s492, s8018, s8019, 1, s491, s8020, s8021, 1, s490, s8022, s8023, 1, s489, s8024, s8025, 1, s488, s8026, s8027, 1, s487, s8028, s8029, 1, s486, s8030, s8031, 1, s485, s8032, s8033, 1, s484, s8034, s8035, 1, s483, s8036, s8037, 1, s482, s8038, s8039, 1, s481, s8040, s8041, 1, s480, s8042, s8043, 1, s479, s8044, s8045, 1, s478, s8046, s8047, 1, s477, s8048, s8049, 1, s476, s8050, s8051, 1, s475, s8052, s8053, 1, s474, s8054, s8055, 1, s473, s8056, s8057, 1, s472, s8058, s8059, 1, s471, s8060, s8061, 1, s470, s8062, s8063, 1, s469, s8064, s8065, 1, s468, s8066, s8067, 1, s467, s8068, s8069, 1, s466, s8070, s8071, 1, s465, s8072, s8073, 1, s464, s8074, s8075, 1, s463, s8076, s8077, 1, s462, s8078, s8079, 1, s461, s8080, s8081, 1, s460, s8082, s8083, 1, s459, s8084, s8085, 1, s458, s8086, s8087, 1, s457, s8088, s8089, 1, s456, s8090, s8091, 1, s455, s8092, s8093, 1, s454, s8094, s8095, 1, s453, s8096, s8097, 1, s452, s8098, s8099, 1, s451, s8100, s8101, 1, s450, s8102, s8103, 1, s449, s8104, s8105, 1, s448, s8106, s8107, 1, s447, s8108, s8109, 1, s446, s8110, s8111, 1, s445, s8112, s8113, 1, s444, s8114, s8115, 1, s443, s8116, s8117, 1, s442, s8118, s8119, 1, s441, s8120, s8121, 1, s440, s8122, s8123, 1, s439, s8124, s8125, 1, s438, s8126, s8127, 1, s437, s8128, s8129, 1, s436, s8130, s8131, 1, s435, s8132, s8133, 1, s434, s8134, s8135, 1, s433, s8136, s8137, 1, s432, s8138, s8139, 1, s431, s8140, s8141, 1, s430, s8142, s8143, 1, s429, s8144, s8145, 1, s428, s8146, s8147, 1, s427, s8148, s8149, 1, s426, s8150, s8151, 1, s425, s8152, s8153, 1, s424, s8154, s8155, 1, s423, s8156, s8157, 1, s422, s8158, s8159, 1, s421, s8160, s8161, 1, s420, s8162, s8163, 1, s419, s8164, s8165, 1, s418, s8166, s8167, 1, s417, s8168, s8169, 1, s416, s8170, s8171, 1, s415, s8172, s8173, 1, s414, s8174, s8175, 1, s413, s8176, s8177, 1, s412, s8178, s8179, 1, s411, s8180, s8181, 1, s410, s8182, s8183, 1, s409, s8184, s8185, 1, s408, s8186, s8187, 1, s407, s8188, s8189, 1, s406, s8190, s8191, 1, s405, s8192, s8193, 1, s404, s8194, s8195, 1, s403, s8196, s8197, 1, s402, s8198, s8199, 1, s401, s8200, s8201, 1, s400, s8202, s8203, 1, s399, s8204, s8205, 1, s398, s8206, s8207, 1, s397, s8208, s8209, 1, s396, s8210, s8211, 1, s395, s8212, s8213, 1, s394, s8214, s8215, 1, s393, s8216, s8217, 1, s392, s8218, s8219, 1, s391, s8220, s8221, 1, s390, s8222, s8223, 1, s389, s8224, s8225, 1, s388, s8226, s8227, 1, s387, s8228, s8229, 1, s386, s8230, s8231, 1, s385, s8232, s8233, 1, s384, s8234, s8235, 1, s383, s8236, s8237, 1, s382, s8238, s8239, 1, s381, s8240, s8241, 1, s380, s8242, s8243, 1, s379, s8244, s8245, 1, s378, s8246, s8247, 1, s377, s8248, s8249, 1, s376, s8250, s8251, 1, s375, s8252, s8253, 1, s374, s8254, s8255, 1, s373, s8256, s8257, 1, s372, s8258, s8259, 1, s371, s8260, s8261, 1, s370, s8262, s8263, 1, s369, s8264, s8265, 1, s368, s8266, s8267, 1, s367, s8268, s8269, 1, s366, s8270, s8271, 1, s365, s8272, s8273, 1, s364, s8274, s8275, 1, s363, s8276, s8277, 1, s362, s8278, s8279, 1, s361, s8280, s8281, 1, s360, s8282, s8283, 1, s359, s8284, s8285, 1, s358, s8286, s8287, 1, s357, s8288, s8289, 1, s356, s8290, s8291, 1, s355, s8292, s8293, 1, s354, s8294, s8295, 1, s353, s8296, s8297, 1, s352, s8298, s8299, 1, s351, s8300, s8301, 1, s350, s8302, s8303, 1, s349, s8304, s8305, 1, s348, s8306, s8307, 1, s347, s8308, s8309, 1, s346, s8310, s8311, 1, s345, s8312, s8313, 1, s344, s8314, s8315, 1, s343, s8316, s8317, 1, s342, s8318, s8319, 1, s341, s8320, s8321, 1, s340, s8322, s8323, 1, s339, s8324, s8325, 1, s338, s8326, s8327, 1, s337, s8328, s8329, 1, s336, s8330, s8331, 1, s335, s8332, s8333, 1, s334, s8334, s8335, 1, s333, s8336, s8337, 1, s332, s8338, s8339, 1, s331, s8340, s8341, 1, s330, s8342, s8343, 1, s329, s8344, s8345, 1, s328, s8346, s8347, 1, s327, s8348, s8349, 1, s326, s8350, s8351, 1, s325, s8352, s8353, 1, s324, s8354, s8355, 1, s323, s8356, s8357, 1, s322, s8358, s8359, 1, s321, s8360, s8361, 1, s320, s8362, s8363, 1, s319, s8364, s8365, 1, s318, s8366, s8367, 1, s317, s8368, s8369, 1, s316, s8370, s8371, 1, s315, s8372, s8373, 1, s314, s8374, s8375, 1, s313, s8376, s8377, 1, s312, s8378, s8379, 1, s311, s8380, s8381, 1, s310, s8382, s8383, 1, s309, s8384, s8385, 1, s308, s8386, s8387, 1, s307, s8388, s8389, 1, s306, s8390, s8391, 1, s305, s8392, s8393, 1, s304, s8394, s8395, 1, s303, s8396, s8397, 1, s302, s8398, s8399, 1, s301, s8400, s8401, 1, s300, s8402, s8403, 1, s299, s8404, s8405, 1, s298, s8406, s8407, 1, s297, s8408, s8409, 1, s296, s8410, s8411, 1, s295, s8412, s8413, 1, s294, s8414, s8415, 1, s293, s8416, s8417, 1, s292, s8418, s8419, 1, s291, s8420, s8421, 1, s290, s8422, s8423, 1, s289, s8424, s8425, 1, s288, s8426, s8427, 1, s287, s8428, s8429, 1, s286, s8430, s8431, 1, s285, s8432, s8433, 1, s284, s8434, s8435, 1, s283, s8436, s8437, 1, s282, s8438, s8439, 1, s281, s8440, s8441, 1, s280, s8442, s8443, 1, s279, s8444, s8445, 1, s278, s8446, s8447, 1, s277, s8448, s8449, 1, s276, s8450, s8451, 1, s275, s8452, s8453, 1, s274, s8454, s8455, 1, s273, s8456, s8457, 1, s272, s8458, s8459, 1, s271, s8460, s8461, 1, s270, s8462, s8463, 1, s269, s8464, s8465, 1, s268, s8466, s8467, 1, s267, s8468, s8469, 1, s266, s8470, s8471, 1, s265, s8472, s8473, 1, s264, s8474, s8475, 1, s263, s8476, s8477, 1, s262, s8478, s8479, 1, s261, s8480, s8481, 1, s260, s8482, s8483, 1, s259, s8484, s8485, 1, s258, s8486, s8487, 1, s257, s8488, s8489, 1, s256, s8490, s8491, 1, s255, s8492, s8493, 1, s254, s8494, s8495, 1, s253, s8496, s8497, 1, s252, s8498, s8499, 1, s251, s8500, s8501, 1, s250, s8502, s8503, 1, s249, s8504, s8505, 1, s248, s8506, s8507, 1, s247, s8508, s8509, 1, s246, s8510, s8511, 1, s245, s8512, s8513, 1, s244, s8514, s8515, 1, s243, s8516, s8517, 1, s242, s8518, s8519, 1, s241, s8520, s8521, 1, s240, s8522, s8523, 1, s239, s8524, s8525, 1, s238, s8526, s8527, 1, s237, s8528, s8529, 1, s236, s8530, s8531, 1, s235, s8532, s8533, 1, s234, s8534, s8535, 1, s233, s8536, s8537, 1, s232, s8538, s8539, 1, s231, s8540, s8541, 1, s230, s8542, s8543, 1, s229, s8544, s8545, 1, s228, s8546, s8547, 1, s227, s8548, s8549, 1, s226, s8550, s8551, 1, s225, s8552, s8553, 1, s224, s8554, s8555, 1, s223, s8556, s8557, 1, s222, s8558, s8559, 1, s221, s8560, s8561, 1, s220, s8562, s8563, 1, s219, s8564, s8565, 1, s218, s8566, s8567, 1, s217, s8568, s8569, 1, s216, s8570, s8571, 1, s215, s8572, s8573, 1, s214, s8574, s8575, 1, s213, s8576, s8577, 1, s212, s8578, s8579, 1, s211, s8580, s8581, 1, s210, s8582, s8583, 1, s209, s8584, s8585, 1, s208, s8586, s8587, 1, s207, s8588, s8589, 1, s206, s8590, s8591, 1, s205, s8592, s8593, 1, s204, s8594, s8595, 1, s203, s8596, s8597, 1, s202, s8598, s8599, 1, s201, s8600, s8601, 1, s200, s8602, s8603, 1, s199, s8604, s8605, 1, s198, s8606, s8607, 1, s197, s8608, s8609, 1, s196, s8610, s8611, 1, s195, s8612, s8613, 1, s194, s8614, s8615, 1, s193, s8616, s8617, 1, s192, s8618, s8619, 1, s191, s8620, s8621, 1, s190, s8622, s8623, 1, s189, s8624, s8625, 1, s188, s8626, s8627, 1, s187, s8628, s8629, 1, s186, s8630, s8631, 1, s185, s8632, s8633, 1, s184, s8634, s8635, 1, s183, s8636, s8637, 1, s182, s8638, s8639, 1, s181, s8640, s8641, 1, s180, s8642, s8643, 1, s179, s8644, s8645, 1, s178, s8646, s8647, 1, s177, s8648, s8649, 1, s176, s8650, s8651, 1, s175, s8652, s8653, 1, s174, s8654, s8655, 1, s173, s8656, s8657, 1, s172, s8658, s8659, 1, s171, s8660, s8661, 1, s170, s8662, s8663, 1, s169, s8664, s8665, 1, s168, s8666, s8667, 1, s167, s8668, s8669, 1, s166, s8670, s8671, 1, s165, s8672, s8673, 1, s164, s8674, s8675, 1, s163, s8676, s8677, 1, s162, s8678, s8679, 1, s161, s8680, s8681, 1, s160, s8682, s8683, 1, s159, s8684, s8685, 1, s158, s8686, s8687, 1, s157, s8688, s8689, 1, s156, s8690, s8691, 1, s155, s8692, s8693, 1, s154, s8694, s8695, 1, s153, s8696, s8697, 1, s152, s8698, s8699, 1, s151, s8700, s8701, 1, s150, s8702, s8703, 1, s149, s8704, s8705, 1, s148, s8706, s8707, 1, s147, s8708, s8709, 1, s146, s8710, s8711, 1, s145, s8712, s8713, 1, s144, s8714, s8715, 1, s143, s8716, s8717, 1, s142, s8718, s8719, 1, s141, s8720, s8721, 1, s140, s8722, s8723, 1, s139, s8724, s8725, 1, s138, s8726, s8727, 1, s137, s8728, s8729, 1, s136, s8730, s8731, 1, s135, s8732, s8733, 1, s134, s8734, s8735, 1, s133, s8736, s8737, 1, s132, s8738, s8739, 1, s131, s8740, s8741, 1, s130, s8742, s8743, 1, s129, s8744, s8745, 1, s128, s8746, s8747, 1, s127, s8748, s8749, 1, s126, s8750, s8751, 1, s125, s8752, s8753, 1, s124, s8754, s8755, 1, s123, s8756, s8757, 1, s122, s8758, s8759, 1, s121, s8760, s8761, 1, s120, s8762, s8763, 1, s119, s8764, s8765, 1, s118, s8766, s8767, 1, s117, s8768, s8769, 1, s116, s8770, s8771, 1, s115, s8772, s8773, 1, s114, s8774, s8775, 1, s113, s8776, s8777, 1, s112, s8778, s8779, 1, s111, s8780, s8781, 1, s110, s8782, s8783, 1, s109, s8784, s8785, 1, s108, s8786, s8787, 1, s107, s8788, s8789, 1, s106, s8790, s8791, 1, s105, s8792, s8793, 1, s104, s8794, s8795, 1, s103, s8796, s8797, 1, s102, s8798, s8799, 1, s101, s8800, s8801, 1, s100, s8802, s8803, 1, s99, s8804, s8805, 1, s98, s8806, s8807, 1, s97, s8808, s8809, 1, s96, s8810, s8811, 1, s95, s8812, s8813, 1, s94, s8814, s8815, 1, s93, s8816, s8817, 1, s92, s8818, s8819, 1, s91, s8820, s8821, 1, s90, s8822, s8823, 1, s89, s8824, s8825, 1, s88, s8826, s8827, 1, s87, s8828, s8829, 1, s86, s8830, s8831, 1, s85, s8832, s8833, 1, s84, s8834, s8835, 1, s83, s8836, s8837, 1, s82, s8838, s8839, 1, s81, s8840, s8841, 1, s80, s8842, s8843, 1, s79, s8844, s8845, 1, s78, s8846, s8847, 1, s77, s8848, s8849, 1, s76, s8850, s8851, 1, s75, s8852, s8853, 1, s74, s8854, s8855, 1, s73, s8856, s8857, 1, s72, s8858, s8859, 1, s71, s8860, s8861, 1, s70, s8862, s8863, 1, s69, s8864, s8865, 1, s68, s8866, s8867, 1, s67, s8868, s8869, 1, s66, s8870, s8871, 1, s65, s8872, s8873, 1, s64, s8874, s8875, 1, s63, s8876, s8877, 1, s62, s8878, s8879, 1, s61, s8880, s8881, 1, s60, s8882, s8883, 1, s59, s8884, s8885, 1, s58, s8886, s8887, 1, s57, s8888, s8889, 1, s56, s8890, s8891, 1, s55, s8892, s8893, 1, s54, s8894, s8895, 1, s53, s8896, s8897, 1, s52, s8898, s8899, 1, s51, s8900, s8901, 1, s50, s8902, s8903, 1, s49, s8904, s8905, 1, s48, s8906, s8907, 1, s47, s8908, s8909, 1, s46, s8910, s8911, 1, s45, s8912, s8913, 1, s44, s8914, s8915, 1, s43, s8916, s8917, 1, s42, s8918, s8919, 1, s41, s8920, s8921, 1, s40, s8922, s8923, 1, s39, s8924, s8925, 1, s38, s8926, s8927, 1, s37, s8928, s8929, 1, s36, s8930, s8931, 1, s35, s8932, s8933, 1, s34, s8934, s8935, 1, s33, s8936, s8937, 1, s32, s8938, s8939, 1, s31, s8940, s8941, 1, s30, s8942, s8943, 1, s29, s8944, s8945, 1, s28, s8946, s8947, 1, s27, s8948, s8949, 1, s26, s8950, s8951, 1, s25, s8952, s8953, 1, s24, s8954, s8955, 1, s23, s8956, s8957, 1, s22, s8958, s8959, 1, s21, s8960, s8961, 1, s20, s8962, s8963, 1, s19, s8964, s8965, 1, s18, s8966, s8967, 1, s17, s8968, s8969, 1, s16, s8970, s8971, 1, s15, s8972, s8973, 1, s14, s8974, s8975, 1, s13, s8976, s8977, 1, s12, s8978, s8979, 1, s11, s8980, s8981, 1, s10, s8982, s8983, 1, s9, s8984, s8985, 1, s8, s8986, s8987, 1, s7, s8988, s8989, 1, s6, s8990, s8991, 1, s5, s8992, s8993, 1, s4, s8994, s8995, 1, s3, s8996, s8997, 1, s2, s8998, s8999 # 6000
+adds s0, s1, s3000 # 6001
+adds s1, s0, s2999 # 6002
+adds s0, s1, s2998 # 6003
+adds s1, s0, s2997 # 6004
+adds s0, s1, s2996 # 6005
+adds s1, s0, s2995 # 6006
+adds s0, s1, s2994 # 6007
+adds s1, s0, s2993 # 6008
+adds s0, s1, s2992 # 6009
+adds s1, s0, s2991 # 6010
+adds s0, s1, s2990 # 6011
+adds s1, s0, s2989 # 6012
+adds s0, s1, s2988 # 6013
+adds s1, s0, s2987 # 6014
+adds s0, s1, s2986 # 6015
+adds s1, s0, s2985 # 6016
+adds s0, s1, s2984 # 6017
+adds s1, s0, s2983 # 6018
+adds s0, s1, s2982 # 6019
+adds s1, s0, s2981 # 6020
+adds s0, s1, s2980 # 6021
+adds s1, s0, s2979 # 6022
+adds s0, s1, s2978 # 6023
+adds s1, s0, s2977 # 6024
+adds s0, s1, s2976 # 6025
+adds s1, s0, s2975 # 6026
+adds s0, s1, s2974 # 6027
+adds s1, s0, s2973 # 6028
+adds s0, s1, s2972 # 6029
+adds s1, s0, s2971 # 6030
+adds s0, s1, s2970 # 6031
+adds s1, s0, s2969 # 6032
+adds s0, s1, s2968 # 6033
+adds s1, s0, s2967 # 6034
+adds s0, s1, s2966 # 6035
+adds s1, s0, s2965 # 6036
+adds s0, s1, s2964 # 6037
+adds s1, s0, s2963 # 6038
+adds s0, s1, s2962 # 6039
+adds s1, s0, s2961 # 6040
+adds s0, s1, s2960 # 6041
+adds s1, s0, s2959 # 6042
+adds s0, s1, s2958 # 6043
+adds s1, s0, s2957 # 6044
+adds s0, s1, s2956 # 6045
+adds s1, s0, s2955 # 6046
+adds s0, s1, s2954 # 6047
+adds s1, s0, s2953 # 6048
+adds s0, s1, s2952 # 6049
+adds s1, s0, s2951 # 6050
+adds s0, s1, s2950 # 6051
+adds s1, s0, s2949 # 6052
+adds s0, s1, s2948 # 6053
+adds s1, s0, s2947 # 6054
+adds s0, s1, s2946 # 6055
+adds s1, s0, s2945 # 6056
+adds s0, s1, s2944 # 6057
+adds s1, s0, s2943 # 6058
+adds s0, s1, s2942 # 6059
+adds s1, s0, s2941 # 6060
+adds s0, s1, s2940 # 6061
+adds s1, s0, s2939 # 6062
+adds s0, s1, s2938 # 6063
+adds s1, s0, s2937 # 6064
+adds s0, s1, s2936 # 6065
+adds s1, s0, s2935 # 6066
+adds s0, s1, s2934 # 6067
+adds s1, s0, s2933 # 6068
+adds s0, s1, s2932 # 6069
+adds s1, s0, s2931 # 6070
+adds s0, s1, s2930 # 6071
+adds s1, s0, s2929 # 6072
+adds s0, s1, s2928 # 6073
+adds s1, s0, s2927 # 6074
+adds s0, s1, s2926 # 6075
+adds s1, s0, s2925 # 6076
+adds s0, s1, s2924 # 6077
+adds s1, s0, s2923 # 6078
+adds s0, s1, s2922 # 6079
+adds s1, s0, s2921 # 6080
+adds s0, s1, s2920 # 6081
+adds s1, s0, s2919 # 6082
+adds s0, s1, s2918 # 6083
+adds s1, s0, s2917 # 6084
+adds s0, s1, s2916 # 6085
+adds s1, s0, s2915 # 6086
+adds s0, s1, s2914 # 6087
+adds s1, s0, s2913 # 6088
+adds s0, s1, s2912 # 6089
+adds s1, s0, s2911 # 6090
+adds s0, s1, s2910 # 6091
+adds s1, s0, s2909 # 6092
+adds s0, s1, s2908 # 6093
+adds s1, s0, s2907 # 6094
+adds s0, s1, s2906 # 6095
+adds s1, s0, s2905 # 6096
+adds s0, s1, s2904 # 6097
+adds s1, s0, s2903 # 6098
+adds s0, s1, s2902 # 6099
+adds s1, s0, s2901 # 6100
+adds s0, s1, s2900 # 6101
+adds s1, s0, s2899 # 6102
+adds s0, s1, s2898 # 6103
+adds s1, s0, s2897 # 6104
+adds s0, s1, s2896 # 6105
+adds s1, s0, s2895 # 6106
+adds s0, s1, s2894 # 6107
+adds s1, s0, s2893 # 6108
+adds s0, s1, s2892 # 6109
+adds s1, s0, s2891 # 6110
+adds s0, s1, s2890 # 6111
+adds s1, s0, s2889 # 6112
+adds s0, s1, s2888 # 6113
+adds s1, s0, s2887 # 6114
+adds s0, s1, s2886 # 6115
+adds s1, s0, s2885 # 6116
+adds s0, s1, s2884 # 6117
+adds s1, s0, s2883 # 6118
+adds s0, s1, s2882 # 6119
+adds s1, s0, s2881 # 6120
+adds s0, s1, s2880 # 6121
+adds s1, s0, s2879 # 6122
+adds s0, s1, s2878 # 6123
+adds s1, s0, s2877 # 6124
+adds s0, s1, s2876 # 6125
+adds s1, s0, s2875 # 6126
+adds s0, s1, s2874 # 6127
+adds s1, s0, s2873 # 6128
+adds s0, s1, s2872 # 6129
+adds s1, s0, s2871 # 6130
+adds s0, s1, s2870 # 6131
+adds s1, s0, s2869 # 6132
+adds s0, s1, s2868 # 6133
+adds s1, s0, s2867 # 6134
+adds s0, s1, s2866 # 6135
+adds s1, s0, s2865 # 6136
+adds s0, s1, s2864 # 6137
+adds s1, s0, s2863 # 6138
+adds s0, s1, s2862 # 6139
+adds s1, s0, s2861 # 6140
+adds s0, s1, s2860 # 6141
+adds s1, s0, s2859 # 6142
+adds s0, s1, s2858 # 6143
+adds s1, s0, s2857 # 6144
+adds s0, s1, s2856 # 6145
+adds s1, s0, s2855 # 6146
+adds s0, s1, s2854 # 6147
+adds s1, s0, s2853 # 6148
+adds s0, s1, s2852 # 6149
+adds s1, s0, s2851 # 6150
+adds s0, s1, s2850 # 6151
+adds s1, s0, s2849 # 6152
+adds s0, s1, s2848 # 6153
+adds s1, s0, s2847 # 6154
+adds s0, s1, s2846 # 6155
+adds s1, s0, s2845 # 6156
+adds s0, s1, s2844 # 6157
+adds s1, s0, s2843 # 6158
+adds s0, s1, s2842 # 6159
+adds s1, s0, s2841 # 6160
+adds s0, s1, s2840 # 6161
+adds s1, s0, s2839 # 6162
+adds s0, s1, s2838 # 6163
+adds s1, s0, s2837 # 6164
+adds s0, s1, s2836 # 6165
+adds s1, s0, s2835 # 6166
+adds s0, s1, s2834 # 6167
+adds s1, s0, s2833 # 6168
+adds s0, s1, s2832 # 6169
+adds s1, s0, s2831 # 6170
+adds s0, s1, s2830 # 6171
+adds s1, s0, s2829 # 6172
+adds s0, s1, s2828 # 6173
+adds s1, s0, s2827 # 6174
+adds s0, s1, s2826 # 6175
+adds s1, s0, s2825 # 6176
+adds s0, s1, s2824 # 6177
+adds s1, s0, s2823 # 6178
+adds s0, s1, s2822 # 6179
+adds s1, s0, s2821 # 6180
+adds s0, s1, s2820 # 6181
+adds s1, s0, s2819 # 6182
+adds s0, s1, s2818 # 6183
+adds s1, s0, s2817 # 6184
+adds s0, s1, s2816 # 6185
+adds s1, s0, s2815 # 6186
+adds s0, s1, s2814 # 6187
+adds s1, s0, s2813 # 6188
+adds s0, s1, s2812 # 6189
+adds s1, s0, s2811 # 6190
+adds s0, s1, s2810 # 6191
+adds s1, s0, s2809 # 6192
+adds s0, s1, s2808 # 6193
+adds s1, s0, s2807 # 6194
+adds s0, s1, s2806 # 6195
+adds s1, s0, s2805 # 6196
+adds s0, s1, s2804 # 6197
+adds s1, s0, s2803 # 6198
+adds s0, s1, s2802 # 6199
+adds s1, s0, s2801 # 6200
+adds s0, s1, s2800 # 6201
+adds s1, s0, s2799 # 6202
+adds s0, s1, s2798 # 6203
+adds s1, s0, s2797 # 6204
+adds s0, s1, s2796 # 6205
+adds s1, s0, s2795 # 6206
+adds s0, s1, s2794 # 6207
+adds s1, s0, s2793 # 6208
+adds s0, s1, s2792 # 6209
+adds s1, s0, s2791 # 6210
+adds s0, s1, s2790 # 6211
+adds s1, s0, s2789 # 6212
+adds s0, s1, s2788 # 6213
+adds s1, s0, s2787 # 6214
+adds s0, s1, s2786 # 6215
+adds s1, s0, s2785 # 6216
+adds s0, s1, s2784 # 6217
+adds s1, s0, s2783 # 6218
+adds s0, s1, s2782 # 6219
+adds s1, s0, s2781 # 6220
+adds s0, s1, s2780 # 6221
+adds s1, s0, s2779 # 6222
+adds s0, s1, s2778 # 6223
+adds s1, s0, s2777 # 6224
+adds s0, s1, s2776 # 6225
+adds s1, s0, s2775 # 6226
+adds s0, s1, s2774 # 6227
+adds s1, s0, s2773 # 6228
+adds s0, s1, s2772 # 6229
+adds s1, s0, s2771 # 6230
+adds s0, s1, s2770 # 6231
+adds s1, s0, s2769 # 6232
+adds s0, s1, s2768 # 6233
+adds s1, s0, s2767 # 6234
+adds s0, s1, s2766 # 6235
+adds s1, s0, s2765 # 6236
+adds s0, s1, s2764 # 6237
+adds s1, s0, s2763 # 6238
+adds s0, s1, s2762 # 6239
+adds s1, s0, s2761 # 6240
+adds s0, s1, s2760 # 6241
+adds s1, s0, s2759 # 6242
+adds s0, s1, s2758 # 6243
+adds s1, s0, s2757 # 6244
+adds s0, s1, s2756 # 6245
+adds s1, s0, s2755 # 6246
+adds s0, s1, s2754 # 6247
+adds s1, s0, s2753 # 6248
+adds s0, s1, s2752 # 6249
+adds s1, s0, s2751 # 6250
+adds s0, s1, s2750 # 6251
+adds s1, s0, s2749 # 6252
+adds s0, s1, s2748 # 6253
+adds s1, s0, s2747 # 6254
+adds s0, s1, s2746 # 6255
+adds s1, s0, s2745 # 6256
+adds s0, s1, s2744 # 6257
+adds s1, s0, s2743 # 6258
+adds s0, s1, s2742 # 6259
+adds s1, s0, s2741 # 6260
+adds s0, s1, s2740 # 6261
+adds s1, s0, s2739 # 6262
+adds s0, s1, s2738 # 6263
+adds s1, s0, s2737 # 6264
+adds s0, s1, s2736 # 6265
+adds s1, s0, s2735 # 6266
+adds s0, s1, s2734 # 6267
+adds s1, s0, s2733 # 6268
+adds s0, s1, s2732 # 6269
+adds s1, s0, s2731 # 6270
+adds s0, s1, s2730 # 6271
+adds s1, s0, s2729 # 6272
+adds s0, s1, s2728 # 6273
+adds s1, s0, s2727 # 6274
+adds s0, s1, s2726 # 6275
+adds s1, s0, s2725 # 6276
+adds s0, s1, s2724 # 6277
+adds s1, s0, s2723 # 6278
+adds s0, s1, s2722 # 6279
+adds s1, s0, s2721 # 6280
+adds s0, s1, s2720 # 6281
+adds s1, s0, s2719 # 6282
+adds s0, s1, s2718 # 6283
+adds s1, s0, s2717 # 6284
+adds s0, s1, s2716 # 6285
+adds s1, s0, s2715 # 6286
+adds s0, s1, s2714 # 6287
+adds s1, s0, s2713 # 6288
+adds s0, s1, s2712 # 6289
+adds s1, s0, s2711 # 6290
+adds s0, s1, s2710 # 6291
+adds s1, s0, s2709 # 6292
+adds s0, s1, s2708 # 6293
+adds s1, s0, s2707 # 6294
+adds s0, s1, s2706 # 6295
+adds s1, s0, s2705 # 6296
+adds s0, s1, s2704 # 6297
+adds s1, s0, s2703 # 6298
+adds s0, s1, s2702 # 6299
+adds s1, s0, s2701 # 6300
+adds s0, s1, s2700 # 6301
+adds s1, s0, s2699 # 6302
+adds s0, s1, s2698 # 6303
+adds s1, s0, s2697 # 6304
+adds s0, s1, s2696 # 6305
+adds s1, s0, s2695 # 6306
+adds s0, s1, s2694 # 6307
+adds s1, s0, s2693 # 6308
+adds s0, s1, s2692 # 6309
+adds s1, s0, s2691 # 6310
+adds s0, s1, s2690 # 6311
+adds s1, s0, s2689 # 6312
+adds s0, s1, s2688 # 6313
+adds s1, s0, s2687 # 6314
+adds s0, s1, s2686 # 6315
+adds s1, s0, s2685 # 6316
+adds s0, s1, s2684 # 6317
+adds s1, s0, s2683 # 6318
+adds s0, s1, s2682 # 6319
+adds s1, s0, s2681 # 6320
+adds s0, s1, s2680 # 6321
+adds s1, s0, s2679 # 6322
+adds s0, s1, s2678 # 6323
+adds s1, s0, s2677 # 6324
+adds s0, s1, s2676 # 6325
+adds s1, s0, s2675 # 6326
+adds s0, s1, s2674 # 6327
+adds s1, s0, s2673 # 6328
+adds s0, s1, s2672 # 6329
+adds s1, s0, s2671 # 6330
+adds s0, s1, s2670 # 6331
+adds s1, s0, s2669 # 6332
+adds s0, s1, s2668 # 6333
+adds s1, s0, s2667 # 6334
+adds s0, s1, s2666 # 6335
+adds s1, s0, s2665 # 6336
+adds s0, s1, s2664 # 6337
+adds s1, s0, s2663 # 6338
+adds s0, s1, s2662 # 6339
+adds s1, s0, s2661 # 6340
+adds s0, s1, s2660 # 6341
+adds s1, s0, s2659 # 6342
+adds s0, s1, s2658 # 6343
+adds s1, s0, s2657 # 6344
+adds s0, s1, s2656 # 6345
+adds s1, s0, s2655 # 6346
+adds s0, s1, s2654 # 6347
+adds s1, s0, s2653 # 6348
+adds s0, s1, s2652 # 6349
+adds s1, s0, s2651 # 6350
+adds s0, s1, s2650 # 6351
+adds s1, s0, s2649 # 6352
+adds s0, s1, s2648 # 6353
+adds s1, s0, s2647 # 6354
+adds s0, s1, s2646 # 6355
+adds s1, s0, s2645 # 6356
+adds s0, s1, s2644 # 6357
+adds s1, s0, s2643 # 6358
+adds s0, s1, s2642 # 6359
+adds s1, s0, s2641 # 6360
+adds s0, s1, s2640 # 6361
+adds s1, s0, s2639 # 6362
+adds s0, s1, s2638 # 6363
+adds s1, s0, s2637 # 6364
+adds s0, s1, s2636 # 6365
+adds s1, s0, s2635 # 6366
+adds s0, s1, s2634 # 6367
+adds s1, s0, s2633 # 6368
+adds s0, s1, s2632 # 6369
+adds s1, s0, s2631 # 6370
+adds s0, s1, s2630 # 6371
+adds s1, s0, s2629 # 6372
+adds s0, s1, s2628 # 6373
+adds s1, s0, s2627 # 6374
+adds s0, s1, s2626 # 6375
+adds s1, s0, s2625 # 6376
+adds s0, s1, s2624 # 6377
+adds s1, s0, s2623 # 6378
+adds s0, s1, s2622 # 6379
+adds s1, s0, s2621 # 6380
+adds s0, s1, s2620 # 6381
+adds s1, s0, s2619 # 6382
+adds s0, s1, s2618 # 6383
+adds s1, s0, s2617 # 6384
+adds s0, s1, s2616 # 6385
+adds s1, s0, s2615 # 6386
+adds s0, s1, s2614 # 6387
+adds s1, s0, s2613 # 6388
+adds s0, s1, s2612 # 6389
+adds s1, s0, s2611 # 6390
+adds s0, s1, s2610 # 6391
+adds s1, s0, s2609 # 6392
+adds s0, s1, s2608 # 6393
+adds s1, s0, s2607 # 6394
+adds s0, s1, s2606 # 6395
+adds s1, s0, s2605 # 6396
+adds s0, s1, s2604 # 6397
+adds s1, s0, s2603 # 6398
+adds s0, s1, s2602 # 6399
+adds s1, s0, s2601 # 6400
+adds s0, s1, s2600 # 6401
+adds s1, s0, s2599 # 6402
+adds s0, s1, s2598 # 6403
+adds s1, s0, s2597 # 6404
+adds s0, s1, s2596 # 6405
+adds s1, s0, s2595 # 6406
+adds s0, s1, s2594 # 6407
+adds s1, s0, s2593 # 6408
+adds s0, s1, s2592 # 6409
+adds s1, s0, s2591 # 6410
+adds s0, s1, s2590 # 6411
+adds s1, s0, s2589 # 6412
+adds s0, s1, s2588 # 6413
+adds s1, s0, s2587 # 6414
+adds s0, s1, s2586 # 6415
+adds s1, s0, s2585 # 6416
+adds s0, s1, s2584 # 6417
+adds s1, s0, s2583 # 6418
+adds s0, s1, s2582 # 6419
+adds s1, s0, s2581 # 6420
+adds s0, s1, s2580 # 6421
+adds s1, s0, s2579 # 6422
+adds s0, s1, s2578 # 6423
+adds s1, s0, s2577 # 6424
+adds s0, s1, s2576 # 6425
+adds s1, s0, s2575 # 6426
+adds s0, s1, s2574 # 6427
+adds s1, s0, s2573 # 6428
+adds s0, s1, s2572 # 6429
+adds s1, s0, s2571 # 6430
+adds s0, s1, s2570 # 6431
+adds s1, s0, s2569 # 6432
+adds s0, s1, s2568 # 6433
+adds s1, s0, s2567 # 6434
+adds s0, s1, s2566 # 6435
+adds s1, s0, s2565 # 6436
+adds s0, s1, s2564 # 6437
+adds s1, s0, s2563 # 6438
+adds s0, s1, s2562 # 6439
+adds s1, s0, s2561 # 6440
+adds s0, s1, s2560 # 6441
+adds s1, s0, s2559 # 6442
+adds s0, s1, s2558 # 6443
+adds s1, s0, s2557 # 6444
+adds s0, s1, s2556 # 6445
+adds s1, s0, s2555 # 6446
+adds s0, s1, s2554 # 6447
+adds s1, s0, s2553 # 6448
+adds s0, s1, s2552 # 6449
+adds s1, s0, s2551 # 6450
+adds s0, s1, s2550 # 6451
+adds s1, s0, s2549 # 6452
+adds s0, s1, s2548 # 6453
+adds s1, s0, s2547 # 6454
+adds s0, s1, s2546 # 6455
+adds s1, s0, s2545 # 6456
+adds s0, s1, s2544 # 6457
+adds s1, s0, s2543 # 6458
+adds s0, s1, s2542 # 6459
+adds s1, s0, s2541 # 6460
+adds s0, s1, s2540 # 6461
+adds s1, s0, s2539 # 6462
+adds s0, s1, s2538 # 6463
+adds s1, s0, s2537 # 6464
+adds s0, s1, s2536 # 6465
+adds s1, s0, s2535 # 6466
+adds s0, s1, s2534 # 6467
+adds s1, s0, s2533 # 6468
+adds s0, s1, s2532 # 6469
+adds s1, s0, s2531 # 6470
+adds s0, s1, s2530 # 6471
+adds s1, s0, s2529 # 6472
+adds s0, s1, s2528 # 6473
+adds s1, s0, s2527 # 6474
+adds s0, s1, s2526 # 6475
+adds s1, s0, s2525 # 6476
+adds s0, s1, s2524 # 6477
+adds s1, s0, s2523 # 6478
+adds s0, s1, s2522 # 6479
+adds s1, s0, s2521 # 6480
+adds s0, s1, s2520 # 6481
+adds s1, s0, s2519 # 6482
+adds s0, s1, s2518 # 6483
+adds s1, s0, s2517 # 6484
+adds s0, s1, s2516 # 6485
+adds s1, s0, s2515 # 6486
+adds s0, s1, s2514 # 6487
+adds s1, s0, s2513 # 6488
+adds s0, s1, s2512 # 6489
+adds s1, s0, s2511 # 6490
+adds s0, s1, s2510 # 6491
+adds s1, s0, s2509 # 6492
+adds s0, s1, s2508 # 6493
+adds s1, s0, s2507 # 6494
+adds s0, s1, s2506 # 6495
+adds s1, s0, s2505 # 6496
+adds s0, s1, s2504 # 6497
+adds s1, s0, s2503 # 6498
+adds s0, s1, s2502 # 6499
+adds s1, s0, s2501 # 6500
+adds s0, s1, s2500 # 6501
+adds s1, s0, s2499 # 6502
+adds s0, s1, s2498 # 6503
+adds s1, s0, s2497 # 6504
+adds s0, s1, s2496 # 6505
+adds s1, s0, s2495 # 6506
+adds s0, s1, s2494 # 6507
+adds s1, s0, s2493 # 6508
+adds s0, s1, s2492 # 6509
+adds s1, s0, s2491 # 6510
+adds s0, s1, s2490 # 6511
+adds s1, s0, s2489 # 6512
+adds s0, s1, s2488 # 6513
+adds s1, s0, s2487 # 6514
+adds s0, s1, s2486 # 6515
+adds s1, s0, s2485 # 6516
+adds s0, s1, s2484 # 6517
+adds s1, s0, s2483 # 6518
+adds s0, s1, s2482 # 6519
+adds s1, s0, s2481 # 6520
+adds s0, s1, s2480 # 6521
+adds s1, s0, s2479 # 6522
+adds s0, s1, s2478 # 6523
+adds s1, s0, s2477 # 6524
+adds s0, s1, s2476 # 6525
+adds s1, s0, s2475 # 6526
+adds s0, s1, s2474 # 6527
+adds s1, s0, s2473 # 6528
+adds s0, s1, s2472 # 6529
+adds s1, s0, s2471 # 6530
+adds s0, s1, s2470 # 6531
+adds s1, s0, s2469 # 6532
+adds s0, s1, s2468 # 6533
+adds s1, s0, s2467 # 6534
+adds s0, s1, s2466 # 6535
+adds s1, s0, s2465 # 6536
+adds s0, s1, s2464 # 6537
+adds s1, s0, s2463 # 6538
+adds s0, s1, s2462 # 6539
+adds s1, s0, s2461 # 6540
+adds s0, s1, s2460 # 6541
+adds s1, s0, s2459 # 6542
+adds s0, s1, s2458 # 6543
+adds s1, s0, s2457 # 6544
+adds s0, s1, s2456 # 6545
+adds s1, s0, s2455 # 6546
+adds s0, s1, s2454 # 6547
+adds s1, s0, s2453 # 6548
+adds s0, s1, s2452 # 6549
+adds s1, s0, s2451 # 6550
+adds s0, s1, s2450 # 6551
+adds s1, s0, s2449 # 6552
+adds s0, s1, s2448 # 6553
+adds s1, s0, s2447 # 6554
+adds s0, s1, s2446 # 6555
+adds s1, s0, s2445 # 6556
+adds s0, s1, s2444 # 6557
+adds s1, s0, s2443 # 6558
+adds s0, s1, s2442 # 6559
+adds s1, s0, s2441 # 6560
+adds s0, s1, s2440 # 6561
+adds s1, s0, s2439 # 6562
+adds s0, s1, s2438 # 6563
+adds s1, s0, s2437 # 6564
+adds s0, s1, s2436 # 6565
+adds s1, s0, s2435 # 6566
+adds s0, s1, s2434 # 6567
+adds s1, s0, s2433 # 6568
+adds s0, s1, s2432 # 6569
+adds s1, s0, s2431 # 6570
+adds s0, s1, s2430 # 6571
+adds s1, s0, s2429 # 6572
+adds s0, s1, s2428 # 6573
+adds s1, s0, s2427 # 6574
+adds s0, s1, s2426 # 6575
+adds s1, s0, s2425 # 6576
+adds s0, s1, s2424 # 6577
+adds s1, s0, s2423 # 6578
+adds s0, s1, s2422 # 6579
+adds s1, s0, s2421 # 6580
+adds s0, s1, s2420 # 6581
+adds s1, s0, s2419 # 6582
+adds s0, s1, s2418 # 6583
+adds s1, s0, s2417 # 6584
+adds s0, s1, s2416 # 6585
+adds s1, s0, s2415 # 6586
+adds s0, s1, s2414 # 6587
+adds s1, s0, s2413 # 6588
+adds s0, s1, s2412 # 6589
+adds s1, s0, s2411 # 6590
+adds s0, s1, s2410 # 6591
+adds s1, s0, s2409 # 6592
+adds s0, s1, s2408 # 6593
+adds s1, s0, s2407 # 6594
+adds s0, s1, s2406 # 6595
+adds s1, s0, s2405 # 6596
+adds s0, s1, s2404 # 6597
+adds s1, s0, s2403 # 6598
+adds s0, s1, s2402 # 6599
+adds s1, s0, s2401 # 6600
+adds s0, s1, s2400 # 6601
+adds s1, s0, s2399 # 6602
+adds s0, s1, s2398 # 6603
+adds s1, s0, s2397 # 6604
+adds s0, s1, s2396 # 6605
+adds s1, s0, s2395 # 6606
+adds s0, s1, s2394 # 6607
+adds s1, s0, s2393 # 6608
+adds s0, s1, s2392 # 6609
+adds s1, s0, s2391 # 6610
+adds s0, s1, s2390 # 6611
+adds s1, s0, s2389 # 6612
+adds s0, s1, s2388 # 6613
+adds s1, s0, s2387 # 6614
+adds s0, s1, s2386 # 6615
+adds s1, s0, s2385 # 6616
+adds s0, s1, s2384 # 6617
+adds s1, s0, s2383 # 6618
+adds s0, s1, s2382 # 6619
+adds s1, s0, s2381 # 6620
+adds s0, s1, s2380 # 6621
+adds s1, s0, s2379 # 6622
+adds s0, s1, s2378 # 6623
+adds s1, s0, s2377 # 6624
+adds s0, s1, s2376 # 6625
+adds s1, s0, s2375 # 6626
+adds s0, s1, s2374 # 6627
+adds s1, s0, s2373 # 6628
+adds s0, s1, s2372 # 6629
+adds s1, s0, s2371 # 6630
+adds s0, s1, s2370 # 6631
+adds s1, s0, s2369 # 6632
+adds s0, s1, s2368 # 6633
+adds s1, s0, s2367 # 6634
+adds s0, s1, s2366 # 6635
+adds s1, s0, s2365 # 6636
+adds s0, s1, s2364 # 6637
+adds s1, s0, s2363 # 6638
+adds s0, s1, s2362 # 6639
+adds s1, s0, s2361 # 6640
+adds s0, s1, s2360 # 6641
+adds s1, s0, s2359 # 6642
+adds s0, s1, s2358 # 6643
+adds s1, s0, s2357 # 6644
+adds s0, s1, s2356 # 6645
+adds s1, s0, s2355 # 6646
+adds s0, s1, s2354 # 6647
+adds s1, s0, s2353 # 6648
+adds s0, s1, s2352 # 6649
+adds s1, s0, s2351 # 6650
+adds s0, s1, s2350 # 6651
+adds s1, s0, s2349 # 6652
+adds s0, s1, s2348 # 6653
+adds s1, s0, s2347 # 6654
+adds s0, s1, s2346 # 6655
+adds s1, s0, s2345 # 6656
+adds s0, s1, s2344 # 6657
+adds s1, s0, s2343 # 6658
+adds s0, s1, s2342 # 6659
+adds s1, s0, s2341 # 6660
+adds s0, s1, s2340 # 6661
+adds s1, s0, s2339 # 6662
+adds s0, s1, s2338 # 6663
+adds s1, s0, s2337 # 6664
+adds s0, s1, s2336 # 6665
+adds s1, s0, s2335 # 6666
+adds s0, s1, s2334 # 6667
+adds s1, s0, s2333 # 6668
+adds s0, s1, s2332 # 6669
+adds s1, s0, s2331 # 6670
+adds s0, s1, s2330 # 6671
+adds s1, s0, s2329 # 6672
+adds s0, s1, s2328 # 6673
+adds s1, s0, s2327 # 6674
+adds s0, s1, s2326 # 6675
+adds s1, s0, s2325 # 6676
+adds s0, s1, s2324 # 6677
+adds s1, s0, s2323 # 6678
+adds s0, s1, s2322 # 6679
+adds s1, s0, s2321 # 6680
+adds s0, s1, s2320 # 6681
+adds s1, s0, s2319 # 6682
+adds s0, s1, s2318 # 6683
+adds s1, s0, s2317 # 6684
+adds s0, s1, s2316 # 6685
+adds s1, s0, s2315 # 6686
+adds s0, s1, s2314 # 6687
+adds s1, s0, s2313 # 6688
+adds s0, s1, s2312 # 6689
+adds s1, s0, s2311 # 6690
+adds s0, s1, s2310 # 6691
+adds s1, s0, s2309 # 6692
+adds s0, s1, s2308 # 6693
+adds s1, s0, s2307 # 6694
+adds s0, s1, s2306 # 6695
+adds s1, s0, s2305 # 6696
+adds s0, s1, s2304 # 6697
+adds s1, s0, s2303 # 6698
+adds s0, s1, s2302 # 6699
+adds s1, s0, s2301 # 6700
+adds s0, s1, s2300 # 6701
+adds s1, s0, s2299 # 6702
+adds s0, s1, s2298 # 6703
+adds s1, s0, s2297 # 6704
+adds s0, s1, s2296 # 6705
+adds s1, s0, s2295 # 6706
+adds s0, s1, s2294 # 6707
+adds s1, s0, s2293 # 6708
+adds s0, s1, s2292 # 6709
+adds s1, s0, s2291 # 6710
+adds s0, s1, s2290 # 6711
+adds s1, s0, s2289 # 6712
+adds s0, s1, s2288 # 6713
+adds s1, s0, s2287 # 6714
+adds s0, s1, s2286 # 6715
+adds s1, s0, s2285 # 6716
+adds s0, s1, s2284 # 6717
+adds s1, s0, s2283 # 6718
+adds s0, s1, s2282 # 6719
+adds s1, s0, s2281 # 6720
+adds s0, s1, s2280 # 6721
+adds s1, s0, s2279 # 6722
+adds s0, s1, s2278 # 6723
+adds s1, s0, s2277 # 6724
+adds s0, s1, s2276 # 6725
+adds s1, s0, s2275 # 6726
+adds s0, s1, s2274 # 6727
+adds s1, s0, s2273 # 6728
+adds s0, s1, s2272 # 6729
+adds s1, s0, s2271 # 6730
+adds s0, s1, s2270 # 6731
+adds s1, s0, s2269 # 6732
+adds s0, s1, s2268 # 6733
+adds s1, s0, s2267 # 6734
+adds s0, s1, s2266 # 6735
+adds s1, s0, s2265 # 6736
+adds s0, s1, s2264 # 6737
+adds s1, s0, s2263 # 6738
+adds s0, s1, s2262 # 6739
+adds s1, s0, s2261 # 6740
+adds s0, s1, s2260 # 6741
+adds s1, s0, s2259 # 6742
+adds s0, s1, s2258 # 6743
+adds s1, s0, s2257 # 6744
+adds s0, s1, s2256 # 6745
+adds s1, s0, s2255 # 6746
+adds s0, s1, s2254 # 6747
+adds s1, s0, s2253 # 6748
+adds s0, s1, s2252 # 6749
+adds s1, s0, s2251 # 6750
+adds s0, s1, s2250 # 6751
+adds s1, s0, s2249 # 6752
+adds s0, s1, s2248 # 6753
+adds s1, s0, s2247 # 6754
+adds s0, s1, s2246 # 6755
+adds s1, s0, s2245 # 6756
+adds s0, s1, s2244 # 6757
+adds s1, s0, s2243 # 6758
+adds s0, s1, s2242 # 6759
+adds s1, s0, s2241 # 6760
+adds s0, s1, s2240 # 6761
+adds s1, s0, s2239 # 6762
+adds s0, s1, s2238 # 6763
+adds s1, s0, s2237 # 6764
+adds s0, s1, s2236 # 6765
+adds s1, s0, s2235 # 6766
+adds s0, s1, s2234 # 6767
+adds s1, s0, s2233 # 6768
+adds s0, s1, s2232 # 6769
+adds s1, s0, s2231 # 6770
+adds s0, s1, s2230 # 6771
+adds s1, s0, s2229 # 6772
+adds s0, s1, s2228 # 6773
+adds s1, s0, s2227 # 6774
+adds s0, s1, s2226 # 6775
+adds s1, s0, s2225 # 6776
+adds s0, s1, s2224 # 6777
+adds s1, s0, s2223 # 6778
+adds s0, s1, s2222 # 6779
+adds s1, s0, s2221 # 6780
+adds s0, s1, s2220 # 6781
+adds s1, s0, s2219 # 6782
+adds s0, s1, s2218 # 6783
+adds s1, s0, s2217 # 6784
+adds s0, s1, s2216 # 6785
+adds s1, s0, s2215 # 6786
+adds s0, s1, s2214 # 6787
+adds s1, s0, s2213 # 6788
+adds s0, s1, s2212 # 6789
+adds s1, s0, s2211 # 6790
+adds s0, s1, s2210 # 6791
+adds s1, s0, s2209 # 6792
+adds s0, s1, s2208 # 6793
+adds s1, s0, s2207 # 6794
+adds s0, s1, s2206 # 6795
+adds s1, s0, s2205 # 6796
+adds s0, s1, s2204 # 6797
+adds s1, s0, s2203 # 6798
+adds s0, s1, s2202 # 6799
+adds s1, s0, s2201 # 6800
+adds s0, s1, s2200 # 6801
+adds s1, s0, s2199 # 6802
+adds s0, s1, s2198 # 6803
+adds s1, s0, s2197 # 6804
+adds s0, s1, s2196 # 6805
+adds s1, s0, s2195 # 6806
+adds s0, s1, s2194 # 6807
+adds s1, s0, s2193 # 6808
+adds s0, s1, s2192 # 6809
+adds s1, s0, s2191 # 6810
+adds s0, s1, s2190 # 6811
+adds s1, s0, s2189 # 6812
+adds s0, s1, s2188 # 6813
+adds s1, s0, s2187 # 6814
+adds s0, s1, s2186 # 6815
+adds s1, s0, s2185 # 6816
+adds s0, s1, s2184 # 6817
+adds s1, s0, s2183 # 6818
+adds s0, s1, s2182 # 6819
+adds s1, s0, s2181 # 6820
+adds s0, s1, s2180 # 6821
+adds s1, s0, s2179 # 6822
+adds s0, s1, s2178 # 6823
+adds s1, s0, s2177 # 6824
+adds s0, s1, s2176 # 6825
+adds s1, s0, s2175 # 6826
+adds s0, s1, s2174 # 6827
+adds s1, s0, s2173 # 6828
+adds s0, s1, s2172 # 6829
+adds s1, s0, s2171 # 6830
+adds s0, s1, s2170 # 6831
+adds s1, s0, s2169 # 6832
+adds s0, s1, s2168 # 6833
+adds s1, s0, s2167 # 6834
+adds s0, s1, s2166 # 6835
+adds s1, s0, s2165 # 6836
+adds s0, s1, s2164 # 6837
+adds s1, s0, s2163 # 6838
+adds s0, s1, s2162 # 6839
+adds s1, s0, s2161 # 6840
+adds s0, s1, s2160 # 6841
+adds s1, s0, s2159 # 6842
+adds s0, s1, s2158 # 6843
+adds s1, s0, s2157 # 6844
+adds s0, s1, s2156 # 6845
+adds s1, s0, s2155 # 6846
+adds s0, s1, s2154 # 6847
+adds s1, s0, s2153 # 6848
+adds s0, s1, s2152 # 6849
+adds s1, s0, s2151 # 6850
+adds s0, s1, s2150 # 6851
+adds s1, s0, s2149 # 6852
+adds s0, s1, s2148 # 6853
+adds s1, s0, s2147 # 6854
+adds s0, s1, s2146 # 6855
+adds s1, s0, s2145 # 6856
+adds s0, s1, s2144 # 6857
+adds s1, s0, s2143 # 6858
+adds s0, s1, s2142 # 6859
+adds s1, s0, s2141 # 6860
+adds s0, s1, s2140 # 6861
+adds s1, s0, s2139 # 6862
+adds s0, s1, s2138 # 6863
+adds s1, s0, s2137 # 6864
+adds s0, s1, s2136 # 6865
+adds s1, s0, s2135 # 6866
+adds s0, s1, s2134 # 6867
+adds s1, s0, s2133 # 6868
+adds s0, s1, s2132 # 6869
+adds s1, s0, s2131 # 6870
+adds s0, s1, s2130 # 6871
+adds s1, s0, s2129 # 6872
+adds s0, s1, s2128 # 6873
+adds s1, s0, s2127 # 6874
+adds s0, s1, s2126 # 6875
+adds s1, s0, s2125 # 6876
+adds s0, s1, s2124 # 6877
+adds s1, s0, s2123 # 6878
+adds s0, s1, s2122 # 6879
+adds s1, s0, s2121 # 6880
+adds s0, s1, s2120 # 6881
+adds s1, s0, s2119 # 6882
+adds s0, s1, s2118 # 6883
+adds s1, s0, s2117 # 6884
+adds s0, s1, s2116 # 6885
+adds s1, s0, s2115 # 6886
+adds s0, s1, s2114 # 6887
+adds s1, s0, s2113 # 6888
+adds s0, s1, s2112 # 6889
+adds s1, s0, s2111 # 6890
+adds s0, s1, s2110 # 6891
+adds s1, s0, s2109 # 6892
+adds s0, s1, s2108 # 6893
+adds s1, s0, s2107 # 6894
+adds s0, s1, s2106 # 6895
+adds s1, s0, s2105 # 6896
+adds s0, s1, s2104 # 6897
+adds s1, s0, s2103 # 6898
+adds s0, s1, s2102 # 6899
+adds s1, s0, s2101 # 6900
+adds s0, s1, s2100 # 6901
+adds s1, s0, s2099 # 6902
+adds s0, s1, s2098 # 6903
+adds s1, s0, s2097 # 6904
+adds s0, s1, s2096 # 6905
+adds s1, s0, s2095 # 6906
+adds s0, s1, s2094 # 6907
+adds s1, s0, s2093 # 6908
+adds s0, s1, s2092 # 6909
+adds s1, s0, s2091 # 6910
+adds s0, s1, s2090 # 6911
+adds s1, s0, s2089 # 6912
+adds s0, s1, s2088 # 6913
+adds s1, s0, s2087 # 6914
+adds s0, s1, s2086 # 6915
+adds s1, s0, s2085 # 6916
+adds s0, s1, s2084 # 6917
+adds s1, s0, s2083 # 6918
+adds s0, s1, s2082 # 6919
+adds s1, s0, s2081 # 6920
+adds s0, s1, s2080 # 6921
+adds s1, s0, s2079 # 6922
+adds s0, s1, s2078 # 6923
+adds s1, s0, s2077 # 6924
+adds s0, s1, s2076 # 6925
+adds s1, s0, s2075 # 6926
+adds s0, s1, s2074 # 6927
+adds s1, s0, s2073 # 6928
+adds s0, s1, s2072 # 6929
+adds s1, s0, s2071 # 6930
+adds s0, s1, s2070 # 6931
+adds s1, s0, s2069 # 6932
+adds s0, s1, s2068 # 6933
+adds s1, s0, s2067 # 6934
+adds s0, s1, s2066 # 6935
+adds s1, s0, s2065 # 6936
+adds s0, s1, s2064 # 6937
+adds s1, s0, s2063 # 6938
+adds s0, s1, s2062 # 6939
+adds s1, s0, s2061 # 6940
+adds s0, s1, s2060 # 6941
+adds s1, s0, s2059 # 6942
+adds s0, s1, s2058 # 6943
+adds s1, s0, s2057 # 6944
+adds s0, s1, s2056 # 6945
+adds s1, s0, s2055 # 6946
+adds s0, s1, s2054 # 6947
+adds s1, s0, s2053 # 6948
+adds s0, s1, s2052 # 6949
+adds s1, s0, s2051 # 6950
+adds s0, s1, s2050 # 6951
+adds s1, s0, s2049 # 6952
+adds s0, s1, s2048 # 6953
+adds s1, s0, s2047 # 6954
+adds s0, s1, s2046 # 6955
+adds s1, s0, s2045 # 6956
+adds s0, s1, s2044 # 6957
+adds s1, s0, s2043 # 6958
+adds s0, s1, s2042 # 6959
+adds s1, s0, s2041 # 6960
+adds s0, s1, s2040 # 6961
+adds s1, s0, s2039 # 6962
+adds s0, s1, s2038 # 6963
+adds s1, s0, s2037 # 6964
+adds s0, s1, s2036 # 6965
+adds s1, s0, s2035 # 6966
+adds s0, s1, s2034 # 6967
+adds s1, s0, s2033 # 6968
+adds s0, s1, s2032 # 6969
+adds s1, s0, s2031 # 6970
+adds s0, s1, s2030 # 6971
+adds s1, s0, s2029 # 6972
+adds s0, s1, s2028 # 6973
+adds s1, s0, s2027 # 6974
+adds s0, s1, s2026 # 6975
+adds s1, s0, s2025 # 6976
+adds s0, s1, s2024 # 6977
+adds s1, s0, s2023 # 6978
+adds s0, s1, s2022 # 6979
+adds s1, s0, s2021 # 6980
+adds s0, s1, s2020 # 6981
+adds s1, s0, s2019 # 6982
+adds s0, s1, s2018 # 6983
+adds s1, s0, s2017 # 6984
+adds s0, s1, s2016 # 6985
+adds s1, s0, s2015 # 6986
+adds s0, s1, s2014 # 6987
+adds s1, s0, s2013 # 6988
+adds s0, s1, s2012 # 6989
+adds s1, s0, s2011 # 6990
+adds s0, s1, s2010 # 6991
+adds s1, s0, s2009 # 6992
+adds s0, s1, s2008 # 6993
+adds s1, s0, s2007 # 6994
+adds s0, s1, s2006 # 6995
+adds s1, s0, s2005 # 6996
+adds s0, s1, s2004 # 6997
+adds s1, s0, s2003 # 6998
+adds s0, s1, s2002 # 6999
+adds s1, s0, s2001 # 7000
+adds s0, s1, s2000 # 7001
+adds s1, s0, s1999 # 7002
+adds s0, s1, s1998 # 7003
+adds s1, s0, s1997 # 7004
+adds s0, s1, s1996 # 7005
+adds s1, s0, s1995 # 7006
+adds s0, s1, s1994 # 7007
+adds s1, s0, s1993 # 7008
+adds s0, s1, s1992 # 7009
+adds s1, s0, s1991 # 7010
+adds s0, s1, s1990 # 7011
+adds s1, s0, s1989 # 7012
+adds s0, s1, s1988 # 7013
+adds s1, s0, s1987 # 7014
+adds s0, s1, s1986 # 7015
+adds s1, s0, s1985 # 7016
+adds s0, s1, s1984 # 7017
+adds s1, s0, s1983 # 7018
+adds s0, s1, s1982 # 7019
+adds s1, s0, s1981 # 7020
+adds s0, s1, s1980 # 7021
+adds s1, s0, s1979 # 7022
+adds s0, s1, s1978 # 7023
+adds s1, s0, s1977 # 7024
+adds s0, s1, s1976 # 7025
+adds s1, s0, s1975 # 7026
+adds s0, s1, s1974 # 7027
+adds s1, s0, s1973 # 7028
+adds s0, s1, s1972 # 7029
+adds s1, s0, s1971 # 7030
+adds s0, s1, s1970 # 7031
+adds s1, s0, s1969 # 7032
+adds s0, s1, s1968 # 7033
+adds s1, s0, s1967 # 7034
+adds s0, s1, s1966 # 7035
+adds s1, s0, s1965 # 7036
+adds s0, s1, s1964 # 7037
+adds s1, s0, s1963 # 7038
+adds s0, s1, s1962 # 7039
+adds s1, s0, s1961 # 7040
+adds s0, s1, s1960 # 7041
+adds s1, s0, s1959 # 7042
+adds s0, s1, s1958 # 7043
+adds s1, s0, s1957 # 7044
+adds s0, s1, s1956 # 7045
+adds s1, s0, s1955 # 7046
+adds s0, s1, s1954 # 7047
+adds s1, s0, s1953 # 7048
+adds s0, s1, s1952 # 7049
+adds s1, s0, s1951 # 7050
+adds s0, s1, s1950 # 7051
+adds s1, s0, s1949 # 7052
+adds s0, s1, s1948 # 7053
+adds s1, s0, s1947 # 7054
+adds s0, s1, s1946 # 7055
+adds s1, s0, s1945 # 7056
+adds s0, s1, s1944 # 7057
+adds s1, s0, s1943 # 7058
+adds s0, s1, s1942 # 7059
+adds s1, s0, s1941 # 7060
+adds s0, s1, s1940 # 7061
+adds s1, s0, s1939 # 7062
+adds s0, s1, s1938 # 7063
+adds s1, s0, s1937 # 7064
+adds s0, s1, s1936 # 7065
+adds s1, s0, s1935 # 7066
+adds s0, s1, s1934 # 7067
+adds s1, s0, s1933 # 7068
+adds s0, s1, s1932 # 7069
+adds s1, s0, s1931 # 7070
+adds s0, s1, s1930 # 7071
+adds s1, s0, s1929 # 7072
+adds s0, s1, s1928 # 7073
+adds s1, s0, s1927 # 7074
+adds s0, s1, s1926 # 7075
+adds s1, s0, s1925 # 7076
+adds s0, s1, s1924 # 7077
+adds s1, s0, s1923 # 7078
+adds s0, s1, s1922 # 7079
+adds s1, s0, s1921 # 7080
+adds s0, s1, s1920 # 7081
+adds s1, s0, s1919 # 7082
+adds s0, s1, s1918 # 7083
+adds s1, s0, s1917 # 7084
+adds s0, s1, s1916 # 7085
+adds s1, s0, s1915 # 7086
+adds s0, s1, s1914 # 7087
+adds s1, s0, s1913 # 7088
+adds s0, s1, s1912 # 7089
+adds s1, s0, s1911 # 7090
+adds s0, s1, s1910 # 7091
+adds s1, s0, s1909 # 7092
+adds s0, s1, s1908 # 7093
+adds s1, s0, s1907 # 7094
+adds s0, s1, s1906 # 7095
+adds s1, s0, s1905 # 7096
+adds s0, s1, s1904 # 7097
+adds s1, s0, s1903 # 7098
+adds s0, s1, s1902 # 7099
+adds s1, s0, s1901 # 7100
+adds s0, s1, s1900 # 7101
+adds s1, s0, s1899 # 7102
+adds s0, s1, s1898 # 7103
+adds s1, s0, s1897 # 7104
+adds s0, s1, s1896 # 7105
+adds s1, s0, s1895 # 7106
+adds s0, s1, s1894 # 7107
+adds s1, s0, s1893 # 7108
+adds s0, s1, s1892 # 7109
+adds s1, s0, s1891 # 7110
+adds s0, s1, s1890 # 7111
+adds s1, s0, s1889 # 7112
+adds s0, s1, s1888 # 7113
+adds s1, s0, s1887 # 7114
+adds s0, s1, s1886 # 7115
+adds s1, s0, s1885 # 7116
+adds s0, s1, s1884 # 7117
+adds s1, s0, s1883 # 7118
+adds s0, s1, s1882 # 7119
+adds s1, s0, s1881 # 7120
+adds s0, s1, s1880 # 7121
+adds s1, s0, s1879 # 7122
+adds s0, s1, s1878 # 7123
+adds s1, s0, s1877 # 7124
+adds s0, s1, s1876 # 7125
+adds s1, s0, s1875 # 7126
+adds s0, s1, s1874 # 7127
+adds s1, s0, s1873 # 7128
+adds s0, s1, s1872 # 7129
+adds s1, s0, s1871 # 7130
+adds s0, s1, s1870 # 7131
+adds s1, s0, s1869 # 7132
+adds s0, s1, s1868 # 7133
+adds s1, s0, s1867 # 7134
+adds s0, s1, s1866 # 7135
+adds s1, s0, s1865 # 7136
+adds s0, s1, s1864 # 7137
+adds s1, s0, s1863 # 7138
+adds s0, s1, s1862 # 7139
+adds s1, s0, s1861 # 7140
+adds s0, s1, s1860 # 7141
+adds s1, s0, s1859 # 7142
+adds s0, s1, s1858 # 7143
+adds s1, s0, s1857 # 7144
+adds s0, s1, s1856 # 7145
+adds s1, s0, s1855 # 7146
+adds s0, s1, s1854 # 7147
+adds s1, s0, s1853 # 7148
+adds s0, s1, s1852 # 7149
+adds s1, s0, s1851 # 7150
+adds s0, s1, s1850 # 7151
+adds s1, s0, s1849 # 7152
+adds s0, s1, s1848 # 7153
+adds s1, s0, s1847 # 7154
+adds s0, s1, s1846 # 7155
+adds s1, s0, s1845 # 7156
+adds s0, s1, s1844 # 7157
+adds s1, s0, s1843 # 7158
+adds s0, s1, s1842 # 7159
+adds s1, s0, s1841 # 7160
+adds s0, s1, s1840 # 7161
+adds s1, s0, s1839 # 7162
+adds s0, s1, s1838 # 7163
+adds s1, s0, s1837 # 7164
+adds s0, s1, s1836 # 7165
+adds s1, s0, s1835 # 7166
+adds s0, s1, s1834 # 7167
+adds s1, s0, s1833 # 7168
+adds s0, s1, s1832 # 7169
+adds s1, s0, s1831 # 7170
+adds s0, s1, s1830 # 7171
+adds s1, s0, s1829 # 7172
+adds s0, s1, s1828 # 7173
+adds s1, s0, s1827 # 7174
+adds s0, s1, s1826 # 7175
+adds s1, s0, s1825 # 7176
+adds s0, s1, s1824 # 7177
+adds s1, s0, s1823 # 7178
+adds s0, s1, s1822 # 7179
+adds s1, s0, s1821 # 7180
+adds s0, s1, s1820 # 7181
+adds s1, s0, s1819 # 7182
+adds s0, s1, s1818 # 7183
+adds s1, s0, s1817 # 7184
+adds s0, s1, s1816 # 7185
+adds s1, s0, s1815 # 7186
+adds s0, s1, s1814 # 7187
+adds s1, s0, s1813 # 7188
+adds s0, s1, s1812 # 7189
+adds s1, s0, s1811 # 7190
+adds s0, s1, s1810 # 7191
+adds s1, s0, s1809 # 7192
+adds s0, s1, s1808 # 7193
+adds s1, s0, s1807 # 7194
+adds s0, s1, s1806 # 7195
+adds s1, s0, s1805 # 7196
+adds s0, s1, s1804 # 7197
+adds s1, s0, s1803 # 7198
+adds s0, s1, s1802 # 7199
+adds s1, s0, s1801 # 7200
+adds s0, s1, s1800 # 7201
+adds s1, s0, s1799 # 7202
+adds s0, s1, s1798 # 7203
+adds s1, s0, s1797 # 7204
+adds s0, s1, s1796 # 7205
+adds s1, s0, s1795 # 7206
+adds s0, s1, s1794 # 7207
+adds s1, s0, s1793 # 7208
+adds s0, s1, s1792 # 7209
+adds s1, s0, s1791 # 7210
+adds s0, s1, s1790 # 7211
+adds s1, s0, s1789 # 7212
+adds s0, s1, s1788 # 7213
+adds s1, s0, s1787 # 7214
+adds s0, s1, s1786 # 7215
+adds s1, s0, s1785 # 7216
+adds s0, s1, s1784 # 7217
+adds s1, s0, s1783 # 7218
+adds s0, s1, s1782 # 7219
+adds s1, s0, s1781 # 7220
+adds s0, s1, s1780 # 7221
+adds s1, s0, s1779 # 7222
+adds s0, s1, s1778 # 7223
+adds s1, s0, s1777 # 7224
+adds s0, s1, s1776 # 7225
+adds s1, s0, s1775 # 7226
+adds s0, s1, s1774 # 7227
+adds s1, s0, s1773 # 7228
+adds s0, s1, s1772 # 7229
+adds s1, s0, s1771 # 7230
+adds s0, s1, s1770 # 7231
+adds s1, s0, s1769 # 7232
+adds s0, s1, s1768 # 7233
+adds s1, s0, s1767 # 7234
+adds s0, s1, s1766 # 7235
+adds s1, s0, s1765 # 7236
+adds s0, s1, s1764 # 7237
+adds s1, s0, s1763 # 7238
+adds s0, s1, s1762 # 7239
+adds s1, s0, s1761 # 7240
+adds s0, s1, s1760 # 7241
+adds s1, s0, s1759 # 7242
+adds s0, s1, s1758 # 7243
+adds s1, s0, s1757 # 7244
+adds s0, s1, s1756 # 7245
+adds s1, s0, s1755 # 7246
+adds s0, s1, s1754 # 7247
+adds s1, s0, s1753 # 7248
+adds s0, s1, s1752 # 7249
+adds s1, s0, s1751 # 7250
+adds s0, s1, s1750 # 7251
+adds s1, s0, s1749 # 7252
+adds s0, s1, s1748 # 7253
+adds s1, s0, s1747 # 7254
+adds s0, s1, s1746 # 7255
+adds s1, s0, s1745 # 7256
+adds s0, s1, s1744 # 7257
+adds s1, s0, s1743 # 7258
+adds s0, s1, s1742 # 7259
+adds s1, s0, s1741 # 7260
+adds s0, s1, s1740 # 7261
+adds s1, s0, s1739 # 7262
+adds s0, s1, s1738 # 7263
+adds s1, s0, s1737 # 7264
+adds s0, s1, s1736 # 7265
+adds s1, s0, s1735 # 7266
+adds s0, s1, s1734 # 7267
+adds s1, s0, s1733 # 7268
+adds s0, s1, s1732 # 7269
+adds s1, s0, s1731 # 7270
+adds s0, s1, s1730 # 7271
+adds s1, s0, s1729 # 7272
+adds s0, s1, s1728 # 7273
+adds s1, s0, s1727 # 7274
+adds s0, s1, s1726 # 7275
+adds s1, s0, s1725 # 7276
+adds s0, s1, s1724 # 7277
+adds s1, s0, s1723 # 7278
+adds s0, s1, s1722 # 7279
+adds s1, s0, s1721 # 7280
+adds s0, s1, s1720 # 7281
+adds s1, s0, s1719 # 7282
+adds s0, s1, s1718 # 7283
+adds s1, s0, s1717 # 7284
+adds s0, s1, s1716 # 7285
+adds s1, s0, s1715 # 7286
+adds s0, s1, s1714 # 7287
+adds s1, s0, s1713 # 7288
+adds s0, s1, s1712 # 7289
+adds s1, s0, s1711 # 7290
+adds s0, s1, s1710 # 7291
+adds s1, s0, s1709 # 7292
+adds s0, s1, s1708 # 7293
+adds s1, s0, s1707 # 7294
+adds s0, s1, s1706 # 7295
+adds s1, s0, s1705 # 7296
+adds s0, s1, s1704 # 7297
+adds s1, s0, s1703 # 7298
+adds s0, s1, s1702 # 7299
+adds s1, s0, s1701 # 7300
+adds s0, s1, s1700 # 7301
+adds s1, s0, s1699 # 7302
+adds s0, s1, s1698 # 7303
+adds s1, s0, s1697 # 7304
+adds s0, s1, s1696 # 7305
+adds s1, s0, s1695 # 7306
+adds s0, s1, s1694 # 7307
+adds s1, s0, s1693 # 7308
+adds s0, s1, s1692 # 7309
+adds s1, s0, s1691 # 7310
+adds s0, s1, s1690 # 7311
+adds s1, s0, s1689 # 7312
+adds s0, s1, s1688 # 7313
+adds s1, s0, s1687 # 7314
+adds s0, s1, s1686 # 7315
+adds s1, s0, s1685 # 7316
+adds s0, s1, s1684 # 7317
+adds s1, s0, s1683 # 7318
+adds s0, s1, s1682 # 7319
+adds s1, s0, s1681 # 7320
+adds s0, s1, s1680 # 7321
+adds s1, s0, s1679 # 7322
+adds s0, s1, s1678 # 7323
+adds s1, s0, s1677 # 7324
+adds s0, s1, s1676 # 7325
+adds s1, s0, s1675 # 7326
+adds s0, s1, s1674 # 7327
+adds s1, s0, s1673 # 7328
+adds s0, s1, s1672 # 7329
+adds s1, s0, s1671 # 7330
+adds s0, s1, s1670 # 7331
+adds s1, s0, s1669 # 7332
+adds s0, s1, s1668 # 7333
+adds s1, s0, s1667 # 7334
+adds s0, s1, s1666 # 7335
+adds s1, s0, s1665 # 7336
+adds s0, s1, s1664 # 7337
+adds s1, s0, s1663 # 7338
+adds s0, s1, s1662 # 7339
+adds s1, s0, s1661 # 7340
+adds s0, s1, s1660 # 7341
+adds s1, s0, s1659 # 7342
+adds s0, s1, s1658 # 7343
+adds s1, s0, s1657 # 7344
+adds s0, s1, s1656 # 7345
+adds s1, s0, s1655 # 7346
+adds s0, s1, s1654 # 7347
+adds s1, s0, s1653 # 7348
+adds s0, s1, s1652 # 7349
+adds s1, s0, s1651 # 7350
+adds s0, s1, s1650 # 7351
+adds s1, s0, s1649 # 7352
+adds s0, s1, s1648 # 7353
+adds s1, s0, s1647 # 7354
+adds s0, s1, s1646 # 7355
+adds s1, s0, s1645 # 7356
+adds s0, s1, s1644 # 7357
+adds s1, s0, s1643 # 7358
+adds s0, s1, s1642 # 7359
+adds s1, s0, s1641 # 7360
+adds s0, s1, s1640 # 7361
+adds s1, s0, s1639 # 7362
+adds s0, s1, s1638 # 7363
+adds s1, s0, s1637 # 7364
+adds s0, s1, s1636 # 7365
+adds s1, s0, s1635 # 7366
+adds s0, s1, s1634 # 7367
+adds s1, s0, s1633 # 7368
+adds s0, s1, s1632 # 7369
+adds s1, s0, s1631 # 7370
+adds s0, s1, s1630 # 7371
+adds s1, s0, s1629 # 7372
+adds s0, s1, s1628 # 7373
+adds s1, s0, s1627 # 7374
+adds s0, s1, s1626 # 7375
+adds s1, s0, s1625 # 7376
+adds s0, s1, s1624 # 7377
+adds s1, s0, s1623 # 7378
+adds s0, s1, s1622 # 7379
+adds s1, s0, s1621 # 7380
+adds s0, s1, s1620 # 7381
+adds s1, s0, s1619 # 7382
+adds s0, s1, s1618 # 7383
+adds s1, s0, s1617 # 7384
+adds s0, s1, s1616 # 7385
+adds s1, s0, s1615 # 7386
+adds s0, s1, s1614 # 7387
+adds s1, s0, s1613 # 7388
+adds s0, s1, s1612 # 7389
+adds s1, s0, s1611 # 7390
+adds s0, s1, s1610 # 7391
+adds s1, s0, s1609 # 7392
+adds s0, s1, s1608 # 7393
+adds s1, s0, s1607 # 7394
+adds s0, s1, s1606 # 7395
+adds s1, s0, s1605 # 7396
+adds s0, s1, s1604 # 7397
+adds s1, s0, s1603 # 7398
+adds s0, s1, s1602 # 7399
+adds s1, s0, s1601 # 7400
+adds s0, s1, s1600 # 7401
+adds s1, s0, s1599 # 7402
+adds s0, s1, s1598 # 7403
+adds s1, s0, s1597 # 7404
+adds s0, s1, s1596 # 7405
+adds s1, s0, s1595 # 7406
+adds s0, s1, s1594 # 7407
+adds s1, s0, s1593 # 7408
+adds s0, s1, s1592 # 7409
+adds s1, s0, s1591 # 7410
+adds s0, s1, s1590 # 7411
+adds s1, s0, s1589 # 7412
+adds s0, s1, s1588 # 7413
+adds s1, s0, s1587 # 7414
+adds s0, s1, s1586 # 7415
+adds s1, s0, s1585 # 7416
+adds s0, s1, s1584 # 7417
+adds s1, s0, s1583 # 7418
+adds s0, s1, s1582 # 7419
+adds s1, s0, s1581 # 7420
+adds s0, s1, s1580 # 7421
+adds s1, s0, s1579 # 7422
+adds s0, s1, s1578 # 7423
+adds s1, s0, s1577 # 7424
+adds s0, s1, s1576 # 7425
+adds s1, s0, s1575 # 7426
+adds s0, s1, s1574 # 7427
+adds s1, s0, s1573 # 7428
+adds s0, s1, s1572 # 7429
+adds s1, s0, s1571 # 7430
+adds s0, s1, s1570 # 7431
+adds s1, s0, s1569 # 7432
+adds s0, s1, s1568 # 7433
+adds s1, s0, s1567 # 7434
+adds s0, s1, s1566 # 7435
+adds s1, s0, s1565 # 7436
+adds s0, s1, s1564 # 7437
+adds s1, s0, s1563 # 7438
+adds s0, s1, s1562 # 7439
+adds s1, s0, s1561 # 7440
+adds s0, s1, s1560 # 7441
+adds s1, s0, s1559 # 7442
+adds s0, s1, s1558 # 7443
+adds s1, s0, s1557 # 7444
+adds s0, s1, s1556 # 7445
+adds s1, s0, s1555 # 7446
+adds s0, s1, s1554 # 7447
+adds s1, s0, s1553 # 7448
+adds s0, s1, s1552 # 7449
+adds s1, s0, s1551 # 7450
+adds s0, s1, s1550 # 7451
+adds s1, s0, s1549 # 7452
+adds s0, s1, s1548 # 7453
+adds s1, s0, s1547 # 7454
+adds s0, s1, s1546 # 7455
+adds s1, s0, s1545 # 7456
+adds s0, s1, s1544 # 7457
+adds s1, s0, s1543 # 7458
+adds s0, s1, s1542 # 7459
+adds s1, s0, s1541 # 7460
+adds s0, s1, s1540 # 7461
+adds s1, s0, s1539 # 7462
+adds s0, s1, s1538 # 7463
+adds s1, s0, s1537 # 7464
+adds s0, s1, s1536 # 7465
+adds s1, s0, s1535 # 7466
+adds s0, s1, s1534 # 7467
+adds s1, s0, s1533 # 7468
+adds s0, s1, s1532 # 7469
+adds s1, s0, s1531 # 7470
+adds s0, s1, s1530 # 7471
+adds s1, s0, s1529 # 7472
+adds s0, s1, s1528 # 7473
+adds s1, s0, s1527 # 7474
+adds s0, s1, s1526 # 7475
+adds s1, s0, s1525 # 7476
+adds s0, s1, s1524 # 7477
+adds s1, s0, s1523 # 7478
+adds s0, s1, s1522 # 7479
+adds s1, s0, s1521 # 7480
+adds s0, s1, s1520 # 7481
+adds s1, s0, s1519 # 7482
+adds s0, s1, s1518 # 7483
+adds s1, s0, s1517 # 7484
+adds s0, s1, s1516 # 7485
+adds s1, s0, s1515 # 7486
+adds s0, s1, s1514 # 7487
+adds s1, s0, s1513 # 7488
+adds s0, s1, s1512 # 7489
+adds s1, s0, s1511 # 7490
+adds s0, s1, s1510 # 7491
+adds s1, s0, s1509 # 7492
+adds s0, s1, s1508 # 7493
+adds s1, s0, s1507 # 7494
+adds s0, s1, s1506 # 7495
+adds s1, s0, s1505 # 7496
+adds s0, s1, s1504 # 7497
+adds s1, s0, s1503 # 7498
+adds s0, s1, s1502 # 7499
+adds s1, s0, s1501 # 7500
+adds s0, s1, s1500 # 7501
+adds s1, s0, s1499 # 7502
+adds s0, s1, s1498 # 7503
+adds s1, s0, s1497 # 7504
+adds s0, s1, s1496 # 7505
+adds s1, s0, s1495 # 7506
+adds s0, s1, s1494 # 7507
+adds s1, s0, s1493 # 7508
+adds s0, s1, s1492 # 7509
+adds s1, s0, s1491 # 7510
+adds s0, s1, s1490 # 7511
+adds s1, s0, s1489 # 7512
+adds s0, s1, s1488 # 7513
+adds s1, s0, s1487 # 7514
+adds s0, s1, s1486 # 7515
+adds s1, s0, s1485 # 7516
+adds s0, s1, s1484 # 7517
+adds s1, s0, s1483 # 7518
+adds s0, s1, s1482 # 7519
+adds s1, s0, s1481 # 7520
+adds s0, s1, s1480 # 7521
+adds s1, s0, s1479 # 7522
+adds s0, s1, s1478 # 7523
+adds s1, s0, s1477 # 7524
+adds s0, s1, s1476 # 7525
+adds s1, s0, s1475 # 7526
+adds s0, s1, s1474 # 7527
+adds s1, s0, s1473 # 7528
+adds s0, s1, s1472 # 7529
+adds s1, s0, s1471 # 7530
+adds s0, s1, s1470 # 7531
+adds s1, s0, s1469 # 7532
+adds s0, s1, s1468 # 7533
+adds s1, s0, s1467 # 7534
+adds s0, s1, s1466 # 7535
+adds s1, s0, s1465 # 7536
+adds s0, s1, s1464 # 7537
+adds s1, s0, s1463 # 7538
+adds s0, s1, s1462 # 7539
+adds s1, s0, s1461 # 7540
+adds s0, s1, s1460 # 7541
+adds s1, s0, s1459 # 7542
+adds s0, s1, s1458 # 7543
+adds s1, s0, s1457 # 7544
+adds s0, s1, s1456 # 7545
+adds s1, s0, s1455 # 7546
+adds s0, s1, s1454 # 7547
+adds s1, s0, s1453 # 7548
+adds s0, s1, s1452 # 7549
+adds s1, s0, s1451 # 7550
+adds s0, s1, s1450 # 7551
+adds s1, s0, s1449 # 7552
+adds s0, s1, s1448 # 7553
+adds s1, s0, s1447 # 7554
+adds s0, s1, s1446 # 7555
+adds s1, s0, s1445 # 7556
+adds s0, s1, s1444 # 7557
+adds s1, s0, s1443 # 7558
+adds s0, s1, s1442 # 7559
+adds s1, s0, s1441 # 7560
+adds s0, s1, s1440 # 7561
+adds s1, s0, s1439 # 7562
+adds s0, s1, s1438 # 7563
+adds s1, s0, s1437 # 7564
+adds s0, s1, s1436 # 7565
+adds s1, s0, s1435 # 7566
+adds s0, s1, s1434 # 7567
+adds s1, s0, s1433 # 7568
+adds s0, s1, s1432 # 7569
+adds s1, s0, s1431 # 7570
+adds s0, s1, s1430 # 7571
+adds s1, s0, s1429 # 7572
+adds s0, s1, s1428 # 7573
+adds s1, s0, s1427 # 7574
+adds s0, s1, s1426 # 7575
+adds s1, s0, s1425 # 7576
+adds s0, s1, s1424 # 7577
+adds s1, s0, s1423 # 7578
+adds s0, s1, s1422 # 7579
+adds s1, s0, s1421 # 7580
+adds s0, s1, s1420 # 7581
+adds s1, s0, s1419 # 7582
+adds s0, s1, s1418 # 7583
+adds s1, s0, s1417 # 7584
+adds s0, s1, s1416 # 7585
+adds s1, s0, s1415 # 7586
+adds s0, s1, s1414 # 7587
+adds s1, s0, s1413 # 7588
+adds s0, s1, s1412 # 7589
+adds s1, s0, s1411 # 7590
+adds s0, s1, s1410 # 7591
+adds s1, s0, s1409 # 7592
+adds s0, s1, s1408 # 7593
+adds s1, s0, s1407 # 7594
+adds s0, s1, s1406 # 7595
+adds s1, s0, s1405 # 7596
+adds s0, s1, s1404 # 7597
+adds s1, s0, s1403 # 7598
+adds s0, s1, s1402 # 7599
+adds s1, s0, s1401 # 7600
+adds s0, s1, s1400 # 7601
+adds s1, s0, s1399 # 7602
+adds s0, s1, s1398 # 7603
+adds s1, s0, s1397 # 7604
+adds s0, s1, s1396 # 7605
+adds s1, s0, s1395 # 7606
+adds s0, s1, s1394 # 7607
+adds s1, s0, s1393 # 7608
+adds s0, s1, s1392 # 7609
+adds s1, s0, s1391 # 7610
+adds s0, s1, s1390 # 7611
+adds s1, s0, s1389 # 7612
+adds s0, s1, s1388 # 7613
+adds s1, s0, s1387 # 7614
+adds s0, s1, s1386 # 7615
+adds s1, s0, s1385 # 7616
+adds s0, s1, s1384 # 7617
+adds s1, s0, s1383 # 7618
+adds s0, s1, s1382 # 7619
+adds s1, s0, s1381 # 7620
+adds s0, s1, s1380 # 7621
+adds s1, s0, s1379 # 7622
+adds s0, s1, s1378 # 7623
+adds s1, s0, s1377 # 7624
+adds s0, s1, s1376 # 7625
+adds s1, s0, s1375 # 7626
+adds s0, s1, s1374 # 7627
+adds s1, s0, s1373 # 7628
+adds s0, s1, s1372 # 7629
+adds s1, s0, s1371 # 7630
+adds s0, s1, s1370 # 7631
+adds s1, s0, s1369 # 7632
+adds s0, s1, s1368 # 7633
+adds s1, s0, s1367 # 7634
+adds s0, s1, s1366 # 7635
+adds s1, s0, s1365 # 7636
+adds s0, s1, s1364 # 7637
+adds s1, s0, s1363 # 7638
+adds s0, s1, s1362 # 7639
+adds s1, s0, s1361 # 7640
+adds s0, s1, s1360 # 7641
+adds s1, s0, s1359 # 7642
+adds s0, s1, s1358 # 7643
+adds s1, s0, s1357 # 7644
+adds s0, s1, s1356 # 7645
+adds s1, s0, s1355 # 7646
+adds s0, s1, s1354 # 7647
+adds s1, s0, s1353 # 7648
+adds s0, s1, s1352 # 7649
+adds s1, s0, s1351 # 7650
+adds s0, s1, s1350 # 7651
+adds s1, s0, s1349 # 7652
+adds s0, s1, s1348 # 7653
+adds s1, s0, s1347 # 7654
+adds s0, s1, s1346 # 7655
+adds s1, s0, s1345 # 7656
+adds s0, s1, s1344 # 7657
+adds s1, s0, s1343 # 7658
+adds s0, s1, s1342 # 7659
+adds s1, s0, s1341 # 7660
+adds s0, s1, s1340 # 7661
+adds s1, s0, s1339 # 7662
+adds s0, s1, s1338 # 7663
+adds s1, s0, s1337 # 7664
+adds s0, s1, s1336 # 7665
+adds s1, s0, s1335 # 7666
+adds s0, s1, s1334 # 7667
+adds s1, s0, s1333 # 7668
+adds s0, s1, s1332 # 7669
+adds s1, s0, s1331 # 7670
+adds s0, s1, s1330 # 7671
+adds s1, s0, s1329 # 7672
+adds s0, s1, s1328 # 7673
+adds s1, s0, s1327 # 7674
+adds s0, s1, s1326 # 7675
+adds s1, s0, s1325 # 7676
+adds s0, s1, s1324 # 7677
+adds s1, s0, s1323 # 7678
+adds s0, s1, s1322 # 7679
+adds s1, s0, s1321 # 7680
+adds s0, s1, s1320 # 7681
+adds s1, s0, s1319 # 7682
+adds s0, s1, s1318 # 7683
+adds s1, s0, s1317 # 7684
+adds s0, s1, s1316 # 7685
+adds s1, s0, s1315 # 7686
+adds s0, s1, s1314 # 7687
+adds s1, s0, s1313 # 7688
+adds s0, s1, s1312 # 7689
+adds s1, s0, s1311 # 7690
+adds s0, s1, s1310 # 7691
+adds s1, s0, s1309 # 7692
+adds s0, s1, s1308 # 7693
+adds s1, s0, s1307 # 7694
+adds s0, s1, s1306 # 7695
+adds s1, s0, s1305 # 7696
+adds s0, s1, s1304 # 7697
+adds s1, s0, s1303 # 7698
+adds s0, s1, s1302 # 7699
+adds s1, s0, s1301 # 7700
+adds s0, s1, s1300 # 7701
+adds s1, s0, s1299 # 7702
+adds s0, s1, s1298 # 7703
+adds s1, s0, s1297 # 7704
+adds s0, s1, s1296 # 7705
+adds s1, s0, s1295 # 7706
+adds s0, s1, s1294 # 7707
+adds s1, s0, s1293 # 7708
+adds s0, s1, s1292 # 7709
+adds s1, s0, s1291 # 7710
+adds s0, s1, s1290 # 7711
+adds s1, s0, s1289 # 7712
+adds s0, s1, s1288 # 7713
+adds s1, s0, s1287 # 7714
+adds s0, s1, s1286 # 7715
+adds s1, s0, s1285 # 7716
+adds s0, s1, s1284 # 7717
+adds s1, s0, s1283 # 7718
+adds s0, s1, s1282 # 7719
+adds s1, s0, s1281 # 7720
+adds s0, s1, s1280 # 7721
+adds s1, s0, s1279 # 7722
+adds s0, s1, s1278 # 7723
+adds s1, s0, s1277 # 7724
+adds s0, s1, s1276 # 7725
+adds s1, s0, s1275 # 7726
+adds s0, s1, s1274 # 7727
+adds s1, s0, s1273 # 7728
+adds s0, s1, s1272 # 7729
+adds s1, s0, s1271 # 7730
+adds s0, s1, s1270 # 7731
+adds s1, s0, s1269 # 7732
+adds s0, s1, s1268 # 7733
+adds s1, s0, s1267 # 7734
+adds s0, s1, s1266 # 7735
+adds s1, s0, s1265 # 7736
+adds s0, s1, s1264 # 7737
+adds s1, s0, s1263 # 7738
+adds s0, s1, s1262 # 7739
+adds s1, s0, s1261 # 7740
+adds s0, s1, s1260 # 7741
+adds s1, s0, s1259 # 7742
+adds s0, s1, s1258 # 7743
+adds s1, s0, s1257 # 7744
+adds s0, s1, s1256 # 7745
+adds s1, s0, s1255 # 7746
+adds s0, s1, s1254 # 7747
+adds s1, s0, s1253 # 7748
+adds s0, s1, s1252 # 7749
+adds s1, s0, s1251 # 7750
+adds s0, s1, s1250 # 7751
+adds s1, s0, s1249 # 7752
+adds s0, s1, s1248 # 7753
+adds s1, s0, s1247 # 7754
+adds s0, s1, s1246 # 7755
+adds s1, s0, s1245 # 7756
+adds s0, s1, s1244 # 7757
+adds s1, s0, s1243 # 7758
+adds s0, s1, s1242 # 7759
+adds s1, s0, s1241 # 7760
+adds s0, s1, s1240 # 7761
+adds s1, s0, s1239 # 7762
+adds s0, s1, s1238 # 7763
+adds s1, s0, s1237 # 7764
+adds s0, s1, s1236 # 7765
+adds s1, s0, s1235 # 7766
+adds s0, s1, s1234 # 7767
+adds s1, s0, s1233 # 7768
+adds s0, s1, s1232 # 7769
+adds s1, s0, s1231 # 7770
+adds s0, s1, s1230 # 7771
+adds s1, s0, s1229 # 7772
+adds s0, s1, s1228 # 7773
+adds s1, s0, s1227 # 7774
+adds s0, s1, s1226 # 7775
+adds s1, s0, s1225 # 7776
+adds s0, s1, s1224 # 7777
+adds s1, s0, s1223 # 7778
+adds s0, s1, s1222 # 7779
+adds s1, s0, s1221 # 7780
+adds s0, s1, s1220 # 7781
+adds s1, s0, s1219 # 7782
+adds s0, s1, s1218 # 7783
+adds s1, s0, s1217 # 7784
+adds s0, s1, s1216 # 7785
+adds s1, s0, s1215 # 7786
+adds s0, s1, s1214 # 7787
+adds s1, s0, s1213 # 7788
+adds s0, s1, s1212 # 7789
+adds s1, s0, s1211 # 7790
+adds s0, s1, s1210 # 7791
+adds s1, s0, s1209 # 7792
+adds s0, s1, s1208 # 7793
+adds s1, s0, s1207 # 7794
+adds s0, s1, s1206 # 7795
+adds s1, s0, s1205 # 7796
+adds s0, s1, s1204 # 7797
+adds s1, s0, s1203 # 7798
+adds s0, s1, s1202 # 7799
+adds s1, s0, s1201 # 7800
+adds s0, s1, s1200 # 7801
+adds s1, s0, s1199 # 7802
+adds s0, s1, s1198 # 7803
+adds s1, s0, s1197 # 7804
+adds s0, s1, s1196 # 7805
+adds s1, s0, s1195 # 7806
+adds s0, s1, s1194 # 7807
+adds s1, s0, s1193 # 7808
+adds s0, s1, s1192 # 7809
+adds s1, s0, s1191 # 7810
+adds s0, s1, s1190 # 7811
+adds s1, s0, s1189 # 7812
+adds s0, s1, s1188 # 7813
+adds s1, s0, s1187 # 7814
+adds s0, s1, s1186 # 7815
+adds s1, s0, s1185 # 7816
+adds s0, s1, s1184 # 7817
+adds s1, s0, s1183 # 7818
+adds s0, s1, s1182 # 7819
+adds s1, s0, s1181 # 7820
+adds s0, s1, s1180 # 7821
+adds s1, s0, s1179 # 7822
+adds s0, s1, s1178 # 7823
+adds s1, s0, s1177 # 7824
+adds s0, s1, s1176 # 7825
+adds s1, s0, s1175 # 7826
+adds s0, s1, s1174 # 7827
+adds s1, s0, s1173 # 7828
+adds s0, s1, s1172 # 7829
+adds s1, s0, s1171 # 7830
+adds s0, s1, s1170 # 7831
+adds s1, s0, s1169 # 7832
+adds s0, s1, s1168 # 7833
+adds s1, s0, s1167 # 7834
+adds s0, s1, s1166 # 7835
+adds s1, s0, s1165 # 7836
+adds s0, s1, s1164 # 7837
+adds s1, s0, s1163 # 7838
+adds s0, s1, s1162 # 7839
+adds s1, s0, s1161 # 7840
+adds s0, s1, s1160 # 7841
+adds s1, s0, s1159 # 7842
+adds s0, s1, s1158 # 7843
+adds s1, s0, s1157 # 7844
+adds s0, s1, s1156 # 7845
+adds s1, s0, s1155 # 7846
+adds s0, s1, s1154 # 7847
+adds s1, s0, s1153 # 7848
+adds s0, s1, s1152 # 7849
+adds s1, s0, s1151 # 7850
+adds s0, s1, s1150 # 7851
+adds s1, s0, s1149 # 7852
+adds s0, s1, s1148 # 7853
+adds s1, s0, s1147 # 7854
+adds s0, s1, s1146 # 7855
+adds s1, s0, s1145 # 7856
+adds s0, s1, s1144 # 7857
+adds s1, s0, s1143 # 7858
+adds s0, s1, s1142 # 7859
+adds s1, s0, s1141 # 7860
+adds s0, s1, s1140 # 7861
+adds s1, s0, s1139 # 7862
+adds s0, s1, s1138 # 7863
+adds s1, s0, s1137 # 7864
+adds s0, s1, s1136 # 7865
+adds s1, s0, s1135 # 7866
+adds s0, s1, s1134 # 7867
+adds s1, s0, s1133 # 7868
+adds s0, s1, s1132 # 7869
+adds s1, s0, s1131 # 7870
+adds s0, s1, s1130 # 7871
+adds s1, s0, s1129 # 7872
+adds s0, s1, s1128 # 7873
+adds s1, s0, s1127 # 7874
+adds s0, s1, s1126 # 7875
+adds s1, s0, s1125 # 7876
+adds s0, s1, s1124 # 7877
+adds s1, s0, s1123 # 7878
+adds s0, s1, s1122 # 7879
+adds s1, s0, s1121 # 7880
+adds s0, s1, s1120 # 7881
+adds s1, s0, s1119 # 7882
+adds s0, s1, s1118 # 7883
+adds s1, s0, s1117 # 7884
+adds s0, s1, s1116 # 7885
+adds s1, s0, s1115 # 7886
+adds s0, s1, s1114 # 7887
+adds s1, s0, s1113 # 7888
+adds s0, s1, s1112 # 7889
+adds s1, s0, s1111 # 7890
+adds s0, s1, s1110 # 7891
+adds s1, s0, s1109 # 7892
+adds s0, s1, s1108 # 7893
+adds s1, s0, s1107 # 7894
+adds s0, s1, s1106 # 7895
+adds s1, s0, s1105 # 7896
+adds s0, s1, s1104 # 7897
+adds s1, s0, s1103 # 7898
+adds s0, s1, s1102 # 7899
+adds s1, s0, s1101 # 7900
+adds s0, s1, s1100 # 7901
+adds s1, s0, s1099 # 7902
+adds s0, s1, s1098 # 7903
+adds s1, s0, s1097 # 7904
+adds s0, s1, s1096 # 7905
+adds s1, s0, s1095 # 7906
+adds s0, s1, s1094 # 7907
+adds s1, s0, s1093 # 7908
+adds s0, s1, s1092 # 7909
+adds s1, s0, s1091 # 7910
+adds s0, s1, s1090 # 7911
+adds s1, s0, s1089 # 7912
+adds s0, s1, s1088 # 7913
+adds s1, s0, s1087 # 7914
+adds s0, s1, s1086 # 7915
+adds s1, s0, s1085 # 7916
+adds s0, s1, s1084 # 7917
+adds s1, s0, s1083 # 7918
+adds s0, s1, s1082 # 7919
+adds s1, s0, s1081 # 7920
+adds s0, s1, s1080 # 7921
+adds s1, s0, s1079 # 7922
+adds s0, s1, s1078 # 7923
+adds s1, s0, s1077 # 7924
+adds s0, s1, s1076 # 7925
+adds s1, s0, s1075 # 7926
+adds s0, s1, s1074 # 7927
+adds s1, s0, s1073 # 7928
+adds s0, s1, s1072 # 7929
+adds s1, s0, s1071 # 7930
+adds s0, s1, s1070 # 7931
+adds s1, s0, s1069 # 7932
+adds s0, s1, s1068 # 7933
+adds s1, s0, s1067 # 7934
+adds s0, s1, s1066 # 7935
+adds s1, s0, s1065 # 7936
+adds s0, s1, s1064 # 7937
+adds s1, s0, s1063 # 7938
+adds s0, s1, s1062 # 7939
+adds s1, s0, s1061 # 7940
+adds s0, s1, s1060 # 7941
+adds s1, s0, s1059 # 7942
+adds s0, s1, s1058 # 7943
+adds s1, s0, s1057 # 7944
+adds s0, s1, s1056 # 7945
+adds s1, s0, s1055 # 7946
+adds s0, s1, s1054 # 7947
+adds s1, s0, s1053 # 7948
+adds s0, s1, s1052 # 7949
+adds s1, s0, s1051 # 7950
+adds s0, s1, s1050 # 7951
+adds s1, s0, s1049 # 7952
+adds s0, s1, s1048 # 7953
+adds s1, s0, s1047 # 7954
+adds s0, s1, s1046 # 7955
+adds s1, s0, s1045 # 7956
+adds s0, s1, s1044 # 7957
+adds s1, s0, s1043 # 7958
+adds s0, s1, s1042 # 7959
+adds s1, s0, s1041 # 7960
+adds s0, s1, s1040 # 7961
+adds s1, s0, s1039 # 7962
+adds s0, s1, s1038 # 7963
+adds s1, s0, s1037 # 7964
+adds s0, s1, s1036 # 7965
+adds s1, s0, s1035 # 7966
+adds s0, s1, s1034 # 7967
+adds s1, s0, s1033 # 7968
+adds s0, s1, s1032 # 7969
+adds s1, s0, s1031 # 7970
+adds s0, s1, s1030 # 7971
+adds s1, s0, s1029 # 7972
+adds s0, s1, s1028 # 7973
+adds s1, s0, s1027 # 7974
+adds s0, s1, s1026 # 7975
+adds s1, s0, s1025 # 7976
+adds s0, s1, s1024 # 7977
+adds s1, s0, s1023 # 7978
+adds s0, s1, s1022 # 7979
+adds s1, s0, s1021 # 7980
+adds s0, s1, s1020 # 7981
+adds s1, s0, s1019 # 7982
+adds s0, s1, s1018 # 7983
+adds s1, s0, s1017 # 7984
+adds s0, s1, s1016 # 7985
+adds s1, s0, s1015 # 7986
+adds s0, s1, s1014 # 7987
+adds s1, s0, s1013 # 7988
+adds s0, s1, s1012 # 7989
+adds s1, s0, s1011 # 7990
+adds s0, s1, s1010 # 7991
+adds s1, s0, s1009 # 7992
+adds s0, s1, s1008 # 7993
+adds s1, s0, s1007 # 7994
+adds s0, s1, s1006 # 7995
+adds s1, s0, s1005 # 7996
+adds s0, s1, s1004 # 7997
+adds s1, s0, s1003 # 7998
+adds s0, s1, s1002 # 7999
+adds s1, s0, s1001 # 8000
+adds s0, s1, s1000 # 8001
+adds s1, s0, s999 # 8002
+adds s0, s1, s998 # 8003
+adds s1, s0, s997 # 8004
+adds s0, s1, s996 # 8005
+adds s1, s0, s995 # 8006
+adds s0, s1, s994 # 8007
+adds s1, s0, s993 # 8008
+adds s0, s1, s992 # 8009
+adds s1, s0, s991 # 8010
+adds s0, s1, s990 # 8011
+adds s1, s0, s989 # 8012
+adds s0, s1, s988 # 8013
+adds s1, s0, s987 # 8014
+adds s0, s1, s986 # 8015
+adds s1, s0, s985 # 8016
+adds s0, s1, s984 # 8017
+adds s1, s0, s983 # 8018
+adds s0, s1, s982 # 8019
+adds s1, s0, s981 # 8020
+adds s0, s1, s980 # 8021
+adds s1, s0, s979 # 8022
+adds s0, s1, s978 # 8023
+adds s1, s0, s977 # 8024
+adds s0, s1, s976 # 8025
+adds s1, s0, s975 # 8026
+adds s0, s1, s974 # 8027
+adds s1, s0, s973 # 8028
+adds s0, s1, s972 # 8029
+adds s1, s0, s971 # 8030
+adds s0, s1, s970 # 8031
+adds s1, s0, s969 # 8032
+adds s0, s1, s968 # 8033
+adds s1, s0, s967 # 8034
+adds s0, s1, s966 # 8035
+adds s1, s0, s965 # 8036
+adds s0, s1, s964 # 8037
+adds s1, s0, s963 # 8038
+adds s0, s1, s962 # 8039
+adds s1, s0, s961 # 8040
+adds s0, s1, s960 # 8041
+adds s1, s0, s959 # 8042
+adds s0, s1, s958 # 8043
+adds s1, s0, s957 # 8044
+adds s0, s1, s956 # 8045
+adds s1, s0, s955 # 8046
+adds s0, s1, s954 # 8047
+adds s1, s0, s953 # 8048
+adds s0, s1, s952 # 8049
+adds s1, s0, s951 # 8050
+adds s0, s1, s950 # 8051
+adds s1, s0, s949 # 8052
+adds s0, s1, s948 # 8053
+adds s1, s0, s947 # 8054
+adds s0, s1, s946 # 8055
+adds s1, s0, s945 # 8056
+adds s0, s1, s944 # 8057
+adds s1, s0, s943 # 8058
+adds s0, s1, s942 # 8059
+adds s1, s0, s941 # 8060
+adds s0, s1, s940 # 8061
+adds s1, s0, s939 # 8062
+adds s0, s1, s938 # 8063
+adds s1, s0, s937 # 8064
+adds s0, s1, s936 # 8065
+adds s1, s0, s935 # 8066
+adds s0, s1, s934 # 8067
+adds s1, s0, s933 # 8068
+adds s0, s1, s932 # 8069
+adds s1, s0, s931 # 8070
+adds s0, s1, s930 # 8071
+adds s1, s0, s929 # 8072
+adds s0, s1, s928 # 8073
+adds s1, s0, s927 # 8074
+adds s0, s1, s926 # 8075
+adds s1, s0, s925 # 8076
+adds s0, s1, s924 # 8077
+adds s1, s0, s923 # 8078
+adds s0, s1, s922 # 8079
+adds s1, s0, s921 # 8080
+adds s0, s1, s920 # 8081
+adds s1, s0, s919 # 8082
+adds s0, s1, s918 # 8083
+adds s1, s0, s917 # 8084
+adds s0, s1, s916 # 8085
+adds s1, s0, s915 # 8086
+adds s0, s1, s914 # 8087
+adds s1, s0, s913 # 8088
+adds s0, s1, s912 # 8089
+adds s1, s0, s911 # 8090
+adds s0, s1, s910 # 8091
+adds s1, s0, s909 # 8092
+adds s0, s1, s908 # 8093
+adds s1, s0, s907 # 8094
+adds s0, s1, s906 # 8095
+adds s1, s0, s905 # 8096
+adds s0, s1, s904 # 8097
+adds s1, s0, s903 # 8098
+adds s0, s1, s902 # 8099
+adds s1, s0, s901 # 8100
+adds s0, s1, s900 # 8101
+adds s1, s0, s899 # 8102
+adds s0, s1, s898 # 8103
+adds s1, s0, s897 # 8104
+adds s0, s1, s896 # 8105
+adds s1, s0, s895 # 8106
+adds s0, s1, s894 # 8107
+adds s1, s0, s893 # 8108
+adds s0, s1, s892 # 8109
+adds s1, s0, s891 # 8110
+adds s0, s1, s890 # 8111
+adds s1, s0, s889 # 8112
+adds s0, s1, s888 # 8113
+adds s1, s0, s887 # 8114
+adds s0, s1, s886 # 8115
+adds s1, s0, s885 # 8116
+adds s0, s1, s884 # 8117
+adds s1, s0, s883 # 8118
+adds s0, s1, s882 # 8119
+adds s1, s0, s881 # 8120
+adds s0, s1, s880 # 8121
+adds s1, s0, s879 # 8122
+adds s0, s1, s878 # 8123
+adds s1, s0, s877 # 8124
+adds s0, s1, s876 # 8125
+adds s1, s0, s875 # 8126
+adds s0, s1, s874 # 8127
+adds s1, s0, s873 # 8128
+adds s0, s1, s872 # 8129
+adds s1, s0, s871 # 8130
+adds s0, s1, s870 # 8131
+adds s1, s0, s869 # 8132
+adds s0, s1, s868 # 8133
+adds s1, s0, s867 # 8134
+adds s0, s1, s866 # 8135
+adds s1, s0, s865 # 8136
+adds s0, s1, s864 # 8137
+adds s1, s0, s863 # 8138
+adds s0, s1, s862 # 8139
+adds s1, s0, s861 # 8140
+adds s0, s1, s860 # 8141
+adds s1, s0, s859 # 8142
+adds s0, s1, s858 # 8143
+adds s1, s0, s857 # 8144
+adds s0, s1, s856 # 8145
+adds s1, s0, s855 # 8146
+adds s0, s1, s854 # 8147
+adds s1, s0, s853 # 8148
+adds s0, s1, s852 # 8149
+adds s1, s0, s851 # 8150
+adds s0, s1, s850 # 8151
+adds s1, s0, s849 # 8152
+adds s0, s1, s848 # 8153
+adds s1, s0, s847 # 8154
+adds s0, s1, s846 # 8155
+adds s1, s0, s845 # 8156
+adds s0, s1, s844 # 8157
+adds s1, s0, s843 # 8158
+adds s0, s1, s842 # 8159
+adds s1, s0, s841 # 8160
+adds s0, s1, s840 # 8161
+adds s1, s0, s839 # 8162
+adds s0, s1, s838 # 8163
+adds s1, s0, s837 # 8164
+adds s0, s1, s836 # 8165
+adds s1, s0, s835 # 8166
+adds s0, s1, s834 # 8167
+adds s1, s0, s833 # 8168
+adds s0, s1, s832 # 8169
+adds s1, s0, s831 # 8170
+adds s0, s1, s830 # 8171
+adds s1, s0, s829 # 8172
+adds s0, s1, s828 # 8173
+adds s1, s0, s827 # 8174
+adds s0, s1, s826 # 8175
+adds s1, s0, s825 # 8176
+adds s0, s1, s824 # 8177
+adds s1, s0, s823 # 8178
+adds s0, s1, s822 # 8179
+adds s1, s0, s821 # 8180
+adds s0, s1, s820 # 8181
+adds s1, s0, s819 # 8182
+adds s0, s1, s818 # 8183
+adds s1, s0, s817 # 8184
+adds s0, s1, s816 # 8185
+adds s1, s0, s815 # 8186
+adds s0, s1, s814 # 8187
+adds s1, s0, s813 # 8188
+adds s0, s1, s812 # 8189
+adds s1, s0, s811 # 8190
+adds s0, s1, s810 # 8191
+adds s1, s0, s809 # 8192
+adds s0, s1, s808 # 8193
+adds s1, s0, s807 # 8194
+adds s0, s1, s806 # 8195
+adds s1, s0, s805 # 8196
+adds s0, s1, s804 # 8197
+adds s1, s0, s803 # 8198
+adds s0, s1, s802 # 8199
+adds s1, s0, s801 # 8200
+adds s0, s1, s800 # 8201
+adds s1, s0, s799 # 8202
+adds s0, s1, s798 # 8203
+adds s1, s0, s797 # 8204
+adds s0, s1, s796 # 8205
+adds s1, s0, s795 # 8206
+adds s0, s1, s794 # 8207
+adds s1, s0, s793 # 8208
+adds s0, s1, s792 # 8209
+adds s1, s0, s791 # 8210
+adds s0, s1, s790 # 8211
+adds s1, s0, s789 # 8212
+adds s0, s1, s788 # 8213
+adds s1, s0, s787 # 8214
+adds s0, s1, s786 # 8215
+adds s1, s0, s785 # 8216
+adds s0, s1, s784 # 8217
+adds s1, s0, s783 # 8218
+adds s0, s1, s782 # 8219
+adds s1, s0, s781 # 8220
+adds s0, s1, s780 # 8221
+adds s1, s0, s779 # 8222
+adds s0, s1, s778 # 8223
+adds s1, s0, s777 # 8224
+adds s0, s1, s776 # 8225
+adds s1, s0, s775 # 8226
+adds s0, s1, s774 # 8227
+adds s1, s0, s773 # 8228
+adds s0, s1, s772 # 8229
+adds s1, s0, s771 # 8230
+adds s0, s1, s770 # 8231
+adds s1, s0, s769 # 8232
+adds s0, s1, s768 # 8233
+adds s1, s0, s767 # 8234
+adds s0, s1, s766 # 8235
+adds s1, s0, s765 # 8236
+adds s0, s1, s764 # 8237
+adds s1, s0, s763 # 8238
+adds s0, s1, s762 # 8239
+adds s1, s0, s761 # 8240
+adds s0, s1, s760 # 8241
+adds s1, s0, s759 # 8242
+adds s0, s1, s758 # 8243
+adds s1, s0, s757 # 8244
+adds s0, s1, s756 # 8245
+adds s1, s0, s755 # 8246
+adds s0, s1, s754 # 8247
+adds s1, s0, s753 # 8248
+adds s0, s1, s752 # 8249
+adds s1, s0, s751 # 8250
+adds s0, s1, s750 # 8251
+adds s1, s0, s749 # 8252
+adds s0, s1, s748 # 8253
+adds s1, s0, s747 # 8254
+adds s0, s1, s746 # 8255
+adds s1, s0, s745 # 8256
+adds s0, s1, s744 # 8257
+adds s1, s0, s743 # 8258
+adds s0, s1, s742 # 8259
+adds s1, s0, s741 # 8260
+adds s0, s1, s740 # 8261
+adds s1, s0, s739 # 8262
+adds s0, s1, s738 # 8263
+adds s1, s0, s737 # 8264
+adds s0, s1, s736 # 8265
+adds s1, s0, s735 # 8266
+adds s0, s1, s734 # 8267
+adds s1, s0, s733 # 8268
+adds s0, s1, s732 # 8269
+adds s1, s0, s731 # 8270
+adds s0, s1, s730 # 8271
+adds s1, s0, s729 # 8272
+adds s0, s1, s728 # 8273
+adds s1, s0, s727 # 8274
+adds s0, s1, s726 # 8275
+adds s1, s0, s725 # 8276
+adds s0, s1, s724 # 8277
+adds s1, s0, s723 # 8278
+adds s0, s1, s722 # 8279
+adds s1, s0, s721 # 8280
+adds s0, s1, s720 # 8281
+adds s1, s0, s719 # 8282
+adds s0, s1, s718 # 8283
+adds s1, s0, s717 # 8284
+adds s0, s1, s716 # 8285
+adds s1, s0, s715 # 8286
+adds s0, s1, s714 # 8287
+adds s1, s0, s713 # 8288
+adds s0, s1, s712 # 8289
+adds s1, s0, s711 # 8290
+adds s0, s1, s710 # 8291
+adds s1, s0, s709 # 8292
+adds s0, s1, s708 # 8293
+adds s1, s0, s707 # 8294
+adds s0, s1, s706 # 8295
+adds s1, s0, s705 # 8296
+adds s0, s1, s704 # 8297
+adds s1, s0, s703 # 8298
+adds s0, s1, s702 # 8299
+adds s1, s0, s701 # 8300
+adds s0, s1, s700 # 8301
+adds s1, s0, s699 # 8302
+adds s0, s1, s698 # 8303
+adds s1, s0, s697 # 8304
+adds s0, s1, s696 # 8305
+adds s1, s0, s695 # 8306
+adds s0, s1, s694 # 8307
+adds s1, s0, s693 # 8308
+adds s0, s1, s692 # 8309
+adds s1, s0, s691 # 8310
+adds s0, s1, s690 # 8311
+adds s1, s0, s689 # 8312
+adds s0, s1, s688 # 8313
+adds s1, s0, s687 # 8314
+adds s0, s1, s686 # 8315
+adds s1, s0, s685 # 8316
+adds s0, s1, s684 # 8317
+adds s1, s0, s683 # 8318
+adds s0, s1, s682 # 8319
+adds s1, s0, s681 # 8320
+adds s0, s1, s680 # 8321
+adds s1, s0, s679 # 8322
+adds s0, s1, s678 # 8323
+adds s1, s0, s677 # 8324
+adds s0, s1, s676 # 8325
+adds s1, s0, s675 # 8326
+adds s0, s1, s674 # 8327
+adds s1, s0, s673 # 8328
+adds s0, s1, s672 # 8329
+adds s1, s0, s671 # 8330
+adds s0, s1, s670 # 8331
+adds s1, s0, s669 # 8332
+adds s0, s1, s668 # 8333
+adds s1, s0, s667 # 8334
+adds s0, s1, s666 # 8335
+adds s1, s0, s665 # 8336
+adds s0, s1, s664 # 8337
+adds s1, s0, s663 # 8338
+adds s0, s1, s662 # 8339
+adds s1, s0, s661 # 8340
+adds s0, s1, s660 # 8341
+adds s1, s0, s659 # 8342
+adds s0, s1, s658 # 8343
+adds s1, s0, s657 # 8344
+adds s0, s1, s656 # 8345
+adds s1, s0, s655 # 8346
+adds s0, s1, s654 # 8347
+adds s1, s0, s653 # 8348
+adds s0, s1, s652 # 8349
+adds s1, s0, s651 # 8350
+adds s0, s1, s650 # 8351
+adds s1, s0, s649 # 8352
+adds s0, s1, s648 # 8353
+adds s1, s0, s647 # 8354
+adds s0, s1, s646 # 8355
+adds s1, s0, s645 # 8356
+adds s0, s1, s644 # 8357
+adds s1, s0, s643 # 8358
+adds s0, s1, s642 # 8359
+adds s1, s0, s641 # 8360
+adds s0, s1, s640 # 8361
+adds s1, s0, s639 # 8362
+adds s0, s1, s638 # 8363
+adds s1, s0, s637 # 8364
+adds s0, s1, s636 # 8365
+adds s1, s0, s635 # 8366
+adds s0, s1, s634 # 8367
+adds s1, s0, s633 # 8368
+adds s0, s1, s632 # 8369
+adds s1, s0, s631 # 8370
+adds s0, s1, s630 # 8371
+adds s1, s0, s629 # 8372
+adds s0, s1, s628 # 8373
+adds s1, s0, s627 # 8374
+adds s0, s1, s626 # 8375
+adds s1, s0, s625 # 8376
+adds s0, s1, s624 # 8377
+adds s1, s0, s623 # 8378
+adds s0, s1, s622 # 8379
+adds s1, s0, s621 # 8380
+adds s0, s1, s620 # 8381
+adds s1, s0, s619 # 8382
+adds s0, s1, s618 # 8383
+adds s1, s0, s617 # 8384
+adds s0, s1, s616 # 8385
+adds s1, s0, s615 # 8386
+adds s0, s1, s614 # 8387
+adds s1, s0, s613 # 8388
+adds s0, s1, s612 # 8389
+adds s1, s0, s611 # 8390
+adds s0, s1, s610 # 8391
+adds s1, s0, s609 # 8392
+adds s0, s1, s608 # 8393
+adds s1, s0, s607 # 8394
+adds s0, s1, s606 # 8395
+adds s1, s0, s605 # 8396
+adds s0, s1, s604 # 8397
+adds s1, s0, s603 # 8398
+adds s0, s1, s602 # 8399
+adds s1, s0, s601 # 8400
+adds s0, s1, s600 # 8401
+adds s1, s0, s599 # 8402
+adds s0, s1, s598 # 8403
+adds s1, s0, s597 # 8404
+adds s0, s1, s596 # 8405
+adds s1, s0, s595 # 8406
+adds s0, s1, s594 # 8407
+adds s1, s0, s593 # 8408
+adds s0, s1, s592 # 8409
+adds s1, s0, s591 # 8410
+adds s0, s1, s590 # 8411
+adds s1, s0, s589 # 8412
+adds s0, s1, s588 # 8413
+adds s1, s0, s587 # 8414
+adds s0, s1, s586 # 8415
+adds s1, s0, s585 # 8416
+adds s0, s1, s584 # 8417
+adds s1, s0, s583 # 8418
+adds s0, s1, s582 # 8419
+adds s1, s0, s581 # 8420
+adds s0, s1, s580 # 8421
+adds s1, s0, s579 # 8422
+adds s0, s1, s578 # 8423
+adds s1, s0, s577 # 8424
+adds s0, s1, s576 # 8425
+adds s1, s0, s575 # 8426
+adds s0, s1, s574 # 8427
+adds s1, s0, s573 # 8428
+adds s0, s1, s572 # 8429
+adds s1, s0, s571 # 8430
+adds s0, s1, s570 # 8431
+adds s1, s0, s569 # 8432
+adds s0, s1, s568 # 8433
+adds s1, s0, s567 # 8434
+adds s0, s1, s566 # 8435
+adds s1, s0, s565 # 8436
+adds s0, s1, s564 # 8437
+adds s1, s0, s563 # 8438
+adds s0, s1, s562 # 8439
+adds s1, s0, s561 # 8440
+adds s0, s1, s560 # 8441
+adds s1, s0, s559 # 8442
+adds s0, s1, s558 # 8443
+adds s1, s0, s557 # 8444
+adds s0, s1, s556 # 8445
+adds s1, s0, s555 # 8446
+adds s0, s1, s554 # 8447
+adds s1, s0, s553 # 8448
+adds s0, s1, s552 # 8449
+adds s1, s0, s551 # 8450
+adds s0, s1, s550 # 8451
+adds s1, s0, s549 # 8452
+adds s0, s1, s548 # 8453
+adds s1, s0, s547 # 8454
+adds s0, s1, s546 # 8455
+adds s1, s0, s545 # 8456
+adds s0, s1, s544 # 8457
+adds s1, s0, s543 # 8458
+adds s0, s1, s542 # 8459
+adds s1, s0, s541 # 8460
+adds s0, s1, s540 # 8461
+adds s1, s0, s539 # 8462
+adds s0, s1, s538 # 8463
+adds s1, s0, s537 # 8464
+adds s0, s1, s536 # 8465
+adds s1, s0, s535 # 8466
+adds s0, s1, s534 # 8467
+adds s1, s0, s533 # 8468
+adds s0, s1, s532 # 8469
+adds s1, s0, s531 # 8470
+adds s0, s1, s530 # 8471
+adds s1, s0, s529 # 8472
+adds s0, s1, s528 # 8473
+adds s1, s0, s527 # 8474
+adds s0, s1, s526 # 8475
+adds s1, s0, s525 # 8476
+adds s0, s1, s524 # 8477
+adds s1, s0, s523 # 8478
+adds s0, s1, s522 # 8479
+adds s1, s0, s521 # 8480
+adds s0, s1, s520 # 8481
+adds s1, s0, s519 # 8482
+adds s0, s1, s518 # 8483
+adds s1, s0, s517 # 8484
+adds s0, s1, s516 # 8485
+adds s1, s0, s515 # 8486
+adds s0, s1, s514 # 8487
+adds s1, s0, s513 # 8488
+adds s0, s1, s512 # 8489
+adds s1, s0, s511 # 8490
+adds s0, s1, s510 # 8491
+adds s1, s0, s509 # 8492
+adds s0, s1, s508 # 8493
+adds s1, s0, s507 # 8494
+adds s0, s1, s506 # 8495
+adds s1, s0, s505 # 8496
+adds s0, s1, s504 # 8497
+adds s1, s0, s503 # 8498
+adds s0, s1, s502 # 8499
+adds s1, s0, s501 # 8500
+adds s0, s1, s500 # 8501
+adds s1, s0, s499 # 8502
+adds s0, s1, s498 # 8503
+adds s1, s0, s497 # 8504
+adds s0, s1, s496 # 8505
+adds s1, s0, s495 # 8506
+adds s0, s1, s494 # 8507
+adds s1, s0, s493 # 8508
+adds s0, s1, s492 # 8509
+adds s1, s0, s491 # 8510
+adds s0, s1, s490 # 8511
+adds s1, s0, s489 # 8512
+adds s0, s1, s488 # 8513
+adds s1, s0, s487 # 8514
+adds s0, s1, s486 # 8515
+adds s1, s0, s485 # 8516
+adds s0, s1, s484 # 8517
+adds s1, s0, s483 # 8518
+adds s0, s1, s482 # 8519
+adds s1, s0, s481 # 8520
+adds s0, s1, s480 # 8521
+adds s1, s0, s479 # 8522
+adds s0, s1, s478 # 8523
+adds s1, s0, s477 # 8524
+adds s0, s1, s476 # 8525
+adds s1, s0, s475 # 8526
+adds s0, s1, s474 # 8527
+adds s1, s0, s473 # 8528
+adds s0, s1, s472 # 8529
+adds s1, s0, s471 # 8530
+adds s0, s1, s470 # 8531
+adds s1, s0, s469 # 8532
+adds s0, s1, s468 # 8533
+adds s1, s0, s467 # 8534
+adds s0, s1, s466 # 8535
+adds s1, s0, s465 # 8536
+adds s0, s1, s464 # 8537
+adds s1, s0, s463 # 8538
+adds s0, s1, s462 # 8539
+adds s1, s0, s461 # 8540
+adds s0, s1, s460 # 8541
+adds s1, s0, s459 # 8542
+adds s0, s1, s458 # 8543
+adds s1, s0, s457 # 8544
+adds s0, s1, s456 # 8545
+adds s1, s0, s455 # 8546
+adds s0, s1, s454 # 8547
+adds s1, s0, s453 # 8548
+adds s0, s1, s452 # 8549
+adds s1, s0, s451 # 8550
+adds s0, s1, s450 # 8551
+adds s1, s0, s449 # 8552
+adds s0, s1, s448 # 8553
+adds s1, s0, s447 # 8554
+adds s0, s1, s446 # 8555
+adds s1, s0, s445 # 8556
+adds s0, s1, s444 # 8557
+adds s1, s0, s443 # 8558
+adds s0, s1, s442 # 8559
+adds s1, s0, s441 # 8560
+adds s0, s1, s440 # 8561
+adds s1, s0, s439 # 8562
+adds s0, s1, s438 # 8563
+adds s1, s0, s437 # 8564
+adds s0, s1, s436 # 8565
+adds s1, s0, s435 # 8566
+adds s0, s1, s434 # 8567
+adds s1, s0, s433 # 8568
+adds s0, s1, s432 # 8569
+adds s1, s0, s431 # 8570
+adds s0, s1, s430 # 8571
+adds s1, s0, s429 # 8572
+adds s0, s1, s428 # 8573
+adds s1, s0, s427 # 8574
+adds s0, s1, s426 # 8575
+adds s1, s0, s425 # 8576
+adds s0, s1, s424 # 8577
+adds s1, s0, s423 # 8578
+adds s0, s1, s422 # 8579
+adds s1, s0, s421 # 8580
+adds s0, s1, s420 # 8581
+adds s1, s0, s419 # 8582
+adds s0, s1, s418 # 8583
+adds s1, s0, s417 # 8584
+adds s0, s1, s416 # 8585
+adds s1, s0, s415 # 8586
+adds s0, s1, s414 # 8587
+adds s1, s0, s413 # 8588
+adds s0, s1, s412 # 8589
+adds s1, s0, s411 # 8590
+adds s0, s1, s410 # 8591
+adds s1, s0, s409 # 8592
+adds s0, s1, s408 # 8593
+adds s1, s0, s407 # 8594
+adds s0, s1, s406 # 8595
+adds s1, s0, s405 # 8596
+adds s0, s1, s404 # 8597
+adds s1, s0, s403 # 8598
+adds s0, s1, s402 # 8599
+adds s1, s0, s401 # 8600
+adds s0, s1, s400 # 8601
+adds s1, s0, s399 # 8602
+adds s0, s1, s398 # 8603
+adds s1, s0, s397 # 8604
+adds s0, s1, s396 # 8605
+adds s1, s0, s395 # 8606
+adds s0, s1, s394 # 8607
+adds s1, s0, s393 # 8608
+adds s0, s1, s392 # 8609
+adds s1, s0, s391 # 8610
+adds s0, s1, s390 # 8611
+adds s1, s0, s389 # 8612
+adds s0, s1, s388 # 8613
+adds s1, s0, s387 # 8614
+adds s0, s1, s386 # 8615
+adds s1, s0, s385 # 8616
+adds s0, s1, s384 # 8617
+adds s1, s0, s383 # 8618
+adds s0, s1, s382 # 8619
+adds s1, s0, s381 # 8620
+adds s0, s1, s380 # 8621
+adds s1, s0, s379 # 8622
+adds s0, s1, s378 # 8623
+adds s1, s0, s377 # 8624
+adds s0, s1, s376 # 8625
+adds s1, s0, s375 # 8626
+adds s0, s1, s374 # 8627
+adds s1, s0, s373 # 8628
+adds s0, s1, s372 # 8629
+adds s1, s0, s371 # 8630
+adds s0, s1, s370 # 8631
+adds s1, s0, s369 # 8632
+adds s0, s1, s368 # 8633
+adds s1, s0, s367 # 8634
+adds s0, s1, s366 # 8635
+adds s1, s0, s365 # 8636
+adds s0, s1, s364 # 8637
+adds s1, s0, s363 # 8638
+adds s0, s1, s362 # 8639
+adds s1, s0, s361 # 8640
+adds s0, s1, s360 # 8641
+adds s1, s0, s359 # 8642
+adds s0, s1, s358 # 8643
+adds s1, s0, s357 # 8644
+adds s0, s1, s356 # 8645
+adds s1, s0, s355 # 8646
+adds s0, s1, s354 # 8647
+adds s1, s0, s353 # 8648
+adds s0, s1, s352 # 8649
+adds s1, s0, s351 # 8650
+adds s0, s1, s350 # 8651
+adds s1, s0, s349 # 8652
+adds s0, s1, s348 # 8653
+adds s1, s0, s347 # 8654
+adds s0, s1, s346 # 8655
+adds s1, s0, s345 # 8656
+adds s0, s1, s344 # 8657
+adds s1, s0, s343 # 8658
+adds s0, s1, s342 # 8659
+adds s1, s0, s341 # 8660
+adds s0, s1, s340 # 8661
+adds s1, s0, s339 # 8662
+adds s0, s1, s338 # 8663
+adds s1, s0, s337 # 8664
+adds s0, s1, s336 # 8665
+adds s1, s0, s335 # 8666
+adds s0, s1, s334 # 8667
+adds s1, s0, s333 # 8668
+adds s0, s1, s332 # 8669
+adds s1, s0, s331 # 8670
+adds s0, s1, s330 # 8671
+adds s1, s0, s329 # 8672
+adds s0, s1, s328 # 8673
+adds s1, s0, s327 # 8674
+adds s0, s1, s326 # 8675
+adds s1, s0, s325 # 8676
+adds s0, s1, s324 # 8677
+adds s1, s0, s323 # 8678
+adds s0, s1, s322 # 8679
+adds s1, s0, s321 # 8680
+adds s0, s1, s320 # 8681
+adds s1, s0, s319 # 8682
+adds s0, s1, s318 # 8683
+adds s1, s0, s317 # 8684
+adds s0, s1, s316 # 8685
+adds s1, s0, s315 # 8686
+adds s0, s1, s314 # 8687
+adds s1, s0, s313 # 8688
+adds s0, s1, s312 # 8689
+adds s1, s0, s311 # 8690
+adds s0, s1, s310 # 8691
+adds s1, s0, s309 # 8692
+adds s0, s1, s308 # 8693
+adds s1, s0, s307 # 8694
+adds s0, s1, s306 # 8695
+adds s1, s0, s305 # 8696
+adds s0, s1, s304 # 8697
+adds s1, s0, s303 # 8698
+adds s0, s1, s302 # 8699
+adds s1, s0, s301 # 8700
+adds s0, s1, s300 # 8701
+adds s1, s0, s299 # 8702
+adds s0, s1, s298 # 8703
+adds s1, s0, s297 # 8704
+adds s0, s1, s296 # 8705
+adds s1, s0, s295 # 8706
+adds s0, s1, s294 # 8707
+adds s1, s0, s293 # 8708
+adds s0, s1, s292 # 8709
+adds s1, s0, s291 # 8710
+adds s0, s1, s290 # 8711
+adds s1, s0, s289 # 8712
+adds s0, s1, s288 # 8713
+adds s1, s0, s287 # 8714
+adds s0, s1, s286 # 8715
+adds s1, s0, s285 # 8716
+adds s0, s1, s284 # 8717
+adds s1, s0, s283 # 8718
+adds s0, s1, s282 # 8719
+adds s1, s0, s281 # 8720
+adds s0, s1, s280 # 8721
+adds s1, s0, s279 # 8722
+adds s0, s1, s278 # 8723
+adds s1, s0, s277 # 8724
+adds s0, s1, s276 # 8725
+adds s1, s0, s275 # 8726
+adds s0, s1, s274 # 8727
+adds s1, s0, s273 # 8728
+adds s0, s1, s272 # 8729
+adds s1, s0, s271 # 8730
+adds s0, s1, s270 # 8731
+adds s1, s0, s269 # 8732
+adds s0, s1, s268 # 8733
+adds s1, s0, s267 # 8734
+adds s0, s1, s266 # 8735
+adds s1, s0, s265 # 8736
+adds s0, s1, s264 # 8737
+adds s1, s0, s263 # 8738
+adds s0, s1, s262 # 8739
+adds s1, s0, s261 # 8740
+adds s0, s1, s260 # 8741
+adds s1, s0, s259 # 8742
+adds s0, s1, s258 # 8743
+adds s1, s0, s257 # 8744
+adds s0, s1, s256 # 8745
+adds s1, s0, s255 # 8746
+adds s0, s1, s254 # 8747
+adds s1, s0, s253 # 8748
+adds s0, s1, s252 # 8749
+adds s1, s0, s251 # 8750
+adds s0, s1, s250 # 8751
+adds s1, s0, s249 # 8752
+adds s0, s1, s248 # 8753
+adds s1, s0, s247 # 8754
+adds s0, s1, s246 # 8755
+adds s1, s0, s245 # 8756
+adds s0, s1, s244 # 8757
+adds s1, s0, s243 # 8758
+adds s0, s1, s242 # 8759
+adds s1, s0, s241 # 8760
+adds s0, s1, s240 # 8761
+adds s1, s0, s239 # 8762
+adds s0, s1, s238 # 8763
+adds s1, s0, s237 # 8764
+adds s0, s1, s236 # 8765
+adds s1, s0, s235 # 8766
+adds s0, s1, s234 # 8767
+adds s1, s0, s233 # 8768
+adds s0, s1, s232 # 8769
+adds s1, s0, s231 # 8770
+adds s0, s1, s230 # 8771
+adds s1, s0, s229 # 8772
+adds s0, s1, s228 # 8773
+adds s1, s0, s227 # 8774
+adds s0, s1, s226 # 8775
+adds s1, s0, s225 # 8776
+adds s0, s1, s224 # 8777
+adds s1, s0, s223 # 8778
+adds s0, s1, s222 # 8779
+adds s1, s0, s221 # 8780
+adds s0, s1, s220 # 8781
+adds s1, s0, s219 # 8782
+adds s0, s1, s218 # 8783
+adds s1, s0, s217 # 8784
+adds s0, s1, s216 # 8785
+adds s1, s0, s215 # 8786
+adds s0, s1, s214 # 8787
+adds s1, s0, s213 # 8788
+adds s0, s1, s212 # 8789
+adds s1, s0, s211 # 8790
+adds s0, s1, s210 # 8791
+adds s1, s0, s209 # 8792
+adds s0, s1, s208 # 8793
+adds s1, s0, s207 # 8794
+adds s0, s1, s206 # 8795
+adds s1, s0, s205 # 8796
+adds s0, s1, s204 # 8797
+adds s1, s0, s203 # 8798
+adds s0, s1, s202 # 8799
+adds s1, s0, s201 # 8800
+adds s0, s1, s200 # 8801
+adds s1, s0, s199 # 8802
+adds s0, s1, s198 # 8803
+adds s1, s0, s197 # 8804
+adds s0, s1, s196 # 8805
+adds s1, s0, s195 # 8806
+adds s0, s1, s194 # 8807
+adds s1, s0, s193 # 8808
+adds s0, s1, s192 # 8809
+adds s1, s0, s191 # 8810
+adds s0, s1, s190 # 8811
+adds s1, s0, s189 # 8812
+adds s0, s1, s188 # 8813
+adds s1, s0, s187 # 8814
+adds s0, s1, s186 # 8815
+adds s1, s0, s185 # 8816
+adds s0, s1, s184 # 8817
+adds s1, s0, s183 # 8818
+adds s0, s1, s182 # 8819
+adds s1, s0, s181 # 8820
+adds s0, s1, s180 # 8821
+adds s1, s0, s179 # 8822
+adds s0, s1, s178 # 8823
+adds s1, s0, s177 # 8824
+adds s0, s1, s176 # 8825
+adds s1, s0, s175 # 8826
+adds s0, s1, s174 # 8827
+adds s1, s0, s173 # 8828
+adds s0, s1, s172 # 8829
+adds s1, s0, s171 # 8830
+adds s0, s1, s170 # 8831
+adds s1, s0, s169 # 8832
+adds s0, s1, s168 # 8833
+adds s1, s0, s167 # 8834
+adds s0, s1, s166 # 8835
+adds s1, s0, s165 # 8836
+adds s0, s1, s164 # 8837
+adds s1, s0, s163 # 8838
+adds s0, s1, s162 # 8839
+adds s1, s0, s161 # 8840
+adds s0, s1, s160 # 8841
+adds s1, s0, s159 # 8842
+adds s0, s1, s158 # 8843
+adds s1, s0, s157 # 8844
+adds s0, s1, s156 # 8845
+adds s1, s0, s155 # 8846
+adds s0, s1, s154 # 8847
+adds s1, s0, s153 # 8848
+adds s0, s1, s152 # 8849
+adds s1, s0, s151 # 8850
+adds s0, s1, s150 # 8851
+adds s1, s0, s149 # 8852
+adds s0, s1, s148 # 8853
+adds s1, s0, s147 # 8854
+adds s0, s1, s146 # 8855
+adds s1, s0, s145 # 8856
+adds s0, s1, s144 # 8857
+adds s1, s0, s143 # 8858
+adds s0, s1, s142 # 8859
+adds s1, s0, s141 # 8860
+adds s0, s1, s140 # 8861
+adds s1, s0, s139 # 8862
+adds s0, s1, s138 # 8863
+adds s1, s0, s137 # 8864
+adds s0, s1, s136 # 8865
+adds s1, s0, s135 # 8866
+adds s0, s1, s134 # 8867
+adds s1, s0, s133 # 8868
+adds s0, s1, s132 # 8869
+adds s1, s0, s131 # 8870
+adds s0, s1, s130 # 8871
+adds s1, s0, s129 # 8872
+adds s0, s1, s128 # 8873
+adds s1, s0, s127 # 8874
+adds s0, s1, s126 # 8875
+adds s1, s0, s125 # 8876
+adds s0, s1, s124 # 8877
+adds s1, s0, s123 # 8878
+adds s0, s1, s122 # 8879
+adds s1, s0, s121 # 8880
+adds s0, s1, s120 # 8881
+adds s1, s0, s119 # 8882
+adds s0, s1, s118 # 8883
+adds s1, s0, s117 # 8884
+adds s0, s1, s116 # 8885
+adds s1, s0, s115 # 8886
+adds s0, s1, s114 # 8887
+adds s1, s0, s113 # 8888
+adds s0, s1, s112 # 8889
+adds s1, s0, s111 # 8890
+adds s0, s1, s110 # 8891
+adds s1, s0, s109 # 8892
+adds s0, s1, s108 # 8893
+adds s1, s0, s107 # 8894
+adds s0, s1, s106 # 8895
+adds s1, s0, s105 # 8896
+adds s0, s1, s104 # 8897
+adds s1, s0, s103 # 8898
+adds s0, s1, s102 # 8899
+adds s1, s0, s101 # 8900
+adds s0, s1, s100 # 8901
+adds s1, s0, s99 # 8902
+adds s0, s1, s98 # 8903
+adds s1, s0, s97 # 8904
+adds s0, s1, s96 # 8905
+adds s1, s0, s95 # 8906
+adds s0, s1, s94 # 8907
+adds s1, s0, s93 # 8908
+adds s0, s1, s92 # 8909
+adds s1, s0, s91 # 8910
+adds s0, s1, s90 # 8911
+adds s1, s0, s89 # 8912
+adds s0, s1, s88 # 8913
+adds s1, s0, s87 # 8914
+adds s0, s1, s86 # 8915
+adds s1, s0, s85 # 8916
+adds s0, s1, s84 # 8917
+adds s1, s0, s83 # 8918
+adds s0, s1, s82 # 8919
+adds s1, s0, s81 # 8920
+adds s0, s1, s80 # 8921
+adds s1, s0, s79 # 8922
+adds s0, s1, s78 # 8923
+adds s1, s0, s77 # 8924
+adds s0, s1, s76 # 8925
+adds s1, s0, s75 # 8926
+adds s0, s1, s74 # 8927
+adds s1, s0, s73 # 8928
+adds s0, s1, s72 # 8929
+adds s1, s0, s71 # 8930
+adds s0, s1, s70 # 8931
+adds s1, s0, s69 # 8932
+adds s0, s1, s68 # 8933
+adds s1, s0, s67 # 8934
+adds s0, s1, s66 # 8935
+adds s1, s0, s65 # 8936
+adds s0, s1, s64 # 8937
+adds s1, s0, s63 # 8938
+adds s0, s1, s62 # 8939
+adds s1, s0, s61 # 8940
+adds s0, s1, s60 # 8941
+adds s1, s0, s59 # 8942
+adds s0, s1, s58 # 8943
+adds s1, s0, s57 # 8944
+adds s0, s1, s56 # 8945
+adds s1, s0, s55 # 8946
+adds s0, s1, s54 # 8947
+adds s1, s0, s53 # 8948
+adds s0, s1, s52 # 8949
+adds s1, s0, s51 # 8950
+adds s0, s1, s50 # 8951
+adds s1, s0, s49 # 8952
+adds s0, s1, s48 # 8953
+adds s1, s0, s47 # 8954
+adds s0, s1, s46 # 8955
+adds s1, s0, s45 # 8956
+adds s0, s1, s44 # 8957
+adds s1, s0, s43 # 8958
+adds s0, s1, s42 # 8959
+adds s1, s0, s41 # 8960
+adds s0, s1, s40 # 8961
+adds s1, s0, s39 # 8962
+adds s0, s1, s38 # 8963
+adds s1, s0, s37 # 8964
+adds s0, s1, s36 # 8965
+adds s1, s0, s35 # 8966
+adds s0, s1, s34 # 8967
+adds s1, s0, s33 # 8968
+adds s0, s1, s32 # 8969
+adds s1, s0, s31 # 8970
+adds s0, s1, s30 # 8971
+adds s1, s0, s29 # 8972
+adds s0, s1, s28 # 8973
+adds s1, s0, s27 # 8974
+adds s0, s1, s26 # 8975
+adds s1, s0, s25 # 8976
+adds s0, s1, s24 # 8977
+adds s1, s0, s23 # 8978
+adds s0, s1, s22 # 8979
+adds s1, s0, s21 # 8980
+adds s0, s1, s20 # 8981
+adds s1, s0, s19 # 8982
+adds s0, s1, s18 # 8983
+adds s1, s0, s17 # 8984
+adds s0, s1, s16 # 8985
+adds s1, s0, s15 # 8986
+adds s0, s1, s14 # 8987
+adds s1, s0, s13 # 8988
+adds s0, s1, s12 # 8989
+adds s1, s0, s11 # 8990
+adds s0, s1, s10 # 8991
+adds s1, s0, s9 # 8992
+adds s0, s1, s8 # 8993
+adds s1, s0, s7 # 8994
+adds s0, s1, s6 # 8995
+adds s1, s0, s5 # 8996
+adds s0, s1, s4 # 8997
+adds s1, s0, s3 # 8998
+adds s0, s1, s2 # 8999
+ldsi s2, 3000 # 9000
+ldsi s6003, 3001 # 9001
+ldsi s6005, 3002 # 9002
+ldsi s6007, 3003 # 9003
+ldsi s6009, 3004 # 9004
+ldsi s6011, 3005 # 9005
+ldsi s6013, 3006 # 9006
+ldsi s6015, 3007 # 9007
+ldsi s6017, 3008 # 9008
+ldsi s6019, 3009 # 9009
+ldsi s6021, 3010 # 9010
+ldsi s6023, 3011 # 9011
+ldsi s6025, 3012 # 9012
+ldsi s6027, 3013 # 9013
+ldsi s6029, 3014 # 9014
+ldsi s6031, 3015 # 9015
+ldsi s6033, 3016 # 9016
+ldsi s6035, 3017 # 9017
+ldsi s6037, 3018 # 9018
+ldsi s6039, 3019 # 9019
+ldsi s6041, 3020 # 9020
+ldsi s6043, 3021 # 9021
+ldsi s6045, 3022 # 9022
+ldsi s6047, 3023 # 9023
+ldsi s6049, 3024 # 9024
+ldsi s6051, 3025 # 9025
+ldsi s6053, 3026 # 9026
+ldsi s6055, 3027 # 9027
+ldsi s6057, 3028 # 9028
+ldsi s6059, 3029 # 9029
+ldsi s6061, 3030 # 9030
+ldsi s6063, 3031 # 9031
+ldsi s6065, 3032 # 9032
+ldsi s6067, 3033 # 9033
+ldsi s6069, 3034 # 9034
+ldsi s6071, 3035 # 9035
+ldsi s6073, 3036 # 9036
+ldsi s6075, 3037 # 9037
+ldsi s6077, 3038 # 9038
+ldsi s6079, 3039 # 9039
+ldsi s6081, 3040 # 9040
+ldsi s6083, 3041 # 9041
+ldsi s6085, 3042 # 9042
+ldsi s6087, 3043 # 9043
+ldsi s6089, 3044 # 9044
+ldsi s6091, 3045 # 9045
+ldsi s6093, 3046 # 9046
+ldsi s6095, 3047 # 9047
+ldsi s6097, 3048 # 9048
+ldsi s6099, 3049 # 9049
+ldsi s6101, 3050 # 9050
+ldsi s6103, 3051 # 9051
+ldsi s6105, 3052 # 9052
+ldsi s6107, 3053 # 9053
+ldsi s6109, 3054 # 9054
+ldsi s6111, 3055 # 9055
+ldsi s6113, 3056 # 9056
+ldsi s6115, 3057 # 9057
+ldsi s6117, 3058 # 9058
+ldsi s6119, 3059 # 9059
+ldsi s6121, 3060 # 9060
+ldsi s6123, 3061 # 9061
+ldsi s6125, 3062 # 9062
+ldsi s6127, 3063 # 9063
+ldsi s6129, 3064 # 9064
+ldsi s6131, 3065 # 9065
+ldsi s6133, 3066 # 9066
+ldsi s6135, 3067 # 9067
+ldsi s6137, 3068 # 9068
+ldsi s6139, 3069 # 9069
+ldsi s6141, 3070 # 9070
+ldsi s6143, 3071 # 9071
+ldsi s6145, 3072 # 9072
+ldsi s6147, 3073 # 9073
+ldsi s6149, 3074 # 9074
+ldsi s6151, 3075 # 9075
+ldsi s6153, 3076 # 9076
+ldsi s6155, 3077 # 9077
+ldsi s6157, 3078 # 9078
+ldsi s6159, 3079 # 9079
+ldsi s6161, 3080 # 9080
+ldsi s6163, 3081 # 9081
+ldsi s6165, 3082 # 9082
+ldsi s6167, 3083 # 9083
+ldsi s6169, 3084 # 9084
+ldsi s6171, 3085 # 9085
+ldsi s6173, 3086 # 9086
+ldsi s6175, 3087 # 9087
+ldsi s6177, 3088 # 9088
+ldsi s6179, 3089 # 9089
+ldsi s6181, 3090 # 9090
+ldsi s6183, 3091 # 9091
+ldsi s6185, 3092 # 9092
+ldsi s6187, 3093 # 9093
+ldsi s6189, 3094 # 9094
+ldsi s6191, 3095 # 9095
+ldsi s6193, 3096 # 9096
+ldsi s6195, 3097 # 9097
+ldsi s6197, 3098 # 9098
+ldsi s6199, 3099 # 9099
+ldsi s6201, 3100 # 9100
+ldsi s6203, 3101 # 9101
+ldsi s6205, 3102 # 9102
+ldsi s6207, 3103 # 9103
+ldsi s6209, 3104 # 9104
+ldsi s6211, 3105 # 9105
+ldsi s6213, 3106 # 9106
+ldsi s6215, 3107 # 9107
+ldsi s6217, 3108 # 9108
+ldsi s6219, 3109 # 9109
+ldsi s6221, 3110 # 9110
+ldsi s6223, 3111 # 9111
+ldsi s6225, 3112 # 9112
+ldsi s6227, 3113 # 9113
+ldsi s6229, 3114 # 9114
+ldsi s6231, 3115 # 9115
+ldsi s6233, 3116 # 9116
+ldsi s6235, 3117 # 9117
+ldsi s6237, 3118 # 9118
+ldsi s6239, 3119 # 9119
+ldsi s6241, 3120 # 9120
+ldsi s6243, 3121 # 9121
+ldsi s6245, 3122 # 9122
+ldsi s6247, 3123 # 9123
+ldsi s6249, 3124 # 9124
+ldsi s6251, 3125 # 9125
+ldsi s6253, 3126 # 9126
+ldsi s6255, 3127 # 9127
+ldsi s6257, 3128 # 9128
+ldsi s6259, 3129 # 9129
+ldsi s6261, 3130 # 9130
+ldsi s6263, 3131 # 9131
+ldsi s6265, 3132 # 9132
+ldsi s6267, 3133 # 9133
+ldsi s6269, 3134 # 9134
+ldsi s6271, 3135 # 9135
+ldsi s6273, 3136 # 9136
+ldsi s6275, 3137 # 9137
+ldsi s6277, 3138 # 9138
+ldsi s6279, 3139 # 9139
+ldsi s6281, 3140 # 9140
+ldsi s6283, 3141 # 9141
+ldsi s6285, 3142 # 9142
+ldsi s6287, 3143 # 9143
+ldsi s6289, 3144 # 9144
+ldsi s6291, 3145 # 9145
+ldsi s6293, 3146 # 9146
+ldsi s6295, 3147 # 9147
+ldsi s6297, 3148 # 9148
+ldsi s6299, 3149 # 9149
+ldsi s6301, 3150 # 9150
+ldsi s6303, 3151 # 9151
+ldsi s6305, 3152 # 9152
+ldsi s6307, 3153 # 9153
+ldsi s6309, 3154 # 9154
+ldsi s6311, 3155 # 9155
+ldsi s6313, 3156 # 9156
+ldsi s6315, 3157 # 9157
+ldsi s6317, 3158 # 9158
+ldsi s6319, 3159 # 9159
+ldsi s6321, 3160 # 9160
+ldsi s6323, 3161 # 9161
+ldsi s6325, 3162 # 9162
+ldsi s6327, 3163 # 9163
+ldsi s6329, 3164 # 9164
+ldsi s6331, 3165 # 9165
+ldsi s6333, 3166 # 9166
+ldsi s6335, 3167 # 9167
+ldsi s6337, 3168 # 9168
+ldsi s6339, 3169 # 9169
+ldsi s6341, 3170 # 9170
+ldsi s6343, 3171 # 9171
+ldsi s6345, 3172 # 9172
+ldsi s6347, 3173 # 9173
+ldsi s6349, 3174 # 9174
+ldsi s6351, 3175 # 9175
+ldsi s6353, 3176 # 9176
+ldsi s6355, 3177 # 9177
+ldsi s6357, 3178 # 9178
+ldsi s6359, 3179 # 9179
+ldsi s6361, 3180 # 9180
+ldsi s6363, 3181 # 9181
+ldsi s6365, 3182 # 9182
+ldsi s6367, 3183 # 9183
+ldsi s6369, 3184 # 9184
+ldsi s6371, 3185 # 9185
+ldsi s6373, 3186 # 9186
+ldsi s6375, 3187 # 9187
+ldsi s6377, 3188 # 9188
+ldsi s6379, 3189 # 9189
+ldsi s6381, 3190 # 9190
+ldsi s6383, 3191 # 9191
+ldsi s6385, 3192 # 9192
+ldsi s6387, 3193 # 9193
+ldsi s6389, 3194 # 9194
+ldsi s6391, 3195 # 9195
+ldsi s6393, 3196 # 9196
+ldsi s6395, 3197 # 9197
+ldsi s6397, 3198 # 9198
+ldsi s6399, 3199 # 9199
+ldsi s6401, 3200 # 9200
+ldsi s6403, 3201 # 9201
+ldsi s6405, 3202 # 9202
+ldsi s6407, 3203 # 9203
+ldsi s6409, 3204 # 9204
+ldsi s6411, 3205 # 9205
+ldsi s6413, 3206 # 9206
+ldsi s6415, 3207 # 9207
+ldsi s6417, 3208 # 9208
+ldsi s6419, 3209 # 9209
+ldsi s6421, 3210 # 9210
+ldsi s6423, 3211 # 9211
+ldsi s6425, 3212 # 9212
+ldsi s6427, 3213 # 9213
+ldsi s6429, 3214 # 9214
+ldsi s6431, 3215 # 9215
+ldsi s6433, 3216 # 9216
+ldsi s6435, 3217 # 9217
+ldsi s6437, 3218 # 9218
+ldsi s6439, 3219 # 9219
+ldsi s6441, 3220 # 9220
+ldsi s6443, 3221 # 9221
+ldsi s6445, 3222 # 9222
+ldsi s6447, 3223 # 9223
+ldsi s6449, 3224 # 9224
+ldsi s6451, 3225 # 9225
+ldsi s6453, 3226 # 9226
+ldsi s6455, 3227 # 9227
+ldsi s6457, 3228 # 9228
+ldsi s6459, 3229 # 9229
+ldsi s6461, 3230 # 9230
+ldsi s6463, 3231 # 9231
+ldsi s6465, 3232 # 9232
+ldsi s6467, 3233 # 9233
+ldsi s6469, 3234 # 9234
+ldsi s6471, 3235 # 9235
+ldsi s6473, 3236 # 9236
+ldsi s6475, 3237 # 9237
+ldsi s6477, 3238 # 9238
+ldsi s6479, 3239 # 9239
+ldsi s6481, 3240 # 9240
+ldsi s6483, 3241 # 9241
+ldsi s6485, 3242 # 9242
+ldsi s6487, 3243 # 9243
+ldsi s6489, 3244 # 9244
+ldsi s6491, 3245 # 9245
+ldsi s6493, 3246 # 9246
+ldsi s6495, 3247 # 9247
+ldsi s6497, 3248 # 9248
+ldsi s6499, 3249 # 9249
+ldsi s6501, 3250 # 9250
+ldsi s6503, 3251 # 9251
+ldsi s6505, 3252 # 9252
+ldsi s6507, 3253 # 9253
+ldsi s6509, 3254 # 9254
+ldsi s6511, 3255 # 9255
+ldsi s6513, 3256 # 9256
+ldsi s6515, 3257 # 9257
+ldsi s6517, 3258 # 9258
+ldsi s6519, 3259 # 9259
+ldsi s6521, 3260 # 9260
+ldsi s6523, 3261 # 9261
+ldsi s6525, 3262 # 9262
+ldsi s6527, 3263 # 9263
+ldsi s6529, 3264 # 9264
+ldsi s6531, 3265 # 9265
+ldsi s6533, 3266 # 9266
+ldsi s6535, 3267 # 9267
+ldsi s6537, 3268 # 9268
+ldsi s6539, 3269 # 9269
+ldsi s6541, 3270 # 9270
+ldsi s6543, 3271 # 9271
+ldsi s6545, 3272 # 9272
+ldsi s6547, 3273 # 9273
+ldsi s6549, 3274 # 9274
+ldsi s6551, 3275 # 9275
+ldsi s6553, 3276 # 9276
+ldsi s6555, 3277 # 9277
+ldsi s6557, 3278 # 9278
+ldsi s6559, 3279 # 9279
+ldsi s6561, 3280 # 9280
+ldsi s6563, 3281 # 9281
+ldsi s6565, 3282 # 9282
+ldsi s6567, 3283 # 9283
+ldsi s6569, 3284 # 9284
+ldsi s6571, 3285 # 9285
+ldsi s6573, 3286 # 9286
+ldsi s6575, 3287 # 9287
+ldsi s6577, 3288 # 9288
+ldsi s6579, 3289 # 9289
+ldsi s6581, 3290 # 9290
+ldsi s6583, 3291 # 9291
+ldsi s6585, 3292 # 9292
+ldsi s6587, 3293 # 9293
+ldsi s6589, 3294 # 9294
+ldsi s6591, 3295 # 9295
+ldsi s6593, 3296 # 9296
+ldsi s6595, 3297 # 9297
+ldsi s6597, 3298 # 9298
+ldsi s6599, 3299 # 9299
+ldsi s6601, 3300 # 9300
+ldsi s6603, 3301 # 9301
+ldsi s6605, 3302 # 9302
+ldsi s6607, 3303 # 9303
+ldsi s6609, 3304 # 9304
+ldsi s6611, 3305 # 9305
+ldsi s6613, 3306 # 9306
+ldsi s6615, 3307 # 9307
+ldsi s6617, 3308 # 9308
+ldsi s6619, 3309 # 9309
+ldsi s6621, 3310 # 9310
+ldsi s6623, 3311 # 9311
+ldsi s6625, 3312 # 9312
+ldsi s6627, 3313 # 9313
+ldsi s6629, 3314 # 9314
+ldsi s6631, 3315 # 9315
+ldsi s6633, 3316 # 9316
+ldsi s6635, 3317 # 9317
+ldsi s6637, 3318 # 9318
+ldsi s6639, 3319 # 9319
+ldsi s6641, 3320 # 9320
+ldsi s6643, 3321 # 9321
+ldsi s6645, 3322 # 9322
+ldsi s6647, 3323 # 9323
+ldsi s6649, 3324 # 9324
+ldsi s6651, 3325 # 9325
+ldsi s6653, 3326 # 9326
+ldsi s6655, 3327 # 9327
+ldsi s6657, 3328 # 9328
+ldsi s6659, 3329 # 9329
+ldsi s6661, 3330 # 9330
+ldsi s6663, 3331 # 9331
+ldsi s6665, 3332 # 9332
+ldsi s6667, 3333 # 9333
+ldsi s6669, 3334 # 9334
+ldsi s6671, 3335 # 9335
+ldsi s6673, 3336 # 9336
+ldsi s6675, 3337 # 9337
+ldsi s6677, 3338 # 9338
+ldsi s6679, 3339 # 9339
+ldsi s6681, 3340 # 9340
+ldsi s6683, 3341 # 9341
+ldsi s6685, 3342 # 9342
+ldsi s6687, 3343 # 9343
+ldsi s6689, 3344 # 9344
+ldsi s6691, 3345 # 9345
+ldsi s6693, 3346 # 9346
+ldsi s6695, 3347 # 9347
+ldsi s6697, 3348 # 9348
+ldsi s6699, 3349 # 9349
+ldsi s6701, 3350 # 9350
+ldsi s6703, 3351 # 9351
+ldsi s6705, 3352 # 9352
+ldsi s6707, 3353 # 9353
+ldsi s6709, 3354 # 9354
+ldsi s6711, 3355 # 9355
+ldsi s6713, 3356 # 9356
+ldsi s6715, 3357 # 9357
+ldsi s6717, 3358 # 9358
+ldsi s6719, 3359 # 9359
+ldsi s6721, 3360 # 9360
+ldsi s6723, 3361 # 9361
+ldsi s6725, 3362 # 9362
+ldsi s6727, 3363 # 9363
+ldsi s6729, 3364 # 9364
+ldsi s6731, 3365 # 9365
+ldsi s6733, 3366 # 9366
+ldsi s6735, 3367 # 9367
+ldsi s6737, 3368 # 9368
+ldsi s6739, 3369 # 9369
+ldsi s6741, 3370 # 9370
+ldsi s6743, 3371 # 9371
+ldsi s6745, 3372 # 9372
+ldsi s6747, 3373 # 9373
+ldsi s6749, 3374 # 9374
+ldsi s6751, 3375 # 9375
+ldsi s6753, 3376 # 9376
+ldsi s6755, 3377 # 9377
+ldsi s6757, 3378 # 9378
+ldsi s6759, 3379 # 9379
+ldsi s6761, 3380 # 9380
+ldsi s6763, 3381 # 9381
+ldsi s6765, 3382 # 9382
+ldsi s6767, 3383 # 9383
+ldsi s6769, 3384 # 9384
+ldsi s6771, 3385 # 9385
+ldsi s6773, 3386 # 9386
+ldsi s6775, 3387 # 9387
+ldsi s6777, 3388 # 9388
+ldsi s6779, 3389 # 9389
+ldsi s6781, 3390 # 9390
+ldsi s6783, 3391 # 9391
+ldsi s6785, 3392 # 9392
+ldsi s6787, 3393 # 9393
+ldsi s6789, 3394 # 9394
+ldsi s6791, 3395 # 9395
+ldsi s6793, 3396 # 9396
+ldsi s6795, 3397 # 9397
+ldsi s6797, 3398 # 9398
+ldsi s6799, 3399 # 9399
+ldsi s6801, 3400 # 9400
+ldsi s6803, 3401 # 9401
+ldsi s6805, 3402 # 9402
+ldsi s6807, 3403 # 9403
+ldsi s6809, 3404 # 9404
+ldsi s6811, 3405 # 9405
+ldsi s6813, 3406 # 9406
+ldsi s6815, 3407 # 9407
+ldsi s6817, 3408 # 9408
+ldsi s6819, 3409 # 9409
+ldsi s6821, 3410 # 9410
+ldsi s6823, 3411 # 9411
+ldsi s6825, 3412 # 9412
+ldsi s6827, 3413 # 9413
+ldsi s6829, 3414 # 9414
+ldsi s6831, 3415 # 9415
+ldsi s6833, 3416 # 9416
+ldsi s6835, 3417 # 9417
+ldsi s6837, 3418 # 9418
+ldsi s6839, 3419 # 9419
+ldsi s6841, 3420 # 9420
+ldsi s6843, 3421 # 9421
+ldsi s6845, 3422 # 9422
+ldsi s6847, 3423 # 9423
+ldsi s6849, 3424 # 9424
+ldsi s6851, 3425 # 9425
+ldsi s6853, 3426 # 9426
+ldsi s6855, 3427 # 9427
+ldsi s6857, 3428 # 9428
+ldsi s6859, 3429 # 9429
+ldsi s6861, 3430 # 9430
+ldsi s6863, 3431 # 9431
+ldsi s6865, 3432 # 9432
+ldsi s6867, 3433 # 9433
+ldsi s6869, 3434 # 9434
+ldsi s6871, 3435 # 9435
+ldsi s6873, 3436 # 9436
+ldsi s6875, 3437 # 9437
+ldsi s6877, 3438 # 9438
+ldsi s6879, 3439 # 9439
+ldsi s6881, 3440 # 9440
+ldsi s6883, 3441 # 9441
+ldsi s6885, 3442 # 9442
+ldsi s6887, 3443 # 9443
+ldsi s6889, 3444 # 9444
+ldsi s6891, 3445 # 9445
+ldsi s6893, 3446 # 9446
+ldsi s6895, 3447 # 9447
+ldsi s6897, 3448 # 9448
+ldsi s6899, 3449 # 9449
+ldsi s6901, 3450 # 9450
+ldsi s6903, 3451 # 9451
+ldsi s6905, 3452 # 9452
+ldsi s6907, 3453 # 9453
+ldsi s6909, 3454 # 9454
+ldsi s6911, 3455 # 9455
+ldsi s6913, 3456 # 9456
+ldsi s6915, 3457 # 9457
+ldsi s6917, 3458 # 9458
+ldsi s6919, 3459 # 9459
+ldsi s6921, 3460 # 9460
+ldsi s6923, 3461 # 9461
+ldsi s6925, 3462 # 9462
+ldsi s6927, 3463 # 9463
+ldsi s6929, 3464 # 9464
+ldsi s6931, 3465 # 9465
+ldsi s6933, 3466 # 9466
+ldsi s6935, 3467 # 9467
+ldsi s6937, 3468 # 9468
+ldsi s6939, 3469 # 9469
+ldsi s6941, 3470 # 9470
+ldsi s6943, 3471 # 9471
+ldsi s6945, 3472 # 9472
+ldsi s6947, 3473 # 9473
+ldsi s6949, 3474 # 9474
+ldsi s6951, 3475 # 9475
+ldsi s6953, 3476 # 9476
+ldsi s6955, 3477 # 9477
+ldsi s6957, 3478 # 9478
+ldsi s6959, 3479 # 9479
+ldsi s6961, 3480 # 9480
+ldsi s6963, 3481 # 9481
+ldsi s6965, 3482 # 9482
+ldsi s6967, 3483 # 9483
+ldsi s6969, 3484 # 9484
+ldsi s6971, 3485 # 9485
+ldsi s6973, 3486 # 9486
+ldsi s6975, 3487 # 9487
+ldsi s6977, 3488 # 9488
+ldsi s6979, 3489 # 9489
+ldsi s6981, 3490 # 9490
+ldsi s6983, 3491 # 9491
+ldsi s6985, 3492 # 9492
+ldsi s6987, 3493 # 9493
+ldsi s6989, 3494 # 9494
+ldsi s6991, 3495 # 9495
+ldsi s6993, 3496 # 9496
+ldsi s6995, 3497 # 9497
+ldsi s6997, 3498 # 9498
+ldsi s6999, 3499 # 9499
+ldsi s7001, 3500 # 9500
+ldsi s7003, 3501 # 9501
+ldsi s7005, 3502 # 9502
+ldsi s7007, 3503 # 9503
+ldsi s7009, 3504 # 9504
+ldsi s7011, 3505 # 9505
+ldsi s7013, 3506 # 9506
+ldsi s7015, 3507 # 9507
+ldsi s7017, 3508 # 9508
+ldsi s7019, 3509 # 9509
+ldsi s7021, 3510 # 9510
+ldsi s7023, 3511 # 9511
+ldsi s7025, 3512 # 9512
+ldsi s7027, 3513 # 9513
+ldsi s7029, 3514 # 9514
+ldsi s7031, 3515 # 9515
+ldsi s7033, 3516 # 9516
+ldsi s7035, 3517 # 9517
+ldsi s7037, 3518 # 9518
+ldsi s7039, 3519 # 9519
+ldsi s7041, 3520 # 9520
+ldsi s7043, 3521 # 9521
+ldsi s7045, 3522 # 9522
+ldsi s7047, 3523 # 9523
+ldsi s7049, 3524 # 9524
+ldsi s7051, 3525 # 9525
+ldsi s7053, 3526 # 9526
+ldsi s7055, 3527 # 9527
+ldsi s7057, 3528 # 9528
+ldsi s7059, 3529 # 9529
+ldsi s7061, 3530 # 9530
+ldsi s7063, 3531 # 9531
+ldsi s7065, 3532 # 9532
+ldsi s7067, 3533 # 9533
+ldsi s7069, 3534 # 9534
+ldsi s7071, 3535 # 9535
+ldsi s7073, 3536 # 9536
+ldsi s7075, 3537 # 9537
+ldsi s7077, 3538 # 9538
+ldsi s7079, 3539 # 9539
+ldsi s7081, 3540 # 9540
+ldsi s7083, 3541 # 9541
+ldsi s7085, 3542 # 9542
+ldsi s7087, 3543 # 9543
+ldsi s7089, 3544 # 9544
+ldsi s7091, 3545 # 9545
+ldsi s7093, 3546 # 9546
+ldsi s7095, 3547 # 9547
+ldsi s7097, 3548 # 9548
+ldsi s7099, 3549 # 9549
+ldsi s7101, 3550 # 9550
+ldsi s7103, 3551 # 9551
+ldsi s7105, 3552 # 9552
+ldsi s7107, 3553 # 9553
+ldsi s7109, 3554 # 9554
+ldsi s7111, 3555 # 9555
+ldsi s7113, 3556 # 9556
+ldsi s7115, 3557 # 9557
+ldsi s7117, 3558 # 9558
+ldsi s7119, 3559 # 9559
+ldsi s7121, 3560 # 9560
+ldsi s7123, 3561 # 9561
+ldsi s7125, 3562 # 9562
+ldsi s7127, 3563 # 9563
+ldsi s7129, 3564 # 9564
+ldsi s7131, 3565 # 9565
+ldsi s7133, 3566 # 9566
+ldsi s7135, 3567 # 9567
+ldsi s7137, 3568 # 9568
+ldsi s7139, 3569 # 9569
+ldsi s7141, 3570 # 9570
+ldsi s7143, 3571 # 9571
+ldsi s7145, 3572 # 9572
+ldsi s7147, 3573 # 9573
+ldsi s7149, 3574 # 9574
+ldsi s7151, 3575 # 9575
+ldsi s7153, 3576 # 9576
+ldsi s7155, 3577 # 9577
+ldsi s7157, 3578 # 9578
+ldsi s7159, 3579 # 9579
+ldsi s7161, 3580 # 9580
+ldsi s7163, 3581 # 9581
+ldsi s7165, 3582 # 9582
+ldsi s7167, 3583 # 9583
+ldsi s7169, 3584 # 9584
+ldsi s7171, 3585 # 9585
+ldsi s7173, 3586 # 9586
+ldsi s7175, 3587 # 9587
+ldsi s7177, 3588 # 9588
+ldsi s7179, 3589 # 9589
+ldsi s7181, 3590 # 9590
+ldsi s7183, 3591 # 9591
+ldsi s7185, 3592 # 9592
+ldsi s7187, 3593 # 9593
+ldsi s7189, 3594 # 9594
+ldsi s7191, 3595 # 9595
+ldsi s7193, 3596 # 9596
+ldsi s7195, 3597 # 9597
+ldsi s7197, 3598 # 9598
+ldsi s7199, 3599 # 9599
+ldsi s7201, 3600 # 9600
+ldsi s7203, 3601 # 9601
+ldsi s7205, 3602 # 9602
+ldsi s7207, 3603 # 9603
+ldsi s7209, 3604 # 9604
+ldsi s7211, 3605 # 9605
+ldsi s7213, 3606 # 9606
+ldsi s7215, 3607 # 9607
+ldsi s7217, 3608 # 9608
+ldsi s7219, 3609 # 9609
+ldsi s7221, 3610 # 9610
+ldsi s7223, 3611 # 9611
+ldsi s7225, 3612 # 9612
+ldsi s7227, 3613 # 9613
+ldsi s7229, 3614 # 9614
+ldsi s7231, 3615 # 9615
+ldsi s7233, 3616 # 9616
+ldsi s7235, 3617 # 9617
+ldsi s7237, 3618 # 9618
+ldsi s7239, 3619 # 9619
+ldsi s7241, 3620 # 9620
+ldsi s7243, 3621 # 9621
+ldsi s7245, 3622 # 9622
+ldsi s7247, 3623 # 9623
+ldsi s7249, 3624 # 9624
+ldsi s7251, 3625 # 9625
+ldsi s7253, 3626 # 9626
+ldsi s7255, 3627 # 9627
+ldsi s7257, 3628 # 9628
+ldsi s7259, 3629 # 9629
+ldsi s7261, 3630 # 9630
+ldsi s7263, 3631 # 9631
+ldsi s7265, 3632 # 9632
+ldsi s7267, 3633 # 9633
+ldsi s7269, 3634 # 9634
+ldsi s7271, 3635 # 9635
+ldsi s7273, 3636 # 9636
+ldsi s7275, 3637 # 9637
+ldsi s7277, 3638 # 9638
+ldsi s7279, 3639 # 9639
+ldsi s7281, 3640 # 9640
+ldsi s7283, 3641 # 9641
+ldsi s7285, 3642 # 9642
+ldsi s7287, 3643 # 9643
+ldsi s7289, 3644 # 9644
+ldsi s7291, 3645 # 9645
+ldsi s7293, 3646 # 9646
+ldsi s7295, 3647 # 9647
+ldsi s7297, 3648 # 9648
+ldsi s7299, 3649 # 9649
+ldsi s7301, 3650 # 9650
+ldsi s7303, 3651 # 9651
+ldsi s7305, 3652 # 9652
+ldsi s7307, 3653 # 9653
+ldsi s7309, 3654 # 9654
+ldsi s7311, 3655 # 9655
+ldsi s7313, 3656 # 9656
+ldsi s7315, 3657 # 9657
+ldsi s7317, 3658 # 9658
+ldsi s7319, 3659 # 9659
+ldsi s7321, 3660 # 9660
+ldsi s7323, 3661 # 9661
+ldsi s7325, 3662 # 9662
+ldsi s7327, 3663 # 9663
+ldsi s7329, 3664 # 9664
+ldsi s7331, 3665 # 9665
+ldsi s7333, 3666 # 9666
+ldsi s7335, 3667 # 9667
+ldsi s7337, 3668 # 9668
+ldsi s7339, 3669 # 9669
+ldsi s7341, 3670 # 9670
+ldsi s7343, 3671 # 9671
+ldsi s7345, 3672 # 9672
+ldsi s7347, 3673 # 9673
+ldsi s7349, 3674 # 9674
+ldsi s7351, 3675 # 9675
+ldsi s7353, 3676 # 9676
+ldsi s7355, 3677 # 9677
+ldsi s7357, 3678 # 9678
+ldsi s7359, 3679 # 9679
+ldsi s7361, 3680 # 9680
+ldsi s7363, 3681 # 9681
+ldsi s7365, 3682 # 9682
+ldsi s7367, 3683 # 9683
+ldsi s7369, 3684 # 9684
+ldsi s7371, 3685 # 9685
+ldsi s7373, 3686 # 9686
+ldsi s7375, 3687 # 9687
+ldsi s7377, 3688 # 9688
+ldsi s7379, 3689 # 9689
+ldsi s7381, 3690 # 9690
+ldsi s7383, 3691 # 9691
+ldsi s7385, 3692 # 9692
+ldsi s7387, 3693 # 9693
+ldsi s7389, 3694 # 9694
+ldsi s7391, 3695 # 9695
+ldsi s7393, 3696 # 9696
+ldsi s7395, 3697 # 9697
+ldsi s7397, 3698 # 9698
+ldsi s7399, 3699 # 9699
+ldsi s7401, 3700 # 9700
+ldsi s7403, 3701 # 9701
+ldsi s7405, 3702 # 9702
+ldsi s7407, 3703 # 9703
+ldsi s7409, 3704 # 9704
+ldsi s7411, 3705 # 9705
+ldsi s7413, 3706 # 9706
+ldsi s7415, 3707 # 9707
+ldsi s7417, 3708 # 9708
+ldsi s7419, 3709 # 9709
+ldsi s7421, 3710 # 9710
+ldsi s7423, 3711 # 9711
+ldsi s7425, 3712 # 9712
+ldsi s7427, 3713 # 9713
+ldsi s7429, 3714 # 9714
+ldsi s7431, 3715 # 9715
+ldsi s7433, 3716 # 9716
+ldsi s7435, 3717 # 9717
+ldsi s7437, 3718 # 9718
+ldsi s7439, 3719 # 9719
+ldsi s7441, 3720 # 9720
+ldsi s7443, 3721 # 9721
+ldsi s7445, 3722 # 9722
+ldsi s7447, 3723 # 9723
+ldsi s7449, 3724 # 9724
+ldsi s7451, 3725 # 9725
+ldsi s7453, 3726 # 9726
+ldsi s7455, 3727 # 9727
+ldsi s7457, 3728 # 9728
+ldsi s7459, 3729 # 9729
+ldsi s7461, 3730 # 9730
+ldsi s7463, 3731 # 9731
+ldsi s7465, 3732 # 9732
+ldsi s7467, 3733 # 9733
+ldsi s7469, 3734 # 9734
+ldsi s7471, 3735 # 9735
+ldsi s7473, 3736 # 9736
+ldsi s7475, 3737 # 9737
+ldsi s7477, 3738 # 9738
+ldsi s7479, 3739 # 9739
+ldsi s7481, 3740 # 9740
+ldsi s7483, 3741 # 9741
+ldsi s7485, 3742 # 9742
+ldsi s7487, 3743 # 9743
+ldsi s7489, 3744 # 9744
+ldsi s7491, 3745 # 9745
+ldsi s7493, 3746 # 9746
+ldsi s7495, 3747 # 9747
+ldsi s7497, 3748 # 9748
+ldsi s7499, 3749 # 9749
+ldsi s7501, 3750 # 9750
+ldsi s7503, 3751 # 9751
+ldsi s7505, 3752 # 9752
+ldsi s7507, 3753 # 9753
+ldsi s7509, 3754 # 9754
+ldsi s7511, 3755 # 9755
+ldsi s7513, 3756 # 9756
+ldsi s7515, 3757 # 9757
+ldsi s7517, 3758 # 9758
+ldsi s7519, 3759 # 9759
+ldsi s7521, 3760 # 9760
+ldsi s7523, 3761 # 9761
+ldsi s7525, 3762 # 9762
+ldsi s7527, 3763 # 9763
+ldsi s7529, 3764 # 9764
+ldsi s7531, 3765 # 9765
+ldsi s7533, 3766 # 9766
+ldsi s7535, 3767 # 9767
+ldsi s7537, 3768 # 9768
+ldsi s7539, 3769 # 9769
+ldsi s7541, 3770 # 9770
+ldsi s7543, 3771 # 9771
+ldsi s7545, 3772 # 9772
+ldsi s7547, 3773 # 9773
+ldsi s7549, 3774 # 9774
+ldsi s7551, 3775 # 9775
+ldsi s7553, 3776 # 9776
+ldsi s7555, 3777 # 9777
+ldsi s7557, 3778 # 9778
+ldsi s7559, 3779 # 9779
+ldsi s7561, 3780 # 9780
+ldsi s7563, 3781 # 9781
+ldsi s7565, 3782 # 9782
+ldsi s7567, 3783 # 9783
+ldsi s7569, 3784 # 9784
+ldsi s7571, 3785 # 9785
+ldsi s7573, 3786 # 9786
+ldsi s7575, 3787 # 9787
+ldsi s7577, 3788 # 9788
+ldsi s7579, 3789 # 9789
+ldsi s7581, 3790 # 9790
+ldsi s7583, 3791 # 9791
+ldsi s7585, 3792 # 9792
+ldsi s7587, 3793 # 9793
+ldsi s7589, 3794 # 9794
+ldsi s7591, 3795 # 9795
+ldsi s7593, 3796 # 9796
+ldsi s7595, 3797 # 9797
+ldsi s7597, 3798 # 9798
+ldsi s7599, 3799 # 9799
+ldsi s7601, 3800 # 9800
+ldsi s7603, 3801 # 9801
+ldsi s7605, 3802 # 9802
+ldsi s7607, 3803 # 9803
+ldsi s7609, 3804 # 9804
+ldsi s7611, 3805 # 9805
+ldsi s7613, 3806 # 9806
+ldsi s7615, 3807 # 9807
+ldsi s7617, 3808 # 9808
+ldsi s7619, 3809 # 9809
+ldsi s7621, 3810 # 9810
+ldsi s7623, 3811 # 9811
+ldsi s7625, 3812 # 9812
+ldsi s7627, 3813 # 9813
+ldsi s7629, 3814 # 9814
+ldsi s7631, 3815 # 9815
+ldsi s7633, 3816 # 9816
+ldsi s7635, 3817 # 9817
+ldsi s7637, 3818 # 9818
+ldsi s7639, 3819 # 9819
+ldsi s7641, 3820 # 9820
+ldsi s7643, 3821 # 9821
+ldsi s7645, 3822 # 9822
+ldsi s7647, 3823 # 9823
+ldsi s7649, 3824 # 9824
+ldsi s7651, 3825 # 9825
+ldsi s7653, 3826 # 9826
+ldsi s7655, 3827 # 9827
+ldsi s7657, 3828 # 9828
+ldsi s7659, 3829 # 9829
+ldsi s7661, 3830 # 9830
+ldsi s7663, 3831 # 9831
+ldsi s7665, 3832 # 9832
+ldsi s7667, 3833 # 9833
+ldsi s7669, 3834 # 9834
+ldsi s7671, 3835 # 9835
+ldsi s7673, 3836 # 9836
+ldsi s7675, 3837 # 9837
+ldsi s7677, 3838 # 9838
+ldsi s7679, 3839 # 9839
+ldsi s7681, 3840 # 9840
+ldsi s7683, 3841 # 9841
+ldsi s7685, 3842 # 9842
+ldsi s7687, 3843 # 9843
+ldsi s7689, 3844 # 9844
+ldsi s7691, 3845 # 9845
+ldsi s7693, 3846 # 9846
+ldsi s7695, 3847 # 9847
+ldsi s7697, 3848 # 9848
+ldsi s7699, 3849 # 9849
+ldsi s7701, 3850 # 9850
+ldsi s7703, 3851 # 9851
+ldsi s7705, 3852 # 9852
+ldsi s7707, 3853 # 9853
+ldsi s7709, 3854 # 9854
+ldsi s7711, 3855 # 9855
+ldsi s7713, 3856 # 9856
+ldsi s7715, 3857 # 9857
+ldsi s7717, 3858 # 9858
+ldsi s7719, 3859 # 9859
+ldsi s7721, 3860 # 9860
+ldsi s7723, 3861 # 9861
+ldsi s7725, 3862 # 9862
+ldsi s7727, 3863 # 9863
+ldsi s7729, 3864 # 9864
+ldsi s7731, 3865 # 9865
+ldsi s7733, 3866 # 9866
+ldsi s7735, 3867 # 9867
+ldsi s7737, 3868 # 9868
+ldsi s7739, 3869 # 9869
+ldsi s7741, 3870 # 9870
+ldsi s7743, 3871 # 9871
+ldsi s7745, 3872 # 9872
+ldsi s7747, 3873 # 9873
+ldsi s7749, 3874 # 9874
+ldsi s7751, 3875 # 9875
+ldsi s7753, 3876 # 9876
+ldsi s7755, 3877 # 9877
+ldsi s7757, 3878 # 9878
+ldsi s7759, 3879 # 9879
+ldsi s7761, 3880 # 9880
+ldsi s7763, 3881 # 9881
+ldsi s7765, 3882 # 9882
+ldsi s7767, 3883 # 9883
+ldsi s7769, 3884 # 9884
+ldsi s7771, 3885 # 9885
+ldsi s7773, 3886 # 9886
+ldsi s7775, 3887 # 9887
+ldsi s7777, 3888 # 9888
+ldsi s7779, 3889 # 9889
+ldsi s7781, 3890 # 9890
+ldsi s7783, 3891 # 9891
+ldsi s7785, 3892 # 9892
+ldsi s7787, 3893 # 9893
+ldsi s7789, 3894 # 9894
+ldsi s7791, 3895 # 9895
+ldsi s7793, 3896 # 9896
+ldsi s7795, 3897 # 9897
+ldsi s7797, 3898 # 9898
+ldsi s7799, 3899 # 9899
+ldsi s7801, 3900 # 9900
+ldsi s7803, 3901 # 9901
+ldsi s7805, 3902 # 9902
+ldsi s7807, 3903 # 9903
+ldsi s7809, 3904 # 9904
+ldsi s7811, 3905 # 9905
+ldsi s7813, 3906 # 9906
+ldsi s7815, 3907 # 9907
+ldsi s7817, 3908 # 9908
+ldsi s7819, 3909 # 9909
+ldsi s7821, 3910 # 9910
+ldsi s7823, 3911 # 9911
+ldsi s7825, 3912 # 9912
+ldsi s7827, 3913 # 9913
+ldsi s7829, 3914 # 9914
+ldsi s7831, 3915 # 9915
+ldsi s7833, 3916 # 9916
+ldsi s7835, 3917 # 9917
+ldsi s7837, 3918 # 9918
+ldsi s7839, 3919 # 9919
+ldsi s7841, 3920 # 9920
+ldsi s7843, 3921 # 9921
+ldsi s7845, 3922 # 9922
+ldsi s7847, 3923 # 9923
+ldsi s7849, 3924 # 9924
+ldsi s7851, 3925 # 9925
+ldsi s7853, 3926 # 9926
+ldsi s7855, 3927 # 9927
+ldsi s7857, 3928 # 9928
+ldsi s7859, 3929 # 9929
+ldsi s7861, 3930 # 9930
+ldsi s7863, 3931 # 9931
+ldsi s7865, 3932 # 9932
+ldsi s7867, 3933 # 9933
+ldsi s7869, 3934 # 9934
+ldsi s7871, 3935 # 9935
+ldsi s7873, 3936 # 9936
+ldsi s7875, 3937 # 9937
+ldsi s7877, 3938 # 9938
+ldsi s7879, 3939 # 9939
+ldsi s7881, 3940 # 9940
+ldsi s7883, 3941 # 9941
+ldsi s7885, 3942 # 9942
+ldsi s7887, 3943 # 9943
+ldsi s7889, 3944 # 9944
+ldsi s7891, 3945 # 9945
+ldsi s7893, 3946 # 9946
+ldsi s7895, 3947 # 9947
+ldsi s7897, 3948 # 9948
+ldsi s7899, 3949 # 9949
+ldsi s7901, 3950 # 9950
+ldsi s7903, 3951 # 9951
+ldsi s7905, 3952 # 9952
+ldsi s7907, 3953 # 9953
+ldsi s7909, 3954 # 9954
+ldsi s7911, 3955 # 9955
+ldsi s7913, 3956 # 9956
+ldsi s7915, 3957 # 9957
+ldsi s7917, 3958 # 9958
+ldsi s7919, 3959 # 9959
+ldsi s7921, 3960 # 9960
+ldsi s7923, 3961 # 9961
+ldsi s7925, 3962 # 9962
+ldsi s7927, 3963 # 9963
+ldsi s7929, 3964 # 9964
+ldsi s7931, 3965 # 9965
+ldsi s7933, 3966 # 9966
+ldsi s7935, 3967 # 9967
+ldsi s7937, 3968 # 9968
+ldsi s7939, 3969 # 9969
+ldsi s7941, 3970 # 9970
+ldsi s7943, 3971 # 9971
+ldsi s7945, 3972 # 9972
+ldsi s7947, 3973 # 9973
+ldsi s7949, 3974 # 9974
+ldsi s7951, 3975 # 9975
+ldsi s7953, 3976 # 9976
+ldsi s7955, 3977 # 9977
+ldsi s7957, 3978 # 9978
+ldsi s7959, 3979 # 9979
+ldsi s7961, 3980 # 9980
+ldsi s7963, 3981 # 9981
+ldsi s7965, 3982 # 9982
+ldsi s7967, 3983 # 9983
+ldsi s7969, 3984 # 9984
+ldsi s7971, 3985 # 9985
+ldsi s7973, 3986 # 9986
+ldsi s7975, 3987 # 9987
+ldsi s7977, 3988 # 9988
+ldsi s7979, 3989 # 9989
+ldsi s7981, 3990 # 9990
+ldsi s7983, 3991 # 9991
+ldsi s7985, 3992 # 9992
+ldsi s7987, 3993 # 9993
+ldsi s7989, 3994 # 9994
+ldsi s7991, 3995 # 9995
+ldsi s7993, 3996 # 9996
+ldsi s7995, 3997 # 9997
+ldsi s7997, 3998 # 9998
+ldsi s7999, 3999 # 9999
+ldsi s8001, 4000 # 10000
+ldsi s8003, 4001 # 10001
+ldsi s8005, 4002 # 10002
+ldsi s8007, 4003 # 10003
+ldsi s8009, 4004 # 10004
+ldsi s8011, 4005 # 10005
+ldsi s8013, 4006 # 10006
+ldsi s8015, 4007 # 10007
+ldsi s8017, 4008 # 10008
+ldsi s8019, 4009 # 10009
+ldsi s8021, 4010 # 10010
+ldsi s8023, 4011 # 10011
+ldsi s8025, 4012 # 10012
+ldsi s8027, 4013 # 10013
+ldsi s8029, 4014 # 10014
+ldsi s8031, 4015 # 10015
+ldsi s8033, 4016 # 10016
+ldsi s8035, 4017 # 10017
+ldsi s8037, 4018 # 10018
+ldsi s8039, 4019 # 10019
+ldsi s8041, 4020 # 10020
+ldsi s8043, 4021 # 10021
+ldsi s8045, 4022 # 10022
+ldsi s8047, 4023 # 10023
+ldsi s8049, 4024 # 10024
+ldsi s8051, 4025 # 10025
+ldsi s8053, 4026 # 10026
+ldsi s8055, 4027 # 10027
+ldsi s8057, 4028 # 10028
+ldsi s8059, 4029 # 10029
+ldsi s8061, 4030 # 10030
+ldsi s8063, 4031 # 10031
+ldsi s8065, 4032 # 10032
+ldsi s8067, 4033 # 10033
+ldsi s8069, 4034 # 10034
+ldsi s8071, 4035 # 10035
+ldsi s8073, 4036 # 10036
+ldsi s8075, 4037 # 10037
+ldsi s8077, 4038 # 10038
+ldsi s8079, 4039 # 10039
+ldsi s8081, 4040 # 10040
+ldsi s8083, 4041 # 10041
+ldsi s8085, 4042 # 10042
+ldsi s8087, 4043 # 10043
+ldsi s8089, 4044 # 10044
+ldsi s8091, 4045 # 10045
+ldsi s8093, 4046 # 10046
+ldsi s8095, 4047 # 10047
+ldsi s8097, 4048 # 10048
+ldsi s8099, 4049 # 10049
+ldsi s8101, 4050 # 10050
+ldsi s8103, 4051 # 10051
+ldsi s8105, 4052 # 10052
+ldsi s8107, 4053 # 10053
+ldsi s8109, 4054 # 10054
+ldsi s8111, 4055 # 10055
+ldsi s8113, 4056 # 10056
+ldsi s8115, 4057 # 10057
+ldsi s8117, 4058 # 10058
+ldsi s8119, 4059 # 10059
+ldsi s8121, 4060 # 10060
+ldsi s8123, 4061 # 10061
+ldsi s8125, 4062 # 10062
+ldsi s8127, 4063 # 10063
+ldsi s8129, 4064 # 10064
+ldsi s8131, 4065 # 10065
+ldsi s8133, 4066 # 10066
+ldsi s8135, 4067 # 10067
+ldsi s8137, 4068 # 10068
+ldsi s8139, 4069 # 10069
+ldsi s8141, 4070 # 10070
+ldsi s8143, 4071 # 10071
+ldsi s8145, 4072 # 10072
+ldsi s8147, 4073 # 10073
+ldsi s8149, 4074 # 10074
+ldsi s8151, 4075 # 10075
+ldsi s8153, 4076 # 10076
+ldsi s8155, 4077 # 10077
+ldsi s8157, 4078 # 10078
+ldsi s8159, 4079 # 10079
+ldsi s8161, 4080 # 10080
+ldsi s8163, 4081 # 10081
+ldsi s8165, 4082 # 10082
+ldsi s8167, 4083 # 10083
+ldsi s8169, 4084 # 10084
+ldsi s8171, 4085 # 10085
+ldsi s8173, 4086 # 10086
+ldsi s8175, 4087 # 10087
+ldsi s8177, 4088 # 10088
+ldsi s8179, 4089 # 10089
+ldsi s8181, 4090 # 10090
+ldsi s8183, 4091 # 10091
+ldsi s8185, 4092 # 10092
+ldsi s8187, 4093 # 10093
+ldsi s8189, 4094 # 10094
+ldsi s8191, 4095 # 10095
+ldsi s8193, 4096 # 10096
+ldsi s8195, 4097 # 10097
+ldsi s8197, 4098 # 10098
+ldsi s8199, 4099 # 10099
+ldsi s8201, 4100 # 10100
+ldsi s8203, 4101 # 10101
+ldsi s8205, 4102 # 10102
+ldsi s8207, 4103 # 10103
+ldsi s8209, 4104 # 10104
+ldsi s8211, 4105 # 10105
+ldsi s8213, 4106 # 10106
+ldsi s8215, 4107 # 10107
+ldsi s8217, 4108 # 10108
+ldsi s8219, 4109 # 10109
+ldsi s8221, 4110 # 10110
+ldsi s8223, 4111 # 10111
+ldsi s8225, 4112 # 10112
+ldsi s8227, 4113 # 10113
+ldsi s8229, 4114 # 10114
+ldsi s8231, 4115 # 10115
+ldsi s8233, 4116 # 10116
+ldsi s8235, 4117 # 10117
+ldsi s8237, 4118 # 10118
+ldsi s8239, 4119 # 10119
+ldsi s8241, 4120 # 10120
+ldsi s8243, 4121 # 10121
+ldsi s8245, 4122 # 10122
+ldsi s8247, 4123 # 10123
+ldsi s8249, 4124 # 10124
+ldsi s8251, 4125 # 10125
+ldsi s8253, 4126 # 10126
+ldsi s8255, 4127 # 10127
+ldsi s8257, 4128 # 10128
+ldsi s8259, 4129 # 10129
+ldsi s8261, 4130 # 10130
+ldsi s8263, 4131 # 10131
+ldsi s8265, 4132 # 10132
+ldsi s8267, 4133 # 10133
+ldsi s8269, 4134 # 10134
+ldsi s8271, 4135 # 10135
+ldsi s8273, 4136 # 10136
+ldsi s8275, 4137 # 10137
+ldsi s8277, 4138 # 10138
+ldsi s8279, 4139 # 10139
+ldsi s8281, 4140 # 10140
+ldsi s8283, 4141 # 10141
+ldsi s8285, 4142 # 10142
+ldsi s8287, 4143 # 10143
+ldsi s8289, 4144 # 10144
+ldsi s8291, 4145 # 10145
+ldsi s8293, 4146 # 10146
+ldsi s8295, 4147 # 10147
+ldsi s8297, 4148 # 10148
+ldsi s8299, 4149 # 10149
+ldsi s8301, 4150 # 10150
+ldsi s8303, 4151 # 10151
+ldsi s8305, 4152 # 10152
+ldsi s8307, 4153 # 10153
+ldsi s8309, 4154 # 10154
+ldsi s8311, 4155 # 10155
+ldsi s8313, 4156 # 10156
+ldsi s8315, 4157 # 10157
+ldsi s8317, 4158 # 10158
+ldsi s8319, 4159 # 10159
+ldsi s8321, 4160 # 10160
+ldsi s8323, 4161 # 10161
+ldsi s8325, 4162 # 10162
+ldsi s8327, 4163 # 10163
+ldsi s8329, 4164 # 10164
+ldsi s8331, 4165 # 10165
+ldsi s8333, 4166 # 10166
+ldsi s8335, 4167 # 10167
+ldsi s8337, 4168 # 10168
+ldsi s8339, 4169 # 10169
+ldsi s8341, 4170 # 10170
+ldsi s8343, 4171 # 10171
+ldsi s8345, 4172 # 10172
+ldsi s8347, 4173 # 10173
+ldsi s8349, 4174 # 10174
+ldsi s8351, 4175 # 10175
+ldsi s8353, 4176 # 10176
+ldsi s8355, 4177 # 10177
+ldsi s8357, 4178 # 10178
+ldsi s8359, 4179 # 10179
+ldsi s8361, 4180 # 10180
+ldsi s8363, 4181 # 10181
+ldsi s8365, 4182 # 10182
+ldsi s8367, 4183 # 10183
+ldsi s8369, 4184 # 10184
+ldsi s8371, 4185 # 10185
+ldsi s8373, 4186 # 10186
+ldsi s8375, 4187 # 10187
+ldsi s8377, 4188 # 10188
+ldsi s8379, 4189 # 10189
+ldsi s8381, 4190 # 10190
+ldsi s8383, 4191 # 10191
+ldsi s8385, 4192 # 10192
+ldsi s8387, 4193 # 10193
+ldsi s8389, 4194 # 10194
+ldsi s8391, 4195 # 10195
+ldsi s8393, 4196 # 10196
+ldsi s8395, 4197 # 10197
+ldsi s8397, 4198 # 10198
+ldsi s8399, 4199 # 10199
+ldsi s8401, 4200 # 10200
+ldsi s8403, 4201 # 10201
+ldsi s8405, 4202 # 10202
+ldsi s8407, 4203 # 10203
+ldsi s8409, 4204 # 10204
+ldsi s8411, 4205 # 10205
+ldsi s8413, 4206 # 10206
+ldsi s8415, 4207 # 10207
+ldsi s8417, 4208 # 10208
+ldsi s8419, 4209 # 10209
+ldsi s8421, 4210 # 10210
+ldsi s8423, 4211 # 10211
+ldsi s8425, 4212 # 10212
+ldsi s8427, 4213 # 10213
+ldsi s8429, 4214 # 10214
+ldsi s8431, 4215 # 10215
+ldsi s8433, 4216 # 10216
+ldsi s8435, 4217 # 10217
+ldsi s8437, 4218 # 10218
+ldsi s8439, 4219 # 10219
+ldsi s8441, 4220 # 10220
+ldsi s8443, 4221 # 10221
+ldsi s8445, 4222 # 10222
+ldsi s8447, 4223 # 10223
+ldsi s8449, 4224 # 10224
+ldsi s8451, 4225 # 10225
+ldsi s8453, 4226 # 10226
+ldsi s8455, 4227 # 10227
+ldsi s8457, 4228 # 10228
+ldsi s8459, 4229 # 10229
+ldsi s8461, 4230 # 10230
+ldsi s8463, 4231 # 10231
+ldsi s8465, 4232 # 10232
+ldsi s8467, 4233 # 10233
+ldsi s8469, 4234 # 10234
+ldsi s8471, 4235 # 10235
+ldsi s8473, 4236 # 10236
+ldsi s8475, 4237 # 10237
+ldsi s8477, 4238 # 10238
+ldsi s8479, 4239 # 10239
+ldsi s8481, 4240 # 10240
+ldsi s8483, 4241 # 10241
+ldsi s8485, 4242 # 10242
+ldsi s8487, 4243 # 10243
+ldsi s8489, 4244 # 10244
+ldsi s8491, 4245 # 10245
+ldsi s8493, 4246 # 10246
+ldsi s8495, 4247 # 10247
+ldsi s8497, 4248 # 10248
+ldsi s8499, 4249 # 10249
+ldsi s8501, 4250 # 10250
+ldsi s8503, 4251 # 10251
+ldsi s8505, 4252 # 10252
+ldsi s8507, 4253 # 10253
+ldsi s8509, 4254 # 10254
+ldsi s8511, 4255 # 10255
+ldsi s8513, 4256 # 10256
+ldsi s8515, 4257 # 10257
+ldsi s8517, 4258 # 10258
+ldsi s8519, 4259 # 10259
+ldsi s8521, 4260 # 10260
+ldsi s8523, 4261 # 10261
+ldsi s8525, 4262 # 10262
+ldsi s8527, 4263 # 10263
+ldsi s8529, 4264 # 10264
+ldsi s8531, 4265 # 10265
+ldsi s8533, 4266 # 10266
+ldsi s8535, 4267 # 10267
+ldsi s8537, 4268 # 10268
+ldsi s8539, 4269 # 10269
+ldsi s8541, 4270 # 10270
+ldsi s8543, 4271 # 10271
+ldsi s8545, 4272 # 10272
+ldsi s8547, 4273 # 10273
+ldsi s8549, 4274 # 10274
+ldsi s8551, 4275 # 10275
+ldsi s8553, 4276 # 10276
+ldsi s8555, 4277 # 10277
+ldsi s8557, 4278 # 10278
+ldsi s8559, 4279 # 10279
+ldsi s8561, 4280 # 10280
+ldsi s8563, 4281 # 10281
+ldsi s8565, 4282 # 10282
+ldsi s8567, 4283 # 10283
+ldsi s8569, 4284 # 10284
+ldsi s8571, 4285 # 10285
+ldsi s8573, 4286 # 10286
+ldsi s8575, 4287 # 10287
+ldsi s8577, 4288 # 10288
+ldsi s8579, 4289 # 10289
+ldsi s8581, 4290 # 10290
+ldsi s8583, 4291 # 10291
+ldsi s8585, 4292 # 10292
+ldsi s8587, 4293 # 10293
+ldsi s8589, 4294 # 10294
+ldsi s8591, 4295 # 10295
+ldsi s8593, 4296 # 10296
+ldsi s8595, 4297 # 10297
+ldsi s8597, 4298 # 10298
+ldsi s8599, 4299 # 10299
+ldsi s8601, 4300 # 10300
+ldsi s8603, 4301 # 10301
+ldsi s8605, 4302 # 10302
+ldsi s8607, 4303 # 10303
+ldsi s8609, 4304 # 10304
+ldsi s8611, 4305 # 10305
+ldsi s8613, 4306 # 10306
+ldsi s8615, 4307 # 10307
+ldsi s8617, 4308 # 10308
+ldsi s8619, 4309 # 10309
+ldsi s8621, 4310 # 10310
+ldsi s8623, 4311 # 10311
+ldsi s8625, 4312 # 10312
+ldsi s8627, 4313 # 10313
+ldsi s8629, 4314 # 10314
+ldsi s8631, 4315 # 10315
+ldsi s8633, 4316 # 10316
+ldsi s8635, 4317 # 10317
+ldsi s8637, 4318 # 10318
+ldsi s8639, 4319 # 10319
+ldsi s8641, 4320 # 10320
+ldsi s8643, 4321 # 10321
+ldsi s8645, 4322 # 10322
+ldsi s8647, 4323 # 10323
+ldsi s8649, 4324 # 10324
+ldsi s8651, 4325 # 10325
+ldsi s8653, 4326 # 10326
+ldsi s8655, 4327 # 10327
+ldsi s8657, 4328 # 10328
+ldsi s8659, 4329 # 10329
+ldsi s8661, 4330 # 10330
+ldsi s8663, 4331 # 10331
+ldsi s8665, 4332 # 10332
+ldsi s8667, 4333 # 10333
+ldsi s8669, 4334 # 10334
+ldsi s8671, 4335 # 10335
+ldsi s8673, 4336 # 10336
+ldsi s8675, 4337 # 10337
+ldsi s8677, 4338 # 10338
+ldsi s8679, 4339 # 10339
+ldsi s8681, 4340 # 10340
+ldsi s8683, 4341 # 10341
+ldsi s8685, 4342 # 10342
+ldsi s8687, 4343 # 10343
+ldsi s8689, 4344 # 10344
+ldsi s8691, 4345 # 10345
+ldsi s8693, 4346 # 10346
+ldsi s8695, 4347 # 10347
+ldsi s8697, 4348 # 10348
+ldsi s8699, 4349 # 10349
+ldsi s8701, 4350 # 10350
+ldsi s8703, 4351 # 10351
+ldsi s8705, 4352 # 10352
+ldsi s8707, 4353 # 10353
+ldsi s8709, 4354 # 10354
+ldsi s8711, 4355 # 10355
+ldsi s8713, 4356 # 10356
+ldsi s8715, 4357 # 10357
+ldsi s8717, 4358 # 10358
+ldsi s8719, 4359 # 10359
+ldsi s8721, 4360 # 10360
+ldsi s8723, 4361 # 10361
+ldsi s8725, 4362 # 10362
+ldsi s8727, 4363 # 10363
+ldsi s8729, 4364 # 10364
+ldsi s8731, 4365 # 10365
+ldsi s8733, 4366 # 10366
+ldsi s8735, 4367 # 10367
+ldsi s8737, 4368 # 10368
+ldsi s8739, 4369 # 10369
+ldsi s8741, 4370 # 10370
+ldsi s8743, 4371 # 10371
+ldsi s8745, 4372 # 10372
+ldsi s8747, 4373 # 10373
+ldsi s8749, 4374 # 10374
+ldsi s8751, 4375 # 10375
+ldsi s8753, 4376 # 10376
+ldsi s8755, 4377 # 10377
+ldsi s8757, 4378 # 10378
+ldsi s8759, 4379 # 10379
+ldsi s8761, 4380 # 10380
+ldsi s8763, 4381 # 10381
+ldsi s8765, 4382 # 10382
+ldsi s8767, 4383 # 10383
+ldsi s8769, 4384 # 10384
+ldsi s8771, 4385 # 10385
+ldsi s8773, 4386 # 10386
+ldsi s8775, 4387 # 10387
+ldsi s8777, 4388 # 10388
+ldsi s8779, 4389 # 10389
+ldsi s8781, 4390 # 10390
+ldsi s8783, 4391 # 10391
+ldsi s8785, 4392 # 10392
+ldsi s8787, 4393 # 10393
+ldsi s8789, 4394 # 10394
+ldsi s8791, 4395 # 10395
+ldsi s8793, 4396 # 10396
+ldsi s8795, 4397 # 10397
+ldsi s8797, 4398 # 10398
+ldsi s8799, 4399 # 10399
+ldsi s8801, 4400 # 10400
+ldsi s8803, 4401 # 10401
+ldsi s8805, 4402 # 10402
+ldsi s8807, 4403 # 10403
+ldsi s8809, 4404 # 10404
+ldsi s8811, 4405 # 10405
+ldsi s8813, 4406 # 10406
+ldsi s8815, 4407 # 10407
+ldsi s8817, 4408 # 10408
+ldsi s8819, 4409 # 10409
+ldsi s8821, 4410 # 10410
+ldsi s8823, 4411 # 10411
+ldsi s8825, 4412 # 10412
+ldsi s8827, 4413 # 10413
+ldsi s8829, 4414 # 10414
+ldsi s8831, 4415 # 10415
+ldsi s8833, 4416 # 10416
+ldsi s8835, 4417 # 10417
+ldsi s8837, 4418 # 10418
+ldsi s8839, 4419 # 10419
+ldsi s8841, 4420 # 10420
+ldsi s8843, 4421 # 10421
+ldsi s8845, 4422 # 10422
+ldsi s8847, 4423 # 10423
+ldsi s8849, 4424 # 10424
+ldsi s8851, 4425 # 10425
+ldsi s8853, 4426 # 10426
+ldsi s8855, 4427 # 10427
+ldsi s8857, 4428 # 10428
+ldsi s8859, 4429 # 10429
+ldsi s8861, 4430 # 10430
+ldsi s8863, 4431 # 10431
+ldsi s8865, 4432 # 10432
+ldsi s8867, 4433 # 10433
+ldsi s8869, 4434 # 10434
+ldsi s8871, 4435 # 10435
+ldsi s8873, 4436 # 10436
+ldsi s8875, 4437 # 10437
+ldsi s8877, 4438 # 10438
+ldsi s8879, 4439 # 10439
+ldsi s8881, 4440 # 10440
+ldsi s8883, 4441 # 10441
+ldsi s8885, 4442 # 10442
+ldsi s8887, 4443 # 10443
+ldsi s8889, 4444 # 10444
+ldsi s8891, 4445 # 10445
+ldsi s8893, 4446 # 10446
+ldsi s8895, 4447 # 10447
+ldsi s8897, 4448 # 10448
+ldsi s8899, 4449 # 10449
+ldsi s8901, 4450 # 10450
+ldsi s8903, 4451 # 10451
+ldsi s8905, 4452 # 10452
+ldsi s8907, 4453 # 10453
+ldsi s8909, 4454 # 10454
+ldsi s8911, 4455 # 10455
+ldsi s8913, 4456 # 10456
+ldsi s8915, 4457 # 10457
+ldsi s8917, 4458 # 10458
+ldsi s8919, 4459 # 10459
+ldsi s8921, 4460 # 10460
+ldsi s8923, 4461 # 10461
+ldsi s8925, 4462 # 10462
+ldsi s8927, 4463 # 10463
+ldsi s8929, 4464 # 10464
+ldsi s8931, 4465 # 10465
+ldsi s8933, 4466 # 10466
+ldsi s8935, 4467 # 10467
+ldsi s8937, 4468 # 10468
+ldsi s8939, 4469 # 10469
+ldsi s8941, 4470 # 10470
+ldsi s8943, 4471 # 10471
+ldsi s8945, 4472 # 10472
+ldsi s8947, 4473 # 10473
+ldsi s8949, 4474 # 10474
+ldsi s8951, 4475 # 10475
+ldsi s8953, 4476 # 10476
+ldsi s8955, 4477 # 10477
+ldsi s8957, 4478 # 10478
+ldsi s8959, 4479 # 10479
+ldsi s8961, 4480 # 10480
+ldsi s8963, 4481 # 10481
+ldsi s8965, 4482 # 10482
+ldsi s8967, 4483 # 10483
+ldsi s8969, 4484 # 10484
+ldsi s8971, 4485 # 10485
+ldsi s8973, 4486 # 10486
+ldsi s8975, 4487 # 10487
+ldsi s8977, 4488 # 10488
+ldsi s8979, 4489 # 10489
+ldsi s8981, 4490 # 10490
+ldsi s8983, 4491 # 10491
+ldsi s8985, 4492 # 10492
+ldsi s8987, 4493 # 10493
+ldsi s8989, 4494 # 10494
+ldsi s8991, 4495 # 10495
+ldsi s8993, 4496 # 10496
+ldsi s8995, 4497 # 10497
+ldsi s8997, 4498 # 10498
+ldsi s8999, 4499 # 10499
+ldsi s9001, 4500 # 10500
+ldsi s9003, 4501 # 10501
+ldsi s9005, 4502 # 10502
+ldsi s9007, 4503 # 10503
+ldsi s9009, 4504 # 10504
+ldsi s9011, 4505 # 10505
+ldsi s9013, 4506 # 10506
+ldsi s9015, 4507 # 10507
+ldsi s9017, 4508 # 10508
+ldsi s9019, 4509 # 10509
+ldsi s9021, 4510 # 10510
+ldsi s9023, 4511 # 10511
+ldsi s9025, 4512 # 10512
+ldsi s9027, 4513 # 10513
+ldsi s9029, 4514 # 10514
+ldsi s9031, 4515 # 10515
+ldsi s9033, 4516 # 10516
+ldsi s9035, 4517 # 10517
+ldsi s9037, 4518 # 10518
+ldsi s9039, 4519 # 10519
+ldsi s9041, 4520 # 10520
+ldsi s9043, 4521 # 10521
+ldsi s9045, 4522 # 10522
+ldsi s9047, 4523 # 10523
+ldsi s9049, 4524 # 10524
+ldsi s9051, 4525 # 10525
+ldsi s9053, 4526 # 10526
+ldsi s9055, 4527 # 10527
+ldsi s9057, 4528 # 10528
+ldsi s9059, 4529 # 10529
+ldsi s9061, 4530 # 10530
+ldsi s9063, 4531 # 10531
+ldsi s9065, 4532 # 10532
+ldsi s9067, 4533 # 10533
+ldsi s9069, 4534 # 10534
+ldsi s9071, 4535 # 10535
+ldsi s9073, 4536 # 10536
+ldsi s9075, 4537 # 10537
+ldsi s9077, 4538 # 10538
+ldsi s9079, 4539 # 10539
+ldsi s9081, 4540 # 10540
+ldsi s9083, 4541 # 10541
+ldsi s9085, 4542 # 10542
+ldsi s9087, 4543 # 10543
+ldsi s9089, 4544 # 10544
+ldsi s9091, 4545 # 10545
+ldsi s9093, 4546 # 10546
+ldsi s9095, 4547 # 10547
+ldsi s9097, 4548 # 10548
+ldsi s9099, 4549 # 10549
+ldsi s9101, 4550 # 10550
+ldsi s9103, 4551 # 10551
+ldsi s9105, 4552 # 10552
+ldsi s9107, 4553 # 10553
+ldsi s9109, 4554 # 10554
+ldsi s9111, 4555 # 10555
+ldsi s9113, 4556 # 10556
+ldsi s9115, 4557 # 10557
+ldsi s9117, 4558 # 10558
+ldsi s9119, 4559 # 10559
+ldsi s9121, 4560 # 10560
+ldsi s9123, 4561 # 10561
+ldsi s9125, 4562 # 10562
+ldsi s9127, 4563 # 10563
+ldsi s9129, 4564 # 10564
+ldsi s9131, 4565 # 10565
+ldsi s9133, 4566 # 10566
+ldsi s9135, 4567 # 10567
+ldsi s9137, 4568 # 10568
+ldsi s9139, 4569 # 10569
+ldsi s9141, 4570 # 10570
+ldsi s9143, 4571 # 10571
+ldsi s9145, 4572 # 10572
+ldsi s9147, 4573 # 10573
+ldsi s9149, 4574 # 10574
+ldsi s9151, 4575 # 10575
+ldsi s9153, 4576 # 10576
+ldsi s9155, 4577 # 10577
+ldsi s9157, 4578 # 10578
+ldsi s9159, 4579 # 10579
+ldsi s9161, 4580 # 10580
+ldsi s9163, 4581 # 10581
+ldsi s9165, 4582 # 10582
+ldsi s9167, 4583 # 10583
+ldsi s9169, 4584 # 10584
+ldsi s9171, 4585 # 10585
+ldsi s9173, 4586 # 10586
+ldsi s9175, 4587 # 10587
+ldsi s9177, 4588 # 10588
+ldsi s9179, 4589 # 10589
+ldsi s9181, 4590 # 10590
+ldsi s9183, 4591 # 10591
+ldsi s9185, 4592 # 10592
+ldsi s9187, 4593 # 10593
+ldsi s9189, 4594 # 10594
+ldsi s9191, 4595 # 10595
+ldsi s9193, 4596 # 10596
+ldsi s9195, 4597 # 10597
+ldsi s9197, 4598 # 10598
+ldsi s9199, 4599 # 10599
+ldsi s9201, 4600 # 10600
+ldsi s9203, 4601 # 10601
+ldsi s9205, 4602 # 10602
+ldsi s9207, 4603 # 10603
+ldsi s9209, 4604 # 10604
+ldsi s9211, 4605 # 10605
+ldsi s9213, 4606 # 10606
+ldsi s9215, 4607 # 10607
+ldsi s9217, 4608 # 10608
+ldsi s9219, 4609 # 10609
+ldsi s9221, 4610 # 10610
+ldsi s9223, 4611 # 10611
+ldsi s9225, 4612 # 10612
+ldsi s9227, 4613 # 10613
+ldsi s9229, 4614 # 10614
+ldsi s9231, 4615 # 10615
+ldsi s9233, 4616 # 10616
+ldsi s9235, 4617 # 10617
+ldsi s9237, 4618 # 10618
+ldsi s9239, 4619 # 10619
+ldsi s9241, 4620 # 10620
+ldsi s9243, 4621 # 10621
+ldsi s9245, 4622 # 10622
+ldsi s9247, 4623 # 10623
+ldsi s9249, 4624 # 10624
+ldsi s9251, 4625 # 10625
+ldsi s9253, 4626 # 10626
+ldsi s9255, 4627 # 10627
+ldsi s9257, 4628 # 10628
+ldsi s9259, 4629 # 10629
+ldsi s9261, 4630 # 10630
+ldsi s9263, 4631 # 10631
+ldsi s9265, 4632 # 10632
+ldsi s9267, 4633 # 10633
+ldsi s9269, 4634 # 10634
+ldsi s9271, 4635 # 10635
+ldsi s9273, 4636 # 10636
+ldsi s9275, 4637 # 10637
+ldsi s9277, 4638 # 10638
+ldsi s9279, 4639 # 10639
+ldsi s9281, 4640 # 10640
+ldsi s9283, 4641 # 10641
+ldsi s9285, 4642 # 10642
+ldsi s9287, 4643 # 10643
+ldsi s9289, 4644 # 10644
+ldsi s9291, 4645 # 10645
+ldsi s9293, 4646 # 10646
+ldsi s9295, 4647 # 10647
+ldsi s9297, 4648 # 10648
+ldsi s9299, 4649 # 10649
+ldsi s9301, 4650 # 10650
+ldsi s9303, 4651 # 10651
+ldsi s9305, 4652 # 10652
+ldsi s9307, 4653 # 10653
+ldsi s9309, 4654 # 10654
+ldsi s9311, 4655 # 10655
+ldsi s9313, 4656 # 10656
+ldsi s9315, 4657 # 10657
+ldsi s9317, 4658 # 10658
+ldsi s9319, 4659 # 10659
+ldsi s9321, 4660 # 10660
+ldsi s9323, 4661 # 10661
+ldsi s9325, 4662 # 10662
+ldsi s9327, 4663 # 10663
+ldsi s9329, 4664 # 10664
+ldsi s9331, 4665 # 10665
+ldsi s9333, 4666 # 10666
+ldsi s9335, 4667 # 10667
+ldsi s9337, 4668 # 10668
+ldsi s9339, 4669 # 10669
+ldsi s9341, 4670 # 10670
+ldsi s9343, 4671 # 10671
+ldsi s9345, 4672 # 10672
+ldsi s9347, 4673 # 10673
+ldsi s9349, 4674 # 10674
+ldsi s9351, 4675 # 10675
+ldsi s9353, 4676 # 10676
+ldsi s9355, 4677 # 10677
+ldsi s9357, 4678 # 10678
+ldsi s9359, 4679 # 10679
+ldsi s9361, 4680 # 10680
+ldsi s9363, 4681 # 10681
+ldsi s9365, 4682 # 10682
+ldsi s9367, 4683 # 10683
+ldsi s9369, 4684 # 10684
+ldsi s9371, 4685 # 10685
+ldsi s9373, 4686 # 10686
+ldsi s9375, 4687 # 10687
+ldsi s9377, 4688 # 10688
+ldsi s9379, 4689 # 10689
+ldsi s9381, 4690 # 10690
+ldsi s9383, 4691 # 10691
+ldsi s9385, 4692 # 10692
+ldsi s9387, 4693 # 10693
+ldsi s9389, 4694 # 10694
+ldsi s9391, 4695 # 10695
+ldsi s9393, 4696 # 10696
+ldsi s9395, 4697 # 10697
+ldsi s9397, 4698 # 10698
+ldsi s9399, 4699 # 10699
+ldsi s9401, 4700 # 10700
+ldsi s9403, 4701 # 10701
+ldsi s9405, 4702 # 10702
+ldsi s9407, 4703 # 10703
+ldsi s9409, 4704 # 10704
+ldsi s9411, 4705 # 10705
+ldsi s9413, 4706 # 10706
+ldsi s9415, 4707 # 10707
+ldsi s9417, 4708 # 10708
+ldsi s9419, 4709 # 10709
+ldsi s9421, 4710 # 10710
+ldsi s9423, 4711 # 10711
+ldsi s9425, 4712 # 10712
+ldsi s9427, 4713 # 10713
+ldsi s9429, 4714 # 10714
+ldsi s9431, 4715 # 10715
+ldsi s9433, 4716 # 10716
+ldsi s9435, 4717 # 10717
+ldsi s9437, 4718 # 10718
+ldsi s9439, 4719 # 10719
+ldsi s9441, 4720 # 10720
+ldsi s9443, 4721 # 10721
+ldsi s9445, 4722 # 10722
+ldsi s9447, 4723 # 10723
+ldsi s9449, 4724 # 10724
+ldsi s9451, 4725 # 10725
+ldsi s9453, 4726 # 10726
+ldsi s9455, 4727 # 10727
+ldsi s9457, 4728 # 10728
+ldsi s9459, 4729 # 10729
+ldsi s9461, 4730 # 10730
+ldsi s9463, 4731 # 10731
+ldsi s9465, 4732 # 10732
+ldsi s9467, 4733 # 10733
+ldsi s9469, 4734 # 10734
+ldsi s9471, 4735 # 10735
+ldsi s9473, 4736 # 10736
+ldsi s9475, 4737 # 10737
+ldsi s9477, 4738 # 10738
+ldsi s9479, 4739 # 10739
+ldsi s9481, 4740 # 10740
+ldsi s9483, 4741 # 10741
+ldsi s9485, 4742 # 10742
+ldsi s9487, 4743 # 10743
+ldsi s9489, 4744 # 10744
+ldsi s9491, 4745 # 10745
+ldsi s9493, 4746 # 10746
+ldsi s9495, 4747 # 10747
+ldsi s9497, 4748 # 10748
+ldsi s9499, 4749 # 10749
+ldsi s9501, 4750 # 10750
+ldsi s9503, 4751 # 10751
+ldsi s9505, 4752 # 10752
+ldsi s9507, 4753 # 10753
+ldsi s9509, 4754 # 10754
+ldsi s9511, 4755 # 10755
+ldsi s9513, 4756 # 10756
+ldsi s9515, 4757 # 10757
+ldsi s9517, 4758 # 10758
+ldsi s9519, 4759 # 10759
+ldsi s9521, 4760 # 10760
+ldsi s9523, 4761 # 10761
+ldsi s9525, 4762 # 10762
+ldsi s9527, 4763 # 10763
+ldsi s9529, 4764 # 10764
+ldsi s9531, 4765 # 10765
+ldsi s9533, 4766 # 10766
+ldsi s9535, 4767 # 10767
+ldsi s9537, 4768 # 10768
+ldsi s9539, 4769 # 10769
+ldsi s9541, 4770 # 10770
+ldsi s9543, 4771 # 10771
+ldsi s9545, 4772 # 10772
+ldsi s9547, 4773 # 10773
+ldsi s9549, 4774 # 10774
+ldsi s9551, 4775 # 10775
+ldsi s9553, 4776 # 10776
+ldsi s9555, 4777 # 10777
+ldsi s9557, 4778 # 10778
+ldsi s9559, 4779 # 10779
+ldsi s9561, 4780 # 10780
+ldsi s9563, 4781 # 10781
+ldsi s9565, 4782 # 10782
+ldsi s9567, 4783 # 10783
+ldsi s9569, 4784 # 10784
+ldsi s9571, 4785 # 10785
+ldsi s9573, 4786 # 10786
+ldsi s9575, 4787 # 10787
+ldsi s9577, 4788 # 10788
+ldsi s9579, 4789 # 10789
+ldsi s9581, 4790 # 10790
+ldsi s9583, 4791 # 10791
+ldsi s9585, 4792 # 10792
+ldsi s9587, 4793 # 10793
+ldsi s9589, 4794 # 10794
+ldsi s9591, 4795 # 10795
+ldsi s9593, 4796 # 10796
+ldsi s9595, 4797 # 10797
+ldsi s9597, 4798 # 10798
+ldsi s9599, 4799 # 10799
+ldsi s9601, 4800 # 10800
+ldsi s9603, 4801 # 10801
+ldsi s9605, 4802 # 10802
+ldsi s9607, 4803 # 10803
+ldsi s9609, 4804 # 10804
+ldsi s9611, 4805 # 10805
+ldsi s9613, 4806 # 10806
+ldsi s9615, 4807 # 10807
+ldsi s9617, 4808 # 10808
+ldsi s9619, 4809 # 10809
+ldsi s9621, 4810 # 10810
+ldsi s9623, 4811 # 10811
+ldsi s9625, 4812 # 10812
+ldsi s9627, 4813 # 10813
+ldsi s9629, 4814 # 10814
+ldsi s9631, 4815 # 10815
+ldsi s9633, 4816 # 10816
+ldsi s9635, 4817 # 10817
+ldsi s9637, 4818 # 10818
+ldsi s9639, 4819 # 10819
+ldsi s9641, 4820 # 10820
+ldsi s9643, 4821 # 10821
+ldsi s9645, 4822 # 10822
+ldsi s9647, 4823 # 10823
+ldsi s9649, 4824 # 10824
+ldsi s9651, 4825 # 10825
+ldsi s9653, 4826 # 10826
+ldsi s9655, 4827 # 10827
+ldsi s9657, 4828 # 10828
+ldsi s9659, 4829 # 10829
+ldsi s9661, 4830 # 10830
+ldsi s9663, 4831 # 10831
+ldsi s9665, 4832 # 10832
+ldsi s9667, 4833 # 10833
+ldsi s9669, 4834 # 10834
+ldsi s9671, 4835 # 10835
+ldsi s9673, 4836 # 10836
+ldsi s9675, 4837 # 10837
+ldsi s9677, 4838 # 10838
+ldsi s9679, 4839 # 10839
+ldsi s9681, 4840 # 10840
+ldsi s9683, 4841 # 10841
+ldsi s9685, 4842 # 10842
+ldsi s9687, 4843 # 10843
+ldsi s9689, 4844 # 10844
+ldsi s9691, 4845 # 10845
+ldsi s9693, 4846 # 10846
+ldsi s9695, 4847 # 10847
+ldsi s9697, 4848 # 10848
+ldsi s9699, 4849 # 10849
+ldsi s9701, 4850 # 10850
+ldsi s9703, 4851 # 10851
+ldsi s9705, 4852 # 10852
+ldsi s9707, 4853 # 10853
+ldsi s9709, 4854 # 10854
+ldsi s9711, 4855 # 10855
+ldsi s9713, 4856 # 10856
+ldsi s9715, 4857 # 10857
+ldsi s9717, 4858 # 10858
+ldsi s9719, 4859 # 10859
+ldsi s9721, 4860 # 10860
+ldsi s9723, 4861 # 10861
+ldsi s9725, 4862 # 10862
+ldsi s9727, 4863 # 10863
+ldsi s9729, 4864 # 10864
+ldsi s9731, 4865 # 10865
+ldsi s9733, 4866 # 10866
+ldsi s9735, 4867 # 10867
+ldsi s9737, 4868 # 10868
+ldsi s9739, 4869 # 10869
+ldsi s9741, 4870 # 10870
+ldsi s9743, 4871 # 10871
+ldsi s9745, 4872 # 10872
+ldsi s9747, 4873 # 10873
+ldsi s9749, 4874 # 10874
+ldsi s9751, 4875 # 10875
+ldsi s9753, 4876 # 10876
+ldsi s9755, 4877 # 10877
+ldsi s9757, 4878 # 10878
+ldsi s9759, 4879 # 10879
+ldsi s9761, 4880 # 10880
+ldsi s9763, 4881 # 10881
+ldsi s9765, 4882 # 10882
+ldsi s9767, 4883 # 10883
+ldsi s9769, 4884 # 10884
+ldsi s9771, 4885 # 10885
+ldsi s9773, 4886 # 10886
+ldsi s9775, 4887 # 10887
+ldsi s9777, 4888 # 10888
+ldsi s9779, 4889 # 10889
+ldsi s9781, 4890 # 10890
+ldsi s9783, 4891 # 10891
+ldsi s9785, 4892 # 10892
+ldsi s9787, 4893 # 10893
+ldsi s9789, 4894 # 10894
+ldsi s9791, 4895 # 10895
+ldsi s9793, 4896 # 10896
+ldsi s9795, 4897 # 10897
+ldsi s9797, 4898 # 10898
+ldsi s9799, 4899 # 10899
+ldsi s9801, 4900 # 10900
+ldsi s9803, 4901 # 10901
+ldsi s9805, 4902 # 10902
+ldsi s9807, 4903 # 10903
+ldsi s9809, 4904 # 10904
+ldsi s9811, 4905 # 10905
+ldsi s9813, 4906 # 10906
+ldsi s9815, 4907 # 10907
+ldsi s9817, 4908 # 10908
+ldsi s9819, 4909 # 10909
+ldsi s9821, 4910 # 10910
+ldsi s9823, 4911 # 10911
+ldsi s9825, 4912 # 10912
+ldsi s9827, 4913 # 10913
+ldsi s9829, 4914 # 10914
+ldsi s9831, 4915 # 10915
+ldsi s9833, 4916 # 10916
+ldsi s9835, 4917 # 10917
+ldsi s9837, 4918 # 10918
+ldsi s9839, 4919 # 10919
+ldsi s9841, 4920 # 10920
+ldsi s9843, 4921 # 10921
+ldsi s9845, 4922 # 10922
+ldsi s9847, 4923 # 10923
+ldsi s9849, 4924 # 10924
+ldsi s9851, 4925 # 10925
+ldsi s9853, 4926 # 10926
+ldsi s9855, 4927 # 10927
+ldsi s9857, 4928 # 10928
+ldsi s9859, 4929 # 10929
+ldsi s9861, 4930 # 10930
+ldsi s9863, 4931 # 10931
+ldsi s9865, 4932 # 10932
+ldsi s9867, 4933 # 10933
+ldsi s9869, 4934 # 10934
+ldsi s9871, 4935 # 10935
+ldsi s9873, 4936 # 10936
+ldsi s9875, 4937 # 10937
+ldsi s9877, 4938 # 10938
+ldsi s9879, 4939 # 10939
+ldsi s9881, 4940 # 10940
+ldsi s9883, 4941 # 10941
+ldsi s9885, 4942 # 10942
+ldsi s9887, 4943 # 10943
+ldsi s9889, 4944 # 10944
+ldsi s9891, 4945 # 10945
+ldsi s9893, 4946 # 10946
+ldsi s9895, 4947 # 10947
+ldsi s9897, 4948 # 10948
+ldsi s9899, 4949 # 10949
+ldsi s9901, 4950 # 10950
+ldsi s9903, 4951 # 10951
+ldsi s9905, 4952 # 10952
+ldsi s9907, 4953 # 10953
+ldsi s9909, 4954 # 10954
+ldsi s9911, 4955 # 10955
+ldsi s9913, 4956 # 10956
+ldsi s9915, 4957 # 10957
+ldsi s9917, 4958 # 10958
+ldsi s9919, 4959 # 10959
+ldsi s9921, 4960 # 10960
+ldsi s9923, 4961 # 10961
+ldsi s9925, 4962 # 10962
+ldsi s9927, 4963 # 10963
+ldsi s9929, 4964 # 10964
+ldsi s9931, 4965 # 10965
+ldsi s9933, 4966 # 10966
+ldsi s9935, 4967 # 10967
+ldsi s9937, 4968 # 10968
+ldsi s9939, 4969 # 10969
+ldsi s9941, 4970 # 10970
+ldsi s9943, 4971 # 10971
+ldsi s9945, 4972 # 10972
+ldsi s9947, 4973 # 10973
+ldsi s9949, 4974 # 10974
+ldsi s9951, 4975 # 10975
+ldsi s9953, 4976 # 10976
+ldsi s9955, 4977 # 10977
+ldsi s9957, 4978 # 10978
+ldsi s9959, 4979 # 10979
+ldsi s9961, 4980 # 10980
+ldsi s9963, 4981 # 10981
+ldsi s9965, 4982 # 10982
+ldsi s9967, 4983 # 10983
+ldsi s9969, 4984 # 10984
+ldsi s9971, 4985 # 10985
+ldsi s9973, 4986 # 10986
+ldsi s9975, 4987 # 10987
+ldsi s9977, 4988 # 10988
+ldsi s9979, 4989 # 10989
+ldsi s9981, 4990 # 10990
+ldsi s9983, 4991 # 10991
+ldsi s9985, 4992 # 10992
+ldsi s9987, 4993 # 10993
+ldsi s9989, 4994 # 10994
+ldsi s9991, 4995 # 10995
+ldsi s9993, 4996 # 10996
+ldsi s9995, 4997 # 10997
+ldsi s9997, 4998 # 10998
+ldsi s9999, 4999 # 10999
+ldsi s10001, 5000 # 11000
+ldsi s10003, 5001 # 11001
+ldsi s10005, 5002 # 11002
+ldsi s10007, 5003 # 11003
+ldsi s10009, 5004 # 11004
+ldsi s10011, 5005 # 11005
+ldsi s10013, 5006 # 11006
+ldsi s10015, 5007 # 11007
+ldsi s10017, 5008 # 11008
+ldsi s10019, 5009 # 11009
+ldsi s10021, 5010 # 11010
+ldsi s10023, 5011 # 11011
+ldsi s10025, 5012 # 11012
+ldsi s10027, 5013 # 11013
+ldsi s10029, 5014 # 11014
+ldsi s10031, 5015 # 11015
+ldsi s10033, 5016 # 11016
+ldsi s10035, 5017 # 11017
+ldsi s10037, 5018 # 11018
+ldsi s10039, 5019 # 11019
+ldsi s10041, 5020 # 11020
+ldsi s10043, 5021 # 11021
+ldsi s10045, 5022 # 11022
+ldsi s10047, 5023 # 11023
+ldsi s10049, 5024 # 11024
+ldsi s10051, 5025 # 11025
+ldsi s10053, 5026 # 11026
+ldsi s10055, 5027 # 11027
+ldsi s10057, 5028 # 11028
+ldsi s10059, 5029 # 11029
+ldsi s10061, 5030 # 11030
+ldsi s10063, 5031 # 11031
+ldsi s10065, 5032 # 11032
+ldsi s10067, 5033 # 11033
+ldsi s10069, 5034 # 11034
+ldsi s10071, 5035 # 11035
+ldsi s10073, 5036 # 11036
+ldsi s10075, 5037 # 11037
+ldsi s10077, 5038 # 11038
+ldsi s10079, 5039 # 11039
+ldsi s10081, 5040 # 11040
+ldsi s10083, 5041 # 11041
+ldsi s10085, 5042 # 11042
+ldsi s10087, 5043 # 11043
+ldsi s10089, 5044 # 11044
+ldsi s10091, 5045 # 11045
+ldsi s10093, 5046 # 11046
+ldsi s10095, 5047 # 11047
+ldsi s10097, 5048 # 11048
+ldsi s10099, 5049 # 11049
+ldsi s10101, 5050 # 11050
+ldsi s10103, 5051 # 11051
+ldsi s10105, 5052 # 11052
+ldsi s10107, 5053 # 11053
+ldsi s10109, 5054 # 11054
+ldsi s10111, 5055 # 11055
+ldsi s10113, 5056 # 11056
+ldsi s10115, 5057 # 11057
+ldsi s10117, 5058 # 11058
+ldsi s10119, 5059 # 11059
+ldsi s10121, 5060 # 11060
+ldsi s10123, 5061 # 11061
+ldsi s10125, 5062 # 11062
+ldsi s10127, 5063 # 11063
+ldsi s10129, 5064 # 11064
+ldsi s10131, 5065 # 11065
+ldsi s10133, 5066 # 11066
+ldsi s10135, 5067 # 11067
+ldsi s10137, 5068 # 11068
+ldsi s10139, 5069 # 11069
+ldsi s10141, 5070 # 11070
+ldsi s10143, 5071 # 11071
+ldsi s10145, 5072 # 11072
+ldsi s10147, 5073 # 11073
+ldsi s10149, 5074 # 11074
+ldsi s10151, 5075 # 11075
+ldsi s10153, 5076 # 11076
+ldsi s10155, 5077 # 11077
+ldsi s10157, 5078 # 11078
+ldsi s10159, 5079 # 11079
+ldsi s10161, 5080 # 11080
+ldsi s10163, 5081 # 11081
+ldsi s10165, 5082 # 11082
+ldsi s10167, 5083 # 11083
+ldsi s10169, 5084 # 11084
+ldsi s10171, 5085 # 11085
+ldsi s10173, 5086 # 11086
+ldsi s10175, 5087 # 11087
+ldsi s10177, 5088 # 11088
+ldsi s10179, 5089 # 11089
+ldsi s10181, 5090 # 11090
+ldsi s10183, 5091 # 11091
+ldsi s10185, 5092 # 11092
+ldsi s10187, 5093 # 11093
+ldsi s10189, 5094 # 11094
+ldsi s10191, 5095 # 11095
+ldsi s10193, 5096 # 11096
+ldsi s10195, 5097 # 11097
+ldsi s10197, 5098 # 11098
+ldsi s10199, 5099 # 11099
+ldsi s10201, 5100 # 11100
+ldsi s10203, 5101 # 11101
+ldsi s10205, 5102 # 11102
+ldsi s10207, 5103 # 11103
+ldsi s10209, 5104 # 11104
+ldsi s10211, 5105 # 11105
+ldsi s10213, 5106 # 11106
+ldsi s10215, 5107 # 11107
+ldsi s10217, 5108 # 11108
+ldsi s10219, 5109 # 11109
+ldsi s10221, 5110 # 11110
+ldsi s10223, 5111 # 11111
+ldsi s10225, 5112 # 11112
+ldsi s10227, 5113 # 11113
+ldsi s10229, 5114 # 11114
+ldsi s10231, 5115 # 11115
+ldsi s10233, 5116 # 11116
+ldsi s10235, 5117 # 11117
+ldsi s10237, 5118 # 11118
+ldsi s10239, 5119 # 11119
+ldsi s10241, 5120 # 11120
+ldsi s10243, 5121 # 11121
+ldsi s10245, 5122 # 11122
+ldsi s10247, 5123 # 11123
+ldsi s10249, 5124 # 11124
+ldsi s10251, 5125 # 11125
+ldsi s10253, 5126 # 11126
+ldsi s10255, 5127 # 11127
+ldsi s10257, 5128 # 11128
+ldsi s10259, 5129 # 11129
+ldsi s10261, 5130 # 11130
+ldsi s10263, 5131 # 11131
+ldsi s10265, 5132 # 11132
+ldsi s10267, 5133 # 11133
+ldsi s10269, 5134 # 11134
+ldsi s10271, 5135 # 11135
+ldsi s10273, 5136 # 11136
+ldsi s10275, 5137 # 11137
+ldsi s10277, 5138 # 11138
+ldsi s10279, 5139 # 11139
+ldsi s10281, 5140 # 11140
+ldsi s10283, 5141 # 11141
+ldsi s10285, 5142 # 11142
+ldsi s10287, 5143 # 11143
+ldsi s10289, 5144 # 11144
+ldsi s10291, 5145 # 11145
+ldsi s10293, 5146 # 11146
+ldsi s10295, 5147 # 11147
+ldsi s10297, 5148 # 11148
+ldsi s10299, 5149 # 11149
+ldsi s10301, 5150 # 11150
+ldsi s10303, 5151 # 11151
+ldsi s10305, 5152 # 11152
+ldsi s10307, 5153 # 11153
+ldsi s10309, 5154 # 11154
+ldsi s10311, 5155 # 11155
+ldsi s10313, 5156 # 11156
+ldsi s10315, 5157 # 11157
+ldsi s10317, 5158 # 11158
+ldsi s10319, 5159 # 11159
+ldsi s10321, 5160 # 11160
+ldsi s10323, 5161 # 11161
+ldsi s10325, 5162 # 11162
+ldsi s10327, 5163 # 11163
+ldsi s10329, 5164 # 11164
+ldsi s10331, 5165 # 11165
+ldsi s10333, 5166 # 11166
+ldsi s10335, 5167 # 11167
+ldsi s10337, 5168 # 11168
+ldsi s10339, 5169 # 11169
+ldsi s10341, 5170 # 11170
+ldsi s10343, 5171 # 11171
+ldsi s10345, 5172 # 11172
+ldsi s10347, 5173 # 11173
+ldsi s10349, 5174 # 11174
+ldsi s10351, 5175 # 11175
+ldsi s10353, 5176 # 11176
+ldsi s10355, 5177 # 11177
+ldsi s10357, 5178 # 11178
+ldsi s10359, 5179 # 11179
+ldsi s10361, 5180 # 11180
+ldsi s10363, 5181 # 11181
+ldsi s10365, 5182 # 11182
+ldsi s10367, 5183 # 11183
+ldsi s10369, 5184 # 11184
+ldsi s10371, 5185 # 11185
+ldsi s10373, 5186 # 11186
+ldsi s10375, 5187 # 11187
+ldsi s10377, 5188 # 11188
+ldsi s10379, 5189 # 11189
+ldsi s10381, 5190 # 11190
+ldsi s10383, 5191 # 11191
+ldsi s10385, 5192 # 11192
+ldsi s10387, 5193 # 11193
+ldsi s10389, 5194 # 11194
+ldsi s10391, 5195 # 11195
+ldsi s10393, 5196 # 11196
+ldsi s10395, 5197 # 11197
+ldsi s10397, 5198 # 11198
+ldsi s10399, 5199 # 11199
+ldsi s10401, 5200 # 11200
+ldsi s10403, 5201 # 11201
+ldsi s10405, 5202 # 11202
+ldsi s10407, 5203 # 11203
+ldsi s10409, 5204 # 11204
+ldsi s10411, 5205 # 11205
+ldsi s10413, 5206 # 11206
+ldsi s10415, 5207 # 11207
+ldsi s10417, 5208 # 11208
+ldsi s10419, 5209 # 11209
+ldsi s10421, 5210 # 11210
+ldsi s10423, 5211 # 11211
+ldsi s10425, 5212 # 11212
+ldsi s10427, 5213 # 11213
+ldsi s10429, 5214 # 11214
+ldsi s10431, 5215 # 11215
+ldsi s10433, 5216 # 11216
+ldsi s10435, 5217 # 11217
+ldsi s10437, 5218 # 11218
+ldsi s10439, 5219 # 11219
+ldsi s10441, 5220 # 11220
+ldsi s10443, 5221 # 11221
+ldsi s10445, 5222 # 11222
+ldsi s10447, 5223 # 11223
+ldsi s10449, 5224 # 11224
+ldsi s10451, 5225 # 11225
+ldsi s10453, 5226 # 11226
+ldsi s10455, 5227 # 11227
+ldsi s10457, 5228 # 11228
+ldsi s10459, 5229 # 11229
+ldsi s10461, 5230 # 11230
+ldsi s10463, 5231 # 11231
+ldsi s10465, 5232 # 11232
+ldsi s10467, 5233 # 11233
+ldsi s10469, 5234 # 11234
+ldsi s10471, 5235 # 11235
+ldsi s10473, 5236 # 11236
+ldsi s10475, 5237 # 11237
+ldsi s10477, 5238 # 11238
+ldsi s10479, 5239 # 11239
+ldsi s10481, 5240 # 11240
+ldsi s10483, 5241 # 11241
+ldsi s10485, 5242 # 11242
+ldsi s10487, 5243 # 11243
+ldsi s10489, 5244 # 11244
+ldsi s10491, 5245 # 11245
+ldsi s10493, 5246 # 11246
+ldsi s10495, 5247 # 11247
+ldsi s10497, 5248 # 11248
+ldsi s10499, 5249 # 11249
+ldsi s10501, 5250 # 11250
+ldsi s10503, 5251 # 11251
+ldsi s10505, 5252 # 11252
+ldsi s10507, 5253 # 11253
+ldsi s10509, 5254 # 11254
+ldsi s10511, 5255 # 11255
+ldsi s10513, 5256 # 11256
+ldsi s10515, 5257 # 11257
+ldsi s10517, 5258 # 11258
+ldsi s10519, 5259 # 11259
+ldsi s10521, 5260 # 11260
+ldsi s10523, 5261 # 11261
+ldsi s10525, 5262 # 11262
+ldsi s10527, 5263 # 11263
+ldsi s10529, 5264 # 11264
+ldsi s10531, 5265 # 11265
+ldsi s10533, 5266 # 11266
+ldsi s10535, 5267 # 11267
+ldsi s10537, 5268 # 11268
+ldsi s10539, 5269 # 11269
+ldsi s10541, 5270 # 11270
+ldsi s10543, 5271 # 11271
+ldsi s10545, 5272 # 11272
+ldsi s10547, 5273 # 11273
+ldsi s10549, 5274 # 11274
+ldsi s10551, 5275 # 11275
+ldsi s10553, 5276 # 11276
+ldsi s10555, 5277 # 11277
+ldsi s10557, 5278 # 11278
+ldsi s10559, 5279 # 11279
+ldsi s10561, 5280 # 11280
+ldsi s10563, 5281 # 11281
+ldsi s10565, 5282 # 11282
+ldsi s10567, 5283 # 11283
+ldsi s10569, 5284 # 11284
+ldsi s10571, 5285 # 11285
+ldsi s10573, 5286 # 11286
+ldsi s10575, 5287 # 11287
+ldsi s10577, 5288 # 11288
+ldsi s10579, 5289 # 11289
+ldsi s10581, 5290 # 11290
+ldsi s10583, 5291 # 11291
+ldsi s10585, 5292 # 11292
+ldsi s10587, 5293 # 11293
+ldsi s10589, 5294 # 11294
+ldsi s10591, 5295 # 11295
+ldsi s10593, 5296 # 11296
+ldsi s10595, 5297 # 11297
+ldsi s10597, 5298 # 11298
+ldsi s10599, 5299 # 11299
+ldsi s10601, 5300 # 11300
+ldsi s10603, 5301 # 11301
+ldsi s10605, 5302 # 11302
+ldsi s10607, 5303 # 11303
+ldsi s10609, 5304 # 11304
+ldsi s10611, 5305 # 11305
+ldsi s10613, 5306 # 11306
+ldsi s10615, 5307 # 11307
+ldsi s10617, 5308 # 11308
+ldsi s10619, 5309 # 11309
+ldsi s10621, 5310 # 11310
+ldsi s10623, 5311 # 11311
+ldsi s10625, 5312 # 11312
+ldsi s10627, 5313 # 11313
+ldsi s10629, 5314 # 11314
+ldsi s10631, 5315 # 11315
+ldsi s10633, 5316 # 11316
+ldsi s10635, 5317 # 11317
+ldsi s10637, 5318 # 11318
+ldsi s10639, 5319 # 11319
+ldsi s10641, 5320 # 11320
+ldsi s10643, 5321 # 11321
+ldsi s10645, 5322 # 11322
+ldsi s10647, 5323 # 11323
+ldsi s10649, 5324 # 11324
+ldsi s10651, 5325 # 11325
+ldsi s10653, 5326 # 11326
+ldsi s10655, 5327 # 11327
+ldsi s10657, 5328 # 11328
+ldsi s10659, 5329 # 11329
+ldsi s10661, 5330 # 11330
+ldsi s10663, 5331 # 11331
+ldsi s10665, 5332 # 11332
+ldsi s10667, 5333 # 11333
+ldsi s10669, 5334 # 11334
+ldsi s10671, 5335 # 11335
+ldsi s10673, 5336 # 11336
+ldsi s10675, 5337 # 11337
+ldsi s10677, 5338 # 11338
+ldsi s10679, 5339 # 11339
+ldsi s10681, 5340 # 11340
+ldsi s10683, 5341 # 11341
+ldsi s10685, 5342 # 11342
+ldsi s10687, 5343 # 11343
+ldsi s10689, 5344 # 11344
+ldsi s10691, 5345 # 11345
+ldsi s10693, 5346 # 11346
+ldsi s10695, 5347 # 11347
+ldsi s10697, 5348 # 11348
+ldsi s10699, 5349 # 11349
+ldsi s10701, 5350 # 11350
+ldsi s10703, 5351 # 11351
+ldsi s10705, 5352 # 11352
+ldsi s10707, 5353 # 11353
+ldsi s10709, 5354 # 11354
+ldsi s10711, 5355 # 11355
+ldsi s10713, 5356 # 11356
+ldsi s10715, 5357 # 11357
+ldsi s10717, 5358 # 11358
+ldsi s10719, 5359 # 11359
+ldsi s10721, 5360 # 11360
+ldsi s10723, 5361 # 11361
+ldsi s10725, 5362 # 11362
+ldsi s10727, 5363 # 11363
+ldsi s10729, 5364 # 11364
+ldsi s10731, 5365 # 11365
+ldsi s10733, 5366 # 11366
+ldsi s10735, 5367 # 11367
+ldsi s10737, 5368 # 11368
+ldsi s10739, 5369 # 11369
+ldsi s10741, 5370 # 11370
+ldsi s10743, 5371 # 11371
+ldsi s10745, 5372 # 11372
+ldsi s10747, 5373 # 11373
+ldsi s10749, 5374 # 11374
+ldsi s10751, 5375 # 11375
+ldsi s10753, 5376 # 11376
+ldsi s10755, 5377 # 11377
+ldsi s10757, 5378 # 11378
+ldsi s10759, 5379 # 11379
+ldsi s10761, 5380 # 11380
+ldsi s10763, 5381 # 11381
+ldsi s10765, 5382 # 11382
+ldsi s10767, 5383 # 11383
+ldsi s10769, 5384 # 11384
+ldsi s10771, 5385 # 11385
+ldsi s10773, 5386 # 11386
+ldsi s10775, 5387 # 11387
+ldsi s10777, 5388 # 11388
+ldsi s10779, 5389 # 11389
+ldsi s10781, 5390 # 11390
+ldsi s10783, 5391 # 11391
+ldsi s10785, 5392 # 11392
+ldsi s10787, 5393 # 11393
+ldsi s10789, 5394 # 11394
+ldsi s10791, 5395 # 11395
+ldsi s10793, 5396 # 11396
+ldsi s10795, 5397 # 11397
+ldsi s10797, 5398 # 11398
+ldsi s10799, 5399 # 11399
+ldsi s10801, 5400 # 11400
+ldsi s10803, 5401 # 11401
+ldsi s10805, 5402 # 11402
+ldsi s10807, 5403 # 11403
+ldsi s10809, 5404 # 11404
+ldsi s10811, 5405 # 11405
+ldsi s10813, 5406 # 11406
+ldsi s10815, 5407 # 11407
+ldsi s10817, 5408 # 11408
+ldsi s10819, 5409 # 11409
+ldsi s10821, 5410 # 11410
+ldsi s10823, 5411 # 11411
+ldsi s10825, 5412 # 11412
+ldsi s10827, 5413 # 11413
+ldsi s10829, 5414 # 11414
+ldsi s10831, 5415 # 11415
+ldsi s10833, 5416 # 11416
+ldsi s10835, 5417 # 11417
+ldsi s10837, 5418 # 11418
+ldsi s10839, 5419 # 11419
+ldsi s10841, 5420 # 11420
+ldsi s10843, 5421 # 11421
+ldsi s10845, 5422 # 11422
+ldsi s10847, 5423 # 11423
+ldsi s10849, 5424 # 11424
+ldsi s10851, 5425 # 11425
+ldsi s10853, 5426 # 11426
+ldsi s10855, 5427 # 11427
+ldsi s10857, 5428 # 11428
+ldsi s10859, 5429 # 11429
+ldsi s10861, 5430 # 11430
+ldsi s10863, 5431 # 11431
+ldsi s10865, 5432 # 11432
+ldsi s10867, 5433 # 11433
+ldsi s10869, 5434 # 11434
+ldsi s10871, 5435 # 11435
+ldsi s10873, 5436 # 11436
+ldsi s10875, 5437 # 11437
+ldsi s10877, 5438 # 11438
+ldsi s10879, 5439 # 11439
+ldsi s10881, 5440 # 11440
+ldsi s10883, 5441 # 11441
+ldsi s10885, 5442 # 11442
+ldsi s10887, 5443 # 11443
+ldsi s10889, 5444 # 11444
+ldsi s10891, 5445 # 11445
+ldsi s10893, 5446 # 11446
+ldsi s10895, 5447 # 11447
+ldsi s10897, 5448 # 11448
+ldsi s10899, 5449 # 11449
+ldsi s10901, 5450 # 11450
+ldsi s10903, 5451 # 11451
+ldsi s10905, 5452 # 11452
+ldsi s10907, 5453 # 11453
+ldsi s10909, 5454 # 11454
+ldsi s10911, 5455 # 11455
+ldsi s10913, 5456 # 11456
+ldsi s10915, 5457 # 11457
+ldsi s10917, 5458 # 11458
+ldsi s10919, 5459 # 11459
+ldsi s10921, 5460 # 11460
+ldsi s10923, 5461 # 11461
+ldsi s10925, 5462 # 11462
+ldsi s10927, 5463 # 11463
+ldsi s10929, 5464 # 11464
+ldsi s10931, 5465 # 11465
+ldsi s10933, 5466 # 11466
+ldsi s10935, 5467 # 11467
+ldsi s10937, 5468 # 11468
+ldsi s10939, 5469 # 11469
+ldsi s10941, 5470 # 11470
+ldsi s10943, 5471 # 11471
+ldsi s10945, 5472 # 11472
+ldsi s10947, 5473 # 11473
+ldsi s10949, 5474 # 11474
+ldsi s10951, 5475 # 11475
+ldsi s10953, 5476 # 11476
+ldsi s10955, 5477 # 11477
+ldsi s10957, 5478 # 11478
+ldsi s10959, 5479 # 11479
+ldsi s10961, 5480 # 11480
+ldsi s10963, 5481 # 11481
+ldsi s10965, 5482 # 11482
+ldsi s10967, 5483 # 11483
+ldsi s10969, 5484 # 11484
+ldsi s10971, 5485 # 11485
+ldsi s10973, 5486 # 11486
+ldsi s10975, 5487 # 11487
+ldsi s10977, 5488 # 11488
+ldsi s10979, 5489 # 11489
+ldsi s10981, 5490 # 11490
+ldsi s10983, 5491 # 11491
+ldsi s10985, 5492 # 11492
+ldsi s10987, 5493 # 11493
+ldsi s10989, 5494 # 11494
+ldsi s10991, 5495 # 11495
+ldsi s10993, 5496 # 11496
+ldsi s10995, 5497 # 11497
+ldsi s10997, 5498 # 11498
+ldsi s10999, 5499 # 11499
+ldsi s11001, 5500 # 11500
+ldsi s11003, 5501 # 11501
+ldsi s11005, 5502 # 11502
+ldsi s11007, 5503 # 11503
+ldsi s11009, 5504 # 11504
+ldsi s11011, 5505 # 11505
+ldsi s11013, 5506 # 11506
+ldsi s11015, 5507 # 11507
+ldsi s11017, 5508 # 11508
+ldsi s11019, 5509 # 11509
+ldsi s11021, 5510 # 11510
+ldsi s11023, 5511 # 11511
+ldsi s11025, 5512 # 11512
+ldsi s11027, 5513 # 11513
+ldsi s11029, 5514 # 11514
+ldsi s11031, 5515 # 11515
+ldsi s11033, 5516 # 11516
+ldsi s11035, 5517 # 11517
+ldsi s11037, 5518 # 11518
+ldsi s11039, 5519 # 11519
+ldsi s11041, 5520 # 11520
+ldsi s11043, 5521 # 11521
+ldsi s11045, 5522 # 11522
+ldsi s11047, 5523 # 11523
+ldsi s11049, 5524 # 11524
+ldsi s11051, 5525 # 11525
+ldsi s11053, 5526 # 11526
+ldsi s11055, 5527 # 11527
+ldsi s11057, 5528 # 11528
+ldsi s11059, 5529 # 11529
+ldsi s11061, 5530 # 11530
+ldsi s11063, 5531 # 11531
+ldsi s11065, 5532 # 11532
+ldsi s11067, 5533 # 11533
+ldsi s11069, 5534 # 11534
+ldsi s11071, 5535 # 11535
+ldsi s11073, 5536 # 11536
+ldsi s11075, 5537 # 11537
+ldsi s11077, 5538 # 11538
+ldsi s11079, 5539 # 11539
+ldsi s11081, 5540 # 11540
+ldsi s11083, 5541 # 11541
+ldsi s11085, 5542 # 11542
+ldsi s11087, 5543 # 11543
+ldsi s11089, 5544 # 11544
+ldsi s11091, 5545 # 11545
+ldsi s11093, 5546 # 11546
+ldsi s11095, 5547 # 11547
+ldsi s11097, 5548 # 11548
+ldsi s11099, 5549 # 11549
+ldsi s11101, 5550 # 11550
+ldsi s11103, 5551 # 11551
+ldsi s11105, 5552 # 11552
+ldsi s11107, 5553 # 11553
+ldsi s11109, 5554 # 11554
+ldsi s11111, 5555 # 11555
+ldsi s11113, 5556 # 11556
+ldsi s11115, 5557 # 11557
+ldsi s11117, 5558 # 11558
+ldsi s11119, 5559 # 11559
+ldsi s11121, 5560 # 11560
+ldsi s11123, 5561 # 11561
+ldsi s11125, 5562 # 11562
+ldsi s11127, 5563 # 11563
+ldsi s11129, 5564 # 11564
+ldsi s11131, 5565 # 11565
+ldsi s11133, 5566 # 11566
+ldsi s11135, 5567 # 11567
+ldsi s11137, 5568 # 11568
+ldsi s11139, 5569 # 11569
+ldsi s11141, 5570 # 11570
+ldsi s11143, 5571 # 11571
+ldsi s11145, 5572 # 11572
+ldsi s11147, 5573 # 11573
+ldsi s11149, 5574 # 11574
+ldsi s11151, 5575 # 11575
+ldsi s11153, 5576 # 11576
+ldsi s11155, 5577 # 11577
+ldsi s11157, 5578 # 11578
+ldsi s11159, 5579 # 11579
+ldsi s11161, 5580 # 11580
+ldsi s11163, 5581 # 11581
+ldsi s11165, 5582 # 11582
+ldsi s11167, 5583 # 11583
+ldsi s11169, 5584 # 11584
+ldsi s11171, 5585 # 11585
+ldsi s11173, 5586 # 11586
+ldsi s11175, 5587 # 11587
+ldsi s11177, 5588 # 11588
+ldsi s11179, 5589 # 11589
+ldsi s11181, 5590 # 11590
+ldsi s11183, 5591 # 11591
+ldsi s11185, 5592 # 11592
+ldsi s11187, 5593 # 11593
+ldsi s11189, 5594 # 11594
+ldsi s11191, 5595 # 11595
+ldsi s11193, 5596 # 11596
+ldsi s11195, 5597 # 11597
+ldsi s11197, 5598 # 11598
+ldsi s11199, 5599 # 11599
+ldsi s11201, 5600 # 11600
+ldsi s11203, 5601 # 11601
+ldsi s11205, 5602 # 11602
+ldsi s11207, 5603 # 11603
+ldsi s11209, 5604 # 11604
+ldsi s11211, 5605 # 11605
+ldsi s11213, 5606 # 11606
+ldsi s11215, 5607 # 11607
+ldsi s11217, 5608 # 11608
+ldsi s11219, 5609 # 11609
+ldsi s11221, 5610 # 11610
+ldsi s11223, 5611 # 11611
+ldsi s11225, 5612 # 11612
+ldsi s11227, 5613 # 11613
+ldsi s11229, 5614 # 11614
+ldsi s11231, 5615 # 11615
+ldsi s11233, 5616 # 11616
+ldsi s11235, 5617 # 11617
+ldsi s11237, 5618 # 11618
+ldsi s11239, 5619 # 11619
+ldsi s11241, 5620 # 11620
+ldsi s11243, 5621 # 11621
+ldsi s11245, 5622 # 11622
+ldsi s11247, 5623 # 11623
+ldsi s11249, 5624 # 11624
+ldsi s11251, 5625 # 11625
+ldsi s11253, 5626 # 11626
+ldsi s11255, 5627 # 11627
+ldsi s11257, 5628 # 11628
+ldsi s11259, 5629 # 11629
+ldsi s11261, 5630 # 11630
+ldsi s11263, 5631 # 11631
+ldsi s11265, 5632 # 11632
+ldsi s11267, 5633 # 11633
+ldsi s11269, 5634 # 11634
+ldsi s11271, 5635 # 11635
+ldsi s11273, 5636 # 11636
+ldsi s11275, 5637 # 11637
+ldsi s11277, 5638 # 11638
+ldsi s11279, 5639 # 11639
+ldsi s11281, 5640 # 11640
+ldsi s11283, 5641 # 11641
+ldsi s11285, 5642 # 11642
+ldsi s11287, 5643 # 11643
+ldsi s11289, 5644 # 11644
+ldsi s11291, 5645 # 11645
+ldsi s11293, 5646 # 11646
+ldsi s11295, 5647 # 11647
+ldsi s11297, 5648 # 11648
+ldsi s11299, 5649 # 11649
+ldsi s11301, 5650 # 11650
+ldsi s11303, 5651 # 11651
+ldsi s11305, 5652 # 11652
+ldsi s11307, 5653 # 11653
+ldsi s11309, 5654 # 11654
+ldsi s11311, 5655 # 11655
+ldsi s11313, 5656 # 11656
+ldsi s11315, 5657 # 11657
+ldsi s11317, 5658 # 11658
+ldsi s11319, 5659 # 11659
+ldsi s11321, 5660 # 11660
+ldsi s11323, 5661 # 11661
+ldsi s11325, 5662 # 11662
+ldsi s11327, 5663 # 11663
+ldsi s11329, 5664 # 11664
+ldsi s11331, 5665 # 11665
+ldsi s11333, 5666 # 11666
+ldsi s11335, 5667 # 11667
+ldsi s11337, 5668 # 11668
+ldsi s11339, 5669 # 11669
+ldsi s11341, 5670 # 11670
+ldsi s11343, 5671 # 11671
+ldsi s11345, 5672 # 11672
+ldsi s11347, 5673 # 11673
+ldsi s11349, 5674 # 11674
+ldsi s11351, 5675 # 11675
+ldsi s11353, 5676 # 11676
+ldsi s11355, 5677 # 11677
+ldsi s11357, 5678 # 11678
+ldsi s11359, 5679 # 11679
+ldsi s11361, 5680 # 11680
+ldsi s11363, 5681 # 11681
+ldsi s11365, 5682 # 11682
+ldsi s11367, 5683 # 11683
+ldsi s11369, 5684 # 11684
+ldsi s11371, 5685 # 11685
+ldsi s11373, 5686 # 11686
+ldsi s11375, 5687 # 11687
+ldsi s11377, 5688 # 11688
+ldsi s11379, 5689 # 11689
+ldsi s11381, 5690 # 11690
+ldsi s11383, 5691 # 11691
+ldsi s11385, 5692 # 11692
+ldsi s11387, 5693 # 11693
+ldsi s11389, 5694 # 11694
+ldsi s11391, 5695 # 11695
+ldsi s11393, 5696 # 11696
+ldsi s11395, 5697 # 11697
+ldsi s11397, 5698 # 11698
+ldsi s11399, 5699 # 11699
+ldsi s11401, 5700 # 11700
+ldsi s11403, 5701 # 11701
+ldsi s11405, 5702 # 11702
+ldsi s11407, 5703 # 11703
+ldsi s11409, 5704 # 11704
+ldsi s11411, 5705 # 11705
+ldsi s11413, 5706 # 11706
+ldsi s11415, 5707 # 11707
+ldsi s11417, 5708 # 11708
+ldsi s11419, 5709 # 11709
+ldsi s11421, 5710 # 11710
+ldsi s11423, 5711 # 11711
+ldsi s11425, 5712 # 11712
+ldsi s11427, 5713 # 11713
+ldsi s11429, 5714 # 11714
+ldsi s11431, 5715 # 11715
+ldsi s11433, 5716 # 11716
+ldsi s11435, 5717 # 11717
+ldsi s11437, 5718 # 11718
+ldsi s11439, 5719 # 11719
+ldsi s11441, 5720 # 11720
+ldsi s11443, 5721 # 11721
+ldsi s11445, 5722 # 11722
+ldsi s11447, 5723 # 11723
+ldsi s11449, 5724 # 11724
+ldsi s11451, 5725 # 11725
+ldsi s11453, 5726 # 11726
+ldsi s11455, 5727 # 11727
+ldsi s11457, 5728 # 11728
+ldsi s11459, 5729 # 11729
+ldsi s11461, 5730 # 11730
+ldsi s11463, 5731 # 11731
+ldsi s11465, 5732 # 11732
+ldsi s11467, 5733 # 11733
+ldsi s11469, 5734 # 11734
+ldsi s11471, 5735 # 11735
+ldsi s11473, 5736 # 11736
+ldsi s11475, 5737 # 11737
+ldsi s11477, 5738 # 11738
+ldsi s11479, 5739 # 11739
+ldsi s11481, 5740 # 11740
+ldsi s11483, 5741 # 11741
+ldsi s11485, 5742 # 11742
+ldsi s11487, 5743 # 11743
+ldsi s11489, 5744 # 11744
+ldsi s11491, 5745 # 11745
+ldsi s11493, 5746 # 11746
+ldsi s11495, 5747 # 11747
+ldsi s11497, 5748 # 11748
+ldsi s11499, 5749 # 11749
+ldsi s11501, 5750 # 11750
+ldsi s11503, 5751 # 11751
+ldsi s11505, 5752 # 11752
+ldsi s11507, 5753 # 11753
+ldsi s11509, 5754 # 11754
+ldsi s11511, 5755 # 11755
+ldsi s11513, 5756 # 11756
+ldsi s11515, 5757 # 11757
+ldsi s11517, 5758 # 11758
+ldsi s11519, 5759 # 11759
+ldsi s11521, 5760 # 11760
+ldsi s11523, 5761 # 11761
+ldsi s11525, 5762 # 11762
+ldsi s11527, 5763 # 11763
+ldsi s11529, 5764 # 11764
+ldsi s11531, 5765 # 11765
+ldsi s11533, 5766 # 11766
+ldsi s11535, 5767 # 11767
+ldsi s11537, 5768 # 11768
+ldsi s11539, 5769 # 11769
+ldsi s11541, 5770 # 11770
+ldsi s11543, 5771 # 11771
+ldsi s11545, 5772 # 11772
+ldsi s11547, 5773 # 11773
+ldsi s11549, 5774 # 11774
+ldsi s11551, 5775 # 11775
+ldsi s11553, 5776 # 11776
+ldsi s11555, 5777 # 11777
+ldsi s11557, 5778 # 11778
+ldsi s11559, 5779 # 11779
+ldsi s11561, 5780 # 11780
+ldsi s11563, 5781 # 11781
+ldsi s11565, 5782 # 11782
+ldsi s11567, 5783 # 11783
+ldsi s11569, 5784 # 11784
+ldsi s11571, 5785 # 11785
+ldsi s11573, 5786 # 11786
+ldsi s11575, 5787 # 11787
+ldsi s11577, 5788 # 11788
+ldsi s11579, 5789 # 11789
+ldsi s11581, 5790 # 11790
+ldsi s11583, 5791 # 11791
+ldsi s11585, 5792 # 11792
+ldsi s11587, 5793 # 11793
+ldsi s11589, 5794 # 11794
+ldsi s11591, 5795 # 11795
+ldsi s11593, 5796 # 11796
+ldsi s11595, 5797 # 11797
+ldsi s11597, 5798 # 11798
+ldsi s11599, 5799 # 11799
+ldsi s11601, 5800 # 11800
+ldsi s11603, 5801 # 11801
+ldsi s11605, 5802 # 11802
+ldsi s11607, 5803 # 11803
+ldsi s11609, 5804 # 11804
+ldsi s11611, 5805 # 11805
+ldsi s11613, 5806 # 11806
+ldsi s11615, 5807 # 11807
+ldsi s11617, 5808 # 11808
+ldsi s11619, 5809 # 11809
+ldsi s11621, 5810 # 11810
+ldsi s11623, 5811 # 11811
+ldsi s11625, 5812 # 11812
+ldsi s11627, 5813 # 11813
+ldsi s11629, 5814 # 11814
+ldsi s11631, 5815 # 11815
+ldsi s11633, 5816 # 11816
+ldsi s11635, 5817 # 11817
+ldsi s11637, 5818 # 11818
+ldsi s11639, 5819 # 11819
+ldsi s11641, 5820 # 11820
+ldsi s11643, 5821 # 11821
+ldsi s11645, 5822 # 11822
+ldsi s11647, 5823 # 11823
+ldsi s11649, 5824 # 11824
+ldsi s11651, 5825 # 11825
+ldsi s11653, 5826 # 11826
+ldsi s11655, 5827 # 11827
+ldsi s11657, 5828 # 11828
+ldsi s11659, 5829 # 11829
+ldsi s11661, 5830 # 11830
+ldsi s11663, 5831 # 11831
+ldsi s11665, 5832 # 11832
+ldsi s11667, 5833 # 11833
+ldsi s11669, 5834 # 11834
+ldsi s11671, 5835 # 11835
+ldsi s11673, 5836 # 11836
+ldsi s11675, 5837 # 11837
+ldsi s11677, 5838 # 11838
+ldsi s11679, 5839 # 11839
+ldsi s11681, 5840 # 11840
+ldsi s11683, 5841 # 11841
+ldsi s11685, 5842 # 11842
+ldsi s11687, 5843 # 11843
+ldsi s11689, 5844 # 11844
+ldsi s11691, 5845 # 11845
+ldsi s11693, 5846 # 11846
+ldsi s11695, 5847 # 11847
+ldsi s11697, 5848 # 11848
+ldsi s11699, 5849 # 11849
+ldsi s11701, 5850 # 11850
+ldsi s11703, 5851 # 11851
+ldsi s11705, 5852 # 11852
+ldsi s11707, 5853 # 11853
+ldsi s11709, 5854 # 11854
+ldsi s11711, 5855 # 11855
+ldsi s11713, 5856 # 11856
+ldsi s11715, 5857 # 11857
+ldsi s11717, 5858 # 11858
+ldsi s11719, 5859 # 11859
+ldsi s11721, 5860 # 11860
+ldsi s11723, 5861 # 11861
+ldsi s11725, 5862 # 11862
+ldsi s11727, 5863 # 11863
+ldsi s11729, 5864 # 11864
+ldsi s11731, 5865 # 11865
+ldsi s11733, 5866 # 11866
+ldsi s11735, 5867 # 11867
+ldsi s11737, 5868 # 11868
+ldsi s11739, 5869 # 11869
+ldsi s11741, 5870 # 11870
+ldsi s11743, 5871 # 11871
+ldsi s11745, 5872 # 11872
+ldsi s11747, 5873 # 11873
+ldsi s11749, 5874 # 11874
+ldsi s11751, 5875 # 11875
+ldsi s11753, 5876 # 11876
+ldsi s11755, 5877 # 11877
+ldsi s11757, 5878 # 11878
+ldsi s11759, 5879 # 11879
+ldsi s11761, 5880 # 11880
+ldsi s11763, 5881 # 11881
+ldsi s11765, 5882 # 11882
+ldsi s11767, 5883 # 11883
+ldsi s11769, 5884 # 11884
+ldsi s11771, 5885 # 11885
+ldsi s11773, 5886 # 11886
+ldsi s11775, 5887 # 11887
+ldsi s11777, 5888 # 11888
+ldsi s11779, 5889 # 11889
+ldsi s11781, 5890 # 11890
+ldsi s11783, 5891 # 11891
+ldsi s11785, 5892 # 11892
+ldsi s11787, 5893 # 11893
+ldsi s11789, 5894 # 11894
+ldsi s11791, 5895 # 11895
+ldsi s11793, 5896 # 11896
+ldsi s11795, 5897 # 11897
+ldsi s11797, 5898 # 11898
+ldsi s11799, 5899 # 11899
+ldsi s11801, 5900 # 11900
+ldsi s11803, 5901 # 11901
+ldsi s11805, 5902 # 11902
+ldsi s11807, 5903 # 11903
+ldsi s11809, 5904 # 11904
+ldsi s11811, 5905 # 11905
+ldsi s11813, 5906 # 11906
+ldsi s11815, 5907 # 11907
+ldsi s11817, 5908 # 11908
+ldsi s11819, 5909 # 11909
+ldsi s11821, 5910 # 11910
+ldsi s11823, 5911 # 11911
+ldsi s11825, 5912 # 11912
+ldsi s11827, 5913 # 11913
+ldsi s11829, 5914 # 11914
+ldsi s11831, 5915 # 11915
+ldsi s11833, 5916 # 11916
+ldsi s11835, 5917 # 11917
+ldsi s11837, 5918 # 11918
+ldsi s11839, 5919 # 11919
+ldsi s11841, 5920 # 11920
+ldsi s11843, 5921 # 11921
+ldsi s11845, 5922 # 11922
+ldsi s11847, 5923 # 11923
+ldsi s11849, 5924 # 11924
+ldsi s11851, 5925 # 11925
+ldsi s11853, 5926 # 11926
+ldsi s11855, 5927 # 11927
+ldsi s11857, 5928 # 11928
+ldsi s11859, 5929 # 11929
+ldsi s11861, 5930 # 11930
+ldsi s11863, 5931 # 11931
+ldsi s11865, 5932 # 11932
+ldsi s11867, 5933 # 11933
+ldsi s11869, 5934 # 11934
+ldsi s11871, 5935 # 11935
+ldsi s11873, 5936 # 11936
+ldsi s11875, 5937 # 11937
+ldsi s11877, 5938 # 11938
+ldsi s11879, 5939 # 11939
+ldsi s11881, 5940 # 11940
+ldsi s11883, 5941 # 11941
+ldsi s11885, 5942 # 11942
+ldsi s11887, 5943 # 11943
+ldsi s11889, 5944 # 11944
+ldsi s11891, 5945 # 11945
+ldsi s11893, 5946 # 11946
+ldsi s11895, 5947 # 11947
+ldsi s11897, 5948 # 11948
+ldsi s11899, 5949 # 11949
+ldsi s11901, 5950 # 11950
+ldsi s11903, 5951 # 11951
+ldsi s11905, 5952 # 11952
+ldsi s11907, 5953 # 11953
+ldsi s11909, 5954 # 11954
+ldsi s11911, 5955 # 11955
+ldsi s11913, 5956 # 11956
+ldsi s11915, 5957 # 11957
+ldsi s11917, 5958 # 11958
+ldsi s11919, 5959 # 11959
+ldsi s11921, 5960 # 11960
+ldsi s11923, 5961 # 11961
+ldsi s11925, 5962 # 11962
+ldsi s11927, 5963 # 11963
+ldsi s11929, 5964 # 11964
+ldsi s11931, 5965 # 11965
+ldsi s11933, 5966 # 11966
+ldsi s11935, 5967 # 11967
+ldsi s11937, 5968 # 11968
+ldsi s11939, 5969 # 11969
+ldsi s11941, 5970 # 11970
+ldsi s11943, 5971 # 11971
+ldsi s11945, 5972 # 11972
+ldsi s11947, 5973 # 11973
+ldsi s11949, 5974 # 11974
+ldsi s11951, 5975 # 11975
+ldsi s11953, 5976 # 11976
+ldsi s11955, 5977 # 11977
+ldsi s11957, 5978 # 11978
+ldsi s11959, 5979 # 11979
+ldsi s11961, 5980 # 11980
+ldsi s11963, 5981 # 11981
+ldsi s11965, 5982 # 11982
+ldsi s11967, 5983 # 11983
+ldsi s11969, 5984 # 11984
+ldsi s11971, 5985 # 11985
+ldsi s11973, 5986 # 11986
+ldsi s11975, 5987 # 11987
+ldsi s11977, 5988 # 11988
+ldsi s11979, 5989 # 11989
+ldsi s11981, 5990 # 11990
+ldsi s11983, 5991 # 11991
+ldsi s11985, 5992 # 11992
+ldsi s11987, 5993 # 11993
+ldsi s11989, 5994 # 11994
+ldsi s11991, 5995 # 11995
+ldsi s11993, 5996 # 11996
+ldsi s11995, 5997 # 11997
+ldsi s11997, 5998 # 11998
+ldsi s11999, 5999 # 11999
+addsi s6002, s2, 1 # 12000
+addsi s6004, s6003, 1 # 12001
+addsi s6006, s6005, 1 # 12002
+addsi s6008, s6007, 1 # 12003
+addsi s6010, s6009, 1 # 12004
+addsi s6012, s6011, 1 # 12005
+addsi s6014, s6013, 1 # 12006
+addsi s6016, s6015, 1 # 12007
+addsi s6018, s6017, 1 # 12008
+addsi s6020, s6019, 1 # 12009
+addsi s6022, s6021, 1 # 12010
+addsi s6024, s6023, 1 # 12011
+addsi s6026, s6025, 1 # 12012
+addsi s6028, s6027, 1 # 12013
+addsi s6030, s6029, 1 # 12014
+addsi s6032, s6031, 1 # 12015
+addsi s6034, s6033, 1 # 12016
+addsi s6036, s6035, 1 # 12017
+addsi s6038, s6037, 1 # 12018
+addsi s6040, s6039, 1 # 12019
+addsi s6042, s6041, 1 # 12020
+addsi s6044, s6043, 1 # 12021
+addsi s6046, s6045, 1 # 12022
+addsi s6048, s6047, 1 # 12023
+addsi s6050, s6049, 1 # 12024
+addsi s6052, s6051, 1 # 12025
+addsi s6054, s6053, 1 # 12026
+addsi s6056, s6055, 1 # 12027
+addsi s6058, s6057, 1 # 12028
+addsi s6060, s6059, 1 # 12029
+addsi s6062, s6061, 1 # 12030
+addsi s6064, s6063, 1 # 12031
+addsi s6066, s6065, 1 # 12032
+addsi s6068, s6067, 1 # 12033
+addsi s6070, s6069, 1 # 12034
+addsi s6072, s6071, 1 # 12035
+addsi s6074, s6073, 1 # 12036
+addsi s6076, s6075, 1 # 12037
+addsi s6078, s6077, 1 # 12038
+addsi s6080, s6079, 1 # 12039
+addsi s6082, s6081, 1 # 12040
+addsi s6084, s6083, 1 # 12041
+addsi s6086, s6085, 1 # 12042
+addsi s6088, s6087, 1 # 12043
+addsi s6090, s6089, 1 # 12044
+addsi s6092, s6091, 1 # 12045
+addsi s6094, s6093, 1 # 12046
+addsi s6096, s6095, 1 # 12047
+addsi s6098, s6097, 1 # 12048
+addsi s6100, s6099, 1 # 12049
+addsi s6102, s6101, 1 # 12050
+addsi s6104, s6103, 1 # 12051
+addsi s6106, s6105, 1 # 12052
+addsi s6108, s6107, 1 # 12053
+addsi s6110, s6109, 1 # 12054
+addsi s6112, s6111, 1 # 12055
+addsi s6114, s6113, 1 # 12056
+addsi s6116, s6115, 1 # 12057
+addsi s6118, s6117, 1 # 12058
+addsi s6120, s6119, 1 # 12059
+addsi s6122, s6121, 1 # 12060
+addsi s6124, s6123, 1 # 12061
+addsi s6126, s6125, 1 # 12062
+addsi s6128, s6127, 1 # 12063
+addsi s6130, s6129, 1 # 12064
+addsi s6132, s6131, 1 # 12065
+addsi s6134, s6133, 1 # 12066
+addsi s6136, s6135, 1 # 12067
+addsi s6138, s6137, 1 # 12068
+addsi s6140, s6139, 1 # 12069
+addsi s6142, s6141, 1 # 12070
+addsi s6144, s6143, 1 # 12071
+addsi s6146, s6145, 1 # 12072
+addsi s6148, s6147, 1 # 12073
+addsi s6150, s6149, 1 # 12074
+addsi s6152, s6151, 1 # 12075
+addsi s6154, s6153, 1 # 12076
+addsi s6156, s6155, 1 # 12077
+addsi s6158, s6157, 1 # 12078
+addsi s6160, s6159, 1 # 12079
+addsi s6162, s6161, 1 # 12080
+addsi s6164, s6163, 1 # 12081
+addsi s6166, s6165, 1 # 12082
+addsi s6168, s6167, 1 # 12083
+addsi s6170, s6169, 1 # 12084
+addsi s6172, s6171, 1 # 12085
+addsi s6174, s6173, 1 # 12086
+addsi s6176, s6175, 1 # 12087
+addsi s6178, s6177, 1 # 12088
+addsi s6180, s6179, 1 # 12089
+addsi s6182, s6181, 1 # 12090
+addsi s6184, s6183, 1 # 12091
+addsi s6186, s6185, 1 # 12092
+addsi s6188, s6187, 1 # 12093
+addsi s6190, s6189, 1 # 12094
+addsi s6192, s6191, 1 # 12095
+addsi s6194, s6193, 1 # 12096
+addsi s6196, s6195, 1 # 12097
+addsi s6198, s6197, 1 # 12098
+addsi s6200, s6199, 1 # 12099
+addsi s6202, s6201, 1 # 12100
+addsi s6204, s6203, 1 # 12101
+addsi s6206, s6205, 1 # 12102
+addsi s6208, s6207, 1 # 12103
+addsi s6210, s6209, 1 # 12104
+addsi s6212, s6211, 1 # 12105
+addsi s6214, s6213, 1 # 12106
+addsi s6216, s6215, 1 # 12107
+addsi s6218, s6217, 1 # 12108
+addsi s6220, s6219, 1 # 12109
+addsi s6222, s6221, 1 # 12110
+addsi s6224, s6223, 1 # 12111
+addsi s6226, s6225, 1 # 12112
+addsi s6228, s6227, 1 # 12113
+addsi s6230, s6229, 1 # 12114
+addsi s6232, s6231, 1 # 12115
+addsi s6234, s6233, 1 # 12116
+addsi s6236, s6235, 1 # 12117
+addsi s6238, s6237, 1 # 12118
+addsi s6240, s6239, 1 # 12119
+addsi s6242, s6241, 1 # 12120
+addsi s6244, s6243, 1 # 12121
+addsi s6246, s6245, 1 # 12122
+addsi s6248, s6247, 1 # 12123
+addsi s6250, s6249, 1 # 12124
+addsi s6252, s6251, 1 # 12125
+addsi s6254, s6253, 1 # 12126
+addsi s6256, s6255, 1 # 12127
+addsi s6258, s6257, 1 # 12128
+addsi s6260, s6259, 1 # 12129
+addsi s6262, s6261, 1 # 12130
+addsi s6264, s6263, 1 # 12131
+addsi s6266, s6265, 1 # 12132
+addsi s6268, s6267, 1 # 12133
+addsi s6270, s6269, 1 # 12134
+addsi s6272, s6271, 1 # 12135
+addsi s6274, s6273, 1 # 12136
+addsi s6276, s6275, 1 # 12137
+addsi s6278, s6277, 1 # 12138
+addsi s6280, s6279, 1 # 12139
+addsi s6282, s6281, 1 # 12140
+addsi s6284, s6283, 1 # 12141
+addsi s6286, s6285, 1 # 12142
+addsi s6288, s6287, 1 # 12143
+addsi s6290, s6289, 1 # 12144
+addsi s6292, s6291, 1 # 12145
+addsi s6294, s6293, 1 # 12146
+addsi s6296, s6295, 1 # 12147
+addsi s6298, s6297, 1 # 12148
+addsi s6300, s6299, 1 # 12149
+addsi s6302, s6301, 1 # 12150
+addsi s6304, s6303, 1 # 12151
+addsi s6306, s6305, 1 # 12152
+addsi s6308, s6307, 1 # 12153
+addsi s6310, s6309, 1 # 12154
+addsi s6312, s6311, 1 # 12155
+addsi s6314, s6313, 1 # 12156
+addsi s6316, s6315, 1 # 12157
+addsi s6318, s6317, 1 # 12158
+addsi s6320, s6319, 1 # 12159
+addsi s6322, s6321, 1 # 12160
+addsi s6324, s6323, 1 # 12161
+addsi s6326, s6325, 1 # 12162
+addsi s6328, s6327, 1 # 12163
+addsi s6330, s6329, 1 # 12164
+addsi s6332, s6331, 1 # 12165
+addsi s6334, s6333, 1 # 12166
+addsi s6336, s6335, 1 # 12167
+addsi s6338, s6337, 1 # 12168
+addsi s6340, s6339, 1 # 12169
+addsi s6342, s6341, 1 # 12170
+addsi s6344, s6343, 1 # 12171
+addsi s6346, s6345, 1 # 12172
+addsi s6348, s6347, 1 # 12173
+addsi s6350, s6349, 1 # 12174
+addsi s6352, s6351, 1 # 12175
+addsi s6354, s6353, 1 # 12176
+addsi s6356, s6355, 1 # 12177
+addsi s6358, s6357, 1 # 12178
+addsi s6360, s6359, 1 # 12179
+addsi s6362, s6361, 1 # 12180
+addsi s6364, s6363, 1 # 12181
+addsi s6366, s6365, 1 # 12182
+addsi s6368, s6367, 1 # 12183
+addsi s6370, s6369, 1 # 12184
+addsi s6372, s6371, 1 # 12185
+addsi s6374, s6373, 1 # 12186
+addsi s6376, s6375, 1 # 12187
+addsi s6378, s6377, 1 # 12188
+addsi s6380, s6379, 1 # 12189
+addsi s6382, s6381, 1 # 12190
+addsi s6384, s6383, 1 # 12191
+addsi s6386, s6385, 1 # 12192
+addsi s6388, s6387, 1 # 12193
+addsi s6390, s6389, 1 # 12194
+addsi s6392, s6391, 1 # 12195
+addsi s6394, s6393, 1 # 12196
+addsi s6396, s6395, 1 # 12197
+addsi s6398, s6397, 1 # 12198
+addsi s6400, s6399, 1 # 12199
+addsi s6402, s6401, 1 # 12200
+addsi s6404, s6403, 1 # 12201
+addsi s6406, s6405, 1 # 12202
+addsi s6408, s6407, 1 # 12203
+addsi s6410, s6409, 1 # 12204
+addsi s6412, s6411, 1 # 12205
+addsi s6414, s6413, 1 # 12206
+addsi s6416, s6415, 1 # 12207
+addsi s6418, s6417, 1 # 12208
+addsi s6420, s6419, 1 # 12209
+addsi s6422, s6421, 1 # 12210
+addsi s6424, s6423, 1 # 12211
+addsi s6426, s6425, 1 # 12212
+addsi s6428, s6427, 1 # 12213
+addsi s6430, s6429, 1 # 12214
+addsi s6432, s6431, 1 # 12215
+addsi s6434, s6433, 1 # 12216
+addsi s6436, s6435, 1 # 12217
+addsi s6438, s6437, 1 # 12218
+addsi s6440, s6439, 1 # 12219
+addsi s6442, s6441, 1 # 12220
+addsi s6444, s6443, 1 # 12221
+addsi s6446, s6445, 1 # 12222
+addsi s6448, s6447, 1 # 12223
+addsi s6450, s6449, 1 # 12224
+addsi s6452, s6451, 1 # 12225
+addsi s6454, s6453, 1 # 12226
+addsi s6456, s6455, 1 # 12227
+addsi s6458, s6457, 1 # 12228
+addsi s6460, s6459, 1 # 12229
+addsi s6462, s6461, 1 # 12230
+addsi s6464, s6463, 1 # 12231
+addsi s6466, s6465, 1 # 12232
+addsi s6468, s6467, 1 # 12233
+addsi s6470, s6469, 1 # 12234
+addsi s6472, s6471, 1 # 12235
+addsi s6474, s6473, 1 # 12236
+addsi s6476, s6475, 1 # 12237
+addsi s6478, s6477, 1 # 12238
+addsi s6480, s6479, 1 # 12239
+addsi s6482, s6481, 1 # 12240
+addsi s6484, s6483, 1 # 12241
+addsi s6486, s6485, 1 # 12242
+addsi s6488, s6487, 1 # 12243
+addsi s6490, s6489, 1 # 12244
+addsi s6492, s6491, 1 # 12245
+addsi s6494, s6493, 1 # 12246
+addsi s6496, s6495, 1 # 12247
+addsi s6498, s6497, 1 # 12248
+addsi s6500, s6499, 1 # 12249
+addsi s6502, s6501, 1 # 12250
+addsi s6504, s6503, 1 # 12251
+addsi s6506, s6505, 1 # 12252
+addsi s6508, s6507, 1 # 12253
+addsi s6510, s6509, 1 # 12254
+addsi s6512, s6511, 1 # 12255
+addsi s6514, s6513, 1 # 12256
+addsi s6516, s6515, 1 # 12257
+addsi s6518, s6517, 1 # 12258
+addsi s6520, s6519, 1 # 12259
+addsi s6522, s6521, 1 # 12260
+addsi s6524, s6523, 1 # 12261
+addsi s6526, s6525, 1 # 12262
+addsi s6528, s6527, 1 # 12263
+addsi s6530, s6529, 1 # 12264
+addsi s6532, s6531, 1 # 12265
+addsi s6534, s6533, 1 # 12266
+addsi s6536, s6535, 1 # 12267
+addsi s6538, s6537, 1 # 12268
+addsi s6540, s6539, 1 # 12269
+addsi s6542, s6541, 1 # 12270
+addsi s6544, s6543, 1 # 12271
+addsi s6546, s6545, 1 # 12272
+addsi s6548, s6547, 1 # 12273
+addsi s6550, s6549, 1 # 12274
+addsi s6552, s6551, 1 # 12275
+addsi s6554, s6553, 1 # 12276
+addsi s6556, s6555, 1 # 12277
+addsi s6558, s6557, 1 # 12278
+addsi s6560, s6559, 1 # 12279
+addsi s6562, s6561, 1 # 12280
+addsi s6564, s6563, 1 # 12281
+addsi s6566, s6565, 1 # 12282
+addsi s6568, s6567, 1 # 12283
+addsi s6570, s6569, 1 # 12284
+addsi s6572, s6571, 1 # 12285
+addsi s6574, s6573, 1 # 12286
+addsi s6576, s6575, 1 # 12287
+addsi s6578, s6577, 1 # 12288
+addsi s6580, s6579, 1 # 12289
+addsi s6582, s6581, 1 # 12290
+addsi s6584, s6583, 1 # 12291
+addsi s6586, s6585, 1 # 12292
+addsi s6588, s6587, 1 # 12293
+addsi s6590, s6589, 1 # 12294
+addsi s6592, s6591, 1 # 12295
+addsi s6594, s6593, 1 # 12296
+addsi s6596, s6595, 1 # 12297
+addsi s6598, s6597, 1 # 12298
+addsi s6600, s6599, 1 # 12299
+addsi s6602, s6601, 1 # 12300
+addsi s6604, s6603, 1 # 12301
+addsi s6606, s6605, 1 # 12302
+addsi s6608, s6607, 1 # 12303
+addsi s6610, s6609, 1 # 12304
+addsi s6612, s6611, 1 # 12305
+addsi s6614, s6613, 1 # 12306
+addsi s6616, s6615, 1 # 12307
+addsi s6618, s6617, 1 # 12308
+addsi s6620, s6619, 1 # 12309
+addsi s6622, s6621, 1 # 12310
+addsi s6624, s6623, 1 # 12311
+addsi s6626, s6625, 1 # 12312
+addsi s6628, s6627, 1 # 12313
+addsi s6630, s6629, 1 # 12314
+addsi s6632, s6631, 1 # 12315
+addsi s6634, s6633, 1 # 12316
+addsi s6636, s6635, 1 # 12317
+addsi s6638, s6637, 1 # 12318
+addsi s6640, s6639, 1 # 12319
+addsi s6642, s6641, 1 # 12320
+addsi s6644, s6643, 1 # 12321
+addsi s6646, s6645, 1 # 12322
+addsi s6648, s6647, 1 # 12323
+addsi s6650, s6649, 1 # 12324
+addsi s6652, s6651, 1 # 12325
+addsi s6654, s6653, 1 # 12326
+addsi s6656, s6655, 1 # 12327
+addsi s6658, s6657, 1 # 12328
+addsi s6660, s6659, 1 # 12329
+addsi s6662, s6661, 1 # 12330
+addsi s6664, s6663, 1 # 12331
+addsi s6666, s6665, 1 # 12332
+addsi s6668, s6667, 1 # 12333
+addsi s6670, s6669, 1 # 12334
+addsi s6672, s6671, 1 # 12335
+addsi s6674, s6673, 1 # 12336
+addsi s6676, s6675, 1 # 12337
+addsi s6678, s6677, 1 # 12338
+addsi s6680, s6679, 1 # 12339
+addsi s6682, s6681, 1 # 12340
+addsi s6684, s6683, 1 # 12341
+addsi s6686, s6685, 1 # 12342
+addsi s6688, s6687, 1 # 12343
+addsi s6690, s6689, 1 # 12344
+addsi s6692, s6691, 1 # 12345
+addsi s6694, s6693, 1 # 12346
+addsi s6696, s6695, 1 # 12347
+addsi s6698, s6697, 1 # 12348
+addsi s6700, s6699, 1 # 12349
+addsi s6702, s6701, 1 # 12350
+addsi s6704, s6703, 1 # 12351
+addsi s6706, s6705, 1 # 12352
+addsi s6708, s6707, 1 # 12353
+addsi s6710, s6709, 1 # 12354
+addsi s6712, s6711, 1 # 12355
+addsi s6714, s6713, 1 # 12356
+addsi s6716, s6715, 1 # 12357
+addsi s6718, s6717, 1 # 12358
+addsi s6720, s6719, 1 # 12359
+addsi s6722, s6721, 1 # 12360
+addsi s6724, s6723, 1 # 12361
+addsi s6726, s6725, 1 # 12362
+addsi s6728, s6727, 1 # 12363
+addsi s6730, s6729, 1 # 12364
+addsi s6732, s6731, 1 # 12365
+addsi s6734, s6733, 1 # 12366
+addsi s6736, s6735, 1 # 12367
+addsi s6738, s6737, 1 # 12368
+addsi s6740, s6739, 1 # 12369
+addsi s6742, s6741, 1 # 12370
+addsi s6744, s6743, 1 # 12371
+addsi s6746, s6745, 1 # 12372
+addsi s6748, s6747, 1 # 12373
+addsi s6750, s6749, 1 # 12374
+addsi s6752, s6751, 1 # 12375
+addsi s6754, s6753, 1 # 12376
+addsi s6756, s6755, 1 # 12377
+addsi s6758, s6757, 1 # 12378
+addsi s6760, s6759, 1 # 12379
+addsi s6762, s6761, 1 # 12380
+addsi s6764, s6763, 1 # 12381
+addsi s6766, s6765, 1 # 12382
+addsi s6768, s6767, 1 # 12383
+addsi s6770, s6769, 1 # 12384
+addsi s6772, s6771, 1 # 12385
+addsi s6774, s6773, 1 # 12386
+addsi s6776, s6775, 1 # 12387
+addsi s6778, s6777, 1 # 12388
+addsi s6780, s6779, 1 # 12389
+addsi s6782, s6781, 1 # 12390
+addsi s6784, s6783, 1 # 12391
+addsi s6786, s6785, 1 # 12392
+addsi s6788, s6787, 1 # 12393
+addsi s6790, s6789, 1 # 12394
+addsi s6792, s6791, 1 # 12395
+addsi s6794, s6793, 1 # 12396
+addsi s6796, s6795, 1 # 12397
+addsi s6798, s6797, 1 # 12398
+addsi s6800, s6799, 1 # 12399
+addsi s6802, s6801, 1 # 12400
+addsi s6804, s6803, 1 # 12401
+addsi s6806, s6805, 1 # 12402
+addsi s6808, s6807, 1 # 12403
+addsi s6810, s6809, 1 # 12404
+addsi s6812, s6811, 1 # 12405
+addsi s6814, s6813, 1 # 12406
+addsi s6816, s6815, 1 # 12407
+addsi s6818, s6817, 1 # 12408
+addsi s6820, s6819, 1 # 12409
+addsi s6822, s6821, 1 # 12410
+addsi s6824, s6823, 1 # 12411
+addsi s6826, s6825, 1 # 12412
+addsi s6828, s6827, 1 # 12413
+addsi s6830, s6829, 1 # 12414
+addsi s6832, s6831, 1 # 12415
+addsi s6834, s6833, 1 # 12416
+addsi s6836, s6835, 1 # 12417
+addsi s6838, s6837, 1 # 12418
+addsi s6840, s6839, 1 # 12419
+addsi s6842, s6841, 1 # 12420
+addsi s6844, s6843, 1 # 12421
+addsi s6846, s6845, 1 # 12422
+addsi s6848, s6847, 1 # 12423
+addsi s6850, s6849, 1 # 12424
+addsi s6852, s6851, 1 # 12425
+addsi s6854, s6853, 1 # 12426
+addsi s6856, s6855, 1 # 12427
+addsi s6858, s6857, 1 # 12428
+addsi s6860, s6859, 1 # 12429
+addsi s6862, s6861, 1 # 12430
+addsi s6864, s6863, 1 # 12431
+addsi s6866, s6865, 1 # 12432
+addsi s6868, s6867, 1 # 12433
+addsi s6870, s6869, 1 # 12434
+addsi s6872, s6871, 1 # 12435
+addsi s6874, s6873, 1 # 12436
+addsi s6876, s6875, 1 # 12437
+addsi s6878, s6877, 1 # 12438
+addsi s6880, s6879, 1 # 12439
+addsi s6882, s6881, 1 # 12440
+addsi s6884, s6883, 1 # 12441
+addsi s6886, s6885, 1 # 12442
+addsi s6888, s6887, 1 # 12443
+addsi s6890, s6889, 1 # 12444
+addsi s6892, s6891, 1 # 12445
+addsi s6894, s6893, 1 # 12446
+addsi s6896, s6895, 1 # 12447
+addsi s6898, s6897, 1 # 12448
+addsi s6900, s6899, 1 # 12449
+addsi s6902, s6901, 1 # 12450
+addsi s6904, s6903, 1 # 12451
+addsi s6906, s6905, 1 # 12452
+addsi s6908, s6907, 1 # 12453
+addsi s6910, s6909, 1 # 12454
+addsi s6912, s6911, 1 # 12455
+addsi s6914, s6913, 1 # 12456
+addsi s6916, s6915, 1 # 12457
+addsi s6918, s6917, 1 # 12458
+addsi s6920, s6919, 1 # 12459
+addsi s6922, s6921, 1 # 12460
+addsi s6924, s6923, 1 # 12461
+addsi s6926, s6925, 1 # 12462
+addsi s6928, s6927, 1 # 12463
+addsi s6930, s6929, 1 # 12464
+addsi s6932, s6931, 1 # 12465
+addsi s6934, s6933, 1 # 12466
+addsi s6936, s6935, 1 # 12467
+addsi s6938, s6937, 1 # 12468
+addsi s6940, s6939, 1 # 12469
+addsi s6942, s6941, 1 # 12470
+addsi s6944, s6943, 1 # 12471
+addsi s6946, s6945, 1 # 12472
+addsi s6948, s6947, 1 # 12473
+addsi s6950, s6949, 1 # 12474
+addsi s6952, s6951, 1 # 12475
+addsi s6954, s6953, 1 # 12476
+addsi s6956, s6955, 1 # 12477
+addsi s6958, s6957, 1 # 12478
+addsi s6960, s6959, 1 # 12479
+addsi s6962, s6961, 1 # 12480
+addsi s6964, s6963, 1 # 12481
+addsi s6966, s6965, 1 # 12482
+addsi s6968, s6967, 1 # 12483
+addsi s6970, s6969, 1 # 12484
+addsi s6972, s6971, 1 # 12485
+addsi s6974, s6973, 1 # 12486
+addsi s6976, s6975, 1 # 12487
+addsi s6978, s6977, 1 # 12488
+addsi s6980, s6979, 1 # 12489
+addsi s6982, s6981, 1 # 12490
+addsi s6984, s6983, 1 # 12491
+addsi s6986, s6985, 1 # 12492
+addsi s6988, s6987, 1 # 12493
+addsi s6990, s6989, 1 # 12494
+addsi s6992, s6991, 1 # 12495
+addsi s6994, s6993, 1 # 12496
+addsi s6996, s6995, 1 # 12497
+addsi s6998, s6997, 1 # 12498
+addsi s7000, s6999, 1 # 12499
+addsi s7002, s7001, 1 # 12500
+addsi s7004, s7003, 1 # 12501
+addsi s7006, s7005, 1 # 12502
+addsi s7008, s7007, 1 # 12503
+addsi s7010, s7009, 1 # 12504
+addsi s7012, s7011, 1 # 12505
+addsi s7014, s7013, 1 # 12506
+addsi s7016, s7015, 1 # 12507
+addsi s7018, s7017, 1 # 12508
+addsi s7020, s7019, 1 # 12509
+addsi s7022, s7021, 1 # 12510
+addsi s7024, s7023, 1 # 12511
+addsi s7026, s7025, 1 # 12512
+addsi s7028, s7027, 1 # 12513
+addsi s7030, s7029, 1 # 12514
+addsi s7032, s7031, 1 # 12515
+addsi s7034, s7033, 1 # 12516
+addsi s7036, s7035, 1 # 12517
+addsi s7038, s7037, 1 # 12518
+addsi s7040, s7039, 1 # 12519
+addsi s7042, s7041, 1 # 12520
+addsi s7044, s7043, 1 # 12521
+addsi s7046, s7045, 1 # 12522
+addsi s7048, s7047, 1 # 12523
+addsi s7050, s7049, 1 # 12524
+addsi s7052, s7051, 1 # 12525
+addsi s7054, s7053, 1 # 12526
+addsi s7056, s7055, 1 # 12527
+addsi s7058, s7057, 1 # 12528
+addsi s7060, s7059, 1 # 12529
+addsi s7062, s7061, 1 # 12530
+addsi s7064, s7063, 1 # 12531
+addsi s7066, s7065, 1 # 12532
+addsi s7068, s7067, 1 # 12533
+addsi s7070, s7069, 1 # 12534
+addsi s7072, s7071, 1 # 12535
+addsi s7074, s7073, 1 # 12536
+addsi s7076, s7075, 1 # 12537
+addsi s7078, s7077, 1 # 12538
+addsi s7080, s7079, 1 # 12539
+addsi s7082, s7081, 1 # 12540
+addsi s7084, s7083, 1 # 12541
+addsi s7086, s7085, 1 # 12542
+addsi s7088, s7087, 1 # 12543
+addsi s7090, s7089, 1 # 12544
+addsi s7092, s7091, 1 # 12545
+addsi s7094, s7093, 1 # 12546
+addsi s7096, s7095, 1 # 12547
+addsi s7098, s7097, 1 # 12548
+addsi s7100, s7099, 1 # 12549
+addsi s7102, s7101, 1 # 12550
+addsi s7104, s7103, 1 # 12551
+addsi s7106, s7105, 1 # 12552
+addsi s7108, s7107, 1 # 12553
+addsi s7110, s7109, 1 # 12554
+addsi s7112, s7111, 1 # 12555
+addsi s7114, s7113, 1 # 12556
+addsi s7116, s7115, 1 # 12557
+addsi s7118, s7117, 1 # 12558
+addsi s7120, s7119, 1 # 12559
+addsi s7122, s7121, 1 # 12560
+addsi s7124, s7123, 1 # 12561
+addsi s7126, s7125, 1 # 12562
+addsi s7128, s7127, 1 # 12563
+addsi s7130, s7129, 1 # 12564
+addsi s7132, s7131, 1 # 12565
+addsi s7134, s7133, 1 # 12566
+addsi s7136, s7135, 1 # 12567
+addsi s7138, s7137, 1 # 12568
+addsi s7140, s7139, 1 # 12569
+addsi s7142, s7141, 1 # 12570
+addsi s7144, s7143, 1 # 12571
+addsi s7146, s7145, 1 # 12572
+addsi s7148, s7147, 1 # 12573
+addsi s7150, s7149, 1 # 12574
+addsi s7152, s7151, 1 # 12575
+addsi s7154, s7153, 1 # 12576
+addsi s7156, s7155, 1 # 12577
+addsi s7158, s7157, 1 # 12578
+addsi s7160, s7159, 1 # 12579
+addsi s7162, s7161, 1 # 12580
+addsi s7164, s7163, 1 # 12581
+addsi s7166, s7165, 1 # 12582
+addsi s7168, s7167, 1 # 12583
+addsi s7170, s7169, 1 # 12584
+addsi s7172, s7171, 1 # 12585
+addsi s7174, s7173, 1 # 12586
+addsi s7176, s7175, 1 # 12587
+addsi s7178, s7177, 1 # 12588
+addsi s7180, s7179, 1 # 12589
+addsi s7182, s7181, 1 # 12590
+addsi s7184, s7183, 1 # 12591
+addsi s7186, s7185, 1 # 12592
+addsi s7188, s7187, 1 # 12593
+addsi s7190, s7189, 1 # 12594
+addsi s7192, s7191, 1 # 12595
+addsi s7194, s7193, 1 # 12596
+addsi s7196, s7195, 1 # 12597
+addsi s7198, s7197, 1 # 12598
+addsi s7200, s7199, 1 # 12599
+addsi s7202, s7201, 1 # 12600
+addsi s7204, s7203, 1 # 12601
+addsi s7206, s7205, 1 # 12602
+addsi s7208, s7207, 1 # 12603
+addsi s7210, s7209, 1 # 12604
+addsi s7212, s7211, 1 # 12605
+addsi s7214, s7213, 1 # 12606
+addsi s7216, s7215, 1 # 12607
+addsi s7218, s7217, 1 # 12608
+addsi s7220, s7219, 1 # 12609
+addsi s7222, s7221, 1 # 12610
+addsi s7224, s7223, 1 # 12611
+addsi s7226, s7225, 1 # 12612
+addsi s7228, s7227, 1 # 12613
+addsi s7230, s7229, 1 # 12614
+addsi s7232, s7231, 1 # 12615
+addsi s7234, s7233, 1 # 12616
+addsi s7236, s7235, 1 # 12617
+addsi s7238, s7237, 1 # 12618
+addsi s7240, s7239, 1 # 12619
+addsi s7242, s7241, 1 # 12620
+addsi s7244, s7243, 1 # 12621
+addsi s7246, s7245, 1 # 12622
+addsi s7248, s7247, 1 # 12623
+addsi s7250, s7249, 1 # 12624
+addsi s7252, s7251, 1 # 12625
+addsi s7254, s7253, 1 # 12626
+addsi s7256, s7255, 1 # 12627
+addsi s7258, s7257, 1 # 12628
+addsi s7260, s7259, 1 # 12629
+addsi s7262, s7261, 1 # 12630
+addsi s7264, s7263, 1 # 12631
+addsi s7266, s7265, 1 # 12632
+addsi s7268, s7267, 1 # 12633
+addsi s7270, s7269, 1 # 12634
+addsi s7272, s7271, 1 # 12635
+addsi s7274, s7273, 1 # 12636
+addsi s7276, s7275, 1 # 12637
+addsi s7278, s7277, 1 # 12638
+addsi s7280, s7279, 1 # 12639
+addsi s7282, s7281, 1 # 12640
+addsi s7284, s7283, 1 # 12641
+addsi s7286, s7285, 1 # 12642
+addsi s7288, s7287, 1 # 12643
+addsi s7290, s7289, 1 # 12644
+addsi s7292, s7291, 1 # 12645
+addsi s7294, s7293, 1 # 12646
+addsi s7296, s7295, 1 # 12647
+addsi s7298, s7297, 1 # 12648
+addsi s7300, s7299, 1 # 12649
+addsi s7302, s7301, 1 # 12650
+addsi s7304, s7303, 1 # 12651
+addsi s7306, s7305, 1 # 12652
+addsi s7308, s7307, 1 # 12653
+addsi s7310, s7309, 1 # 12654
+addsi s7312, s7311, 1 # 12655
+addsi s7314, s7313, 1 # 12656
+addsi s7316, s7315, 1 # 12657
+addsi s7318, s7317, 1 # 12658
+addsi s7320, s7319, 1 # 12659
+addsi s7322, s7321, 1 # 12660
+addsi s7324, s7323, 1 # 12661
+addsi s7326, s7325, 1 # 12662
+addsi s7328, s7327, 1 # 12663
+addsi s7330, s7329, 1 # 12664
+addsi s7332, s7331, 1 # 12665
+addsi s7334, s7333, 1 # 12666
+addsi s7336, s7335, 1 # 12667
+addsi s7338, s7337, 1 # 12668
+addsi s7340, s7339, 1 # 12669
+addsi s7342, s7341, 1 # 12670
+addsi s7344, s7343, 1 # 12671
+addsi s7346, s7345, 1 # 12672
+addsi s7348, s7347, 1 # 12673
+addsi s7350, s7349, 1 # 12674
+addsi s7352, s7351, 1 # 12675
+addsi s7354, s7353, 1 # 12676
+addsi s7356, s7355, 1 # 12677
+addsi s7358, s7357, 1 # 12678
+addsi s7360, s7359, 1 # 12679
+addsi s7362, s7361, 1 # 12680
+addsi s7364, s7363, 1 # 12681
+addsi s7366, s7365, 1 # 12682
+addsi s7368, s7367, 1 # 12683
+addsi s7370, s7369, 1 # 12684
+addsi s7372, s7371, 1 # 12685
+addsi s7374, s7373, 1 # 12686
+addsi s7376, s7375, 1 # 12687
+addsi s7378, s7377, 1 # 12688
+addsi s7380, s7379, 1 # 12689
+addsi s7382, s7381, 1 # 12690
+addsi s7384, s7383, 1 # 12691
+addsi s7386, s7385, 1 # 12692
+addsi s7388, s7387, 1 # 12693
+addsi s7390, s7389, 1 # 12694
+addsi s7392, s7391, 1 # 12695
+addsi s7394, s7393, 1 # 12696
+addsi s7396, s7395, 1 # 12697
+addsi s7398, s7397, 1 # 12698
+addsi s7400, s7399, 1 # 12699
+addsi s7402, s7401, 1 # 12700
+addsi s7404, s7403, 1 # 12701
+addsi s7406, s7405, 1 # 12702
+addsi s7408, s7407, 1 # 12703
+addsi s7410, s7409, 1 # 12704
+addsi s7412, s7411, 1 # 12705
+addsi s7414, s7413, 1 # 12706
+addsi s7416, s7415, 1 # 12707
+addsi s7418, s7417, 1 # 12708
+addsi s7420, s7419, 1 # 12709
+addsi s7422, s7421, 1 # 12710
+addsi s7424, s7423, 1 # 12711
+addsi s7426, s7425, 1 # 12712
+addsi s7428, s7427, 1 # 12713
+addsi s7430, s7429, 1 # 12714
+addsi s7432, s7431, 1 # 12715
+addsi s7434, s7433, 1 # 12716
+addsi s7436, s7435, 1 # 12717
+addsi s7438, s7437, 1 # 12718
+addsi s7440, s7439, 1 # 12719
+addsi s7442, s7441, 1 # 12720
+addsi s7444, s7443, 1 # 12721
+addsi s7446, s7445, 1 # 12722
+addsi s7448, s7447, 1 # 12723
+addsi s7450, s7449, 1 # 12724
+addsi s7452, s7451, 1 # 12725
+addsi s7454, s7453, 1 # 12726
+addsi s7456, s7455, 1 # 12727
+addsi s7458, s7457, 1 # 12728
+addsi s7460, s7459, 1 # 12729
+addsi s7462, s7461, 1 # 12730
+addsi s7464, s7463, 1 # 12731
+addsi s7466, s7465, 1 # 12732
+addsi s7468, s7467, 1 # 12733
+addsi s7470, s7469, 1 # 12734
+addsi s7472, s7471, 1 # 12735
+addsi s7474, s7473, 1 # 12736
+addsi s7476, s7475, 1 # 12737
+addsi s7478, s7477, 1 # 12738
+addsi s7480, s7479, 1 # 12739
+addsi s7482, s7481, 1 # 12740
+addsi s7484, s7483, 1 # 12741
+addsi s7486, s7485, 1 # 12742
+addsi s7488, s7487, 1 # 12743
+addsi s7490, s7489, 1 # 12744
+addsi s7492, s7491, 1 # 12745
+addsi s7494, s7493, 1 # 12746
+addsi s7496, s7495, 1 # 12747
+addsi s7498, s7497, 1 # 12748
+addsi s7500, s7499, 1 # 12749
+addsi s7502, s7501, 1 # 12750
+addsi s7504, s7503, 1 # 12751
+addsi s7506, s7505, 1 # 12752
+addsi s7508, s7507, 1 # 12753
+addsi s7510, s7509, 1 # 12754
+addsi s7512, s7511, 1 # 12755
+addsi s7514, s7513, 1 # 12756
+addsi s7516, s7515, 1 # 12757
+addsi s7518, s7517, 1 # 12758
+addsi s7520, s7519, 1 # 12759
+addsi s7522, s7521, 1 # 12760
+addsi s7524, s7523, 1 # 12761
+addsi s7526, s7525, 1 # 12762
+addsi s7528, s7527, 1 # 12763
+addsi s7530, s7529, 1 # 12764
+addsi s7532, s7531, 1 # 12765
+addsi s7534, s7533, 1 # 12766
+addsi s7536, s7535, 1 # 12767
+addsi s7538, s7537, 1 # 12768
+addsi s7540, s7539, 1 # 12769
+addsi s7542, s7541, 1 # 12770
+addsi s7544, s7543, 1 # 12771
+addsi s7546, s7545, 1 # 12772
+addsi s7548, s7547, 1 # 12773
+addsi s7550, s7549, 1 # 12774
+addsi s7552, s7551, 1 # 12775
+addsi s7554, s7553, 1 # 12776
+addsi s7556, s7555, 1 # 12777
+addsi s7558, s7557, 1 # 12778
+addsi s7560, s7559, 1 # 12779
+addsi s7562, s7561, 1 # 12780
+addsi s7564, s7563, 1 # 12781
+addsi s7566, s7565, 1 # 12782
+addsi s7568, s7567, 1 # 12783
+addsi s7570, s7569, 1 # 12784
+addsi s7572, s7571, 1 # 12785
+addsi s7574, s7573, 1 # 12786
+addsi s7576, s7575, 1 # 12787
+addsi s7578, s7577, 1 # 12788
+addsi s7580, s7579, 1 # 12789
+addsi s7582, s7581, 1 # 12790
+addsi s7584, s7583, 1 # 12791
+addsi s7586, s7585, 1 # 12792
+addsi s7588, s7587, 1 # 12793
+addsi s7590, s7589, 1 # 12794
+addsi s7592, s7591, 1 # 12795
+addsi s7594, s7593, 1 # 12796
+addsi s7596, s7595, 1 # 12797
+addsi s7598, s7597, 1 # 12798
+addsi s7600, s7599, 1 # 12799
+addsi s7602, s7601, 1 # 12800
+addsi s7604, s7603, 1 # 12801
+addsi s7606, s7605, 1 # 12802
+addsi s7608, s7607, 1 # 12803
+addsi s7610, s7609, 1 # 12804
+addsi s7612, s7611, 1 # 12805
+addsi s7614, s7613, 1 # 12806
+addsi s7616, s7615, 1 # 12807
+addsi s7618, s7617, 1 # 12808
+addsi s7620, s7619, 1 # 12809
+addsi s7622, s7621, 1 # 12810
+addsi s7624, s7623, 1 # 12811
+addsi s7626, s7625, 1 # 12812
+addsi s7628, s7627, 1 # 12813
+addsi s7630, s7629, 1 # 12814
+addsi s7632, s7631, 1 # 12815
+addsi s7634, s7633, 1 # 12816
+addsi s7636, s7635, 1 # 12817
+addsi s7638, s7637, 1 # 12818
+addsi s7640, s7639, 1 # 12819
+addsi s7642, s7641, 1 # 12820
+addsi s7644, s7643, 1 # 12821
+addsi s7646, s7645, 1 # 12822
+addsi s7648, s7647, 1 # 12823
+addsi s7650, s7649, 1 # 12824
+addsi s7652, s7651, 1 # 12825
+addsi s7654, s7653, 1 # 12826
+addsi s7656, s7655, 1 # 12827
+addsi s7658, s7657, 1 # 12828
+addsi s7660, s7659, 1 # 12829
+addsi s7662, s7661, 1 # 12830
+addsi s7664, s7663, 1 # 12831
+addsi s7666, s7665, 1 # 12832
+addsi s7668, s7667, 1 # 12833
+addsi s7670, s7669, 1 # 12834
+addsi s7672, s7671, 1 # 12835
+addsi s7674, s7673, 1 # 12836
+addsi s7676, s7675, 1 # 12837
+addsi s7678, s7677, 1 # 12838
+addsi s7680, s7679, 1 # 12839
+addsi s7682, s7681, 1 # 12840
+addsi s7684, s7683, 1 # 12841
+addsi s7686, s7685, 1 # 12842
+addsi s7688, s7687, 1 # 12843
+addsi s7690, s7689, 1 # 12844
+addsi s7692, s7691, 1 # 12845
+addsi s7694, s7693, 1 # 12846
+addsi s7696, s7695, 1 # 12847
+addsi s7698, s7697, 1 # 12848
+addsi s7700, s7699, 1 # 12849
+addsi s7702, s7701, 1 # 12850
+addsi s7704, s7703, 1 # 12851
+addsi s7706, s7705, 1 # 12852
+addsi s7708, s7707, 1 # 12853
+addsi s7710, s7709, 1 # 12854
+addsi s7712, s7711, 1 # 12855
+addsi s7714, s7713, 1 # 12856
+addsi s7716, s7715, 1 # 12857
+addsi s7718, s7717, 1 # 12858
+addsi s7720, s7719, 1 # 12859
+addsi s7722, s7721, 1 # 12860
+addsi s7724, s7723, 1 # 12861
+addsi s7726, s7725, 1 # 12862
+addsi s7728, s7727, 1 # 12863
+addsi s7730, s7729, 1 # 12864
+addsi s7732, s7731, 1 # 12865
+addsi s7734, s7733, 1 # 12866
+addsi s7736, s7735, 1 # 12867
+addsi s7738, s7737, 1 # 12868
+addsi s7740, s7739, 1 # 12869
+addsi s7742, s7741, 1 # 12870
+addsi s7744, s7743, 1 # 12871
+addsi s7746, s7745, 1 # 12872
+addsi s7748, s7747, 1 # 12873
+addsi s7750, s7749, 1 # 12874
+addsi s7752, s7751, 1 # 12875
+addsi s7754, s7753, 1 # 12876
+addsi s7756, s7755, 1 # 12877
+addsi s7758, s7757, 1 # 12878
+addsi s7760, s7759, 1 # 12879
+addsi s7762, s7761, 1 # 12880
+addsi s7764, s7763, 1 # 12881
+addsi s7766, s7765, 1 # 12882
+addsi s7768, s7767, 1 # 12883
+addsi s7770, s7769, 1 # 12884
+addsi s7772, s7771, 1 # 12885
+addsi s7774, s7773, 1 # 12886
+addsi s7776, s7775, 1 # 12887
+addsi s7778, s7777, 1 # 12888
+addsi s7780, s7779, 1 # 12889
+addsi s7782, s7781, 1 # 12890
+addsi s7784, s7783, 1 # 12891
+addsi s7786, s7785, 1 # 12892
+addsi s7788, s7787, 1 # 12893
+addsi s7790, s7789, 1 # 12894
+addsi s7792, s7791, 1 # 12895
+addsi s7794, s7793, 1 # 12896
+addsi s7796, s7795, 1 # 12897
+addsi s7798, s7797, 1 # 12898
+addsi s7800, s7799, 1 # 12899
+addsi s7802, s7801, 1 # 12900
+addsi s7804, s7803, 1 # 12901
+addsi s7806, s7805, 1 # 12902
+addsi s7808, s7807, 1 # 12903
+addsi s7810, s7809, 1 # 12904
+addsi s7812, s7811, 1 # 12905
+addsi s7814, s7813, 1 # 12906
+addsi s7816, s7815, 1 # 12907
+addsi s7818, s7817, 1 # 12908
+addsi s7820, s7819, 1 # 12909
+addsi s7822, s7821, 1 # 12910
+addsi s7824, s7823, 1 # 12911
+addsi s7826, s7825, 1 # 12912
+addsi s7828, s7827, 1 # 12913
+addsi s7830, s7829, 1 # 12914
+addsi s7832, s7831, 1 # 12915
+addsi s7834, s7833, 1 # 12916
+addsi s7836, s7835, 1 # 12917
+addsi s7838, s7837, 1 # 12918
+addsi s7840, s7839, 1 # 12919
+addsi s7842, s7841, 1 # 12920
+addsi s7844, s7843, 1 # 12921
+addsi s7846, s7845, 1 # 12922
+addsi s7848, s7847, 1 # 12923
+addsi s7850, s7849, 1 # 12924
+addsi s7852, s7851, 1 # 12925
+addsi s7854, s7853, 1 # 12926
+addsi s7856, s7855, 1 # 12927
+addsi s7858, s7857, 1 # 12928
+addsi s7860, s7859, 1 # 12929
+addsi s7862, s7861, 1 # 12930
+addsi s7864, s7863, 1 # 12931
+addsi s7866, s7865, 1 # 12932
+addsi s7868, s7867, 1 # 12933
+addsi s7870, s7869, 1 # 12934
+addsi s7872, s7871, 1 # 12935
+addsi s7874, s7873, 1 # 12936
+addsi s7876, s7875, 1 # 12937
+addsi s7878, s7877, 1 # 12938
+addsi s7880, s7879, 1 # 12939
+addsi s7882, s7881, 1 # 12940
+addsi s7884, s7883, 1 # 12941
+addsi s7886, s7885, 1 # 12942
+addsi s7888, s7887, 1 # 12943
+addsi s7890, s7889, 1 # 12944
+addsi s7892, s7891, 1 # 12945
+addsi s7894, s7893, 1 # 12946
+addsi s7896, s7895, 1 # 12947
+addsi s7898, s7897, 1 # 12948
+addsi s7900, s7899, 1 # 12949
+addsi s7902, s7901, 1 # 12950
+addsi s7904, s7903, 1 # 12951
+addsi s7906, s7905, 1 # 12952
+addsi s7908, s7907, 1 # 12953
+addsi s7910, s7909, 1 # 12954
+addsi s7912, s7911, 1 # 12955
+addsi s7914, s7913, 1 # 12956
+addsi s7916, s7915, 1 # 12957
+addsi s7918, s7917, 1 # 12958
+addsi s7920, s7919, 1 # 12959
+addsi s7922, s7921, 1 # 12960
+addsi s7924, s7923, 1 # 12961
+addsi s7926, s7925, 1 # 12962
+addsi s7928, s7927, 1 # 12963
+addsi s7930, s7929, 1 # 12964
+addsi s7932, s7931, 1 # 12965
+addsi s7934, s7933, 1 # 12966
+addsi s7936, s7935, 1 # 12967
+addsi s7938, s7937, 1 # 12968
+addsi s7940, s7939, 1 # 12969
+addsi s7942, s7941, 1 # 12970
+addsi s7944, s7943, 1 # 12971
+addsi s7946, s7945, 1 # 12972
+addsi s7948, s7947, 1 # 12973
+addsi s7950, s7949, 1 # 12974
+addsi s7952, s7951, 1 # 12975
+addsi s7954, s7953, 1 # 12976
+addsi s7956, s7955, 1 # 12977
+addsi s7958, s7957, 1 # 12978
+addsi s7960, s7959, 1 # 12979
+addsi s7962, s7961, 1 # 12980
+addsi s7964, s7963, 1 # 12981
+addsi s7966, s7965, 1 # 12982
+addsi s7968, s7967, 1 # 12983
+addsi s7970, s7969, 1 # 12984
+addsi s7972, s7971, 1 # 12985
+addsi s7974, s7973, 1 # 12986
+addsi s7976, s7975, 1 # 12987
+addsi s7978, s7977, 1 # 12988
+addsi s7980, s7979, 1 # 12989
+addsi s7982, s7981, 1 # 12990
+addsi s7984, s7983, 1 # 12991
+addsi s7986, s7985, 1 # 12992
+addsi s7988, s7987, 1 # 12993
+addsi s7990, s7989, 1 # 12994
+addsi s7992, s7991, 1 # 12995
+addsi s7994, s7993, 1 # 12996
+addsi s7996, s7995, 1 # 12997
+addsi s7998, s7997, 1 # 12998
+addsi s8000, s7999, 1 # 12999
+addsi s8002, s8001, 1 # 13000
+addsi s8004, s8003, 1 # 13001
+addsi s8006, s8005, 1 # 13002
+addsi s8008, s8007, 1 # 13003
+addsi s8010, s8009, 1 # 13004
+addsi s8012, s8011, 1 # 13005
+addsi s8014, s8013, 1 # 13006
+addsi s8016, s8015, 1 # 13007
+addsi s8018, s8017, 1 # 13008
+addsi s8020, s8019, 1 # 13009
+addsi s8022, s8021, 1 # 13010
+addsi s8024, s8023, 1 # 13011
+addsi s8026, s8025, 1 # 13012
+addsi s8028, s8027, 1 # 13013
+addsi s8030, s8029, 1 # 13014
+addsi s8032, s8031, 1 # 13015
+addsi s8034, s8033, 1 # 13016
+addsi s8036, s8035, 1 # 13017
+addsi s8038, s8037, 1 # 13018
+addsi s8040, s8039, 1 # 13019
+addsi s8042, s8041, 1 # 13020
+addsi s8044, s8043, 1 # 13021
+addsi s8046, s8045, 1 # 13022
+addsi s8048, s8047, 1 # 13023
+addsi s8050, s8049, 1 # 13024
+addsi s8052, s8051, 1 # 13025
+addsi s8054, s8053, 1 # 13026
+addsi s8056, s8055, 1 # 13027
+addsi s8058, s8057, 1 # 13028
+addsi s8060, s8059, 1 # 13029
+addsi s8062, s8061, 1 # 13030
+addsi s8064, s8063, 1 # 13031
+addsi s8066, s8065, 1 # 13032
+addsi s8068, s8067, 1 # 13033
+addsi s8070, s8069, 1 # 13034
+addsi s8072, s8071, 1 # 13035
+addsi s8074, s8073, 1 # 13036
+addsi s8076, s8075, 1 # 13037
+addsi s8078, s8077, 1 # 13038
+addsi s8080, s8079, 1 # 13039
+addsi s8082, s8081, 1 # 13040
+addsi s8084, s8083, 1 # 13041
+addsi s8086, s8085, 1 # 13042
+addsi s8088, s8087, 1 # 13043
+addsi s8090, s8089, 1 # 13044
+addsi s8092, s8091, 1 # 13045
+addsi s8094, s8093, 1 # 13046
+addsi s8096, s8095, 1 # 13047
+addsi s8098, s8097, 1 # 13048
+addsi s8100, s8099, 1 # 13049
+addsi s8102, s8101, 1 # 13050
+addsi s8104, s8103, 1 # 13051
+addsi s8106, s8105, 1 # 13052
+addsi s8108, s8107, 1 # 13053
+addsi s8110, s8109, 1 # 13054
+addsi s8112, s8111, 1 # 13055
+addsi s8114, s8113, 1 # 13056
+addsi s8116, s8115, 1 # 13057
+addsi s8118, s8117, 1 # 13058
+addsi s8120, s8119, 1 # 13059
+addsi s8122, s8121, 1 # 13060
+addsi s8124, s8123, 1 # 13061
+addsi s8126, s8125, 1 # 13062
+addsi s8128, s8127, 1 # 13063
+addsi s8130, s8129, 1 # 13064
+addsi s8132, s8131, 1 # 13065
+addsi s8134, s8133, 1 # 13066
+addsi s8136, s8135, 1 # 13067
+addsi s8138, s8137, 1 # 13068
+addsi s8140, s8139, 1 # 13069
+addsi s8142, s8141, 1 # 13070
+addsi s8144, s8143, 1 # 13071
+addsi s8146, s8145, 1 # 13072
+addsi s8148, s8147, 1 # 13073
+addsi s8150, s8149, 1 # 13074
+addsi s8152, s8151, 1 # 13075
+addsi s8154, s8153, 1 # 13076
+addsi s8156, s8155, 1 # 13077
+addsi s8158, s8157, 1 # 13078
+addsi s8160, s8159, 1 # 13079
+addsi s8162, s8161, 1 # 13080
+addsi s8164, s8163, 1 # 13081
+addsi s8166, s8165, 1 # 13082
+addsi s8168, s8167, 1 # 13083
+addsi s8170, s8169, 1 # 13084
+addsi s8172, s8171, 1 # 13085
+addsi s8174, s8173, 1 # 13086
+addsi s8176, s8175, 1 # 13087
+addsi s8178, s8177, 1 # 13088
+addsi s8180, s8179, 1 # 13089
+addsi s8182, s8181, 1 # 13090
+addsi s8184, s8183, 1 # 13091
+addsi s8186, s8185, 1 # 13092
+addsi s8188, s8187, 1 # 13093
+addsi s8190, s8189, 1 # 13094
+addsi s8192, s8191, 1 # 13095
+addsi s8194, s8193, 1 # 13096
+addsi s8196, s8195, 1 # 13097
+addsi s8198, s8197, 1 # 13098
+addsi s8200, s8199, 1 # 13099
+addsi s8202, s8201, 1 # 13100
+addsi s8204, s8203, 1 # 13101
+addsi s8206, s8205, 1 # 13102
+addsi s8208, s8207, 1 # 13103
+addsi s8210, s8209, 1 # 13104
+addsi s8212, s8211, 1 # 13105
+addsi s8214, s8213, 1 # 13106
+addsi s8216, s8215, 1 # 13107
+addsi s8218, s8217, 1 # 13108
+addsi s8220, s8219, 1 # 13109
+addsi s8222, s8221, 1 # 13110
+addsi s8224, s8223, 1 # 13111
+addsi s8226, s8225, 1 # 13112
+addsi s8228, s8227, 1 # 13113
+addsi s8230, s8229, 1 # 13114
+addsi s8232, s8231, 1 # 13115
+addsi s8234, s8233, 1 # 13116
+addsi s8236, s8235, 1 # 13117
+addsi s8238, s8237, 1 # 13118
+addsi s8240, s8239, 1 # 13119
+addsi s8242, s8241, 1 # 13120
+addsi s8244, s8243, 1 # 13121
+addsi s8246, s8245, 1 # 13122
+addsi s8248, s8247, 1 # 13123
+addsi s8250, s8249, 1 # 13124
+addsi s8252, s8251, 1 # 13125
+addsi s8254, s8253, 1 # 13126
+addsi s8256, s8255, 1 # 13127
+addsi s8258, s8257, 1 # 13128
+addsi s8260, s8259, 1 # 13129
+addsi s8262, s8261, 1 # 13130
+addsi s8264, s8263, 1 # 13131
+addsi s8266, s8265, 1 # 13132
+addsi s8268, s8267, 1 # 13133
+addsi s8270, s8269, 1 # 13134
+addsi s8272, s8271, 1 # 13135
+addsi s8274, s8273, 1 # 13136
+addsi s8276, s8275, 1 # 13137
+addsi s8278, s8277, 1 # 13138
+addsi s8280, s8279, 1 # 13139
+addsi s8282, s8281, 1 # 13140
+addsi s8284, s8283, 1 # 13141
+addsi s8286, s8285, 1 # 13142
+addsi s8288, s8287, 1 # 13143
+addsi s8290, s8289, 1 # 13144
+addsi s8292, s8291, 1 # 13145
+addsi s8294, s8293, 1 # 13146
+addsi s8296, s8295, 1 # 13147
+addsi s8298, s8297, 1 # 13148
+addsi s8300, s8299, 1 # 13149
+addsi s8302, s8301, 1 # 13150
+addsi s8304, s8303, 1 # 13151
+addsi s8306, s8305, 1 # 13152
+addsi s8308, s8307, 1 # 13153
+addsi s8310, s8309, 1 # 13154
+addsi s8312, s8311, 1 # 13155
+addsi s8314, s8313, 1 # 13156
+addsi s8316, s8315, 1 # 13157
+addsi s8318, s8317, 1 # 13158
+addsi s8320, s8319, 1 # 13159
+addsi s8322, s8321, 1 # 13160
+addsi s8324, s8323, 1 # 13161
+addsi s8326, s8325, 1 # 13162
+addsi s8328, s8327, 1 # 13163
+addsi s8330, s8329, 1 # 13164
+addsi s8332, s8331, 1 # 13165
+addsi s8334, s8333, 1 # 13166
+addsi s8336, s8335, 1 # 13167
+addsi s8338, s8337, 1 # 13168
+addsi s8340, s8339, 1 # 13169
+addsi s8342, s8341, 1 # 13170
+addsi s8344, s8343, 1 # 13171
+addsi s8346, s8345, 1 # 13172
+addsi s8348, s8347, 1 # 13173
+addsi s8350, s8349, 1 # 13174
+addsi s8352, s8351, 1 # 13175
+addsi s8354, s8353, 1 # 13176
+addsi s8356, s8355, 1 # 13177
+addsi s8358, s8357, 1 # 13178
+addsi s8360, s8359, 1 # 13179
+addsi s8362, s8361, 1 # 13180
+addsi s8364, s8363, 1 # 13181
+addsi s8366, s8365, 1 # 13182
+addsi s8368, s8367, 1 # 13183
+addsi s8370, s8369, 1 # 13184
+addsi s8372, s8371, 1 # 13185
+addsi s8374, s8373, 1 # 13186
+addsi s8376, s8375, 1 # 13187
+addsi s8378, s8377, 1 # 13188
+addsi s8380, s8379, 1 # 13189
+addsi s8382, s8381, 1 # 13190
+addsi s8384, s8383, 1 # 13191
+addsi s8386, s8385, 1 # 13192
+addsi s8388, s8387, 1 # 13193
+addsi s8390, s8389, 1 # 13194
+addsi s8392, s8391, 1 # 13195
+addsi s8394, s8393, 1 # 13196
+addsi s8396, s8395, 1 # 13197
+addsi s8398, s8397, 1 # 13198
+addsi s8400, s8399, 1 # 13199
+addsi s8402, s8401, 1 # 13200
+addsi s8404, s8403, 1 # 13201
+addsi s8406, s8405, 1 # 13202
+addsi s8408, s8407, 1 # 13203
+addsi s8410, s8409, 1 # 13204
+addsi s8412, s8411, 1 # 13205
+addsi s8414, s8413, 1 # 13206
+addsi s8416, s8415, 1 # 13207
+addsi s8418, s8417, 1 # 13208
+addsi s8420, s8419, 1 # 13209
+addsi s8422, s8421, 1 # 13210
+addsi s8424, s8423, 1 # 13211
+addsi s8426, s8425, 1 # 13212
+addsi s8428, s8427, 1 # 13213
+addsi s8430, s8429, 1 # 13214
+addsi s8432, s8431, 1 # 13215
+addsi s8434, s8433, 1 # 13216
+addsi s8436, s8435, 1 # 13217
+addsi s8438, s8437, 1 # 13218
+addsi s8440, s8439, 1 # 13219
+addsi s8442, s8441, 1 # 13220
+addsi s8444, s8443, 1 # 13221
+addsi s8446, s8445, 1 # 13222
+addsi s8448, s8447, 1 # 13223
+addsi s8450, s8449, 1 # 13224
+addsi s8452, s8451, 1 # 13225
+addsi s8454, s8453, 1 # 13226
+addsi s8456, s8455, 1 # 13227
+addsi s8458, s8457, 1 # 13228
+addsi s8460, s8459, 1 # 13229
+addsi s8462, s8461, 1 # 13230
+addsi s8464, s8463, 1 # 13231
+addsi s8466, s8465, 1 # 13232
+addsi s8468, s8467, 1 # 13233
+addsi s8470, s8469, 1 # 13234
+addsi s8472, s8471, 1 # 13235
+addsi s8474, s8473, 1 # 13236
+addsi s8476, s8475, 1 # 13237
+addsi s8478, s8477, 1 # 13238
+addsi s8480, s8479, 1 # 13239
+addsi s8482, s8481, 1 # 13240
+addsi s8484, s8483, 1 # 13241
+addsi s8486, s8485, 1 # 13242
+addsi s8488, s8487, 1 # 13243
+addsi s8490, s8489, 1 # 13244
+addsi s8492, s8491, 1 # 13245
+addsi s8494, s8493, 1 # 13246
+addsi s8496, s8495, 1 # 13247
+addsi s8498, s8497, 1 # 13248
+addsi s8500, s8499, 1 # 13249
+addsi s8502, s8501, 1 # 13250
+addsi s8504, s8503, 1 # 13251
+addsi s8506, s8505, 1 # 13252
+addsi s8508, s8507, 1 # 13253
+addsi s8510, s8509, 1 # 13254
+addsi s8512, s8511, 1 # 13255
+addsi s8514, s8513, 1 # 13256
+addsi s8516, s8515, 1 # 13257
+addsi s8518, s8517, 1 # 13258
+addsi s8520, s8519, 1 # 13259
+addsi s8522, s8521, 1 # 13260
+addsi s8524, s8523, 1 # 13261
+addsi s8526, s8525, 1 # 13262
+addsi s8528, s8527, 1 # 13263
+addsi s8530, s8529, 1 # 13264
+addsi s8532, s8531, 1 # 13265
+addsi s8534, s8533, 1 # 13266
+addsi s8536, s8535, 1 # 13267
+addsi s8538, s8537, 1 # 13268
+addsi s8540, s8539, 1 # 13269
+addsi s8542, s8541, 1 # 13270
+addsi s8544, s8543, 1 # 13271
+addsi s8546, s8545, 1 # 13272
+addsi s8548, s8547, 1 # 13273
+addsi s8550, s8549, 1 # 13274
+addsi s8552, s8551, 1 # 13275
+addsi s8554, s8553, 1 # 13276
+addsi s8556, s8555, 1 # 13277
+addsi s8558, s8557, 1 # 13278
+addsi s8560, s8559, 1 # 13279
+addsi s8562, s8561, 1 # 13280
+addsi s8564, s8563, 1 # 13281
+addsi s8566, s8565, 1 # 13282
+addsi s8568, s8567, 1 # 13283
+addsi s8570, s8569, 1 # 13284
+addsi s8572, s8571, 1 # 13285
+addsi s8574, s8573, 1 # 13286
+addsi s8576, s8575, 1 # 13287
+addsi s8578, s8577, 1 # 13288
+addsi s8580, s8579, 1 # 13289
+addsi s8582, s8581, 1 # 13290
+addsi s8584, s8583, 1 # 13291
+addsi s8586, s8585, 1 # 13292
+addsi s8588, s8587, 1 # 13293
+addsi s8590, s8589, 1 # 13294
+addsi s8592, s8591, 1 # 13295
+addsi s8594, s8593, 1 # 13296
+addsi s8596, s8595, 1 # 13297
+addsi s8598, s8597, 1 # 13298
+addsi s8600, s8599, 1 # 13299
+addsi s8602, s8601, 1 # 13300
+addsi s8604, s8603, 1 # 13301
+addsi s8606, s8605, 1 # 13302
+addsi s8608, s8607, 1 # 13303
+addsi s8610, s8609, 1 # 13304
+addsi s8612, s8611, 1 # 13305
+addsi s8614, s8613, 1 # 13306
+addsi s8616, s8615, 1 # 13307
+addsi s8618, s8617, 1 # 13308
+addsi s8620, s8619, 1 # 13309
+addsi s8622, s8621, 1 # 13310
+addsi s8624, s8623, 1 # 13311
+addsi s8626, s8625, 1 # 13312
+addsi s8628, s8627, 1 # 13313
+addsi s8630, s8629, 1 # 13314
+addsi s8632, s8631, 1 # 13315
+addsi s8634, s8633, 1 # 13316
+addsi s8636, s8635, 1 # 13317
+addsi s8638, s8637, 1 # 13318
+addsi s8640, s8639, 1 # 13319
+addsi s8642, s8641, 1 # 13320
+addsi s8644, s8643, 1 # 13321
+addsi s8646, s8645, 1 # 13322
+addsi s8648, s8647, 1 # 13323
+addsi s8650, s8649, 1 # 13324
+addsi s8652, s8651, 1 # 13325
+addsi s8654, s8653, 1 # 13326
+addsi s8656, s8655, 1 # 13327
+addsi s8658, s8657, 1 # 13328
+addsi s8660, s8659, 1 # 13329
+addsi s8662, s8661, 1 # 13330
+addsi s8664, s8663, 1 # 13331
+addsi s8666, s8665, 1 # 13332
+addsi s8668, s8667, 1 # 13333
+addsi s8670, s8669, 1 # 13334
+addsi s8672, s8671, 1 # 13335
+addsi s8674, s8673, 1 # 13336
+addsi s8676, s8675, 1 # 13337
+addsi s8678, s8677, 1 # 13338
+addsi s8680, s8679, 1 # 13339
+addsi s8682, s8681, 1 # 13340
+addsi s8684, s8683, 1 # 13341
+addsi s8686, s8685, 1 # 13342
+addsi s8688, s8687, 1 # 13343
+addsi s8690, s8689, 1 # 13344
+addsi s8692, s8691, 1 # 13345
+addsi s8694, s8693, 1 # 13346
+addsi s8696, s8695, 1 # 13347
+addsi s8698, s8697, 1 # 13348
+addsi s8700, s8699, 1 # 13349
+addsi s8702, s8701, 1 # 13350
+addsi s8704, s8703, 1 # 13351
+addsi s8706, s8705, 1 # 13352
+addsi s8708, s8707, 1 # 13353
+addsi s8710, s8709, 1 # 13354
+addsi s8712, s8711, 1 # 13355
+addsi s8714, s8713, 1 # 13356
+addsi s8716, s8715, 1 # 13357
+addsi s8718, s8717, 1 # 13358
+addsi s8720, s8719, 1 # 13359
+addsi s8722, s8721, 1 # 13360
+addsi s8724, s8723, 1 # 13361
+addsi s8726, s8725, 1 # 13362
+addsi s8728, s8727, 1 # 13363
+addsi s8730, s8729, 1 # 13364
+addsi s8732, s8731, 1 # 13365
+addsi s8734, s8733, 1 # 13366
+addsi s8736, s8735, 1 # 13367
+addsi s8738, s8737, 1 # 13368
+addsi s8740, s8739, 1 # 13369
+addsi s8742, s8741, 1 # 13370
+addsi s8744, s8743, 1 # 13371
+addsi s8746, s8745, 1 # 13372
+addsi s8748, s8747, 1 # 13373
+addsi s8750, s8749, 1 # 13374
+addsi s8752, s8751, 1 # 13375
+addsi s8754, s8753, 1 # 13376
+addsi s8756, s8755, 1 # 13377
+addsi s8758, s8757, 1 # 13378
+addsi s8760, s8759, 1 # 13379
+addsi s8762, s8761, 1 # 13380
+addsi s8764, s8763, 1 # 13381
+addsi s8766, s8765, 1 # 13382
+addsi s8768, s8767, 1 # 13383
+addsi s8770, s8769, 1 # 13384
+addsi s8772, s8771, 1 # 13385
+addsi s8774, s8773, 1 # 13386
+addsi s8776, s8775, 1 # 13387
+addsi s8778, s8777, 1 # 13388
+addsi s8780, s8779, 1 # 13389
+addsi s8782, s8781, 1 # 13390
+addsi s8784, s8783, 1 # 13391
+addsi s8786, s8785, 1 # 13392
+addsi s8788, s8787, 1 # 13393
+addsi s8790, s8789, 1 # 13394
+addsi s8792, s8791, 1 # 13395
+addsi s8794, s8793, 1 # 13396
+addsi s8796, s8795, 1 # 13397
+addsi s8798, s8797, 1 # 13398
+addsi s8800, s8799, 1 # 13399
+addsi s8802, s8801, 1 # 13400
+addsi s8804, s8803, 1 # 13401
+addsi s8806, s8805, 1 # 13402
+addsi s8808, s8807, 1 # 13403
+addsi s8810, s8809, 1 # 13404
+addsi s8812, s8811, 1 # 13405
+addsi s8814, s8813, 1 # 13406
+addsi s8816, s8815, 1 # 13407
+addsi s8818, s8817, 1 # 13408
+addsi s8820, s8819, 1 # 13409
+addsi s8822, s8821, 1 # 13410
+addsi s8824, s8823, 1 # 13411
+addsi s8826, s8825, 1 # 13412
+addsi s8828, s8827, 1 # 13413
+addsi s8830, s8829, 1 # 13414
+addsi s8832, s8831, 1 # 13415
+addsi s8834, s8833, 1 # 13416
+addsi s8836, s8835, 1 # 13417
+addsi s8838, s8837, 1 # 13418
+addsi s8840, s8839, 1 # 13419
+addsi s8842, s8841, 1 # 13420
+addsi s8844, s8843, 1 # 13421
+addsi s8846, s8845, 1 # 13422
+addsi s8848, s8847, 1 # 13423
+addsi s8850, s8849, 1 # 13424
+addsi s8852, s8851, 1 # 13425
+addsi s8854, s8853, 1 # 13426
+addsi s8856, s8855, 1 # 13427
+addsi s8858, s8857, 1 # 13428
+addsi s8860, s8859, 1 # 13429
+addsi s8862, s8861, 1 # 13430
+addsi s8864, s8863, 1 # 13431
+addsi s8866, s8865, 1 # 13432
+addsi s8868, s8867, 1 # 13433
+addsi s8870, s8869, 1 # 13434
+addsi s8872, s8871, 1 # 13435
+addsi s8874, s8873, 1 # 13436
+addsi s8876, s8875, 1 # 13437
+addsi s8878, s8877, 1 # 13438
+addsi s8880, s8879, 1 # 13439
+addsi s8882, s8881, 1 # 13440
+addsi s8884, s8883, 1 # 13441
+addsi s8886, s8885, 1 # 13442
+addsi s8888, s8887, 1 # 13443
+addsi s8890, s8889, 1 # 13444
+addsi s8892, s8891, 1 # 13445
+addsi s8894, s8893, 1 # 13446
+addsi s8896, s8895, 1 # 13447
+addsi s8898, s8897, 1 # 13448
+addsi s8900, s8899, 1 # 13449
+addsi s8902, s8901, 1 # 13450
+addsi s8904, s8903, 1 # 13451
+addsi s8906, s8905, 1 # 13452
+addsi s8908, s8907, 1 # 13453
+addsi s8910, s8909, 1 # 13454
+addsi s8912, s8911, 1 # 13455
+addsi s8914, s8913, 1 # 13456
+addsi s8916, s8915, 1 # 13457
+addsi s8918, s8917, 1 # 13458
+addsi s8920, s8919, 1 # 13459
+addsi s8922, s8921, 1 # 13460
+addsi s8924, s8923, 1 # 13461
+addsi s8926, s8925, 1 # 13462
+addsi s8928, s8927, 1 # 13463
+addsi s8930, s8929, 1 # 13464
+addsi s8932, s8931, 1 # 13465
+addsi s8934, s8933, 1 # 13466
+addsi s8936, s8935, 1 # 13467
+addsi s8938, s8937, 1 # 13468
+addsi s8940, s8939, 1 # 13469
+addsi s8942, s8941, 1 # 13470
+addsi s8944, s8943, 1 # 13471
+addsi s8946, s8945, 1 # 13472
+addsi s8948, s8947, 1 # 13473
+addsi s8950, s8949, 1 # 13474
+addsi s8952, s8951, 1 # 13475
+addsi s8954, s8953, 1 # 13476
+addsi s8956, s8955, 1 # 13477
+addsi s8958, s8957, 1 # 13478
+addsi s8960, s8959, 1 # 13479
+addsi s8962, s8961, 1 # 13480
+addsi s8964, s8963, 1 # 13481
+addsi s8966, s8965, 1 # 13482
+addsi s8968, s8967, 1 # 13483
+addsi s8970, s8969, 1 # 13484
+addsi s8972, s8971, 1 # 13485
+addsi s8974, s8973, 1 # 13486
+addsi s8976, s8975, 1 # 13487
+addsi s8978, s8977, 1 # 13488
+addsi s8980, s8979, 1 # 13489
+addsi s8982, s8981, 1 # 13490
+addsi s8984, s8983, 1 # 13491
+addsi s8986, s8985, 1 # 13492
+addsi s8988, s8987, 1 # 13493
+addsi s8990, s8989, 1 # 13494
+addsi s8992, s8991, 1 # 13495
+addsi s8994, s8993, 1 # 13496
+addsi s8996, s8995, 1 # 13497
+addsi s8998, s8997, 1 # 13498
+addsi s9000, s8999, 1 # 13499
+addsi s9002, s9001, 1 # 13500
+addsi s9004, s9003, 1 # 13501
+addsi s9006, s9005, 1 # 13502
+addsi s9008, s9007, 1 # 13503
+addsi s9010, s9009, 1 # 13504
+addsi s9012, s9011, 1 # 13505
+addsi s9014, s9013, 1 # 13506
+addsi s9016, s9015, 1 # 13507
+addsi s9018, s9017, 1 # 13508
+addsi s9020, s9019, 1 # 13509
+addsi s9022, s9021, 1 # 13510
+addsi s9024, s9023, 1 # 13511
+addsi s9026, s9025, 1 # 13512
+addsi s9028, s9027, 1 # 13513
+addsi s9030, s9029, 1 # 13514
+addsi s9032, s9031, 1 # 13515
+addsi s9034, s9033, 1 # 13516
+addsi s9036, s9035, 1 # 13517
+addsi s9038, s9037, 1 # 13518
+addsi s9040, s9039, 1 # 13519
+addsi s9042, s9041, 1 # 13520
+addsi s9044, s9043, 1 # 13521
+addsi s9046, s9045, 1 # 13522
+addsi s9048, s9047, 1 # 13523
+addsi s9050, s9049, 1 # 13524
+addsi s9052, s9051, 1 # 13525
+addsi s9054, s9053, 1 # 13526
+addsi s9056, s9055, 1 # 13527
+addsi s9058, s9057, 1 # 13528
+addsi s9060, s9059, 1 # 13529
+addsi s9062, s9061, 1 # 13530
+addsi s9064, s9063, 1 # 13531
+addsi s9066, s9065, 1 # 13532
+addsi s9068, s9067, 1 # 13533
+addsi s9070, s9069, 1 # 13534
+addsi s9072, s9071, 1 # 13535
+addsi s9074, s9073, 1 # 13536
+addsi s9076, s9075, 1 # 13537
+addsi s9078, s9077, 1 # 13538
+addsi s9080, s9079, 1 # 13539
+addsi s9082, s9081, 1 # 13540
+addsi s9084, s9083, 1 # 13541
+addsi s9086, s9085, 1 # 13542
+addsi s9088, s9087, 1 # 13543
+addsi s9090, s9089, 1 # 13544
+addsi s9092, s9091, 1 # 13545
+addsi s9094, s9093, 1 # 13546
+addsi s9096, s9095, 1 # 13547
+addsi s9098, s9097, 1 # 13548
+addsi s9100, s9099, 1 # 13549
+addsi s9102, s9101, 1 # 13550
+addsi s9104, s9103, 1 # 13551
+addsi s9106, s9105, 1 # 13552
+addsi s9108, s9107, 1 # 13553
+addsi s9110, s9109, 1 # 13554
+addsi s9112, s9111, 1 # 13555
+addsi s9114, s9113, 1 # 13556
+addsi s9116, s9115, 1 # 13557
+addsi s9118, s9117, 1 # 13558
+addsi s9120, s9119, 1 # 13559
+addsi s9122, s9121, 1 # 13560
+addsi s9124, s9123, 1 # 13561
+addsi s9126, s9125, 1 # 13562
+addsi s9128, s9127, 1 # 13563
+addsi s9130, s9129, 1 # 13564
+addsi s9132, s9131, 1 # 13565
+addsi s9134, s9133, 1 # 13566
+addsi s9136, s9135, 1 # 13567
+addsi s9138, s9137, 1 # 13568
+addsi s9140, s9139, 1 # 13569
+addsi s9142, s9141, 1 # 13570
+addsi s9144, s9143, 1 # 13571
+addsi s9146, s9145, 1 # 13572
+addsi s9148, s9147, 1 # 13573
+addsi s9150, s9149, 1 # 13574
+addsi s9152, s9151, 1 # 13575
+addsi s9154, s9153, 1 # 13576
+addsi s9156, s9155, 1 # 13577
+addsi s9158, s9157, 1 # 13578
+addsi s9160, s9159, 1 # 13579
+addsi s9162, s9161, 1 # 13580
+addsi s9164, s9163, 1 # 13581
+addsi s9166, s9165, 1 # 13582
+addsi s9168, s9167, 1 # 13583
+addsi s9170, s9169, 1 # 13584
+addsi s9172, s9171, 1 # 13585
+addsi s9174, s9173, 1 # 13586
+addsi s9176, s9175, 1 # 13587
+addsi s9178, s9177, 1 # 13588
+addsi s9180, s9179, 1 # 13589
+addsi s9182, s9181, 1 # 13590
+addsi s9184, s9183, 1 # 13591
+addsi s9186, s9185, 1 # 13592
+addsi s9188, s9187, 1 # 13593
+addsi s9190, s9189, 1 # 13594
+addsi s9192, s9191, 1 # 13595
+addsi s9194, s9193, 1 # 13596
+addsi s9196, s9195, 1 # 13597
+addsi s9198, s9197, 1 # 13598
+addsi s9200, s9199, 1 # 13599
+addsi s9202, s9201, 1 # 13600
+addsi s9204, s9203, 1 # 13601
+addsi s9206, s9205, 1 # 13602
+addsi s9208, s9207, 1 # 13603
+addsi s9210, s9209, 1 # 13604
+addsi s9212, s9211, 1 # 13605
+addsi s9214, s9213, 1 # 13606
+addsi s9216, s9215, 1 # 13607
+addsi s9218, s9217, 1 # 13608
+addsi s9220, s9219, 1 # 13609
+addsi s9222, s9221, 1 # 13610
+addsi s9224, s9223, 1 # 13611
+addsi s9226, s9225, 1 # 13612
+addsi s9228, s9227, 1 # 13613
+addsi s9230, s9229, 1 # 13614
+addsi s9232, s9231, 1 # 13615
+addsi s9234, s9233, 1 # 13616
+addsi s9236, s9235, 1 # 13617
+addsi s9238, s9237, 1 # 13618
+addsi s9240, s9239, 1 # 13619
+addsi s9242, s9241, 1 # 13620
+addsi s9244, s9243, 1 # 13621
+addsi s9246, s9245, 1 # 13622
+addsi s9248, s9247, 1 # 13623
+addsi s9250, s9249, 1 # 13624
+addsi s9252, s9251, 1 # 13625
+addsi s9254, s9253, 1 # 13626
+addsi s9256, s9255, 1 # 13627
+addsi s9258, s9257, 1 # 13628
+addsi s9260, s9259, 1 # 13629
+addsi s9262, s9261, 1 # 13630
+addsi s9264, s9263, 1 # 13631
+addsi s9266, s9265, 1 # 13632
+addsi s9268, s9267, 1 # 13633
+addsi s9270, s9269, 1 # 13634
+addsi s9272, s9271, 1 # 13635
+addsi s9274, s9273, 1 # 13636
+addsi s9276, s9275, 1 # 13637
+addsi s9278, s9277, 1 # 13638
+addsi s9280, s9279, 1 # 13639
+addsi s9282, s9281, 1 # 13640
+addsi s9284, s9283, 1 # 13641
+addsi s9286, s9285, 1 # 13642
+addsi s9288, s9287, 1 # 13643
+addsi s9290, s9289, 1 # 13644
+addsi s9292, s9291, 1 # 13645
+addsi s9294, s9293, 1 # 13646
+addsi s9296, s9295, 1 # 13647
+addsi s9298, s9297, 1 # 13648
+addsi s9300, s9299, 1 # 13649
+addsi s9302, s9301, 1 # 13650
+addsi s9304, s9303, 1 # 13651
+addsi s9306, s9305, 1 # 13652
+addsi s9308, s9307, 1 # 13653
+addsi s9310, s9309, 1 # 13654
+addsi s9312, s9311, 1 # 13655
+addsi s9314, s9313, 1 # 13656
+addsi s9316, s9315, 1 # 13657
+addsi s9318, s9317, 1 # 13658
+addsi s9320, s9319, 1 # 13659
+addsi s9322, s9321, 1 # 13660
+addsi s9324, s9323, 1 # 13661
+addsi s9326, s9325, 1 # 13662
+addsi s9328, s9327, 1 # 13663
+addsi s9330, s9329, 1 # 13664
+addsi s9332, s9331, 1 # 13665
+addsi s9334, s9333, 1 # 13666
+addsi s9336, s9335, 1 # 13667
+addsi s9338, s9337, 1 # 13668
+addsi s9340, s9339, 1 # 13669
+addsi s9342, s9341, 1 # 13670
+addsi s9344, s9343, 1 # 13671
+addsi s9346, s9345, 1 # 13672
+addsi s9348, s9347, 1 # 13673
+addsi s9350, s9349, 1 # 13674
+addsi s9352, s9351, 1 # 13675
+addsi s9354, s9353, 1 # 13676
+addsi s9356, s9355, 1 # 13677
+addsi s9358, s9357, 1 # 13678
+addsi s9360, s9359, 1 # 13679
+addsi s9362, s9361, 1 # 13680
+addsi s9364, s9363, 1 # 13681
+addsi s9366, s9365, 1 # 13682
+addsi s9368, s9367, 1 # 13683
+addsi s9370, s9369, 1 # 13684
+addsi s9372, s9371, 1 # 13685
+addsi s9374, s9373, 1 # 13686
+addsi s9376, s9375, 1 # 13687
+addsi s9378, s9377, 1 # 13688
+addsi s9380, s9379, 1 # 13689
+addsi s9382, s9381, 1 # 13690
+addsi s9384, s9383, 1 # 13691
+addsi s9386, s9385, 1 # 13692
+addsi s9388, s9387, 1 # 13693
+addsi s9390, s9389, 1 # 13694
+addsi s9392, s9391, 1 # 13695
+addsi s9394, s9393, 1 # 13696
+addsi s9396, s9395, 1 # 13697
+addsi s9398, s9397, 1 # 13698
+addsi s9400, s9399, 1 # 13699
+addsi s9402, s9401, 1 # 13700
+addsi s9404, s9403, 1 # 13701
+addsi s9406, s9405, 1 # 13702
+addsi s9408, s9407, 1 # 13703
+addsi s9410, s9409, 1 # 13704
+addsi s9412, s9411, 1 # 13705
+addsi s9414, s9413, 1 # 13706
+addsi s9416, s9415, 1 # 13707
+addsi s9418, s9417, 1 # 13708
+addsi s9420, s9419, 1 # 13709
+addsi s9422, s9421, 1 # 13710
+addsi s9424, s9423, 1 # 13711
+addsi s9426, s9425, 1 # 13712
+addsi s9428, s9427, 1 # 13713
+addsi s9430, s9429, 1 # 13714
+addsi s9432, s9431, 1 # 13715
+addsi s9434, s9433, 1 # 13716
+addsi s9436, s9435, 1 # 13717
+addsi s9438, s9437, 1 # 13718
+addsi s9440, s9439, 1 # 13719
+addsi s9442, s9441, 1 # 13720
+addsi s9444, s9443, 1 # 13721
+addsi s9446, s9445, 1 # 13722
+addsi s9448, s9447, 1 # 13723
+addsi s9450, s9449, 1 # 13724
+addsi s9452, s9451, 1 # 13725
+addsi s9454, s9453, 1 # 13726
+addsi s9456, s9455, 1 # 13727
+addsi s9458, s9457, 1 # 13728
+addsi s9460, s9459, 1 # 13729
+addsi s9462, s9461, 1 # 13730
+addsi s9464, s9463, 1 # 13731
+addsi s9466, s9465, 1 # 13732
+addsi s9468, s9467, 1 # 13733
+addsi s9470, s9469, 1 # 13734
+addsi s9472, s9471, 1 # 13735
+addsi s9474, s9473, 1 # 13736
+addsi s9476, s9475, 1 # 13737
+addsi s9478, s9477, 1 # 13738
+addsi s9480, s9479, 1 # 13739
+addsi s9482, s9481, 1 # 13740
+addsi s9484, s9483, 1 # 13741
+addsi s9486, s9485, 1 # 13742
+addsi s9488, s9487, 1 # 13743
+addsi s9490, s9489, 1 # 13744
+addsi s9492, s9491, 1 # 13745
+addsi s9494, s9493, 1 # 13746
+addsi s9496, s9495, 1 # 13747
+addsi s9498, s9497, 1 # 13748
+addsi s9500, s9499, 1 # 13749
+addsi s9502, s9501, 1 # 13750
+addsi s9504, s9503, 1 # 13751
+addsi s9506, s9505, 1 # 13752
+addsi s9508, s9507, 1 # 13753
+addsi s9510, s9509, 1 # 13754
+addsi s9512, s9511, 1 # 13755
+addsi s9514, s9513, 1 # 13756
+addsi s9516, s9515, 1 # 13757
+addsi s9518, s9517, 1 # 13758
+addsi s9520, s9519, 1 # 13759
+addsi s9522, s9521, 1 # 13760
+addsi s9524, s9523, 1 # 13761
+addsi s9526, s9525, 1 # 13762
+addsi s9528, s9527, 1 # 13763
+addsi s9530, s9529, 1 # 13764
+addsi s9532, s9531, 1 # 13765
+addsi s9534, s9533, 1 # 13766
+addsi s9536, s9535, 1 # 13767
+addsi s9538, s9537, 1 # 13768
+addsi s9540, s9539, 1 # 13769
+addsi s9542, s9541, 1 # 13770
+addsi s9544, s9543, 1 # 13771
+addsi s9546, s9545, 1 # 13772
+addsi s9548, s9547, 1 # 13773
+addsi s9550, s9549, 1 # 13774
+addsi s9552, s9551, 1 # 13775
+addsi s9554, s9553, 1 # 13776
+addsi s9556, s9555, 1 # 13777
+addsi s9558, s9557, 1 # 13778
+addsi s9560, s9559, 1 # 13779
+addsi s9562, s9561, 1 # 13780
+addsi s9564, s9563, 1 # 13781
+addsi s9566, s9565, 1 # 13782
+addsi s9568, s9567, 1 # 13783
+addsi s9570, s9569, 1 # 13784
+addsi s9572, s9571, 1 # 13785
+addsi s9574, s9573, 1 # 13786
+addsi s9576, s9575, 1 # 13787
+addsi s9578, s9577, 1 # 13788
+addsi s9580, s9579, 1 # 13789
+addsi s9582, s9581, 1 # 13790
+addsi s9584, s9583, 1 # 13791
+addsi s9586, s9585, 1 # 13792
+addsi s9588, s9587, 1 # 13793
+addsi s9590, s9589, 1 # 13794
+addsi s9592, s9591, 1 # 13795
+addsi s9594, s9593, 1 # 13796
+addsi s9596, s9595, 1 # 13797
+addsi s9598, s9597, 1 # 13798
+addsi s9600, s9599, 1 # 13799
+addsi s9602, s9601, 1 # 13800
+addsi s9604, s9603, 1 # 13801
+addsi s9606, s9605, 1 # 13802
+addsi s9608, s9607, 1 # 13803
+addsi s9610, s9609, 1 # 13804
+addsi s9612, s9611, 1 # 13805
+addsi s9614, s9613, 1 # 13806
+addsi s9616, s9615, 1 # 13807
+addsi s9618, s9617, 1 # 13808
+addsi s9620, s9619, 1 # 13809
+addsi s9622, s9621, 1 # 13810
+addsi s9624, s9623, 1 # 13811
+addsi s9626, s9625, 1 # 13812
+addsi s9628, s9627, 1 # 13813
+addsi s9630, s9629, 1 # 13814
+addsi s9632, s9631, 1 # 13815
+addsi s9634, s9633, 1 # 13816
+addsi s9636, s9635, 1 # 13817
+addsi s9638, s9637, 1 # 13818
+addsi s9640, s9639, 1 # 13819
+addsi s9642, s9641, 1 # 13820
+addsi s9644, s9643, 1 # 13821
+addsi s9646, s9645, 1 # 13822
+addsi s9648, s9647, 1 # 13823
+addsi s9650, s9649, 1 # 13824
+addsi s9652, s9651, 1 # 13825
+addsi s9654, s9653, 1 # 13826
+addsi s9656, s9655, 1 # 13827
+addsi s9658, s9657, 1 # 13828
+addsi s9660, s9659, 1 # 13829
+addsi s9662, s9661, 1 # 13830
+addsi s9664, s9663, 1 # 13831
+addsi s9666, s9665, 1 # 13832
+addsi s9668, s9667, 1 # 13833
+addsi s9670, s9669, 1 # 13834
+addsi s9672, s9671, 1 # 13835
+addsi s9674, s9673, 1 # 13836
+addsi s9676, s9675, 1 # 13837
+addsi s9678, s9677, 1 # 13838
+addsi s9680, s9679, 1 # 13839
+addsi s9682, s9681, 1 # 13840
+addsi s9684, s9683, 1 # 13841
+addsi s9686, s9685, 1 # 13842
+addsi s9688, s9687, 1 # 13843
+addsi s9690, s9689, 1 # 13844
+addsi s9692, s9691, 1 # 13845
+addsi s9694, s9693, 1 # 13846
+addsi s9696, s9695, 1 # 13847
+addsi s9698, s9697, 1 # 13848
+addsi s9700, s9699, 1 # 13849
+addsi s9702, s9701, 1 # 13850
+addsi s9704, s9703, 1 # 13851
+addsi s9706, s9705, 1 # 13852
+addsi s9708, s9707, 1 # 13853
+addsi s9710, s9709, 1 # 13854
+addsi s9712, s9711, 1 # 13855
+addsi s9714, s9713, 1 # 13856
+addsi s9716, s9715, 1 # 13857
+addsi s9718, s9717, 1 # 13858
+addsi s9720, s9719, 1 # 13859
+addsi s9722, s9721, 1 # 13860
+addsi s9724, s9723, 1 # 13861
+addsi s9726, s9725, 1 # 13862
+addsi s9728, s9727, 1 # 13863
+addsi s9730, s9729, 1 # 13864
+addsi s9732, s9731, 1 # 13865
+addsi s9734, s9733, 1 # 13866
+addsi s9736, s9735, 1 # 13867
+addsi s9738, s9737, 1 # 13868
+addsi s9740, s9739, 1 # 13869
+addsi s9742, s9741, 1 # 13870
+addsi s9744, s9743, 1 # 13871
+addsi s9746, s9745, 1 # 13872
+addsi s9748, s9747, 1 # 13873
+addsi s9750, s9749, 1 # 13874
+addsi s9752, s9751, 1 # 13875
+addsi s9754, s9753, 1 # 13876
+addsi s9756, s9755, 1 # 13877
+addsi s9758, s9757, 1 # 13878
+addsi s9760, s9759, 1 # 13879
+addsi s9762, s9761, 1 # 13880
+addsi s9764, s9763, 1 # 13881
+addsi s9766, s9765, 1 # 13882
+addsi s9768, s9767, 1 # 13883
+addsi s9770, s9769, 1 # 13884
+addsi s9772, s9771, 1 # 13885
+addsi s9774, s9773, 1 # 13886
+addsi s9776, s9775, 1 # 13887
+addsi s9778, s9777, 1 # 13888
+addsi s9780, s9779, 1 # 13889
+addsi s9782, s9781, 1 # 13890
+addsi s9784, s9783, 1 # 13891
+addsi s9786, s9785, 1 # 13892
+addsi s9788, s9787, 1 # 13893
+addsi s9790, s9789, 1 # 13894
+addsi s9792, s9791, 1 # 13895
+addsi s9794, s9793, 1 # 13896
+addsi s9796, s9795, 1 # 13897
+addsi s9798, s9797, 1 # 13898
+addsi s9800, s9799, 1 # 13899
+addsi s9802, s9801, 1 # 13900
+addsi s9804, s9803, 1 # 13901
+addsi s9806, s9805, 1 # 13902
+addsi s9808, s9807, 1 # 13903
+addsi s9810, s9809, 1 # 13904
+addsi s9812, s9811, 1 # 13905
+addsi s9814, s9813, 1 # 13906
+addsi s9816, s9815, 1 # 13907
+addsi s9818, s9817, 1 # 13908
+addsi s9820, s9819, 1 # 13909
+addsi s9822, s9821, 1 # 13910
+addsi s9824, s9823, 1 # 13911
+addsi s9826, s9825, 1 # 13912
+addsi s9828, s9827, 1 # 13913
+addsi s9830, s9829, 1 # 13914
+addsi s9832, s9831, 1 # 13915
+addsi s9834, s9833, 1 # 13916
+addsi s9836, s9835, 1 # 13917
+addsi s9838, s9837, 1 # 13918
+addsi s9840, s9839, 1 # 13919
+addsi s9842, s9841, 1 # 13920
+addsi s9844, s9843, 1 # 13921
+addsi s9846, s9845, 1 # 13922
+addsi s9848, s9847, 1 # 13923
+addsi s9850, s9849, 1 # 13924
+addsi s9852, s9851, 1 # 13925
+addsi s9854, s9853, 1 # 13926
+addsi s9856, s9855, 1 # 13927
+addsi s9858, s9857, 1 # 13928
+addsi s9860, s9859, 1 # 13929
+addsi s9862, s9861, 1 # 13930
+addsi s9864, s9863, 1 # 13931
+addsi s9866, s9865, 1 # 13932
+addsi s9868, s9867, 1 # 13933
+addsi s9870, s9869, 1 # 13934
+addsi s9872, s9871, 1 # 13935
+addsi s9874, s9873, 1 # 13936
+addsi s9876, s9875, 1 # 13937
+addsi s9878, s9877, 1 # 13938
+addsi s9880, s9879, 1 # 13939
+addsi s9882, s9881, 1 # 13940
+addsi s9884, s9883, 1 # 13941
+addsi s9886, s9885, 1 # 13942
+addsi s9888, s9887, 1 # 13943
+addsi s9890, s9889, 1 # 13944
+addsi s9892, s9891, 1 # 13945
+addsi s9894, s9893, 1 # 13946
+addsi s9896, s9895, 1 # 13947
+addsi s9898, s9897, 1 # 13948
+addsi s9900, s9899, 1 # 13949
+addsi s9902, s9901, 1 # 13950
+addsi s9904, s9903, 1 # 13951
+addsi s9906, s9905, 1 # 13952
+addsi s9908, s9907, 1 # 13953
+addsi s9910, s9909, 1 # 13954
+addsi s9912, s9911, 1 # 13955
+addsi s9914, s9913, 1 # 13956
+addsi s9916, s9915, 1 # 13957
+addsi s9918, s9917, 1 # 13958
+addsi s9920, s9919, 1 # 13959
+addsi s9922, s9921, 1 # 13960
+addsi s9924, s9923, 1 # 13961
+addsi s9926, s9925, 1 # 13962
+addsi s9928, s9927, 1 # 13963
+addsi s9930, s9929, 1 # 13964
+addsi s9932, s9931, 1 # 13965
+addsi s9934, s9933, 1 # 13966
+addsi s9936, s9935, 1 # 13967
+addsi s9938, s9937, 1 # 13968
+addsi s9940, s9939, 1 # 13969
+addsi s9942, s9941, 1 # 13970
+addsi s9944, s9943, 1 # 13971
+addsi s9946, s9945, 1 # 13972
+addsi s9948, s9947, 1 # 13973
+addsi s9950, s9949, 1 # 13974
+addsi s9952, s9951, 1 # 13975
+addsi s9954, s9953, 1 # 13976
+addsi s9956, s9955, 1 # 13977
+addsi s9958, s9957, 1 # 13978
+addsi s9960, s9959, 1 # 13979
+addsi s9962, s9961, 1 # 13980
+addsi s9964, s9963, 1 # 13981
+addsi s9966, s9965, 1 # 13982
+addsi s9968, s9967, 1 # 13983
+addsi s9970, s9969, 1 # 13984
+addsi s9972, s9971, 1 # 13985
+addsi s9974, s9973, 1 # 13986
+addsi s9976, s9975, 1 # 13987
+addsi s9978, s9977, 1 # 13988
+addsi s9980, s9979, 1 # 13989
+addsi s9982, s9981, 1 # 13990
+addsi s9984, s9983, 1 # 13991
+addsi s9986, s9985, 1 # 13992
+addsi s9988, s9987, 1 # 13993
+addsi s9990, s9989, 1 # 13994
+addsi s9992, s9991, 1 # 13995
+addsi s9994, s9993, 1 # 13996
+addsi s9996, s9995, 1 # 13997
+addsi s9998, s9997, 1 # 13998
+addsi s10000, s9999, 1 # 13999
+addsi s10002, s10001, 1 # 14000
+addsi s10004, s10003, 1 # 14001
+addsi s10006, s10005, 1 # 14002
+addsi s10008, s10007, 1 # 14003
+addsi s10010, s10009, 1 # 14004
+addsi s10012, s10011, 1 # 14005
+addsi s10014, s10013, 1 # 14006
+addsi s10016, s10015, 1 # 14007
+addsi s10018, s10017, 1 # 14008
+addsi s10020, s10019, 1 # 14009
+addsi s10022, s10021, 1 # 14010
+addsi s10024, s10023, 1 # 14011
+addsi s10026, s10025, 1 # 14012
+addsi s10028, s10027, 1 # 14013
+addsi s10030, s10029, 1 # 14014
+addsi s10032, s10031, 1 # 14015
+addsi s10034, s10033, 1 # 14016
+addsi s10036, s10035, 1 # 14017
+addsi s10038, s10037, 1 # 14018
+addsi s10040, s10039, 1 # 14019
+addsi s10042, s10041, 1 # 14020
+addsi s10044, s10043, 1 # 14021
+addsi s10046, s10045, 1 # 14022
+addsi s10048, s10047, 1 # 14023
+addsi s10050, s10049, 1 # 14024
+addsi s10052, s10051, 1 # 14025
+addsi s10054, s10053, 1 # 14026
+addsi s10056, s10055, 1 # 14027
+addsi s10058, s10057, 1 # 14028
+addsi s10060, s10059, 1 # 14029
+addsi s10062, s10061, 1 # 14030
+addsi s10064, s10063, 1 # 14031
+addsi s10066, s10065, 1 # 14032
+addsi s10068, s10067, 1 # 14033
+addsi s10070, s10069, 1 # 14034
+addsi s10072, s10071, 1 # 14035
+addsi s10074, s10073, 1 # 14036
+addsi s10076, s10075, 1 # 14037
+addsi s10078, s10077, 1 # 14038
+addsi s10080, s10079, 1 # 14039
+addsi s10082, s10081, 1 # 14040
+addsi s10084, s10083, 1 # 14041
+addsi s10086, s10085, 1 # 14042
+addsi s10088, s10087, 1 # 14043
+addsi s10090, s10089, 1 # 14044
+addsi s10092, s10091, 1 # 14045
+addsi s10094, s10093, 1 # 14046
+addsi s10096, s10095, 1 # 14047
+addsi s10098, s10097, 1 # 14048
+addsi s10100, s10099, 1 # 14049
+addsi s10102, s10101, 1 # 14050
+addsi s10104, s10103, 1 # 14051
+addsi s10106, s10105, 1 # 14052
+addsi s10108, s10107, 1 # 14053
+addsi s10110, s10109, 1 # 14054
+addsi s10112, s10111, 1 # 14055
+addsi s10114, s10113, 1 # 14056
+addsi s10116, s10115, 1 # 14057
+addsi s10118, s10117, 1 # 14058
+addsi s10120, s10119, 1 # 14059
+addsi s10122, s10121, 1 # 14060
+addsi s10124, s10123, 1 # 14061
+addsi s10126, s10125, 1 # 14062
+addsi s10128, s10127, 1 # 14063
+addsi s10130, s10129, 1 # 14064
+addsi s10132, s10131, 1 # 14065
+addsi s10134, s10133, 1 # 14066
+addsi s10136, s10135, 1 # 14067
+addsi s10138, s10137, 1 # 14068
+addsi s10140, s10139, 1 # 14069
+addsi s10142, s10141, 1 # 14070
+addsi s10144, s10143, 1 # 14071
+addsi s10146, s10145, 1 # 14072
+addsi s10148, s10147, 1 # 14073
+addsi s10150, s10149, 1 # 14074
+addsi s10152, s10151, 1 # 14075
+addsi s10154, s10153, 1 # 14076
+addsi s10156, s10155, 1 # 14077
+addsi s10158, s10157, 1 # 14078
+addsi s10160, s10159, 1 # 14079
+addsi s10162, s10161, 1 # 14080
+addsi s10164, s10163, 1 # 14081
+addsi s10166, s10165, 1 # 14082
+addsi s10168, s10167, 1 # 14083
+addsi s10170, s10169, 1 # 14084
+addsi s10172, s10171, 1 # 14085
+addsi s10174, s10173, 1 # 14086
+addsi s10176, s10175, 1 # 14087
+addsi s10178, s10177, 1 # 14088
+addsi s10180, s10179, 1 # 14089
+addsi s10182, s10181, 1 # 14090
+addsi s10184, s10183, 1 # 14091
+addsi s10186, s10185, 1 # 14092
+addsi s10188, s10187, 1 # 14093
+addsi s10190, s10189, 1 # 14094
+addsi s10192, s10191, 1 # 14095
+addsi s10194, s10193, 1 # 14096
+addsi s10196, s10195, 1 # 14097
+addsi s10198, s10197, 1 # 14098
+addsi s10200, s10199, 1 # 14099
+addsi s10202, s10201, 1 # 14100
+addsi s10204, s10203, 1 # 14101
+addsi s10206, s10205, 1 # 14102
+addsi s10208, s10207, 1 # 14103
+addsi s10210, s10209, 1 # 14104
+addsi s10212, s10211, 1 # 14105
+addsi s10214, s10213, 1 # 14106
+addsi s10216, s10215, 1 # 14107
+addsi s10218, s10217, 1 # 14108
+addsi s10220, s10219, 1 # 14109
+addsi s10222, s10221, 1 # 14110
+addsi s10224, s10223, 1 # 14111
+addsi s10226, s10225, 1 # 14112
+addsi s10228, s10227, 1 # 14113
+addsi s10230, s10229, 1 # 14114
+addsi s10232, s10231, 1 # 14115
+addsi s10234, s10233, 1 # 14116
+addsi s10236, s10235, 1 # 14117
+addsi s10238, s10237, 1 # 14118
+addsi s10240, s10239, 1 # 14119
+addsi s10242, s10241, 1 # 14120
+addsi s10244, s10243, 1 # 14121
+addsi s10246, s10245, 1 # 14122
+addsi s10248, s10247, 1 # 14123
+addsi s10250, s10249, 1 # 14124
+addsi s10252, s10251, 1 # 14125
+addsi s10254, s10253, 1 # 14126
+addsi s10256, s10255, 1 # 14127
+addsi s10258, s10257, 1 # 14128
+addsi s10260, s10259, 1 # 14129
+addsi s10262, s10261, 1 # 14130
+addsi s10264, s10263, 1 # 14131
+addsi s10266, s10265, 1 # 14132
+addsi s10268, s10267, 1 # 14133
+addsi s10270, s10269, 1 # 14134
+addsi s10272, s10271, 1 # 14135
+addsi s10274, s10273, 1 # 14136
+addsi s10276, s10275, 1 # 14137
+addsi s10278, s10277, 1 # 14138
+addsi s10280, s10279, 1 # 14139
+addsi s10282, s10281, 1 # 14140
+addsi s10284, s10283, 1 # 14141
+addsi s10286, s10285, 1 # 14142
+addsi s10288, s10287, 1 # 14143
+addsi s10290, s10289, 1 # 14144
+addsi s10292, s10291, 1 # 14145
+addsi s10294, s10293, 1 # 14146
+addsi s10296, s10295, 1 # 14147
+addsi s10298, s10297, 1 # 14148
+addsi s10300, s10299, 1 # 14149
+addsi s10302, s10301, 1 # 14150
+addsi s10304, s10303, 1 # 14151
+addsi s10306, s10305, 1 # 14152
+addsi s10308, s10307, 1 # 14153
+addsi s10310, s10309, 1 # 14154
+addsi s10312, s10311, 1 # 14155
+addsi s10314, s10313, 1 # 14156
+addsi s10316, s10315, 1 # 14157
+addsi s10318, s10317, 1 # 14158
+addsi s10320, s10319, 1 # 14159
+addsi s10322, s10321, 1 # 14160
+addsi s10324, s10323, 1 # 14161
+addsi s10326, s10325, 1 # 14162
+addsi s10328, s10327, 1 # 14163
+addsi s10330, s10329, 1 # 14164
+addsi s10332, s10331, 1 # 14165
+addsi s10334, s10333, 1 # 14166
+addsi s10336, s10335, 1 # 14167
+addsi s10338, s10337, 1 # 14168
+addsi s10340, s10339, 1 # 14169
+addsi s10342, s10341, 1 # 14170
+addsi s10344, s10343, 1 # 14171
+addsi s10346, s10345, 1 # 14172
+addsi s10348, s10347, 1 # 14173
+addsi s10350, s10349, 1 # 14174
+addsi s10352, s10351, 1 # 14175
+addsi s10354, s10353, 1 # 14176
+addsi s10356, s10355, 1 # 14177
+addsi s10358, s10357, 1 # 14178
+addsi s10360, s10359, 1 # 14179
+addsi s10362, s10361, 1 # 14180
+addsi s10364, s10363, 1 # 14181
+addsi s10366, s10365, 1 # 14182
+addsi s10368, s10367, 1 # 14183
+addsi s10370, s10369, 1 # 14184
+addsi s10372, s10371, 1 # 14185
+addsi s10374, s10373, 1 # 14186
+addsi s10376, s10375, 1 # 14187
+addsi s10378, s10377, 1 # 14188
+addsi s10380, s10379, 1 # 14189
+addsi s10382, s10381, 1 # 14190
+addsi s10384, s10383, 1 # 14191
+addsi s10386, s10385, 1 # 14192
+addsi s10388, s10387, 1 # 14193
+addsi s10390, s10389, 1 # 14194
+addsi s10392, s10391, 1 # 14195
+addsi s10394, s10393, 1 # 14196
+addsi s10396, s10395, 1 # 14197
+addsi s10398, s10397, 1 # 14198
+addsi s10400, s10399, 1 # 14199
+addsi s10402, s10401, 1 # 14200
+addsi s10404, s10403, 1 # 14201
+addsi s10406, s10405, 1 # 14202
+addsi s10408, s10407, 1 # 14203
+addsi s10410, s10409, 1 # 14204
+addsi s10412, s10411, 1 # 14205
+addsi s10414, s10413, 1 # 14206
+addsi s10416, s10415, 1 # 14207
+addsi s10418, s10417, 1 # 14208
+addsi s10420, s10419, 1 # 14209
+addsi s10422, s10421, 1 # 14210
+addsi s10424, s10423, 1 # 14211
+addsi s10426, s10425, 1 # 14212
+addsi s10428, s10427, 1 # 14213
+addsi s10430, s10429, 1 # 14214
+addsi s10432, s10431, 1 # 14215
+addsi s10434, s10433, 1 # 14216
+addsi s10436, s10435, 1 # 14217
+addsi s10438, s10437, 1 # 14218
+addsi s10440, s10439, 1 # 14219
+addsi s10442, s10441, 1 # 14220
+addsi s10444, s10443, 1 # 14221
+addsi s10446, s10445, 1 # 14222
+addsi s10448, s10447, 1 # 14223
+addsi s10450, s10449, 1 # 14224
+addsi s10452, s10451, 1 # 14225
+addsi s10454, s10453, 1 # 14226
+addsi s10456, s10455, 1 # 14227
+addsi s10458, s10457, 1 # 14228
+addsi s10460, s10459, 1 # 14229
+addsi s10462, s10461, 1 # 14230
+addsi s10464, s10463, 1 # 14231
+addsi s10466, s10465, 1 # 14232
+addsi s10468, s10467, 1 # 14233
+addsi s10470, s10469, 1 # 14234
+addsi s10472, s10471, 1 # 14235
+addsi s10474, s10473, 1 # 14236
+addsi s10476, s10475, 1 # 14237
+addsi s10478, s10477, 1 # 14238
+addsi s10480, s10479, 1 # 14239
+addsi s10482, s10481, 1 # 14240
+addsi s10484, s10483, 1 # 14241
+addsi s10486, s10485, 1 # 14242
+addsi s10488, s10487, 1 # 14243
+addsi s10490, s10489, 1 # 14244
+addsi s10492, s10491, 1 # 14245
+addsi s10494, s10493, 1 # 14246
+addsi s10496, s10495, 1 # 14247
+addsi s10498, s10497, 1 # 14248
+addsi s10500, s10499, 1 # 14249
+addsi s10502, s10501, 1 # 14250
+addsi s10504, s10503, 1 # 14251
+addsi s10506, s10505, 1 # 14252
+addsi s10508, s10507, 1 # 14253
+addsi s10510, s10509, 1 # 14254
+addsi s10512, s10511, 1 # 14255
+addsi s10514, s10513, 1 # 14256
+addsi s10516, s10515, 1 # 14257
+addsi s10518, s10517, 1 # 14258
+addsi s10520, s10519, 1 # 14259
+addsi s10522, s10521, 1 # 14260
+addsi s10524, s10523, 1 # 14261
+addsi s10526, s10525, 1 # 14262
+addsi s10528, s10527, 1 # 14263
+addsi s10530, s10529, 1 # 14264
+addsi s10532, s10531, 1 # 14265
+addsi s10534, s10533, 1 # 14266
+addsi s10536, s10535, 1 # 14267
+addsi s10538, s10537, 1 # 14268
+addsi s10540, s10539, 1 # 14269
+addsi s10542, s10541, 1 # 14270
+addsi s10544, s10543, 1 # 14271
+addsi s10546, s10545, 1 # 14272
+addsi s10548, s10547, 1 # 14273
+addsi s10550, s10549, 1 # 14274
+addsi s10552, s10551, 1 # 14275
+addsi s10554, s10553, 1 # 14276
+addsi s10556, s10555, 1 # 14277
+addsi s10558, s10557, 1 # 14278
+addsi s10560, s10559, 1 # 14279
+addsi s10562, s10561, 1 # 14280
+addsi s10564, s10563, 1 # 14281
+addsi s10566, s10565, 1 # 14282
+addsi s10568, s10567, 1 # 14283
+addsi s10570, s10569, 1 # 14284
+addsi s10572, s10571, 1 # 14285
+addsi s10574, s10573, 1 # 14286
+addsi s10576, s10575, 1 # 14287
+addsi s10578, s10577, 1 # 14288
+addsi s10580, s10579, 1 # 14289
+addsi s10582, s10581, 1 # 14290
+addsi s10584, s10583, 1 # 14291
+addsi s10586, s10585, 1 # 14292
+addsi s10588, s10587, 1 # 14293
+addsi s10590, s10589, 1 # 14294
+addsi s10592, s10591, 1 # 14295
+addsi s10594, s10593, 1 # 14296
+addsi s10596, s10595, 1 # 14297
+addsi s10598, s10597, 1 # 14298
+addsi s10600, s10599, 1 # 14299
+addsi s10602, s10601, 1 # 14300
+addsi s10604, s10603, 1 # 14301
+addsi s10606, s10605, 1 # 14302
+addsi s10608, s10607, 1 # 14303
+addsi s10610, s10609, 1 # 14304
+addsi s10612, s10611, 1 # 14305
+addsi s10614, s10613, 1 # 14306
+addsi s10616, s10615, 1 # 14307
+addsi s10618, s10617, 1 # 14308
+addsi s10620, s10619, 1 # 14309
+addsi s10622, s10621, 1 # 14310
+addsi s10624, s10623, 1 # 14311
+addsi s10626, s10625, 1 # 14312
+addsi s10628, s10627, 1 # 14313
+addsi s10630, s10629, 1 # 14314
+addsi s10632, s10631, 1 # 14315
+addsi s10634, s10633, 1 # 14316
+addsi s10636, s10635, 1 # 14317
+addsi s10638, s10637, 1 # 14318
+addsi s10640, s10639, 1 # 14319
+addsi s10642, s10641, 1 # 14320
+addsi s10644, s10643, 1 # 14321
+addsi s10646, s10645, 1 # 14322
+addsi s10648, s10647, 1 # 14323
+addsi s10650, s10649, 1 # 14324
+addsi s10652, s10651, 1 # 14325
+addsi s10654, s10653, 1 # 14326
+addsi s10656, s10655, 1 # 14327
+addsi s10658, s10657, 1 # 14328
+addsi s10660, s10659, 1 # 14329
+addsi s10662, s10661, 1 # 14330
+addsi s10664, s10663, 1 # 14331
+addsi s10666, s10665, 1 # 14332
+addsi s10668, s10667, 1 # 14333
+addsi s10670, s10669, 1 # 14334
+addsi s10672, s10671, 1 # 14335
+addsi s10674, s10673, 1 # 14336
+addsi s10676, s10675, 1 # 14337
+addsi s10678, s10677, 1 # 14338
+addsi s10680, s10679, 1 # 14339
+addsi s10682, s10681, 1 # 14340
+addsi s10684, s10683, 1 # 14341
+addsi s10686, s10685, 1 # 14342
+addsi s10688, s10687, 1 # 14343
+addsi s10690, s10689, 1 # 14344
+addsi s10692, s10691, 1 # 14345
+addsi s10694, s10693, 1 # 14346
+addsi s10696, s10695, 1 # 14347
+addsi s10698, s10697, 1 # 14348
+addsi s10700, s10699, 1 # 14349
+addsi s10702, s10701, 1 # 14350
+addsi s10704, s10703, 1 # 14351
+addsi s10706, s10705, 1 # 14352
+addsi s10708, s10707, 1 # 14353
+addsi s10710, s10709, 1 # 14354
+addsi s10712, s10711, 1 # 14355
+addsi s10714, s10713, 1 # 14356
+addsi s10716, s10715, 1 # 14357
+addsi s10718, s10717, 1 # 14358
+addsi s10720, s10719, 1 # 14359
+addsi s10722, s10721, 1 # 14360
+addsi s10724, s10723, 1 # 14361
+addsi s10726, s10725, 1 # 14362
+addsi s10728, s10727, 1 # 14363
+addsi s10730, s10729, 1 # 14364
+addsi s10732, s10731, 1 # 14365
+addsi s10734, s10733, 1 # 14366
+addsi s10736, s10735, 1 # 14367
+addsi s10738, s10737, 1 # 14368
+addsi s10740, s10739, 1 # 14369
+addsi s10742, s10741, 1 # 14370
+addsi s10744, s10743, 1 # 14371
+addsi s10746, s10745, 1 # 14372
+addsi s10748, s10747, 1 # 14373
+addsi s10750, s10749, 1 # 14374
+addsi s10752, s10751, 1 # 14375
+addsi s10754, s10753, 1 # 14376
+addsi s10756, s10755, 1 # 14377
+addsi s10758, s10757, 1 # 14378
+addsi s10760, s10759, 1 # 14379
+addsi s10762, s10761, 1 # 14380
+addsi s10764, s10763, 1 # 14381
+addsi s10766, s10765, 1 # 14382
+addsi s10768, s10767, 1 # 14383
+addsi s10770, s10769, 1 # 14384
+addsi s10772, s10771, 1 # 14385
+addsi s10774, s10773, 1 # 14386
+addsi s10776, s10775, 1 # 14387
+addsi s10778, s10777, 1 # 14388
+addsi s10780, s10779, 1 # 14389
+addsi s10782, s10781, 1 # 14390
+addsi s10784, s10783, 1 # 14391
+addsi s10786, s10785, 1 # 14392
+addsi s10788, s10787, 1 # 14393
+addsi s10790, s10789, 1 # 14394
+addsi s10792, s10791, 1 # 14395
+addsi s10794, s10793, 1 # 14396
+addsi s10796, s10795, 1 # 14397
+addsi s10798, s10797, 1 # 14398
+addsi s10800, s10799, 1 # 14399
+addsi s10802, s10801, 1 # 14400
+addsi s10804, s10803, 1 # 14401
+addsi s10806, s10805, 1 # 14402
+addsi s10808, s10807, 1 # 14403
+addsi s10810, s10809, 1 # 14404
+addsi s10812, s10811, 1 # 14405
+addsi s10814, s10813, 1 # 14406
+addsi s10816, s10815, 1 # 14407
+addsi s10818, s10817, 1 # 14408
+addsi s10820, s10819, 1 # 14409
+addsi s10822, s10821, 1 # 14410
+addsi s10824, s10823, 1 # 14411
+addsi s10826, s10825, 1 # 14412
+addsi s10828, s10827, 1 # 14413
+addsi s10830, s10829, 1 # 14414
+addsi s10832, s10831, 1 # 14415
+addsi s10834, s10833, 1 # 14416
+addsi s10836, s10835, 1 # 14417
+addsi s10838, s10837, 1 # 14418
+addsi s10840, s10839, 1 # 14419
+addsi s10842, s10841, 1 # 14420
+addsi s10844, s10843, 1 # 14421
+addsi s10846, s10845, 1 # 14422
+addsi s10848, s10847, 1 # 14423
+addsi s10850, s10849, 1 # 14424
+addsi s10852, s10851, 1 # 14425
+addsi s10854, s10853, 1 # 14426
+addsi s10856, s10855, 1 # 14427
+addsi s10858, s10857, 1 # 14428
+addsi s10860, s10859, 1 # 14429
+addsi s10862, s10861, 1 # 14430
+addsi s10864, s10863, 1 # 14431
+addsi s10866, s10865, 1 # 14432
+addsi s10868, s10867, 1 # 14433
+addsi s10870, s10869, 1 # 14434
+addsi s10872, s10871, 1 # 14435
+addsi s10874, s10873, 1 # 14436
+addsi s10876, s10875, 1 # 14437
+addsi s10878, s10877, 1 # 14438
+addsi s10880, s10879, 1 # 14439
+addsi s10882, s10881, 1 # 14440
+addsi s10884, s10883, 1 # 14441
+addsi s10886, s10885, 1 # 14442
+addsi s10888, s10887, 1 # 14443
+addsi s10890, s10889, 1 # 14444
+addsi s10892, s10891, 1 # 14445
+addsi s10894, s10893, 1 # 14446
+addsi s10896, s10895, 1 # 14447
+addsi s10898, s10897, 1 # 14448
+addsi s10900, s10899, 1 # 14449
+addsi s10902, s10901, 1 # 14450
+addsi s10904, s10903, 1 # 14451
+addsi s10906, s10905, 1 # 14452
+addsi s10908, s10907, 1 # 14453
+addsi s10910, s10909, 1 # 14454
+addsi s10912, s10911, 1 # 14455
+addsi s10914, s10913, 1 # 14456
+addsi s10916, s10915, 1 # 14457
+addsi s10918, s10917, 1 # 14458
+addsi s10920, s10919, 1 # 14459
+addsi s10922, s10921, 1 # 14460
+addsi s10924, s10923, 1 # 14461
+addsi s10926, s10925, 1 # 14462
+addsi s10928, s10927, 1 # 14463
+addsi s10930, s10929, 1 # 14464
+addsi s10932, s10931, 1 # 14465
+addsi s10934, s10933, 1 # 14466
+addsi s10936, s10935, 1 # 14467
+addsi s10938, s10937, 1 # 14468
+addsi s10940, s10939, 1 # 14469
+addsi s10942, s10941, 1 # 14470
+addsi s10944, s10943, 1 # 14471
+addsi s10946, s10945, 1 # 14472
+addsi s10948, s10947, 1 # 14473
+addsi s10950, s10949, 1 # 14474
+addsi s10952, s10951, 1 # 14475
+addsi s10954, s10953, 1 # 14476
+addsi s10956, s10955, 1 # 14477
+addsi s10958, s10957, 1 # 14478
+addsi s10960, s10959, 1 # 14479
+addsi s10962, s10961, 1 # 14480
+addsi s10964, s10963, 1 # 14481
+addsi s10966, s10965, 1 # 14482
+addsi s10968, s10967, 1 # 14483
+addsi s10970, s10969, 1 # 14484
+addsi s10972, s10971, 1 # 14485
+addsi s10974, s10973, 1 # 14486
+addsi s10976, s10975, 1 # 14487
+addsi s10978, s10977, 1 # 14488
+addsi s10980, s10979, 1 # 14489
+addsi s10982, s10981, 1 # 14490
+addsi s10984, s10983, 1 # 14491
+addsi s10986, s10985, 1 # 14492
+addsi s10988, s10987, 1 # 14493
+addsi s10990, s10989, 1 # 14494
+addsi s10992, s10991, 1 # 14495
+addsi s10994, s10993, 1 # 14496
+addsi s10996, s10995, 1 # 14497
+addsi s10998, s10997, 1 # 14498
+addsi s11000, s10999, 1 # 14499
+addsi s11002, s11001, 1 # 14500
+addsi s11004, s11003, 1 # 14501
+addsi s11006, s11005, 1 # 14502
+addsi s11008, s11007, 1 # 14503
+addsi s11010, s11009, 1 # 14504
+addsi s11012, s11011, 1 # 14505
+addsi s11014, s11013, 1 # 14506
+addsi s11016, s11015, 1 # 14507
+addsi s11018, s11017, 1 # 14508
+addsi s11020, s11019, 1 # 14509
+addsi s11022, s11021, 1 # 14510
+addsi s11024, s11023, 1 # 14511
+addsi s11026, s11025, 1 # 14512
+addsi s11028, s11027, 1 # 14513
+addsi s11030, s11029, 1 # 14514
+addsi s11032, s11031, 1 # 14515
+addsi s11034, s11033, 1 # 14516
+addsi s11036, s11035, 1 # 14517
+addsi s11038, s11037, 1 # 14518
+addsi s11040, s11039, 1 # 14519
+addsi s11042, s11041, 1 # 14520
+addsi s11044, s11043, 1 # 14521
+addsi s11046, s11045, 1 # 14522
+addsi s11048, s11047, 1 # 14523
+addsi s11050, s11049, 1 # 14524
+addsi s11052, s11051, 1 # 14525
+addsi s11054, s11053, 1 # 14526
+addsi s11056, s11055, 1 # 14527
+addsi s11058, s11057, 1 # 14528
+addsi s11060, s11059, 1 # 14529
+addsi s11062, s11061, 1 # 14530
+addsi s11064, s11063, 1 # 14531
+addsi s11066, s11065, 1 # 14532
+addsi s11068, s11067, 1 # 14533
+addsi s11070, s11069, 1 # 14534
+addsi s11072, s11071, 1 # 14535
+addsi s11074, s11073, 1 # 14536
+addsi s11076, s11075, 1 # 14537
+addsi s11078, s11077, 1 # 14538
+addsi s11080, s11079, 1 # 14539
+addsi s11082, s11081, 1 # 14540
+addsi s11084, s11083, 1 # 14541
+addsi s11086, s11085, 1 # 14542
+addsi s11088, s11087, 1 # 14543
+addsi s11090, s11089, 1 # 14544
+addsi s11092, s11091, 1 # 14545
+addsi s11094, s11093, 1 # 14546
+addsi s11096, s11095, 1 # 14547
+addsi s11098, s11097, 1 # 14548
+addsi s11100, s11099, 1 # 14549
+addsi s11102, s11101, 1 # 14550
+addsi s11104, s11103, 1 # 14551
+addsi s11106, s11105, 1 # 14552
+addsi s11108, s11107, 1 # 14553
+addsi s11110, s11109, 1 # 14554
+addsi s11112, s11111, 1 # 14555
+addsi s11114, s11113, 1 # 14556
+addsi s11116, s11115, 1 # 14557
+addsi s11118, s11117, 1 # 14558
+addsi s11120, s11119, 1 # 14559
+addsi s11122, s11121, 1 # 14560
+addsi s11124, s11123, 1 # 14561
+addsi s11126, s11125, 1 # 14562
+addsi s11128, s11127, 1 # 14563
+addsi s11130, s11129, 1 # 14564
+addsi s11132, s11131, 1 # 14565
+addsi s11134, s11133, 1 # 14566
+addsi s11136, s11135, 1 # 14567
+addsi s11138, s11137, 1 # 14568
+addsi s11140, s11139, 1 # 14569
+addsi s11142, s11141, 1 # 14570
+addsi s11144, s11143, 1 # 14571
+addsi s11146, s11145, 1 # 14572
+addsi s11148, s11147, 1 # 14573
+addsi s11150, s11149, 1 # 14574
+addsi s11152, s11151, 1 # 14575
+addsi s11154, s11153, 1 # 14576
+addsi s11156, s11155, 1 # 14577
+addsi s11158, s11157, 1 # 14578
+addsi s11160, s11159, 1 # 14579
+addsi s11162, s11161, 1 # 14580
+addsi s11164, s11163, 1 # 14581
+addsi s11166, s11165, 1 # 14582
+addsi s11168, s11167, 1 # 14583
+addsi s11170, s11169, 1 # 14584
+addsi s11172, s11171, 1 # 14585
+addsi s11174, s11173, 1 # 14586
+addsi s11176, s11175, 1 # 14587
+addsi s11178, s11177, 1 # 14588
+addsi s11180, s11179, 1 # 14589
+addsi s11182, s11181, 1 # 14590
+addsi s11184, s11183, 1 # 14591
+addsi s11186, s11185, 1 # 14592
+addsi s11188, s11187, 1 # 14593
+addsi s11190, s11189, 1 # 14594
+addsi s11192, s11191, 1 # 14595
+addsi s11194, s11193, 1 # 14596
+addsi s11196, s11195, 1 # 14597
+addsi s11198, s11197, 1 # 14598
+addsi s11200, s11199, 1 # 14599
+addsi s11202, s11201, 1 # 14600
+addsi s11204, s11203, 1 # 14601
+addsi s11206, s11205, 1 # 14602
+addsi s11208, s11207, 1 # 14603
+addsi s11210, s11209, 1 # 14604
+addsi s11212, s11211, 1 # 14605
+addsi s11214, s11213, 1 # 14606
+addsi s11216, s11215, 1 # 14607
+addsi s11218, s11217, 1 # 14608
+addsi s11220, s11219, 1 # 14609
+addsi s11222, s11221, 1 # 14610
+addsi s11224, s11223, 1 # 14611
+addsi s11226, s11225, 1 # 14612
+addsi s11228, s11227, 1 # 14613
+addsi s11230, s11229, 1 # 14614
+addsi s11232, s11231, 1 # 14615
+addsi s11234, s11233, 1 # 14616
+addsi s11236, s11235, 1 # 14617
+addsi s11238, s11237, 1 # 14618
+addsi s11240, s11239, 1 # 14619
+addsi s11242, s11241, 1 # 14620
+addsi s11244, s11243, 1 # 14621
+addsi s11246, s11245, 1 # 14622
+addsi s11248, s11247, 1 # 14623
+addsi s11250, s11249, 1 # 14624
+addsi s11252, s11251, 1 # 14625
+addsi s11254, s11253, 1 # 14626
+addsi s11256, s11255, 1 # 14627
+addsi s11258, s11257, 1 # 14628
+addsi s11260, s11259, 1 # 14629
+addsi s11262, s11261, 1 # 14630
+addsi s11264, s11263, 1 # 14631
+addsi s11266, s11265, 1 # 14632
+addsi s11268, s11267, 1 # 14633
+addsi s11270, s11269, 1 # 14634
+addsi s11272, s11271, 1 # 14635
+addsi s11274, s11273, 1 # 14636
+addsi s11276, s11275, 1 # 14637
+addsi s11278, s11277, 1 # 14638
+addsi s11280, s11279, 1 # 14639
+addsi s11282, s11281, 1 # 14640
+addsi s11284, s11283, 1 # 14641
+addsi s11286, s11285, 1 # 14642
+addsi s11288, s11287, 1 # 14643
+addsi s11290, s11289, 1 # 14644
+addsi s11292, s11291, 1 # 14645
+addsi s11294, s11293, 1 # 14646
+addsi s11296, s11295, 1 # 14647
+addsi s11298, s11297, 1 # 14648
+addsi s11300, s11299, 1 # 14649
+addsi s11302, s11301, 1 # 14650
+addsi s11304, s11303, 1 # 14651
+addsi s11306, s11305, 1 # 14652
+addsi s11308, s11307, 1 # 14653
+addsi s11310, s11309, 1 # 14654
+addsi s11312, s11311, 1 # 14655
+addsi s11314, s11313, 1 # 14656
+addsi s11316, s11315, 1 # 14657
+addsi s11318, s11317, 1 # 14658
+addsi s11320, s11319, 1 # 14659
+addsi s11322, s11321, 1 # 14660
+addsi s11324, s11323, 1 # 14661
+addsi s11326, s11325, 1 # 14662
+addsi s11328, s11327, 1 # 14663
+addsi s11330, s11329, 1 # 14664
+addsi s11332, s11331, 1 # 14665
+addsi s11334, s11333, 1 # 14666
+addsi s11336, s11335, 1 # 14667
+addsi s11338, s11337, 1 # 14668
+addsi s11340, s11339, 1 # 14669
+addsi s11342, s11341, 1 # 14670
+addsi s11344, s11343, 1 # 14671
+addsi s11346, s11345, 1 # 14672
+addsi s11348, s11347, 1 # 14673
+addsi s11350, s11349, 1 # 14674
+addsi s11352, s11351, 1 # 14675
+addsi s11354, s11353, 1 # 14676
+addsi s11356, s11355, 1 # 14677
+addsi s11358, s11357, 1 # 14678
+addsi s11360, s11359, 1 # 14679
+addsi s11362, s11361, 1 # 14680
+addsi s11364, s11363, 1 # 14681
+addsi s11366, s11365, 1 # 14682
+addsi s11368, s11367, 1 # 14683
+addsi s11370, s11369, 1 # 14684
+addsi s11372, s11371, 1 # 14685
+addsi s11374, s11373, 1 # 14686
+addsi s11376, s11375, 1 # 14687
+addsi s11378, s11377, 1 # 14688
+addsi s11380, s11379, 1 # 14689
+addsi s11382, s11381, 1 # 14690
+addsi s11384, s11383, 1 # 14691
+addsi s11386, s11385, 1 # 14692
+addsi s11388, s11387, 1 # 14693
+addsi s11390, s11389, 1 # 14694
+addsi s11392, s11391, 1 # 14695
+addsi s11394, s11393, 1 # 14696
+addsi s11396, s11395, 1 # 14697
+addsi s11398, s11397, 1 # 14698
+addsi s11400, s11399, 1 # 14699
+addsi s11402, s11401, 1 # 14700
+addsi s11404, s11403, 1 # 14701
+addsi s11406, s11405, 1 # 14702
+addsi s11408, s11407, 1 # 14703
+addsi s11410, s11409, 1 # 14704
+addsi s11412, s11411, 1 # 14705
+addsi s11414, s11413, 1 # 14706
+addsi s11416, s11415, 1 # 14707
+addsi s11418, s11417, 1 # 14708
+addsi s11420, s11419, 1 # 14709
+addsi s11422, s11421, 1 # 14710
+addsi s11424, s11423, 1 # 14711
+addsi s11426, s11425, 1 # 14712
+addsi s11428, s11427, 1 # 14713
+addsi s11430, s11429, 1 # 14714
+addsi s11432, s11431, 1 # 14715
+addsi s11434, s11433, 1 # 14716
+addsi s11436, s11435, 1 # 14717
+addsi s11438, s11437, 1 # 14718
+addsi s11440, s11439, 1 # 14719
+addsi s11442, s11441, 1 # 14720
+addsi s11444, s11443, 1 # 14721
+addsi s11446, s11445, 1 # 14722
+addsi s11448, s11447, 1 # 14723
+addsi s11450, s11449, 1 # 14724
+addsi s11452, s11451, 1 # 14725
+addsi s11454, s11453, 1 # 14726
+addsi s11456, s11455, 1 # 14727
+addsi s11458, s11457, 1 # 14728
+addsi s11460, s11459, 1 # 14729
+addsi s11462, s11461, 1 # 14730
+addsi s11464, s11463, 1 # 14731
+addsi s11466, s11465, 1 # 14732
+addsi s11468, s11467, 1 # 14733
+addsi s11470, s11469, 1 # 14734
+addsi s11472, s11471, 1 # 14735
+addsi s11474, s11473, 1 # 14736
+addsi s11476, s11475, 1 # 14737
+addsi s11478, s11477, 1 # 14738
+addsi s11480, s11479, 1 # 14739
+addsi s11482, s11481, 1 # 14740
+addsi s11484, s11483, 1 # 14741
+addsi s11486, s11485, 1 # 14742
+addsi s11488, s11487, 1 # 14743
+addsi s11490, s11489, 1 # 14744
+addsi s11492, s11491, 1 # 14745
+addsi s11494, s11493, 1 # 14746
+addsi s11496, s11495, 1 # 14747
+addsi s11498, s11497, 1 # 14748
+addsi s11500, s11499, 1 # 14749
+addsi s11502, s11501, 1 # 14750
+addsi s11504, s11503, 1 # 14751
+addsi s11506, s11505, 1 # 14752
+addsi s11508, s11507, 1 # 14753
+addsi s11510, s11509, 1 # 14754
+addsi s11512, s11511, 1 # 14755
+addsi s11514, s11513, 1 # 14756
+addsi s11516, s11515, 1 # 14757
+addsi s11518, s11517, 1 # 14758
+addsi s11520, s11519, 1 # 14759
+addsi s11522, s11521, 1 # 14760
+addsi s11524, s11523, 1 # 14761
+addsi s11526, s11525, 1 # 14762
+addsi s11528, s11527, 1 # 14763
+addsi s11530, s11529, 1 # 14764
+addsi s11532, s11531, 1 # 14765
+addsi s11534, s11533, 1 # 14766
+addsi s11536, s11535, 1 # 14767
+addsi s11538, s11537, 1 # 14768
+addsi s11540, s11539, 1 # 14769
+addsi s11542, s11541, 1 # 14770
+addsi s11544, s11543, 1 # 14771
+addsi s11546, s11545, 1 # 14772
+addsi s11548, s11547, 1 # 14773
+addsi s11550, s11549, 1 # 14774
+addsi s11552, s11551, 1 # 14775
+addsi s11554, s11553, 1 # 14776
+addsi s11556, s11555, 1 # 14777
+addsi s11558, s11557, 1 # 14778
+addsi s11560, s11559, 1 # 14779
+addsi s11562, s11561, 1 # 14780
+addsi s11564, s11563, 1 # 14781
+addsi s11566, s11565, 1 # 14782
+addsi s11568, s11567, 1 # 14783
+addsi s11570, s11569, 1 # 14784
+addsi s11572, s11571, 1 # 14785
+addsi s11574, s11573, 1 # 14786
+addsi s11576, s11575, 1 # 14787
+addsi s11578, s11577, 1 # 14788
+addsi s11580, s11579, 1 # 14789
+addsi s11582, s11581, 1 # 14790
+addsi s11584, s11583, 1 # 14791
+addsi s11586, s11585, 1 # 14792
+addsi s11588, s11587, 1 # 14793
+addsi s11590, s11589, 1 # 14794
+addsi s11592, s11591, 1 # 14795
+addsi s11594, s11593, 1 # 14796
+addsi s11596, s11595, 1 # 14797
+addsi s11598, s11597, 1 # 14798
+addsi s11600, s11599, 1 # 14799
+addsi s11602, s11601, 1 # 14800
+addsi s11604, s11603, 1 # 14801
+addsi s11606, s11605, 1 # 14802
+addsi s11608, s11607, 1 # 14803
+addsi s11610, s11609, 1 # 14804
+addsi s11612, s11611, 1 # 14805
+addsi s11614, s11613, 1 # 14806
+addsi s11616, s11615, 1 # 14807
+addsi s11618, s11617, 1 # 14808
+addsi s11620, s11619, 1 # 14809
+addsi s11622, s11621, 1 # 14810
+addsi s11624, s11623, 1 # 14811
+addsi s11626, s11625, 1 # 14812
+addsi s11628, s11627, 1 # 14813
+addsi s11630, s11629, 1 # 14814
+addsi s11632, s11631, 1 # 14815
+addsi s11634, s11633, 1 # 14816
+addsi s11636, s11635, 1 # 14817
+addsi s11638, s11637, 1 # 14818
+addsi s11640, s11639, 1 # 14819
+addsi s11642, s11641, 1 # 14820
+addsi s11644, s11643, 1 # 14821
+addsi s11646, s11645, 1 # 14822
+addsi s11648, s11647, 1 # 14823
+addsi s11650, s11649, 1 # 14824
+addsi s11652, s11651, 1 # 14825
+addsi s11654, s11653, 1 # 14826
+addsi s11656, s11655, 1 # 14827
+addsi s11658, s11657, 1 # 14828
+addsi s11660, s11659, 1 # 14829
+addsi s11662, s11661, 1 # 14830
+addsi s11664, s11663, 1 # 14831
+addsi s11666, s11665, 1 # 14832
+addsi s11668, s11667, 1 # 14833
+addsi s11670, s11669, 1 # 14834
+addsi s11672, s11671, 1 # 14835
+addsi s11674, s11673, 1 # 14836
+addsi s11676, s11675, 1 # 14837
+addsi s11678, s11677, 1 # 14838
+addsi s11680, s11679, 1 # 14839
+addsi s11682, s11681, 1 # 14840
+addsi s11684, s11683, 1 # 14841
+addsi s11686, s11685, 1 # 14842
+addsi s11688, s11687, 1 # 14843
+addsi s11690, s11689, 1 # 14844
+addsi s11692, s11691, 1 # 14845
+addsi s11694, s11693, 1 # 14846
+addsi s11696, s11695, 1 # 14847
+addsi s11698, s11697, 1 # 14848
+addsi s11700, s11699, 1 # 14849
+addsi s11702, s11701, 1 # 14850
+addsi s11704, s11703, 1 # 14851
+addsi s11706, s11705, 1 # 14852
+addsi s11708, s11707, 1 # 14853
+addsi s11710, s11709, 1 # 14854
+addsi s11712, s11711, 1 # 14855
+addsi s11714, s11713, 1 # 14856
+addsi s11716, s11715, 1 # 14857
+addsi s11718, s11717, 1 # 14858
+addsi s11720, s11719, 1 # 14859
+addsi s11722, s11721, 1 # 14860
+addsi s11724, s11723, 1 # 14861
+addsi s11726, s11725, 1 # 14862
+addsi s11728, s11727, 1 # 14863
+addsi s11730, s11729, 1 # 14864
+addsi s11732, s11731, 1 # 14865
+addsi s11734, s11733, 1 # 14866
+addsi s11736, s11735, 1 # 14867
+addsi s11738, s11737, 1 # 14868
+addsi s11740, s11739, 1 # 14869
+addsi s11742, s11741, 1 # 14870
+addsi s11744, s11743, 1 # 14871
+addsi s11746, s11745, 1 # 14872
+addsi s11748, s11747, 1 # 14873
+addsi s11750, s11749, 1 # 14874
+addsi s11752, s11751, 1 # 14875
+addsi s11754, s11753, 1 # 14876
+addsi s11756, s11755, 1 # 14877
+addsi s11758, s11757, 1 # 14878
+addsi s11760, s11759, 1 # 14879
+addsi s11762, s11761, 1 # 14880
+addsi s11764, s11763, 1 # 14881
+addsi s11766, s11765, 1 # 14882
+addsi s11768, s11767, 1 # 14883
+addsi s11770, s11769, 1 # 14884
+addsi s11772, s11771, 1 # 14885
+addsi s11774, s11773, 1 # 14886
+addsi s11776, s11775, 1 # 14887
+addsi s11778, s11777, 1 # 14888
+addsi s11780, s11779, 1 # 14889
+addsi s11782, s11781, 1 # 14890
+addsi s11784, s11783, 1 # 14891
+addsi s11786, s11785, 1 # 14892
+addsi s11788, s11787, 1 # 14893
+addsi s11790, s11789, 1 # 14894
+addsi s11792, s11791, 1 # 14895
+addsi s11794, s11793, 1 # 14896
+addsi s11796, s11795, 1 # 14897
+addsi s11798, s11797, 1 # 14898
+addsi s11800, s11799, 1 # 14899
+addsi s11802, s11801, 1 # 14900
+addsi s11804, s11803, 1 # 14901
+addsi s11806, s11805, 1 # 14902
+addsi s11808, s11807, 1 # 14903
+addsi s11810, s11809, 1 # 14904
+addsi s11812, s11811, 1 # 14905
+addsi s11814, s11813, 1 # 14906
+addsi s11816, s11815, 1 # 14907
+addsi s11818, s11817, 1 # 14908
+addsi s11820, s11819, 1 # 14909
+addsi s11822, s11821, 1 # 14910
+addsi s11824, s11823, 1 # 14911
+addsi s11826, s11825, 1 # 14912
+addsi s11828, s11827, 1 # 14913
+addsi s11830, s11829, 1 # 14914
+addsi s11832, s11831, 1 # 14915
+addsi s11834, s11833, 1 # 14916
+addsi s11836, s11835, 1 # 14917
+addsi s11838, s11837, 1 # 14918
+addsi s11840, s11839, 1 # 14919
+addsi s11842, s11841, 1 # 14920
+addsi s11844, s11843, 1 # 14921
+addsi s11846, s11845, 1 # 14922
+addsi s11848, s11847, 1 # 14923
+addsi s11850, s11849, 1 # 14924
+addsi s11852, s11851, 1 # 14925
+addsi s11854, s11853, 1 # 14926
+addsi s11856, s11855, 1 # 14927
+addsi s11858, s11857, 1 # 14928
+addsi s11860, s11859, 1 # 14929
+addsi s11862, s11861, 1 # 14930
+addsi s11864, s11863, 1 # 14931
+addsi s11866, s11865, 1 # 14932
+addsi s11868, s11867, 1 # 14933
+addsi s11870, s11869, 1 # 14934
+addsi s11872, s11871, 1 # 14935
+addsi s11874, s11873, 1 # 14936
+addsi s11876, s11875, 1 # 14937
+addsi s11878, s11877, 1 # 14938
+addsi s11880, s11879, 1 # 14939
+addsi s11882, s11881, 1 # 14940
+addsi s11884, s11883, 1 # 14941
+addsi s11886, s11885, 1 # 14942
+addsi s11888, s11887, 1 # 14943
+addsi s11890, s11889, 1 # 14944
+addsi s11892, s11891, 1 # 14945
+addsi s11894, s11893, 1 # 14946
+addsi s11896, s11895, 1 # 14947
+addsi s11898, s11897, 1 # 14948
+addsi s11900, s11899, 1 # 14949
+addsi s11902, s11901, 1 # 14950
+addsi s11904, s11903, 1 # 14951
+addsi s11906, s11905, 1 # 14952
+addsi s11908, s11907, 1 # 14953
+addsi s11910, s11909, 1 # 14954
+addsi s11912, s11911, 1 # 14955
+addsi s11914, s11913, 1 # 14956
+addsi s11916, s11915, 1 # 14957
+addsi s11918, s11917, 1 # 14958
+addsi s11920, s11919, 1 # 14959
+addsi s11922, s11921, 1 # 14960
+addsi s11924, s11923, 1 # 14961
+addsi s11926, s11925, 1 # 14962
+addsi s11928, s11927, 1 # 14963
+addsi s11930, s11929, 1 # 14964
+addsi s11932, s11931, 1 # 14965
+addsi s11934, s11933, 1 # 14966
+addsi s11936, s11935, 1 # 14967
+addsi s11938, s11937, 1 # 14968
+addsi s11940, s11939, 1 # 14969
+addsi s11942, s11941, 1 # 14970
+addsi s11944, s11943, 1 # 14971
+addsi s11946, s11945, 1 # 14972
+addsi s11948, s11947, 1 # 14973
+addsi s11950, s11949, 1 # 14974
+addsi s11952, s11951, 1 # 14975
+addsi s11954, s11953, 1 # 14976
+addsi s11956, s11955, 1 # 14977
+addsi s11958, s11957, 1 # 14978
+addsi s11960, s11959, 1 # 14979
+addsi s11962, s11961, 1 # 14980
+addsi s11964, s11963, 1 # 14981
+addsi s11966, s11965, 1 # 14982
+addsi s11968, s11967, 1 # 14983
+addsi s11970, s11969, 1 # 14984
+addsi s11972, s11971, 1 # 14985
+addsi s11974, s11973, 1 # 14986
+addsi s11976, s11975, 1 # 14987
+addsi s11978, s11977, 1 # 14988
+addsi s11980, s11979, 1 # 14989
+addsi s11982, s11981, 1 # 14990
+addsi s11984, s11983, 1 # 14991
+addsi s11986, s11985, 1 # 14992
+addsi s11988, s11987, 1 # 14993
+addsi s11990, s11989, 1 # 14994
+addsi s11992, s11991, 1 # 14995
+addsi s11994, s11993, 1 # 14996
+addsi s11996, s11995, 1 # 14997
+addsi s11998, s11997, 1 # 14998
+addsi s12000, s11999, 1 # 14999
+ldint ci2, 0 # 15000
+vincint 3000, ci4, ci2, 1, 1, 3000 # 15001
+vconvint 3000, c2, ci4 # 15002
+vldsi 3000, s3, 0 # 15003
+vaddm 3000, s12001, s3, c2 # 15004
+muls 12004, 1, s1, s2, s6002, 1, s6001, s6003, s6004, 1, s6000, s6005, s6006, 1, s5999, s6007, s6008, 1, s5998, s6009, s6010, 1, s5997, s6011, s6012, 1, s5996, s6013, s6014, 1, s5995, s6015, s6016, 1, s5994, s6017, s6018, 1, s5993, s6019, s6020, 1, s5992, s6021, s6022, 1, s5991, s6023, s6024, 1, s5990, s6025, s6026, 1, s5989, s6027, s6028, 1, s5988, s6029, s6030, 1, s5987, s6031, s6032, 1, s5986, s6033, s6034, 1, s5985, s6035, s6036, 1, s5984, s6037, s6038, 1, s5983, s6039, s6040, 1, s5982, s6041, s6042, 1, s5981, s6043, s6044, 1, s5980, s6045, s6046, 1, s5979, s6047, s6048, 1, s5978, s6049, s6050, 1, s5977, s6051, s6052, 1, s5976, s6053, s6054, 1, s5975, s6055, s6056, 1, s5974, s6057, s6058, 1, s5973, s6059, s6060, 1, s5972, s6061, s6062, 1, s5971, s6063, s6064, 1, s5970, s6065, s6066, 1, s5969, s6067, s6068, 1, s5968, s6069, s6070, 1, s5967, s6071, s6072, 1, s5966, s6073, s6074, 1, s5965, s6075, s6076, 1, s5964, s6077, s6078, 1, s5963, s6079, s6080, 1, s5962, s6081, s6082, 1, s5961, s6083, s6084, 1, s5960, s6085, s6086, 1, s5959, s6087, s6088, 1, s5958, s6089, s6090, 1, s5957, s6091, s6092, 1, s5956, s6093, s6094, 1, s5955, s6095, s6096, 1, s5954, s6097, s6098, 1, s5953, s6099, s6100, 1, s5952, s6101, s6102, 1, s5951, s6103, s6104, 1, s5950, s6105, s6106, 1, s5949, s6107, s6108, 1, s5948, s6109, s6110, 1, s5947, s6111, s6112, 1, s5946, s6113, s6114, 1, s5945, s6115, s6116, 1, s5944, s6117, s6118, 1, s5943, s6119, s6120, 1, s5942, s6121, s6122, 1, s5941, s6123, s6124, 1, s5940, s6125, s6126, 1, s5939, s6127, s6128, 1, s5938, s6129, s6130, 1, s5937, s6131, s6132, 1, s5936, s6133, s6134, 1, s5935, s6135, s6136, 1, s5934, s6137, s6138, 1, s5933, s6139, s6140, 1, s5932, s6141, s6142, 1, s5931, s6143, s6144, 1, s5930, s6145, s6146, 1, s5929, s6147, s6148, 1, s5928, s6149, s6150, 1, s5927, s6151, s6152, 1, s5926, s6153, s6154, 1, s5925, s6155, s6156, 1, s5924, s6157, s6158, 1, s5923, s6159, s6160, 1, s5922, s6161, s6162, 1, s5921, s6163, s6164, 1, s5920, s6165, s6166, 1, s5919, s6167, s6168, 1, s5918, s6169, s6170, 1, s5917, s6171, s6172, 1, s5916, s6173, s6174, 1, s5915, s6175, s6176, 1, s5914, s6177, s6178, 1, s5913, s6179, s6180, 1, s5912, s6181, s6182, 1, s5911, s6183, s6184, 1, s5910, s6185, s6186, 1, s5909, s6187, s6188, 1, s5908, s6189, s6190, 1, s5907, s6191, s6192, 1, s5906, s6193, s6194, 1, s5905, s6195, s6196, 1, s5904, s6197, s6198, 1, s5903, s6199, s6200, 1, s5902, s6201, s6202, 1, s5901, s6203, s6204, 1, s5900, s6205, s6206, 1, s5899, s6207, s6208, 1, s5898, s6209, s6210, 1, s5897, s6211, s6212, 1, s5896, s6213, s6214, 1, s5895, s6215, s6216, 1, s5894, s6217, s6218, 1, s5893, s6219, s6220, 1, s5892, s6221, s6222, 1, s5891, s6223, s6224, 1, s5890, s6225, s6226, 1, s5889, s6227, s6228, 1, s5888, s6229, s6230, 1, s5887, s6231, s6232, 1, s5886, s6233, s6234, 1, s5885, s6235, s6236, 1, s5884, s6237, s6238, 1, s5883, s6239, s6240, 1, s5882, s6241, s6242, 1, s5881, s6243, s6244, 1, s5880, s6245, s6246, 1, s5879, s6247, s6248, 1, s5878, s6249, s6250, 1, s5877, s6251, s6252, 1, s5876, s6253, s6254, 1, s5875, s6255, s6256, 1, s5874, s6257, s6258, 1, s5873, s6259, s6260, 1, s5872, s6261, s6262, 1, s5871, s6263, s6264, 1, s5870, s6265, s6266, 1, s5869, s6267, s6268, 1, s5868, s6269, s6270, 1, s5867, s6271, s6272, 1, s5866, s6273, s6274, 1, s5865, s6275, s6276, 1, s5864, s6277, s6278, 1, s5863, s6279, s6280, 1, s5862, s6281, s6282, 1, s5861, s6283, s6284, 1, s5860, s6285, s6286, 1, s5859, s6287, s6288, 1, s5858, s6289, s6290, 1, s5857, s6291, s6292, 1, s5856, s6293, s6294, 1, s5855, s6295, s6296, 1, s5854, s6297, s6298, 1, s5853, s6299, s6300, 1, s5852, s6301, s6302, 1, s5851, s6303, s6304, 1, s5850, s6305, s6306, 1, s5849, s6307, s6308, 1, s5848, s6309, s6310, 1, s5847, s6311, s6312, 1, s5846, s6313, s6314, 1, s5845, s6315, s6316, 1, s5844, s6317, s6318, 1, s5843, s6319, s6320, 1, s5842, s6321, s6322, 1, s5841, s6323, s6324, 1, s5840, s6325, s6326, 1, s5839, s6327, s6328, 1, s5838, s6329, s6330, 1, s5837, s6331, s6332, 1, s5836, s6333, s6334, 1, s5835, s6335, s6336, 1, s5834, s6337, s6338, 1, s5833, s6339, s6340, 1, s5832, s6341, s6342, 1, s5831, s6343, s6344, 1, s5830, s6345, s6346, 1, s5829, s6347, s6348, 1, s5828, s6349, s6350, 1, s5827, s6351, s6352, 1, s5826, s6353, s6354, 1, s5825, s6355, s6356, 1, s5824, s6357, s6358, 1, s5823, s6359, s6360, 1, s5822, s6361, s6362, 1, s5821, s6363, s6364, 1, s5820, s6365, s6366, 1, s5819, s6367, s6368, 1, s5818, s6369, s6370, 1, s5817, s6371, s6372, 1, s5816, s6373, s6374, 1, s5815, s6375, s6376, 1, s5814, s6377, s6378, 1, s5813, s6379, s6380, 1, s5812, s6381, s6382, 1, s5811, s6383, s6384, 1, s5810, s6385, s6386, 1, s5809, s6387, s6388, 1, s5808, s6389, s6390, 1, s5807, s6391, s6392, 1, s5806, s6393, s6394, 1, s5805, s6395, s6396, 1, s5804, s6397, s6398, 1, s5803, s6399, s6400, 1, s5802, s6401, s6402, 1, s5801, s6403, s6404, 1, s5800, s6405, s6406, 1, s5799, s6407, s6408, 1, s5798, s6409, s6410, 1, s5797, s6411, s6412, 1, s5796, s6413, s6414, 1, s5795, s6415, s6416, 1, s5794, s6417, s6418, 1, s5793, s6419, s6420, 1, s5792, s6421, s6422, 1, s5791, s6423, s6424, 1, s5790, s6425, s6426, 1, s5789, s6427, s6428, 1, s5788, s6429, s6430, 1, s5787, s6431, s6432, 1, s5786, s6433, s6434, 1, s5785, s6435, s6436, 1, s5784, s6437, s6438, 1, s5783, s6439, s6440, 1, s5782, s6441, s6442, 1, s5781, s6443, s6444, 1, s5780, s6445, s6446, 1, s5779, s6447, s6448, 1, s5778, s6449, s6450, 1, s5777, s6451, s6452, 1, s5776, s6453, s6454, 1, s5775, s6455, s6456, 1, s5774, s6457, s6458, 1, s5773, s6459, s6460, 1, s5772, s6461, s6462, 1, s5771, s6463, s6464, 1, s5770, s6465, s6466, 1, s5769, s6467, s6468, 1, s5768, s6469, s6470, 1, s5767, s6471, s6472, 1, s5766, s6473, s6474, 1, s5765, s6475, s6476, 1, s5764, s6477, s6478, 1, s5763, s6479, s6480, 1, s5762, s6481, s6482, 1, s5761, s6483, s6484, 1, s5760, s6485, s6486, 1, s5759, s6487, s6488, 1, s5758, s6489, s6490, 1, s5757, s6491, s6492, 1, s5756, s6493, s6494, 1, s5755, s6495, s6496, 1, s5754, s6497, s6498, 1, s5753, s6499, s6500, 1, s5752, s6501, s6502, 1, s5751, s6503, s6504, 1, s5750, s6505, s6506, 1, s5749, s6507, s6508, 1, s5748, s6509, s6510, 1, s5747, s6511, s6512, 1, s5746, s6513, s6514, 1, s5745, s6515, s6516, 1, s5744, s6517, s6518, 1, s5743, s6519, s6520, 1, s5742, s6521, s6522, 1, s5741, s6523, s6524, 1, s5740, s6525, s6526, 1, s5739, s6527, s6528, 1, s5738, s6529, s6530, 1, s5737, s6531, s6532, 1, s5736, s6533, s6534, 1, s5735, s6535, s6536, 1, s5734, s6537, s6538, 1, s5733, s6539, s6540, 1, s5732, s6541, s6542, 1, s5731, s6543, s6544, 1, s5730, s6545, s6546, 1, s5729, s6547, s6548, 1, s5728, s6549, s6550, 1, s5727, s6551, s6552, 1, s5726, s6553, s6554, 1, s5725, s6555, s6556, 1, s5724, s6557, s6558, 1, s5723, s6559, s6560, 1, s5722, s6561, s6562, 1, s5721, s6563, s6564, 1, s5720, s6565, s6566, 1, s5719, s6567, s6568, 1, s5718, s6569, s6570, 1, s5717, s6571, s6572, 1, s5716, s6573, s6574, 1, s5715, s6575, s6576, 1, s5714, s6577, s6578, 1, s5713, s6579, s6580, 1, s5712, s6581, s6582, 1, s5711, s6583, s6584, 1, s5710, s6585, s6586, 1, s5709, s6587, s6588, 1, s5708, s6589, s6590, 1, s5707, s6591, s6592, 1, s5706, s6593, s6594, 1, s5705, s6595, s6596, 1, s5704, s6597, s6598, 1, s5703, s6599, s6600, 1, s5702, s6601, s6602, 1, s5701, s6603, s6604, 1, s5700, s6605, s6606, 1, s5699, s6607, s6608, 1, s5698, s6609, s6610, 1, s5697, s6611, s6612, 1, s5696, s6613, s6614, 1, s5695, s6615, s6616, 1, s5694, s6617, s6618, 1, s5693, s6619, s6620, 1, s5692, s6621, s6622, 1, s5691, s6623, s6624, 1, s5690, s6625, s6626, 1, s5689, s6627, s6628, 1, s5688, s6629, s6630, 1, s5687, s6631, s6632, 1, s5686, s6633, s6634, 1, s5685, s6635, s6636, 1, s5684, s6637, s6638, 1, s5683, s6639, s6640, 1, s5682, s6641, s6642, 1, s5681, s6643, s6644, 1, s5680, s6645, s6646, 1, s5679, s6647, s6648, 1, s5678, s6649, s6650, 1, s5677, s6651, s6652, 1, s5676, s6653, s6654, 1, s5675, s6655, s6656, 1, s5674, s6657, s6658, 1, s5673, s6659, s6660, 1, s5672, s6661, s6662, 1, s5671, s6663, s6664, 1, s5670, s6665, s6666, 1, s5669, s6667, s6668, 1, s5668, s6669, s6670, 1, s5667, s6671, s6672, 1, s5666, s6673, s6674, 1, s5665, s6675, s6676, 1, s5664, s6677, s6678, 1, s5663, s6679, s6680, 1, s5662, s6681, s6682, 1, s5661, s6683, s6684, 1, s5660, s6685, s6686, 1, s5659, s6687, s6688, 1, s5658, s6689, s6690, 1, s5657, s6691, s6692, 1, s5656, s6693, s6694, 1, s5655, s6695, s6696, 1, s5654, s6697, s6698, 1, s5653, s6699, s6700, 1, s5652, s6701, s6702, 1, s5651, s6703, s6704, 1, s5650, s6705, s6706, 1, s5649, s6707, s6708, 1, s5648, s6709, s6710, 1, s5647, s6711, s6712, 1, s5646, s6713, s6714, 1, s5645, s6715, s6716, 1, s5644, s6717, s6718, 1, s5643, s6719, s6720, 1, s5642, s6721, s6722, 1, s5641, s6723, s6724, 1, s5640, s6725, s6726, 1, s5639, s6727, s6728, 1, s5638, s6729, s6730, 1, s5637, s6731, s6732, 1, s5636, s6733, s6734, 1, s5635, s6735, s6736, 1, s5634, s6737, s6738, 1, s5633, s6739, s6740, 1, s5632, s6741, s6742, 1, s5631, s6743, s6744, 1, s5630, s6745, s6746, 1, s5629, s6747, s6748, 1, s5628, s6749, s6750, 1, s5627, s6751, s6752, 1, s5626, s6753, s6754, 1, s5625, s6755, s6756, 1, s5624, s6757, s6758, 1, s5623, s6759, s6760, 1, s5622, s6761, s6762, 1, s5621, s6763, s6764, 1, s5620, s6765, s6766, 1, s5619, s6767, s6768, 1, s5618, s6769, s6770, 1, s5617, s6771, s6772, 1, s5616, s6773, s6774, 1, s5615, s6775, s6776, 1, s5614, s6777, s6778, 1, s5613, s6779, s6780, 1, s5612, s6781, s6782, 1, s5611, s6783, s6784, 1, s5610, s6785, s6786, 1, s5609, s6787, s6788, 1, s5608, s6789, s6790, 1, s5607, s6791, s6792, 1, s5606, s6793, s6794, 1, s5605, s6795, s6796, 1, s5604, s6797, s6798, 1, s5603, s6799, s6800, 1, s5602, s6801, s6802, 1, s5601, s6803, s6804, 1, s5600, s6805, s6806, 1, s5599, s6807, s6808, 1, s5598, s6809, s6810, 1, s5597, s6811, s6812, 1, s5596, s6813, s6814, 1, s5595, s6815, s6816, 1, s5594, s6817, s6818, 1, s5593, s6819, s6820, 1, s5592, s6821, s6822, 1, s5591, s6823, s6824, 1, s5590, s6825, s6826, 1, s5589, s6827, s6828, 1, s5588, s6829, s6830, 1, s5587, s6831, s6832, 1, s5586, s6833, s6834, 1, s5585, s6835, s6836, 1, s5584, s6837, s6838, 1, s5583, s6839, s6840, 1, s5582, s6841, s6842, 1, s5581, s6843, s6844, 1, s5580, s6845, s6846, 1, s5579, s6847, s6848, 1, s5578, s6849, s6850, 1, s5577, s6851, s6852, 1, s5576, s6853, s6854, 1, s5575, s6855, s6856, 1, s5574, s6857, s6858, 1, s5573, s6859, s6860, 1, s5572, s6861, s6862, 1, s5571, s6863, s6864, 1, s5570, s6865, s6866, 1, s5569, s6867, s6868, 1, s5568, s6869, s6870, 1, s5567, s6871, s6872, 1, s5566, s6873, s6874, 1, s5565, s6875, s6876, 1, s5564, s6877, s6878, 1, s5563, s6879, s6880, 1, s5562, s6881, s6882, 1, s5561, s6883, s6884, 1, s5560, s6885, s6886, 1, s5559, s6887, s6888, 1, s5558, s6889, s6890, 1, s5557, s6891, s6892, 1, s5556, s6893, s6894, 1, s5555, s6895, s6896, 1, s5554, s6897, s6898, 1, s5553, s6899, s6900, 1, s5552, s6901, s6902, 1, s5551, s6903, s6904, 1, s5550, s6905, s6906, 1, s5549, s6907, s6908, 1, s5548, s6909, s6910, 1, s5547, s6911, s6912, 1, s5546, s6913, s6914, 1, s5545, s6915, s6916, 1, s5544, s6917, s6918, 1, s5543, s6919, s6920, 1, s5542, s6921, s6922, 1, s5541, s6923, s6924, 1, s5540, s6925, s6926, 1, s5539, s6927, s6928, 1, s5538, s6929, s6930, 1, s5537, s6931, s6932, 1, s5536, s6933, s6934, 1, s5535, s6935, s6936, 1, s5534, s6937, s6938, 1, s5533, s6939, s6940, 1, s5532, s6941, s6942, 1, s5531, s6943, s6944, 1, s5530, s6945, s6946, 1, s5529, s6947, s6948, 1, s5528, s6949, s6950, 1, s5527, s6951, s6952, 1, s5526, s6953, s6954, 1, s5525, s6955, s6956, 1, s5524, s6957, s6958, 1, s5523, s6959, s6960, 1, s5522, s6961, s6962, 1, s5521, s6963, s6964, 1, s5520, s6965, s6966, 1, s5519, s6967, s6968, 1, s5518, s6969, s6970, 1, s5517, s6971, s6972, 1, s5516, s6973, s6974, 1, s5515, s6975, s6976, 1, s5514, s6977, s6978, 1, s5513, s6979, s6980, 1, s5512, s6981, s6982, 1, s5511, s6983, s6984, 1, s5510, s6985, s6986, 1, s5509, s6987, s6988, 1, s5508, s6989, s6990, 1, s5507, s6991, s6992, 1, s5506, s6993, s6994, 1, s5505, s6995, s6996, 1, s5504, s6997, s6998, 1, s5503, s6999, s7000, 1, s5502, s7001, s7002, 1, s5501, s7003, s7004, 1, s5500, s7005, s7006, 1, s5499, s7007, s7008, 1, s5498, s7009, s7010, 1, s5497, s7011, s7012, 1, s5496, s7013, s7014, 1, s5495, s7015, s7016, 1, s5494, s7017, s7018, 1, s5493, s7019, s7020, 1, s5492, s7021, s7022, 1, s5491, s7023, s7024, 1, s5490, s7025, s7026, 1, s5489, s7027, s7028, 1, s5488, s7029, s7030, 1, s5487, s7031, s7032, 1, s5486, s7033, s7034, 1, s5485, s7035, s7036, 1, s5484, s7037, s7038, 1, s5483, s7039, s7040, 1, s5482, s7041, s7042, 1, s5481, s7043, s7044, 1, s5480, s7045, s7046, 1, s5479, s7047, s7048, 1, s5478, s7049, s7050, 1, s5477, s7051, s7052, 1, s5476, s7053, s7054, 1, s5475, s7055, s7056, 1, s5474, s7057, s7058, 1, s5473, s7059, s7060, 1, s5472, s7061, s7062, 1, s5471, s7063, s7064, 1, s5470, s7065, s7066, 1, s5469, s7067, s7068, 1, s5468, s7069, s7070, 1, s5467, s7071, s7072, 1, s5466, s7073, s7074, 1, s5465, s7075, s7076, 1, s5464, s7077, s7078, 1, s5463, s7079, s7080, 1, s5462, s7081, s7082, 1, s5461, s7083, s7084, 1, s5460, s7085, s7086, 1, s5459, s7087, s7088, 1, s5458, s7089, s7090, 1, s5457, s7091, s7092, 1, s5456, s7093, s7094, 1, s5455, s7095, s7096, 1, s5454, s7097, s7098, 1, s5453, s7099, s7100, 1, s5452, s7101, s7102, 1, s5451, s7103, s7104, 1, s5450, s7105, s7106, 1, s5449, s7107, s7108, 1, s5448, s7109, s7110, 1, s5447, s7111, s7112, 1, s5446, s7113, s7114, 1, s5445, s7115, s7116, 1, s5444, s7117, s7118, 1, s5443, s7119, s7120, 1, s5442, s7121, s7122, 1, s5441, s7123, s7124, 1, s5440, s7125, s7126, 1, s5439, s7127, s7128, 1, s5438, s7129, s7130, 1, s5437, s7131, s7132, 1, s5436, s7133, s7134, 1, s5435, s7135, s7136, 1, s5434, s7137, s7138, 1, s5433, s7139, s7140, 1, s5432, s7141, s7142, 1, s5431, s7143, s7144, 1, s5430, s7145, s7146, 1, s5429, s7147, s7148, 1, s5428, s7149, s7150, 1, s5427, s7151, s7152, 1, s5426, s7153, s7154, 1, s5425, s7155, s7156, 1, s5424, s7157, s7158, 1, s5423, s7159, s7160, 1, s5422, s7161, s7162, 1, s5421, s7163, s7164, 1, s5420, s7165, s7166, 1, s5419, s7167, s7168, 1, s5418, s7169, s7170, 1, s5417, s7171, s7172, 1, s5416, s7173, s7174, 1, s5415, s7175, s7176, 1, s5414, s7177, s7178, 1, s5413, s7179, s7180, 1, s5412, s7181, s7182, 1, s5411, s7183, s7184, 1, s5410, s7185, s7186, 1, s5409, s7187, s7188, 1, s5408, s7189, s7190, 1, s5407, s7191, s7192, 1, s5406, s7193, s7194, 1, s5405, s7195, s7196, 1, s5404, s7197, s7198, 1, s5403, s7199, s7200, 1, s5402, s7201, s7202, 1, s5401, s7203, s7204, 1, s5400, s7205, s7206, 1, s5399, s7207, s7208, 1, s5398, s7209, s7210, 1, s5397, s7211, s7212, 1, s5396, s7213, s7214, 1, s5395, s7215, s7216, 1, s5394, s7217, s7218, 1, s5393, s7219, s7220, 1, s5392, s7221, s7222, 1, s5391, s7223, s7224, 1, s5390, s7225, s7226, 1, s5389, s7227, s7228, 1, s5388, s7229, s7230, 1, s5387, s7231, s7232, 1, s5386, s7233, s7234, 1, s5385, s7235, s7236, 1, s5384, s7237, s7238, 1, s5383, s7239, s7240, 1, s5382, s7241, s7242, 1, s5381, s7243, s7244, 1, s5380, s7245, s7246, 1, s5379, s7247, s7248, 1, s5378, s7249, s7250, 1, s5377, s7251, s7252, 1, s5376, s7253, s7254, 1, s5375, s7255, s7256, 1, s5374, s7257, s7258, 1, s5373, s7259, s7260, 1, s5372, s7261, s7262, 1, s5371, s7263, s7264, 1, s5370, s7265, s7266, 1, s5369, s7267, s7268, 1, s5368, s7269, s7270, 1, s5367, s7271, s7272, 1, s5366, s7273, s7274, 1, s5365, s7275, s7276, 1, s5364, s7277, s7278, 1, s5363, s7279, s7280, 1, s5362, s7281, s7282, 1, s5361, s7283, s7284, 1, s5360, s7285, s7286, 1, s5359, s7287, s7288, 1, s5358, s7289, s7290, 1, s5357, s7291, s7292, 1, s5356, s7293, s7294, 1, s5355, s7295, s7296, 1, s5354, s7297, s7298, 1, s5353, s7299, s7300, 1, s5352, s7301, s7302, 1, s5351, s7303, s7304, 1, s5350, s7305, s7306, 1, s5349, s7307, s7308, 1, s5348, s7309, s7310, 1, s5347, s7311, s7312, 1, s5346, s7313, s7314, 1, s5345, s7315, s7316, 1, s5344, s7317, s7318, 1, s5343, s7319, s7320, 1, s5342, s7321, s7322, 1, s5341, s7323, s7324, 1, s5340, s7325, s7326, 1, s5339, s7327, s7328, 1, s5338, s7329, s7330, 1, s5337, s7331, s7332, 1, s5336, s7333, s7334, 1, s5335, s7335, s7336, 1, s5334, s7337, s7338, 1, s5333, s7339, s7340, 1, s5332, s7341, s7342, 1, s5331, s7343, s7344, 1, s5330, s7345, s7346, 1, s5329, s7347, s7348, 1, s5328, s7349, s7350, 1, s5327, s7351, s7352, 1, s5326, s7353, s7354, 1, s5325, s7355, s7356, 1, s5324, s7357, s7358, 1, s5323, s7359, s7360, 1, s5322, s7361, s7362, 1, s5321, s7363, s7364, 1, s5320, s7365, s7366, 1, s5319, s7367, s7368, 1, s5318, s7369, s7370, 1, s5317, s7371, s7372, 1, s5316, s7373, s7374, 1, s5315, s7375, s7376, 1, s5314, s7377, s7378, 1, s5313, s7379, s7380, 1, s5312, s7381, s7382, 1, s5311, s7383, s7384, 1, s5310, s7385, s7386, 1, s5309, s7387, s7388, 1, s5308, s7389, s7390, 1, s5307, s7391, s7392, 1, s5306, s7393, s7394, 1, s5305, s7395, s7396, 1, s5304, s7397, s7398, 1, s5303, s7399, s7400, 1, s5302, s7401, s7402, 1, s5301, s7403, s7404, 1, s5300, s7405, s7406, 1, s5299, s7407, s7408, 1, s5298, s7409, s7410, 1, s5297, s7411, s7412, 1, s5296, s7413, s7414, 1, s5295, s7415, s7416, 1, s5294, s7417, s7418, 1, s5293, s7419, s7420, 1, s5292, s7421, s7422, 1, s5291, s7423, s7424, 1, s5290, s7425, s7426, 1, s5289, s7427, s7428, 1, s5288, s7429, s7430, 1, s5287, s7431, s7432, 1, s5286, s7433, s7434, 1, s5285, s7435, s7436, 1, s5284, s7437, s7438, 1, s5283, s7439, s7440, 1, s5282, s7441, s7442, 1, s5281, s7443, s7444, 1, s5280, s7445, s7446, 1, s5279, s7447, s7448, 1, s5278, s7449, s7450, 1, s5277, s7451, s7452, 1, s5276, s7453, s7454, 1, s5275, s7455, s7456, 1, s5274, s7457, s7458, 1, s5273, s7459, s7460, 1, s5272, s7461, s7462, 1, s5271, s7463, s7464, 1, s5270, s7465, s7466, 1, s5269, s7467, s7468, 1, s5268, s7469, s7470, 1, s5267, s7471, s7472, 1, s5266, s7473, s7474, 1, s5265, s7475, s7476, 1, s5264, s7477, s7478, 1, s5263, s7479, s7480, 1, s5262, s7481, s7482, 1, s5261, s7483, s7484, 1, s5260, s7485, s7486, 1, s5259, s7487, s7488, 1, s5258, s7489, s7490, 1, s5257, s7491, s7492, 1, s5256, s7493, s7494, 1, s5255, s7495, s7496, 1, s5254, s7497, s7498, 1, s5253, s7499, s7500, 1, s5252, s7501, s7502, 1, s5251, s7503, s7504, 1, s5250, s7505, s7506, 1, s5249, s7507, s7508, 1, s5248, s7509, s7510, 1, s5247, s7511, s7512, 1, s5246, s7513, s7514, 1, s5245, s7515, s7516, 1, s5244, s7517, s7518, 1, s5243, s7519, s7520, 1, s5242, s7521, s7522, 1, s5241, s7523, s7524, 1, s5240, s7525, s7526, 1, s5239, s7527, s7528, 1, s5238, s7529, s7530, 1, s5237, s7531, s7532, 1, s5236, s7533, s7534, 1, s5235, s7535, s7536, 1, s5234, s7537, s7538, 1, s5233, s7539, s7540, 1, s5232, s7541, s7542, 1, s5231, s7543, s7544, 1, s5230, s7545, s7546, 1, s5229, s7547, s7548, 1, s5228, s7549, s7550, 1, s5227, s7551, s7552, 1, s5226, s7553, s7554, 1, s5225, s7555, s7556, 1, s5224, s7557, s7558, 1, s5223, s7559, s7560, 1, s5222, s7561, s7562, 1, s5221, s7563, s7564, 1, s5220, s7565, s7566, 1, s5219, s7567, s7568, 1, s5218, s7569, s7570, 1, s5217, s7571, s7572, 1, s5216, s7573, s7574, 1, s5215, s7575, s7576, 1, s5214, s7577, s7578, 1, s5213, s7579, s7580, 1, s5212, s7581, s7582, 1, s5211, s7583, s7584, 1, s5210, s7585, s7586, 1, s5209, s7587, s7588, 1, s5208, s7589, s7590, 1, s5207, s7591, s7592, 1, s5206, s7593, s7594, 1, s5205, s7595, s7596, 1, s5204, s7597, s7598, 1, s5203, s7599, s7600, 1, s5202, s7601, s7602, 1, s5201, s7603, s7604, 1, s5200, s7605, s7606, 1, s5199, s7607, s7608, 1, s5198, s7609, s7610, 1, s5197, s7611, s7612, 1, s5196, s7613, s7614, 1, s5195, s7615, s7616, 1, s5194, s7617, s7618, 1, s5193, s7619, s7620, 1, s5192, s7621, s7622, 1, s5191, s7623, s7624, 1, s5190, s7625, s7626, 1, s5189, s7627, s7628, 1, s5188, s7629, s7630, 1, s5187, s7631, s7632, 1, s5186, s7633, s7634, 1, s5185, s7635, s7636, 1, s5184, s7637, s7638, 1, s5183, s7639, s7640, 1, s5182, s7641, s7642, 1, s5181, s7643, s7644, 1, s5180, s7645, s7646, 1, s5179, s7647, s7648, 1, s5178, s7649, s7650, 1, s5177, s7651, s7652, 1, s5176, s7653, s7654, 1, s5175, s7655, s7656, 1, s5174, s7657, s7658, 1, s5173, s7659, s7660, 1, s5172, s7661, s7662, 1, s5171, s7663, s7664, 1, s5170, s7665, s7666, 1, s5169, s7667, s7668, 1, s5168, s7669, s7670, 1, s5167, s7671, s7672, 1, s5166, s7673, s7674, 1, s5165, s7675, s7676, 1, s5164, s7677, s7678, 1, s5163, s7679, s7680, 1, s5162, s7681, s7682, 1, s5161, s7683, s7684, 1, s5160, s7685, s7686, 1, s5159, s7687, s7688, 1, s5158, s7689, s7690, 1, s5157, s7691, s7692, 1, s5156, s7693, s7694, 1, s5155, s7695, s7696, 1, s5154, s7697, s7698, 1, s5153, s7699, s7700, 1, s5152, s7701, s7702, 1, s5151, s7703, s7704, 1, s5150, s7705, s7706, 1, s5149, s7707, s7708, 1, s5148, s7709, s7710, 1, s5147, s7711, s7712, 1, s5146, s7713, s7714, 1, s5145, s7715, s7716, 1, s5144, s7717, s7718, 1, s5143, s7719, s7720, 1, s5142, s7721, s7722, 1, s5141, s7723, s7724, 1, s5140, s7725, s7726, 1, s5139, s7727, s7728, 1, s5138, s7729, s7730, 1, s5137, s7731, s7732, 1, s5136, s7733, s7734, 1, s5135, s7735, s7736, 1, s5134, s7737, s7738, 1, s5133, s7739, s7740, 1, s5132, s7741, s7742, 1, s5131, s7743, s7744, 1, s5130, s7745, s7746, 1, s5129, s7747, s7748, 1, s5128, s7749, s7750, 1, s5127, s7751, s7752, 1, s5126, s7753, s7754, 1, s5125, s7755, s7756, 1, s5124, s7757, s7758, 1, s5123, s7759, s7760, 1, s5122, s7761, s7762, 1, s5121, s7763, s7764, 1, s5120, s7765, s7766, 1, s5119, s7767, s7768, 1, s5118, s7769, s7770, 1, s5117, s7771, s7772, 1, s5116, s7773, s7774, 1, s5115, s7775, s7776, 1, s5114, s7777, s7778, 1, s5113, s7779, s7780, 1, s5112, s7781, s7782, 1, s5111, s7783, s7784, 1, s5110, s7785, s7786, 1, s5109, s7787, s7788, 1, s5108, s7789, s7790, 1, s5107, s7791, s7792, 1, s5106, s7793, s7794, 1, s5105, s7795, s7796, 1, s5104, s7797, s7798, 1, s5103, s7799, s7800, 1, s5102, s7801, s7802, 1, s5101, s7803, s7804, 1, s5100, s7805, s7806, 1, s5099, s7807, s7808, 1, s5098, s7809, s7810, 1, s5097, s7811, s7812, 1, s5096, s7813, s7814, 1, s5095, s7815, s7816, 1, s5094, s7817, s7818, 1, s5093, s7819, s7820, 1, s5092, s7821, s7822, 1, s5091, s7823, s7824, 1, s5090, s7825, s7826, 1, s5089, s7827, s7828, 1, s5088, s7829, s7830, 1, s5087, s7831, s7832, 1, s5086, s7833, s7834, 1, s5085, s7835, s7836, 1, s5084, s7837, s7838, 1, s5083, s7839, s7840, 1, s5082, s7841, s7842, 1, s5081, s7843, s7844, 1, s5080, s7845, s7846, 1, s5079, s7847, s7848, 1, s5078, s7849, s7850, 1, s5077, s7851, s7852, 1, s5076, s7853, s7854, 1, s5075, s7855, s7856, 1, s5074, s7857, s7858, 1, s5073, s7859, s7860, 1, s5072, s7861, s7862, 1, s5071, s7863, s7864, 1, s5070, s7865, s7866, 1, s5069, s7867, s7868, 1, s5068, s7869, s7870, 1, s5067, s7871, s7872, 1, s5066, s7873, s7874, 1, s5065, s7875, s7876, 1, s5064, s7877, s7878, 1, s5063, s7879, s7880, 1, s5062, s7881, s7882, 1, s5061, s7883, s7884, 1, s5060, s7885, s7886, 1, s5059, s7887, s7888, 1, s5058, s7889, s7890, 1, s5057, s7891, s7892, 1, s5056, s7893, s7894, 1, s5055, s7895, s7896, 1, s5054, s7897, s7898, 1, s5053, s7899, s7900, 1, s5052, s7901, s7902, 1, s5051, s7903, s7904, 1, s5050, s7905, s7906, 1, s5049, s7907, s7908, 1, s5048, s7909, s7910, 1, s5047, s7911, s7912, 1, s5046, s7913, s7914, 1, s5045, s7915, s7916, 1, s5044, s7917, s7918, 1, s5043, s7919, s7920, 1, s5042, s7921, s7922, 1, s5041, s7923, s7924, 1, s5040, s7925, s7926, 1, s5039, s7927, s7928, 1, s5038, s7929, s7930, 1, s5037, s7931, s7932, 1, s5036, s7933, s7934, 1, s5035, s7935, s7936, 1, s5034, s7937, s7938, 1, s5033, s7939, s7940, 1, s5032, s7941, s7942, 1, s5031, s7943, s7944, 1, s5030, s7945, s7946, 1, s5029, s7947, s7948, 1, s5028, s7949, s7950, 1, s5027, s7951, s7952, 1, s5026, s7953, s7954, 1, s5025, s7955, s7956, 1, s5024, s7957, s7958, 1, s5023, s7959, s7960, 1, s5022, s7961, s7962, 1, s5021, s7963, s7964, 1, s5020, s7965, s7966, 1, s5019, s7967, s7968, 1, s5018, s7969, s7970, 1, s5017, s7971, s7972, 1, s5016, s7973, s7974, 1, s5015, s7975, s7976, 1, s5014, s7977, s7978, 1, s5013, s7979, s7980, 1, s5012, s7981, s7982, 1, s5011, s7983, s7984, 1, s5010, s7985, s7986, 1, s5009, s7987, s7988, 1, s5008, s7989, s7990, 1, s5007, s7991, s7992, 1, s5006, s7993, s7994, 1, s5005, s7995, s7996, 1, s5004, s7997, s7998, 1, s5003, s7999, s8000, 1, s5002, s8001, s8002, 1, s5001, s8003, s8004, 1, s5000, s8005, s8006, 1, s4999, s8007, s8008, 1, s4998, s8009, s8010, 1, s4997, s8011, s8012, 1, s4996, s8013, s8014, 1, s4995, s8015, s8016, 1, s4994, s8017, s8018, 1, s4993, s8019, s8020, 1, s4992, s8021, s8022, 1, s4991, s8023, s8024, 1, s4990, s8025, s8026, 1, s4989, s8027, s8028, 1, s4988, s8029, s8030, 1, s4987, s8031, s8032, 1, s4986, s8033, s8034, 1, s4985, s8035, s8036, 1, s4984, s8037, s8038, 1, s4983, s8039, s8040, 1, s4982, s8041, s8042, 1, s4981, s8043, s8044, 1, s4980, s8045, s8046, 1, s4979, s8047, s8048, 1, s4978, s8049, s8050, 1, s4977, s8051, s8052, 1, s4976, s8053, s8054, 1, s4975, s8055, s8056, 1, s4974, s8057, s8058, 1, s4973, s8059, s8060, 1, s4972, s8061, s8062, 1, s4971, s8063, s8064, 1, s4970, s8065, s8066, 1, s4969, s8067, s8068, 1, s4968, s8069, s8070, 1, s4967, s8071, s8072, 1, s4966, s8073, s8074, 1, s4965, s8075, s8076, 1, s4964, s8077, s8078, 1, s4963, s8079, s8080, 1, s4962, s8081, s8082, 1, s4961, s8083, s8084, 1, s4960, s8085, s8086, 1, s4959, s8087, s8088, 1, s4958, s8089, s8090, 1, s4957, s8091, s8092, 1, s4956, s8093, s8094, 1, s4955, s8095, s8096, 1, s4954, s8097, s8098, 1, s4953, s8099, s8100, 1, s4952, s8101, s8102, 1, s4951, s8103, s8104, 1, s4950, s8105, s8106, 1, s4949, s8107, s8108, 1, s4948, s8109, s8110, 1, s4947, s8111, s8112, 1, s4946, s8113, s8114, 1, s4945, s8115, s8116, 1, s4944, s8117, s8118, 1, s4943, s8119, s8120, 1, s4942, s8121, s8122, 1, s4941, s8123, s8124, 1, s4940, s8125, s8126, 1, s4939, s8127, s8128, 1, s4938, s8129, s8130, 1, s4937, s8131, s8132, 1, s4936, s8133, s8134, 1, s4935, s8135, s8136, 1, s4934, s8137, s8138, 1, s4933, s8139, s8140, 1, s4932, s8141, s8142, 1, s4931, s8143, s8144, 1, s4930, s8145, s8146, 1, s4929, s8147, s8148, 1, s4928, s8149, s8150, 1, s4927, s8151, s8152, 1, s4926, s8153, s8154, 1, s4925, s8155, s8156, 1, s4924, s8157, s8158, 1, s4923, s8159, s8160, 1, s4922, s8161, s8162, 1, s4921, s8163, s8164, 1, s4920, s8165, s8166, 1, s4919, s8167, s8168, 1, s4918, s8169, s8170, 1, s4917, s8171, s8172, 1, s4916, s8173, s8174, 1, s4915, s8175, s8176, 1, s4914, s8177, s8178, 1, s4913, s8179, s8180, 1, s4912, s8181, s8182, 1, s4911, s8183, s8184, 1, s4910, s8185, s8186, 1, s4909, s8187, s8188, 1, s4908, s8189, s8190, 1, s4907, s8191, s8192, 1, s4906, s8193, s8194, 1, s4905, s8195, s8196, 1, s4904, s8197, s8198, 1, s4903, s8199, s8200, 1, s4902, s8201, s8202, 1, s4901, s8203, s8204, 1, s4900, s8205, s8206, 1, s4899, s8207, s8208, 1, s4898, s8209, s8210, 1, s4897, s8211, s8212, 1, s4896, s8213, s8214, 1, s4895, s8215, s8216, 1, s4894, s8217, s8218, 1, s4893, s8219, s8220, 1, s4892, s8221, s8222, 1, s4891, s8223, s8224, 1, s4890, s8225, s8226, 1, s4889, s8227, s8228, 1, s4888, s8229, s8230, 1, s4887, s8231, s8232, 1, s4886, s8233, s8234, 1, s4885, s8235, s8236, 1, s4884, s8237, s8238, 1, s4883, s8239, s8240, 1, s4882, s8241, s8242, 1, s4881, s8243, s8244, 1, s4880, s8245, s8246, 1, s4879, s8247, s8248, 1, s4878, s8249, s8250, 1, s4877, s8251, s8252, 1, s4876, s8253, s8254, 1, s4875, s8255, s8256, 1, s4874, s8257, s8258, 1, s4873, s8259, s8260, 1, s4872, s8261, s8262, 1, s4871, s8263, s8264, 1, s4870, s8265, s8266, 1, s4869, s8267, s8268, 1, s4868, s8269, s8270, 1, s4867, s8271, s8272, 1, s4866, s8273, s8274, 1, s4865, s8275, s8276, 1, s4864, s8277, s8278, 1, s4863, s8279, s8280, 1, s4862, s8281, s8282, 1, s4861, s8283, s8284, 1, s4860, s8285, s8286, 1, s4859, s8287, s8288, 1, s4858, s8289, s8290, 1, s4857, s8291, s8292, 1, s4856, s8293, s8294, 1, s4855, s8295, s8296, 1, s4854, s8297, s8298, 1, s4853, s8299, s8300, 1, s4852, s8301, s8302, 1, s4851, s8303, s8304, 1, s4850, s8305, s8306, 1, s4849, s8307, s8308, 1, s4848, s8309, s8310, 1, s4847, s8311, s8312, 1, s4846, s8313, s8314, 1, s4845, s8315, s8316, 1, s4844, s8317, s8318, 1, s4843, s8319, s8320, 1, s4842, s8321, s8322, 1, s4841, s8323, s8324, 1, s4840, s8325, s8326, 1, s4839, s8327, s8328, 1, s4838, s8329, s8330, 1, s4837, s8331, s8332, 1, s4836, s8333, s8334, 1, s4835, s8335, s8336, 1, s4834, s8337, s8338, 1, s4833, s8339, s8340, 1, s4832, s8341, s8342, 1, s4831, s8343, s8344, 1, s4830, s8345, s8346, 1, s4829, s8347, s8348, 1, s4828, s8349, s8350, 1, s4827, s8351, s8352, 1, s4826, s8353, s8354, 1, s4825, s8355, s8356, 1, s4824, s8357, s8358, 1, s4823, s8359, s8360, 1, s4822, s8361, s8362, 1, s4821, s8363, s8364, 1, s4820, s8365, s8366, 1, s4819, s8367, s8368, 1, s4818, s8369, s8370, 1, s4817, s8371, s8372, 1, s4816, s8373, s8374, 1, s4815, s8375, s8376, 1, s4814, s8377, s8378, 1, s4813, s8379, s8380, 1, s4812, s8381, s8382, 1, s4811, s8383, s8384, 1, s4810, s8385, s8386, 1, s4809, s8387, s8388, 1, s4808, s8389, s8390, 1, s4807, s8391, s8392, 1, s4806, s8393, s8394, 1, s4805, s8395, s8396, 1, s4804, s8397, s8398, 1, s4803, s8399, s8400, 1, s4802, s8401, s8402, 1, s4801, s8403, s8404, 1, s4800, s8405, s8406, 1, s4799, s8407, s8408, 1, s4798, s8409, s8410, 1, s4797, s8411, s8412, 1, s4796, s8413, s8414, 1, s4795, s8415, s8416, 1, s4794, s8417, s8418, 1, s4793, s8419, s8420, 1, s4792, s8421, s8422, 1, s4791, s8423, s8424, 1, s4790, s8425, s8426, 1, s4789, s8427, s8428, 1, s4788, s8429, s8430, 1, s4787, s8431, s8432, 1, s4786, s8433, s8434, 1, s4785, s8435, s8436, 1, s4784, s8437, s8438, 1, s4783, s8439, s8440, 1, s4782, s8441, s8442, 1, s4781, s8443, s8444, 1, s4780, s8445, s8446, 1, s4779, s8447, s8448, 1, s4778, s8449, s8450, 1, s4777, s8451, s8452, 1, s4776, s8453, s8454, 1, s4775, s8455, s8456, 1, s4774, s8457, s8458, 1, s4773, s8459, s8460, 1, s4772, s8461, s8462, 1, s4771, s8463, s8464, 1, s4770, s8465, s8466, 1, s4769, s8467, s8468, 1, s4768, s8469, s8470, 1, s4767, s8471, s8472, 1, s4766, s8473, s8474, 1, s4765, s8475, s8476, 1, s4764, s8477, s8478, 1, s4763, s8479, s8480, 1, s4762, s8481, s8482, 1, s4761, s8483, s8484, 1, s4760, s8485, s8486, 1, s4759, s8487, s8488, 1, s4758, s8489, s8490, 1, s4757, s8491, s8492, 1, s4756, s8493, s8494, 1, s4755, s8495, s8496, 1, s4754, s8497, s8498, 1, s4753, s8499, s8500, 1, s4752, s8501, s8502, 1, s4751, s8503, s8504, 1, s4750, s8505, s8506, 1, s4749, s8507, s8508, 1, s4748, s8509, s8510, 1, s4747, s8511, s8512, 1, s4746, s8513, s8514, 1, s4745, s8515, s8516, 1, s4744, s8517, s8518, 1, s4743, s8519, s8520, 1, s4742, s8521, s8522, 1, s4741, s8523, s8524, 1, s4740, s8525, s8526, 1, s4739, s8527, s8528, 1, s4738, s8529, s8530, 1, s4737, s8531, s8532, 1, s4736, s8533, s8534, 1, s4735, s8535, s8536, 1, s4734, s8537, s8538, 1, s4733, s8539, s8540, 1, s4732, s8541, s8542, 1, s4731, s8543, s8544, 1, s4730, s8545, s8546, 1, s4729, s8547, s8548, 1, s4728, s8549, s8550, 1, s4727, s8551, s8552, 1, s4726, s8553, s8554, 1, s4725, s8555, s8556, 1, s4724, s8557, s8558, 1, s4723, s8559, s8560, 1, s4722, s8561, s8562, 1, s4721, s8563, s8564, 1, s4720, s8565, s8566, 1, s4719, s8567, s8568, 1, s4718, s8569, s8570, 1, s4717, s8571, s8572, 1, s4716, s8573, s8574, 1, s4715, s8575, s8576, 1, s4714, s8577, s8578, 1, s4713, s8579, s8580, 1, s4712, s8581, s8582, 1, s4711, s8583, s8584, 1, s4710, s8585, s8586, 1, s4709, s8587, s8588, 1, s4708, s8589, s8590, 1, s4707, s8591, s8592, 1, s4706, s8593, s8594, 1, s4705, s8595, s8596, 1, s4704, s8597, s8598, 1, s4703, s8599, s8600, 1, s4702, s8601, s8602, 1, s4701, s8603, s8604, 1, s4700, s8605, s8606, 1, s4699, s8607, s8608, 1, s4698, s8609, s8610, 1, s4697, s8611, s8612, 1, s4696, s8613, s8614, 1, s4695, s8615, s8616, 1, s4694, s8617, s8618, 1, s4693, s8619, s8620, 1, s4692, s8621, s8622, 1, s4691, s8623, s8624, 1, s4690, s8625, s8626, 1, s4689, s8627, s8628, 1, s4688, s8629, s8630, 1, s4687, s8631, s8632, 1, s4686, s8633, s8634, 1, s4685, s8635, s8636, 1, s4684, s8637, s8638, 1, s4683, s8639, s8640, 1, s4682, s8641, s8642, 1, s4681, s8643, s8644, 1, s4680, s8645, s8646, 1, s4679, s8647, s8648, 1, s4678, s8649, s8650, 1, s4677, s8651, s8652, 1, s4676, s8653, s8654, 1, s4675, s8655, s8656, 1, s4674, s8657, s8658, 1, s4673, s8659, s8660, 1, s4672, s8661, s8662, 1, s4671, s8663, s8664, 1, s4670, s8665, s8666, 1, s4669, s8667, s8668, 1, s4668, s8669, s8670, 1, s4667, s8671, s8672, 1, s4666, s8673, s8674, 1, s4665, s8675, s8676, 1, s4664, s8677, s8678, 1, s4663, s8679, s8680, 1, s4662, s8681, s8682, 1, s4661, s8683, s8684, 1, s4660, s8685, s8686, 1, s4659, s8687, s8688, 1, s4658, s8689, s8690, 1, s4657, s8691, s8692, 1, s4656, s8693, s8694, 1, s4655, s8695, s8696, 1, s4654, s8697, s8698, 1, s4653, s8699, s8700, 1, s4652, s8701, s8702, 1, s4651, s8703, s8704, 1, s4650, s8705, s8706, 1, s4649, s8707, s8708, 1, s4648, s8709, s8710, 1, s4647, s8711, s8712, 1, s4646, s8713, s8714, 1, s4645, s8715, s8716, 1, s4644, s8717, s8718, 1, s4643, s8719, s8720, 1, s4642, s8721, s8722, 1, s4641, s8723, s8724, 1, s4640, s8725, s8726, 1, s4639, s8727, s8728, 1, s4638, s8729, s8730, 1, s4637, s8731, s8732, 1, s4636, s8733, s8734, 1, s4635, s8735, s8736, 1, s4634, s8737, s8738, 1, s4633, s8739, s8740, 1, s4632, s8741, s8742, 1, s4631, s8743, s8744, 1, s4630, s8745, s8746, 1, s4629, s8747, s8748, 1, s4628, s8749, s8750, 1, s4627, s8751, s8752, 1, s4626, s8753, s8754, 1, s4625, s8755, s8756, 1, s4624, s8757, s8758, 1, s4623, s8759, s8760, 1, s4622, s8761, s8762, 1, s4621, s8763, s8764, 1, s4620, s8765, s8766, 1, s4619, s8767, s8768, 1, s4618, s8769, s8770, 1, s4617, s8771, s8772, 1, s4616, s8773, s8774, 1, s4615, s8775, s8776, 1, s4614, s8777, s8778, 1, s4613, s8779, s8780, 1, s4612, s8781, s8782, 1, s4611, s8783, s8784, 1, s4610, s8785, s8786, 1, s4609, s8787, s8788, 1, s4608, s8789, s8790, 1, s4607, s8791, s8792, 1, s4606, s8793, s8794, 1, s4605, s8795, s8796, 1, s4604, s8797, s8798, 1, s4603, s8799, s8800, 1, s4602, s8801, s8802, 1, s4601, s8803, s8804, 1, s4600, s8805, s8806, 1, s4599, s8807, s8808, 1, s4598, s8809, s8810, 1, s4597, s8811, s8812, 1, s4596, s8813, s8814, 1, s4595, s8815, s8816, 1, s4594, s8817, s8818, 1, s4593, s8819, s8820, 1, s4592, s8821, s8822, 1, s4591, s8823, s8824, 1, s4590, s8825, s8826, 1, s4589, s8827, s8828, 1, s4588, s8829, s8830, 1, s4587, s8831, s8832, 1, s4586, s8833, s8834, 1, s4585, s8835, s8836, 1, s4584, s8837, s8838, 1, s4583, s8839, s8840, 1, s4582, s8841, s8842, 1, s4581, s8843, s8844, 1, s4580, s8845, s8846, 1, s4579, s8847, s8848, 1, s4578, s8849, s8850, 1, s4577, s8851, s8852, 1, s4576, s8853, s8854, 1, s4575, s8855, s8856, 1, s4574, s8857, s8858, 1, s4573, s8859, s8860, 1, s4572, s8861, s8862, 1, s4571, s8863, s8864, 1, s4570, s8865, s8866, 1, s4569, s8867, s8868, 1, s4568, s8869, s8870, 1, s4567, s8871, s8872, 1, s4566, s8873, s8874, 1, s4565, s8875, s8876, 1, s4564, s8877, s8878, 1, s4563, s8879, s8880, 1, s4562, s8881, s8882, 1, s4561, s8883, s8884, 1, s4560, s8885, s8886, 1, s4559, s8887, s8888, 1, s4558, s8889, s8890, 1, s4557, s8891, s8892, 1, s4556, s8893, s8894, 1, s4555, s8895, s8896, 1, s4554, s8897, s8898, 1, s4553, s8899, s8900, 1, s4552, s8901, s8902, 1, s4551, s8903, s8904, 1, s4550, s8905, s8906, 1, s4549, s8907, s8908, 1, s4548, s8909, s8910, 1, s4547, s8911, s8912, 1, s4546, s8913, s8914, 1, s4545, s8915, s8916, 1, s4544, s8917, s8918, 1, s4543, s8919, s8920, 1, s4542, s8921, s8922, 1, s4541, s8923, s8924, 1, s4540, s8925, s8926, 1, s4539, s8927, s8928, 1, s4538, s8929, s8930, 1, s4537, s8931, s8932, 1, s4536, s8933, s8934, 1, s4535, s8935, s8936, 1, s4534, s8937, s8938, 1, s4533, s8939, s8940, 1, s4532, s8941, s8942, 1, s4531, s8943, s8944, 1, s4530, s8945, s8946, 1, s4529, s8947, s8948, 1, s4528, s8949, s8950, 1, s4527, s8951, s8952, 1, s4526, s8953, s8954, 1, s4525, s8955, s8956, 1, s4524, s8957, s8958, 1, s4523, s8959, s8960, 1, s4522, s8961, s8962, 1, s4521, s8963, s8964, 1, s4520, s8965, s8966, 1, s4519, s8967, s8968, 1, s4518, s8969, s8970, 1, s4517, s8971, s8972, 1, s4516, s8973, s8974, 1, s4515, s8975, s8976, 1, s4514, s8977, s8978, 1, s4513, s8979, s8980, 1, s4512, s8981, s8982, 1, s4511, s8983, s8984, 1, s4510, s8985, s8986, 1, s4509, s8987, s8988, 1, s4508, s8989, s8990, 1, s4507, s8991, s8992, 1, s4506, s8993, s8994, 1, s4505, s8995, s8996, 1, s4504, s8997, s8998, 1, s4503, s8999, s9000, 1, s4502, s9001, s9002, 1, s4501, s9003, s9004, 1, s4500, s9005, s9006, 1, s4499, s9007, s9008, 1, s4498, s9009, s9010, 1, s4497, s9011, s9012, 1, s4496, s9013, s9014, 1, s4495, s9015, s9016, 1, s4494, s9017, s9018, 1, s4493, s9019, s9020, 1, s4492, s9021, s9022, 1, s4491, s9023, s9024, 1, s4490, s9025, s9026, 1, s4489, s9027, s9028, 1, s4488, s9029, s9030, 1, s4487, s9031, s9032, 1, s4486, s9033, s9034, 1, s4485, s9035, s9036, 1, s4484, s9037, s9038, 1, s4483, s9039, s9040, 1, s4482, s9041, s9042, 1, s4481, s9043, s9044, 1, s4480, s9045, s9046, 1, s4479, s9047, s9048, 1, s4478, s9049, s9050, 1, s4477, s9051, s9052, 1, s4476, s9053, s9054, 1, s4475, s9055, s9056, 1, s4474, s9057, s9058, 1, s4473, s9059, s9060, 1, s4472, s9061, s9062, 1, s4471, s9063, s9064, 1, s4470, s9065, s9066, 1, s4469, s9067, s9068, 1, s4468, s9069, s9070, 1, s4467, s9071, s9072, 1, s4466, s9073, s9074, 1, s4465, s9075, s9076, 1, s4464, s9077, s9078, 1, s4463, s9079, s9080, 1, s4462, s9081, s9082, 1, s4461, s9083, s9084, 1, s4460, s9085, s9086, 1, s4459, s9087, s9088, 1, s4458, s9089, s9090, 1, s4457, s9091, s9092, 1, s4456, s9093, s9094, 1, s4455, s9095, s9096, 1, s4454, s9097, s9098, 1, s4453, s9099, s9100, 1, s4452, s9101, s9102, 1, s4451, s9103, s9104, 1, s4450, s9105, s9106, 1, s4449, s9107, s9108, 1, s4448, s9109, s9110, 1, s4447, s9111, s9112, 1, s4446, s9113, s9114, 1, s4445, s9115, s9116, 1, s4444, s9117, s9118, 1, s4443, s9119, s9120, 1, s4442, s9121, s9122, 1, s4441, s9123, s9124, 1, s4440, s9125, s9126, 1, s4439, s9127, s9128, 1, s4438, s9129, s9130, 1, s4437, s9131, s9132, 1, s4436, s9133, s9134, 1, s4435, s9135, s9136, 1, s4434, s9137, s9138, 1, s4433, s9139, s9140, 1, s4432, s9141, s9142, 1, s4431, s9143, s9144, 1, s4430, s9145, s9146, 1, s4429, s9147, s9148, 1, s4428, s9149, s9150, 1, s4427, s9151, s9152, 1, s4426, s9153, s9154, 1, s4425, s9155, s9156, 1, s4424, s9157, s9158, 1, s4423, s9159, s9160, 1, s4422, s9161, s9162, 1, s4421, s9163, s9164, 1, s4420, s9165, s9166, 1, s4419, s9167, s9168, 1, s4418, s9169, s9170, 1, s4417, s9171, s9172, 1, s4416, s9173, s9174, 1, s4415, s9175, s9176, 1, s4414, s9177, s9178, 1, s4413, s9179, s9180, 1, s4412, s9181, s9182, 1, s4411, s9183, s9184, 1, s4410, s9185, s9186, 1, s4409, s9187, s9188, 1, s4408, s9189, s9190, 1, s4407, s9191, s9192, 1, s4406, s9193, s9194, 1, s4405, s9195, s9196, 1, s4404, s9197, s9198, 1, s4403, s9199, s9200, 1, s4402, s9201, s9202, 1, s4401, s9203, s9204, 1, s4400, s9205, s9206, 1, s4399, s9207, s9208, 1, s4398, s9209, s9210, 1, s4397, s9211, s9212, 1, s4396, s9213, s9214, 1, s4395, s9215, s9216, 1, s4394, s9217, s9218, 1, s4393, s9219, s9220, 1, s4392, s9221, s9222, 1, s4391, s9223, s9224, 1, s4390, s9225, s9226, 1, s4389, s9227, s9228, 1, s4388, s9229, s9230, 1, s4387, s9231, s9232, 1, s4386, s9233, s9234, 1, s4385, s9235, s9236, 1, s4384, s9237, s9238, 1, s4383, s9239, s9240, 1, s4382, s9241, s9242, 1, s4381, s9243, s9244, 1, s4380, s9245, s9246, 1, s4379, s9247, s9248, 1, s4378, s9249, s9250, 1, s4377, s9251, s9252, 1, s4376, s9253, s9254, 1, s4375, s9255, s9256, 1, s4374, s9257, s9258, 1, s4373, s9259, s9260, 1, s4372, s9261, s9262, 1, s4371, s9263, s9264, 1, s4370, s9265, s9266, 1, s4369, s9267, s9268, 1, s4368, s9269, s9270, 1, s4367, s9271, s9272, 1, s4366, s9273, s9274, 1, s4365, s9275, s9276, 1, s4364, s9277, s9278, 1, s4363, s9279, s9280, 1, s4362, s9281, s9282, 1, s4361, s9283, s9284, 1, s4360, s9285, s9286, 1, s4359, s9287, s9288, 1, s4358, s9289, s9290, 1, s4357, s9291, s9292, 1, s4356, s9293, s9294, 1, s4355, s9295, s9296, 1, s4354, s9297, s9298, 1, s4353, s9299, s9300, 1, s4352, s9301, s9302, 1, s4351, s9303, s9304, 1, s4350, s9305, s9306, 1, s4349, s9307, s9308, 1, s4348, s9309, s9310, 1, s4347, s9311, s9312, 1, s4346, s9313, s9314, 1, s4345, s9315, s9316, 1, s4344, s9317, s9318, 1, s4343, s9319, s9320, 1, s4342, s9321, s9322, 1, s4341, s9323, s9324, 1, s4340, s9325, s9326, 1, s4339, s9327, s9328, 1, s4338, s9329, s9330, 1, s4337, s9331, s9332, 1, s4336, s9333, s9334, 1, s4335, s9335, s9336, 1, s4334, s9337, s9338, 1, s4333, s9339, s9340, 1, s4332, s9341, s9342, 1, s4331, s9343, s9344, 1, s4330, s9345, s9346, 1, s4329, s9347, s9348, 1, s4328, s9349, s9350, 1, s4327, s9351, s9352, 1, s4326, s9353, s9354, 1, s4325, s9355, s9356, 1, s4324, s9357, s9358, 1, s4323, s9359, s9360, 1, s4322, s9361, s9362, 1, s4321, s9363, s9364, 1, s4320, s9365, s9366, 1, s4319, s9367, s9368, 1, s4318, s9369, s9370, 1, s4317, s9371, s9372, 1, s4316, s9373, s9374, 1, s4315, s9375, s9376, 1, s4314, s9377, s9378, 1, s4313, s9379, s9380, 1, s4312, s9381, s9382, 1, s4311, s9383, s9384, 1, s4310, s9385, s9386, 1, s4309, s9387, s9388, 1, s4308, s9389, s9390, 1, s4307, s9391, s9392, 1, s4306, s9393, s9394, 1, s4305, s9395, s9396, 1, s4304, s9397, s9398, 1, s4303, s9399, s9400, 1, s4302, s9401, s9402, 1, s4301, s9403, s9404, 1, s4300, s9405, s9406, 1, s4299, s9407, s9408, 1, s4298, s9409, s9410, 1, s4297, s9411, s9412, 1, s4296, s9413, s9414, 1, s4295, s9415, s9416, 1, s4294, s9417, s9418, 1, s4293, s9419, s9420, 1, s4292, s9421, s9422, 1, s4291, s9423, s9424, 1, s4290, s9425, s9426, 1, s4289, s9427, s9428, 1, s4288, s9429, s9430, 1, s4287, s9431, s9432, 1, s4286, s9433, s9434, 1, s4285, s9435, s9436, 1, s4284, s9437, s9438, 1, s4283, s9439, s9440, 1, s4282, s9441, s9442, 1, s4281, s9443, s9444, 1, s4280, s9445, s9446, 1, s4279, s9447, s9448, 1, s4278, s9449, s9450, 1, s4277, s9451, s9452, 1, s4276, s9453, s9454, 1, s4275, s9455, s9456, 1, s4274, s9457, s9458, 1, s4273, s9459, s9460, 1, s4272, s9461, s9462, 1, s4271, s9463, s9464, 1, s4270, s9465, s9466, 1, s4269, s9467, s9468, 1, s4268, s9469, s9470, 1, s4267, s9471, s9472, 1, s4266, s9473, s9474, 1, s4265, s9475, s9476, 1, s4264, s9477, s9478, 1, s4263, s9479, s9480, 1, s4262, s9481, s9482, 1, s4261, s9483, s9484, 1, s4260, s9485, s9486, 1, s4259, s9487, s9488, 1, s4258, s9489, s9490, 1, s4257, s9491, s9492, 1, s4256, s9493, s9494, 1, s4255, s9495, s9496, 1, s4254, s9497, s9498, 1, s4253, s9499, s9500, 1, s4252, s9501, s9502, 1, s4251, s9503, s9504, 1, s4250, s9505, s9506, 1, s4249, s9507, s9508, 1, s4248, s9509, s9510, 1, s4247, s9511, s9512, 1, s4246, s9513, s9514, 1, s4245, s9515, s9516, 1, s4244, s9517, s9518, 1, s4243, s9519, s9520, 1, s4242, s9521, s9522, 1, s4241, s9523, s9524, 1, s4240, s9525, s9526, 1, s4239, s9527, s9528, 1, s4238, s9529, s9530, 1, s4237, s9531, s9532, 1, s4236, s9533, s9534, 1, s4235, s9535, s9536, 1, s4234, s9537, s9538, 1, s4233, s9539, s9540, 1, s4232, s9541, s9542, 1, s4231, s9543, s9544, 1, s4230, s9545, s9546, 1, s4229, s9547, s9548, 1, s4228, s9549, s9550, 1, s4227, s9551, s9552, 1, s4226, s9553, s9554, 1, s4225, s9555, s9556, 1, s4224, s9557, s9558, 1, s4223, s9559, s9560, 1, s4222, s9561, s9562, 1, s4221, s9563, s9564, 1, s4220, s9565, s9566, 1, s4219, s9567, s9568, 1, s4218, s9569, s9570, 1, s4217, s9571, s9572, 1, s4216, s9573, s9574, 1, s4215, s9575, s9576, 1, s4214, s9577, s9578, 1, s4213, s9579, s9580, 1, s4212, s9581, s9582, 1, s4211, s9583, s9584, 1, s4210, s9585, s9586, 1, s4209, s9587, s9588, 1, s4208, s9589, s9590, 1, s4207, s9591, s9592, 1, s4206, s9593, s9594, 1, s4205, s9595, s9596, 1, s4204, s9597, s9598, 1, s4203, s9599, s9600, 1, s4202, s9601, s9602, 1, s4201, s9603, s9604, 1, s4200, s9605, s9606, 1, s4199, s9607, s9608, 1, s4198, s9609, s9610, 1, s4197, s9611, s9612, 1, s4196, s9613, s9614, 1, s4195, s9615, s9616, 1, s4194, s9617, s9618, 1, s4193, s9619, s9620, 1, s4192, s9621, s9622, 1, s4191, s9623, s9624, 1, s4190, s9625, s9626, 1, s4189, s9627, s9628, 1, s4188, s9629, s9630, 1, s4187, s9631, s9632, 1, s4186, s9633, s9634, 1, s4185, s9635, s9636, 1, s4184, s9637, s9638, 1, s4183, s9639, s9640, 1, s4182, s9641, s9642, 1, s4181, s9643, s9644, 1, s4180, s9645, s9646, 1, s4179, s9647, s9648, 1, s4178, s9649, s9650, 1, s4177, s9651, s9652, 1, s4176, s9653, s9654, 1, s4175, s9655, s9656, 1, s4174, s9657, s9658, 1, s4173, s9659, s9660, 1, s4172, s9661, s9662, 1, s4171, s9663, s9664, 1, s4170, s9665, s9666, 1, s4169, s9667, s9668, 1, s4168, s9669, s9670, 1, s4167, s9671, s9672, 1, s4166, s9673, s9674, 1, s4165, s9675, s9676, 1, s4164, s9677, s9678, 1, s4163, s9679, s9680, 1, s4162, s9681, s9682, 1, s4161, s9683, s9684, 1, s4160, s9685, s9686, 1, s4159, s9687, s9688, 1, s4158, s9689, s9690, 1, s4157, s9691, s9692, 1, s4156, s9693, s9694, 1, s4155, s9695, s9696, 1, s4154, s9697, s9698, 1, s4153, s9699, s9700, 1, s4152, s9701, s9702, 1, s4151, s9703, s9704, 1, s4150, s9705, s9706, 1, s4149, s9707, s9708, 1, s4148, s9709, s9710, 1, s4147, s9711, s9712, 1, s4146, s9713, s9714, 1, s4145, s9715, s9716, 1, s4144, s9717, s9718, 1, s4143, s9719, s9720, 1, s4142, s9721, s9722, 1, s4141, s9723, s9724, 1, s4140, s9725, s9726, 1, s4139, s9727, s9728, 1, s4138, s9729, s9730, 1, s4137, s9731, s9732, 1, s4136, s9733, s9734, 1, s4135, s9735, s9736, 1, s4134, s9737, s9738, 1, s4133, s9739, s9740, 1, s4132, s9741, s9742, 1, s4131, s9743, s9744, 1, s4130, s9745, s9746, 1, s4129, s9747, s9748, 1, s4128, s9749, s9750, 1, s4127, s9751, s9752, 1, s4126, s9753, s9754, 1, s4125, s9755, s9756, 1, s4124, s9757, s9758, 1, s4123, s9759, s9760, 1, s4122, s9761, s9762, 1, s4121, s9763, s9764, 1, s4120, s9765, s9766, 1, s4119, s9767, s9768, 1, s4118, s9769, s9770, 1, s4117, s9771, s9772, 1, s4116, s9773, s9774, 1, s4115, s9775, s9776, 1, s4114, s9777, s9778, 1, s4113, s9779, s9780, 1, s4112, s9781, s9782, 1, s4111, s9783, s9784, 1, s4110, s9785, s9786, 1, s4109, s9787, s9788, 1, s4108, s9789, s9790, 1, s4107, s9791, s9792, 1, s4106, s9793, s9794, 1, s4105, s9795, s9796, 1, s4104, s9797, s9798, 1, s4103, s9799, s9800, 1, s4102, s9801, s9802, 1, s4101, s9803, s9804, 1, s4100, s9805, s9806, 1, s4099, s9807, s9808, 1, s4098, s9809, s9810, 1, s4097, s9811, s9812, 1, s4096, s9813, s9814, 1, s4095, s9815, s9816, 1, s4094, s9817, s9818, 1, s4093, s9819, s9820, 1, s4092, s9821, s9822, 1, s4091, s9823, s9824, 1, s4090, s9825, s9826, 1, s4089, s9827, s9828, 1, s4088, s9829, s9830, 1, s4087, s9831, s9832, 1, s4086, s9833, s9834, 1, s4085, s9835, s9836, 1, s4084, s9837, s9838, 1, s4083, s9839, s9840, 1, s4082, s9841, s9842, 1, s4081, s9843, s9844, 1, s4080, s9845, s9846, 1, s4079, s9847, s9848, 1, s4078, s9849, s9850, 1, s4077, s9851, s9852, 1, s4076, s9853, s9854, 1, s4075, s9855, s9856, 1, s4074, s9857, s9858, 1, s4073, s9859, s9860, 1, s4072, s9861, s9862, 1, s4071, s9863, s9864, 1, s4070, s9865, s9866, 1, s4069, s9867, s9868, 1, s4068, s9869, s9870, 1, s4067, s9871, s9872, 1, s4066, s9873, s9874, 1, s4065, s9875, s9876, 1, s4064, s9877, s9878, 1, s4063, s9879, s9880, 1, s4062, s9881, s9882, 1, s4061, s9883, s9884, 1, s4060, s9885, s9886, 1, s4059, s9887, s9888, 1, s4058, s9889, s9890, 1, s4057, s9891, s9892, 1, s4056, s9893, s9894, 1, s4055, s9895, s9896, 1, s4054, s9897, s9898, 1, s4053, s9899, s9900, 1, s4052, s9901, s9902, 1, s4051, s9903, s9904, 1, s4050, s9905, s9906, 1, s4049, s9907, s9908, 1, s4048, s9909, s9910, 1, s4047, s9911, s9912, 1, s4046, s9913, s9914, 1, s4045, s9915, s9916, 1, s4044, s9917, s9918, 1, s4043, s9919, s9920, 1, s4042, s9921, s9922, 1, s4041, s9923, s9924, 1, s4040, s9925, s9926, 1, s4039, s9927, s9928, 1, s4038, s9929, s9930, 1, s4037, s9931, s9932, 1, s4036, s9933, s9934, 1, s4035, s9935, s9936, 1, s4034, s9937, s9938, 1, s4033, s9939, s9940, 1, s4032, s9941, s9942, 1, s4031, s9943, s9944, 1, s4030, s9945, s9946, 1, s4029, s9947, s9948, 1, s4028, s9949, s9950, 1, s4027, s9951, s9952, 1, s4026, s9953, s9954, 1, s4025, s9955, s9956, 1, s4024, s9957, s9958, 1, s4023, s9959, s9960, 1, s4022, s9961, s9962, 1, s4021, s9963, s9964, 1, s4020, s9965, s9966, 1, s4019, s9967, s9968, 1, s4018, s9969, s9970, 1, s4017, s9971, s9972, 1, s4016, s9973, s9974, 1, s4015, s9975, s9976, 1, s4014, s9977, s9978, 1, s4013, s9979, s9980, 1, s4012, s9981, s9982, 1, s4011, s9983, s9984, 1, s4010, s9985, s9986, 1, s4009, s9987, s9988, 1, s4008, s9989, s9990, 1, s4007, s9991, s9992, 1, s4006, s9993, s9994, 1, s4005, s9995, s9996, 1, s4004, s9997, s9998, 1, s4003, s9999, s10000, 1, s4002, s10001, s10002, 1, s4001, s10003, s10004, 1, s4000, s10005, s10006, 1, s3999, s10007, s10008, 1, s3998, s10009, s10010, 1, s3997, s10011, s10012, 1, s3996, s10013, s10014, 1, s3995, s10015, s10016, 1, s3994, s10017, s10018, 1, s3993, s10019, s10020, 1, s3992, s10021, s10022, 1, s3991, s10023, s10024, 1, s3990, s10025, s10026, 1, s3989, s10027, s10028, 1, s3988, s10029, s10030, 1, s3987, s10031, s10032, 1, s3986, s10033, s10034, 1, s3985, s10035, s10036, 1, s3984, s10037, s10038, 1, s3983, s10039, s10040, 1, s3982, s10041, s10042, 1, s3981, s10043, s10044, 1, s3980, s10045, s10046, 1, s3979, s10047, s10048, 1, s3978, s10049, s10050, 1, s3977, s10051, s10052, 1, s3976, s10053, s10054, 1, s3975, s10055, s10056, 1, s3974, s10057, s10058, 1, s3973, s10059, s10060, 1, s3972, s10061, s10062, 1, s3971, s10063, s10064, 1, s3970, s10065, s10066, 1, s3969, s10067, s10068, 1, s3968, s10069, s10070, 1, s3967, s10071, s10072, 1, s3966, s10073, s10074, 1, s3965, s10075, s10076, 1, s3964, s10077, s10078, 1, s3963, s10079, s10080, 1, s3962, s10081, s10082, 1, s3961, s10083, s10084, 1, s3960, s10085, s10086, 1, s3959, s10087, s10088, 1, s3958, s10089, s10090, 1, s3957, s10091, s10092, 1, s3956, s10093, s10094, 1, s3955, s10095, s10096, 1, s3954, s10097, s10098, 1, s3953, s10099, s10100, 1, s3952, s10101, s10102, 1, s3951, s10103, s10104, 1, s3950, s10105, s10106, 1, s3949, s10107, s10108, 1, s3948, s10109, s10110, 1, s3947, s10111, s10112, 1, s3946, s10113, s10114, 1, s3945, s10115, s10116, 1, s3944, s10117, s10118, 1, s3943, s10119, s10120, 1, s3942, s10121, s10122, 1, s3941, s10123, s10124, 1, s3940, s10125, s10126, 1, s3939, s10127, s10128, 1, s3938, s10129, s10130, 1, s3937, s10131, s10132, 1, s3936, s10133, s10134, 1, s3935, s10135, s10136, 1, s3934, s10137, s10138, 1, s3933, s10139, s10140, 1, s3932, s10141, s10142, 1, s3931, s10143, s10144, 1, s3930, s10145, s10146, 1, s3929, s10147, s10148, 1, s3928, s10149, s10150, 1, s3927, s10151, s10152, 1, s3926, s10153, s10154, 1, s3925, s10155, s10156, 1, s3924, s10157, s10158, 1, s3923, s10159, s10160, 1, s3922, s10161, s10162, 1, s3921, s10163, s10164, 1, s3920, s10165, s10166, 1, s3919, s10167, s10168, 1, s3918, s10169, s10170, 1, s3917, s10171, s10172, 1, s3916, s10173, s10174, 1, s3915, s10175, s10176, 1, s3914, s10177, s10178, 1, s3913, s10179, s10180, 1, s3912, s10181, s10182, 1, s3911, s10183, s10184, 1, s3910, s10185, s10186, 1, s3909, s10187, s10188, 1, s3908, s10189, s10190, 1, s3907, s10191, s10192, 1, s3906, s10193, s10194, 1, s3905, s10195, s10196, 1, s3904, s10197, s10198, 1, s3903, s10199, s10200, 1, s3902, s10201, s10202, 1, s3901, s10203, s10204, 1, s3900, s10205, s10206, 1, s3899, s10207, s10208, 1, s3898, s10209, s10210, 1, s3897, s10211, s10212, 1, s3896, s10213, s10214, 1, s3895, s10215, s10216, 1, s3894, s10217, s10218, 1, s3893, s10219, s10220, 1, s3892, s10221, s10222, 1, s3891, s10223, s10224, 1, s3890, s10225, s10226, 1, s3889, s10227, s10228, 1, s3888, s10229, s10230, 1, s3887, s10231, s10232, 1, s3886, s10233, s10234, 1, s3885, s10235, s10236, 1, s3884, s10237, s10238, 1, s3883, s10239, s10240, 1, s3882, s10241, s10242, 1, s3881, s10243, s10244, 1, s3880, s10245, s10246, 1, s3879, s10247, s10248, 1, s3878, s10249, s10250, 1, s3877, s10251, s10252, 1, s3876, s10253, s10254, 1, s3875, s10255, s10256, 1, s3874, s10257, s10258, 1, s3873, s10259, s10260, 1, s3872, s10261, s10262, 1, s3871, s10263, s10264, 1, s3870, s10265, s10266, 1, s3869, s10267, s10268, 1, s3868, s10269, s10270, 1, s3867, s10271, s10272, 1, s3866, s10273, s10274, 1, s3865, s10275, s10276, 1, s3864, s10277, s10278, 1, s3863, s10279, s10280, 1, s3862, s10281, s10282, 1, s3861, s10283, s10284, 1, s3860, s10285, s10286, 1, s3859, s10287, s10288, 1, s3858, s10289, s10290, 1, s3857, s10291, s10292, 1, s3856, s10293, s10294, 1, s3855, s10295, s10296, 1, s3854, s10297, s10298, 1, s3853, s10299, s10300, 1, s3852, s10301, s10302, 1, s3851, s10303, s10304, 1, s3850, s10305, s10306, 1, s3849, s10307, s10308, 1, s3848, s10309, s10310, 1, s3847, s10311, s10312, 1, s3846, s10313, s10314, 1, s3845, s10315, s10316, 1, s3844, s10317, s10318, 1, s3843, s10319, s10320, 1, s3842, s10321, s10322, 1, s3841, s10323, s10324, 1, s3840, s10325, s10326, 1, s3839, s10327, s10328, 1, s3838, s10329, s10330, 1, s3837, s10331, s10332, 1, s3836, s10333, s10334, 1, s3835, s10335, s10336, 1, s3834, s10337, s10338, 1, s3833, s10339, s10340, 1, s3832, s10341, s10342, 1, s3831, s10343, s10344, 1, s3830, s10345, s10346, 1, s3829, s10347, s10348, 1, s3828, s10349, s10350, 1, s3827, s10351, s10352, 1, s3826, s10353, s10354, 1, s3825, s10355, s10356, 1, s3824, s10357, s10358, 1, s3823, s10359, s10360, 1, s3822, s10361, s10362, 1, s3821, s10363, s10364, 1, s3820, s10365, s10366, 1, s3819, s10367, s10368, 1, s3818, s10369, s10370, 1, s3817, s10371, s10372, 1, s3816, s10373, s10374, 1, s3815, s10375, s10376, 1, s3814, s10377, s10378, 1, s3813, s10379, s10380, 1, s3812, s10381, s10382, 1, s3811, s10383, s10384, 1, s3810, s10385, s10386, 1, s3809, s10387, s10388, 1, s3808, s10389, s10390, 1, s3807, s10391, s10392, 1, s3806, s10393, s10394, 1, s3805, s10395, s10396, 1, s3804, s10397, s10398, 1, s3803, s10399, s10400, 1, s3802, s10401, s10402, 1, s3801, s10403, s10404, 1, s3800, s10405, s10406, 1, s3799, s10407, s10408, 1, s3798, s10409, s10410, 1, s3797, s10411, s10412, 1, s3796, s10413, s10414, 1, s3795, s10415, s10416, 1, s3794, s10417, s10418, 1, s3793, s10419, s10420, 1, s3792, s10421, s10422, 1, s3791, s10423, s10424, 1, s3790, s10425, s10426, 1, s3789, s10427, s10428, 1, s3788, s10429, s10430, 1, s3787, s10431, s10432, 1, s3786, s10433, s10434, 1, s3785, s10435, s10436, 1, s3784, s10437, s10438, 1, s3783, s10439, s10440, 1, s3782, s10441, s10442, 1, s3781, s10443, s10444, 1, s3780, s10445, s10446, 1, s3779, s10447, s10448, 1, s3778, s10449, s10450, 1, s3777, s10451, s10452, 1, s3776, s10453, s10454, 1, s3775, s10455, s10456, 1, s3774, s10457, s10458, 1, s3773, s10459, s10460, 1, s3772, s10461, s10462, 1, s3771, s10463, s10464, 1, s3770, s10465, s10466, 1, s3769, s10467, s10468, 1, s3768, s10469, s10470, 1, s3767, s10471, s10472, 1, s3766, s10473, s10474, 1, s3765, s10475, s10476, 1, s3764, s10477, s10478, 1, s3763, s10479, s10480, 1, s3762, s10481, s10482, 1, s3761, s10483, s10484, 1, s3760, s10485, s10486, 1, s3759, s10487, s10488, 1, s3758, s10489, s10490, 1, s3757, s10491, s10492, 1, s3756, s10493, s10494, 1, s3755, s10495, s10496, 1, s3754, s10497, s10498, 1, s3753, s10499, s10500, 1, s3752, s10501, s10502, 1, s3751, s10503, s10504, 1, s3750, s10505, s10506, 1, s3749, s10507, s10508, 1, s3748, s10509, s10510, 1, s3747, s10511, s10512, 1, s3746, s10513, s10514, 1, s3745, s10515, s10516, 1, s3744, s10517, s10518, 1, s3743, s10519, s10520, 1, s3742, s10521, s10522, 1, s3741, s10523, s10524, 1, s3740, s10525, s10526, 1, s3739, s10527, s10528, 1, s3738, s10529, s10530, 1, s3737, s10531, s10532, 1, s3736, s10533, s10534, 1, s3735, s10535, s10536, 1, s3734, s10537, s10538, 1, s3733, s10539, s10540, 1, s3732, s10541, s10542, 1, s3731, s10543, s10544, 1, s3730, s10545, s10546, 1, s3729, s10547, s10548, 1, s3728, s10549, s10550, 1, s3727, s10551, s10552, 1, s3726, s10553, s10554, 1, s3725, s10555, s10556, 1, s3724, s10557, s10558, 1, s3723, s10559, s10560, 1, s3722, s10561, s10562, 1, s3721, s10563, s10564, 1, s3720, s10565, s10566, 1, s3719, s10567, s10568, 1, s3718, s10569, s10570, 1, s3717, s10571, s10572, 1, s3716, s10573, s10574, 1, s3715, s10575, s10576, 1, s3714, s10577, s10578, 1, s3713, s10579, s10580, 1, s3712, s10581, s10582, 1, s3711, s10583, s10584, 1, s3710, s10585, s10586, 1, s3709, s10587, s10588, 1, s3708, s10589, s10590, 1, s3707, s10591, s10592, 1, s3706, s10593, s10594, 1, s3705, s10595, s10596, 1, s3704, s10597, s10598, 1, s3703, s10599, s10600, 1, s3702, s10601, s10602, 1, s3701, s10603, s10604, 1, s3700, s10605, s10606, 1, s3699, s10607, s10608, 1, s3698, s10609, s10610, 1, s3697, s10611, s10612, 1, s3696, s10613, s10614, 1, s3695, s10615, s10616, 1, s3694, s10617, s10618, 1, s3693, s10619, s10620, 1, s3692, s10621, s10622, 1, s3691, s10623, s10624, 1, s3690, s10625, s10626, 1, s3689, s10627, s10628, 1, s3688, s10629, s10630, 1, s3687, s10631, s10632, 1, s3686, s10633, s10634, 1, s3685, s10635, s10636, 1, s3684, s10637, s10638, 1, s3683, s10639, s10640, 1, s3682, s10641, s10642, 1, s3681, s10643, s10644, 1, s3680, s10645, s10646, 1, s3679, s10647, s10648, 1, s3678, s10649, s10650, 1, s3677, s10651, s10652, 1, s3676, s10653, s10654, 1, s3675, s10655, s10656, 1, s3674, s10657, s10658, 1, s3673, s10659, s10660, 1, s3672, s10661, s10662, 1, s3671, s10663, s10664, 1, s3670, s10665, s10666, 1, s3669, s10667, s10668, 1, s3668, s10669, s10670, 1, s3667, s10671, s10672, 1, s3666, s10673, s10674, 1, s3665, s10675, s10676, 1, s3664, s10677, s10678, 1, s3663, s10679, s10680, 1, s3662, s10681, s10682, 1, s3661, s10683, s10684, 1, s3660, s10685, s10686, 1, s3659, s10687, s10688, 1, s3658, s10689, s10690, 1, s3657, s10691, s10692, 1, s3656, s10693, s10694, 1, s3655, s10695, s10696, 1, s3654, s10697, s10698, 1, s3653, s10699, s10700, 1, s3652, s10701, s10702, 1, s3651, s10703, s10704, 1, s3650, s10705, s10706, 1, s3649, s10707, s10708, 1, s3648, s10709, s10710, 1, s3647, s10711, s10712, 1, s3646, s10713, s10714, 1, s3645, s10715, s10716, 1, s3644, s10717, s10718, 1, s3643, s10719, s10720, 1, s3642, s10721, s10722, 1, s3641, s10723, s10724, 1, s3640, s10725, s10726, 1, s3639, s10727, s10728, 1, s3638, s10729, s10730, 1, s3637, s10731, s10732, 1, s3636, s10733, s10734, 1, s3635, s10735, s10736, 1, s3634, s10737, s10738, 1, s3633, s10739, s10740, 1, s3632, s10741, s10742, 1, s3631, s10743, s10744, 1, s3630, s10745, s10746, 1, s3629, s10747, s10748, 1, s3628, s10749, s10750, 1, s3627, s10751, s10752, 1, s3626, s10753, s10754, 1, s3625, s10755, s10756, 1, s3624, s10757, s10758, 1, s3623, s10759, s10760, 1, s3622, s10761, s10762, 1, s3621, s10763, s10764, 1, s3620, s10765, s10766, 1, s3619, s10767, s10768, 1, s3618, s10769, s10770, 1, s3617, s10771, s10772, 1, s3616, s10773, s10774, 1, s3615, s10775, s10776, 1, s3614, s10777, s10778, 1, s3613, s10779, s10780, 1, s3612, s10781, s10782, 1, s3611, s10783, s10784, 1, s3610, s10785, s10786, 1, s3609, s10787, s10788, 1, s3608, s10789, s10790, 1, s3607, s10791, s10792, 1, s3606, s10793, s10794, 1, s3605, s10795, s10796, 1, s3604, s10797, s10798, 1, s3603, s10799, s10800, 1, s3602, s10801, s10802, 1, s3601, s10803, s10804, 1, s3600, s10805, s10806, 1, s3599, s10807, s10808, 1, s3598, s10809, s10810, 1, s3597, s10811, s10812, 1, s3596, s10813, s10814, 1, s3595, s10815, s10816, 1, s3594, s10817, s10818, 1, s3593, s10819, s10820, 1, s3592, s10821, s10822, 1, s3591, s10823, s10824, 1, s3590, s10825, s10826, 1, s3589, s10827, s10828, 1, s3588, s10829, s10830, 1, s3587, s10831, s10832, 1, s3586, s10833, s10834, 1, s3585, s10835, s10836, 1, s3584, s10837, s10838, 1, s3583, s10839, s10840, 1, s3582, s10841, s10842, 1, s3581, s10843, s10844, 1, s3580, s10845, s10846, 1, s3579, s10847, s10848, 1, s3578, s10849, s10850, 1, s3577, s10851, s10852, 1, s3576, s10853, s10854, 1, s3575, s10855, s10856, 1, s3574, s10857, s10858, 1, s3573, s10859, s10860, 1, s3572, s10861, s10862, 1, s3571, s10863, s10864, 1, s3570, s10865, s10866, 1, s3569, s10867, s10868, 1, s3568, s10869, s10870, 1, s3567, s10871, s10872, 1, s3566, s10873, s10874, 1, s3565, s10875, s10876, 1, s3564, s10877, s10878, 1, s3563, s10879, s10880, 1, s3562, s10881, s10882, 1, s3561, s10883, s10884, 1, s3560, s10885, s10886, 1, s3559, s10887, s10888, 1, s3558, s10889, s10890, 1, s3557, s10891, s10892, 1, s3556, s10893, s10894, 1, s3555, s10895, s10896, 1, s3554, s10897, s10898, 1, s3553, s10899, s10900, 1, s3552, s10901, s10902, 1, s3551, s10903, s10904, 1, s3550, s10905, s10906, 1, s3549, s10907, s10908, 1, s3548, s10909, s10910, 1, s3547, s10911, s10912, 1, s3546, s10913, s10914, 1, s3545, s10915, s10916, 1, s3544, s10917, s10918, 1, s3543, s10919, s10920, 1, s3542, s10921, s10922, 1, s3541, s10923, s10924, 1, s3540, s10925, s10926, 1, s3539, s10927, s10928, 1, s3538, s10929, s10930, 1, s3537, s10931, s10932, 1, s3536, s10933, s10934, 1, s3535, s10935, s10936, 1, s3534, s10937, s10938, 1, s3533, s10939, s10940, 1, s3532, s10941, s10942, 1, s3531, s10943, s10944, 1, s3530, s10945, s10946, 1, s3529, s10947, s10948, 1, s3528, s10949, s10950, 1, s3527, s10951, s10952, 1, s3526, s10953, s10954, 1, s3525, s10955, s10956, 1, s3524, s10957, s10958, 1, s3523, s10959, s10960, 1, s3522, s10961, s10962, 1, s3521, s10963, s10964, 1, s3520, s10965, s10966, 1, s3519, s10967, s10968, 1, s3518, s10969, s10970, 1, s3517, s10971, s10972, 1, s3516, s10973, s10974, 1, s3515, s10975, s10976, 1, s3514, s10977, s10978, 1, s3513, s10979, s10980, 1, s3512, s10981, s10982, 1, s3511, s10983, s10984, 1, s3510, s10985, s10986, 1, s3509, s10987, s10988, 1, s3508, s10989, s10990, 1, s3507, s10991, s10992, 1, s3506, s10993, s10994, 1, s3505, s10995, s10996, 1, s3504, s10997, s10998, 1, s3503, s10999, s11000, 1, s3502, s11001, s11002, 1, s3501, s11003, s11004, 1, s3500, s11005, s11006, 1, s3499, s11007, s11008, 1, s3498, s11009, s11010, 1, s3497, s11011, s11012, 1, s3496, s11013, s11014, 1, s3495, s11015, s11016, 1, s3494, s11017, s11018, 1, s3493, s11019, s11020, 1, s3492, s11021, s11022, 1, s3491, s11023, s11024, 1, s3490, s11025, s11026, 1, s3489, s11027, s11028, 1, s3488, s11029, s11030, 1, s3487, s11031, s11032, 1, s3486, s11033, s11034, 1, s3485, s11035, s11036, 1, s3484, s11037, s11038, 1, s3483, s11039, s11040, 1, s3482, s11041, s11042, 1, s3481, s11043, s11044, 1, s3480, s11045, s11046, 1, s3479, s11047, s11048, 1, s3478, s11049, s11050, 1, s3477, s11051, s11052, 1, s3476, s11053, s11054, 1, s3475, s11055, s11056, 1, s3474, s11057, s11058, 1, s3473, s11059, s11060, 1, s3472, s11061, s11062, 1, s3471, s11063, s11064, 1, s3470, s11065, s11066, 1, s3469, s11067, s11068, 1, s3468, s11069, s11070, 1, s3467, s11071, s11072, 1, s3466, s11073, s11074, 1, s3465, s11075, s11076, 1, s3464, s11077, s11078, 1, s3463, s11079, s11080, 1, s3462, s11081, s11082, 1, s3461, s11083, s11084, 1, s3460, s11085, s11086, 1, s3459, s11087, s11088, 1, s3458, s11089, s11090, 1, s3457, s11091, s11092, 1, s3456, s11093, s11094, 1, s3455, s11095, s11096, 1, s3454, s11097, s11098, 1, s3453, s11099, s11100, 1, s3452, s11101, s11102, 1, s3451, s11103, s11104, 1, s3450, s11105, s11106, 1, s3449, s11107, s11108, 1, s3448, s11109, s11110, 1, s3447, s11111, s11112, 1, s3446, s11113, s11114, 1, s3445, s11115, s11116, 1, s3444, s11117, s11118, 1, s3443, s11119, s11120, 1, s3442, s11121, s11122, 1, s3441, s11123, s11124, 1, s3440, s11125, s11126, 1, s3439, s11127, s11128, 1, s3438, s11129, s11130, 1, s3437, s11131, s11132, 1, s3436, s11133, s11134, 1, s3435, s11135, s11136, 1, s3434, s11137, s11138, 1, s3433, s11139, s11140, 1, s3432, s11141, s11142, 1, s3431, s11143, s11144, 1, s3430, s11145, s11146, 1, s3429, s11147, s11148, 1, s3428, s11149, s11150, 1, s3427, s11151, s11152, 1, s3426, s11153, s11154, 1, s3425, s11155, s11156, 1, s3424, s11157, s11158, 1, s3423, s11159, s11160, 1, s3422, s11161, s11162, 1, s3421, s11163, s11164, 1, s3420, s11165, s11166, 1, s3419, s11167, s11168, 1, s3418, s11169, s11170, 1, s3417, s11171, s11172, 1, s3416, s11173, s11174, 1, s3415, s11175, s11176, 1, s3414, s11177, s11178, 1, s3413, s11179, s11180, 1, s3412, s11181, s11182, 1, s3411, s11183, s11184, 1, s3410, s11185, s11186, 1, s3409, s11187, s11188, 1, s3408, s11189, s11190, 1, s3407, s11191, s11192, 1, s3406, s11193, s11194, 1, s3405, s11195, s11196, 1, s3404, s11197, s11198, 1, s3403, s11199, s11200, 1, s3402, s11201, s11202, 1, s3401, s11203, s11204, 1, s3400, s11205, s11206, 1, s3399, s11207, s11208, 1, s3398, s11209, s11210, 1, s3397, s11211, s11212, 1, s3396, s11213, s11214, 1, s3395, s11215, s11216, 1, s3394, s11217, s11218, 1, s3393, s11219, s11220, 1, s3392, s11221, s11222, 1, s3391, s11223, s11224, 1, s3390, s11225, s11226, 1, s3389, s11227, s11228, 1, s3388, s11229, s11230, 1, s3387, s11231, s11232, 1, s3386, s11233, s11234, 1, s3385, s11235, s11236, 1, s3384, s11237, s11238, 1, s3383, s11239, s11240, 1, s3382, s11241, s11242, 1, s3381, s11243, s11244, 1, s3380, s11245, s11246, 1, s3379, s11247, s11248, 1, s3378, s11249, s11250, 1, s3377, s11251, s11252, 1, s3376, s11253, s11254, 1, s3375, s11255, s11256, 1, s3374, s11257, s11258, 1, s3373, s11259, s11260, 1, s3372, s11261, s11262, 1, s3371, s11263, s11264, 1, s3370, s11265, s11266, 1, s3369, s11267, s11268, 1, s3368, s11269, s11270, 1, s3367, s11271, s11272, 1, s3366, s11273, s11274, 1, s3365, s11275, s11276, 1, s3364, s11277, s11278, 1, s3363, s11279, s11280, 1, s3362, s11281, s11282, 1, s3361, s11283, s11284, 1, s3360, s11285, s11286, 1, s3359, s11287, s11288, 1, s3358, s11289, s11290, 1, s3357, s11291, s11292, 1, s3356, s11293, s11294, 1, s3355, s11295, s11296, 1, s3354, s11297, s11298, 1, s3353, s11299, s11300, 1, s3352, s11301, s11302, 1, s3351, s11303, s11304, 1, s3350, s11305, s11306, 1, s3349, s11307, s11308, 1, s3348, s11309, s11310, 1, s3347, s11311, s11312, 1, s3346, s11313, s11314, 1, s3345, s11315, s11316, 1, s3344, s11317, s11318, 1, s3343, s11319, s11320, 1, s3342, s11321, s11322, 1, s3341, s11323, s11324, 1, s3340, s11325, s11326, 1, s3339, s11327, s11328, 1, s3338, s11329, s11330, 1, s3337, s11331, s11332, 1, s3336, s11333, s11334, 1, s3335, s11335, s11336, 1, s3334, s11337, s11338, 1, s3333, s11339, s11340, 1, s3332, s11341, s11342, 1, s3331, s11343, s11344, 1, s3330, s11345, s11346, 1, s3329, s11347, s11348, 1, s3328, s11349, s11350, 1, s3327, s11351, s11352, 1, s3326, s11353, s11354, 1, s3325, s11355, s11356, 1, s3324, s11357, s11358, 1, s3323, s11359, s11360, 1, s3322, s11361, s11362, 1, s3321, s11363, s11364, 1, s3320, s11365, s11366, 1, s3319, s11367, s11368, 1, s3318, s11369, s11370, 1, s3317, s11371, s11372, 1, s3316, s11373, s11374, 1, s3315, s11375, s11376, 1, s3314, s11377, s11378, 1, s3313, s11379, s11380, 1, s3312, s11381, s11382, 1, s3311, s11383, s11384, 1, s3310, s11385, s11386, 1, s3309, s11387, s11388, 1, s3308, s11389, s11390, 1, s3307, s11391, s11392, 1, s3306, s11393, s11394, 1, s3305, s11395, s11396, 1, s3304, s11397, s11398, 1, s3303, s11399, s11400, 1, s3302, s11401, s11402, 1, s3301, s11403, s11404, 1, s3300, s11405, s11406, 1, s3299, s11407, s11408, 1, s3298, s11409, s11410, 1, s3297, s11411, s11412, 1, s3296, s11413, s11414, 1, s3295, s11415, s11416, 1, s3294, s11417, s11418, 1, s3293, s11419, s11420, 1, s3292, s11421, s11422, 1, s3291, s11423, s11424, 1, s3290, s11425, s11426, 1, s3289, s11427, s11428, 1, s3288, s11429, s11430, 1, s3287, s11431, s11432, 1, s3286, s11433, s11434, 1, s3285, s11435, s11436, 1, s3284, s11437, s11438, 1, s3283, s11439, s11440, 1, s3282, s11441, s11442, 1, s3281, s11443, s11444, 1, s3280, s11445, s11446, 1, s3279, s11447, s11448, 1, s3278, s11449, s11450, 1, s3277, s11451, s11452, 1, s3276, s11453, s11454, 1, s3275, s11455, s11456, 1, s3274, s11457, s11458, 1, s3273, s11459, s11460, 1, s3272, s11461, s11462, 1, s3271, s11463, s11464, 1, s3270, s11465, s11466, 1, s3269, s11467, s11468, 1, s3268, s11469, s11470, 1, s3267, s11471, s11472, 1, s3266, s11473, s11474, 1, s3265, s11475, s11476, 1, s3264, s11477, s11478, 1, s3263, s11479, s11480, 1, s3262, s11481, s11482, 1, s3261, s11483, s11484, 1, s3260, s11485, s11486, 1, s3259, s11487, s11488, 1, s3258, s11489, s11490, 1, s3257, s11491, s11492, 1, s3256, s11493, s11494, 1, s3255, s11495, s11496, 1, s3254, s11497, s11498, 1, s3253, s11499, s11500, 1, s3252, s11501, s11502, 1, s3251, s11503, s11504, 1, s3250, s11505, s11506, 1, s3249, s11507, s11508, 1, s3248, s11509, s11510, 1, s3247, s11511, s11512, 1, s3246, s11513, s11514, 1, s3245, s11515, s11516, 1, s3244, s11517, s11518, 1, s3243, s11519, s11520, 1, s3242, s11521, s11522, 1, s3241, s11523, s11524, 1, s3240, s11525, s11526, 1, s3239, s11527, s11528, 1, s3238, s11529, s11530, 1, s3237, s11531, s11532, 1, s3236, s11533, s11534, 1, s3235, s11535, s11536, 1, s3234, s11537, s11538, 1, s3233, s11539, s11540, 1, s3232, s11541, s11542, 1, s3231, s11543, s11544, 1, s3230, s11545, s11546, 1, s3229, s11547, s11548, 1, s3228, s11549, s11550, 1, s3227, s11551, s11552, 1, s3226, s11553, s11554, 1, s3225, s11555, s11556, 1, s3224, s11557, s11558, 1, s3223, s11559, s11560, 1, s3222, s11561, s11562, 1, s3221, s11563, s11564, 1, s3220, s11565, s11566, 1, s3219, s11567, s11568, 1, s3218, s11569, s11570, 1, s3217, s11571, s11572, 1, s3216, s11573, s11574, 1, s3215, s11575, s11576, 1, s3214, s11577, s11578, 1, s3213, s11579, s11580, 1, s3212, s11581, s11582, 1, s3211, s11583, s11584, 1, s3210, s11585, s11586, 1, s3209, s11587, s11588, 1, s3208, s11589, s11590, 1, s3207, s11591, s11592, 1, s3206, s11593, s11594, 1, s3205, s11595, s11596, 1, s3204, s11597, s11598, 1, s3203, s11599, s11600, 1, s3202, s11601, s11602, 1, s3201, s11603, s11604, 1, s3200, s11605, s11606, 1, s3199, s11607, s11608, 1, s3198, s11609, s11610, 1, s3197, s11611, s11612, 1, s3196, s11613, s11614, 1, s3195, s11615, s11616, 1, s3194, s11617, s11618, 1, s3193, s11619, s11620, 1, s3192, s11621, s11622, 1, s3191, s11623, s11624, 1, s3190, s11625, s11626, 1, s3189, s11627, s11628, 1, s3188, s11629, s11630, 1, s3187, s11631, s11632, 1, s3186, s11633, s11634, 1, s3185, s11635, s11636, 1, s3184, s11637, s11638, 1, s3183, s11639, s11640, 1, s3182, s11641, s11642, 1, s3181, s11643, s11644, 1, s3180, s11645, s11646, 1, s3179, s11647, s11648, 1, s3178, s11649, s11650, 1, s3177, s11651, s11652, 1, s3176, s11653, s11654, 1, s3175, s11655, s11656, 1, s3174, s11657, s11658, 1, s3173, s11659, s11660, 1, s3172, s11661, s11662, 1, s3171, s11663, s11664, 1, s3170, s11665, s11666, 1, s3169, s11667, s11668, 1, s3168, s11669, s11670, 1, s3167, s11671, s11672, 1, s3166, s11673, s11674, 1, s3165, s11675, s11676, 1, s3164, s11677, s11678, 1, s3163, s11679, s11680, 1, s3162, s11681, s11682, 1, s3161, s11683, s11684, 1, s3160, s11685, s11686, 1, s3159, s11687, s11688, 1, s3158, s11689, s11690, 1, s3157, s11691, s11692, 1, s3156, s11693, s11694, 1, s3155, s11695, s11696, 1, s3154, s11697, s11698, 1, s3153, s11699, s11700, 1, s3152, s11701, s11702, 1, s3151, s11703, s11704, 1, s3150, s11705, s11706, 1, s3149, s11707, s11708, 1, s3148, s11709, s11710, 1, s3147, s11711, s11712, 1, s3146, s11713, s11714, 1, s3145, s11715, s11716, 1, s3144, s11717, s11718, 1, s3143, s11719, s11720, 1, s3142, s11721, s11722, 1, s3141, s11723, s11724, 1, s3140, s11725, s11726, 1, s3139, s11727, s11728, 1, s3138, s11729, s11730, 1, s3137, s11731, s11732, 1, s3136, s11733, s11734, 1, s3135, s11735, s11736, 1, s3134, s11737, s11738, 1, s3133, s11739, s11740, 1, s3132, s11741, s11742, 1, s3131, s11743, s11744, 1, s3130, s11745, s11746, 1, s3129, s11747, s11748, 1, s3128, s11749, s11750, 1, s3127, s11751, s11752, 1, s3126, s11753, s11754, 1, s3125, s11755, s11756, 1, s3124, s11757, s11758, 1, s3123, s11759, s11760, 1, s3122, s11761, s11762, 1, s3121, s11763, s11764, 1, s3120, s11765, s11766, 1, s3119, s11767, s11768, 1, s3118, s11769, s11770, 1, s3117, s11771, s11772, 1, s3116, s11773, s11774, 1, s3115, s11775, s11776, 1, s3114, s11777, s11778, 1, s3113, s11779, s11780, 1, s3112, s11781, s11782, 1, s3111, s11783, s11784, 1, s3110, s11785, s11786, 1, s3109, s11787, s11788, 1, s3108, s11789, s11790, 1, s3107, s11791, s11792, 1, s3106, s11793, s11794, 1, s3105, s11795, s11796, 1, s3104, s11797, s11798, 1, s3103, s11799, s11800, 1, s3102, s11801, s11802, 1, s3101, s11803, s11804, 1, s3100, s11805, s11806, 1, s3099, s11807, s11808, 1, s3098, s11809, s11810, 1, s3097, s11811, s11812, 1, s3096, s11813, s11814, 1, s3095, s11815, s11816, 1, s3094, s11817, s11818, 1, s3093, s11819, s11820, 1, s3092, s11821, s11822, 1, s3091, s11823, s11824, 1, s3090, s11825, s11826, 1, s3089, s11827, s11828, 1, s3088, s11829, s11830, 1, s3087, s11831, s11832, 1, s3086, s11833, s11834, 1, s3085, s11835, s11836, 1, s3084, s11837, s11838, 1, s3083, s11839, s11840, 1, s3082, s11841, s11842, 1, s3081, s11843, s11844, 1, s3080, s11845, s11846, 1, s3079, s11847, s11848, 1, s3078, s11849, s11850, 1, s3077, s11851, s11852, 1, s3076, s11853, s11854, 1, s3075, s11855, s11856, 1, s3074, s11857, s11858, 1, s3073, s11859, s11860, 1, s3072, s11861, s11862, 1, s3071, s11863, s11864, 1, s3070, s11865, s11866, 1, s3069, s11867, s11868, 1, s3068, s11869, s11870, 1, s3067, s11871, s11872, 1, s3066, s11873, s11874, 1, s3065, s11875, s11876, 1, s3064, s11877, s11878, 1, s3063, s11879, s11880, 1, s3062, s11881, s11882, 1, s3061, s11883, s11884, 1, s3060, s11885, s11886, 1, s3059, s11887, s11888, 1, s3058, s11889, s11890, 1, s3057, s11891, s11892, 1, s3056, s11893, s11894, 1, s3055, s11895, s11896, 1, s3054, s11897, s11898, 1, s3053, s11899, s11900, 1, s3052, s11901, s11902, 1, s3051, s11903, s11904, 1, s3050, s11905, s11906, 1, s3049, s11907, s11908, 1, s3048, s11909, s11910, 1, s3047, s11911, s11912, 1, s3046, s11913, s11914, 1, s3045, s11915, s11916, 1, s3044, s11917, s11918, 1, s3043, s11919, s11920, 1, s3042, s11921, s11922, 1, s3041, s11923, s11924, 1, s3040, s11925, s11926, 1, s3039, s11927, s11928, 1, s3038, s11929, s11930, 1, s3037, s11931, s11932, 1, s3036, s11933, s11934, 1, s3035, s11935, s11936, 1, s3034, s11937, s11938, 1, s3033, s11939, s11940, 1, s3032, s11941, s11942, 1, s3031, s11943, s11944, 1, s3030, s11945, s11946, 1, s3029, s11947, s11948, 1, s3028, s11949, s11950, 1, s3027, s11951, s11952, 1, s3026, s11953, s11954, 1, s3025, s11955, s11956, 1, s3024, s11957, s11958, 1, s3023, s11959, s11960, 1, s3022, s11961, s11962, 1, s3021, s11963, s11964, 1, s3020, s11965, s11966, 1, s3019, s11967, s11968, 1, s3018, s11969, s11970, 1, s3017, s11971, s11972, 1, s3016, s11973, s11974, 1, s3015, s11975, s11976, 1, s3014, s11977, s11978, 1, s3013, s11979, s11980, 1, s3012, s11981, s11982, 1, s3011, s11983, s11984, 1, s3010, s11985, s11986, 1, s3009, s11987, s11988, 1, s3008, s11989, s11990, 1, s3007, s11991, s11992, 1, s3006, s11993, s11994, 1, s3005, s11995, s11996, 1, s3004, s11997, s11998, 1, s3003, s11999, s12000, 3000, s3, s12001, s12001 # 15005
+adds s2, s1, s6001 # 15006
+adds s1, s2, s6000 # 15007
+adds s2, s1, s5999 # 15008
+adds s1, s2, s5998 # 15009
+adds s2, s1, s5997 # 15010
+adds s1, s2, s5996 # 15011
+adds s2, s1, s5995 # 15012
+adds s1, s2, s5994 # 15013
+adds s2, s1, s5993 # 15014
+adds s1, s2, s5992 # 15015
+adds s2, s1, s5991 # 15016
+adds s1, s2, s5990 # 15017
+adds s2, s1, s5989 # 15018
+adds s1, s2, s5988 # 15019
+adds s2, s1, s5987 # 15020
+adds s1, s2, s5986 # 15021
+adds s2, s1, s5985 # 15022
+adds s1, s2, s5984 # 15023
+adds s2, s1, s5983 # 15024
+adds s1, s2, s5982 # 15025
+adds s2, s1, s5981 # 15026
+adds s1, s2, s5980 # 15027
+adds s2, s1, s5979 # 15028
+adds s1, s2, s5978 # 15029
+adds s2, s1, s5977 # 15030
+adds s1, s2, s5976 # 15031
+adds s2, s1, s5975 # 15032
+adds s1, s2, s5974 # 15033
+adds s2, s1, s5973 # 15034
+adds s1, s2, s5972 # 15035
+adds s2, s1, s5971 # 15036
+adds s1, s2, s5970 # 15037
+adds s2, s1, s5969 # 15038
+adds s1, s2, s5968 # 15039
+adds s2, s1, s5967 # 15040
+adds s1, s2, s5966 # 15041
+adds s2, s1, s5965 # 15042
+adds s1, s2, s5964 # 15043
+adds s2, s1, s5963 # 15044
+adds s1, s2, s5962 # 15045
+adds s2, s1, s5961 # 15046
+adds s1, s2, s5960 # 15047
+adds s2, s1, s5959 # 15048
+adds s1, s2, s5958 # 15049
+adds s2, s1, s5957 # 15050
+adds s1, s2, s5956 # 15051
+adds s2, s1, s5955 # 15052
+adds s1, s2, s5954 # 15053
+adds s2, s1, s5953 # 15054
+adds s1, s2, s5952 # 15055
+adds s2, s1, s5951 # 15056
+adds s1, s2, s5950 # 15057
+adds s2, s1, s5949 # 15058
+adds s1, s2, s5948 # 15059
+adds s2, s1, s5947 # 15060
+adds s1, s2, s5946 # 15061
+adds s2, s1, s5945 # 15062
+adds s1, s2, s5944 # 15063
+adds s2, s1, s5943 # 15064
+adds s1, s2, s5942 # 15065
+adds s2, s1, s5941 # 15066
+adds s1, s2, s5940 # 15067
+adds s2, s1, s5939 # 15068
+adds s1, s2, s5938 # 15069
+adds s2, s1, s5937 # 15070
+adds s1, s2, s5936 # 15071
+adds s2, s1, s5935 # 15072
+adds s1, s2, s5934 # 15073
+adds s2, s1, s5933 # 15074
+adds s1, s2, s5932 # 15075
+adds s2, s1, s5931 # 15076
+adds s1, s2, s5930 # 15077
+adds s2, s1, s5929 # 15078
+adds s1, s2, s5928 # 15079
+adds s2, s1, s5927 # 15080
+adds s1, s2, s5926 # 15081
+adds s2, s1, s5925 # 15082
+adds s1, s2, s5924 # 15083
+adds s2, s1, s5923 # 15084
+adds s1, s2, s5922 # 15085
+adds s2, s1, s5921 # 15086
+adds s1, s2, s5920 # 15087
+adds s2, s1, s5919 # 15088
+adds s1, s2, s5918 # 15089
+adds s2, s1, s5917 # 15090
+adds s1, s2, s5916 # 15091
+adds s2, s1, s5915 # 15092
+adds s1, s2, s5914 # 15093
+adds s2, s1, s5913 # 15094
+adds s1, s2, s5912 # 15095
+adds s2, s1, s5911 # 15096
+adds s1, s2, s5910 # 15097
+adds s2, s1, s5909 # 15098
+adds s1, s2, s5908 # 15099
+adds s2, s1, s5907 # 15100
+adds s1, s2, s5906 # 15101
+adds s2, s1, s5905 # 15102
+adds s1, s2, s5904 # 15103
+adds s2, s1, s5903 # 15104
+adds s1, s2, s5902 # 15105
+adds s2, s1, s5901 # 15106
+adds s1, s2, s5900 # 15107
+adds s2, s1, s5899 # 15108
+adds s1, s2, s5898 # 15109
+adds s2, s1, s5897 # 15110
+adds s1, s2, s5896 # 15111
+adds s2, s1, s5895 # 15112
+adds s1, s2, s5894 # 15113
+adds s2, s1, s5893 # 15114
+adds s1, s2, s5892 # 15115
+adds s2, s1, s5891 # 15116
+adds s1, s2, s5890 # 15117
+adds s2, s1, s5889 # 15118
+adds s1, s2, s5888 # 15119
+adds s2, s1, s5887 # 15120
+adds s1, s2, s5886 # 15121
+adds s2, s1, s5885 # 15122
+adds s1, s2, s5884 # 15123
+adds s2, s1, s5883 # 15124
+adds s1, s2, s5882 # 15125
+adds s2, s1, s5881 # 15126
+adds s1, s2, s5880 # 15127
+adds s2, s1, s5879 # 15128
+adds s1, s2, s5878 # 15129
+adds s2, s1, s5877 # 15130
+adds s1, s2, s5876 # 15131
+adds s2, s1, s5875 # 15132
+adds s1, s2, s5874 # 15133
+adds s2, s1, s5873 # 15134
+adds s1, s2, s5872 # 15135
+adds s2, s1, s5871 # 15136
+adds s1, s2, s5870 # 15137
+adds s2, s1, s5869 # 15138
+adds s1, s2, s5868 # 15139
+adds s2, s1, s5867 # 15140
+adds s1, s2, s5866 # 15141
+adds s2, s1, s5865 # 15142
+adds s1, s2, s5864 # 15143
+adds s2, s1, s5863 # 15144
+adds s1, s2, s5862 # 15145
+adds s2, s1, s5861 # 15146
+adds s1, s2, s5860 # 15147
+adds s2, s1, s5859 # 15148
+adds s1, s2, s5858 # 15149
+adds s2, s1, s5857 # 15150
+adds s1, s2, s5856 # 15151
+adds s2, s1, s5855 # 15152
+adds s1, s2, s5854 # 15153
+adds s2, s1, s5853 # 15154
+adds s1, s2, s5852 # 15155
+adds s2, s1, s5851 # 15156
+adds s1, s2, s5850 # 15157
+adds s2, s1, s5849 # 15158
+adds s1, s2, s5848 # 15159
+adds s2, s1, s5847 # 15160
+adds s1, s2, s5846 # 15161
+adds s2, s1, s5845 # 15162
+adds s1, s2, s5844 # 15163
+adds s2, s1, s5843 # 15164
+adds s1, s2, s5842 # 15165
+adds s2, s1, s5841 # 15166
+adds s1, s2, s5840 # 15167
+adds s2, s1, s5839 # 15168
+adds s1, s2, s5838 # 15169
+adds s2, s1, s5837 # 15170
+adds s1, s2, s5836 # 15171
+adds s2, s1, s5835 # 15172
+adds s1, s2, s5834 # 15173
+adds s2, s1, s5833 # 15174
+adds s1, s2, s5832 # 15175
+adds s2, s1, s5831 # 15176
+adds s1, s2, s5830 # 15177
+adds s2, s1, s5829 # 15178
+adds s1, s2, s5828 # 15179
+adds s2, s1, s5827 # 15180
+adds s1, s2, s5826 # 15181
+adds s2, s1, s5825 # 15182
+adds s1, s2, s5824 # 15183
+adds s2, s1, s5823 # 15184
+adds s1, s2, s5822 # 15185
+adds s2, s1, s5821 # 15186
+adds s1, s2, s5820 # 15187
+adds s2, s1, s5819 # 15188
+adds s1, s2, s5818 # 15189
+adds s2, s1, s5817 # 15190
+adds s1, s2, s5816 # 15191
+adds s2, s1, s5815 # 15192
+adds s1, s2, s5814 # 15193
+adds s2, s1, s5813 # 15194
+adds s1, s2, s5812 # 15195
+adds s2, s1, s5811 # 15196
+adds s1, s2, s5810 # 15197
+adds s2, s1, s5809 # 15198
+adds s1, s2, s5808 # 15199
+adds s2, s1, s5807 # 15200
+adds s1, s2, s5806 # 15201
+adds s2, s1, s5805 # 15202
+adds s1, s2, s5804 # 15203
+adds s2, s1, s5803 # 15204
+adds s1, s2, s5802 # 15205
+adds s2, s1, s5801 # 15206
+adds s1, s2, s5800 # 15207
+adds s2, s1, s5799 # 15208
+adds s1, s2, s5798 # 15209
+adds s2, s1, s5797 # 15210
+adds s1, s2, s5796 # 15211
+adds s2, s1, s5795 # 15212
+adds s1, s2, s5794 # 15213
+adds s2, s1, s5793 # 15214
+adds s1, s2, s5792 # 15215
+adds s2, s1, s5791 # 15216
+adds s1, s2, s5790 # 15217
+adds s2, s1, s5789 # 15218
+adds s1, s2, s5788 # 15219
+adds s2, s1, s5787 # 15220
+adds s1, s2, s5786 # 15221
+adds s2, s1, s5785 # 15222
+adds s1, s2, s5784 # 15223
+adds s2, s1, s5783 # 15224
+adds s1, s2, s5782 # 15225
+adds s2, s1, s5781 # 15226
+adds s1, s2, s5780 # 15227
+adds s2, s1, s5779 # 15228
+adds s1, s2, s5778 # 15229
+adds s2, s1, s5777 # 15230
+adds s1, s2, s5776 # 15231
+adds s2, s1, s5775 # 15232
+adds s1, s2, s5774 # 15233
+adds s2, s1, s5773 # 15234
+adds s1, s2, s5772 # 15235
+adds s2, s1, s5771 # 15236
+adds s1, s2, s5770 # 15237
+adds s2, s1, s5769 # 15238
+adds s1, s2, s5768 # 15239
+adds s2, s1, s5767 # 15240
+adds s1, s2, s5766 # 15241
+adds s2, s1, s5765 # 15242
+adds s1, s2, s5764 # 15243
+adds s2, s1, s5763 # 15244
+adds s1, s2, s5762 # 15245
+adds s2, s1, s5761 # 15246
+adds s1, s2, s5760 # 15247
+adds s2, s1, s5759 # 15248
+adds s1, s2, s5758 # 15249
+adds s2, s1, s5757 # 15250
+adds s1, s2, s5756 # 15251
+adds s2, s1, s5755 # 15252
+adds s1, s2, s5754 # 15253
+adds s2, s1, s5753 # 15254
+adds s1, s2, s5752 # 15255
+adds s2, s1, s5751 # 15256
+adds s1, s2, s5750 # 15257
+adds s2, s1, s5749 # 15258
+adds s1, s2, s5748 # 15259
+adds s2, s1, s5747 # 15260
+adds s1, s2, s5746 # 15261
+adds s2, s1, s5745 # 15262
+adds s1, s2, s5744 # 15263
+adds s2, s1, s5743 # 15264
+adds s1, s2, s5742 # 15265
+adds s2, s1, s5741 # 15266
+adds s1, s2, s5740 # 15267
+adds s2, s1, s5739 # 15268
+adds s1, s2, s5738 # 15269
+adds s2, s1, s5737 # 15270
+adds s1, s2, s5736 # 15271
+adds s2, s1, s5735 # 15272
+adds s1, s2, s5734 # 15273
+adds s2, s1, s5733 # 15274
+adds s1, s2, s5732 # 15275
+adds s2, s1, s5731 # 15276
+adds s1, s2, s5730 # 15277
+adds s2, s1, s5729 # 15278
+adds s1, s2, s5728 # 15279
+adds s2, s1, s5727 # 15280
+adds s1, s2, s5726 # 15281
+adds s2, s1, s5725 # 15282
+adds s1, s2, s5724 # 15283
+adds s2, s1, s5723 # 15284
+adds s1, s2, s5722 # 15285
+adds s2, s1, s5721 # 15286
+adds s1, s2, s5720 # 15287
+adds s2, s1, s5719 # 15288
+adds s1, s2, s5718 # 15289
+adds s2, s1, s5717 # 15290
+adds s1, s2, s5716 # 15291
+adds s2, s1, s5715 # 15292
+adds s1, s2, s5714 # 15293
+adds s2, s1, s5713 # 15294
+adds s1, s2, s5712 # 15295
+adds s2, s1, s5711 # 15296
+adds s1, s2, s5710 # 15297
+adds s2, s1, s5709 # 15298
+adds s1, s2, s5708 # 15299
+adds s2, s1, s5707 # 15300
+adds s1, s2, s5706 # 15301
+adds s2, s1, s5705 # 15302
+adds s1, s2, s5704 # 15303
+adds s2, s1, s5703 # 15304
+adds s1, s2, s5702 # 15305
+adds s2, s1, s5701 # 15306
+adds s1, s2, s5700 # 15307
+adds s2, s1, s5699 # 15308
+adds s1, s2, s5698 # 15309
+adds s2, s1, s5697 # 15310
+adds s1, s2, s5696 # 15311
+adds s2, s1, s5695 # 15312
+adds s1, s2, s5694 # 15313
+adds s2, s1, s5693 # 15314
+adds s1, s2, s5692 # 15315
+adds s2, s1, s5691 # 15316
+adds s1, s2, s5690 # 15317
+adds s2, s1, s5689 # 15318
+adds s1, s2, s5688 # 15319
+adds s2, s1, s5687 # 15320
+adds s1, s2, s5686 # 15321
+adds s2, s1, s5685 # 15322
+adds s1, s2, s5684 # 15323
+adds s2, s1, s5683 # 15324
+adds s1, s2, s5682 # 15325
+adds s2, s1, s5681 # 15326
+adds s1, s2, s5680 # 15327
+adds s2, s1, s5679 # 15328
+adds s1, s2, s5678 # 15329
+adds s2, s1, s5677 # 15330
+adds s1, s2, s5676 # 15331
+adds s2, s1, s5675 # 15332
+adds s1, s2, s5674 # 15333
+adds s2, s1, s5673 # 15334
+adds s1, s2, s5672 # 15335
+adds s2, s1, s5671 # 15336
+adds s1, s2, s5670 # 15337
+adds s2, s1, s5669 # 15338
+adds s1, s2, s5668 # 15339
+adds s2, s1, s5667 # 15340
+adds s1, s2, s5666 # 15341
+adds s2, s1, s5665 # 15342
+adds s1, s2, s5664 # 15343
+adds s2, s1, s5663 # 15344
+adds s1, s2, s5662 # 15345
+adds s2, s1, s5661 # 15346
+adds s1, s2, s5660 # 15347
+adds s2, s1, s5659 # 15348
+adds s1, s2, s5658 # 15349
+adds s2, s1, s5657 # 15350
+adds s1, s2, s5656 # 15351
+adds s2, s1, s5655 # 15352
+adds s1, s2, s5654 # 15353
+adds s2, s1, s5653 # 15354
+adds s1, s2, s5652 # 15355
+adds s2, s1, s5651 # 15356
+adds s1, s2, s5650 # 15357
+adds s2, s1, s5649 # 15358
+adds s1, s2, s5648 # 15359
+adds s2, s1, s5647 # 15360
+adds s1, s2, s5646 # 15361
+adds s2, s1, s5645 # 15362
+adds s1, s2, s5644 # 15363
+adds s2, s1, s5643 # 15364
+adds s1, s2, s5642 # 15365
+adds s2, s1, s5641 # 15366
+adds s1, s2, s5640 # 15367
+adds s2, s1, s5639 # 15368
+adds s1, s2, s5638 # 15369
+adds s2, s1, s5637 # 15370
+adds s1, s2, s5636 # 15371
+adds s2, s1, s5635 # 15372
+adds s1, s2, s5634 # 15373
+adds s2, s1, s5633 # 15374
+adds s1, s2, s5632 # 15375
+adds s2, s1, s5631 # 15376
+adds s1, s2, s5630 # 15377
+adds s2, s1, s5629 # 15378
+adds s1, s2, s5628 # 15379
+adds s2, s1, s5627 # 15380
+adds s1, s2, s5626 # 15381
+adds s2, s1, s5625 # 15382
+adds s1, s2, s5624 # 15383
+adds s2, s1, s5623 # 15384
+adds s1, s2, s5622 # 15385
+adds s2, s1, s5621 # 15386
+adds s1, s2, s5620 # 15387
+adds s2, s1, s5619 # 15388
+adds s1, s2, s5618 # 15389
+adds s2, s1, s5617 # 15390
+adds s1, s2, s5616 # 15391
+adds s2, s1, s5615 # 15392
+adds s1, s2, s5614 # 15393
+adds s2, s1, s5613 # 15394
+adds s1, s2, s5612 # 15395
+adds s2, s1, s5611 # 15396
+adds s1, s2, s5610 # 15397
+adds s2, s1, s5609 # 15398
+adds s1, s2, s5608 # 15399
+adds s2, s1, s5607 # 15400
+adds s1, s2, s5606 # 15401
+adds s2, s1, s5605 # 15402
+adds s1, s2, s5604 # 15403
+adds s2, s1, s5603 # 15404
+adds s1, s2, s5602 # 15405
+adds s2, s1, s5601 # 15406
+adds s1, s2, s5600 # 15407
+adds s2, s1, s5599 # 15408
+adds s1, s2, s5598 # 15409
+adds s2, s1, s5597 # 15410
+adds s1, s2, s5596 # 15411
+adds s2, s1, s5595 # 15412
+adds s1, s2, s5594 # 15413
+adds s2, s1, s5593 # 15414
+adds s1, s2, s5592 # 15415
+adds s2, s1, s5591 # 15416
+adds s1, s2, s5590 # 15417
+adds s2, s1, s5589 # 15418
+adds s1, s2, s5588 # 15419
+adds s2, s1, s5587 # 15420
+adds s1, s2, s5586 # 15421
+adds s2, s1, s5585 # 15422
+adds s1, s2, s5584 # 15423
+adds s2, s1, s5583 # 15424
+adds s1, s2, s5582 # 15425
+adds s2, s1, s5581 # 15426
+adds s1, s2, s5580 # 15427
+adds s2, s1, s5579 # 15428
+adds s1, s2, s5578 # 15429
+adds s2, s1, s5577 # 15430
+adds s1, s2, s5576 # 15431
+adds s2, s1, s5575 # 15432
+adds s1, s2, s5574 # 15433
+adds s2, s1, s5573 # 15434
+adds s1, s2, s5572 # 15435
+adds s2, s1, s5571 # 15436
+adds s1, s2, s5570 # 15437
+adds s2, s1, s5569 # 15438
+adds s1, s2, s5568 # 15439
+adds s2, s1, s5567 # 15440
+adds s1, s2, s5566 # 15441
+adds s2, s1, s5565 # 15442
+adds s1, s2, s5564 # 15443
+adds s2, s1, s5563 # 15444
+adds s1, s2, s5562 # 15445
+adds s2, s1, s5561 # 15446
+adds s1, s2, s5560 # 15447
+adds s2, s1, s5559 # 15448
+adds s1, s2, s5558 # 15449
+adds s2, s1, s5557 # 15450
+adds s1, s2, s5556 # 15451
+adds s2, s1, s5555 # 15452
+adds s1, s2, s5554 # 15453
+adds s2, s1, s5553 # 15454
+adds s1, s2, s5552 # 15455
+adds s2, s1, s5551 # 15456
+adds s1, s2, s5550 # 15457
+adds s2, s1, s5549 # 15458
+adds s1, s2, s5548 # 15459
+adds s2, s1, s5547 # 15460
+adds s1, s2, s5546 # 15461
+adds s2, s1, s5545 # 15462
+adds s1, s2, s5544 # 15463
+adds s2, s1, s5543 # 15464
+adds s1, s2, s5542 # 15465
+adds s2, s1, s5541 # 15466
+adds s1, s2, s5540 # 15467
+adds s2, s1, s5539 # 15468
+adds s1, s2, s5538 # 15469
+adds s2, s1, s5537 # 15470
+adds s1, s2, s5536 # 15471
+adds s2, s1, s5535 # 15472
+adds s1, s2, s5534 # 15473
+adds s2, s1, s5533 # 15474
+adds s1, s2, s5532 # 15475
+adds s2, s1, s5531 # 15476
+adds s1, s2, s5530 # 15477
+adds s2, s1, s5529 # 15478
+adds s1, s2, s5528 # 15479
+adds s2, s1, s5527 # 15480
+adds s1, s2, s5526 # 15481
+adds s2, s1, s5525 # 15482
+adds s1, s2, s5524 # 15483
+adds s2, s1, s5523 # 15484
+adds s1, s2, s5522 # 15485
+adds s2, s1, s5521 # 15486
+adds s1, s2, s5520 # 15487
+adds s2, s1, s5519 # 15488
+adds s1, s2, s5518 # 15489
+adds s2, s1, s5517 # 15490
+adds s1, s2, s5516 # 15491
+adds s2, s1, s5515 # 15492
+adds s1, s2, s5514 # 15493
+adds s2, s1, s5513 # 15494
+adds s1, s2, s5512 # 15495
+adds s2, s1, s5511 # 15496
+adds s1, s2, s5510 # 15497
+adds s2, s1, s5509 # 15498
+adds s1, s2, s5508 # 15499
+adds s2, s1, s5507 # 15500
+adds s1, s2, s5506 # 15501
+adds s2, s1, s5505 # 15502
+adds s1, s2, s5504 # 15503
+adds s2, s1, s5503 # 15504
+adds s1, s2, s5502 # 15505
+adds s2, s1, s5501 # 15506
+adds s1, s2, s5500 # 15507
+adds s2, s1, s5499 # 15508
+adds s1, s2, s5498 # 15509
+adds s2, s1, s5497 # 15510
+adds s1, s2, s5496 # 15511
+adds s2, s1, s5495 # 15512
+adds s1, s2, s5494 # 15513
+adds s2, s1, s5493 # 15514
+adds s1, s2, s5492 # 15515
+adds s2, s1, s5491 # 15516
+adds s1, s2, s5490 # 15517
+adds s2, s1, s5489 # 15518
+adds s1, s2, s5488 # 15519
+adds s2, s1, s5487 # 15520
+adds s1, s2, s5486 # 15521
+adds s2, s1, s5485 # 15522
+adds s1, s2, s5484 # 15523
+adds s2, s1, s5483 # 15524
+adds s1, s2, s5482 # 15525
+adds s2, s1, s5481 # 15526
+adds s1, s2, s5480 # 15527
+adds s2, s1, s5479 # 15528
+adds s1, s2, s5478 # 15529
+adds s2, s1, s5477 # 15530
+adds s1, s2, s5476 # 15531
+adds s2, s1, s5475 # 15532
+adds s1, s2, s5474 # 15533
+adds s2, s1, s5473 # 15534
+adds s1, s2, s5472 # 15535
+adds s2, s1, s5471 # 15536
+adds s1, s2, s5470 # 15537
+adds s2, s1, s5469 # 15538
+adds s1, s2, s5468 # 15539
+adds s2, s1, s5467 # 15540
+adds s1, s2, s5466 # 15541
+adds s2, s1, s5465 # 15542
+adds s1, s2, s5464 # 15543
+adds s2, s1, s5463 # 15544
+adds s1, s2, s5462 # 15545
+adds s2, s1, s5461 # 15546
+adds s1, s2, s5460 # 15547
+adds s2, s1, s5459 # 15548
+adds s1, s2, s5458 # 15549
+adds s2, s1, s5457 # 15550
+adds s1, s2, s5456 # 15551
+adds s2, s1, s5455 # 15552
+adds s1, s2, s5454 # 15553
+adds s2, s1, s5453 # 15554
+adds s1, s2, s5452 # 15555
+adds s2, s1, s5451 # 15556
+adds s1, s2, s5450 # 15557
+adds s2, s1, s5449 # 15558
+adds s1, s2, s5448 # 15559
+adds s2, s1, s5447 # 15560
+adds s1, s2, s5446 # 15561
+adds s2, s1, s5445 # 15562
+adds s1, s2, s5444 # 15563
+adds s2, s1, s5443 # 15564
+adds s1, s2, s5442 # 15565
+adds s2, s1, s5441 # 15566
+adds s1, s2, s5440 # 15567
+adds s2, s1, s5439 # 15568
+adds s1, s2, s5438 # 15569
+adds s2, s1, s5437 # 15570
+adds s1, s2, s5436 # 15571
+adds s2, s1, s5435 # 15572
+adds s1, s2, s5434 # 15573
+adds s2, s1, s5433 # 15574
+adds s1, s2, s5432 # 15575
+adds s2, s1, s5431 # 15576
+adds s1, s2, s5430 # 15577
+adds s2, s1, s5429 # 15578
+adds s1, s2, s5428 # 15579
+adds s2, s1, s5427 # 15580
+adds s1, s2, s5426 # 15581
+adds s2, s1, s5425 # 15582
+adds s1, s2, s5424 # 15583
+adds s2, s1, s5423 # 15584
+adds s1, s2, s5422 # 15585
+adds s2, s1, s5421 # 15586
+adds s1, s2, s5420 # 15587
+adds s2, s1, s5419 # 15588
+adds s1, s2, s5418 # 15589
+adds s2, s1, s5417 # 15590
+adds s1, s2, s5416 # 15591
+adds s2, s1, s5415 # 15592
+adds s1, s2, s5414 # 15593
+adds s2, s1, s5413 # 15594
+adds s1, s2, s5412 # 15595
+adds s2, s1, s5411 # 15596
+adds s1, s2, s5410 # 15597
+adds s2, s1, s5409 # 15598
+adds s1, s2, s5408 # 15599
+adds s2, s1, s5407 # 15600
+adds s1, s2, s5406 # 15601
+adds s2, s1, s5405 # 15602
+adds s1, s2, s5404 # 15603
+adds s2, s1, s5403 # 15604
+adds s1, s2, s5402 # 15605
+adds s2, s1, s5401 # 15606
+adds s1, s2, s5400 # 15607
+adds s2, s1, s5399 # 15608
+adds s1, s2, s5398 # 15609
+adds s2, s1, s5397 # 15610
+adds s1, s2, s5396 # 15611
+adds s2, s1, s5395 # 15612
+adds s1, s2, s5394 # 15613
+adds s2, s1, s5393 # 15614
+adds s1, s2, s5392 # 15615
+adds s2, s1, s5391 # 15616
+adds s1, s2, s5390 # 15617
+adds s2, s1, s5389 # 15618
+adds s1, s2, s5388 # 15619
+adds s2, s1, s5387 # 15620
+adds s1, s2, s5386 # 15621
+adds s2, s1, s5385 # 15622
+adds s1, s2, s5384 # 15623
+adds s2, s1, s5383 # 15624
+adds s1, s2, s5382 # 15625
+adds s2, s1, s5381 # 15626
+adds s1, s2, s5380 # 15627
+adds s2, s1, s5379 # 15628
+adds s1, s2, s5378 # 15629
+adds s2, s1, s5377 # 15630
+adds s1, s2, s5376 # 15631
+adds s2, s1, s5375 # 15632
+adds s1, s2, s5374 # 15633
+adds s2, s1, s5373 # 15634
+adds s1, s2, s5372 # 15635
+adds s2, s1, s5371 # 15636
+adds s1, s2, s5370 # 15637
+adds s2, s1, s5369 # 15638
+adds s1, s2, s5368 # 15639
+adds s2, s1, s5367 # 15640
+adds s1, s2, s5366 # 15641
+adds s2, s1, s5365 # 15642
+adds s1, s2, s5364 # 15643
+adds s2, s1, s5363 # 15644
+adds s1, s2, s5362 # 15645
+adds s2, s1, s5361 # 15646
+adds s1, s2, s5360 # 15647
+adds s2, s1, s5359 # 15648
+adds s1, s2, s5358 # 15649
+adds s2, s1, s5357 # 15650
+adds s1, s2, s5356 # 15651
+adds s2, s1, s5355 # 15652
+adds s1, s2, s5354 # 15653
+adds s2, s1, s5353 # 15654
+adds s1, s2, s5352 # 15655
+adds s2, s1, s5351 # 15656
+adds s1, s2, s5350 # 15657
+adds s2, s1, s5349 # 15658
+adds s1, s2, s5348 # 15659
+adds s2, s1, s5347 # 15660
+adds s1, s2, s5346 # 15661
+adds s2, s1, s5345 # 15662
+adds s1, s2, s5344 # 15663
+adds s2, s1, s5343 # 15664
+adds s1, s2, s5342 # 15665
+adds s2, s1, s5341 # 15666
+adds s1, s2, s5340 # 15667
+adds s2, s1, s5339 # 15668
+adds s1, s2, s5338 # 15669
+adds s2, s1, s5337 # 15670
+adds s1, s2, s5336 # 15671
+adds s2, s1, s5335 # 15672
+adds s1, s2, s5334 # 15673
+adds s2, s1, s5333 # 15674
+adds s1, s2, s5332 # 15675
+adds s2, s1, s5331 # 15676
+adds s1, s2, s5330 # 15677
+adds s2, s1, s5329 # 15678
+adds s1, s2, s5328 # 15679
+adds s2, s1, s5327 # 15680
+adds s1, s2, s5326 # 15681
+adds s2, s1, s5325 # 15682
+adds s1, s2, s5324 # 15683
+adds s2, s1, s5323 # 15684
+adds s1, s2, s5322 # 15685
+adds s2, s1, s5321 # 15686
+adds s1, s2, s5320 # 15687
+adds s2, s1, s5319 # 15688
+adds s1, s2, s5318 # 15689
+adds s2, s1, s5317 # 15690
+adds s1, s2, s5316 # 15691
+adds s2, s1, s5315 # 15692
+adds s1, s2, s5314 # 15693
+adds s2, s1, s5313 # 15694
+adds s1, s2, s5312 # 15695
+adds s2, s1, s5311 # 15696
+adds s1, s2, s5310 # 15697
+adds s2, s1, s5309 # 15698
+adds s1, s2, s5308 # 15699
+adds s2, s1, s5307 # 15700
+adds s1, s2, s5306 # 15701
+adds s2, s1, s5305 # 15702
+adds s1, s2, s5304 # 15703
+adds s2, s1, s5303 # 15704
+adds s1, s2, s5302 # 15705
+adds s2, s1, s5301 # 15706
+adds s1, s2, s5300 # 15707
+adds s2, s1, s5299 # 15708
+adds s1, s2, s5298 # 15709
+adds s2, s1, s5297 # 15710
+adds s1, s2, s5296 # 15711
+adds s2, s1, s5295 # 15712
+adds s1, s2, s5294 # 15713
+adds s2, s1, s5293 # 15714
+adds s1, s2, s5292 # 15715
+adds s2, s1, s5291 # 15716
+adds s1, s2, s5290 # 15717
+adds s2, s1, s5289 # 15718
+adds s1, s2, s5288 # 15719
+adds s2, s1, s5287 # 15720
+adds s1, s2, s5286 # 15721
+adds s2, s1, s5285 # 15722
+adds s1, s2, s5284 # 15723
+adds s2, s1, s5283 # 15724
+adds s1, s2, s5282 # 15725
+adds s2, s1, s5281 # 15726
+adds s1, s2, s5280 # 15727
+adds s2, s1, s5279 # 15728
+adds s1, s2, s5278 # 15729
+adds s2, s1, s5277 # 15730
+adds s1, s2, s5276 # 15731
+adds s2, s1, s5275 # 15732
+adds s1, s2, s5274 # 15733
+adds s2, s1, s5273 # 15734
+adds s1, s2, s5272 # 15735
+adds s2, s1, s5271 # 15736
+adds s1, s2, s5270 # 15737
+adds s2, s1, s5269 # 15738
+adds s1, s2, s5268 # 15739
+adds s2, s1, s5267 # 15740
+adds s1, s2, s5266 # 15741
+adds s2, s1, s5265 # 15742
+adds s1, s2, s5264 # 15743
+adds s2, s1, s5263 # 15744
+adds s1, s2, s5262 # 15745
+adds s2, s1, s5261 # 15746
+adds s1, s2, s5260 # 15747
+adds s2, s1, s5259 # 15748
+adds s1, s2, s5258 # 15749
+adds s2, s1, s5257 # 15750
+adds s1, s2, s5256 # 15751
+adds s2, s1, s5255 # 15752
+adds s1, s2, s5254 # 15753
+adds s2, s1, s5253 # 15754
+adds s1, s2, s5252 # 15755
+adds s2, s1, s5251 # 15756
+adds s1, s2, s5250 # 15757
+adds s2, s1, s5249 # 15758
+adds s1, s2, s5248 # 15759
+adds s2, s1, s5247 # 15760
+adds s1, s2, s5246 # 15761
+adds s2, s1, s5245 # 15762
+adds s1, s2, s5244 # 15763
+adds s2, s1, s5243 # 15764
+adds s1, s2, s5242 # 15765
+adds s2, s1, s5241 # 15766
+adds s1, s2, s5240 # 15767
+adds s2, s1, s5239 # 15768
+adds s1, s2, s5238 # 15769
+adds s2, s1, s5237 # 15770
+adds s1, s2, s5236 # 15771
+adds s2, s1, s5235 # 15772
+adds s1, s2, s5234 # 15773
+adds s2, s1, s5233 # 15774
+adds s1, s2, s5232 # 15775
+adds s2, s1, s5231 # 15776
+adds s1, s2, s5230 # 15777
+adds s2, s1, s5229 # 15778
+adds s1, s2, s5228 # 15779
+adds s2, s1, s5227 # 15780
+adds s1, s2, s5226 # 15781
+adds s2, s1, s5225 # 15782
+adds s1, s2, s5224 # 15783
+adds s2, s1, s5223 # 15784
+adds s1, s2, s5222 # 15785
+adds s2, s1, s5221 # 15786
+adds s1, s2, s5220 # 15787
+adds s2, s1, s5219 # 15788
+adds s1, s2, s5218 # 15789
+adds s2, s1, s5217 # 15790
+adds s1, s2, s5216 # 15791
+adds s2, s1, s5215 # 15792
+adds s1, s2, s5214 # 15793
+adds s2, s1, s5213 # 15794
+adds s1, s2, s5212 # 15795
+adds s2, s1, s5211 # 15796
+adds s1, s2, s5210 # 15797
+adds s2, s1, s5209 # 15798
+adds s1, s2, s5208 # 15799
+adds s2, s1, s5207 # 15800
+adds s1, s2, s5206 # 15801
+adds s2, s1, s5205 # 15802
+adds s1, s2, s5204 # 15803
+adds s2, s1, s5203 # 15804
+adds s1, s2, s5202 # 15805
+adds s2, s1, s5201 # 15806
+adds s1, s2, s5200 # 15807
+adds s2, s1, s5199 # 15808
+adds s1, s2, s5198 # 15809
+adds s2, s1, s5197 # 15810
+adds s1, s2, s5196 # 15811
+adds s2, s1, s5195 # 15812
+adds s1, s2, s5194 # 15813
+adds s2, s1, s5193 # 15814
+adds s1, s2, s5192 # 15815
+adds s2, s1, s5191 # 15816
+adds s1, s2, s5190 # 15817
+adds s2, s1, s5189 # 15818
+adds s1, s2, s5188 # 15819
+adds s2, s1, s5187 # 15820
+adds s1, s2, s5186 # 15821
+adds s2, s1, s5185 # 15822
+adds s1, s2, s5184 # 15823
+adds s2, s1, s5183 # 15824
+adds s1, s2, s5182 # 15825
+adds s2, s1, s5181 # 15826
+adds s1, s2, s5180 # 15827
+adds s2, s1, s5179 # 15828
+adds s1, s2, s5178 # 15829
+adds s2, s1, s5177 # 15830
+adds s1, s2, s5176 # 15831
+adds s2, s1, s5175 # 15832
+adds s1, s2, s5174 # 15833
+adds s2, s1, s5173 # 15834
+adds s1, s2, s5172 # 15835
+adds s2, s1, s5171 # 15836
+adds s1, s2, s5170 # 15837
+adds s2, s1, s5169 # 15838
+adds s1, s2, s5168 # 15839
+adds s2, s1, s5167 # 15840
+adds s1, s2, s5166 # 15841
+adds s2, s1, s5165 # 15842
+adds s1, s2, s5164 # 15843
+adds s2, s1, s5163 # 15844
+adds s1, s2, s5162 # 15845
+adds s2, s1, s5161 # 15846
+adds s1, s2, s5160 # 15847
+adds s2, s1, s5159 # 15848
+adds s1, s2, s5158 # 15849
+adds s2, s1, s5157 # 15850
+adds s1, s2, s5156 # 15851
+adds s2, s1, s5155 # 15852
+adds s1, s2, s5154 # 15853
+adds s2, s1, s5153 # 15854
+adds s1, s2, s5152 # 15855
+adds s2, s1, s5151 # 15856
+adds s1, s2, s5150 # 15857
+adds s2, s1, s5149 # 15858
+adds s1, s2, s5148 # 15859
+adds s2, s1, s5147 # 15860
+adds s1, s2, s5146 # 15861
+adds s2, s1, s5145 # 15862
+adds s1, s2, s5144 # 15863
+adds s2, s1, s5143 # 15864
+adds s1, s2, s5142 # 15865
+adds s2, s1, s5141 # 15866
+adds s1, s2, s5140 # 15867
+adds s2, s1, s5139 # 15868
+adds s1, s2, s5138 # 15869
+adds s2, s1, s5137 # 15870
+adds s1, s2, s5136 # 15871
+adds s2, s1, s5135 # 15872
+adds s1, s2, s5134 # 15873
+adds s2, s1, s5133 # 15874
+adds s1, s2, s5132 # 15875
+adds s2, s1, s5131 # 15876
+adds s1, s2, s5130 # 15877
+adds s2, s1, s5129 # 15878
+adds s1, s2, s5128 # 15879
+adds s2, s1, s5127 # 15880
+adds s1, s2, s5126 # 15881
+adds s2, s1, s5125 # 15882
+adds s1, s2, s5124 # 15883
+adds s2, s1, s5123 # 15884
+adds s1, s2, s5122 # 15885
+adds s2, s1, s5121 # 15886
+adds s1, s2, s5120 # 15887
+adds s2, s1, s5119 # 15888
+adds s1, s2, s5118 # 15889
+adds s2, s1, s5117 # 15890
+adds s1, s2, s5116 # 15891
+adds s2, s1, s5115 # 15892
+adds s1, s2, s5114 # 15893
+adds s2, s1, s5113 # 15894
+adds s1, s2, s5112 # 15895
+adds s2, s1, s5111 # 15896
+adds s1, s2, s5110 # 15897
+adds s2, s1, s5109 # 15898
+adds s1, s2, s5108 # 15899
+adds s2, s1, s5107 # 15900
+adds s1, s2, s5106 # 15901
+adds s2, s1, s5105 # 15902
+adds s1, s2, s5104 # 15903
+adds s2, s1, s5103 # 15904
+adds s1, s2, s5102 # 15905
+adds s2, s1, s5101 # 15906
+adds s1, s2, s5100 # 15907
+adds s2, s1, s5099 # 15908
+adds s1, s2, s5098 # 15909
+adds s2, s1, s5097 # 15910
+adds s1, s2, s5096 # 15911
+adds s2, s1, s5095 # 15912
+adds s1, s2, s5094 # 15913
+adds s2, s1, s5093 # 15914
+adds s1, s2, s5092 # 15915
+adds s2, s1, s5091 # 15916
+adds s1, s2, s5090 # 15917
+adds s2, s1, s5089 # 15918
+adds s1, s2, s5088 # 15919
+adds s2, s1, s5087 # 15920
+adds s1, s2, s5086 # 15921
+adds s2, s1, s5085 # 15922
+adds s1, s2, s5084 # 15923
+adds s2, s1, s5083 # 15924
+adds s1, s2, s5082 # 15925
+adds s2, s1, s5081 # 15926
+adds s1, s2, s5080 # 15927
+adds s2, s1, s5079 # 15928
+adds s1, s2, s5078 # 15929
+adds s2, s1, s5077 # 15930
+adds s1, s2, s5076 # 15931
+adds s2, s1, s5075 # 15932
+adds s1, s2, s5074 # 15933
+adds s2, s1, s5073 # 15934
+adds s1, s2, s5072 # 15935
+adds s2, s1, s5071 # 15936
+adds s1, s2, s5070 # 15937
+adds s2, s1, s5069 # 15938
+adds s1, s2, s5068 # 15939
+adds s2, s1, s5067 # 15940
+adds s1, s2, s5066 # 15941
+adds s2, s1, s5065 # 15942
+adds s1, s2, s5064 # 15943
+adds s2, s1, s5063 # 15944
+adds s1, s2, s5062 # 15945
+adds s2, s1, s5061 # 15946
+adds s1, s2, s5060 # 15947
+adds s2, s1, s5059 # 15948
+adds s1, s2, s5058 # 15949
+adds s2, s1, s5057 # 15950
+adds s1, s2, s5056 # 15951
+adds s2, s1, s5055 # 15952
+adds s1, s2, s5054 # 15953
+adds s2, s1, s5053 # 15954
+adds s1, s2, s5052 # 15955
+adds s2, s1, s5051 # 15956
+adds s1, s2, s5050 # 15957
+adds s2, s1, s5049 # 15958
+adds s1, s2, s5048 # 15959
+adds s2, s1, s5047 # 15960
+adds s1, s2, s5046 # 15961
+adds s2, s1, s5045 # 15962
+adds s1, s2, s5044 # 15963
+adds s2, s1, s5043 # 15964
+adds s1, s2, s5042 # 15965
+adds s2, s1, s5041 # 15966
+adds s1, s2, s5040 # 15967
+adds s2, s1, s5039 # 15968
+adds s1, s2, s5038 # 15969
+adds s2, s1, s5037 # 15970
+adds s1, s2, s5036 # 15971
+adds s2, s1, s5035 # 15972
+adds s1, s2, s5034 # 15973
+adds s2, s1, s5033 # 15974
+adds s1, s2, s5032 # 15975
+adds s2, s1, s5031 # 15976
+adds s1, s2, s5030 # 15977
+adds s2, s1, s5029 # 15978
+adds s1, s2, s5028 # 15979
+adds s2, s1, s5027 # 15980
+adds s1, s2, s5026 # 15981
+adds s2, s1, s5025 # 15982
+adds s1, s2, s5024 # 15983
+adds s2, s1, s5023 # 15984
+adds s1, s2, s5022 # 15985
+adds s2, s1, s5021 # 15986
+adds s1, s2, s5020 # 15987
+adds s2, s1, s5019 # 15988
+adds s1, s2, s5018 # 15989
+adds s2, s1, s5017 # 15990
+adds s1, s2, s5016 # 15991
+adds s2, s1, s5015 # 15992
+adds s1, s2, s5014 # 15993
+adds s2, s1, s5013 # 15994
+adds s1, s2, s5012 # 15995
+adds s2, s1, s5011 # 15996
+adds s1, s2, s5010 # 15997
+adds s2, s1, s5009 # 15998
+adds s1, s2, s5008 # 15999
+adds s2, s1, s5007 # 16000
+adds s1, s2, s5006 # 16001
+adds s2, s1, s5005 # 16002
+adds s1, s2, s5004 # 16003
+adds s2, s1, s5003 # 16004
+adds s1, s2, s5002 # 16005
+adds s2, s1, s5001 # 16006
+adds s1, s2, s5000 # 16007
+adds s2, s1, s4999 # 16008
+adds s1, s2, s4998 # 16009
+adds s2, s1, s4997 # 16010
+adds s1, s2, s4996 # 16011
+adds s2, s1, s4995 # 16012
+adds s1, s2, s4994 # 16013
+adds s2, s1, s4993 # 16014
+adds s1, s2, s4992 # 16015
+adds s2, s1, s4991 # 16016
+adds s1, s2, s4990 # 16017
+adds s2, s1, s4989 # 16018
+adds s1, s2, s4988 # 16019
+adds s2, s1, s4987 # 16020
+adds s1, s2, s4986 # 16021
+adds s2, s1, s4985 # 16022
+adds s1, s2, s4984 # 16023
+adds s2, s1, s4983 # 16024
+adds s1, s2, s4982 # 16025
+adds s2, s1, s4981 # 16026
+adds s1, s2, s4980 # 16027
+adds s2, s1, s4979 # 16028
+adds s1, s2, s4978 # 16029
+adds s2, s1, s4977 # 16030
+adds s1, s2, s4976 # 16031
+adds s2, s1, s4975 # 16032
+adds s1, s2, s4974 # 16033
+adds s2, s1, s4973 # 16034
+adds s1, s2, s4972 # 16035
+adds s2, s1, s4971 # 16036
+adds s1, s2, s4970 # 16037
+adds s2, s1, s4969 # 16038
+adds s1, s2, s4968 # 16039
+adds s2, s1, s4967 # 16040
+adds s1, s2, s4966 # 16041
+adds s2, s1, s4965 # 16042
+adds s1, s2, s4964 # 16043
+adds s2, s1, s4963 # 16044
+adds s1, s2, s4962 # 16045
+adds s2, s1, s4961 # 16046
+adds s1, s2, s4960 # 16047
+adds s2, s1, s4959 # 16048
+adds s1, s2, s4958 # 16049
+adds s2, s1, s4957 # 16050
+adds s1, s2, s4956 # 16051
+adds s2, s1, s4955 # 16052
+adds s1, s2, s4954 # 16053
+adds s2, s1, s4953 # 16054
+adds s1, s2, s4952 # 16055
+adds s2, s1, s4951 # 16056
+adds s1, s2, s4950 # 16057
+adds s2, s1, s4949 # 16058
+adds s1, s2, s4948 # 16059
+adds s2, s1, s4947 # 16060
+adds s1, s2, s4946 # 16061
+adds s2, s1, s4945 # 16062
+adds s1, s2, s4944 # 16063
+adds s2, s1, s4943 # 16064
+adds s1, s2, s4942 # 16065
+adds s2, s1, s4941 # 16066
+adds s1, s2, s4940 # 16067
+adds s2, s1, s4939 # 16068
+adds s1, s2, s4938 # 16069
+adds s2, s1, s4937 # 16070
+adds s1, s2, s4936 # 16071
+adds s2, s1, s4935 # 16072
+adds s1, s2, s4934 # 16073
+adds s2, s1, s4933 # 16074
+adds s1, s2, s4932 # 16075
+adds s2, s1, s4931 # 16076
+adds s1, s2, s4930 # 16077
+adds s2, s1, s4929 # 16078
+adds s1, s2, s4928 # 16079
+adds s2, s1, s4927 # 16080
+adds s1, s2, s4926 # 16081
+adds s2, s1, s4925 # 16082
+adds s1, s2, s4924 # 16083
+adds s2, s1, s4923 # 16084
+adds s1, s2, s4922 # 16085
+adds s2, s1, s4921 # 16086
+adds s1, s2, s4920 # 16087
+adds s2, s1, s4919 # 16088
+adds s1, s2, s4918 # 16089
+adds s2, s1, s4917 # 16090
+adds s1, s2, s4916 # 16091
+adds s2, s1, s4915 # 16092
+adds s1, s2, s4914 # 16093
+adds s2, s1, s4913 # 16094
+adds s1, s2, s4912 # 16095
+adds s2, s1, s4911 # 16096
+adds s1, s2, s4910 # 16097
+adds s2, s1, s4909 # 16098
+adds s1, s2, s4908 # 16099
+adds s2, s1, s4907 # 16100
+adds s1, s2, s4906 # 16101
+adds s2, s1, s4905 # 16102
+adds s1, s2, s4904 # 16103
+adds s2, s1, s4903 # 16104
+adds s1, s2, s4902 # 16105
+adds s2, s1, s4901 # 16106
+adds s1, s2, s4900 # 16107
+adds s2, s1, s4899 # 16108
+adds s1, s2, s4898 # 16109
+adds s2, s1, s4897 # 16110
+adds s1, s2, s4896 # 16111
+adds s2, s1, s4895 # 16112
+adds s1, s2, s4894 # 16113
+adds s2, s1, s4893 # 16114
+adds s1, s2, s4892 # 16115
+adds s2, s1, s4891 # 16116
+adds s1, s2, s4890 # 16117
+adds s2, s1, s4889 # 16118
+adds s1, s2, s4888 # 16119
+adds s2, s1, s4887 # 16120
+adds s1, s2, s4886 # 16121
+adds s2, s1, s4885 # 16122
+adds s1, s2, s4884 # 16123
+adds s2, s1, s4883 # 16124
+adds s1, s2, s4882 # 16125
+adds s2, s1, s4881 # 16126
+adds s1, s2, s4880 # 16127
+adds s2, s1, s4879 # 16128
+adds s1, s2, s4878 # 16129
+adds s2, s1, s4877 # 16130
+adds s1, s2, s4876 # 16131
+adds s2, s1, s4875 # 16132
+adds s1, s2, s4874 # 16133
+adds s2, s1, s4873 # 16134
+adds s1, s2, s4872 # 16135
+adds s2, s1, s4871 # 16136
+adds s1, s2, s4870 # 16137
+adds s2, s1, s4869 # 16138
+adds s1, s2, s4868 # 16139
+adds s2, s1, s4867 # 16140
+adds s1, s2, s4866 # 16141
+adds s2, s1, s4865 # 16142
+adds s1, s2, s4864 # 16143
+adds s2, s1, s4863 # 16144
+adds s1, s2, s4862 # 16145
+adds s2, s1, s4861 # 16146
+adds s1, s2, s4860 # 16147
+adds s2, s1, s4859 # 16148
+adds s1, s2, s4858 # 16149
+adds s2, s1, s4857 # 16150
+adds s1, s2, s4856 # 16151
+adds s2, s1, s4855 # 16152
+adds s1, s2, s4854 # 16153
+adds s2, s1, s4853 # 16154
+adds s1, s2, s4852 # 16155
+adds s2, s1, s4851 # 16156
+adds s1, s2, s4850 # 16157
+adds s2, s1, s4849 # 16158
+adds s1, s2, s4848 # 16159
+adds s2, s1, s4847 # 16160
+adds s1, s2, s4846 # 16161
+adds s2, s1, s4845 # 16162
+adds s1, s2, s4844 # 16163
+adds s2, s1, s4843 # 16164
+adds s1, s2, s4842 # 16165
+adds s2, s1, s4841 # 16166
+adds s1, s2, s4840 # 16167
+adds s2, s1, s4839 # 16168
+adds s1, s2, s4838 # 16169
+adds s2, s1, s4837 # 16170
+adds s1, s2, s4836 # 16171
+adds s2, s1, s4835 # 16172
+adds s1, s2, s4834 # 16173
+adds s2, s1, s4833 # 16174
+adds s1, s2, s4832 # 16175
+adds s2, s1, s4831 # 16176
+adds s1, s2, s4830 # 16177
+adds s2, s1, s4829 # 16178
+adds s1, s2, s4828 # 16179
+adds s2, s1, s4827 # 16180
+adds s1, s2, s4826 # 16181
+adds s2, s1, s4825 # 16182
+adds s1, s2, s4824 # 16183
+adds s2, s1, s4823 # 16184
+adds s1, s2, s4822 # 16185
+adds s2, s1, s4821 # 16186
+adds s1, s2, s4820 # 16187
+adds s2, s1, s4819 # 16188
+adds s1, s2, s4818 # 16189
+adds s2, s1, s4817 # 16190
+adds s1, s2, s4816 # 16191
+adds s2, s1, s4815 # 16192
+adds s1, s2, s4814 # 16193
+adds s2, s1, s4813 # 16194
+adds s1, s2, s4812 # 16195
+adds s2, s1, s4811 # 16196
+adds s1, s2, s4810 # 16197
+adds s2, s1, s4809 # 16198
+adds s1, s2, s4808 # 16199
+adds s2, s1, s4807 # 16200
+adds s1, s2, s4806 # 16201
+adds s2, s1, s4805 # 16202
+adds s1, s2, s4804 # 16203
+adds s2, s1, s4803 # 16204
+adds s1, s2, s4802 # 16205
+adds s2, s1, s4801 # 16206
+adds s1, s2, s4800 # 16207
+adds s2, s1, s4799 # 16208
+adds s1, s2, s4798 # 16209
+adds s2, s1, s4797 # 16210
+adds s1, s2, s4796 # 16211
+adds s2, s1, s4795 # 16212
+adds s1, s2, s4794 # 16213
+adds s2, s1, s4793 # 16214
+adds s1, s2, s4792 # 16215
+adds s2, s1, s4791 # 16216
+adds s1, s2, s4790 # 16217
+adds s2, s1, s4789 # 16218
+adds s1, s2, s4788 # 16219
+adds s2, s1, s4787 # 16220
+adds s1, s2, s4786 # 16221
+adds s2, s1, s4785 # 16222
+adds s1, s2, s4784 # 16223
+adds s2, s1, s4783 # 16224
+adds s1, s2, s4782 # 16225
+adds s2, s1, s4781 # 16226
+adds s1, s2, s4780 # 16227
+adds s2, s1, s4779 # 16228
+adds s1, s2, s4778 # 16229
+adds s2, s1, s4777 # 16230
+adds s1, s2, s4776 # 16231
+adds s2, s1, s4775 # 16232
+adds s1, s2, s4774 # 16233
+adds s2, s1, s4773 # 16234
+adds s1, s2, s4772 # 16235
+adds s2, s1, s4771 # 16236
+adds s1, s2, s4770 # 16237
+adds s2, s1, s4769 # 16238
+adds s1, s2, s4768 # 16239
+adds s2, s1, s4767 # 16240
+adds s1, s2, s4766 # 16241
+adds s2, s1, s4765 # 16242
+adds s1, s2, s4764 # 16243
+adds s2, s1, s4763 # 16244
+adds s1, s2, s4762 # 16245
+adds s2, s1, s4761 # 16246
+adds s1, s2, s4760 # 16247
+adds s2, s1, s4759 # 16248
+adds s1, s2, s4758 # 16249
+adds s2, s1, s4757 # 16250
+adds s1, s2, s4756 # 16251
+adds s2, s1, s4755 # 16252
+adds s1, s2, s4754 # 16253
+adds s2, s1, s4753 # 16254
+adds s1, s2, s4752 # 16255
+adds s2, s1, s4751 # 16256
+adds s1, s2, s4750 # 16257
+adds s2, s1, s4749 # 16258
+adds s1, s2, s4748 # 16259
+adds s2, s1, s4747 # 16260
+adds s1, s2, s4746 # 16261
+adds s2, s1, s4745 # 16262
+adds s1, s2, s4744 # 16263
+adds s2, s1, s4743 # 16264
+adds s1, s2, s4742 # 16265
+adds s2, s1, s4741 # 16266
+adds s1, s2, s4740 # 16267
+adds s2, s1, s4739 # 16268
+adds s1, s2, s4738 # 16269
+adds s2, s1, s4737 # 16270
+adds s1, s2, s4736 # 16271
+adds s2, s1, s4735 # 16272
+adds s1, s2, s4734 # 16273
+adds s2, s1, s4733 # 16274
+adds s1, s2, s4732 # 16275
+adds s2, s1, s4731 # 16276
+adds s1, s2, s4730 # 16277
+adds s2, s1, s4729 # 16278
+adds s1, s2, s4728 # 16279
+adds s2, s1, s4727 # 16280
+adds s1, s2, s4726 # 16281
+adds s2, s1, s4725 # 16282
+adds s1, s2, s4724 # 16283
+adds s2, s1, s4723 # 16284
+adds s1, s2, s4722 # 16285
+adds s2, s1, s4721 # 16286
+adds s1, s2, s4720 # 16287
+adds s2, s1, s4719 # 16288
+adds s1, s2, s4718 # 16289
+adds s2, s1, s4717 # 16290
+adds s1, s2, s4716 # 16291
+adds s2, s1, s4715 # 16292
+adds s1, s2, s4714 # 16293
+adds s2, s1, s4713 # 16294
+adds s1, s2, s4712 # 16295
+adds s2, s1, s4711 # 16296
+adds s1, s2, s4710 # 16297
+adds s2, s1, s4709 # 16298
+adds s1, s2, s4708 # 16299
+adds s2, s1, s4707 # 16300
+adds s1, s2, s4706 # 16301
+adds s2, s1, s4705 # 16302
+adds s1, s2, s4704 # 16303
+adds s2, s1, s4703 # 16304
+adds s1, s2, s4702 # 16305
+adds s2, s1, s4701 # 16306
+adds s1, s2, s4700 # 16307
+adds s2, s1, s4699 # 16308
+adds s1, s2, s4698 # 16309
+adds s2, s1, s4697 # 16310
+adds s1, s2, s4696 # 16311
+adds s2, s1, s4695 # 16312
+adds s1, s2, s4694 # 16313
+adds s2, s1, s4693 # 16314
+adds s1, s2, s4692 # 16315
+adds s2, s1, s4691 # 16316
+adds s1, s2, s4690 # 16317
+adds s2, s1, s4689 # 16318
+adds s1, s2, s4688 # 16319
+adds s2, s1, s4687 # 16320
+adds s1, s2, s4686 # 16321
+adds s2, s1, s4685 # 16322
+adds s1, s2, s4684 # 16323
+adds s2, s1, s4683 # 16324
+adds s1, s2, s4682 # 16325
+adds s2, s1, s4681 # 16326
+adds s1, s2, s4680 # 16327
+adds s2, s1, s4679 # 16328
+adds s1, s2, s4678 # 16329
+adds s2, s1, s4677 # 16330
+adds s1, s2, s4676 # 16331
+adds s2, s1, s4675 # 16332
+adds s1, s2, s4674 # 16333
+adds s2, s1, s4673 # 16334
+adds s1, s2, s4672 # 16335
+adds s2, s1, s4671 # 16336
+adds s1, s2, s4670 # 16337
+adds s2, s1, s4669 # 16338
+adds s1, s2, s4668 # 16339
+adds s2, s1, s4667 # 16340
+adds s1, s2, s4666 # 16341
+adds s2, s1, s4665 # 16342
+adds s1, s2, s4664 # 16343
+adds s2, s1, s4663 # 16344
+adds s1, s2, s4662 # 16345
+adds s2, s1, s4661 # 16346
+adds s1, s2, s4660 # 16347
+adds s2, s1, s4659 # 16348
+adds s1, s2, s4658 # 16349
+adds s2, s1, s4657 # 16350
+adds s1, s2, s4656 # 16351
+adds s2, s1, s4655 # 16352
+adds s1, s2, s4654 # 16353
+adds s2, s1, s4653 # 16354
+adds s1, s2, s4652 # 16355
+adds s2, s1, s4651 # 16356
+adds s1, s2, s4650 # 16357
+adds s2, s1, s4649 # 16358
+adds s1, s2, s4648 # 16359
+adds s2, s1, s4647 # 16360
+adds s1, s2, s4646 # 16361
+adds s2, s1, s4645 # 16362
+adds s1, s2, s4644 # 16363
+adds s2, s1, s4643 # 16364
+adds s1, s2, s4642 # 16365
+adds s2, s1, s4641 # 16366
+adds s1, s2, s4640 # 16367
+adds s2, s1, s4639 # 16368
+adds s1, s2, s4638 # 16369
+adds s2, s1, s4637 # 16370
+adds s1, s2, s4636 # 16371
+adds s2, s1, s4635 # 16372
+adds s1, s2, s4634 # 16373
+adds s2, s1, s4633 # 16374
+adds s1, s2, s4632 # 16375
+adds s2, s1, s4631 # 16376
+adds s1, s2, s4630 # 16377
+adds s2, s1, s4629 # 16378
+adds s1, s2, s4628 # 16379
+adds s2, s1, s4627 # 16380
+adds s1, s2, s4626 # 16381
+adds s2, s1, s4625 # 16382
+adds s1, s2, s4624 # 16383
+adds s2, s1, s4623 # 16384
+adds s1, s2, s4622 # 16385
+adds s2, s1, s4621 # 16386
+adds s1, s2, s4620 # 16387
+adds s2, s1, s4619 # 16388
+adds s1, s2, s4618 # 16389
+adds s2, s1, s4617 # 16390
+adds s1, s2, s4616 # 16391
+adds s2, s1, s4615 # 16392
+adds s1, s2, s4614 # 16393
+adds s2, s1, s4613 # 16394
+adds s1, s2, s4612 # 16395
+adds s2, s1, s4611 # 16396
+adds s1, s2, s4610 # 16397
+adds s2, s1, s4609 # 16398
+adds s1, s2, s4608 # 16399
+adds s2, s1, s4607 # 16400
+adds s1, s2, s4606 # 16401
+adds s2, s1, s4605 # 16402
+adds s1, s2, s4604 # 16403
+adds s2, s1, s4603 # 16404
+adds s1, s2, s4602 # 16405
+adds s2, s1, s4601 # 16406
+adds s1, s2, s4600 # 16407
+adds s2, s1, s4599 # 16408
+adds s1, s2, s4598 # 16409
+adds s2, s1, s4597 # 16410
+adds s1, s2, s4596 # 16411
+adds s2, s1, s4595 # 16412
+adds s1, s2, s4594 # 16413
+adds s2, s1, s4593 # 16414
+adds s1, s2, s4592 # 16415
+adds s2, s1, s4591 # 16416
+adds s1, s2, s4590 # 16417
+adds s2, s1, s4589 # 16418
+adds s1, s2, s4588 # 16419
+adds s2, s1, s4587 # 16420
+adds s1, s2, s4586 # 16421
+adds s2, s1, s4585 # 16422
+adds s1, s2, s4584 # 16423
+adds s2, s1, s4583 # 16424
+adds s1, s2, s4582 # 16425
+adds s2, s1, s4581 # 16426
+adds s1, s2, s4580 # 16427
+adds s2, s1, s4579 # 16428
+adds s1, s2, s4578 # 16429
+adds s2, s1, s4577 # 16430
+adds s1, s2, s4576 # 16431
+adds s2, s1, s4575 # 16432
+adds s1, s2, s4574 # 16433
+adds s2, s1, s4573 # 16434
+adds s1, s2, s4572 # 16435
+adds s2, s1, s4571 # 16436
+adds s1, s2, s4570 # 16437
+adds s2, s1, s4569 # 16438
+adds s1, s2, s4568 # 16439
+adds s2, s1, s4567 # 16440
+adds s1, s2, s4566 # 16441
+adds s2, s1, s4565 # 16442
+adds s1, s2, s4564 # 16443
+adds s2, s1, s4563 # 16444
+adds s1, s2, s4562 # 16445
+adds s2, s1, s4561 # 16446
+adds s1, s2, s4560 # 16447
+adds s2, s1, s4559 # 16448
+adds s1, s2, s4558 # 16449
+adds s2, s1, s4557 # 16450
+adds s1, s2, s4556 # 16451
+adds s2, s1, s4555 # 16452
+adds s1, s2, s4554 # 16453
+adds s2, s1, s4553 # 16454
+adds s1, s2, s4552 # 16455
+adds s2, s1, s4551 # 16456
+adds s1, s2, s4550 # 16457
+adds s2, s1, s4549 # 16458
+adds s1, s2, s4548 # 16459
+adds s2, s1, s4547 # 16460
+adds s1, s2, s4546 # 16461
+adds s2, s1, s4545 # 16462
+adds s1, s2, s4544 # 16463
+adds s2, s1, s4543 # 16464
+adds s1, s2, s4542 # 16465
+adds s2, s1, s4541 # 16466
+adds s1, s2, s4540 # 16467
+adds s2, s1, s4539 # 16468
+adds s1, s2, s4538 # 16469
+adds s2, s1, s4537 # 16470
+adds s1, s2, s4536 # 16471
+adds s2, s1, s4535 # 16472
+adds s1, s2, s4534 # 16473
+adds s2, s1, s4533 # 16474
+adds s1, s2, s4532 # 16475
+adds s2, s1, s4531 # 16476
+adds s1, s2, s4530 # 16477
+adds s2, s1, s4529 # 16478
+adds s1, s2, s4528 # 16479
+adds s2, s1, s4527 # 16480
+adds s1, s2, s4526 # 16481
+adds s2, s1, s4525 # 16482
+adds s1, s2, s4524 # 16483
+adds s2, s1, s4523 # 16484
+adds s1, s2, s4522 # 16485
+adds s2, s1, s4521 # 16486
+adds s1, s2, s4520 # 16487
+adds s2, s1, s4519 # 16488
+adds s1, s2, s4518 # 16489
+adds s2, s1, s4517 # 16490
+adds s1, s2, s4516 # 16491
+adds s2, s1, s4515 # 16492
+adds s1, s2, s4514 # 16493
+adds s2, s1, s4513 # 16494
+adds s1, s2, s4512 # 16495
+adds s2, s1, s4511 # 16496
+adds s1, s2, s4510 # 16497
+adds s2, s1, s4509 # 16498
+adds s1, s2, s4508 # 16499
+adds s2, s1, s4507 # 16500
+adds s1, s2, s4506 # 16501
+adds s2, s1, s4505 # 16502
+adds s1, s2, s4504 # 16503
+adds s2, s1, s4503 # 16504
+adds s1, s2, s4502 # 16505
+adds s2, s1, s4501 # 16506
+adds s1, s2, s4500 # 16507
+adds s2, s1, s4499 # 16508
+adds s1, s2, s4498 # 16509
+adds s2, s1, s4497 # 16510
+adds s1, s2, s4496 # 16511
+adds s2, s1, s4495 # 16512
+adds s1, s2, s4494 # 16513
+adds s2, s1, s4493 # 16514
+adds s1, s2, s4492 # 16515
+adds s2, s1, s4491 # 16516
+adds s1, s2, s4490 # 16517
+adds s2, s1, s4489 # 16518
+adds s1, s2, s4488 # 16519
+adds s2, s1, s4487 # 16520
+adds s1, s2, s4486 # 16521
+adds s2, s1, s4485 # 16522
+adds s1, s2, s4484 # 16523
+adds s2, s1, s4483 # 16524
+adds s1, s2, s4482 # 16525
+adds s2, s1, s4481 # 16526
+adds s1, s2, s4480 # 16527
+adds s2, s1, s4479 # 16528
+adds s1, s2, s4478 # 16529
+adds s2, s1, s4477 # 16530
+adds s1, s2, s4476 # 16531
+adds s2, s1, s4475 # 16532
+adds s1, s2, s4474 # 16533
+adds s2, s1, s4473 # 16534
+adds s1, s2, s4472 # 16535
+adds s2, s1, s4471 # 16536
+adds s1, s2, s4470 # 16537
+adds s2, s1, s4469 # 16538
+adds s1, s2, s4468 # 16539
+adds s2, s1, s4467 # 16540
+adds s1, s2, s4466 # 16541
+adds s2, s1, s4465 # 16542
+adds s1, s2, s4464 # 16543
+adds s2, s1, s4463 # 16544
+adds s1, s2, s4462 # 16545
+adds s2, s1, s4461 # 16546
+adds s1, s2, s4460 # 16547
+adds s2, s1, s4459 # 16548
+adds s1, s2, s4458 # 16549
+adds s2, s1, s4457 # 16550
+adds s1, s2, s4456 # 16551
+adds s2, s1, s4455 # 16552
+adds s1, s2, s4454 # 16553
+adds s2, s1, s4453 # 16554
+adds s1, s2, s4452 # 16555
+adds s2, s1, s4451 # 16556
+adds s1, s2, s4450 # 16557
+adds s2, s1, s4449 # 16558
+adds s1, s2, s4448 # 16559
+adds s2, s1, s4447 # 16560
+adds s1, s2, s4446 # 16561
+adds s2, s1, s4445 # 16562
+adds s1, s2, s4444 # 16563
+adds s2, s1, s4443 # 16564
+adds s1, s2, s4442 # 16565
+adds s2, s1, s4441 # 16566
+adds s1, s2, s4440 # 16567
+adds s2, s1, s4439 # 16568
+adds s1, s2, s4438 # 16569
+adds s2, s1, s4437 # 16570
+adds s1, s2, s4436 # 16571
+adds s2, s1, s4435 # 16572
+adds s1, s2, s4434 # 16573
+adds s2, s1, s4433 # 16574
+adds s1, s2, s4432 # 16575
+adds s2, s1, s4431 # 16576
+adds s1, s2, s4430 # 16577
+adds s2, s1, s4429 # 16578
+adds s1, s2, s4428 # 16579
+adds s2, s1, s4427 # 16580
+adds s1, s2, s4426 # 16581
+adds s2, s1, s4425 # 16582
+adds s1, s2, s4424 # 16583
+adds s2, s1, s4423 # 16584
+adds s1, s2, s4422 # 16585
+adds s2, s1, s4421 # 16586
+adds s1, s2, s4420 # 16587
+adds s2, s1, s4419 # 16588
+adds s1, s2, s4418 # 16589
+adds s2, s1, s4417 # 16590
+adds s1, s2, s4416 # 16591
+adds s2, s1, s4415 # 16592
+adds s1, s2, s4414 # 16593
+adds s2, s1, s4413 # 16594
+adds s1, s2, s4412 # 16595
+adds s2, s1, s4411 # 16596
+adds s1, s2, s4410 # 16597
+adds s2, s1, s4409 # 16598
+adds s1, s2, s4408 # 16599
+adds s2, s1, s4407 # 16600
+adds s1, s2, s4406 # 16601
+adds s2, s1, s4405 # 16602
+adds s1, s2, s4404 # 16603
+adds s2, s1, s4403 # 16604
+adds s1, s2, s4402 # 16605
+adds s2, s1, s4401 # 16606
+adds s1, s2, s4400 # 16607
+adds s2, s1, s4399 # 16608
+adds s1, s2, s4398 # 16609
+adds s2, s1, s4397 # 16610
+adds s1, s2, s4396 # 16611
+adds s2, s1, s4395 # 16612
+adds s1, s2, s4394 # 16613
+adds s2, s1, s4393 # 16614
+adds s1, s2, s4392 # 16615
+adds s2, s1, s4391 # 16616
+adds s1, s2, s4390 # 16617
+adds s2, s1, s4389 # 16618
+adds s1, s2, s4388 # 16619
+adds s2, s1, s4387 # 16620
+adds s1, s2, s4386 # 16621
+adds s2, s1, s4385 # 16622
+adds s1, s2, s4384 # 16623
+adds s2, s1, s4383 # 16624
+adds s1, s2, s4382 # 16625
+adds s2, s1, s4381 # 16626
+adds s1, s2, s4380 # 16627
+adds s2, s1, s4379 # 16628
+adds s1, s2, s4378 # 16629
+adds s2, s1, s4377 # 16630
+adds s1, s2, s4376 # 16631
+adds s2, s1, s4375 # 16632
+adds s1, s2, s4374 # 16633
+adds s2, s1, s4373 # 16634
+adds s1, s2, s4372 # 16635
+adds s2, s1, s4371 # 16636
+adds s1, s2, s4370 # 16637
+adds s2, s1, s4369 # 16638
+adds s1, s2, s4368 # 16639
+adds s2, s1, s4367 # 16640
+adds s1, s2, s4366 # 16641
+adds s2, s1, s4365 # 16642
+adds s1, s2, s4364 # 16643
+adds s2, s1, s4363 # 16644
+adds s1, s2, s4362 # 16645
+adds s2, s1, s4361 # 16646
+adds s1, s2, s4360 # 16647
+adds s2, s1, s4359 # 16648
+adds s1, s2, s4358 # 16649
+adds s2, s1, s4357 # 16650
+adds s1, s2, s4356 # 16651
+adds s2, s1, s4355 # 16652
+adds s1, s2, s4354 # 16653
+adds s2, s1, s4353 # 16654
+adds s1, s2, s4352 # 16655
+adds s2, s1, s4351 # 16656
+adds s1, s2, s4350 # 16657
+adds s2, s1, s4349 # 16658
+adds s1, s2, s4348 # 16659
+adds s2, s1, s4347 # 16660
+adds s1, s2, s4346 # 16661
+adds s2, s1, s4345 # 16662
+adds s1, s2, s4344 # 16663
+adds s2, s1, s4343 # 16664
+adds s1, s2, s4342 # 16665
+adds s2, s1, s4341 # 16666
+adds s1, s2, s4340 # 16667
+adds s2, s1, s4339 # 16668
+adds s1, s2, s4338 # 16669
+adds s2, s1, s4337 # 16670
+adds s1, s2, s4336 # 16671
+adds s2, s1, s4335 # 16672
+adds s1, s2, s4334 # 16673
+adds s2, s1, s4333 # 16674
+adds s1, s2, s4332 # 16675
+adds s2, s1, s4331 # 16676
+adds s1, s2, s4330 # 16677
+adds s2, s1, s4329 # 16678
+adds s1, s2, s4328 # 16679
+adds s2, s1, s4327 # 16680
+adds s1, s2, s4326 # 16681
+adds s2, s1, s4325 # 16682
+adds s1, s2, s4324 # 16683
+adds s2, s1, s4323 # 16684
+adds s1, s2, s4322 # 16685
+adds s2, s1, s4321 # 16686
+adds s1, s2, s4320 # 16687
+adds s2, s1, s4319 # 16688
+adds s1, s2, s4318 # 16689
+adds s2, s1, s4317 # 16690
+adds s1, s2, s4316 # 16691
+adds s2, s1, s4315 # 16692
+adds s1, s2, s4314 # 16693
+adds s2, s1, s4313 # 16694
+adds s1, s2, s4312 # 16695
+adds s2, s1, s4311 # 16696
+adds s1, s2, s4310 # 16697
+adds s2, s1, s4309 # 16698
+adds s1, s2, s4308 # 16699
+adds s2, s1, s4307 # 16700
+adds s1, s2, s4306 # 16701
+adds s2, s1, s4305 # 16702
+adds s1, s2, s4304 # 16703
+adds s2, s1, s4303 # 16704
+adds s1, s2, s4302 # 16705
+adds s2, s1, s4301 # 16706
+adds s1, s2, s4300 # 16707
+adds s2, s1, s4299 # 16708
+adds s1, s2, s4298 # 16709
+adds s2, s1, s4297 # 16710
+adds s1, s2, s4296 # 16711
+adds s2, s1, s4295 # 16712
+adds s1, s2, s4294 # 16713
+adds s2, s1, s4293 # 16714
+adds s1, s2, s4292 # 16715
+adds s2, s1, s4291 # 16716
+adds s1, s2, s4290 # 16717
+adds s2, s1, s4289 # 16718
+adds s1, s2, s4288 # 16719
+adds s2, s1, s4287 # 16720
+adds s1, s2, s4286 # 16721
+adds s2, s1, s4285 # 16722
+adds s1, s2, s4284 # 16723
+adds s2, s1, s4283 # 16724
+adds s1, s2, s4282 # 16725
+adds s2, s1, s4281 # 16726
+adds s1, s2, s4280 # 16727
+adds s2, s1, s4279 # 16728
+adds s1, s2, s4278 # 16729
+adds s2, s1, s4277 # 16730
+adds s1, s2, s4276 # 16731
+adds s2, s1, s4275 # 16732
+adds s1, s2, s4274 # 16733
+adds s2, s1, s4273 # 16734
+adds s1, s2, s4272 # 16735
+adds s2, s1, s4271 # 16736
+adds s1, s2, s4270 # 16737
+adds s2, s1, s4269 # 16738
+adds s1, s2, s4268 # 16739
+adds s2, s1, s4267 # 16740
+adds s1, s2, s4266 # 16741
+adds s2, s1, s4265 # 16742
+adds s1, s2, s4264 # 16743
+adds s2, s1, s4263 # 16744
+adds s1, s2, s4262 # 16745
+adds s2, s1, s4261 # 16746
+adds s1, s2, s4260 # 16747
+adds s2, s1, s4259 # 16748
+adds s1, s2, s4258 # 16749
+adds s2, s1, s4257 # 16750
+adds s1, s2, s4256 # 16751
+adds s2, s1, s4255 # 16752
+adds s1, s2, s4254 # 16753
+adds s2, s1, s4253 # 16754
+adds s1, s2, s4252 # 16755
+adds s2, s1, s4251 # 16756
+adds s1, s2, s4250 # 16757
+adds s2, s1, s4249 # 16758
+adds s1, s2, s4248 # 16759
+adds s2, s1, s4247 # 16760
+adds s1, s2, s4246 # 16761
+adds s2, s1, s4245 # 16762
+adds s1, s2, s4244 # 16763
+adds s2, s1, s4243 # 16764
+adds s1, s2, s4242 # 16765
+adds s2, s1, s4241 # 16766
+adds s1, s2, s4240 # 16767
+adds s2, s1, s4239 # 16768
+adds s1, s2, s4238 # 16769
+adds s2, s1, s4237 # 16770
+adds s1, s2, s4236 # 16771
+adds s2, s1, s4235 # 16772
+adds s1, s2, s4234 # 16773
+adds s2, s1, s4233 # 16774
+adds s1, s2, s4232 # 16775
+adds s2, s1, s4231 # 16776
+adds s1, s2, s4230 # 16777
+adds s2, s1, s4229 # 16778
+adds s1, s2, s4228 # 16779
+adds s2, s1, s4227 # 16780
+adds s1, s2, s4226 # 16781
+adds s2, s1, s4225 # 16782
+adds s1, s2, s4224 # 16783
+adds s2, s1, s4223 # 16784
+adds s1, s2, s4222 # 16785
+adds s2, s1, s4221 # 16786
+adds s1, s2, s4220 # 16787
+adds s2, s1, s4219 # 16788
+adds s1, s2, s4218 # 16789
+adds s2, s1, s4217 # 16790
+adds s1, s2, s4216 # 16791
+adds s2, s1, s4215 # 16792
+adds s1, s2, s4214 # 16793
+adds s2, s1, s4213 # 16794
+adds s1, s2, s4212 # 16795
+adds s2, s1, s4211 # 16796
+adds s1, s2, s4210 # 16797
+adds s2, s1, s4209 # 16798
+adds s1, s2, s4208 # 16799
+adds s2, s1, s4207 # 16800
+adds s1, s2, s4206 # 16801
+adds s2, s1, s4205 # 16802
+adds s1, s2, s4204 # 16803
+adds s2, s1, s4203 # 16804
+adds s1, s2, s4202 # 16805
+adds s2, s1, s4201 # 16806
+adds s1, s2, s4200 # 16807
+adds s2, s1, s4199 # 16808
+adds s1, s2, s4198 # 16809
+adds s2, s1, s4197 # 16810
+adds s1, s2, s4196 # 16811
+adds s2, s1, s4195 # 16812
+adds s1, s2, s4194 # 16813
+adds s2, s1, s4193 # 16814
+adds s1, s2, s4192 # 16815
+adds s2, s1, s4191 # 16816
+adds s1, s2, s4190 # 16817
+adds s2, s1, s4189 # 16818
+adds s1, s2, s4188 # 16819
+adds s2, s1, s4187 # 16820
+adds s1, s2, s4186 # 16821
+adds s2, s1, s4185 # 16822
+adds s1, s2, s4184 # 16823
+adds s2, s1, s4183 # 16824
+adds s1, s2, s4182 # 16825
+adds s2, s1, s4181 # 16826
+adds s1, s2, s4180 # 16827
+adds s2, s1, s4179 # 16828
+adds s1, s2, s4178 # 16829
+adds s2, s1, s4177 # 16830
+adds s1, s2, s4176 # 16831
+adds s2, s1, s4175 # 16832
+adds s1, s2, s4174 # 16833
+adds s2, s1, s4173 # 16834
+adds s1, s2, s4172 # 16835
+adds s2, s1, s4171 # 16836
+adds s1, s2, s4170 # 16837
+adds s2, s1, s4169 # 16838
+adds s1, s2, s4168 # 16839
+adds s2, s1, s4167 # 16840
+adds s1, s2, s4166 # 16841
+adds s2, s1, s4165 # 16842
+adds s1, s2, s4164 # 16843
+adds s2, s1, s4163 # 16844
+adds s1, s2, s4162 # 16845
+adds s2, s1, s4161 # 16846
+adds s1, s2, s4160 # 16847
+adds s2, s1, s4159 # 16848
+adds s1, s2, s4158 # 16849
+adds s2, s1, s4157 # 16850
+adds s1, s2, s4156 # 16851
+adds s2, s1, s4155 # 16852
+adds s1, s2, s4154 # 16853
+adds s2, s1, s4153 # 16854
+adds s1, s2, s4152 # 16855
+adds s2, s1, s4151 # 16856
+adds s1, s2, s4150 # 16857
+adds s2, s1, s4149 # 16858
+adds s1, s2, s4148 # 16859
+adds s2, s1, s4147 # 16860
+adds s1, s2, s4146 # 16861
+adds s2, s1, s4145 # 16862
+adds s1, s2, s4144 # 16863
+adds s2, s1, s4143 # 16864
+adds s1, s2, s4142 # 16865
+adds s2, s1, s4141 # 16866
+adds s1, s2, s4140 # 16867
+adds s2, s1, s4139 # 16868
+adds s1, s2, s4138 # 16869
+adds s2, s1, s4137 # 16870
+adds s1, s2, s4136 # 16871
+adds s2, s1, s4135 # 16872
+adds s1, s2, s4134 # 16873
+adds s2, s1, s4133 # 16874
+adds s1, s2, s4132 # 16875
+adds s2, s1, s4131 # 16876
+adds s1, s2, s4130 # 16877
+adds s2, s1, s4129 # 16878
+adds s1, s2, s4128 # 16879
+adds s2, s1, s4127 # 16880
+adds s1, s2, s4126 # 16881
+adds s2, s1, s4125 # 16882
+adds s1, s2, s4124 # 16883
+adds s2, s1, s4123 # 16884
+adds s1, s2, s4122 # 16885
+adds s2, s1, s4121 # 16886
+adds s1, s2, s4120 # 16887
+adds s2, s1, s4119 # 16888
+adds s1, s2, s4118 # 16889
+adds s2, s1, s4117 # 16890
+adds s1, s2, s4116 # 16891
+adds s2, s1, s4115 # 16892
+adds s1, s2, s4114 # 16893
+adds s2, s1, s4113 # 16894
+adds s1, s2, s4112 # 16895
+adds s2, s1, s4111 # 16896
+adds s1, s2, s4110 # 16897
+adds s2, s1, s4109 # 16898
+adds s1, s2, s4108 # 16899
+adds s2, s1, s4107 # 16900
+adds s1, s2, s4106 # 16901
+adds s2, s1, s4105 # 16902
+adds s1, s2, s4104 # 16903
+adds s2, s1, s4103 # 16904
+adds s1, s2, s4102 # 16905
+adds s2, s1, s4101 # 16906
+adds s1, s2, s4100 # 16907
+adds s2, s1, s4099 # 16908
+adds s1, s2, s4098 # 16909
+adds s2, s1, s4097 # 16910
+adds s1, s2, s4096 # 16911
+adds s2, s1, s4095 # 16912
+adds s1, s2, s4094 # 16913
+adds s2, s1, s4093 # 16914
+adds s1, s2, s4092 # 16915
+adds s2, s1, s4091 # 16916
+adds s1, s2, s4090 # 16917
+adds s2, s1, s4089 # 16918
+adds s1, s2, s4088 # 16919
+adds s2, s1, s4087 # 16920
+adds s1, s2, s4086 # 16921
+adds s2, s1, s4085 # 16922
+adds s1, s2, s4084 # 16923
+adds s2, s1, s4083 # 16924
+adds s1, s2, s4082 # 16925
+adds s2, s1, s4081 # 16926
+adds s1, s2, s4080 # 16927
+adds s2, s1, s4079 # 16928
+adds s1, s2, s4078 # 16929
+adds s2, s1, s4077 # 16930
+adds s1, s2, s4076 # 16931
+adds s2, s1, s4075 # 16932
+adds s1, s2, s4074 # 16933
+adds s2, s1, s4073 # 16934
+adds s1, s2, s4072 # 16935
+adds s2, s1, s4071 # 16936
+adds s1, s2, s4070 # 16937
+adds s2, s1, s4069 # 16938
+adds s1, s2, s4068 # 16939
+adds s2, s1, s4067 # 16940
+adds s1, s2, s4066 # 16941
+adds s2, s1, s4065 # 16942
+adds s1, s2, s4064 # 16943
+adds s2, s1, s4063 # 16944
+adds s1, s2, s4062 # 16945
+adds s2, s1, s4061 # 16946
+adds s1, s2, s4060 # 16947
+adds s2, s1, s4059 # 16948
+adds s1, s2, s4058 # 16949
+adds s2, s1, s4057 # 16950
+adds s1, s2, s4056 # 16951
+adds s2, s1, s4055 # 16952
+adds s1, s2, s4054 # 16953
+adds s2, s1, s4053 # 16954
+adds s1, s2, s4052 # 16955
+adds s2, s1, s4051 # 16956
+adds s1, s2, s4050 # 16957
+adds s2, s1, s4049 # 16958
+adds s1, s2, s4048 # 16959
+adds s2, s1, s4047 # 16960
+adds s1, s2, s4046 # 16961
+adds s2, s1, s4045 # 16962
+adds s1, s2, s4044 # 16963
+adds s2, s1, s4043 # 16964
+adds s1, s2, s4042 # 16965
+adds s2, s1, s4041 # 16966
+adds s1, s2, s4040 # 16967
+adds s2, s1, s4039 # 16968
+adds s1, s2, s4038 # 16969
+adds s2, s1, s4037 # 16970
+adds s1, s2, s4036 # 16971
+adds s2, s1, s4035 # 16972
+adds s1, s2, s4034 # 16973
+adds s2, s1, s4033 # 16974
+adds s1, s2, s4032 # 16975
+adds s2, s1, s4031 # 16976
+adds s1, s2, s4030 # 16977
+adds s2, s1, s4029 # 16978
+adds s1, s2, s4028 # 16979
+adds s2, s1, s4027 # 16980
+adds s1, s2, s4026 # 16981
+adds s2, s1, s4025 # 16982
+adds s1, s2, s4024 # 16983
+adds s2, s1, s4023 # 16984
+adds s1, s2, s4022 # 16985
+adds s2, s1, s4021 # 16986
+adds s1, s2, s4020 # 16987
+adds s2, s1, s4019 # 16988
+adds s1, s2, s4018 # 16989
+adds s2, s1, s4017 # 16990
+adds s1, s2, s4016 # 16991
+adds s2, s1, s4015 # 16992
+adds s1, s2, s4014 # 16993
+adds s2, s1, s4013 # 16994
+adds s1, s2, s4012 # 16995
+adds s2, s1, s4011 # 16996
+adds s1, s2, s4010 # 16997
+adds s2, s1, s4009 # 16998
+adds s1, s2, s4008 # 16999
+adds s2, s1, s4007 # 17000
+adds s1, s2, s4006 # 17001
+adds s2, s1, s4005 # 17002
+adds s1, s2, s4004 # 17003
+adds s2, s1, s4003 # 17004
+adds s1, s2, s4002 # 17005
+adds s2, s1, s4001 # 17006
+adds s1, s2, s4000 # 17007
+adds s2, s1, s3999 # 17008
+adds s1, s2, s3998 # 17009
+adds s2, s1, s3997 # 17010
+adds s1, s2, s3996 # 17011
+adds s2, s1, s3995 # 17012
+adds s1, s2, s3994 # 17013
+adds s2, s1, s3993 # 17014
+adds s1, s2, s3992 # 17015
+adds s2, s1, s3991 # 17016
+adds s1, s2, s3990 # 17017
+adds s2, s1, s3989 # 17018
+adds s1, s2, s3988 # 17019
+adds s2, s1, s3987 # 17020
+adds s1, s2, s3986 # 17021
+adds s2, s1, s3985 # 17022
+adds s1, s2, s3984 # 17023
+adds s2, s1, s3983 # 17024
+adds s1, s2, s3982 # 17025
+adds s2, s1, s3981 # 17026
+adds s1, s2, s3980 # 17027
+adds s2, s1, s3979 # 17028
+adds s1, s2, s3978 # 17029
+adds s2, s1, s3977 # 17030
+adds s1, s2, s3976 # 17031
+adds s2, s1, s3975 # 17032
+adds s1, s2, s3974 # 17033
+adds s2, s1, s3973 # 17034
+adds s1, s2, s3972 # 17035
+adds s2, s1, s3971 # 17036
+adds s1, s2, s3970 # 17037
+adds s2, s1, s3969 # 17038
+adds s1, s2, s3968 # 17039
+adds s2, s1, s3967 # 17040
+adds s1, s2, s3966 # 17041
+adds s2, s1, s3965 # 17042
+adds s1, s2, s3964 # 17043
+adds s2, s1, s3963 # 17044
+adds s1, s2, s3962 # 17045
+adds s2, s1, s3961 # 17046
+adds s1, s2, s3960 # 17047
+adds s2, s1, s3959 # 17048
+adds s1, s2, s3958 # 17049
+adds s2, s1, s3957 # 17050
+adds s1, s2, s3956 # 17051
+adds s2, s1, s3955 # 17052
+adds s1, s2, s3954 # 17053
+adds s2, s1, s3953 # 17054
+adds s1, s2, s3952 # 17055
+adds s2, s1, s3951 # 17056
+adds s1, s2, s3950 # 17057
+adds s2, s1, s3949 # 17058
+adds s1, s2, s3948 # 17059
+adds s2, s1, s3947 # 17060
+adds s1, s2, s3946 # 17061
+adds s2, s1, s3945 # 17062
+adds s1, s2, s3944 # 17063
+adds s2, s1, s3943 # 17064
+adds s1, s2, s3942 # 17065
+adds s2, s1, s3941 # 17066
+adds s1, s2, s3940 # 17067
+adds s2, s1, s3939 # 17068
+adds s1, s2, s3938 # 17069
+adds s2, s1, s3937 # 17070
+adds s1, s2, s3936 # 17071
+adds s2, s1, s3935 # 17072
+adds s1, s2, s3934 # 17073
+adds s2, s1, s3933 # 17074
+adds s1, s2, s3932 # 17075
+adds s2, s1, s3931 # 17076
+adds s1, s2, s3930 # 17077
+adds s2, s1, s3929 # 17078
+adds s1, s2, s3928 # 17079
+adds s2, s1, s3927 # 17080
+adds s1, s2, s3926 # 17081
+adds s2, s1, s3925 # 17082
+adds s1, s2, s3924 # 17083
+adds s2, s1, s3923 # 17084
+adds s1, s2, s3922 # 17085
+adds s2, s1, s3921 # 17086
+adds s1, s2, s3920 # 17087
+adds s2, s1, s3919 # 17088
+adds s1, s2, s3918 # 17089
+adds s2, s1, s3917 # 17090
+adds s1, s2, s3916 # 17091
+adds s2, s1, s3915 # 17092
+adds s1, s2, s3914 # 17093
+adds s2, s1, s3913 # 17094
+adds s1, s2, s3912 # 17095
+adds s2, s1, s3911 # 17096
+adds s1, s2, s3910 # 17097
+adds s2, s1, s3909 # 17098
+adds s1, s2, s3908 # 17099
+adds s2, s1, s3907 # 17100
+adds s1, s2, s3906 # 17101
+adds s2, s1, s3905 # 17102
+adds s1, s2, s3904 # 17103
+adds s2, s1, s3903 # 17104
+adds s1, s2, s3902 # 17105
+adds s2, s1, s3901 # 17106
+adds s1, s2, s3900 # 17107
+adds s2, s1, s3899 # 17108
+adds s1, s2, s3898 # 17109
+adds s2, s1, s3897 # 17110
+adds s1, s2, s3896 # 17111
+adds s2, s1, s3895 # 17112
+adds s1, s2, s3894 # 17113
+adds s2, s1, s3893 # 17114
+adds s1, s2, s3892 # 17115
+adds s2, s1, s3891 # 17116
+adds s1, s2, s3890 # 17117
+adds s2, s1, s3889 # 17118
+adds s1, s2, s3888 # 17119
+adds s2, s1, s3887 # 17120
+adds s1, s2, s3886 # 17121
+adds s2, s1, s3885 # 17122
+adds s1, s2, s3884 # 17123
+adds s2, s1, s3883 # 17124
+adds s1, s2, s3882 # 17125
+adds s2, s1, s3881 # 17126
+adds s1, s2, s3880 # 17127
+adds s2, s1, s3879 # 17128
+adds s1, s2, s3878 # 17129
+adds s2, s1, s3877 # 17130
+adds s1, s2, s3876 # 17131
+adds s2, s1, s3875 # 17132
+adds s1, s2, s3874 # 17133
+adds s2, s1, s3873 # 17134
+adds s1, s2, s3872 # 17135
+adds s2, s1, s3871 # 17136
+adds s1, s2, s3870 # 17137
+adds s2, s1, s3869 # 17138
+adds s1, s2, s3868 # 17139
+adds s2, s1, s3867 # 17140
+adds s1, s2, s3866 # 17141
+adds s2, s1, s3865 # 17142
+adds s1, s2, s3864 # 17143
+adds s2, s1, s3863 # 17144
+adds s1, s2, s3862 # 17145
+adds s2, s1, s3861 # 17146
+adds s1, s2, s3860 # 17147
+adds s2, s1, s3859 # 17148
+adds s1, s2, s3858 # 17149
+adds s2, s1, s3857 # 17150
+adds s1, s2, s3856 # 17151
+adds s2, s1, s3855 # 17152
+adds s1, s2, s3854 # 17153
+adds s2, s1, s3853 # 17154
+adds s1, s2, s3852 # 17155
+adds s2, s1, s3851 # 17156
+adds s1, s2, s3850 # 17157
+adds s2, s1, s3849 # 17158
+adds s1, s2, s3848 # 17159
+adds s2, s1, s3847 # 17160
+adds s1, s2, s3846 # 17161
+adds s2, s1, s3845 # 17162
+adds s1, s2, s3844 # 17163
+adds s2, s1, s3843 # 17164
+adds s1, s2, s3842 # 17165
+adds s2, s1, s3841 # 17166
+adds s1, s2, s3840 # 17167
+adds s2, s1, s3839 # 17168
+adds s1, s2, s3838 # 17169
+adds s2, s1, s3837 # 17170
+adds s1, s2, s3836 # 17171
+adds s2, s1, s3835 # 17172
+adds s1, s2, s3834 # 17173
+adds s2, s1, s3833 # 17174
+adds s1, s2, s3832 # 17175
+adds s2, s1, s3831 # 17176
+adds s1, s2, s3830 # 17177
+adds s2, s1, s3829 # 17178
+adds s1, s2, s3828 # 17179
+adds s2, s1, s3827 # 17180
+adds s1, s2, s3826 # 17181
+adds s2, s1, s3825 # 17182
+adds s1, s2, s3824 # 17183
+adds s2, s1, s3823 # 17184
+adds s1, s2, s3822 # 17185
+adds s2, s1, s3821 # 17186
+adds s1, s2, s3820 # 17187
+adds s2, s1, s3819 # 17188
+adds s1, s2, s3818 # 17189
+adds s2, s1, s3817 # 17190
+adds s1, s2, s3816 # 17191
+adds s2, s1, s3815 # 17192
+adds s1, s2, s3814 # 17193
+adds s2, s1, s3813 # 17194
+adds s1, s2, s3812 # 17195
+adds s2, s1, s3811 # 17196
+adds s1, s2, s3810 # 17197
+adds s2, s1, s3809 # 17198
+adds s1, s2, s3808 # 17199
+adds s2, s1, s3807 # 17200
+adds s1, s2, s3806 # 17201
+adds s2, s1, s3805 # 17202
+adds s1, s2, s3804 # 17203
+adds s2, s1, s3803 # 17204
+adds s1, s2, s3802 # 17205
+adds s2, s1, s3801 # 17206
+adds s1, s2, s3800 # 17207
+adds s2, s1, s3799 # 17208
+adds s1, s2, s3798 # 17209
+adds s2, s1, s3797 # 17210
+adds s1, s2, s3796 # 17211
+adds s2, s1, s3795 # 17212
+adds s1, s2, s3794 # 17213
+adds s2, s1, s3793 # 17214
+adds s1, s2, s3792 # 17215
+adds s2, s1, s3791 # 17216
+adds s1, s2, s3790 # 17217
+adds s2, s1, s3789 # 17218
+adds s1, s2, s3788 # 17219
+adds s2, s1, s3787 # 17220
+adds s1, s2, s3786 # 17221
+adds s2, s1, s3785 # 17222
+adds s1, s2, s3784 # 17223
+adds s2, s1, s3783 # 17224
+adds s1, s2, s3782 # 17225
+adds s2, s1, s3781 # 17226
+adds s1, s2, s3780 # 17227
+adds s2, s1, s3779 # 17228
+adds s1, s2, s3778 # 17229
+adds s2, s1, s3777 # 17230
+adds s1, s2, s3776 # 17231
+adds s2, s1, s3775 # 17232
+adds s1, s2, s3774 # 17233
+adds s2, s1, s3773 # 17234
+adds s1, s2, s3772 # 17235
+adds s2, s1, s3771 # 17236
+adds s1, s2, s3770 # 17237
+adds s2, s1, s3769 # 17238
+adds s1, s2, s3768 # 17239
+adds s2, s1, s3767 # 17240
+adds s1, s2, s3766 # 17241
+adds s2, s1, s3765 # 17242
+adds s1, s2, s3764 # 17243
+adds s2, s1, s3763 # 17244
+adds s1, s2, s3762 # 17245
+adds s2, s1, s3761 # 17246
+adds s1, s2, s3760 # 17247
+adds s2, s1, s3759 # 17248
+adds s1, s2, s3758 # 17249
+adds s2, s1, s3757 # 17250
+adds s1, s2, s3756 # 17251
+adds s2, s1, s3755 # 17252
+adds s1, s2, s3754 # 17253
+adds s2, s1, s3753 # 17254
+adds s1, s2, s3752 # 17255
+adds s2, s1, s3751 # 17256
+adds s1, s2, s3750 # 17257
+adds s2, s1, s3749 # 17258
+adds s1, s2, s3748 # 17259
+adds s2, s1, s3747 # 17260
+adds s1, s2, s3746 # 17261
+adds s2, s1, s3745 # 17262
+adds s1, s2, s3744 # 17263
+adds s2, s1, s3743 # 17264
+adds s1, s2, s3742 # 17265
+adds s2, s1, s3741 # 17266
+adds s1, s2, s3740 # 17267
+adds s2, s1, s3739 # 17268
+adds s1, s2, s3738 # 17269
+adds s2, s1, s3737 # 17270
+adds s1, s2, s3736 # 17271
+adds s2, s1, s3735 # 17272
+adds s1, s2, s3734 # 17273
+adds s2, s1, s3733 # 17274
+adds s1, s2, s3732 # 17275
+adds s2, s1, s3731 # 17276
+adds s1, s2, s3730 # 17277
+adds s2, s1, s3729 # 17278
+adds s1, s2, s3728 # 17279
+adds s2, s1, s3727 # 17280
+adds s1, s2, s3726 # 17281
+adds s2, s1, s3725 # 17282
+adds s1, s2, s3724 # 17283
+adds s2, s1, s3723 # 17284
+adds s1, s2, s3722 # 17285
+adds s2, s1, s3721 # 17286
+adds s1, s2, s3720 # 17287
+adds s2, s1, s3719 # 17288
+adds s1, s2, s3718 # 17289
+adds s2, s1, s3717 # 17290
+adds s1, s2, s3716 # 17291
+adds s2, s1, s3715 # 17292
+adds s1, s2, s3714 # 17293
+adds s2, s1, s3713 # 17294
+adds s1, s2, s3712 # 17295
+adds s2, s1, s3711 # 17296
+adds s1, s2, s3710 # 17297
+adds s2, s1, s3709 # 17298
+adds s1, s2, s3708 # 17299
+adds s2, s1, s3707 # 17300
+adds s1, s2, s3706 # 17301
+adds s2, s1, s3705 # 17302
+adds s1, s2, s3704 # 17303
+adds s2, s1, s3703 # 17304
+adds s1, s2, s3702 # 17305
+adds s2, s1, s3701 # 17306
+adds s1, s2, s3700 # 17307
+adds s2, s1, s3699 # 17308
+adds s1, s2, s3698 # 17309
+adds s2, s1, s3697 # 17310
+adds s1, s2, s3696 # 17311
+adds s2, s1, s3695 # 17312
+adds s1, s2, s3694 # 17313
+adds s2, s1, s3693 # 17314
+adds s1, s2, s3692 # 17315
+adds s2, s1, s3691 # 17316
+adds s1, s2, s3690 # 17317
+adds s2, s1, s3689 # 17318
+adds s1, s2, s3688 # 17319
+adds s2, s1, s3687 # 17320
+adds s1, s2, s3686 # 17321
+adds s2, s1, s3685 # 17322
+adds s1, s2, s3684 # 17323
+adds s2, s1, s3683 # 17324
+adds s1, s2, s3682 # 17325
+adds s2, s1, s3681 # 17326
+adds s1, s2, s3680 # 17327
+adds s2, s1, s3679 # 17328
+adds s1, s2, s3678 # 17329
+adds s2, s1, s3677 # 17330
+adds s1, s2, s3676 # 17331
+adds s2, s1, s3675 # 17332
+adds s1, s2, s3674 # 17333
+adds s2, s1, s3673 # 17334
+adds s1, s2, s3672 # 17335
+adds s2, s1, s3671 # 17336
+adds s1, s2, s3670 # 17337
+adds s2, s1, s3669 # 17338
+adds s1, s2, s3668 # 17339
+adds s2, s1, s3667 # 17340
+adds s1, s2, s3666 # 17341
+adds s2, s1, s3665 # 17342
+adds s1, s2, s3664 # 17343
+adds s2, s1, s3663 # 17344
+adds s1, s2, s3662 # 17345
+adds s2, s1, s3661 # 17346
+adds s1, s2, s3660 # 17347
+adds s2, s1, s3659 # 17348
+adds s1, s2, s3658 # 17349
+adds s2, s1, s3657 # 17350
+adds s1, s2, s3656 # 17351
+adds s2, s1, s3655 # 17352
+adds s1, s2, s3654 # 17353
+adds s2, s1, s3653 # 17354
+adds s1, s2, s3652 # 17355
+adds s2, s1, s3651 # 17356
+adds s1, s2, s3650 # 17357
+adds s2, s1, s3649 # 17358
+adds s1, s2, s3648 # 17359
+adds s2, s1, s3647 # 17360
+adds s1, s2, s3646 # 17361
+adds s2, s1, s3645 # 17362
+adds s1, s2, s3644 # 17363
+adds s2, s1, s3643 # 17364
+adds s1, s2, s3642 # 17365
+adds s2, s1, s3641 # 17366
+adds s1, s2, s3640 # 17367
+adds s2, s1, s3639 # 17368
+adds s1, s2, s3638 # 17369
+adds s2, s1, s3637 # 17370
+adds s1, s2, s3636 # 17371
+adds s2, s1, s3635 # 17372
+adds s1, s2, s3634 # 17373
+adds s2, s1, s3633 # 17374
+adds s1, s2, s3632 # 17375
+adds s2, s1, s3631 # 17376
+adds s1, s2, s3630 # 17377
+adds s2, s1, s3629 # 17378
+adds s1, s2, s3628 # 17379
+adds s2, s1, s3627 # 17380
+adds s1, s2, s3626 # 17381
+adds s2, s1, s3625 # 17382
+adds s1, s2, s3624 # 17383
+adds s2, s1, s3623 # 17384
+adds s1, s2, s3622 # 17385
+adds s2, s1, s3621 # 17386
+adds s1, s2, s3620 # 17387
+adds s2, s1, s3619 # 17388
+adds s1, s2, s3618 # 17389
+adds s2, s1, s3617 # 17390
+adds s1, s2, s3616 # 17391
+adds s2, s1, s3615 # 17392
+adds s1, s2, s3614 # 17393
+adds s2, s1, s3613 # 17394
+adds s1, s2, s3612 # 17395
+adds s2, s1, s3611 # 17396
+adds s1, s2, s3610 # 17397
+adds s2, s1, s3609 # 17398
+adds s1, s2, s3608 # 17399
+adds s2, s1, s3607 # 17400
+adds s1, s2, s3606 # 17401
+adds s2, s1, s3605 # 17402
+adds s1, s2, s3604 # 17403
+adds s2, s1, s3603 # 17404
+adds s1, s2, s3602 # 17405
+adds s2, s1, s3601 # 17406
+adds s1, s2, s3600 # 17407
+adds s2, s1, s3599 # 17408
+adds s1, s2, s3598 # 17409
+adds s2, s1, s3597 # 17410
+adds s1, s2, s3596 # 17411
+adds s2, s1, s3595 # 17412
+adds s1, s2, s3594 # 17413
+adds s2, s1, s3593 # 17414
+adds s1, s2, s3592 # 17415
+adds s2, s1, s3591 # 17416
+adds s1, s2, s3590 # 17417
+adds s2, s1, s3589 # 17418
+adds s1, s2, s3588 # 17419
+adds s2, s1, s3587 # 17420
+adds s1, s2, s3586 # 17421
+adds s2, s1, s3585 # 17422
+adds s1, s2, s3584 # 17423
+adds s2, s1, s3583 # 17424
+adds s1, s2, s3582 # 17425
+adds s2, s1, s3581 # 17426
+adds s1, s2, s3580 # 17427
+adds s2, s1, s3579 # 17428
+adds s1, s2, s3578 # 17429
+adds s2, s1, s3577 # 17430
+adds s1, s2, s3576 # 17431
+adds s2, s1, s3575 # 17432
+adds s1, s2, s3574 # 17433
+adds s2, s1, s3573 # 17434
+adds s1, s2, s3572 # 17435
+adds s2, s1, s3571 # 17436
+adds s1, s2, s3570 # 17437
+adds s2, s1, s3569 # 17438
+adds s1, s2, s3568 # 17439
+adds s2, s1, s3567 # 17440
+adds s1, s2, s3566 # 17441
+adds s2, s1, s3565 # 17442
+adds s1, s2, s3564 # 17443
+adds s2, s1, s3563 # 17444
+adds s1, s2, s3562 # 17445
+adds s2, s1, s3561 # 17446
+adds s1, s2, s3560 # 17447
+adds s2, s1, s3559 # 17448
+adds s1, s2, s3558 # 17449
+adds s2, s1, s3557 # 17450
+adds s1, s2, s3556 # 17451
+adds s2, s1, s3555 # 17452
+adds s1, s2, s3554 # 17453
+adds s2, s1, s3553 # 17454
+adds s1, s2, s3552 # 17455
+adds s2, s1, s3551 # 17456
+adds s1, s2, s3550 # 17457
+adds s2, s1, s3549 # 17458
+adds s1, s2, s3548 # 17459
+adds s2, s1, s3547 # 17460
+adds s1, s2, s3546 # 17461
+adds s2, s1, s3545 # 17462
+adds s1, s2, s3544 # 17463
+adds s2, s1, s3543 # 17464
+adds s1, s2, s3542 # 17465
+adds s2, s1, s3541 # 17466
+adds s1, s2, s3540 # 17467
+adds s2, s1, s3539 # 17468
+adds s1, s2, s3538 # 17469
+adds s2, s1, s3537 # 17470
+adds s1, s2, s3536 # 17471
+adds s2, s1, s3535 # 17472
+adds s1, s2, s3534 # 17473
+adds s2, s1, s3533 # 17474
+adds s1, s2, s3532 # 17475
+adds s2, s1, s3531 # 17476
+adds s1, s2, s3530 # 17477
+adds s2, s1, s3529 # 17478
+adds s1, s2, s3528 # 17479
+adds s2, s1, s3527 # 17480
+adds s1, s2, s3526 # 17481
+adds s2, s1, s3525 # 17482
+adds s1, s2, s3524 # 17483
+adds s2, s1, s3523 # 17484
+adds s1, s2, s3522 # 17485
+adds s2, s1, s3521 # 17486
+adds s1, s2, s3520 # 17487
+adds s2, s1, s3519 # 17488
+adds s1, s2, s3518 # 17489
+adds s2, s1, s3517 # 17490
+adds s1, s2, s3516 # 17491
+adds s2, s1, s3515 # 17492
+adds s1, s2, s3514 # 17493
+adds s2, s1, s3513 # 17494
+adds s1, s2, s3512 # 17495
+adds s2, s1, s3511 # 17496
+adds s1, s2, s3510 # 17497
+adds s2, s1, s3509 # 17498
+adds s1, s2, s3508 # 17499
+adds s2, s1, s3507 # 17500
+adds s1, s2, s3506 # 17501
+adds s2, s1, s3505 # 17502
+adds s1, s2, s3504 # 17503
+adds s2, s1, s3503 # 17504
+adds s1, s2, s3502 # 17505
+adds s2, s1, s3501 # 17506
+adds s1, s2, s3500 # 17507
+adds s2, s1, s3499 # 17508
+adds s1, s2, s3498 # 17509
+adds s2, s1, s3497 # 17510
+adds s1, s2, s3496 # 17511
+adds s2, s1, s3495 # 17512
+adds s1, s2, s3494 # 17513
+adds s2, s1, s3493 # 17514
+adds s1, s2, s3492 # 17515
+adds s2, s1, s3491 # 17516
+adds s1, s2, s3490 # 17517
+adds s2, s1, s3489 # 17518
+adds s1, s2, s3488 # 17519
+adds s2, s1, s3487 # 17520
+adds s1, s2, s3486 # 17521
+adds s2, s1, s3485 # 17522
+adds s1, s2, s3484 # 17523
+adds s2, s1, s3483 # 17524
+adds s1, s2, s3482 # 17525
+adds s2, s1, s3481 # 17526
+adds s1, s2, s3480 # 17527
+adds s2, s1, s3479 # 17528
+adds s1, s2, s3478 # 17529
+adds s2, s1, s3477 # 17530
+adds s1, s2, s3476 # 17531
+adds s2, s1, s3475 # 17532
+adds s1, s2, s3474 # 17533
+adds s2, s1, s3473 # 17534
+adds s1, s2, s3472 # 17535
+adds s2, s1, s3471 # 17536
+adds s1, s2, s3470 # 17537
+adds s2, s1, s3469 # 17538
+adds s1, s2, s3468 # 17539
+adds s2, s1, s3467 # 17540
+adds s1, s2, s3466 # 17541
+adds s2, s1, s3465 # 17542
+adds s1, s2, s3464 # 17543
+adds s2, s1, s3463 # 17544
+adds s1, s2, s3462 # 17545
+adds s2, s1, s3461 # 17546
+adds s1, s2, s3460 # 17547
+adds s2, s1, s3459 # 17548
+adds s1, s2, s3458 # 17549
+adds s2, s1, s3457 # 17550
+adds s1, s2, s3456 # 17551
+adds s2, s1, s3455 # 17552
+adds s1, s2, s3454 # 17553
+adds s2, s1, s3453 # 17554
+adds s1, s2, s3452 # 17555
+adds s2, s1, s3451 # 17556
+adds s1, s2, s3450 # 17557
+adds s2, s1, s3449 # 17558
+adds s1, s2, s3448 # 17559
+adds s2, s1, s3447 # 17560
+adds s1, s2, s3446 # 17561
+adds s2, s1, s3445 # 17562
+adds s1, s2, s3444 # 17563
+adds s2, s1, s3443 # 17564
+adds s1, s2, s3442 # 17565
+adds s2, s1, s3441 # 17566
+adds s1, s2, s3440 # 17567
+adds s2, s1, s3439 # 17568
+adds s1, s2, s3438 # 17569
+adds s2, s1, s3437 # 17570
+adds s1, s2, s3436 # 17571
+adds s2, s1, s3435 # 17572
+adds s1, s2, s3434 # 17573
+adds s2, s1, s3433 # 17574
+adds s1, s2, s3432 # 17575
+adds s2, s1, s3431 # 17576
+adds s1, s2, s3430 # 17577
+adds s2, s1, s3429 # 17578
+adds s1, s2, s3428 # 17579
+adds s2, s1, s3427 # 17580
+adds s1, s2, s3426 # 17581
+adds s2, s1, s3425 # 17582
+adds s1, s2, s3424 # 17583
+adds s2, s1, s3423 # 17584
+adds s1, s2, s3422 # 17585
+adds s2, s1, s3421 # 17586
+adds s1, s2, s3420 # 17587
+adds s2, s1, s3419 # 17588
+adds s1, s2, s3418 # 17589
+adds s2, s1, s3417 # 17590
+adds s1, s2, s3416 # 17591
+adds s2, s1, s3415 # 17592
+adds s1, s2, s3414 # 17593
+adds s2, s1, s3413 # 17594
+adds s1, s2, s3412 # 17595
+adds s2, s1, s3411 # 17596
+adds s1, s2, s3410 # 17597
+adds s2, s1, s3409 # 17598
+adds s1, s2, s3408 # 17599
+adds s2, s1, s3407 # 17600
+adds s1, s2, s3406 # 17601
+adds s2, s1, s3405 # 17602
+adds s1, s2, s3404 # 17603
+adds s2, s1, s3403 # 17604
+adds s1, s2, s3402 # 17605
+adds s2, s1, s3401 # 17606
+adds s1, s2, s3400 # 17607
+adds s2, s1, s3399 # 17608
+adds s1, s2, s3398 # 17609
+adds s2, s1, s3397 # 17610
+adds s1, s2, s3396 # 17611
+adds s2, s1, s3395 # 17612
+adds s1, s2, s3394 # 17613
+adds s2, s1, s3393 # 17614
+adds s1, s2, s3392 # 17615
+adds s2, s1, s3391 # 17616
+adds s1, s2, s3390 # 17617
+adds s2, s1, s3389 # 17618
+adds s1, s2, s3388 # 17619
+adds s2, s1, s3387 # 17620
+adds s1, s2, s3386 # 17621
+adds s2, s1, s3385 # 17622
+adds s1, s2, s3384 # 17623
+adds s2, s1, s3383 # 17624
+adds s1, s2, s3382 # 17625
+adds s2, s1, s3381 # 17626
+adds s1, s2, s3380 # 17627
+adds s2, s1, s3379 # 17628
+adds s1, s2, s3378 # 17629
+adds s2, s1, s3377 # 17630
+adds s1, s2, s3376 # 17631
+adds s2, s1, s3375 # 17632
+adds s1, s2, s3374 # 17633
+adds s2, s1, s3373 # 17634
+adds s1, s2, s3372 # 17635
+adds s2, s1, s3371 # 17636
+adds s1, s2, s3370 # 17637
+adds s2, s1, s3369 # 17638
+adds s1, s2, s3368 # 17639
+adds s2, s1, s3367 # 17640
+adds s1, s2, s3366 # 17641
+adds s2, s1, s3365 # 17642
+adds s1, s2, s3364 # 17643
+adds s2, s1, s3363 # 17644
+adds s1, s2, s3362 # 17645
+adds s2, s1, s3361 # 17646
+adds s1, s2, s3360 # 17647
+adds s2, s1, s3359 # 17648
+adds s1, s2, s3358 # 17649
+adds s2, s1, s3357 # 17650
+adds s1, s2, s3356 # 17651
+adds s2, s1, s3355 # 17652
+adds s1, s2, s3354 # 17653
+adds s2, s1, s3353 # 17654
+adds s1, s2, s3352 # 17655
+adds s2, s1, s3351 # 17656
+adds s1, s2, s3350 # 17657
+adds s2, s1, s3349 # 17658
+adds s1, s2, s3348 # 17659
+adds s2, s1, s3347 # 17660
+adds s1, s2, s3346 # 17661
+adds s2, s1, s3345 # 17662
+adds s1, s2, s3344 # 17663
+adds s2, s1, s3343 # 17664
+adds s1, s2, s3342 # 17665
+adds s2, s1, s3341 # 17666
+adds s1, s2, s3340 # 17667
+adds s2, s1, s3339 # 17668
+adds s1, s2, s3338 # 17669
+adds s2, s1, s3337 # 17670
+adds s1, s2, s3336 # 17671
+adds s2, s1, s3335 # 17672
+adds s1, s2, s3334 # 17673
+adds s2, s1, s3333 # 17674
+adds s1, s2, s3332 # 17675
+adds s2, s1, s3331 # 17676
+adds s1, s2, s3330 # 17677
+adds s2, s1, s3329 # 17678
+adds s1, s2, s3328 # 17679
+adds s2, s1, s3327 # 17680
+adds s1, s2, s3326 # 17681
+adds s2, s1, s3325 # 17682
+adds s1, s2, s3324 # 17683
+adds s2, s1, s3323 # 17684
+adds s1, s2, s3322 # 17685
+adds s2, s1, s3321 # 17686
+adds s1, s2, s3320 # 17687
+adds s2, s1, s3319 # 17688
+adds s1, s2, s3318 # 17689
+adds s2, s1, s3317 # 17690
+adds s1, s2, s3316 # 17691
+adds s2, s1, s3315 # 17692
+adds s1, s2, s3314 # 17693
+adds s2, s1, s3313 # 17694
+adds s1, s2, s3312 # 17695
+adds s2, s1, s3311 # 17696
+adds s1, s2, s3310 # 17697
+adds s2, s1, s3309 # 17698
+adds s1, s2, s3308 # 17699
+adds s2, s1, s3307 # 17700
+adds s1, s2, s3306 # 17701
+adds s2, s1, s3305 # 17702
+adds s1, s2, s3304 # 17703
+adds s2, s1, s3303 # 17704
+adds s1, s2, s3302 # 17705
+adds s2, s1, s3301 # 17706
+adds s1, s2, s3300 # 17707
+adds s2, s1, s3299 # 17708
+adds s1, s2, s3298 # 17709
+adds s2, s1, s3297 # 17710
+adds s1, s2, s3296 # 17711
+adds s2, s1, s3295 # 17712
+adds s1, s2, s3294 # 17713
+adds s2, s1, s3293 # 17714
+adds s1, s2, s3292 # 17715
+adds s2, s1, s3291 # 17716
+adds s1, s2, s3290 # 17717
+adds s2, s1, s3289 # 17718
+adds s1, s2, s3288 # 17719
+adds s2, s1, s3287 # 17720
+adds s1, s2, s3286 # 17721
+adds s2, s1, s3285 # 17722
+adds s1, s2, s3284 # 17723
+adds s2, s1, s3283 # 17724
+adds s1, s2, s3282 # 17725
+adds s2, s1, s3281 # 17726
+adds s1, s2, s3280 # 17727
+adds s2, s1, s3279 # 17728
+adds s1, s2, s3278 # 17729
+adds s2, s1, s3277 # 17730
+adds s1, s2, s3276 # 17731
+adds s2, s1, s3275 # 17732
+adds s1, s2, s3274 # 17733
+adds s2, s1, s3273 # 17734
+adds s1, s2, s3272 # 17735
+adds s2, s1, s3271 # 17736
+adds s1, s2, s3270 # 17737
+adds s2, s1, s3269 # 17738
+adds s1, s2, s3268 # 17739
+adds s2, s1, s3267 # 17740
+adds s1, s2, s3266 # 17741
+adds s2, s1, s3265 # 17742
+adds s1, s2, s3264 # 17743
+adds s2, s1, s3263 # 17744
+adds s1, s2, s3262 # 17745
+adds s2, s1, s3261 # 17746
+adds s1, s2, s3260 # 17747
+adds s2, s1, s3259 # 17748
+adds s1, s2, s3258 # 17749
+adds s2, s1, s3257 # 17750
+adds s1, s2, s3256 # 17751
+adds s2, s1, s3255 # 17752
+adds s1, s2, s3254 # 17753
+adds s2, s1, s3253 # 17754
+adds s1, s2, s3252 # 17755
+adds s2, s1, s3251 # 17756
+adds s1, s2, s3250 # 17757
+adds s2, s1, s3249 # 17758
+adds s1, s2, s3248 # 17759
+adds s2, s1, s3247 # 17760
+adds s1, s2, s3246 # 17761
+adds s2, s1, s3245 # 17762
+adds s1, s2, s3244 # 17763
+adds s2, s1, s3243 # 17764
+adds s1, s2, s3242 # 17765
+adds s2, s1, s3241 # 17766
+adds s1, s2, s3240 # 17767
+adds s2, s1, s3239 # 17768
+adds s1, s2, s3238 # 17769
+adds s2, s1, s3237 # 17770
+adds s1, s2, s3236 # 17771
+adds s2, s1, s3235 # 17772
+adds s1, s2, s3234 # 17773
+adds s2, s1, s3233 # 17774
+adds s1, s2, s3232 # 17775
+adds s2, s1, s3231 # 17776
+adds s1, s2, s3230 # 17777
+adds s2, s1, s3229 # 17778
+adds s1, s2, s3228 # 17779
+adds s2, s1, s3227 # 17780
+adds s1, s2, s3226 # 17781
+adds s2, s1, s3225 # 17782
+adds s1, s2, s3224 # 17783
+adds s2, s1, s3223 # 17784
+adds s1, s2, s3222 # 17785
+adds s2, s1, s3221 # 17786
+adds s1, s2, s3220 # 17787
+adds s2, s1, s3219 # 17788
+adds s1, s2, s3218 # 17789
+adds s2, s1, s3217 # 17790
+adds s1, s2, s3216 # 17791
+adds s2, s1, s3215 # 17792
+adds s1, s2, s3214 # 17793
+adds s2, s1, s3213 # 17794
+adds s1, s2, s3212 # 17795
+adds s2, s1, s3211 # 17796
+adds s1, s2, s3210 # 17797
+adds s2, s1, s3209 # 17798
+adds s1, s2, s3208 # 17799
+adds s2, s1, s3207 # 17800
+adds s1, s2, s3206 # 17801
+adds s2, s1, s3205 # 17802
+adds s1, s2, s3204 # 17803
+adds s2, s1, s3203 # 17804
+adds s1, s2, s3202 # 17805
+adds s2, s1, s3201 # 17806
+adds s1, s2, s3200 # 17807
+adds s2, s1, s3199 # 17808
+adds s1, s2, s3198 # 17809
+adds s2, s1, s3197 # 17810
+adds s1, s2, s3196 # 17811
+adds s2, s1, s3195 # 17812
+adds s1, s2, s3194 # 17813
+adds s2, s1, s3193 # 17814
+adds s1, s2, s3192 # 17815
+adds s2, s1, s3191 # 17816
+adds s1, s2, s3190 # 17817
+adds s2, s1, s3189 # 17818
+adds s1, s2, s3188 # 17819
+adds s2, s1, s3187 # 17820
+adds s1, s2, s3186 # 17821
+adds s2, s1, s3185 # 17822
+adds s1, s2, s3184 # 17823
+adds s2, s1, s3183 # 17824
+adds s1, s2, s3182 # 17825
+adds s2, s1, s3181 # 17826
+adds s1, s2, s3180 # 17827
+adds s2, s1, s3179 # 17828
+adds s1, s2, s3178 # 17829
+adds s2, s1, s3177 # 17830
+adds s1, s2, s3176 # 17831
+adds s2, s1, s3175 # 17832
+adds s1, s2, s3174 # 17833
+adds s2, s1, s3173 # 17834
+adds s1, s2, s3172 # 17835
+adds s2, s1, s3171 # 17836
+adds s1, s2, s3170 # 17837
+adds s2, s1, s3169 # 17838
+adds s1, s2, s3168 # 17839
+adds s2, s1, s3167 # 17840
+adds s1, s2, s3166 # 17841
+adds s2, s1, s3165 # 17842
+adds s1, s2, s3164 # 17843
+adds s2, s1, s3163 # 17844
+adds s1, s2, s3162 # 17845
+adds s2, s1, s3161 # 17846
+adds s1, s2, s3160 # 17847
+adds s2, s1, s3159 # 17848
+adds s1, s2, s3158 # 17849
+adds s2, s1, s3157 # 17850
+adds s1, s2, s3156 # 17851
+adds s2, s1, s3155 # 17852
+adds s1, s2, s3154 # 17853
+adds s2, s1, s3153 # 17854
+adds s1, s2, s3152 # 17855
+adds s2, s1, s3151 # 17856
+adds s1, s2, s3150 # 17857
+adds s2, s1, s3149 # 17858
+adds s1, s2, s3148 # 17859
+adds s2, s1, s3147 # 17860
+adds s1, s2, s3146 # 17861
+adds s2, s1, s3145 # 17862
+adds s1, s2, s3144 # 17863
+adds s2, s1, s3143 # 17864
+adds s1, s2, s3142 # 17865
+adds s2, s1, s3141 # 17866
+adds s1, s2, s3140 # 17867
+adds s2, s1, s3139 # 17868
+adds s1, s2, s3138 # 17869
+adds s2, s1, s3137 # 17870
+adds s1, s2, s3136 # 17871
+adds s2, s1, s3135 # 17872
+adds s1, s2, s3134 # 17873
+adds s2, s1, s3133 # 17874
+adds s1, s2, s3132 # 17875
+adds s2, s1, s3131 # 17876
+adds s1, s2, s3130 # 17877
+adds s2, s1, s3129 # 17878
+adds s1, s2, s3128 # 17879
+adds s2, s1, s3127 # 17880
+adds s1, s2, s3126 # 17881
+adds s2, s1, s3125 # 17882
+adds s1, s2, s3124 # 17883
+adds s2, s1, s3123 # 17884
+adds s1, s2, s3122 # 17885
+adds s2, s1, s3121 # 17886
+adds s1, s2, s3120 # 17887
+adds s2, s1, s3119 # 17888
+adds s1, s2, s3118 # 17889
+adds s2, s1, s3117 # 17890
+adds s1, s2, s3116 # 17891
+adds s2, s1, s3115 # 17892
+adds s1, s2, s3114 # 17893
+adds s2, s1, s3113 # 17894
+adds s1, s2, s3112 # 17895
+adds s2, s1, s3111 # 17896
+adds s1, s2, s3110 # 17897
+adds s2, s1, s3109 # 17898
+adds s1, s2, s3108 # 17899
+adds s2, s1, s3107 # 17900
+adds s1, s2, s3106 # 17901
+adds s2, s1, s3105 # 17902
+adds s1, s2, s3104 # 17903
+adds s2, s1, s3103 # 17904
+adds s1, s2, s3102 # 17905
+adds s2, s1, s3101 # 17906
+adds s1, s2, s3100 # 17907
+adds s2, s1, s3099 # 17908
+adds s1, s2, s3098 # 17909
+adds s2, s1, s3097 # 17910
+adds s1, s2, s3096 # 17911
+adds s2, s1, s3095 # 17912
+adds s1, s2, s3094 # 17913
+adds s2, s1, s3093 # 17914
+adds s1, s2, s3092 # 17915
+adds s2, s1, s3091 # 17916
+adds s1, s2, s3090 # 17917
+adds s2, s1, s3089 # 17918
+adds s1, s2, s3088 # 17919
+adds s2, s1, s3087 # 17920
+adds s1, s2, s3086 # 17921
+adds s2, s1, s3085 # 17922
+adds s1, s2, s3084 # 17923
+adds s2, s1, s3083 # 17924
+adds s1, s2, s3082 # 17925
+adds s2, s1, s3081 # 17926
+adds s1, s2, s3080 # 17927
+adds s2, s1, s3079 # 17928
+adds s1, s2, s3078 # 17929
+adds s2, s1, s3077 # 17930
+adds s1, s2, s3076 # 17931
+adds s2, s1, s3075 # 17932
+adds s1, s2, s3074 # 17933
+adds s2, s1, s3073 # 17934
+adds s1, s2, s3072 # 17935
+adds s2, s1, s3071 # 17936
+adds s1, s2, s3070 # 17937
+adds s2, s1, s3069 # 17938
+adds s1, s2, s3068 # 17939
+adds s2, s1, s3067 # 17940
+adds s1, s2, s3066 # 17941
+adds s2, s1, s3065 # 17942
+adds s1, s2, s3064 # 17943
+adds s2, s1, s3063 # 17944
+adds s1, s2, s3062 # 17945
+adds s2, s1, s3061 # 17946
+adds s1, s2, s3060 # 17947
+adds s2, s1, s3059 # 17948
+adds s1, s2, s3058 # 17949
+adds s2, s1, s3057 # 17950
+adds s1, s2, s3056 # 17951
+adds s2, s1, s3055 # 17952
+adds s1, s2, s3054 # 17953
+adds s2, s1, s3053 # 17954
+adds s1, s2, s3052 # 17955
+adds s2, s1, s3051 # 17956
+adds s1, s2, s3050 # 17957
+adds s2, s1, s3049 # 17958
+adds s1, s2, s3048 # 17959
+adds s2, s1, s3047 # 17960
+adds s1, s2, s3046 # 17961
+adds s2, s1, s3045 # 17962
+adds s1, s2, s3044 # 17963
+adds s2, s1, s3043 # 17964
+adds s1, s2, s3042 # 17965
+adds s2, s1, s3041 # 17966
+adds s1, s2, s3040 # 17967
+adds s2, s1, s3039 # 17968
+adds s1, s2, s3038 # 17969
+adds s2, s1, s3037 # 17970
+adds s1, s2, s3036 # 17971
+adds s2, s1, s3035 # 17972
+adds s1, s2, s3034 # 17973
+adds s2, s1, s3033 # 17974
+adds s1, s2, s3032 # 17975
+adds s2, s1, s3031 # 17976
+adds s1, s2, s3030 # 17977
+adds s2, s1, s3029 # 17978
+adds s1, s2, s3028 # 17979
+adds s2, s1, s3027 # 17980
+adds s1, s2, s3026 # 17981
+adds s2, s1, s3025 # 17982
+adds s1, s2, s3024 # 17983
+adds s2, s1, s3023 # 17984
+adds s1, s2, s3022 # 17985
+adds s2, s1, s3021 # 17986
+adds s1, s2, s3020 # 17987
+adds s2, s1, s3019 # 17988
+adds s1, s2, s3018 # 17989
+adds s2, s1, s3017 # 17990
+adds s1, s2, s3016 # 17991
+adds s2, s1, s3015 # 17992
+adds s1, s2, s3014 # 17993
+adds s2, s1, s3013 # 17994
+adds s1, s2, s3012 # 17995
+adds s2, s1, s3011 # 17996
+adds s1, s2, s3010 # 17997
+adds s2, s1, s3009 # 17998
+adds s1, s2, s3008 # 17999
+adds s2, s1, s3007 # 18000
+adds s1, s2, s3006 # 18001
+adds s2, s1, s3005 # 18002
+adds s1, s2, s3004 # 18003
+adds s2, s1, s3003 # 18004
+adds s1, s0, s2 # 18005
+adds s2, s3, s103 # 18006
+adds s0, s2, s203 # 18007
+adds s2, s0, s303 # 18008
+adds s0, s2, s403 # 18009
+adds s2, s0, s503 # 18010
+adds s0, s2, s603 # 18011
+adds s2, s0, s703 # 18012
+adds s0, s2, s803 # 18013
+adds s2, s0, s903 # 18014
+adds s0, s2, s1003 # 18015
+adds s2, s0, s1103 # 18016
+adds s0, s2, s1203 # 18017
+adds s2, s0, s1303 # 18018
+adds s0, s2, s1403 # 18019
+adds s2, s0, s1503 # 18020
+adds s0, s2, s1603 # 18021
+adds s2, s0, s1703 # 18022
+adds s0, s2, s1803 # 18023
+adds s2, s0, s1903 # 18024
+adds s0, s2, s2003 # 18025
+adds s2, s0, s2103 # 18026
+adds s0, s2, s2203 # 18027
+adds s2, s0, s2303 # 18028
+adds s0, s2, s2403 # 18029
+adds s2, s0, s2503 # 18030
+adds s0, s2, s2603 # 18031
+adds s2, s0, s2703 # 18032
+adds s0, s2, s2803 # 18033
+adds s2, s0, s2903 # 18034
+adds s0, s1, s2 # 18035
+asm_open 5, 1, c0, s0, c1, s0 # 18036
+print_reg_plain c0 # 18037
+print_char 32 # 18038
+print_char4 942682679 # 18039
+print_char4 942945589 # 18040
+print_char 48 # 18041
+print_char 48 # 18042
+print_char 48 # 18043
+print_char 10 # 18044
+convmodp ci0, c1, 64 # 18045
+ldint ci3, 17 # 18046
+ldint ci2, 65536 # 18047
+mulint ci1, ci2, ci2 # 18048
+mulint ci2, ci3, ci1 # 18049
+ldint ci3, -928896032 # 18050
+addint ci1, ci2, ci3 # 18051
+eqc ci2, ci0, ci1 # 18052
+shrci c0, c1, 64 # 18053
+ldint ci1, 1 # 18054
+subint ci0, ci1, ci2 # 18055
+crash ci0 # 18056
+use 0, 7, 2 # 18057
+use 0, 0, 9000 # 18058
+ldmc c0, 8191 # 18059
+gldmc cg0, 8191 # 18060
+ldmint ci0, 8191 # 18061
+ldms s0, 8191 # 18062
+gldms sg0, 8191 # 18063
+active 1 # 18064
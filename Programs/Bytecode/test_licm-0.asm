@@ -0,0 +1,102 @@
+ldi c3, 3 # 0
+ldi c0, 1 # 1
+ldint ci0, 0 # 2
+mulci c1, c3, 5 # 3
+ldint ci1, 10 # 4
+ldint ci2, 1 # 5
+ldint ci3, 0 # 6
+ldi c2, 0 # 7
+ldint ci4, 8192 # 8
+ldint ci5, 10 # 9
+ldint ci6, 1 # 10
+ldint ci7, 0 # 11
+ldi c3, 0 # 12
+ldint ci8, 8202 # 13
+ldint ci9, 1 # 14
+ldint ci10, 0 # 15
+ldint ci11, 10 # 16
+ltc ci15, ci0, ci1 # 17
+subint ci12, ci2, ci15 # 18
+ltc ci15, ci0, ci3 # 19
+addint ci13, ci12, ci15 # 20
+mulint ci14, ci12, ci15 # 21
+subint ci12, ci13, ci14 # 22
+convint c5, ci12 # 23
+cond_print_str c5, 1919252079 # 24
+convint c4, ci12 # 25
+cond_print_str c4, 2003790950 # 26
+convint c5, ci12 # 27
+cond_print_str c5, 8250 # 28
+convint c5, ci0 # 29
+convint c4, ci12 # 30
+cond_print_plain c4, c5, c2 # 31
+convint c4, ci12 # 32
+cond_print_str c4, 47 # 33
+convint c4, ci12 # 34
+cond_print_str c4, 12337 # 35
+convint c4, ci12 # 36
+cond_print_str c4, 10 # 37
+crash ci12 # 38
+addint ci12, ci0, ci4 # 39
+stmci c1, ci12 # 40
+mulci c4, c0, 7 # 41
+movc c0, c4 # 42
+ltc ci14, ci0, ci5 # 43
+subint ci13, ci6, ci14 # 44
+ltc ci15, ci0, ci7 # 45
+addint ci12, ci13, ci15 # 46
+mulint ci14, ci13, ci15 # 47
+subint ci13, ci12, ci14 # 48
+convint c5, ci13 # 49
+cond_print_str c5, 1919252079 # 50
+convint c4, ci13 # 51
+cond_print_str c4, 2003790950 # 52
+convint c5, ci13 # 53
+cond_print_str c5, 8250 # 54
+convint c5, ci0 # 55
+convint c4, ci13 # 56
+cond_print_plain c4, c5, c3 # 57
+convint c4, ci13 # 58
+cond_print_str c4, 47 # 59
+convint c4, ci13 # 60
+cond_print_str c4, 12337 # 61
+convint c4, ci13 # 62
+cond_print_str c4, 10 # 63
+crash ci13 # 64
+addint ci12, ci0, ci8 # 65
+stmci c0, ci12 # 66
+addint ci13, ci0, ci9 # 67
+addint ci0, ci13, ci10 # 68
+ltc ci12, ci13, ci11 # 69
+jmpnz ci12, -54 # 70
+ldmc c2, 8201 # 71
+ldmc c0, 8202 # 72
+ldmc c1, 8211 # 73
+print_reg_plain c2 # 74
+print_char 32 # 75
+print_reg_plain c0 # 76
+print_char 32 # 77
+print_reg_plain c1 # 78
+print_char 10 # 79
+ldmc c1, 8201 # 80
+convmodp ci2, c1, 64 # 81
+ldint ci0, 15 # 82
+eqc ci1, ci2, ci0 # 83
+shrci c0, c1, 64 # 84
+ldint ci0, 1 # 85
+subint ci2, ci0, ci1 # 86
+crash ci2 # 87
+ldmc c1, 8211 # 88
+convmodp ci0, c1, 64 # 89
+ldint ci1, 282475249 # 90
+eqc ci2, ci0, ci1 # 91
+shrci c0, c1, 64 # 92
+ldint ci1, 1 # 93
+subint ci0, ci1, ci2 # 94
+crash ci0 # 95
+ldmc c0, 8211 # 96
+gldmc cg0, 8191 # 97
+ldmint ci0, 8191 # 98
+ldms s0, 8191 # 99
+gldms sg0, 8191 # 100
+active 1 # 101
@@ -0,0 +1,1232 @@
+ldint ci1, 0 # 0
+vincint 1000, ci3, ci1, 1, 1, 1000 # 1
+vconvint 1000, c22, ci3 # 2
+vldsi 1000, s49021, 0 # 3
+vaddm 1000, s99021, s49021, c22 # 4
+ldint ci0, 20 # 5
+vincint 1000, ci3, ci0, 1, 1, 1000 # 6
+vconvint 1000, c22, ci3 # 7
+vldsi 1000, s87021, 0 # 8
+vaddm 1000, s98021, s87021, c22 # 9
+ldint ci2, 0 # 10
+vincint 1000, ci3, ci2, 1, 1, 1000 # 11
+vconvint 1000, c22, ci3 # 12
+vldsi 1000, s55021, 0 # 13
+vaddm 1000, s66021, s55021, c22 # 14
+ldint ci1, 0 # 15
+vincint 1000, ci3, ci1, 1, 1, 1000 # 16
+vconvint 1000, c22, ci3 # 17
+vldsi 1000, s49021, 0 # 18
+vaddm 1000, s39021, s49021, c22 # 19
+ldint ci0, 1 # 20
+vincint 1000, ci3, ci0, 1, 1, 1000 # 21
+vconvint 1000, c22, ci3 # 22
+vldsi 1000, s87021, 0 # 23
+vaddm 1000, s71021, s87021, c22 # 24
+ldint ci2, 2 # 25
+vincint 1000, ci3, ci2, 1, 1, 1000 # 26
+vconvint 1000, c22, ci3 # 27
+vldsi 1000, s82021, 0 # 28
+vaddm 1000, s87021, s82021, c22 # 29
+ldint ci1, 2 # 30
+vincint 1000, ci3, ci1, 1, 1, 1000 # 31
+vconvint 1000, c22, ci3 # 32
+vldsi 1000, s50021, 0 # 33
+vaddm 1000, s44021, s50021, c22 # 34
+ldint ci0, 4 # 35
+vincint 1000, ci3, ci0, 1, 1, 1000 # 36
+vconvint 1000, c22, ci3 # 37
+vldsi 1000, s45021, 0 # 38
+vaddm 1000, s60021, s45021, c22 # 39
+ldint ci2, 3 # 40
+vincint 1000, ci3, ci2, 1, 1, 1000 # 41
+vconvint 1000, c22, ci3 # 42
+vldsi 1000, s61021, 0 # 43
+vaddm 1000, s92021, s61021, c22 # 44
+ldint ci1, 6 # 45
+vincint 1000, ci3, ci1, 1, 1, 1000 # 46
+vconvint 1000, c22, ci3 # 47
+vldsi 1000, s77021, 0 # 48
+vaddm 1000, s65021, s77021, c22 # 49
+ldint ci0, 4 # 50
+vincint 1000, ci3, ci0, 1, 1, 1000 # 51
+vconvint 1000, c22, ci3 # 52
+vldsi 1000, s93021, 0 # 53
+vaddm 1000, s54021, s93021, c22 # 54
+ldint ci2, 8 # 55
+vincint 1000, ci3, ci2, 1, 1, 1000 # 56
+vconvint 1000, c22, ci3 # 57
+vldsi 1000, s56021, 0 # 58
+vaddm 1000, s86021, s56021, c22 # 59
+ldint ci1, 5 # 60
+vincint 1000, ci3, ci1, 1, 1, 1000 # 61
+vconvint 1000, c22, ci3 # 62
+vldsi 1000, s72021, 0 # 63
+vaddm 1000, s59021, s72021, c22 # 64
+ldint ci0, 10 # 65
+vincint 1000, ci3, ci0, 1, 1, 1000 # 66
+vconvint 1000, c22, ci3 # 67
+vldsi 1000, s88021, 0 # 68
+vaddm 1000, s75021, s88021, c22 # 69
+ldint ci2, 6 # 70
+vincint 1000, ci3, ci2, 1, 1, 1000 # 71
+vconvint 1000, c22, ci3 # 72
+vldsi 1000, s40021, 0 # 73
+vaddm 1000, s48021, s40021, c22 # 74
+ldint ci1, 12 # 75
+vincint 1000, ci3, ci1, 1, 1, 1000 # 76
+vconvint 1000, c22, ci3 # 77
+vldsi 1000, s81021, 0 # 78
+vaddm 1000, s80021, s81021, c22 # 79
+ldint ci0, 7 # 80
+vincint 1000, ci3, ci0, 1, 1, 1000 # 81
+vconvint 1000, c22, ci3 # 82
+vldsi 1000, s51021, 0 # 83
+vaddm 1000, s96021, s51021, c22 # 84
+ldint ci2, 14 # 85
+vincint 1000, ci3, ci2, 1, 1, 1000 # 86
+vconvint 1000, c22, ci3 # 87
+vldsi 1000, s67021, 0 # 88
+vaddm 1000, s69021, s67021, c22 # 89
+ldint ci1, 8 # 90
+vincint 1000, ci3, ci1, 1, 1, 1000 # 91
+vconvint 1000, c22, ci3 # 92
+vldsi 1000, s83021, 0 # 93
+vaddm 1000, s53021, s83021, c22 # 94
+ldint ci0, 16 # 95
+vincint 1000, ci3, ci0, 1, 1, 1000 # 96
+vconvint 1000, c22, ci3 # 97
+vldsi 1000, s97021, 0 # 98
+vaddm 1000, s42021, s97021, c22 # 99
+ldint ci2, 9 # 100
+vincint 1000, ci3, ci2, 1, 1, 1000 # 101
+vconvint 1000, c22, ci3 # 102
+vldsi 1000, s62021, 0 # 103
+vaddm 1000, s74021, s62021, c22 # 104
+ldint ci1, 18 # 105
+vincint 1000, ci3, ci1, 1, 1, 1000 # 106
+vconvint 1000, c22, ci3 # 107
+vldsi 1000, s78021, 0 # 108
+vaddm 1000, s90021, s78021, c22 # 109
+ldint ci0, 10 # 110
+vincint 1000, ci3, ci0, 1, 1, 1000 # 111
+vconvint 1000, c22, ci3 # 112
+vldsi 1000, s94021, 0 # 113
+vaddm 1000, s63021, s94021, c22 # 114
+ldint ci2, 20 # 115
+vincint 1000, ci3, ci2, 1, 1, 1000 # 116
+vconvint 1000, c22, ci3 # 117
+vldsi 1000, s46021, 0 # 118
+vaddm 1000, s47021, s46021, c22 # 119
+ldint ci1, 11 # 120
+vincint 1000, ci3, ci1, 1, 1, 1000 # 121
+vconvint 1000, c22, ci3 # 122
+vldsi 1000, s41021, 0 # 123
+vaddm 1000, s95021, s41021, c22 # 124
+ldint ci0, 22 # 125
+vincint 1000, ci3, ci0, 1, 1, 1000 # 126
+vconvint 1000, c22, ci3 # 127
+vldsi 1000, s89021, 0 # 128
+vaddm 1000, s68021, s89021, c22 # 129
+ldint ci2, 12 # 130
+vincint 1000, ci3, ci2, 1, 1, 1000 # 131
+vconvint 1000, c22, ci3 # 132
+vldsi 1000, s73021, 0 # 133
+vaddm 1000, s84021, s73021, c22 # 134
+ldint ci1, 24 # 135
+vincint 1000, ci3, ci1, 1, 1, 1000 # 136
+vconvint 1000, c22, ci3 # 137
+vldsi 1000, s41021, 0 # 138
+vaddm 1000, s57021, s41021, c22 # 139
+ldint ci0, 13 # 140
+vincint 1000, ci3, ci0, 1, 1, 1000 # 141
+vconvint 1000, c22, ci3 # 142
+vldsi 1000, s52021, 0 # 143
+vaddm 1000, s89021, s52021, c22 # 144
+ldint ci2, 26 # 145
+vincint 1000, ci3, ci2, 1, 1, 1000 # 146
+vconvint 1000, c22, ci3 # 147
+vldsi 1000, s100021, 0 # 148
+vaddm 1000, s62021, s100021, c22 # 149
+ldint ci1, 14 # 150
+vincint 1000, ci3, ci1, 1, 1, 1000 # 151
+vconvint 1000, c22, ci3 # 152
+vldsi 1000, s79021, 0 # 153
+vaddm 1000, s78021, s79021, c22 # 154
+ldint ci0, 28 # 155
+vincint 1000, ci3, ci0, 1, 1, 1000 # 156
+vconvint 1000, c22, ci3 # 157
+vldsi 1000, s58021, 0 # 158
+vaddm 1000, s97021, s58021, c22 # 159
+ldint ci2, 15 # 160
+vincint 1000, ci3, ci2, 1, 1, 1000 # 161
+vconvint 1000, c22, ci3 # 162
+vldsi 1000, s85021, 0 # 163
+vaddm 1000, s51021, s85021, c22 # 164
+ldint ci1, 30 # 165
+vincint 1000, ci3, ci1, 1, 1, 1000 # 166
+vconvint 1000, c22, ci3 # 167
+vldsi 1000, s64021, 0 # 168
+vaddm 1000, s83021, s64021, c22 # 169
+ldint ci0, 16 # 170
+vincint 1000, ci3, ci0, 1, 1, 1000 # 171
+vconvint 1000, c22, ci3 # 172
+vldsi 1000, s91021, 0 # 173
+vaddm 1000, s56021, s91021, c22 # 174
+ldint ci2, 32 # 175
+vincint 1000, ci3, ci2, 1, 1, 1000 # 176
+vconvint 1000, c22, ci3 # 177
+vldsi 1000, s43021, 0 # 178
+vaddm 1000, s72021, s43021, c22 # 179
+ldint ci1, 17 # 180
+vincint 1000, ci3, ci1, 1, 1, 1000 # 181
+vconvint 1000, c22, ci3 # 182
+vldsi 1000, s70021, 0 # 183
+vaddm 1000, s81021, s70021, c22 # 184
+ldint ci0, 34 # 185
+vincint 1000, ci3, ci0, 1, 1, 1000 # 186
+vconvint 1000, c22, ci3 # 187
+vldsi 1000, s38021, 0 # 188
+vaddm 1000, s45021, s38021, c22 # 189
+ldint ci2, 18 # 190
+vincint 1000, ci3, ci2, 1, 1, 1000 # 191
+vconvint 1000, c22, ci3 # 192
+vldsi 1000, s76021, 0 # 193
+vaddm 1000, s93021, s76021, c22 # 194
+ldint ci1, 36 # 195
+vincint 1000, ci3, ci1, 1, 1, 1000 # 196
+vconvint 1000, c22, ci3 # 197
+vldsi 1000, s55021, 0 # 198
+vaddm 1000, s77021, s55021, c22 # 199
+ldint ci0, 19 # 200
+vincint 1000, ci3, ci0, 1, 1, 1000 # 201
+vconvint 1000, c22, ci3 # 202
+vldsi 1000, s49021, 0 # 203
+vaddm 1000, s50021, s49021, c22 # 204
+ldint ci2, 38 # 205
+vincint 1000, ci3, ci2, 1, 1, 1000 # 206
+vconvint 1000, c22, ci3 # 207
+vldsi 1000, s82021, 0 # 208
+vaddm 1000, s100021, s82021, c22 # 209
+ldint ci1, 0 # 210
+vincint 950, ci9553, ci1, 1, 1, 950 # 211
+vconvint 950, c9572, ci9553 # 212
+vldsi 950, s34221, 0 # 213
+vaddm 950, s37071, s34221, c9572 # 214
+ldint ci0, 19 # 215
+vincint 950, ci9553, ci0, 1, 1, 950 # 216
+vconvint 950, c9572, ci9553 # 217
+vldsi 950, s35171, 0 # 218
+vaddm 950, s36121, s35171, c9572 # 219
+ldint ci2, 0 # 220
+vincint 900, ci8653, ci2, 1, 1, 900 # 221
+vconvint 900, c8672, ci8653 # 222
+vldsi 900, s30621, 0 # 223
+vaddm 900, s33321, s30621, c8672 # 224
+ldint ci1, 18 # 225
+vincint 900, ci8653, ci1, 1, 1, 900 # 226
+vconvint 900, c8672, ci8653 # 227
+vldsi 900, s31521, 0 # 228
+vaddm 900, s32421, s31521, c8672 # 229
+ldint ci0, 0 # 230
+vincint 850, ci7803, ci0, 1, 1, 850 # 231
+vconvint 850, c7822, ci7803 # 232
+vldsi 850, s28921, 0 # 233
+vaddm 850, s29771, s28921, c7822 # 234
+ldint ci2, 17 # 235
+vincint 850, ci7803, ci2, 1, 1, 850 # 236
+vconvint 850, c7822, ci7803 # 237
+vldsi 850, s28071, 0 # 238
+vaddm 850, s28921, s28071, c7822 # 239
+ldint ci1, 0 # 240
+vincint 800, ci7003, ci1, 1, 1, 800 # 241
+vconvint 800, c7022, ci7003 # 242
+vldsi 800, s25621, 0 # 243
+vaddm 800, s26421, s25621, c7022 # 244
+ldint ci0, 16 # 245
+vincint 800, ci7003, ci0, 1, 1, 800 # 246
+vconvint 800, c7022, ci7003 # 247
+vldsi 800, s24021, 0 # 248
+vaddm 800, s25621, s24021, c7022 # 249
+ldint ci2, 0 # 250
+vincint 750, ci6253, ci2, 1, 1, 750 # 251
+vconvint 750, c6272, ci6253 # 252
+vldsi 750, s21021, 0 # 253
+vaddm 750, s23271, s21021, c6272 # 254
+ldint ci1, 15 # 255
+vincint 750, ci6253, ci1, 1, 1, 750 # 256
+vconvint 750, c6272, ci6253 # 257
+vldsi 750, s21771, 0 # 258
+vaddm 750, s22521, s21771, c6272 # 259
+ldint ci0, 0 # 260
+vincint 700, ci5553, ci0, 1, 1, 700 # 261
+vconvint 700, c5572, ci5553 # 262
+vldsi 700, s18221, 0 # 263
+vaddm 700, s20321, s18221, c5572 # 264
+ldint ci2, 14 # 265
+vincint 700, ci5553, ci2, 1, 1, 700 # 266
+vconvint 700, c5572, ci5553 # 267
+vldsi 700, s18921, 0 # 268
+vaddm 700, s19621, s18921, c5572 # 269
+ldint ci1, 0 # 270
+vincint 650, ci4903, ci1, 1, 1, 650 # 271
+vconvint 650, c4922, ci4903 # 272
+vldsi 650, s16921, 0 # 273
+vaddm 650, s17571, s16921, c4922 # 274
+ldint ci0, 13 # 275
+vincint 650, ci4903, ci0, 1, 1, 650 # 276
+vconvint 650, c4922, ci4903 # 277
+vldsi 650, s16271, 0 # 278
+vaddm 650, s16921, s16271, c4922 # 279
+ldint ci2, 0 # 280
+vincint 600, ci4303, ci2, 1, 1, 600 # 281
+vconvint 600, c4322, ci4303 # 282
+vldsi 600, s14421, 0 # 283
+vaddm 600, s15021, s14421, c4322 # 284
+ldint ci1, 12 # 285
+vincint 600, ci4303, ci1, 1, 1, 600 # 286
+vconvint 600, c4322, ci4303 # 287
+vldsi 600, s13221, 0 # 288
+vaddm 600, s14421, s13221, c4322 # 289
+ldint ci0, 0 # 290
+vincint 550, ci3753, ci0, 1, 1, 550 # 291
+vconvint 550, c3772, ci3753 # 292
+vldsi 550, s11021, 0 # 293
+vaddm 550, s12671, s11021, c3772 # 294
+ldint ci2, 11 # 295
+vincint 550, ci3753, ci2, 1, 1, 550 # 296
+vconvint 550, c3772, ci3753 # 297
+vldsi 550, s11571, 0 # 298
+vaddm 550, s12121, s11571, c3772 # 299
+ldint ci1, 0 # 300
+vincint 500, ci3253, ci1, 1, 1, 500 # 301
+vconvint 500, c3272, ci3253 # 302
+vldsi 500, s10021, 0 # 303
+vaddm 500, s10521, s10021, c3272 # 304
+ldint ci0, 10 # 305
+vincint 500, ci3253, ci0, 1, 1, 500 # 306
+vconvint 500, c3272, ci3253 # 307
+vldsi 500, s9521, 0 # 308
+vaddm 500, s10021, s9521, c3272 # 309
+ldint ci2, 0 # 310
+vincint 450, ci2803, ci2, 1, 1, 450 # 311
+vconvint 450, c2822, ci2803 # 312
+vldsi 450, s8121, 0 # 313
+vaddm 450, s8571, s8121, c2822 # 314
+ldint ci1, 9 # 315
+vincint 450, ci2803, ci1, 1, 1, 450 # 316
+vconvint 450, c2822, ci2803 # 317
+vldsi 450, s7671, 0 # 318
+vaddm 450, s8121, s7671, c2822 # 319
+ldint ci0, 0 # 320
+vincint 400, ci2403, ci0, 1, 1, 400 # 321
+vconvint 400, c2422, ci2403 # 322
+vldsi 400, s6421, 0 # 323
+vaddm 400, s6821, s6421, c2422 # 324
+ldint ci2, 8 # 325
+vincint 400, ci2403, ci2, 1, 1, 400 # 326
+vconvint 400, c2422, ci2403 # 327
+vldsi 400, s5621, 0 # 328
+vaddm 400, s6421, s5621, c2422 # 329
+ldint ci1, 0 # 330
+vincint 350, ci2053, ci1, 1, 1, 350 # 331
+vconvint 350, c2072, ci2053 # 332
+vldsi 350, s4221, 0 # 333
+vaddm 350, s5271, s4221, c2072 # 334
+ldint ci0, 7 # 335
+vincint 350, ci2053, ci0, 1, 1, 350 # 336
+vconvint 350, c2072, ci2053 # 337
+vldsi 350, s4571, 0 # 338
+vaddm 350, s4921, s4571, c2072 # 339
+ldint ci2, 0 # 340
+vincint 300, ci1753, ci2, 1, 1, 300 # 341
+vconvint 300, c1772, ci1753 # 342
+vldsi 300, s3621, 0 # 343
+vaddm 300, s3921, s3621, c1772 # 344
+ldint ci1, 6 # 345
+vincint 300, ci1753, ci1, 1, 1, 300 # 346
+vconvint 300, c1772, ci1753 # 347
+vldsi 300, s3321, 0 # 348
+vaddm 300, s3621, s3321, c1772 # 349
+ldint ci0, 0 # 350
+vincint 250, ci1503, ci0, 1, 1, 250 # 351
+vconvint 250, c1522, ci1503 # 352
+vldsi 250, s2521, 0 # 353
+vaddm 250, s2771, s2521, c1522 # 354
+ldint ci2, 5 # 355
+vincint 250, ci1503, ci2, 1, 1, 250 # 356
+vconvint 250, c1522, ci1503 # 357
+vldsi 250, s2271, 0 # 358
+vaddm 250, s2521, s2271, c1522 # 359
+ldint ci1, 0 # 360
+vincint 200, ci1303, ci1, 1, 1, 200 # 361
+vconvint 200, c1322, ci1303 # 362
+vldsi 200, s1621, 0 # 363
+vaddm 200, s1821, s1621, c1322 # 364
+ldint ci0, 4 # 365
+vincint 200, ci1303, ci0, 1, 1, 200 # 366
+vconvint 200, c1322, ci1303 # 367
+vldsi 200, s1221, 0 # 368
+vaddm 200, s1621, s1221, c1322 # 369
+ldint ci2, 0 # 370
+vincint 150, ci1153, ci2, 1, 1, 150 # 371
+vconvint 150, c1172, ci1153 # 372
+vldsi 150, s621, 0 # 373
+vaddm 150, s1071, s621, c1172 # 374
+ldint ci1, 3 # 375
+vincint 150, ci1153, ci1, 1, 1, 150 # 376
+vconvint 150, c1172, ci1153 # 377
+vldsi 150, s771, 0 # 378
+vaddm 150, s921, s771, c1172 # 379
+ldint ci0, 0 # 380
+vincint 100, ci1053, ci0, 1, 1, 100 # 381
+vconvint 100, c1072, ci1053 # 382
+vldsi 100, s221, 0 # 383
+vaddm 100, s521, s221, c1072 # 384
+ldint ci2, 2 # 385
+vincint 100, ci1053, ci2, 1, 1, 100 # 386
+vconvint 100, c1072, ci1053 # 387
+vldsi 100, s321, 0 # 388
+vaddm 100, s421, s321, c1072 # 389
+ldint ci1, 0 # 390
+vincint 50, ci1003, ci1, 1, 1, 50 # 391
+vconvint 50, c1022, ci1003 # 392
+vldsi 50, s121, 0 # 393
+vaddm 50, s171, s121, c1022 # 394
+ldint ci0, 1 # 395
+vincint 50, ci1003, ci0, 1, 1, 50 # 396
+vconvint 50, c1022, ci1003 # 397
+vldsi 50, s71, 0 # 398
+vaddm 50, s121, s71, c1022 # 399
+muls 160, 50, s21, s171, s121, 100, s221, s521, s421, 150, s621, s1071, s921, 200, s1221, s1821, s1621, 250, s2021, s2771, s2521, 300, s3021, s3921, s3621, 350, s4221, s5271, s4921, 400, s5621, s6821, s6421, 450, s7221, s8571, s8121, 500, s9021, s10521, s10021, 550, s11021, s12671, s12121, 600, s13221, s15021, s14421, 650, s15621, s17571, s16921, 700, s18221, s20321, s19621, 750, s21021, s23271, s22521, 800, s24021, s26421, s25621, 850, s27221, s29771, s28921, 900, s30621, s33321, s32421, 950, s34221, s37071, s36121, 1000, s94021, s99021, s98021, 1000, s91021, s66021, s39021, 1000, s88021, s71021, s87021, 1000, s85021, s44021, s60021, 1000, s82021, s92021, s65021, 1000, s79021, s54021, s86021, 1000, s76021, s59021, s75021, 1000, s73021, s48021, s80021, 1000, s70021, s96021, s69021, 1000, s67021, s53021, s42021, 1000, s64021, s74021, s90021, 1000, s61021, s63021, s47021, 1000, s58021, s95021, s68021, 1000, s55021, s84021, s57021, 1000, s52021, s89021, s62021, 1000, s49021, s78021, s97021, 1000, s46021, s51021, s83021, 1000, s43021, s56021, s72021, 1000, s40021, s81021, s45021, 1000, s41021, s93021, s77021, 1000, s38021, s50021, s100021 # 400
+ldint ci2, 0 # 401
+vincint 1000, ci3, ci2, 1, 1, 1000 # 402
+vconvint 1000, c22, ci3 # 403
+vldsi 1000, s50021, 0 # 404
+vaddm 1000, s96021, s50021, c22 # 405
+ldint ci1, 0 # 406
+vincint 1000, ci3, ci1, 1, 1, 1000 # 407
+vconvint 1000, c22, ci3 # 408
+vldsi 1000, s77021, 0 # 409
+vaddm 1000, s95021, s77021, c22 # 410
+ldint ci0, 3 # 411
+vincint 1000, ci3, ci0, 1, 1, 1000 # 412
+vconvint 1000, c22, ci3 # 413
+vldsi 1000, s77021, 0 # 414
+vaddm 1000, s93021, s77021, c22 # 415
+ldint ci2, 4 # 416
+vincint 1000, ci3, ci2, 1, 1, 1000 # 417
+vconvint 1000, c22, ci3 # 418
+vldsi 1000, s45021, 0 # 419
+vaddm 1000, s92021, s45021, c22 # 420
+ldint ci1, 6 # 421
+vincint 1000, ci3, ci1, 1, 1, 1000 # 422
+vconvint 1000, c22, ci3 # 423
+vldsi 1000, s81021, 0 # 424
+vaddm 1000, s90021, s81021, c22 # 425
+ldint ci0, 8 # 426
+vincint 1000, ci3, ci0, 1, 1, 1000 # 427
+vconvint 1000, c22, ci3 # 428
+vldsi 1000, s72021, 0 # 429
+vaddm 1000, s89021, s72021, c22 # 430
+ldint ci2, 9 # 431
+vincint 1000, ci3, ci2, 1, 1, 1000 # 432
+vconvint 1000, c22, ci3 # 433
+vldsi 1000, s56021, 0 # 434
+vaddm 1000, s87021, s56021, c22 # 435
+ldint ci1, 12 # 436
+vincint 1000, ci3, ci1, 1, 1, 1000 # 437
+vconvint 1000, c22, ci3 # 438
+vldsi 1000, s83021, 0 # 439
+vaddm 1000, s86021, s83021, c22 # 440
+ldint ci0, 12 # 441
+vincint 1000, ci3, ci0, 1, 1, 1000 # 442
+vconvint 1000, c22, ci3 # 443
+vldsi 1000, s51021, 0 # 444
+vaddm 1000, s84021, s51021, c22 # 445
+ldint ci2, 16 # 446
+vincint 1000, ci3, ci2, 1, 1, 1000 # 447
+vconvint 1000, c22, ci3 # 448
+vldsi 1000, s97021, 0 # 449
+vaddm 1000, s83021, s97021, c22 # 450
+ldint ci1, 15 # 451
+vincint 1000, ci3, ci1, 1, 1, 1000 # 452
+vconvint 1000, c22, ci3 # 453
+vldsi 1000, s78021, 0 # 454
+vaddm 1000, s81021, s78021, c22 # 455
+ldint ci0, 20 # 456
+vincint 1000, ci3, ci0, 1, 1, 1000 # 457
+vconvint 1000, c22, ci3 # 458
+vldsi 1000, s62021, 0 # 459
+vaddm 1000, s80021, s62021, c22 # 460
+ldint ci2, 18 # 461
+vincint 1000, ci3, ci2, 1, 1, 1000 # 462
+vconvint 1000, c22, ci3 # 463
+vldsi 1000, s57021, 0 # 464
+vaddm 1000, s78021, s57021, c22 # 465
+ldint ci1, 24 # 466
+vincint 1000, ci3, ci1, 1, 1, 1000 # 467
+vconvint 1000, c22, ci3 # 468
+vldsi 1000, s68021, 0 # 469
+vaddm 1000, s77021, s68021, c22 # 470
+ldint ci0, 21 # 471
+vincint 1000, ci3, ci0, 1, 1, 1000 # 472
+vconvint 1000, c22, ci3 # 473
+vldsi 1000, s47021, 0 # 474
+vaddm 1000, s75021, s47021, c22 # 475
+ldint ci2, 28 # 476
+vincint 1000, ci3, ci2, 1, 1, 1000 # 477
+vconvint 1000, c22, ci3 # 478
+vldsi 1000, s63021, 0 # 479
+vaddm 1000, s74021, s63021, c22 # 480
+ldint ci1, 24 # 481
+vincint 1000, ci3, ci1, 1, 1, 1000 # 482
+vconvint 1000, c22, ci3 # 483
+vldsi 1000, s42021, 0 # 484
+vaddm 1000, s72021, s42021, c22 # 485
+ldint ci0, 32 # 486
+vincint 1000, ci3, ci0, 1, 1, 1000 # 487
+vconvint 1000, c22, ci3 # 488
+vldsi 1000, s53021, 0 # 489
+vaddm 1000, s71021, s53021, c22 # 490
+ldint ci2, 27 # 491
+vincint 1000, ci3, ci2, 1, 1, 1000 # 492
+vconvint 1000, c22, ci3 # 493
+vldsi 1000, s53021, 0 # 494
+vaddm 1000, s69021, s53021, c22 # 495
+ldint ci1, 36 # 496
+vincint 1000, ci3, ci1, 1, 1, 1000 # 497
+vconvint 1000, c22, ci3 # 498
+vldsi 1000, s48021, 0 # 499
+vaddm 1000, s68021, s48021, c22 # 500
+ldint ci0, 30 # 501
+vincint 1000, ci3, ci0, 1, 1, 1000 # 502
+vconvint 1000, c22, ci3 # 503
+vldsi 1000, s51021, 0 # 504
+vaddm 1000, s66021, s51021, c22 # 505
+ldint ci2, 40 # 506
+vincint 1000, ci3, ci2, 1, 1, 1000 # 507
+vconvint 1000, c22, ci3 # 508
+vldsi 1000, s39021, 0 # 509
+vaddm 1000, s65021, s39021, c22 # 510
+ldint ci1, 33 # 511
+vincint 1000, ci3, ci1, 1, 1, 1000 # 512
+vconvint 1000, c22, ci3 # 513
+vldsi 1000, s47021, 0 # 514
+vaddm 1000, s63021, s47021, c22 # 515
+ldint ci0, 44 # 516
+vincint 1000, ci3, ci0, 1, 1, 1000 # 517
+vconvint 1000, c22, ci3 # 518
+vldsi 1000, s53021, 0 # 519
+vaddm 1000, s62021, s53021, c22 # 520
+ldint ci2, 36 # 521
+vincint 1000, ci3, ci2, 1, 1, 1000 # 522
+vconvint 1000, c22, ci3 # 523
+vldsi 1000, s57021, 0 # 524
+vaddm 1000, s60021, s57021, c22 # 525
+ldint ci1, 48 # 526
+vincint 1000, ci3, ci1, 1, 1, 1000 # 527
+vconvint 1000, c22, ci3 # 528
+vldsi 1000, s54021, 0 # 529
+vaddm 1000, s59021, s54021, c22 # 530
+ldint ci0, 39 # 531
+vincint 1000, ci3, ci0, 1, 1, 1000 # 532
+vconvint 1000, c22, ci3 # 533
+vldsi 1000, s50021, 0 # 534
+vaddm 1000, s57021, s50021, c22 # 535
+ldint ci2, 52 # 536
+vincint 1000, ci3, ci2, 1, 1, 1000 # 537
+vconvint 1000, c22, ci3 # 538
+vldsi 1000, s42021, 0 # 539
+vaddm 1000, s56021, s42021, c22 # 540
+ldint ci1, 42 # 541
+vincint 1000, ci3, ci1, 1, 1, 1000 # 542
+vconvint 1000, c22, ci3 # 543
+vldsi 1000, s97021, 0 # 544
+vaddm 1000, s54021, s97021, c22 # 545
+ldint ci0, 56 # 546
+vincint 1000, ci3, ci0, 1, 1, 1000 # 547
+vconvint 1000, c22, ci3 # 548
+vldsi 1000, s48021, 0 # 549
+vaddm 1000, s53021, s48021, c22 # 550
+ldint ci2, 45 # 551
+vincint 1000, ci3, ci2, 1, 1, 1000 # 552
+vconvint 1000, c22, ci3 # 553
+vldsi 1000, s44021, 0 # 554
+vaddm 1000, s51021, s44021, c22 # 555
+ldint ci1, 60 # 556
+vincint 1000, ci3, ci1, 1, 1, 1000 # 557
+vconvint 1000, c22, ci3 # 558
+vldsi 1000, s45021, 0 # 559
+vaddm 1000, s50021, s45021, c22 # 560
+ldint ci0, 48 # 561
+vincint 1000, ci3, ci0, 1, 1, 1000 # 562
+vconvint 1000, c22, ci3 # 563
+vldsi 1000, s39021, 0 # 564
+vaddm 1000, s48021, s39021, c22 # 565
+ldint ci2, 64 # 566
+vincint 1000, ci3, ci2, 1, 1, 1000 # 567
+vconvint 1000, c22, ci3 # 568
+vldsi 1000, s39021, 0 # 569
+vaddm 1000, s47021, s39021, c22 # 570
+ldint ci1, 51 # 571
+vincint 1000, ci3, ci1, 1, 1, 1000 # 572
+vconvint 1000, c22, ci3 # 573
+vldsi 1000, s97021, 0 # 574
+vaddm 1000, s45021, s97021, c22 # 575
+ldint ci0, 68 # 576
+vincint 1000, ci3, ci0, 1, 1, 1000 # 577
+vconvint 1000, c22, ci3 # 578
+vldsi 1000, s42021, 0 # 579
+vaddm 1000, s44021, s42021, c22 # 580
+ldint ci2, 54 # 581
+vincint 1000, ci3, ci2, 1, 1, 1000 # 582
+vconvint 1000, c22, ci3 # 583
+vldsi 1000, s39021, 0 # 584
+vaddm 1000, s42021, s39021, c22 # 585
+ldint ci1, 72 # 586
+vincint 1000, ci3, ci1, 1, 1, 1000 # 587
+vconvint 1000, c22, ci3 # 588
+vldsi 1000, s97021, 0 # 589
+vaddm 1000, s39021, s97021, c22 # 590
+vadds 1000, s97021, s94021, s99021 # 591
+vadds 1000, s94021, s97021, s98021 # 592
+adds s0, s94021, s94071 # 593
+adds s6, s0, s94121 # 594
+adds s8, s6, s94171 # 595
+adds s4, s8, s94221 # 596
+adds s5, s4, s94271 # 597
+adds s7, s5, s94321 # 598
+adds s18, s7, s94371 # 599
+adds s19, s18, s94421 # 600
+adds s20, s19, s94471 # 601
+adds s16, s20, s94521 # 602
+adds s17, s16, s94571 # 603
+adds s13, s17, s94621 # 604
+adds s14, s13, s94671 # 605
+adds s11, s14, s94721 # 606
+adds s15, s11, s94771 # 607
+adds s3, s15, s94821 # 608
+adds s12, s3, s94871 # 609
+adds s7, s12, s94921 # 610
+adds s2, s7, s94971 # 611
+vadds 1000, s94021, s91021, s96021 # 612
+vadds 1000, s91021, s94021, s95021 # 613
+vstms 1000, s91021, 8192 # 614
+vadds 1000, s91021, s88021, s93021 # 615
+vadds 1000, s88021, s91021, s92021 # 616
+vstms 1000, s88021, 9192 # 617
+vadds 1000, s88021, s85021, s90021 # 618
+vadds 1000, s85021, s88021, s89021 # 619
+vstms 1000, s85021, 10192 # 620
+vadds 1000, s85021, s82021, s87021 # 621
+vadds 1000, s82021, s85021, s86021 # 622
+vstms 1000, s82021, 11192 # 623
+vadds 1000, s82021, s79021, s84021 # 624
+vadds 1000, s79021, s82021, s83021 # 625
+vstms 1000, s79021, 12192 # 626
+vadds 1000, s79021, s76021, s81021 # 627
+vadds 1000, s76021, s79021, s80021 # 628
+vstms 1000, s76021, 13192 # 629
+vadds 1000, s76021, s73021, s78021 # 630
+vadds 1000, s73021, s76021, s77021 # 631
+vstms 1000, s73021, 14192 # 632
+vadds 1000, s73021, s70021, s75021 # 633
+vadds 1000, s70021, s73021, s74021 # 634
+vstms 1000, s70021, 15192 # 635
+vadds 1000, s70021, s67021, s72021 # 636
+vadds 1000, s67021, s70021, s71021 # 637
+vstms 1000, s67021, 16192 # 638
+vadds 1000, s67021, s64021, s69021 # 639
+vadds 1000, s64021, s67021, s68021 # 640
+vstms 1000, s64021, 17192 # 641
+vadds 1000, s64021, s61021, s66021 # 642
+vadds 1000, s61021, s64021, s65021 # 643
+vstms 1000, s61021, 18192 # 644
+vadds 1000, s61021, s58021, s63021 # 645
+vadds 1000, s58021, s61021, s62021 # 646
+vstms 1000, s58021, 19192 # 647
+vadds 1000, s58021, s55021, s60021 # 648
+vadds 1000, s55021, s58021, s59021 # 649
+vstms 1000, s55021, 20192 # 650
+vadds 1000, s55021, s52021, s57021 # 651
+vadds 1000, s52021, s55021, s56021 # 652
+vstms 1000, s52021, 21192 # 653
+vadds 1000, s52021, s49021, s54021 # 654
+vadds 1000, s49021, s52021, s53021 # 655
+vstms 1000, s49021, 22192 # 656
+vadds 1000, s49021, s46021, s51021 # 657
+vadds 1000, s46021, s49021, s50021 # 658
+vstms 1000, s46021, 23192 # 659
+vadds 1000, s46021, s43021, s48021 # 660
+vadds 1000, s43021, s46021, s47021 # 661
+vstms 1000, s43021, 24192 # 662
+vadds 1000, s43021, s40021, s45021 # 663
+vadds 1000, s40021, s43021, s44021 # 664
+vstms 1000, s40021, 25192 # 665
+vadds 1000, s40021, s41021, s42021 # 666
+vadds 1000, s41021, s40021, s39021 # 667
+vstms 1000, s41021, 26192 # 668
+ldint ci0, 57 # 669
+vincint 1000, ci3, ci0, 1, 1, 1000 # 670
+vconvint 1000, c22, ci3 # 671
+vldsi 1000, s39021, 0 # 672
+vaddm 1000, s41021, s39021, c22 # 673
+ldint ci2, 76 # 674
+vincint 1000, ci3, ci2, 1, 1, 1000 # 675
+vconvint 1000, c22, ci3 # 676
+vldsi 1000, s39021, 0 # 677
+vaddm 1000, s40021, s39021, c22 # 678
+vadds 1000, s39021, s38021, s41021 # 679
+vadds 1000, s38021, s39021, s40021 # 680
+vstms 1000, s38021, 27192 # 681
+vadds 950, s35171, s34221, s37071 # 682
+vadds 950, s34221, s35171, s36121 # 683
+adds s9, s34221, s34271 # 684
+adds s5, s9, s34321 # 685
+adds s10, s5, s34371 # 686
+adds s1, s10, s34421 # 687
+adds s0, s1, s34471 # 688
+adds s6, s0, s34521 # 689
+adds s8, s6, s34571 # 690
+adds s4, s8, s34621 # 691
+adds s20, s4, s34671 # 692
+adds s18, s20, s34721 # 693
+adds s19, s18, s34771 # 694
+adds s15, s19, s34821 # 695
+adds s16, s15, s34871 # 696
+adds s17, s16, s34921 # 697
+adds s13, s17, s34971 # 698
+adds s14, s13, s35021 # 699
+adds s11, s14, s35071 # 700
+adds s4, s11, s35121 # 701
+vadds 900, s31521, s30621, s33321 # 702
+vadds 900, s30621, s31521, s32421 # 703
+adds s3, s30621, s30671 # 704
+adds s8, s3, s30721 # 705
+adds s12, s8, s30771 # 706
+adds s7, s12, s30821 # 707
+adds s9, s7, s30871 # 708
+adds s5, s9, s30921 # 709
+adds s10, s5, s30971 # 710
+adds s1, s10, s31021 # 711
+adds s0, s1, s31071 # 712
+adds s6, s0, s31121 # 713
+adds s20, s6, s31171 # 714
+adds s17, s20, s31221 # 715
+adds s18, s17, s31271 # 716
+adds s19, s18, s31321 # 717
+adds s15, s19, s31371 # 718
+adds s16, s15, s31421 # 719
+adds s6, s16, s31471 # 720
+vadds 850, s28071, s27221, s29771 # 721
+vadds 850, s27221, s28071, s28921 # 722
+adds s12, s27221, s27271 # 723
+adds s13, s12, s27321 # 724
+adds s14, s13, s27371 # 725
+adds s11, s14, s27421 # 726
+adds s3, s11, s27471 # 727
+adds s8, s3, s27521 # 728
+adds s0, s8, s27571 # 729
+adds s7, s0, s27621 # 730
+adds s9, s7, s27671 # 731
+adds s5, s9, s27721 # 732
+adds s10, s5, s27771 # 733
+adds s1, s10, s27821 # 734
+adds s18, s1, s27871 # 735
+adds s20, s18, s27921 # 736
+adds s17, s20, s27971 # 737
+adds s8, s17, s28021 # 738
+vadds 800, s24821, s24021, s26421 # 739
+vadds 800, s24021, s24821, s25621 # 740
+adds s18, s24021, s24071 # 741
+adds s19, s18, s24121 # 742
+adds s15, s19, s24171 # 743
+adds s16, s15, s24221 # 744
+adds s12, s16, s24271 # 745
+adds s13, s12, s24321 # 746
+adds s14, s13, s24371 # 747
+adds s11, s14, s24421 # 748
+adds s3, s11, s24471 # 749
+adds s1, s3, s24521 # 750
+adds s0, s1, s24571 # 751
+adds s7, s0, s24621 # 752
+adds s9, s7, s24671 # 753
+adds s5, s9, s24721 # 754
+adds s10, s5, s24771 # 755
+vadds 750, s21771, s21021, s23271 # 756
+vadds 750, s21021, s21771, s22521 # 757
+adds s20, s21021, s21071 # 758
+adds s3, s20, s21121 # 759
+adds s17, s3, s21171 # 760
+adds s18, s17, s21221 # 761
+adds s19, s18, s21271 # 762
+adds s15, s19, s21321 # 763
+adds s16, s15, s21371 # 764
+adds s12, s16, s21421 # 765
+adds s13, s12, s21471 # 766
+adds s14, s13, s21521 # 767
+adds s11, s14, s21571 # 768
+adds s0, s11, s21621 # 769
+adds s1, s0, s21671 # 770
+adds s12, s1, s21721 # 771
+vadds 700, s18921, s18221, s20321 # 772
+vadds 700, s18221, s18921, s19621 # 773
+adds s5, s18221, s18271 # 774
+adds s7, s5, s18321 # 775
+adds s9, s7, s18371 # 776
+adds s20, s9, s18421 # 777
+adds s3, s20, s18471 # 778
+adds s17, s3, s18521 # 779
+adds s18, s17, s18571 # 780
+adds s19, s18, s18621 # 781
+adds s15, s19, s18671 # 782
+adds s16, s15, s18721 # 783
+adds s9, s16, s18771 # 784
+adds s13, s9, s18821 # 785
+adds s14, s13, s18871 # 786
+vadds 650, s16271, s15621, s17571 # 787
+vadds 650, s15621, s16271, s16921 # 788
+adds s7, s15621, s15671 # 789
+adds s11, s7, s15721 # 790
+adds s0, s11, s15771 # 791
+adds s1, s0, s15821 # 792
+adds s5, s1, s15871 # 793
+adds s20, s5, s15921 # 794
+adds s3, s20, s15971 # 795
+adds s17, s3, s16021 # 796
+adds s18, s17, s16071 # 797
+adds s19, s18, s16121 # 798
+adds s15, s19, s16171 # 799
+adds s16, s15, s16221 # 800
+vadds 600, s13821, s13221, s15021 # 801
+vadds 600, s13221, s13821, s14421 # 802
+adds s11, s13221, s13271 # 803
+adds s9, s11, s13321 # 804
+adds s13, s9, s13371 # 805
+adds s7, s13, s13421 # 806
+adds s5, s7, s13471 # 807
+adds s0, s5, s13521 # 808
+adds s1, s0, s13571 # 809
+adds s20, s1, s13621 # 810
+adds s3, s20, s13671 # 811
+adds s17, s3, s13721 # 812
+adds s18, s17, s13771 # 813
+vadds 550, s11571, s11021, s12671 # 814
+vadds 550, s11021, s11571, s12121 # 815
+adds s13, s11021, s11071 # 816
+adds s19, s13, s11121 # 817
+adds s15, s19, s11171 # 818
+adds s11, s15, s11221 # 819
+adds s9, s11, s11271 # 820
+adds s1, s9, s11321 # 821
+adds s7, s1, s11371 # 822
+adds s5, s7, s11421 # 823
+adds s0, s5, s11471 # 824
+adds s20, s0, s11521 # 825
+vadds 500, s9521, s9021, s10521 # 826
+vadds 500, s9021, s9521, s10021 # 827
+adds s19, s9021, s9071 # 828
+adds s3, s19, s9121 # 829
+adds s17, s3, s9171 # 830
+adds s13, s17, s9221 # 831
+adds s9, s13, s9271 # 832
+adds s15, s9, s9321 # 833
+adds s11, s15, s9371 # 834
+adds s0, s11, s9421 # 835
+adds s1, s0, s9471 # 836
+vadds 450, s7671, s7221, s8571 # 837
+vadds 450, s7221, s7671, s8121 # 838
+adds s9, s7221, s7271 # 839
+adds s7, s9, s7321 # 840
+adds s5, s7, s7371 # 841
+adds s19, s5, s7421 # 842
+adds s3, s19, s7471 # 843
+adds s17, s3, s7521 # 844
+adds s13, s17, s7571 # 845
+adds s5, s13, s7621 # 846
+vadds 400, s6021, s5621, s6821 # 847
+vadds 400, s5621, s6021, s6421 # 848
+adds s15, s5621, s5671 # 849
+adds s7, s15, s5721 # 850
+adds s11, s7, s5771 # 851
+adds s0, s11, s5821 # 852
+adds s9, s0, s5871 # 853
+adds s19, s9, s5921 # 854
+adds s9, s19, s5971 # 855
+vadds 350, s4571, s4221, s5271 # 856
+vadds 350, s4221, s4571, s4921 # 857
+adds s15, s4221, s4271 # 858
+adds s3, s15, s4321 # 859
+adds s17, s3, s4371 # 860
+adds s13, s17, s4421 # 861
+adds s7, s13, s4471 # 862
+adds s0, s7, s4521 # 863
+vadds 300, s3321, s3021, s3921 # 864
+vadds 300, s3021, s3321, s3621 # 865
+adds s11, s3021, s3071 # 866
+adds s19, s11, s3121 # 867
+adds s11, s19, s3171 # 868
+adds s15, s11, s3221 # 869
+adds s3, s15, s3271 # 870
+vadds 250, s2271, s2021, s2771 # 871
+vadds 250, s2021, s2271, s2521 # 872
+adds s13, s2021, s2071 # 873
+adds s17, s13, s2121 # 874
+adds s7, s17, s2171 # 875
+adds s19, s7, s2221 # 876
+vadds 200, s1421, s1221, s1821 # 877
+vadds 200, s1221, s1421, s1621 # 878
+adds s15, s1221, s1271 # 879
+adds s11, s15, s1321 # 880
+adds s7, s11, s1371 # 881
+vadds 150, s771, s621, s1071 # 882
+vadds 150, s621, s771, s921 # 883
+adds s17, s621, s671 # 884
+adds s13, s17, s721 # 885
+vadds 100, s321, s221, s521 # 886
+vadds 100, s221, s321, s421 # 887
+adds s17, s221, s271 # 888
+vadds 50, s71, s21, s171 # 889
+vadds 50, s21, s71, s121 # 890
+ldsi s11, 0 # 891
+adds s15, s11, s21 # 892
+adds s11, s15, s17 # 893
+adds s17, s11, s13 # 894
+adds s15, s17, s7 # 895
+adds s13, s15, s19 # 896
+adds s11, s13, s3 # 897
+adds s7, s11, s0 # 898
+adds s3, s7, s9 # 899
+adds s0, s3, s5 # 900
+adds s19, s0, s1 # 901
+adds s17, s19, s20 # 902
+adds s15, s17, s18 # 903
+adds s13, s15, s16 # 904
+adds s11, s13, s14 # 905
+adds s9, s11, s12 # 906
+adds s7, s9, s10 # 907
+adds s5, s7, s8 # 908
+adds s3, s5, s6 # 909
+adds s1, s3, s4 # 910
+adds s0, s1, s2 # 911
+ldms s1, 9191 # 912
+ldms s2, 10191 # 913
+ldms s3, 11191 # 914
+ldms s4, 12191 # 915
+ldms s5, 13191 # 916
+ldms s6, 14191 # 917
+ldms s7, 15191 # 918
+ldms s8, 16191 # 919
+ldms s9, 17191 # 920
+ldms s10, 18191 # 921
+ldms s11, 19191 # 922
+ldms s12, 20191 # 923
+ldms s13, 21191 # 924
+ldms s14, 22191 # 925
+ldms s15, 23191 # 926
+ldms s16, 24191 # 927
+ldms s17, 25191 # 928
+ldms s18, 26191 # 929
+ldms s19, 27191 # 930
+ldms s20, 28191 # 931
+asm_open 45, 1, c0, s0, c21, s0, c20, s1, c19, s2, c18, s3, c17, s4, c16, s5, c15, s6, c14, s7, c13, s8, c12, s9, c11, s10, c10, s11, c9, s12, c8, s13, c7, s14, c6, s15, c5, s16, c4, s17, c3, s18, c2, s19, c1, s20 # 932
+print_reg_plain c0 # 933
+ldint ci0, 34416620 # 934
+convmodp ci2, c21, 63 # 935
+eqc ci1, ci2, ci0 # 936
+ldint ci0, 1 # 937
+subint ci2, ci0, ci1 # 938
+print_char 32 # 939
+print_char4 825504819 # 940
+print_char4 808597046 # 941
+print_char 10 # 942
+crash ci2 # 943
+ldint ci0, 999999 # 944
+convmodp ci2, c20, 63 # 945
+eqc ci1, ci2, ci0 # 946
+ldint ci0, 1 # 947
+subint ci2, ci0, ci1 # 948
+print_reg_plain c20 # 949
+print_char 32 # 950
+print_char4 960051513 # 951
+print_char 57 # 952
+print_char 57 # 953
+print_char 10 # 954
+crash ci2 # 955
+ldint ci0, 1003005 # 956
+convmodp ci2, c19, 63 # 957
+eqc ci1, ci2, ci0 # 958
+ldint ci0, 1 # 959
+subint ci2, ci0, ci1 # 960
+print_reg_plain c19 # 961
+print_char 32 # 962
+print_char4 858796081 # 963
+print_char 48 # 964
+print_char 48 # 965
+print_char 53 # 966
+print_char 10 # 967
+crash ci2 # 968
+ldint ci0, 1006015 # 969
+convmodp ci2, c18, 63 # 970
+eqc ci1, ci2, ci0 # 971
+ldint ci0, 1 # 972
+subint ci2, ci0, ci1 # 973
+print_reg_plain c18 # 974
+print_char 32 # 975
+print_char4 909127729 # 976
+print_char 48 # 977
+print_char 49 # 978
+print_char 53 # 979
+print_char 10 # 980
+crash ci2 # 981
+ldint ci0, 1009029 # 982
+convmodp ci2, c17, 63 # 983
+eqc ci1, ci2, ci0 # 984
+ldint ci0, 1 # 985
+subint ci2, ci0, ci1 # 986
+print_reg_plain c17 # 987
+print_char 32 # 988
+print_char4 959459377 # 989
+print_char 48 # 990
+print_char 50 # 991
+print_char 57 # 992
+print_char 10 # 993
+crash ci2 # 994
+ldint ci0, 1012047 # 995
+convmodp ci2, c16, 63 # 996
+eqc ci1, ci2, ci0 # 997
+ldint ci0, 1 # 998
+subint ci2, ci0, ci1 # 999
+print_reg_plain c16 # 1000
+print_char 32 # 1001
+print_char4 842084401 # 1002
+print_char 48 # 1003
+print_char 52 # 1004
+print_char 55 # 1005
+print_char 10 # 1006
+crash ci2 # 1007
+ldint ci0, 1015069 # 1008
+convmodp ci2, c15, 63 # 1009
+eqc ci1, ci2, ci0 # 1010
+ldint ci0, 1 # 1011
+subint ci2, ci0, ci1 # 1012
+print_reg_plain c15 # 1013
+print_char 32 # 1014
+print_char4 892416049 # 1015
+print_char 48 # 1016
+print_char 54 # 1017
+print_char 57 # 1018
+print_char 10 # 1019
+crash ci2 # 1020
+ldint ci0, 1018095 # 1021
+convmodp ci2, c14, 63 # 1022
+eqc ci1, ci2, ci0 # 1023
+ldint ci0, 1 # 1024
+subint ci2, ci0, ci1 # 1025
+print_reg_plain c14 # 1026
+print_char 32 # 1027
+print_char4 942747697 # 1028
+print_char 48 # 1029
+print_char 57 # 1030
+print_char 53 # 1031
+print_char 10 # 1032
+crash ci2 # 1033
+ldint ci0, 1021125 # 1034
+convmodp ci2, c13, 63 # 1035
+eqc ci1, ci2, ci0 # 1036
+ldint ci0, 1 # 1037
+subint ci2, ci0, ci1 # 1038
+print_reg_plain c13 # 1039
+print_char 32 # 1040
+print_char4 825372721 # 1041
+print_char 49 # 1042
+print_char 50 # 1043
+print_char 53 # 1044
+print_char 10 # 1045
+crash ci2 # 1046
+ldint ci0, 1024159 # 1047
+convmodp ci2, c12, 63 # 1048
+eqc ci1, ci2, ci0 # 1049
+ldint ci0, 1 # 1050
+subint ci2, ci0, ci1 # 1051
+print_reg_plain c12 # 1052
+print_char 32 # 1053
+print_char4 875704369 # 1054
+print_char 49 # 1055
+print_char 53 # 1056
+print_char 57 # 1057
+print_char 10 # 1058
+crash ci2 # 1059
+ldint ci0, 1027197 # 1060
+convmodp ci2, c11, 63 # 1061
+eqc ci1, ci2, ci0 # 1062
+ldint ci0, 1 # 1063
+subint ci2, ci0, ci1 # 1064
+print_reg_plain c11 # 1065
+print_char 32 # 1066
+print_char4 926036017 # 1067
+print_char 49 # 1068
+print_char 57 # 1069
+print_char 55 # 1070
+print_char 10 # 1071
+crash ci2 # 1072
+ldint ci0, 1030239 # 1073
+convmodp ci2, c10, 63 # 1074
+eqc ci1, ci2, ci0 # 1075
+ldint ci0, 1 # 1076
+subint ci2, ci0, ci1 # 1077
+print_reg_plain c10 # 1078
+print_char 32 # 1079
+print_char4 808661041 # 1080
+print_char 50 # 1081
+print_char 51 # 1082
+print_char 57 # 1083
+print_char 10 # 1084
+crash ci2 # 1085
+ldint ci0, 1033285 # 1086
+convmodp ci2, c9, 63 # 1087
+eqc ci1, ci2, ci0 # 1088
+ldint ci0, 1 # 1089
+subint ci2, ci0, ci1 # 1090
+print_reg_plain c9 # 1091
+print_char 32 # 1092
+print_char4 858992689 # 1093
+print_char 50 # 1094
+print_char 56 # 1095
+print_char 53 # 1096
+print_char 10 # 1097
+crash ci2 # 1098
+ldint ci0, 1036335 # 1099
+convmodp ci2, c8, 63 # 1100
+eqc ci1, ci2, ci0 # 1101
+ldint ci0, 1 # 1102
+subint ci2, ci0, ci1 # 1103
+print_reg_plain c8 # 1104
+print_char 32 # 1105
+print_char4 909324337 # 1106
+print_char 51 # 1107
+print_char 51 # 1108
+print_char 53 # 1109
+print_char 10 # 1110
+crash ci2 # 1111
+ldint ci0, 1039389 # 1112
+convmodp ci2, c7, 63 # 1113
+eqc ci1, ci2, ci0 # 1114
+ldint ci0, 1 # 1115
+subint ci2, ci0, ci1 # 1116
+print_reg_plain c7 # 1117
+print_char 32 # 1118
+print_char4 959655985 # 1119
+print_char 51 # 1120
+print_char 56 # 1121
+print_char 57 # 1122
+print_char 10 # 1123
+crash ci2 # 1124
+ldint ci0, 1042447 # 1125
+convmodp ci2, c6, 63 # 1126
+eqc ci1, ci2, ci0 # 1127
+ldint ci0, 1 # 1128
+subint ci2, ci0, ci1 # 1129
+print_reg_plain c6 # 1130
+print_char 32 # 1131
+print_char4 842281009 # 1132
+print_char 52 # 1133
+print_char 52 # 1134
+print_char 55 # 1135
+print_char 10 # 1136
+crash ci2 # 1137
+ldint ci0, 1045509 # 1138
+convmodp ci2, c5, 63 # 1139
+eqc ci1, ci2, ci0 # 1140
+ldint ci0, 1 # 1141
+subint ci2, ci0, ci1 # 1142
+print_reg_plain c5 # 1143
+print_char 32 # 1144
+print_char4 892612657 # 1145
+print_char 53 # 1146
+print_char 48 # 1147
+print_char 57 # 1148
+print_char 10 # 1149
+crash ci2 # 1150
+ldint ci0, 1048575 # 1151
+convmodp ci2, c4, 63 # 1152
+eqc ci1, ci2, ci0 # 1153
+ldint ci0, 1 # 1154
+subint ci2, ci0, ci1 # 1155
+print_reg_plain c4 # 1156
+print_char 32 # 1157
+print_char4 942944305 # 1158
+print_char 53 # 1159
+print_char 55 # 1160
+print_char 53 # 1161
+print_char 10 # 1162
+crash ci2 # 1163
+ldint ci0, 1051645 # 1164
+convmodp ci2, c3, 63 # 1165
+eqc ci1, ci2, ci0 # 1166
+ldint ci0, 1 # 1167
+subint ci2, ci0, ci1 # 1168
+print_reg_plain c3 # 1169
+print_char 32 # 1170
+print_char4 825569329 # 1171
+print_char 54 # 1172
+print_char 52 # 1173
+print_char 53 # 1174
+print_char 10 # 1175
+crash ci2 # 1176
+ldint ci0, 1054719 # 1177
+convmodp ci2, c2, 63 # 1178
+eqc ci1, ci2, ci0 # 1179
+ldint ci0, 1 # 1180
+subint ci2, ci0, ci1 # 1181
+print_reg_plain c2 # 1182
+print_char 32 # 1183
+print_char4 875900977 # 1184
+print_char 55 # 1185
+print_char 49 # 1186
+print_char 57 # 1187
+print_char 10 # 1188
+crash ci2 # 1189
+convmodp ci0, c1, 63 # 1190
+ldint ci1, 1057797 # 1191
+eqc ci2, ci0, ci1 # 1192
+ldint ci1, 1 # 1193
+subint ci0, ci1, ci2 # 1194
+print_reg_plain c1 # 1195
+print_char 32 # 1196
+print_char4 926232625 # 1197
+print_char 55 # 1198
+print_char 57 # 1199
+print_char 55 # 1200
+print_char 10 # 1201
+crash ci0 # 1202
+shrci c0, c21, 64 # 1203
+shrci c0, c20, 64 # 1204
+shrci c0, c19, 64 # 1205
+shrci c0, c18, 64 # 1206
+shrci c0, c17, 64 # 1207
+shrci c0, c16, 64 # 1208
+shrci c0, c15, 64 # 1209
+shrci c0, c14, 64 # 1210
+shrci c0, c13, 64 # 1211
+shrci c0, c12, 64 # 1212
+shrci c0, c11, 64 # 1213
+shrci c0, c10, 64 # 1214
+shrci c0, c9, 64 # 1215
+shrci c0, c8, 64 # 1216
+shrci c0, c7, 64 # 1217
+shrci c0, c6, 64 # 1218
+shrci c0, c5, 64 # 1219
+shrci c0, c4, 64 # 1220
+shrci c0, c3, 64 # 1221
+shrci c0, c2, 64 # 1222
+shrci c0, c1, 64 # 1223
+use 0, 7, 22 # 1224
+use 0, 0, 30500 # 1225
+ldmc c0, 8191 # 1226
+gldmc cg0, 8191 # 1227
+ldmint ci0, 8191 # 1228
+ldms s0, 28191 # 1229
+gldms sg0, 8191 # 1230
+active 1 # 1231
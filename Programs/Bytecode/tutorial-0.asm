@@ -0,0 +1,682 @@
+ldsi s16, 1 # 0
+ldsi s22, 2 # 1
+inputmixed 6, 0, s24, 0, 0, s1, 1 # 2
+print_char4 544501607 # 3
+adds s33, s16, s22 # 4
+muls 4, 1, s25, s16, s22 # 5
+asm_open 3, 1, c1, s25 # 6
+subs s39, s16, s22 # 7
+asm_open 9, 1, c4, s24, c3, s1, c2, s33, c0, s39 # 8
+print_reg_plain c4 # 9
+print_char4 1869768224 # 10
+print_char4 1819287661 # 11
+print_char4 1919252833 # 12
+print_char 32 # 13
+print_char 48 # 14
+print_char 10 # 15
+print_char4 544501607 # 16
+print_reg_plain c3 # 17
+print_char4 1869768224 # 18
+print_char4 1819287661 # 19
+print_char4 1919252833 # 20
+print_char 32 # 21
+print_char 49 # 22
+print_char 10 # 23
+print_char4 1701869669 # 24
+print_char4 1684370531 # 25
+print_char 32 # 26
+print_char 51 # 27
+print_char4 1869029420 # 28
+print_char 116 # 29
+print_char 32 # 30
+print_reg_plain c2 # 31
+print_char 10 # 32
+print_char4 1701869669 # 33
+print_char4 1684370531 # 34
+print_char 32 # 35
+print_char 50 # 36
+print_char4 1869029420 # 37
+print_char 116 # 38
+print_char 32 # 39
+print_reg_plain c1 # 40
+print_char 10 # 41
+print_char4 1701869669 # 42
+print_char4 1684370531 # 43
+print_char 32 # 44
+print_char 45 # 45
+print_char 49 # 46
+print_char4 1869029420 # 47
+print_char 116 # 48
+print_char 32 # 49
+print_reg_plain c0 # 50
+print_char 10 # 51
+mulsi s25, s22, 32768 # 52
+mulsi s39, s16, 32768 # 53
+concats 3, s1, 1, s25 # 54
+concats 3, s33, 1, s39 # 55
+ldint ci0, 0 # 56
+call_tape 17, 1, ci0, 1, 4, 1, *0, *0, 0, 4, 1, *11, *1, 0, 4, 1, *14, *33 # 57
+picks s24, s0, 0, 1 # 58
+concats 3, s25, 1, s24 # 59
+ldint ci0, 0 # 60
+call_tape 12, 2, ci0, 1, 4, 1, *18, *0, 0, 4, 1, *2, *25 # 61
+picks s39, s18, 0, 1 # 62
+asm_open 3, 1, c0, s39 # 63
+print_char4 1701869669 # 64
+print_char4 1684370531 # 65
+print_char 32 # 66
+print_char 50 # 67
+print_char4 1869029420 # 68
+print_char 116 # 69
+print_char 32 # 70
+print_reg_plain c0 # 71
+print_char 10 # 72
+subs s24, s16, s22 # 73
+print_char4 1701869669 # 74
+print_char4 1684370531 # 75
+print_char 32 # 76
+print_char 49 # 77
+print_char4 1869029420 # 78
+print_char 116 # 79
+print_char 32 # 80
+subs s25, s22, s16 # 81
+subs s0, s16, s22 # 82
+subs s1, s22, s16 # 83
+subs s18, s16, s22 # 84
+subs s33, s16, s22 # 85
+vconcats 2, 5, s42, 1, s18, 1, s33 # 86
+ldint ci0, 0 # 87
+call_tape 12, 3, ci0, 1, 4, 2, *40, *0, 0, 4, 2, *0, *42 # 88
+picks s39, s40, 0, 1 # 89
+picks s33, s40, 1, 1 # 90
+movs s18, s39 # 91
+movs s39, s33 # 92
+subsfi s33, s39, 1 # 93
+asm_open 5, 1, c1, s18, c0, s33 # 94
+subs s33, s16, s22 # 95
+vconcats 5, 11, s39, 1, s24, 1, s25, 1, s0, 1, s1, 1, s33 # 96
+ldint ci0, 0 # 97
+call_tape 12, 4, ci0, 1, 4, 5, *34, *0, 0, 4, 5, *10, *39 # 98
+picks s0, s34, 0, 1 # 99
+picks s18, s34, 1, 1 # 100
+picks s33, s34, 2, 1 # 101
+picks s25, s34, 3, 1 # 102
+picks s24, s34, 4, 1 # 103
+subsfi s1, s18, 1 # 104
+subsfi s18, s33, 1 # 105
+asm_open 9, 1, c5, s0, c4, s1, c3, s18, c2, s25 # 106
+print_reg_plain c5 # 107
+print_char 10 # 108
+print_char4 1701869669 # 109
+print_char4 1684370531 # 110
+print_char 32 # 111
+print_char 49 # 112
+print_char4 1869029420 # 113
+print_char 116 # 114
+print_char 32 # 115
+print_reg_plain c4 # 116
+print_char 10 # 117
+print_char4 1701869669 # 118
+print_char4 1684370531 # 119
+print_char 32 # 120
+print_char 48 # 121
+print_char4 1869029420 # 122
+print_char 116 # 123
+print_char 32 # 124
+print_reg_plain c3 # 125
+print_char 10 # 126
+print_char4 1701869669 # 127
+print_char4 1684370531 # 128
+print_char 32 # 129
+print_char 48 # 130
+print_char4 1869029420 # 131
+print_char 116 # 132
+print_char 32 # 133
+print_reg_plain c2 # 134
+print_char 10 # 135
+print_char4 1701869669 # 136
+print_char4 1684370531 # 137
+print_char 32 # 138
+print_char 48 # 139
+print_char4 1869029420 # 140
+print_char 116 # 141
+print_char 32 # 142
+print_reg_plain c1 # 143
+print_char 10 # 144
+print_char4 1701869669 # 145
+print_char4 1684370531 # 146
+print_char 32 # 147
+print_char 49 # 148
+print_char4 1869029420 # 149
+print_char 116 # 150
+print_char 32 # 151
+print_reg_plain c0 # 152
+print_char 10 # 153
+subs s25, s22, s16 # 154
+muls 4, 1, s18, s24, s25 # 155
+adds s1, s18, s16 # 156
+asm_open 3, 1, c0, s1 # 157
+print_char4 1701869669 # 158
+print_char4 1684370531 # 159
+print_char 32 # 160
+print_char 50 # 161
+print_char4 1869029420 # 162
+print_char 116 # 163
+print_char 32 # 164
+print_reg_plain c0 # 165
+print_char 10 # 166
+ldint ci0, 0 # 167
+convint c0, ci0 # 168
+ldsi s0, 0 # 169
+addm s24, s0, c0 # 170
+ldint ci2, 1 # 171
+subint ci4, ci0, ci2 # 172
+convint c1, ci4 # 173
+ldsi s22, 0 # 174
+addm s25, s22, c1 # 175
+muls 4, 1, s16, s24, s25 # 176
+ldint ci4, 100 # 177
+ltc ci3, ci0, ci4 # 178
+ldint ci1, 1 # 179
+subint ci2, ci1, ci3 # 180
+ldint ci3, 0 # 181
+ltc ci4, ci0, ci3 # 182
+addint ci3, ci2, ci4 # 183
+mulint ci1, ci2, ci4 # 184
+subint ci2, ci3, ci1 # 185
+convint c2, ci2 # 186
+cond_print_str c2, 1919252079 # 187
+convint c0, ci2 # 188
+cond_print_str c0, 2003790950 # 189
+convint c1, ci2 # 190
+cond_print_str c1, 8250 # 191
+convint c1, ci0 # 192
+convint c0, ci2 # 193
+ldi c2, 0 # 194
+cond_print_plain c0, c1, c2 # 195
+convint c0, ci2 # 196
+cond_print_str c0, 47 # 197
+convint c0, ci2 # 198
+cond_print_str c0, 3158065 # 199
+convint c0, ci2 # 200
+cond_print_str c0, 10 # 201
+crash ci2 # 202
+ldint ci2, 8192 # 203
+addint ci1, ci0, ci2 # 204
+stmsi s16, ci1 # 205
+ldint ci3, 1 # 206
+addint ci2, ci0, ci3 # 207
+ldint ci3, 0 # 208
+addint ci0, ci2, ci3 # 209
+ldint ci3, 100 # 210
+ltc ci1, ci2, ci3 # 211
+jmpnz ci1, -45 # 212
+ldms s24, 8291 # 213
+print_char4 1701869669 # 214
+print_char4 1684370531 # 215
+print_char 32 # 216
+print_char4 842020665 # 217
+print_char4 1869029420 # 218
+print_char 116 # 219
+print_char 32 # 220
+ldsi s25, 131072 # 221
+ldsi s22, -6554 # 222
+adds s0, s25, s22 # 223
+ldi c2, 0 # 224
+ldi c2, -16 # 225
+ldi c3, 0 # 226
+ldi c4, 0 # 227
+ldi c5, 0 # 228
+subsfi s18, s22, 0 # 229
+adds s1, s25, s18 # 230
+asm_open 7, 1, c6, s24, c1, s0, c0, s1 # 231
+print_reg_plain c6 # 232
+print_char 10 # 233
+print_float_prec 4 # 234
+print_char4 1701869669 # 235
+print_char4 1684370531 # 236
+print_char 32 # 237
+print_char 49 # 238
+print_char 46 # 239
+print_char 57 # 240
+print_char4 1869029420 # 241
+print_char 116 # 242
+print_char 32 # 243
+print_float_plain c1, c2, c3, c4, c5 # 244
+print_char 10 # 245
+ldi c4, 0 # 246
+print_char4 1701869669 # 247
+print_char4 1684370531 # 248
+print_char 32 # 249
+print_char 50 # 250
+print_char 46 # 251
+print_char 49 # 252
+print_char4 1869029420 # 253
+print_char 116 # 254
+print_char 32 # 255
+ldi c1, -16 # 256
+ldi c2, 0 # 257
+ldi c3, 0 # 258
+ldi c4, 0 # 259
+print_float_plain c0, c1, c2, c3, c4 # 260
+print_char 10 # 261
+muls 4, 1, s18, s25, s22 # 262
+concats 3, s16, 1, s18 # 263
+ldint ci0, 0 # 264
+call_tape 12, 5, ci0, 1, 4, 1, *17, *0, 0, 4, 1, *3, *16 # 265
+picks s1, s17, 0, 1 # 266
+asm_open 3, 1, c0, s1 # 267
+ldi c3, 0 # 268
+print_char4 1701869669 # 269
+print_char4 1684370531 # 270
+print_char 32 # 271
+print_char4 841887789 # 272
+print_char4 1869029420 # 273
+print_char 116 # 274
+print_char 32 # 275
+ldi c1, -16 # 276
+ldi c2, 0 # 277
+ldi c3, 0 # 278
+ldi c4, 0 # 279
+print_float_plain c0, c1, c2, c3, c4 # 280
+print_char 10 # 281
+concats 3, s24, 1, s25 # 282
+concats 3, s0, 1, s22 # 283
+ldint ci0, 0 # 284
+call_tape 17, 6, ci0, 1, 4, 1, *23, *0, 0, 4, 1, *103, *24, 0, 4, 1, *90, *0 # 285
+picks s18, s23, 0, 1 # 286
+asm_open 3, 1, c0, s18 # 287
+ldi c2, 0 # 288
+print_char4 1701869669 # 289
+print_char4 1684370531 # 290
+print_char 32 # 291
+print_char 45 # 292
+print_char 50 # 293
+print_char 48 # 294
+print_char4 1869029420 # 295
+print_char 116 # 296
+print_char 32 # 297
+ldi c1, -16 # 298
+ldi c2, 0 # 299
+ldi c3, 0 # 300
+ldi c4, 0 # 301
+print_float_plain c0, c1, c2, c3, c4 # 302
+print_char 10 # 303
+subs s24, s25, s22 # 304
+print_char4 1701869669 # 305
+print_char4 1684370531 # 306
+print_char 32 # 307
+print_char 48 # 308
+print_char4 1869029420 # 309
+print_char 116 # 310
+print_char 32 # 311
+subs s0, s22, s25 # 312
+subs s1, s25, s22 # 313
+subs s17, s22, s25 # 314
+subs s23, s25, s22 # 315
+subs s16, s25, s22 # 316
+vconcats 2, 5, s33, 1, s23, 1, s16 # 317
+ldint ci0, 0 # 318
+call_tape 12, 7, ci0, 1, 4, 2, *31, *0, 0, 4, 2, *0, *33 # 319
+picks s16, s31, 0, 1 # 320
+picks s23, s31, 1, 1 # 321
+movs s18, s16 # 322
+movs s16, s23 # 323
+subsfi s23, s16, 1 # 324
+asm_open 5, 1, c3, s18, c2, s23 # 325
+subs s16, s25, s22 # 326
+vconcats 5, 11, s31, 1, s24, 1, s0, 1, s1, 1, s17, 1, s16 # 327
+ldint ci0, 0 # 328
+call_tape 12, 8, ci0, 1, 4, 5, *26, *0, 0, 4, 5, *10, *31 # 329
+picks s0, s26, 0, 1 # 330
+picks s23, s26, 1, 1 # 331
+picks s18, s26, 2, 1 # 332
+picks s17, s26, 3, 1 # 333
+picks s24, s26, 4, 1 # 334
+subsfi s1, s23, 1 # 335
+subsfi s16, s18, 1 # 336
+asm_open 9, 1, c5, s0, c1, s1, c0, s16, c4, s17 # 337
+print_reg_plain c5 # 338
+print_char 10 # 339
+print_char4 1701869669 # 340
+print_char4 1684370531 # 341
+print_char 32 # 342
+print_char 48 # 343
+print_char4 1869029420 # 344
+print_char 116 # 345
+print_char 32 # 346
+print_reg_plain c1 # 347
+print_char 10 # 348
+print_char4 1701869669 # 349
+print_char4 1684370531 # 350
+print_char 32 # 351
+print_char 49 # 352
+print_char4 1869029420 # 353
+print_char 116 # 354
+print_char 32 # 355
+print_reg_plain c0 # 356
+print_char 10 # 357
+print_char4 1701869669 # 358
+print_char4 1684370531 # 359
+print_char 32 # 360
+print_char 49 # 361
+print_char4 1869029420 # 362
+print_char 116 # 363
+print_char 32 # 364
+print_reg_plain c4 # 365
+print_char 10 # 366
+print_char4 1701869669 # 367
+print_char4 1684370531 # 368
+print_char 32 # 369
+print_char 48 # 370
+print_char4 1869029420 # 371
+print_char 116 # 372
+print_char 32 # 373
+print_reg_plain c3 # 374
+print_char 10 # 375
+print_char4 1701869669 # 376
+print_char4 1684370531 # 377
+print_char 32 # 378
+print_char 49 # 379
+print_char4 1869029420 # 380
+print_char 116 # 381
+print_char 32 # 382
+print_reg_plain c2 # 383
+print_char 10 # 384
+subsfi s26, s22, 0 # 385
+adds s23, s25, s26 # 386
+muls 4, 1, s18, s23, s24 # 387
+adds s17, s18, s22 # 388
+asm_open 3, 1, c0, s17 # 389
+ldi c1, 0 # 390
+print_char4 1701869669 # 391
+print_char4 1684370531 # 392
+print_char 32 # 393
+print_char4 825110573 # 394
+print_char4 1869029420 # 395
+print_char 116 # 396
+print_char 32 # 397
+ldi c1, -16 # 398
+ldi c2, 0 # 399
+ldi c3, 0 # 400
+ldi c4, 0 # 401
+print_float_plain c0, c1, c2, c3, c4 # 402
+print_char 10 # 403
+print_char4 1953653072 # 404
+print_char4 976232569 # 405
+print_char4 1701605408 # 406
+print_char4 543519585 # 407
+print_char4 1970302569 # 408
+print_char4 1752440948 # 409
+print_char4 543516018 # 410
+print_char4 1651340654 # 411
+print_char4 544436837 # 412
+print_char4 544501614 # 413
+print_char4 1768186977 # 414
+print_char4 1965057902 # 415
+print_char4 1869881456 # 416
+print_char4 1919253024 # 417
+print_char 111 # 418
+print_char 10 # 419
+print_char4 1953653072 # 420
+print_char4 976298105 # 421
+print_char4 1701605408 # 422
+print_char4 543519585 # 423
+print_char4 1970302569 # 424
+print_char4 1851859060 # 425
+print_char4 1752440953 # 426
+print_char4 543516018 # 427
+print_char4 1651340654 # 428
+print_char4 175338085 # 429
+ldint ci1, 3 # 430
+ldint ci0, 0 # 431
+ldint ci1, 3 # 432
+ldint ci0, 3 # 433
+ldint ci1, 0 # 434
+ldint ci0, 1 # 435
+ldint ci1, 1 # 436
+ldint ci0, 0 # 437
+ldint ci0, 0 # 438
+inputmixed 24, 1, s16, 16, 0, 1, s1, 16, 1, 1, s0, 16, 0, 1, s26, 16, 1, 1, s25, 16, 0, 1, s24, 16, 1 # 439
+ldint ci1, 3 # 440
+ldint ci1, 1 # 441
+ldint ci1, 1 # 442
+ldint ci1, 0 # 443
+ldi c0, 0 # 444
+ldi c0, 0 # 445
+ldi c0, 0 # 446
+ldi c0, 0 # 447
+ldi c0, 0 # 448
+ldi c0, 0 # 449
+ldi c0, 0 # 450
+ldi c0, 0 # 451
+ldi c0, 0 # 452
+ldi c0, 0 # 453
+ldi c0, 0 # 454
+ldi c0, 0 # 455
+ldi c0, 0 # 456
+ldint ci1, 2 # 457
+ldint ci1, 0 # 458
+ldint ci1, 8292 # 459
+ldint ci1, 8292 # 460
+stms s16, 8292 # 461
+ldint ci1, 1 # 462
+ldint ci1, 8293 # 463
+stms s1, 8293 # 464
+ldint ci1, 1 # 465
+ldint ci1, 1 # 466
+ldint ci1, 3 # 467
+ldint ci1, 1 # 468
+ldint ci1, 1 # 469
+ldint ci1, 0 # 470
+ldi c0, 0 # 471
+ldi c0, 0 # 472
+ldi c0, 0 # 473
+ldi c0, 1 # 474
+ldi c0, 0 # 475
+ldi c0, 0 # 476
+ldi c0, 0 # 477
+ldi c0, 0 # 478
+ldi c0, 0 # 479
+ldi c0, 0 # 480
+ldi c0, 0 # 481
+ldi c0, 0 # 482
+ldi c0, 0 # 483
+ldint ci1, 2 # 484
+ldint ci1, 2 # 485
+ldint ci1, 8292 # 486
+ldint ci1, 8294 # 487
+stms s0, 8294 # 488
+ldint ci1, 1 # 489
+ldint ci1, 8295 # 490
+stms s26, 8295 # 491
+ldint ci1, 2 # 492
+ldint ci1, 2 # 493
+ldint ci1, 3 # 494
+ldint ci1, 1 # 495
+ldint ci1, 1 # 496
+ldint ci1, 0 # 497
+ldi c0, 0 # 498
+ldi c0, 0 # 499
+ldi c0, 0 # 500
+ldi c0, 2 # 501
+ldi c0, 0 # 502
+ldi c0, 0 # 503
+ldi c0, 0 # 504
+ldi c0, 0 # 505
+ldi c0, 0 # 506
+ldi c0, 0 # 507
+ldi c0, 0 # 508
+ldi c0, 0 # 509
+ldi c0, 0 # 510
+ldint ci1, 2 # 511
+ldint ci1, 4 # 512
+ldint ci1, 8292 # 513
+ldint ci1, 8296 # 514
+stms s25, 8296 # 515
+ldint ci1, 1 # 516
+ldint ci1, 8297 # 517
+stms s24, 8297 # 518
+ldint ci1, 3 # 519
+ldint ci1, 3 # 520
+ldint ci1, 0 # 521
+ldint ci0, 3 # 522
+ldint ci0, 6 # 523
+ldint ci0, 3 # 524
+ldint ci0, 1 # 525
+ldint ci0, 1 # 526
+ldint ci0, 0 # 527
+ldint ci0, 0 # 528
+crash ci0 # 529
+ldms s22, 8292 # 530
+ldint ci0, 0 # 531
+crash ci0 # 532
+ldms s23, 8294 # 533
+adds s17, s22, s23 # 534
+ldint ci0, 0 # 535
+crash ci0 # 536
+ldms s18, 8296 # 537
+adds s16, s17, s18 # 538
+ldms s0, 8292 # 539
+ldms s22, 8293 # 540
+ldms s23, 8294 # 541
+ldms s24, 8295 # 542
+ldms s25, 8296 # 543
+ldms s26, 8297 # 544
+muls 12, 1, s17, s0, s22, 1, s18, s23, s24, 1, s1, s25, s26 # 545
+vconcats 3, 7, s22, 1, s17, 1, s18, 1, s1 # 546
+ldint ci0, 0 # 547
+call_tape 12, 9, ci0, 1, 4, 3, *19, *0, 0, 4, 3, *9, *22 # 548
+picks s1, s19, 0, 1 # 549
+picks s18, s19, 1, 1 # 550
+picks s17, s19, 2, 1 # 551
+adds s0, s1, s18 # 552
+adds s1, s0, s17 # 553
+concats 3, s0, 1, s1 # 554
+concats 3, s1, 1, s16 # 555
+ldint ci0, 0 # 556
+call_tape 17, 6, ci0, 1, 4, 1, *3, *0, 0, 4, 1, *103, *0, 0, 4, 1, *90, *1 # 557
+picks s0, s3, 0, 1 # 558
+ldms s16, 8292 # 559
+ldms s1, 8294 # 560
+adds s3, s16, s1 # 561
+ldms s16, 8296 # 562
+adds s1, s3, s16 # 563
+ldi c0, 0 # 564
+subml s3, s1, c0 # 565
+concats 3, s1, 1, s3 # 566
+ldint ci0, 0 # 567
+call_tape 12, 10, ci0, 1, 4, 1, *2, *0, 0, 4, 1, *1, *1 # 568
+picks s3, s2, 0, 1 # 569
+movs s2, s3 # 570
+subsfi s1, s2, 1 # 571
+asm_open 3, 1, c0, s1 # 572
+convmodp ci0, c0, 64 # 573
+jmpeqz ci0, 15 # 574
+asm_open 3, 1, c0, s0 # 575
+ldi c1, 0 # 576
+print_char4 1734960503 # 577
+print_char4 1684370536 # 578
+print_char4 1702256928 # 579
+print_char4 1701273970 # 580
+print_char 58 # 581
+print_char 32 # 582
+ldi c1, -16 # 583
+ldi c2, 0 # 584
+ldi c3, 0 # 585
+ldi c4, 0 # 586
+print_float_plain c0, c1, c2, c3, c4 # 587
+print_char 10 # 588
+jmp 8 # 589
+print_char4 1920298873 # 590
+print_char4 1886284064 # 591
+print_char4 544437365 # 592
+print_char4 1701077357 # 593
+print_char4 544173600 # 594
+print_char4 1936614771 # 595
+print_char 101 # 596
+print_char 10 # 597
+ldint ci0, 0 # 598
+crash ci0 # 599
+ldsi s3, 0 # 600
+stms s3, 8298 # 601
+ldint ci0, 0 # 602
+crash ci0 # 603
+ldsi s2, 65536 # 604
+stms s2, 8300 # 605
+ldsi s1, 65536 # 606
+stms s1, 8299 # 607
+ldsi s0, 0 # 608
+stms s0, 8301 # 609
+vldms 6, s4, 8292 # 610
+vldms 4, s22, 8298 # 611
+matmuls 6, s16, s4, s22, 3, 2, 2 # 612
+vconcats 6, 3, s4, 6, s16 # 613
+ldint ci0, 0 # 614
+call_tape 12, 11, ci0, 1, 4, 6, *10, *0, 0, 4, 6, *48, *4 # 615
+vpicks 6, s4, s10, 0, 1 # 616
+vstms 6, s4, 8302 # 617
+ldint ci1, 0 # 618
+crash ci1 # 619
+ldms s1, 8302 # 620
+ldint ci0, 0 # 621
+crash ci0 # 622
+ldms s0, 8293 # 623
+ldi c4, 0 # 624
+ldi c3, 0 # 625
+print_char4 1701869669 # 626
+print_char4 1684370531 # 627
+print_char 32 # 628
+ldi c8, -16 # 629
+ldi c9, 0 # 630
+ldi c10, 0 # 631
+ldi c11, 0 # 632
+ldi c4, -16 # 633
+ldi c5, 0 # 634
+ldi c2, 0 # 635
+ldi c6, 0 # 636
+ldint ci1, 0 # 637
+ldms s3, 8305 # 638
+ldint ci0, 0 # 639
+ldms s2, 8294 # 640
+asm_open 9, 1, c7, s0, c3, s1, c1, s2, c0, s3 # 641
+print_float_plain c7, c8, c9, c10, c11 # 642
+print_char4 1869029420 # 643
+print_char 116 # 644
+print_char 32 # 645
+print_float_plain c3, c4, c5, c2, c6 # 646
+print_char 10 # 647
+crash ci1 # 648
+crash ci0 # 649
+ldi c2, 0 # 650
+ldi c5, 0 # 651
+print_char4 1701869669 # 652
+print_char4 1684370531 # 653
+print_char 32 # 654
+ldi c2, -16 # 655
+ldi c3, 0 # 656
+ldi c4, 0 # 657
+ldi c5, 0 # 658
+print_float_plain c1, c2, c3, c4, c5 # 659
+print_char4 1869029420 # 660
+print_char 116 # 661
+print_char 32 # 662
+ldi c1, -16 # 663
+ldi c2, 0 # 664
+ldi c3, 0 # 665
+ldi c4, 0 # 666
+print_float_plain c0, c1, c2, c3, c4 # 667
+print_char 10 # 668
+use 2, 0, 14004 # 669
+use 0, 2, 28 # 670
+use 0, 4, 194 # 671
+use_inp 0, 0, 4 # 672
+use_inp 0, 1, 4 # 673
+use 0, 7, 59 # 674
+use 0, 0, 158 # 675
+ldmc c0, 8191 # 676
+gldmc cg0, 8191 # 677
+ldmint ci0, 8191 # 678
+ldms s0, 8307 # 679
+gldms sg0, 8191 # 680
+active 1 # 681
@@ -0,0 +1,455 @@
+call_arg *1, 4 # 0
+split 95, 3, s1, sb89, sb91, sb20, sb85, sb87, sb10, sb77, sb83, sb0, sb72, sb75, sb103, sb70, sb71, sb100, sb66, sb67, sb90, sb63, sb64, sb86, sb59, sb61, sb82, sb53, sb56, sb79, sb48, sb51, sb76, sb43, sb46, sb74, sb39, sb40, sb68, sb34, sb37, sb65, sb32, sb33, sb62, sb27, sb29, sb60, sb24, sb25, sb58, sb22, sb23, sb54, sb18, sb21, sb52, sb15, sb17, sb49, sb11, sb13, sb44, sb8, sb9, sb42, sb3, sb6, sb38, sb152, sb153, sb30, sb150, sb151, sb26, sb148, sb149, sb19, sb146, sb147, sb16, sb105, sb106, sb14, sb92, sb102, sb12, sb84, sb88, sb7, sb78, sb81, sb5, sb1, sb4, sb2 # 1
+xors 4, 1, sb28, sb20, sb91 # 2
+xors 4, 1, sb101, sb28, sb89 # 3
+xors 4, 1, sb31, sb89, sb20 # 4
+xors 4, 1, sb35, sb10, sb87 # 5
+xors 4, 1, sb104, sb35, sb85 # 6
+xors 4, 1, sb36, sb85, sb10 # 7
+xors 4, 1, sb41, sb0, sb83 # 8
+xors 4, 1, sb99, sb41, sb77 # 9
+xors 4, 1, sb45, sb77, sb0 # 10
+xors 4, 1, sb47, sb103, sb75 # 11
+xors 4, 1, sb98, sb47, sb72 # 12
+xors 4, 1, sb50, sb72, sb103 # 13
+xors 4, 1, sb55, sb100, sb71 # 14
+xors 4, 1, sb97, sb55, sb70 # 15
+xors 4, 1, sb57, sb70, sb100 # 16
+xors 4, 1, sb69, sb90, sb67 # 17
+xors 4, 1, sb96, sb69, sb66 # 18
+xors 4, 1, sb73, sb66, sb90 # 19
+xors 4, 1, sb80, sb86, sb64 # 20
+xors 4, 1, sb95, sb80, sb63 # 21
+xors 4, 1, sb107, sb63, sb86 # 22
+xors 4, 1, sb108, sb82, sb61 # 23
+xors 4, 1, sb94, sb108, sb59 # 24
+xors 4, 1, sb109, sb59, sb82 # 25
+xors 4, 1, sb110, sb79, sb56 # 26
+xors 4, 1, sb93, sb110, sb53 # 27
+xors 4, 1, sb111, sb53, sb79 # 28
+xors 4, 1, sb112, sb76, sb51 # 29
+xors 4, 1, sb91, sb112, sb48 # 30
+xors 4, 1, sb113, sb48, sb76 # 31
+xors 4, 1, sb114, sb74, sb46 # 32
+xors 4, 1, sb89, sb114, sb43 # 33
+xors 4, 1, sb115, sb43, sb74 # 34
+xors 4, 1, sb116, sb68, sb40 # 35
+xors 4, 1, sb87, sb116, sb39 # 36
+xors 4, 1, sb117, sb39, sb68 # 37
+xors 4, 1, sb118, sb65, sb37 # 38
+xors 4, 1, sb85, sb118, sb34 # 39
+xors 4, 1, sb119, sb34, sb65 # 40
+xors 4, 1, sb120, sb62, sb33 # 41
+xors 4, 1, sb83, sb120, sb32 # 42
+xors 4, 1, sb121, sb32, sb62 # 43
+xors 4, 1, sb122, sb60, sb29 # 44
+xors 4, 1, sb77, sb122, sb27 # 45
+xors 4, 1, sb123, sb27, sb60 # 46
+xors 4, 1, sb124, sb58, sb25 # 47
+xors 4, 1, sb70, sb124, sb24 # 48
+xors 4, 1, sb125, sb24, sb58 # 49
+xors 4, 1, sb126, sb54, sb23 # 50
+xors 4, 1, sb63, sb126, sb22 # 51
+xors 4, 1, sb127, sb22, sb54 # 52
+xors 4, 1, sb128, sb52, sb21 # 53
+xors 4, 1, sb46, sb128, sb18 # 54
+xors 4, 1, sb129, sb18, sb52 # 55
+xors 4, 1, sb130, sb49, sb17 # 56
+xors 4, 1, sb39, sb130, sb15 # 57
+xors 4, 1, sb131, sb15, sb49 # 58
+xors 4, 1, sb132, sb44, sb13 # 59
+xors 4, 1, sb37, sb132, sb11 # 60
+xors 4, 1, sb133, sb11, sb44 # 61
+xors 4, 1, sb134, sb42, sb9 # 62
+xors 4, 1, sb33, sb134, sb8 # 63
+xors 4, 1, sb135, sb8, sb42 # 64
+xors 4, 1, sb136, sb38, sb6 # 65
+xors 4, 1, sb32, sb136, sb3 # 66
+xors 4, 1, sb137, sb3, sb38 # 67
+xors 4, 1, sb138, sb30, sb153 # 68
+xors 4, 1, sb27, sb138, sb152 # 69
+xors 4, 1, sb139, sb152, sb30 # 70
+xors 4, 1, sb140, sb26, sb151 # 71
+xors 4, 1, sb25, sb140, sb150 # 72
+xors 4, 1, sb141, sb150, sb26 # 73
+xors 4, 1, sb142, sb19, sb149 # 74
+xors 4, 1, sb24, sb142, sb148 # 75
+xors 4, 1, sb143, sb148, sb19 # 76
+xors 4, 1, sb144, sb16, sb147 # 77
+xors 4, 1, sb22, sb144, sb146 # 78
+xors 4, 1, sb145, sb146, sb16 # 79
+xors 4, 1, sb146, sb14, sb106 # 80
+xors 4, 1, sb8, sb146, sb105 # 81
+xors 4, 1, sb147, sb105, sb14 # 82
+xors 4, 1, sb148, sb12, sb102 # 83
+xors 4, 1, sb71, sb148, sb92 # 84
+xors 4, 1, sb149, sb92, sb12 # 85
+xors 4, 1, sb150, sb7, sb88 # 86
+xors 4, 1, sb67, sb150, sb84 # 87
+xors 4, 1, sb151, sb84, sb7 # 88
+xors 4, 1, sb152, sb5, sb81 # 89
+xors 4, 1, sb3, sb152, sb78 # 90
+xors 4, 1, sb153, sb78, sb5 # 91
+ands 124, 1, sb21, sb28, sb31, 1, sb17, sb35, sb36, 1, sb9, sb41, sb45, 1, sb106, sb47, sb50, 1, sb102, sb55, sb57, 1, sb92, sb69, sb73, 1, sb88, sb80, sb107, 1, sb84, sb108, sb109, 1, sb81, sb110, sb111, 1, sb78, sb112, sb113, 1, sb75, sb114, sb115, 1, sb72, sb116, sb117, 1, sb66, sb118, sb119, 1, sb64, sb120, sb121, 1, sb61, sb122, sb123, 1, sb59, sb124, sb125, 1, sb56, sb126, sb127, 1, sb53, sb128, sb129, 1, sb51, sb130, sb131, 1, sb48, sb132, sb133, 1, sb43, sb134, sb135, 1, sb40, sb136, sb137, 1, sb34, sb138, sb139, 1, sb29, sb140, sb141, 1, sb23, sb142, sb143, 1, sb18, sb144, sb145, 1, sb15, sb146, sb147, 1, sb13, sb148, sb149, 1, sb11, sb150, sb151, 1, sb6, sb152, sb153, 1, sb105, sb101, sb101 # 92
+xors 4, 1, sb41, sb20, sb21 # 93
+xors 4, 1, sb45, sb10, sb17 # 94
+xors 4, 1, sb73, sb0, sb9 # 95
+xors 4, 1, sb80, sb103, sb106 # 96
+xors 4, 1, sb31, sb100, sb102 # 97
+xors 4, 1, sb35, sb90, sb92 # 98
+xors 4, 1, sb57, sb86, sb88 # 99
+xors 4, 1, sb9, sb82, sb84 # 100
+xors 4, 1, sb69, sb79, sb81 # 101
+xors 4, 1, sb55, sb76, sb78 # 102
+xors 4, 1, sb21, sb74, sb75 # 103
+xors 4, 1, sb82, sb68, sb72 # 104
+xors 4, 1, sb50, sb65, sb66 # 105
+xors 4, 1, sb75, sb62, sb64 # 106
+xors 4, 1, sb47, sb60, sb61 # 107
+xors 4, 1, sb102, sb58, sb59 # 108
+xors 4, 1, sb60, sb54, sb56 # 109
+xors 4, 1, sb58, sb52, sb53 # 110
+xors 4, 1, sb28, sb49, sb51 # 111
+xors 4, 1, sb51, sb44, sb48 # 112
+xors 4, 1, sb36, sb42, sb43 # 113
+xors 4, 1, sb17, sb38, sb40 # 114
+xors 4, 1, sb72, sb30, sb34 # 115
+xors 4, 1, sb100, sb26, sb29 # 116
+xors 4, 1, sb20, sb19, sb23 # 117
+xors 4, 1, sb74, sb16, sb18 # 118
+xors 4, 1, sb29, sb14, sb15 # 119
+xors 4, 1, sb68, sb12, sb13 # 120
+xors 4, 1, sb10, sb7, sb11 # 121
+xors 4, 1, sb106, sb5, sb6 # 122
+xors 4, 1, sb0, sb2, sb4 # 123
+xors 4, 1, sb43, sb0, sb1 # 124
+xors 4, 1, sb103, sb101, sb105 # 125
+xors 4, 1, sb42, sb41, sb104 # 126
+xors 4, 1, sb104, sb42, sb103 # 127
+xors 4, 1, sb52, sb103, sb41 # 128
+xors 4, 1, sb56, sb45, sb99 # 129
+xors 4, 1, sb12, sb73, sb98 # 130
+xors 4, 1, sb84, sb80, sb97 # 131
+xors 4, 1, sb64, sb31, sb96 # 132
+xors 4, 1, sb5, sb35, sb95 # 133
+xors 4, 1, sb15, sb57, sb94 # 134
+xors 4, 1, sb88, sb9, sb93 # 135
+xors 4, 1, sb11, sb69, sb91 # 136
+xors 4, 1, sb53, sb31, sb96 # 137
+nots 1, sb90, sb53 # 138
+nots 1, sb59, sb31 # 139
+xors 4, 1, sb76, sb35, sb95 # 140
+xors 4, 1, sb79, sb57, sb94 # 141
+xors 4, 1, sb92, sb9, sb93 # 142
+xors 4, 1, sb78, sb69, sb91 # 143
+xors 4, 1, sb1, sb90, sb64 # 144
+xors 4, 1, sb49, sb55, sb89 # 145
+xors 4, 1, sb16, sb21, sb87 # 146
+xors 4, 1, sb90, sb82, sb85 # 147
+xors 4, 1, sb38, sb50, sb83 # 148
+xors 4, 1, sb81, sb75, sb77 # 149
+xors 4, 1, sb66, sb47, sb70 # 150
+xors 4, 1, sb4, sb55, sb89 # 151
+nots 1, sb65, sb4 # 152
+nots 1, sb7, sb55 # 153
+xors 4, 1, sb86, sb21, sb87 # 154
+xors 4, 1, sb34, sb82, sb85 # 155
+xors 4, 1, sb48, sb50, sb83 # 156
+xors 4, 1, sb83, sb75, sb77 # 157
+xors 4, 1, sb2, sb47, sb70 # 158
+xors 4, 1, sb54, sb65, sb49 # 159
+xors 4, 1, sb19, sb102, sb63 # 160
+xors 4, 1, sb94, sb60, sb46 # 161
+xors 4, 1, sb44, sb58, sb39 # 162
+xors 4, 1, sb62, sb28, sb37 # 163
+xors 4, 1, sb85, sb51, sb33 # 164
+xors 4, 1, sb30, sb36, sb32 # 165
+xors 4, 1, sb61, sb17, sb27 # 166
+xors 4, 1, sb77, sb102, sb63 # 167
+nots 1, sb26, sb77 # 168
+nots 1, sb14, sb102 # 169
+xors 4, 1, sb40, sb60, sb46 # 170
+xors 4, 1, sb0, sb58, sb39 # 171
+xors 4, 1, sb6, sb28, sb37 # 172
+xors 4, 1, sb87, sb51, sb33 # 173
+xors 4, 1, sb39, sb36, sb32 # 174
+xors 4, 1, sb63, sb17, sb27 # 175
+xors 4, 1, sb32, sb26, sb19 # 176
+xors 4, 1, sb23, sb72, sb25 # 177
+xors 4, 1, sb103, sb100, sb24 # 178
+xors 4, 1, sb97, sb20, sb22 # 179
+xors 4, 1, sb70, sb74, sb8 # 180
+xors 4, 1, sb89, sb29, sb71 # 181
+xors 4, 1, sb46, sb68, sb67 # 182
+xors 4, 1, sb65, sb10, sb3 # 183
+xors 4, 1, sb13, sb106, sb43 # 184
+xors 4, 1, sb18, sb72, sb25 # 185
+nots 1, sb37, sb18 # 186
+nots 1, sb26, sb72 # 187
+xors 4, 1, sb105, sb100, sb24 # 188
+xors 4, 1, sb99, sb20, sb22 # 189
+xors 4, 1, sb93, sb74, sb8 # 190
+xors 4, 1, sb91, sb29, sb71 # 191
+xors 4, 1, sb71, sb68, sb67 # 192
+xors 4, 1, sb67, sb10, sb3 # 193
+xors 4, 1, sb3, sb106, sb43 # 194
+xors 4, 1, sb24, sb37, sb23 # 195
+nots 1, sb27, sb101 # 196
+nots 1, sb98, sb104 # 197
+ands 40, 1, sb106, sb42, sb52, 1, sb101, sb64, sb31, 1, sb33, sb53, sb59, 1, sb22, sb49, sb55, 1, sb8, sb4, sb7, 1, sb43, sb19, sb102, 1, sb104, sb77, sb14, 1, sb96, sb23, sb72, 1, sb25, sb18, sb26, 1, sb95, sb27, sb98 # 198
+xors 4, 1, sb37, sb41, sb106 # 199
+xors 4, 1, sb27, sb56, sb37 # 200
+xors 4, 1, sb59, sb37, sb45 # 201
+xors 4, 1, sb98, sb31, sb101 # 202
+xors 4, 1, sb53, sb5, sb98 # 203
+xors 4, 1, sb7, sb98, sb35 # 204
+xors 4, 1, sb26, sb31, sb33 # 205
+xors 4, 1, sb31, sb76, sb26 # 206
+xors 4, 1, sb4, sb31, sb53 # 207
+xors 4, 1, sb77, sb26, sb35 # 208
+xors 4, 1, sb18, sb55, sb22 # 209
+xors 4, 1, sb41, sb16, sb18 # 210
+xors 4, 1, sb14, sb18, sb21 # 211
+xors 4, 1, sb42, sb55, sb8 # 212
+xors 4, 1, sb52, sb86, sb42 # 213
+xors 4, 1, sb55, sb52, sb41 # 214
+xors 4, 1, sb31, sb42, sb21 # 215
+xors 4, 1, sb106, sb102, sb43 # 216
+xors 4, 1, sb18, sb94, sb106 # 217
+xors 4, 1, sb98, sb106, sb60 # 218
+xors 4, 1, sb37, sb102, sb104 # 219
+xors 4, 1, sb101, sb40, sb37 # 220
+xors 4, 1, sb33, sb101, sb18 # 221
+xors 4, 1, sb42, sb37, sb60 # 222
+xors 4, 1, sb26, sb72, sb96 # 223
+xors 4, 1, sb22, sb103, sb26 # 224
+xors 4, 1, sb104, sb26, sb100 # 225
+xors 4, 1, sb52, sb72, sb25 # 226
+xors 4, 1, sb8, sb105, sb52 # 227
+xors 4, 1, sb25, sb8, sb22 # 228
+xors 4, 1, sb106, sb52, sb100 # 229
+ands 36, 1, sb52, sb56, sb59, 1, sb43, sb5, sb7, 1, sb102, sb76, sb77, 1, sb96, sb16, sb14, 1, sb26, sb86, sb31, 1, sb72, sb94, sb98, 1, sb8, sb40, sb42, 1, sb101, sb103, sb104, 1, sb37, sb105, sb106 # 230
+xors 4, 1, sb42, sb45, sb52 # 231
+xors 4, 1, sb76, sb12, sb42 # 232
+xors 4, 1, sb77, sb42, sb73 # 233
+xors 4, 1, sb40, sb35, sb43 # 234
+xors 4, 1, sb45, sb15, sb40 # 235
+xors 4, 1, sb16, sb40, sb57 # 236
+xors 4, 1, sb98, sb35, sb102 # 237
+xors 4, 1, sb35, sb79, sb98 # 238
+xors 4, 1, sb5, sb35, sb45 # 239
+xors 4, 1, sb86, sb98, sb57 # 240
+xors 4, 1, sb94, sb21, sb96 # 241
+xors 4, 1, sb40, sb90, sb94 # 242
+xors 4, 1, sb31, sb94, sb82 # 243
+xors 4, 1, sb14, sb21, sb26 # 244
+xors 4, 1, sb21, sb34, sb14 # 245
+xors 4, 1, sb56, sb21, sb40 # 246
+xors 4, 1, sb43, sb14, sb82 # 247
+xors 4, 1, sb7, sb60, sb72 # 248
+xors 4, 1, sb14, sb44, sb7 # 249
+xors 4, 1, sb52, sb7, sb58 # 250
+xors 4, 1, sb42, sb60, sb8 # 251
+xors 4, 1, sb59, sb0, sb42 # 252
+xors 4, 1, sb35, sb59, sb14 # 253
+xors 4, 1, sb8, sb42, sb58 # 254
+xors 4, 1, sb102, sb100, sb101 # 255
+xors 4, 1, sb21, sb97, sb102 # 256
+xors 4, 1, sb98, sb102, sb20 # 257
+xors 4, 1, sb94, sb100, sb37 # 258
+xors 4, 1, sb96, sb99, sb94 # 259
+xors 4, 1, sb26, sb96, sb21 # 260
+xors 4, 1, sb100, sb94, sb20 # 261
+nots 1, sb101, sb27 # 262
+nots 1, sb102, sb76 # 263
+ands 40, 1, sb72, sb12, sb77, 1, sb7, sb15, sb16, 1, sb59, sb79, sb86, 1, sb42, sb90, sb31, 1, sb94, sb34, sb43, 1, sb76, sb44, sb52, 1, sb60, sb0, sb8, 1, sb37, sb97, sb98, 1, sb27, sb99, sb100, 1, sb96, sb101, sb102 # 264
+xors 4, 1, sb8, sb73, sb72 # 265
+xors 4, 1, sb77, sb84, sb8 # 266
+xors 4, 1, sb86, sb8, sb80 # 267
+xors 4, 1, sb0, sb57, sb7 # 268
+xors 4, 1, sb43, sb88, sb0 # 269
+xors 4, 1, sb90, sb0, sb9 # 270
+xors 4, 1, sb44, sb57, sb59 # 271
+xors 4, 1, sb52, sb92, sb44 # 272
+xors 4, 1, sb79, sb52, sb43 # 273
+xors 4, 1, sb31, sb44, sb9 # 274
+xors 4, 1, sb34, sb82, sb42 # 275
+xors 4, 1, sb15, sb38, sb34 # 276
+xors 4, 1, sb44, sb34, sb50 # 277
+xors 4, 1, sb12, sb82, sb94 # 278
+xors 4, 1, sb16, sb48, sb12 # 279
+xors 4, 1, sb57, sb16, sb15 # 280
+xors 4, 1, sb59, sb12, sb50 # 281
+xors 4, 1, sb72, sb58, sb76 # 282
+xors 4, 1, sb12, sb62, sb72 # 283
+xors 4, 1, sb0, sb72, sb28 # 284
+xors 4, 1, sb42, sb58, sb60 # 285
+xors 4, 1, sb52, sb6, sb42 # 286
+xors 4, 1, sb34, sb52, sb12 # 287
+xors 4, 1, sb72, sb42, sb28 # 288
+xors 4, 1, sb94, sb20, sb37 # 289
+xors 4, 1, sb8, sb70, sb94 # 290
+xors 4, 1, sb76, sb94, sb74 # 291
+xors 4, 1, sb16, sb20, sb27 # 292
+xors 4, 1, sb82, sb93, sb16 # 293
+xors 4, 1, sb27, sb82, sb8 # 294
+xors 4, 1, sb94, sb16, sb74 # 295
+ands 40, 1, sb82, sb84, sb86, 1, sb16, sb88, sb90, 1, sb7, sb92, sb31, 1, sb60, sb38, sb44, 1, sb58, sb48, sb59, 1, sb42, sb62, sb0, 1, sb37, sb6, sb72, 1, sb20, sb70, sb76, 1, sb73, sb93, sb94, 1, sb52, sb95, sb96 # 296
+xors 4, 1, sb0, sb80, sb82 # 297
+xors 4, 1, sb72, sb9, sb16 # 298
+xors 4, 1, sb31, sb11, sb72 # 299
+xors 4, 1, sb76, sb72, sb69 # 300
+xors 4, 1, sb70, sb9, sb7 # 301
+xors 4, 1, sb6, sb78, sb70 # 302
+xors 4, 1, sb80, sb6, sb31 # 303
+xors 4, 1, sb62, sb70, sb69 # 304
+xors 4, 1, sb59, sb50, sb60 # 305
+xors 4, 1, sb6, sb81, sb59 # 306
+xors 4, 1, sb82, sb59, sb75 # 307
+xors 4, 1, sb44, sb50, sb58 # 308
+xors 4, 1, sb48, sb83, sb44 # 309
+xors 4, 1, sb58, sb48, sb6 # 310
+xors 4, 1, sb84, sb44, sb75 # 311
+xors 4, 1, sb38, sb28, sb42 # 312
+xors 4, 1, sb9, sb85, sb38 # 313
+xors 4, 1, sb86, sb38, sb51 # 314
+xors 4, 1, sb90, sb28, sb37 # 315
+xors 4, 1, sb92, sb87, sb90 # 316
+xors 4, 1, sb42, sb92, sb9 # 317
+xors 4, 1, sb88, sb90, sb51 # 318
+xors 4, 1, sb16, sb74, sb20 # 319
+xors 4, 1, sb7, sb89, sb16 # 320
+xors 4, 1, sb90, sb16, sb29 # 321
+xors 4, 1, sb72, sb74, sb73 # 322
+xors 4, 1, sb73, sb91, sb72 # 323
+xors 4, 1, sb28, sb73, sb7 # 324
+xors 4, 1, sb92, sb72, sb29 # 325
+ands 52, 1, sb73, sb11, sb76, 1, sb70, sb78, sb62, 1, sb59, sb0, sb1, 1, sb48, sb0, sb4, 1, sb60, sb0, sb5, 1, sb38, sb0, sb79, 1, sb20, sb0, sb80, 1, sb16, sb81, sb82, 1, sb74, sb83, sb84, 1, sb72, sb85, sb86, 1, sb50, sb87, sb88, 1, sb44, sb89, sb90, 1, sb37, sb91, sb92 # 326
+xors 4, 1, sb62, sb69, sb73 # 327
+xors 4, 1, sb5, sb69, sb70 # 328
+xors 4, 1, sb1, sb5, sb62 # 329
+xors 4, 1, sb76, sb59, sb64 # 330
+xors 4, 1, sb11, sb48, sb53 # 331
+xors 4, 1, sb70, sb60, sb45 # 332
+xors 4, 1, sb69, sb38, sb43 # 333
+xors 4, 1, sb53, sb20, sb31 # 334
+xors 4, 1, sb78, sb75, sb16 # 335
+xors 4, 1, sb48, sb66, sb78 # 336
+xors 4, 1, sb64, sb78, sb47 # 337
+xors 4, 1, sb73, sb75, sb74 # 338
+xors 4, 1, sb74, sb2, sb73 # 339
+xors 4, 1, sb59, sb74, sb48 # 340
+xors 4, 1, sb16, sb73, sb47 # 341
+xors 4, 1, sb5, sb51, sb72 # 342
+xors 4, 1, sb4, sb30, sb5 # 343
+xors 4, 1, sb31, sb5, sb36 # 344
+xors 4, 1, sb60, sb51, sb50 # 345
+xors 4, 1, sb50, sb39, sb60 # 346
+xors 4, 1, sb43, sb50, sb4 # 347
+xors 4, 1, sb45, sb60, sb36 # 348
+xors 4, 1, sb38, sb29, sb44 # 349
+xors 4, 1, sb5, sb46, sb38 # 350
+xors 4, 1, sb51, sb38, sb68 # 351
+xors 4, 1, sb78, sb29, sb37 # 352
+xors 4, 1, sb20, sb71, sb78 # 353
+xors 4, 1, sb29, sb20, sb5 # 354
+xors 4, 1, sb72, sb78, sb68 # 355
+nots 1, sb73, sb77 # 356
+nots 1, sb74, sb76 # 357
+nots 1, sb75, sb11 # 358
+nots 1, sb76, sb70 # 359
+nots 1, sb77, sb69 # 360
+nots 1, sb78, sb53 # 361
+ands 40, 1, sb60, sb0, sb1, 1, sb53, sb66, sb64, 1, sb50, sb2, sb16, 1, sb44, sb30, sb31, 1, sb37, sb39, sb45, 1, sb20, sb46, sb51, 1, sb11, sb71, sb72, 1, sb69, sb73, sb74, 1, sb70, sb75, sb76, 1, sb38, sb77, sb78 # 362
+xors 4, 1, sb51, sb60, sb62 # 363
+xors 4, 1, sb46, sb47, sb53 # 364
+xors 4, 1, sb45, sb47, sb50 # 365
+xors 4, 1, sb60, sb45, sb46 # 366
+xors 4, 1, sb39, sb36, sb44 # 367
+xors 4, 1, sb2, sb61, sb39 # 368
+xors 4, 1, sb62, sb39, sb17 # 369
+xors 4, 1, sb30, sb36, sb37 # 370
+xors 4, 1, sb31, sb63, sb30 # 371
+xors 4, 1, sb44, sb31, sb2 # 372
+xors 4, 1, sb64, sb30, sb17 # 373
+xors 4, 1, sb16, sb68, sb20 # 374
+xors 4, 1, sb1, sb65, sb16 # 375
+xors 4, 1, sb66, sb16, sb10 # 376
+xors 4, 1, sb53, sb68, sb11 # 377
+xors 4, 1, sb0, sb67, sb53 # 378
+xors 4, 1, sb30, sb0, sb1 # 379
+xors 4, 1, sb68, sb53, sb10 # 380
+ands 48, 1, sb50, sb51, sb54, 1, sb39, sb51, sb55, 1, sb37, sb51, sb56, 1, sb20, sb51, sb57, 1, sb0, sb51, sb58, 1, sb47, sb51, sb59, 1, sb45, sb51, sb60, 1, sb36, sb61, sb62, 1, sb31, sb63, sb64, 1, sb16, sb65, sb66, 1, sb11, sb67, sb68, 1, sb53, sb69, sb70 # 381
+xors 4, 1, sb51, sb50, sb49 # 382
+xors 4, 1, sb50, sb39, sb41 # 383
+xors 4, 1, sb49, sb37, sb40 # 384
+xors 4, 1, sb41, sb20, sb15 # 385
+xors 4, 1, sb40, sb0, sb6 # 386
+xors 4, 1, sb39, sb47, sb48 # 387
+xors 4, 1, sb20, sb45, sb46 # 388
+xors 4, 1, sb37, sb17, sb36 # 389
+xors 4, 1, sb15, sb17, sb31 # 390
+xors 4, 1, sb45, sb15, sb37 # 391
+xors 4, 1, sb15, sb10, sb16 # 392
+xors 4, 1, sb16, sb13, sb15 # 393
+xors 4, 1, sb6, sb10, sb11 # 394
+xors 4, 1, sb0, sb3, sb6 # 395
+xors 4, 1, sb31, sb0, sb16 # 396
+nots 1, sb46, sb51 # 397
+nots 1, sb47, sb50 # 398
+nots 1, sb48, sb49 # 399
+nots 1, sb49, sb41 # 400
+nots 1, sb50, sb40 # 401
+nots 1, sb51, sb39 # 402
+ands 48, 1, sb17, sb20, sb32, 1, sb15, sb20, sb33, 1, sb13, sb20, sb35, 1, sb10, sb20, sb34, 1, sb6, sb20, sb42, 1, sb3, sb20, sb43, 1, sb0, sb20, sb44, 1, sb36, sb20, sb45, 1, sb39, sb46, sb47, 1, sb40, sb48, sb49, 1, sb41, sb50, sb51, 1, sb11, sb52, sb53 # 403
+xors 4, 1, sb35, sb17, sb19 # 404
+xors 4, 1, sb34, sb15, sb18 # 405
+xors 4, 1, sb20, sb13, sb14 # 406
+xors 4, 1, sb19, sb10, sb12 # 407
+xors 4, 1, sb18, sb6, sb9 # 408
+xors 4, 1, sb17, sb3, sb4 # 409
+xors 4, 1, sb14, sb0, sb2 # 410
+xors 4, 1, sb13, sb36, sb37 # 411
+nots 1, sb32, sb35 # 412
+nots 1, sb33, sb34 # 413
+nots 1, sb34, sb20 # 414
+nots 1, sb35, sb19 # 415
+nots 1, sb36, sb18 # 416
+nots 1, sb37, sb17 # 417
+ands 52, 1, sb12, sb13, sb24, 1, sb10, sb13, sb25, 1, sb9, sb13, sb26, 1, sb3, sb13, sb27, 1, sb6, sb13, sb28, 1, sb4, sb13, sb29, 1, sb0, sb13, sb30, 1, sb15, sb13, sb31, 1, sb17, sb32, sb33, 1, sb18, sb34, sb35, 1, sb2, sb36, sb37, 1, sb19, sb38, sb39, 1, sb20, sb40, sb41 # 418
+xors 4, 1, sb13, sb12, sb23 # 419
+xors 4, 1, sb12, sb10, sb22 # 420
+xors 4, 1, sb10, sb9, sb21 # 421
+xors 4, 1, sb9, sb3, sb8 # 422
+xors 4, 1, sb8, sb6, sb7 # 423
+xors 4, 1, sb7, sb4, sb5 # 424
+xors 4, 1, sb3, sb0, sb1 # 425
+xors 4, 1, sb1, sb15, sb16 # 426
+nots 1, sb4, sb14 # 427
+nots 1, sb5, sb13 # 428
+nots 1, sb6, sb12 # 429
+nots 1, sb0, sb10 # 430
+nots 1, sb13, sb9 # 431
+nots 1, sb14, sb8 # 432
+nots 1, sb15, sb7 # 433
+nots 1, sb16, sb3 # 434
+nots 1, sb10, sb1 # 435
+ands 24, 1, sb3, sb4, sb5, 1, sb7, sb6, sb0, 1, sb8, sb13, sb14, 1, sb9, sb15, sb16, 1, sb1, sb17, sb18, 1, sb12, sb19, sb20 # 436
+ands 16, 1, sb4, sb2, sb3, 1, sb5, sb7, sb8, 1, sb6, sb9, sb10, 1, sb0, sb11, sb12 # 437
+ands 8, 1, sb2, sb1, sb4, 1, sb3, sb5, sb6 # 438
+ands 4, 1, sb1, sb2, sb3 # 439
+ands 4, 1, sb2, sb0, sb1 # 440
+dabit s2, sb1 # 441
+xors 4, 1, sb0, sb1, sb2 # 442
+reveal 3, 1, cb0, sb0 # 443
+convcbitvec 1, ci0, cb0 # 444
+convint c0, ci0 # 445
+addm s1, s2, c0 # 446
+mulsi s0, s2, 2 # 447
+convint c0, ci0 # 448
+mulm s2, s0, c0 # 449
+subs s0, s1, s2 # 450
+movs s1, s0 # 451
+movs s0, s1 # 452
+use 2, 0, 144 # 453
+use 0, 4, 1 # 454
@@ -0,0 +1,952 @@
+vcall_arg 2, *0, 4 # 0
+vsplit 2, 191, 3, s0, sb165, sb168, sb202, sb159, sb160, sb199, sb155, sb157, sb191, sb151, sb153, sb183, sb148, sb140, sb179, sb139, sb135, sb175, sb137, sb138, sb171, sb134, sb136, sb166, sb131, sb132, sb163, sb128, sb130, sb158, sb124, sb126, sb154, sb121, sb122, sb150, sb117, sb118, sb147, sb114, sb115, sb145, sb112, sb113, sb143, sb110, sb111, sb141, sb106, sb108, sb133, sb101, sb103, sb129, sb98, sb99, sb127, sb96, sb97, sb125, sb92, sb94, sb123, sb89, sb90, sb119, sb85, sb87, sb116, sb80, sb83, sb109, sb77, sb79, sb107, sb73, sb74, sb105, sb70, sb71, sb102, sb63, sb68, sb100, sb60, sb61, sb95, sb53, sb58, sb91, sb49, sb51, sb88, sb43, sb46, sb86, sb38, sb41, sb84, sb34, sb35, sb82, sb32, sb33, sb78, sb28, sb29, sb76, sb24, sb26, sb72, sb16, sb22, sb69, sb11, sb13, sb67, sb3, sb6, sb62, sb312, sb313, sb59, sb310, sb311, sb57, sb308, sb309, sb52, sb306, sb307, sb50, sb304, sb305, sb47, sb302, sb303, sb44, sb300, sb301, sb42, sb298, sb299, sb40, sb296, sb297, sb36, sb294, sb295, sb31, sb292, sb293, sb25, sb221, sb223, sb23, sb216, sb219, sb20, sb203, sb207, sb14, sb197, sb201, sb12, sb181, sb185, sb9, sb173, sb177, sb5, sb164, sb167, sb224, sb161, sb162, sb222, sb152, sb156, sb220, sb146, sb149, sb217, sb142, sb144, sb215, sb210, sb214, sb211 # 1
+xors 4, 2, sb205, sb202, sb168 # 2
+xors 4, 2, sb18, sb205, sb165 # 3
+xors 4, 2, sb206, sb165, sb202 # 4
+xors 4, 2, sb208, sb199, sb160 # 5
+xors 4, 2, sb204, sb208, sb159 # 6
+xors 4, 2, sb209, sb159, sb199 # 7
+xors 4, 2, sb218, sb191, sb157 # 8
+xors 4, 2, sb196, sb218, sb155 # 9
+xors 4, 2, sb0, sb155, sb191 # 10
+xors 4, 2, sb1, sb183, sb153 # 11
+xors 4, 2, sb195, sb1, sb151 # 12
+xors 4, 2, sb2, sb151, sb183 # 13
+xors 4, 2, sb4, sb179, sb140 # 14
+xors 4, 2, sb194, sb4, sb148 # 15
+xors 4, 2, sb7, sb148, sb179 # 16
+xors 4, 2, sb8, sb175, sb135 # 17
+xors 4, 2, sb193, sb8, sb139 # 18
+xors 4, 2, sb10, sb139, sb175 # 19
+xors 4, 2, sb15, sb171, sb138 # 20
+xors 4, 2, sb192, sb15, sb137 # 21
+xors 4, 2, sb17, sb137, sb171 # 22
+xors 4, 2, sb19, sb166, sb136 # 23
+xors 4, 2, sb190, sb19, sb134 # 24
+xors 4, 2, sb21, sb134, sb166 # 25
+xors 4, 2, sb27, sb163, sb132 # 26
+xors 4, 2, sb189, sb27, sb131 # 27
+xors 4, 2, sb30, sb131, sb163 # 28
+xors 4, 2, sb37, sb158, sb130 # 29
+xors 4, 2, sb188, sb37, sb128 # 30
+xors 4, 2, sb39, sb128, sb158 # 31
+xors 4, 2, sb45, sb154, sb126 # 32
+xors 4, 2, sb184, sb45, sb124 # 33
+xors 4, 2, sb48, sb124, sb154 # 34
+xors 4, 2, sb54, sb150, sb122 # 35
+xors 4, 2, sb182, sb54, sb121 # 36
+xors 4, 2, sb55, sb121, sb150 # 37
+xors 4, 2, sb56, sb147, sb118 # 38
+xors 4, 2, sb180, sb56, sb117 # 39
+xors 4, 2, sb64, sb117, sb147 # 40
+xors 4, 2, sb65, sb145, sb115 # 41
+xors 4, 2, sb176, sb65, sb114 # 42
+xors 4, 2, sb66, sb114, sb145 # 43
+xors 4, 2, sb75, sb143, sb113 # 44
+xors 4, 2, sb174, sb75, sb112 # 45
+xors 4, 2, sb81, sb112, sb143 # 46
+xors 4, 2, sb93, sb141, sb111 # 47
+xors 4, 2, sb172, sb93, sb110 # 48
+xors 4, 2, sb104, sb110, sb141 # 49
+xors 4, 2, sb120, sb133, sb108 # 50
+xors 4, 2, sb170, sb120, sb106 # 51
+xors 4, 2, sb135, sb106, sb133 # 52
+xors 4, 2, sb140, sb129, sb103 # 53
+xors 4, 2, sb168, sb140, sb101 # 54
+xors 4, 2, sb225, sb101, sb129 # 55
+xors 4, 2, sb226, sb127, sb99 # 56
+xors 4, 2, sb160, sb226, sb98 # 57
+xors 4, 2, sb227, sb98, sb127 # 58
+xors 4, 2, sb228, sb125, sb97 # 59
+xors 4, 2, sb159, sb228, sb96 # 60
+xors 4, 2, sb229, sb96, sb125 # 61
+xors 4, 2, sb230, sb123, sb94 # 62
+xors 4, 2, sb157, sb230, sb92 # 63
+xors 4, 2, sb231, sb92, sb123 # 64
+xors 4, 2, sb232, sb119, sb90 # 65
+xors 4, 2, sb155, sb232, sb89 # 66
+xors 4, 2, sb233, sb89, sb119 # 67
+xors 4, 2, sb234, sb116, sb87 # 68
+xors 4, 2, sb153, sb234, sb85 # 69
+xors 4, 2, sb235, sb85, sb116 # 70
+xors 4, 2, sb236, sb109, sb83 # 71
+xors 4, 2, sb151, sb236, sb80 # 72
+xors 4, 2, sb237, sb80, sb109 # 73
+xors 4, 2, sb238, sb107, sb79 # 74
+xors 4, 2, sb148, sb238, sb77 # 75
+xors 4, 2, sb239, sb77, sb107 # 76
+xors 4, 2, sb240, sb105, sb74 # 77
+xors 4, 2, sb139, sb240, sb73 # 78
+xors 4, 2, sb241, sb73, sb105 # 79
+xors 4, 2, sb242, sb102, sb71 # 80
+xors 4, 2, sb138, sb242, sb70 # 81
+xors 4, 2, sb243, sb70, sb102 # 82
+xors 4, 2, sb244, sb100, sb68 # 83
+xors 4, 2, sb136, sb244, sb63 # 84
+xors 4, 2, sb245, sb63, sb100 # 85
+xors 4, 2, sb246, sb95, sb61 # 86
+xors 4, 2, sb134, sb246, sb60 # 87
+xors 4, 2, sb247, sb60, sb95 # 88
+xors 4, 2, sb248, sb91, sb58 # 89
+xors 4, 2, sb132, sb248, sb53 # 90
+xors 4, 2, sb249, sb53, sb91 # 91
+xors 4, 2, sb250, sb88, sb51 # 92
+xors 4, 2, sb130, sb250, sb49 # 93
+xors 4, 2, sb251, sb49, sb88 # 94
+xors 4, 2, sb252, sb86, sb46 # 95
+xors 4, 2, sb122, sb252, sb43 # 96
+xors 4, 2, sb253, sb43, sb86 # 97
+xors 4, 2, sb254, sb84, sb41 # 98
+xors 4, 2, sb118, sb254, sb38 # 99
+xors 4, 2, sb255, sb38, sb84 # 100
+xors 4, 2, sb256, sb82, sb35 # 101
+xors 4, 2, sb115, sb256, sb34 # 102
+xors 4, 2, sb257, sb34, sb82 # 103
+xors 4, 2, sb258, sb78, sb33 # 104
+xors 4, 2, sb114, sb258, sb32 # 105
+xors 4, 2, sb259, sb32, sb78 # 106
+xors 4, 2, sb260, sb76, sb29 # 107
+xors 4, 2, sb113, sb260, sb28 # 108
+xors 4, 2, sb261, sb28, sb76 # 109
+xors 4, 2, sb262, sb72, sb26 # 110
+xors 4, 2, sb111, sb262, sb24 # 111
+xors 4, 2, sb263, sb24, sb72 # 112
+xors 4, 2, sb264, sb69, sb22 # 113
+xors 4, 2, sb110, sb264, sb16 # 114
+xors 4, 2, sb265, sb16, sb69 # 115
+xors 4, 2, sb266, sb67, sb13 # 116
+xors 4, 2, sb99, sb266, sb11 # 117
+xors 4, 2, sb267, sb11, sb67 # 118
+xors 4, 2, sb268, sb62, sb6 # 119
+xors 4, 2, sb98, sb268, sb3 # 120
+xors 4, 2, sb269, sb3, sb62 # 121
+xors 4, 2, sb270, sb59, sb313 # 122
+xors 4, 2, sb96, sb270, sb312 # 123
+xors 4, 2, sb271, sb312, sb59 # 124
+xors 4, 2, sb272, sb57, sb311 # 125
+xors 4, 2, sb94, sb272, sb310 # 126
+xors 4, 2, sb273, sb310, sb57 # 127
+xors 4, 2, sb274, sb52, sb309 # 128
+xors 4, 2, sb90, sb274, sb308 # 129
+xors 4, 2, sb275, sb308, sb52 # 130
+xors 4, 2, sb276, sb50, sb307 # 131
+xors 4, 2, sb213, sb276, sb306 # 132
+xors 4, 2, sb277, sb306, sb50 # 133
+xors 4, 2, sb278, sb47, sb305 # 134
+xors 4, 2, sb212, sb278, sb304 # 135
+xors 4, 2, sb279, sb304, sb47 # 136
+xors 4, 2, sb280, sb44, sb303 # 137
+xors 4, 2, sb79, sb280, sb302 # 138
+xors 4, 2, sb281, sb302, sb44 # 139
+xors 4, 2, sb282, sb42, sb301 # 140
+xors 4, 2, sb74, sb282, sb300 # 141
+xors 4, 2, sb283, sb300, sb42 # 142
+xors 4, 2, sb284, sb40, sb299 # 143
+xors 4, 2, sb200, sb284, sb298 # 144
+xors 4, 2, sb285, sb298, sb40 # 145
+xors 4, 2, sb286, sb36, sb297 # 146
+xors 4, 2, sb71, sb286, sb296 # 147
+xors 4, 2, sb287, sb296, sb36 # 148
+xors 4, 2, sb288, sb31, sb295 # 149
+xors 4, 2, sb198, sb288, sb294 # 150
+xors 4, 2, sb289, sb294, sb31 # 151
+xors 4, 2, sb290, sb25, sb293 # 152
+xors 4, 2, sb61, sb290, sb292 # 153
+xors 4, 2, sb291, sb292, sb25 # 154
+xors 4, 2, sb292, sb23, sb223 # 155
+xors 4, 2, sb187, sb292, sb221 # 156
+xors 4, 2, sb293, sb221, sb23 # 157
+xors 4, 2, sb294, sb20, sb219 # 158
+xors 4, 2, sb186, sb294, sb216 # 159
+xors 4, 2, sb295, sb216, sb20 # 160
+xors 4, 2, sb296, sb14, sb207 # 161
+xors 4, 2, sb178, sb296, sb203 # 162
+xors 4, 2, sb297, sb203, sb14 # 163
+xors 4, 2, sb298, sb12, sb201 # 164
+xors 4, 2, sb169, sb298, sb197 # 165
+xors 4, 2, sb299, sb197, sb12 # 166
+xors 4, 2, sb300, sb9, sb185 # 167
+xors 4, 2, sb165, sb300, sb181 # 168
+xors 4, 2, sb301, sb181, sb9 # 169
+xors 4, 2, sb302, sb5, sb177 # 170
+xors 4, 2, sb34, sb302, sb173 # 171
+xors 4, 2, sb303, sb173, sb5 # 172
+xors 4, 2, sb304, sb224, sb167 # 173
+xors 4, 2, sb35, sb304, sb164 # 174
+xors 4, 2, sb305, sb164, sb224 # 175
+xors 4, 2, sb306, sb222, sb162 # 176
+xors 4, 2, sb162, sb306, sb161 # 177
+xors 4, 2, sb307, sb161, sb222 # 178
+xors 4, 2, sb308, sb220, sb156 # 179
+xors 4, 2, sb32, sb308, sb152 # 180
+xors 4, 2, sb309, sb152, sb220 # 181
+xors 4, 2, sb310, sb217, sb149 # 182
+xors 4, 2, sb29, sb310, sb146 # 183
+xors 4, 2, sb311, sb146, sb217 # 184
+xors 4, 2, sb312, sb215, sb144 # 185
+xors 4, 2, sb28, sb312, sb142 # 186
+xors 4, 2, sb313, sb142, sb215 # 187
+ands 252, 2, sb203, sb205, sb206, 2, sb201, sb208, sb209, 2, sb197, sb218, sb0, 2, sb185, sb1, sb2, 2, sb181, sb4, sb7, 2, sb177, sb8, sb10, 2, sb173, sb15, sb17, 2, sb167, sb19, sb21, 2, sb164, sb27, sb30, 2, sb161, sb37, sb39, 2, sb156, sb45, sb48, 2, sb152, sb54, sb55, 2, sb149, sb56, sb64, 2, sb146, sb65, sb66, 2, sb144, sb75, sb81, 2, sb142, sb93, sb104, 2, sb137, sb120, sb135, 2, sb131, sb140, sb225, 2, sb128, sb226, sb227, 2, sb126, sb228, sb229, 2, sb124, sb230, sb231, 2, sb121, sb232, sb233, 2, sb117, sb234, sb235, 2, sb112, sb236, sb237, 2, sb108, sb238, sb239, 2, sb106, sb240, sb241, 2, sb103, sb242, sb243, 2, sb101, sb244, sb245, 2, sb97, sb246, sb247, 2, sb92, sb248, sb249, 2, sb89, sb250, sb251, 2, sb87, sb252, sb253, 2, sb85, sb254, sb255, 2, sb83, sb256, sb257, 2, sb80, sb258, sb259, 2, sb77, sb260, sb261, 2, sb73, sb262, sb263, 2, sb70, sb264, sb265, 2, sb68, sb266, sb267, 2, sb63, sb268, sb269, 2, sb60, sb270, sb271, 2, sb58, sb272, sb273, 2, sb53, sb274, sb275, 2, sb51, sb276, sb277, 2, sb49, sb278, sb279, 2, sb46, sb280, sb281, 2, sb43, sb282, sb283, 2, sb41, sb284, sb285, 2, sb38, sb286, sb287, 2, sb33, sb288, sb289, 2, sb26, sb290, sb291, 2, sb24, sb292, sb293, 2, sb22, sb294, sb295, 2, sb16, sb296, sb297, 2, sb13, sb298, sb299, 2, sb11, sb300, sb301, 2, sb6, sb302, sb303, 2, sb3, sb304, sb305, 2, sb223, sb306, sb307, 2, sb221, sb308, sb309, 2, sb219, sb310, sb311, 2, sb216, sb312, sb313, 2, sb207, sb18, sb18 # 188
+xors 4, 2, sb37, sb202, sb203 # 189
+xors 4, 2, sb206, sb199, sb201 # 190
+xors 4, 2, sb21, sb191, sb197 # 191
+xors 4, 2, sb202, sb183, sb185 # 192
+xors 4, 2, sb135, sb179, sb181 # 193
+xors 4, 2, sb140, sb175, sb177 # 194
+xors 4, 2, sb2, sb171, sb173 # 195
+xors 4, 2, sb55, sb166, sb167 # 196
+xors 4, 2, sb203, sb163, sb164 # 197
+xors 4, 2, sb1, sb158, sb161 # 198
+xors 4, 2, sb167, sb154, sb156 # 199
+xors 4, 2, sb218, sb150, sb152 # 200
+xors 4, 2, sb17, sb147, sb149 # 201
+xors 4, 2, sb66, sb145, sb146 # 202
+xors 4, 2, sb75, sb143, sb144 # 203
+xors 4, 2, sb147, sb141, sb142 # 204
+xors 4, 2, sb120, sb133, sb137 # 205
+xors 4, 2, sb199, sb129, sb131 # 206
+xors 4, 2, sb4, sb127, sb128 # 207
+xors 4, 2, sb39, sb125, sb126 # 208
+xors 4, 2, sb183, sb123, sb124 # 209
+xors 4, 2, sb7, sb119, sb121 # 210
+xors 4, 2, sb121, sb116, sb117 # 211
+xors 4, 2, sb104, sb109, sb112 # 212
+xors 4, 2, sb185, sb107, sb108 # 213
+xors 4, 2, sb93, sb105, sb106 # 214
+xors 4, 2, sb10, sb102, sb103 # 215
+xors 4, 2, sb171, sb100, sb101 # 216
+xors 4, 2, sb64, sb95, sb97 # 217
+xors 4, 2, sb56, sb91, sb92 # 218
+xors 4, 2, sb81, sb88, sb89 # 219
+xors 4, 2, sb65, sb86, sb87 # 220
+xors 4, 2, sb27, sb84, sb85 # 221
+xors 4, 2, sb208, sb82, sb83 # 222
+xors 4, 2, sb205, sb78, sb80 # 223
+xors 4, 2, sb161, sb76, sb77 # 224
+xors 4, 2, sb45, sb72, sb73 # 225
+xors 4, 2, sb164, sb69, sb70 # 226
+xors 4, 2, sb54, sb67, sb68 # 227
+xors 4, 2, sb48, sb62, sb63 # 228
+xors 4, 2, sb30, sb59, sb60 # 229
+xors 4, 2, sb108, sb57, sb58 # 230
+xors 4, 2, sb69, sb52, sb53 # 231
+xors 4, 2, sb197, sb50, sb51 # 232
+xors 4, 2, sb8, sb47, sb49 # 233
+xors 4, 2, sb166, sb44, sb46 # 234
+xors 4, 2, sb156, sb42, sb43 # 235
+xors 4, 2, sb144, sb40, sb41 # 236
+xors 4, 2, sb0, sb36, sb38 # 237
+xors 4, 2, sb15, sb31, sb33 # 238
+xors 4, 2, sb19, sb25, sb26 # 239
+xors 4, 2, sb78, sb23, sb24 # 240
+xors 4, 2, sb36, sb20, sb22 # 241
+xors 4, 2, sb42, sb14, sb16 # 242
+xors 4, 2, sb177, sb12, sb13 # 243
+xors 4, 2, sb149, sb9, sb11 # 244
+xors 4, 2, sb145, sb5, sb6 # 245
+xors 4, 2, sb128, sb224, sb3 # 246
+xors 4, 2, sb119, sb222, sb223 # 247
+xors 4, 2, sb100, sb220, sb221 # 248
+xors 4, 2, sb5, sb217, sb219 # 249
+xors 4, 2, sb146, sb215, sb216 # 250
+xors 4, 2, sb209, sb211, sb214 # 251
+xors 4, 2, sb152, sb209, sb210 # 252
+xors 4, 2, sb201, sb18, sb207 # 253
+xors 4, 2, sb43, sb37, sb204 # 254
+xors 4, 2, sb143, sb43, sb201 # 255
+xors 4, 2, sb47, sb201, sb37 # 256
+xors 4, 2, sb201, sb206, sb196 # 257
+xors 4, 2, sb129, sb21, sb195 # 258
+xors 4, 2, sb83, sb202, sb194 # 259
+xors 4, 2, sb16, sb135, sb193 # 260
+xors 4, 2, sb22, sb140, sb192 # 261
+xors 4, 2, sb179, sb21, sb195 # 262
+nots 2, sb191, sb179 # 263
+nots 2, sb53, sb21 # 264
+xors 4, 2, sb216, sb202, sb194 # 265
+xors 4, 2, sb150, sb135, sb193 # 266
+xors 4, 2, sb158, sb140, sb192 # 267
+xors 4, 2, sb31, sb191, sb129 # 268
+xors 4, 2, sb41, sb2, sb190 # 269
+xors 4, 2, sb105, sb55, sb189 # 270
+xors 4, 2, sb38, sb203, sb188 # 271
+xors 4, 2, sb173, sb1, sb184 # 272
+xors 4, 2, sb58, sb167, sb182 # 273
+xors 4, 2, sb60, sb2, sb190 # 274
+nots 2, sb181, sb60 # 275
+nots 2, sb62, sb2 # 276
+xors 4, 2, sb123, sb55, sb189 # 277
+xors 4, 2, sb175, sb203, sb188 # 278
+xors 4, 2, sb50, sb1, sb184 # 279
+xors 4, 2, sb77, sb167, sb182 # 280
+xors 4, 2, sb46, sb181, sb41 # 281
+xors 4, 2, sb23, sb218, sb180 # 282
+xors 4, 2, sb137, sb17, sb176 # 283
+xors 4, 2, sb52, sb66, sb174 # 284
+xors 4, 2, sb181, sb75, sb172 # 285
+xors 4, 2, sb85, sb147, sb170 # 286
+xors 4, 2, sb84, sb120, sb168 # 287
+xors 4, 2, sb63, sb218, sb180 # 288
+nots 2, sb163, sb63 # 289
+nots 2, sb193, sb218 # 290
+xors 4, 2, sb142, sb17, sb176 # 291
+xors 4, 2, sb191, sb66, sb174 # 292
+xors 4, 2, sb67, sb75, sb172 # 293
+xors 4, 2, sb97, sb147, sb170 # 294
+xors 4, 2, sb89, sb120, sb168 # 295
+xors 4, 2, sb51, sb163, sb23 # 296
+xors 4, 2, sb124, sb199, sb160 # 297
+xors 4, 2, sb154, sb4, sb159 # 298
+xors 4, 2, sb68, sb39, sb157 # 299
+xors 4, 2, sb73, sb183, sb155 # 300
+xors 4, 2, sb126, sb7, sb153 # 301
+xors 4, 2, sb112, sb121, sb151 # 302
+xors 4, 2, sb86, sb104, sb148 # 303
+xors 4, 2, sb195, sb199, sb160 # 304
+nots 2, sb141, sb195 # 305
+nots 2, sb204, sb199 # 306
+xors 4, 2, sb160, sb4, sb159 # 307
+xors 4, 2, sb72, sb39, sb157 # 308
+xors 4, 2, sb80, sb183, sb155 # 309
+xors 4, 2, sb3, sb7, sb153 # 310
+xors 4, 2, sb125, sb121, sb151 # 311
+xors 4, 2, sb103, sb104, sb148 # 312
+xors 4, 2, sb25, sb141, sb124 # 313
+xors 4, 2, sb91, sb185, sb139 # 314
+xors 4, 2, sb40, sb93, sb138 # 315
+xors 4, 2, sb76, sb10, sb136 # 316
+xors 4, 2, sb102, sb171, sb134 # 317
+xors 4, 2, sb131, sb64, sb132 # 318
+xors 4, 2, sb133, sb56, sb130 # 319
+xors 4, 2, sb109, sb81, sb122 # 320
+xors 4, 2, sb101, sb65, sb118 # 321
+xors 4, 2, sb210, sb185, sb139 # 322
+nots 2, sb117, sb210 # 323
+nots 2, sb214, sb185 # 324
+xors 4, 2, sb49, sb93, sb138 # 325
+xors 4, 2, sb6, sb10, sb136 # 326
+xors 4, 2, sb127, sb171, sb134 # 327
+xors 4, 2, sb141, sb64, sb132 # 328
+xors 4, 2, sb139, sb56, sb130 # 329
+xors 4, 2, sb116, sb81, sb122 # 330
+xors 4, 2, sb106, sb65, sb118 # 331
+xors 4, 2, sb95, sb117, sb91 # 332
+xors 4, 2, sb57, sb27, sb115 # 333
+xors 4, 2, sb189, sb208, sb114 # 334
+xors 4, 2, sb14, sb205, sb113 # 335
+xors 4, 2, sb190, sb161, sb111 # 336
+xors 4, 2, sb148, sb45, sb110 # 337
+xors 4, 2, sb168, sb164, sb99 # 338
+xors 4, 2, sb122, sb54, sb98 # 339
+xors 4, 2, sb107, sb48, sb96 # 340
+xors 4, 2, sb44, sb30, sb94 # 341
+xors 4, 2, sb87, sb27, sb115 # 342
+nots 2, sb92, sb87 # 343
+nots 2, sb224, sb27 # 344
+xors 4, 2, sb70, sb208, sb114 # 345
+xors 4, 2, sb207, sb205, sb113 # 346
+xors 4, 2, sb192, sb161, sb111 # 347
+xors 4, 2, sb163, sb45, sb110 # 348
+xors 4, 2, sb170, sb164, sb99 # 349
+xors 4, 2, sb151, sb54, sb98 # 350
+xors 4, 2, sb130, sb48, sb96 # 351
+xors 4, 2, sb82, sb30, sb94 # 352
+xors 4, 2, sb59, sb92, sb57 # 353
+xors 4, 2, sb24, sb108, sb90 # 354
+xors 4, 2, sb217, sb69, sb213 # 355
+xors 4, 2, sb209, sb197, sb212 # 356
+xors 4, 2, sb194, sb8, sb79 # 357
+xors 4, 2, sb180, sb166, sb74 # 358
+xors 4, 2, sb172, sb156, sb200 # 359
+xors 4, 2, sb153, sb144, sb71 # 360
+xors 4, 2, sb132, sb0, sb198 # 361
+xors 4, 2, sb111, sb15, sb61 # 362
+xors 4, 2, sb88, sb19, sb187 # 363
+xors 4, 2, sb98, sb108, sb90 # 364
+nots 2, sb188, sb98 # 365
+nots 2, sb99, sb108 # 366
+xors 4, 2, sb219, sb69, sb213 # 367
+xors 4, 2, sb211, sb197, sb212 # 368
+xors 4, 2, sb196, sb8, sb79 # 369
+xors 4, 2, sb182, sb166, sb74 # 370
+xors 4, 2, sb174, sb156, sb200 # 371
+xors 4, 2, sb155, sb144, sb71 # 372
+xors 4, 2, sb134, sb0, sb198 # 373
+xors 4, 2, sb113, sb15, sb61 # 374
+xors 4, 2, sb90, sb19, sb187 # 375
+xors 4, 2, sb26, sb188, sb24 # 376
+xors 4, 2, sb33, sb78, sb186 # 377
+xors 4, 2, sb221, sb36, sb178 # 378
+xors 4, 2, sb213, sb42, sb169 # 379
+xors 4, 2, sb198, sb177, sb165 # 380
+xors 4, 2, sb184, sb149, sb34 # 381
+xors 4, 2, sb176, sb145, sb35 # 382
+xors 4, 2, sb157, sb128, sb162 # 383
+xors 4, 2, sb136, sb119, sb32 # 384
+xors 4, 2, sb115, sb100, sb29 # 385
+xors 4, 2, sb92, sb5, sb28 # 386
+xors 4, 2, sb13, sb146, sb152 # 387
+xors 4, 2, sb110, sb78, sb186 # 388
+nots 2, sb20, sb110 # 389
+nots 2, sb114, sb78 # 390
+xors 4, 2, sb223, sb36, sb178 # 391
+xors 4, 2, sb215, sb42, sb169 # 392
+xors 4, 2, sb200, sb177, sb165 # 393
+xors 4, 2, sb186, sb149, sb34 # 394
+xors 4, 2, sb178, sb145, sb35 # 395
+xors 4, 2, sb159, sb128, sb162 # 396
+xors 4, 2, sb138, sb119, sb32 # 397
+xors 4, 2, sb117, sb100, sb29 # 398
+xors 4, 2, sb94, sb5, sb28 # 399
+xors 4, 2, sb74, sb146, sb152 # 400
+xors 4, 2, sb34, sb20, sb33 # 401
+nots 2, sb118, sb18 # 402
+nots 2, sb12, sb143 # 403
+ands 72, 2, sb169, sb43, sb47, 2, sb162, sb129, sb21, 2, sb28, sb179, sb53, 2, sb18, sb41, sb2, 2, sb11, sb60, sb62, 2, sb96, sb23, sb218, 2, sb220, sb63, sb193, 2, sb79, sb124, sb199, 2, sb71, sb195, sb204, 2, sb61, sb91, sb185, 2, sb187, sb210, sb214, 2, sb35, sb57, sb27, 2, sb29, sb87, sb224, 2, sb143, sb24, sb108, 2, sb9, sb98, sb99, 2, sb222, sb33, sb78, 2, sb212, sb110, sb114, 2, sb188, sb118, sb12 # 404
+xors 4, 2, sb165, sb37, sb169 # 405
+xors 4, 2, sb152, sb201, sb165 # 406
+xors 4, 2, sb193, sb165, sb206 # 407
+xors 4, 2, sb32, sb21, sb162 # 408
+xors 4, 2, sb110, sb83, sb32 # 409
+xors 4, 2, sb214, sb32, sb202 # 410
+xors 4, 2, sb146, sb21, sb28 # 411
+xors 4, 2, sb20, sb216, sb146 # 412
+xors 4, 2, sb37, sb20, sb110 # 413
+xors 4, 2, sb99, sb146, sb202 # 414
+xors 4, 2, sb12, sb2, sb18 # 415
+xors 4, 2, sb162, sb105, sb12 # 416
+xors 4, 2, sb114, sb12, sb55 # 417
+xors 4, 2, sb98, sb2, sb11 # 418
+xors 4, 2, sb118, sb123, sb98 # 419
+xors 4, 2, sb62, sb118, sb162 # 420
+xors 4, 2, sb2, sb98, sb55 # 421
+xors 4, 2, sb224, sb218, sb96 # 422
+xors 4, 2, sb20, sb137, sb224 # 423
+xors 4, 2, sb12, sb224, sb17 # 424
+xors 4, 2, sb210, sb218, sb220 # 425
+xors 4, 2, sb87, sb142, sb210 # 426
+xors 4, 2, sb53, sb87, sb20 # 427
+xors 4, 2, sb146, sb210, sb17 # 428
+xors 4, 2, sb204, sb199, sb79 # 429
+xors 4, 2, sb118, sb154, sb204 # 430
+xors 4, 2, sb28, sb204, sb4 # 431
+xors 4, 2, sb63, sb199, sb71 # 432
+xors 4, 2, sb195, sb160, sb63 # 433
+xors 4, 2, sb43, sb195, sb118 # 434
+xors 4, 2, sb165, sb63, sb4 # 435
+xors 4, 2, sb60, sb185, sb61 # 436
+xors 4, 2, sb87, sb40, sb60 # 437
+xors 4, 2, sb47, sb60, sb93 # 438
+xors 4, 2, sb169, sb185, sb187 # 439
+xors 4, 2, sb179, sb49, sb169 # 440
+xors 4, 2, sb96, sb179, sb87 # 441
+xors 4, 2, sb179, sb169, sb93 # 442
+xors 4, 2, sb32, sb27, sb35 # 443
+xors 4, 2, sb18, sb189, sb32 # 444
+xors 4, 2, sb63, sb32, sb208 # 445
+xors 4, 2, sb21, sb27, sb29 # 446
+xors 4, 2, sb27, sb70, sb21 # 447
+xors 4, 2, sb60, sb27, sb18 # 448
+xors 4, 2, sb204, sb21, sb208 # 449
+xors 4, 2, sb11, sb108, sb143 # 450
+xors 4, 2, sb21, sb217, sb11 # 451
+xors 4, 2, sb218, sb11, sb69 # 452
+xors 4, 2, sb224, sb108, sb9 # 453
+xors 4, 2, sb98, sb219, sb224 # 454
+xors 4, 2, sb27, sb98, sb21 # 455
+xors 4, 2, sb220, sb224, sb69 # 456
+xors 4, 2, sb210, sb78, sb222 # 457
+xors 4, 2, sb32, sb221, sb210 # 458
+xors 4, 2, sb222, sb210, sb36 # 459
+xors 4, 2, sb71, sb78, sb212 # 460
+xors 4, 2, sb79, sb223, sb71 # 461
+xors 4, 2, sb35, sb79, sb32 # 462
+xors 4, 2, sb224, sb71, sb36 # 463
+ands 68, 2, sb78, sb201, sb193, 2, sb79, sb83, sb214, 2, sb71, sb216, sb99, 2, sb61, sb105, sb114, 2, sb185, sb123, sb2, 2, sb29, sb137, sb12, 2, sb143, sb142, sb146, 2, sb11, sb154, sb28, 2, sb9, sb160, sb165, 2, sb108, sb40, sb47, 2, sb98, sb49, sb179, 2, sb212, sb189, sb63, 2, sb210, sb70, sb204, 2, sb195, sb217, sb218, 2, sb199, sb219, sb220, 2, sb187, sb221, sb222, 2, sb169, sb223, sb224 # 464
+xors 4, 2, sb179, sb206, sb78 # 465
+xors 4, 2, sb204, sb202, sb79 # 466
+xors 4, 2, sb99, sb16, sb204 # 467
+xors 4, 2, sb146, sb204, sb135 # 468
+xors 4, 2, sb63, sb202, sb71 # 469
+xors 4, 2, sb70, sb150, sb63 # 470
+xors 4, 2, sb165, sb70, sb99 # 471
+xors 4, 2, sb154, sb63, sb135 # 472
+xors 4, 2, sb189, sb55, sb61 # 473
+xors 4, 2, sb160, sb38, sb189 # 474
+xors 4, 2, sb40, sb189, sb203 # 475
+xors 4, 2, sb47, sb55, sb185 # 476
+xors 4, 2, sb49, sb175, sb47 # 477
+xors 4, 2, sb63, sb49, sb160 # 478
+xors 4, 2, sb49, sb47, sb203 # 479
+xors 4, 2, sb28, sb17, sb29 # 480
+xors 4, 2, sb142, sb52, sb28 # 481
+xors 4, 2, sb61, sb28, sb66 # 482
+xors 4, 2, sb12, sb17, sb143 # 483
+xors 4, 2, sb143, sb191, sb12 # 484
+xors 4, 2, sb55, sb143, sb142 # 485
+xors 4, 2, sb193, sb12, sb66 # 486
+xors 4, 2, sb137, sb4, sb11 # 487
+xors 4, 2, sb114, sb68, sb137 # 488
+xors 4, 2, sb70, sb137, sb39 # 489
+xors 4, 2, sb123, sb4, sb9 # 490
+xors 4, 2, sb2, sb72, sb123 # 491
+xors 4, 2, sb47, sb2, sb114 # 492
+xors 4, 2, sb201, sb123, sb39 # 493
+xors 4, 2, sb105, sb93, sb108 # 494
+xors 4, 2, sb78, sb76, sb105 # 495
+xors 4, 2, sb4, sb105, sb10 # 496
+xors 4, 2, sb214, sb93, sb98 # 497
+xors 4, 2, sb216, sb6, sb214 # 498
+xors 4, 2, sb98, sb216, sb78 # 499
+xors 4, 2, sb9, sb214, sb10 # 500
+xors 4, 2, sb83, sb208, sb212 # 501
+xors 4, 2, sb2, sb14, sb83 # 502
+xors 4, 2, sb206, sb83, sb205 # 503
+xors 4, 2, sb204, sb208, sb210 # 504
+xors 4, 2, sb79, sb207, sb204 # 505
+xors 4, 2, sb71, sb79, sb2 # 506
+xors 4, 2, sb208, sb204, sb205 # 507
+xors 4, 2, sb202, sb69, sb195 # 508
+xors 4, 2, sb17, sb209, sb202 # 509
+xors 4, 2, sb210, sb202, sb197 # 510
+xors 4, 2, sb189, sb69, sb199 # 511
+xors 4, 2, sb195, sb211, sb189 # 512
+xors 4, 2, sb28, sb195, sb17 # 513
+xors 4, 2, sb212, sb189, sb197 # 514
+xors 4, 2, sb185, sb36, sb187 # 515
+xors 4, 2, sb11, sb213, sb185 # 516
+xors 4, 2, sb214, sb185, sb42 # 517
+xors 4, 2, sb143, sb36, sb169 # 518
+xors 4, 2, sb29, sb215, sb143 # 519
+xors 4, 2, sb36, sb29, sb11 # 520
+xors 4, 2, sb216, sb143, sb42 # 521
+ands 76, 2, sb143, sb16, sb146, 2, sb137, sb150, sb154, 2, sb123, sb179, sb31, 2, sb105, sb179, sb37, 2, sb93, sb179, sb165, 2, sb79, sb38, sb40, 2, sb204, sb175, sb49, 2, sb69, sb52, sb61, 2, sb195, sb191, sb193, 2, sb187, sb68, sb70, 2, sb169, sb72, sb201, 2, sb29, sb76, sb4, 2, sb12, sb6, sb9, 2, sb108, sb14, sb206, 2, sb83, sb207, sb208, 2, sb202, sb209, sb210, 2, sb199, sb211, sb212, 2, sb189, sb213, sb214, 2, sb185, sb215, sb216 # 522
+xors 4, 2, sb14, sb135, sb143 # 523
+xors 4, 2, sb9, sb22, sb14 # 524
+xors 4, 2, sb154, sb14, sb140 # 525
+xors 4, 2, sb4, sb135, sb137 # 526
+xors 4, 2, sb6, sb158, sb4 # 527
+xors 4, 2, sb40, sb6, sb9 # 528
+xors 4, 2, sb31, sb4, sb140 # 529
+xors 4, 2, sb146, sb123, sb129 # 530
+xors 4, 2, sb16, sb105, sb110 # 531
+xors 4, 2, sb143, sb93, sb99 # 532
+xors 4, 2, sb76, sb203, sb79 # 533
+xors 4, 2, sb150, sb173, sb76 # 534
+xors 4, 2, sb175, sb76, sb1 # 535
+xors 4, 2, sb70, sb203, sb204 # 536
+xors 4, 2, sb201, sb50, sb70 # 537
+xors 4, 2, sb72, sb201, sb150 # 538
+xors 4, 2, sb52, sb70, sb1 # 539
+xors 4, 2, sb68, sb66, sb69 # 540
+xors 4, 2, sb137, sb181, sb68 # 541
+xors 4, 2, sb38, sb68, sb75 # 542
+xors 4, 2, sb191, sb66, sb195 # 543
+xors 4, 2, sb193, sb67, sb191 # 544
+xors 4, 2, sb61, sb193, sb137 # 545
+xors 4, 2, sb69, sb191, sb75 # 546
+xors 4, 2, sb49, sb39, sb187 # 547
+xors 4, 2, sb110, sb73, sb49 # 548
+xors 4, 2, sb79, sb49, sb183 # 549
+xors 4, 2, sb165, sb39, sb169 # 550
+xors 4, 2, sb37, sb80, sb165 # 551
+xors 4, 2, sb49, sb37, sb110 # 552
+xors 4, 2, sb93, sb165, sb183 # 553
+xors 4, 2, sb14, sb10, sb29 # 554
+xors 4, 2, sb76, sb102, sb14 # 555
+xors 4, 2, sb123, sb14, sb171 # 556
+xors 4, 2, sb135, sb10, sb12 # 557
+xors 4, 2, sb129, sb127, sb135 # 558
+xors 4, 2, sb99, sb129, sb76 # 559
+xors 4, 2, sb12, sb135, sb171 # 560
+xors 4, 2, sb105, sb205, sb108 # 561
+xors 4, 2, sb68, sb190, sb105 # 562
+xors 4, 2, sb191, sb105, sb161 # 563
+xors 4, 2, sb203, sb205, sb83 # 564
+xors 4, 2, sb204, sb192, sb203 # 565
+xors 4, 2, sb70, sb204, sb68 # 566
+xors 4, 2, sb193, sb203, sb161 # 567
+xors 4, 2, sb201, sb197, sb202 # 568
+xors 4, 2, sb14, sb194, sb201 # 569
+xors 4, 2, sb195, sb201, sb8 # 570
+xors 4, 2, sb66, sb197, sb199 # 571
+xors 4, 2, sb39, sb196, sb66 # 572
+xors 4, 2, sb29, sb39, sb14 # 573
+xors 4, 2, sb197, sb66, sb8 # 574
+xors 4, 2, sb187, sb42, sb189 # 575
+xors 4, 2, sb10, sb198, sb187 # 576
+xors 4, 2, sb199, sb187, sb177 # 577
+xors 4, 2, sb165, sb42, sb185 # 578
+xors 4, 2, sb169, sb200, sb165 # 579
+xors 4, 2, sb37, sb169, sb10 # 580
+xors 4, 2, sb201, sb165, sb177 # 581
+nots 2, sb202, sb152 # 582
+nots 2, sb203, sb146 # 583
+nots 2, sb204, sb16 # 584
+nots 2, sb205, sb143 # 585
+ands 76, 2, sb16, sb22, sb154, 2, sb143, sb158, sb31, 2, sb4, sb179, sb40, 2, sb6, sb173, sb175, 2, sb129, sb50, sb52, 2, sb105, sb181, sb38, 2, sb83, sb67, sb69, 2, sb66, sb73, sb79, 2, sb185, sb80, sb93, 2, sb169, sb102, sb123, 2, sb42, sb127, sb12, 2, sb39, sb190, sb191, 2, sb165, sb192, sb193, 2, sb152, sb194, sb195, 2, sb135, sb196, sb197, 2, sb108, sb198, sb199, 2, sb187, sb200, sb201, 2, sb189, sb202, sb203, 2, sb146, sb204, sb205 # 586
+xors 4, 2, sb175, sb140, sb16 # 587
+xors 4, 2, sb12, sb140, sb143 # 588
+xors 4, 2, sb52, sb12, sb175 # 589
+xors 4, 2, sb140, sb4, sb9 # 590
+xors 4, 2, sb4, sb1, sb6 # 591
+xors 4, 2, sb22, sb58, sb4 # 592
+xors 4, 2, sb67, sb4, sb167 # 593
+xors 4, 2, sb123, sb1, sb129 # 594
+xors 4, 2, sb127, sb77, sb123 # 595
+xors 4, 2, sb80, sb127, sb22 # 596
+xors 4, 2, sb79, sb123, sb167 # 597
+xors 4, 2, sb102, sb75, sb105 # 598
+xors 4, 2, sb6, sb85, sb102 # 599
+xors 4, 2, sb93, sb102, sb147 # 600
+xors 4, 2, sb69, sb75, sb83 # 601
+xors 4, 2, sb73, sb97, sb69 # 602
+xors 4, 2, sb75, sb73, sb6 # 603
+xors 4, 2, sb105, sb69, sb147 # 604
+xors 4, 2, sb38, sb183, sb66 # 605
+xors 4, 2, sb123, sb126, sb38 # 606
+xors 4, 2, sb129, sb38, sb7 # 607
+xors 4, 2, sb173, sb183, sb185 # 608
+xors 4, 2, sb181, sb3, sb173 # 609
+xors 4, 2, sb50, sb181, sb123 # 610
+xors 4, 2, sb4, sb173, sb7 # 611
+xors 4, 2, sb40, sb171, sb169 # 612
+xors 4, 2, sb73, sb131, sb40 # 613
+xors 4, 2, sb9, sb40, sb64 # 614
+xors 4, 2, sb40, sb171, sb42 # 615
+xors 4, 2, sb169, sb141, sb40 # 616
+xors 4, 2, sb102, sb169, sb73 # 617
+xors 4, 2, sb143, sb40, sb64 # 618
+xors 4, 2, sb38, sb161, sb39 # 619
+xors 4, 2, sb66, sb148, sb38 # 620
+xors 4, 2, sb158, sb38, sb45 # 621
+xors 4, 2, sb154, sb161, sb165 # 622
+xors 4, 2, sb31, sb163, sb154 # 623
+xors 4, 2, sb69, sb31, sb66 # 624
+xors 4, 2, sb42, sb154, sb45 # 625
+xors 4, 2, sb16, sb8, sb152 # 626
+xors 4, 2, sb12, sb180, sb16 # 627
+xors 4, 2, sb181, sb16, sb166 # 628
+xors 4, 2, sb127, sb8, sb135 # 629
+xors 4, 2, sb1, sb182, sb127 # 630
+xors 4, 2, sb31, sb1, sb12 # 631
+xors 4, 2, sb183, sb127, sb166 # 632
+xors 4, 2, sb83, sb177, sb108 # 633
+xors 4, 2, sb1, sb184, sb83 # 634
+xors 4, 2, sb185, sb83, sb149 # 635
+xors 4, 2, sb171, sb177, sb187 # 636
+xors 4, 2, sb173, sb186, sb171 # 637
+xors 4, 2, sb38, sb173, sb1 # 638
+xors 4, 2, sb187, sb171, sb149 # 639
+ands 64, 2, sb171, sb179, sb52, 2, sb169, sb58, sb67, 2, sb40, sb77, sb79, 2, sb161, sb85, sb93, 2, sb152, sb97, sb105, 2, sb135, sb126, sb129, 2, sb8, sb3, sb4, 2, sb108, sb131, sb9, 2, sb83, sb141, sb143, 2, sb177, sb148, sb158, 2, sb173, sb163, sb42, 2, sb39, sb180, sb181, 2, sb165, sb182, sb183, 2, sb154, sb184, sb185, 2, sb16, sb186, sb187, 2, sb127, sb188, sb189 # 640
+xors 4, 2, sb42, sb171, sb175 # 641
+xors 4, 2, sb148, sb167, sb169 # 642
+xors 4, 2, sb163, sb167, sb40 # 643
+xors 4, 2, sb79, sb163, sb148 # 644
+xors 4, 2, sb158, sb147, sb161 # 645
+xors 4, 2, sb131, sb84, sb158 # 646
+xors 4, 2, sb85, sb158, sb120 # 647
+xors 4, 2, sb141, sb147, sb152 # 648
+xors 4, 2, sb143, sb89, sb141 # 649
+xors 4, 2, sb77, sb143, sb131 # 650
+xors 4, 2, sb105, sb141, sb120 # 651
+xors 4, 2, sb9, sb7, sb135 # 652
+xors 4, 2, sb93, sb112, sb9 # 653
+xors 4, 2, sb126, sb9, sb121 # 654
+xors 4, 2, sb3, sb7, sb8 # 655
+xors 4, 2, sb4, sb125, sb3 # 656
+xors 4, 2, sb52, sb4, sb93 # 657
+xors 4, 2, sb129, sb3, sb121 # 658
+xors 4, 2, sb97, sb64, sb108 # 659
+xors 4, 2, sb67, sb133, sb97 # 660
+xors 4, 2, sb135, sb97, sb56 # 661
+xors 4, 2, sb179, sb64, sb83 # 662
+xors 4, 2, sb58, sb139, sb179 # 663
+xors 4, 2, sb8, sb58, sb67 # 664
+xors 4, 2, sb167, sb179, sb56 # 665
+xors 4, 2, sb175, sb45, sb177 # 666
+xors 4, 2, sb64, sb168, sb175 # 667
+xors 4, 2, sb169, sb175, sb164 # 668
+xors 4, 2, sb161, sb45, sb173 # 669
+xors 4, 2, sb40, sb170, sb161 # 670
+xors 4, 2, sb83, sb40, sb64 # 671
+xors 4, 2, sb171, sb161, sb164 # 672
+xors 4, 2, sb163, sb166, sb39 # 673
+xors 4, 2, sb7, sb172, sb163 # 674
+xors 4, 2, sb173, sb163, sb156 # 675
+xors 4, 2, sb158, sb166, sb165 # 676
+xors 4, 2, sb163, sb174, sb158 # 677
+xors 4, 2, sb45, sb163, sb7 # 678
+xors 4, 2, sb175, sb158, sb156 # 679
+xors 4, 2, sb152, sb149, sb154 # 680
+xors 4, 2, sb4, sb176, sb152 # 681
+xors 4, 2, sb177, sb152, sb145 # 682
+xors 4, 2, sb147, sb149, sb16 # 683
+xors 4, 2, sb141, sb178, sb147 # 684
+xors 4, 2, sb39, sb141, sb4 # 685
+xors 4, 2, sb179, sb147, sb145 # 686
+ands 72, 2, sb166, sb42, sb46, 2, sb163, sb42, sb62, 2, sb154, sb42, sb63, 2, sb152, sb42, sb72, 2, sb143, sb42, sb80, 2, sb141, sb42, sb79, 2, sb9, sb84, sb85, 2, sb3, sb89, sb105, 2, sb108, sb112, sb126, 2, sb97, sb125, sb129, 2, sb16, sb133, sb135, 2, sb58, sb139, sb167, 2, sb40, sb168, sb169, 2, sb165, sb170, sb171, 2, sb161, sb172, sb173, 2, sb158, sb174, sb175, 2, sb149, sb176, sb177, 2, sb147, sb178, sb179 # 687
+xors 4, 2, sb139, sb166, sb41 # 688
+xors 4, 2, sb135, sb163, sb162 # 689
+xors 4, 2, sb133, sb154, sb160 # 690
+xors 4, 2, sb129, sb152, sb150 # 691
+xors 4, 2, sb125, sb143, sb22 # 692
+xors 4, 2, sb42, sb141, sb148 # 693
+xors 4, 2, sb126, sb120, sb9 # 694
+xors 4, 2, sb112, sb120, sb3 # 695
+xors 4, 2, sb79, sb112, sb126 # 696
+xors 4, 2, sb105, sb121, sb108 # 697
+xors 4, 2, sb80, sb86, sb105 # 698
+xors 4, 2, sb89, sb105, sb104 # 699
+xors 4, 2, sb84, sb121, sb97 # 700
+xors 4, 2, sb85, sb103, sb84 # 701
+xors 4, 2, sb62, sb85, sb80 # 702
+xors 4, 2, sb108, sb84, sb104 # 703
+xors 4, 2, sb72, sb56, sb16 # 704
+xors 4, 2, sb63, sb109, sb72 # 705
+xors 4, 2, sb112, sb72, sb81 # 706
+xors 4, 2, sb41, sb56, sb58 # 707
+xors 4, 2, sb46, sb116, sb41 # 708
+xors 4, 2, sb16, sb46, sb63 # 709
+xors 4, 2, sb120, sb41, sb81 # 710
+xors 4, 2, sb166, sb164, sb40 # 711
+xors 4, 2, sb56, sb122, sb166 # 712
+xors 4, 2, sb150, sb166, sb54 # 713
+xors 4, 2, sb162, sb164, sb165 # 714
+xors 4, 2, sb163, sb151, sb162 # 715
+xors 4, 2, sb84, sb163, sb56 # 716
+xors 4, 2, sb152, sb162, sb54 # 717
+xors 4, 2, sb160, sb156, sb161 # 718
+xors 4, 2, sb3, sb153, sb160 # 719
+xors 4, 2, sb154, sb160, sb144 # 720
+xors 4, 2, sb143, sb156, sb158 # 721
+xors 4, 2, sb22, sb155, sb143 # 722
+xors 4, 2, sb46, sb22, sb3 # 723
+xors 4, 2, sb156, sb143, sb144 # 724
+xors 4, 2, sb148, sb145, sb149 # 725
+xors 4, 2, sb9, sb157, sb148 # 726
+xors 4, 2, sb158, sb148, sb128 # 727
+xors 4, 2, sb141, sb145, sb147 # 728
+xors 4, 2, sb143, sb159, sb141 # 729
+xors 4, 2, sb40, sb143, sb9 # 730
+xors 4, 2, sb160, sb141, sb128 # 731
+nots 2, sb161, sb140 # 732
+nots 2, sb162, sb139 # 733
+nots 2, sb163, sb135 # 734
+nots 2, sb164, sb133 # 735
+nots 2, sb165, sb129 # 736
+nots 2, sb166, sb125 # 737
+ands 80, 2, sb22, sb42, sb51, 2, sb143, sb42, sb53, 2, sb140, sb42, sb55, 2, sb135, sb42, sb61, 2, sb133, sb42, sb75, 2, sb129, sb42, sb77, 2, sb125, sb42, sb79, 2, sb121, sb86, sb89, 2, sb105, sb103, sb108, 2, sb97, sb109, sb112, 2, sb85, sb116, sb120, 2, sb72, sb122, sb150, 2, sb58, sb151, sb152, 2, sb41, sb153, sb154, 2, sb145, sb155, sb156, 2, sb141, sb157, sb158, 2, sb139, sb159, sb160, 2, sb147, sb161, sb162, 2, sb148, sb163, sb164, 2, sb149, sb165, sb166 # 738
+xors 4, 2, sb120, sb22, sb23 # 739
+xors 4, 2, sb116, sb143, sb20 # 740
+xors 4, 2, sb112, sb140, sb142 # 741
+xors 4, 2, sb108, sb135, sb137 # 742
+xors 4, 2, sb109, sb133, sb6 # 743
+xors 4, 2, sb122, sb129, sb131 # 744
+xors 4, 2, sb22, sb125, sb126 # 745
+xors 4, 2, sb79, sb104, sb121 # 746
+xors 4, 2, sb103, sb104, sb105 # 747
+xors 4, 2, sb89, sb103, sb79 # 748
+xors 4, 2, sb86, sb81, sb97 # 749
+xors 4, 2, sb55, sb101, sb86 # 750
+xors 4, 2, sb103, sb86, sb65 # 751
+xors 4, 2, sb75, sb81, sb85 # 752
+xors 4, 2, sb77, sb106, sb75 # 753
+xors 4, 2, sb23, sb77, sb55 # 754
+xors 4, 2, sb105, sb75, sb65 # 755
+xors 4, 2, sb61, sb54, sb72 # 756
+xors 4, 2, sb53, sb107, sb61 # 757
+xors 4, 2, sb129, sb61, sb48 # 758
+xors 4, 2, sb42, sb54, sb58 # 759
+xors 4, 2, sb51, sb130, sb42 # 760
+xors 4, 2, sb85, sb51, sb53 # 761
+xors 4, 2, sb131, sb42, sb48 # 762
+xors 4, 2, sb20, sb144, sb41 # 763
+xors 4, 2, sb54, sb132, sb20 # 764
+xors 4, 2, sb133, sb20, sb0 # 765
+xors 4, 2, sb142, sb144, sb145 # 766
+xors 4, 2, sb143, sb134, sb142 # 767
+xors 4, 2, sb61, sb143, sb54 # 768
+xors 4, 2, sb135, sb142, sb0 # 769
+xors 4, 2, sb140, sb128, sb141 # 770
+xors 4, 2, sb6, sb136, sb140 # 771
+xors 4, 2, sb137, sb140, sb119 # 772
+xors 4, 2, sb125, sb128, sb139 # 773
+xors 4, 2, sb126, sb138, sb125 # 774
+xors 4, 2, sb41, sb126, sb6 # 775
+xors 4, 2, sb139, sb125, sb119 # 776
+nots 2, sb140, sb120 # 777
+nots 2, sb141, sb116 # 778
+nots 2, sb142, sb112 # 779
+nots 2, sb143, sb108 # 780
+nots 2, sb144, sb109 # 781
+nots 2, sb145, sb122 # 782
+ands 84, 2, sb121, sb22, sb25, 2, sb116, sb22, sb43, 2, sb112, sb22, sb47, 2, sb109, sb22, sb49, 2, sb97, sb22, sb50, 2, sb86, sb22, sb52, 2, sb81, sb22, sb62, 2, sb77, sb22, sb89, 2, sb75, sb101, sb103, 2, sb72, sb106, sb105, 2, sb58, sb107, sb129, 2, sb51, sb130, sb131, 2, sb42, sb132, sb133, 2, sb20, sb134, sb135, 2, sb122, sb136, sb137, 2, sb120, sb138, sb139, 2, sb125, sb140, sb141, 2, sb126, sb142, sb143, 2, sb104, sb144, sb145, 2, sb128, sb146, sb147, 2, sb108, sb148, sb149 # 783
+xors 4, 2, sb107, sb121, sb124 # 784
+xors 4, 2, sb106, sb116, sb118 # 785
+xors 4, 2, sb105, sb112, sb114 # 786
+xors 4, 2, sb103, sb109, sb110 # 787
+xors 4, 2, sb101, sb97, sb123 # 788
+xors 4, 2, sb89, sb86, sb93 # 789
+xors 4, 2, sb97, sb81, sb80 # 790
+xors 4, 2, sb93, sb77, sb79 # 791
+xors 4, 2, sb50, sb65, sb75 # 792
+xors 4, 2, sb62, sb65, sb72 # 793
+xors 4, 2, sb25, sb62, sb50 # 794
+xors 4, 2, sb52, sb48, sb58 # 795
+xors 4, 2, sb49, sb44, sb52 # 796
+xors 4, 2, sb80, sb52, sb30 # 797
+xors 4, 2, sb43, sb48, sb51 # 798
+xors 4, 2, sb47, sb82, sb43 # 799
+xors 4, 2, sb86, sb47, sb49 # 800
+xors 4, 2, sb110, sb43, sb30 # 801
+xors 4, 2, sb22, sb0, sb42 # 802
+xors 4, 2, sb52, sb111, sb22 # 803
+xors 4, 2, sb112, sb22, sb15 # 804
+xors 4, 2, sb123, sb0, sb20 # 805
+xors 4, 2, sb124, sb113, sb123 # 806
+xors 4, 2, sb62, sb124, sb52 # 807
+xors 4, 2, sb114, sb123, sb15 # 808
+xors 4, 2, sb121, sb119, sb122 # 809
+xors 4, 2, sb0, sb115, sb121 # 810
+xors 4, 2, sb116, sb121, sb100 # 811
+xors 4, 2, sb109, sb119, sb120 # 812
+xors 4, 2, sb118, sb117, sb109 # 813
+xors 4, 2, sb42, sb118, sb0 # 814
+xors 4, 2, sb118, sb109, sb100 # 815
+nots 2, sb119, sb107 # 816
+nots 2, sb120, sb106 # 817
+nots 2, sb121, sb105 # 818
+nots 2, sb122, sb103 # 819
+nots 2, sb123, sb101 # 820
+nots 2, sb124, sb89 # 821
+ands 80, 2, sb89, sb93, sb95, 2, sb79, sb93, sb96, 2, sb77, sb93, sb98, 2, sb75, sb93, sb99, 2, sb72, sb93, sb102, 2, sb65, sb93, sb8, 2, sb58, sb93, sb16, 2, sb51, sb93, sb23, 2, sb48, sb93, sb25, 2, sb47, sb44, sb80, 2, sb43, sb82, sb110, 2, sb22, sb111, sb112, 2, sb20, sb113, sb114, 2, sb103, sb115, sb116, 2, sb101, sb117, sb118, 2, sb105, sb119, sb120, 2, sb106, sb121, sb122, 2, sb107, sb123, sb124, 2, sb109, sb125, sb126, 2, sb81, sb127, sb128 # 822
+xors 4, 2, sb82, sb89, sb91 # 823
+xors 4, 2, sb80, sb79, sb87 # 824
+xors 4, 2, sb79, sb77, sb78 # 825
+xors 4, 2, sb78, sb75, sb76 # 826
+xors 4, 2, sb77, sb72, sb73 # 827
+xors 4, 2, sb76, sb65, sb67 # 828
+xors 4, 2, sb75, sb58, sb63 # 829
+xors 4, 2, sb72, sb51, sb55 # 830
+xors 4, 2, sb58, sb48, sb50 # 831
+xors 4, 2, sb44, sb30, sb47 # 832
+xors 4, 2, sb23, sb30, sb43 # 833
+xors 4, 2, sb87, sb23, sb44 # 834
+xors 4, 2, sb16, sb15, sb22 # 835
+xors 4, 2, sb50, sb88, sb16 # 836
+xors 4, 2, sb89, sb16, sb19 # 837
+xors 4, 2, sb8, sb15, sb20 # 838
+xors 4, 2, sb16, sb90, sb8 # 839
+xors 4, 2, sb63, sb16, sb50 # 840
+xors 4, 2, sb91, sb8, sb19 # 841
+xors 4, 2, sb102, sb100, sb103 # 842
+xors 4, 2, sb20, sb92, sb102 # 843
+xors 4, 2, sb93, sb102, sb5 # 844
+xors 4, 2, sb98, sb100, sb101 # 845
+xors 4, 2, sb99, sb94, sb98 # 846
+xors 4, 2, sb43, sb99, sb20 # 847
+xors 4, 2, sb95, sb98, sb5 # 848
+nots 2, sb96, sb97 # 849
+nots 2, sb97, sb82 # 850
+nots 2, sb98, sb80 # 851
+nots 2, sb99, sb79 # 852
+nots 2, sb100, sb78 # 853
+nots 2, sb101, sb77 # 854
+nots 2, sb102, sb76 # 855
+nots 2, sb103, sb75 # 856
+ands 84, 2, sb25, sb58, sb59, 2, sb15, sb58, sb60, 2, sb73, sb58, sb71, 2, sb67, sb58, sb70, 2, sb65, sb58, sb69, 2, sb55, sb58, sb83, 2, sb48, sb58, sb84, 2, sb51, sb58, sb85, 2, sb47, sb58, sb86, 2, sb30, sb58, sb87, 2, sb23, sb88, sb89, 2, sb22, sb90, sb91, 2, sb16, sb92, sb93, 2, sb8, sb94, sb95, 2, sb75, sb96, sb97, 2, sb76, sb98, sb99, 2, sb77, sb100, sb101, 2, sb78, sb102, sb103, 2, sb79, sb104, sb105, 2, sb80, sb106, sb107, 2, sb82, sb108, sb109 # 857
+xors 4, 2, sb71, sb25, sb57 # 858
+xors 4, 2, sb70, sb15, sb18 # 859
+xors 4, 2, sb69, sb73, sb2 # 860
+xors 4, 2, sb60, sb67, sb68 # 861
+xors 4, 2, sb59, sb65, sb66 # 862
+xors 4, 2, sb58, sb55, sb64 # 863
+xors 4, 2, sb57, sb48, sb56 # 864
+xors 4, 2, sb56, sb51, sb53 # 865
+xors 4, 2, sb55, sb47, sb49 # 866
+xors 4, 2, sb25, sb30, sb44 # 867
+xors 4, 2, sb48, sb19, sb23 # 868
+xors 4, 2, sb18, sb19, sb22 # 869
+xors 4, 2, sb64, sb18, sb48 # 870
+xors 4, 2, sb15, sb5, sb16 # 871
+xors 4, 2, sb18, sb13, sb15 # 872
+xors 4, 2, sb2, sb5, sb8 # 873
+xors 4, 2, sb73, sb74, sb2 # 874
+xors 4, 2, sb44, sb73, sb18 # 875
+nots 2, sb65, sb72 # 876
+nots 2, sb66, sb71 # 877
+nots 2, sb67, sb70 # 878
+nots 2, sb68, sb69 # 879
+nots 2, sb69, sb60 # 880
+nots 2, sb70, sb59 # 881
+nots 2, sb71, sb58 # 882
+nots 2, sb72, sb57 # 883
+nots 2, sb73, sb56 # 884
+nots 2, sb74, sb55 # 885
+ands 80, 2, sb23, sb25, sb26, 2, sb19, sb25, sb27, 2, sb16, sb25, sb28, 2, sb13, sb25, sb29, 2, sb8, sb25, sb31, 2, sb5, sb25, sb45, 2, sb2, sb25, sb46, 2, sb53, sb25, sb61, 2, sb51, sb25, sb62, 2, sb49, sb25, sb63, 2, sb47, sb25, sb64, 2, sb55, sb65, sb66, 2, sb56, sb67, sb68, 2, sb57, sb69, sb70, 2, sb58, sb71, sb72, 2, sb22, sb73, sb74, 2, sb59, sb75, sb76, 2, sb60, sb77, sb78, 2, sb30, sb79, sb80, 2, sb15, sb81, sb82 # 886
+xors 4, 2, sb46, sb23, sb24 # 887
+xors 4, 2, sb31, sb19, sb21 # 888
+xors 4, 2, sb29, sb16, sb17 # 889
+xors 4, 2, sb28, sb13, sb14 # 890
+xors 4, 2, sb27, sb8, sb12 # 891
+xors 4, 2, sb26, sb5, sb7 # 892
+xors 4, 2, sb25, sb2, sb3 # 893
+xors 4, 2, sb24, sb53, sb54 # 894
+xors 4, 2, sb23, sb51, sb52 # 895
+xors 4, 2, sb21, sb49, sb50 # 896
+xors 4, 2, sb16, sb47, sb48 # 897
+nots 2, sb45, sb46 # 898
+nots 2, sb46, sb31 # 899
+nots 2, sb47, sb29 # 900
+nots 2, sb48, sb28 # 901
+nots 2, sb49, sb27 # 902
+nots 2, sb50, sb26 # 903
+nots 2, sb51, sb25 # 904
+nots 2, sb52, sb24 # 905
+nots 2, sb53, sb23 # 906
+nots 2, sb54, sb21 # 907
+ands 76, 2, sb14, sb16, sb34, 2, sb13, sb16, sb35, 2, sb12, sb16, sb36, 2, sb3, sb16, sb37, 2, sb2, sb16, sb38, 2, sb8, sb16, sb39, 2, sb7, sb16, sb40, 2, sb5, sb16, sb41, 2, sb21, sb16, sb42, 2, sb19, sb16, sb43, 2, sb17, sb16, sb44, 2, sb23, sb45, sb46, 2, sb24, sb47, sb48, 2, sb25, sb49, sb50, 2, sb26, sb51, sb52, 2, sb27, sb53, sb54, 2, sb28, sb55, sb56, 2, sb29, sb57, sb58, 2, sb31, sb59, sb60 # 908
+xors 4, 2, sb16, sb14, sb33 # 909
+xors 4, 2, sb14, sb13, sb32 # 910
+xors 4, 2, sb13, sb12, sb11 # 911
+xors 4, 2, sb12, sb3, sb10 # 912
+xors 4, 2, sb11, sb2, sb1 # 913
+xors 4, 2, sb10, sb8, sb4 # 914
+xors 4, 2, sb8, sb7, sb9 # 915
+xors 4, 2, sb4, sb5, sb6 # 916
+xors 4, 2, sb3, sb21, sb0 # 917
+xors 4, 2, sb2, sb19, sb20 # 918
+xors 4, 2, sb1, sb17, sb18 # 919
+nots 2, sb5, sb16 # 920
+nots 2, sb6, sb14 # 921
+nots 2, sb7, sb13 # 922
+nots 2, sb9, sb12 # 923
+nots 2, sb0, sb11 # 924
+nots 2, sb17, sb10 # 925
+nots 2, sb18, sb8 # 926
+nots 2, sb19, sb4 # 927
+nots 2, sb20, sb3 # 928
+nots 2, sb21, sb2 # 929
+nots 2, sb12, sb1 # 930
+ands 40, 2, sb4, sb5, sb6, 2, sb1, sb7, sb9, 2, sb2, sb0, sb17, 2, sb10, sb18, sb19, 2, sb11, sb20, sb21, 2, sb13, sb22, sb23, 2, sb14, sb24, sb25, 2, sb3, sb26, sb27, 2, sb8, sb28, sb29, 2, sb16, sb30, sb31 # 931
+ands 20, 2, sb5, sb4, sb1, 2, sb6, sb2, sb10, 2, sb7, sb11, sb12, 2, sb9, sb13, sb14, 2, sb0, sb15, sb16 # 932
+ands 12, 2, sb1, sb3, sb5, 2, sb4, sb6, sb7, 2, sb2, sb8, sb9 # 933
+ands 4, 2, sb3, sb1, sb4 # 934
+ands 4, 2, sb1, sb2, sb3 # 935
+ands 4, 2, sb2, sb0, sb1 # 936
+vdabit 2, s4, sb1 # 937
+xors 4, 2, sb0, sb1, sb2 # 938
+reveal 3, 2, cb0, sb0 # 939
+convcbitvec 2, ci0, cb0 # 940
+vconvint 2, c0, ci0 # 941
+vaddm 2, s2, s4, c0 # 942
+vmulsi 2, s0, s4, 2 # 943
+vconvint 2, c0, ci0 # 944
+vmulm 2, s4, s0, c0 # 945
+vsubs 2, s0, s2, s4 # 946
+vmovs 2, s2, s0 # 947
+vmovs 2, s0, s2 # 948
+use 2, 0, 624 # 949
+use 0, 4, 2 # 950
+reqbl -64 # 951
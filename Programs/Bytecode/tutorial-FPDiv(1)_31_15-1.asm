@@ -0,0 +1,7994 @@
+call_arg *11, 4 # 0
+call_arg *14, 4 # 1
+ldi c6, 1 # 2
+shlci c1, c6, 31 # 3
+mulci c0, c1, 2 # 4
+ldi c3, 2 # 5
+mulci c4, c3, 2147483647 # 6
+addci c7, c4, 1963229553 # 7
+ldsi s13, 0 # 8
+addm s12, s13, c7 # 9
+subsi s10, s14, 0 # 10
+split 98, 3, s10, sb23, sb583, sb496, sb115, sb430, sb192, sb577, sb578, sb188, sb573, sb114, sb37, sb521, sb104, sb7, sb113, sb570, sb443, sb520, sb102, sb177, sb565, sb569, sb176, sb112, sb519, sb175, sb111, sb511, sb441, sb429, sb518, sb168, sb554, sb555, sb165, sb22, sb517, sb167, sb549, sb110, sb439, sb103, sb109, sb495, sb546, sb516, sb157, sb510, sb108, sb438, sb17, sb542, sb407, sb541, sb424, sb413, sb539, sb538, sb155, sb537, sb536, sb147, sb527, sb509, sb436, sb515, sb526, sb494, sb90, sb489, sb28, sb488, sb81, sb143, sb3, sb406, sb144, sb80, sb404, sb136, sb423, sb402, sb133, sb487, sb16, sb5, sb97, sb79, sb129, sb400, sb398, sb433, sb504, sb394, sb485 # 11
+xors 4, 1, sb195, sb496, sb583 # 12
+xors 4, 1, sb196, sb23, sb496 # 13
+xors 4, 1, sb39, sb192, sb430 # 14
+xors 4, 1, sb636, sb39, sb115 # 15
+xors 4, 1, sb198, sb115, sb192 # 16
+xors 4, 1, sb200, sb188, sb578 # 17
+xors 4, 1, sb635, sb200, sb577 # 18
+xors 4, 1, sb415, sb577, sb188 # 19
+xors 4, 1, sb447, sb37, sb114 # 20
+xors 4, 1, sb634, sb447, sb573 # 21
+xors 4, 1, sb202, sb573, sb37 # 22
+xors 4, 1, sb204, sb7, sb104 # 23
+xors 4, 1, sb225, sb204, sb521 # 24
+xors 4, 1, sb206, sb521, sb7 # 25
+xors 4, 1, sb41, sb443, sb570 # 26
+xors 4, 1, sb631, sb41, sb113 # 27
+xors 4, 1, sb8, sb113, sb443 # 28
+xors 4, 1, sb448, sb177, sb102 # 29
+xors 4, 1, sb533, sb448, sb520 # 30
+xors 4, 1, sb450, sb520, sb177 # 31
+xors 4, 1, sb83, sb176, sb569 # 32
+xors 4, 1, sb221, sb83, sb565 # 33
+xors 4, 1, sb210, sb565, sb176 # 34
+xors 4, 1, sb42, sb175, sb519 # 35
+xors 4, 1, sb626, sb42, sb112 # 36
+xors 4, 1, sb449, sb112, sb175 # 37
+xors 4, 1, sb214, sb441, sb511 # 38
+xors 4, 1, sb218, sb214, sb111 # 39
+xors 4, 1, sb508, sb111, sb441 # 40
+xors 4, 1, sb505, sb168, sb518 # 41
+xors 4, 1, sb217, sb505, sb429 # 42
+xors 4, 1, sb490, sb429, sb168 # 43
+xors 4, 1, sb43, sb165, sb555 # 44
+xors 4, 1, sb215, sb43, sb554 # 45
+xors 4, 1, sb497, sb554, sb165 # 46
+xors 4, 1, sb228, sb167, sb517 # 47
+xors 4, 1, sb621, sb228, sb22 # 48
+xors 4, 1, sb44, sb22, sb167 # 49
+xors 4, 1, sb451, sb439, sb110 # 50
+xors 4, 1, sb212, sb451, sb549 # 51
+xors 4, 1, sb222, sb549, sb439 # 52
+xors 4, 1, sb45, sb495, sb109 # 53
+xors 4, 1, sb617, sb45, sb103 # 54
+xors 4, 1, sb224, sb103, sb495 # 55
+xors 4, 1, sb453, sb157, sb516 # 56
+xors 4, 1, sb616, sb453, sb546 # 57
+xors 4, 1, sb9, sb546, sb157 # 58
+xors 4, 1, sb452, sb438, sb108 # 59
+xors 4, 1, sb615, sb452, sb510 # 60
+xors 4, 1, sb18, sb510, sb438 # 61
+xors 4, 1, sb229, sb407, sb542 # 62
+xors 4, 1, sb207, sb229, sb17 # 63
+xors 4, 1, sb416, sb17, sb407 # 64
+xors 4, 1, sb231, sb413, sb424 # 65
+xors 4, 1, sb205, sb231, sb541 # 66
+xors 4, 1, sb425, sb541, sb413 # 67
+xors 4, 1, sb82, sb155, sb538 # 68
+xors 4, 1, sb203, sb82, sb539 # 69
+xors 4, 1, sb237, sb539, sb155 # 70
+xors 4, 1, sb235, sb147, sb536 # 71
+xors 4, 1, sb609, sb235, sb537 # 72
+xors 4, 1, sb454, sb537, sb147 # 73
+xors 4, 1, sb47, sb436, sb509 # 74
+xors 4, 1, sb608, sb47, sb527 # 75
+xors 4, 1, sb498, sb527, sb436 # 76
+xors 4, 1, sb239, sb494, sb526 # 77
+xors 4, 1, sb199, sb239, sb515 # 78
+xors 4, 1, sb455, sb515, sb494 # 79
+xors 4, 1, sb243, sb28, sb489 # 80
+xors 4, 1, sb604, sb243, sb90 # 81
+xors 4, 1, sb48, sb90, sb28 # 82
+xors 4, 1, sb91, sb143, sb81 # 83
+xors 4, 1, sb602, sb91, sb488 # 84
+xors 4, 1, sb245, sb488, sb143 # 85
+xors 4, 1, sb247, sb144, sb406 # 86
+xors 4, 1, sb600, sb247, sb3 # 87
+xors 4, 1, sb246, sb3, sb144 # 88
+xors 4, 1, sb456, sb136, sb404 # 89
+xors 4, 1, sb191, sb456, sb80 # 90
+xors 4, 1, sb248, sb80, sb136 # 91
+xors 4, 1, sb457, sb133, sb402 # 92
+xors 4, 1, sb190, sb457, sb423 # 93
+xors 4, 1, sb250, sb423, sb133 # 94
+xors 4, 1, sb251, sb5, sb16 # 95
+xors 4, 1, sb526, sb251, sb487 # 96
+xors 4, 1, sb50, sb487, sb5 # 97
+xors 4, 1, sb253, sb129, sb79 # 98
+xors 4, 1, sb594, sb253, sb97 # 99
+xors 4, 1, sb10, sb97, sb129 # 100
+xors 4, 1, sb417, sb433, sb398 # 101
+xors 4, 1, sb186, sb417, sb400 # 102
+xors 4, 1, sb458, sb400, sb433 # 103
+xors 4, 1, sb78, sb485, sb394 # 104
+xors 4, 1, sb46, sb78, sb504 # 105
+dabit s7, sb220 # 106
+mulsi s6, s7, 2 # 107
+randoms s22, 31 # 108
+split 101, 3, s22, sb486, sb390, sb120, sb484, sb77, sb11, sb385, sb386, sb405, sb76, sb384, sb401, sb410, sb483, sb397, sb15, sb422, sb395, sb482, sb378, sb392, sb376, sb75, sb389, sb481, sb96, sb387, sb370, sb372, sb382, sb480, sb74, sb380, sb20, sb411, sb377, sb73, sb365, sb374, sb366, sb72, sb371, sb427, sb479, sb368, sb426, sb503, sb364, sb421, sb19, sb362, sb71, sb478, sb360, sb352, sb70, sb358, sb350, sb351, sb356, sb14, sb349, sb353, sb477, sb69, sb347, sb502, sb345, sb476, sb340, sb98, sb343, sb67, sb491, sb68, sb341, sb474, sb339, sb334, sb337, sb338, sb332, sb336, sb66, sb331, sb473, sb13, sb328, sb335, sb327, sb326, sb65, sb472, sb324, sb330, sb319, sb313, sb318, sb316 # 109
+xors 4, 1, sb261, sb120, sb390 # 110
+xors 4, 1, sb216, sb261, sb486 # 111
+xors 4, 1, sb259, sb486, sb120 # 112
+xors 4, 1, sb260, sb11, sb77 # 113
+xors 4, 1, sb310, sb260, sb484 # 114
+xors 4, 1, sb459, sb484, sb11 # 115
+xors 4, 1, sb52, sb405, sb386 # 116
+xors 4, 1, sb307, sb52, sb385 # 117
+xors 4, 1, sb92, sb385, sb405 # 118
+xors 4, 1, sb266, sb401, sb384 # 119
+xors 4, 1, sb304, sb266, sb76 # 120
+xors 4, 1, sb460, sb76, sb401 # 121
+xors 4, 1, sb53, sb397, sb483 # 122
+xors 4, 1, sb302, sb53, sb410 # 123
+xors 4, 1, sb267, sb410, sb397 # 124
+xors 4, 1, sb499, sb395, sb422 # 125
+xors 4, 1, sb301, sb499, sb15 # 126
+xors 4, 1, sb271, sb15, sb395 # 127
+xors 4, 1, sb273, sb392, sb378 # 128
+xors 4, 1, sb300, sb273, sb482 # 129
+xors 4, 1, sb54, sb482, sb392 # 130
+xors 4, 1, sb461, sb389, sb75 # 131
+xors 4, 1, sb466, sb461, sb376 # 132
+xors 4, 1, sb418, sb376, sb389 # 133
+xors 4, 1, sb281, sb387, sb96 # 134
+xors 4, 1, sb294, sb281, sb481 # 135
+xors 4, 1, sb275, sb481, sb387 # 136
+xors 4, 1, sb55, sb382, sb372 # 137
+xors 4, 1, sb292, sb55, sb370 # 138
+xors 4, 1, sb462, sb370, sb382 # 139
+xors 4, 1, sb85, sb380, sb74 # 140
+xors 4, 1, sb290, sb85, sb480 # 141
+xors 4, 1, sb279, sb480, sb380 # 142
+xors 4, 1, sb463, sb377, sb411 # 143
+xors 4, 1, sb289, sb463, sb20 # 144
+xors 4, 1, sb2, sb20, sb377 # 145
+xors 4, 1, sb56, sb374, sb365 # 146
+xors 4, 1, sb287, sb56, sb73 # 147
+xors 4, 1, sb492, sb73, sb374 # 148
+xors 4, 1, sb93, sb371, sb72 # 149
+xors 4, 1, sb285, sb93, sb366 # 150
+xors 4, 1, sb57, sb366, sb371 # 151
+xors 4, 1, sb286, sb368, sb479 # 152
+xors 4, 1, sb284, sb286, sb427 # 153
+xors 4, 1, sb464, sb427, sb368 # 154
+xors 4, 1, sb58, sb364, sb503 # 155
+xors 4, 1, sb283, sb58, sb426 # 156
+xors 4, 1, sb291, sb426, sb364 # 157
+xors 4, 1, sb465, sb362, sb19 # 158
+xors 4, 1, sb282, sb465, sb421 # 159
+xors 4, 1, sb293, sb421, sb362 # 160
+xors 4, 1, sb500, sb360, sb478 # 161
+xors 4, 1, sb280, sb500, sb71 # 162
+xors 4, 1, sb507, sb71, sb360 # 163
+xors 4, 1, sb295, sb358, sb70 # 164
+xors 4, 1, sb277, sb295, sb352 # 165
+xors 4, 1, sb297, sb352, sb358 # 166
+xors 4, 1, sb59, sb356, sb351 # 167
+xors 4, 1, sb276, sb59, sb350 # 168
+xors 4, 1, sb298, sb350, sb356 # 169
+xors 4, 1, sb299, sb353, sb349 # 170
+xors 4, 1, sb274, sb299, sb14 # 171
+xors 4, 1, sb306, sb14, sb353 # 172
+xors 4, 1, sb467, sb347, sb69 # 173
+xors 4, 1, sb272, sb467, sb477 # 174
+xors 4, 1, sb60, sb477, sb347 # 175
+xors 4, 1, sb303, sb476, sb345 # 176
+xors 4, 1, sb270, sb303, sb502 # 177
+xors 4, 1, sb12, sb502, sb476 # 178
+xors 4, 1, sb305, sb343, sb98 # 179
+xors 4, 1, sb269, sb305, sb340 # 180
+xors 4, 1, sb419, sb340, sb343 # 181
+xors 4, 1, sb468, sb68, sb491 # 182
+xors 4, 1, sb268, sb468, sb67 # 183
+xors 4, 1, sb63, sb67, sb68 # 184
+xors 4, 1, sb309, sb339, sb474 # 185
+xors 4, 1, sb264, sb309, sb341 # 186
+xors 4, 1, sb317, sb341, sb339 # 187
+xors 4, 1, sb62, sb338, sb337 # 188
+xors 4, 1, sb159, sb62, sb334 # 189
+xors 4, 1, sb469, sb334, sb338 # 190
+xors 4, 1, sb94, sb66, sb336 # 191
+xors 4, 1, sb515, sb94, sb332 # 192
+xors 4, 1, sb314, sb332, sb66 # 193
+xors 4, 1, sb315, sb13, sb473 # 194
+xors 4, 1, sb323, sb315, sb331 # 195
+xors 4, 1, sb501, sb331, sb13 # 196
+xors 4, 1, sb470, sb327, sb335 # 197
+xors 4, 1, sb409, sb470, sb328 # 198
+xors 4, 1, sb100, sb328, sb327 # 199
+xors 4, 1, sb322, sb472, sb65 # 200
+xors 4, 1, sb119, sb322, sb326 # 201
+xors 4, 1, sb321, sb326, sb472 # 202
+xors 4, 1, sb471, sb319, sb330 # 203
+xors 4, 1, sb440, sb471, sb324 # 204
+xors 4, 1, sb64, sb324, sb319 # 205
+ands 256, 1, sb193, sb195, sb196, 1, sb99, sb39, sb198, 1, sb189, sb200, sb415, 1, sb89, sb447, sb202, 1, sb183, sb204, sb206, 1, sb180, sb41, sb8, 1, sb178, sb448, sb450, 1, sb442, sb83, sb210, 1, sb35, sb42, sb449, 1, sb181, sb214, sb508, 1, sb101, sb505, sb490, 1, sb88, sb43, sb497, 1, sb164, sb228, sb44, 1, sb506, sb451, sb222, 1, sb160, sb45, sb224, 1, sb158, sb453, sb9, 1, sb1, sb452, sb18, 1, sb6, sb229, sb416, 1, sb0, sb231, sb425, 1, sb437, sb82, sb237, 1, sb148, sb235, sb454, 1, sb29, sb47, sb498, 1, sb30, sb239, sb455, 1, sb142, sb243, sb48, 1, sb435, sb91, sb245, 1, sb87, sb247, sb246, 1, sb434, sb456, sb248, 1, sb134, sb457, sb250, 1, sb27, sb251, sb50, 1, sb130, sb253, sb10, 1, sb26, sb417, sb458, 1, sb408, sb261, sb259, 1, sb61, sb260, sb459, 1, sb40, sb52, sb92, 1, sb403, sb266, sb460, 1, sb399, sb53, sb267, 1, sb396, sb499, sb271, 1, sb393, sb273, sb54, 1, sb391, sb461, sb418, 1, sb388, sb281, sb275, 1, sb383, sb55, sb462, 1, sb381, sb85, sb279, 1, sb379, sb463, sb2, 1, sb375, sb56, sb492, 1, sb373, sb93, sb57, 1, sb369, sb286, sb464, 1, sb367, sb58, sb291, 1, sb363, sb465, sb293, 1, sb361, sb500, sb507, 1, sb359, sb295, sb297, 1, sb357, sb59, sb298, 1, sb354, sb299, sb306, 1, sb348, sb467, sb60, 1, sb346, sb303, sb12, 1, sb344, sb305, sb419, 1, sb342, sb468, sb63, 1, sb475, sb309, sb317, 1, sb84, sb62, sb469, 1, sb333, sb94, sb314, 1, sb329, sb315, sb501, 1, sb420, sb470, sb100, 1, sb325, sb322, sb321, 1, sb320, sb471, sb64, 1, sb311, sb216, sb216 # 206
+xors 4, 1, sb228, sb496, sb193 # 207
+xors 4, 1, sb227, sb192, sb99 # 208
+xors 4, 1, sb242, sb227, sb635 # 209
+xors 4, 1, sb226, sb188, sb189 # 210
+xors 4, 1, sb535, sb226, sb634 # 211
+xors 4, 1, sb632, sb37, sb89 # 212
+xors 4, 1, sb241, sb632, sb225 # 213
+xors 4, 1, sb223, sb7, sb183 # 214
+xors 4, 1, sb514, sb223, sb631 # 215
+xors 4, 1, sb630, sb443, sb180 # 216
+xors 4, 1, sb240, sb630, sb533 # 217
+xors 4, 1, sb628, sb177, sb178 # 218
+xors 4, 1, sb641, sb628, sb221 # 219
+xors 4, 1, sb219, sb176, sb442 # 220
+xors 4, 1, sb238, sb219, sb626 # 221
+xors 4, 1, sb625, sb175, sb35 # 222
+xors 4, 1, sb534, sb625, sb218 # 223
+xors 4, 1, sb623, sb441, sb181 # 224
+xors 4, 1, sb237, sb623, sb217 # 225
+xors 4, 1, sb622, sb168, sb101 # 226
+xors 4, 1, sb127, sb622, sb215 # 227
+xors 4, 1, sb213, sb165, sb88 # 228
+xors 4, 1, sb643, sb213, sb621 # 229
+xors 4, 1, sb211, sb167, sb164 # 230
+xors 4, 1, sb633, sb211, sb212 # 231
+xors 4, 1, sb209, sb439, sb506 # 232
+xors 4, 1, sb236, sb209, sb617 # 233
+xors 4, 1, sb208, sb495, sb160 # 234
+xors 4, 1, sb432, sb208, sb616 # 235
+xors 4, 1, sb614, sb157, sb158 # 236
+xors 4, 1, sb642, sb614, sb615 # 237
+xors 4, 1, sb612, sb438, sb1 # 238
+xors 4, 1, sb125, sb612, sb207 # 239
+xors 4, 1, sb204, sb407, sb6 # 240
+xors 4, 1, sb234, sb204, sb205 # 241
+xors 4, 1, sb610, sb413, sb0 # 242
+xors 4, 1, sb532, sb610, sb203 # 243
+xors 4, 1, sb201, sb155, sb437 # 244
+xors 4, 1, sb640, sb201, sb609 # 245
+xors 4, 1, sb606, sb147, sb148 # 246
+xors 4, 1, sb513, sb606, sb608 # 247
+xors 4, 1, sb197, sb436, sb29 # 248
+xors 4, 1, sb233, sb197, sb199 # 249
+xors 4, 1, sb446, sb494, sb30 # 250
+xors 4, 1, sb124, sb446, sb604 # 251
+xors 4, 1, sb194, sb28, sb142 # 252
+xors 4, 1, sb232, sb194, sb602 # 253
+xors 4, 1, sb38, sb143, sb435 # 254
+xors 4, 1, sb123, sb38, sb600 # 255
+xors 4, 1, sb445, sb144, sb87 # 256
+xors 4, 1, sb638, sb445, sb191 # 257
+xors 4, 1, sb597, sb136, sb434 # 258
+xors 4, 1, sb618, sb597, sb190 # 259
+xors 4, 1, sb187, sb133, sb134 # 260
+xors 4, 1, sb230, sb187, sb526 # 261
+xors 4, 1, sb593, sb5, sb27 # 262
+xors 4, 1, sb531, sb593, sb594 # 263
+xors 4, 1, sb444, sb129, sb130 # 264
+xors 4, 1, sb376, sb444, sb186 # 265
+xors 4, 1, sb45, sb433, sb26 # 266
+xors 4, 1, sb184, sb120, sb408 # 267
+xors 4, 1, sb430, sb11, sb61 # 268
+xors 4, 1, sb36, sb405, sb40 # 269
+xors 4, 1, sb521, sb401, sb403 # 270
+xors 4, 1, sb355, sb397, sb399 # 271
+xors 4, 1, sb418, sb395, sb396 # 272
+xors 4, 1, sb581, sb392, sb393 # 273
+xors 4, 1, sb511, sb389, sb391 # 274
+xors 4, 1, sb95, sb387, sb388 # 275
+xors 4, 1, sb281, sb382, sb383 # 276
+xors 4, 1, sb144, sb380, sb381 # 277
+xors 4, 1, sb577, sb377, sb379 # 278
+xors 4, 1, sb112, sb374, sb375 # 279
+xors 4, 1, sb336, sb371, sb373 # 280
+xors 4, 1, sb92, sb368, sb369 # 281
+xors 4, 1, sb87, sb364, sb367 # 282
+xors 4, 1, sb580, sb362, sb363 # 283
+xors 4, 1, sb166, sb360, sb361 # 284
+xors 4, 1, sb110, sb358, sb359 # 285
+xors 4, 1, sb330, sb356, sb357 # 286
+xors 4, 1, sb261, sb353, sb354 # 287
+xors 4, 1, sb408, sb347, sb348 # 288
+xors 4, 1, sb170, sb476, sb346 # 289
+xors 4, 1, sb529, sb343, sb344 # 290
+xors 4, 1, sb567, sb68, sb342 # 291
+xors 4, 1, sb546, sb339, sb475 # 292
+xors 4, 1, sb324, sb338, sb84 # 293
+xors 4, 1, sb10, sb66, sb333 # 294
+xors 4, 1, sb120, sb13, sb329 # 295
+xors 4, 1, sb33, sb327, sb420 # 296
+xors 4, 1, sb489, sb472, sb325 # 297
+xors 4, 1, sb90, sb319, sb320 # 298
+xors 4, 1, sb312, sb316, sb318 # 299
+xors 4, 1, sb453, sb312, sb313 # 300
+xors 4, 1, sb308, sb216, sb311 # 301
+xors 4, 1, sb244, sb184, sb310 # 302
+xors 4, 1, sb174, sb244, sb308 # 303
+xors 4, 1, sb49, sb308, sb184 # 304
+xors 4, 1, sb547, sb430, sb307 # 305
+xors 4, 1, sb70, sb36, sb304 # 306
+xors 4, 1, sb548, sb521, sb302 # 307
+xors 4, 1, sb396, sb355, sb301 # 308
+xors 4, 1, sb306, sb418, sb300 # 309
+xors 4, 1, sb249, sb36, sb304 # 310
+nots 1, sb296, sb249 # 311
+nots 1, sb252, sb36 # 312
+xors 4, 1, sb143, sb521, sb302 # 313
+xors 4, 1, sb486, sb355, sb301 # 314
+xors 4, 1, sb303, sb418, sb300 # 315
+xors 4, 1, sb400, sb296, sb70 # 316
+xors 4, 1, sb592, sb581, sb466 # 317
+xors 4, 1, sb145, sb511, sb294 # 318
+xors 4, 1, sb487, sb95, sb292 # 319
+xors 4, 1, sb12, sb281, sb290 # 320
+xors 4, 1, sb454, sb144, sb289 # 321
+xors 4, 1, sb254, sb581, sb466 # 322
+nots 1, sb288, sb254 # 323
+nots 1, sb255, sb581 # 324
+xors 4, 1, sb553, sb511, sb294 # 325
+xors 4, 1, sb16, sb95, sb292 # 326
+xors 4, 1, sb63, sb281, sb290 # 327
+xors 4, 1, sb498, sb144, sb289 # 328
+xors 4, 1, sb381, sb288, sb592 # 329
+xors 4, 1, sb126, sb577, sb287 # 330
+xors 4, 1, sb556, sb112, sb285 # 331
+xors 4, 1, sb488, sb336, sb284 # 332
+xors 4, 1, sb317, sb92, sb283 # 333
+xors 4, 1, sb455, sb87, sb282 # 334
+xors 4, 1, sb392, sb580, sb280 # 335
+xors 4, 1, sb51, sb577, sb287 # 336
+nots 1, sb278, sb51 # 337
+nots 1, sb256, sb577 # 338
+xors 4, 1, sb150, sb112, sb285 # 339
+xors 4, 1, sb450, sb336, sb284 # 340
+xors 4, 1, sb62, sb92, sb283 # 341
+xors 4, 1, sb243, sb87, sb282 # 342
+xors 4, 1, sb395, sb580, sb280 # 343
+xors 4, 1, sb561, sb278, sb126 # 344
+xors 4, 1, sb22, sb166, sb277 # 345
+xors 4, 1, sb558, sb110, sb276 # 346
+xors 4, 1, sb509, sb330, sb274 # 347
+xors 4, 1, sb94, sb261, sb272 # 348
+xors 4, 1, sb245, sb408, sb270 # 349
+xors 4, 1, sb399, sb170, sb269 # 350
+xors 4, 1, sb566, sb529, sb268 # 351
+xors 4, 1, sb257, sb166, sb277 # 352
+nots 1, sb265, sb257 # 353
+nots 1, sb258, sb166 # 354
+xors 4, 1, sb152, sb110, sb276 # 355
+xors 4, 1, sb537, sb330, sb274 # 356
+xors 4, 1, sb501, sb261, sb272 # 357
+xors 4, 1, sb247, sb408, sb270 # 358
+xors 4, 1, sb403, sb170, sb269 # 359
+xors 4, 1, sb32, sb529, sb268 # 360
+xors 4, 1, sb527, sb265, sb22 # 361
+xors 4, 1, sb282, sb567, sb264 # 362
+xors 4, 1, sb560, sb546, sb159 # 363
+xors 4, 1, sb539, sb324, sb515 # 364
+xors 4, 1, sb100, sb10, sb323 # 365
+xors 4, 1, sb457, sb120, sb409 # 366
+xors 4, 1, sb30, sb33, sb119 # 367
+xors 4, 1, sb161, sb489, sb440 # 368
+xors 4, 1, sb541, sb90, sb453 # 369
+xors 4, 1, sb262, sb567, sb264 # 370
+nots 1, sb423, sb262 # 371
+nots 1, sb263, sb567 # 372
+ands 220, 1, sb482, sb444, sb186, 1, sb122, sb593, sb594, 1, sb619, sb187, sb526, 1, sb611, sb597, sb190, 1, sb530, sb445, sb191, 1, sb428, sb38, sb600, 1, sb620, sb194, sb602, 1, sb24, sb446, sb604, 1, sb106, sb197, sb199, 1, sb21, sb606, sb608, 1, sb624, sb201, sb609, 1, sb528, sb610, sb203, 1, sb627, sb204, sb205, 1, sb431, sb612, sb207, 1, sb629, sb614, sb615, 1, sb512, sb208, sb616, 1, sb25, sb209, sb617, 1, sb596, sb211, sb212, 1, sb644, sb213, sb621, 1, sb525, sb622, sb215, 1, sb637, sb623, sb217, 1, sb598, sb625, sb218, 1, sb639, sb219, sb626, 1, sb590, sb628, sb221, 1, sb128, sb630, sb533, 1, sb117, sb223, sb631, 1, sb107, sb632, sb225, 1, sb493, sb226, sb634, 1, sb131, sb227, sb635, 1, sb139, sb228, sb636, 1, sb132, sb531, sb230, 1, sb75, sb618, sb638, 1, sb540, sb123, sb232, 1, sb15, sb124, sb233, 1, sb135, sb513, sb640, 1, sb483, sb532, sb234, 1, sb543, sb125, sb642, 1, sb384, sb432, sb236, 1, sb544, sb633, sb643, 1, sb386, sb127, sb237, 1, sb137, sb534, sb238, 1, sb484, sb641, sb240, 1, sb138, sb514, sb241, 1, sb545, sb535, sb242, 1, sb185, sb244, sb49, 1, sb182, sb70, sb36, 1, sb588, sb249, sb252, 1, sb584, sb592, sb581, 1, sb414, sb254, sb255, 1, sb172, sb126, sb577, 1, sb171, sb51, sb256, 1, sb522, sb22, sb166, 1, sb574, sb257, sb258, 1, sb163, sb282, sb567, 1, sb568, sb262, sb263 # 373
+xors 4, 1, sb591, sb184, sb185 # 374
+xors 4, 1, sb156, sb547, sb591 # 375
+xors 4, 1, sb140, sb591, sb430 # 376
+xors 4, 1, sb589, sb36, sb182 # 377
+xors 4, 1, sb477, sb548, sb589 # 378
+xors 4, 1, sb141, sb589, sb521 # 379
+xors 4, 1, sb179, sb36, sb588 # 380
+xors 4, 1, sb586, sb143, sb179 # 381
+xors 4, 1, sb80, sb586, sb477 # 382
+xors 4, 1, sb551, sb179, sb521 # 383
+xors 4, 1, sb582, sb581, sb584 # 384
+xors 4, 1, sb591, sb145, sb582 # 385
+xors 4, 1, sb552, sb582, sb511 # 386
+xors 4, 1, sb579, sb581, sb414 # 387
+xors 4, 1, sb173, sb553, sb579 # 388
+xors 4, 1, sb382, sb173, sb591 # 389
+xors 4, 1, sb146, sb579, sb511 # 390
+xors 4, 1, sb34, sb577, sb172 # 391
+xors 4, 1, sb412, sb556, sb34 # 392
+xors 4, 1, sb149, sb34, sb112 # 393
+xors 4, 1, sb576, sb577, sb171 # 394
+xors 4, 1, sb169, sb150, sb576 # 395
+xors 4, 1, sb154, sb169, sb412 # 396
+xors 4, 1, sb151, sb576, sb112 # 397
+xors 4, 1, sb575, sb166, sb522 # 398
+xors 4, 1, sb516, sb558, sb575 # 399
+xors 4, 1, sb559, sb575, sb110 # 400
+xors 4, 1, sb571, sb166, sb574 # 401
+xors 4, 1, sb572, sb152, sb571 # 402
+xors 4, 1, sb4, sb572, sb516 # 403
+xors 4, 1, sb153, sb571, sb110 # 404
+xors 4, 1, sb162, sb567, sb163 # 405
+xors 4, 1, sb278, sb560, sb162 # 406
+xors 4, 1, sb562, sb162, sb546 # 407
+xors 4, 1, sb564, sb567, sb568 # 408
+xors 4, 1, sb31, sb546, sb159 # 409
+xors 4, 1, sb3, sb31, sb564 # 410
+xors 4, 1, sb563, sb564, sb546 # 411
+ands 132, 1, sb613, sb531, sb619, 1, sb121, sb618, sb530, 1, sb607, sb123, sb620, 1, sb605, sb124, sb106, 1, sb603, sb513, sb624, 1, sb601, sb532, sb627, 1, sb599, sb125, sb629, 1, sb105, sb432, sb25, 1, sb595, sb633, sb644, 1, sb118, sb127, sb637, 1, sb86, sb534, sb639, 1, sb524, sb641, sb128, 1, sb587, sb514, sb107, 1, sb585, sb535, sb131, 1, sb58, sb376, sb132, 1, sb390, sb75, sb540, 1, sb93, sb15, sb135, 1, sb394, sb483, sb543, 1, sb297, sb384, sb544, 1, sb504, sb386, sb137, 1, sb78, sb484, sb138, 1, sb116, sb545, sb139, 1, sb23, sb547, sb140, 1, sb115, sb548, sb141, 1, sb583, sb143, sb551, 1, sb104, sb145, sb552, 1, sb113, sb553, sb146, 1, sb569, sb556, sb149, 1, sb519, sb150, sb151, 1, sb557, sb558, sb559, 1, sb555, sb152, sb153, 1, sb550, sb560, sb562, 1, sb103, sb31, sb563 # 412
+xors 4, 1, sb378, sb613, sb122 # 413
+xors 4, 1, sb74, sb121, sb611 # 414
+xors 4, 1, sb422, sb607, sb428 # 415
+xors 4, 1, sb372, sb605, sb24 # 416
+xors 4, 1, sb410, sb603, sb21 # 417
+xors 4, 1, sb503, sb601, sb528 # 418
+xors 4, 1, sb76, sb599, sb431 # 419
+xors 4, 1, sb427, sb105, sb512 # 420
+xors 4, 1, sb385, sb595, sb596 # 421
+xors 4, 1, sb73, sb118, sb525 # 422
+xors 4, 1, sb77, sb86, sb598 # 423
+xors 4, 1, sb479, sb524, sb590 # 424
+xors 4, 1, sb485, sb587, sb117 # 425
+xors 4, 1, sb523, sb585, sb493 # 426
+xors 4, 1, sb398, sb116, sb523 # 427
+xors 4, 1, sb235, sb430, sb23 # 428
+xors 4, 1, sb578, sb521, sb115 # 429
+xors 4, 1, sb69, sb396, sb578 # 430
+xors 4, 1, sb97, sb578, sb355 # 431
+xors 4, 1, sb114, sb521, sb583 # 432
+xors 4, 1, sb573, sb486, sb114 # 433
+xors 4, 1, sb402, sb573, sb69 # 434
+xors 4, 1, sb79, sb114, sb355 # 435
+xors 4, 1, sb570, sb511, sb104 # 436
+xors 4, 1, sb589, sb487, sb570 # 437
+xors 4, 1, sb404, sb570, sb95 # 438
+xors 4, 1, sb102, sb511, sb113 # 439
+xors 4, 1, sb520, sb16, sb102 # 440
+xors 4, 1, sb383, sb520, sb589 # 441
+xors 4, 1, sb81, sb102, sb95 # 442
+xors 4, 1, sb565, sb112, sb569 # 443
+xors 4, 1, sb432, sb488, sb565 # 444
+xors 4, 1, sb495, sb565, sb336 # 445
+xors 4, 1, sb518, sb112, sb519 # 446
+xors 4, 1, sb111, sb450, sb518 # 447
+xors 4, 1, sb155, sb111, sb432 # 448
+xors 4, 1, sb510, sb518, sb336 # 449
+xors 4, 1, sb429, sb110, sb557 # 450
+xors 4, 1, sb109, sb509, sb429 # 451
+xors 4, 1, sb536, sb429, sb330 # 452
+xors 4, 1, sb554, sb110, sb555 # 453
+xors 4, 1, sb517, sb537, sb554 # 454
+xors 4, 1, sb431, sb517, sb109 # 455
+xors 4, 1, sb538, sb554, sb330 # 456
+xors 4, 1, sb549, sb546, sb550 # 457
+xors 4, 1, sb276, sb539, sb549 # 458
+xors 4, 1, sb424, sb549, sb324 # 459
+xors 4, 1, sb108, sb546, sb103 # 460
+xors 4, 1, sb17, sb324, sb515 # 461
+xors 4, 1, sb406, sb17, sb108 # 462
+xors 4, 1, sb542, sb108, sb324 # 463
+ands 96, 1, sb96, sb376, sb378, 1, sb481, sb75, sb422, 1, sb370, sb15, sb410, 1, sb480, sb483, sb76, 1, sb365, sb384, sb385, 1, sb411, sb386, sb77, 1, sb72, sb484, sb485, 1, sb9, sb58, sb390, 1, sb298, sb93, sb394, 1, sb299, sb297, sb504, 1, sb20, sb78, sb398, 1, sb19, sb396, sb97, 1, sb478, sb486, sb79, 1, sb351, sb235, sb400, 1, sb350, sb235, sb80, 1, sb349, sb235, sb402, 1, sb352, sb487, sb404, 1, sb502, sb16, sb81, 1, sb491, sb488, sb495, 1, sb474, sb450, sb510, 1, sb341, sb509, sb536, 1, sb331, sb537, sb538, 1, sb328, sb539, sb424, 1, sb65, sb17, sb542 # 464
+xors 4, 1, sb291, sb96, sb482 # 465
+xors 4, 1, sb465, sb481, sb74 # 466
+xors 4, 1, sb293, sb370, sb372 # 467
+xors 4, 1, sb295, sb480, sb503 # 468
+xors 4, 1, sb57, sb365, sb427 # 469
+xors 4, 1, sb59, sb411, sb73 # 470
+xors 4, 1, sb366, sb72, sb479 # 471
+xors 4, 1, sb467, sb20, sb366 # 472
+xors 4, 1, sb426, sb355, sb19 # 473
+xors 4, 1, sb85, sb306, sb426 # 474
+xors 4, 1, sb60, sb426, sb418 # 475
+xors 4, 1, sb421, sb355, sb478 # 476
+xors 4, 1, sb71, sb303, sb421 # 477
+xors 4, 1, sb305, sb71, sb85 # 478
+xors 4, 1, sb419, sb421, sb418 # 479
+xors 4, 1, sb532, sb351, sb70 # 480
+xors 4, 1, sb528, sb350, sb477 # 481
+xors 4, 1, sb14, sb349, sb69 # 482
+xors 4, 1, sb345, sb95, sb352 # 483
+xors 4, 1, sb181, sb12, sb345 # 484
+xors 4, 1, sb468, sb345, sb281 # 485
+xors 4, 1, sb340, sb95, sb502 # 486
+xors 4, 1, sb98, sb63, sb340 # 487
+xors 4, 1, sb387, sb98, sb181 # 488
+xors 4, 1, sb309, sb340, sb281 # 489
+xors 4, 1, sb67, sb336, sb491 # 490
+xors 4, 1, sb627, sb317, sb67 # 491
+xors 4, 1, sb469, sb67, sb92 # 492
+xors 4, 1, sb334, sb336, sb474 # 493
+xors 4, 1, sb337, sb62, sb334 # 494
+xors 4, 1, sb562, sb337, sb627 # 495
+xors 4, 1, sb314, sb334, sb92 # 496
+xors 4, 1, sb332, sb330, sb341 # 497
+xors 4, 1, sb103, sb94, sb332 # 498
+xors 4, 1, sb315, sb332, sb261 # 499
+xors 4, 1, sb473, sb330, sb331 # 500
+xors 4, 1, sb335, sb501, sb473 # 501
+xors 4, 1, sb21, sb335, sb103 # 502
+xors 4, 1, sb470, sb473, sb261 # 503
+xors 4, 1, sb326, sb324, sb328 # 504
+xors 4, 1, sb272, sb100, sb326 # 505
+xors 4, 1, sb64, sb326, sb10 # 506
+xors 4, 1, sb322, sb324, sb65 # 507
+xors 4, 1, sb321, sb10, sb323 # 508
+xors 4, 1, sb80, sb321, sb322 # 509
+xors 4, 1, sb471, sb322, sb10 # 510
+ands 64, 1, sb507, sb58, sb465, 1, sb464, sb93, sb295, 1, sb500, sb297, sb59, 1, sb18, sb9, sb298, 1, sb492, sb299, sb467, 1, sb56, sb306, sb60, 1, sb2, sb303, sb419, 1, sb462, sb235, sb305, 1, sb55, sb12, sb468, 1, sb463, sb63, sb309, 1, sb271, sb317, sb469, 1, sb499, sb62, sb314, 1, sb460, sb94, sb315, 1, sb52, sb501, sb470, 1, sb459, sb100, sb64, 1, sb417, sb321, sb471 # 511
+xors 4, 1, sb425, sb507, sb291 # 512
+xors 4, 1, sb416, sb464, sb293 # 513
+xors 4, 1, sb286, sb500, sb57 # 514
+xors 4, 1, sb82, sb492, sb286 # 515
+xors 4, 1, sb148, sb418, sb56 # 516
+xors 4, 1, sb279, sb418, sb2 # 517
+xors 4, 1, sb47, sb279, sb148 # 518
+xors 4, 1, sb531, sb462, sb85 # 519
+xors 4, 1, sb275, sb281, sb55 # 520
+xors 4, 1, sb179, sb454, sb275 # 521
+xors 4, 1, sb239, sb275, sb144 # 522
+xors 4, 1, sb54, sb281, sb463 # 523
+xors 4, 1, sb461, sb498, sb54 # 524
+xors 4, 1, sb388, sb461, sb179 # 525
+xors 4, 1, sb91, sb54, sb144 # 526
+xors 4, 1, sb273, sb92, sb271 # 527
+xors 4, 1, sb124, sb455, sb273 # 528
+xors 4, 1, sb48, sb273, sb87 # 529
+xors 4, 1, sb267, sb92, sb499 # 530
+xors 4, 1, sb53, sb243, sb267 # 531
+xors 4, 1, sb563, sb53, sb124 # 532
+xors 4, 1, sb456, sb267, sb87 # 533
+xors 4, 1, sb266, sb261, sb460 # 534
+xors 4, 1, sb510, sb245, sb266 # 535
+xors 4, 1, sb246, sb266, sb408 # 536
+xors 4, 1, sb259, sb261, sb52 # 537
+xors 4, 1, sb260, sb247, sb259 # 538
+xors 4, 1, sb428, sb260, sb510 # 539
+xors 4, 1, sb248, sb259, sb408 # 540
+xors 4, 1, sb458, sb10, sb459 # 541
+xors 4, 1, sb269, sb457, sb458 # 542
+xors 4, 1, sb250, sb458, sb120 # 543
+xors 4, 1, sb253, sb10, sb417 # 544
+xors 4, 1, sb251, sb120, sb409 # 545
+xors 4, 1, sb402, sb251, sb253 # 546
+xors 4, 1, sb50, sb253, sb120 # 547
+ands 44, 1, sb229, sb9, sb416, 1, sb231, sb18, sb82, 1, sb147, sb235, sb47, 1, sb29, sb454, sb239, 1, sb436, sb498, sb91, 1, sb142, sb455, sb48, 1, sb435, sb243, sb456, 1, sb134, sb245, sb246, 1, sb27, sb247, sb248, 1, sb5, sb457, sb250, 1, sb433, sb251, sb50 # 548
+xors 4, 1, sb452, sb229, sb425 # 549
+xors 4, 1, sb224, sb231, sb452 # 550
+xors 4, 1, sb44, sb224, sb45 # 551
+xors 4, 1, sb222, sb44, sb46 # 552
+xors 4, 1, sb451, sb220, sb222 # 553
+reveal 3, 1, cb20, sb451 # 554
+convcbitvec 1, ci3, cb20 # 555
+convint c2, ci3 # 556
+addm s3, s7, c2 # 557
+convint c5, ci3 # 558
+mulm s8, s6, c5 # 559
+subs s5, s3, s8 # 560
+movs s4, s5 # 561
+movs s2, s4 # 562
+mulsi s1, s2, 2 # 563
+subsfi s9, s1, 1 # 564
+muls 4, 1, s1, s9, s14 # 565
+split 95, 3, s1, sb43, sb497, sb287, sb490, sb505, sb283, sb508, sb214, sb274, sb449, sb42, sb264, sb210, sb83, sb258, sb448, sb217, sb255, sb8, sb41, sb249, sb202, sb206, sb242, sb447, sb415, sb238, sb198, sb200, sb236, sb196, sb197, sb233, sb39, sb195, sb230, sb193, sb496, sb635, sb99, sb191, sb226, sb192, sb189, sb631, sb188, sb89, sb630, sb183, sb37, sb219, sb180, sb7, sb624, sb178, sb443, sb622, sb442, sb177, sb212, sb176, sb35, sb616, sb441, sb175, sb615, sb101, sb168, sb205, sb88, sb166, sb610, sb165, sb164, sb608, sb439, sb167, sb604, sb506, sb160, sb194, sb157, sb158, sb598, sb1, sb438, sb597, sb6, sb407, sb594, sb413, sb0, sb437 # 566
+xors 4, 1, sb289, sb287, sb497 # 567
+xors 4, 1, sb389, sb289, sb43 # 568
+xors 4, 1, sb290, sb43, sb287 # 569
+xors 4, 1, sb292, sb283, sb505 # 570
+xors 4, 1, sb285, sb292, sb490 # 571
+xors 4, 1, sb294, sb490, sb283 # 572
+xors 4, 1, sb466, sb274, sb214 # 573
+xors 4, 1, sb280, sb466, sb508 # 574
+xors 4, 1, sb296, sb508, sb274 # 575
+xors 4, 1, sb300, sb264, sb42 # 576
+xors 4, 1, sb270, sb300, sb449 # 577
+xors 4, 1, sb301, sb449, sb264 # 578
+xors 4, 1, sb302, sb258, sb83 # 579
+xors 4, 1, sb263, sb302, sb210 # 580
+xors 4, 1, sb304, sb210, sb258 # 581
+xors 4, 1, sb307, sb255, sb217 # 582
+xors 4, 1, sb257, sb307, sb448 # 583
+xors 4, 1, sb308, sb448, sb255 # 584
+xors 4, 1, sb310, sb249, sb41 # 585
+xors 4, 1, sb254, sb310, sb8 # 586
+xors 4, 1, sb311, sb8, sb249 # 587
+xors 4, 1, sb312, sb242, sb206 # 588
+xors 4, 1, sb49, sb312, sb202 # 589
+xors 4, 1, sb313, sb202, sb242 # 590
+xors 4, 1, sb316, sb238, sb415 # 591
+xors 4, 1, sb241, sb316, sb447 # 592
+xors 4, 1, sb318, sb447, sb238 # 593
+xors 4, 1, sb319, sb236, sb200 # 594
+xors 4, 1, sb237, sb319, sb198 # 595
+xors 4, 1, sb320, sb198, sb236 # 596
+xors 4, 1, sb472, sb233, sb197 # 597
+xors 4, 1, sb642, sb472, sb196 # 598
+xors 4, 1, sb325, sb196, sb233 # 599
+xors 4, 1, sb327, sb230, sb195 # 600
+xors 4, 1, sb232, sb327, sb39 # 601
+xors 4, 1, sb420, sb39, sb230 # 602
+xors 4, 1, sb13, sb635, sb496 # 603
+xors 4, 1, sb636, sb13, sb193 # 604
+xors 4, 1, sb329, sb193, sb635 # 605
+xors 4, 1, sb66, sb226, sb191 # 606
+xors 4, 1, sb634, sb66, sb99 # 607
+xors 4, 1, sb333, sb99, sb226 # 608
+xors 4, 1, sb338, sb631, sb189 # 609
+xors 4, 1, sb632, sb338, sb192 # 610
+xors 4, 1, sb84, sb192, sb631 # 611
+xors 4, 1, sb339, sb630, sb89 # 612
+xors 4, 1, sb533, sb339, sb188 # 613
+xors 4, 1, sb475, sb188, sb630 # 614
+xors 4, 1, sb68, sb219, sb37 # 615
+xors 4, 1, sb221, sb68, sb183 # 616
+xors 4, 1, sb342, sb183, sb219 # 617
+xors 4, 1, sb343, sb624, sb7 # 618
+xors 4, 1, sb625, sb343, sb180 # 619
+xors 4, 1, sb344, sb180, sb624 # 620
+xors 4, 1, sb476, sb622, sb443 # 621
+xors 4, 1, sb623, sb476, sb178 # 622
+xors 4, 1, sb346, sb178, sb622 # 623
+xors 4, 1, sb347, sb212, sb177 # 624
+xors 4, 1, sb621, sb347, sb442 # 625
+xors 4, 1, sb348, sb442, sb212 # 626
+xors 4, 1, sb353, sb616, sb35 # 627
+xors 4, 1, sb211, sb353, sb176 # 628
+xors 4, 1, sb354, sb176, sb616 # 629
+xors 4, 1, sb356, sb615, sb175 # 630
+xors 4, 1, sb209, sb356, sb441 # 631
+xors 4, 1, sb357, sb441, sb615 # 632
+xors 4, 1, sb358, sb205, sb168 # 633
+xors 4, 1, sb207, sb358, sb101 # 634
+xors 4, 1, sb359, sb101, sb205 # 635
+xors 4, 1, sb360, sb610, sb166 # 636
+xors 4, 1, sb612, sb360, sb88 # 637
+xors 4, 1, sb361, sb88, sb610 # 638
+xors 4, 1, sb362, sb608, sb164 # 639
+xors 4, 1, sb609, sb362, sb165 # 640
+xors 4, 1, sb363, sb165, sb608 # 641
+xors 4, 1, sb364, sb604, sb167 # 642
+xors 4, 1, sb199, sb364, sb439 # 643
+xors 4, 1, sb367, sb439, sb604 # 644
+xors 4, 1, sb368, sb194, sb160 # 645
+xors 4, 1, sb602, sb368, sb506 # 646
+xors 4, 1, sb369, sb506, sb194 # 647
+xors 4, 1, sb371, sb598, sb158 # 648
+xors 4, 1, sb600, sb371, sb157 # 649
+xors 4, 1, sb373, sb157, sb598 # 650
+xors 4, 1, sb374, sb597, sb438 # 651
+xors 4, 1, sb190, sb374, sb1 # 652
+xors 4, 1, sb375, sb1, sb597 # 653
+xors 4, 1, sb377, sb594, sb407 # 654
+xors 4, 1, sb526, sb377, sb6 # 655
+xors 4, 1, sb379, sb6, sb594 # 656
+xors 4, 1, sb31, sb437, sb0 # 657
+xors 4, 1, sb37, sb31, sb413 # 658
+xors 4, 1, sb380, sb147, sb148 # 659
+xors 4, 1, sb175, sb144, sb29 # 660
+xors 4, 1, sb494, sb144, sb436 # 661
+xors 4, 1, sb391, sb494, sb175 # 662
+xors 4, 1, sb28, sb87, sb142 # 663
+xors 4, 1, sb106, sb392, sb28 # 664
+xors 4, 1, sb393, sb28, sb580 # 665
+xors 4, 1, sb136, sb87, sb435 # 666
+xors 4, 1, sb434, sb395, sb136 # 667
+xors 4, 1, sb564, sb434, sb106 # 668
+xors 4, 1, sb397, sb136, sb580 # 669
+xors 4, 1, sb133, sb408, sb134 # 670
+xors 4, 1, sb424, sb399, sb133 # 671
+xors 4, 1, sb401, sb133, sb170 # 672
+xors 4, 1, sb129, sb408, sb27 # 673
+xors 4, 1, sb130, sb403, sb129 # 674
+xors 4, 1, sb121, sb130, sb424 # 675
+xors 4, 1, sb405, sb129, sb170 # 676
+xors 4, 1, sb26, sb120, sb5 # 677
+xors 4, 1, sb265, sb30, sb26 # 678
+xors 4, 1, sb40, sb26, sb33 # 679
+xors 4, 1, sb108, sb120, sb433 # 680
+xors 4, 1, sb11, sb33, sb119 # 681
+xors 4, 1, sb487, sb11, sb108 # 682
+xors 4, 1, sb61, sb108, sb33 # 683
+ands 172, 1, sb288, sb289, sb290, 1, sb284, sb292, sb294, 1, sb277, sb466, sb296, 1, sb268, sb300, sb301, 1, sb262, sb302, sb304, 1, sb51, sb307, sb308, 1, sb252, sb310, sb311, 1, sb244, sb312, sb313, 1, sb240, sb316, sb318, 1, sb643, sb319, sb320, 1, sb640, sb472, sb325, 1, sb638, sb327, sb420, 1, sb228, sb13, sb329, 1, sb227, sb66, sb333, 1, sb225, sb338, sb84, 1, sb223, sb339, sb475, 1, sb626, sb68, sb342, 1, sb218, sb343, sb344, 1, sb215, sb476, sb346, 1, sb213, sb347, sb348, 1, sb617, sb353, sb354, 1, sb208, sb356, sb357, 1, sb614, sb358, sb359, 1, sb203, sb360, sb361, 1, sb201, sb362, sb363, 1, sb606, sb364, sb367, 1, sb446, sb368, sb369, 1, sb38, sb371, sb373, 1, sb445, sb374, sb375, 1, sb187, sb377, sb379, 1, sb185, sb389, sb389, 1, sb184, sb380, sb381, 1, sb182, sb380, sb382, 1, sb36, sb380, sb383, 1, sb586, sb380, sb387, 1, sb584, sb380, sb388, 1, sb414, sb380, sb391, 1, sb581, sb392, sb393, 1, sb173, sb395, sb397, 1, sb172, sb399, sb401, 1, sb578, sb403, sb405, 1, sb522, sb30, sb40, 1, sb574, sb11, sb61 # 684
+xors 4, 1, sb145, sb287, sb288 # 685
+xors 4, 1, sb553, sb145, sb285 # 686
+xors 4, 1, sb582, sb283, sb284 # 687
+xors 4, 1, sb588, sb582, sb280 # 688
+xors 4, 1, sb20, sb274, sb277 # 689
+xors 4, 1, sb370, sb20, sb270 # 690
+xors 4, 1, sb63, sb264, sb268 # 691
+xors 4, 1, sb64, sb63, sb263 # 692
+xors 4, 1, sb140, sb258, sb262 # 693
+xors 4, 1, sb266, sb140, sb257 # 694
+xors 4, 1, sb556, sb140, sb257 # 695
+nots 1, sb256, sb556 # 696
+xors 4, 1, sb273, sb256, sb266 # 697
+nots 1, sb149, sb140 # 698
+xors 4, 1, sb577, sb255, sb51 # 699
+xors 4, 1, sb493, sb577, sb254 # 700
+xors 4, 1, sb117, sb577, sb254 # 701
+xors 4, 1, sb72, sb249, sb252 # 702
+xors 4, 1, sb372, sb72, sb49 # 703
+xors 4, 1, sb482, sb72, sb49 # 704
+xors 4, 1, sb317, sb242, sb244 # 705
+xors 4, 1, sb321, sb317, sb241 # 706
+xors 4, 1, sb323, sb317, sb241 # 707
+xors 4, 1, sb460, sb238, sb240 # 708
+xors 4, 1, sb271, sb460, sb237 # 709
+xors 4, 1, sb54, sb460, sb237 # 710
+xors 4, 1, sb544, sb236, sb643 # 711
+xors 4, 1, sb495, sb544, sb642 # 712
+xors 4, 1, sb150, sb544, sb642 # 713
+nots 1, sb234, sb150 # 714
+xors 4, 1, sb171, sb234, sb495 # 715
+nots 1, sb151, sb544 # 716
+xors 4, 1, sb570, sb233, sb640 # 717
+xors 4, 1, sb590, sb570, sb232 # 718
+xors 4, 1, sb595, sb570, sb232 # 719
+xors 4, 1, sb426, sb230, sb638 # 720
+xors 4, 1, sb378, sb426, sb636 # 721
+xors 4, 1, sb422, sb426, sb636 # 722
+xors 4, 1, sb61, sb635, sb228 # 723
+xors 4, 1, sb65, sb61, sb634 # 724
+xors 4, 1, sb328, sb61, sb634 # 725
+xors 4, 1, sb250, sb226, sb227 # 726
+xors 4, 1, sb11, sb250, sb632 # 727
+xors 4, 1, sb281, sb250, sb632 # 728
+xors 4, 1, sb450, sb631, sb225 # 729
+xors 4, 1, sb451, sb450, sb533 # 730
+xors 4, 1, sb222, sb450, sb533 # 731
+xors 4, 1, sb644, sb630, sb223 # 732
+xors 4, 1, sb401, sb644, sb221 # 733
+xors 4, 1, sb558, sb644, sb221 # 734
+nots 1, sb628, sb558 # 735
+xors 4, 1, sb405, sb628, sb401 # 736
+nots 1, sb559, sb644 # 737
+xors 4, 1, sb112, sb219, sb626 # 738
+xors 4, 1, sb118, sb112, sb625 # 739
+xors 4, 1, sb596, sb112, sb625 # 740
+xors 4, 1, sb352, sb624, sb218 # 741
+xors 4, 1, sb15, sb352, sb623 # 742
+xors 4, 1, sb483, sb352, sb623 # 743
+xors 4, 1, sb467, sb622, sb215 # 744
+xors 4, 1, sb473, sb467, sb621 # 745
+xors 4, 1, sb335, sb467, sb621 # 746
+xors 4, 1, sb456, sb212, sb213 # 747
+xors 4, 1, sb463, sb456, sb211 # 748
+xors 4, 1, sb286, sb456, sb211 # 749
+xors 4, 1, sb448, sb616, sb617 # 750
+xors 4, 1, sb46, sb448, sb209 # 751
+xors 4, 1, sb45, sb448, sb209 # 752
+xors 4, 1, sb30, sb615, sb208 # 753
+xors 4, 1, sb443, sb30, sb207 # 754
+xors 4, 1, sb183, sb30, sb207 # 755
+xors 4, 1, sb127, sb205, sb614 # 756
+xors 4, 1, sb341, sb127, sb612 # 757
+xors 4, 1, sb152, sb127, sb612 # 758
+nots 1, sb204, sb152 # 759
+xors 4, 1, sb343, sb204, sb341 # 760
+nots 1, sb153, sb127 # 761
+xors 4, 1, sb429, sb610, sb203 # 762
+xors 4, 1, sb105, sb429, sb609 # 763
+xors 4, 1, sb605, sb429, sb609 # 764
+xors 4, 1, sb95, sb608, sb201 # 765
+xors 4, 1, sb385, sb95, sb199 # 766
+xors 4, 1, sb77, sb95, sb199 # 767
+xors 4, 1, sb500, sb604, sb606 # 768
+xors 4, 1, sb337, sb500, sb602 # 769
+xors 4, 1, sb491, sb500, sb602 # 770
+xors 4, 1, sb47, sb194, sb446 # 771
+xors 4, 1, sb57, sb47, sb600 # 772
+xors 4, 1, sb293, sb47, sb600 # 773
+xors 4, 1, sb40, sb598, sb38 # 774
+xors 4, 1, sb231, sb40, sb190 # 775
+xors 4, 1, sb229, sb40, sb190 # 776
+xors 4, 1, sb436, sb597, sb445 # 777
+xors 4, 1, sb186, sb436, sb526 # 778
+xors 4, 1, sb188, sb436, sb526 # 779
+xors 4, 1, sb593, sb594, sb187 # 780
+xors 4, 1, sb147, sb593, sb37 # 781
+xors 4, 1, sb87, sb593, sb37 # 782
+xors 4, 1, sb444, sb389, sb185 # 783
+xors 4, 1, sb24, sb553, sb444 # 784
+xors 4, 1, sb146, sb444, sb145 # 785
+xors 4, 1, sb404, sb184, sb592 # 786
+xors 4, 1, sb349, sb182, sb591 # 787
+xors 4, 1, sb306, sb36, sb589 # 788
+xors 4, 1, sb459, sb586, sb181 # 789
+xors 4, 1, sb485, sb584, sb179 # 790
+xors 4, 1, sb560, sb414, sb175 # 791
+xors 4, 1, sb619, sb580, sb581 # 792
+xors 4, 1, sb579, sb580, sb173 # 793
+xors 4, 1, sb159, sb579, sb619 # 794
+xors 4, 1, sb34, sb170, sb172 # 795
+xors 4, 1, sb514, sb566, sb34 # 796
+xors 4, 1, sb567, sb34, sb529 # 797
+xors 4, 1, sb576, sb170, sb578 # 798
+xors 4, 1, sb169, sb32, sb576 # 799
+xors 4, 1, sb611, sb169, sb514 # 800
+xors 4, 1, sb568, sb576, sb529 # 801
+xors 4, 1, sb575, sb33, sb522 # 802
+xors 4, 1, sb263, sb161, sb575 # 803
+xors 4, 1, sb162, sb575, sb489 # 804
+xors 4, 1, sb572, sb33, sb574 # 805
+xors 4, 1, sb163, sb489, sb440 # 806
+xors 4, 1, sb400, sb163, sb572 # 807
+xors 4, 1, sb571, sb572, sb489 # 808
+ands 80, 1, sb552, sb553, sb146, 1, sb143, sb266, sb140, 1, sb548, sb556, sb149, 1, sb138, sb495, sb544, 1, sb137, sb150, sb151, 1, sb540, sb401, sb644, 1, sb131, sb558, sb559, 1, sb641, sb341, sb127, 1, sb534, sb152, sb153, 1, sb633, sb560, sb561, 1, sb25, sb560, sb154, 1, sb629, sb560, sb155, 1, sb125, sb560, sb562, 1, sb513, sb560, sb563, 1, sb620, sb560, sb564, 1, sb123, sb560, sb159, 1, sb530, sb566, sb567, 1, sb618, sb32, sb568, 1, sb538, sb161, sb162, 1, sb85, sb163, sb571 # 809
+xors 4, 1, sb551, sb145, sb552 # 810
+xors 4, 1, sb433, sb588, sb551 # 811
+xors 4, 1, sb554, sb433, sb24 # 812
+xors 4, 1, sb585, sb551, sb582 # 813
+xors 4, 1, sb141, sb140, sb143 # 814
+xors 4, 1, sb52, sb493, sb141 # 815
+xors 4, 1, sb587, sb141, sb577 # 816
+xors 4, 1, sb139, sb140, sb548 # 817
+xors 4, 1, sb547, sb117, sb139 # 818
+xors 4, 1, sb418, sb547, sb52 # 819
+xors 4, 1, sb524, sb139, sb577 # 820
+xors 4, 1, sb545, sb544, sb138 # 821
+xors 4, 1, sb506, sb590, sb545 # 822
+xors 4, 1, sb86, sb545, sb570 # 823
+xors 4, 1, sb135, sb544, sb137 # 824
+xors 4, 1, sb543, sb595, sb135 # 825
+xors 4, 1, sb441, sb543, sb506 # 826
+xors 4, 1, sb525, sb135, sb570 # 827
+xors 4, 1, sb132, sb644, sb540 # 828
+xors 4, 1, sb397, sb118, sb132 # 829
+xors 4, 1, sb599, sb132, sb112 # 830
+xors 4, 1, sb535, sb644, sb131 # 831
+xors 4, 1, sb107, sb596, sb535 # 832
+xors 4, 1, sb31, sb107, sb397 # 833
+xors 4, 1, sb512, sb535, sb112 # 834
+xors 4, 1, sb128, sb127, sb641 # 835
+xors 4, 1, sb98, sb105, sb128 # 836
+xors 4, 1, sb601, sb128, sb429 # 837
+xors 4, 1, sb639, sb127, sb534 # 838
+xors 4, 1, sb637, sb605, sb639 # 839
+xors 4, 1, sb344, sb637, sb98 # 840
+xors 4, 1, sb607, sb639, sb429 # 841
+xors 4, 1, sb502, sb633, sb126 # 842
+xors 4, 1, sb468, sb25, sb412 # 843
+xors 4, 1, sb245, sb629, sb432 # 844
+xors 4, 1, sb217, sb125, sb627 # 845
+xors 4, 1, sb176, sb513, sb124 # 846
+xors 4, 1, sb336, sb620, sb106 # 847
+xors 4, 1, sb603, sb123, sb619 # 848
+xors 4, 1, sb537, sb529, sb530 # 849
+xors 4, 1, sb613, sb529, sb618 # 850
+xors 4, 1, sb122, sb613, sb537 # 851
+ands 72, 1, sb523, sb588, sb585, 1, sb430, sb493, sb587, 1, sb116, sb117, sb524, 1, sb114, sb590, sb86, 1, sb104, sb595, sb525, 1, sb102, sb118, sb599, 1, sb565, sb596, sb512, 1, sb518, sb105, sb601, 1, sb557, sb605, sb607, 1, sb517, sb433, sb24, 1, sb550, sb603, sb527, 1, sb549, sb603, sb4, 1, sb546, sb603, sb431, 1, sb515, sb603, sb21, 1, sb542, sb603, sb428, 1, sb17, sb603, sb121, 1, sb539, sb603, sb611, 1, sb536, sb603, sb122 # 852
+xors 4, 1, sb23, sb582, sb523 # 853
+xors 4, 1, sb84, sb370, sb23 # 854
+xors 4, 1, sb481, sb23, sb20 # 855
+xors 4, 1, sb115, sb577, sb430 # 856
+xors 4, 1, sb260, sb372, sb115 # 857
+xors 4, 1, sb74, sb115, sb72 # 858
+xors 4, 1, sb521, sb577, sb116 # 859
+xors 4, 1, sb583, sb482, sb521 # 860
+xors 4, 1, sb275, sb583, sb260 # 861
+xors 4, 1, sb376, sb521, sb72 # 862
+xors 4, 1, sb573, sb570, sb114 # 863
+xors 4, 1, sb167, sb378, sb573 # 864
+xors 4, 1, sb75, sb573, sb426 # 865
+xors 4, 1, sb511, sb570, sb104 # 866
+xors 4, 1, sb113, sb422, sb511 # 867
+xors 4, 1, sb35, sb113, sb167 # 868
+xors 4, 1, sb410, sb511, sb426 # 869
+xors 4, 1, sb520, sb112, sb102 # 870
+xors 4, 1, sb393, sb15, sb520 # 871
+xors 4, 1, sb76, sb520, sb352 # 872
+xors 4, 1, sb569, sb112, sb565 # 873
+xors 4, 1, sb519, sb483, sb569 # 874
+xors 4, 1, sb39, sb519, sb393 # 875
+xors 4, 1, sb384, sb569, sb352 # 876
+xors 4, 1, sb111, sb429, sb518 # 877
+xors 4, 1, sb338, sb385, sb111 # 878
+xors 4, 1, sb386, sb111, sb95 # 879
+xors 4, 1, sb110, sb429, sb557 # 880
+xors 4, 1, sb555, sb77, sb110 # 881
+xors 4, 1, sb345, sb555, sb338 # 882
+xors 4, 1, sb484, sb110, sb95 # 883
+xors 4, 1, sb27, sb554, sb517 # 884
+xors 4, 1, sb134, sb27, sb389 # 885
+xors 4, 1, sb507, sb550, sb22 # 886
+xors 4, 1, sb239, sb549, sb516 # 887
+xors 4, 1, sb206, sb546, sb109 # 888
+xors 4, 1, sb0, sb515, sb103 # 889
+xors 4, 1, sb26, sb542, sb510 # 890
+xors 4, 1, sb377, sb17, sb424 # 891
+xors 4, 1, sb330, sb539, sb514 # 892
+xors 4, 1, sb390, sb536, sb537 # 893
+xors 4, 1, sb509, sb489, sb538 # 894
+xors 4, 1, sb258, sb541, sb509 # 895
+xors 4, 1, sb81, sb489, sb85 # 896
+xors 4, 1, sb488, sb90, sb453 # 897
+xors 4, 1, sb16, sb488, sb81 # 898
+xors 4, 1, sb394, sb423, sb282 # 899
+xors 4, 1, sb504, sb3, sb278 # 900
+xors 4, 1, sb78, sb406, sb276 # 901
+xors 4, 1, sb398, sb80, sb272 # 902
+xors 4, 1, sb396, sb402, sb269 # 903
+xors 4, 1, sb97, sb487, sb265 # 904
+xors 4, 1, sb486, sb400, sb263 # 905
+xors 4, 1, sb79, sb16, sb258 # 906
+ands 72, 1, sb96, sb370, sb481, 1, sb480, sb372, sb74, 1, sb427, sb482, sb376, 1, sb411, sb378, sb75, 1, sb19, sb422, sb410, 1, sb421, sb15, sb76, 1, sb70, sb483, sb384, 1, sb351, sb385, sb386, 1, sb476, sb77, sb484, 1, sb136, sb27, sb389, 1, sb280, sb390, sb394, 1, sb277, sb390, sb504, 1, sb274, sb390, sb78, 1, sb270, sb390, sb398, 1, sb268, sb390, sb396, 1, sb264, sb390, sb97, 1, sb262, sb390, sb486, 1, sb257, sb390, sb79 # 907
+xors 4, 1, sb503, sb20, sb96 # 908
+xors 4, 1, sb89, sb64, sb503 # 909
+xors 4, 1, sb192, sb89, sb84 # 910
+xors 4, 1, sb471, sb503, sb63 # 911
+xors 4, 1, sb365, sb72, sb480 # 912
+xors 4, 1, sb458, sb321, sb365 # 913
+xors 4, 1, sb322, sb365, sb317 # 914
+xors 4, 1, sb73, sb72, sb427 # 915
+xors 4, 1, sb479, sb323, sb73 # 916
+xors 4, 1, sb56, sb479, sb458 # 917
+xors 4, 1, sb324, sb73, sb317 # 918
+xors 4, 1, sb366, sb426, sb411 # 919
+xors 4, 1, sb165, sb65, sb366 # 920
+xors 4, 1, sb326, sb366, sb61 # 921
+xors 4, 1, sb355, sb426, sb19 # 922
+xors 4, 1, sb478, sb328, sb355 # 923
+xors 4, 1, sb442, sb478, sb165 # 924
+xors 4, 1, sb331, sb355, sb61 # 925
+xors 4, 1, sb71, sb352, sb421 # 926
+xors 4, 1, sb391, sb473, sb71 # 927
+xors 4, 1, sb332, sb71, sb467 # 928
+xors 4, 1, sb350, sb352, sb70 # 929
+xors 4, 1, sb477, sb335, sb350 # 930
+xors 4, 1, sb71, sb477, sb391 # 931
+xors 4, 1, sb334, sb350, sb467 # 932
+xors 4, 1, sb69, sb95, sb351 # 933
+xors 4, 1, sb66, sb337, sb69 # 934
+xors 4, 1, sb474, sb69, sb500 # 935
+xors 4, 1, sb340, sb95, sb476 # 936
+xors 4, 1, sb68, sb491, sb340 # 937
+xors 4, 1, sb346, sb68, sb66 # 938
+xors 4, 1, sb67, sb340, sb500 # 939
+ands 40, 1, sb100, sb64, sb471, 1, sb470, sb321, sb322, 1, sb501, sb323, sb324, 1, sb314, sb65, sb326, 1, sb469, sb328, sb331, 1, sb419, sb473, sb332, 1, sb60, sb335, sb334, 1, sb297, sb337, sb474, 1, sb295, sb491, sb67, 1, sb99, sb89, sb84 # 940
+xors 4, 1, sb90, sb63, sb100 # 941
+xors 4, 1, sb315, sb317, sb470 # 942
+xors 4, 1, sb409, sb271, sb315 # 943
+xors 4, 1, sb55, sb315, sb460 # 944
+xors 4, 1, sb94, sb317, sb501 # 945
+xors 4, 1, sb62, sb54, sb94 # 946
+xors 4, 1, sb462, sb62, sb409 # 947
+xors 4, 1, sb461, sb94, sb460 # 948
+xors 4, 1, sb309, sb61, sb314 # 949
+xors 4, 1, sb88, sb11, sb309 # 950
+xors 4, 1, sb279, sb309, sb250 # 951
+xors 4, 1, sb305, sb61, sb469 # 952
+xors 4, 1, sb12, sb281, sb305 # 953
+xors 4, 1, sb177, sb12, sb88 # 954
+xors 4, 1, sb2, sb305, sb250 # 955
+xors 4, 1, sb303, sb467, sb419 # 956
+xors 4, 1, sb387, sb463, sb303 # 957
+xors 4, 1, sb492, sb303, sb456 # 958
+xors 4, 1, sb298, sb467, sb60 # 959
+xors 4, 1, sb299, sb286, sb298 # 960
+xors 4, 1, sb108, sb299, sb387 # 961
+xors 4, 1, sb464, sb298, sb456 # 962
+xors 4, 1, sb59, sb500, sb297 # 963
+xors 4, 1, sb420, sb57, sb59 # 964
+xors 4, 1, sb93, sb59, sb47 # 965
+xors 4, 1, sb291, sb500, sb295 # 966
+xors 4, 1, sb465, sb293, sb291 # 967
+xors 4, 1, sb347, sb465, sb420 # 968
+xors 4, 1, sb58, sb291, sb47 # 969
+ands 52, 1, sb499, sb271, sb55, 1, sb53, sb54, sb461, 1, sb267, sb90, sb273, 1, sb261, sb90, sb418, 1, sb259, sb90, sb275, 1, sb417, sb90, sb56, 1, sb10, sb90, sb462, 1, sb253, sb11, sb279, 1, sb251, sb281, sb2, 1, sb247, sb463, sb492, 1, sb243, sb286, sb464, 1, sb91, sb57, sb93, 1, sb454, sb293, sb58 # 970
+xors 4, 1, sb508, sb460, sb499 # 971
+xors 4, 1, sb92, sb460, sb53 # 972
+xors 4, 1, sb497, sb92, sb508 # 973
+xors 4, 1, sb425, sb267, sb266 # 974
+xors 4, 1, sb615, sb261, sb52 # 975
+xors 4, 1, sb447, sb615, sb425 # 976
+xors 4, 1, sb18, sb259, sb260 # 977
+xors 4, 1, sb362, sb417, sb458 # 978
+xors 4, 1, sb196, sb362, sb18 # 979
+xors 4, 1, sb5, sb10, sb409 # 980
+xors 4, 1, sb50, sb250, sb253 # 981
+xors 4, 1, sb157, sb451, sb50 # 982
+xors 4, 1, sb220, sb50, sb450 # 983
+xors 4, 1, sb248, sb250, sb251 # 984
+xors 4, 1, sb457, sb222, sb248 # 985
+xors 4, 1, sb178, sb457, sb157 # 986
+xors 4, 1, sb44, sb248, sb450 # 987
+xors 4, 1, sb246, sb456, sb247 # 988
+xors 4, 1, sb382, sb46, sb246 # 989
+xors 4, 1, sb224, sb246, sb448 # 990
+xors 4, 1, sb48, sb456, sb243 # 991
+xors 4, 1, sb455, sb45, sb48 # 992
+xors 4, 1, sb119, sb455, sb382 # 993
+xors 4, 1, sb452, sb48, sb448 # 994
+xors 4, 1, sb498, sb47, sb91 # 995
+xors 4, 1, sb327, sb231, sb498 # 996
+xors 4, 1, sb9, sb498, sb40 # 997
+xors 4, 1, sb82, sb47, sb454 # 998
+xors 4, 1, sb235, sb229, sb82 # 999
+xors 4, 1, sb348, sb235, sb327 # 1000
+xors 4, 1, sb416, sb82, sb40 # 1001
+ands 36, 1, sb505, sb90, sb497, 1, sb43, sb451, sb220, 1, sb214, sb222, sb44, 1, sb210, sb46, sb224, 1, sb490, sb45, sb452, 1, sb449, sb231, sb9, 1, sb415, sb229, sb416, 1, sb197, sb362, sb18, 1, sb195, sb615, sb425 # 1002
+xors 4, 1, sb101, sb505, sb508 # 1003
+xors 4, 1, sb6, sb450, sb43 # 1004
+xors 4, 1, sb42, sb450, sb214 # 1005
+xors 4, 1, sb180, sb42, sb6 # 1006
+xors 4, 1, sb83, sb448, sb210 # 1007
+xors 4, 1, sb380, sb443, sb83 # 1008
+xors 4, 1, sb7, sb83, sb30 # 1009
+xors 4, 1, sb8, sb448, sb490 # 1010
+xors 4, 1, sb41, sb183, sb8 # 1011
+xors 4, 1, sb120, sb41, sb380 # 1012
+xors 4, 1, sb189, sb8, sb30 # 1013
+xors 4, 1, sb202, sb40, sb449 # 1014
+xors 4, 1, sb472, sb186, sb202 # 1015
+xors 4, 1, sb191, sb202, sb436 # 1016
+xors 4, 1, sb198, sb40, sb415 # 1017
+xors 4, 1, sb200, sb188, sb198 # 1018
+xors 4, 1, sb353, sb200, sb472 # 1019
+xors 4, 1, sb193, sb198, sb436 # 1020
+xors 4, 1, sb363, sb196, sb197 # 1021
+xors 4, 1, sb208, sb447, sb195 # 1022
+xors 4, 1, sb494, sb208, sb89 # 1023
+xors 4, 1, sb496, sb192, sb99 # 1024
+xors 4, 1, sb434, sb208, sb496 # 1025
+ands 52, 1, sb166, sb101, sb171, 1, sb164, sb101, sb441, 1, sb168, sb101, sb35, 1, sb160, sb101, sb442, 1, sb158, sb101, sb177, 1, sb438, sb101, sb178, 1, sb1, sb101, sb180, 1, sb407, sb443, sb7, 1, sb439, sb183, sb189, 1, sb413, sb186, sb191, 1, sb29, sb188, sb193, 1, sb28, sb208, sb89, 1, sb435, sb208, sb496 # 1026
+xors 4, 1, sb244, sb166, sb495 # 1027
+xors 4, 1, sb364, sb244, sb5 # 1028
+xors 4, 1, sb130, sb164, sb506 # 1029
+xors 4, 1, sb360, sb168, sb167 # 1030
+xors 4, 1, sb368, sb360, sb130 # 1031
+xors 4, 1, sb129, sb160, sb165 # 1032
+xors 4, 1, sb585, sb158, sb88 # 1033
+xors 4, 1, sb371, sb585, sb129 # 1034
+xors 4, 1, sb359, sb438, sb157 # 1035
+xors 4, 1, sb403, sb1, sb6 # 1036
+xors 4, 1, sb375, sb30, sb407 # 1037
+xors 4, 1, sb437, sb30, sb439 # 1038
+xors 4, 1, sb408, sb437, sb375 # 1039
+xors 4, 1, sb148, sb436, sb413 # 1040
+xors 4, 1, sb319, sb147, sb148 # 1041
+xors 4, 1, sb144, sb436, sb29 # 1042
+xors 4, 1, sb142, sb87, sb144 # 1043
+xors 4, 1, sb354, sb142, sb319 # 1044
+xors 4, 1, sb209, sb494, sb28 # 1045
+xors 4, 1, sb616, sb434, sb435 # 1046
+xors 4, 1, sb288, sb616, sb433 # 1047
+xors 4, 1, sb285, sb616, sb27 # 1048
+xors 4, 1, sb133, sb134, sb136 # 1049
+xors 4, 1, sb283, sb616, sb133 # 1050
+ands 56, 1, sb399, sb403, sb405, 1, sb395, sb403, sb31, 1, sb392, sb403, sb39, 1, sb388, sb403, sb71, 1, sb383, sb403, sb108, 1, sb381, sb403, sb119, 1, sb379, sb403, sb120, 1, sb374, sb403, sb408, 1, sb373, sb585, sb129, 1, sb369, sb360, sb130, 1, sb367, sb244, sb5, 1, sb289, sb616, sb433, 1, sb287, sb616, sb27, 1, sb284, sb616, sb133 # 1051
+xors 4, 1, sb241, sb399, sb401 # 1052
+xors 4, 1, sb304, sb241, sb359 # 1053
+xors 4, 1, sb358, sb395, sb397 # 1054
+xors 4, 1, sb612, sb392, sb393 # 1055
+xors 4, 1, sb308, sb612, sb358 # 1056
+xors 4, 1, sb357, sb388, sb391 # 1057
+xors 4, 1, sb238, sb383, sb387 # 1058
+xors 4, 1, sb311, sb238, sb357 # 1059
+xors 4, 1, sb356, sb381, sb382 # 1060
+xors 4, 1, sb143, sb379, sb380 # 1061
+xors 4, 1, sb313, sb143, sb356 # 1062
+xors 4, 1, sb342, sb374, sb375 # 1063
+xors 4, 1, sb493, sb371, sb373 # 1064
+xors 4, 1, sb301, sb493, sb360 # 1065
+xors 4, 1, sb361, sb368, sb369 # 1066
+xors 4, 1, sb296, sb493, sb361 # 1067
+xors 4, 1, sb49, sb364, sb367 # 1068
+xors 4, 1, sb294, sb49, sb362 # 1069
+xors 4, 1, sb290, sb49, sb363 # 1070
+ands 64, 1, sb475, sb342, sb343, 1, sb339, sb342, sb344, 1, sb333, sb342, sb345, 1, sb329, sb342, sb346, 1, sb13, sb342, sb347, 1, sb325, sb342, sb348, 1, sb320, sb342, sb353, 1, sb318, sb342, sb354, 1, sb316, sb143, sb356, 1, sb312, sb238, sb357, 1, sb310, sb612, sb358, 1, sb307, sb241, sb359, 1, sb302, sb493, sb360, 1, sb300, sb493, sb361, 1, sb466, sb49, sb362, 1, sb292, sb49, sb363 # 1071
+xors 4, 1, sb237, sb475, sb341 # 1072
+xors 4, 1, sb610, sb339, sb98 # 1073
+xors 4, 1, sb635, sb610, sb237 # 1074
+xors 4, 1, sb236, sb333, sb338 # 1075
+xors 4, 1, sb576, sb329, sb66 # 1076
+xors 4, 1, sb636, sb576, sb236 # 1077
+xors 4, 1, sb643, sb13, sb420 # 1078
+xors 4, 1, sb609, sb325, sb327 # 1079
+xors 4, 1, sb638, sb609, sb643 # 1080
+xors 4, 1, sb642, sb320, sb472 # 1081
+xors 4, 1, sb233, sb318, sb319 # 1082
+xors 4, 1, sb640, sb233, sb642 # 1083
+xors 4, 1, sb551, sb313, sb316 # 1084
+xors 4, 1, sb227, sb551, sb238 # 1085
+xors 4, 1, sb240, sb311, sb312 # 1086
+xors 4, 1, sb225, sb551, sb240 # 1087
+xors 4, 1, sb205, sb308, sb310 # 1088
+xors 4, 1, sb631, sb205, sb241 # 1089
+xors 4, 1, sb242, sb304, sb307 # 1090
+xors 4, 1, sb630, sb205, sb242 # 1091
+xors 4, 1, sb587, sb301, sb302 # 1092
+xors 4, 1, sb117, sb296, sb300 # 1093
+xors 4, 1, sb628, sb117, sb244 # 1094
+xors 4, 1, sb219, sb117, sb49 # 1095
+xors 4, 1, sb249, sb294, sb466 # 1096
+xors 4, 1, sb218, sb117, sb249 # 1097
+xors 4, 1, sb252, sb290, sb292 # 1098
+xors 4, 1, sb624, sb117, sb252 # 1099
+xors 4, 1, sb617, sb288, sb289 # 1100
+xors 4, 1, sb211, sb285, sb287 # 1101
+xors 4, 1, sb212, sb283, sb284 # 1102
+xors 4, 1, sb286, sb280, sb282 # 1103
+xors 4, 1, sb489, sb277, sb278 # 1104
+xors 4, 1, sb447, sb274, sb276 # 1105
+xors 4, 1, sb148, sb270, sb272 # 1106
+xors 4, 1, sb16, sb268, sb269 # 1107
+xors 4, 1, sb476, sb264, sb265 # 1108
+xors 4, 1, sb256, sb262, sb263 # 1109
+xors 4, 1, sb255, sb257, sb258 # 1110
+dabit s0, sb51 # 1111
+xors 4, 1, sb487, sb51, sb256 # 1112
+mulsi s21, s0, 2 # 1113
+dabit s32, sb254 # 1114
+xors 4, 1, sb406, sb254, sb255 # 1115
+mulsi s31, s32, 2 # 1116
+ldi c3, 1 # 1117
+mulci c6, c3, 2147483647 # 1118
+addci c1, c6, 1 # 1119
+xors 4, 1, sb3, sb216, sb233 # 1120
+ands 52, 1, sb234, sb233, sb642, 1, sb232, sb609, sb643, 1, sb230, sb576, sb236, 1, sb228, sb610, sb237, 1, sb634, sb551, sb238, 1, sb226, sb551, sb240, 1, sb632, sb205, sb241, 1, sb533, sb205, sb242, 1, sb223, sb117, sb244, 1, sb221, sb117, sb49, 1, sb626, sb117, sb249, 1, sb625, sb117, sb252, 1, sb623, sb3, sb216 # 1121
+xors 4, 1, sb606, sb640, sb234 # 1122
+xors 4, 1, sb608, sb606, sb609 # 1123
+xors 4, 1, sb622, sb606, sb233 # 1124
+xors 4, 1, sb203, sb638, sb232 # 1125
+xors 4, 1, sb604, sb606, sb203 # 1126
+xors 4, 1, sb169, sb636, sb230 # 1127
+xors 4, 1, sb194, sb169, sb610 # 1128
+xors 4, 1, sb204, sb635, sb228 # 1129
+xors 4, 1, sb598, sb169, sb204 # 1130
+xors 4, 1, sb145, sb227, sb634 # 1131
+xors 4, 1, sb552, sb225, sb226 # 1132
+xors 4, 1, sb597, sb552, sb612 # 1133
+xors 4, 1, sb445, sb552, sb205 # 1134
+xors 4, 1, sb614, sb631, sb632 # 1135
+xors 4, 1, sb594, sb552, sb614 # 1136
+xors 4, 1, sb207, sb630, sb533 # 1137
+xors 4, 1, sb593, sb552, sb207 # 1138
+xors 4, 1, sb524, sb628, sb223 # 1139
+xors 4, 1, sb590, sb219, sb221 # 1140
+xors 4, 1, sb86, sb218, sb626 # 1141
+xors 4, 1, sb595, sb624, sb625 # 1142
+xors 4, 1, sb592, sb595, sb615 # 1143
+xors 4, 1, sb444, sb595, sb208 # 1144
+xors 4, 1, sb591, sb595, sb209 # 1145
+xors 4, 1, sb589, sb595, sb616 # 1146
+xors 4, 1, sb181, sb595, sb617 # 1147
+xors 4, 1, sb179, sb595, sb211 # 1148
+xors 4, 1, sb414, sb595, sb212 # 1149
+xors 4, 1, sb215, sb216, sb623 # 1150
+xors 4, 1, sb213, sb174, sb622 # 1151
+xors 4, 1, sb423, sb213, sb215 # 1152
+xors 4, 1, sb621, sb215, sb174 # 1153
+ands 64, 1, sb201, sb606, sb609, 1, sb199, sb606, sb203, 1, sb446, sb169, sb610, 1, sb600, sb169, sb204, 1, sb38, sb552, sb612, 1, sb190, sb552, sb205, 1, sb526, sb552, sb614, 1, sb187, sb552, sb207, 1, sb37, sb595, sb615, 1, sb185, sb595, sb208, 1, sb184, sb595, sb209, 1, sb182, sb595, sb616, 1, sb36, sb595, sb617, 1, sb586, sb595, sb211, 1, sb584, sb595, sb212, 1, sb175, sb213, sb621 # 1154
+xors 4, 1, sb602, sb608, sb201 # 1155
+xors 4, 1, sb581, sb602, sb606 # 1156
+xors 4, 1, sb574, sb604, sb199 # 1157
+xors 4, 1, sb575, sb574, sb576 # 1158
+xors 4, 1, sb572, sb574, sb169 # 1159
+xors 4, 1, sb580, sb574, sb602 # 1160
+xors 4, 1, sb170, sb194, sb446 # 1161
+xors 4, 1, sb32, sb574, sb170 # 1162
+xors 4, 1, sb578, sb598, sb600 # 1163
+xors 4, 1, sb439, sb574, sb578 # 1164
+xors 4, 1, sb553, sb597, sb38 # 1165
+xors 4, 1, sb146, sb445, sb190 # 1166
+xors 4, 1, sb556, sb594, sb526 # 1167
+xors 4, 1, sb149, sb593, sb187 # 1168
+xors 4, 1, sb525, sb592, sb37 # 1169
+xors 4, 1, sb118, sb444, sb185 # 1170
+xors 4, 1, sb599, sb591, sb184 # 1171
+xors 4, 1, sb596, sb589, sb182 # 1172
+xors 4, 1, sb512, sb181, sb36 # 1173
+xors 4, 1, sb105, sb179, sb586 # 1174
+xors 4, 1, sb601, sb414, sb584 # 1175
+xors 4, 1, sb469, sb174, sb175 # 1176
+xors 4, 1, sb155, sb156, sb581 # 1177
+xors 4, 1, sb150, sb532, sb580 # 1178
+xors 4, 1, sb34, sb156, sb581 # 1179
+nots 1, sb173, sb34 # 1180
+nots 1, sb172, sb156 # 1181
+xors 4, 1, sb151, sb532, sb580 # 1182
+xors 4, 1, sb579, sb173, sb155 # 1183
+ands 28, 1, sb522, sb574, sb576, 1, sb440, sb574, sb169, 1, sb162, sb574, sb170, 1, sb568, sb574, sb578, 1, sb159, sb155, sb156, 1, sb564, sb34, sb172, 1, sb562, sb469, sb579 # 1184
+xors 4, 1, sb571, sb575, sb522 # 1185
+xors 4, 1, sb33, sb571, sb574 # 1186
+xors 4, 1, sb605, sb528, sb33 # 1187
+xors 4, 1, sb607, sb528, sb33 # 1188
+xors 4, 1, sb161, sb572, sb440 # 1189
+xors 4, 1, sb163, sb161, sb571 # 1190
+xors 4, 1, sb366, sb14, sb163 # 1191
+xors 4, 1, sb411, sb14, sb163 # 1192
+xors 4, 1, sb567, sb32, sb162 # 1193
+xors 4, 1, sb561, sb567, sb161 # 1194
+xors 4, 1, sb547, sb439, sb568 # 1195
+xors 4, 1, sb548, sb547, sb143 # 1196
+xors 4, 1, sb139, sb547, sb551 # 1197
+xors 4, 1, sb544, sb547, sb145 # 1198
+xors 4, 1, sb135, sb547, sb552 # 1199
+xors 4, 1, sb131, sb547, sb553 # 1200
+xors 4, 1, sb128, sb547, sb146 # 1201
+xors 4, 1, sb639, sb547, sb556 # 1202
+xors 4, 1, sb127, sb547, sb149 # 1203
+xors 4, 1, sb620, sb547, sb567 # 1204
+xors 4, 1, sb566, sb156, sb159 # 1205
+xors 4, 1, sb125, sb150, sb566 # 1206
+xors 4, 1, sb558, sb566, sb532 # 1207
+xors 4, 1, sb563, sb156, sb564 # 1208
+xors 4, 1, sb154, sb151, sb563 # 1209
+xors 4, 1, sb559, sb563, sb532 # 1210
+xors 4, 1, sb488, sb562, sb155 # 1211
+xors 4, 1, sb152, sb154, sb125 # 1212
+xors 4, 1, sb260, sb531, sb561 # 1213
+xors 4, 1, sb24, sb404, sb620 # 1214
+xors 4, 1, sb153, sb531, sb561 # 1215
+nots 1, sb122, sb153 # 1216
+nots 1, sb560, sb531 # 1217
+ands 52, 1, sb141, sb547, sb143, 1, sb140, sb547, sb551, 1, sb545, sb547, sb145, 1, sb543, sb547, sb552, 1, sb132, sb547, sb553, 1, sb107, sb547, sb146, 1, sb535, sb547, sb556, 1, sb637, sb547, sb149, 1, sb633, sb150, sb558, 1, sb25, sb151, sb559, 1, sb432, sb469, sb152, 1, sb124, sb260, sb531, 1, sb106, sb153, sb560 # 1218
+xors 4, 1, sb138, sb548, sb141 # 1219
+xors 4, 1, sb618, sb138, sb547 # 1220
+xors 4, 1, sb73, sb349, sb618 # 1221
+xors 4, 1, sb137, sb139, sb140 # 1222
+xors 4, 1, sb530, sb137, sb138 # 1223
+xors 4, 1, sb314, sb306, sb530 # 1224
+xors 4, 1, sb540, sb544, sb545 # 1225
+xors 4, 1, sb123, sb540, sb137 # 1226
+xors 4, 1, sb267, sb459, sb123 # 1227
+xors 4, 1, sb644, sb135, sb543 # 1228
+xors 4, 1, sb529, sb644, sb540 # 1229
+xors 4, 1, sb641, sb131, sb132 # 1230
+xors 4, 1, sb392, sb641, sb644 # 1231
+xors 4, 1, sb534, sb128, sb107 # 1232
+xors 4, 1, sb394, sb534, sb641 # 1233
+xors 4, 1, sb126, sb639, sb535 # 1234
+xors 4, 1, sb504, sb126, sb534 # 1235
+xors 4, 1, sb583, sb127, sb637 # 1236
+xors 4, 1, sb116, sb583, sb585 # 1237
+xors 4, 1, sb430, sb583, sb493 # 1238
+xors 4, 1, sb577, sb583, sb587 # 1239
+xors 4, 1, sb104, sb583, sb117 # 1240
+xors 4, 1, sb570, sb583, sb524 # 1241
+xors 4, 1, sb569, sb583, sb590 # 1242
+xors 4, 1, sb519, sb583, sb86 # 1243
+xors 4, 1, sb111, sb583, sb595 # 1244
+xors 4, 1, sb22, sb583, sb525 # 1245
+xors 4, 1, sb554, sb583, sb118 # 1246
+xors 4, 1, sb550, sb583, sb599 # 1247
+xors 4, 1, sb103, sb583, sb596 # 1248
+xors 4, 1, sb515, sb583, sb512 # 1249
+xors 4, 1, sb541, sb583, sb105 # 1250
+xors 4, 1, sb509, sb583, sb601 # 1251
+xors 4, 1, sb77, sb583, sb126 # 1252
+xors 4, 1, sb412, sb532, sb633 # 1253
+xors 4, 1, sb453, sb605, sb412 # 1254
+xors 4, 1, sb603, sb412, sb528 # 1255
+xors 4, 1, sb627, sb532, sb25 # 1256
+xors 4, 1, sb629, sb607, sb627 # 1257
+xors 4, 1, sb527, sb629, sb453 # 1258
+xors 4, 1, sb4, sb627, sb528 # 1259
+xors 4, 1, sb81, sb432, sb125 # 1260
+xors 4, 1, sb513, sb531, sb124 # 1261
+xors 4, 1, sb10, sb24, sb513 # 1262
+xors 4, 1, sb431, sb513, sb404 # 1263
+xors 4, 1, sb619, sb531, sb106 # 1264
+xors 4, 1, sb21, sb404, sb620 # 1265
+xors 4, 1, sb613, sb21, sb619 # 1266
+xors 4, 1, sb428, sb619, sb404 # 1267
+xors 4, 1, sb427, sb349, sb618 # 1268
+xors 4, 1, sb94, sb306, sb530 # 1269
+xors 4, 1, sb266, sb459, sb123 # 1270
+xors 4, 1, sb92, sb122, sb260 # 1271
+xors 4, 1, sb271, sb613, sb10 # 1272
+xors 4, 1, sb171, sb485, sb529 # 1273
+xors 4, 1, sb480, sb502, sb392 # 1274
+xors 4, 1, sb317, sb468, sb394 # 1275
+xors 4, 1, sb55, sb245, sb504 # 1276
+xors 4, 1, sb225, sb217, sb77 # 1277
+xors 4, 1, sb121, sb485, sb529 # 1278
+nots 1, sb484, sb121 # 1279
+nots 1, sb611, sb485 # 1280
+ands 88, 1, sb523, sb583, sb585, 1, sb23, sb583, sb493, 1, sb582, sb583, sb587, 1, sb114, sb583, sb117, 1, sb573, sb583, sb524, 1, sb102, sb583, sb590, 1, sb565, sb583, sb86, 1, sb520, sb583, sb595, 1, sb557, sb583, sb525, 1, sb517, sb583, sb118, 1, sb555, sb583, sb599, 1, sb549, sb583, sb596, 1, sb109, sb583, sb512, 1, sb542, sb583, sb105, 1, sb539, sb583, sb601, 1, sb17, sb605, sb603, 1, sb536, sb607, sb4, 1, sb451, sb469, sb527, 1, sb80, sb24, sb431, 1, sb400, sb21, sb428, 1, sb396, sb171, sb485, 1, sb398, sb121, sb611 # 1281
+xors 4, 1, sb588, sb116, sb523 # 1282
+xors 4, 1, sb390, sb588, sb583 # 1283
+xors 4, 1, sb35, sb176, sb390 # 1284
+xors 4, 1, sb115, sb430, sb23 # 1285
+xors 4, 1, sb384, sb115, sb588 # 1286
+xors 4, 1, sb521, sb577, sb582 # 1287
+xors 4, 1, sb76, sb521, sb115 # 1288
+xors 4, 1, sb113, sb104, sb114 # 1289
+xors 4, 1, sb386, sb113, sb521 # 1290
+xors 4, 1, sb511, sb570, sb573 # 1291
+xors 4, 1, sb422, sb511, sb113 # 1292
+xors 4, 1, sb112, sb569, sb102 # 1293
+xors 4, 1, sb389, sb112, sb511 # 1294
+xors 4, 1, sb518, sb519, sb565 # 1295
+xors 4, 1, sb483, sb518, sb112 # 1296
+xors 4, 1, sb429, sb111, sb520 # 1297
+xors 4, 1, sb378, sb429, sb518 # 1298
+xors 4, 1, sb110, sb22, sb557 # 1299
+xors 4, 1, sb410, sb110, sb429 # 1300
+xors 4, 1, sb516, sb554, sb517 # 1301
+xors 4, 1, sb473, sb516, sb110 # 1302
+xors 4, 1, sb546, sb550, sb555 # 1303
+xors 4, 1, sb464, sb546, sb516 # 1304
+xors 4, 1, sb510, sb103, sb549 # 1305
+xors 4, 1, sb46, sb510, sb546 # 1306
+xors 4, 1, sb424, sb515, sb109 # 1307
+xors 4, 1, sb198, sb424, sb510 # 1308
+xors 4, 1, sb514, sb541, sb542 # 1309
+xors 4, 1, sb147, sb514, sb424 # 1310
+xors 4, 1, sb537, sb509, sb539 # 1311
+xors 4, 1, sb15, sb537, sb514 # 1312
+xors 4, 1, sb538, sb528, sb17 # 1313
+xors 4, 1, sb421, sb366, sb538 # 1314
+xors 4, 1, sb72, sb538, sb14 # 1315
+xors 4, 1, sb425, sb528, sb536 # 1316
+xors 4, 1, sb85, sb411, sb425 # 1317
+xors 4, 1, sb503, sb85, sb421 # 1318
+xors 4, 1, sb479, sb425, sb14 # 1319
+xors 4, 1, sb448, sb451, sb453 # 1320
+reveal 21, 1, cb19, sb487, 1, cb18, sb406, 1, cb17, sb3, 1, cb16, sb423, 1, cb15, sb488, 1, cb14, sb81, 1, cb13, sb448 # 1321
+convcbitvec 1, ci2, cb19 # 1322
+convint c5, ci2 # 1323
+addm s34, s0, c5 # 1324
+convint c4, ci2 # 1325
+mulm s20, s21, c4 # 1326
+subs s33, s34, s20 # 1327
+movs s25, s33 # 1328
+convcbitvec 1, ci1, cb18 # 1329
+convint c7, ci1 # 1330
+addm s29, s32, c7 # 1331
+convint c2, ci1 # 1332
+mulm s30, s31, c2 # 1333
+subs s28, s29, s30 # 1334
+movs s27, s28 # 1335
+mulsi s26, s27, 2 # 1336
+adds s24, s25, s26 # 1337
+mulm s23, s24, c1 # 1338
+subs s19, s22, s23 # 1339
+xors 4, 1, sb402, sb404, sb80 # 1340
+xors 4, 1, sb409, sb73, sb402 # 1341
+xors 4, 1, sb365, sb402, sb349 # 1342
+xors 4, 1, sb486, sb404, sb400 # 1343
+xors 4, 1, sb79, sb427, sb486 # 1344
+xors 4, 1, sb54, sb79, sb409 # 1345
+xors 4, 1, sb20, sb486, sb349 # 1346
+xors 4, 1, sb97, sb485, sb396 # 1347
+xors 4, 1, sb88, sb480, sb97 # 1348
+xors 4, 1, sb96, sb97, sb502 # 1349
+xors 4, 1, sb78, sb485, sb398 # 1350
+xors 4, 1, sb370, sb502, sb392 # 1351
+xors 4, 1, sb385, sb370, sb78 # 1352
+xors 4, 1, sb481, sb78, sb502 # 1353
+xors 4, 1, sb501, sb468, sb394 # 1354
+xors 4, 1, sb85, sb245, sb504 # 1355
+xors 4, 1, sb222, sb217, sb77 # 1356
+xors 4, 1, sb180, sb176, sb390 # 1357
+xors 4, 1, sb443, sb484, sb171 # 1358
+xors 4, 1, sb183, sb385, sb88 # 1359
+xors 4, 1, sb368, sb336, sb384 # 1360
+xors 4, 1, sb64, sb507, sb76 # 1361
+xors 4, 1, sb418, sb239, sb386 # 1362
+xors 4, 1, sb45, sb206, sb422 # 1363
+xors 4, 1, sb189, sb0, sb389 # 1364
+xors 4, 1, sb27, sb26, sb483 # 1365
+xors 4, 1, sb381, sb377, sb378 # 1366
+xors 4, 1, sb372, sb336, sb384 # 1367
+nots 1, sb75, sb372 # 1368
+nots 1, sb74, sb336 # 1369
+xors 4, 1, sb471, sb507, sb76 # 1370
+xors 4, 1, sb56, sb239, sb386 # 1371
+xors 4, 1, sb452, sb206, sb422 # 1372
+xors 4, 1, sb191, sb0, sb389 # 1373
+xors 4, 1, sb435, sb26, sb483 # 1374
+xors 4, 1, sb383, sb377, sb378 # 1375
+xors 4, 1, sb388, sb75, sb368 # 1376
+xors 4, 1, sb319, sb330, sb410 # 1377
+xors 4, 1, sb324, sb286, sb473 # 1378
+xors 4, 1, sb11, sb489, sb464 # 1379
+xors 4, 1, sb231, sb447, sb46 # 1380
+xors 4, 1, sb193, sb148, sb198 # 1381
+xors 4, 1, sb494, sb16, sb147 # 1382
+xors 4, 1, sb403, sb476, sb15 # 1383
+xors 4, 1, sb376, sb330, sb410 # 1384
+nots 1, sb344, sb376 # 1385
+nots 1, sb482, sb330 # 1386
+ands 44, 1, sb19, sb366, sb72, 1, sb478, sb411, sb479, 1, sb355, sb469, sb503, 1, sb352, sb73, sb365, 1, sb350, sb427, sb20, 1, sb69, sb480, sb96, 1, sb95, sb370, sb481, 1, sb84, sb368, sb336, 1, sb491, sb372, sb74, 1, sb335, sb319, sb330, 1, sb474, sb376, sb482 # 1387
+xors 4, 1, sb309, sb14, sb19 # 1388
+xors 4, 1, sb426, sb14, sb478 # 1389
+xors 4, 1, sb62, sb426, sb309 # 1390
+xors 4, 1, sb252, sb355, sb421 # 1391
+xors 4, 1, sb70, sb349, sb352 # 1392
+xors 4, 1, sb457, sb314, sb70 # 1393
+xors 4, 1, sb470, sb70, sb306 # 1394
+xors 4, 1, sb477, sb349, sb350 # 1395
+xors 4, 1, sb351, sb94, sb477 # 1396
+xors 4, 1, sb461, sb351, sb457 # 1397
+xors 4, 1, sb100, sb477, sb306 # 1398
+xors 4, 1, sb345, sb502, sb69 # 1399
+xors 4, 1, sb165, sb317, sb345 # 1400
+xors 4, 1, sb63, sb345, sb468 # 1401
+xors 4, 1, sb340, sb502, sb95 # 1402
+xors 4, 1, sb68, sb501, sb340 # 1403
+xors 4, 1, sb89, sb68, sb165 # 1404
+xors 4, 1, sb321, sb340, sb468 # 1405
+xors 4, 1, sb67, sb336, sb84 # 1406
+xors 4, 1, sb364, sb64, sb67 # 1407
+xors 4, 1, sb322, sb67, sb507 # 1408
+xors 4, 1, sb334, sb336, sb491 # 1409
+xors 4, 1, sb337, sb471, sb334 # 1410
+xors 4, 1, sb391, sb337, sb364 # 1411
+xors 4, 1, sb323, sb334, sb507 # 1412
+xors 4, 1, sb332, sb330, sb335 # 1413
+xors 4, 1, sb316, sb324, sb332 # 1414
+xors 4, 1, sb65, sb332, sb286 # 1415
+xors 4, 1, sb328, sb330, sb474 # 1416
+xors 4, 1, sb326, sb286, sb473 # 1417
+xors 4, 1, sb343, sb326, sb328 # 1418
+xors 4, 1, sb331, sb328, sb286 # 1419
+ands 36, 1, sb315, sb469, sb62, 1, sb61, sb314, sb470, 1, sb305, sb94, sb100, 1, sb419, sb317, sb63, 1, sb299, sb501, sb321, 1, sb59, sb64, sb322, 1, sb500, sb471, sb323, 1, sb58, sb324, sb65, 1, sb57, sb326, sb331 # 1420
+xors 4, 1, sb90, sb315, sb309 # 1421
+xors 4, 1, sb12, sb306, sb61 # 1422
+xors 4, 1, sb250, sb267, sb12 # 1423
+xors 4, 1, sb460, sb12, sb459 # 1424
+xors 4, 1, sb60, sb306, sb305 # 1425
+xors 4, 1, sb303, sb266, sb60 # 1426
+xors 4, 1, sb273, sb303, sb250 # 1427
+xors 4, 1, sb53, sb60, sb459 # 1428
+xors 4, 1, sb467, sb468, sb419 # 1429
+xors 4, 1, sb168, sb55, sb467 # 1430
+xors 4, 1, sb275, sb467, sb245 # 1431
+xors 4, 1, sb298, sb468, sb299 # 1432
+xors 4, 1, sb297, sb85, sb298 # 1433
+xors 4, 1, sb186, sb297, sb168 # 1434
+xors 4, 1, sb462, sb298, sb245 # 1435
+xors 4, 1, sb295, sb507, sb59 # 1436
+xors 4, 1, sb362, sb418, sb295 # 1437
+xors 4, 1, sb279, sb295, sb239 # 1438
+xors 4, 1, sb465, sb507, sb500 # 1439
+xors 4, 1, sb291, sb56, sb465 # 1440
+xors 4, 1, sb393, sb291, sb362 # 1441
+xors 4, 1, sb281, sb465, sb239 # 1442
+xors 4, 1, sb293, sb286, sb58 # 1443
+xors 4, 1, sb312, sb11, sb293 # 1444
+xors 4, 1, sb2, sb293, sb489 # 1445
+xors 4, 1, sb93, sb286, sb57 # 1446
+xors 4, 1, sb463, sb489, sb464 # 1447
+xors 4, 1, sb342, sb463, sb93 # 1448
+xors 4, 1, sb492, sb93, sb489 # 1449
+ands 52, 1, sb52, sb267, sb460, 1, sb499, sb266, sb53, 1, sb458, sb90, sb92, 1, sb261, sb90, sb271, 1, sb253, sb90, sb54, 1, sb417, sb90, sb461, 1, sb50, sb90, sb273, 1, sb251, sb55, sb275, 1, sb248, sb85, sb462, 1, sb455, sb418, sb279, 1, sb48, sb56, sb281, 1, sb91, sb11, sb2, 1, sb47, sb463, sb492 # 1450
+xors 4, 1, sb83, sb459, sb52 # 1451
+xors 4, 1, sb259, sb459, sb499 # 1452
+xors 4, 1, sb497, sb259, sb83 # 1453
+xors 4, 1, sb254, sb458, sb260 # 1454
+xors 4, 1, sb255, sb261, sb10 # 1455
+xors 4, 1, sb51, sb253, sb409 # 1456
+xors 4, 1, sb256, sb417, sb457 # 1457
+xors 4, 1, sb257, sb50, sb250 # 1458
+xors 4, 1, sb247, sb245, sb251 # 1459
+xors 4, 1, sb167, sb225, sb247 # 1460
+xors 4, 1, sb220, sb247, sb217 # 1461
+xors 4, 1, sb243, sb245, sb248 # 1462
+xors 4, 1, sb246, sb222, sb243 # 1463
+xors 4, 1, sb188, sb246, sb167 # 1464
+xors 4, 1, sb44, sb243, sb217 # 1465
+xors 4, 1, sb456, sb239, sb455 # 1466
+xors 4, 1, sb360, sb45, sb456 # 1467
+xors 4, 1, sb224, sb456, sb206 # 1468
+xors 4, 1, sb454, sb239, sb48 # 1469
+xors 4, 1, sb498, sb452, sb454 # 1470
+xors 4, 1, sb395, sb498, sb360 # 1471
+xors 4, 1, sb9, sb454, sb206 # 1472
+xors 4, 1, sb235, sb489, sb91 # 1473
+xors 4, 1, sb310, sb231, sb235 # 1474
+xors 4, 1, sb82, sb235, sb447 # 1475
+xors 4, 1, sb416, sb489, sb47 # 1476
+xors 4, 1, sb229, sb447, sb46 # 1477
+xors 4, 1, sb341, sb229, sb416 # 1478
+xors 4, 1, sb18, sb416, sb447 # 1479
+ands 28, 1, sb508, sb90, sb497, 1, sb214, sb225, sb220, 1, sb42, sb222, sb44, 1, sb505, sb45, sb224, 1, sb8, sb452, sb9, 1, sb40, sb231, sb82, 1, sb200, sb229, sb18 # 1480
+xors 4, 1, sb134, sb508, sb83 # 1481
+xors 4, 1, sb43, sb217, sb214 # 1482
+xors 4, 1, sb160, sb35, sb43 # 1483
+xors 4, 1, sb178, sb43, sb176 # 1484
+xors 4, 1, sb450, sb217, sb42 # 1485
+xors 4, 1, sb210, sb180, sb450 # 1486
+xors 4, 1, sb496, sb210, sb160 # 1487
+xors 4, 1, sb7, sb450, sb176 # 1488
+xors 4, 1, sb490, sb206, sb505 # 1489
+xors 4, 1, sb358, sb189, sb490 # 1490
+xors 4, 1, sb99, sb490, sb0 # 1491
+xors 4, 1, sb41, sb206, sb8 # 1492
+xors 4, 1, sb449, sb191, sb41 # 1493
+xors 4, 1, sb397, sb449, sb358 # 1494
+xors 4, 1, sb192, sb41, sb0 # 1495
+xors 4, 1, sb202, sb447, sb40 # 1496
+xors 4, 1, sb307, sb193, sb202 # 1497
+xors 4, 1, sb415, sb202, sb148 # 1498
+xors 4, 1, sb197, sb447, sb200 # 1499
+xors 4, 1, sb195, sb148, sb198 # 1500
+xors 4, 1, sb475, sb195, sb197 # 1501
+xors 4, 1, sb196, sb197, sb148 # 1502
+ands 48, 1, sb442, sb35, sb178, 1, sb177, sb180, sb7, 1, sb101, sb134, sb443, 1, sb166, sb134, sb183, 1, sb164, sb134, sb89, 1, sb495, sb134, sb186, 1, sb506, sb134, sb188, 1, sb158, sb134, sb496, 1, sb157, sb189, sb99, 1, sb1, sb191, sb192, 1, sb437, sb193, sb415, 1, sb413, sb195, sb196 # 1503
+xors 4, 1, sb133, sb176, sb442 # 1504
+xors 4, 1, sb441, sb176, sb177 # 1505
+xors 4, 1, sb136, sb441, sb133 # 1506
+xors 4, 1, sb258, sb101, sb171 # 1507
+xors 4, 1, sb262, sb166, sb88 # 1508
+xors 4, 1, sb263, sb164, sb165 # 1509
+xors 4, 1, sb264, sb495, sb168 # 1510
+xors 4, 1, sb265, sb506, sb167 # 1511
+xors 4, 1, sb268, sb158, sb160 # 1512
+xors 4, 1, sb438, sb0, sb157 # 1513
+xors 4, 1, sb356, sb27, sb438 # 1514
+xors 4, 1, sb142, sb438, sb26 # 1515
+xors 4, 1, sb6, sb0, sb1 # 1516
+xors 4, 1, sb407, sb435, sb6 # 1517
+xors 4, 1, sb399, sb407, sb356 # 1518
+xors 4, 1, sb28, sb6, sb26 # 1519
+xors 4, 1, sb30, sb148, sb437 # 1520
+xors 4, 1, sb302, sb494, sb30 # 1521
+xors 4, 1, sb87, sb30, sb16 # 1522
+xors 4, 1, sb436, sb148, sb413 # 1523
+xors 4, 1, sb144, sb16, sb147 # 1524
+xors 4, 1, sb339, sb144, sb436 # 1525
+xors 4, 1, sb29, sb436, sb16 # 1526
+ands 20, 1, sb434, sb134, sb136, 1, sb5, sb27, sb142, 1, sb129, sb435, sb28, 1, sb120, sb494, sb87, 1, sb108, sb144, sb29 # 1527
+xors 4, 1, sb373, sb434, sb133 # 1528
+xors 4, 1, sb433, sb26, sb5 # 1529
+xors 4, 1, sb353, sb381, sb433 # 1530
+xors 4, 1, sb382, sb433, sb377 # 1531
+xors 4, 1, sb130, sb26, sb129 # 1532
+xors 4, 1, sb408, sb383, sb130 # 1533
+xors 4, 1, sb401, sb408, sb353 # 1534
+xors 4, 1, sb387, sb130, sb377 # 1535
+xors 4, 1, sb119, sb16, sb120 # 1536
+xors 4, 1, sb300, sb403, sb119 # 1537
+xors 4, 1, sb405, sb119, sb476 # 1538
+xors 4, 1, sb71, sb16, sb108 # 1539
+xors 4, 1, sb31, sb476, sb15 # 1540
+xors 4, 1, sb98, sb31, sb71 # 1541
+xors 4, 1, sb39, sb71, sb476 # 1542
+ands 44, 1, sb380, sb381, sb382, 1, sb379, sb383, sb387, 1, sb367, sb373, sb388, 1, sb363, sb373, sb391, 1, sb361, sb373, sb393, 1, sb359, sb373, sb395, 1, sb357, sb373, sb397, 1, sb354, sb373, sb399, 1, sb348, sb373, sb401, 1, sb347, sb403, sb405, 1, sb346, sb31, sb39 # 1543
+xors 4, 1, sb371, sb377, sb380 # 1544
+xors 4, 1, sb375, sb377, sb379 # 1545
+xors 4, 1, sb374, sb375, sb371 # 1546
+ands 4, 1, sb369, sb373, sb374 # 1547
+xors 4, 1, sb320, sb369, sb371 # 1548
+xors 4, 1, sb269, sb367, sb368 # 1549
+xors 4, 1, sb270, sb363, sb364 # 1550
+xors 4, 1, sb272, sb361, sb362 # 1551
+xors 4, 1, sb274, sb359, sb360 # 1552
+xors 4, 1, sb276, sb357, sb358 # 1553
+xors 4, 1, sb277, sb354, sb356 # 1554
+xors 4, 1, sb278, sb348, sb353 # 1555
+xors 4, 1, sb466, sb476, sb347 # 1556
+xors 4, 1, sb338, sb476, sb346 # 1557
+xors 4, 1, sb472, sb344, sb319 # 1558
+xors 4, 1, sb325, sb343, sb316 # 1559
+xors 4, 1, sb327, sb342, sb312 # 1560
+xors 4, 1, sb13, sb341, sb310 # 1561
+xors 4, 1, sb420, sb475, sb307 # 1562
+xors 4, 1, sb329, sb339, sb302 # 1563
+xors 4, 1, sb66, sb98, sb300 # 1564
+xors 4, 1, sb333, sb338, sb466 # 1565
+ands 32, 1, sb318, sb320, sb472, 1, sb313, sb320, sb325, 1, sb311, sb320, sb327, 1, sb308, sb320, sb13, 1, sb304, sb320, sb420, 1, sb301, sb320, sb329, 1, sb296, sb320, sb66, 1, sb294, sb320, sb333 # 1566
+xors 4, 1, sb280, sb318, sb319 # 1567
+xors 4, 1, sb282, sb313, sb316 # 1568
+xors 4, 1, sb283, sb311, sb312 # 1569
+xors 4, 1, sb284, sb308, sb310 # 1570
+xors 4, 1, sb285, sb304, sb307 # 1571
+xors 4, 1, sb287, sb301, sb302 # 1572
+xors 4, 1, sb288, sb296, sb300 # 1573
+xors 4, 1, sb292, sb294, sb466 # 1574
+convcbitvec 1, ci4, cb17 # 1575
+convcbitvec 1, ci3, cb16 # 1576
+convcbitvec 1, ci2, cb15 # 1577
+convcbitvec 1, ci1, cb14 # 1578
+convcbitvec 1, ci0, cb13 # 1579
+convint c3, ci4 # 1580
+ldsi s21, 0 # 1581
+addm s17, s21, c3 # 1582
+convint c6, ci3 # 1583
+ldsi s20, 0 # 1584
+addm s16, s20, c6 # 1585
+mulsi s18, s16, 2 # 1586
+adds s10, s17, s18 # 1587
+convint c5, ci2 # 1588
+ldsi s16, 0 # 1589
+addm s15, s16, c5 # 1590
+mulsi s13, s15, 4 # 1591
+adds s7, s10, s13 # 1592
+convint c4, ci1 # 1593
+ldsi s10, 0 # 1594
+addm s6, s10, c4 # 1595
+mulsi s8, s6, 8 # 1596
+adds s3, s7, s8 # 1597
+convint c7, ci0 # 1598
+ldsi s6, 0 # 1599
+addm s5, s6, c7 # 1600
+mulsi s4, s5, 16 # 1601
+adds s2, s3, s4 # 1602
+ldsi s34, 0 # 1603
+ldsi s33, 0 # 1604
+ldsi s32, 0 # 1605
+ldsi s31, 0 # 1606
+ldsi s30, 0 # 1607
+ldsi s29, 0 # 1608
+ldsi s28, 0 # 1609
+ldsi s27, 0 # 1610
+ldsi s26, 0 # 1611
+ldsi s25, 0 # 1612
+ldsi s24, 0 # 1613
+ldsi s7, 0 # 1614
+ldsi s5, 0 # 1615
+ldsi s10, 0 # 1616
+ldsi s3, 0 # 1617
+ldsi s4, 0 # 1618
+ldsi s21, 0 # 1619
+ldsi s0, 0 # 1620
+ldsi s18, 0 # 1621
+ldsi s13, 0 # 1622
+ldsi s15, 0 # 1623
+ldsi s23, 0 # 1624
+ldsi s22, 0 # 1625
+ldsi s8, 0 # 1626
+ldsi s6, 0 # 1627
+ldsi s17, 0 # 1628
+dabit s16, sb290 # 1629
+xors 4, 1, sb289, sb290, sb292 # 1630
+reveal 81, 1, cb26, sb252, 1, cb25, sb254, 1, cb24, sb255, 1, cb23, sb51, 1, cb22, sb256, 1, cb21, sb257, 1, cb20, sb258, 1, cb19, sb262, 1, cb18, sb263, 1, cb17, sb264, 1, cb16, sb265, 1, cb15, sb268, 1, cb14, sb269, 1, cb13, sb270, 1, cb12, sb272, 1, cb11, sb274, 1, cb10, sb276, 1, cb9, sb277, 1, cb8, sb278, 1, cb7, sb280, 1, cb2, sb282, 1, cb4, sb283, 1, cb5, sb284, 1, cb1, sb285, 1, cb0, sb287, 1, cb6, sb288, 1, cb3, sb289 # 1631
+convcbitvec 1, ci0, cb26 # 1632
+convint c2, ci0 # 1633
+addm s20, s34, c2 # 1634
+mulsi s34, s20, 32 # 1635
+adds s20, s2, s34 # 1636
+convcbitvec 1, ci0, cb25 # 1637
+convint c1, ci0 # 1638
+addm s2, s33, c1 # 1639
+mulsi s33, s2, 64 # 1640
+adds s2, s20, s33 # 1641
+convcbitvec 1, ci0, cb24 # 1642
+convint c3, ci0 # 1643
+addm s20, s32, c3 # 1644
+mulsi s32, s20, 128 # 1645
+adds s20, s2, s32 # 1646
+convcbitvec 1, ci0, cb23 # 1647
+convint c6, ci0 # 1648
+addm s2, s31, c6 # 1649
+mulsi s31, s2, 256 # 1650
+adds s2, s20, s31 # 1651
+convcbitvec 1, ci0, cb22 # 1652
+convint c5, ci0 # 1653
+addm s20, s30, c5 # 1654
+mulsi s30, s20, 512 # 1655
+adds s20, s2, s30 # 1656
+convcbitvec 1, ci0, cb21 # 1657
+convint c4, ci0 # 1658
+addm s2, s29, c4 # 1659
+mulsi s29, s2, 1024 # 1660
+adds s2, s20, s29 # 1661
+convcbitvec 1, ci0, cb20 # 1662
+convint c7, ci0 # 1663
+addm s20, s28, c7 # 1664
+mulsi s28, s20, 2048 # 1665
+adds s20, s2, s28 # 1666
+convcbitvec 1, ci0, cb19 # 1667
+convint c2, ci0 # 1668
+addm s2, s27, c2 # 1669
+mulsi s27, s2, 4096 # 1670
+adds s2, s20, s27 # 1671
+convcbitvec 1, ci0, cb18 # 1672
+convint c1, ci0 # 1673
+addm s20, s26, c1 # 1674
+mulsi s26, s20, 8192 # 1675
+adds s20, s2, s26 # 1676
+convcbitvec 1, ci0, cb17 # 1677
+convint c3, ci0 # 1678
+addm s2, s25, c3 # 1679
+mulsi s25, s2, 16384 # 1680
+adds s2, s20, s25 # 1681
+convcbitvec 1, ci0, cb16 # 1682
+convint c6, ci0 # 1683
+addm s20, s24, c6 # 1684
+mulsi s24, s20, 32768 # 1685
+adds s20, s2, s24 # 1686
+convcbitvec 1, ci0, cb15 # 1687
+convint c5, ci0 # 1688
+addm s2, s7, c5 # 1689
+mulsi s7, s2, 65536 # 1690
+adds s2, s20, s7 # 1691
+convcbitvec 1, ci0, cb14 # 1692
+convint c4, ci0 # 1693
+addm s7, s5, c4 # 1694
+mulsi s20, s7, 131072 # 1695
+adds s5, s2, s20 # 1696
+convcbitvec 1, ci0, cb13 # 1697
+convint c7, ci0 # 1698
+addm s7, s10, c7 # 1699
+mulsi s20, s7, 262144 # 1700
+adds s7, s5, s20 # 1701
+convcbitvec 1, ci0, cb12 # 1702
+convint c2, ci0 # 1703
+addm s2, s3, c2 # 1704
+mulsi s10, s2, 524288 # 1705
+adds s3, s7, s10 # 1706
+convcbitvec 1, ci0, cb11 # 1707
+convint c1, ci0 # 1708
+addm s20, s4, c1 # 1709
+mulsi s5, s20, 1048576 # 1710
+adds s7, s3, s5 # 1711
+convcbitvec 1, ci0, cb10 # 1712
+convint c3, ci0 # 1713
+addm s2, s21, c3 # 1714
+mulsi s10, s2, 2097152 # 1715
+adds s5, s7, s10 # 1716
+convcbitvec 1, ci0, cb9 # 1717
+convint c6, ci0 # 1718
+addm s4, s0, c6 # 1719
+mulsi s20, s4, 4194304 # 1720
+adds s2, s5, s20 # 1721
+convcbitvec 1, ci0, cb8 # 1722
+convint c5, ci0 # 1723
+addm s3, s18, c5 # 1724
+mulsi s21, s3, 8388608 # 1725
+adds s0, s2, s21 # 1726
+convcbitvec 1, ci0, cb7 # 1727
+convint c4, ci0 # 1728
+addm s10, s13, c4 # 1729
+mulsi s7, s10, 16777216 # 1730
+adds s21, s0, s7 # 1731
+convcbitvec 1, ci0, cb2 # 1732
+convint c7, ci0 # 1733
+addm s4, s15, c7 # 1734
+mulsi s20, s4, 33554432 # 1735
+adds s5, s21, s20 # 1736
+convcbitvec 1, ci0, cb4 # 1737
+convint c2, ci0 # 1738
+addm s18, s23, c2 # 1739
+mulsi s3, s18, 67108864 # 1740
+adds s10, s5, s3 # 1741
+convcbitvec 1, ci0, cb5 # 1742
+convint c1, ci0 # 1743
+addm s13, s22, c1 # 1744
+mulsi s2, s13, 134217728 # 1745
+adds s5, s10, s2 # 1746
+convcbitvec 1, ci0, cb1 # 1747
+convint c3, ci0 # 1748
+addm s7, s8, c3 # 1749
+mulsi s0, s7, 268435456 # 1750
+adds s20, s5, s0 # 1751
+convcbitvec 1, ci0, cb0 # 1752
+convint c6, ci0 # 1753
+addm s15, s6, c6 # 1754
+mulsi s4, s15, 536870912 # 1755
+adds s3, s20, s4 # 1756
+convcbitvec 1, ci0, cb6 # 1757
+convint c5, ci0 # 1758
+addm s21, s17, c5 # 1759
+mulsi s23, s21, 1073741824 # 1760
+adds s18, s3, s23 # 1761
+subs s7, s18, s19 # 1762
+convcbitvec 1, ci0, cb3 # 1763
+convint c4, ci0 # 1764
+addm s13, s16, c4 # 1765
+mulsi s22, s16, 2 # 1766
+convint c7, ci0 # 1767
+mulm s15, s22, c7 # 1768
+subs s10, s13, s15 # 1769
+movs s2, s10 # 1770
+ldi c3, 1 # 1771
+mulci c2, c3, 2147483647 # 1772
+addci c1, c2, 1 # 1773
+mulm s8, s2, c1 # 1774
+adds s5, s7, s8 # 1775
+muls 8, 1, s0, s1, s5, 1, s4, s9, s5 # 1776
+mulsi s6, s0, 2 # 1777
+subs s20, s12, s6 # 1778
+muls 4, 1, s22, s20, s4 # 1779
+addsi s17, s22, 536870912 # 1780
+ldi c5, 2 # 1781
+mulci c6, c5, 2147483647 # 1782
+addci c3, c6, 4 # 1783
+mulci c4, c3, 2147483647 # 1784
+addci c7, c4, 2 # 1785
+addm s21, s17, c7 # 1786
+split 194, 3, s21, sb49, sb249, sb453, sb242, sb244, sb448, sb240, sb241, sb488, sb237, sb238, sb3, sb236, sb643, sb406, sb234, sb642, sb402, sb640, sb233, sb404, sb638, sb232, sb486, sb636, sb230, sb97, sb635, sb228, sb398, sb634, sb227, sb394, sb632, sb226, sb504, sb533, sb631, sb390, sb630, sb223, sb484, sb628, sb221, sb386, sb219, sb626, sb389, sb218, sb625, sb483, sb623, sb624, sb410, sb622, sb216, sb482, sb621, sb215, sb376, sb212, sb213, sb15, sb617, sb211, sb96, sb616, sb209, sb73, sb208, sb615, sb503, sb207, sb614, sb411, sb205, sb612, sb72, sb610, sb204, sb366, sb609, sb203, sb426, sb201, sb608, sb421, sb606, sb199, sb355, sb602, sb604, sb70, sb194, sb446, sb351, sb598, sb600, sb477, sb597, sb38, sb69, sb190, sb445, sb68, sb594, sb526, sb84, sb593, sb187, sb491, sb592, sb185, sb337, sb184, sb444, sb335, sb182, sb591, sb474, sb181, sb589, sb473, sb586, sb588, sb331, sb584, sb179, sb65, sb175, sb582, sb324, sb174, sb581, sb64, sb580, sb173, sb321, sb579, sb172, sb94, sb578, sb171, sb470, sb169, sb577, sb314, sb115, sb576, sb62, sb574, sb575, sb469, sb440, sb33, sb315, sb571, sb572, sb306, sb162, sb163, sb419, sb32, sb161, sb467, sb160, sb568, sb468, sb159, sb567, sb298, sb564, sb566, sb59, sb155, sb156, sb295, sb560, sb154, sb465, sb152, sb153, sb58, sb151, sb559, sb293, sb557, sb558, sb93, sb149, sb556, sb284 # 1787
+xors 4, 1, sb464, sb453, sb249 # 1788
+xors 4, 1, sb502, sb49, sb453 # 1789
+xors 4, 1, sb479, sb448, sb244 # 1790
+xors 4, 1, sb36, sb479, sb242 # 1791
+xors 4, 1, sb520, sb242, sb448 # 1792
+xors 4, 1, sb528, sb488, sb241 # 1793
+xors 4, 1, sb37, sb528, sb240 # 1794
+xors 4, 1, sb536, sb240, sb488 # 1795
+xors 4, 1, sb538, sb3, sb238 # 1796
+xors 4, 1, sb180, sb538, sb237 # 1797
+xors 4, 1, sb17, sb237, sb3 # 1798
+xors 4, 1, sb537, sb406, sb643 # 1799
+xors 4, 1, sb176, sb537, sb236 # 1800
+xors 4, 1, sb514, sb236, sb406 # 1801
+xors 4, 1, sb509, sb402, sb642 # 1802
+xors 4, 1, sb414, sb509, sb234 # 1803
+xors 4, 1, sb539, sb234, sb402 # 1804
+xors 4, 1, sb424, sb404, sb233 # 1805
+xors 4, 1, sb34, sb424, sb640 # 1806
+xors 4, 1, sb541, sb640, sb404 # 1807
+xors 4, 1, sb542, sb486, sb232 # 1808
+xors 4, 1, sb170, sb542, sb638 # 1809
+xors 4, 1, sb510, sb638, sb486 # 1810
+xors 4, 1, sb515, sb97, sb230 # 1811
+xors 4, 1, sb506, sb515, sb636 # 1812
+xors 4, 1, sb109, sb636, sb97 # 1813
+xors 4, 1, sb546, sb398, sb228 # 1814
+xors 4, 1, sb167, sb546, sb635 # 1815
+xors 4, 1, sb103, sb635, sb398 # 1816
+xors 4, 1, sb549, sb394, sb227 # 1817
+xors 4, 1, sb495, sb549, sb634 # 1818
+xors 4, 1, sb516, sb634, sb394 # 1819
+xors 4, 1, sb550, sb504, sb226 # 1820
+xors 4, 1, sb168, sb550, sb632 # 1821
+xors 4, 1, sb555, sb632, sb504 # 1822
+xors 4, 1, sb110, sb390, sb631 # 1823
+xors 4, 1, sb439, sb110, sb533 # 1824
+xors 4, 1, sb554, sb533, sb390 # 1825
+xors 4, 1, sb517, sb484, sb223 # 1826
+xors 4, 1, sb158, sb517, sb630 # 1827
+xors 4, 1, sb429, sb630, sb484 # 1828
+xors 4, 1, sb22, sb386, sb221 # 1829
+xors 4, 1, sb31, sb22, sb628 # 1830
+xors 4, 1, sb518, sb628, sb386 # 1831
+xors 4, 1, sb111, sb389, sb626 # 1832
+xors 4, 1, sb6, sb111, sb219 # 1833
+xors 4, 1, sb112, sb219, sb389 # 1834
+xors 4, 1, sb561, sb483, sb625 # 1835
+xors 4, 1, sb407, sb561, sb218 # 1836
+xors 4, 1, sb562, sb218, sb483 # 1837
+xors 4, 1, sb563, sb410, sb624 # 1838
+xors 4, 1, sb150, sb563, sb623 # 1839
+xors 4, 1, sb519, sb623, sb410 # 1840
+xors 4, 1, sb565, sb482, sb216 # 1841
+xors 4, 1, sb148, sb565, sb622 # 1842
+xors 4, 1, sb511, sb622, sb482 # 1843
+xors 4, 1, sb569, sb376, sb215 # 1844
+xors 4, 1, sb29, sb569, sb621 # 1845
+xors 4, 1, sb102, sb621, sb376 # 1846
+xors 4, 1, sb113, sb15, sb213 # 1847
+xors 4, 1, sb144, sb113, sb212 # 1848
+xors 4, 1, sb570, sb212, sb15 # 1849
+xors 4, 1, sb573, sb96, sb211 # 1850
+xors 4, 1, sb142, sb573, sb617 # 1851
+xors 4, 1, sb521, sb617, sb96 # 1852
+xors 4, 1, sb104, sb73, sb209 # 1853
+xors 4, 1, sb436, sb104, sb616 # 1854
+xors 4, 1, sb114, sb616, sb73 # 1855
+xors 4, 1, sb522, sb503, sb615 # 1856
+xors 4, 1, sb494, sb522, sb208 # 1857
+xors 4, 1, sb430, sb208, sb503 # 1858
+xors 4, 1, sb23, sb411, sb614 # 1859
+xors 4, 1, sb434, sb23, sb207 # 1860
+xors 4, 1, sb583, sb207, sb411 # 1861
+xors 4, 1, sb116, sb72, sb612 # 1862
+xors 4, 1, sb134, sb116, sb205 # 1863
+xors 4, 1, sb523, sb205, sb72 # 1864
+xors 4, 1, sb585, sb366, sb204 # 1865
+xors 4, 1, sb136, sb585, sb610 # 1866
+xors 4, 1, sb493, sb610, sb366 # 1867
+xors 4, 1, sb587, sb426, sb203 # 1868
+xors 4, 1, sb130, sb587, sb609 # 1869
+xors 4, 1, sb117, sb609, sb426 # 1870
+xors 4, 1, sb524, sb421, sb608 # 1871
+xors 4, 1, sb408, sb524, sb201 # 1872
+xors 4, 1, sb590, sb201, sb421 # 1873
+xors 4, 1, sb86, sb355, sb199 # 1874
+xors 4, 1, sb26, sb86, sb606 # 1875
+xors 4, 1, sb595, sb606, sb355 # 1876
+xors 4, 1, sb525, sb70, sb604 # 1877
+xors 4, 1, sb39, sb525, sb602 # 1878
+xors 4, 1, sb118, sb602, sb70 # 1879
+xors 4, 1, sb599, sb351, sb446 # 1880
+xors 4, 1, sb199, sb599, sb194 # 1881
+xors 4, 1, sb596, sb194, sb351 # 1882
+xors 4, 1, sb512, sb477, sb600 # 1883
+xors 4, 1, sb415, sb512, sb598 # 1884
+xors 4, 1, sb105, sb598, sb477 # 1885
+xors 4, 1, sb601, sb69, sb38 # 1886
+xors 4, 1, sb41, sb601, sb597 # 1887
+xors 4, 1, sb605, sb597, sb69 # 1888
+xors 4, 1, sb603, sb68, sb445 # 1889
+xors 4, 1, sb449, sb603, sb190 # 1890
+xors 4, 1, sb607, sb190, sb68 # 1891
+xors 4, 1, sb4, sb84, sb526 # 1892
+xors 4, 1, sb490, sb4, sb594 # 1893
+xors 4, 1, sb527, sb594, sb84 # 1894
+xors 4, 1, sb24, sb491, sb187 # 1895
+xors 4, 1, sb505, sb24, sb593 # 1896
+xors 4, 1, sb431, sb593, sb491 # 1897
+xors 4, 1, sb21, sb337, sb185 # 1898
+xors 4, 1, sb450, sb21, sb592 # 1899
+xors 4, 1, sb428, sb592, sb337 # 1900
+xors 4, 1, sb121, sb335, sb444 # 1901
+xors 4, 1, sb217, sb121, sb184 # 1902
+xors 4, 1, sb611, sb184, sb335 # 1903
+xors 4, 1, sb529, sb474, sb591 # 1904
+xors 4, 1, sb451, sb529, sb182 # 1905
+xors 4, 1, sb613, sb182, sb474 # 1906
+xors 4, 1, sb122, sb473, sb589 # 1907
+xors 4, 1, sb43, sb122, sb181 # 1908
+xors 4, 1, sb123, sb181, sb473 # 1909
+xors 4, 1, sb530, sb331, sb588 # 1910
+xors 4, 1, sb225, sb530, sb586 # 1911
+xors 4, 1, sb618, sb586, sb331 # 1912
+xors 4, 1, sb619, sb65, sb179 # 1913
+xors 4, 1, sb222, sb619, sb584 # 1914
+xors 4, 1, sb620, sb584, sb65 # 1915
+xors 4, 1, sb531, sb324, sb582 # 1916
+xors 4, 1, sb45, sb531, sb175 # 1917
+xors 4, 1, sb106, sb175, sb324 # 1918
+xors 4, 1, sb513, sb64, sb581 # 1919
+xors 4, 1, sb425, sb513, sb174 # 1920
+xors 4, 1, sb124, sb174, sb64 # 1921
+xors 4, 1, sb432, sb321, sb173 # 1922
+xors 4, 1, sb452, sb432, sb580 # 1923
+xors 4, 1, sb125, sb580, sb321 # 1924
+xors 4, 1, sb627, sb94, sb172 # 1925
+xors 4, 1, sb9, sb627, sb579 # 1926
+xors 4, 1, sb629, sb579, sb94 # 1927
+xors 4, 1, sb532, sb470, sb171 # 1928
+xors 4, 1, sb231, sb532, sb578 # 1929
+xors 4, 1, sb25, sb578, sb470 # 1930
+xors 4, 1, sb412, sb314, sb577 # 1931
+xors 4, 1, sb82, sb412, sb169 # 1932
+xors 4, 1, sb633, sb169, sb314 # 1933
+xors 4, 1, sb126, sb62, sb576 # 1934
+xors 4, 1, sb47, sb126, sb115 # 1935
+xors 4, 1, sb127, sb115, sb62 # 1936
+xors 4, 1, sb637, sb469, sb575 # 1937
+xors 4, 1, sb91, sb637, sb574 # 1938
+xors 4, 1, sb534, sb574, sb469 # 1939
+xors 4, 1, sb639, sb315, sb33 # 1940
+xors 4, 1, sb498, sb639, sb440 # 1941
+xors 4, 1, sb535, sb440, sb315 # 1942
+xors 4, 1, sb641, sb306, sb572 # 1943
+xors 4, 1, sb48, sb641, sb571 # 1944
+xors 4, 1, sb128, sb571, sb306 # 1945
+xors 4, 1, sb107, sb419, sb163 # 1946
+xors 4, 1, sb456, sb107, sb162 # 1947
+xors 4, 1, sb644, sb162, sb419 # 1948
+xors 4, 1, sb131, sb467, sb161 # 1949
+xors 4, 1, sb246, sb131, sb32 # 1950
+xors 4, 1, sb132, sb32, sb467 # 1951
+xors 4, 1, sb540, sb468, sb568 # 1952
+xors 4, 1, sb248, sb540, sb160 # 1953
+xors 4, 1, sb135, sb160, sb468 # 1954
+xors 4, 1, sb543, sb298, sb567 # 1955
+xors 4, 1, sb251, sb543, sb159 # 1956
+xors 4, 1, sb137, sb159, sb298 # 1957
+xors 4, 1, sb544, sb59, sb566 # 1958
+xors 4, 1, sb50, sb544, sb564 # 1959
+xors 4, 1, sb545, sb564, sb59 # 1960
+xors 4, 1, sb138, sb295, sb156 # 1961
+xors 4, 1, sb417, sb138, sb155 # 1962
+xors 4, 1, sb139, sb155, sb295 # 1963
+xors 4, 1, sb140, sb465, sb154 # 1964
+xors 4, 1, sb409, sb140, sb560 # 1965
+xors 4, 1, sb547, sb560, sb465 # 1966
+xors 4, 1, sb548, sb58, sb153 # 1967
+xors 4, 1, sb261, sb548, sb152 # 1968
+xors 4, 1, sb141, sb152, sb58 # 1969
+xors 4, 1, sb143, sb293, sb559 # 1970
+xors 4, 1, sb260, sb143, sb151 # 1971
+xors 4, 1, sb551, sb151, sb293 # 1972
+xors 4, 1, sb145, sb93, sb558 # 1973
+xors 4, 1, sb459, sb145, sb557 # 1974
+xors 4, 1, sb552, sb557, sb93 # 1975
+xors 4, 1, sb553, sb284, sb556 # 1976
+xors 4, 1, sb499, sb553, sb149 # 1977
+xors 4, 1, sb146, sb149, sb284 # 1978
+ands 256, 1, sb18, sb464, sb502, 1, sb90, sb479, sb520, 1, sb89, sb528, sb536, 1, sb81, sb538, sb17, 1, sb423, sb537, sb514, 1, sb487, sb509, sb539, 1, sb80, sb424, sb541, 1, sb400, sb542, sb510, 1, sb79, sb515, sb109, 1, sb396, sb546, sb103, 1, sb485, sb549, sb516, 1, sb392, sb550, sb555, 1, sb78, sb110, sb554, 1, sb77, sb517, sb429, 1, sb385, sb22, sb518, 1, sb76, sb111, sb112, 1, sb422, sb561, sb562, 1, sb384, sb563, sb519, 1, sb378, sb565, sb511, 1, sb75, sb569, sb102, 1, sb74, sb113, sb570, 1, sb372, sb573, sb521, 1, sb481, sb104, sb114, 1, sb370, sb522, sb430, 1, sb480, sb23, sb583, 1, sb20, sb116, sb523, 1, sb365, sb585, sb493, 1, sb427, sb587, sb117, 1, sb478, sb524, sb590, 1, sb14, sb86, sb595, 1, sb19, sb525, sb118, 1, sb352, sb599, sb596, 1, sb350, sb512, sb105, 1, sb349, sb601, sb605, 1, sb345, sb603, sb607, 1, sb95, sb4, sb527, 1, sb340, sb24, sb431, 1, sb67, sb21, sb428, 1, sb336, sb121, sb611, 1, sb334, sb529, sb613, 1, sb332, sb122, sb123, 1, sb330, sb530, sb618, 1, sb328, sb619, sb620, 1, sb326, sb531, sb106, 1, sb323, sb513, sb124, 1, sb471, sb432, sb125, 1, sb322, sb627, sb629, 1, sb63, sb532, sb25, 1, sb501, sb412, sb633, 1, sb317, sb126, sb127, 1, sb100, sb637, sb534, 1, sb309, sb639, sb535, 1, sb61, sb641, sb128, 1, sb305, sb107, sb644, 1, sb12, sb131, sb132, 1, sb60, sb540, sb135, 1, sb303, sb543, sb137, 1, sb297, sb544, sb545, 1, sb299, sb138, sb139, 1, sb500, sb140, sb547, 1, sb291, sb548, sb141, 1, sb507, sb143, sb551, 1, sb57, sb145, sb552, 1, sb286, sb553, sb146 # 1979
+xors 4, 1, sb7, sb453, sb18 # 1980
+xors 4, 1, sb183, sb448, sb90 # 1981
+xors 4, 1, sb177, sb488, sb89 # 1982
+xors 4, 1, sb442, sb3, sb81 # 1983
+xors 4, 1, sb443, sb406, sb423 # 1984
+xors 4, 1, sb441, sb402, sb487 # 1985
+xors 4, 1, sb178, sb404, sb80 # 1986
+xors 4, 1, sb88, sb486, sb400 # 1987
+xors 4, 1, sb165, sb97, sb79 # 1988
+xors 4, 1, sb101, sb398, sb396 # 1989
+xors 4, 1, sb164, sb394, sb485 # 1990
+xors 4, 1, sb166, sb504, sb392 # 1991
+xors 4, 1, sb157, sb390, sb78 # 1992
+xors 4, 1, sb0, sb484, sb77 # 1993
+xors 4, 1, sb1, sb386, sb385 # 1994
+xors 4, 1, sb438, sb389, sb76 # 1995
+xors 4, 1, sb413, sb483, sb422 # 1996
+xors 4, 1, sb30, sb410, sb384 # 1997
+xors 4, 1, sb437, sb482, sb378 # 1998
+xors 4, 1, sb147, sb376, sb75 # 1999
+xors 4, 1, sb435, sb15, sb74 # 2000
+xors 4, 1, sb87, sb96, sb372 # 2001
+xors 4, 1, sb140, sb73, sb481 # 2002
+xors 4, 1, sb27, sb503, sb370 # 2003
+xors 4, 1, sb133, sb411, sb480 # 2004
+xors 4, 1, sb433, sb72, sb20 # 2005
+xors 4, 1, sb129, sb366, sb365 # 2006
+xors 4, 1, sb5, sb426, sb427 # 2007
+xors 4, 1, sb120, sb421, sb478 # 2008
+xors 4, 1, sb206, sb355, sb14 # 2009
+xors 4, 1, sb447, sb70, sb19 # 2010
+xors 4, 1, sb202, sb351, sb352 # 2011
+xors 4, 1, sb210, sb477, sb350 # 2012
+xors 4, 1, sb8, sb69, sb349 # 2013
+xors 4, 1, sb208, sb68, sb345 # 2014
+xors 4, 1, sb497, sb84, sb95 # 2015
+xors 4, 1, sb42, sb491, sb340 # 2016
+xors 4, 1, sb214, sb337, sb67 # 2017
+xors 4, 1, sb508, sb335, sb336 # 2018
+xors 4, 1, sb218, sb474, sb334 # 2019
+xors 4, 1, sb220, sb473, sb332 # 2020
+xors 4, 1, sb44, sb331, sb330 # 2021
+xors 4, 1, sb224, sb65, sb328 # 2022
+xors 4, 1, sb229, sb324, sb326 # 2023
+xors 4, 1, sb416, sb64, sb323 # 2024
+xors 4, 1, sb489, sb321, sb471 # 2025
+xors 4, 1, sb46, sb94, sb322 # 2026
+xors 4, 1, sb235, sb470, sb63 # 2027
+xors 4, 1, sb454, sb314, sb501 # 2028
+xors 4, 1, sb239, sb62, sb317 # 2029
+xors 4, 1, sb455, sb469, sb100 # 2030
+xors 4, 1, sb243, sb315, sb309 # 2031
+xors 4, 1, sb245, sb306, sb61 # 2032
+xors 4, 1, sb247, sb419, sb305 # 2033
+xors 4, 1, sb250, sb467, sb12 # 2034
+xors 4, 1, sb457, sb468, sb60 # 2035
+xors 4, 1, sb253, sb298, sb303 # 2036
+xors 4, 1, sb10, sb59, sb297 # 2037
+xors 4, 1, sb458, sb295, sb299 # 2038
+xors 4, 1, sb259, sb465, sb500 # 2039
+xors 4, 1, sb52, sb58, sb291 # 2040
+xors 4, 1, sb267, sb293, sb507 # 2041
+xors 4, 1, sb460, sb93, sb57 # 2042
+xors 4, 1, sb123, sb284, sb286 # 2043
+xors 4, 1, sb466, sb120, sb26 # 2044
+xors 4, 1, sb188, sb5, sb408 # 2045
+xors 4, 1, sb300, sb129, sb130 # 2046
+xors 4, 1, sb496, sb433, sb136 # 2047
+xors 4, 1, sb302, sb133, sb134 # 2048
+xors 4, 1, sb99, sb27, sb434 # 2049
+xors 4, 1, sb307, sb140, sb494 # 2050
+xors 4, 1, sb186, sb87, sb436 # 2051
+xors 4, 1, sb310, sb435, sb142 # 2052
+xors 4, 1, sb196, sb147, sb144 # 2053
+xors 4, 1, sb312, sb437, sb29 # 2054
+xors 4, 1, sb191, sb30, sb148 # 2055
+xors 4, 1, sb316, sb413, sb150 # 2056
+xors 4, 1, sb189, sb438, sb407 # 2057
+xors 4, 1, sb319, sb1, sb6 # 2058
+xors 4, 1, sb198, sb0, sb31 # 2059
+xors 4, 1, sb472, sb157, sb158 # 2060
+xors 4, 1, sb200, sb166, sb439 # 2061
+xors 4, 1, sb327, sb164, sb168 # 2062
+xors 4, 1, sb192, sb101, sb495 # 2063
+xors 4, 1, sb13, sb165, sb167 # 2064
+xors 4, 1, sb193, sb88, sb506 # 2065
+xors 4, 1, sb66, sb178, sb170 # 2066
+xors 4, 1, sb40, sb441, sb34 # 2067
+xors 4, 1, sb338, sb443, sb414 # 2068
+xors 4, 1, sb195, sb442, sb176 # 2069
+xors 4, 1, sb98, sb177, sb180 # 2070
+xors 4, 1, sb197, sb183, sb37 # 2071
+dabit s15, sb535 # 2072
+mulsi s2, s15, 2 # 2073
+dabit s7, sb492 # 2074
+xors 4, 1, sb529, sb492, sb206 # 2075
+mulsi s6, s7, 2 # 2076
+xors 4, 1, sb266, sb39, sb206 # 2077
+xors 4, 1, sb353, sb199, sb447 # 2078
+xors 4, 1, sb53, sb415, sb202 # 2079
+xors 4, 1, sb356, sb41, sb210 # 2080
+xors 4, 1, sb92, sb449, sb8 # 2081
+xors 4, 1, sb358, sb490, sb208 # 2082
+xors 4, 1, sb271, sb505, sb497 # 2083
+xors 4, 1, sb360, sb450, sb42 # 2084
+xors 4, 1, sb54, sb217, sb214 # 2085
+xors 4, 1, sb362, sb451, sb508 # 2086
+xors 4, 1, sb461, sb43, sb218 # 2087
+xors 4, 1, sb364, sb225, sb220 # 2088
+xors 4, 1, sb273, sb222, sb44 # 2089
+xors 4, 1, sb368, sb45, sb224 # 2090
+xors 4, 1, sb55, sb425, sb229 # 2091
+xors 4, 1, sb371, sb452, sb416 # 2092
+xors 4, 1, sb275, sb9, sb489 # 2093
+xors 4, 1, sb374, sb231, sb46 # 2094
+xors 4, 1, sb85, sb82, sb235 # 2095
+xors 4, 1, sb377, sb47, sb454 # 2096
+xors 4, 1, sb462, sb91, sb239 # 2097
+xors 4, 1, sb380, sb498, sb455 # 2098
+xors 4, 1, sb418, sb48, sb243 # 2099
+xors 4, 1, sb382, sb456, sb245 # 2100
+xors 4, 1, sb279, sb246, sb247 # 2101
+xors 4, 1, sb387, sb248, sb250 # 2102
+xors 4, 1, sb56, sb251, sb457 # 2103
+xors 4, 1, sb391, sb50, sb253 # 2104
+xors 4, 1, sb281, sb417, sb10 # 2105
+xors 4, 1, sb395, sb409, sb458 # 2106
+xors 4, 1, sb11, sb261, sb259 # 2107
+xors 4, 1, sb399, sb260, sb52 # 2108
+xors 4, 1, sb463, sb459, sb267 # 2109
+xors 4, 1, sb403, sb499, sb460 # 2110
+ands 376, 1, sb294, sb120, sb26, 1, sb296, sb5, sb408, 1, sb290, sb129, sb130, 1, sb301, sb433, sb136, 1, sb288, sb133, sb134, 1, sb304, sb27, sb434, 1, sb285, sb140, sb494, 1, sb308, sb87, sb436, 1, sb282, sb435, sb142, 1, sb311, sb147, sb144, 1, sb278, sb437, sb29, 1, sb313, sb30, sb148, 1, sb276, sb413, sb150, 1, sb318, sb438, sb407, 1, sb272, sb1, sb6, 1, sb320, sb0, sb31, 1, sb269, sb157, sb158, 1, sb325, sb166, sb439, 1, sb265, sb164, sb168, 1, sb329, sb101, sb495, 1, sb263, sb165, sb167, 1, sb420, sb88, sb506, 1, sb258, sb178, sb170, 1, sb333, sb441, sb34, 1, sb256, sb443, sb414, 1, sb339, sb442, sb176, 1, sb255, sb177, sb180, 1, sb475, sb183, sb37, 1, sb348, sb7, sb36, 1, sb153, sb466, sb188, 1, sb190, sb300, sb496, 1, sb341, sb302, sb99, 1, sb38, sb307, sb186, 1, sb342, sb310, sb196, 1, sb600, sb312, sb191, 1, sb343, sb316, sb189, 1, sb446, sb319, sb198, 1, sb344, sb472, sb200, 1, sb604, sb327, sb192, 1, sb476, sb13, sb193, 1, sb201, sb66, sb40, 1, sb346, sb338, sb195, 1, sb347, sb98, sb197, 1, sb354, sb39, sb206, 1, sb49, sb199, sb447, 1, sb357, sb415, sb202, 1, sb242, sb41, sb210, 1, sb359, sb449, sb8, 1, sb240, sb490, sb208, 1, sb361, sb505, sb497, 1, sb237, sb450, sb42, 1, sb363, sb217, sb214, 1, sb236, sb451, sb508, 1, sb367, sb43, sb218, 1, sb234, sb225, sb220, 1, sb369, sb222, sb44, 1, sb640, sb45, sb224, 1, sb373, sb425, sb229, 1, sb638, sb452, sb416, 1, sb375, sb9, sb489, 1, sb636, sb231, sb46, 1, sb379, sb82, sb235, 1, sb635, sb47, sb454, 1, sb381, sb91, sb239, 1, sb634, sb498, sb455, 1, sb383, sb48, sb243, 1, sb632, sb456, sb245, 1, sb388, sb246, sb247, 1, sb223, sb248, sb250, 1, sb393, sb251, sb457, 1, sb630, sb50, sb253, 1, sb397, sb417, sb10, 1, sb628, sb409, sb458, 1, sb401, sb261, sb259, 1, sb179, sb260, sb52, 1, sb405, sb459, sb267, 1, sb584, sb499, sb460, 1, sb28, sb353, sb266, 1, sb205, sb356, sb53, 1, sb35, sb358, sb92, 1, sb207, sb360, sb271, 1, sb83, sb362, sb54, 1, sb530, sb364, sb461, 1, sb2, sb368, sb273, 1, sb616, sb371, sb55, 1, sb71, sb374, sb275, 1, sb211, sb377, sb85, 1, sb16, sb380, sb462, 1, sb213, sb382, sb418, 1, sb108, sb387, sb279, 1, sb215, sb391, sb56, 1, sb119, sb395, sb281, 1, sb216, sb399, sb11, 1, sb432, sb403, sb463 # 2111
+ands 184, 1, sb292, sb466, sb296, 1, sb289, sb300, sb301, 1, sb287, sb302, sb304, 1, sb283, sb307, sb308, 1, sb280, sb310, sb311, 1, sb277, sb312, sb313, 1, sb274, sb316, sb318, 1, sb270, sb319, sb320, 1, sb268, sb472, sb325, 1, sb264, sb327, sb329, 1, sb262, sb13, sb420, 1, sb257, sb66, sb333, 1, sb51, sb338, sb339, 1, sb254, sb98, sb475, 1, sb609, sb190, sb341, 1, sb155, sb38, sb342, 1, sb610, sb600, sb343, 1, sb564, sb446, sb344, 1, sb203, sb604, sb476, 1, sb204, sb201, sb346, 1, sb249, sb347, sb348, 1, sb244, sb353, sb354, 1, sb241, sb356, sb357, 1, sb238, sb358, sb359, 1, sb643, sb360, sb361, 1, sb642, sb362, sb363, 1, sb233, sb364, sb367, 1, sb232, sb368, sb369, 1, sb230, sb371, sb373, 1, sb228, sb374, sb375, 1, sb227, sb377, sb379, 1, sb226, sb380, sb381, 1, sb631, sb382, sb383, 1, sb533, sb387, sb388, 1, sb221, sb391, sb393, 1, sb626, sb395, sb397, 1, sb586, sb399, sb401, 1, sb175, sb403, sb405, 1, sb624, sb205, sb28, 1, sb568, sb207, sb35, 1, sb625, sb530, sb83, 1, sb161, sb616, sb2, 1, sb125, sb211, sb71, 1, sb163, sb213, sb16, 1, sb219, sb215, sb108, 1, sb572, sb216, sb119 # 2112
+xors 4, 1, sb560, sb292, sb294 # 2113
+xors 4, 1, sb445, sb289, sb290 # 2114
+xors 4, 1, sb597, sb287, sb288 # 2115
+xors 4, 1, sb187, sb283, sb285 # 2116
+xors 4, 1, sb598, sb280, sb282 # 2117
+xors 4, 1, sb593, sb277, sb278 # 2118
+xors 4, 1, sb194, sb274, sb276 # 2119
+xors 4, 1, sb444, sb270, sb272 # 2120
+xors 4, 1, sb602, sb268, sb269 # 2121
+xors 4, 1, sb591, sb264, sb265 # 2122
+xors 4, 1, sb606, sb262, sb263 # 2123
+xors 4, 1, sb589, sb257, sb258 # 2124
+xors 4, 1, sb608, sb51, sb256 # 2125
+xors 4, 1, sb252, sb254, sb255 # 2126
+xors 4, 1, sb612, sb249, sb252 # 2127
+xors 4, 1, sb614, sb244, sb49 # 2128
+xors 4, 1, sb582, sb241, sb242 # 2129
+xors 4, 1, sb615, sb238, sb240 # 2130
+xors 4, 1, sb174, sb643, sb237 # 2131
+xors 4, 1, sb209, sb642, sb236 # 2132
+xors 4, 1, sb580, sb233, sb234 # 2133
+xors 4, 1, sb617, sb232, sb640 # 2134
+xors 4, 1, sb579, sb230, sb638 # 2135
+xors 4, 1, sb212, sb228, sb636 # 2136
+xors 4, 1, sb578, sb227, sb635 # 2137
+xors 4, 1, sb621, sb226, sb634 # 2138
+xors 4, 1, sb576, sb631, sb632 # 2139
+xors 4, 1, sb622, sb533, sb223 # 2140
+xors 4, 1, sb115, sb221, sb630 # 2141
+xors 4, 1, sb623, sb626, sb628 # 2142
+ands 88, 1, sb526, sb190, sb597, 1, sb594, sb38, sb598, 1, sb185, sb600, sb194, 1, sb592, sb446, sb602, 1, sb184, sb604, sb606, 1, sb182, sb201, sb608, 1, sb135, sb153, sb609, 1, sb566, sb155, sb610, 1, sb567, sb564, sb203, 1, sb588, sb204, sb612, 1, sb581, sb205, sb614, 1, sb173, sb207, sb615, 1, sb172, sb530, sb209, 1, sb171, sb616, sb617, 1, sb577, sb211, sb212, 1, sb169, sb213, sb621, 1, sb575, sb215, sb622, 1, sb553, sb216, sb623, 1, sb33, sb568, sb624, 1, sb545, sb161, sb625, 1, sb574, sb163, sb125, 1, sb139, sb572, sb219 # 2143
+xors 4, 1, sb154, sb526, sb445 # 2144
+xors 4, 1, sb559, sb594, sb187 # 2145
+xors 4, 1, sb156, sb185, sb593 # 2146
+xors 4, 1, sb558, sb592, sb444 # 2147
+xors 4, 1, sb159, sb184, sb591 # 2148
+xors 4, 1, sb181, sb182, sb589 # 2149
+xors 4, 1, sb160, sb588, sb181 # 2150
+xors 4, 1, sb146, sb586, sb179 # 2151
+xors 4, 1, sb531, sb175, sb584 # 2152
+xors 4, 1, sb32, sb581, sb582 # 2153
+xors 4, 1, sb145, sb173, sb174 # 2154
+xors 4, 1, sb162, sb172, sb580 # 2155
+xors 4, 1, sb551, sb171, sb579 # 2156
+xors 4, 1, sb571, sb577, sb578 # 2157
+xors 4, 1, sb548, sb169, sb576 # 2158
+xors 4, 1, sb440, sb575, sb115 # 2159
+ands 44, 1, sb152, sb153, sb154, 1, sb151, sb155, sb156, 1, sb557, sb564, sb159, 1, sb137, sb135, sb566, 1, sb149, sb567, sb160, 1, sb552, sb568, sb32, 1, sb143, sb161, sb162, 1, sb141, sb163, sb571, 1, sb128, sb572, sb440, 1, sb28, sb545, sb33, 1, sb633, sb139, sb574 # 2160
+xors 4, 1, sb540, sb152, sb560 # 2161
+xors 4, 1, sb543, sb151, sb559 # 2162
+xors 4, 1, sb556, sb557, sb558 # 2163
+xors 4, 1, sb544, sb149, sb556 # 2164
+xors 4, 1, sb107, sb553, sb146 # 2165
+xors 4, 1, sb138, sb552, sb145 # 2166
+xors 4, 1, sb641, sb143, sb551 # 2167
+xors 4, 1, sb547, sb141, sb548 # 2168
+ands 20, 1, sb132, sb135, sb543, 1, sb644, sb137, sb544, 1, sb534, sb545, sb138, 1, sb637, sb139, sb547, 1, sb127, sb633, sb28 # 2169
+xors 4, 1, sb131, sb132, sb540 # 2170
+xors 4, 1, sb629, sb644, sb131 # 2171
+xors 4, 1, sb613, sb535, sb629 # 2172
+xors 4, 1, sb639, sb128, sb107 # 2173
+xors 4, 1, sb126, sb534, sb641 # 2174
+xors 4, 1, sb25, sb637, sb639 # 2175
+ands 8, 1, sb412, sb633, sb126, 1, sb532, sb432, sb127 # 2176
+xors 4, 1, sb627, sb412, sb25 # 2177
+ands 8, 1, sb106, sb432, sb627, 1, sb124, sb532, sb629 # 2178
+xors 4, 1, sb513, sb106, sb531 # 2179
+xors 4, 1, sb620, sb124, sb513 # 2180
+dabit s16, sb619 # 2181
+xors 4, 1, sb611, sb619, sb620 # 2182
+mulsi s18, s16, 2 # 2183
+dabit s0, sb618 # 2184
+xors 4, 1, sb122, sb618, sb123 # 2185
+reveal 12, 1, cb7, sb611, 1, cb2, sb613, 1, cb4, sb529, 1, cb5, sb122 # 2186
+convcbitvec 1, ci0, cb7 # 2187
+convint c2, ci0 # 2188
+addm s23, s16, c2 # 2189
+convint c1, ci0 # 2190
+mulm s3, s18, c1 # 2191
+subs s19, s23, s3 # 2192
+movs s23, s19 # 2193
+convcbitvec 1, ci0, cb2 # 2194
+convint c5, ci0 # 2195
+addm s10, s15, c5 # 2196
+convint c6, ci0 # 2197
+mulm s13, s2, c6 # 2198
+subs s8, s10, s13 # 2199
+movs s1, s8 # 2200
+convcbitvec 1, ci0, cb4 # 2201
+convint c3, ci0 # 2202
+addm s5, s7, c3 # 2203
+convint c4, ci0 # 2204
+mulm s9, s6, c4 # 2205
+subs s10, s5, s9 # 2206
+movs s7, s10 # 2207
+adds s3, s1, s7 # 2208
+convcbitvec 1, ci0, cb5 # 2209
+convint c7, ci0 # 2210
+addm s20, s0, c7 # 2211
+mulsi s12, s0, 2 # 2212
+convint c2, ci0 # 2213
+mulm s4, s12, c2 # 2214
+subs s16, s20, s4 # 2215
+movs s22, s16 # 2216
+adds s17, s23, s22 # 2217
+shrsi s18, s21, 30 # 2218
+adds s15, s18, s3 # 2219
+ldi c6, 8 # 2220
+mulci c1, c6, 2147483647 # 2221
+addci c5, c1, 8 # 2222
+mulm s19, s17, c5 # 2223
+subs s13, s15, s19 # 2224
+ldi c7, 4 # 2225
+mulci c3, c7, 2147483647 # 2226
+addci c4, c3, 4 # 2227
+subml s2, s13, c4 # 2228
+movs s8, s2 # 2229
+muls 8, 1, s6, s14, s8, 1, s0, s11, s8 # 2230
+submr s19, c0, s6 # 2231
+ldi c5, 2 # 2232
+mulci c2, c5, 2147483647 # 2233
+addci c6, c2, 4 # 2234
+mulci c1, c6, 2147483647 # 2235
+addci c7, c1, 2 # 2236
+addm s9, s0, c7 # 2237
+split 194, 3, s9, sb428, sb121, sb225, sb431, sb21, sb453, sb527, sb24, sb228, sb4, sb607, sb451, sb603, sb605, sb217, sb105, sb601, sb450, sb596, sb512, sb497, sb118, sb599, sb505, sb525, sb595, sb490, sb590, sb86, sb449, sb524, sb117, sb210, sb585, sb587, sb41, sb523, sb116, sb206, sb23, sb583, sb448, sb522, sb430, sb40, sb104, sb114, sb200, sb521, sb573, sb198, sb113, sb570, sb191, sb102, sb569, sb196, sb565, sb511, sb99, sb563, sb519, sb496, sb561, sb562, sb188, sb111, sb112, sb37, sb22, sb518, sb183, sb517, sb429, sb180, sb554, sb110, sb177, sb550, sb555, sb443, sb516, sb549, sb441, sb546, sb103, sb178, sb515, sb109, sb101, sb542, sb510, sb168, sb541, sb424, sb164, sb539, sb509, sb439, sb514, sb537, sb166, sb17, sb538, sb157, sb528, sb536, sb407, sb486, sb520, sb438, sb464, sb502, sb413, sb90, sb18, sb30, sb437, sb89, sb147, sb488, sb81, sb436, sb3, sb423, sb87, sb487, sb406, sb494, sb402, sb80, sb140, sb404, sb400, sb27, sb79, sb97, sb136, sb396, sb398, sb408, sb485, sb394, sb5, sb392, sb504, sb26, sb78, sb390, sb120, sb77, sb484, sb493, sb385, sb386, sb16, sb76, sb389, sb73, sb422, sb483, sb71, sb384, sb410, sb2, sb378, sb482, sb83, sb75, sb376, sb35, sb74, sb15, sb405, sb372, sb96, sb401, sb481, sb370, sb397, sb503, sb480, sb393, sb411, sb20, sb388, sb72, sb366, sb383, sb427, sb479, sb381 # 2238
+xors 4, 1, sb45, sb225, sb121 # 2239
+xors 4, 1, sb425, sb428, sb225 # 2240
+xors 4, 1, sb229, sb453, sb21 # 2241
+xors 4, 1, sb618, sb229, sb431 # 2242
+xors 4, 1, sb416, sb431, sb453 # 2243
+xors 4, 1, sb9, sb228, sb24 # 2244
+xors 4, 1, sb209, sb9, sb527 # 2245
+xors 4, 1, sb489, sb527, sb228 # 2246
+xors 4, 1, sb82, sb451, sb607 # 2247
+xors 4, 1, sb123, sb82, sb4 # 2248
+xors 4, 1, sb235, sb4, sb451 # 2249
+xors 4, 1, sb47, sb217, sb605 # 2250
+xors 4, 1, sb614, sb47, sb603 # 2251
+xors 4, 1, sb454, sb603, sb217 # 2252
+xors 4, 1, sb91, sb450, sb601 # 2253
+xors 4, 1, sb612, sb91, sb105 # 2254
+xors 4, 1, sb239, sb105, sb450 # 2255
+xors 4, 1, sb498, sb497, sb512 # 2256
+xors 4, 1, sb611, sb498, sb596 # 2257
+xors 4, 1, sb455, sb596, sb497 # 2258
+xors 4, 1, sb48, sb505, sb599 # 2259
+xors 4, 1, sb610, sb48, sb118 # 2260
+xors 4, 1, sb243, sb118, sb505 # 2261
+xors 4, 1, sb456, sb490, sb595 # 2262
+xors 4, 1, sb201, sb456, sb525 # 2263
+xors 4, 1, sb245, sb525, sb490 # 2264
+xors 4, 1, sb246, sb449, sb86 # 2265
+xors 4, 1, sb199, sb246, sb590 # 2266
+xors 4, 1, sb247, sb590, sb449 # 2267
+xors 4, 1, sb248, sb210, sb117 # 2268
+xors 4, 1, sb197, sb248, sb524 # 2269
+xors 4, 1, sb250, sb524, sb210 # 2270
+xors 4, 1, sb251, sb41, sb587 # 2271
+xors 4, 1, sb446, sb251, sb585 # 2272
+xors 4, 1, sb457, sb585, sb41 # 2273
+xors 4, 1, sb50, sb206, sb116 # 2274
+xors 4, 1, sb194, sb50, sb523 # 2275
+xors 4, 1, sb253, sb523, sb206 # 2276
+xors 4, 1, sb417, sb448, sb583 # 2277
+xors 4, 1, sb38, sb417, sb23 # 2278
+xors 4, 1, sb10, sb23, sb448 # 2279
+xors 4, 1, sb409, sb40, sb430 # 2280
+xors 4, 1, sb597, sb409, sb522 # 2281
+xors 4, 1, sb458, sb522, sb40 # 2282
+xors 4, 1, sb261, sb200, sb114 # 2283
+xors 4, 1, sb216, sb261, sb104 # 2284
+xors 4, 1, sb259, sb104, sb200 # 2285
+xors 4, 1, sb260, sb198, sb573 # 2286
+xors 4, 1, sb218, sb260, sb521 # 2287
+xors 4, 1, sb52, sb521, sb198 # 2288
+xors 4, 1, sb459, sb191, sb570 # 2289
+xors 4, 1, sb219, sb459, sb113 # 2290
+xors 4, 1, sb267, sb113, sb191 # 2291
+xors 4, 1, sb499, sb196, sb569 # 2292
+xors 4, 1, sb628, sb499, sb102 # 2293
+xors 4, 1, sb460, sb102, sb196 # 2294
+xors 4, 1, sb266, sb99, sb511 # 2295
+xors 4, 1, sb630, sb266, sb565 # 2296
+xors 4, 1, sb53, sb565, sb99 # 2297
+xors 4, 1, sb92, sb496, sb519 # 2298
+xors 4, 1, sb533, sb92, sb563 # 2299
+xors 4, 1, sb271, sb563, sb496 # 2300
+xors 4, 1, sb54, sb188, sb562 # 2301
+xors 4, 1, sb632, sb54, sb561 # 2302
+xors 4, 1, sb461, sb561, sb188 # 2303
+xors 4, 1, sb273, sb37, sb112 # 2304
+xors 4, 1, sb634, sb273, sb111 # 2305
+xors 4, 1, sb55, sb111, sb37 # 2306
+xors 4, 1, sb275, sb183, sb518 # 2307
+xors 4, 1, sb635, sb275, sb22 # 2308
+xors 4, 1, sb85, sb22, sb183 # 2309
+xors 4, 1, sb462, sb180, sb429 # 2310
+xors 4, 1, sb230, sb462, sb517 # 2311
+xors 4, 1, sb418, sb517, sb180 # 2312
+xors 4, 1, sb279, sb177, sb110 # 2313
+xors 4, 1, sb232, sb279, sb554 # 2314
+xors 4, 1, sb56, sb554, sb177 # 2315
+xors 4, 1, sb281, sb443, sb555 # 2316
+xors 4, 1, sb640, sb281, sb550 # 2317
+xors 4, 1, sb463, sb550, sb443 # 2318
+xors 4, 1, sb492, sb441, sb549 # 2319
+xors 4, 1, sb642, sb492, sb516 # 2320
+xors 4, 1, sb284, sb516, sb441 # 2321
+xors 4, 1, sb286, sb178, sb103 # 2322
+xors 4, 1, sb236, sb286, sb546 # 2323
+xors 4, 1, sb93, sb546, sb178 # 2324
+xors 4, 1, sb57, sb101, sb109 # 2325
+xors 4, 1, sb238, sb57, sb515 # 2326
+xors 4, 1, sb293, sb515, sb101 # 2327
+xors 4, 1, sb507, sb168, sb510 # 2328
+xors 4, 1, sb241, sb507, sb542 # 2329
+xors 4, 1, sb58, sb542, sb168 # 2330
+xors 4, 1, sb291, sb164, sb424 # 2331
+xors 4, 1, sb244, sb291, sb541 # 2332
+xors 4, 1, sb465, sb541, sb164 # 2333
+xors 4, 1, sb500, sb439, sb509 # 2334
+xors 4, 1, sb249, sb500, sb539 # 2335
+xors 4, 1, sb295, sb539, sb439 # 2336
+xors 4, 1, sb299, sb166, sb537 # 2337
+xors 4, 1, sb254, sb299, sb514 # 2338
+xors 4, 1, sb59, sb514, sb166 # 2339
+xors 4, 1, sb297, sb157, sb538 # 2340
+xors 4, 1, sb51, sb297, sb17 # 2341
+xors 4, 1, sb298, sb17, sb157 # 2342
+xors 4, 1, sb303, sb407, sb536 # 2343
+xors 4, 1, sb257, sb303, sb528 # 2344
+xors 4, 1, sb468, sb528, sb407 # 2345
+xors 4, 1, sb60, sb438, sb520 # 2346
+xors 4, 1, sb262, sb60, sb486 # 2347
+xors 4, 1, sb467, sb486, sb438 # 2348
+xors 4, 1, sb12, sb413, sb502 # 2349
+xors 4, 1, sb264, sb12, sb464 # 2350
+xors 4, 1, sb419, sb464, sb413 # 2351
+xors 4, 1, sb305, sb30, sb18 # 2352
+xors 4, 1, sb268, sb305, sb90 # 2353
+xors 4, 1, sb306, sb90, sb30 # 2354
+xors 4, 1, sb61, sb147, sb89 # 2355
+xors 4, 1, sb270, sb61, sb437 # 2356
+xors 4, 1, sb315, sb437, sb147 # 2357
+xors 4, 1, sb309, sb436, sb81 # 2358
+xors 4, 1, sb274, sb309, sb488 # 2359
+xors 4, 1, sb469, sb488, sb436 # 2360
+xors 4, 1, sb100, sb87, sb423 # 2361
+xors 4, 1, sb277, sb100, sb3 # 2362
+xors 4, 1, sb62, sb3, sb87 # 2363
+xors 4, 1, sb317, sb494, sb406 # 2364
+xors 4, 1, sb280, sb317, sb487 # 2365
+xors 4, 1, sb314, sb487, sb494 # 2366
+xors 4, 1, sb501, sb140, sb80 # 2367
+xors 4, 1, sb283, sb501, sb402 # 2368
+xors 4, 1, sb470, sb402, sb140 # 2369
+xors 4, 1, sb63, sb27, sb400 # 2370
+xors 4, 1, sb287, sb63, sb404 # 2371
+xors 4, 1, sb94, sb404, sb27 # 2372
+xors 4, 1, sb322, sb136, sb97 # 2373
+xors 4, 1, sb289, sb322, sb79 # 2374
+xors 4, 1, sb321, sb79, sb136 # 2375
+xors 4, 1, sb471, sb408, sb398 # 2376
+xors 4, 1, sb292, sb471, sb396 # 2377
+xors 4, 1, sb64, sb396, sb408 # 2378
+xors 4, 1, sb323, sb5, sb394 # 2379
+xors 4, 1, sb466, sb323, sb485 # 2380
+xors 4, 1, sb324, sb485, sb5 # 2381
+xors 4, 1, sb326, sb26, sb504 # 2382
+xors 4, 1, sb300, sb326, sb392 # 2383
+xors 4, 1, sb65, sb392, sb26 # 2384
+xors 4, 1, sb328, sb120, sb390 # 2385
+xors 4, 1, sb302, sb328, sb78 # 2386
+xors 4, 1, sb331, sb78, sb120 # 2387
+xors 4, 1, sb330, sb493, sb484 # 2388
+xors 4, 1, sb307, sb330, sb77 # 2389
+xors 4, 1, sb473, sb77, sb493 # 2390
+xors 4, 1, sb332, sb16, sb386 # 2391
+xors 4, 1, sb310, sb332, sb385 # 2392
+xors 4, 1, sb474, sb385, sb16 # 2393
+xors 4, 1, sb334, sb73, sb389 # 2394
+xors 4, 1, sb312, sb334, sb76 # 2395
+xors 4, 1, sb335, sb76, sb73 # 2396
+xors 4, 1, sb336, sb71, sb483 # 2397
+xors 4, 1, sb316, sb336, sb422 # 2398
+xors 4, 1, sb337, sb422, sb71 # 2399
+xors 4, 1, sb67, sb2, sb410 # 2400
+xors 4, 1, sb319, sb67, sb384 # 2401
+xors 4, 1, sb491, sb384, sb2 # 2402
+xors 4, 1, sb340, sb83, sb482 # 2403
+xors 4, 1, sb472, sb340, sb378 # 2404
+xors 4, 1, sb84, sb378, sb83 # 2405
+xors 4, 1, sb95, sb35, sb376 # 2406
+xors 4, 1, sb327, sb95, sb75 # 2407
+xors 4, 1, sb68, sb75, sb35 # 2408
+xors 4, 1, sb345, sb405, sb15 # 2409
+xors 4, 1, sb329, sb345, sb74 # 2410
+xors 4, 1, sb69, sb74, sb405 # 2411
+xors 4, 1, sb349, sb401, sb96 # 2412
+xors 4, 1, sb66, sb349, sb372 # 2413
+xors 4, 1, sb477, sb372, sb401 # 2414
+xors 4, 1, sb350, sb397, sb370 # 2415
+xors 4, 1, sb338, sb350, sb481 # 2416
+xors 4, 1, sb351, sb481, sb397 # 2417
+xors 4, 1, sb352, sb393, sb480 # 2418
+xors 4, 1, sb339, sb352, sb503 # 2419
+xors 4, 1, sb70, sb503, sb393 # 2420
+xors 4, 1, sb19, sb388, sb20 # 2421
+xors 4, 1, sb341, sb19, sb411 # 2422
+xors 4, 1, sb355, sb411, sb388 # 2423
+xors 4, 1, sb14, sb383, sb366 # 2424
+xors 4, 1, sb343, sb14, sb72 # 2425
+xors 4, 1, sb478, sb72, sb383 # 2426
+xors 4, 1, sb426, sb381, sb479 # 2427
+xors 4, 1, sb432, sb426, sb427 # 2428
+xors 4, 1, sb365, sb427, sb381 # 2429
+ands 256, 1, sb231, sb45, sb425, 1, sb224, sb229, sb416, 1, sb452, sb9, sb489, 1, sb44, sb82, sb235, 1, sb222, sb47, sb454, 1, sb220, sb91, sb239, 1, sb214, sb498, sb455, 1, sb43, sb48, sb243, 1, sb508, sb456, sb245, 1, sb211, sb246, sb247, 1, sb42, sb248, sb250, 1, sb204, sb251, sb457, 1, sb202, sb50, sb253, 1, sb8, sb417, sb10, 1, sb415, sb409, sb458, 1, sb447, sb261, sb259, 1, sb39, sb260, sb52, 1, sb195, sb459, sb267, 1, sb445, sb499, sb460, 1, sb192, sb266, sb53, 1, sb186, sb92, sb271, 1, sb193, sb54, sb461, 1, sb189, sb273, sb55, 1, sb36, sb275, sb85, 1, sb7, sb462, sb418, 1, sb176, sb279, sb56, 1, sb442, sb281, sb463, 1, sb34, sb492, sb284, 1, sb170, sb286, sb93, 1, sb506, sb57, sb293, 1, sb88, sb507, sb58, 1, sb165, sb291, sb465, 1, sb167, sb500, sb295, 1, sb495, sb299, sb59, 1, sb158, sb297, sb298, 1, sb31, sb303, sb468, 1, sb0, sb60, sb467, 1, sb6, sb12, sb419, 1, sb150, sb305, sb306, 1, sb148, sb61, sb315, 1, sb29, sb309, sb469, 1, sb144, sb100, sb62, 1, sb142, sb317, sb314, 1, sb435, sb501, sb470, 1, sb434, sb63, sb94, 1, sb134, sb322, sb321, 1, sb133, sb471, sb64, 1, sb130, sb323, sb324, 1, sb433, sb326, sb65, 1, sb129, sb328, sb331, 1, sb119, sb330, sb473, 1, sb108, sb332, sb474, 1, sb15, sb334, sb335, 1, sb421, sb336, sb337, 1, sb11, sb67, sb491, 1, sb46, sb340, sb84, 1, sb414, sb95, sb68, 1, sb1, sb345, sb69, 1, sb403, sb349, sb477, 1, sb399, sb350, sb351, 1, sb395, sb352, sb70, 1, sb391, sb19, sb355, 1, sb387, sb14, sb478, 1, sb382, sb426, sb365 # 2430
+xors 4, 1, sb617, sb225, sb231 # 2431
+xors 4, 1, sb616, sb453, sb224 # 2432
+xors 4, 1, sb208, sb228, sb452 # 2433
+xors 4, 1, sb207, sb451, sb44 # 2434
+xors 4, 1, sb205, sb217, sb222 # 2435
+xors 4, 1, sb203, sb450, sb220 # 2436
+xors 4, 1, sb609, sb497, sb214 # 2437
+xors 4, 1, sb608, sb505, sb43 # 2438
+xors 4, 1, sb606, sb490, sb508 # 2439
+xors 4, 1, sb604, sb449, sb211 # 2440
+xors 4, 1, sb602, sb210, sb42 # 2441
+xors 4, 1, sb600, sb41, sb204 # 2442
+xors 4, 1, sb598, sb206, sb202 # 2443
+xors 4, 1, sb190, sb448, sb8 # 2444
+xors 4, 1, sb624, sb40, sb415 # 2445
+xors 4, 1, sb532, sb200, sb447 # 2446
+xors 4, 1, sb626, sb198, sb39 # 2447
+xors 4, 1, sb221, sb191, sb195 # 2448
+xors 4, 1, sb223, sb196, sb445 # 2449
+xors 4, 1, sb631, sb99, sb192 # 2450
+xors 4, 1, sb226, sb496, sb186 # 2451
+xors 4, 1, sb227, sb188, sb193 # 2452
+xors 4, 1, sb636, sb37, sb189 # 2453
+xors 4, 1, sb638, sb183, sb36 # 2454
+xors 4, 1, sb233, sb180, sb7 # 2455
+xors 4, 1, sb234, sb177, sb176 # 2456
+xors 4, 1, sb643, sb443, sb442 # 2457
+xors 4, 1, sb237, sb441, sb34 # 2458
+xors 4, 1, sb240, sb178, sb170 # 2459
+xors 4, 1, sb242, sb101, sb506 # 2460
+xors 4, 1, sb49, sb168, sb88 # 2461
+xors 4, 1, sb252, sb164, sb165 # 2462
+xors 4, 1, sb255, sb439, sb167 # 2463
+xors 4, 1, sb256, sb166, sb495 # 2464
+xors 4, 1, sb258, sb157, sb158 # 2465
+xors 4, 1, sb263, sb407, sb31 # 2466
+xors 4, 1, sb265, sb438, sb0 # 2467
+xors 4, 1, sb269, sb413, sb6 # 2468
+xors 4, 1, sb272, sb30, sb150 # 2469
+xors 4, 1, sb276, sb147, sb148 # 2470
+xors 4, 1, sb278, sb436, sb29 # 2471
+xors 4, 1, sb282, sb87, sb144 # 2472
+xors 4, 1, sb285, sb494, sb142 # 2473
+xors 4, 1, sb288, sb140, sb435 # 2474
+xors 4, 1, sb290, sb27, sb434 # 2475
+xors 4, 1, sb294, sb136, sb134 # 2476
+xors 4, 1, sb296, sb408, sb133 # 2477
+xors 4, 1, sb301, sb5, sb130 # 2478
+xors 4, 1, sb304, sb26, sb433 # 2479
+xors 4, 1, sb308, sb120, sb129 # 2480
+xors 4, 1, sb311, sb493, sb119 # 2481
+xors 4, 1, sb313, sb16, sb108 # 2482
+xors 4, 1, sb318, sb73, sb15 # 2483
+xors 4, 1, sb320, sb71, sb421 # 2484
+xors 4, 1, sb325, sb2, sb11 # 2485
+xors 4, 1, sb13, sb83, sb46 # 2486
+xors 4, 1, sb420, sb35, sb414 # 2487
+xors 4, 1, sb333, sb405, sb1 # 2488
+xors 4, 1, sb98, sb401, sb403 # 2489
+xors 4, 1, sb475, sb397, sb399 # 2490
+xors 4, 1, sb342, sb393, sb395 # 2491
+xors 4, 1, sb344, sb388, sb391 # 2492
+xors 4, 1, sb412, sb383, sb387 # 2493
+xors 4, 1, sb315, sb381, sb382 # 2494
+xors 4, 1, sb536, sb190, sb597 # 2495
+xors 4, 1, sb132, sb598, sb38 # 2496
+xors 4, 1, sb212, sb600, sb194 # 2497
+xors 4, 1, sb133, sb602, sb446 # 2498
+xors 4, 1, sb213, sb604, sb197 # 2499
+xors 4, 1, sb543, sb606, sb199 # 2500
+xors 4, 1, sb621, sb608, sb201 # 2501
+xors 4, 1, sb137, sb609, sb610 # 2502
+xors 4, 1, sb215, sb203, sb611 # 2503
+xors 4, 1, sb545, sb205, sb612 # 2504
+xors 4, 1, sb622, sb207, sb614 # 2505
+xors 4, 1, sb547, sb208, sb123 # 2506
+xors 4, 1, sb623, sb616, sb209 # 2507
+dabit s4, sb365 # 2508
+mulsi s20, s4, 2 # 2509
+dabit s17, sb380 # 2510
+xors 4, 1, sb469, sb380, sb624 # 2511
+mulsi s18, s17, 2 # 2512
+xors 4, 1, sb476, sb216, sb624 # 2513
+xors 4, 1, sb552, sb218, sb532 # 2514
+xors 4, 1, sb346, sb219, sb626 # 2515
+xors 4, 1, sb553, sb628, sb221 # 2516
+xors 4, 1, sb347, sb630, sb223 # 2517
+xors 4, 1, sb149, sb533, sb631 # 2518
+xors 4, 1, sb348, sb632, sb226 # 2519
+xors 4, 1, sb558, sb634, sb227 # 2520
+xors 4, 1, sb353, sb635, sb636 # 2521
+xors 4, 1, sb559, sb230, sb638 # 2522
+xors 4, 1, sb354, sb232, sb233 # 2523
+xors 4, 1, sb560, sb640, sb234 # 2524
+xors 4, 1, sb356, sb642, sb643 # 2525
+xors 4, 1, sb154, sb236, sb237 # 2526
+xors 4, 1, sb357, sb238, sb240 # 2527
+xors 4, 1, sb156, sb241, sb242 # 2528
+xors 4, 1, sb358, sb244, sb49 # 2529
+xors 4, 1, sb159, sb249, sb252 # 2530
+xors 4, 1, sb359, sb254, sb255 # 2531
+xors 4, 1, sb567, sb51, sb256 # 2532
+xors 4, 1, sb360, sb257, sb258 # 2533
+xors 4, 1, sb568, sb262, sb263 # 2534
+xors 4, 1, sb361, sb264, sb265 # 2535
+xors 4, 1, sb32, sb268, sb269 # 2536
+xors 4, 1, sb362, sb270, sb272 # 2537
+xors 4, 1, sb163, sb274, sb276 # 2538
+xors 4, 1, sb363, sb277, sb278 # 2539
+xors 4, 1, sb572, sb280, sb282 # 2540
+xors 4, 1, sb364, sb283, sb285 # 2541
+xors 4, 1, sb33, sb287, sb288 # 2542
+xors 4, 1, sb367, sb289, sb290 # 2543
+xors 4, 1, sb575, sb292, sb294 # 2544
+xors 4, 1, sb368, sb466, sb296 # 2545
+xors 4, 1, sb169, sb300, sb301 # 2546
+xors 4, 1, sb369, sb302, sb304 # 2547
+xors 4, 1, sb577, sb307, sb308 # 2548
+xors 4, 1, sb371, sb310, sb311 # 2549
+xors 4, 1, sb578, sb312, sb313 # 2550
+xors 4, 1, sb373, sb316, sb318 # 2551
+xors 4, 1, sb579, sb319, sb320 # 2552
+xors 4, 1, sb374, sb472, sb325 # 2553
+xors 4, 1, sb580, sb327, sb13 # 2554
+xors 4, 1, sb375, sb329, sb420 # 2555
+xors 4, 1, sb174, sb66, sb333 # 2556
+xors 4, 1, sb377, sb338, sb98 # 2557
+xors 4, 1, sb582, sb339, sb475 # 2558
+xors 4, 1, sb379, sb341, sb342 # 2559
+xors 4, 1, sb179, sb343, sb344 # 2560
+ands 372, 1, sb539, sb190, sb597, 1, sb131, sb598, sb38, 1, sb540, sb600, sb194, 1, sb514, sb602, sb446, 1, sb135, sb604, sb197, 1, sb129, sb606, sb199, 1, sb544, sb608, sb201, 1, sb639, sb609, sb610, 1, sb138, sb203, sb611, 1, sb637, sb205, sb612, 1, sb139, sb207, sb614, 1, sb127, sb208, sb123, 1, sb28, sb616, sb209, 1, sb145, sb617, sb618, 1, sb548, sb132, sb212, 1, sb538, sb133, sb213, 1, sb141, sb543, sb621, 1, sb17, sb137, sb215, 1, sb143, sb545, sb622, 1, sb551, sb547, sb623, 1, sb146, sb216, sb624, 1, sb125, sb218, sb532, 1, sb556, sb219, sb626, 1, sb627, sb628, sb221, 1, sb557, sb630, sb223, 1, sb625, sb533, sb631, 1, sb151, sb632, sb226, 1, sb513, sb634, sb227, 1, sb152, sb635, sb636, 1, sb124, sb230, sb638, 1, sb153, sb232, sb233, 1, sb530, sb640, sb234, 1, sb155, sb642, sb643, 1, sb615, sb236, sb237, 1, sb564, sb238, sb240, 1, sb613, sb241, sb242, 1, sb566, sb244, sb49, 1, sb121, sb249, sb252, 1, sb160, sb254, sb255, 1, sb4, sb51, sb256, 1, sb161, sb257, sb258, 1, sb605, sb262, sb263, 1, sb162, sb264, sb265, 1, sb603, sb268, sb269, 1, sb571, sb270, sb272, 1, sb601, sb274, sb276, 1, sb440, sb277, sb278, 1, sb599, sb280, sb282, 1, sb574, sb283, sb285, 1, sb526, sb287, sb288, 1, sb522, sb289, sb290, 1, sb595, sb292, sb294, 1, sb576, sb466, sb296, 1, sb525, sb300, sb301, 1, sb171, sb302, sb304, 1, sb86, sb307, sb308, 1, sb172, sb310, sb311, 1, sb524, sb312, sb313, 1, sb173, sb316, sb318, 1, sb587, sb319, sb320, 1, sb581, sb472, sb325, 1, sb585, sb327, sb13, 1, sb175, sb329, sb420, 1, sb583, sb66, sb333, 1, sb584, sb338, sb98, 1, sb430, sb339, sb475, 1, sb181, sb341, sb342, 1, sb18, sb343, sb344, 1, sb65, sb432, sb412, 1, sb588, sb552, sb476, 1, sb546, sb553, sb346, 1, sb589, sb149, sb347, 1, sb103, sb558, sb348, 1, sb182, sb559, sb353, 1, sb109, sb560, sb354, 1, sb591, sb154, sb356, 1, sb110, sb156, sb357, 1, sb184, sb159, sb358, 1, sb554, sb567, sb359, 1, sb185, sb568, sb360, 1, sb555, sb32, sb361, 1, sb444, sb163, sb362, 1, sb518, sb572, sb363, 1, sb592, sb33, sb364, 1, sb519, sb575, sb367, 1, sb593, sb169, sb368, 1, sb562, sb577, sb369, 1, sb187, sb578, sb371, 1, sb112, sb579, sb373, 1, sb594, sb580, sb374, 1, sb511, sb174, sb375, 1, sb119, sb582, sb377, 1, sb520, sb179, sb379 # 2561
+ands 184, 1, sb644, sb132, sb540, 1, sb535, sb133, sb135, 1, sb107, sb543, sb544, 1, sb534, sb137, sb138, 1, sb128, sb545, sb139, 1, sb641, sb547, sb28, 1, sb376, sb536, sb548, 1, sb542, sb538, sb141, 1, sb509, sb17, sb143, 1, sb126, sb551, sb145, 1, sb629, sb552, sb146, 1, sb25, sb553, sb556, 1, sb531, sb149, sb557, 1, sb106, sb558, sb151, 1, sb620, sb559, sb152, 1, sb619, sb560, sb153, 1, sb122, sb154, sb155, 1, sb529, sb156, sb564, 1, sb21, sb159, sb566, 1, sb431, sb567, sb160, 1, sb527, sb568, sb161, 1, sb24, sb32, sb162, 1, sb607, sb163, sb571, 1, sb105, sb572, sb440, 1, sb596, sb33, sb574, 1, sb118, sb575, sb522, 1, sb512, sb169, sb576, 1, sb590, sb577, sb171, 1, sb117, sb578, sb172, 1, sb586, sb579, sb173, 1, sb116, sb580, sb581, 1, sb523, sb174, sb175, 1, sb23, sb582, sb584, 1, sb90, sb179, sb181, 1, sb570, sb546, sb588, 1, sb483, sb103, sb589, 1, sb114, sb109, sb182, 1, sb385, sb110, sb591, 1, sb104, sb554, sb184, 1, sb75, sb555, sb185, 1, sb573, sb518, sb444, 1, sb410, sb519, sb592, 1, sb521, sb562, sb593, 1, sb389, sb112, sb187, 1, sb115, sb511, sb594, 1, sb384, sb520, sb119 # 2562
+xors 4, 1, sb537, sb644, sb131 # 2563
+xors 4, 1, sb428, sb535, sb514 # 2564
+xors 4, 1, sb541, sb107, sb129 # 2565
+xors 4, 1, sb102, sb534, sb639 # 2566
+xors 4, 1, sb424, sb128, sb637 # 2567
+xors 4, 1, sb633, sb641, sb127 # 2568
+xors 4, 1, sb515, sb126, sb633 # 2569
+xors 4, 1, sb474, sb432, sb412 # 2570
+xors 4, 1, sb516, sb629, sb125 # 2571
+xors 4, 1, sb89, sb25, sb627 # 2572
+xors 4, 1, sb549, sb531, sb625 # 2573
+xors 4, 1, sb488, sb106, sb513 # 2574
+xors 4, 1, sb550, sb620, sb124 # 2575
+xors 4, 1, sb16, sb619, sb530 # 2576
+xors 4, 1, sb429, sb122, sb615 # 2577
+xors 4, 1, sb404, sb529, sb613 # 2578
+xors 4, 1, sb517, sb21, sb121 # 2579
+xors 4, 1, sb402, sb431, sb4 # 2580
+xors 4, 1, sb22, sb527, sb605 # 2581
+xors 4, 1, sb406, sb24, sb603 # 2582
+xors 4, 1, sb111, sb607, sb601 # 2583
+xors 4, 1, sb486, sb105, sb599 # 2584
+xors 4, 1, sb561, sb596, sb526 # 2585
+xors 4, 1, sb400, sb118, sb595 # 2586
+xors 4, 1, sb563, sb512, sb525 # 2587
+xors 4, 1, sb396, sb590, sb86 # 2588
+xors 4, 1, sb565, sb117, sb524 # 2589
+xors 4, 1, sb78, sb586, sb587 # 2590
+xors 4, 1, sb569, sb116, sb585 # 2591
+xors 4, 1, sb390, sb523, sb583 # 2592
+xors 4, 1, sb113, sb23, sb430 # 2593
+ands 92, 1, sb510, sb536, sb537, 1, sb528, sb538, sb541, 1, sb95, sb17, sb424, 1, sb481, sb376, sb542, 1, sb464, sb509, sb515, 1, sb437, sb546, sb516, 1, sb81, sb103, sb549, 1, sb423, sb109, sb550, 1, sb487, sb110, sb429, 1, sb80, sb554, sb517, 1, sb3, sb555, sb22, 1, sb97, sb518, sb111, 1, sb79, sb519, sb561, 1, sb485, sb562, sb563, 1, sb504, sb112, sb565, 1, sb398, sb511, sb569, 1, sb427, sb520, sb113, 1, sb77, sb483, sb570, 1, sb502, sb385, sb114, 1, sb394, sb75, sb104, 1, sb345, sb410, sb573, 1, sb392, sb389, sb521, 1, sb69, sb384, sb115 # 2594
+xors 4, 1, sb372, sb510, sb539 # 2595
+xors 4, 1, sb96, sb528, sb428 # 2596
+xors 4, 1, sb100, sb95, sb102 # 2597
+xors 4, 1, sb74, sb464, sb100 # 2598
+xors 4, 1, sb370, sb90, sb18 # 2599
+xors 4, 1, sb378, sb437, sb89 # 2600
+xors 4, 1, sb366, sb81, sb488 # 2601
+xors 4, 1, sb482, sb423, sb16 # 2602
+xors 4, 1, sb479, sb487, sb404 # 2603
+xors 4, 1, sb484, sb80, sb402 # 2604
+xors 4, 1, sb71, sb3, sb406 # 2605
+xors 4, 1, sb422, sb97, sb486 # 2606
+xors 4, 1, sb19, sb79, sb400 # 2607
+xors 4, 1, sb76, sb485, sb396 # 2608
+xors 4, 1, sb426, sb504, sb78 # 2609
+xors 4, 1, sb386, sb398, sb390 # 2610
+ands 44, 1, sb503, sb376, sb96, 1, sb20, sb481, sb74, 1, sb411, sb483, sb378, 1, sb72, sb385, sb482, 1, sb478, sb75, sb484, 1, sb355, sb410, sb422, 1, sb14, sb389, sb76, 1, sb477, sb384, sb386, 1, sb349, sb502, sb77, 1, sb331, sb345, sb394, 1, sb70, sb69, sb392 # 2611
+xors 4, 1, sb480, sb503, sb372 # 2612
+xors 4, 1, sb326, sb20, sb480 # 2613
+xors 4, 1, sb62, sb365, sb326 # 2614
+xors 4, 1, sb352, sb427, sb370 # 2615
+xors 4, 1, sb68, sb411, sb366 # 2616
+xors 4, 1, sb491, sb72, sb479 # 2617
+xors 4, 1, sb351, sb478, sb71 # 2618
+xors 4, 1, sb340, sb355, sb19 # 2619
+xors 4, 1, sb350, sb14, sb426 # 2620
+xors 4, 1, sb337, sb477, sb352 # 2621
+ands 20, 1, sb84, sb502, sb68, 1, sb67, sb345, sb351, 1, sb336, sb69, sb350, 1, sb335, sb331, sb349, 1, sb322, sb474, sb70 # 2622
+xors 4, 1, sb473, sb84, sb491 # 2623
+xors 4, 1, sb332, sb67, sb340 # 2624
+xors 4, 1, sb334, sb336, sb337 # 2625
+ands 12, 1, sb330, sb331, sb473, 1, sb328, sb474, sb334, 1, sb324, sb322, sb335 # 2626
+xors 4, 1, sb64, sb330, sb332 # 2627
+xors 4, 1, sb321, sb328, sb65 # 2628
+ands 8, 1, sb323, sb322, sb64, 1, sb94, sb324, sb326 # 2629
+xors 4, 1, sb471, sb323, sb321 # 2630
+xors 4, 1, sb317, sb94, sb471 # 2631
+dabit s1, sb470 # 2632
+xors 4, 1, sb63, sb470, sb317 # 2633
+mulsi s7, s1, 2 # 2634
+dabit s10, sb501 # 2635
+xors 4, 1, sb314, sb501, sb315 # 2636
+reveal 12, 1, cb1, sb63, 1, cb0, sb62, 1, cb6, sb469, 1, cb3, sb314 # 2637
+convcbitvec 1, ci0, cb1 # 2638
+convint c3, ci0 # 2639
+addm s5, s1, c3 # 2640
+convint c4, ci0 # 2641
+mulm s8, s7, c4 # 2642
+subs s12, s5, s8 # 2643
+movs s5, s12 # 2644
+convcbitvec 1, ci0, cb0 # 2645
+convint c5, ci0 # 2646
+addm s23, s4, c5 # 2647
+convint c2, ci0 # 2648
+mulm s22, s20, c2 # 2649
+subs s16, s23, s22 # 2650
+movs s2, s16 # 2651
+convcbitvec 1, ci0, cb6 # 2652
+convint c6, ci0 # 2653
+addm s21, s17, c6 # 2654
+convint c1, ci0 # 2655
+mulm s3, s18, c1 # 2656
+subs s15, s21, s3 # 2657
+movs s13, s15 # 2658
+adds s7, s2, s13 # 2659
+convcbitvec 1, ci0, cb3 # 2660
+convint c7, ci0 # 2661
+addm s1, s10, c7 # 2662
+mulsi s11, s10, 2 # 2663
+convint c3, ci0 # 2664
+mulm s14, s11, c3 # 2665
+subs s6, s1, s14 # 2666
+movs s0, s6 # 2667
+adds s12, s5, s0 # 2668
+shrsi s8, s9, 15 # 2669
+adds s20, s8, s7 # 2670
+ldi c2, 262144 # 2671
+mulci c4, c2, 2147483647 # 2672
+addci c5, c4, 262144 # 2673
+mulm s21, s12, c5 # 2674
+subs s4, s20, s21 # 2675
+ldi c1, 131072 # 2676
+mulci c6, c1, 2147483647 # 2677
+addci c7, c6, 131072 # 2678
+subml s22, s4, c7 # 2679
+addsi s23, s22, 1 # 2680
+ldi c4, 131072 # 2681
+mulci c3, c4, 2147483647 # 2682
+addci c2, c3, 131072 # 2683
+addm s16, s23, c2 # 2684
+split 194, 3, s16, sb61, sb309, sb287, sb305, sb306, sb283, sb419, sb12, sb280, sb467, sb60, sb277, sb468, sb303, sb274, sb297, sb298, sb270, sb59, sb299, sb268, sb500, sb295, sb264, sb291, sb465, sb262, sb58, sb507, sb257, sb57, sb293, sb51, sb93, sb286, sb254, sb492, sb284, sb249, sb281, sb463, sb244, sb279, sb56, sb241, sb418, sb464, sb238, sb275, sb462, sb643, sb273, sb85, sb235, sb461, sb54, sb233, sb271, sb55, sb232, sb53, sb92, sb230, sb266, sb460, sb635, sb499, sb267, sb634, sb459, sb52, sb225, sb259, sb260, sb224, sb458, sb261, sb630, sb409, sb10, sb126, sb253, sb417, sb628, sb50, sb457, sb219, sb251, sb250, sb625, sb247, sb248, sb217, sb245, sb246, sb215, sb243, sb456, sb214, sb48, sb455, sb618, sb239, sb498, sb616, sb454, sb91, sb615, sb82, sb47, sb207, sb416, sb489, sb205, sb229, sb425, sb204, sb45, sb231, sb202, sb453, sb452, sb608, sb46, sb228, sb606, sb44, sb451, sb604, sb222, sb220, sb602, sb450, sb497, sb600, sb43, sb505, sb191, sb508, sb490, sb445, sb211, sb449, sb187, sb42, sb210, sb186, sb41, sb83, sb185, sb206, sb212, sb591, sb8, sb448, sb589, sb415, sb40, sb588, sb447, sb200, sb442, sb39, sb198, sb581, sb195, sb196, sb173, sb192, sb99, sb172, sb496, sb193, sb34, sb188, sb189, sb170, sb89, sb37, sb169, sb36, sb183, sb575, sb180, sb443, sb166, sb178, sb179, sb572, sb414, sb35, sb163 # 2685
+xors 4, 1, sb289, sb287, sb309 # 2686
+xors 4, 1, sb290, sb61, sb287 # 2687
+xors 4, 1, sb292, sb283, sb306 # 2688
+xors 4, 1, sb546, sb292, sb305 # 2689
+xors 4, 1, sb294, sb305, sb283 # 2690
+xors 4, 1, sb466, sb280, sb12 # 2691
+xors 4, 1, sb138, sb466, sb419 # 2692
+xors 4, 1, sb296, sb419, sb280 # 2693
+xors 4, 1, sb300, sb277, sb60 # 2694
+xors 4, 1, sb544, sb300, sb467 # 2695
+xors 4, 1, sb301, sb467, sb277 # 2696
+xors 4, 1, sb302, sb274, sb303 # 2697
+xors 4, 1, sb136, sb302, sb468 # 2698
+xors 4, 1, sb304, sb468, sb274 # 2699
+xors 4, 1, sb307, sb270, sb298 # 2700
+xors 4, 1, sb135, sb307, sb297 # 2701
+xors 4, 1, sb308, sb297, sb270 # 2702
+xors 4, 1, sb310, sb268, sb299 # 2703
+xors 4, 1, sb540, sb310, sb59 # 2704
+xors 4, 1, sb311, sb59, sb268 # 2705
+xors 4, 1, sb312, sb264, sb295 # 2706
+xors 4, 1, sb131, sb312, sb500 # 2707
+xors 4, 1, sb313, sb500, sb264 # 2708
+xors 4, 1, sb316, sb262, sb465 # 2709
+xors 4, 1, sb644, sb316, sb291 # 2710
+xors 4, 1, sb318, sb291, sb262 # 2711
+xors 4, 1, sb319, sb257, sb507 # 2712
+xors 4, 1, sb641, sb319, sb58 # 2713
+xors 4, 1, sb320, sb58, sb257 # 2714
+xors 4, 1, sb472, sb51, sb293 # 2715
+xors 4, 1, sb127, sb472, sb57 # 2716
+xors 4, 1, sb325, sb57, sb51 # 2717
+xors 4, 1, sb327, sb254, sb286 # 2718
+xors 4, 1, sb128, sb327, sb93 # 2719
+xors 4, 1, sb13, sb93, sb254 # 2720
+xors 4, 1, sb329, sb249, sb284 # 2721
+xors 4, 1, sb534, sb329, sb492 # 2722
+xors 4, 1, sb420, sb492, sb249 # 2723
+xors 4, 1, sb66, sb244, sb463 # 2724
+xors 4, 1, sb637, sb66, sb281 # 2725
+xors 4, 1, sb333, sb281, sb244 # 2726
+xors 4, 1, sb338, sb241, sb56 # 2727
+xors 4, 1, sb25, sb338, sb279 # 2728
+xors 4, 1, sb339, sb279, sb241 # 2729
+xors 4, 1, sb475, sb238, sb464 # 2730
+xors 4, 1, sb432, sb475, sb418 # 2731
+xors 4, 1, sb341, sb418, sb238 # 2732
+xors 4, 1, sb342, sb643, sb462 # 2733
+xors 4, 1, sb629, sb342, sb275 # 2734
+xors 4, 1, sb343, sb275, sb643 # 2735
+xors 4, 1, sb344, sb235, sb85 # 2736
+xors 4, 1, sb624, sb344, sb273 # 2737
+xors 4, 1, sb476, sb273, sb235 # 2738
+xors 4, 1, sb346, sb233, sb54 # 2739
+xors 4, 1, sb124, sb346, sb461 # 2740
+xors 4, 1, sb347, sb461, sb233 # 2741
+xors 4, 1, sb348, sb232, sb55 # 2742
+xors 4, 1, sb620, sb348, sb271 # 2743
+xors 4, 1, sb353, sb271, sb232 # 2744
+xors 4, 1, sb354, sb230, sb92 # 2745
+xors 4, 1, sb619, sb354, sb53 # 2746
+xors 4, 1, sb356, sb53, sb230 # 2747
+xors 4, 1, sb357, sb635, sb460 # 2748
+xors 4, 1, sb621, sb357, sb266 # 2749
+xors 4, 1, sb358, sb266, sb635 # 2750
+xors 4, 1, sb359, sb634, sb267 # 2751
+xors 4, 1, sb529, sb359, sb499 # 2752
+xors 4, 1, sb360, sb499, sb634 # 2753
+xors 4, 1, sb361, sb225, sb52 # 2754
+xors 4, 1, sb530, sb361, sb459 # 2755
+xors 4, 1, sb362, sb459, sb225 # 2756
+xors 4, 1, sb363, sb224, sb260 # 2757
+xors 4, 1, sb610, sb363, sb259 # 2758
+xors 4, 1, sb364, sb259, sb224 # 2759
+xors 4, 1, sb367, sb630, sb261 # 2760
+xors 4, 1, sb428, sb367, sb458 # 2761
+xors 4, 1, sb368, sb458, sb630 # 2762
+xors 4, 1, sb369, sb126, sb10 # 2763
+xors 4, 1, sb528, sb369, sb409 # 2764
+xors 4, 1, sb371, sb409, sb126 # 2765
+xors 4, 1, sb373, sb628, sb417 # 2766
+xors 4, 1, sb120, sb373, sb253 # 2767
+xors 4, 1, sb374, sb253, sb628 # 2768
+xors 4, 1, sb375, sb219, sb457 # 2769
+xors 4, 1, sb607, sb375, sb50 # 2770
+xors 4, 1, sb377, sb50, sb219 # 2771
+xors 4, 1, sb379, sb625, sb250 # 2772
+xors 4, 1, sb24, sb379, sb251 # 2773
+xors 4, 1, sb380, sb251, sb625 # 2774
+xors 4, 1, sb381, sb217, sb248 # 2775
+xors 4, 1, sb598, sb381, sb247 # 2776
+xors 4, 1, sb382, sb247, sb217 # 2777
+xors 4, 1, sb383, sb215, sb246 # 2778
+xors 4, 1, sb512, sb383, sb245 # 2779
+xors 4, 1, sb387, sb245, sb215 # 2780
+xors 4, 1, sb388, sb214, sb456 # 2781
+xors 4, 1, sb603, sb388, sb243 # 2782
+xors 4, 1, sb391, sb243, sb214 # 2783
+xors 4, 1, sb393, sb618, sb455 # 2784
+xors 4, 1, sb526, sb393, sb48 # 2785
+xors 4, 1, sb395, sb48, sb618 # 2786
+xors 4, 1, sb397, sb616, sb498 # 2787
+xors 4, 1, sb493, sb397, sb239 # 2788
+xors 4, 1, sb399, sb239, sb616 # 2789
+xors 4, 1, sb401, sb615, sb91 # 2790
+xors 4, 1, sb596, sb401, sb454 # 2791
+xors 4, 1, sb403, sb454, sb615 # 2792
+xors 4, 1, sb405, sb207, sb47 # 2793
+xors 4, 1, sb525, sb405, sb82 # 2794
+xors 4, 1, sb1, sb82, sb207 # 2795
+xors 4, 1, sb9, sb205, sb489 # 2796
+xors 4, 1, sb523, sb9, sb416 # 2797
+xors 4, 1, sb2, sb416, sb205 # 2798
+xors 4, 1, sb11, sb204, sb425 # 2799
+xors 4, 1, sb590, sb11, sb229 # 2800
+xors 4, 1, sb98, sb229, sb204 # 2801
+xors 4, 1, sb421, sb202, sb231 # 2802
+xors 4, 1, sb117, sb421, sb45 # 2803
+xors 4, 1, sb73, sb45, sb202 # 2804
+xors 4, 1, sb15, sb608, sb452 # 2805
+xors 4, 1, sb586, sb15, sb453 # 2806
+xors 4, 1, sb118, sb453, sb608 # 2807
+xors 4, 1, sb431, sb606, sb228 # 2808
+xors 4, 1, sb116, sb431, sb46 # 2809
+xors 4, 1, sb122, sb46, sb606 # 2810
+xors 4, 1, sb26, sb604, sb451 # 2811
+xors 4, 1, sb114, sb26, sb44 # 2812
+xors 4, 1, sb433, sb44, sb604 # 2813
+xors 4, 1, sb5, sb602, sb220 # 2814
+xors 4, 1, sb23, sb5, sb222 # 2815
+xors 4, 1, sb130, sb222, sb602 # 2816
+xors 4, 1, sb408, sb600, sb497 # 2817
+xors 4, 1, sb104, sb408, sb450 # 2818
+xors 4, 1, sb134, sb450, sb600 # 2819
+xors 4, 1, sb27, sb191, sb505 # 2820
+xors 4, 1, sb570, sb27, sb43 # 2821
+xors 4, 1, sb434, sb43, sb191 # 2822
+xors 4, 1, sb139, sb445, sb490 # 2823
+xors 4, 1, sb102, sb139, sb508 # 2824
+xors 4, 1, sb140, sb508, sb445 # 2825
+xors 4, 1, sb435, sb187, sb449 # 2826
+xors 4, 1, sb511, sb435, sb211 # 2827
+xors 4, 1, sb494, sb211, sb187 # 2828
+xors 4, 1, sb142, sb186, sb210 # 2829
+xors 4, 1, sb569, sb142, sb42 # 2830
+xors 4, 1, sb87, sb42, sb186 # 2831
+xors 4, 1, sb144, sb185, sb83 # 2832
+xors 4, 1, sb519, sb144, sb41 # 2833
+xors 4, 1, sb436, sb41, sb185 # 2834
+xors 4, 1, sb29, sb591, sb212 # 2835
+xors 4, 1, sb562, sb29, sb206 # 2836
+xors 4, 1, sb147, sb206, sb591 # 2837
+xors 4, 1, sb148, sb589, sb448 # 2838
+xors 4, 1, sb518, sb148, sb8 # 2839
+xors 4, 1, sb30, sb8, sb589 # 2840
+xors 4, 1, sb150, sb588, sb40 # 2841
+xors 4, 1, sb110, sb150, sb415 # 2842
+xors 4, 1, sb413, sb415, sb588 # 2843
+xors 4, 1, sb6, sb442, sb200 # 2844
+xors 4, 1, sb429, sb6, sb447 # 2845
+xors 4, 1, sb438, sb447, sb442 # 2846
+xors 4, 1, sb0, sb581, sb198 # 2847
+xors 4, 1, sb550, sb0, sb39 # 2848
+xors 4, 1, sb407, sb39, sb581 # 2849
+xors 4, 1, sb31, sb173, sb196 # 2850
+xors 4, 1, sb516, sb31, sb195 # 2851
+xors 4, 1, sb157, sb195, sb173 # 2852
+xors 4, 1, sb158, sb172, sb99 # 2853
+xors 4, 1, sb555, sb158, sb192 # 2854
+xors 4, 1, sb495, sb192, sb172 # 2855
+xors 4, 1, sb167, sb34, sb193 # 2856
+xors 4, 1, sb108, sb167, sb496 # 2857
+xors 4, 1, sb439, sb496, sb34 # 2858
+xors 4, 1, sb164, sb170, sb189 # 2859
+xors 4, 1, sb510, sb164, sb188 # 2860
+xors 4, 1, sb165, sb188, sb170 # 2861
+xors 4, 1, sb33, sb169, sb37 # 2862
+xors 4, 1, sb103, sb33, sb89 # 2863
+xors 4, 1, sb168, sb89, sb169 # 2864
+xors 4, 1, sb88, sb575, sb183 # 2865
+xors 4, 1, sb539, sb88, sb36 # 2866
+xors 4, 1, sb101, sb36, sb575 # 2867
+xors 4, 1, sb506, sb166, sb443 # 2868
+xors 4, 1, sb536, sb506, sb180 # 2869
+xors 4, 1, sb441, sb180, sb166 # 2870
+xors 4, 1, sb171, sb572, sb179 # 2871
+xors 4, 1, sb542, sb171, sb178 # 2872
+xors 4, 1, sb7, sb178, sb572 # 2873
+xors 4, 1, sb181, sb163, sb35 # 2874
+xors 4, 1, sb541, sb181, sb414 # 2875
+xors 4, 1, sb176, sb414, sb163 # 2876
+ands 256, 1, sb288, sb289, sb290, 1, sb285, sb292, sb294, 1, sb282, sb466, sb296, 1, sb278, sb300, sb301, 1, sb276, sb302, sb304, 1, sb272, sb307, sb308, 1, sb269, sb310, sb311, 1, sb265, sb312, sb313, 1, sb263, sb316, sb318, 1, sb258, sb319, sb320, 1, sb256, sb472, sb325, 1, sb255, sb327, sb13, 1, sb252, sb329, sb420, 1, sb49, sb66, sb333, 1, sb242, sb338, sb339, 1, sb240, sb475, sb341, 1, sb237, sb342, sb343, 1, sb236, sb344, sb476, 1, sb234, sb346, sb347, 1, sb640, sb348, sb353, 1, sb638, sb354, sb356, 1, sb636, sb357, sb358, 1, sb227, sb359, sb360, 1, sb226, sb361, sb362, 1, sb632, sb363, sb364, 1, sb631, sb367, sb368, 1, sb533, sb369, sb371, 1, sb223, sb373, sb374, 1, sb221, sb375, sb377, 1, sb626, sb379, sb380, 1, sb218, sb381, sb382, 1, sb216, sb383, sb387, 1, sb622, sb388, sb391, 1, sb213, sb393, sb395, 1, sb617, sb397, sb399, 1, sb209, sb401, sb403, 1, sb208, sb405, sb1, 1, sb614, sb9, sb2, 1, sb612, sb11, sb98, 1, sb203, sb421, sb73, 1, sb201, sb15, sb118, 1, sb199, sb431, sb122, 1, sb197, sb26, sb433, 1, sb446, sb5, sb130, 1, sb194, sb408, sb134, 1, sb38, sb27, sb434, 1, sb190, sb139, sb140, 1, sb119, sb435, sb494, 1, sb594, sb142, sb87, 1, sb592, sb144, sb436, 1, sb444, sb29, sb147, 1, sb184, sb148, sb30, 1, sb182, sb150, sb413, 1, sb177, sb6, sb438, 1, sb175, sb0, sb407, 1, sb174, sb31, sb157, 1, sb580, sb158, sb495, 1, sb579, sb167, sb439, 1, sb578, sb164, sb165, 1, sb576, sb33, sb168, 1, sb115, sb88, sb101, 1, sb574, sb506, sb441, 1, sb440, sb171, sb7, 1, sb571, sb181, sb176 # 2877
+xors 4, 1, sb26, sb287, sb288 # 2878
+xors 4, 1, sb545, sb283, sb285 # 2879
+xors 4, 1, sb137, sb280, sb282 # 2880
+xors 4, 1, sb543, sb277, sb278 # 2881
+xors 4, 1, sb133, sb274, sb276 # 2882
+xors 4, 1, sb132, sb270, sb272 # 2883
+xors 4, 1, sb107, sb268, sb269 # 2884
+xors 4, 1, sb129, sb264, sb265 # 2885
+xors 4, 1, sb639, sb262, sb263 # 2886
+xors 4, 1, sb642, sb257, sb258 # 2887
+xors 4, 1, sb535, sb51, sb256 # 2888
+xors 4, 1, sb633, sb254, sb255 # 2889
+xors 4, 1, sb412, sb249, sb252 # 2890
+xors 4, 1, sb125, sb244, sb49 # 2891
+xors 4, 1, sb532, sb241, sb242 # 2892
+xors 4, 1, sb627, sb238, sb240 # 2893
+xors 4, 1, sb106, sb643, sb237 # 2894
+xors 4, 1, sb623, sb235, sb236 # 2895
+xors 4, 1, sb123, sb233, sb234 # 2896
+xors 4, 1, sb531, sb232, sb640 # 2897
+xors 4, 1, sb513, sb230, sb638 # 2898
+xors 4, 1, sb613, sb635, sb636 # 2899
+xors 4, 1, sb611, sb634, sb227 # 2900
+xors 4, 1, sb609, sb225, sb226 # 2901
+xors 4, 1, sb121, sb224, sb632 # 2902
+xors 4, 1, sb605, sb630, sb631 # 2903
+xors 4, 1, sb4, sb126, sb533 # 2904
+xors 4, 1, sb601, sb628, sb223 # 2905
+xors 4, 1, sb599, sb219, sb221 # 2906
+xors 4, 1, sb597, sb625, sb626 # 2907
+xors 4, 1, sb595, sb217, sb218 # 2908
+xors 4, 1, sb593, sb215, sb216 # 2909
+xors 4, 1, sb86, sb214, sb622 # 2910
+xors 4, 1, sb524, sb618, sb213 # 2911
+xors 4, 1, sb587, sb616, sb617 # 2912
+xors 4, 1, sb585, sb615, sb209 # 2913
+xors 4, 1, sb584, sb207, sb208 # 2914
+xors 4, 1, sb430, sb205, sb614 # 2915
+xors 4, 1, sb522, sb204, sb612 # 2916
+xors 4, 1, sb577, sb202, sb203 # 2917
+xors 4, 1, sb583, sb608, sb201 # 2918
+xors 4, 1, sb582, sb606, sb199 # 2919
+xors 4, 1, sb521, sb604, sb197 # 2920
+xors 4, 1, sb573, sb602, sb446 # 2921
+xors 4, 1, sb520, sb600, sb194 # 2922
+xors 4, 1, sb113, sb191, sb38 # 2923
+xors 4, 1, sb563, sb445, sb190 # 2924
+xors 4, 1, sb561, sb187, sb119 # 2925
+xors 4, 1, sb112, sb186, sb594 # 2926
+xors 4, 1, sb565, sb185, sb592 # 2927
+xors 4, 1, sb111, sb591, sb444 # 2928
+xors 4, 1, sb22, sb589, sb184 # 2929
+xors 4, 1, sb554, sb588, sb182 # 2930
+xors 4, 1, sb549, sb442, sb177 # 2931
+xors 4, 1, sb517, sb581, sb175 # 2932
+xors 4, 1, sb109, sb173, sb174 # 2933
+xors 4, 1, sb509, sb172, sb580 # 2934
+xors 4, 1, sb17, sb34, sb579 # 2935
+xors 4, 1, sb514, sb170, sb578 # 2936
+xors 4, 1, sb538, sb169, sb576 # 2937
+xors 4, 1, sb515, sb575, sb115 # 2938
+xors 4, 1, sb424, sb166, sb574 # 2939
+xors 4, 1, sb21, sb572, sb440 # 2940
+xors 4, 1, sb27, sb163, sb571 # 2941
+xors 4, 1, sb98, sb21, sb541 # 2942
+xors 4, 1, sb547, sb424, sb542 # 2943
+xors 4, 1, sb341, sb515, sb536 # 2944
+xors 4, 1, sb28, sb538, sb539 # 2945
+xors 4, 1, sb95, sb514, sb103 # 2946
+xors 4, 1, sb548, sb17, sb510 # 2947
+xors 4, 1, sb351, sb509, sb108 # 2948
+xors 4, 1, sb141, sb109, sb555 # 2949
+xors 4, 1, sb69, sb517, sb516 # 2950
+xors 4, 1, sb143, sb549, sb550 # 2951
+xors 4, 1, sb350, sb554, sb429 # 2952
+xors 4, 1, sb551, sb22, sb110 # 2953
+xors 4, 1, sb70, sb111, sb518 # 2954
+xors 4, 1, sb145, sb565, sb562 # 2955
+xors 4, 1, sb14, sb112, sb519 # 2956
+xors 4, 1, sb552, sb561, sb569 # 2957
+xors 4, 1, sb72, sb563, sb511 # 2958
+xors 4, 1, sb146, sb113, sb102 # 2959
+xors 4, 1, sb426, sb520, sb570 # 2960
+xors 4, 1, sb553, sb573, sb104 # 2961
+xors 4, 1, sb479, sb521, sb23 # 2962
+xors 4, 1, sb556, sb582, sb114 # 2963
+xors 4, 1, sb411, sb583, sb116 # 2964
+xors 4, 1, sb149, sb577, sb586 # 2965
+xors 4, 1, sb366, sb522, sb117 # 2966
+xors 4, 1, sb557, sb430, sb590 # 2967
+xors 4, 1, sb427, sb584, sb523 # 2968
+xors 4, 1, sb558, sb585, sb525 # 2969
+xors 4, 1, sb370, sb587, sb596 # 2970
+xors 4, 1, sb151, sb524, sb493 # 2971
+xors 4, 1, sb372, sb86, sb526 # 2972
+xors 4, 1, sb559, sb593, sb603 # 2973
+xors 4, 1, sb376, sb595, sb512 # 2974
+xors 4, 1, sb152, sb597, sb598 # 2975
+xors 4, 1, sb15, sb599, sb24 # 2976
+xors 4, 1, sb560, sb601, sb607 # 2977
+xors 4, 1, sb483, sb4, sb120 # 2978
+xors 4, 1, sb153, sb605, sb528 # 2979
+xors 4, 1, sb378, sb121, sb428 # 2980
+xors 4, 1, sb154, sb609, sb610 # 2981
+xors 4, 1, sb385, sb611, sb530 # 2982
+xors 4, 1, sb155, sb613, sb529 # 2983
+xors 4, 1, sb484, sb513, sb621 # 2984
+xors 4, 1, sb156, sb531, sb619 # 2985
+xors 4, 1, sb389, sb123, sb620 # 2986
+xors 4, 1, sb564, sb623, sb124 # 2987
+xors 4, 1, sb386, sb106, sb624 # 2988
+xors 4, 1, sb159, sb627, sb629 # 2989
+xors 4, 1, sb77, sb532, sb432 # 2990
+xors 4, 1, sb566, sb125, sb25 # 2991
+xors 4, 1, sb394, sb412, sb637 # 2992
+xors 4, 1, sb567, sb633, sb534 # 2993
+xors 4, 1, sb392, sb535, sb128 # 2994
+xors 4, 1, sb160, sb642, sb127 # 2995
+xors 4, 1, sb398, sb639, sb641 # 2996
+xors 4, 1, sb568, sb129, sb644 # 2997
+xors 4, 1, sb396, sb107, sb131 # 2998
+xors 4, 1, sb161, sb132, sb540 # 2999
+xors 4, 1, sb79, sb133, sb135 # 3000
+xors 4, 1, sb32, sb543, sb136 # 3001
+xors 4, 1, sb400, sb137, sb544 # 3002
+xors 4, 1, sb162, sb545, sb138 # 3003
+ands 376, 1, sb67, sb21, sb541, 1, sb340, sb424, sb542, 1, sb336, sb515, sb536, 1, sb502, sb538, sb539, 1, sb334, sb514, sb103, 1, sb345, sb17, sb510, 1, sb473, sb509, sb108, 1, sb352, sb109, sb555, 1, sb332, sb517, sb516, 1, sb349, sb549, sb550, 1, sb328, sb554, sb429, 1, sb477, sb22, sb110, 1, sb330, sb111, sb518, 1, sb355, sb565, sb562, 1, sb324, sb112, sb519, 1, sb71, sb561, sb569, 1, sb322, sb563, sb511, 1, sb478, sb113, sb102, 1, sb323, sb520, sb570, 1, sb503, sb573, sb104, 1, sb94, sb521, sb23, 1, sb480, sb582, sb114, 1, sb501, sb583, sb116, 1, sb365, sb577, sb586, 1, sb314, sb522, sb117, 1, sb20, sb430, sb590, 1, sb62, sb584, sb523, 1, sb74, sb585, sb525, 1, sb63, sb587, sb596, 1, sb481, sb524, sb493, 1, sb61, sb86, sb526, 1, sb96, sb593, sb603, 1, sb419, sb595, sb512, 1, sb75, sb597, sb598, 1, sb303, sb599, sb24, 1, sb422, sb601, sb607, 1, sb468, sb4, sb120, 1, sb482, sb605, sb528, 1, sb299, sb121, sb428, 1, sb384, sb609, sb610, 1, sb59, sb611, sb530, 1, sb410, sb613, sb529, 1, sb295, sb513, sb621, 1, sb76, sb531, sb619, 1, sb507, sb123, sb620, 1, sb390, sb623, sb124, 1, sb58, sb106, sb624, 1, sb485, sb627, sb629, 1, sb293, sb532, sb432, 1, sb78, sb125, sb25, 1, sb93, sb412, sb637, 1, sb486, sb633, sb534, 1, sb464, sb535, sb128, 1, sb504, sb642, sb127, 1, sb85, sb639, sb641, 1, sb97, sb129, sb644, 1, sb11, sb107, sb131, 1, sb16, sb132, sb540, 1, sb2, sb133, sb135, 1, sb487, sb543, sb136, 1, sb55, sb137, sb544, 1, sb404, sb545, sb138, 1, sb537, sb26, sb546, 1, sb239, sb98, sb547, 1, sb402, sb341, sb28, 1, sb47, sb95, sb548, 1, sb80, sb351, sb141, 1, sb245, sb69, sb143, 1, sb423, sb350, sb551, 1, sb498, sb70, sb145, 1, sb406, sb14, sb552, 1, sb91, sb72, sb146, 1, sb3, sb426, sb553, 1, sb50, sb479, sb556, 1, sb488, sb411, sb149, 1, sb456, sb366, sb557, 1, sb81, sb427, sb558, 1, sb417, sb370, sb151, 1, sb437, sb372, sb559, 1, sb251, sb376, sb152, 1, sb90, sb15, sb560, 1, sb253, sb483, sb153, 1, sb18, sb378, sb154, 1, sb459, sb385, sb155, 1, sb471, sb484, sb156, 1, sb458, sb389, sb564, 1, sb100, sb386, sb159, 1, sb499, sb77, sb566, 1, sb474, sb394, sb567, 1, sb261, sb392, sb160, 1, sb19, sb398, sb568, 1, sb271, sb396, sb161, 1, sb527, sb79, sb32, 1, sb105, sb400, sb162 # 3004
+ands 188, 1, sb491, sb98, sb340, 1, sb68, sb341, sb502, 1, sb84, sb95, sb345, 1, sb331, sb351, sb352, 1, sb337, sb69, sb349, 1, sb335, sb350, sb477, 1, sb65, sb70, sb355, 1, sb64, sb14, sb71, 1, sb321, sb72, sb478, 1, sb326, sb426, sb503, 1, sb317, sb479, sb480, 1, sb315, sb411, sb365, 1, sb470, sb366, sb20, 1, sb469, sb427, sb74, 1, sb309, sb370, sb481, 1, sb306, sb372, sb96, 1, sb305, sb376, sb75, 1, sb60, sb15, sb422, 1, sb12, sb483, sb482, 1, sb467, sb378, sb384, 1, sb298, sb385, sb410, 1, sb297, sb484, sb76, 1, sb465, sb389, sb390, 1, sb500, sb386, sb485, 1, sb291, sb77, sb78, 1, sb286, sb394, sb486, 1, sb284, sb392, sb504, 1, sb463, sb398, sb97, 1, sb281, sb396, sb16, 1, sb57, sb79, sb487, 1, sb492, sb400, sb404, 1, sb36, sb239, sb402, 1, sb460, sb47, sb80, 1, sb37, sb245, sb423, 1, sb266, sb498, sb406, 1, sb188, sb91, sb3, 1, sb267, sb50, sb488, 1, sb496, sb456, sb81, 1, sb92, sb417, sb437, 1, sb89, sb251, sb90, 1, sb275, sb253, sb18, 1, sb40, sb459, sb471, 1, sb279, sb458, sb100, 1, sb196, sb499, sb474, 1, sb462, sb261, sb19, 1, sb461, sb271, sb527, 1, sb56, sb105, sb537 # 3005
+xors 4, 1, sb454, sb491, sb67 # 3006
+xors 4, 1, sb48, sb68, sb336 # 3007
+xors 4, 1, sb46, sb84, sb334 # 3008
+xors 4, 1, sb243, sb331, sb473 # 3009
+xors 4, 1, sb18, sb337, sb332 # 3010
+xors 4, 1, sb247, sb335, sb328 # 3011
+xors 4, 1, sb228, sb65, sb330 # 3012
+xors 4, 1, sb455, sb64, sb324 # 3013
+xors 4, 1, sb453, sb321, sb322 # 3014
+xors 4, 1, sb250, sb326, sb323 # 3015
+xors 4, 1, sb231, sb317, sb94 # 3016
+xors 4, 1, sb246, sb315, sb501 # 3017
+xors 4, 1, sb222, sb470, sb314 # 3018
+xors 4, 1, sb248, sb469, sb62 # 3019
+xors 4, 1, sb220, sb309, sb63 # 3020
+xors 4, 1, sb409, sb306, sb61 # 3021
+xors 4, 1, sb497, sb305, sb419 # 3022
+xors 4, 1, sb457, sb60, sb303 # 3023
+xors 4, 1, sb83, sb12, sb468 # 3024
+xors 4, 1, sb259, sb467, sb299 # 3025
+xors 4, 1, sb508, sb298, sb59 # 3026
+xors 4, 1, sb10, sb297, sb295 # 3027
+xors 4, 1, sb42, sb465, sb507 # 3028
+xors 4, 1, sb53, sb500, sb58 # 3029
+xors 4, 1, sb210, sb291, sb293 # 3030
+xors 4, 1, sb260, sb286, sb93 # 3031
+xors 4, 1, sb490, sb284, sb464 # 3032
+xors 4, 1, sb52, sb463, sb85 # 3033
+xors 4, 1, sb8, sb281, sb11 # 3034
+xors 4, 1, sb54, sb57, sb2 # 3035
+xors 4, 1, sb418, sb492, sb55 # 3036
+xors 4, 1, sb273, sb56, sb418 # 3037
+ands 92, 1, sb82, sb239, sb48, 1, sb416, sb47, sb243, 1, sb489, sb245, sb247, 1, sb45, sb498, sb455, 1, sb425, sb91, sb250, 1, sb229, sb50, sb246, 1, sb451, sb456, sb248, 1, sb452, sb417, sb409, 1, sb450, sb251, sb457, 1, sb505, sb253, sb259, 1, sb44, sb459, sb10, 1, sb211, sb458, sb53, 1, sb43, sb499, sb260, 1, sb449, sb261, sb52, 1, sb206, sb271, sb54, 1, sb6, sb36, sb460, 1, sb198, sb37, sb266, 1, sb157, sb188, sb267, 1, sb200, sb496, sb92, 1, sb495, sb89, sb275, 1, sb415, sb40, sb279, 1, sb447, sb196, sb462, 1, sb41, sb461, sb273 # 3038
+xors 4, 1, sb7, sb82, sb454 # 3039
+xors 4, 1, sb183, sb416, sb46 # 3040
+xors 4, 1, sb181, sb489, sb18 # 3041
+xors 4, 1, sb193, sb45, sb228 # 3042
+xors 4, 1, sb443, sb425, sb453 # 3043
+xors 4, 1, sb189, sb229, sb231 # 3044
+xors 4, 1, sb179, sb451, sb222 # 3045
+xors 4, 1, sb192, sb452, sb220 # 3046
+xors 4, 1, sb176, sb450, sb497 # 3047
+xors 4, 1, sb99, sb505, sb83 # 3048
+xors 4, 1, sb441, sb44, sb508 # 3049
+xors 4, 1, sb195, sb211, sb42 # 3050
+xors 4, 1, sb167, sb43, sb210 # 3051
+xors 4, 1, sb39, sb449, sb490 # 3052
+xors 4, 1, sb212, sb206, sb8 # 3053
+xors 4, 1, sb448, sb41, sb212 # 3054
+ands 44, 1, sb180, sb36, sb183, 1, sb178, sb37, sb193, 1, sb414, sb188, sb189, 1, sb35, sb496, sb192, 1, sb171, sb89, sb99, 1, sb88, sb40, sb195, 1, sb33, sb196, sb39, 1, sb494, sb6, sb198, 1, sb439, sb157, sb200, 1, sb165, sb495, sb415, 1, sb164, sb447, sb448 # 3055
+xors 4, 1, sb438, sb180, sb7 # 3056
+xors 4, 1, sb0, sb178, sb181 # 3057
+xors 4, 1, sb407, sb414, sb443 # 3058
+xors 4, 1, sb158, sb35, sb179 # 3059
+xors 4, 1, sb30, sb171, sb176 # 3060
+xors 4, 1, sb506, sb88, sb441 # 3061
+xors 4, 1, sb101, sb33, sb167 # 3062
+xors 4, 1, sb168, sb164, sb101 # 3063
+ands 20, 1, sb31, sb6, sb0, 1, sb413, sb157, sb158, 1, sb150, sb495, sb506, 1, sb436, sb494, sb439, 1, sb147, sb165, sb168 # 3064
+xors 4, 1, sb87, sb31, sb438 # 3065
+xors 4, 1, sb144, sb413, sb407 # 3066
+xors 4, 1, sb148, sb150, sb30 # 3067
+xors 4, 1, sb29, sb147, sb148 # 3068
+ands 8, 1, sb142, sb494, sb144, 1, sb139, sb436, sb29 # 3069
+xors 4, 1, sb140, sb142, sb87 # 3070
+xors 4, 1, sb435, sb139, sb140 # 3071
+dabit s3, sb434 # 3072
+xors 4, 1, sb433, sb434, sb435 # 3073
+mulsi s18, s3, 2 # 3074
+dabit s8, sb134 # 3075
+xors 4, 1, sb5, sb134, sb27 # 3076
+mulsi s7, s8, 2 # 3077
+shrsi s17, s16, 1 # 3078
+dabit s9, sb130 # 3079
+xors 4, 1, sb408, sb130, sb26 # 3080
+reveal 9, 1, cb2, sb433, 1, cb4, sb5, 1, cb7, sb408 # 3081
+convcbitvec 1, ci0, cb2 # 3082
+convint c5, ci0 # 3083
+addm s11, s3, c5 # 3084
+convint c1, ci0 # 3085
+mulm s15, s18, c1 # 3086
+subs s13, s11, s15 # 3087
+movs s2, s13 # 3088
+movs s10, s2 # 3089
+convcbitvec 1, ci0, cb4 # 3090
+convint c6, ci0 # 3091
+addm s14, s8, c6 # 3092
+convint c7, ci0 # 3093
+mulm s6, s7, c7 # 3094
+subs s1, s14, s6 # 3095
+movs s0, s1 # 3096
+adds s5, s10, s0 # 3097
+convcbitvec 1, ci0, cb7 # 3098
+convint c4, ci0 # 3099
+addm s20, s9, c4 # 3100
+mulsi s12, s9, 2 # 3101
+convint c3, ci0 # 3102
+mulm s21, s12, c3 # 3103
+subs s23, s20, s21 # 3104
+movs s4, s23 # 3105
+adds s22, s17, s4 # 3106
+ldi c6, 2 # 3107
+mulci c2, c6, 2147483647 # 3108
+addci c5, c2, 4 # 3109
+mulci c1, c5, 2147483647 # 3110
+addci c7, c1, 2 # 3111
+mulm s16, s5, c7 # 3112
+subs s3, s22, s16 # 3113
+ldi c6, 65536 # 3114
+mulci c4, c6, 2147483647 # 3115
+addci c3, c4, 65536 # 3116
+subml s15, s3, c3 # 3117
+addm s18, s19, c0 # 3118
+muls 8, 1, s11, s15, s18, 1, s9, s19, s19 # 3119
+ldi c1, 2 # 3120
+mulci c2, c1, 2147483647 # 3121
+addci c5, c2, 4 # 3122
+mulci c6, c5, 2147483647 # 3123
+addci c7, c6, 2 # 3124
+addm s10, s11, c7 # 3125
+split 194, 3, s10, sb431, sb122, sb471, sb73, sb118, sb320, sb1, sb421, sb63, sb403, sb405, sb100, sb399, sb401, sb468, sb395, sb397, sb12, sb391, sb393, sb467, sb387, sb388, sb298, sb382, sb383, sb297, sb380, sb381, sb293, sb377, sb379, sb291, sb374, sb375, sb93, sb371, sb373, sb464, sb368, sb369, sb57, sb363, sb367, sb492, sb360, sb362, sb418, sb358, sb359, sb56, sb356, sb357, sb462, sb353, sb354, sb279, sb347, sb348, sb275, sb345, sb346, sb54, sb343, sb344, sb271, sb475, sb342, sb499, sb333, sb338, sb269, sb420, sb66, sb53, sb329, sb13, sb459, sb325, sb327, sb259, sb319, sb472, sb409, sb316, sb318, sb417, sb312, sb313, sb50, sb310, sb311, sb250, sb307, sb308, sb247, sb302, sb304, sb245, sb300, sb301, sb243, sb466, sb296, sb48, sb292, sb294, sb239, sb289, sb290, sb454, sb287, sb288, sb237, sb283, sb285, sb425, sb280, sb282, sb231, sb277, sb278, sb229, sb274, sb276, sb452, sb270, sb272, sb225, sb265, sb268, sb9, sb263, sb264, sb224, sb258, sb262, sb44, sb256, sb257, sb43, sb255, sb51, sb490, sb252, sb254, sb90, sb49, sb249, sb449, sb242, sb244, sb212, sb240, sb241, sb41, sb643, sb238, sb448, sb235, sb236, sb40, sb233, sb234, sb197, sb232, sb640, sb193, sb230, sb638, sb37, sb635, sb636, sb443, sb634, sb227, sb179, sb632, sb226, sb35, sb126, sb631, sb176, sb223, sb630, sb495, sb628, sb221, sb166, sb219, sb626, sb160 # 3126
+xors 4, 1, sb326, sb471, sb122 # 3127
+xors 4, 1, sb65, sb431, sb471 # 3128
+xors 4, 1, sb330, sb320, sb118 # 3129
+xors 4, 1, sb361, sb330, sb73 # 3130
+xors 4, 1, sb335, sb73, sb320 # 3131
+xors 4, 1, sb474, sb63, sb421 # 3132
+xors 4, 1, sb364, sb474, sb1 # 3133
+xors 4, 1, sb337, sb1, sb63 # 3134
+xors 4, 1, sb339, sb100, sb405 # 3135
+xors 4, 1, sb19, sb339, sb403 # 3136
+xors 4, 1, sb84, sb403, sb100 # 3137
+xors 4, 1, sb68, sb468, sb401 # 3138
+xors 4, 1, sb421, sb68, sb399 # 3139
+xors 4, 1, sb502, sb399, sb468 # 3140
+xors 4, 1, sb351, sb12, sb397 # 3141
+xors 4, 1, sb352, sb351, sb395 # 3142
+xors 4, 1, sb477, sb395, sb12 # 3143
+xors 4, 1, sb70, sb467, sb393 # 3144
+xors 4, 1, sb350, sb70, sb391 # 3145
+xors 4, 1, sb355, sb391, sb467 # 3146
+xors 4, 1, sb14, sb298, sb388 # 3147
+xors 4, 1, sb349, sb14, sb387 # 3148
+xors 4, 1, sb71, sb387, sb298 # 3149
+xors 4, 1, sb72, sb297, sb383 # 3150
+xors 4, 1, sb476, sb72, sb382 # 3151
+xors 4, 1, sb73, sb382, sb297 # 3152
+xors 4, 1, sb503, sb293, sb381 # 3153
+xors 4, 1, sb95, sb503, sb380 # 3154
+xors 4, 1, sb479, sb380, sb293 # 3155
+xors 4, 1, sb480, sb291, sb379 # 3156
+xors 4, 1, sb491, sb480, sb377 # 3157
+xors 4, 1, sb411, sb377, sb291 # 3158
+xors 4, 1, sb365, sb93, sb375 # 3159
+xors 4, 1, sb98, sb365, sb374 # 3160
+xors 4, 1, sb366, sb374, sb93 # 3161
+xors 4, 1, sb20, sb464, sb373 # 3162
+xors 4, 1, sb341, sb20, sb371 # 3163
+xors 4, 1, sb427, sb371, sb464 # 3164
+xors 4, 1, sb74, sb57, sb369 # 3165
+xors 4, 1, sb67, sb74, sb368 # 3166
+xors 4, 1, sb370, sb368, sb57 # 3167
+xors 4, 1, sb481, sb492, sb367 # 3168
+xors 4, 1, sb336, sb481, sb363 # 3169
+xors 4, 1, sb372, sb363, sb492 # 3170
+xors 4, 1, sb96, sb418, sb362 # 3171
+xors 4, 1, sb334, sb96, sb360 # 3172
+xors 4, 1, sb376, sb360, sb418 # 3173
+xors 4, 1, sb75, sb56, sb359 # 3174
+xors 4, 1, sb332, sb75, sb358 # 3175
+xors 4, 1, sb15, sb358, sb56 # 3176
+xors 4, 1, sb422, sb462, sb357 # 3177
+xors 4, 1, sb328, sb422, sb356 # 3178
+xors 4, 1, sb483, sb356, sb462 # 3179
+xors 4, 1, sb384, sb279, sb354 # 3180
+xors 4, 1, sb473, sb384, sb353 # 3181
+xors 4, 1, sb385, sb353, sb279 # 3182
+xors 4, 1, sb484, sb275, sb348 # 3183
+xors 4, 1, sb323, sb484, sb347 # 3184
+xors 4, 1, sb389, sb347, sb275 # 3185
+xors 4, 1, sb390, sb54, sb346 # 3186
+xors 4, 1, sb321, sb390, sb345 # 3187
+xors 4, 1, sb485, sb345, sb54 # 3188
+xors 4, 1, sb78, sb271, sb344 # 3189
+xors 4, 1, sb64, sb78, sb343 # 3190
+xors 4, 1, sb394, sb343, sb271 # 3191
+xors 4, 1, sb486, sb499, sb342 # 3192
+xors 4, 1, sb470, sb486, sb475 # 3193
+xors 4, 1, sb398, sb475, sb499 # 3194
+xors 4, 1, sb97, sb269, sb338 # 3195
+xors 4, 1, sb315, sb97, sb333 # 3196
+xors 4, 1, sb16, sb333, sb269 # 3197
+xors 4, 1, sb487, sb53, sb66 # 3198
+xors 4, 1, sb314, sb487, sb420 # 3199
+xors 4, 1, sb404, sb420, sb53 # 3200
+xors 4, 1, sb423, sb459, sb13 # 3201
+xors 4, 1, sb469, sb423, sb329 # 3202
+xors 4, 1, sb406, sb329, sb459 # 3203
+xors 4, 1, sb488, sb259, sb327 # 3204
+xors 4, 1, sb309, sb488, sb325 # 3205
+xors 4, 1, sb451, sb325, sb259 # 3206
+xors 4, 1, sb453, sb409, sb472 # 3207
+xors 4, 1, sb61, sb453, sb319 # 3208
+xors 4, 1, sb489, sb319, sb409 # 3209
+xors 4, 1, sb18, sb417, sb318 # 3210
+xors 4, 1, sb305, sb18, sb316 # 3211
+xors 4, 1, sb460, sb316, sb417 # 3212
+xors 4, 1, sb537, sb50, sb313 # 3213
+xors 4, 1, sb303, sb537, sb312 # 3214
+xors 4, 1, sb541, sb312, sb50 # 3215
+xors 4, 1, sb424, sb250, sb311 # 3216
+xors 4, 1, sb60, sb424, sb310 # 3217
+xors 4, 1, sb542, sb310, sb250 # 3218
+xors 4, 1, sb515, sb247, sb308 # 3219
+xors 4, 1, sb76, sb515, sb307 # 3220
+xors 4, 1, sb103, sb307, sb247 # 3221
+xors 4, 1, sb109, sb245, sb304 # 3222
+xors 4, 1, sb482, sb109, sb302 # 3223
+xors 4, 1, sb555, sb302, sb245 # 3224
+xors 4, 1, sb517, sb243, sb301 # 3225
+xors 4, 1, sb378, sb517, sb300 # 3226
+xors 4, 1, sb554, sb300, sb243 # 3227
+xors 4, 1, sb429, sb48, sb296 # 3228
+xors 4, 1, sb410, sb429, sb466 # 3229
+xors 4, 1, sb22, sb466, sb48 # 3230
+xors 4, 1, sb111, sb239, sb294 # 3231
+xors 4, 1, sb386, sb111, sb292 # 3232
+xors 4, 1, sb518, sb292, sb239 # 3233
+xors 4, 1, sb565, sb454, sb290 # 3234
+xors 4, 1, sb77, sb565, sb289 # 3235
+xors 4, 1, sb568, sb289, sb454 # 3236
+xors 4, 1, sb562, sb237, sb288 # 3237
+xors 4, 1, sb392, sb562, sb287 # 3238
+xors 4, 1, sb112, sb287, sb237 # 3239
+xors 4, 1, sb519, sb425, sb285 # 3240
+xors 4, 1, sb504, sb519, sb283 # 3241
+xors 4, 1, sb569, sb283, sb425 # 3242
+xors 4, 1, sb511, sb231, sb282 # 3243
+xors 4, 1, sb396, sb511, sb280 # 3244
+xors 4, 1, sb113, sb280, sb231 # 3245
+xors 4, 1, sb102, sb229, sb278 # 3246
+xors 4, 1, sb79, sb102, sb277 # 3247
+xors 4, 1, sb520, sb277, sb229 # 3248
+xors 4, 1, sb570, sb452, sb276 # 3249
+xors 4, 1, sb402, sb570, sb274 # 3250
+xors 4, 1, sb573, sb274, sb452 # 3251
+xors 4, 1, sb104, sb225, sb272 # 3252
+xors 4, 1, sb80, sb104, sb270 # 3253
+xors 4, 1, sb521, sb270, sb225 # 3254
+xors 4, 1, sb23, sb9, sb268 # 3255
+xors 4, 1, sb3, sb23, sb265 # 3256
+xors 4, 1, sb582, sb265, sb9 # 3257
+xors 4, 1, sb583, sb224, sb264 # 3258
+xors 4, 1, sb81, sb583, sb263 # 3259
+xors 4, 1, sb116, sb263, sb224 # 3260
+xors 4, 1, sb586, sb44, sb262 # 3261
+xors 4, 1, sb437, sb586, sb258 # 3262
+xors 4, 1, sb117, sb258, sb44 # 3263
+xors 4, 1, sb590, sb43, sb257 # 3264
+xors 4, 1, sb506, sb590, sb256 # 3265
+xors 4, 1, sb118, sb256, sb43 # 3266
+xors 4, 1, sb525, sb490, sb51 # 3267
+xors 4, 1, sb496, sb525, sb255 # 3268
+xors 4, 1, sb596, sb255, sb490 # 3269
+xors 4, 1, sb105, sb90, sb254 # 3270
+xors 4, 1, sb82, sb105, sb252 # 3271
+xors 4, 1, sb526, sb252, sb90 # 3272
+xors 4, 1, sb21, sb449, sb249 # 3273
+xors 4, 1, sb458, sb21, sb49 # 3274
+xors 4, 1, sb603, sb49, sb449 # 3275
+xors 4, 1, sb527, sb212, sb244 # 3276
+xors 4, 1, sb500, sb527, sb242 # 3277
+xors 4, 1, sb431, sb242, sb212 # 3278
+xors 4, 1, sb24, sb41, sb241 # 3279
+xors 4, 1, sb501, sb24, sb240 # 3280
+xors 4, 1, sb607, sb240, sb41 # 3281
+xors 4, 1, sb4, sb448, sb238 # 3282
+xors 4, 1, sb478, sb4, sb643 # 3283
+xors 4, 1, sb122, sb643, sb448 # 3284
+xors 4, 1, sb617, sb40, sb236 # 3285
+xors 4, 1, sb426, sb617, sb235 # 3286
+xors 4, 1, sb530, sb235, sb40 # 3287
+xors 4, 1, sb513, sb197, sb234 # 3288
+xors 4, 1, sb528, sb513, sb233 # 3289
+xors 4, 1, sb621, sb233, sb197 # 3290
+xors 4, 1, sb531, sb193, sb640 # 3291
+xors 4, 1, sb538, sb531, sb232 # 3292
+xors 4, 1, sb623, sb232, sb193 # 3293
+xors 4, 1, sb124, sb37, sb638 # 3294
+xors 4, 1, sb17, sb124, sb230 # 3295
+xors 4, 1, sb627, sb230, sb37 # 3296
+xors 4, 1, sb629, sb443, sb636 # 3297
+xors 4, 1, sb539, sb629, sb635 # 3298
+xors 4, 1, sb532, sb635, sb443 # 3299
+xors 4, 1, sb432, sb179, sb227 # 3300
+xors 4, 1, sb510, sb432, sb634 # 3301
+xors 4, 1, sb533, sb634, sb179 # 3302
+xors 4, 1, sb637, sb35, sb226 # 3303
+xors 4, 1, sb509, sb637, sb632 # 3304
+xors 4, 1, sb534, sb632, sb35 # 3305
+xors 4, 1, sb536, sb176, sb631 # 3306
+xors 4, 1, sb516, sb536, sb126 # 3307
+xors 4, 1, sb535, sb126, sb176 # 3308
+xors 4, 1, sb128, sb495, sb630 # 3309
+xors 4, 1, sb549, sb128, sb223 # 3310
+xors 4, 1, sb131, sb223, sb495 # 3311
+xors 4, 1, sb132, sb166, sb221 # 3312
+xors 4, 1, sb550, sb132, sb628 # 3313
+xors 4, 1, sb540, sb628, sb166 # 3314
+xors 4, 1, sb135, sb160, sb626 # 3315
+xors 4, 1, sb110, sb135, sb219 # 3316
+xors 4, 1, sb543, sb219, sb160 # 3317
+dabit s21, sb514 # 3318
+mulsi s13, s21, 2 # 3319
+dabit s23, sb457 # 3320
+mulsi s18, s23, 2 # 3321
+dabit s0, sb400 # 3322
+mulsi s8, s0, 2 # 3323
+dabit s19, sb1 # 3324
+mulsi s3, s19, 2 # 3325
+shrsi s22, s10, 31 # 3326
+ldi c6, 4 # 3327
+mulci c4, c6, 2147483647 # 3328
+addci c3, c4, 4 # 3329
+ldi c5, 2 # 3330
+mulci c1, c5, 2147483647 # 3331
+addci c2, c1, 2 # 3332
+ldi c1, 2 # 3333
+mulci c7, c1, 2147483647 # 3334
+addci c6, c7, 2 # 3335
+dabit s2, sb211 # 3336
+mulsi s10, s2, 2 # 3337
+dabit s1, sb206 # 3338
+mulsi s20, s1, 2 # 3339
+dabit s16, sb2 # 3340
+mulsi s15, s16, 2 # 3341
+ldi c5, 2 # 3342
+mulci c4, c5, 2147483647 # 3343
+addci c1, c4, 4 # 3344
+mulci c7, c1, 2147483647 # 3345
+addci c5, c7, 2 # 3346
+ldi c7, 1 # 3347
+mulci c4, c7, 2147483647 # 3348
+addci c1, c4, 1 # 3349
+ldi c4, 1 # 3350
+mulci c7, c4, 2147483647 # 3351
+addci c4, c7, 1 # 3352
+addm s7, s9, c4 # 3353
+ldi c4, 1 # 3354
+mulci c7, c4, 2147483647 # 3355
+addci c4, c7, 2 # 3356
+mulci c7, c4, 2147483647 # 3357
+addci c4, c7, 1 # 3358
+addm s5, s7, c4 # 3359
+split 194, 3, s5, sb625, sb218, sb407, sb216, sb217, sb30, sb215, sb622, sb147, sb213, sb214, sb142, sb616, sb618, sb140, sb615, sb209, sb27, sb207, sb208, sb134, sb205, sb614, sb408, sb204, sb612, sb5, sb203, sb529, sb433, sb201, sb202, sb493, sb199, sb608, sb83, sb604, sb606, sb403, sb446, sb602, sb399, sb600, sb194, sb395, sb38, sb191, sb391, sb190, sb445, sb387, sb187, sb119, sb382, sb186, sb594, sb380, sb592, sb185, sb377, sb591, sb444, sb374, sb182, sb184, sb371, sb584, sb181, sb368, sb580, sb414, sb363, sb171, sb579, sb360, sb169, sb441, sb358, sb575, sb522, sb356, sb572, sb165, sb353, sb161, sb163, sb347, sb159, sb567, sb345, sb563, sb157, sb343, sb560, sb561, sb340, sb558, sb559, sb333, sb556, sb150, sb13, sb436, sb146, sb329, sb139, sb435, sb472, sb129, sb133, sb319, sb577, sb641, sb316, sb69, sb108, sb312, sb324, sb331, sb310, sb94, sb322, sb307, sb62, sb317, sb302, sb306, sb419, sb300, sb295, sb299, sb59, sb465, sb507, sb292, sb286, sb58, sb289, sb85, sb284, sb287, sb11, sb463, sb283, sb55, sb281, sb280, sb461, sb273, sb277, sb267, sb92, sb274, sb52, sb266, sb270, sb260, sb261, sb265, sb253, sb10, sb263, sb248, sb251, sb258, sb91, sb246, sb256, sb455, sb498, sb255, sb46, sb47, sb252, sb228, sb416, sb456, sb222, sb45, sb242, sb497, sb220, sb240, sb505, sb450, sb236, sb42, sb508, sb642, sb8, sb210, sb640 # 3360
+xors 4, 1, sb136, sb407, sb218 # 3361
+xors 4, 1, sb137, sb625, sb407 # 3362
+xors 4, 1, sb544, sb30, sb217 # 3363
+xors 4, 1, sb644, sb544, sb216 # 3364
+xors 4, 1, sb545, sb216, sb30 # 3365
+xors 4, 1, sb138, sb147, sb622 # 3366
+xors 4, 1, sb107, sb138, sb215 # 3367
+xors 4, 1, sb546, sb215, sb147 # 3368
+xors 4, 1, sb547, sb142, sb214 # 3369
+xors 4, 1, sb127, sb547, sb213 # 3370
+xors 4, 1, sb28, sb213, sb142 # 3371
+xors 4, 1, sb548, sb140, sb618 # 3372
+xors 4, 1, sb639, sb548, sb616 # 3373
+xors 4, 1, sb141, sb616, sb140 # 3374
+xors 4, 1, sb143, sb27, sb209 # 3375
+xors 4, 1, sb633, sb143, sb615 # 3376
+xors 4, 1, sb144, sb615, sb27 # 3377
+xors 4, 1, sb145, sb134, sb208 # 3378
+xors 4, 1, sb25, sb145, sb207 # 3379
+xors 4, 1, sb29, sb207, sb134 # 3380
+xors 4, 1, sb553, sb408, sb614 # 3381
+xors 4, 1, sb125, sb553, sb205 # 3382
+xors 4, 1, sb149, sb205, sb408 # 3383
+xors 4, 1, sb557, sb5, sb612 # 3384
+xors 4, 1, sb412, sb557, sb204 # 3385
+xors 4, 1, sb151, sb204, sb5 # 3386
+xors 4, 1, sb152, sb433, sb529 # 3387
+xors 4, 1, sb624, sb152, sb203 # 3388
+xors 4, 1, sb153, sb203, sb433 # 3389
+xors 4, 1, sb154, sb493, sb202 # 3390
+xors 4, 1, sb106, sb154, sb201 # 3391
+xors 4, 1, sb155, sb201, sb493 # 3392
+xors 4, 1, sb156, sb83, sb608 # 3393
+xors 4, 1, sb620, sb156, sb199 # 3394
+xors 4, 1, sb564, sb199, sb83 # 3395
+xors 4, 1, sb566, sb403, sb606 # 3396
+xors 4, 1, sb619, sb566, sb604 # 3397
+xors 4, 1, sb32, sb604, sb403 # 3398
+xors 4, 1, sb162, sb399, sb602 # 3399
+xors 4, 1, sb123, sb162, sb446 # 3400
+xors 4, 1, sb571, sb446, sb399 # 3401
+xors 4, 1, sb440, sb395, sb194 # 3402
+xors 4, 1, sb613, sb440, sb600 # 3403
+xors 4, 1, sb574, sb600, sb395 # 3404
+xors 4, 1, sb115, sb391, sb191 # 3405
+xors 4, 1, sb121, sb115, sb38 # 3406
+xors 4, 1, sb576, sb38, sb391 # 3407
+xors 4, 1, sb170, sb387, sb445 # 3408
+xors 4, 1, sb428, sb170, sb190 # 3409
+xors 4, 1, sb578, sb190, sb387 # 3410
+xors 4, 1, sb34, sb382, sb119 # 3411
+xors 4, 1, sb605, sb34, sb187 # 3412
+xors 4, 1, sb172, sb187, sb382 # 3413
+xors 4, 1, sb173, sb380, sb594 # 3414
+xors 4, 1, sb120, sb173, sb186 # 3415
+xors 4, 1, sb174, sb186, sb380 # 3416
+xors 4, 1, sb581, sb377, sb185 # 3417
+xors 4, 1, sb601, sb581, sb592 # 3418
+xors 4, 1, sb175, sb592, sb377 # 3419
+xors 4, 1, sb442, sb374, sb444 # 3420
+xors 4, 1, sb599, sb442, sb591 # 3421
+xors 4, 1, sb177, sb591, sb374 # 3422
+xors 4, 1, sb588, sb371, sb184 # 3423
+xors 4, 1, sb512, sb588, sb182 # 3424
+xors 4, 1, sb589, sb182, sb371 # 3425
+xors 4, 1, sb182, sb368, sb181 # 3426
+xors 4, 1, sb595, sb182, sb584 # 3427
+xors 4, 1, sb184, sb584, sb368 # 3428
+xors 4, 1, sb444, sb363, sb414 # 3429
+xors 4, 1, sb593, sb444, sb580 # 3430
+xors 4, 1, sb592, sb580, sb363 # 3431
+xors 4, 1, sb186, sb360, sb579 # 3432
+xors 4, 1, sb86, sb186, sb171 # 3433
+xors 4, 1, sb594, sb171, sb360 # 3434
+xors 4, 1, sb119, sb358, sb441 # 3435
+xors 4, 1, sb524, sb119, sb169 # 3436
+xors 4, 1, sb597, sb169, sb358 # 3437
+xors 4, 1, sb190, sb356, sb522 # 3438
+xors 4, 1, sb587, sb190, sb575 # 3439
+xors 4, 1, sb598, sb575, sb356 # 3440
+xors 4, 1, sb38, sb353, sb165 # 3441
+xors 4, 1, sb585, sb38, sb572 # 3442
+xors 4, 1, sb600, sb572, sb353 # 3443
+xors 4, 1, sb194, sb347, sb163 # 3444
+xors 4, 1, sb523, sb194, sb161 # 3445
+xors 4, 1, sb446, sb161, sb347 # 3446
+xors 4, 1, sb195, sb345, sb567 # 3447
+xors 4, 1, sb430, sb195, sb159 # 3448
+xors 4, 1, sb604, sb159, sb345 # 3449
+xors 4, 1, sb606, sb343, sb157 # 3450
+xors 4, 1, sb522, sb606, sb563 # 3451
+xors 4, 1, sb608, sb563, sb343 # 3452
+xors 4, 1, sb609, sb340, sb561 # 3453
+xors 4, 1, sb114, sb609, sb560 # 3454
+xors 4, 1, sb610, sb560, sb340 # 3455
+xors 4, 1, sb203, sb333, sb559 # 3456
+xors 4, 1, sb551, sb203, sb558 # 3457
+xors 4, 1, sb611, sb558, sb333 # 3458
+xors 4, 1, sb612, sb13, sb150 # 3459
+xors 4, 1, sb552, sb612, sb556 # 3460
+xors 4, 1, sb205, sb556, sb13 # 3461
+xors 4, 1, sb614, sb329, sb146 # 3462
+xors 4, 1, sb146, sb614, sb436 # 3463
+xors 4, 1, sb208, sb436, sb329 # 3464
+xors 4, 1, sb209, sb472, sb435 # 3465
+xors 4, 1, sb556, sb209, sb139 # 3466
+xors 4, 1, sb618, sb139, sb472 # 3467
+xors 4, 1, sb213, sb319, sb133 # 3468
+xors 4, 1, sb558, sb213, sb129 # 3469
+xors 4, 1, sb214, sb129, sb319 # 3470
+xors 4, 1, sb215, sb316, sb641 # 3471
+xors 4, 1, sb559, sb215, sb577 # 3472
+xors 4, 1, sb622, sb577, sb316 # 3473
+xors 4, 1, sb216, sb312, sb108 # 3474
+xors 4, 1, sb560, sb216, sb69 # 3475
+xors 4, 1, sb217, sb69, sb312 # 3476
+xors 4, 1, sb625, sb310, sb331 # 3477
+xors 4, 1, sb561, sb625, sb324 # 3478
+xors 4, 1, sb218, sb324, sb310 # 3479
+xors 4, 1, sb219, sb307, sb322 # 3480
+xors 4, 1, sb563, sb219, sb94 # 3481
+xors 4, 1, sb626, sb94, sb307 # 3482
+xors 4, 1, sb628, sb302, sb317 # 3483
+xors 4, 1, sb159, sb628, sb62 # 3484
+xors 4, 1, sb221, sb62, sb302 # 3485
+xors 4, 1, sb223, sb300, sb419 # 3486
+xors 4, 1, sb567, sb223, sb306 # 3487
+xors 4, 1, sb630, sb306, sb300 # 3488
+xors 4, 1, sb126, sb59, sb299 # 3489
+xors 4, 1, sb161, sb126, sb295 # 3490
+xors 4, 1, sb631, sb295, sb59 # 3491
+xors 4, 1, sb632, sb292, sb507 # 3492
+xors 4, 1, sb163, sb632, sb465 # 3493
+xors 4, 1, sb226, sb465, sb292 # 3494
+xors 4, 1, sb634, sb289, sb58 # 3495
+xors 4, 1, sb572, sb634, sb286 # 3496
+xors 4, 1, sb227, sb286, sb289 # 3497
+xors 4, 1, sb635, sb287, sb284 # 3498
+xors 4, 1, sb575, sb635, sb85 # 3499
+xors 4, 1, sb636, sb85, sb287 # 3500
+xors 4, 1, sb230, sb283, sb463 # 3501
+xors 4, 1, sb169, sb230, sb11 # 3502
+xors 4, 1, sb638, sb11, sb283 # 3503
+xors 4, 1, sb232, sb280, sb281 # 3504
+xors 4, 1, sb577, sb232, sb55 # 3505
+xors 4, 1, sb233, sb55, sb280 # 3506
+xors 4, 1, sb331, sb277, sb273 # 3507
+xors 4, 1, sb171, sb331, sb461 # 3508
+xors 4, 1, sb475, sb461, sb277 # 3509
+xors 4, 1, sb69, sb274, sb92 # 3510
+xors 4, 1, sb579, sb69, sb267 # 3511
+xors 4, 1, sb87, sb267, sb274 # 3512
+xors 4, 1, sb436, sb270, sb266 # 3513
+xors 4, 1, sb580, sb436, sb52 # 3514
+xors 4, 1, sb148, sb52, sb270 # 3515
+xors 4, 1, sb150, sb265, sb261 # 3516
+xors 4, 1, sb584, sb150, sb260 # 3517
+xors 4, 1, sb31, sb260, sb265 # 3518
+xors 4, 1, sb438, sb263, sb10 # 3519
+xors 4, 1, sb591, sb438, sb253 # 3520
+xors 4, 1, sb157, sb253, sb263 # 3521
+xors 4, 1, sb158, sb258, sb251 # 3522
+xors 4, 1, sb185, sb158, sb248 # 3523
+xors 4, 1, sb439, sb248, sb258 # 3524
+xors 4, 1, sb168, sb256, sb246 # 3525
+xors 4, 1, sb187, sb168, sb91 # 3526
+xors 4, 1, sb165, sb91, sb256 # 3527
+xors 4, 1, sb101, sb255, sb498 # 3528
+xors 4, 1, sb445, sb101, sb455 # 3529
+xors 4, 1, sb33, sb455, sb255 # 3530
+xors 4, 1, sb88, sb252, sb47 # 3531
+xors 4, 1, sb191, sb88, sb46 # 3532
+xors 4, 1, sb441, sb46, sb252 # 3533
+xors 4, 1, sb7, sb456, sb416 # 3534
+xors 4, 1, sb602, sb7, sb228 # 3535
+xors 4, 1, sb36, sb228, sb456 # 3536
+xors 4, 1, sb188, sb242, sb45 # 3537
+xors 4, 1, sb201, sb188, sb222 # 3538
+xors 4, 1, sb192, sb222, sb242 # 3539
+xors 4, 1, sb89, sb240, sb220 # 3540
+xors 4, 1, sb529, sb89, sb497 # 3541
+xors 4, 1, sb196, sb497, sb240 # 3542
+xors 4, 1, sb198, sb236, sb450 # 3543
+xors 4, 1, sb207, sb198, sb505 # 3544
+xors 4, 1, sb39, sb505, sb236 # 3545
+xors 4, 1, sb200, sb642, sb508 # 3546
+xors 4, 1, sb615, sb200, sb42 # 3547
+xors 4, 1, sb199, sb42, sb642 # 3548
+xors 4, 1, sb415, sb640, sb210 # 3549
+xors 4, 1, sb616, sb415, sb8 # 3550
+xors 4, 1, sb202, sb8, sb640 # 3551
+ands 512, 1, sb324, sb326, sb65, 1, sb322, sb330, sb335, 1, sb94, sb474, sb337, 1, sb317, sb339, sb84, 1, sb62, sb68, sb502, 1, sb419, sb351, sb477, 1, sb306, sb70, sb355, 1, sb299, sb14, sb71, 1, sb466, sb72, sb73, 1, sb295, sb503, sb479, 1, sb507, sb480, sb411, 1, sb465, sb365, sb366, 1, sb58, sb20, sb427, 1, sb286, sb74, sb370, 1, sb284, sb481, sb372, 1, sb463, sb96, sb376, 1, sb11, sb75, sb15, 1, sb85, sb422, sb483, 1, sb281, sb384, sb385, 1, sb55, sb484, sb389, 1, sb461, sb390, sb485, 1, sb273, sb78, sb394, 1, sb92, sb486, sb398, 1, sb266, sb97, sb16, 1, sb267, sb487, sb404, 1, sb52, sb423, sb406, 1, sb260, sb488, sb451, 1, sb261, sb453, sb489, 1, sb10, sb18, sb460, 1, sb253, sb537, sb541, 1, sb251, sb424, sb542, 1, sb248, sb515, sb103, 1, sb246, sb109, sb555, 1, sb49, sb517, sb554, 1, sb91, sb429, sb22, 1, sb498, sb111, sb518, 1, sb455, sb565, sb568, 1, sb47, sb562, sb112, 1, sb234, sb519, sb569, 1, sb235, sb511, sb113, 1, sb46, sb102, sb520, 1, sb228, sb570, sb573, 1, sb45, sb104, sb521, 1, sb416, sb23, sb582, 1, sb222, sb583, sb116, 1, sb220, sb586, sb117, 1, sb497, sb590, sb118, 1, sb450, sb525, sb596, 1, sb505, sb105, sb526, 1, sb42, sb21, sb603, 1, sb210, sb527, sb431, 1, sb508, sb24, sb607, 1, sb8, sb4, sb122, 1, sb204, sb617, sb530, 1, sb447, sb513, sb621, 1, sb99, sb531, sb623, 1, sb189, sb124, sb627, 1, sb183, sb629, sb532, 1, sb180, sb432, sb533, 1, sb178, sb637, sb534, 1, sb414, sb536, sb535, 1, sb181, sb128, sb131, 1, sb167, sb132, sb540, 1, sb164, sb135, sb543, 1, sb0, sb136, sb137, 1, sb6, sb544, sb545, 1, sb413, sb138, sb546, 1, sb494, sb547, sb28, 1, sb435, sb548, sb141, 1, sb139, sb143, sb144, 1, sb434, sb145, sb29, 1, sb133, sb553, sb149, 1, sb130, sb557, sb151, 1, sb129, sb152, sb153, 1, sb26, sb154, sb155, 1, sb108, sb156, sb564, 1, sb405, sb566, sb32, 1, sb401, sb162, sb571, 1, sb397, sb440, sb574, 1, sb393, sb115, sb576, 1, sb388, sb170, sb578, 1, sb383, sb34, sb172, 1, sb381, sb173, sb174, 1, sb379, sb581, sb175, 1, sb375, sb442, sb177, 1, sb373, sb588, sb589, 1, sb369, sb182, sb184, 1, sb367, sb444, sb592, 1, sb362, sb186, sb594, 1, sb359, sb119, sb597, 1, sb357, sb190, sb598, 1, sb354, sb38, sb600, 1, sb348, sb194, sb446, 1, sb346, sb195, sb604, 1, sb344, sb606, sb608, 1, sb342, sb609, sb610, 1, sb338, sb203, sb611, 1, sb66, sb612, sb205, 1, sb420, sb614, sb208, 1, sb327, sb209, sb618, 1, sb325, sb213, sb214, 1, sb318, sb215, sb622, 1, sb313, sb216, sb217, 1, sb311, sb625, sb218, 1, sb308, sb219, sb626, 1, sb304, sb628, sb221, 1, sb301, sb223, sb630, 1, sb296, sb126, sb631, 1, sb294, sb632, sb226, 1, sb290, sb634, sb227, 1, sb288, sb635, sb636, 1, sb285, sb230, sb638, 1, sb282, sb232, sb233, 1, sb278, sb331, sb475, 1, sb276, sb69, sb87, 1, sb272, sb436, sb148, 1, sb268, sb150, sb31, 1, sb264, sb438, sb157, 1, sb262, sb158, sb439, 1, sb257, sb168, sb165, 1, sb51, sb101, sb33, 1, sb254, sb88, sb441, 1, sb249, sb7, sb36, 1, sb244, sb188, sb192, 1, sb241, sb89, sb196, 1, sb238, sb198, sb39, 1, sb643, sb200, sb199, 1, sb641, sb415, sb202 # 3552
+xors 4, 1, sb71, sb471, sb324 # 3553
+xors 4, 1, sb14, sb320, sb322 # 3554
+xors 4, 1, sb74, sb14, sb364 # 3555
+xors 4, 1, sb72, sb63, sb94 # 3556
+xors 4, 1, sb441, sb72, sb19 # 3557
+xors 4, 1, sb355, sb100, sb317 # 3558
+xors 4, 1, sb481, sb355, sb421 # 3559
+xors 4, 1, sb70, sb468, sb62 # 3560
+xors 4, 1, sb168, sb70, sb352 # 3561
+xors 4, 1, sb351, sb12, sb419 # 3562
+xors 4, 1, sb96, sb351, sb350 # 3563
+xors 4, 1, sb477, sb467, sb306 # 3564
+xors 4, 1, sb101, sb477, sb349 # 3565
+xors 4, 1, sb69, sb298, sb299 # 3566
+xors 4, 1, sb376, sb69, sb476 # 3567
+xors 4, 1, sb68, sb297, sb466 # 3568
+xors 4, 1, sb33, sb68, sb95 # 3569
+xors 4, 1, sb84, sb293, sb295 # 3570
+xors 4, 1, sb372, sb84, sb491 # 3571
+xors 4, 1, sb339, sb291, sb507 # 3572
+xors 4, 1, sb439, sb339, sb98 # 3573
+xors 4, 1, sb474, sb93, sb465 # 3574
+xors 4, 1, sb73, sb474, sb341 # 3575
+xors 4, 1, sb335, sb464, sb58 # 3576
+xors 4, 1, sb165, sb335, sb67 # 3577
+xors 4, 1, sb337, sb57, sb286 # 3578
+xors 4, 1, sb503, sb337, sb336 # 3579
+xors 4, 1, sb331, sb492, sb284 # 3580
+xors 4, 1, sb157, sb331, sb334 # 3581
+xors 4, 1, sb330, sb418, sb463 # 3582
+xors 4, 1, sb480, sb330, sb332 # 3583
+xors 4, 1, sb65, sb56, sb11 # 3584
+xors 4, 1, sb31, sb65, sb328 # 3585
+xors 4, 1, sb326, sb462, sb85 # 3586
+xors 4, 1, sb411, sb326, sb473 # 3587
+xors 4, 1, sb324, sb279, sb281 # 3588
+xors 4, 1, sb156, sb324, sb323 # 3589
+xors 4, 1, sb322, sb275, sb55 # 3590
+xors 4, 1, sb370, sb322, sb321 # 3591
+xors 4, 1, sb320, sb54, sb461 # 3592
+xors 4, 1, sb438, sb320, sb64 # 3593
+xors 4, 1, sb100, sb271, sb273 # 3594
+xors 4, 1, sb365, sb100, sb470 # 3595
+xors 4, 1, sb317, sb499, sb92 # 3596
+xors 4, 1, sb150, sb317, sb315 # 3597
+xors 4, 1, sb94, sb269, sb266 # 3598
+xors 4, 1, sb479, sb94, sb314 # 3599
+xors 4, 1, sb62, sb53, sb267 # 3600
+xors 4, 1, sb148, sb62, sb469 # 3601
+xors 4, 1, sb63, sb459, sb52 # 3602
+xors 4, 1, sb20, sb63, sb309 # 3603
+xors 4, 1, sb306, sb259, sb260 # 3604
+xors 4, 1, sb436, sb306, sb61 # 3605
+xors 4, 1, sb12, sb409, sb261 # 3606
+xors 4, 1, sb366, sb12, sb305 # 3607
+xors 4, 1, sb419, sb417, sb10 # 3608
+xors 4, 1, sb87, sb419, sb303 # 3609
+xors 4, 1, sb467, sb50, sb253 # 3610
+xors 4, 1, sb174, sb467, sb60 # 3611
+xors 4, 1, sb483, sb250, sb251 # 3612
+xors 4, 1, sb15, sb457, sb483 # 3613
+xors 4, 1, sb555, sb76, sb483 # 3614
+xors 4, 1, sb385, sb247, sb248 # 3615
+xors 4, 1, sb7, sb482, sb385 # 3616
+xors 4, 1, sb422, sb245, sb246 # 3617
+xors 4, 1, sb429, sb378, sb422 # 3618
+xors 4, 1, sb389, sb243, sb49 # 3619
+xors 4, 1, sb36, sb410, sb389 # 3620
+xors 4, 1, sb485, sb48, sb91 # 3621
+xors 4, 1, sb111, sb386, sb485 # 3622
+xors 4, 1, sb390, sb239, sb498 # 3623
+xors 4, 1, sb188, sb77, sb390 # 3624
+xors 4, 1, sb486, sb454, sb455 # 3625
+xors 4, 1, sb518, sb392, sb486 # 3626
+xors 4, 1, sb394, sb237, sb47 # 3627
+xors 4, 1, sb89, sb504, sb394 # 3628
+xors 4, 1, sb398, sb425, sb234 # 3629
+xors 4, 1, sb565, sb396, sb398 # 3630
+xors 4, 1, sb97, sb231, sb235 # 3631
+xors 4, 1, sb192, sb79, sb97 # 3632
+xors 4, 1, sb16, sb229, sb46 # 3633
+xors 4, 1, sb568, sb402, sb16 # 3634
+xors 4, 1, sb404, sb452, sb228 # 3635
+xors 4, 1, sb196, sb80, sb404 # 3636
+xors 4, 1, sb423, sb225, sb45 # 3637
+xors 4, 1, sb112, sb3, sb423 # 3638
+xors 4, 1, sb488, sb9, sb416 # 3639
+xors 4, 1, sb198, sb81, sb488 # 3640
+xors 4, 1, sb440, sb224, sb222 # 3641
+xors 4, 1, sb519, sb437, sb440 # 3642
+xors 4, 1, sb88, sb44, sb220 # 3643
+xors 4, 1, sb39, sb506, sb88 # 3644
+xors 4, 1, sb453, sb43, sb497 # 3645
+xors 4, 1, sb569, sb496, sb453 # 3646
+xors 4, 1, sb489, sb490, sb450 # 3647
+xors 4, 1, sb200, sb82, sb489 # 3648
+xors 4, 1, sb460, sb90, sb505 # 3649
+xors 4, 1, sb511, sb458, sb460 # 3650
+xors 4, 1, sb471, sb449, sb42 # 3651
+xors 4, 1, sb199, sb500, sb471 # 3652
+xors 4, 1, sb475, sb212, sb210 # 3653
+xors 4, 1, sb113, sb501, sb475 # 3654
+xors 4, 1, sb502, sb41, sb508 # 3655
+xors 4, 1, sb415, sb478, sb502 # 3656
+xors 4, 1, sb427, sb448, sb8 # 3657
+xors 4, 1, sb102, sb426, sb427 # 3658
+xors 4, 1, sb21, sb40, sb204 # 3659
+xors 4, 1, sb202, sb528, sb21 # 3660
+xors 4, 1, sb537, sb197, sb447 # 3661
+xors 4, 1, sb520, sb538, sb537 # 3662
+xors 4, 1, sb541, sb193, sb99 # 3663
+xors 4, 1, sb204, sb17, sb541 # 3664
+xors 4, 1, sb424, sb37, sb189 # 3665
+xors 4, 1, sb570, sb539, sb424 # 3666
+xors 4, 1, sb542, sb443, sb183 # 3667
+xors 4, 1, sb448, sb510, sb542 # 3668
+xors 4, 1, sb515, sb179, sb180 # 3669
+xors 4, 1, sb521, sb509, sb515 # 3670
+xors 4, 1, sb103, sb35, sb178 # 3671
+xors 4, 1, sb508, sb516, sb103 # 3672
+xors 4, 1, sb109, sb176, sb414 # 3673
+xors 4, 1, sb573, sb549, sb109 # 3674
+xors 4, 1, sb517, sb495, sb181 # 3675
+xors 4, 1, sb212, sb550, sb517 # 3676
+xors 4, 1, sb554, sb166, sb167 # 3677
+xors 4, 1, sb487, sb110, sb554 # 3678
+xors 4, 1, sb158, sb160, sb164 # 3679
+xors 4, 1, sb484, sb1, sb158 # 3680
+xors 4, 1, sb536, sb407, sb0 # 3681
+xors 4, 1, sb534, sb30, sb6 # 3682
+xors 4, 1, sb637, sb147, sb413 # 3683
+xors 4, 1, sb533, sb142, sb494 # 3684
+xors 4, 1, sb432, sb140, sb435 # 3685
+xors 4, 1, sb629, sb27, sb139 # 3686
+xors 4, 1, sb627, sb134, sb434 # 3687
+xors 4, 1, sb625, sb408, sb133 # 3688
+xors 4, 1, sb513, sb5, sb130 # 3689
+xors 4, 1, sb531, sb433, sb129 # 3690
+xors 4, 1, sb530, sb493, sb26 # 3691
+xors 4, 1, sb617, sb83, sb108 # 3692
+xors 4, 1, sb122, sb403, sb405 # 3693
+xors 4, 1, sb610, sb399, sb401 # 3694
+xors 4, 1, sb4, sb395, sb397 # 3695
+xors 4, 1, sb431, sb391, sb393 # 3696
+xors 4, 1, sb527, sb387, sb388 # 3697
+xors 4, 1, sb603, sb382, sb383 # 3698
+xors 4, 1, sb607, sb380, sb381 # 3699
+xors 4, 1, sb105, sb377, sb379 # 3700
+xors 4, 1, sb596, sb374, sb375 # 3701
+xors 4, 1, sb118, sb371, sb373 # 3702
+xors 4, 1, sb525, sb368, sb369 # 3703
+xors 4, 1, sb590, sb363, sb367 # 3704
+xors 4, 1, sb117, sb360, sb362 # 3705
+xors 4, 1, sb586, sb358, sb359 # 3706
+xors 4, 1, sb116, sb356, sb357 # 3707
+xors 4, 1, sb583, sb353, sb354 # 3708
+xors 4, 1, sb23, sb347, sb348 # 3709
+xors 4, 1, sb578, sb345, sb346 # 3710
+xors 4, 1, sb104, sb343, sb344 # 3711
+xors 4, 1, sb145, sb340, sb342 # 3712
+xors 4, 1, sb553, sb333, sb338 # 3713
+xors 4, 1, sb149, sb13, sb66 # 3714
+xors 4, 1, sb557, sb329, sb420 # 3715
+xors 4, 1, sb151, sb472, sb327 # 3716
+xors 4, 1, sb152, sb319, sb325 # 3717
+xors 4, 1, sb153, sb316, sb318 # 3718
+xors 4, 1, sb562, sb312, sb313 # 3719
+xors 4, 1, sb564, sb310, sb311 # 3720
+xors 4, 1, sb566, sb307, sb308 # 3721
+xors 4, 1, sb32, sb302, sb304 # 3722
+xors 4, 1, sb162, sb300, sb301 # 3723
+xors 4, 1, sb571, sb59, sb296 # 3724
+xors 4, 1, sb574, sb292, sb294 # 3725
+xors 4, 1, sb115, sb289, sb290 # 3726
+xors 4, 1, sb576, sb287, sb288 # 3727
+xors 4, 1, sb34, sb283, sb285 # 3728
+xors 4, 1, sb172, sb280, sb282 # 3729
+xors 4, 1, sb173, sb277, sb278 # 3730
+xors 4, 1, sb582, sb274, sb276 # 3731
+xors 4, 1, sb589, sb270, sb272 # 3732
+xors 4, 1, sb444, sb265, sb268 # 3733
+xors 4, 1, sb594, sb263, sb264 # 3734
+xors 4, 1, sb526, sb258, sb262 # 3735
+xors 4, 1, sb597, sb256, sb257 # 3736
+xors 4, 1, sb600, sb255, sb51 # 3737
+xors 4, 1, sb604, sb252, sb254 # 3738
+xors 4, 1, sb609, sb456, sb249 # 3739
+xors 4, 1, sb612, sb242, sb244 # 3740
+xors 4, 1, sb614, sb240, sb241 # 3741
+xors 4, 1, sb208, sb236, sb238 # 3742
+xors 4, 1, sb618, sb642, sb643 # 3743
+xors 4, 1, sb78, sb640, sb641 # 3744
+xors 4, 1, sb451, sb104, sb114 # 3745
+xors 4, 1, sb535, sb578, sb522 # 3746
+xors 4, 1, sb44, sb23, sb430 # 3747
+xors 4, 1, sb131, sb583, sb523 # 3748
+xors 4, 1, sb224, sb116, sb585 # 3749
+xors 4, 1, sb132, sb586, sb587 # 3750
+xors 4, 1, sb18, sb117, sb524 # 3751
+xors 4, 1, sb540, sb590, sb86 # 3752
+xors 4, 1, sb9, sb525, sb593 # 3753
+xors 4, 1, sb135, sb118, sb595 # 3754
+xors 4, 1, sb416, sb596, sb512 # 3755
+xors 4, 1, sb543, sb105, sb599 # 3756
+xors 4, 1, sb46, sb607, sb601 # 3757
+xors 4, 1, sb137, sb603, sb120 # 3758
+xors 4, 1, sb235, sb527, sb605 # 3759
+xors 4, 1, sb545, sb431, sb428 # 3760
+xors 4, 1, sb237, sb4, sb121 # 3761
+xors 4, 1, sb138, sb610, sb613 # 3762
+xors 4, 1, sb455, sb122, sb123 # 3763
+xors 4, 1, sb546, sb617, sb619 # 3764
+xors 4, 1, sb498, sb530, sb620 # 3765
+xors 4, 1, sb140, sb531, sb106 # 3766
+xors 4, 1, sb48, sb513, sb624 # 3767
+xors 4, 1, sb547, sb625, sb412 # 3768
+xors 4, 1, sb49, sb627, sb125 # 3769
+xors 4, 1, sb548, sb629, sb25 # 3770
+xors 4, 1, sb246, sb432, sb633 # 3771
+xors 4, 1, sb141, sb533, sb639 # 3772
+xors 4, 1, sb248, sb637, sb127 # 3773
+xors 4, 1, sb143, sb534, sb107 # 3774
+dabit s14, sb468 # 3775
+mulsi s12, s14, 2 # 3776
+dabit s17, sb233 # 3777
+xors 4, 1, sb384, sb233, sb145 # 3778
+mulsi s4, s17, 2 # 3779
+xors 4, 1, sb621, sb551, sb145 # 3780
+xors 4, 1, sb261, sb552, sb553 # 3781
+xors 4, 1, sb215, sb146, sb149 # 3782
+xors 4, 1, sb270, sb556, sb557 # 3783
+xors 4, 1, sb623, sb558, sb151 # 3784
+xors 4, 1, sb53, sb559, sb152 # 3785
+xors 4, 1, sb217, sb560, sb153 # 3786
+xors 4, 1, sb267, sb561, sb562 # 3787
+xors 4, 1, sb532, sb563, sb564 # 3788
+xors 4, 1, sb269, sb159, sb566 # 3789
+xors 4, 1, sb219, sb567, sb32 # 3790
+xors 4, 1, sb271, sb161, sb162 # 3791
+xors 4, 1, sb628, sb163, sb571 # 3792
+xors 4, 1, sb273, sb572, sb574 # 3793
+xors 4, 1, sb223, sb575, sb115 # 3794
+xors 4, 1, sb275, sb169, sb576 # 3795
+xors 4, 1, sb630, sb577, sb34 # 3796
+xors 4, 1, sb55, sb171, sb172 # 3797
+xors 4, 1, sb126, sb579, sb173 # 3798
+xors 4, 1, sb279, sb580, sb582 # 3799
+xors 4, 1, sb631, sb584, sb589 # 3800
+xors 4, 1, sb281, sb591, sb444 # 3801
+xors 4, 1, sb632, sb185, sb594 # 3802
+xors 4, 1, sb85, sb187, sb526 # 3803
+xors 4, 1, sb634, sb445, sb597 # 3804
+xors 4, 1, sb492, sb191, sb600 # 3805
+xors 4, 1, sb635, sb602, sb604 # 3806
+xors 4, 1, sb57, sb201, sb609 # 3807
+xors 4, 1, sb230, sb529, sb612 # 3808
+xors 4, 1, sb464, sb207, sb614 # 3809
+xors 4, 1, sb232, sb615, sb208 # 3810
+xors 4, 1, sb58, sb616, sb618 # 3811
+ands 748, 1, sb581, sb467, sb60, 1, sb413, sb419, sb303, 1, sb144, sb12, sb305, 1, sb147, sb306, sb61, 1, sb29, sb63, sb309, 1, sb28, sb62, sb469, 1, sb1, sb94, sb314, 1, sb136, sb317, sb315, 1, sb154, sb100, sb470, 1, sb142, sb320, sb64, 1, sb155, sb322, sb321, 1, sb434, sb324, sb323, 1, sb0, sb326, sb473, 1, sb134, sb65, sb328, 1, sb407, sb330, sb332, 1, sb128, sb331, sb334, 1, sb158, sb337, sb336, 1, sb26, sb335, sb67, 1, sb160, sb474, sb341, 1, sb124, sb339, sb98, 1, sb164, sb84, sb491, 1, sb24, sb68, sb95, 1, sb167, sb69, sb476, 1, sb119, sb477, sb349, 1, sb166, sb351, sb350, 1, sb22, sb70, sb352, 1, sb495, sb355, sb421, 1, sb75, sb72, sb19, 1, sb170, sb14, sb364, 1, sb186, sb71, sb361, 1, sb442, sb87, sb366, 1, sb175, sb436, sb20, 1, sb177, sb148, sb479, 1, sb588, sb150, sb365, 1, sb414, sb438, sb370, 1, sb182, sb156, sb411, 1, sb179, sb31, sb480, 1, sb184, sb157, sb503, 1, sb178, sb165, sb73, 1, sb592, sb439, sb372, 1, sb176, sb33, sb376, 1, sb37, sb101, sb96, 1, sb443, sb168, sb481, 1, sb180, sb441, sb74, 1, sb181, sb76, sb483, 1, sb6, sb482, sb385, 1, sb183, sb378, sb422, 1, sb405, sb410, sb389, 1, sb190, sb386, sb485, 1, sb401, sb77, sb390, 1, sb38, sb392, sb486, 1, sb397, sb504, sb394, 1, sb189, sb396, sb398, 1, sb393, sb79, sb97, 1, sb99, sb402, sb16, 1, sb388, sb80, sb404, 1, sb193, sb3, sb423, 1, sb383, sb81, sb488, 1, sb195, sb437, sb440, 1, sb381, sb506, sb88, 1, sb197, sb496, sb453, 1, sb379, sb82, sb489, 1, sb40, sb458, sb460, 1, sb375, sb500, sb471, 1, sb447, sb501, sb475, 1, sb373, sb478, sb502, 1, sb8, sb426, sb427, 1, sb369, sb528, sb21, 1, sb41, sb538, sb537, 1, sb367, sb17, sb541, 1, sb42, sb539, sb424, 1, sb362, sb510, sb542, 1, sb210, sb509, sb515, 1, sb359, sb516, sb103, 1, sb449, sb549, sb109, 1, sb357, sb550, sb517, 1, sb406, sb110, sb554, 1, sb450, sb7, sb555, 1, sb598, sb36, sb429, 1, sb214, sb188, sb111, 1, sb194, sb89, sb518, 1, sb497, sb192, sb565, 1, sb446, sb196, sb568, 1, sb490, sb198, sb112, 1, sb606, sb39, sb519, 1, sb505, sb200, sb569, 1, sb608, sb199, sb511, 1, sb222, sb415, sb113, 1, sb203, sb202, sb102, 1, sb90, sb204, sb520, 1, sb611, sb448, sb570, 1, sb220, sb508, sb521, 1, sb205, sb212, sb573, 1, sb354, sb104, sb114, 1, sb452, sb578, sb522, 1, sb348, sb23, sb430, 1, sb228, sb583, sb523, 1, sb346, sb116, sb585, 1, sb225, sb586, sb587, 1, sb344, sb117, sb524, 1, sb45, sb590, sb86, 1, sb342, sb525, sb593, 1, sb229, sb118, sb595, 1, sb338, sb596, sb512, 1, sb231, sb105, sb599, 1, sb66, sb607, sb601, 1, sb425, sb603, sb120, 1, sb329, sb527, sb605, 1, sb454, sb431, sb428, 1, sb327, sb4, sb121, 1, sb47, sb610, sb613, 1, sb325, sb122, sb123, 1, sb239, sb617, sb619, 1, sb318, sb530, sb620, 1, sb243, sb531, sb106, 1, sb313, sb513, sb624, 1, sb91, sb625, sb412, 1, sb311, sb627, sb125, 1, sb245, sb629, sb25, 1, sb308, sb432, sb633, 1, sb247, sb533, sb639, 1, sb304, sb637, sb127, 1, sb251, sb534, sb107, 1, sb259, sb536, sb644, 1, sb209, sb451, sb535, 1, sb250, sb44, sb131, 1, sb213, sb224, sb132, 1, sb50, sb18, sb540, 1, sb622, sb9, sb135, 1, sb457, sb416, sb543, 1, sb216, sb46, sb137, 1, sb253, sb235, sb545, 1, sb218, sb237, sb138, 1, sb409, sb455, sb546, 1, sb626, sb498, sb140, 1, sb10, sb48, sb547, 1, sb221, sb49, sb548, 1, sb417, sb246, sb141, 1, sb52, sb248, sb143, 1, sb260, sb551, sb145, 1, sb296, sb552, sb553, 1, sb459, sb146, sb149, 1, sb294, sb556, sb557, 1, sb92, sb558, sb151, 1, sb290, sb559, sb152, 1, sb266, sb560, sb153, 1, sb288, sb561, sb562, 1, sb499, sb563, sb564, 1, sb285, sb159, sb566, 1, sb461, sb567, sb32, 1, sb282, sb161, sb162, 1, sb54, sb163, sb571, 1, sb278, sb572, sb574, 1, sb463, sb575, sb115, 1, sb276, sb169, sb576, 1, sb462, sb577, sb34, 1, sb272, sb171, sb172, 1, sb418, sb579, sb173, 1, sb265, sb580, sb582, 1, sb11, sb584, sb589, 1, sb263, sb591, sb444, 1, sb56, sb185, sb594, 1, sb258, sb187, sb526, 1, sb284, sb445, sb597, 1, sb256, sb191, sb600, 1, sb286, sb602, sb604, 1, sb255, sb201, sb609, 1, sb293, sb529, sb612, 1, sb252, sb207, sb614, 1, sb507, sb615, sb208, 1, sb544, sb616, sb618, 1, sb291, sb261, sb621, 1, sb226, sb270, sb215, 1, sb465, sb53, sb623, 1, sb227, sb267, sb217, 1, sb93, sb269, sb532, 1, sb636, sb271, sb219, 1, sb295, sb273, sb628, 1, sb638, sb275, sb223, 1, sb466, sb55, sb630, 1, sb233, sb279, sb126, 1, sb297, sb281, sb631, 1, sb234, sb85, sb632, 1, sb298, sb492, sb634, 1, sb643, sb57, sb635, 1, sb299, sb464, sb230, 1, sb238, sb58, sb232 # 3812
+ands 372, 1, sb435, sb87, sb144, 1, sb139, sb436, sb29, 1, sb494, sb148, sb1, 1, sb27, sb150, sb154, 1, sb133, sb438, sb155, 1, sb408, sb156, sb0, 1, sb130, sb31, sb407, 1, sb5, sb157, sb158, 1, sb129, sb165, sb160, 1, sb433, sb439, sb164, 1, sb121, sb33, sb167, 1, sb493, sb101, sb166, 1, sb108, sb168, sb495, 1, sb43, sb441, sb170, 1, sb525, sb174, sb442, 1, sb594, sb175, sb177, 1, sb596, sb588, sb414, 1, sb526, sb182, sb179, 1, sb512, sb184, sb178, 1, sb597, sb592, sb176, 1, sb445, sb37, sb443, 1, sb35, sb180, sb186, 1, sb30, sb7, sb181, 1, sb403, sb36, sb183, 1, sb399, sb188, sb190, 1, sb395, sb89, sb38, 1, sb391, sb192, sb189, 1, sb387, sb196, sb99, 1, sb382, sb198, sb193, 1, sb380, sb39, sb195, 1, sb377, sb200, sb197, 1, sb374, sb199, sb40, 1, sb371, sb415, sb447, 1, sb368, sb202, sb8, 1, sb363, sb204, sb41, 1, sb360, sb448, sb42, 1, sb358, sb508, sb210, 1, sb356, sb212, sb449, 1, sb207, sb598, sb450, 1, sb603, sb194, sb214, 1, sb208, sb446, sb497, 1, sb605, sb606, sb490, 1, sb615, sb608, sb505, 1, sb607, sb203, sb222, 1, sb616, sb611, sb90, 1, sb528, sb205, sb220, 1, sb353, sb451, sb452, 1, sb347, sb44, sb228, 1, sb345, sb224, sb225, 1, sb343, sb18, sb45, 1, sb340, sb9, sb229, 1, sb333, sb416, sb231, 1, sb13, sb46, sb425, 1, sb420, sb235, sb454, 1, sb472, sb237, sb47, 1, sb319, sb455, sb239, 1, sb316, sb498, sb243, 1, sb312, sb48, sb91, 1, sb310, sb49, sb245, 1, sb307, sb246, sb247, 1, sb302, sb248, sb251, 1, sb624, sb209, sb250, 1, sb630, sb213, sb50, 1, sb617, sb622, sb457, 1, sb533, sb216, sb253, 1, sb123, sb218, sb409, 1, sb223, sb626, sb10, 1, sb631, sb221, sb417, 1, sb300, sb52, sb259, 1, sb59, sb261, sb260, 1, sb292, sb270, sb459, 1, sb289, sb53, sb92, 1, sb287, sb267, sb266, 1, sb283, sb269, sb499, 1, sb280, sb271, sb461, 1, sb277, sb273, sb54, 1, sb274, sb275, sb463, 1, sb268, sb55, sb462, 1, sb264, sb279, sb418, 1, sb262, sb281, sb11, 1, sb257, sb85, sb56, 1, sb51, sb492, sb284, 1, sb254, sb57, sb286, 1, sb249, sb464, sb293, 1, sb137, sb58, sb507, 1, sb241, sb226, sb291, 1, sb531, sb227, sb465, 1, sb242, sb636, sb93, 1, sb25, sb638, sb295, 1, sb244, sb233, sb466, 1, sb125, sb234, sb297, 1, sb456, sb643, sb298, 1, sb412, sb238, sb299 # 3813
+xors 4, 1, sb582, sb435, sb413 # 3814
+xors 4, 1, sb173, sb139, sb147 # 3815
+xors 4, 1, sb584, sb494, sb28 # 3816
+xors 4, 1, sb172, sb27, sb136 # 3817
+xors 4, 1, sb589, sb133, sb142 # 3818
+xors 4, 1, sb34, sb408, sb434 # 3819
+xors 4, 1, sb591, sb130, sb134 # 3820
+xors 4, 1, sb169, sb5, sb128 # 3821
+xors 4, 1, sb444, sb129, sb26 # 3822
+xors 4, 1, sb115, sb433, sb124 # 3823
+xors 4, 1, sb185, sb121, sb24 # 3824
+xors 4, 1, sb574, sb493, sb119 # 3825
+xors 4, 1, sb187, sb108, sb22 # 3826
+xors 4, 1, sb83, sb43, sb75 # 3827
+xors 4, 1, sb191, sb35, sb83 # 3828
+xors 4, 1, sb600, sb30, sb6 # 3829
+xors 4, 1, sb163, sb403, sb405 # 3830
+xors 4, 1, sb602, sb399, sb401 # 3831
+xors 4, 1, sb32, sb395, sb397 # 3832
+xors 4, 1, sb604, sb391, sb393 # 3833
+xors 4, 1, sb567, sb387, sb388 # 3834
+xors 4, 1, sb201, sb382, sb383 # 3835
+xors 4, 1, sb159, sb380, sb381 # 3836
+xors 4, 1, sb609, sb377, sb379 # 3837
+xors 4, 1, sb563, sb374, sb375 # 3838
+xors 4, 1, sb122, sb371, sb373 # 3839
+xors 4, 1, sb561, sb368, sb369 # 3840
+xors 4, 1, sb612, sb363, sb367 # 3841
+xors 4, 1, sb560, sb360, sb362 # 3842
+xors 4, 1, sb614, sb358, sb359 # 3843
+xors 4, 1, sb559, sb356, sb357 # 3844
+xors 4, 1, sb558, sb353, sb354 # 3845
+xors 4, 1, sb618, sb347, sb348 # 3846
+xors 4, 1, sb149, sb345, sb346 # 3847
+xors 4, 1, sb621, sb343, sb344 # 3848
+xors 4, 1, sb146, sb340, sb342 # 3849
+xors 4, 1, sb215, sb333, sb338 # 3850
+xors 4, 1, sb145, sb13, sb66 # 3851
+xors 4, 1, sb217, sb420, sb329 # 3852
+xors 4, 1, sb143, sb472, sb327 # 3853
+xors 4, 1, sb532, sb319, sb325 # 3854
+xors 4, 1, sb548, sb316, sb318 # 3855
+xors 4, 1, sb219, sb312, sb313 # 3856
+xors 4, 1, sb140, sb310, sb311 # 3857
+xors 4, 1, sb628, sb307, sb308 # 3858
+xors 4, 1, sb301, sb302, sb304 # 3859
+xors 4, 1, sb632, sb300, sb301 # 3860
+xors 4, 1, sb634, sb59, sb296 # 3861
+xors 4, 1, sb543, sb292, sb294 # 3862
+xors 4, 1, sb635, sb289, sb290 # 3863
+xors 4, 1, sb540, sb287, sb288 # 3864
+xors 4, 1, sb230, sb283, sb285 # 3865
+xors 4, 1, sb131, sb280, sb282 # 3866
+xors 4, 1, sb232, sb277, sb278 # 3867
+xors 4, 1, sb107, sb274, sb276 # 3868
+xors 4, 1, sb640, sb268, sb272 # 3869
+xors 4, 1, sb536, sb264, sb265 # 3870
+xors 4, 1, sb642, sb262, sb263 # 3871
+xors 4, 1, sb639, sb257, sb258 # 3872
+xors 4, 1, sb236, sb51, sb256 # 3873
+xors 4, 1, sb127, sb254, sb255 # 3874
+xors 4, 1, sb240, sb249, sb252 # 3875
+ands 184, 1, sb580, sb174, sb582, 1, sb579, sb175, sb584, 1, sb171, sb588, sb589, 1, sb577, sb182, sb591, 1, sb576, sb184, sb444, 1, sb575, sb592, sb185, 1, sb440, sb37, sb187, 1, sb538, sb525, sb594, 1, sb431, sb596, sb526, 1, sb601, sb512, sb597, 1, sb571, sb445, sb191, 1, sb162, sb598, sb600, 1, sb161, sb194, sb602, 1, sb566, sb446, sb604, 1, sb564, sb606, sb201, 1, sb562, sb608, sb609, 1, sb153, sb203, sb122, 1, sb152, sb611, sb612, 1, sb151, sb205, sb614, 1, sb613, sb603, sb207, 1, sb515, sb605, sb208, 1, sb529, sb607, sb615, 1, sb108, sb528, sb616, 1, sb557, sb209, sb618, 1, sb556, sb213, sb621, 1, sb552, sb622, sb215, 1, sb551, sb216, sb217, 1, sb141, sb218, sb532, 1, sb547, sb626, sb219, 1, sb546, sb221, sb628, 1, sb516, sb624, sb630, 1, sb623, sb617, sb533, 1, sb106, sb123, sb223, 1, sb545, sb631, sb632, 1, sb135, sb226, sb634, 1, sb132, sb227, sb635, 1, sb535, sb636, sb230, 1, sb644, sb638, sb232, 1, sb534, sb233, sb640, 1, sb637, sb234, sb642, 1, sb641, sb643, sb236, 1, sb565, sb238, sb240, 1, sb633, sb531, sb241, 1, sb553, sb25, sb242, 1, sb126, sb125, sb244, 1, sb517, sb412, sb456 # 3876
+xors 4, 1, sb593, sb580, sb581 # 3877
+xors 4, 1, sb595, sb579, sb173 # 3878
+xors 4, 1, sb86, sb171, sb172 # 3879
+xors 4, 1, sb105, sb577, sb34 # 3880
+xors 4, 1, sb117, sb576, sb169 # 3881
+xors 4, 1, sb599, sb575, sb115 # 3882
+xors 4, 1, sb572, sb440, sb574 # 3883
+xors 4, 1, sb120, sb571, sb572 # 3884
+xors 4, 1, sb527, sb162, sb163 # 3885
+xors 4, 1, sb585, sb161, sb32 # 3886
+xors 4, 1, sb428, sb566, sb567 # 3887
+xors 4, 1, sb583, sb564, sb159 # 3888
+xors 4, 1, sb4, sb562, sb563 # 3889
+xors 4, 1, sb23, sb153, sb561 # 3890
+xors 4, 1, sb610, sb152, sb560 # 3891
+xors 4, 1, sb522, sb151, sb559 # 3892
+xors 4, 1, sb521, sb557, sb558 # 3893
+xors 4, 1, sb619, sb556, sb149 # 3894
+xors 4, 1, sb573, sb552, sb146 # 3895
+xors 4, 1, sb530, sb551, sb145 # 3896
+xors 4, 1, sb570, sb141, sb143 # 3897
+xors 4, 1, sb620, sb547, sb548 # 3898
+xors 4, 1, sb138, sb546, sb140 # 3899
+xors 4, 1, sb513, sb545, sb138 # 3900
+xors 4, 1, sb568, sb137, sb544 # 3901
+xors 4, 1, sb625, sb135, sb543 # 3902
+xors 4, 1, sb112, sb132, sb540 # 3903
+xors 4, 1, sb627, sb535, sb131 # 3904
+xors 4, 1, sb569, sb644, sb107 # 3905
+xors 4, 1, sb629, sb534, sb536 # 3906
+xors 4, 1, sb111, sb637, sb639 # 3907
+xors 4, 1, sb432, sb641, sb127 # 3908
+ands 88, 1, sb118, sb525, sb595, 1, sb590, sb596, sb105, 1, sb524, sb512, sb599, 1, sb541, sb538, sb431, 1, sb586, sb601, sb120, 1, sb116, sb603, sb527, 1, sb523, sb605, sb428, 1, sb430, sb607, sb4, 1, sb578, sb528, sb610, 1, sb103, sb515, sb613, 1, sb81, sb108, sb529, 1, sb104, sb624, sb619, 1, sb114, sb617, sb530, 1, sb520, sb123, sb620, 1, sb550, sb516, sb623, 1, sb113, sb106, sb513, 1, sb519, sb531, sb625, 1, sb511, sb25, sb627, 1, sb518, sb125, sb629, 1, sb460, sb412, sb432, 1, sb429, sb553, sb633, 1, sb506, sb517, sb126 # 3909
+xors 4, 1, sb537, sb118, sb593 # 3910
+xors 4, 1, sb539, sb590, sb86 # 3911
+xors 4, 1, sb587, sb524, sb117 # 3912
+xors 4, 1, sb424, sb586, sb587 # 3913
+xors 4, 1, sb510, sb116, sb585 # 3914
+xors 4, 1, sb21, sb523, sb583 # 3915
+xors 4, 1, sb549, sb430, sb23 # 3916
+xors 4, 1, sb426, sb578, sb522 # 3917
+xors 4, 1, sb478, sb104, sb521 # 3918
+xors 4, 1, sb109, sb114, sb573 # 3919
+xors 4, 1, sb102, sb520, sb570 # 3920
+xors 4, 1, sb110, sb113, sb102 # 3921
+xors 4, 1, sb500, sb565, sb568 # 3922
+xors 4, 1, sb554, sb519, sb112 # 3923
+xors 4, 1, sb458, sb511, sb569 # 3924
+xors 4, 1, sb555, sb518, sb111 # 3925
+ands 40, 1, sb542, sb538, sb539, 1, sb509, sb541, sb424, 1, sb427, sb515, sb510, 1, sb502, sb108, sb549, 1, sb88, sb81, sb103, 1, sb475, sb516, sb109, 1, sb471, sb550, sb110, 1, sb82, sb553, sb554, 1, sb396, sb517, sb555, 1, sb453, sb506, sb429 # 3926
+xors 4, 1, sb17, sb542, sb537 # 3927
+xors 4, 1, sb16, sb509, sb17 # 3928
+xors 4, 1, sb422, sb514, sb16 # 3929
+xors 4, 1, sb437, sb427, sb21 # 3930
+xors 4, 1, sb488, sb502, sb426 # 3931
+xors 4, 1, sb501, sb475, sb478 # 3932
+xors 4, 1, sb489, sb471, sb501 # 3933
+xors 4, 1, sb389, sb468, sb489 # 3934
+xors 4, 1, sb398, sb460, sb500 # 3935
+xors 4, 1, sb496, sb82, sb458 # 3936
+ands 16, 1, sb423, sb81, sb437, 1, sb3, sb487, sb88, 1, sb392, sb506, sb496, 1, sb390, sb453, sb489 # 3937
+xors 4, 1, sb80, sb423, sb488 # 3938
+ands 8, 1, sb404, sb487, sb80, 1, sb79, sb3, sb16 # 3939
+xors 4, 1, sb402, sb404, sb406 # 3940
+xors 4, 1, sb97, sb79, sb402 # 3941
+xors 4, 1, sb378, sb400, sb97 # 3942
+xors 4, 1, sb504, sb396, sb398 # 3943
+xors 4, 1, sb394, sb392, sb504 # 3944
+xors 4, 1, sb486, sb390, sb394 # 3945
+dabit s7, sb77 # 3946
+xors 4, 1, sb410, sb77, sb486 # 3947
+mulsi s6, s7, 2 # 3948
+dabit s11, sb386 # 3949
+xors 4, 1, sb485, sb386, sb78 # 3950
+reveal 24, 1, cb7, sb378, 1, cb5, sb410, 1, cb1, sb422, 1, cb0, sb15, 1, cb6, sb484, 1, cb3, sb389, 1, cb2, sb384, 1, cb4, sb485 # 3951
+convcbitvec 1, ci0, cb7 # 3952
+convint c7, ci0 # 3953
+addm s9, s0, c7 # 3954
+convint c4, ci0 # 3955
+mulm s0, s8, c4 # 3956
+subs s8, s9, s0 # 3957
+movs s0, s8 # 3958
+convcbitvec 1, ci0, cb5 # 3959
+convint c7, ci0 # 3960
+addm s8, s7, c7 # 3961
+convint c4, ci0 # 3962
+mulm s9, s6, c4 # 3963
+subs s7, s8, s9 # 3964
+movs s6, s7 # 3965
+convcbitvec 1, ci0, cb1 # 3966
+convint c7, ci0 # 3967
+addm s8, s21, c7 # 3968
+convint c4, ci0 # 3969
+mulm s9, s13, c4 # 3970
+subs s7, s8, s9 # 3971
+movs s21, s7 # 3972
+convcbitvec 1, ci0, cb0 # 3973
+convint c7, ci0 # 3974
+addm s9, s23, c7 # 3975
+convint c4, ci0 # 3976
+mulm s13, s18, c4 # 3977
+subs s8, s9, s13 # 3978
+movs s7, s8 # 3979
+adds s23, s21, s7 # 3980
+adds s18, s22, s23 # 3981
+convcbitvec 1, ci0, cb6 # 3982
+convint c4, ci0 # 3983
+addm s9, s19, c4 # 3984
+convint c7, ci0 # 3985
+mulm s13, s3, c7 # 3986
+subs s8, s9, s13 # 3987
+movs s7, s8 # 3988
+adds s22, s0, s7 # 3989
+mulm s21, s22, c3 # 3990
+subs s23, s18, s21 # 3991
+subml s19, s23, c2 # 3992
+addsi s3, s19, 1 # 3993
+addm s13, s3, c6 # 3994
+split 194, 3, s13, sb385, sb482, sb56, sb483, sb76, sb43, sb481, sb96, sb8, sb376, sb372, sb35, sb503, sb75, sb30, sb480, sb411, sb405, sb370, sb365, sb401, sb479, sb20, sb397, sb366, sb361, sb393, sb71, sb364, sb388, sb19, sb72, sb383, sb421, sb355, sb381, sb352, sb70, sb379, sb350, sb351, sb375, sb478, sb349, sb373, sb477, sb476, sb369, sb95, sb346, sb367, sb98, sb68, sb362, sb339, sb341, sb359, sb474, sb67, sb357, sb335, sb336, sb354, sb337, sb334, sb348, sb331, sb332, sb69, sb338, sb330, sb344, sb328, sb65, sb342, sb473, sb326, sb333, sb323, sb324, sb329, sb321, sb322, sb420, sb64, sb320, sb325, sb470, sb100, sb319, sb315, sb317, sb313, sb314, sb94, sb311, sb469, sb62, sb308, sb309, sb318, sb304, sb61, sb63, sb301, sb305, sb306, sb296, sb303, sb12, sb294, sb419, sb60, sb290, sb299, sb467, sb288, sb297, sb298, sb285, sb295, sb466, sb282, sb465, sb93, sb278, sb291, sb507, sb276, sb58, sb293, sb272, sb286, sb464, sb264, sb284, sb57, sb262, sb492, sb85, sb257, sb11, sb281, sb51, sb418, sb279, sb254, sb462, sb55, sb49, sb463, sb275, sb242, sb54, sb273, sb240, sb461, sb271, sb236, sb499, sb269, sb233, sb266, sb267, sb232, sb92, sb53, sb230, sb459, sb270, sb635, sb260, sb261, sb634, sb259, sb52, sb632, sb417, sb265, sb223, sb10, sb409, sb221, sb457, sb253, sb626, sb250, sb251, sb625, sb248, sb249, sb83 # 3995
+xors 4, 1, sb84, sb56, sb482 # 3996
+xors 4, 1, sb491, sb385, sb56 # 3997
+xors 4, 1, sb14, sb43, sb76 # 3998
+xors 4, 1, sb119, sb14, sb483 # 3999
+xors 4, 1, sb73, sb483, sb43 # 4000
+xors 4, 1, sb74, sb8, sb96 # 4001
+xors 4, 1, sb187, sb74, sb481 # 4002
+xors 4, 1, sb22, sb481, sb8 # 4003
+xors 4, 1, sb493, sb35, sb372 # 4004
+xors 4, 1, sb444, sb493, sb376 # 4005
+xors 4, 1, sb121, sb376, sb35 # 4006
+xors 4, 1, sb24, sb30, sb75 # 4007
+xors 4, 1, sb592, sb24, sb503 # 4008
+xors 4, 1, sb433, sb503, sb30 # 4009
+xors 4, 1, sb124, sb405, sb411 # 4010
+xors 4, 1, sb591, sb124, sb480 # 4011
+xors 4, 1, sb129, sb480, sb405 # 4012
+xors 4, 1, sb26, sb401, sb365 # 4013
+xors 4, 1, sb589, sb26, sb370 # 4014
+xors 4, 1, sb5, sb370, sb401 # 4015
+xors 4, 1, sb128, sb397, sb20 # 4016
+xors 4, 1, sb175, sb128, sb479 # 4017
+xors 4, 1, sb130, sb479, sb397 # 4018
+xors 4, 1, sb134, sb393, sb361 # 4019
+xors 4, 1, sb581, sb134, sb366 # 4020
+xors 4, 1, sb408, sb366, sb393 # 4021
+xors 4, 1, sb434, sb388, sb364 # 4022
+xors 4, 1, sb173, sb434, sb71 # 4023
+xors 4, 1, sb133, sb71, sb388 # 4024
+xors 4, 1, sb142, sb383, sb72 # 4025
+xors 4, 1, sb172, sb142, sb19 # 4026
+xors 4, 1, sb27, sb19, sb383 # 4027
+xors 4, 1, sb136, sb381, sb355 # 4028
+xors 4, 1, sb578, sb136, sb421 # 4029
+xors 4, 1, sb494, sb421, sb381 # 4030
+xors 4, 1, sb28, sb379, sb70 # 4031
+xors 4, 1, sb169, sb28, sb352 # 4032
+xors 4, 1, sb139, sb352, sb379 # 4033
+xors 4, 1, sb147, sb375, sb351 # 4034
+xors 4, 1, sb575, sb147, sb350 # 4035
+xors 4, 1, sb435, sb350, sb375 # 4036
+xors 4, 1, sb413, sb373, sb349 # 4037
+xors 4, 1, sb165, sb413, sb478 # 4038
+xors 4, 1, sb87, sb478, sb373 # 4039
+xors 4, 1, sb153, sb369, sb476 # 4040
+xors 4, 1, sb571, sb153, sb477 # 4041
+xors 4, 1, sb436, sb477, sb369 # 4042
+xors 4, 1, sb29, sb367, sb346 # 4043
+xors 4, 1, sb162, sb29, sb95 # 4044
+xors 4, 1, sb6, sb95, sb367 # 4045
+xors 4, 1, sb148, sb362, sb68 # 4046
+xors 4, 1, sb161, sb148, sb98 # 4047
+xors 4, 1, sb1, sb98, sb362 # 4048
+xors 4, 1, sb150, sb359, sb341 # 4049
+xors 4, 1, sb159, sb150, sb339 # 4050
+xors 4, 1, sb157, sb339, sb359 # 4051
+xors 4, 1, sb439, sb357, sb67 # 4052
+xors 4, 1, sb564, sb439, sb474 # 4053
+xors 4, 1, sb154, sb474, sb357 # 4054
+xors 4, 1, sb438, sb354, sb336 # 4055
+xors 4, 1, sb155, sb438, sb335 # 4056
+xors 4, 1, sb156, sb335, sb354 # 4057
+xors 4, 1, sb0, sb348, sb334 # 4058
+xors 4, 1, sb560, sb0, sb337 # 4059
+xors 4, 1, sb164, sb337, sb348 # 4060
+xors 4, 1, sb158, sb69, sb332 # 4061
+xors 4, 1, sb558, sb158, sb331 # 4062
+xors 4, 1, sb33, sb331, sb69 # 4063
+xors 4, 1, sb160, sb344, sb330 # 4064
+xors 4, 1, sb557, sb160, sb338 # 4065
+xors 4, 1, sb167, sb338, sb344 # 4066
+xors 4, 1, sb101, sb342, sb65 # 4067
+xors 4, 1, sb556, sb101, sb328 # 4068
+xors 4, 1, sb441, sb328, sb342 # 4069
+xors 4, 1, sb170, sb333, sb326 # 4070
+xors 4, 1, sb145, sb170, sb473 # 4071
+xors 4, 1, sb34, sb473, sb333 # 4072
+xors 4, 1, sb166, sb329, sb324 # 4073
+xors 4, 1, sb144, sb166, sb323 # 4074
+xors 4, 1, sb168, sb323, sb329 # 4075
+xors 4, 1, sb495, sb420, sb322 # 4076
+xors 4, 1, sb548, sb495, sb321 # 4077
+xors 4, 1, sb442, sb321, sb420 # 4078
+xors 4, 1, sb177, sb325, sb320 # 4079
+xors 4, 1, sb140, sb177, sb64 # 4080
+xors 4, 1, sb414, sb64, sb325 # 4081
+xors 4, 1, sb179, sb319, sb100 # 4082
+xors 4, 1, sb546, sb179, sb470 # 4083
+xors 4, 1, sb178, sb470, sb319 # 4084
+xors 4, 1, sb443, sb313, sb317 # 4085
+xors 4, 1, sb545, sb443, sb315 # 4086
+xors 4, 1, sb180, sb315, sb313 # 4087
+xors 4, 1, sb176, sb311, sb94 # 4088
+xors 4, 1, sb543, sb176, sb314 # 4089
+xors 4, 1, sb186, sb314, sb311 # 4090
+xors 4, 1, sb36, sb308, sb62 # 4091
+xors 4, 1, sb540, sb36, sb469 # 4092
+xors 4, 1, sb188, sb469, sb308 # 4093
+xors 4, 1, sb7, sb304, sb318 # 4094
+xors 4, 1, sb131, sb7, sb309 # 4095
+xors 4, 1, sb181, sb309, sb304 # 4096
+xors 4, 1, sb190, sb301, sb63 # 4097
+xors 4, 1, sb514, sb190, sb61 # 4098
+xors 4, 1, sb183, sb61, sb301 # 4099
+xors 4, 1, sb89, sb296, sb306 # 4100
+xors 4, 1, sb643, sb89, sb305 # 4101
+xors 4, 1, sb38, sb305, sb296 # 4102
+xors 4, 1, sb192, sb294, sb12 # 4103
+xors 4, 1, sb642, sb192, sb303 # 4104
+xors 4, 1, sb196, sb303, sb294 # 4105
+xors 4, 1, sb99, sb290, sb60 # 4106
+xors 4, 1, sb641, sb99, sb419 # 4107
+xors 4, 1, sb189, sb419, sb290 # 4108
+xors 4, 1, sb198, sb288, sb467 # 4109
+xors 4, 1, sb127, sb198, sb299 # 4110
+xors 4, 1, sb39, sb299, sb288 # 4111
+xors 4, 1, sb200, sb285, sb298 # 4112
+xors 4, 1, sb639, sb200, sb297 # 4113
+xors 4, 1, sb193, sb297, sb285 # 4114
+xors 4, 1, sb195, sb282, sb466 # 4115
+xors 4, 1, sb25, sb195, sb295 # 4116
+xors 4, 1, sb197, sb295, sb282 # 4117
+xors 4, 1, sb199, sb278, sb93 # 4118
+xors 4, 1, sb412, sb199, sb465 # 4119
+xors 4, 1, sb204, sb465, sb278 # 4120
+xors 4, 1, sb40, sb276, sb507 # 4121
+xors 4, 1, sb126, sb40, sb291 # 4122
+xors 4, 1, sb415, sb291, sb276 # 4123
+xors 4, 1, sb41, sb272, sb293 # 4124
+xors 4, 1, sb624, sb41, sb58 # 4125
+xors 4, 1, sb447, sb58, sb272 # 4126
+xors 4, 1, sb202, sb264, sb464 # 4127
+xors 4, 1, sb125, sb202, sb286 # 4128
+xors 4, 1, sb448, sb286, sb264 # 4129
+xors 4, 1, sb42, sb262, sb57 # 4130
+xors 4, 1, sb620, sb42, sb284 # 4131
+xors 4, 1, sb508, sb284, sb262 # 4132
+xors 4, 1, sb210, sb257, sb85 # 4133
+xors 4, 1, sb531, sb210, sb492 # 4134
+xors 4, 1, sb212, sb492, sb257 # 4135
+xors 4, 1, sb449, sb51, sb281 # 4136
+xors 4, 1, sb623, sb449, sb11 # 4137
+xors 4, 1, sb450, sb11, sb51 # 4138
+xors 4, 1, sb214, sb254, sb279 # 4139
+xors 4, 1, sb106, sb214, sb418 # 4140
+xors 4, 1, sb497, sb418, sb254 # 4141
+xors 4, 1, sb222, sb49, sb55 # 4142
+xors 4, 1, sb619, sb222, sb462 # 4143
+xors 4, 1, sb220, sb462, sb49 # 4144
+xors 4, 1, sb451, sb242, sb275 # 4145
+xors 4, 1, sb529, sb451, sb463 # 4146
+xors 4, 1, sb452, sb463, sb242 # 4147
+xors 4, 1, sb44, sb240, sb273 # 4148
+xors 4, 1, sb608, sb44, sb54 # 4149
+xors 4, 1, sb228, sb54, sb240 # 4150
+xors 4, 1, sb224, sb236, sb271 # 4151
+xors 4, 1, sb21, sb224, sb461 # 4152
+xors 4, 1, sb225, sb461, sb236 # 4153
+xors 4, 1, sb18, sb233, sb269 # 4154
+xors 4, 1, sb431, sb18, sb499 # 4155
+xors 4, 1, sb45, sb499, sb233 # 4156
+xors 4, 1, sb9, sb232, sb267 # 4157
+xors 4, 1, sb120, sb9, sb266 # 4158
+xors 4, 1, sb229, sb266, sb232 # 4159
+xors 4, 1, sb416, sb230, sb53 # 4160
+xors 4, 1, sb605, sb416, sb92 # 4161
+xors 4, 1, sb231, sb92, sb230 # 4162
+xors 4, 1, sb46, sb635, sb270 # 4163
+xors 4, 1, sb105, sb46, sb459 # 4164
+xors 4, 1, sb425, sb459, sb635 # 4165
+xors 4, 1, sb455, sb634, sb261 # 4166
+xors 4, 1, sb596, sb455, sb260 # 4167
+xors 4, 1, sb235, sb260, sb634 # 4168
+xors 4, 1, sb454, sb632, sb52 # 4169
+xors 4, 1, sb118, sb454, sb259 # 4170
+xors 4, 1, sb237, sb259, sb632 # 4171
+xors 4, 1, sb498, sb223, sb265 # 4172
+xors 4, 1, sb593, sb498, sb417 # 4173
+xors 4, 1, sb239, sb417, sb223 # 4174
+xors 4, 1, sb243, sb221, sb409 # 4175
+xors 4, 1, sb590, sb243, sb10 # 4176
+xors 4, 1, sb456, sb10, sb221 # 4177
+xors 4, 1, sb48, sb626, sb253 # 4178
+xors 4, 1, sb588, sb48, sb457 # 4179
+xors 4, 1, sb91, sb457, sb626 # 4180
+xors 4, 1, sb50, sb625, sb251 # 4181
+xors 4, 1, sb586, sb50, sb250 # 4182
+xors 4, 1, sb245, sb250, sb625 # 4183
+xors 4, 1, sb246, sb83, sb249 # 4184
+xors 4, 1, sb523, sb246, sb248 # 4185
+xors 4, 1, sb247, sb248, sb83 # 4186
+ands 256, 1, sb59, sb84, sb491, 1, sb47, sb14, sb73, 1, sb505, sb74, sb22, 1, sb490, sb493, sb121, 1, sb407, sb24, sb433, 1, sb31, sb124, sb129, 1, sb403, sb26, sb5, 1, sb399, sb128, sb130, 1, sb395, sb134, sb408, 1, sb391, sb434, sb133, 1, sb387, sb142, sb27, 1, sb382, sb136, sb494, 1, sb380, sb28, sb139, 1, sb377, sb147, sb435, 1, sb374, sb413, sb87, 1, sb371, sb153, sb436, 1, sb368, sb29, sb6, 1, sb363, sb148, sb1, 1, sb360, sb150, sb157, 1, sb358, sb439, sb154, 1, sb356, sb438, sb156, 1, sb353, sb0, sb164, 1, sb347, sb158, sb33, 1, sb345, sb160, sb167, 1, sb343, sb101, sb441, 1, sb340, sb170, sb34, 1, sb66, sb166, sb168, 1, sb13, sb495, sb442, 1, sb327, sb177, sb414, 1, sb472, sb179, sb178, 1, sb316, sb443, sb180, 1, sb312, sb176, sb186, 1, sb310, sb36, sb188, 1, sb307, sb7, sb181, 1, sb302, sb190, sb183, 1, sb300, sb89, sb38, 1, sb466, sb192, sb196, 1, sb292, sb99, sb189, 1, sb289, sb198, sb39, 1, sb287, sb200, sb193, 1, sb283, sb195, sb197, 1, sb280, sb199, sb204, 1, sb277, sb40, sb415, 1, sb274, sb41, sb447, 1, sb268, sb202, sb448, 1, sb263, sb42, sb508, 1, sb258, sb210, sb212, 1, sb256, sb449, sb450, 1, sb255, sb214, sb497, 1, sb252, sb222, sb220, 1, sb244, sb451, sb452, 1, sb241, sb44, sb228, 1, sb238, sb224, sb225, 1, sb234, sb18, sb45, 1, sb640, sb9, sb229, 1, sb638, sb416, sb231, 1, sb636, sb46, sb425, 1, sb227, sb455, sb235, 1, sb226, sb454, sb237, 1, sb631, sb498, sb239, 1, sb630, sb243, sb456, 1, sb628, sb48, sb91, 1, sb219, sb50, sb245, 1, sb90, sb246, sb247 # 4187
+xors 4, 1, sb594, sb56, sb59 # 4188
+xors 4, 1, sb210, sb2, sb594 # 4189
+xors 4, 1, sb37, sb43, sb47 # 4190
+xors 4, 1, sb218, sb37, sb187 # 4191
+xors 4, 1, sb185, sb8, sb505 # 4192
+xors 4, 1, sb511, sb185, sb444 # 4193
+xors 4, 1, sb184, sb35, sb490 # 4194
+xors 4, 1, sb217, sb184, sb592 # 4195
+xors 4, 1, sb182, sb30, sb407 # 4196
+xors 4, 1, sb562, sb182, sb591 # 4197
+xors 4, 1, sb584, sb405, sb31 # 4198
+xors 4, 1, sb216, sb584, sb589 # 4199
+xors 4, 1, sb174, sb401, sb403 # 4200
+xors 4, 1, sb518, sb174, sb175 # 4201
+xors 4, 1, sb580, sb397, sb399 # 4202
+xors 4, 1, sb622, sb580, sb581 # 4203
+xors 4, 1, sb579, sb393, sb395 # 4204
+xors 4, 1, sb22, sb579, sb173 # 4205
+xors 4, 1, sb171, sb388, sb391 # 4206
+xors 4, 1, sb215, sb171, sb172 # 4207
+xors 4, 1, sb577, sb383, sb387 # 4208
+xors 4, 1, sb110, sb577, sb578 # 4209
+xors 4, 1, sb522, sb381, sb382 # 4210
+xors 4, 1, sb214, sb522, sb169 # 4211
+xors 4, 1, sb574, sb379, sb380 # 4212
+xors 4, 1, sb553, sb574, sb575 # 4213
+xors 4, 1, sb572, sb375, sb377 # 4214
+xors 4, 1, sb213, sb572, sb165 # 4215
+xors 4, 1, sb163, sb373, sb374 # 4216
+xors 4, 1, sb550, sb163, sb571 # 4217
+xors 4, 1, sb32, sb369, sb371 # 4218
+xors 4, 1, sb618, sb32, sb162 # 4219
+xors 4, 1, sb567, sb367, sb368 # 4220
+xors 4, 1, sb549, sb567, sb161 # 4221
+xors 4, 1, sb566, sb362, sb363 # 4222
+xors 4, 1, sb616, sb566, sb159 # 4223
+xors 4, 1, sb563, sb359, sb360 # 4224
+xors 4, 1, sb103, sb563, sb564 # 4225
+xors 4, 1, sb561, sb357, sb358 # 4226
+xors 4, 1, sb209, sb561, sb155 # 4227
+xors 4, 1, sb152, sb354, sb356 # 4228
+xors 4, 1, sb544, sb152, sb560 # 4229
+xors 4, 1, sb151, sb348, sb353 # 4230
+xors 4, 1, sb530, sb151, sb558 # 4231
+xors 4, 1, sb149, sb69, sb347 # 4232
+xors 4, 1, sb509, sb149, sb557 # 4233
+xors 4, 1, sb146, sb344, sb345 # 4234
+xors 4, 1, sb208, sb146, sb556 # 4235
+xors 4, 1, sb552, sb342, sb343 # 4236
+xors 4, 1, sb17, sb552, sb145 # 4237
+xors 4, 1, sb143, sb333, sb340 # 4238
+xors 4, 1, sb614, sb143, sb144 # 4239
+xors 4, 1, sb141, sb329, sb66 # 4240
+xors 4, 1, sb542, sb141, sb548 # 4241
+xors 4, 1, sb547, sb420, sb13 # 4242
+xors 4, 1, sb207, sb547, sb140 # 4243
+xors 4, 1, sb138, sb325, sb327 # 4244
+xors 4, 1, sb536, sb138, sb546 # 4245
+xors 4, 1, sb137, sb319, sb472 # 4246
+xors 4, 1, sb612, sb137, sb545 # 4247
+xors 4, 1, sb135, sb313, sb316 # 4248
+xors 4, 1, sb538, sb135, sb543 # 4249
+xors 4, 1, sb132, sb311, sb312 # 4250
+xors 4, 1, sb205, sb132, sb540 # 4251
+xors 4, 1, sb644, sb308, sb310 # 4252
+xors 4, 1, sb533, sb644, sb131 # 4253
+xors 4, 1, sb107, sb304, sb307 # 4254
+xors 4, 1, sb611, sb107, sb514 # 4255
+xors 4, 1, sb534, sb301, sb302 # 4256
+xors 4, 1, sb512, sb534, sb643 # 4257
+xors 4, 1, sb637, sb296, sb300 # 4258
+xors 4, 1, sb610, sb637, sb642 # 4259
+xors 4, 1, sb535, sb294, sb466 # 4260
+xors 4, 1, sb524, sb535, sb641 # 4261
+xors 4, 1, sb633, sb290, sb292 # 4262
+xors 4, 1, sb203, sb633, sb127 # 4263
+xors 4, 1, sb432, sb288, sb289 # 4264
+xors 4, 1, sb515, sb432, sb639 # 4265
+xors 4, 1, sb532, sb285, sb287 # 4266
+xors 4, 1, sb609, sb532, sb25 # 4267
+xors 4, 1, sb627, sb282, sb283 # 4268
+xors 4, 1, sb426, sb627, sb412 # 4269
+xors 4, 1, sb629, sb278, sb280 # 4270
+xors 4, 1, sb201, sb629, sb126 # 4271
+xors 4, 1, sb513, sb276, sb277 # 4272
+xors 4, 1, sb475, sb513, sb624 # 4273
+xors 4, 1, sb621, sb272, sb274 # 4274
+xors 4, 1, sb606, sb621, sb125 # 4275
+xors 4, 1, sb123, sb264, sb268 # 4276
+xors 4, 1, sb500, sb123, sb620 # 4277
+xors 4, 1, sb617, sb262, sb263 # 4278
+xors 4, 1, sb604, sb617, sb531 # 4279
+xors 4, 1, sb615, sb257, sb258 # 4280
+xors 4, 1, sb463, sb615, sb623 # 4281
+xors 4, 1, sb613, sb51, sb256 # 4282
+xors 4, 1, sb602, sb613, sb106 # 4283
+xors 4, 1, sb122, sb254, sb255 # 4284
+xors 4, 1, sb458, sb122, sb619 # 4285
+xors 4, 1, sb528, sb49, sb252 # 4286
+xors 4, 1, sb446, sb528, sb529 # 4287
+xors 4, 1, sb428, sb242, sb244 # 4288
+xors 4, 1, sb455, sb428, sb608 # 4289
+xors 4, 1, sb607, sb240, sb241 # 4290
+xors 4, 1, sb194, sb607, sb21 # 4291
+xors 4, 1, sb603, sb236, sb238 # 4292
+xors 4, 1, sb489, sb603, sb431 # 4293
+xors 4, 1, sb601, sb233, sb234 # 4294
+xors 4, 1, sb600, sb601, sb120 # 4295
+xors 4, 1, sb526, sb232, sb640 # 4296
+xors 4, 1, sb453, sb526, sb605 # 4297
+xors 4, 1, sb599, sb230, sb638 # 4298
+xors 4, 1, sb191, sb599, sb105 # 4299
+xors 4, 1, sb595, sb635, sb636 # 4300
+xors 4, 1, sb496, sb595, sb596 # 4301
+xors 4, 1, sb525, sb634, sb227 # 4302
+xors 4, 1, sb598, sb525, sb118 # 4303
+xors 4, 1, sb86, sb632, sb226 # 4304
+xors 4, 1, sb88, sb86, sb593 # 4305
+xors 4, 1, sb117, sb223, sb631 # 4306
+xors 4, 1, sb597, sb117, sb590 # 4307
+xors 4, 1, sb587, sb221, sb630 # 4308
+xors 4, 1, sb437, sb587, sb588 # 4309
+xors 4, 1, sb585, sb626, sb628 # 4310
+xors 4, 1, sb445, sb585, sb586 # 4311
+xors 4, 1, sb583, sb625, sb219 # 4312
+xors 4, 1, sb488, sb583, sb523 # 4313
+ands 376, 1, sb406, sb583, sb523, 1, sb81, sb585, sb586, 1, sb404, sb587, sb588, 1, sb440, sb117, sb590, 1, sb402, sb86, sb593, 1, sb506, sb525, sb118, 1, sb400, sb595, sb596, 1, sb448, sb599, sb105, 1, sb398, sb526, sb605, 1, sb82, sb601, sb120, 1, sb396, sb603, sb431, 1, sb454, sb607, sb21, 1, sb394, sb428, sb608, 1, sb456, sb528, sb529, 1, sb486, sb122, sb619, 1, sb460, sb613, sb106, 1, sb78, sb615, sb623, 1, sb467, sb617, sb531, 1, sb485, sb123, sb620, 1, sb94, sb621, sb125, 1, sb389, sb513, sb624, 1, sb502, sb629, sb126, 1, sb484, sb627, sb412, 1, sb482, sb532, sb25, 1, sb385, sb432, sb639, 1, sb517, sb633, sb127, 1, sb76, sb535, sb641, 1, sb527, sb637, sb642, 1, sb483, sb534, sb643, 1, sb4, sb107, sb514, 1, sb380, sb644, sb131, 1, sb424, sb132, sb540, 1, sb376, sb135, sb543, 1, sb108, sb137, sb545, 1, sb75, sb138, sb546, 1, sb537, sb547, sb140, 1, sb370, sb141, sb548, 1, sb539, sb143, sb144, 1, sb20, sb552, sb145, 1, sb541, sb146, sb556, 1, sb366, sb149, sb557, 1, sb510, sb151, sb558, 1, sb364, sb152, sb560, 1, sb551, sb561, sb155, 1, sb72, sb563, sb564, 1, sb109, sb566, sb159, 1, sb427, sb567, sb161, 1, sb516, sb32, sb162, 1, sb19, sb163, sb571, 1, sb429, sb572, sb165, 1, sb421, sb574, sb575, 1, sb554, sb522, sb169, 1, sb363, sb577, sb578, 1, sb555, sb171, sb172, 1, sb352, sb579, sb173, 1, sb111, sb580, sb581, 1, sb350, sb174, sb175, 1, sb559, sb584, sb589, 1, sb478, sb182, sb591, 1, sb565, sb184, sb592, 1, sb346, sb185, sb444, 1, sb112, sb37, sb187, 1, sb116, sb594, sb119, 1, sb468, sb488, sb445, 1, sb519, sb437, sb597, 1, sb469, sb88, sb598, 1, sb520, sb496, sb191, 1, sb314, sb453, sb600, 1, sb102, sb489, sb194, 1, sb318, sb455, sb446, 1, sb113, sb458, sb602, 1, sb63, sb463, sb604, 1, sb568, sb500, sb606, 1, sb320, sb475, sb201, 1, sb569, sb426, sb609, 1, sb64, sb515, sb203, 1, sb570, sb524, sb610, 1, sb501, sb512, sb611, 1, sb104, sb533, sb205, 1, sb326, sb538, sb612, 1, sb521, sb536, sb207, 1, sb471, sb542, sb614, 1, sb573, sb17, sb208, 1, sb65, sb509, sb530, 1, sb114, sb544, sb209, 1, sb332, sb103, sb616, 1, sb576, sb549, sb618, 1, sb328, sb550, sb213, 1, sb582, sb553, sb214, 1, sb338, sb110, sb215, 1, sb115, sb22, sb622, 1, sb473, sb518, sb216, 1, sb23, sb562, sb217, 1, sb430, sb511, sb218 # 4314
+ands 188, 1, sb423, sb488, sb81, 1, sb16, sb437, sb440, 1, sb3, sb88, sb506, 1, sb80, sb496, sb448, 1, sb487, sb453, sb82, 1, sb79, sb489, sb454, 1, sb97, sb455, sb456, 1, sb504, sb458, sb460, 1, sb392, sb463, sb467, 1, sb390, sb500, sb94, 1, sb77, sb475, sb502, 1, sb386, sb426, sb482, 1, sb384, sb515, sb517, 1, sb15, sb524, sb527, 1, sb422, sb512, sb4, 1, sb410, sb533, sb424, 1, sb96, sb538, sb108, 1, sb378, sb536, sb537, 1, sb481, sb542, sb539, 1, sb503, sb17, sb541, 1, sb372, sb509, sb510, 1, sb411, sb544, sb551, 1, sb361, sb103, sb109, 1, sb480, sb549, sb516, 1, sb365, sb550, sb429, 1, sb355, sb553, sb554, 1, sb479, sb110, sb555, 1, sb351, sb22, sb111, 1, sb71, sb518, sb559, 1, sb476, sb562, sb565, 1, sb70, sb511, sb112, 1, sb260, sb468, sb519, 1, sb68, sb469, sb520, 1, sb261, sb314, sb102, 1, sb335, sb318, sb113, 1, sb52, sb63, sb568, 1, sb474, sb320, sb569, 1, sb259, sb64, sb570, 1, sb337, sb501, sb104, 1, sb92, sb326, sb521, 1, sb67, sb471, sb573, 1, sb270, sb65, sb114, 1, sb339, sb332, sb576, 1, sb265, sb328, sb582, 1, sb349, sb338, sb115, 1, sb341, sb473, sb23, 1, sb343, sb430, sb116 # 4315
+xors 4, 1, sb419, sb423, sb406 # 4316
+xors 4, 1, sb309, sb16, sb404 # 4317
+xors 4, 1, sb12, sb3, sb402 # 4318
+xors 4, 1, sb62, sb80, sb400 # 4319
+xors 4, 1, sb305, sb487, sb398 # 4320
+xors 4, 1, sb315, sb79, sb396 # 4321
+xors 4, 1, sb297, sb97, sb394 # 4322
+xors 4, 1, sb317, sb504, sb486 # 4323
+xors 4, 1, sb299, sb392, sb78 # 4324
+xors 4, 1, sb100, sb390, sb485 # 4325
+xors 4, 1, sb500, sb77, sb389 # 4326
+xors 4, 1, sb322, sb386, sb484 # 4327
+xors 4, 1, sb292, sb384, sb385 # 4328
+xors 4, 1, sb470, sb15, sb76 # 4329
+xors 4, 1, sb58, sb422, sb483 # 4330
+xors 4, 1, sb324, sb410, sb380 # 4331
+xors 4, 1, sb57, sb96, sb376 # 4332
+xors 4, 1, sb321, sb378, sb75 # 4333
+xors 4, 1, sb293, sb481, sb370 # 4334
+xors 4, 1, sb323, sb503, sb20 # 4335
+xors 4, 1, sb492, sb372, sb366 # 4336
+xors 4, 1, sb330, sb411, sb364 # 4337
+xors 4, 1, sb418, sb361, sb72 # 4338
+xors 4, 1, sb334, sb480, sb427 # 4339
+xors 4, 1, sb286, sb365, sb19 # 4340
+xors 4, 1, sb336, sb355, sb421 # 4341
+xors 4, 1, sb462, sb479, sb363 # 4342
+xors 4, 1, sb331, sb351, sb352 # 4343
+xors 4, 1, sb275, sb71, sb350 # 4344
+xors 4, 1, sb98, sb476, sb478 # 4345
+xors 4, 1, sb477, sb70, sb346 # 4346
+xors 4, 1, sb95, sb343, sb477 # 4347
+ands 92, 1, sb61, sb468, sb309, 1, sb306, sb469, sb62, 1, sb298, sb314, sb315, 1, sb303, sb318, sb317, 1, sb60, sb63, sb100, 1, sb465, sb320, sb322, 1, sb93, sb64, sb470, 1, sb295, sb501, sb324, 1, sb464, sb326, sb321, 1, sb507, sb471, sb323, 1, sb291, sb65, sb330, 1, sb281, sb332, sb334, 1, sb284, sb328, sb336, 1, sb55, sb338, sb331, 1, sb85, sb473, sb98, 1, sb82, sb260, sb68, 1, sb53, sb261, sb335, 1, sb233, sb52, sb474, 1, sb461, sb259, sb337, 1, sb453, sb92, sb67, 1, sb269, sb270, sb339, 1, sb279, sb265, sb349, 1, sb11, sb341, sb95 # 4348
+xors 4, 1, sb50, sb61, sb419 # 4349
+xors 4, 1, sb254, sb306, sb12 # 4350
+xors 4, 1, sb250, sb298, sb305 # 4351
+xors 4, 1, sb10, sb303, sb297 # 4352
+xors 4, 1, sb248, sb60, sb299 # 4353
+xors 4, 1, sb266, sb465, sb500 # 4354
+xors 4, 1, sb253, sb93, sb292 # 4355
+xors 4, 1, sb499, sb295, sb58 # 4356
+xors 4, 1, sb249, sb464, sb57 # 4357
+xors 4, 1, sb459, sb507, sb293 # 4358
+xors 4, 1, sb48, sb291, sb492 # 4359
+xors 4, 1, sb54, sb281, sb418 # 4360
+xors 4, 1, sb245, sb284, sb286 # 4361
+xors 4, 1, sb267, sb55, sb462 # 4362
+xors 4, 1, sb273, sb85, sb275 # 4363
+xors 4, 1, sb271, sb11, sb273 # 4364
+ands 44, 1, sb457, sb260, sb254, 1, sb417, sb261, sb10, 1, sb409, sb52, sb266, 1, sb251, sb259, sb499, 1, sb247, sb92, sb459, 1, sb246, sb270, sb54, 1, sb239, sb265, sb267, 1, sb222, sb82, sb53, 1, sb91, sb233, sb461, 1, sb235, sb453, sb269, 1, sb237, sb279, sb271 # 4365
+xors 4, 1, sb489, sb457, sb50 # 4366
+xors 4, 1, sb18, sb417, sb250 # 4367
+xors 4, 1, sb9, sb409, sb248 # 4368
+xors 4, 1, sb416, sb251, sb253 # 4369
+xors 4, 1, sb229, sb247, sb249 # 4370
+xors 4, 1, sb425, sb246, sb48 # 4371
+xors 4, 1, sb243, sb239, sb245 # 4372
+xors 4, 1, sb498, sb237, sb243 # 4373
+ands 20, 1, sb46, sb82, sb18, 1, sb231, sb233, sb416, 1, sb451, sb453, sb425, 1, sb225, sb222, sb91, 1, sb45, sb235, sb498 # 4374
+xors 4, 1, sb44, sb46, sb489 # 4375
+xors 4, 1, sb224, sb231, sb9 # 4376
+xors 4, 1, sb228, sb451, sb229 # 4377
+xors 4, 1, sb452, sb45, sb228 # 4378
+ands 8, 1, sb220, sb222, sb224, 1, sb449, sb225, sb452 # 4379
+xors 4, 1, sb497, sb220, sb44 # 4380
+xors 4, 1, sb450, sb449, sb497 # 4381
+xors 4, 1, sb212, sb211, sb450 # 4382
+xors 4, 1, sb508, sb83, sb90 # 4383
+xors 4, 1, sb42, sb206, sb508 # 4384
+reveal 9, 1, cb7, sb212, 1, cb5, sb42, 1, cb1, sb210 # 4385
+convcbitvec 1, ci0, cb7 # 4386
+convint c4, ci0 # 4387
+addm s8, s2, c4 # 4388
+convint c4, ci0 # 4389
+mulm s9, s10, c4 # 4390
+subs s7, s8, s9 # 4391
+movs s0, s7 # 4392
+movs s3, s0 # 4393
+convcbitvec 1, ci0, cb5 # 4394
+convint c3, ci0 # 4395
+addm s19, s1, c3 # 4396
+convint c7, ci0 # 4397
+mulm s21, s20, c7 # 4398
+subs s22, s19, s21 # 4399
+movs s18, s22 # 4400
+adds s23, s3, s18 # 4401
+mulm s0, s23, c5 # 4402
+convcbitvec 1, ci0, cb1 # 4403
+convint c2, ci0 # 4404
+addm s10, s16, c2 # 4405
+convint c6, ci0 # 4406
+mulm s2, s15, c6 # 4407
+subs s9, s10, s2 # 4408
+movs s7, s9 # 4409
+shrsi s8, s13, 1 # 4410
+adds s13, s8, s7 # 4411
+subs s1, s13, s0 # 4412
+subml s23, s1, c1 # 4413
+convcbitvec 1, ci0, cb3 # 4414
+convint c4, ci0 # 4415
+addm s21, s14, c4 # 4416
+convint c3, ci0 # 4417
+mulm s20, s12, c3 # 4418
+subs s19, s21, s20 # 4419
+movs s15, s19 # 4420
+convcbitvec 1, ci0, cb2 # 4421
+convint c4, ci0 # 4422
+addm s22, s17, c4 # 4423
+convint c7, ci0 # 4424
+mulm s18, s4, c7 # 4425
+subs s3, s22, s18 # 4426
+movs s16, s3 # 4427
+adds s1, s15, s16 # 4428
+convcbitvec 1, ci0, cb4 # 4429
+convint c5, ci0 # 4430
+addm s2, s11, c5 # 4431
+mulsi s10, s11, 2 # 4432
+convint c2, ci0 # 4433
+mulm s9, s10, c2 # 4434
+subs s7, s2, s9 # 4435
+movs s0, s7 # 4436
+adds s8, s6, s0 # 4437
+shrsi s13, s5, 32 # 4438
+adds s12, s13, s1 # 4439
+ldi c7, 2 # 4440
+mulci c6, c7, 2147483647 # 4441
+addci c1, c6, 2 # 4442
+mulm s14, s8, c1 # 4443
+subs s20, s12, s14 # 4444
+subsi s21, s20, 1073741824 # 4445
+movs s19, s21 # 4446
+addm s18, s19, c0 # 4447
+muls 8, 1, s17, s23, s18, 1, s4, s19, s19 # 4448
+ldi c4, 2 # 4449
+mulci c3, c4, 2147483647 # 4450
+addci c7, c3, 4 # 4451
+mulci c5, c7, 2147483647 # 4452
+addci c2, c5, 2 # 4453
+addm s22, s17, c2 # 4454
+split 194, 3, s22, sb447, sb202, sb193, sb41, sb200, sb189, sb39, sb198, sb183, sb99, sb196, sb181, sb192, sb38, sb7, sb89, sb190, sb176, sb496, sb188, sb495, sb36, sb186, sb166, sb180, sb443, sb168, sb178, sb179, sb160, sb414, sb177, sb158, sb442, sb35, sb0, sb34, sb174, sb156, sb170, sb441, sb438, sb101, sb171, sb150, sb167, sb33, sb154, sb164, sb165, sb29, sb506, sb440, sb436, sb88, sb439, sb87, sb157, sb159, sb148, sb1, sb6, sb435, sb153, sb407, sb136, sb413, sb437, sb139, sb147, sb30, sb28, sb494, sb146, sb408, sb27, sb142, sb128, sb133, sb434, sb134, sb130, sb5, sb26, sb124, sb129, sb433, sb493, sb24, sb121, sb14, sb74, sb73, sb491, sb84, sb31, sb399, sb403, sb405, sb391, sb395, sb401, sb382, sb387, sb397, sb377, sb381, sb393, sb373, sb374, sb388, sb368, sb369, sb383, sb359, sb362, sb379, sb356, sb358, sb375, sb347, sb353, sb371, sb345, sb69, sb367, sb340, sb342, sb360, sb66, sb333, sb357, sb13, sb420, sb354, sb472, sb327, sb348, sb313, sb319, sb344, sb308, sb311, sb475, sb304, sb307, sb329, sb296, sb300, sb325, sb294, sb466, sb310, sb287, sb289, sb302, sb278, sb283, sb59, sb274, sb276, sb290, sb263, sb272, sb288, sb257, sb258, sb285, sb255, sb458, sb280, sb244, sb252, sb277, sb240, sb242, sb264, sb640, sb234, sb256, sb230, sb232, sb456, sb635, sb636, sb236, sb632, sb634, sb638, sb223, sb631, sb226 # 4455
+xors 4, 1, sb195, sb193, sb202 # 4456
+xors 4, 1, sb197, sb447, sb193 # 4457
+xors 4, 1, sb199, sb189, sb200 # 4458
+xors 4, 1, sb490, sb199, sb41 # 4459
+xors 4, 1, sb415, sb41, sb189 # 4460
+xors 4, 1, sb40, sb183, sb198 # 4461
+xors 4, 1, sb217, sb40, sb39 # 4462
+xors 4, 1, sb204, sb39, sb183 # 4463
+xors 4, 1, sb8, sb181, sb196 # 4464
+xors 4, 1, sb505, sb8, sb99 # 4465
+xors 4, 1, sb448, sb99, sb181 # 4466
+xors 4, 1, sb41, sb7, sb38 # 4467
+xors 4, 1, sb214, sb41, sb192 # 4468
+xors 4, 1, sb212, sb192, sb7 # 4469
+xors 4, 1, sb42, sb176, sb190 # 4470
+xors 4, 1, sb210, sb42, sb89 # 4471
+xors 4, 1, sb508, sb89, sb176 # 4472
+xors 4, 1, sb43, sb495, sb188 # 4473
+xors 4, 1, sb206, sb43, sb496 # 4474
+xors 4, 1, sb83, sb496, sb495 # 4475
+xors 4, 1, sb90, sb166, sb186 # 4476
+xors 4, 1, sb211, sb90, sb36 # 4477
+xors 4, 1, sb450, sb36, sb166 # 4478
+xors 4, 1, sb497, sb168, sb443 # 4479
+xors 4, 1, sb202, sb497, sb180 # 4480
+xors 4, 1, sb220, sb180, sb168 # 4481
+xors 4, 1, sb44, sb160, sb179 # 4482
+xors 4, 1, sb200, sb44, sb178 # 4483
+xors 4, 1, sb222, sb178, sb160 # 4484
+xors 4, 1, sb227, sb158, sb177 # 4485
+xors 4, 1, sb198, sb227, sb414 # 4486
+xors 4, 1, sb224, sb414, sb158 # 4487
+xors 4, 1, sb225, sb0, sb35 # 4488
+xors 4, 1, sb196, sb225, sb442 # 4489
+xors 4, 1, sb452, sb442, sb0 # 4490
+xors 4, 1, sb45, sb156, sb174 # 4491
+xors 4, 1, sb39, sb45, sb34 # 4492
+xors 4, 1, sb228, sb34, sb156 # 4493
+xors 4, 1, sb229, sb438, sb441 # 4494
+xors 4, 1, sb496, sb229, sb170 # 4495
+xors 4, 1, sb231, sb170, sb438 # 4496
+xors 4, 1, sb9, sb150, sb171 # 4497
+xors 4, 1, sb89, sb9, sb101 # 4498
+xors 4, 1, sb46, sb101, sb150 # 4499
+xors 4, 1, sb489, sb154, sb33 # 4500
+xors 4, 1, sb190, sb489, sb167 # 4501
+xors 4, 1, sb47, sb167, sb154 # 4502
+xors 4, 1, sb454, sb29, sb165 # 4503
+xors 4, 1, sb192, sb454, sb164 # 4504
+xors 4, 1, sb238, sb164, sb29 # 4505
+xors 4, 1, sb241, sb436, sb440 # 4506
+xors 4, 1, sb186, sb241, sb506 # 4507
+xors 4, 1, sb455, sb506, sb436 # 4508
+xors 4, 1, sb91, sb87, sb439 # 4509
+xors 4, 1, sb182, sb91, sb88 # 4510
+xors 4, 1, sb498, sb88, sb87 # 4511
+xors 4, 1, sb243, sb148, sb159 # 4512
+xors 4, 1, sb36, sb243, sb157 # 4513
+xors 4, 1, sb245, sb157, sb148 # 4514
+xors 4, 1, sb246, sb435, sb6 # 4515
+xors 4, 1, sb180, sb246, sb1 # 4516
+xors 4, 1, sb247, sb1, sb435 # 4517
+xors 4, 1, sb249, sb136, sb407 # 4518
+xors 4, 1, sb178, sb249, sb153 # 4519
+xors 4, 1, sb251, sb153, sb136 # 4520
+xors 4, 1, sb253, sb139, sb437 # 4521
+xors 4, 1, sb174, sb253, sb413 # 4522
+xors 4, 1, sb409, sb413, sb139 # 4523
+xors 4, 1, sb417, sb28, sb30 # 4524
+xors 4, 1, sb442, sb417, sb147 # 4525
+xors 4, 1, sb262, sb147, sb28 # 4526
+xors 4, 1, sb260, sb408, sb146 # 4527
+xors 4, 1, sb171, sb260, sb494 # 4528
+xors 4, 1, sb261, sb494, sb408 # 4529
+xors 4, 1, sb52, sb128, sb142 # 4530
+xors 4, 1, sb88, sb52, sb27 # 4531
+xors 4, 1, sb460, sb27, sb128 # 4532
+xors 4, 1, sb266, sb134, sb434 # 4533
+xors 4, 1, sb170, sb266, sb133 # 4534
+xors 4, 1, sb268, sb133, sb134 # 4535
+xors 4, 1, sb499, sb26, sb5 # 4536
+xors 4, 1, sb506, sb499, sb130 # 4537
+xors 4, 1, sb92, sb130, sb26 # 4538
+xors 4, 1, sb270, sb433, sb129 # 4539
+xors 4, 1, sb440, sb270, sb124 # 4540
+xors 4, 1, sb54, sb124, sb433 # 4541
+xors 4, 1, sb461, sb121, sb24 # 4542
+xors 4, 1, sb167, sb461, sb493 # 4543
+xors 4, 1, sb2, sb493, sb121 # 4544
+xors 4, 1, sb282, sb73, sb74 # 4545
+xors 4, 1, sb164, sb282, sb14 # 4546
+xors 4, 1, sb279, sb14, sb73 # 4547
+xors 4, 1, sb11, sb31, sb84 # 4548
+xors 4, 1, sb82, sb11, sb491 # 4549
+xors 4, 1, sb56, sb491, sb31 # 4550
+xors 4, 1, sb463, sb405, sb403 # 4551
+xors 4, 1, sb18, sb463, sb399 # 4552
+xors 4, 1, sb85, sb399, sb405 # 4553
+xors 4, 1, sb284, sb401, sb395 # 4554
+xors 4, 1, sb235, sb284, sb391 # 4555
+xors 4, 1, sb286, sb391, sb401 # 4556
+xors 4, 1, sb291, sb397, sb387 # 4557
+xors 4, 1, sb237, sb291, sb382 # 4558
+xors 4, 1, sb507, sb382, sb397 # 4559
+xors 4, 1, sb293, sb393, sb381 # 4560
+xors 4, 1, sb239, sb293, sb377 # 4561
+xors 4, 1, sb295, sb377, sb393 # 4562
+xors 4, 1, sb301, sb388, sb374 # 4563
+xors 4, 1, sb48, sb301, sb373 # 4564
+xors 4, 1, sb467, sb373, sb388 # 4565
+xors 4, 1, sb60, sb383, sb369 # 4566
+xors 4, 1, sb457, sb60, sb368 # 4567
+xors 4, 1, sb299, sb368, sb383 # 4568
+xors 4, 1, sb303, sb379, sb362 # 4569
+xors 4, 1, sb49, sb303, sb359 # 4570
+xors 4, 1, sb305, sb359, sb379 # 4571
+xors 4, 1, sb306, sb375, sb358 # 4572
+xors 4, 1, sb248, sb306, sb356 # 4573
+xors 4, 1, sb12, sb356, sb375 # 4574
+xors 4, 1, sb61, sb371, sb353 # 4575
+xors 4, 1, sb250, sb61, sb347 # 4576
+xors 4, 1, sb312, sb347, sb371 # 4577
+xors 4, 1, sb419, sb367, sb69 # 4578
+xors 4, 1, sb50, sb419, sb345 # 4579
+xors 4, 1, sb468, sb345, sb367 # 4580
+xors 4, 1, sb309, sb360, sb342 # 4581
+xors 4, 1, sb254, sb309, sb340 # 4582
+xors 4, 1, sb469, sb340, sb360 # 4583
+xors 4, 1, sb316, sb357, sb333 # 4584
+xors 4, 1, sb51, sb316, sb66 # 4585
+xors 4, 1, sb62, sb66, sb357 # 4586
+xors 4, 1, sb94, sb354, sb420 # 4587
+xors 4, 1, sb259, sb94, sb13 # 4588
+xors 4, 1, sb314, sb13, sb354 # 4589
+xors 4, 1, sb315, sb348, sb327 # 4590
+xors 4, 1, sb459, sb315, sb472 # 4591
+xors 4, 1, sb318, sb472, sb348 # 4592
+xors 4, 1, sb317, sb344, sb319 # 4593
+xors 4, 1, sb267, sb317, sb313 # 4594
+xors 4, 1, sb63, sb313, sb344 # 4595
+xors 4, 1, sb100, sb475, sb311 # 4596
+xors 4, 1, sb265, sb100, sb308 # 4597
+xors 4, 1, sb320, sb308, sb475 # 4598
+xors 4, 1, sb322, sb329, sb307 # 4599
+xors 4, 1, sb53, sb322, sb304 # 4600
+xors 4, 1, sb64, sb304, sb329 # 4601
+xors 4, 1, sb324, sb325, sb300 # 4602
+xors 4, 1, sb269, sb324, sb296 # 4603
+xors 4, 1, sb326, sb296, sb325 # 4604
+xors 4, 1, sb65, sb310, sb466 # 4605
+xors 4, 1, sb271, sb65, sb294 # 4606
+xors 4, 1, sb330, sb294, sb310 # 4607
+xors 4, 1, sb332, sb302, sb289 # 4608
+xors 4, 1, sb273, sb332, sb287 # 4609
+xors 4, 1, sb334, sb287, sb302 # 4610
+xors 4, 1, sb336, sb59, sb283 # 4611
+xors 4, 1, sb275, sb336, sb278 # 4612
+xors 4, 1, sb340, sb278, sb59 # 4613
+xors 4, 1, sb338, sb290, sb276 # 4614
+xors 4, 1, sb55, sb338, sb274 # 4615
+xors 4, 1, sb491, sb274, sb290 # 4616
+xors 4, 1, sb84, sb288, sb272 # 4617
+xors 4, 1, sb281, sb84, sb263 # 4618
+xors 4, 1, sb98, sb263, sb288 # 4619
+xors 4, 1, sb502, sb285, sb258 # 4620
+xors 4, 1, sb418, sb502, sb257 # 4621
+xors 4, 1, sb68, sb257, sb285 # 4622
+xors 4, 1, sb345, sb280, sb458 # 4623
+xors 4, 1, sb492, sb345, sb255 # 4624
+xors 4, 1, sb347, sb255, sb280 # 4625
+xors 4, 1, sb349, sb277, sb252 # 4626
+xors 4, 1, sb58, sb349, sb244 # 4627
+xors 4, 1, sb477, sb244, sb277 # 4628
+xors 4, 1, sb70, sb264, sb242 # 4629
+xors 4, 1, sb464, sb70, sb240 # 4630
+xors 4, 1, sb426, sb240, sb264 # 4631
+xors 4, 1, sb14, sb256, sb234 # 4632
+xors 4, 1, sb93, sb14, sb640 # 4633
+xors 4, 1, sb478, sb640, sb256 # 4634
+xors 4, 1, sb71, sb456, sb232 # 4635
+xors 4, 1, sb292, sb71, sb230 # 4636
+xors 4, 1, sb359, sb230, sb456 # 4637
+xors 4, 1, sb479, sb236, sb636 # 4638
+xors 4, 1, sb500, sb479, sb635 # 4639
+xors 4, 1, sb363, sb635, sb236 # 4640
+xors 4, 1, sb368, sb638, sb634 # 4641
+xors 4, 1, sb297, sb368, sb632 # 4642
+xors 4, 1, sb365, sb632, sb638 # 4643
+xors 4, 1, sb480, sb226, sb631 # 4644
+xors 4, 1, sb298, sb480, sb223 # 4645
+xors 4, 1, sb427, sb223, sb226 # 4646
+dabit s20, sb57 # 4647
+mulsi s12, s20, 2 # 4648
+dabit s21, sb72 # 4649
+mulsi s19, s21, 2 # 4650
+dabit s14, sb10 # 4651
+mulsi s8, s14, 2 # 4652
+dabit s18, sb533 # 4653
+mulsi s15, s18, 2 # 4654
+shrsi s3, s22, 31 # 4655
+ldi c3, 4 # 4656
+mulci c6, c3, 2147483647 # 4657
+addci c1, c6, 4 # 4658
+ldi c4, 2 # 4659
+mulci c7, c4, 2147483647 # 4660
+addci c5, c7, 2 # 4661
+ldi c7, 2 # 4662
+mulci c2, c7, 2147483647 # 4663
+addci c3, c2, 2 # 4664
+dabit s16, sb346 # 4665
+mulsi s13, s16, 2 # 4666
+dabit s1, sb333 # 4667
+mulsi s5, s1, 2 # 4668
+dabit s2, sb571 # 4669
+mulsi s9, s2, 2 # 4670
+ldi c4, 2 # 4671
+mulci c6, c4, 2147483647 # 4672
+addci c7, c6, 4 # 4673
+mulci c2, c7, 2147483647 # 4674
+addci c4, c2, 2 # 4675
+ldi c2, 1 # 4676
+mulci c6, c2, 2147483647 # 4677
+addci c7, c6, 1 # 4678
+ldi c6, 1 # 4679
+mulci c2, c6, 2147483647 # 4680
+addci c6, c2, 1 # 4681
+addm s11, s4, c6 # 4682
+ldi c6, 1 # 4683
+mulci c2, c6, 2147483647 # 4684
+addci c6, c2, 2 # 4685
+mulci c2, c6, 2147483647 # 4686
+addci c6, c2, 1 # 4687
+addm s10, s11, c6 # 4688
+split 194, 3, s10, sb221, sb630, sb628, sb625, sb626, sb219, sb213, sb622, sb218, sb530, sb616, sb216, sb614, sb208, sb215, sb610, sb612, sb618, sb201, sb609, sb209, sb446, sb606, sb615, sb191, sb598, sb207, sb119, sb445, sb205, sb37, sb187, sb203, sb444, sb185, sb608, sb584, sb184, sb604, sb581, sb175, sb194, sb579, sb580, sb38, sb577, sb578, sb526, sb522, sb169, sb593, sb163, sb574, sb592, sb567, sb32, sb591, sb152, sb155, sb589, sb149, sb558, sb582, sb144, sb145, sb173, sb141, sb143, sb172, sb138, sb140, sb34, sb135, sb137, sb576, sb131, sb540, sb575, sb643, sb129, sb572, sb534, sb642, sb162, sb637, sb641, sb161, sb432, sb633, sb563, sb532, sb25, sb561, sb627, sb412, sb151, sb513, sb624, sb557, sb620, sb621, sb556, sb617, sb123, sb552, sb528, sb613, sb550, sb428, sb21, sb547, sb607, sb431, sb546, sb603, sb120, sb545, sb601, sb605, sb543, sb105, sb599, sb133, sb596, sb597, sb132, sb594, sb512, sb536, sb570, sb493, sb535, sb564, sb566, sb127, sb429, sb560, sb644, sb551, sb517, sb639, sb544, sb548, sb126, sb108, sb515, sb635, sb538, sb424, sb629, sb474, sb95, sb125, sb416, sb233, sb531, sb188, sb99, sb623, sb179, sb443, sb106, sb33, sb35, sb124, sb439, sb165, sb619, sb157, sb159, sb122, sb6, sb1, sb529, sb153, sb407, sb611, sb413, sb30, sb4, sb146, sb147, sb24, sb142, sb494, sb527, sb27, sb434, sb602, sb130, sb5, sb600 # 4689
+xors 4, 1, sb411, sb628, sb630 # 4690
+xors 4, 1, sb373, sb221, sb628 # 4691
+xors 4, 1, sb74, sb219, sb626 # 4692
+xors 4, 1, sb482, sb74, sb625 # 4693
+xors 4, 1, sb372, sb625, sb219 # 4694
+xors 4, 1, sb481, sb218, sb622 # 4695
+xors 4, 1, sb381, sb481, sb213 # 4696
+xors 4, 1, sb378, sb213, sb218 # 4697
+xors 4, 1, sb75, sb216, sb616 # 4698
+xors 4, 1, sb376, sb75, sb530 # 4699
+xors 4, 1, sb410, sb530, sb216 # 4700
+xors 4, 1, sb380, sb215, sb208 # 4701
+xors 4, 1, sb96, sb380, sb614 # 4702
+xors 4, 1, sb422, sb614, sb215 # 4703
+xors 4, 1, sb483, sb618, sb612 # 4704
+xors 4, 1, sb370, sb483, sb610 # 4705
+xors 4, 1, sb15, sb610, sb618 # 4706
+xors 4, 1, sb76, sb209, sb609 # 4707
+xors 4, 1, sb503, sb76, sb201 # 4708
+xors 4, 1, sb384, sb201, sb209 # 4709
+xors 4, 1, sb385, sb615, sb606 # 4710
+xors 4, 1, sb366, sb385, sb446 # 4711
+xors 4, 1, sb386, sb446, sb615 # 4712
+xors 4, 1, sb484, sb207, sb598 # 4713
+xors 4, 1, sb364, sb484, sb191 # 4714
+xors 4, 1, sb77, sb191, sb207 # 4715
+xors 4, 1, sb389, sb205, sb445 # 4716
+xors 4, 1, sb20, sb389, sb119 # 4717
+xors 4, 1, sb390, sb119, sb205 # 4718
+xors 4, 1, sb485, sb203, sb187 # 4719
+xors 4, 1, sb361, sb485, sb37 # 4720
+xors 4, 1, sb392, sb37, sb203 # 4721
+xors 4, 1, sb78, sb608, sb185 # 4722
+xors 4, 1, sb19, sb78, sb444 # 4723
+xors 4, 1, sb504, sb444, sb608 # 4724
+xors 4, 1, sb486, sb604, sb184 # 4725
+xors 4, 1, sb421, sb486, sb584 # 4726
+xors 4, 1, sb97, sb584, sb604 # 4727
+xors 4, 1, sb79, sb194, sb175 # 4728
+xors 4, 1, sb355, sb79, sb581 # 4729
+xors 4, 1, sb487, sb581, sb194 # 4730
+xors 4, 1, sb80, sb38, sb580 # 4731
+xors 4, 1, sb352, sb80, sb579 # 4732
+xors 4, 1, sb3, sb579, sb38 # 4733
+xors 4, 1, sb16, sb526, sb578 # 4734
+xors 4, 1, sb350, sb16, sb577 # 4735
+xors 4, 1, sb423, sb577, sb526 # 4736
+xors 4, 1, sb488, sb593, sb169 # 4737
+xors 4, 1, sb351, sb488, sb522 # 4738
+xors 4, 1, sb524, sb522, sb593 # 4739
+xors 4, 1, sb537, sb592, sb574 # 4740
+xors 4, 1, sb476, sb537, sb163 # 4741
+xors 4, 1, sb542, sb163, sb592 # 4742
+xors 4, 1, sb107, sb591, sb32 # 4743
+xors 4, 1, sb343, sb107, sb567 # 4744
+xors 4, 1, sb514, sb567, sb591 # 4745
+xors 4, 1, sb539, sb589, sb155 # 4746
+xors 4, 1, sb341, sb539, sb152 # 4747
+xors 4, 1, sb17, sb152, sb589 # 4748
+xors 4, 1, sb541, sb582, sb558 # 4749
+xors 4, 1, sb339, sb541, sb149 # 4750
+xors 4, 1, sb509, sb149, sb582 # 4751
+xors 4, 1, sb510, sb173, sb145 # 4752
+xors 4, 1, sb337, sb510, sb144 # 4753
+xors 4, 1, sb103, sb144, sb173 # 4754
+xors 4, 1, sb109, sb172, sb143 # 4755
+xors 4, 1, sb335, sb109, sb141 # 4756
+xors 4, 1, sb549, sb141, sb172 # 4757
+xors 4, 1, sb516, sb34, sb140 # 4758
+xors 4, 1, sb67, sb516, sb138 # 4759
+xors 4, 1, sb553, sb138, sb34 # 4760
+xors 4, 1, sb554, sb576, sb137 # 4761
+xors 4, 1, sb331, sb554, sb135 # 4762
+xors 4, 1, sb110, sb135, sb576 # 4763
+xors 4, 1, sb555, sb575, sb540 # 4764
+xors 4, 1, sb473, sb555, sb131 # 4765
+xors 4, 1, sb22, sb131, sb575 # 4766
+xors 4, 1, sb111, sb572, sb129 # 4767
+xors 4, 1, sb472, sb111, sb643 # 4768
+xors 4, 1, sb518, sb643, sb572 # 4769
+xors 4, 1, sb559, sb162, sb642 # 4770
+xors 4, 1, sb328, sb559, sb534 # 4771
+xors 4, 1, sb562, sb534, sb162 # 4772
+xors 4, 1, sb565, sb161, sb641 # 4773
+xors 4, 1, sb323, sb565, sb637 # 4774
+xors 4, 1, sb511, sb637, sb161 # 4775
+xors 4, 1, sb112, sb563, sb633 # 4776
+xors 4, 1, sb471, sb112, sb432 # 4777
+xors 4, 1, sb519, sb432, sb563 # 4778
+xors 4, 1, sb520, sb561, sb25 # 4779
+xors 4, 1, sb321, sb520, sb532 # 4780
+xors 4, 1, sb102, sb532, sb561 # 4781
+xors 4, 1, sb113, sb151, sb412 # 4782
+xors 4, 1, sb501, sb113, sb627 # 4783
+xors 4, 1, sb568, sb627, sb151 # 4784
+xors 4, 1, sb569, sb557, sb624 # 4785
+xors 4, 1, sb394, sb569, sb513 # 4786
+xors 4, 1, sb104, sb513, sb557 # 4787
+xors 4, 1, sb521, sb556, sb621 # 4788
+xors 4, 1, sb396, sb521, sb620 # 4789
+xors 4, 1, sb115, sb620, sb556 # 4790
+xors 4, 1, sb573, sb552, sb123 # 4791
+xors 4, 1, sb398, sb573, sb617 # 4792
+xors 4, 1, sb114, sb617, sb552 # 4793
+xors 4, 1, sb116, sb550, sb613 # 4794
+xors 4, 1, sb400, sb116, sb528 # 4795
+xors 4, 1, sb585, sb528, sb550 # 4796
+xors 4, 1, sb586, sb547, sb21 # 4797
+xors 4, 1, sb402, sb586, sb428 # 4798
+xors 4, 1, sb578, sb428, sb547 # 4799
+xors 4, 1, sb587, sb546, sb431 # 4800
+xors 4, 1, sb404, sb587, sb607 # 4801
+xors 4, 1, sb23, sb607, sb546 # 4802
+xors 4, 1, sb430, sb545, sb120 # 4803
+xors 4, 1, sb406, sb430, sb603 # 4804
+xors 4, 1, sb590, sb603, sb545 # 4805
+xors 4, 1, sb583, sb543, sb605 # 4806
+xors 4, 1, sb81, sb583, sb601 # 4807
+xors 4, 1, sb523, sb601, sb543 # 4808
+xors 4, 1, sb525, sb133, sb599 # 4809
+xors 4, 1, sb437, sb525, sb105 # 4810
+xors 4, 1, sb118, sb105, sb133 # 4811
+xors 4, 1, sb595, sb132, sb597 # 4812
+xors 4, 1, sb441, sb595, sb596 # 4813
+xors 4, 1, sb588, sb596, sb132 # 4814
+xors 4, 1, sb117, sb536, sb512 # 4815
+xors 4, 1, sb101, sb117, sb594 # 4816
+xors 4, 1, sb512, sb594, sb536 # 4817
+xors 4, 1, sb86, sb535, sb493 # 4818
+xors 4, 1, sb447, sb86, sb570 # 4819
+xors 4, 1, sb105, sb570, sb535 # 4820
+xors 4, 1, sb601, sb127, sb566 # 4821
+xors 4, 1, sb449, sb601, sb564 # 4822
+xors 4, 1, sb594, sb564, sb127 # 4823
+xors 4, 1, sb596, sb644, sb560 # 4824
+xors 4, 1, sb451, sb596, sb429 # 4825
+xors 4, 1, sb599, sb429, sb644 # 4826
+xors 4, 1, sb605, sb639, sb517 # 4827
+xors 4, 1, sb453, sb605, sb551 # 4828
+xors 4, 1, sb607, sb551, sb639 # 4829
+xors 4, 1, sb119, sb126, sb548 # 4830
+xors 4, 1, sb425, sb119, sb544 # 4831
+xors 4, 1, sb641, sb544, sb126 # 4832
+xors 4, 1, sb169, sb635, sb515 # 4833
+xors 4, 1, sb462, sb169, sb108 # 4834
+xors 4, 1, sb414, sb108, sb635 # 4835
+xors 4, 1, sb177, sb629, sb424 # 4836
+xors 4, 1, sb465, sb177, sb538 # 4837
+xors 4, 1, sb37, sb538, sb629 # 4838
+xors 4, 1, sb191, sb125, sb95 # 4839
+xors 4, 1, sb470, sb191, sb474 # 4840
+xors 4, 1, sb201, sb474, sb125 # 4841
+xors 4, 1, sb208, sb531, sb233 # 4842
+xors 4, 1, sb474, sb208, sb416 # 4843
+xors 4, 1, sb630, sb416, sb531 # 4844
+xors 4, 1, sb631, sb623, sb99 # 4845
+xors 4, 1, sb95, sb631, sb188 # 4846
+xors 4, 1, sb632, sb188, sb623 # 4847
+xors 4, 1, sb634, sb106, sb443 # 4848
+xors 4, 1, sb538, sb634, sb179 # 4849
+xors 4, 1, sb230, sb179, sb106 # 4850
+xors 4, 1, sb232, sb124, sb35 # 4851
+xors 4, 1, sb424, sb232, sb33 # 4852
+xors 4, 1, sb233, sb33, sb124 # 4853
+xors 4, 1, sb234, sb619, sb165 # 4854
+xors 4, 1, sb108, sb234, sb439 # 4855
+xors 4, 1, sb240, sb439, sb619 # 4856
+xors 4, 1, sb244, sb122, sb159 # 4857
+xors 4, 1, sb515, sb244, sb157 # 4858
+xors 4, 1, sb252, sb157, sb122 # 4859
+xors 4, 1, sb458, sb529, sb1 # 4860
+xors 4, 1, sb551, sb458, sb6 # 4861
+xors 4, 1, sb257, sb6, sb529 # 4862
+xors 4, 1, sb263, sb611, sb407 # 4863
+xors 4, 1, sb517, sb263, sb153 # 4864
+xors 4, 1, sb272, sb153, sb611 # 4865
+xors 4, 1, sb276, sb4, sb30 # 4866
+xors 4, 1, sb429, sb276, sb413 # 4867
+xors 4, 1, sb466, sb413, sb4 # 4868
+xors 4, 1, sb300, sb24, sb147 # 4869
+xors 4, 1, sb560, sb300, sb146 # 4870
+xors 4, 1, sb304, sb146, sb24 # 4871
+xors 4, 1, sb308, sb527, sb494 # 4872
+xors 4, 1, sb564, sb308, sb142 # 4873
+xors 4, 1, sb311, sb142, sb527 # 4874
+xors 4, 1, sb319, sb602, sb434 # 4875
+xors 4, 1, sb566, sb319, sb27 # 4876
+xors 4, 1, sb327, sb27, sb602 # 4877
+xors 4, 1, sb13, sb600, sb5 # 4878
+xors 4, 1, sb570, sb13, sb130 # 4879
+xors 4, 1, sb416, sb130, sb600 # 4880
+ands 512, 1, sb99, sb195, sb197, 1, sb445, sb199, sb415, 1, sb188, sb40, sb204, 1, sb443, sb8, sb448, 1, sb179, sb41, sb212, 1, sb35, sb42, sb508, 1, sb175, sb43, sb83, 1, sb33, sb90, sb450, 1, sb165, sb497, sb220, 1, sb439, sb44, sb222, 1, sb159, sb227, sb224, 1, sb157, sb225, sb452, 1, sb1, sb45, sb228, 1, sb153, sb229, sb231, 1, sb30, sb9, sb46, 1, sb413, sb489, sb47, 1, sb147, sb454, sb238, 1, sb146, sb241, sb455, 1, sb143, sb91, sb498, 1, sb141, sb243, sb245, 1, sb494, sb246, sb247, 1, sb137, sb249, sb251, 1, sb434, sb253, sb409, 1, sb142, sb417, sb262, 1, sb5, sb260, sb261, 1, sb129, sb52, sb460, 1, sb27, sb266, sb268, 1, sb130, sb499, sb92, 1, sb432, sb270, sb54, 1, sb431, sb461, sb2, 1, sb493, sb282, sb279, 1, sb6, sb11, sb56, 1, sb407, sb463, sb85, 1, sb403, sb284, sb286, 1, sb399, sb291, sb507, 1, sb395, sb293, sb295, 1, sb391, sb301, sb467, 1, sb387, sb60, sb299, 1, sb382, sb303, sb305, 1, sb377, sb306, sb12, 1, sb374, sb61, sb312, 1, sb369, sb419, sb468, 1, sb362, sb309, sb469, 1, sb358, sb316, sb62, 1, sb356, sb94, sb314, 1, sb353, sb315, sb318, 1, sb69, sb317, sb63, 1, sb342, sb100, sb320, 1, sb66, sb322, sb64, 1, sb420, sb324, sb326, 1, sb313, sb65, sb330, 1, sb307, sb332, sb334, 1, sb296, sb336, sb340, 1, sb294, sb338, sb491, 1, sb289, sb84, sb98, 1, sb287, sb502, sb68, 1, sb283, sb345, sb347, 1, sb278, sb349, sb477, 1, sb274, sb70, sb426, 1, sb258, sb14, sb478, 1, sb255, sb71, sb359, 1, sb242, sb479, sb363, 1, sb640, sb368, sb365, 1, sb636, sb480, sb427, 1, sb223, sb411, sb373, 1, sb221, sb74, sb372, 1, sb626, sb481, sb378, 1, sb625, sb75, sb410, 1, sb622, sb380, sb422, 1, sb213, sb483, sb15, 1, sb616, sb76, sb384, 1, sb530, sb385, sb386, 1, sb614, sb484, sb77, 1, sb612, sb389, sb390, 1, sb610, sb485, sb392, 1, sb609, sb78, sb504, 1, sb606, sb486, sb97, 1, sb446, sb79, sb487, 1, sb598, sb80, sb3, 1, sb597, sb16, sb423, 1, sb187, sb488, sb524, 1, sb185, sb537, sb542, 1, sb444, sb107, sb514, 1, sb184, sb539, sb17, 1, sb584, sb541, sb509, 1, sb581, sb510, sb103, 1, sb580, sb109, sb549, 1, sb579, sb516, sb553, 1, sb577, sb554, sb110, 1, sb522, sb555, sb22, 1, sb574, sb111, sb518, 1, sb163, sb559, sb562, 1, sb32, sb565, sb511, 1, sb567, sb112, sb519, 1, sb155, sb520, sb102, 1, sb152, sb113, sb568, 1, sb558, sb569, sb104, 1, sb149, sb521, sb115, 1, sb145, sb573, sb114, 1, sb144, sb116, sb585, 1, sb548, sb586, sb578, 1, sb140, sb587, sb23, 1, sb138, sb430, sb590, 1, sb544, sb583, sb523, 1, sb135, sb525, sb118, 1, sb540, sb595, sb588, 1, sb131, sb117, sb512, 1, sb643, sb86, sb105, 1, sb534, sb601, sb594, 1, sb637, sb596, sb599, 1, sb642, sb605, sb607, 1, sb633, sb119, sb641, 1, sb25, sb169, sb414, 1, sb532, sb177, sb37, 1, sb627, sb191, sb201, 1, sb412, sb208, sb630, 1, sb513, sb631, sb632, 1, sb621, sb634, sb230, 1, sb123, sb232, sb233, 1, sb624, sb234, sb240, 1, sb617, sb244, sb252, 1, sb613, sb458, sb257, 1, sb620, sb263, sb272, 1, sb528, sb276, sb466, 1, sb21, sb300, sb304, 1, sb428, sb308, sb311, 1, sb120, sb319, sb327, 1, sb603, sb13, sb416 # 4881
+xors 4, 1, sb508, sb193, sb99 # 4882
+xors 4, 1, sb43, sb189, sb445 # 4883
+xors 4, 1, sb46, sb43, sb217 # 4884
+xors 4, 1, sb212, sb183, sb188 # 4885
+xors 4, 1, sb276, sb212, sb505 # 4886
+xors 4, 1, sb83, sb181, sb443 # 4887
+xors 4, 1, sb416, sb83, sb214 # 4888
+xors 4, 1, sb208, sb7, sb179 # 4889
+xors 4, 1, sb272, sb208, sb210 # 4890
+xors 4, 1, sb8, sb176, sb35 # 4891
+xors 4, 1, sb228, sb8, sb206 # 4892
+xors 4, 1, sb204, sb495, sb175 # 4893
+xors 4, 1, sb263, sb204, sb211 # 4894
+xors 4, 1, sb201, sb166, sb33 # 4895
+xors 4, 1, sb227, sb201, sb202 # 4896
+xors 4, 1, sb448, sb168, sb165 # 4897
+xors 4, 1, sb257, sb448, sb200 # 4898
+xors 4, 1, sb197, sb160, sb439 # 4899
+xors 4, 1, sb233, sb197, sb198 # 4900
+xors 4, 1, sb195, sb158, sb159 # 4901
+xors 4, 1, sb458, sb195, sb196 # 4902
+xors 4, 1, sb193, sb0, sb157 # 4903
+xors 4, 1, sb231, sb193, sb39 # 4904
+xors 4, 1, sb191, sb156, sb1 # 4905
+xors 4, 1, sb252, sb191, sb496 # 4906
+xors 4, 1, sb189, sb438, sb153 # 4907
+xors 4, 1, sb229, sb189, sb89 # 4908
+xors 4, 1, sb37, sb150, sb30 # 4909
+xors 4, 1, sb244, sb37, sb190 # 4910
+xors 4, 1, sb188, sb154, sb413 # 4911
+xors 4, 1, sb224, sb188, sb192 # 4912
+xors 4, 1, sb183, sb29, sb147 # 4913
+xors 4, 1, sb240, sb183, sb186 # 4914
+xors 4, 1, sb7, sb436, sb146 # 4915
+xors 4, 1, sb44, sb7, sb182 # 4916
+xors 4, 1, sb181, sb87, sb143 # 4917
+xors 4, 1, sb641, sb181, sb36 # 4918
+xors 4, 1, sb177, sb148, sb141 # 4919
+xors 4, 1, sb222, sb177, sb180 # 4920
+xors 4, 1, sb176, sb435, sb494 # 4921
+xors 4, 1, sb232, sb176, sb178 # 4922
+xors 4, 1, sb414, sb136, sb137 # 4923
+xors 4, 1, sb225, sb414, sb174 # 4924
+xors 4, 1, sb179, sb139, sb434 # 4925
+xors 4, 1, sb230, sb179, sb442 # 4926
+xors 4, 1, sb35, sb28, sb142 # 4927
+xors 4, 1, sb220, sb35, sb171 # 4928
+xors 4, 1, sb169, sb408, sb5 # 4929
+xors 4, 1, sb634, sb169, sb88 # 4930
+xors 4, 1, sb168, sb128, sb129 # 4931
+xors 4, 1, sb90, sb168, sb170 # 4932
+xors 4, 1, sb165, sb134, sb27 # 4933
+xors 4, 1, sb632, sb165, sb506 # 4934
+xors 4, 1, sb439, sb26, sb130 # 4935
+xors 4, 1, sb497, sb439, sb440 # 4936
+xors 4, 1, sb166, sb433, sb432 # 4937
+xors 4, 1, sb630, sb166, sb167 # 4938
+xors 4, 1, sb159, sb121, sb431 # 4939
+xors 4, 1, sb426, sb159, sb164 # 4940
+xors 4, 1, sb489, sb73, sb493 # 4941
+xors 4, 1, sb241, sb72, sb489 # 4942
+xors 4, 1, sb301, sb82, sb489 # 4943
+xors 4, 1, sb234, sb31, sb6 # 4944
+xors 4, 1, sb466, sb18, sb234 # 4945
+xors 4, 1, sb47, sb405, sb407 # 4946
+xors 4, 1, sb467, sb235, sb47 # 4947
+xors 4, 1, sb238, sb401, sb403 # 4948
+xors 4, 1, sb300, sb237, sb238 # 4949
+xors 4, 1, sb455, sb397, sb399 # 4950
+xors 4, 1, sb60, sb239, sb455 # 4951
+xors 4, 1, sb91, sb393, sb395 # 4952
+xors 4, 1, sb304, sb48, sb91 # 4953
+xors 4, 1, sb245, sb388, sb391 # 4954
+xors 4, 1, sb303, sb457, sb245 # 4955
+xors 4, 1, sb247, sb383, sb387 # 4956
+xors 4, 1, sb308, sb49, sb247 # 4957
+xors 4, 1, sb249, sb379, sb382 # 4958
+xors 4, 1, sb305, sb248, sb249 # 4959
+xors 4, 1, sb251, sb375, sb377 # 4960
+xors 4, 1, sb311, sb250, sb251 # 4961
+xors 4, 1, sb253, sb371, sb374 # 4962
+xors 4, 1, sb306, sb50, sb253 # 4963
+xors 4, 1, sb409, sb367, sb369 # 4964
+xors 4, 1, sb319, sb254, sb409 # 4965
+xors 4, 1, sb460, sb360, sb362 # 4966
+xors 4, 1, sb12, sb51, sb460 # 4967
+xors 4, 1, sb262, sb357, sb358 # 4968
+xors 4, 1, sb327, sb259, sb262 # 4969
+xors 4, 1, sb52, sb354, sb356 # 4970
+xors 4, 1, sb61, sb459, sb52 # 4971
+xors 4, 1, sb266, sb348, sb353 # 4972
+xors 4, 1, sb13, sb267, sb266 # 4973
+xors 4, 1, sb268, sb344, sb69 # 4974
+xors 4, 1, sb312, sb265, sb268 # 4975
+xors 4, 1, sb499, sb475, sb342 # 4976
+xors 4, 1, sb340, sb53, sb499 # 4977
+xors 4, 1, sb270, sb329, sb66 # 4978
+xors 4, 1, sb309, sb269, sb270 # 4979
+xors 4, 1, sb54, sb325, sb420 # 4980
+xors 4, 1, sb344, sb271, sb54 # 4981
+xors 4, 1, sb85, sb310, sb313 # 4982
+xors 4, 1, sb469, sb273, sb85 # 4983
+xors 4, 1, sb2, sb302, sb307 # 4984
+xors 4, 1, sb348, sb275, sb2 # 4985
+xors 4, 1, sb282, sb59, sb296 # 4986
+xors 4, 1, sb316, sb55, sb282 # 4987
+xors 4, 1, sb11, sb290, sb294 # 4988
+xors 4, 1, sb354, sb281, sb11 # 4989
+xors 4, 1, sb56, sb288, sb289 # 4990
+xors 4, 1, sb62, sb418, sb56 # 4991
+xors 4, 1, sb284, sb285, sb287 # 4992
+xors 4, 1, sb358, sb492, sb284 # 4993
+xors 4, 1, sb286, sb280, sb283 # 4994
+xors 4, 1, sb94, sb58, sb286 # 4995
+xors 4, 1, sb291, sb277, sb278 # 4996
+xors 4, 1, sb362, sb464, sb291 # 4997
+xors 4, 1, sb507, sb264, sb274 # 4998
+xors 4, 1, sb314, sb93, sb507 # 4999
+xors 4, 1, sb293, sb256, sb258 # 5000
+xors 4, 1, sb369, sb292, sb293 # 5001
+xors 4, 1, sb295, sb456, sb255 # 5002
+xors 4, 1, sb315, sb500, sb295 # 5003
+xors 4, 1, sb59, sb236, sb242 # 5004
+xors 4, 1, sb374, sb297, sb59 # 5005
+xors 4, 1, sb299, sb638, sb640 # 5006
+xors 4, 1, sb261, sb298, sb299 # 5007
+xors 4, 1, sb631, sb226, sb636 # 5008
+xors 4, 1, sb498, sb533, sb631 # 5009
+xors 4, 1, sb378, sb628, sb223 # 5010
+xors 4, 1, sb75, sb219, sb221 # 5011
+xors 4, 1, sb373, sb218, sb626 # 5012
+xors 4, 1, sb74, sb216, sb625 # 5013
+xors 4, 1, sb372, sb215, sb622 # 5014
+xors 4, 1, sb368, sb618, sb213 # 5015
+xors 4, 1, sb365, sb209, sb616 # 5016
+xors 4, 1, sb363, sb615, sb530 # 5017
+xors 4, 1, sb480, sb207, sb614 # 5018
+xors 4, 1, sb359, sb205, sb612 # 5019
+xors 4, 1, sb478, sb203, sb610 # 5020
+xors 4, 1, sb14, sb608, sb609 # 5021
+xors 4, 1, sb70, sb604, sb606 # 5022
+xors 4, 1, sb477, sb194, sb446 # 5023
+xors 4, 1, sb349, sb38, sb598 # 5024
+xors 4, 1, sb347, sb526, sb597 # 5025
+xors 4, 1, sb345, sb593, sb187 # 5026
+xors 4, 1, sb475, sb592, sb185 # 5027
+xors 4, 1, sb491, sb591, sb444 # 5028
+xors 4, 1, sb338, sb589, sb184 # 5029
+xors 4, 1, sb336, sb582, sb584 # 5030
+xors 4, 1, sb334, sb173, sb581 # 5031
+xors 4, 1, sb332, sb172, sb580 # 5032
+xors 4, 1, sb330, sb34, sb579 # 5033
+xors 4, 1, sb65, sb576, sb577 # 5034
+xors 4, 1, sb326, sb575, sb522 # 5035
+xors 4, 1, sb324, sb572, sb574 # 5036
+xors 4, 1, sb322, sb162, sb163 # 5037
+xors 4, 1, sb320, sb161, sb32 # 5038
+xors 4, 1, sb318, sb563, sb567 # 5039
+xors 4, 1, sb317, sb561, sb155 # 5040
+xors 4, 1, sb486, sb151, sb152 # 5041
+xors 4, 1, sb97, sb557, sb558 # 5042
+xors 4, 1, sb3, sb556, sb149 # 5043
+xors 4, 1, sb487, sb552, sb145 # 5044
+xors 4, 1, sb80, sb550, sb144 # 5045
+xors 4, 1, sb16, sb547, sb548 # 5046
+xors 4, 1, sb488, sb546, sb140 # 5047
+xors 4, 1, sb433, sb545, sb138 # 5048
+xors 4, 1, sb495, sb543, sb544 # 5049
+xors 4, 1, sb443, sb133, sb135 # 5050
+xors 4, 1, sb445, sb132, sb540 # 5051
+xors 4, 1, sb99, sb536, sb131 # 5052
+xors 4, 1, sb450, sb535, sb643 # 5053
+xors 4, 1, sb452, sb127, sb534 # 5054
+xors 4, 1, sb454, sb644, sb637 # 5055
+xors 4, 1, sb461, sb639, sb642 # 5056
+xors 4, 1, sb463, sb126, sb633 # 5057
+xors 4, 1, sb468, sb635, sb25 # 5058
+xors 4, 1, sb100, sb629, sb532 # 5059
+xors 4, 1, sb502, sb125, sb627 # 5060
+xors 4, 1, sb537, sb531, sb412 # 5061
+xors 4, 1, sb542, sb623, sb513 # 5062
+xors 4, 1, sb17, sb106, sb621 # 5063
+xors 4, 1, sb509, sb124, sb123 # 5064
+xors 4, 1, sb103, sb619, sb624 # 5065
+xors 4, 1, sb553, sb122, sb617 # 5066
+xors 4, 1, sb555, sb529, sb613 # 5067
+xors 4, 1, sb111, sb611, sb620 # 5068
+xors 4, 1, sb562, sb4, sb528 # 5069
+xors 4, 1, sb565, sb24, sb21 # 5070
+xors 4, 1, sb511, sb527, sb428 # 5071
+xors 4, 1, sb572, sb602, sb120 # 5072
+xors 4, 1, sb246, sb600, sb603 # 5073
+xors 4, 1, sb395, sb317, sb501 # 5074
+xors 4, 1, sb410, sb318, sb321 # 5075
+xors 4, 1, sb399, sb320, sb471 # 5076
+xors 4, 1, sb380, sb322, sb323 # 5077
+xors 4, 1, sb403, sb324, sb328 # 5078
+xors 4, 1, sb422, sb326, sb472 # 5079
+xors 4, 1, sb407, sb65, sb473 # 5080
+xors 4, 1, sb483, sb330, sb331 # 5081
+xors 4, 1, sb31, sb332, sb67 # 5082
+xors 4, 1, sb76, sb334, sb335 # 5083
+xors 4, 1, sb6, sb336, sb337 # 5084
+xors 4, 1, sb384, sb338, sb339 # 5085
+xors 4, 1, sb415, sb491, sb341 # 5086
+xors 4, 1, sb385, sb475, sb343 # 5087
+xors 4, 1, sb41, sb345, sb476 # 5088
+xors 4, 1, sb386, sb347, sb351 # 5089
+xors 4, 1, sb45, sb349, sb350 # 5090
+xors 4, 1, sb484, sb477, sb352 # 5091
+xors 4, 1, sb417, sb70, sb355 # 5092
+xors 4, 1, sb77, sb14, sb421 # 5093
+xors 4, 1, sb63, sb478, sb19 # 5094
+xors 4, 1, sb389, sb359, sb361 # 5095
+xors 4, 1, sb420, sb480, sb20 # 5096
+xors 4, 1, sb390, sb363, sb364 # 5097
+xors 4, 1, sb84, sb365, sb366 # 5098
+xors 4, 1, sb485, sb368, sb503 # 5099
+xors 4, 1, sb71, sb372, sb370 # 5100
+xors 4, 1, sb392, sb74, sb96 # 5101
+xors 4, 1, sb78, sb373, sb376 # 5102
+xors 4, 1, sb504, sb75, sb381 # 5103
+dabit s4, sb279 # 5104
+mulsi s6, s4, 2 # 5105
+dabit s23, sb119 # 5106
+xors 4, 1, sb243, sb119, sb486 # 5107
+mulsi s22, s23, 2 # 5108
+xors 4, 1, sb104, sb394, sb486 # 5109
+xors 4, 1, sb493, sb396, sb97 # 5110
+xors 4, 1, sb521, sb398, sb3 # 5111
+xors 4, 1, sb432, sb400, sb487 # 5112
+xors 4, 1, sb115, sb402, sb80 # 5113
+xors 4, 1, sb121, sb404, sb16 # 5114
+xors 4, 1, sb584, sb406, sb488 # 5115
+xors 4, 1, sb26, sb81, sb433 # 5116
+xors 4, 1, sb116, sb437, sb495 # 5117
+xors 4, 1, sb130, sb441, sb443 # 5118
+xors 4, 1, sb585, sb101, sb445 # 5119
+xors 4, 1, sb134, sb447, sb99 # 5120
+xors 4, 1, sb586, sb449, sb450 # 5121
+xors 4, 1, sb27, sb451, sb452 # 5122
+xors 4, 1, sb587, sb453, sb454 # 5123
+xors 4, 1, sb138, sb425, sb461 # 5124
+xors 4, 1, sb524, sb462, sb463 # 5125
+xors 4, 1, sb28, sb465, sb468 # 5126
+xors 4, 1, sb590, sb470, sb100 # 5127
+xors 4, 1, sb142, sb474, sb502 # 5128
+xors 4, 1, sb525, sb95, sb537 # 5129
+xors 4, 1, sb144, sb538, sb542 # 5130
+xors 4, 1, sb118, sb424, sb17 # 5131
+xors 4, 1, sb139, sb108, sb509 # 5132
+xors 4, 1, sb595, sb515, sb103 # 5133
+xors 4, 1, sb435, sb551, sb553 # 5134
+xors 4, 1, sb597, sb517, sb555 # 5135
+xors 4, 1, sb494, sb429, sb111 # 5136
+xors 4, 1, sb512, sb560, sb562 # 5137
+xors 4, 1, sb148, sb564, sb565 # 5138
+xors 4, 1, sb105, sb566, sb511 # 5139
+xors 4, 1, sb152, sb570, sb572 # 5140
+ands 748, 1, sb411, sb159, sb164, 1, sb223, sb166, sb167, 1, sb631, sb439, sb440, 1, sb221, sb165, sb506, 1, sb226, sb168, sb170, 1, sb626, sb169, sb88, 1, sb636, sb35, sb171, 1, sb625, sb179, sb442, 1, sb638, sb414, sb174, 1, sb215, sb176, sb178, 1, sb640, sb177, sb180, 1, sb618, sb181, sb36, 1, sb236, sb7, sb182, 1, sb209, sb183, sb186, 1, sb242, sb188, sb192, 1, sb615, sb37, sb190, 1, sb456, sb189, sb89, 1, sb207, sb191, sb496, 1, sb255, sb193, sb39, 1, sb205, sb195, sb196, 1, sb256, sb197, sb198, 1, sb203, sb448, sb200, 1, sb258, sb201, sb202, 1, sb199, sb204, sb211, 1, sb264, sb8, sb206, 1, sb604, sb208, sb210, 1, sb274, sb83, sb214, 1, sb194, sb212, sb505, 1, sb277, sb43, sb217, 1, sb294, sb508, sb490, 1, sb278, sb630, sb497, 1, sb479, sb632, sb90, 1, sb280, sb634, sb220, 1, sb481, sb230, sb225, 1, sb283, sb232, sb222, 1, sb427, sb641, sb44, 1, sb285, sb240, sb224, 1, sb519, sb244, sb229, 1, sb287, sb252, sb231, 1, sb428, sb458, sb233, 1, sb288, sb257, sb227, 1, sb106, sb263, sb228, 1, sb289, sb272, sb416, 1, sb290, sb276, sb46, 1, sb296, sb82, sb489, 1, sb187, sb18, sb234, 1, sb302, sb235, sb47, 1, sb592, sb237, sb238, 1, sb307, sb239, sb455, 1, sb444, sb48, sb91, 1, sb310, sb457, sb245, 1, sb184, sb49, sb247, 1, sb313, sb248, sb249, 1, sb175, sb250, sb251, 1, sb325, sb50, sb253, 1, sb580, sb254, sb409, 1, sb329, sb51, sb460, 1, sb579, sb259, sb262, 1, sb66, sb459, sb52, 1, sb34, sb267, sb266, 1, sb342, sb265, sb268, 1, sb576, sb53, sb499, 1, sb69, sb269, sb270, 1, sb575, sb271, sb54, 1, sb353, sb273, sb85, 1, sb163, sb275, sb2, 1, sb356, sb55, sb282, 1, sb161, sb281, sb11, 1, sb360, sb418, sb56, 1, sb567, sb492, sb284, 1, sb367, sb58, sb286, 1, sb155, sb464, sb291, 1, sb371, sb93, sb507, 1, sb558, sb292, sb293, 1, sb375, sb500, sb295, 1, sb150, sb297, sb59, 1, sb260, sb298, sb299, 1, sb377, sb466, sb301, 1, sb539, sb300, sb467, 1, sb379, sb304, sb60, 1, sb541, sb308, sb303, 1, sb382, sb311, sb305, 1, sb510, sb319, sb306, 1, sb383, sb327, sb12, 1, sb516, sb13, sb61, 1, sb387, sb340, sb312, 1, sb110, sb344, sb309, 1, sb388, sb348, sb469, 1, sb549, sb354, sb316, 1, sb391, sb358, sb62, 1, sb559, sb362, sb94, 1, sb393, sb369, sb314, 1, sb554, sb374, sb315, 1, sb556, sb317, sb501, 1, sb397, sb318, sb321, 1, sb552, sb320, sb471, 1, sb401, sb322, sb323, 1, sb548, sb324, sb328, 1, sb405, sb326, sb472, 1, sb140, sb65, sb473, 1, sb0, sb330, sb331, 1, sb545, sb332, sb67, 1, sb30, sb334, sb335, 1, sb136, sb336, sb337, 1, sb33, sb338, sb339, 1, sb135, sb491, sb341, 1, sb40, sb475, sb343, 1, sb540, sb345, sb476, 1, sb42, sb347, sb351, 1, sb131, sb349, sb350, 1, sb9, sb477, sb352, 1, sb644, sb70, sb355, 1, sb419, sb14, sb421, 1, sb514, sb478, sb19, 1, sb64, sb359, sb361, 1, sb642, sb480, sb20, 1, sb98, sb363, sb364, 1, sb639, sb365, sb366, 1, sb68, sb368, sb503, 1, sb126, sb372, sb370, 1, sb15, sb74, sb96, 1, sb635, sb373, sb376, 1, sb423, sb75, sb381, 1, sb86, sb378, sb482, 1, sb518, sb395, sb410, 1, sb92, sb399, sb380, 1, sb569, sb403, sb422, 1, sb107, sb407, sb483, 1, sb568, sb31, sb76, 1, sb109, sb6, sb384, 1, sb113, sb415, sb385, 1, sb22, sb41, sb386, 1, sb102, sb45, sb484, 1, sb112, sb417, sb77, 1, sb520, sb63, sb389, 1, sb114, sb420, sb390, 1, sb573, sb84, sb485, 1, sb430, sb71, sb392, 1, sb23, sb78, sb504, 1, sb119, sb394, sb486, 1, sb627, sb396, sb97, 1, sb128, sb398, sb3, 1, sb125, sb400, sb487, 1, sb412, sb402, sb80, 1, sb124, sb404, sb16, 1, sb5, sb406, sb488, 1, sb624, sb81, sb433, 1, sb129, sb437, sb495, 1, sb619, sb441, sb443, 1, sb408, sb101, sb445, 1, sb617, sb447, sb99, 1, sb434, sb449, sb450, 1, sb622, sb451, sb452, 1, sb137, sb453, sb454, 1, sb620, sb425, sb461, 1, sb143, sb462, sb463, 1, sb611, sb465, sb468, 1, sb141, sb470, sb100, 1, sb528, sb474, sb502, 1, sb87, sb95, sb537, 1, sb609, sb538, sb542, 1, sb29, sb424, sb17, 1, sb607, sb108, sb509, 1, sb146, sb515, sb103, 1, sb605, sb551, sb553, 1, sb436, sb517, sb555, 1, sb431, sb429, sb111, 1, sb147, sb560, sb562, 1, sb599, sb564, sb565, 1, sb413, sb566, sb511, 1, sb79, sb570, sb572, 1, sb1, sb493, sb104, 1, sb578, sb432, sb521, 1, sb153, sb121, sb115, 1, sb588, sb26, sb584, 1, sb156, sb130, sb116, 1, sb583, sb134, sb585, 1, sb438, sb27, sb586, 1, sb523, sb138, sb587, 1, sb158, sb28, sb524, 1, sb594, sb142, sb590, 1, sb154, sb144, sb525, 1, sb117, sb139, sb118, 1, sb157, sb435, sb595, 1, sb596, sb494, sb597, 1, sb160, sb148, sb512, 1, sb601, sb152, sb105 # 5141
+ands 372, 1, sb628, sb630, sb631, 1, sb219, sb632, sb226, 1, sb218, sb634, sb636, 1, sb216, sb230, sb638, 1, sb213, sb232, sb640, 1, sb616, sb641, sb236, 1, sb530, sb240, sb242, 1, sb614, sb244, sb456, 1, sb612, sb252, sb255, 1, sb610, sb458, sb256, 1, sb608, sb257, sb258, 1, sb606, sb263, sb264, 1, sb446, sb272, sb274, 1, sb38, sb276, sb277, 1, sb502, sb426, sb278, 1, sb424, sb479, sb280, 1, sb476, sb481, sb283, 1, sb542, sb427, sb285, 1, sb70, sb519, sb287, 1, sb536, sb428, sb288, 1, sb537, sb106, sb289, 1, sb526, sb290, sb294, 1, sb593, sb466, sb296, 1, sb185, sb300, sb302, 1, sb591, sb304, sb307, 1, sb589, sb308, sb310, 1, sb581, sb311, sb313, 1, sb173, sb319, sb325, 1, sb172, sb327, sb329, 1, sb577, sb13, sb66, 1, sb522, sb340, sb342, 1, sb574, sb344, sb69, 1, sb162, sb348, sb353, 1, sb32, sb354, sb356, 1, sb563, sb358, sb360, 1, sb561, sb362, sb367, 1, sb151, sb369, sb371, 1, sb149, sb374, sb375, 1, sb555, sb539, sb377, 1, sb351, sb541, sb379, 1, sb429, sb510, sb382, 1, sb14, sb516, sb383, 1, sb557, sb110, sb387, 1, sb355, sb549, sb388, 1, sb565, sb559, sb391, 1, sb357, sb554, sb393, 1, sb145, sb395, sb397, 1, sb550, sb399, sb401, 1, sb547, sb403, sb405, 1, sb546, sb407, sb0, 1, sb544, sb31, sb30, 1, sb543, sb6, sb33, 1, sb133, sb415, sb40, 1, sb132, sb41, sb42, 1, sb643, sb45, sb9, 1, sb535, sb417, sb419, 1, sb534, sb63, sb64, 1, sb127, sb420, sb98, 1, sb533, sb84, sb68, 1, sb637, sb71, sb15, 1, sb633, sb78, sb423, 1, sb361, sb518, sb92, 1, sb104, sb569, sb107, 1, sb72, sb568, sb109, 1, sb521, sb113, sb22, 1, sb73, sb102, sb112, 1, sb115, sb520, sb114, 1, sb582, sb573, sb430, 1, sb629, sb23, sb86, 1, sb25, sb493, sb119, 1, sb531, sb432, sb128, 1, sb513, sb121, sb412, 1, sb623, sb26, sb5, 1, sb123, sb130, sb129, 1, sb621, sb134, sb408, 1, sb122, sb27, sb434, 1, sb613, sb138, sb137, 1, sb529, sb28, sb143, 1, sb21, sb142, sb141, 1, sb24, sb144, sb87, 1, sb527, sb139, sb29, 1, sb120, sb435, sb146, 1, sb602, sb494, sb436, 1, sb512, sb148, sb147, 1, sb394, sb152, sb413, 1, sb525, sb578, sb1, 1, sb370, sb588, sb153, 1, sb595, sb583, sb156, 1, sb372, sb523, sb438, 1, sb603, sb594, sb158, 1, sb75, sb117, sb154, 1, sb597, sb596, sb157, 1, sb376, sb601, sb160 # 5142
+xors 4, 1, sb95, sb628, sb223 # 5143
+xors 4, 1, sb474, sb219, sb221 # 5144
+xors 4, 1, sb480, sb218, sb626 # 5145
+xors 4, 1, sb100, sb216, sb625 # 5146
+xors 4, 1, sb20, sb213, sb215 # 5147
+xors 4, 1, sb468, sb616, sb618 # 5148
+xors 4, 1, sb485, sb530, sb209 # 5149
+xors 4, 1, sb465, sb614, sb615 # 5150
+xors 4, 1, sb105, sb612, sb207 # 5151
+xors 4, 1, sb463, sb610, sb205 # 5152
+xors 4, 1, sb4, sb608, sb203 # 5153
+xors 4, 1, sb461, sb606, sb199 # 5154
+xors 4, 1, sb17, sb446, sb604 # 5155
+xors 4, 1, sb598, sb38, sb194 # 5156
+xors 4, 1, sb538, sb526, sb598 # 5157
+xors 4, 1, sb108, sb593, sb187 # 5158
+xors 4, 1, sb457, sb185, sb592 # 5159
+xors 4, 1, sb509, sb591, sb444 # 5160
+xors 4, 1, sb455, sb589, sb184 # 5161
+xors 4, 1, sb515, sb581, sb175 # 5162
+xors 4, 1, sb453, sb173, sb580 # 5163
+xors 4, 1, sb551, sb172, sb579 # 5164
+xors 4, 1, sb451, sb577, sb34 # 5165
+xors 4, 1, sb103, sb522, sb576 # 5166
+xors 4, 1, sb449, sb574, sb575 # 5167
+xors 4, 1, sb111, sb162, sb163 # 5168
+xors 4, 1, sb447, sb32, sb161 # 5169
+xors 4, 1, sb553, sb563, sb567 # 5170
+xors 4, 1, sb445, sb561, sb155 # 5171
+xors 4, 1, sb517, sb151, sb558 # 5172
+xors 4, 1, sb495, sb149, sb150 # 5173
+xors 4, 1, sb443, sb145, sb556 # 5174
+xors 4, 1, sb560, sb550, sb552 # 5175
+xors 4, 1, sb433, sb547, sb548 # 5176
+xors 4, 1, sb562, sb546, sb140 # 5177
+xors 4, 1, sb488, sb544, sb545 # 5178
+xors 4, 1, sb564, sb543, sb136 # 5179
+xors 4, 1, sb3, sb133, sb135 # 5180
+xors 4, 1, sb566, sb132, sb540 # 5181
+xors 4, 1, sb487, sb643, sb131 # 5182
+xors 4, 1, sb511, sb535, sb644 # 5183
+xors 4, 1, sb16, sb534, sb514 # 5184
+xors 4, 1, sb570, sb127, sb642 # 5185
+xors 4, 1, sb80, sb533, sb639 # 5186
+xors 4, 1, sb572, sb637, sb126 # 5187
+xors 4, 1, sb532, sb633, sb635 # 5188
+xors 4, 1, sb584, sb629, sb532 # 5189
+xors 4, 1, sb586, sb25, sb627 # 5190
+xors 4, 1, sb504, sb531, sb125 # 5191
+xors 4, 1, sb590, sb513, sb124 # 5192
+xors 4, 1, sb486, sb623, sb624 # 5193
+xors 4, 1, sb116, sb123, sb619 # 5194
+xors 4, 1, sb389, sb621, sb617 # 5195
+xors 4, 1, sb585, sb122, sb622 # 5196
+xors 4, 1, sb484, sb613, sb620 # 5197
+xors 4, 1, sb587, sb529, sb611 # 5198
+xors 4, 1, sb385, sb21, sb528 # 5199
+xors 4, 1, sb524, sb24, sb609 # 5200
+xors 4, 1, sb483, sb527, sb607 # 5201
+xors 4, 1, sb600, sb120, sb605 # 5202
+xors 4, 1, sb381, sb602, sb431 # 5203
+xors 4, 1, sb118, sb512, sb599 # 5204
+ands 184, 1, sb475, sb426, sb95, 1, sb94, sb479, sb480, 1, sb470, sb481, sb20, 1, sb85, sb427, sb485, 1, sb464, sb519, sb105, 1, sb462, sb428, sb4, 1, sb460, sb106, sb17, 1, sb58, sb502, sb424, 1, sb477, sb476, sb542, 1, sb349, sb70, sb536, 1, sb91, sb537, sb538, 1, sb425, sb539, sb108, 1, sb454, sb541, sb509, 1, sb452, sb510, sb515, 1, sb450, sb516, sb551, 1, sb448, sb110, sb103, 1, sb99, sb549, sb111, 1, sb101, sb559, sb553, 1, sb441, sb554, sb517, 1, sb359, sb351, sb555, 1, sb297, sb14, sb429, 1, sb365, sb355, sb557, 1, sb298, sb357, sb565, 1, sb437, sb518, sb560, 1, sb81, sb569, sb562, 1, sb406, sb568, sb564, 1, sb404, sb113, sb566, 1, sb402, sb102, sb511, 1, sb400, sb520, sb570, 1, sb97, sb573, sb572, 1, sb301, sb361, sb104, 1, sb503, sb72, sb521, 1, sb368, sb73, sb115, 1, sb396, sb582, sb584, 1, sb392, sb578, sb586, 1, sb390, sb588, sb590, 1, sb77, sb583, sb116, 1, sb386, sb523, sb585, 1, sb384, sb594, sb587, 1, sb76, sb117, sb524, 1, sb380, sb596, sb600, 1, sb63, sb601, sb118, 1, sb378, sb370, sb525, 1, sb305, sb372, sb595, 1, sb410, sb75, sb603, 1, sb307, sb376, sb597 # 5205
+xors 4, 1, sb491, sb475, sb411 # 5206
+xors 4, 1, sb343, sb94, sb474 # 5207
+xors 4, 1, sb339, sb470, sb100 # 5208
+xors 4, 1, sb345, sb85, sb468 # 5209
+xors 4, 1, sb67, sb464, sb465 # 5210
+xors 4, 1, sb347, sb462, sb463 # 5211
+xors 4, 1, sb459, sb460, sb461 # 5212
+xors 4, 1, sb350, sb91, sb459 # 5213
+xors 4, 1, sb352, sb425, sb457 # 5214
+xors 4, 1, sb337, sb454, sb455 # 5215
+xors 4, 1, sb478, sb452, sb453 # 5216
+xors 4, 1, sb473, sb450, sb451 # 5217
+xors 4, 1, sb421, sb448, sb449 # 5218
+xors 4, 1, sb331, sb99, sb447 # 5219
+xors 4, 1, sb19, sb101, sb445 # 5220
+xors 4, 1, sb328, sb441, sb495 # 5221
+xors 4, 1, sb472, sb437, sb443 # 5222
+xors 4, 1, sb363, sb81, sb433 # 5223
+xors 4, 1, sb323, sb406, sb488 # 5224
+xors 4, 1, sb364, sb404, sb3 # 5225
+xors 4, 1, sb321, sb402, sb487 # 5226
+xors 4, 1, sb366, sb400, sb16 # 5227
+xors 4, 1, sb398, sb97, sb80 # 5228
+xors 4, 1, sb74, sb396, sb398 # 5229
+xors 4, 1, sb317, sb394, sb79 # 5230
+xors 4, 1, sb96, sb392, sb504 # 5231
+xors 4, 1, sb501, sb390, sb486 # 5232
+xors 4, 1, sb373, sb77, sb389 # 5233
+xors 4, 1, sb315, sb386, sb484 # 5234
+xors 4, 1, sb422, sb384, sb385 # 5235
+xors 4, 1, sb312, sb76, sb483 # 5236
+xors 4, 1, sb482, sb380, sb381 # 5237
+ands 88, 1, sb341, sb502, sb343, 1, sb338, sb476, sb345, 1, sb336, sb70, sb347, 1, sb467, sb58, sb477, 1, sb334, sb349, sb350, 1, sb332, sb351, sb352, 1, sb330, sb14, sb478, 1, sb65, sb355, sb421, 1, sb326, sb357, sb19, 1, sb306, sb297, sb359, 1, sb267, sb298, sb365, 1, sb324, sb361, sb363, 1, sb322, sb72, sb364, 1, sb471, sb73, sb366, 1, sb303, sb301, sb503, 1, sb318, sb368, sb74, 1, sb314, sb370, sb96, 1, sb62, sb372, sb373, 1, sb469, sb75, sb422, 1, sb2, sb376, sb482, 1, sb309, sb305, sb378, 1, sb270, sb307, sb410 # 5238
+xors 4, 1, sb291, sb341, sb491 # 5239
+xors 4, 1, sb93, sb338, sb339 # 5240
+xors 4, 1, sb335, sb336, sb67 # 5241
+xors 4, 1, sb295, sb334, sb335 # 5242
+xors 4, 1, sb59, sb332, sb337 # 5243
+xors 4, 1, sb286, sb330, sb473 # 5244
+xors 4, 1, sb299, sb65, sb331 # 5245
+xors 4, 1, sb284, sb326, sb328 # 5246
+xors 4, 1, sb282, sb324, sb472 # 5247
+xors 4, 1, sb60, sb322, sb323 # 5248
+xors 4, 1, sb320, sb471, sb321 # 5249
+xors 4, 1, sb12, sb318, sb320 # 5250
+xors 4, 1, sb55, sb63, sb317 # 5251
+xors 4, 1, sb61, sb314, sb501 # 5252
+xors 4, 1, sb275, sb62, sb315 # 5253
+xors 4, 1, sb316, sb469, sb312 # 5254
+ands 40, 1, sb500, sb58, sb93, 1, sb293, sb467, sb295, 1, sb507, sb297, sb59, 1, sb492, sb298, sb299, 1, sb269, sb267, sb306, 1, sb11, sb301, sb60, 1, sb281, sb303, sb12, 1, sb56, sb305, sb61, 1, sb253, sb307, sb316, 1, sb54, sb270, sb309 # 5255
+xors 4, 1, sb292, sb500, sb291 # 5256
+xors 4, 1, sb266, sb293, sb292 # 5257
+xors 4, 1, sb239, sb57, sb266 # 5258
+xors 4, 1, sb268, sb507, sb286 # 5259
+xors 4, 1, sb53, sb492, sb284 # 5260
+xors 4, 1, sb418, sb11, sb282 # 5261
+xors 4, 1, sb273, sb281, sb418 # 5262
+xors 4, 1, sb48, sb279, sb273 # 5263
+xors 4, 1, sb254, sb2, sb55 # 5264
+xors 4, 1, sb271, sb56, sb275 # 5265
+ands 16, 1, sb265, sb267, sb268, 1, sb499, sb261, sb269, 1, sb251, sb270, sb271, 1, sb249, sb54, sb273 # 5266
+xors 4, 1, sb52, sb265, sb53 # 5267
+ands 8, 1, sb259, sb261, sb52, 1, sb51, sb499, sb266 # 5268
+xors 4, 1, sb262, sb259, sb260 # 5269
+xors 4, 1, sb409, sb51, sb262 # 5270
+xors 4, 1, sb237, sb10, sb409 # 5271
+xors 4, 1, sb50, sb253, sb254 # 5272
+xors 4, 1, sb250, sb251, sb50 # 5273
+xors 4, 1, sb248, sb249, sb250 # 5274
+dabit s7, sb247 # 5275
+xors 4, 1, sb238, sb247, sb248 # 5276
+mulsi s11, s7, 2 # 5277
+dabit s17, sb49 # 5278
+xors 4, 1, sb245, sb49, sb246 # 5279
+reveal 24, 1, cb1, sb237, 1, cb3, sb238, 1, cb2, sb239, 1, cb5, sb241, 1, cb4, sb498, 1, cb0, sb48, 1, cb7, sb243, 1, cb6, sb245 # 5280
+convcbitvec 1, ci0, cb1 # 5281
+convint c2, ci0 # 5282
+addm s0, s14, c2 # 5283
+convint c6, ci0 # 5284
+mulm s14, s8, c6 # 5285
+subs s8, s0, s14 # 5286
+movs s0, s8 # 5287
+convcbitvec 1, ci0, cb3 # 5288
+convint c2, ci0 # 5289
+addm s14, s7, c2 # 5290
+convint c6, ci0 # 5291
+mulm s8, s11, c6 # 5292
+subs s7, s14, s8 # 5293
+movs s11, s7 # 5294
+convcbitvec 1, ci0, cb2 # 5295
+convint c2, ci0 # 5296
+addm s7, s20, c2 # 5297
+convint c6, ci0 # 5298
+mulm s8, s12, c6 # 5299
+subs s14, s7, s8 # 5300
+movs s20, s14 # 5301
+convcbitvec 1, ci0, cb5 # 5302
+convint c2, ci0 # 5303
+addm s8, s21, c2 # 5304
+convint c6, ci0 # 5305
+mulm s12, s19, c6 # 5306
+subs s14, s8, s12 # 5307
+movs s7, s14 # 5308
+adds s21, s20, s7 # 5309
+adds s19, s3, s21 # 5310
+convcbitvec 1, ci0, cb4 # 5311
+convint c2, ci0 # 5312
+addm s8, s18, c2 # 5313
+convint c6, ci0 # 5314
+mulm s12, s15, c6 # 5315
+subs s7, s8, s12 # 5316
+movs s14, s7 # 5317
+adds s3, s0, s14 # 5318
+mulm s20, s3, c1 # 5319
+subs s21, s19, s20 # 5320
+subml s18, s21, c5 # 5321
+addsi s15, s18, 1 # 5322
+addm s14, s15, c3 # 5323
+split 194, 3, s14, sb235, sb47, sb574, sb18, sb234, sb162, sb489, sb82, sb32, sb46, sb416, sb563, sb227, sb228, sb154, sb233, sb231, sb151, sb229, sb224, sb556, sb44, sb222, sb552, sb225, sb220, sb548, sb90, sb497, sb139, sb490, sb508, sb136, sb217, sb43, sb540, sb505, sb212, sb131, sb214, sb83, sb640, sb210, sb208, sb644, sb206, sb8, sb643, sb211, sb213, sb641, sb204, sb202, sb25, sb200, sb201, sb125, sb197, sb198, sb636, sb195, sb196, sb634, sb193, sb39, sb631, sb496, sb89, sb630, sb189, sb190, sb123, sb192, sb188, sb623, sb194, sb186, sb621, sb183, sb99, sb622, sb7, sb36, sb620, sb181, sb180, sb121, sb177, sb178, sb4, sb176, sb414, sb613, sb442, sb179, sb612, sb171, sb35, sb610, sb169, sb170, sb608, sb168, sb506, sb606, sb165, sb440, sb603, sb167, sb166, sb601, sb164, sb33, sb600, sb159, sb160, sb117, sb157, sb158, sb596, sb438, sb156, sb594, sb153, sb1, sb591, sb413, sb152, sb590, sb0, sb407, sb588, sb147, sb148, sb586, sb436, sb146, sb584, sb87, sb144, sb582, sb141, sb142, sb115, sb143, sb28, sb113, sb137, sb138, sb568, sb434, sb27, sb573, sb408, sb134, sb569, sb129, sb135, sb565, sb130, sb5, sb559, sb26, sb412, sb519, sb128, sb432, sb111, sb119, sb433, sb110, sb493, sb86, sb551, sb23, sb430, sb516, sb112, sb114, sb550, sb109, sb22, sb547, sb424, sb17, sb545, sb106, sb428, sb543, sb107, sb105, sb342 # 5324
+xors 4, 1, sb522, sb574, sb47 # 5325
+xors 4, 1, sb576, sb235, sb574 # 5326
+xors 4, 1, sb577, sb162, sb234 # 5327
+xors 4, 1, sb488, sb577, sb18 # 5328
+xors 4, 1, sb578, sb18, sb162 # 5329
+xors 4, 1, sb172, sb32, sb82 # 5330
+xors 4, 1, sb485, sb172, sb489 # 5331
+xors 4, 1, sb579, sb489, sb32 # 5332
+xors 4, 1, sb173, sb563, sb416 # 5333
+xors 4, 1, sb411, sb173, sb46 # 5334
+xors 4, 1, sb580, sb46, sb563 # 5335
+xors 4, 1, sb174, sb154, sb228 # 5336
+xors 4, 1, sb426, sb174, sb227 # 5337
+xors 4, 1, sb175, sb227, sb154 # 5338
+xors 4, 1, sb182, sb151, sb231 # 5339
+xors 4, 1, sb479, sb182, sb233 # 5340
+xors 4, 1, sb184, sb233, sb151 # 5341
+xors 4, 1, sb444, sb556, sb224 # 5342
+xors 4, 1, sb480, sb444, sb229 # 5343
+xors 4, 1, sb185, sb229, sb556 # 5344
+xors 4, 1, sb592, sb552, sb222 # 5345
+xors 4, 1, sb20, sb592, sb44 # 5346
+xors 4, 1, sb37, sb44, sb552 # 5347
+xors 4, 1, sb187, sb548, sb220 # 5348
+xors 4, 1, sb100, sb187, sb225 # 5349
+xors 4, 1, sb526, sb225, sb548 # 5350
+xors 4, 1, sb191, sb139, sb497 # 5351
+xors 4, 1, sb476, sb191, sb90 # 5352
+xors 4, 1, sb598, sb90, sb139 # 5353
+xors 4, 1, sb602, sb136, sb508 # 5354
+xors 4, 1, sb474, sb602, sb490 # 5355
+xors 4, 1, sb604, sb490, sb136 # 5356
+xors 4, 1, sb199, sb540, sb43 # 5357
+xors 4, 1, sb92, sb199, sb217 # 5358
+xors 4, 1, sb203, sb217, sb540 # 5359
+xors 4, 1, sb205, sb131, sb212 # 5360
+xors 4, 1, sb470, sb205, sb505 # 5361
+xors 4, 1, sb207, sb505, sb131 # 5362
+xors 4, 1, sb614, sb640, sb83 # 5363
+xors 4, 1, sb468, sb614, sb214 # 5364
+xors 4, 1, sb615, sb214, sb640 # 5365
+xors 4, 1, sb530, sb644, sb208 # 5366
+xors 4, 1, sb466, sb530, sb210 # 5367
+xors 4, 1, sb209, sb210, sb644 # 5368
+xors 4, 1, sb616, sb643, sb8 # 5369
+xors 4, 1, sb464, sb616, sb206 # 5370
+xors 4, 1, sb618, sb206, sb643 # 5371
+xors 4, 1, sb215, sb641, sb213 # 5372
+xors 4, 1, sb462, sb215, sb211 # 5373
+xors 4, 1, sb216, sb211, sb641 # 5374
+xors 4, 1, sb625, sb25, sb202 # 5375
+xors 4, 1, sb460, sb625, sb204 # 5376
+xors 4, 1, sb218, sb204, sb25 # 5377
+xors 4, 1, sb219, sb125, sb201 # 5378
+xors 4, 1, sb458, sb219, sb200 # 5379
+xors 4, 1, sb221, sb200, sb125 # 5380
+xors 4, 1, sb628, sb636, sb198 # 5381
+xors 4, 1, sb456, sb628, sb197 # 5382
+xors 4, 1, sb223, sb197, sb636 # 5383
+xors 4, 1, sb632, sb634, sb196 # 5384
+xors 4, 1, sb454, sb632, sb195 # 5385
+xors 4, 1, sb226, sb195, sb634 # 5386
+xors 4, 1, sb230, sb631, sb39 # 5387
+xors 4, 1, sb452, sb230, sb193 # 5388
+xors 4, 1, sb638, sb193, sb631 # 5389
+xors 4, 1, sb232, sb630, sb89 # 5390
+xors 4, 1, sb450, sb232, sb496 # 5391
+xors 4, 1, sb236, sb496, sb630 # 5392
+xors 4, 1, sb240, sb123, sb190 # 5393
+xors 4, 1, sb448, sb240, sb189 # 5394
+xors 4, 1, sb242, sb189, sb123 # 5395
+xors 4, 1, sb244, sb623, sb188 # 5396
+xors 4, 1, sb446, sb244, sb192 # 5397
+xors 4, 1, sb252, sb192, sb623 # 5398
+xors 4, 1, sb255, sb621, sb186 # 5399
+xors 4, 1, sb88, sb255, sb194 # 5400
+xors 4, 1, sb256, sb194, sb621 # 5401
+xors 4, 1, sb257, sb622, sb99 # 5402
+xors 4, 1, sb494, sb257, sb183 # 5403
+xors 4, 1, sb258, sb183, sb622 # 5404
+xors 4, 1, sb263, sb620, sb36 # 5405
+xors 4, 1, sb439, sb263, sb7 # 5406
+xors 4, 1, sb264, sb7, sb620 # 5407
+xors 4, 1, sb272, sb121, sb180 # 5408
+xors 4, 1, sb435, sb272, sb181 # 5409
+xors 4, 1, sb274, sb181, sb121 # 5410
+xors 4, 1, sb276, sb4, sb178 # 5411
+xors 4, 1, sb431, sb276, sb177 # 5412
+xors 4, 1, sb277, sb177, sb4 # 5413
+xors 4, 1, sb278, sb613, sb414 # 5414
+xors 4, 1, sb427, sb278, sb176 # 5415
+xors 4, 1, sb280, sb176, sb613 # 5416
+xors 4, 1, sb283, sb612, sb179 # 5417
+xors 4, 1, sb423, sb283, sb442 # 5418
+xors 4, 1, sb285, sb442, sb612 # 5419
+xors 4, 1, sb287, sb610, sb35 # 5420
+xors 4, 1, sb419, sb287, sb171 # 5421
+xors 4, 1, sb288, sb171, sb610 # 5422
+xors 4, 1, sb289, sb608, sb170 # 5423
+xors 4, 1, sb81, sb289, sb169 # 5424
+xors 4, 1, sb290, sb169, sb608 # 5425
+xors 4, 1, sb294, sb606, sb506 # 5426
+xors 4, 1, sb405, sb294, sb168 # 5427
+xors 4, 1, sb296, sb168, sb606 # 5428
+xors 4, 1, sb300, sb603, sb440 # 5429
+xors 4, 1, sb403, sb300, sb165 # 5430
+xors 4, 1, sb302, sb165, sb603 # 5431
+xors 4, 1, sb304, sb601, sb166 # 5432
+xors 4, 1, sb401, sb304, sb167 # 5433
+xors 4, 1, sb308, sb167, sb601 # 5434
+xors 4, 1, sb310, sb600, sb33 # 5435
+xors 4, 1, sb399, sb310, sb164 # 5436
+xors 4, 1, sb311, sb164, sb600 # 5437
+xors 4, 1, sb313, sb117, sb160 # 5438
+xors 4, 1, sb80, sb313, sb159 # 5439
+xors 4, 1, sb319, sb159, sb117 # 5440
+xors 4, 1, sb325, sb596, sb158 # 5441
+xors 4, 1, sb78, sb325, sb157 # 5442
+xors 4, 1, sb327, sb157, sb596 # 5443
+xors 4, 1, sb420, sb594, sb156 # 5444
+xors 4, 1, sb397, sb420, sb438 # 5445
+xors 4, 1, sb329, sb438, sb594 # 5446
+xors 4, 1, sb66, sb591, sb1 # 5447
+xors 4, 1, sb395, sb66, sb153 # 5448
+xors 4, 1, sb340, sb153, sb591 # 5449
+xors 4, 1, sb69, sb590, sb152 # 5450
+xors 4, 1, sb393, sb69, sb413 # 5451
+xors 4, 1, sb348, sb413, sb590 # 5452
+xors 4, 1, sb353, sb588, sb407 # 5453
+xors 4, 1, sb391, sb353, sb0 # 5454
+xors 4, 1, sb354, sb0, sb588 # 5455
+xors 4, 1, sb356, sb586, sb148 # 5456
+xors 4, 1, sb389, sb356, sb147 # 5457
+xors 4, 1, sb358, sb147, sb586 # 5458
+xors 4, 1, sb360, sb584, sb146 # 5459
+xors 4, 1, sb387, sb360, sb436 # 5460
+xors 4, 1, sb362, sb436, sb584 # 5461
+xors 4, 1, sb374, sb582, sb144 # 5462
+xors 4, 1, sb385, sb374, sb87 # 5463
+xors 4, 1, sb382, sb87, sb582 # 5464
+xors 4, 1, sb388, sb115, sb142 # 5465
+xors 4, 1, sb383, sb388, sb141 # 5466
+xors 4, 1, sb31, sb141, sb115 # 5467
+xors 4, 1, sb29, sb113, sb28 # 5468
+xors 4, 1, sb15, sb29, sb143 # 5469
+xors 4, 1, sb30, sb143, sb113 # 5470
+xors 4, 1, sb6, sb568, sb138 # 5471
+xors 4, 1, sb379, sb6, sb137 # 5472
+xors 4, 1, sb34, sb137, sb568 # 5473
+xors 4, 1, sb38, sb573, sb27 # 5474
+xors 4, 1, sb377, sb38, sb434 # 5475
+xors 4, 1, sb415, sb434, sb573 # 5476
+xors 4, 1, sb40, sb569, sb134 # 5477
+xors 4, 1, sb375, sb40, sb408 # 5478
+xors 4, 1, sb41, sb408, sb569 # 5479
+xors 4, 1, sb42, sb565, sb135 # 5480
+xors 4, 1, sb481, sb42, sb129 # 5481
+xors 4, 1, sb45, sb129, sb565 # 5482
+xors 4, 1, sb9, sb559, sb5 # 5483
+xors 4, 1, sb371, sb9, sb130 # 5484
+xors 4, 1, sb417, sb130, sb559 # 5485
+xors 4, 1, sb64, sb519, sb412 # 5486
+xors 4, 1, sb369, sb64, sb26 # 5487
+xors 4, 1, sb98, sb26, sb519 # 5488
+xors 4, 1, sb84, sb111, sb432 # 5489
+xors 4, 1, sb367, sb84, sb128 # 5490
+xors 4, 1, sb68, sb128, sb111 # 5491
+xors 4, 1, sb13, sb110, sb433 # 5492
+xors 4, 1, sb365, sb13, sb119 # 5493
+xors 4, 1, sb75, sb119, sb110 # 5494
+xors 4, 1, sb73, sb551, sb86 # 5495
+xors 4, 1, sb363, sb73, sb493 # 5496
+xors 4, 1, sb71, sb493, sb551 # 5497
+xors 4, 1, sb70, sb516, sb430 # 5498
+xors 4, 1, sb361, sb70, sb23 # 5499
+xors 4, 1, sb14, sb23, sb516 # 5500
+xors 4, 1, sb72, sb550, sb114 # 5501
+xors 4, 1, sb359, sb72, sb112 # 5502
+xors 4, 1, sb74, sb112, sb550 # 5503
+xors 4, 1, sb76, sb547, sb22 # 5504
+xors 4, 1, sb478, sb76, sb109 # 5505
+xors 4, 1, sb422, sb109, sb547 # 5506
+xors 4, 1, sb410, sb545, sb17 # 5507
+xors 4, 1, sb477, sb410, sb424 # 5508
+xors 4, 1, sb16, sb424, sb545 # 5509
+xors 4, 1, sb3, sb543, sb428 # 5510
+xors 4, 1, sb349, sb3, sb106 # 5511
+xors 4, 1, sb91, sb106, sb543 # 5512
+xors 4, 1, sb85, sb342, sb105 # 5513
+xors 4, 1, sb347, sb85, sb107 # 5514
+xors 4, 1, sb96, sb107, sb342 # 5515
+ands 256, 1, sb575, sb522, sb576, 1, sb163, sb577, sb578, 1, sb161, sb172, sb579, 1, sb567, sb173, sb580, 1, sb155, sb174, sb175, 1, sb558, sb182, sb184, 1, sb150, sb444, sb185, 1, sb149, sb592, sb37, 1, sb145, sb187, sb526, 1, sb140, sb191, sb598, 1, sb544, sb602, sb604, 1, sb133, sb199, sb203, 1, sb132, sb205, sb207, 1, sb536, sb614, sb615, 1, sb642, sb530, sb209, 1, sb127, sb616, sb618, 1, sb126, sb215, sb216, 1, sb639, sb625, sb218, 1, sb637, sb219, sb221, 1, sb635, sb628, sb223, 1, sb633, sb632, sb226, 1, sb124, sb230, sb638, 1, sb629, sb232, sb236, 1, sb627, sb240, sb242, 1, sb626, sb244, sb252, 1, sb624, sb255, sb256, 1, sb122, sb257, sb258, 1, sb619, sb263, sb264, 1, sb617, sb272, sb274, 1, sb21, sb276, sb277, 1, sb24, sb278, sb280, 1, sb611, sb283, sb285, 1, sb609, sb287, sb288, 1, sb607, sb289, sb290, 1, sb605, sb294, sb296, 1, sb120, sb300, sb302, 1, sb118, sb304, sb308, 1, sb599, sb310, sb311, 1, sb597, sb313, sb319, 1, sb595, sb325, sb327, 1, sb593, sb420, sb329, 1, sb116, sb66, sb340, 1, sb589, sb69, sb348, 1, sb587, sb353, sb354, 1, sb585, sb356, sb358, 1, sb583, sb360, sb362, 1, sb581, sb374, sb382, 1, sb572, sb388, sb31, 1, sb570, sb29, sb30, 1, sb102, sb6, sb34, 1, sb566, sb38, sb415, 1, sb564, sb40, sb41, 1, sb562, sb42, sb45, 1, sb560, sb9, sb417, 1, sb561, sb64, sb98, 1, sb557, sb84, sb68, 1, sb555, sb13, sb75, 1, sb554, sb73, sb71, 1, sb553, sb70, sb14, 1, sb549, sb72, sb74, 1, sb546, sb76, sb422, 1, sb108, sb410, sb16, 1, sb542, sb3, sb91, 1, sb344, sb85, sb96 # 5516
+xors 4, 1, sb486, sb574, sb575 # 5517
+xors 4, 1, sb331, sb571, sb486 # 5518
+xors 4, 1, sb484, sb162, sb163 # 5519
+xors 4, 1, sb541, sb484, sb485 # 5520
+xors 4, 1, sb483, sb32, sb161 # 5521
+xors 4, 1, sb64, sb483, sb411 # 5522
+xors 4, 1, sb503, sb563, sb567 # 5523
+xors 4, 1, sb539, sb503, sb426 # 5524
+xors 4, 1, sb482, sb154, sb155 # 5525
+xors 4, 1, sb320, sb482, sb479 # 5526
+xors 4, 1, sb95, sb151, sb558 # 5527
+xors 4, 1, sb538, sb95, sb480 # 5528
+xors 4, 1, sb19, sb556, sb150 # 5529
+xors 4, 1, sb94, sb19, sb20 # 5530
+xors 4, 1, sb475, sb552, sb149 # 5531
+xors 4, 1, sb537, sb475, sb100 # 5532
+xors 4, 1, sb473, sb548, sb145 # 5533
+xors 4, 1, sb316, sb473, sb476 # 5534
+xors 4, 1, sb472, sb139, sb140 # 5535
+xors 4, 1, sb514, sb472, sb474 # 5536
+xors 4, 1, sb471, sb136, sb544 # 5537
+xors 4, 1, sb321, sb471, sb92 # 5538
+xors 4, 1, sb469, sb540, sb133 # 5539
+xors 4, 1, sb535, sb469, sb470 # 5540
+xors 4, 1, sb467, sb131, sb132 # 5541
+xors 4, 1, sb312, sb467, sb468 # 5542
+xors 4, 1, sb465, sb640, sb536 # 5543
+xors 4, 1, sb534, sb465, sb466 # 5544
+xors 4, 1, sb463, sb644, sb642 # 5545
+xors 4, 1, sb315, sb463, sb464 # 5546
+xors 4, 1, sb461, sb643, sb127 # 5547
+xors 4, 1, sb533, sb461, sb462 # 5548
+xors 4, 1, sb459, sb641, sb126 # 5549
+xors 4, 1, sb314, sb459, sb460 # 5550
+xors 4, 1, sb457, sb25, sb639 # 5551
+xors 4, 1, sb532, sb457, sb458 # 5552
+xors 4, 1, sb455, sb125, sb637 # 5553
+xors 4, 1, sb306, sb455, sb456 # 5554
+xors 4, 1, sb453, sb636, sb635 # 5555
+xors 4, 1, sb531, sb453, sb454 # 5556
+xors 4, 1, sb451, sb634, sb633 # 5557
+xors 4, 1, sb62, sb451, sb452 # 5558
+xors 4, 1, sb449, sb631, sb124 # 5559
+xors 4, 1, sb513, sb449, sb450 # 5560
+xors 4, 1, sb447, sb630, sb629 # 5561
+xors 4, 1, sb12, sb447, sb448 # 5562
+xors 4, 1, sb445, sb123, sb627 # 5563
+xors 4, 1, sb512, sb445, sb446 # 5564
+xors 4, 1, sb443, sb623, sb626 # 5565
+xors 4, 1, sb60, sb443, sb88 # 5566
+xors 4, 1, sb441, sb621, sb624 # 5567
+xors 4, 1, sb528, sb441, sb494 # 5568
+xors 4, 1, sb437, sb622, sb122 # 5569
+xors 4, 1, sb298, sb437, sb439 # 5570
+xors 4, 1, sb433, sb620, sb619 # 5571
+xors 4, 1, sb529, sb433, sb435 # 5572
+xors 4, 1, sb429, sb121, sb617 # 5573
+xors 4, 1, sb301, sb429, sb431 # 5574
+xors 4, 1, sb425, sb4, sb21 # 5575
+xors 4, 1, sb527, sb425, sb427 # 5576
+xors 4, 1, sb421, sb613, sb24 # 5577
+xors 4, 1, sb295, sb421, sb423 # 5578
+xors 4, 1, sb417, sb612, sb611 # 5579
+xors 4, 1, sb525, sb417, sb419 # 5580
+xors 4, 1, sb406, sb610, sb609 # 5581
+xors 4, 1, sb507, sb406, sb81 # 5582
+xors 4, 1, sb404, sb608, sb607 # 5583
+xors 4, 1, sb104, sb404, sb405 # 5584
+xors 4, 1, sb402, sb606, sb605 # 5585
+xors 4, 1, sb293, sb402, sb403 # 5586
+xors 4, 1, sb400, sb603, sb120 # 5587
+xors 4, 1, sb524, sb400, sb401 # 5588
+xors 4, 1, sb487, sb601, sb118 # 5589
+xors 4, 1, sb292, sb487, sb399 # 5590
+xors 4, 1, sb79, sb600, sb599 # 5591
+xors 4, 1, sb523, sb79, sb80 # 5592
+xors 4, 1, sb398, sb117, sb597 # 5593
+xors 4, 1, sb286, sb398, sb78 # 5594
+xors 4, 1, sb396, sb596, sb595 # 5595
+xors 4, 1, sb521, sb396, sb397 # 5596
+xors 4, 1, sb394, sb594, sb593 # 5597
+xors 4, 1, sb284, sb394, sb395 # 5598
+xors 4, 1, sb392, sb591, sb116 # 5599
+xors 4, 1, sb520, sb392, sb393 # 5600
+xors 4, 1, sb390, sb590, sb589 # 5601
+xors 4, 1, sb56, sb390, sb391 # 5602
+xors 4, 1, sb77, sb588, sb587 # 5603
+xors 4, 1, sb511, sb77, sb389 # 5604
+xors 4, 1, sb386, sb586, sb585 # 5605
+xors 4, 1, sb2, sb386, sb387 # 5606
+xors 4, 1, sb384, sb584, sb583 # 5607
+xors 4, 1, sb518, sb384, sb385 # 5608
+xors 4, 1, sb381, sb582, sb581 # 5609
+xors 4, 1, sb279, sb381, sb383 # 5610
+xors 4, 1, sb380, sb115, sb572 # 5611
+xors 4, 1, sb517, sb380, sb15 # 5612
+xors 4, 1, sb378, sb113, sb570 # 5613
+xors 4, 1, sb55, sb378, sb379 # 5614
+xors 4, 1, sb376, sb568, sb102 # 5615
+xors 4, 1, sb509, sb376, sb377 # 5616
+xors 4, 1, sb373, sb573, sb566 # 5617
+xors 4, 1, sb281, sb373, sb375 # 5618
+xors 4, 1, sb372, sb569, sb564 # 5619
+xors 4, 1, sb515, sb372, sb481 # 5620
+xors 4, 1, sb370, sb565, sb562 # 5621
+xors 4, 1, sb54, sb370, sb371 # 5622
+xors 4, 1, sb368, sb559, sb560 # 5623
+xors 4, 1, sb510, sb368, sb369 # 5624
+xors 4, 1, sb366, sb519, sb561 # 5625
+xors 4, 1, sb270, sb366, sb367 # 5626
+xors 4, 1, sb364, sb111, sb557 # 5627
+xors 4, 1, sb103, sb364, sb365 # 5628
+xors 4, 1, sb355, sb110, sb555 # 5629
+xors 4, 1, sb499, sb355, sb363 # 5630
+xors 4, 1, sb357, sb551, sb554 # 5631
+xors 4, 1, sb99, sb357, sb361 # 5632
+xors 4, 1, sb352, sb516, sb553 # 5633
+xors 4, 1, sb266, sb352, sb359 # 5634
+xors 4, 1, sb350, sb550, sb549 # 5635
+xors 4, 1, sb97, sb350, sb478 # 5636
+xors 4, 1, sb351, sb547, sb546 # 5637
+xors 4, 1, sb53, sb351, sb477 # 5638
+xors 4, 1, sb502, sb545, sb108 # 5639
+xors 4, 1, sb504, sb502, sb349 # 5640
+xors 4, 1, sb98, sb543, sb542 # 5641
+xors 4, 1, sb262, sb98, sb347 # 5642
+ands 376, 1, sb52, sb98, sb347, 1, sb265, sb502, sb349, 1, sb261, sb351, sb477, 1, sb267, sb350, sb478, 1, sb51, sb352, sb359, 1, sb268, sb357, sb361, 1, sb10, sb355, sb363, 1, sb269, sb364, sb365, 1, sb253, sb366, sb367, 1, sb271, sb368, sb369, 1, sb251, sb370, sb371, 1, sb273, sb372, sb481, 1, sb249, sb373, sb375, 1, sb275, sb376, sb377, 1, sb49, sb378, sb379, 1, sb11, sb380, sb15, 1, sb245, sb381, sb383, 1, sb282, sb384, sb385, 1, sb498, sb386, sb387, 1, sb418, sb77, sb389, 1, sb241, sb390, sb391, 1, sb492, sb392, sb393, 1, sb239, sb394, sb395, 1, sb58, sb396, sb397, 1, sb47, sb398, sb78, 1, sb57, sb79, sb80, 1, sb235, sb487, sb399, 1, sb291, sb400, sb401, 1, sb489, sb402, sb403, 1, sb93, sb404, sb405, 1, sb416, sb406, sb81, 1, sb500, sb417, sb419, 1, sb46, sb421, sb423, 1, sb59, sb425, sb427, 1, sb231, sb429, sb431, 1, sb297, sb433, sb435, 1, sb233, sb437, sb439, 1, sb299, sb441, sb494, 1, sb229, sb443, sb88, 1, sb305, sb445, sb446, 1, sb44, sb447, sb448, 1, sb303, sb449, sb450, 1, sb225, sb451, sb452, 1, sb307, sb453, sb454, 1, sb217, sb455, sb456, 1, sb61, sb457, sb458, 1, sb505, sb459, sb460, 1, sb309, sb461, sb462, 1, sb83, sb463, sb464, 1, sb317, sb465, sb466, 1, sb214, sb467, sb468, 1, sb318, sb469, sb470, 1, sb210, sb471, sb92, 1, sb63, sb472, sb474, 1, sb213, sb473, sb476, 1, sb501, sb475, sb100, 1, sb211, sb19, sb20, 1, sb322, sb95, sb480, 1, sb41, sb482, sb479, 1, sb326, sb503, sb426, 1, sb415, sb483, sb411, 1, sb323, sb484, sb485, 1, sb491, sb486, sb488, 1, sb33, sb262, sb504, 1, sb324, sb53, sb97, 1, sb169, sb266, sb99, 1, sb330, sb499, sb103, 1, sb164, sb270, sb510, 1, sb65, sb54, sb515, 1, sb101, sb281, sb509, 1, sb336, sb55, sb517, 1, sb495, sb279, sb518, 1, sb328, sb2, sb511, 1, sb176, sb56, sb520, 1, sb334, sb284, sb521, 1, sb171, sb286, sb523, 1, sb338, sb292, sb524, 1, sb179, sb293, sb104, 1, sb67, sb507, sb525, 1, sb442, sb295, sb527, 1, sb332, sb301, sb529, 1, sb35, sb298, sb528, 1, sb335, sb60, sb512, 1, sb183, sb12, sb513, 1, sb337, sb62, sb531, 1, sb188, sb306, sb532, 1, sb339, sb314, sb533, 1, sb189, sb315, sb534, 1, sb341, sb312, sb535, 1, sb192, sb321, sb514, 1, sb343, sb316, sb537, 1, sb194, sb94, sb538, 1, sb345, sb320, sb539, 1, sb84, sb64, sb541 # 5643
+ands 188, 1, sb260, sb262, sb265, 1, sb259, sb53, sb267, 1, sb409, sb266, sb268, 1, sb254, sb499, sb269, 1, sb50, sb270, sb271, 1, sb250, sb54, sb273, 1, sb248, sb281, sb275, 1, sb246, sb55, sb11, 1, sb247, sb279, sb282, 1, sb243, sb2, sb418, 1, sb48, sb56, sb492, 1, sb238, sb284, sb58, 1, sb237, sb286, sb57, 1, sb234, sb292, sb291, 1, sb18, sb293, sb93, 1, sb82, sb507, sb500, 1, sb228, sb295, sb59, 1, sb227, sb301, sb297, 1, sb224, sb298, sb299, 1, sb222, sb60, sb305, 1, sb220, sb12, sb303, 1, sb497, sb62, sb307, 1, sb508, sb306, sb61, 1, sb490, sb314, sb309, 1, sb212, sb315, sb317, 1, sb90, sb312, sb318, 1, sb43, sb321, sb63, 1, sb8, sb316, sb501, 1, sb208, sb94, sb322, 1, sb206, sb320, sb326, 1, sb201, sb64, sb323, 1, sb105, sb33, sb324, 1, sb196, sb169, sb330, 1, sb107, sb164, sb65, 1, sb39, sb101, sb336, 1, sb109, sb495, sb328, 1, sb193, sb176, sb334, 1, sb112, sb171, sb338, 1, sb89, sb179, sb67, 1, sb23, sb442, sb332, 1, sb496, sb35, sb335, 1, sb493, sb183, sb337, 1, sb198, sb188, sb339, 1, sb128, sb189, sb341, 1, sb200, sb192, sb343, 1, sb202, sb194, sb345, 1, sb40, sb84, sb491 # 5644
+xors 4, 1, sb167, sb260, sb52 # 5645
+xors 4, 1, sb168, sb259, sb261 # 5646
+xors 4, 1, sb0, sb409, sb51 # 5647
+xors 4, 1, sb170, sb254, sb10 # 5648
+xors 4, 1, sb407, sb50, sb253 # 5649
+xors 4, 1, sb166, sb250, sb251 # 5650
+xors 4, 1, sb160, sb248, sb249 # 5651
+xors 4, 1, sb440, sb246, sb49 # 5652
+xors 4, 1, sb159, sb247, sb245 # 5653
+xors 4, 1, sb506, sb243, sb498 # 5654
+xors 4, 1, sb157, sb48, sb241 # 5655
+xors 4, 1, sb177, sb238, sb239 # 5656
+xors 4, 1, sb436, sb237, sb47 # 5657
+xors 4, 1, sb178, sb234, sb235 # 5658
+xors 4, 1, sb152, sb18, sb489 # 5659
+xors 4, 1, sb181, sb82, sb416 # 5660
+xors 4, 1, sb494, sb228, sb46 # 5661
+xors 4, 1, sb414, sb227, sb231 # 5662
+xors 4, 1, sb148, sb224, sb233 # 5663
+xors 4, 1, sb7, sb222, sb229 # 5664
+xors 4, 1, sb146, sb220, sb44 # 5665
+xors 4, 1, sb180, sb497, sb225 # 5666
+xors 4, 1, sb434, sb508, sb217 # 5667
+xors 4, 1, sb36, sb490, sb505 # 5668
+xors 4, 1, sb143, sb212, sb83 # 5669
+xors 4, 1, sb190, sb90, sb214 # 5670
+xors 4, 1, sb28, sb43, sb210 # 5671
+xors 4, 1, sb186, sb8, sb213 # 5672
+xors 4, 1, sb138, sb208, sb211 # 5673
+xors 4, 1, sb195, sb206, sb41 # 5674
+xors 4, 1, sb204, sb201, sb415 # 5675
+xors 4, 1, sb197, sb40, sb204 # 5676
+ands 92, 1, sb165, sb33, sb168, 1, sb156, sb169, sb170, 1, sb438, sb164, sb166, 1, sb413, sb101, sb440, 1, sb158, sb495, sb506, 1, sb1, sb176, sb177, 1, sb153, sb171, sb178, 1, sb87, sb179, sb181, 1, sb141, sb442, sb414, 1, sb147, sb35, sb7, 1, sb137, sb183, sb180, 1, sb144, sb188, sb36, 1, sb142, sb189, sb190, 1, sb408, sb192, sb186, 1, sb27, sb194, sb195, 1, sb45, sb105, sb196, 1, sb5, sb107, sb39, 1, sb13, sb109, sb193, 1, sb130, sb112, sb89, 1, sb68, sb23, sb496, 1, sb26, sb493, sb198, 1, sb432, sb128, sb200, 1, sb134, sb202, sb197 # 5677
+xors 4, 1, sb106, sb165, sb167 # 5678
+xors 4, 1, sb428, sb156, sb0 # 5679
+xors 4, 1, sb85, sb438, sb407 # 5680
+xors 4, 1, sb424, sb413, sb160 # 5681
+xors 4, 1, sb17, sb158, sb159 # 5682
+xors 4, 1, sb22, sb1, sb157 # 5683
+xors 4, 1, sb16, sb153, sb436 # 5684
+xors 4, 1, sb114, sb87, sb152 # 5685
+xors 4, 1, sb79, sb141, sb494 # 5686
+xors 4, 1, sb430, sb147, sb148 # 5687
+xors 4, 1, sb75, sb137, sb146 # 5688
+xors 4, 1, sb119, sb144, sb434 # 5689
+xors 4, 1, sb73, sb142, sb143 # 5690
+xors 4, 1, sb129, sb408, sb28 # 5691
+xors 4, 1, sb135, sb27, sb138 # 5692
+xors 4, 1, sb412, sb134, sb135 # 5693
+ands 44, 1, sb96, sb105, sb428, 1, sb91, sb107, sb424, 1, sb86, sb109, sb22, 1, sb3, sb112, sb114, 1, sb410, sb23, sb430, 1, sb422, sb493, sb119, 1, sb76, sb128, sb129, 1, sb360, sb45, sb5, 1, sb72, sb13, sb130, 1, sb74, sb68, sb26, 1, sb71, sb432, sb412 # 5694
+xors 4, 1, sb42, sb96, sb106 # 5695
+xors 4, 1, sb9, sb91, sb85 # 5696
+xors 4, 1, sb34, sb86, sb17 # 5697
+xors 4, 1, sb66, sb3, sb16 # 5698
+xors 4, 1, sb31, sb410, sb79 # 5699
+xors 4, 1, sb70, sb422, sb75 # 5700
+xors 4, 1, sb14, sb76, sb73 # 5701
+xors 4, 1, sb69, sb71, sb14 # 5702
+ands 20, 1, sb38, sb45, sb9, 1, sb6, sb13, sb66, 1, sb30, sb68, sb70, 1, sb374, sb360, sb72, 1, sb388, sb74, sb69 # 5703
+xors 4, 1, sb358, sb38, sb42 # 5704
+xors 4, 1, sb362, sb6, sb34 # 5705
+xors 4, 1, sb29, sb30, sb31 # 5706
+xors 4, 1, sb382, sb388, sb29 # 5707
+ands 8, 1, sb356, sb360, sb362, 1, sb353, sb374, sb382 # 5708
+xors 4, 1, sb354, sb356, sb358 # 5709
+xors 4, 1, sb348, sb353, sb354 # 5710
+xors 4, 1, sb420, sb346, sb348 # 5711
+xors 4, 1, sb340, sb342, sb344 # 5712
+xors 4, 1, sb329, sb333, sb340 # 5713
+reveal 9, 1, cb3, sb420, 1, cb2, sb329, 1, cb1, sb331 # 5714
+convcbitvec 1, ci0, cb3 # 5715
+convint c2, ci0 # 5716
+addm s12, s16, c2 # 5717
+convint c6, ci0 # 5718
+mulm s8, s13, c6 # 5719
+subs s7, s12, s8 # 5720
+movs s8, s7 # 5721
+movs s18, s8 # 5722
+convcbitvec 1, ci0, cb2 # 5723
+convint c1, ci0 # 5724
+addm s21, s1, c1 # 5725
+convint c5, ci0 # 5726
+mulm s0, s5, c5 # 5727
+subs s3, s21, s0 # 5728
+movs s20, s3 # 5729
+adds s19, s18, s20 # 5730
+mulm s1, s19, c4 # 5731
+convcbitvec 1, ci0, cb1 # 5732
+convint c3, ci0 # 5733
+addm s15, s2, c3 # 5734
+convint c2, ci0 # 5735
+mulm s16, s9, c2 # 5736
+subs s13, s15, s16 # 5737
+movs s12, s13 # 5738
+shrsi s7, s14, 1 # 5739
+adds s8, s7, s12 # 5740
+subs s5, s8, s1 # 5741
+subml s0, s5, c7 # 5742
+convcbitvec 1, ci0, cb0 # 5743
+convint c6, ci0 # 5744
+addm s2, s4, c6 # 5745
+convint c1, ci0 # 5746
+mulm s4, s6, c1 # 5747
+subs s1, s2, s4 # 5748
+movs s18, s1 # 5749
+convcbitvec 1, ci0, cb7 # 5750
+convint c5, ci0 # 5751
+addm s21, s23, c5 # 5752
+convint c4, ci0 # 5753
+mulm s3, s22, c4 # 5754
+subs s20, s21, s3 # 5755
+movs s19, s20 # 5756
+adds s9, s18, s19 # 5757
+convcbitvec 1, ci0, cb6 # 5758
+convint c3, ci0 # 5759
+addm s14, s17, c3 # 5760
+mulsi s16, s17, 2 # 5761
+convint c2, ci0 # 5762
+mulm s15, s16, c2 # 5763
+subs s13, s14, s15 # 5764
+movs s12, s13 # 5765
+adds s7, s11, s12 # 5766
+shrsi s8, s10, 32 # 5767
+adds s5, s8, s9 # 5768
+ldi c1, 2 # 5769
+mulci c7, c1, 2147483647 # 5770
+addci c6, c7, 2 # 5771
+mulm s6, s7, c6 # 5772
+subs s4, s5, s6 # 5773
+subsi s3, s4, 1073741824 # 5774
+movs s2, s3 # 5775
+addm s1, s2, c0 # 5776
+muls 8, 1, s23, s0, s1, 1, s15, s2, s2 # 5777
+ldi c7, 2 # 5778
+mulci c3, c7, 2147483647 # 5779
+addci c2, c3, 4 # 5780
+mulci c1, c2, 2147483647 # 5781
+addci c6, c1, 2 # 5782
+addm s22, s23, c6 # 5783
+split 194, 3, s22, sb319, sb327, sb118, sb310, sb313, sb116, sb300, sb304, sb22, sb290, sb294, sb109, sb288, sb289, sb107, sb280, sb285, sb20, sb276, sb278, sb99, sb264, sb274, sb19, sb258, sb263, sb96, sb256, sb257, sb92, sb252, sb255, sb91, sb240, sb242, sb88, sb226, sb232, sb85, sb221, sb223, sb3, sb216, sb219, sb76, sb209, sb215, sb74, sb199, sb205, sb72, sb187, sb191, sb70, sb444, sb37, sb68, sb175, sb184, sb66, sb173, sb174, sb13, sb579, sb172, sb333, sb32, sb163, sb329, sb155, sb563, sb325, sb139, sb154, sb311, sb128, sb133, sb308, sb643, sb644, sb302, sb641, sb642, sb296, sb639, sb640, sb287, sb637, sb638, sb283, sb635, sb636, sb277, sb633, sb634, sb272, sb631, sb632, sb244, sb629, sb630, sb236, sb627, sb628, sb230, sb625, sb626, sb218, sb623, sb624, sb207, sb621, sb622, sb203, sb619, sb620, sb38, sb617, sb618, sb185, sb615, sb616, sb182, sb613, sb614, sb161, sb611, sb612, sb149, sb609, sb610, sb136, sb607, sb608, sb131, sb605, sb606, sb120, sb603, sb604, sb572, sb601, sb602, sb570, sb599, sb600, sb568, sb597, sb598, sb566, sb595, sb596, sb564, sb593, sb594, sb562, sb591, sb592, sb560, sb589, sb590, sb558, sb587, sb588, sb556, sb585, sb586, sb552, sb583, sb584, sb548, sb581, sb582, sb544, sb115, sb580, sb540, sb577, sb578, sb536, sb575, sb576, sb106, sb573, sb574, sb530, sb569, sb571, sb526, sb565, sb567, sb522 # 5784
+xors 4, 1, sb121, sb118, sb327 # 5785
+xors 4, 1, sb122, sb319, sb118 # 5786
+xors 4, 1, sb123, sb116, sb313 # 5787
+xors 4, 1, sb132, sb123, sb310 # 5788
+xors 4, 1, sb124, sb310, sb116 # 5789
+xors 4, 1, sb125, sb22, sb304 # 5790
+xors 4, 1, sb129, sb125, sb300 # 5791
+xors 4, 1, sb25, sb300, sb22 # 5792
+xors 4, 1, sb127, sb109, sb294 # 5793
+xors 4, 1, sb126, sb127, sb290 # 5794
+xors 4, 1, sb5, sb290, sb109 # 5795
+xors 4, 1, sb130, sb107, sb289 # 5796
+xors 4, 1, sb24, sb130, sb288 # 5797
+xors 4, 1, sb26, sb288, sb107 # 5798
+xors 4, 1, sb134, sb20, sb285 # 5799
+xors 4, 1, sb117, sb134, sb280 # 5800
+xors 4, 1, sb135, sb280, sb20 # 5801
+xors 4, 1, sb27, sb99, sb278 # 5802
+xors 4, 1, sb113, sb27, sb276 # 5803
+xors 4, 1, sb138, sb276, sb99 # 5804
+xors 4, 1, sb29, sb19, sb274 # 5805
+xors 4, 1, sb4, sb29, sb264 # 5806
+xors 4, 1, sb140, sb264, sb19 # 5807
+xors 4, 1, sb28, sb96, sb263 # 5808
+xors 4, 1, sb21, sb28, sb258 # 5809
+xors 4, 1, sb142, sb258, sb96 # 5810
+xors 4, 1, sb143, sb92, sb257 # 5811
+xors 4, 1, sb102, sb143, sb256 # 5812
+xors 4, 1, sb144, sb256, sb92 # 5813
+xors 4, 1, sb145, sb91, sb255 # 5814
+xors 4, 1, sb100, sb145, sb252 # 5815
+xors 4, 1, sb146, sb252, sb91 # 5816
+xors 4, 1, sb147, sb88, sb242 # 5817
+xors 4, 1, sb16, sb147, sb240 # 5818
+xors 4, 1, sb148, sb240, sb88 # 5819
+xors 4, 1, sb30, sb85, sb232 # 5820
+xors 4, 1, sb78, sb30, sb226 # 5821
+xors 4, 1, sb150, sb226, sb85 # 5822
+xors 4, 1, sb151, sb3, sb223 # 5823
+xors 4, 1, sb313, sb151, sb221 # 5824
+xors 4, 1, sb152, sb221, sb3 # 5825
+xors 4, 1, sb153, sb76, sb219 # 5826
+xors 4, 1, sb256, sb153, sb216 # 5827
+xors 4, 1, sb31, sb216, sb76 # 5828
+xors 4, 1, sb6, sb74, sb215 # 5829
+xors 4, 1, sb252, sb6, sb209 # 5830
+xors 4, 1, sb1, sb209, sb74 # 5831
+xors 4, 1, sb157, sb72, sb205 # 5832
+xors 4, 1, sb294, sb157, sb199 # 5833
+xors 4, 1, sb158, sb199, sb72 # 5834
+xors 4, 1, sb159, sb70, sb191 # 5835
+xors 4, 1, sb280, sb159, sb187 # 5836
+xors 4, 1, sb160, sb187, sb70 # 5837
+xors 4, 1, sb162, sb68, sb37 # 5838
+xors 4, 1, sb270, sb162, sb444 # 5839
+xors 4, 1, sb165, sb444, sb68 # 5840
+xors 4, 1, sb167, sb66, sb184 # 5841
+xors 4, 1, sb263, sb167, sb175 # 5842
+xors 4, 1, sb33, sb175, sb66 # 5843
+xors 4, 1, sb168, sb13, sb174 # 5844
+xors 4, 1, sb257, sb168, sb173 # 5845
+xors 4, 1, sb169, sb173, sb13 # 5846
+xors 4, 1, sb170, sb333, sb172 # 5847
+xors 4, 1, sb253, sb170, sb579 # 5848
+xors 4, 1, sb34, sb579, sb333 # 5849
+xors 4, 1, sb172, sb329, sb163 # 5850
+xors 4, 1, sb247, sb172, sb32 # 5851
+xors 4, 1, sb173, sb32, sb329 # 5852
+xors 4, 1, sb174, sb325, sb563 # 5853
+xors 4, 1, sb242, sb174, sb155 # 5854
+xors 4, 1, sb175, sb155, sb325 # 5855
+xors 4, 1, sb176, sb311, sb154 # 5856
+xors 4, 1, sb9, sb176, sb139 # 5857
+xors 4, 1, sb177, sb139, sb311 # 5858
+xors 4, 1, sb178, sb308, sb133 # 5859
+xors 4, 1, sb45, sb178, sb128 # 5860
+xors 4, 1, sb179, sb128, sb308 # 5861
+xors 4, 1, sb181, sb302, sb644 # 5862
+xors 4, 1, sb223, sb181, sb643 # 5863
+xors 4, 1, sb7, sb643, sb302 # 5864
+xors 4, 1, sb183, sb296, sb642 # 5865
+xors 4, 1, sb219, sb183, sb641 # 5866
+xors 4, 1, sb188, sb641, sb296 # 5867
+xors 4, 1, sb189, sb287, sb640 # 5868
+xors 4, 1, sb215, sb189, sb639 # 5869
+xors 4, 1, sb190, sb639, sb287 # 5870
+xors 4, 1, sb192, sb283, sb638 # 5871
+xors 4, 1, sb42, sb192, sb637 # 5872
+xors 4, 1, sb194, sb637, sb283 # 5873
+xors 4, 1, sb195, sb277, sb636 # 5874
+xors 4, 1, sb209, sb195, sb635 # 5875
+xors 4, 1, sb196, sb635, sb277 # 5876
+xors 4, 1, sb39, sb272, sb634 # 5877
+xors 4, 1, sb164, sb39, sb633 # 5878
+xors 4, 1, sb198, sb633, sb272 # 5879
+xors 4, 1, sb200, sb244, sb632 # 5880
+xors 4, 1, sb166, sb200, sb631 # 5881
+xors 4, 1, sb202, sb631, sb244 # 5882
+xors 4, 1, sb40, sb236, sb630 # 5883
+xors 4, 1, sb171, sb40, sb629 # 5884
+xors 4, 1, sb204, sb629, sb236 # 5885
+xors 4, 1, sb206, sb230, sb628 # 5886
+xors 4, 1, sb35, sb206, sb627 # 5887
+xors 4, 1, sb41, sb627, sb230 # 5888
+xors 4, 1, sb208, sb218, sb626 # 5889
+xors 4, 1, sb180, sb208, sb625 # 5890
+xors 4, 1, sb211, sb625, sb218 # 5891
+xors 4, 1, sb213, sb207, sb624 # 5892
+xors 4, 1, sb36, sb213, sb623 # 5893
+xors 4, 1, sb43, sb623, sb207 # 5894
+xors 4, 1, sb221, sb203, sb622 # 5895
+xors 4, 1, sb193, sb221, sb621 # 5896
+xors 4, 1, sb225, sb621, sb203 # 5897
+xors 4, 1, sb229, sb38, sb620 # 5898
+xors 4, 1, sb197, sb229, sb619 # 5899
+xors 4, 1, sb233, sb619, sb38 # 5900
+xors 4, 1, sb235, sb185, sb618 # 5901
+xors 4, 1, sb201, sb235, sb617 # 5902
+xors 4, 1, sb237, sb617, sb185 # 5903
+xors 4, 1, sb239, sb182, sb616 # 5904
+xors 4, 1, sb8, sb239, sb615 # 5905
+xors 4, 1, sb48, sb615, sb182 # 5906
+xors 4, 1, sb245, sb161, sb614 # 5907
+xors 4, 1, sb354, sb245, sb613 # 5908
+xors 4, 1, sb246, sb613, sb161 # 5909
+xors 4, 1, sb248, sb149, sb612 # 5910
+xors 4, 1, sb356, sb248, sb611 # 5911
+xors 4, 1, sb250, sb611, sb149 # 5912
+xors 4, 1, sb251, sb136, sb610 # 5913
+xors 4, 1, sb358, sb251, sb609 # 5914
+xors 4, 1, sb254, sb609, sb136 # 5915
+xors 4, 1, sb51, sb131, sb608 # 5916
+xors 4, 1, sb360, sb51, sb607 # 5917
+xors 4, 1, sb259, sb607, sb131 # 5918
+xors 4, 1, sb261, sb120, sb606 # 5919
+xors 4, 1, sb362, sb261, sb605 # 5920
+xors 4, 1, sb52, sb605, sb120 # 5921
+xors 4, 1, sb265, sb572, sb604 # 5922
+xors 4, 1, sb364, sb265, sb603 # 5923
+xors 4, 1, sb53, sb603, sb572 # 5924
+xors 4, 1, sb267, sb570, sb602 # 5925
+xors 4, 1, sb366, sb267, sb601 # 5926
+xors 4, 1, sb269, sb601, sb570 # 5927
+xors 4, 1, sb54, sb568, sb600 # 5928
+xors 4, 1, sb368, sb54, sb599 # 5929
+xors 4, 1, sb273, sb599, sb568 # 5930
+xors 4, 1, sb281, sb566, sb598 # 5931
+xors 4, 1, sb370, sb281, sb597 # 5932
+xors 4, 1, sb288, sb597, sb566 # 5933
+xors 4, 1, sb290, sb564, sb596 # 5934
+xors 4, 1, sb372, sb290, sb595 # 5935
+xors 4, 1, sb58, sb595, sb564 # 5936
+xors 4, 1, sb295, sb562, sb594 # 5937
+xors 4, 1, sb374, sb295, sb593 # 5938
+xors 4, 1, sb59, sb593, sb562 # 5939
+xors 4, 1, sb301, sb560, sb592 # 5940
+xors 4, 1, sb376, sb301, sb591 # 5941
+xors 4, 1, sb60, sb591, sb560 # 5942
+xors 4, 1, sb305, sb558, sb590 # 5943
+xors 4, 1, sb378, sb305, sb589 # 5944
+xors 4, 1, sb12, sb589, sb558 # 5945
+xors 4, 1, sb62, sb556, sb588 # 5946
+xors 4, 1, sb380, sb62, sb587 # 5947
+xors 4, 1, sb314, sb587, sb556 # 5948
+xors 4, 1, sb315, sb552, sb586 # 5949
+xors 4, 1, sb382, sb315, sb585 # 5950
+xors 4, 1, sb317, sb585, sb552 # 5951
+xors 4, 1, sb318, sb548, sb584 # 5952
+xors 4, 1, sb384, sb318, sb583 # 5953
+xors 4, 1, sb321, sb583, sb548 # 5954
+xors 4, 1, sb353, sb544, sb582 # 5955
+xors 4, 1, sb386, sb353, sb581 # 5956
+xors 4, 1, sb355, sb581, sb544 # 5957
+xors 4, 1, sb357, sb540, sb580 # 5958
+xors 4, 1, sb388, sb357, sb115 # 5959
+xors 4, 1, sb359, sb115, sb540 # 5960
+xors 4, 1, sb361, sb536, sb578 # 5961
+xors 4, 1, sb390, sb361, sb577 # 5962
+xors 4, 1, sb363, sb577, sb536 # 5963
+xors 4, 1, sb365, sb106, sb576 # 5964
+xors 4, 1, sb392, sb365, sb575 # 5965
+xors 4, 1, sb367, sb575, sb106 # 5966
+xors 4, 1, sb369, sb530, sb574 # 5967
+xors 4, 1, sb394, sb369, sb573 # 5968
+xors 4, 1, sb371, sb573, sb530 # 5969
+xors 4, 1, sb373, sb526, sb571 # 5970
+xors 4, 1, sb396, sb373, sb569 # 5971
+xors 4, 1, sb375, sb569, sb526 # 5972
+xors 4, 1, sb377, sb522, sb567 # 5973
+xors 4, 1, sb398, sb377, sb565 # 5974
+xors 4, 1, sb379, sb565, sb522 # 5975
+dabit s21, sb191 # 5976
+mulsi s19, s21, 2 # 5977
+dabit s20, sb276 # 5978
+mulsi s18, s20, 2 # 5979
+dabit s23, sb32 # 5980
+mulsi s5, s23, 2 # 5981
+dabit s17, sb103 # 5982
+mulsi s12, s17, 2 # 5983
+shrsi s16, s22, 31 # 5984
+ldi c6, 4 # 5985
+mulci c4, c6, 2147483647 # 5986
+addci c5, c4, 4 # 5987
+ldi c3, 2 # 5988
+mulci c7, c3, 2147483647 # 5989
+addci c4, c7, 2 # 5990
+ldi c3, 2 # 5991
+mulci c2, c3, 2147483647 # 5992
+addci c3, c2, 2 # 5993
+dabit s14, sb141 # 5994
+mulsi s9, s14, 2 # 5995
+dabit s13, sb137 # 5996
+mulsi s10, s13, 2 # 5997
+dabit s11, sb112 # 5998
+mulsi s0, s11, 2 # 5999
+ldi c1, 2 # 6000
+mulci c7, c1, 2147483647 # 6001
+addci c6, c7, 4 # 6002
+mulci c2, c6, 2147483647 # 6003
+addci c1, c2, 2 # 6004
+ldi c7, 1 # 6005
+mulci c6, c7, 2147483647 # 6006
+addci c2, c6, 1 # 6007
+ldi c6, 1 # 6008
+mulci c7, c6, 2147483647 # 6009
+addci c6, c7, 1 # 6010
+addm s8, s15, c6 # 6011
+ldi c6, 1 # 6012
+mulci c7, c6, 2147483647 # 6013
+addci c6, c7, 2 # 6014
+mulci c7, c6, 2147483647 # 6015
+addci c6, c7, 1 # 6016
+addm s4, s8, c6 # 6017
+split 194, 3, s4, sb559, sb561, sb516, sb519, sb557, sb512, sb111, sb555, sb508, sb110, sb554, sb504, sb551, sb553, sb500, sb549, sb550, sb496, sb546, sb547, sb98, sb108, sb545, sb491, sb542, sb543, sb489, sb535, sb541, sb487, sb538, sb539, sb485, sb534, sb537, sb483, sb532, sb533, sb481, sb104, sb531, sb479, sb528, sb529, sb94, sb520, sb527, sb444, sb524, sb525, sb440, sb521, sb523, sb87, sb517, sb518, sb434, sb514, sb515, sb430, sb511, sb513, sb426, sb509, sb510, sb84, sb506, sb507, sb420, sb495, sb505, sb416, sb502, sb503, sb81, sb493, sb501, sb351, sb498, sb499, sb349, sb494, sb497, sb347, sb488, sb490, sb345, sb97, sb492, sb343, sb482, sb486, sb341, sb93, sb480, sb339, sb89, sb18, sb337, sb438, sb442, sb335, sb432, sb436, sb332, sb424, sb428, sb328, sb418, sb422, sb324, sb82, sb83, sb320, sb484, sb80, sb316, sb350, sb478, sb323, sb69, sb352, sb309, sb348, sb95, sb306, sb344, sb346, sb303, sb67, sb342, sb298, sb338, sb340, sb293, sb334, sb336, sb291, sb65, sb330, sb286, sb64, sb326, sb56, sb63, sb322, sb2, sb61, sb312, sb282, sb299, sb307, sb275, sb292, sb297, sb268, sb284, sb57, sb262, sb279, sb11, sb10, sb271, sb55, sb249, sb260, sb266, sb243, sb49, sb50, sb238, sb47, sb241, sb234, sb228, sb46, sb231, sb222, sb224, sb227, sb212, sb217, sb44, sb23, sb119, sb220, sb105, sb114, sb214, sb90, sb101, sb210 # 6018
+xors 4, 1, sb381, sb516, sb561 # 6019
+xors 4, 1, sb383, sb559, sb516 # 6020
+xors 4, 1, sb385, sb512, sb557 # 6021
+xors 4, 1, sb477, sb385, sb519 # 6022
+xors 4, 1, sb387, sb519, sb512 # 6023
+xors 4, 1, sb77, sb508, sb555 # 6024
+xors 4, 1, sb475, sb77, sb111 # 6025
+xors 4, 1, sb389, sb111, sb508 # 6026
+xors 4, 1, sb391, sb504, sb554 # 6027
+xors 4, 1, sb473, sb391, sb110 # 6028
+xors 4, 1, sb393, sb110, sb504 # 6029
+xors 4, 1, sb395, sb500, sb553 # 6030
+xors 4, 1, sb471, sb395, sb551 # 6031
+xors 4, 1, sb397, sb551, sb500 # 6032
+xors 4, 1, sb399, sb496, sb550 # 6033
+xors 4, 1, sb469, sb399, sb549 # 6034
+xors 4, 1, sb400, sb549, sb496 # 6035
+xors 4, 1, sb401, sb98, sb547 # 6036
+xors 4, 1, sb467, sb401, sb546 # 6037
+xors 4, 1, sb402, sb546, sb98 # 6038
+xors 4, 1, sb403, sb491, sb545 # 6039
+xors 4, 1, sb465, sb403, sb108 # 6040
+xors 4, 1, sb404, sb108, sb491 # 6041
+xors 4, 1, sb405, sb489, sb543 # 6042
+xors 4, 1, sb463, sb405, sb542 # 6043
+xors 4, 1, sb406, sb542, sb489 # 6044
+xors 4, 1, sb407, sb487, sb541 # 6045
+xors 4, 1, sb461, sb407, sb535 # 6046
+xors 4, 1, sb409, sb535, sb487 # 6047
+xors 4, 1, sb410, sb485, sb539 # 6048
+xors 4, 1, sb459, sb410, sb538 # 6049
+xors 4, 1, sb411, sb538, sb485 # 6050
+xors 4, 1, sb412, sb483, sb537 # 6051
+xors 4, 1, sb457, sb412, sb534 # 6052
+xors 4, 1, sb408, sb534, sb483 # 6053
+xors 4, 1, sb414, sb481, sb533 # 6054
+xors 4, 1, sb455, sb414, sb532 # 6055
+xors 4, 1, sb415, sb532, sb481 # 6056
+xors 4, 1, sb413, sb479, sb531 # 6057
+xors 4, 1, sb453, sb413, sb104 # 6058
+xors 4, 1, sb446, sb104, sb479 # 6059
+xors 4, 1, sb448, sb94, sb529 # 6060
+xors 4, 1, sb451, sb448, sb528 # 6061
+xors 4, 1, sb450, sb528, sb94 # 6062
+xors 4, 1, sb452, sb444, sb527 # 6063
+xors 4, 1, sb449, sb452, sb520 # 6064
+xors 4, 1, sb454, sb520, sb444 # 6065
+xors 4, 1, sb456, sb440, sb525 # 6066
+xors 4, 1, sb447, sb456, sb524 # 6067
+xors 4, 1, sb458, sb524, sb440 # 6068
+xors 4, 1, sb460, sb87, sb523 # 6069
+xors 4, 1, sb445, sb460, sb521 # 6070
+xors 4, 1, sb462, sb521, sb87 # 6071
+xors 4, 1, sb464, sb434, sb518 # 6072
+xors 4, 1, sb443, sb464, sb517 # 6073
+xors 4, 1, sb466, sb517, sb434 # 6074
+xors 4, 1, sb468, sb430, sb515 # 6075
+xors 4, 1, sb441, sb468, sb514 # 6076
+xors 4, 1, sb470, sb514, sb430 # 6077
+xors 4, 1, sb472, sb426, sb513 # 6078
+xors 4, 1, sb439, sb472, sb511 # 6079
+xors 4, 1, sb474, sb511, sb426 # 6080
+xors 4, 1, sb476, sb84, sb510 # 6081
+xors 4, 1, sb437, sb476, sb509 # 6082
+xors 4, 1, sb520, sb509, sb84 # 6083
+xors 4, 1, sb104, sb420, sb507 # 6084
+xors 4, 1, sb435, sb104, sb506 # 6085
+xors 4, 1, sb111, sb506, sb420 # 6086
+xors 4, 1, sb155, sb416, sb505 # 6087
+xors 4, 1, sb433, sb155, sb495 # 6088
+xors 4, 1, sb156, sb495, sb416 # 6089
+xors 4, 1, sb186, sb81, sb503 # 6090
+xors 4, 1, sb431, sb186, sb502 # 6091
+xors 4, 1, sb187, sb502, sb81 # 6092
+xors 4, 1, sb255, sb351, sb501 # 6093
+xors 4, 1, sb429, sb255, sb493 # 6094
+xors 4, 1, sb258, sb493, sb351 # 6095
+xors 4, 1, sb0, sb349, sb499 # 6096
+xors 4, 1, sb427, sb0, sb498 # 6097
+xors 4, 1, sb15, sb498, sb349 # 6098
+xors 4, 1, sb79, sb347, sb497 # 6099
+xors 4, 1, sb425, sb79, sb494 # 6100
+xors 4, 1, sb86, sb494, sb347 # 6101
+xors 4, 1, sb573, sb345, sb490 # 6102
+xors 4, 1, sb423, sb573, sb488 # 6103
+xors 4, 1, sb574, sb488, sb345 # 6104
+xors 4, 1, sb575, sb343, sb492 # 6105
+xors 4, 1, sb421, sb575, sb97 # 6106
+xors 4, 1, sb576, sb97, sb343 # 6107
+xors 4, 1, sb577, sb341, sb486 # 6108
+xors 4, 1, sb419, sb577, sb482 # 6109
+xors 4, 1, sb578, sb482, sb341 # 6110
+xors 4, 1, sb579, sb339, sb480 # 6111
+xors 4, 1, sb417, sb579, sb93 # 6112
+xors 4, 1, sb580, sb93, sb339 # 6113
+xors 4, 1, sb581, sb337, sb18 # 6114
+xors 4, 1, sb493, sb581, sb89 # 6115
+xors 4, 1, sb582, sb89, sb337 # 6116
+xors 4, 1, sb583, sb335, sb442 # 6117
+xors 4, 1, sb495, sb583, sb438 # 6118
+xors 4, 1, sb584, sb438, sb335 # 6119
+xors 4, 1, sb585, sb332, sb436 # 6120
+xors 4, 1, sb497, sb585, sb432 # 6121
+xors 4, 1, sb586, sb432, sb332 # 6122
+xors 4, 1, sb587, sb328, sb428 # 6123
+xors 4, 1, sb499, sb587, sb424 # 6124
+xors 4, 1, sb588, sb424, sb328 # 6125
+xors 4, 1, sb589, sb324, sb422 # 6126
+xors 4, 1, sb501, sb589, sb418 # 6127
+xors 4, 1, sb590, sb418, sb324 # 6128
+xors 4, 1, sb591, sb320, sb83 # 6129
+xors 4, 1, sb503, sb591, sb82 # 6130
+xors 4, 1, sb592, sb82, sb320 # 6131
+xors 4, 1, sb593, sb316, sb80 # 6132
+xors 4, 1, sb505, sb593, sb484 # 6133
+xors 4, 1, sb594, sb484, sb316 # 6134
+xors 4, 1, sb595, sb323, sb478 # 6135
+xors 4, 1, sb507, sb595, sb350 # 6136
+xors 4, 1, sb596, sb350, sb323 # 6137
+xors 4, 1, sb597, sb309, sb352 # 6138
+xors 4, 1, sb509, sb597, sb69 # 6139
+xors 4, 1, sb598, sb69, sb309 # 6140
+xors 4, 1, sb599, sb306, sb95 # 6141
+xors 4, 1, sb511, sb599, sb348 # 6142
+xors 4, 1, sb600, sb348, sb306 # 6143
+xors 4, 1, sb601, sb303, sb346 # 6144
+xors 4, 1, sb513, sb601, sb344 # 6145
+xors 4, 1, sb602, sb344, sb303 # 6146
+xors 4, 1, sb603, sb298, sb342 # 6147
+xors 4, 1, sb515, sb603, sb67 # 6148
+xors 4, 1, sb604, sb67, sb298 # 6149
+xors 4, 1, sb605, sb293, sb340 # 6150
+xors 4, 1, sb517, sb605, sb338 # 6151
+xors 4, 1, sb606, sb338, sb293 # 6152
+xors 4, 1, sb607, sb291, sb336 # 6153
+xors 4, 1, sb519, sb607, sb334 # 6154
+xors 4, 1, sb608, sb334, sb291 # 6155
+xors 4, 1, sb609, sb286, sb330 # 6156
+xors 4, 1, sb521, sb609, sb65 # 6157
+xors 4, 1, sb610, sb65, sb286 # 6158
+xors 4, 1, sb611, sb56, sb326 # 6159
+xors 4, 1, sb523, sb611, sb64 # 6160
+xors 4, 1, sb612, sb64, sb56 # 6161
+xors 4, 1, sb613, sb2, sb322 # 6162
+xors 4, 1, sb525, sb613, sb63 # 6163
+xors 4, 1, sb614, sb63, sb2 # 6164
+xors 4, 1, sb615, sb282, sb312 # 6165
+xors 4, 1, sb527, sb615, sb61 # 6166
+xors 4, 1, sb616, sb61, sb282 # 6167
+xors 4, 1, sb617, sb275, sb307 # 6168
+xors 4, 1, sb529, sb617, sb299 # 6169
+xors 4, 1, sb618, sb299, sb275 # 6170
+xors 4, 1, sb619, sb268, sb297 # 6171
+xors 4, 1, sb531, sb619, sb292 # 6172
+xors 4, 1, sb620, sb292, sb268 # 6173
+xors 4, 1, sb621, sb262, sb57 # 6174
+xors 4, 1, sb533, sb621, sb284 # 6175
+xors 4, 1, sb622, sb284, sb262 # 6176
+xors 4, 1, sb623, sb10, sb11 # 6177
+xors 4, 1, sb535, sb623, sb279 # 6178
+xors 4, 1, sb624, sb279, sb10 # 6179
+xors 4, 1, sb625, sb249, sb55 # 6180
+xors 4, 1, sb537, sb625, sb271 # 6181
+xors 4, 1, sb626, sb271, sb249 # 6182
+xors 4, 1, sb627, sb243, sb266 # 6183
+xors 4, 1, sb539, sb627, sb260 # 6184
+xors 4, 1, sb628, sb260, sb243 # 6185
+xors 4, 1, sb629, sb238, sb50 # 6186
+xors 4, 1, sb541, sb629, sb49 # 6187
+xors 4, 1, sb630, sb49, sb238 # 6188
+xors 4, 1, sb631, sb234, sb241 # 6189
+xors 4, 1, sb543, sb631, sb47 # 6190
+xors 4, 1, sb632, sb47, sb234 # 6191
+xors 4, 1, sb633, sb231, sb46 # 6192
+xors 4, 1, sb545, sb633, sb228 # 6193
+xors 4, 1, sb634, sb228, sb231 # 6194
+xors 4, 1, sb635, sb227, sb224 # 6195
+xors 4, 1, sb547, sb635, sb222 # 6196
+xors 4, 1, sb636, sb222, sb227 # 6197
+xors 4, 1, sb637, sb44, sb217 # 6198
+xors 4, 1, sb549, sb637, sb212 # 6199
+xors 4, 1, sb638, sb212, sb44 # 6200
+xors 4, 1, sb639, sb220, sb119 # 6201
+xors 4, 1, sb551, sb639, sb23 # 6202
+xors 4, 1, sb640, sb23, sb220 # 6203
+xors 4, 1, sb641, sb214, sb114 # 6204
+xors 4, 1, sb553, sb641, sb105 # 6205
+xors 4, 1, sb642, sb105, sb214 # 6206
+xors 4, 1, sb643, sb210, sb101 # 6207
+xors 4, 1, sb555, sb643, sb90 # 6208
+xors 4, 1, sb644, sb90, sb210 # 6209
+ands 512, 1, sb119, sb121, sb122, 1, sb23, sb123, sb124, 1, sb114, sb125, sb25, 1, sb110, sb127, sb5, 1, sb108, sb130, sb26, 1, sb105, sb134, sb135, 1, sb101, sb27, sb138, 1, sb97, sb29, sb140, 1, sb95, sb28, sb142, 1, sb93, sb143, sb144, 1, sb18, sb145, sb146, 1, sb90, sb147, sb148, 1, sb17, sb30, sb150, 1, sb83, sb151, sb152, 1, sb80, sb153, sb31, 1, sb75, sb6, sb1, 1, sb73, sb157, sb158, 1, sb14, sb159, sb160, 1, sb69, sb162, sb165, 1, sb67, sb167, sb33, 1, sb65, sb168, sb169, 1, sb71, sb170, sb34, 1, sb331, sb172, sb173, 1, sb327, sb174, sb175, 1, sb319, sb176, sb177, 1, sb310, sb178, sb179, 1, sb304, sb181, sb7, 1, sb300, sb183, sb188, 1, sb289, sb189, sb190, 1, sb285, sb192, sb194, 1, sb278, sb195, sb196, 1, sb274, sb39, sb198, 1, sb264, sb200, sb202, 1, sb240, sb40, sb204, 1, sb232, sb206, sb41, 1, sb226, sb208, sb211, 1, sb216, sb213, sb43, 1, sb205, sb221, sb225, 1, sb199, sb229, sb233, 1, sb37, sb235, sb237, 1, sb184, sb239, sb48, 1, sb163, sb245, sb246, 1, sb154, sb248, sb250, 1, sb139, sb251, sb254, 1, sb133, sb51, sb259, 1, sb128, sb261, sb52, 1, sb115, sb265, sb53, 1, sb571, sb267, sb269, 1, sb569, sb54, sb273, 1, sb567, sb281, sb288, 1, sb565, sb290, sb58, 1, sb563, sb295, sb59, 1, sb561, sb301, sb60, 1, sb559, sb305, sb12, 1, sb557, sb62, sb314, 1, sb554, sb315, sb317, 1, sb550, sb318, sb321, 1, sb546, sb353, sb355, 1, sb542, sb357, sb359, 1, sb538, sb361, sb363, 1, sb534, sb365, sb367, 1, sb532, sb369, sb371, 1, sb528, sb373, sb375, 1, sb524, sb377, sb379, 1, sb518, sb381, sb383, 1, sb514, sb385, sb387, 1, sb510, sb77, sb389, 1, sb506, sb391, sb393, 1, sb502, sb395, sb397, 1, sb498, sb399, sb400, 1, sb494, sb401, sb402, 1, sb492, sb403, sb404, 1, sb490, sb405, sb406, 1, sb488, sb407, sb409, 1, sb486, sb410, sb411, 1, sb484, sb412, sb408, 1, sb482, sb414, sb415, 1, sb480, sb413, sb446, 1, sb478, sb448, sb450, 1, sb89, sb452, sb454, 1, sb442, sb456, sb458, 1, sb438, sb460, sb462, 1, sb436, sb464, sb466, 1, sb432, sb468, sb470, 1, sb428, sb472, sb474, 1, sb424, sb476, sb520, 1, sb422, sb104, sb111, 1, sb418, sb155, sb156, 1, sb82, sb186, sb187, 1, sb352, sb255, sb258, 1, sb350, sb0, sb15, 1, sb348, sb79, sb86, 1, sb346, sb573, sb574, 1, sb344, sb575, sb576, 1, sb342, sb577, sb578, 1, sb340, sb579, sb580, 1, sb338, sb581, sb582, 1, sb336, sb583, sb584, 1, sb334, sb585, sb586, 1, sb330, sb587, sb588, 1, sb326, sb589, sb590, 1, sb64, sb591, sb592, 1, sb63, sb593, sb594, 1, sb322, sb595, sb596, 1, sb312, sb597, sb598, 1, sb61, sb599, sb600, 1, sb307, sb601, sb602, 1, sb299, sb603, sb604, 1, sb297, sb605, sb606, 1, sb292, sb607, sb608, 1, sb57, sb609, sb610, 1, sb284, sb611, sb612, 1, sb11, sb613, sb614, 1, sb279, sb615, sb616, 1, sb55, sb617, sb618, 1, sb271, sb619, sb620, 1, sb266, sb621, sb622, 1, sb260, sb623, sb624, 1, sb50, sb625, sb626, 1, sb49, sb627, sb628, 1, sb241, sb629, sb630, 1, sb47, sb631, sb632, 1, sb46, sb633, sb634, 1, sb228, sb635, sb636, 1, sb224, sb637, sb638, 1, sb222, sb639, sb640, 1, sb217, sb641, sb642, 1, sb212, sb643, sb644 # 6210
+xors 4, 1, sb5, sb118, sb119 # 6211
+xors 4, 1, sb127, sb116, sb23 # 6212
+xors 4, 1, sb160, sb127, sb129 # 6213
+xors 4, 1, sb123, sb22, sb114 # 6214
+xors 4, 1, sb273, sb123, sb126 # 6215
+xors 4, 1, sb119, sb109, sb110 # 6216
+xors 4, 1, sb157, sb119, sb24 # 6217
+xors 4, 1, sb116, sb107, sb108 # 6218
+xors 4, 1, sb269, sb116, sb117 # 6219
+xors 4, 1, sb111, sb20, sb105 # 6220
+xors 4, 1, sb0, sb111, sb113 # 6221
+xors 4, 1, sb105, sb99, sb101 # 6222
+xors 4, 1, sb53, sb105, sb4 # 6223
+xors 4, 1, sb104, sb19, sb97 # 6224
+xors 4, 1, sb156, sb104, sb21 # 6225
+xors 4, 1, sb101, sb96, sb95 # 6226
+xors 4, 1, sb265, sb101, sb102 # 6227
+xors 4, 1, sb86, sb92, sb93 # 6228
+xors 4, 1, sb155, sb86, sb100 # 6229
+xors 4, 1, sb79, sb91, sb18 # 6230
+xors 4, 1, sb52, sb79, sb16 # 6231
+xors 4, 1, sb15, sb88, sb90 # 6232
+xors 4, 1, sb152, sb15, sb78 # 6233
+xors 4, 1, sb258, sb85, sb17 # 6234
+xors 4, 1, sb259, sb258, sb313 # 6235
+xors 4, 1, sb255, sb3, sb83 # 6236
+xors 4, 1, sb30, sb255, sb256 # 6237
+xors 4, 1, sb186, sb76, sb80 # 6238
+xors 4, 1, sb254, sb186, sb252 # 6239
+xors 4, 1, sb281, sb74, sb75 # 6240
+xors 4, 1, sb151, sb281, sb294 # 6241
+xors 4, 1, sb54, sb72, sb73 # 6242
+xors 4, 1, sb250, sb54, sb280 # 6243
+xors 4, 1, sb267, sb70, sb14 # 6244
+xors 4, 1, sb29, sb267, sb270 # 6245
+xors 4, 1, sb261, sb68, sb69 # 6246
+xors 4, 1, sb248, sb261, sb263 # 6247
+xors 4, 1, sb51, sb66, sb67 # 6248
+xors 4, 1, sb142, sb51, sb257 # 6249
+xors 4, 1, sb251, sb13, sb65 # 6250
+xors 4, 1, sb245, sb251, sb253 # 6251
+xors 4, 1, sb246, sb333, sb71 # 6252
+xors 4, 1, sb140, sb246, sb247 # 6253
+xors 4, 1, sb233, sb329, sb331 # 6254
+xors 4, 1, sb48, sb233, sb242 # 6255
+xors 4, 1, sb229, sb325, sb327 # 6256
+xors 4, 1, sb27, sb229, sb9 # 6257
+xors 4, 1, sb225, sb311, sb319 # 6258
+xors 4, 1, sb239, sb225, sb45 # 6259
+xors 4, 1, sb221, sb308, sb310 # 6260
+xors 4, 1, sb135, sb221, sb223 # 6261
+xors 4, 1, sb43, sb302, sb304 # 6262
+xors 4, 1, sb237, sb43, sb219 # 6263
+xors 4, 1, sb213, sb296, sb300 # 6264
+xors 4, 1, sb134, sb213, sb215 # 6265
+xors 4, 1, sb211, sb287, sb289 # 6266
+xors 4, 1, sb235, sb211, sb42 # 6267
+xors 4, 1, sb41, sb283, sb285 # 6268
+xors 4, 1, sb187, sb41, sb209 # 6269
+xors 4, 1, sb165, sb277, sb278 # 6270
+xors 4, 1, sb138, sb276, sb165 # 6271
+xors 4, 1, sb400, sb164, sb165 # 6272
+xors 4, 1, sb170, sb272, sb274 # 6273
+xors 4, 1, sb288, sb166, sb170 # 6274
+xors 4, 1, sb34, sb244, sb264 # 6275
+xors 4, 1, sb401, sb171, sb34 # 6276
+xors 4, 1, sb178, sb236, sb240 # 6277
+xors 4, 1, sb290, sb35, sb178 # 6278
+xors 4, 1, sb181, sb230, sb232 # 6279
+xors 4, 1, sb402, sb180, sb181 # 6280
+xors 4, 1, sb189, sb218, sb226 # 6281
+xors 4, 1, sb58, sb36, sb189 # 6282
+xors 4, 1, sb195, sb207, sb216 # 6283
+xors 4, 1, sb403, sb193, sb195 # 6284
+xors 4, 1, sb39, sb203, sb205 # 6285
+xors 4, 1, sb295, sb197, sb39 # 6286
+xors 4, 1, sb202, sb38, sb199 # 6287
+xors 4, 1, sb404, sb201, sb202 # 6288
+xors 4, 1, sb353, sb185, sb37 # 6289
+xors 4, 1, sb59, sb8, sb353 # 6290
+xors 4, 1, sb355, sb182, sb184 # 6291
+xors 4, 1, sb405, sb354, sb355 # 6292
+xors 4, 1, sb357, sb161, sb163 # 6293
+xors 4, 1, sb301, sb356, sb357 # 6294
+xors 4, 1, sb359, sb149, sb154 # 6295
+xors 4, 1, sb406, sb358, sb359 # 6296
+xors 4, 1, sb361, sb136, sb139 # 6297
+xors 4, 1, sb60, sb360, sb361 # 6298
+xors 4, 1, sb363, sb131, sb133 # 6299
+xors 4, 1, sb407, sb362, sb363 # 6300
+xors 4, 1, sb365, sb120, sb128 # 6301
+xors 4, 1, sb305, sb364, sb365 # 6302
+xors 4, 1, sb367, sb572, sb115 # 6303
+xors 4, 1, sb408, sb366, sb367 # 6304
+xors 4, 1, sb369, sb570, sb571 # 6305
+xors 4, 1, sb12, sb368, sb369 # 6306
+xors 4, 1, sb371, sb568, sb569 # 6307
+xors 4, 1, sb409, sb370, sb371 # 6308
+xors 4, 1, sb373, sb566, sb567 # 6309
+xors 4, 1, sb315, sb372, sb373 # 6310
+xors 4, 1, sb375, sb564, sb565 # 6311
+xors 4, 1, sb410, sb374, sb375 # 6312
+xors 4, 1, sb377, sb562, sb563 # 6313
+xors 4, 1, sb317, sb376, sb377 # 6314
+xors 4, 1, sb379, sb560, sb561 # 6315
+xors 4, 1, sb411, sb378, sb379 # 6316
+xors 4, 1, sb381, sb558, sb559 # 6317
+xors 4, 1, sb62, sb380, sb381 # 6318
+xors 4, 1, sb383, sb556, sb557 # 6319
+xors 4, 1, sb412, sb382, sb383 # 6320
+xors 4, 1, sb385, sb552, sb554 # 6321
+xors 4, 1, sb314, sb384, sb385 # 6322
+xors 4, 1, sb387, sb548, sb550 # 6323
+xors 4, 1, sb413, sb386, sb387 # 6324
+xors 4, 1, sb389, sb544, sb546 # 6325
+xors 4, 1, sb321, sb388, sb389 # 6326
+xors 4, 1, sb391, sb540, sb542 # 6327
+xors 4, 1, sb414, sb390, sb391 # 6328
+xors 4, 1, sb393, sb536, sb538 # 6329
+xors 4, 1, sb318, sb392, sb393 # 6330
+xors 4, 1, sb395, sb106, sb534 # 6331
+xors 4, 1, sb415, sb394, sb395 # 6332
+xors 4, 1, sb397, sb530, sb532 # 6333
+xors 4, 1, sb77, sb396, sb397 # 6334
+xors 4, 1, sb399, sb526, sb528 # 6335
+xors 4, 1, sb167, sb398, sb399 # 6336
+xors 4, 1, sb520, sb522, sb524 # 6337
+xors 4, 1, sb147, sb103, sb520 # 6338
+xors 4, 1, sb476, sb516, sb518 # 6339
+xors 4, 1, sb474, sb512, sb514 # 6340
+xors 4, 1, sb472, sb508, sb510 # 6341
+xors 4, 1, sb470, sb504, sb506 # 6342
+xors 4, 1, sb468, sb500, sb502 # 6343
+xors 4, 1, sb466, sb496, sb498 # 6344
+xors 4, 1, sb464, sb98, sb494 # 6345
+xors 4, 1, sb462, sb491, sb492 # 6346
+xors 4, 1, sb460, sb489, sb490 # 6347
+xors 4, 1, sb458, sb487, sb488 # 6348
+xors 4, 1, sb456, sb485, sb486 # 6349
+xors 4, 1, sb454, sb483, sb484 # 6350
+xors 4, 1, sb452, sb481, sb482 # 6351
+xors 4, 1, sb450, sb479, sb480 # 6352
+xors 4, 1, sb448, sb94, sb478 # 6353
+xors 4, 1, sb446, sb444, sb89 # 6354
+xors 4, 1, sb444, sb440, sb442 # 6355
+xors 4, 1, sb442, sb87, sb438 # 6356
+xors 4, 1, sb440, sb434, sb436 # 6357
+xors 4, 1, sb438, sb430, sb432 # 6358
+xors 4, 1, sb436, sb426, sb428 # 6359
+xors 4, 1, sb434, sb84, sb424 # 6360
+xors 4, 1, sb432, sb420, sb422 # 6361
+xors 4, 1, sb430, sb416, sb418 # 6362
+xors 4, 1, sb428, sb81, sb82 # 6363
+xors 4, 1, sb426, sb351, sb352 # 6364
+xors 4, 1, sb424, sb349, sb350 # 6365
+xors 4, 1, sb422, sb347, sb348 # 6366
+xors 4, 1, sb420, sb345, sb346 # 6367
+xors 4, 1, sb418, sb343, sb344 # 6368
+xors 4, 1, sb416, sb341, sb342 # 6369
+xors 4, 1, sb494, sb339, sb340 # 6370
+xors 4, 1, sb496, sb337, sb338 # 6371
+xors 4, 1, sb498, sb335, sb336 # 6372
+xors 4, 1, sb500, sb332, sb334 # 6373
+xors 4, 1, sb502, sb328, sb330 # 6374
+xors 4, 1, sb504, sb324, sb326 # 6375
+xors 4, 1, sb506, sb320, sb64 # 6376
+xors 4, 1, sb508, sb316, sb63 # 6377
+xors 4, 1, sb510, sb323, sb322 # 6378
+xors 4, 1, sb512, sb309, sb312 # 6379
+xors 4, 1, sb514, sb306, sb61 # 6380
+xors 4, 1, sb516, sb303, sb307 # 6381
+xors 4, 1, sb518, sb298, sb299 # 6382
+xors 4, 1, sb520, sb293, sb297 # 6383
+xors 4, 1, sb522, sb291, sb292 # 6384
+xors 4, 1, sb524, sb286, sb57 # 6385
+xors 4, 1, sb526, sb56, sb284 # 6386
+xors 4, 1, sb528, sb2, sb11 # 6387
+xors 4, 1, sb530, sb282, sb279 # 6388
+xors 4, 1, sb532, sb275, sb55 # 6389
+xors 4, 1, sb534, sb268, sb271 # 6390
+xors 4, 1, sb536, sb262, sb266 # 6391
+xors 4, 1, sb538, sb10, sb260 # 6392
+xors 4, 1, sb540, sb249, sb50 # 6393
+xors 4, 1, sb542, sb243, sb49 # 6394
+xors 4, 1, sb544, sb238, sb241 # 6395
+xors 4, 1, sb546, sb234, sb47 # 6396
+xors 4, 1, sb548, sb231, sb46 # 6397
+xors 4, 1, sb550, sb227, sb228 # 6398
+xors 4, 1, sb552, sb44, sb224 # 6399
+xors 4, 1, sb554, sb220, sb222 # 6400
+xors 4, 1, sb556, sb214, sb217 # 6401
+xors 4, 1, sb153, sb210, sb212 # 6402
+xors 4, 1, sb115, sb416, sb417 # 6403
+xors 4, 1, sb478, sb418, sb419 # 6404
+xors 4, 1, sb128, sb420, sb421 # 6405
+xors 4, 1, sb479, sb422, sb423 # 6406
+xors 4, 1, sb133, sb424, sb425 # 6407
+xors 4, 1, sb480, sb426, sb427 # 6408
+xors 4, 1, sb139, sb428, sb429 # 6409
+xors 4, 1, sb481, sb430, sb431 # 6410
+xors 4, 1, sb154, sb432, sb433 # 6411
+xors 4, 1, sb482, sb434, sb435 # 6412
+xors 4, 1, sb163, sb436, sb437 # 6413
+xors 4, 1, sb483, sb438, sb439 # 6414
+xors 4, 1, sb184, sb440, sb441 # 6415
+xors 4, 1, sb484, sb442, sb443 # 6416
+xors 4, 1, sb38, sb444, sb445 # 6417
+xors 4, 1, sb485, sb446, sb447 # 6418
+xors 4, 1, sb207, sb448, sb449 # 6419
+xors 4, 1, sb486, sb450, sb451 # 6420
+xors 4, 1, sb230, sb452, sb453 # 6421
+xors 4, 1, sb487, sb454, sb455 # 6422
+xors 4, 1, sb244, sb456, sb457 # 6423
+xors 4, 1, sb488, sb458, sb459 # 6424
+xors 4, 1, sb274, sb460, sb461 # 6425
+xors 4, 1, sb489, sb462, sb463 # 6426
+xors 4, 1, sb283, sb464, sb465 # 6427
+xors 4, 1, sb490, sb466, sb467 # 6428
+xors 4, 1, sb296, sb468, sb469 # 6429
+xors 4, 1, sb491, sb470, sb471 # 6430
+xors 4, 1, sb308, sb472, sb473 # 6431
+xors 4, 1, sb492, sb474, sb475 # 6432
+dabit s6, sb176 # 6433
+mulsi s8, s6, 2 # 6434
+dabit s1, sb208 # 6435
+xors 4, 1, sb150, sb208, sb494 # 6436
+mulsi s3, s1, 2 # 6437
+xors 4, 1, sb557, sb493, sb494 # 6438
+xors 4, 1, sb17, sb495, sb496 # 6439
+xors 4, 1, sb558, sb497, sb498 # 6440
+xors 4, 1, sb90, sb499, sb500 # 6441
+xors 4, 1, sb559, sb501, sb502 # 6442
+xors 4, 1, sb92, sb503, sb504 # 6443
+xors 4, 1, sb560, sb505, sb506 # 6444
+xors 4, 1, sb96, sb507, sb508 # 6445
+xors 4, 1, sb561, sb509, sb510 # 6446
+xors 4, 1, sb206, sb511, sb512 # 6447
+xors 4, 1, sb562, sb513, sb514 # 6448
+xors 4, 1, sb323, sb515, sb516 # 6449
+xors 4, 1, sb563, sb517, sb518 # 6450
+xors 4, 1, sb325, sb519, sb520 # 6451
+xors 4, 1, sb564, sb521, sb522 # 6452
+xors 4, 1, sb327, sb523, sb524 # 6453
+xors 4, 1, sb565, sb525, sb526 # 6454
+xors 4, 1, sb329, sb527, sb528 # 6455
+xors 4, 1, sb566, sb529, sb530 # 6456
+xors 4, 1, sb331, sb531, sb532 # 6457
+xors 4, 1, sb567, sb533, sb534 # 6458
+xors 4, 1, sb333, sb535, sb536 # 6459
+xors 4, 1, sb568, sb537, sb538 # 6460
+xors 4, 1, sb335, sb539, sb540 # 6461
+xors 4, 1, sb569, sb541, sb542 # 6462
+xors 4, 1, sb337, sb543, sb544 # 6463
+xors 4, 1, sb570, sb545, sb546 # 6464
+xors 4, 1, sb339, sb547, sb548 # 6465
+xors 4, 1, sb571, sb549, sb550 # 6466
+xors 4, 1, sb341, sb551, sb552 # 6467
+xors 4, 1, sb572, sb553, sb554 # 6468
+xors 4, 1, sb343, sb555, sb556 # 6469
+ands 748, 1, sb37, sb41, sb209, 1, sb234, sb211, sb42, 1, sb47, sb213, sb215, 1, sb46, sb43, sb219, 1, sb238, sb221, sb223, 1, sb231, sb225, sb45, 1, sb241, sb229, sb9, 1, sb228, sb233, sb242, 1, sb243, sb246, sb247, 1, sb227, sb251, sb253, 1, sb49, sb51, sb257, 1, sb224, sb261, sb263, 1, sb249, sb267, sb270, 1, sb44, sb54, sb280, 1, sb50, sb281, sb294, 1, sb220, sb186, sb252, 1, sb10, sb255, sb256, 1, sb222, sb258, sb313, 1, sb260, sb15, sb78, 1, sb217, sb79, sb16, 1, sb262, sb86, sb100, 1, sb214, sb101, sb102, 1, sb266, sb104, sb21, 1, sb212, sb105, sb4, 1, sb268, sb111, sb113, 1, sb210, sb116, sb117, 1, sb271, sb119, sb24, 1, sb208, sb123, sb126, 1, sb275, sb127, sb129, 1, sb57, sb5, sb132, 1, sb55, sb235, sb134, 1, sb199, sb237, sb135, 1, sb11, sb239, sb27, 1, sb205, sb48, sb140, 1, sb279, sb245, sb142, 1, sb216, sb248, sb29, 1, sb56, sb250, sb151, 1, sb226, sb254, sb30, 1, sb2, sb259, sb152, 1, sb232, sb52, sb155, 1, sb282, sb265, sb156, 1, sb240, sb53, sb0, 1, sb284, sb269, sb157, 1, sb286, sb273, sb160, 1, sb291, sb164, sb165, 1, sb204, sb166, sb170, 1, sb292, sb171, sb34, 1, sb40, sb35, sb178, 1, sb293, sb180, sb181, 1, sb200, sb36, sb189, 1, sb299, sb193, sb195, 1, sb198, sb197, sb39, 1, sb298, sb201, sb202, 1, sb196, sb8, sb353, 1, sb61, sb354, sb355, 1, sb194, sb356, sb357, 1, sb303, sb358, sb359, 1, sb192, sb360, sb361, 1, sb306, sb362, sb363, 1, sb190, sb364, sb365, 1, sb307, sb366, sb367, 1, sb188, sb368, sb369, 1, sb309, sb370, sb371, 1, sb183, sb372, sb373, 1, sb312, sb374, sb375, 1, sb7, sb376, sb377, 1, sb63, sb378, sb379, 1, sb179, sb380, sb381, 1, sb316, sb382, sb383, 1, sb177, sb384, sb385, 1, sb64, sb386, sb387, 1, sb175, sb388, sb389, 1, sb320, sb390, sb391, 1, sb173, sb392, sb393, 1, sb81, sb394, sb395, 1, sb172, sb396, sb397, 1, sb158, sb398, sb399, 1, sb82, sb288, sb400, 1, sb272, sb290, sb401, 1, sb84, sb58, sb402, 1, sb276, sb295, sb403, 1, sb87, sb59, sb404, 1, sb278, sb301, sb405, 1, sb89, sb60, sb406, 1, sb285, sb305, sb407, 1, sb94, sb12, sb408, 1, sb289, sb315, sb409, 1, sb98, sb317, sb410, 1, sb300, sb62, sb411, 1, sb103, sb314, sb412, 1, sb304, sb321, sb413, 1, sb106, sb318, sb414, 1, sb310, sb77, sb415, 1, sb169, sb416, sb417, 1, sb120, sb418, sb419, 1, sb33, sb420, sb421, 1, sb131, sb422, sb423, 1, sb174, sb424, sb425, 1, sb136, sb426, sb427, 1, sb168, sb428, sb429, 1, sb149, sb430, sb431, 1, sb162, sb432, sb433, 1, sb161, sb434, sb435, 1, sb159, sb436, sb437, 1, sb182, sb438, sb439, 1, sb1, sb440, sb441, 1, sb185, sb442, sb443, 1, sb6, sb444, sb445, 1, sb203, sb446, sb447, 1, sb31, sb448, sb449, 1, sb218, sb450, sb451, 1, sb148, sb452, sb453, 1, sb236, sb454, sb455, 1, sb145, sb456, sb457, 1, sb264, sb458, sb459, 1, sb144, sb460, sb461, 1, sb277, sb462, sb463, 1, sb143, sb464, sb465, 1, sb287, sb466, sb467, 1, sb146, sb468, sb469, 1, sb302, sb470, sb471, 1, sb28, sb472, sb473, 1, sb311, sb474, sb475, 1, sb80, sb476, sb477, 1, sb66, sb115, sb478, 1, sb319, sb128, sb479, 1, sb72, sb133, sb480, 1, sb65, sb139, sb481, 1, sb13, sb154, sb482, 1, sb67, sb163, sb483, 1, sb68, sb184, sb484, 1, sb69, sb38, sb485, 1, sb14, sb207, sb486, 1, sb70, sb230, sb487, 1, sb74, sb244, sb488, 1, sb71, sb274, sb489, 1, sb76, sb283, sb490, 1, sb73, sb296, sb491, 1, sb75, sb308, sb492, 1, sb88, sb493, sb494, 1, sb26, sb495, sb496, 1, sb18, sb497, sb498, 1, sb130, sb499, sb500, 1, sb93, sb501, sb502, 1, sb25, sb503, sb504, 1, sb99, sb505, sb506, 1, sb124, sb507, sb508, 1, sb322, sb509, sb510, 1, sb122, sb511, sb512, 1, sb324, sb513, sb514, 1, sb121, sb515, sb516, 1, sb326, sb517, sb518, 1, sb118, sb519, sb520, 1, sb328, sb521, sb522, 1, sb125, sb523, sb524, 1, sb330, sb525, sb526, 1, sb114, sb527, sb528, 1, sb332, sb529, sb530, 1, sb23, sb531, sb532, 1, sb334, sb533, sb534, 1, sb110, sb535, sb536, 1, sb336, sb537, sb538, 1, sb108, sb539, sb540, 1, sb338, sb541, sb542, 1, sb109, sb543, sb544, 1, sb340, sb545, sb546, 1, sb22, sb547, sb548, 1, sb342, sb549, sb550, 1, sb107, sb551, sb552, 1, sb344, sb553, sb554, 1, sb297, sb555, sb556, 1, sb345, sb17, sb557, 1, sb3, sb90, sb558, 1, sb346, sb92, sb559, 1, sb83, sb96, sb560, 1, sb347, sb206, sb561, 1, sb85, sb323, sb562, 1, sb348, sb325, sb563, 1, sb91, sb327, sb564, 1, sb349, sb329, sb565, 1, sb97, sb331, sb566, 1, sb350, sb333, sb567, 1, sb95, sb335, sb568, 1, sb351, sb337, sb569, 1, sb20, sb339, sb570, 1, sb352, sb341, sb571, 1, sb19, sb343, sb572 # 6470
+ands 372, 1, sb233, sb235, sb47, 1, sb9, sb237, sb238, 1, sb229, sb239, sb241, 1, sb45, sb48, sb243, 1, sb225, sb245, sb49, 1, sb223, sb248, sb249, 1, sb221, sb250, sb50, 1, sb219, sb254, sb10, 1, sb43, sb259, sb260, 1, sb215, sb52, sb262, 1, sb213, sb265, sb266, 1, sb211, sb53, sb268, 1, sb209, sb269, sb271, 1, sb42, sb273, sb275, 1, sb242, sb187, sb55, 1, sb252, sb199, sb11, 1, sb247, sb205, sb279, 1, sb255, sb216, sb56, 1, sb246, sb226, sb2, 1, sb256, sb232, sb282, 1, sb258, sb240, sb284, 1, sb8, sb286, sb57, 1, sb41, sb288, sb291, 1, sb202, sb290, sb292, 1, sb201, sb58, sb293, 1, sb39, sb295, sb299, 1, sb195, sb59, sb298, 1, sb193, sb301, sb61, 1, sb197, sb60, sb303, 1, sb189, sb305, sb306, 1, sb186, sb12, sb307, 1, sb36, sb315, sb309, 1, sb181, sb317, sb312, 1, sb178, sb62, sb63, 1, sb35, sb314, sb316, 1, sb180, sb321, sb64, 1, sb34, sb318, sb320, 1, sb170, sb77, sb81, 1, sb313, sb272, sb82, 1, sb251, sb276, sb84, 1, sb16, sb278, sb87, 1, sb253, sb285, sb89, 1, sb30, sb289, sb94, 1, sb257, sb300, sb98, 1, sb0, sb304, sb103, 1, sb51, sb310, sb106, 1, sb171, sb115, sb120, 1, sb166, sb128, sb131, 1, sb164, sb133, sb136, 1, sb165, sb139, sb149, 1, sb160, sb154, sb161, 1, sb156, sb163, sb182, 1, sb155, sb184, sb185, 1, sb157, sb38, sb203, 1, sb152, sb207, sb218, 1, sb29, sb230, sb236, 1, sb151, sb244, sb264, 1, sb142, sb274, sb277, 1, sb140, sb283, sb287, 1, sb135, sb296, sb302, 1, sb134, sb308, sb311, 1, sb261, sb66, sb319, 1, sb15, sb72, sb65, 1, sb263, sb13, sb67, 1, sb79, sb68, sb69, 1, sb267, sb14, sb70, 1, sb78, sb74, sb71, 1, sb86, sb76, sb73, 1, sb27, sb75, sb80, 1, sb132, sb17, sb88, 1, sb127, sb90, sb18, 1, sb5, sb92, sb93, 1, sb129, sb96, sb99, 1, sb24, sb206, sb322, 1, sb126, sb323, sb324, 1, sb123, sb325, sb326, 1, sb117, sb327, sb328, 1, sb119, sb329, sb330, 1, sb116, sb331, sb332, 1, sb111, sb333, sb334, 1, sb113, sb335, sb336, 1, sb105, sb337, sb338, 1, sb4, sb339, sb340, 1, sb101, sb341, sb342, 1, sb294, sb343, sb344, 1, sb102, sb3, sb345, 1, sb270, sb83, sb346, 1, sb21, sb85, sb347, 1, sb54, sb91, sb348, 1, sb104, sb97, sb349, 1, sb280, sb95, sb350, 1, sb100, sb20, sb351, 1, sb281, sb19, sb352 # 6471
+xors 4, 1, sb38, sb233, sb234 # 6472
+xors 4, 1, sb184, sb9, sb46 # 6473
+xors 4, 1, sb203, sb229, sb231 # 6474
+xors 4, 1, sb163, sb45, sb228 # 6475
+xors 4, 1, sb207, sb225, sb227 # 6476
+xors 4, 1, sb154, sb223, sb224 # 6477
+xors 4, 1, sb218, sb221, sb44 # 6478
+xors 4, 1, sb139, sb219, sb220 # 6479
+xors 4, 1, sb230, sb43, sb222 # 6480
+xors 4, 1, sb133, sb215, sb217 # 6481
+xors 4, 1, sb236, sb213, sb214 # 6482
+xors 4, 1, sb128, sb211, sb212 # 6483
+xors 4, 1, sb244, sb209, sb210 # 6484
+xors 4, 1, sb206, sb42, sb208 # 6485
+xors 4, 1, sb264, sb8, sb206 # 6486
+xors 4, 1, sb274, sb41, sb204 # 6487
+xors 4, 1, sb103, sb202, sb40 # 6488
+xors 4, 1, sb277, sb201, sb200 # 6489
+xors 4, 1, sb94, sb39, sb198 # 6490
+xors 4, 1, sb283, sb195, sb196 # 6491
+xors 4, 1, sb87, sb193, sb194 # 6492
+xors 4, 1, sb287, sb197, sb192 # 6493
+xors 4, 1, sb82, sb189, sb190 # 6494
+xors 4, 1, sb296, sb186, sb188 # 6495
+xors 4, 1, sb77, sb36, sb183 # 6496
+xors 4, 1, sb302, sb181, sb7 # 6497
+xors 4, 1, sb319, sb178, sb179 # 6498
+xors 4, 1, sb308, sb35, sb177 # 6499
+xors 4, 1, sb315, sb180, sb175 # 6500
+xors 4, 1, sb311, sb34, sb173 # 6501
+xors 4, 1, sb317, sb170, sb172 # 6502
+xors 4, 1, sb320, sb171, sb169 # 6503
+xors 4, 1, sb70, sb166, sb33 # 6504
+xors 4, 1, sb63, sb164, sb174 # 6505
+xors 4, 1, sb65, sb165, sb168 # 6506
+xors 4, 1, sb61, sb160, sb162 # 6507
+xors 4, 1, sb67, sb156, sb159 # 6508
+xors 4, 1, sb307, sb155, sb1 # 6509
+xors 4, 1, sb69, sb157, sb6 # 6510
+xors 4, 1, sb312, sb152, sb31 # 6511
+xors 4, 1, sb71, sb29, sb148 # 6512
+xors 4, 1, sb309, sb151, sb145 # 6513
+xors 4, 1, sb73, sb142, sb144 # 6514
+xors 4, 1, sb299, sb140, sb143 # 6515
+xors 4, 1, sb75, sb135, sb146 # 6516
+xors 4, 1, sb135, sb134, sb28 # 6517
+xors 4, 1, sb80, sb27, sb135 # 6518
+xors 4, 1, sb18, sb132, sb26 # 6519
+xors 4, 1, sb59, sb127, sb130 # 6520
+xors 4, 1, sb17, sb5, sb25 # 6521
+xors 4, 1, sb291, sb129, sb124 # 6522
+xors 4, 1, sb93, sb24, sb122 # 6523
+xors 4, 1, sb295, sb126, sb121 # 6524
+xors 4, 1, sb88, sb123, sb118 # 6525
+xors 4, 1, sb292, sb117, sb125 # 6526
+xors 4, 1, sb90, sb119, sb114 # 6527
+xors 4, 1, sb293, sb116, sb23 # 6528
+xors 4, 1, sb92, sb111, sb110 # 6529
+xors 4, 1, sb284, sb113, sb108 # 6530
+xors 4, 1, sb99, sb105, sb109 # 6531
+xors 4, 1, sb11, sb4, sb22 # 6532
+xors 4, 1, sb96, sb101, sb107 # 6533
+ands 184, 1, sb185, sb187, sb38, 1, sb182, sb199, sb203, 1, sb161, sb205, sb207, 1, sb149, sb216, sb218, 1, sb136, sb226, sb230, 1, sb131, sb232, sb236, 1, sb120, sb240, sb244, 1, sb192, sb242, sb252, 1, sb248, sb247, sb255, 1, sb249, sb246, sb256, 1, sb106, sb258, sb264, 1, sb98, sb272, sb274, 1, sb89, sb276, sb277, 1, sb84, sb278, sb283, 1, sb81, sb285, sb287, 1, sb318, sb289, sb296, 1, sb64, sb300, sb302, 1, sb321, sb304, sb308, 1, sb314, sb310, sb311, 1, sb52, sb251, sb313, 1, sb197, sb253, sb16, 1, sb260, sb257, sb30, 1, sb198, sb51, sb0, 1, sb62, sb66, sb70, 1, sb316, sb72, sb65, 1, sb12, sb13, sb67, 1, sb306, sb68, sb69, 1, sb60, sb14, sb71, 1, sb305, sb74, sb73, 1, sb298, sb76, sb75, 1, sb201, sb261, sb15, 1, sb53, sb263, sb79, 1, sb268, sb267, sb78, 1, sb303, sb86, sb80, 1, sb58, sb3, sb18, 1, sb290, sb83, sb17, 1, sb288, sb85, sb93, 1, sb286, sb91, sb88, 1, sb57, sb97, sb90, 1, sb282, sb95, sb92, 1, sb2, sb20, sb99, 1, sb217, sb19, sb96, 1, sb56, sb270, sb102, 1, sb8, sb54, sb21, 1, sb279, sb280, sb104, 1, sb41, sb281, sb100 # 6534
+xors 4, 1, sb241, sb185, sb37 # 6535
+xors 4, 1, sb243, sb182, sb184 # 6536
+xors 4, 1, sb239, sb161, sb163 # 6537
+xors 4, 1, sb245, sb149, sb154 # 6538
+xors 4, 1, sb47, sb136, sb139 # 6539
+xors 4, 1, sb49, sb131, sb133 # 6540
+xors 4, 1, sb115, sb120, sb128 # 6541
+xors 4, 1, sb250, sb106, sb115 # 6542
+xors 4, 1, sb50, sb98, sb103 # 6543
+xors 4, 1, sb233, sb89, sb94 # 6544
+xors 4, 1, sb254, sb84, sb87 # 6545
+xors 4, 1, sb231, sb81, sb82 # 6546
+xors 4, 1, sb10, sb318, sb77 # 6547
+xors 4, 1, sb229, sb64, sb319 # 6548
+xors 4, 1, sb259, sb321, sb315 # 6549
+xors 4, 1, sb227, sb314, sb317 # 6550
+xors 4, 1, sb225, sb62, sb320 # 6551
+xors 4, 1, sb262, sb316, sb63 # 6552
+xors 4, 1, sb223, sb12, sb61 # 6553
+xors 4, 1, sb265, sb306, sb307 # 6554
+xors 4, 1, sb222, sb60, sb312 # 6555
+xors 4, 1, sb266, sb305, sb309 # 6556
+xors 4, 1, sb301, sb298, sb299 # 6557
+xors 4, 1, sb269, sb303, sb301 # 6558
+xors 4, 1, sb43, sb294, sb297 # 6559
+xors 4, 1, sb271, sb58, sb59 # 6560
+xors 4, 1, sb215, sb290, sb291 # 6561
+xors 4, 1, sb273, sb288, sb295 # 6562
+xors 4, 1, sb213, sb286, sb292 # 6563
+xors 4, 1, sb275, sb57, sb293 # 6564
+xors 4, 1, sb42, sb282, sb284 # 6565
+xors 4, 1, sb55, sb2, sb11 # 6566
+ands 88, 1, sb48, sb242, sb243, 1, sb238, sb247, sb245, 1, sb237, sb246, sb49, 1, sb194, sb192, sb248, 1, sb234, sb249, sb250, 1, sb46, sb251, sb50, 1, sb9, sb253, sb254, 1, sb228, sb257, sb10, 1, sb45, sb51, sb259, 1, sb200, sb197, sb52, 1, sb171, sb198, sb260, 1, sb224, sb261, sb262, 1, sb44, sb263, sb265, 1, sb220, sb267, sb266, 1, sb211, sb201, sb53, 1, sb221, sb268, sb269, 1, sb214, sb270, sb271, 1, sb212, sb54, sb273, 1, sb210, sb280, sb275, 1, sb174, sb281, sb55, 1, sb209, sb8, sb56, 1, sb168, sb41, sb279 # 6567
+xors 4, 1, sb196, sb48, sb241 # 6568
+xors 4, 1, sb193, sb238, sb239 # 6569
+xors 4, 1, sb235, sb237, sb47 # 6570
+xors 4, 1, sb195, sb234, sb235 # 6571
+xors 4, 1, sb39, sb46, sb233 # 6572
+xors 4, 1, sb186, sb9, sb231 # 6573
+xors 4, 1, sb202, sb228, sb229 # 6574
+xors 4, 1, sb36, sb45, sb227 # 6575
+xors 4, 1, sb180, sb224, sb225 # 6576
+xors 4, 1, sb40, sb44, sb223 # 6577
+xors 4, 1, sb219, sb220, sb222 # 6578
+xors 4, 1, sb204, sb221, sb219 # 6579
+xors 4, 1, sb35, sb217, sb43 # 6580
+xors 4, 1, sb206, sb214, sb215 # 6581
+xors 4, 1, sb177, sb212, sb213 # 6582
+xors 4, 1, sb208, sb210, sb42 # 6583
+ands 40, 1, sb190, sb192, sb193, 1, sb188, sb194, sb195, 1, sb183, sb197, sb39, 1, sb7, sb198, sb202, 1, sb34, sb171, sb200, 1, sb181, sb201, sb40, 1, sb179, sb211, sb204, 1, sb172, sb8, sb206, 1, sb159, sb41, sb208, 1, sb170, sb168, sb209 # 6584
+xors 4, 1, sb189, sb190, sb196 # 6585
+xors 4, 1, sb162, sb188, sb189 # 6586
+xors 4, 1, sb146, sb191, sb162 # 6587
+xors 4, 1, sb166, sb183, sb186 # 6588
+xors 4, 1, sb164, sb7, sb36 # 6589
+xors 4, 1, sb178, sb181, sb180 # 6590
+xors 4, 1, sb175, sb179, sb178 # 6591
+xors 4, 1, sb140, sb176, sb175 # 6592
+xors 4, 1, sb152, sb174, sb35 # 6593
+xors 4, 1, sb173, sb172, sb177 # 6594
+ands 16, 1, sb169, sb171, sb166, 1, sb33, sb167, sb34, 1, sb6, sb168, sb173, 1, sb31, sb170, sb175 # 6595
+xors 4, 1, sb160, sb169, sb164 # 6596
+ands 8, 1, sb165, sb167, sb160, 1, sb155, sb33, sb162 # 6597
+xors 4, 1, sb1, sb165, sb158 # 6598
+xors 4, 1, sb156, sb155, sb1 # 6599
+xors 4, 1, sb143, sb32, sb156 # 6600
+xors 4, 1, sb157, sb159, sb152 # 6601
+xors 4, 1, sb148, sb6, sb157 # 6602
+xors 4, 1, sb29, sb31, sb148 # 6603
+dabit s22, sb145 # 6604
+xors 4, 1, sb144, sb145, sb29 # 6605
+mulsi s2, s22, 2 # 6606
+dabit s7, sb151 # 6607
+xors 4, 1, sb142, sb151, sb153 # 6608
+reveal 24, 1, cb7, sb143, 1, cb6, sb144, 1, cb5, sb146, 1, cb4, sb138, 1, cb2, sb147, 1, cb1, sb140, 1, cb0, sb150, 1, cb3, sb142 # 6609
+convcbitvec 1, ci0, cb7 # 6610
+convint c6, ci0 # 6611
+addm s15, s23, c6 # 6612
+convint c6, ci0 # 6613
+mulm s23, s5, c6 # 6614
+subs s5, s15, s23 # 6615
+movs s15, s5 # 6616
+convcbitvec 1, ci0, cb6 # 6617
+convint c6, ci0 # 6618
+addm s5, s22, c6 # 6619
+convint c6, ci0 # 6620
+mulm s22, s2, c6 # 6621
+subs s2, s5, s22 # 6622
+movs s5, s2 # 6623
+convcbitvec 1, ci0, cb5 # 6624
+convint c6, ci0 # 6625
+addm s2, s21, c6 # 6626
+convint c6, ci0 # 6627
+mulm s21, s19, c6 # 6628
+subs s19, s2, s21 # 6629
+movs s2, s19 # 6630
+convcbitvec 1, ci0, cb4 # 6631
+convint c6, ci0 # 6632
+addm s19, s20, c6 # 6633
+convint c6, ci0 # 6634
+mulm s20, s18, c6 # 6635
+subs s18, s19, s20 # 6636
+movs s19, s18 # 6637
+adds s18, s2, s19 # 6638
+adds s2, s16, s18 # 6639
+convcbitvec 1, ci0, cb2 # 6640
+convint c6, ci0 # 6641
+addm s16, s17, c6 # 6642
+convint c6, ci0 # 6643
+mulm s17, s12, c6 # 6644
+subs s12, s16, s17 # 6645
+movs s16, s12 # 6646
+adds s12, s15, s16 # 6647
+mulm s15, s12, c5 # 6648
+subs s12, s2, s15 # 6649
+subml s2, s12, c4 # 6650
+addsi s12, s2, 1 # 6651
+addm s2, s12, c3 # 6652
+split 194, 3, s2, sb28, sb134, sb114, sb135, sb27, sb110, sb26, sb132, sb108, sb15, sb130, sb105, sb73, sb75, sb100, sb71, sb14, sb101, sb68, sb69, sb96, sb13, sb67, sb19, sb0, sb65, sb92, sb304, sb313, sb90, sb287, sb300, sb88, sb276, sb283, sb85, sb272, sb274, sb83, sb252, sb258, sb80, sb232, sb240, sb78, sb216, sb226, sb76, sb199, sb205, sb74, sb187, sb38, sb72, sb185, sb37, sb70, sb120, sb182, sb66, sb94, sb103, sb64, sb82, sb87, sb51, sb315, sb321, sb308, sb317, sb314, sb302, sb320, sb62, sb289, sb63, sb319, sb285, sb12, sb61, sb278, sb307, sb306, sb264, sb299, sb60, sb256, sb294, sb298, sb244, sb291, sb58, sb236, sb288, sb290, sb230, sb282, sb286, sb218, sb11, sb2, sb207, sb279, sb56, sb203, sb275, sb55, sb191, sb54, sb273, sb186, sb270, sb271, sb184, sb268, sb269, sb154, sb266, sb53, sb115, sb267, sb265, sb98, sb262, sb263, sb89, sb260, sb261, sb84, sb52, sb259, sb318, sb10, sb257, sb316, sb136, sb255, sb312, sb5, sb133, sb309, sb129, sb131, sb310, sb126, sb128, sb305, sb123, sb125, sb311, sb117, sb119, sb301, sb23, sb116, sb303, sb111, sb113, sb297, sb109, sb22, sb59, sb4, sb107, sb295, sb104, sb21, sb292, sb102, sb106, sb293, sb99, sb20, sb296, sb95, sb97, sb57, sb91, sb93, sb284, sb17, sb18, sb281, sb3, sb86, sb280, sb79, sb81, sb277, sb77, sb16, sb139 # 6653
+xors 4, 1, sb118, sb114, sb134 # 6654
+xors 4, 1, sb121, sb28, sb114 # 6655
+xors 4, 1, sb24, sb110, sb27 # 6656
+xors 4, 1, sb45, sb24, sb135 # 6657
+xors 4, 1, sb122, sb135, sb110 # 6658
+xors 4, 1, sb124, sb108, sb132 # 6659
+xors 4, 1, sb225, sb124, sb26 # 6660
+xors 4, 1, sb25, sb26, sb108 # 6661
+xors 4, 1, sb127, sb105, sb130 # 6662
+xors 4, 1, sb223, sb127, sb15 # 6663
+xors 4, 1, sb130, sb15, sb105 # 6664
+xors 4, 1, sb26, sb100, sb75 # 6665
+xors 4, 1, sb221, sb26, sb73 # 6666
+xors 4, 1, sb132, sb73, sb100 # 6667
+xors 4, 1, sb135, sb101, sb14 # 6668
+xors 4, 1, sb219, sb135, sb71 # 6669
+xors 4, 1, sb27, sb71, sb101 # 6670
+xors 4, 1, sb28, sb96, sb69 # 6671
+xors 4, 1, sb217, sb28, sb68 # 6672
+xors 4, 1, sb143, sb68, sb96 # 6673
+xors 4, 1, sb144, sb19, sb67 # 6674
+xors 4, 1, sb215, sb144, sb13 # 6675
+xors 4, 1, sb146, sb13, sb19 # 6676
+xors 4, 1, sb147, sb92, sb65 # 6677
+xors 4, 1, sb213, sb147, sb0 # 6678
+xors 4, 1, sb30, sb0, sb92 # 6679
+xors 4, 1, sb149, sb90, sb313 # 6680
+xors 4, 1, sb211, sb149, sb304 # 6681
+xors 4, 1, sb150, sb304, sb90 # 6682
+xors 4, 1, sb151, sb88, sb300 # 6683
+xors 4, 1, sb209, sb151, sb287 # 6684
+xors 4, 1, sb153, sb287, sb88 # 6685
+xors 4, 1, sb0, sb85, sb283 # 6686
+xors 4, 1, sb42, sb0, sb276 # 6687
+xors 4, 1, sb31, sb276, sb85 # 6688
+xors 4, 1, sb6, sb83, sb274 # 6689
+xors 4, 1, sb8, sb6, sb272 # 6690
+xors 4, 1, sb157, sb272, sb83 # 6691
+xors 4, 1, sb159, sb80, sb258 # 6692
+xors 4, 1, sb202, sb159, sb252 # 6693
+xors 4, 1, sb161, sb252, sb80 # 6694
+xors 4, 1, sb32, sb78, sb240 # 6695
+xors 4, 1, sb200, sb32, sb232 # 6696
+xors 4, 1, sb163, sb232, sb78 # 6697
+xors 4, 1, sb165, sb76, sb226 # 6698
+xors 4, 1, sb198, sb165, sb216 # 6699
+xors 4, 1, sb167, sb216, sb76 # 6700
+xors 4, 1, sb33, sb74, sb205 # 6701
+xors 4, 1, sb196, sb33, sb199 # 6702
+xors 4, 1, sb169, sb199, sb74 # 6703
+xors 4, 1, sb171, sb72, sb38 # 6704
+xors 4, 1, sb194, sb171, sb187 # 6705
+xors 4, 1, sb34, sb187, sb72 # 6706
+xors 4, 1, sb173, sb70, sb37 # 6707
+xors 4, 1, sb192, sb173, sb185 # 6708
+xors 4, 1, sb175, sb185, sb70 # 6709
+xors 4, 1, sb177, sb66, sb182 # 6710
+xors 4, 1, sb190, sb177, sb120 # 6711
+xors 4, 1, sb35, sb120, sb66 # 6712
+xors 4, 1, sb179, sb64, sb103 # 6713
+xors 4, 1, sb188, sb179, sb94 # 6714
+xors 4, 1, sb181, sb94, sb64 # 6715
+xors 4, 1, sb7, sb51, sb87 # 6716
+xors 4, 1, sb38, sb7, sb82 # 6717
+xors 4, 1, sb183, sb82, sb51 # 6718
+xors 4, 1, sb189, sb308, sb321 # 6719
+xors 4, 1, sb36, sb189, sb315 # 6720
+xors 4, 1, sb193, sb315, sb308 # 6721
+xors 4, 1, sb195, sb302, sb314 # 6722
+xors 4, 1, sb180, sb195, sb317 # 6723
+xors 4, 1, sb197, sb317, sb302 # 6724
+xors 4, 1, sb39, sb289, sb62 # 6725
+xors 4, 1, sb178, sb39, sb320 # 6726
+xors 4, 1, sb201, sb320, sb289 # 6727
+xors 4, 1, sb40, sb285, sb319 # 6728
+xors 4, 1, sb176, sb40, sb63 # 6729
+xors 4, 1, sb204, sb63, sb285 # 6730
+xors 4, 1, sb206, sb278, sb61 # 6731
+xors 4, 1, sb174, sb206, sb12 # 6732
+xors 4, 1, sb41, sb12, sb278 # 6733
+xors 4, 1, sb208, sb264, sb306 # 6734
+xors 4, 1, sb172, sb208, sb307 # 6735
+xors 4, 1, sb210, sb307, sb264 # 6736
+xors 4, 1, sb212, sb256, sb60 # 6737
+xors 4, 1, sb170, sb212, sb299 # 6738
+xors 4, 1, sb214, sb299, sb256 # 6739
+xors 4, 1, sb43, sb244, sb298 # 6740
+xors 4, 1, sb168, sb43, sb294 # 6741
+xors 4, 1, sb220, sb294, sb244 # 6742
+xors 4, 1, sb222, sb236, sb58 # 6743
+xors 4, 1, sb166, sb222, sb291 # 6744
+xors 4, 1, sb44, sb291, sb236 # 6745
+xors 4, 1, sb224, sb230, sb290 # 6746
+xors 4, 1, sb164, sb224, sb288 # 6747
+xors 4, 1, sb227, sb288, sb230 # 6748
+xors 4, 1, sb228, sb218, sb286 # 6749
+xors 4, 1, sb162, sb228, sb282 # 6750
+xors 4, 1, sb229, sb282, sb218 # 6751
+xors 4, 1, sb9, sb207, sb2 # 6752
+xors 4, 1, sb160, sb9, sb11 # 6753
+xors 4, 1, sb231, sb11, sb207 # 6754
+xors 4, 1, sb46, sb203, sb56 # 6755
+xors 4, 1, sb158, sb46, sb279 # 6756
+xors 4, 1, sb233, sb279, sb203 # 6757
+xors 4, 1, sb234, sb191, sb55 # 6758
+xors 4, 1, sb156, sb234, sb275 # 6759
+xors 4, 1, sb235, sb275, sb191 # 6760
+xors 4, 1, sb237, sb186, sb273 # 6761
+xors 4, 1, sb1, sb237, sb54 # 6762
+xors 4, 1, sb47, sb54, sb186 # 6763
+xors 4, 1, sb238, sb184, sb271 # 6764
+xors 4, 1, sb155, sb238, sb270 # 6765
+xors 4, 1, sb239, sb270, sb184 # 6766
+xors 4, 1, sb48, sb154, sb269 # 6767
+xors 4, 1, sb152, sb48, sb268 # 6768
+xors 4, 1, sb241, sb268, sb154 # 6769
+xors 4, 1, sb242, sb115, sb53 # 6770
+xors 4, 1, sb148, sb242, sb266 # 6771
+xors 4, 1, sb243, sb266, sb115 # 6772
+xors 4, 1, sb247, sb98, sb265 # 6773
+xors 4, 1, sb29, sb247, sb267 # 6774
+xors 4, 1, sb245, sb267, sb98 # 6775
+xors 4, 1, sb246, sb89, sb263 # 6776
+xors 4, 1, sb145, sb246, sb262 # 6777
+xors 4, 1, sb49, sb262, sb89 # 6778
+xors 4, 1, sb248, sb84, sb261 # 6779
+xors 4, 1, sb142, sb248, sb260 # 6780
+xors 4, 1, sb249, sb260, sb84 # 6781
+xors 4, 1, sb250, sb318, sb259 # 6782
+xors 4, 1, sb140, sb250, sb52 # 6783
+xors 4, 1, sb251, sb52, sb318 # 6784
+xors 4, 1, sb50, sb316, sb257 # 6785
+xors 4, 1, sb138, sb50, sb10 # 6786
+xors 4, 1, sb253, sb10, sb316 # 6787
+xors 4, 1, sb254, sb312, sb255 # 6788
+xors 4, 1, sb134, sb254, sb136 # 6789
+xors 4, 1, sb255, sb136, sb312 # 6790
+xors 4, 1, sb10, sb309, sb133 # 6791
+xors 4, 1, sb133, sb10, sb5 # 6792
+xors 4, 1, sb257, sb5, sb309 # 6793
+xors 4, 1, sb52, sb310, sb131 # 6794
+xors 4, 1, sb131, sb52, sb129 # 6795
+xors 4, 1, sb259, sb129, sb310 # 6796
+xors 4, 1, sb260, sb305, sb128 # 6797
+xors 4, 1, sb5, sb260, sb126 # 6798
+xors 4, 1, sb261, sb126, sb305 # 6799
+xors 4, 1, sb262, sb311, sb125 # 6800
+xors 4, 1, sb129, sb262, sb123 # 6801
+xors 4, 1, sb263, sb123, sb311 # 6802
+xors 4, 1, sb267, sb301, sb119 # 6803
+xors 4, 1, sb128, sb267, sb117 # 6804
+xors 4, 1, sb265, sb117, sb301 # 6805
+xors 4, 1, sb266, sb303, sb116 # 6806
+xors 4, 1, sb126, sb266, sb23 # 6807
+xors 4, 1, sb53, sb23, sb303 # 6808
+xors 4, 1, sb268, sb297, sb113 # 6809
+xors 4, 1, sb125, sb268, sb111 # 6810
+xors 4, 1, sb269, sb111, sb297 # 6811
+xors 4, 1, sb270, sb59, sb22 # 6812
+xors 4, 1, sb123, sb270, sb109 # 6813
+xors 4, 1, sb271, sb109, sb59 # 6814
+xors 4, 1, sb54, sb295, sb107 # 6815
+xors 4, 1, sb119, sb54, sb4 # 6816
+xors 4, 1, sb273, sb4, sb295 # 6817
+xors 4, 1, sb275, sb292, sb21 # 6818
+xors 4, 1, sb117, sb275, sb104 # 6819
+xors 4, 1, sb55, sb104, sb292 # 6820
+xors 4, 1, sb279, sb293, sb106 # 6821
+xors 4, 1, sb23, sb279, sb102 # 6822
+xors 4, 1, sb56, sb102, sb293 # 6823
+xors 4, 1, sb63, sb296, sb20 # 6824
+xors 4, 1, sb107, sb63, sb99 # 6825
+xors 4, 1, sb37, sb99, sb296 # 6826
+xors 4, 1, sb272, sb57, sb97 # 6827
+xors 4, 1, sb113, sb272, sb95 # 6828
+xors 4, 1, sb276, sb95, sb57 # 6829
+xors 4, 1, sb65, sb284, sb93 # 6830
+xors 4, 1, sb109, sb65, sb91 # 6831
+xors 4, 1, sb67, sb91, sb284 # 6832
+xors 4, 1, sb69, sb281, sb18 # 6833
+xors 4, 1, sb106, sb69, sb17 # 6834
+xors 4, 1, sb71, sb17, sb281 # 6835
+xors 4, 1, sb73, sb280, sb86 # 6836
+xors 4, 1, sb21, sb73, sb3 # 6837
+xors 4, 1, sb75, sb3, sb280 # 6838
+xors 4, 1, sb15, sb277, sb81 # 6839
+xors 4, 1, sb104, sb15, sb79 # 6840
+xors 4, 1, sb319, sb79, sb277 # 6841
+xors 4, 1, sb320, sb139, sb16 # 6842
+xors 4, 1, sb102, sb320, sb77 # 6843
+xors 4, 1, sb321, sb77, sb139 # 6844
+ands 256, 1, sb116, sb118, sb121, 1, sb111, sb24, sb122, 1, sb22, sb124, sb25, 1, sb4, sb127, sb130, 1, sb20, sb26, sb132, 1, sb99, sb135, sb27, 1, sb97, sb28, sb143, 1, sb95, sb144, sb146, 1, sb93, sb147, sb30, 1, sb91, sb149, sb150, 1, sb18, sb151, sb153, 1, sb17, sb0, sb31, 1, sb86, sb6, sb157, 1, sb3, sb159, sb161, 1, sb79, sb32, sb163, 1, sb77, sb165, sb167, 1, sb81, sb33, sb169, 1, sb16, sb171, sb34, 1, sb14, sb173, sb175, 1, sb68, sb177, sb35, 1, sb13, sb179, sb181, 1, sb12, sb7, sb183, 1, sb313, sb189, sb193, 1, sb304, sb195, sb197, 1, sb300, sb39, sb201, 1, sb287, sb40, sb204, 1, sb283, sb206, sb41, 1, sb274, sb208, sb210, 1, sb258, sb212, sb214, 1, sb252, sb43, sb220, 1, sb240, sb222, sb44, 1, sb232, sb224, sb227, 1, sb226, sb228, sb229, 1, sb216, sb9, sb231, 1, sb205, sb46, sb233, 1, sb199, sb234, sb235, 1, sb187, sb237, sb47, 1, sb185, sb238, sb239, 1, sb182, sb48, sb241, 1, sb120, sb242, sb243, 1, sb103, sb247, sb245, 1, sb94, sb246, sb49, 1, sb87, sb248, sb249, 1, sb82, sb250, sb251, 1, sb315, sb50, sb253, 1, sb62, sb254, sb255, 1, sb314, sb10, sb257, 1, sb317, sb52, sb259, 1, sb306, sb260, sb261, 1, sb61, sb262, sb263, 1, sb60, sb267, sb265, 1, sb307, sb266, sb53, 1, sb298, sb268, sb269, 1, sb299, sb270, sb271, 1, sb294, sb54, sb273, 1, sb58, sb275, sb55, 1, sb290, sb279, sb56, 1, sb291, sb63, sb37, 1, sb286, sb272, sb276, 1, sb288, sb65, sb67, 1, sb282, sb69, sb71, 1, sb2, sb73, sb75, 1, sb11, sb15, sb319, 1, sb136, sb320, sb321 # 6845
+xors 4, 1, sb227, sb114, sb116 # 6846
+xors 4, 1, sb132, sb112, sb227 # 6847
+xors 4, 1, sb224, sb110, sb111 # 6848
+xors 4, 1, sb276, sb224, sb225 # 6849
+xors 4, 1, sb222, sb108, sb22 # 6850
+xors 4, 1, sb75, sb222, sb223 # 6851
+xors 4, 1, sb220, sb105, sb4 # 6852
+xors 4, 1, sb272, sb220, sb221 # 6853
+xors 4, 1, sb44, sb100, sb20 # 6854
+xors 4, 1, sb73, sb44, sb219 # 6855
+xors 4, 1, sb43, sb101, sb99 # 6856
+xors 4, 1, sb271, sb43, sb217 # 6857
+xors 4, 1, sb214, sb96, sb97 # 6858
+xors 4, 1, sb71, sb214, sb215 # 6859
+xors 4, 1, sb212, sb19, sb95 # 6860
+xors 4, 1, sb270, sb212, sb213 # 6861
+xors 4, 1, sb210, sb92, sb93 # 6862
+xors 4, 1, sb69, sb210, sb211 # 6863
+xors 4, 1, sb208, sb90, sb91 # 6864
+xors 4, 1, sb269, sb208, sb209 # 6865
+xors 4, 1, sb206, sb88, sb18 # 6866
+xors 4, 1, sb15, sb206, sb42 # 6867
+xors 4, 1, sb204, sb85, sb17 # 6868
+xors 4, 1, sb268, sb204, sb8 # 6869
+xors 4, 1, sb201, sb83, sb86 # 6870
+xors 4, 1, sb65, sb201, sb202 # 6871
+xors 4, 1, sb40, sb80, sb3 # 6872
+xors 4, 1, sb267, sb40, sb200 # 6873
+xors 4, 1, sb197, sb78, sb79 # 6874
+xors 4, 1, sb67, sb197, sb198 # 6875
+xors 4, 1, sb39, sb76, sb77 # 6876
+xors 4, 1, sb266, sb39, sb196 # 6877
+xors 4, 1, sb195, sb74, sb81 # 6878
+xors 4, 1, sb63, sb195, sb194 # 6879
+xors 4, 1, sb193, sb72, sb16 # 6880
+xors 4, 1, sb265, sb193, sb192 # 6881
+xors 4, 1, sb189, sb70, sb14 # 6882
+xors 4, 1, sb56, sb189, sb190 # 6883
+xors 4, 1, sb37, sb66, sb68 # 6884
+xors 4, 1, sb53, sb37, sb188 # 6885
+xors 4, 1, sb183, sb64, sb13 # 6886
+xors 4, 1, sb52, sb183, sb38 # 6887
+xors 4, 1, sb181, sb51, sb12 # 6888
+xors 4, 1, sb263, sb181, sb36 # 6889
+xors 4, 1, sb179, sb308, sb313 # 6890
+xors 4, 1, sb7, sb179, sb180 # 6891
+xors 4, 1, sb177, sb302, sb304 # 6892
+xors 4, 1, sb262, sb177, sb178 # 6893
+xors 4, 1, sb175, sb289, sb300 # 6894
+xors 4, 1, sb34, sb175, sb176 # 6895
+xors 4, 1, sb173, sb285, sb287 # 6896
+xors 4, 1, sb261, sb173, sb174 # 6897
+xors 4, 1, sb171, sb278, sb283 # 6898
+xors 4, 1, sb32, sb171, sb172 # 6899
+xors 4, 1, sb169, sb264, sb274 # 6900
+xors 4, 1, sb260, sb169, sb170 # 6901
+xors 4, 1, sb167, sb256, sb258 # 6902
+xors 4, 1, sb30, sb167, sb168 # 6903
+xors 4, 1, sb165, sb244, sb252 # 6904
+xors 4, 1, sb51, sb165, sb166 # 6905
+xors 4, 1, sb163, sb236, sb240 # 6906
+xors 4, 1, sb28, sb163, sb164 # 6907
+xors 4, 1, sb161, sb230, sb232 # 6908
+xors 4, 1, sb10, sb161, sb162 # 6909
+xors 4, 1, sb159, sb218, sb226 # 6910
+xors 4, 1, sb25, sb159, sb160 # 6911
+xors 4, 1, sb157, sb207, sb216 # 6912
+xors 4, 1, sb254, sb157, sb158 # 6913
+xors 4, 1, sb0, sb203, sb205 # 6914
+xors 4, 1, sb22, sb0, sb156 # 6915
+xors 4, 1, sb153, sb191, sb199 # 6916
+xors 4, 1, sb50, sb153, sb1 # 6917
+xors 4, 1, sb151, sb186, sb187 # 6918
+xors 4, 1, sb19, sb151, sb155 # 6919
+xors 4, 1, sb149, sb184, sb185 # 6920
+xors 4, 1, sb250, sb149, sb152 # 6921
+xors 4, 1, sb147, sb154, sb182 # 6922
+xors 4, 1, sb16, sb147, sb148 # 6923
+xors 4, 1, sb146, sb115, sb120 # 6924
+xors 4, 1, sb248, sb146, sb29 # 6925
+xors 4, 1, sb143, sb98, sb103 # 6926
+xors 4, 1, sb313, sb143, sb145 # 6927
+xors 4, 1, sb150, sb89, sb94 # 6928
+xors 4, 1, sb247, sb150, sb142 # 6929
+xors 4, 1, sb144, sb84, sb87 # 6930
+xors 4, 1, sb304, sb144, sb140 # 6931
+xors 4, 1, sb27, sb318, sb82 # 6932
+xors 4, 1, sb246, sb27, sb138 # 6933
+xors 4, 1, sb130, sb316, sb315 # 6934
+xors 4, 1, sb300, sb130, sb134 # 6935
+xors 4, 1, sb135, sb312, sb62 # 6936
+xors 4, 1, sb48, sb135, sb133 # 6937
+xors 4, 1, sb127, sb309, sb314 # 6938
+xors 4, 1, sb287, sb127, sb131 # 6939
+xors 4, 1, sb124, sb310, sb317 # 6940
+xors 4, 1, sb242, sb124, sb5 # 6941
+xors 4, 1, sb122, sb305, sb306 # 6942
+xors 4, 1, sb283, sb122, sb129 # 6943
+xors 4, 1, sb121, sb311, sb61 # 6944
+xors 4, 1, sb238, sb121, sb128 # 6945
+xors 4, 1, sb118, sb301, sb60 # 6946
+xors 4, 1, sb274, sb118, sb126 # 6947
+xors 4, 1, sb116, sb303, sb307 # 6948
+xors 4, 1, sb237, sb116, sb125 # 6949
+xors 4, 1, sb114, sb297, sb298 # 6950
+xors 4, 1, sb258, sb114, sb123 # 6951
+xors 4, 1, sb112, sb59, sb299 # 6952
+xors 4, 1, sb234, sb112, sb119 # 6953
+xors 4, 1, sb110, sb295, sb294 # 6954
+xors 4, 1, sb252, sb110, sb117 # 6955
+xors 4, 1, sb108, sb292, sb58 # 6956
+xors 4, 1, sb46, sb108, sb23 # 6957
+xors 4, 1, sb4, sb293, sb290 # 6958
+xors 4, 1, sb240, sb4, sb107 # 6959
+xors 4, 1, sb105, sb296, sb291 # 6960
+xors 4, 1, sb9, sb105, sb113 # 6961
+xors 4, 1, sb111, sb57, sb286 # 6962
+xors 4, 1, sb232, sb111, sb109 # 6963
+xors 4, 1, sb101, sb284, sb288 # 6964
+xors 4, 1, sb229, sb101, sb106 # 6965
+xors 4, 1, sb99, sb281, sb282 # 6966
+xors 4, 1, sb226, sb99, sb21 # 6967
+xors 4, 1, sb97, sb280, sb2 # 6968
+xors 4, 1, sb228, sb97, sb104 # 6969
+xors 4, 1, sb95, sb277, sb11 # 6970
+xors 4, 1, sb216, sb95, sb102 # 6971
+ands 376, 1, sb207, sb95, sb102, 1, sb218, sb97, sb104, 1, sb203, sb99, sb21, 1, sb230, sb101, sb106, 1, sb187, sb111, sb109, 1, sb236, sb105, sb113, 1, sb185, sb4, sb107, 1, sb244, sb108, sb23, 1, sb182, sb110, sb117, 1, sb256, sb112, sb119, 1, sb120, sb114, sb123, 1, sb264, sb116, sb125, 1, sb103, sb118, sb126, 1, sb278, sb121, sb128, 1, sb94, sb122, sb129, 1, sb285, sb124, sb5, 1, sb87, sb127, sb131, 1, sb289, sb135, sb133, 1, sb82, sb130, sb134, 1, sb302, sb27, sb138, 1, sb318, sb144, sb140, 1, sb308, sb150, sb142, 1, sb317, sb143, sb145, 1, sb14, sb146, sb29, 1, sb310, sb147, sb148, 1, sb3, sb149, sb152, 1, sb61, sb151, sb155, 1, sb20, sb153, sb1, 1, sb311, sb0, sb156, 1, sb24, sb157, sb158, 1, sb307, sb159, sb160, 1, sb26, sb161, sb162, 1, sb303, sb163, sb164, 1, sb6, sb165, sb166, 1, sb299, sb167, sb168, 1, sb31, sb169, sb170, 1, sb59, sb171, sb172, 1, sb33, sb173, sb174, 1, sb295, sb175, sb176, 1, sb35, sb177, sb178, 1, sb293, sb179, sb180, 1, sb41, sb181, sb36, 1, sb291, sb183, sb38, 1, sb54, sb37, sb188, 1, sb296, sb189, sb190, 1, sb12, sb193, sb192, 1, sb57, sb195, sb194, 1, sb66, sb39, sb196, 1, sb288, sb197, sb198, 1, sb64, sb40, sb200, 1, sb284, sb201, sb202, 1, sb13, sb204, sb8, 1, sb11, sb206, sb42, 1, sb68, sb208, sb209, 1, sb279, sb210, sb211, 1, sb70, sb212, sb213, 1, sb55, sb214, sb215, 1, sb72, sb43, sb217, 1, sb275, sb44, sb219, 1, sb74, sb220, sb221, 1, sb273, sb222, sb223, 1, sb76, sb224, sb225, 1, sb100, sb227, sb45, 1, sb231, sb216, sb228, 1, sb77, sb226, sb229, 1, sb233, sb232, sb9, 1, sb78, sb240, sb46, 1, sb235, sb252, sb234, 1, sb79, sb258, sb237, 1, sb47, sb274, sb238, 1, sb80, sb283, sb242, 1, sb239, sb287, sb48, 1, sb81, sb300, sb246, 1, sb241, sb304, sb247, 1, sb83, sb313, sb248, 1, sb243, sb16, sb250, 1, sb17, sb19, sb50, 1, sb245, sb22, sb254, 1, sb85, sb25, sb10, 1, sb49, sb28, sb51, 1, sb86, sb30, sb260, 1, sb249, sb32, sb261, 1, sb92, sb34, sb262, 1, sb251, sb7, sb263, 1, sb90, sb52, sb53, 1, sb253, sb56, sb265, 1, sb88, sb63, sb266, 1, sb255, sb67, sb267, 1, sb96, sb65, sb268, 1, sb257, sb15, sb269, 1, sb91, sb69, sb270, 1, sb259, sb71, sb271, 1, sb18, sb73, sb272, 1, sb93, sb75, sb276 # 6972
+ands 188, 1, sb205, sb216, sb218, 1, sb191, sb226, sb230, 1, sb186, sb232, sb236, 1, sb184, sb240, sb244, 1, sb154, sb252, sb256, 1, sb115, sb258, sb264, 1, sb98, sb274, sb278, 1, sb89, sb283, sb285, 1, sb84, sb287, sb289, 1, sb315, sb300, sb302, 1, sb62, sb304, sb308, 1, sb316, sb313, sb14, 1, sb312, sb16, sb3, 1, sb314, sb19, sb20, 1, sb309, sb22, sb24, 1, sb305, sb25, sb26, 1, sb301, sb28, sb6, 1, sb306, sb30, sb31, 1, sb297, sb32, sb33, 1, sb60, sb34, sb35, 1, sb298, sb7, sb41, 1, sb294, sb52, sb54, 1, sb58, sb56, sb12, 1, sb292, sb63, sb66, 1, sb290, sb67, sb64, 1, sb286, sb65, sb13, 1, sb281, sb15, sb68, 1, sb2, sb69, sb70, 1, sb277, sb71, sb72, 1, sb282, sb73, sb74, 1, sb280, sb75, sb76, 1, sb180, sb231, sb77, 1, sb261, sb233, sb78, 1, sb36, sb235, sb79, 1, sb266, sb47, sb80, 1, sb189, sb239, sb81, 1, sb263, sb241, sb83, 1, sb195, sb243, sb17, 1, sb270, sb245, sb85, 1, sb193, sb49, sb86, 1, sb265, sb249, sb92, 1, sb199, sb251, sb90, 1, sb267, sb253, sb88, 1, sb38, sb255, sb96, 1, sb53, sb257, sb91, 1, sb272, sb259, sb18, 1, sb276, sb93, sb100 # 6973
+xors 4, 1, sb238, sb205, sb207 # 6974
+xors 4, 1, sb46, sb191, sb203 # 6975
+xors 4, 1, sb234, sb186, sb187 # 6976
+xors 4, 1, sb242, sb184, sb185 # 6977
+xors 4, 1, sb227, sb154, sb182 # 6978
+xors 4, 1, sb237, sb115, sb120 # 6979
+xors 4, 1, sb9, sb98, sb103 # 6980
+xors 4, 1, sb48, sb89, sb94 # 6981
+xors 4, 1, sb44, sb84, sb87 # 6982
+xors 4, 1, sb248, sb315, sb82 # 6983
+xors 4, 1, sb228, sb62, sb318 # 6984
+xors 4, 1, sb246, sb316, sb317 # 6985
+xors 4, 1, sb224, sb312, sb310 # 6986
+xors 4, 1, sb250, sb314, sb61 # 6987
+xors 4, 1, sb220, sb309, sb311 # 6988
+xors 4, 1, sb247, sb305, sb307 # 6989
+xors 4, 1, sb222, sb301, sb303 # 6990
+xors 4, 1, sb254, sb306, sb299 # 6991
+xors 4, 1, sb42, sb297, sb59 # 6992
+xors 4, 1, sb51, sb60, sb295 # 6993
+xors 4, 1, sb210, sb298, sb293 # 6994
+xors 4, 1, sb50, sb294, sb291 # 6995
+xors 4, 1, sb208, sb58, sb296 # 6996
+xors 4, 1, sb260, sb292, sb57 # 6997
+xors 4, 1, sb8, sb290, sb288 # 6998
+xors 4, 1, sb10, sb286, sb284 # 6999
+xors 4, 1, sb204, sb281, sb11 # 7000
+xors 4, 1, sb262, sb2, sb279 # 7001
+xors 4, 1, sb40, sb277, sb55 # 7002
+xors 4, 1, sb268, sb282, sb275 # 7003
+xors 4, 1, sb271, sb280, sb273 # 7004
+xors 4, 1, sb269, sb276, sb271 # 7005
+ands 92, 1, sb229, sb231, sb46, 1, sb45, sb233, sb242, 1, sb225, sb235, sb237, 1, sb223, sb47, sb48, 1, sb221, sb239, sb248, 1, sb219, sb241, sb246, 1, sb217, sb243, sb250, 1, sb215, sb245, sb247, 1, sb213, sb49, sb254, 1, sb212, sb249, sb51, 1, sb43, sb251, sb50, 1, sb214, sb253, sb260, 1, sb209, sb255, sb10, 1, sb211, sb257, sb262, 1, sb202, sb259, sb268, 1, sb155, sb180, sb261, 1, sb194, sb36, sb266, 1, sb157, sb189, sb263, 1, sb201, sb195, sb270, 1, sb159, sb193, sb265, 1, sb196, sb199, sb267, 1, sb39, sb38, sb53, 1, sb206, sb272, sb269 # 7006
+xors 4, 1, sb179, sb229, sb238 # 7007
+xors 4, 1, sb181, sb45, sb234 # 7008
+xors 4, 1, sb177, sb225, sb227 # 7009
+xors 4, 1, sb183, sb223, sb9 # 7010
+xors 4, 1, sb175, sb221, sb44 # 7011
+xors 4, 1, sb188, sb219, sb228 # 7012
+xors 4, 1, sb173, sb217, sb224 # 7013
+xors 4, 1, sb37, sb215, sb220 # 7014
+xors 4, 1, sb171, sb213, sb222 # 7015
+xors 4, 1, sb190, sb212, sb42 # 7016
+xors 4, 1, sb169, sb43, sb210 # 7017
+xors 4, 1, sb192, sb214, sb208 # 7018
+xors 4, 1, sb167, sb209, sb8 # 7019
+xors 4, 1, sb197, sb211, sb204 # 7020
+xors 4, 1, sb200, sb202, sb40 # 7021
+xors 4, 1, sb198, sb206, sb200 # 7022
+ands 44, 1, sb178, sb180, sb181, 1, sb176, sb36, sb183, 1, sb174, sb189, sb188, 1, sb172, sb195, sb37, 1, sb170, sb193, sb190, 1, sb168, sb199, sb192, 1, sb166, sb38, sb197, 1, sb144, sb155, sb194, 1, sb161, sb157, sb201, 1, sb162, sb159, sb196, 1, sb164, sb39, sb198 # 7023
+xors 4, 1, sb1, sb178, sb179 # 7024
+xors 4, 1, sb0, sb176, sb177 # 7025
+xors 4, 1, sb156, sb174, sb175 # 7026
+xors 4, 1, sb158, sb172, sb173 # 7027
+xors 4, 1, sb150, sb170, sb171 # 7028
+xors 4, 1, sb160, sb168, sb169 # 7029
+xors 4, 1, sb165, sb166, sb167 # 7030
+xors 4, 1, sb163, sb164, sb165 # 7031
+ands 20, 1, sb153, sb155, sb0, 1, sb151, sb157, sb158, 1, sb149, sb159, sb160, 1, sb148, sb144, sb161, 1, sb147, sb162, sb163 # 7032
+xors 4, 1, sb142, sb153, sb1 # 7033
+xors 4, 1, sb145, sb151, sb156 # 7034
+xors 4, 1, sb152, sb149, sb150 # 7035
+xors 4, 1, sb146, sb147, sb152 # 7036
+ands 8, 1, sb143, sb144, sb145, 1, sb29, sb148, sb146 # 7037
+xors 4, 1, sb140, sb143, sb142 # 7038
+xors 4, 1, sb138, sb29, sb140 # 7039
+xors 4, 1, sb130, sb141, sb138 # 7040
+xors 4, 1, sb134, sb139, sb136 # 7041
+xors 4, 1, sb27, sb137, sb134 # 7042
+reveal 9, 1, cb5, sb130, 1, cb4, sb27, 1, cb2, sb132 # 7043
+convcbitvec 1, ci0, cb5 # 7044
+convint c3, ci0 # 7045
+addm s12, s14, c3 # 7046
+convint c3, ci0 # 7047
+mulm s14, s9, c3 # 7048
+subs s9, s12, s14 # 7049
+movs s12, s9 # 7050
+movs s9, s12 # 7051
+convcbitvec 1, ci0, cb4 # 7052
+convint c3, ci0 # 7053
+addm s12, s13, c3 # 7054
+convint c3, ci0 # 7055
+mulm s13, s10, c3 # 7056
+subs s10, s12, s13 # 7057
+movs s12, s10 # 7058
+adds s10, s9, s12 # 7059
+mulm s9, s10, c1 # 7060
+convcbitvec 1, ci0, cb2 # 7061
+convint c1, ci0 # 7062
+addm s10, s11, c1 # 7063
+convint c1, ci0 # 7064
+mulm s11, s0, c1 # 7065
+subs s0, s10, s11 # 7066
+movs s10, s0 # 7067
+shrsi s0, s2, 1 # 7068
+adds s2, s0, s10 # 7069
+subs s0, s2, s9 # 7070
+subml s2, s0, c2 # 7071
+convcbitvec 1, ci0, cb1 # 7072
+convint c1, ci0 # 7073
+addm s0, s6, c1 # 7074
+convint c2, ci0 # 7075
+mulm s6, s8, c2 # 7076
+subs s8, s0, s6 # 7077
+movs s6, s8 # 7078
+convcbitvec 1, ci0, cb0 # 7079
+convint c1, ci0 # 7080
+addm s0, s1, c1 # 7081
+convint c2, ci0 # 7082
+mulm s8, s3, c2 # 7083
+subs s1, s0, s8 # 7084
+movs s8, s1 # 7085
+adds s3, s6, s8 # 7086
+convcbitvec 1, ci0, cb3 # 7087
+convint c1, ci0 # 7088
+addm s8, s7, c1 # 7089
+mulsi s0, s7, 2 # 7090
+convint c2, ci0 # 7091
+mulm s1, s0, c2 # 7092
+subs s6, s8, s1 # 7093
+movs s7, s6 # 7094
+adds s0, s5, s7 # 7095
+shrsi s1, s4, 32 # 7096
+adds s7, s1, s3 # 7097
+ldi c1, 2 # 7098
+mulci c2, c1, 2147483647 # 7099
+addci c1, c2, 2 # 7100
+mulm s8, s0, c1 # 7101
+subs s6, s7, s8 # 7102
+subsi s5, s6, 1073741824 # 7103
+movs s4, s5 # 7104
+addm s3, s4, c0 # 7105
+muls 4, 1, s1, s2, s3 # 7106
+ldi c0, 2 # 7107
+mulci c1, c0, 2147483647 # 7108
+addci c0, c1, 4 # 7109
+mulci c1, c0, 2147483647 # 7110
+addci c0, c1, 2 # 7111
+addm s4, s1, c0 # 7112
+split 194, 3, s4, sb133, sb135, sb310, sb131, sb127, sb312, sb124, sb5, sb314, sb122, sb129, sb311, sb128, sb121, sb309, sb118, sb126, sb307, sb116, sb125, sb305, sb114, sb123, sb303, sb112, sb119, sb301, sb110, sb117, sb299, sb108, sb23, sb297, sb4, sb107, sb295, sb113, sb105, sb293, sb109, sb111, sb291, sb106, sb101, sb281, sb21, sb99, sb279, sb104, sb97, sb277, sb102, sb95, sb275, sb100, sb93, sb273, sb18, sb91, sb271, sb96, sb89, sb269, sb94, sb87, sb267, sb82, sb84, sb265, sb14, sb16, sb263, sb25, sb6, sb261, sb63, sb115, sb259, sb306, sb308, sb257, sb304, sb12, sb255, sb60, sb302, sb253, sb298, sb300, sb251, sb294, sb296, sb249, sb58, sb292, sb247, sb288, sb290, sb245, sb284, sb286, sb243, sb2, sb282, sb241, sb56, sb280, sb239, sb276, sb278, sb237, sb272, sb274, sb235, sb270, sb54, sb233, sb266, sb268, sb231, sb262, sb264, sb229, sb260, sb52, sb227, sb51, sb258, sb225, sb254, sb256, sb223, sb250, sb252, sb221, sb246, sb248, sb219, sb48, sb242, sb217, sb238, sb240, sb215, sb234, sb236, sb212, sb9, sb232, sb210, sb228, sb230, sb208, sb224, sb226, sb213, sb220, sb222, sb204, sb43, sb218, sb202, sb214, sb216, sb200, sb209, sb211, sb198, sb206, sb207, sb196, sb41, sb205, sb194, sb201, sb203, sb192, sb197, sb199, sb190, sb193, sb195, sb188, sb189, sb191, sb186, sb185, sb187, sb184, sb315, sb154, sb182 # 7113
+xors 4, 1, sb316, sb310, sb135 # 7114
+xors 4, 1, sb317, sb133, sb310 # 7115
+xors 4, 1, sb318, sb312, sb127 # 7116
+xors 4, 1, sb66, sb318, sb131 # 7117
+xors 4, 1, sb103, sb131, sb312 # 7118
+xors 4, 1, sb120, sb314, sb5 # 7119
+xors 4, 1, sb67, sb120, sb124 # 7120
+xors 4, 1, sb244, sb124, sb314 # 7121
+xors 4, 1, sb283, sb311, sb129 # 7122
+xors 4, 1, sb61, sb283, sb122 # 7123
+xors 4, 1, sb285, sb122, sb311 # 7124
+xors 4, 1, sb287, sb309, sb121 # 7125
+xors 4, 1, sb59, sb287, sb128 # 7126
+xors 4, 1, sb289, sb128, sb309 # 7127
+xors 4, 1, sb313, sb307, sb126 # 7128
+xors 4, 1, sb64, sb313, sb118 # 7129
+xors 4, 1, sb3, sb118, sb307 # 7130
+xors 4, 1, sb31, sb305, sb125 # 7131
+xors 4, 1, sb55, sb31, sb116 # 7132
+xors 4, 1, sb33, sb116, sb305 # 7133
+xors 4, 1, sb35, sb303, sb123 # 7134
+xors 4, 1, sb57, sb35, sb114 # 7135
+xors 4, 1, sb7, sb114, sb303 # 7136
+xors 4, 1, sb42, sb301, sb119 # 7137
+xors 4, 1, sb53, sb42, sb112 # 7138
+xors 4, 1, sb45, sb112, sb301 # 7139
+xors 4, 1, sb11, sb299, sb117 # 7140
+xors 4, 1, sb50, sb11, sb110 # 7141
+xors 4, 1, sb62, sb110, sb299 # 7142
+xors 4, 1, sb65, sb297, sb23 # 7143
+xors 4, 1, sb49, sb65, sb108 # 7144
+xors 4, 1, sb13, sb108, sb297 # 7145
+xors 4, 1, sb15, sb295, sb107 # 7146
+xors 4, 1, sb47, sb15, sb4 # 7147
+xors 4, 1, sb68, sb4, sb295 # 7148
+xors 4, 1, sb69, sb293, sb105 # 7149
+xors 4, 1, sb46, sb69, sb113 # 7150
+xors 4, 1, sb70, sb113, sb293 # 7151
+xors 4, 1, sb71, sb291, sb111 # 7152
+xors 4, 1, sb44, sb71, sb109 # 7153
+xors 4, 1, sb72, sb109, sb291 # 7154
+xors 4, 1, sb73, sb281, sb101 # 7155
+xors 4, 1, sb38, sb73, sb106 # 7156
+xors 4, 1, sb74, sb106, sb281 # 7157
+xors 4, 1, sb75, sb279, sb99 # 7158
+xors 4, 1, sb36, sb75, sb21 # 7159
+xors 4, 1, sb76, sb21, sb279 # 7160
+xors 4, 1, sb77, sb277, sb97 # 7161
+xors 4, 1, sb34, sb77, sb104 # 7162
+xors 4, 1, sb78, sb104, sb277 # 7163
+xors 4, 1, sb79, sb275, sb95 # 7164
+xors 4, 1, sb32, sb79, sb102 # 7165
+xors 4, 1, sb80, sb102, sb275 # 7166
+xors 4, 1, sb81, sb273, sb93 # 7167
+xors 4, 1, sb30, sb81, sb100 # 7168
+xors 4, 1, sb83, sb100, sb273 # 7169
+xors 4, 1, sb17, sb271, sb91 # 7170
+xors 4, 1, sb28, sb17, sb18 # 7171
+xors 4, 1, sb85, sb18, sb271 # 7172
+xors 4, 1, sb86, sb269, sb89 # 7173
+xors 4, 1, sb26, sb86, sb96 # 7174
+xors 4, 1, sb88, sb96, sb269 # 7175
+xors 4, 1, sb90, sb267, sb87 # 7176
+xors 4, 1, sb24, sb90, sb94 # 7177
+xors 4, 1, sb92, sb94, sb267 # 7178
+xors 4, 1, sb94, sb265, sb84 # 7179
+xors 4, 1, sb22, sb94, sb82 # 7180
+xors 4, 1, sb19, sb82, sb265 # 7181
+xors 4, 1, sb96, sb263, sb16 # 7182
+xors 4, 1, sb20, sb96, sb14 # 7183
+xors 4, 1, sb98, sb14, sb263 # 7184
+xors 4, 1, sb100, sb261, sb6 # 7185
+xors 4, 1, sb18, sb100, sb25 # 7186
+xors 4, 1, sb102, sb25, sb261 # 7187
+xors 4, 1, sb104, sb259, sb115 # 7188
+xors 4, 1, sb16, sb104, sb63 # 7189
+xors 4, 1, sb21, sb63, sb259 # 7190
+xors 4, 1, sb106, sb257, sb308 # 7191
+xors 4, 1, sb14, sb106, sb306 # 7192
+xors 4, 1, sb109, sb306, sb257 # 7193
+xors 4, 1, sb111, sb255, sb12 # 7194
+xors 4, 1, sb12, sb111, sb304 # 7195
+xors 4, 1, sb113, sb304, sb255 # 7196
+xors 4, 1, sb115, sb253, sb302 # 7197
+xors 4, 1, sb10, sb115, sb60 # 7198
+xors 4, 1, sb23, sb60, sb253 # 7199
+xors 4, 1, sb117, sb251, sb300 # 7200
+xors 4, 1, sb8, sb117, sb298 # 7201
+xors 4, 1, sb119, sb298, sb251 # 7202
+xors 4, 1, sb123, sb249, sb296 # 7203
+xors 4, 1, sb6, sb123, sb294 # 7204
+xors 4, 1, sb25, sb294, sb249 # 7205
+xors 4, 1, sb125, sb247, sb292 # 7206
+xors 4, 1, sb4, sb125, sb58 # 7207
+xors 4, 1, sb126, sb58, sb247 # 7208
+xors 4, 1, sb128, sb245, sb290 # 7209
+xors 4, 1, sb82, sb128, sb288 # 7210
+xors 4, 1, sb129, sb288, sb245 # 7211
+xors 4, 1, sb5, sb243, sb286 # 7212
+xors 4, 1, sb84, sb5, sb284 # 7213
+xors 4, 1, sb131, sb284, sb243 # 7214
+xors 4, 1, sb133, sb241, sb282 # 7215
+xors 4, 1, sb87, sb133, sb2 # 7216
+xors 4, 1, sb135, sb2, sb241 # 7217
+xors 4, 1, sb27, sb239, sb280 # 7218
+xors 4, 1, sb89, sb27, sb56 # 7219
+xors 4, 1, sb137, sb56, sb239 # 7220
+xors 4, 1, sb139, sb237, sb278 # 7221
+xors 4, 1, sb91, sb139, sb276 # 7222
+xors 4, 1, sb141, sb276, sb237 # 7223
+xors 4, 1, sb29, sb235, sb274 # 7224
+xors 4, 1, sb93, sb29, sb272 # 7225
+xors 4, 1, sb143, sb272, sb235 # 7226
+xors 4, 1, sb144, sb233, sb54 # 7227
+xors 4, 1, sb95, sb144, sb270 # 7228
+xors 4, 1, sb145, sb270, sb233 # 7229
+xors 4, 1, sb148, sb231, sb268 # 7230
+xors 4, 1, sb97, sb148, sb266 # 7231
+xors 4, 1, sb147, sb266, sb231 # 7232
+xors 4, 1, sb152, sb229, sb264 # 7233
+xors 4, 1, sb99, sb152, sb262 # 7234
+xors 4, 1, sb149, sb262, sb229 # 7235
+xors 4, 1, sb156, sb227, sb52 # 7236
+xors 4, 1, sb101, sb156, sb260 # 7237
+xors 4, 1, sb151, sb260, sb227 # 7238
+xors 4, 1, sb157, sb225, sb258 # 7239
+xors 4, 1, sb108, sb157, sb51 # 7240
+xors 4, 1, sb153, sb51, sb225 # 7241
+xors 4, 1, sb1, sb223, sb256 # 7242
+xors 4, 1, sb105, sb1, sb254 # 7243
+xors 4, 1, sb155, sb254, sb223 # 7244
+xors 4, 1, sb0, sb221, sb252 # 7245
+xors 4, 1, sb107, sb0, sb250 # 7246
+xors 4, 1, sb158, sb250, sb221 # 7247
+xors 4, 1, sb159, sb219, sb248 # 7248
+xors 4, 1, sb110, sb159, sb246 # 7249
+xors 4, 1, sb160, sb246, sb219 # 7250
+xors 4, 1, sb161, sb217, sb242 # 7251
+xors 4, 1, sb112, sb161, sb48 # 7252
+xors 4, 1, sb163, sb48, sb217 # 7253
+xors 4, 1, sb162, sb215, sb240 # 7254
+xors 4, 1, sb114, sb162, sb238 # 7255
+xors 4, 1, sb165, sb238, sb215 # 7256
+xors 4, 1, sb164, sb212, sb236 # 7257
+xors 4, 1, sb116, sb164, sb234 # 7258
+xors 4, 1, sb167, sb234, sb212 # 7259
+xors 4, 1, sb166, sb210, sb232 # 7260
+xors 4, 1, sb118, sb166, sb9 # 7261
+xors 4, 1, sb169, sb9, sb210 # 7262
+xors 4, 1, sb168, sb208, sb230 # 7263
+xors 4, 1, sb121, sb168, sb228 # 7264
+xors 4, 1, sb171, sb228, sb208 # 7265
+xors 4, 1, sb170, sb213, sb226 # 7266
+xors 4, 1, sb122, sb170, sb224 # 7267
+xors 4, 1, sb173, sb224, sb213 # 7268
+xors 4, 1, sb172, sb204, sb222 # 7269
+xors 4, 1, sb124, sb172, sb220 # 7270
+xors 4, 1, sb177, sb220, sb204 # 7271
+xors 4, 1, sb174, sb202, sb218 # 7272
+xors 4, 1, sb127, sb174, sb43 # 7273
+xors 4, 1, sb175, sb43, sb202 # 7274
+xors 4, 1, sb176, sb200, sb216 # 7275
+xors 4, 1, sb130, sb176, sb214 # 7276
+xors 4, 1, sb178, sb214, sb200 # 7277
+xors 4, 1, sb179, sb198, sb211 # 7278
+xors 4, 1, sb132, sb179, sb209 # 7279
+xors 4, 1, sb180, sb209, sb198 # 7280
+xors 4, 1, sb183, sb196, sb207 # 7281
+xors 4, 1, sb134, sb183, sb206 # 7282
+xors 4, 1, sb181, sb206, sb196 # 7283
+xors 4, 1, sb37, sb194, sb205 # 7284
+xors 4, 1, sb136, sb37, sb41 # 7285
+xors 4, 1, sb39, sb41, sb194 # 7286
+xors 4, 1, sb40, sb192, sb203 # 7287
+xors 4, 1, sb138, sb40, sb201 # 7288
+xors 4, 1, sb41, sb201, sb192 # 7289
+xors 4, 1, sb43, sb190, sb199 # 7290
+xors 4, 1, sb140, sb43, sb197 # 7291
+xors 4, 1, sb9, sb197, sb190 # 7292
+xors 4, 1, sb48, sb188, sb195 # 7293
+xors 4, 1, sb142, sb48, sb193 # 7294
+xors 4, 1, sb51, sb193, sb188 # 7295
+xors 4, 1, sb52, sb186, sb191 # 7296
+xors 4, 1, sb146, sb52, sb189 # 7297
+xors 4, 1, sb54, sb189, sb186 # 7298
+xors 4, 1, sb56, sb184, sb187 # 7299
+xors 4, 1, sb150, sb56, sb185 # 7300
+xors 4, 1, sb58, sb185, sb184 # 7301
+xors 4, 1, sb60, sb182, sb154 # 7302
+xors 4, 1, sb154, sb60, sb315 # 7303
+xors 4, 1, sb63, sb315, sb182 # 7304
+ands 256, 1, sb315, sb316, sb317, 1, sb308, sb318, sb103, 1, sb306, sb120, sb244, 1, sb304, sb283, sb285, 1, sb302, sb287, sb289, 1, sb300, sb313, sb3, 1, sb298, sb31, sb33, 1, sb296, sb35, sb7, 1, sb294, sb42, sb45, 1, sb292, sb11, sb62, 1, sb290, sb65, sb13, 1, sb288, sb15, sb68, 1, sb286, sb69, sb70, 1, sb284, sb71, sb72, 1, sb282, sb73, sb74, 1, sb280, sb75, sb76, 1, sb278, sb77, sb78, 1, sb276, sb79, sb80, 1, sb274, sb81, sb83, 1, sb2, sb17, sb85, 1, sb272, sb86, sb88, 1, sb270, sb90, sb92, 1, sb268, sb94, sb19, 1, sb266, sb96, sb98, 1, sb264, sb100, sb102, 1, sb262, sb104, sb21, 1, sb260, sb106, sb109, 1, sb258, sb111, sb113, 1, sb256, sb115, sb23, 1, sb254, sb117, sb119, 1, sb252, sb123, sb25, 1, sb250, sb125, sb126, 1, sb248, sb128, sb129, 1, sb246, sb5, sb131, 1, sb242, sb133, sb135, 1, sb240, sb27, sb137, 1, sb238, sb139, sb141, 1, sb236, sb29, sb143, 1, sb234, sb144, sb145, 1, sb232, sb148, sb147, 1, sb230, sb152, sb149, 1, sb228, sb156, sb151, 1, sb226, sb157, sb153, 1, sb224, sb1, sb155, 1, sb222, sb0, sb158, 1, sb220, sb159, sb160, 1, sb218, sb161, sb163, 1, sb216, sb162, sb165, 1, sb214, sb164, sb167, 1, sb211, sb166, sb169, 1, sb209, sb168, sb171, 1, sb207, sb170, sb173, 1, sb206, sb172, sb177, 1, sb205, sb174, sb175, 1, sb203, sb176, sb178, 1, sb201, sb179, sb180, 1, sb199, sb183, sb181, 1, sb197, sb37, sb39, 1, sb195, sb40, sb41, 1, sb193, sb43, sb9, 1, sb191, sb48, sb51, 1, sb189, sb52, sb54, 1, sb187, sb56, sb58, 1, sb185, sb60, sb63 # 7305
+xors 4, 1, sb65, sb310, sb315 # 7306
+xors 4, 1, sb63, sb312, sb308 # 7307
+xors 4, 1, sb60, sb314, sb306 # 7308
+xors 4, 1, sb58, sb311, sb304 # 7309
+xors 4, 1, sb56, sb309, sb302 # 7310
+xors 4, 1, sb54, sb307, sb300 # 7311
+xors 4, 1, sb52, sb305, sb298 # 7312
+xors 4, 1, sb51, sb303, sb296 # 7313
+xors 4, 1, sb48, sb301, sb294 # 7314
+xors 4, 1, sb41, sb299, sb292 # 7315
+xors 4, 1, sb40, sb297, sb290 # 7316
+xors 4, 1, sb43, sb295, sb288 # 7317
+xors 4, 1, sb39, sb293, sb286 # 7318
+xors 4, 1, sb37, sb291, sb284 # 7319
+xors 4, 1, sb35, sb281, sb282 # 7320
+xors 4, 1, sb33, sb279, sb280 # 7321
+xors 4, 1, sb31, sb277, sb278 # 7322
+xors 4, 1, sb29, sb275, sb276 # 7323
+xors 4, 1, sb27, sb273, sb274 # 7324
+xors 4, 1, sb25, sb271, sb2 # 7325
+xors 4, 1, sb23, sb269, sb272 # 7326
+xors 4, 1, sb21, sb267, sb270 # 7327
+xors 4, 1, sb19, sb265, sb268 # 7328
+xors 4, 1, sb17, sb263, sb266 # 7329
+xors 4, 1, sb15, sb261, sb264 # 7330
+xors 4, 1, sb13, sb259, sb262 # 7331
+xors 4, 1, sb11, sb257, sb260 # 7332
+xors 4, 1, sb9, sb255, sb258 # 7333
+xors 4, 1, sb7, sb253, sb256 # 7334
+xors 4, 1, sb5, sb251, sb254 # 7335
+xors 4, 1, sb3, sb249, sb252 # 7336
+xors 4, 1, sb83, sb247, sb250 # 7337
+xors 4, 1, sb86, sb245, sb248 # 7338
+xors 4, 1, sb88, sb243, sb246 # 7339
+xors 4, 1, sb90, sb241, sb242 # 7340
+xors 4, 1, sb92, sb239, sb240 # 7341
+xors 4, 1, sb94, sb237, sb238 # 7342
+xors 4, 1, sb96, sb235, sb236 # 7343
+xors 4, 1, sb98, sb233, sb234 # 7344
+xors 4, 1, sb100, sb231, sb232 # 7345
+xors 4, 1, sb102, sb229, sb230 # 7346
+xors 4, 1, sb104, sb227, sb228 # 7347
+xors 4, 1, sb106, sb225, sb226 # 7348
+xors 4, 1, sb109, sb223, sb224 # 7349
+xors 4, 1, sb111, sb221, sb222 # 7350
+xors 4, 1, sb113, sb219, sb220 # 7351
+xors 4, 1, sb115, sb217, sb218 # 7352
+xors 4, 1, sb117, sb215, sb216 # 7353
+xors 4, 1, sb119, sb212, sb214 # 7354
+xors 4, 1, sb128, sb210, sb211 # 7355
+xors 4, 1, sb123, sb208, sb209 # 7356
+xors 4, 1, sb125, sb213, sb207 # 7357
+xors 4, 1, sb129, sb204, sb206 # 7358
+xors 4, 1, sb131, sb202, sb205 # 7359
+xors 4, 1, sb133, sb200, sb203 # 7360
+xors 4, 1, sb135, sb198, sb201 # 7361
+xors 4, 1, sb137, sb196, sb199 # 7362
+xors 4, 1, sb139, sb194, sb197 # 7363
+xors 4, 1, sb141, sb192, sb195 # 7364
+xors 4, 1, sb144, sb190, sb193 # 7365
+xors 4, 1, sb148, sb188, sb191 # 7366
+xors 4, 1, sb152, sb186, sb189 # 7367
+xors 4, 1, sb156, sb184, sb187 # 7368
+xors 4, 1, sb45, sb182, sb185 # 7369
+xors 4, 1, sb244, sb3, sb4 # 7370
+xors 4, 1, sb68, sb5, sb6 # 7371
+xors 4, 1, sb246, sb7, sb8 # 7372
+xors 4, 1, sb74, sb9, sb10 # 7373
+xors 4, 1, sb248, sb11, sb12 # 7374
+xors 4, 1, sb69, sb13, sb14 # 7375
+xors 4, 1, sb250, sb15, sb16 # 7376
+xors 4, 1, sb70, sb17, sb18 # 7377
+xors 4, 1, sb252, sb19, sb20 # 7378
+xors 4, 1, sb71, sb21, sb22 # 7379
+xors 4, 1, sb254, sb23, sb24 # 7380
+xors 4, 1, sb72, sb25, sb26 # 7381
+xors 4, 1, sb256, sb27, sb28 # 7382
+xors 4, 1, sb73, sb29, sb30 # 7383
+xors 4, 1, sb258, sb31, sb32 # 7384
+xors 4, 1, sb77, sb33, sb34 # 7385
+xors 4, 1, sb260, sb35, sb36 # 7386
+xors 4, 1, sb75, sb37, sb38 # 7387
+xors 4, 1, sb262, sb39, sb44 # 7388
+xors 4, 1, sb76, sb43, sb46 # 7389
+xors 4, 1, sb264, sb40, sb47 # 7390
+xors 4, 1, sb78, sb41, sb49 # 7391
+xors 4, 1, sb266, sb48, sb50 # 7392
+xors 4, 1, sb85, sb51, sb53 # 7393
+xors 4, 1, sb268, sb52, sb57 # 7394
+xors 4, 1, sb79, sb54, sb55 # 7395
+xors 4, 1, sb270, sb56, sb64 # 7396
+xors 4, 1, sb80, sb58, sb59 # 7397
+xors 4, 1, sb272, sb60, sb61 # 7398
+xors 4, 1, sb81, sb63, sb67 # 7399
+dabit s7, sb62 # 7400
+mulsi s3, s7, 2 # 7401
+dabit s1, sb181 # 7402
+xors 4, 1, sb42, sb181, sb83 # 7403
+mulsi s2, s1, 2 # 7404
+xors 4, 1, sb157, sb82, sb83 # 7405
+xors 4, 1, sb283, sb84, sb86 # 7406
+xors 4, 1, sb158, sb87, sb88 # 7407
+xors 4, 1, sb285, sb89, sb90 # 7408
+xors 4, 1, sb159, sb91, sb92 # 7409
+xors 4, 1, sb287, sb93, sb94 # 7410
+xors 4, 1, sb160, sb95, sb96 # 7411
+xors 4, 1, sb289, sb97, sb98 # 7412
+xors 4, 1, sb161, sb99, sb100 # 7413
+xors 4, 1, sb291, sb101, sb102 # 7414
+xors 4, 1, sb163, sb108, sb104 # 7415
+xors 4, 1, sb293, sb105, sb106 # 7416
+xors 4, 1, sb165, sb107, sb109 # 7417
+xors 4, 1, sb295, sb110, sb111 # 7418
+xors 4, 1, sb167, sb112, sb113 # 7419
+xors 4, 1, sb297, sb114, sb115 # 7420
+xors 4, 1, sb169, sb116, sb117 # 7421
+xors 4, 1, sb299, sb118, sb119 # 7422
+xors 4, 1, sb171, sb121, sb128 # 7423
+xors 4, 1, sb301, sb122, sb123 # 7424
+xors 4, 1, sb173, sb124, sb125 # 7425
+xors 4, 1, sb303, sb127, sb129 # 7426
+xors 4, 1, sb177, sb130, sb131 # 7427
+xors 4, 1, sb305, sb132, sb133 # 7428
+xors 4, 1, sb175, sb134, sb135 # 7429
+xors 4, 1, sb307, sb136, sb137 # 7430
+xors 4, 1, sb178, sb138, sb139 # 7431
+xors 4, 1, sb309, sb140, sb141 # 7432
+xors 4, 1, sb179, sb142, sb144 # 7433
+xors 4, 1, sb311, sb146, sb148 # 7434
+xors 4, 1, sb180, sb150, sb152 # 7435
+xors 4, 1, sb313, sb154, sb156 # 7436
+ands 376, 1, sb243, sb3, sb4, 1, sb245, sb5, sb6, 1, sb241, sb7, sb8, 1, sb247, sb9, sb10, 1, sb239, sb11, sb12, 1, sb249, sb13, sb14, 1, sb237, sb15, sb16, 1, sb251, sb17, sb18, 1, sb235, sb19, sb20, 1, sb253, sb21, sb22, 1, sb233, sb23, sb24, 1, sb255, sb25, sb26, 1, sb231, sb27, sb28, 1, sb257, sb29, sb30, 1, sb229, sb31, sb32, 1, sb259, sb33, sb34, 1, sb227, sb35, sb36, 1, sb261, sb37, sb38, 1, sb225, sb39, sb44, 1, sb263, sb43, sb46, 1, sb223, sb40, sb47, 1, sb265, sb41, sb49, 1, sb221, sb48, sb50, 1, sb267, sb51, sb53, 1, sb219, sb52, sb57, 1, sb269, sb54, sb55, 1, sb217, sb56, sb64, 1, sb271, sb58, sb59, 1, sb215, sb60, sb61, 1, sb273, sb63, sb67, 1, sb282, sb65, sb66, 1, sb143, sb244, sb68, 1, sb274, sb246, sb74, 1, sb145, sb248, sb69, 1, sb275, sb250, sb70, 1, sb147, sb252, sb71, 1, sb276, sb254, sb72, 1, sb149, sb256, sb73, 1, sb277, sb258, sb77, 1, sb151, sb260, sb75, 1, sb278, sb262, sb76, 1, sb153, sb264, sb78, 1, sb279, sb266, sb85, 1, sb155, sb268, sb79, 1, sb280, sb270, sb80, 1, sb281, sb272, sb81, 1, sb284, sb82, sb83, 1, sb211, sb84, sb86, 1, sb286, sb87, sb88, 1, sb209, sb89, sb90, 1, sb288, sb91, sb92, 1, sb207, sb93, sb94, 1, sb290, sb95, sb96, 1, sb205, sb97, sb98, 1, sb292, sb99, sb100, 1, sb203, sb101, sb102, 1, sb294, sb108, sb104, 1, sb201, sb105, sb106, 1, sb296, sb107, sb109, 1, sb199, sb110, sb111, 1, sb298, sb112, sb113, 1, sb197, sb114, sb115, 1, sb300, sb116, sb117, 1, sb195, sb118, sb119, 1, sb302, sb121, sb128, 1, sb193, sb122, sb123, 1, sb304, sb124, sb125, 1, sb191, sb127, sb129, 1, sb306, sb130, sb131, 1, sb189, sb132, sb133, 1, sb308, sb134, sb135, 1, sb187, sb136, sb137, 1, sb310, sb138, sb139, 1, sb185, sb140, sb141, 1, sb312, sb142, sb144, 1, sb183, sb146, sb148, 1, sb314, sb150, sb152, 1, sb126, sb154, sb156, 1, sb315, sb283, sb157, 1, sb162, sb285, sb158, 1, sb316, sb287, sb159, 1, sb164, sb289, sb160, 1, sb317, sb291, sb161, 1, sb166, sb293, sb163, 1, sb318, sb295, sb165, 1, sb168, sb297, sb167, 1, sb120, sb299, sb169, 1, sb170, sb301, sb171, 1, sb0, sb303, sb173, 1, sb172, sb305, sb177, 1, sb1, sb307, sb175, 1, sb174, sb309, sb178, 1, sb2, sb311, sb179, 1, sb176, sb313, sb180 # 7437
+ands 188, 1, sb242, sb244, sb245, 1, sb240, sb246, sb247, 1, sb238, sb248, sb249, 1, sb236, sb250, sb251, 1, sb234, sb252, sb253, 1, sb232, sb254, sb255, 1, sb230, sb256, sb257, 1, sb228, sb258, sb259, 1, sb226, sb260, sb261, 1, sb224, sb262, sb263, 1, sb222, sb264, sb265, 1, sb220, sb266, sb267, 1, sb218, sb268, sb269, 1, sb216, sb270, sb271, 1, sb214, sb272, sb273, 1, sb92, sb143, sb274, 1, sb157, sb145, sb275, 1, sb94, sb147, sb276, 1, sb158, sb149, sb277, 1, sb96, sb151, sb278, 1, sb159, sb153, sb279, 1, sb160, sb155, sb280, 1, sb212, sb281, sb282, 1, sb210, sb283, sb284, 1, sb208, sb285, sb286, 1, sb206, sb287, sb288, 1, sb204, sb289, sb290, 1, sb202, sb291, sb292, 1, sb200, sb293, sb294, 1, sb198, sb295, sb296, 1, sb196, sb297, sb298, 1, sb194, sb299, sb300, 1, sb192, sb301, sb302, 1, sb190, sb303, sb304, 1, sb188, sb305, sb306, 1, sb186, sb307, sb308, 1, sb184, sb309, sb310, 1, sb182, sb311, sb312, 1, sb125, sb313, sb314, 1, sb178, sb162, sb315, 1, sb101, sb164, sb316, 1, sb179, sb166, sb317, 1, sb103, sb168, sb318, 1, sb180, sb170, sb120, 1, sb105, sb172, sb0, 1, sb181, sb174, sb1, 1, sb107, sb176, sb2 # 7438
+xors 4, 1, sb142, sb242, sb243 # 7439
+xors 4, 1, sb144, sb240, sb241 # 7440
+xors 4, 1, sb140, sb238, sb239 # 7441
+xors 4, 1, sb146, sb236, sb237 # 7442
+xors 4, 1, sb138, sb234, sb235 # 7443
+xors 4, 1, sb148, sb232, sb233 # 7444
+xors 4, 1, sb136, sb230, sb231 # 7445
+xors 4, 1, sb150, sb228, sb229 # 7446
+xors 4, 1, sb134, sb226, sb227 # 7447
+xors 4, 1, sb152, sb224, sb225 # 7448
+xors 4, 1, sb132, sb222, sb223 # 7449
+xors 4, 1, sb154, sb220, sb221 # 7450
+xors 4, 1, sb130, sb218, sb219 # 7451
+xors 4, 1, sb156, sb216, sb217 # 7452
+xors 4, 1, sb213, sb214, sb215 # 7453
+xors 4, 1, sb161, sb212, sb213 # 7454
+xors 4, 1, sb163, sb210, sb211 # 7455
+xors 4, 1, sb124, sb208, sb209 # 7456
+xors 4, 1, sb165, sb206, sb207 # 7457
+xors 4, 1, sb122, sb204, sb205 # 7458
+xors 4, 1, sb167, sb202, sb203 # 7459
+xors 4, 1, sb120, sb200, sb201 # 7460
+xors 4, 1, sb169, sb198, sb199 # 7461
+xors 4, 1, sb118, sb196, sb197 # 7462
+xors 4, 1, sb171, sb194, sb195 # 7463
+xors 4, 1, sb116, sb192, sb193 # 7464
+xors 4, 1, sb173, sb190, sb191 # 7465
+xors 4, 1, sb114, sb188, sb189 # 7466
+xors 4, 1, sb175, sb186, sb187 # 7467
+xors 4, 1, sb112, sb184, sb185 # 7468
+xors 4, 1, sb177, sb182, sb183 # 7469
+ands 92, 1, sb141, sb143, sb144, 1, sb139, sb145, sb146, 1, sb137, sb147, sb148, 1, sb135, sb149, sb150, 1, sb133, sb151, sb152, 1, sb131, sb153, sb154, 1, sb129, sb155, sb156, 1, sb67, sb92, sb157, 1, sb98, sb94, sb158, 1, sb99, sb96, sb159, 1, sb127, sb160, sb161, 1, sb123, sb162, sb163, 1, sb121, sb164, sb165, 1, sb119, sb166, sb167, 1, sb117, sb168, sb169, 1, sb115, sb170, sb171, 1, sb113, sb172, sb173, 1, sb111, sb174, sb175, 1, sb82, sb176, sb177, 1, sb109, sb101, sb178, 1, sb71, sb103, sb179, 1, sb110, sb105, sb180, 1, sb73, sb107, sb181 # 7470
+xors 4, 1, sb91, sb141, sb142 # 7471
+xors 4, 1, sb93, sb139, sb140 # 7472
+xors 4, 1, sb89, sb137, sb138 # 7473
+xors 4, 1, sb95, sb135, sb136 # 7474
+xors 4, 1, sb87, sb133, sb134 # 7475
+xors 4, 1, sb97, sb131, sb132 # 7476
+xors 4, 1, sb128, sb129, sb130 # 7477
+xors 4, 1, sb100, sb127, sb128 # 7478
+xors 4, 1, sb83, sb125, sb126 # 7479
+xors 4, 1, sb102, sb123, sb124 # 7480
+xors 4, 1, sb81, sb121, sb122 # 7481
+xors 4, 1, sb104, sb119, sb120 # 7482
+xors 4, 1, sb79, sb117, sb118 # 7483
+xors 4, 1, sb106, sb115, sb116 # 7484
+xors 4, 1, sb77, sb113, sb114 # 7485
+xors 4, 1, sb108, sb111, sb112 # 7486
+ands 44, 1, sb90, sb92, sb93, 1, sb88, sb94, sb95, 1, sb86, sb96, sb97, 1, sb69, sb67, sb98, 1, sb84, sb99, sb100, 1, sb80, sb101, sb102, 1, sb78, sb103, sb104, 1, sb76, sb105, sb106, 1, sb60, sb107, sb108, 1, sb75, sb71, sb109, 1, sb52, sb73, sb110 # 7487
+xors 4, 1, sb66, sb90, sb91 # 7488
+xors 4, 1, sb68, sb88, sb89 # 7489
+xors 4, 1, sb85, sb86, sb87 # 7490
+xors 4, 1, sb70, sb84, sb85 # 7491
+xors 4, 1, sb61, sb82, sb83 # 7492
+xors 4, 1, sb72, sb80, sb81 # 7493
+xors 4, 1, sb59, sb78, sb79 # 7494
+xors 4, 1, sb74, sb76, sb77 # 7495
+ands 20, 1, sb65, sb67, sb68, 1, sb63, sb69, sb70, 1, sb58, sb71, sb72, 1, sb56, sb73, sb74, 1, sb54, sb52, sb75 # 7496
+xors 4, 1, sb64, sb65, sb66 # 7497
+xors 4, 1, sb55, sb63, sb64 # 7498
+xors 4, 1, sb41, sb62, sb55 # 7499
+xors 4, 1, sb57, sb60, sb61 # 7500
+xors 4, 1, sb53, sb58, sb59 # 7501
+xors 4, 1, sb51, sb56, sb57 # 7502
+ands 8, 1, sb50, sb52, sb53, 1, sb48, sb54, sb55 # 7503
+xors 4, 1, sb49, sb50, sb51 # 7504
+xors 4, 1, sb47, sb48, sb49 # 7505
+dabit s8, sb46 # 7506
+xors 4, 1, sb40, sb46, sb47 # 7507
+mulsi s6, s8, 2 # 7508
+dabit s0, sb44 # 7509
+xors 4, 1, sb43, sb44, sb45 # 7510
+reveal 12, 1, cb3, sb40, 1, cb2, sb41, 1, cb1, sb42, 1, cb0, sb43 # 7511
+convcbitvec 1, ci0, cb3 # 7512
+convint c1, ci0 # 7513
+addm s5, s8, c1 # 7514
+convint c0, ci0 # 7515
+mulm s8, s6, c0 # 7516
+subs s6, s5, s8 # 7517
+movs s5, s6 # 7518
+convcbitvec 1, ci0, cb2 # 7519
+convint c1, ci0 # 7520
+addm s6, s7, c1 # 7521
+convint c0, ci0 # 7522
+mulm s7, s3, c0 # 7523
+subs s3, s6, s7 # 7524
+movs s6, s3 # 7525
+convcbitvec 1, ci0, cb1 # 7526
+convint c1, ci0 # 7527
+addm s3, s1, c1 # 7528
+convint c0, ci0 # 7529
+mulm s1, s2, c0 # 7530
+subs s2, s3, s1 # 7531
+movs s1, s2 # 7532
+adds s3, s6, s1 # 7533
+convcbitvec 1, ci0, cb0 # 7534
+convint c1, ci0 # 7535
+addm s1, s0, c1 # 7536
+mulsi s2, s0, 2 # 7537
+convint c0, ci0 # 7538
+mulm s6, s2, c0 # 7539
+subs s0, s1, s6 # 7540
+movs s6, s0 # 7541
+adds s2, s5, s6 # 7542
+shrsi s1, s4, 32 # 7543
+adds s0, s1, s3 # 7544
+ldi c0, 2 # 7545
+mulci c1, c0, 2147483647 # 7546
+addci c0, c1, 2 # 7547
+mulm s1, s2, c0 # 7548
+subs s6, s0, s1 # 7549
+ldi c0, 1 # 7550
+mulci c1, c0, 2147483647 # 7551
+addci c0, c1, 1 # 7552
+subml s5, s6, c0 # 7553
+addsi s4, s5, 1 # 7554
+ldi c0, 1 # 7555
+mulci c1, c0, 2147483647 # 7556
+addci c0, c1, 1 # 7557
+addm s3, s4, c0 # 7558
+split 194, 3, s3, sb38, sb39, sb201, sb36, sb37, sb197, sb34, sb35, sb193, sb32, sb33, sb189, sb30, sb31, sb185, sb28, sb29, sb181, sb26, sb27, sb177, sb24, sb25, sb173, sb22, sb23, sb171, sb20, sb21, sb169, sb18, sb19, sb167, sb16, sb17, sb165, sb14, sb15, sb163, sb12, sb13, sb161, sb7, sb11, sb159, sb1, sb102, sb157, sb317, sb318, sb155, sb315, sb316, sb153, sb313, sb314, sb151, sb311, sb312, sb149, sb309, sb310, sb147, sb307, sb308, sb145, sb305, sb306, sb143, sb303, sb304, sb141, sb301, sb302, sb139, sb299, sb300, sb137, sb297, sb298, sb135, sb295, sb296, sb133, sb293, sb294, sb131, sb291, sb292, sb129, sb289, sb290, sb127, sb287, sb288, sb125, sb285, sb286, sb123, sb283, sb284, sb121, sb128, sb156, sb119, sb52, sb154, sb117, sb132, sb152, sb115, sb47, sb150, sb113, sb45, sb148, sb111, sb144, sb146, sb109, sb203, sb41, sb107, sb195, sb199, sb105, sb191, sb140, sb103, sb183, sb187, sb101, sb175, sb179, sb99, sb170, sb172, sb97, sb166, sb168, sb95, sb162, sb164, sb93, sb158, sb160, sb91, sb130, sb134, sb89, sb138, sb142, sb87, sb118, sb136, sb85, sb122, sb104, sb81, sb126, sb100, sb77, sb96, sb98, sb75, sb120, sb94, sb73, sb90, sb92, sb71, sb86, sb88, sb68, sb79, sb83, sb65, sb76, sb116, sb63, sb72, sb74, sb60, sb64, sb67, sb57, sb114, sb69, sb53, sb59, sb61, sb49 # 7559
+xors 4, 1, sb205, sb201, sb39 # 7560
+xors 4, 1, sb207, sb38, sb201 # 7561
+xors 4, 1, sb209, sb197, sb37 # 7562
+xors 4, 1, sb251, sb209, sb36 # 7563
+xors 4, 1, sb211, sb36, sb197 # 7564
+xors 4, 1, sb213, sb193, sb35 # 7565
+xors 4, 1, sb250, sb213, sb34 # 7566
+xors 4, 1, sb215, sb34, sb193 # 7567
+xors 4, 1, sb217, sb189, sb33 # 7568
+xors 4, 1, sb248, sb217, sb32 # 7569
+xors 4, 1, sb219, sb32, sb189 # 7570
+xors 4, 1, sb221, sb185, sb31 # 7571
+xors 4, 1, sb246, sb221, sb30 # 7572
+xors 4, 1, sb223, sb30, sb185 # 7573
+xors 4, 1, sb225, sb181, sb29 # 7574
+xors 4, 1, sb244, sb225, sb28 # 7575
+xors 4, 1, sb227, sb28, sb181 # 7576
+xors 4, 1, sb229, sb177, sb27 # 7577
+xors 4, 1, sb242, sb229, sb26 # 7578
+xors 4, 1, sb231, sb26, sb177 # 7579
+xors 4, 1, sb233, sb173, sb25 # 7580
+xors 4, 1, sb240, sb233, sb24 # 7581
+xors 4, 1, sb235, sb24, sb173 # 7582
+xors 4, 1, sb237, sb171, sb23 # 7583
+xors 4, 1, sb238, sb237, sb22 # 7584
+xors 4, 1, sb239, sb22, sb171 # 7585
+xors 4, 1, sb241, sb169, sb21 # 7586
+xors 4, 1, sb236, sb241, sb20 # 7587
+xors 4, 1, sb243, sb20, sb169 # 7588
+xors 4, 1, sb245, sb167, sb19 # 7589
+xors 4, 1, sb234, sb245, sb18 # 7590
+xors 4, 1, sb247, sb18, sb167 # 7591
+xors 4, 1, sb249, sb165, sb17 # 7592
+xors 4, 1, sb232, sb249, sb16 # 7593
+xors 4, 1, sb252, sb16, sb165 # 7594
+xors 4, 1, sb253, sb163, sb15 # 7595
+xors 4, 1, sb230, sb253, sb14 # 7596
+xors 4, 1, sb254, sb14, sb163 # 7597
+xors 4, 1, sb255, sb161, sb13 # 7598
+xors 4, 1, sb228, sb255, sb12 # 7599
+xors 4, 1, sb256, sb12, sb161 # 7600
+xors 4, 1, sb257, sb159, sb11 # 7601
+xors 4, 1, sb226, sb257, sb7 # 7602
+xors 4, 1, sb258, sb7, sb159 # 7603
+xors 4, 1, sb259, sb157, sb102 # 7604
+xors 4, 1, sb224, sb259, sb1 # 7605
+xors 4, 1, sb260, sb1, sb157 # 7606
+xors 4, 1, sb261, sb155, sb318 # 7607
+xors 4, 1, sb222, sb261, sb317 # 7608
+xors 4, 1, sb262, sb317, sb155 # 7609
+xors 4, 1, sb263, sb153, sb316 # 7610
+xors 4, 1, sb220, sb263, sb315 # 7611
+xors 4, 1, sb264, sb315, sb153 # 7612
+xors 4, 1, sb265, sb151, sb314 # 7613
+xors 4, 1, sb218, sb265, sb313 # 7614
+xors 4, 1, sb266, sb313, sb151 # 7615
+xors 4, 1, sb267, sb149, sb312 # 7616
+xors 4, 1, sb216, sb267, sb311 # 7617
+xors 4, 1, sb268, sb311, sb149 # 7618
+xors 4, 1, sb269, sb147, sb310 # 7619
+xors 4, 1, sb214, sb269, sb309 # 7620
+xors 4, 1, sb270, sb309, sb147 # 7621
+xors 4, 1, sb271, sb145, sb308 # 7622
+xors 4, 1, sb212, sb271, sb307 # 7623
+xors 4, 1, sb272, sb307, sb145 # 7624
+xors 4, 1, sb273, sb143, sb306 # 7625
+xors 4, 1, sb210, sb273, sb305 # 7626
+xors 4, 1, sb274, sb305, sb143 # 7627
+xors 4, 1, sb275, sb141, sb304 # 7628
+xors 4, 1, sb208, sb275, sb303 # 7629
+xors 4, 1, sb276, sb303, sb141 # 7630
+xors 4, 1, sb277, sb139, sb302 # 7631
+xors 4, 1, sb206, sb277, sb301 # 7632
+xors 4, 1, sb278, sb301, sb139 # 7633
+xors 4, 1, sb279, sb137, sb300 # 7634
+xors 4, 1, sb204, sb279, sb299 # 7635
+xors 4, 1, sb280, sb299, sb137 # 7636
+xors 4, 1, sb281, sb135, sb298 # 7637
+xors 4, 1, sb202, sb281, sb297 # 7638
+xors 4, 1, sb282, sb297, sb135 # 7639
+xors 4, 1, sb0, sb133, sb296 # 7640
+xors 4, 1, sb200, sb0, sb295 # 7641
+xors 4, 1, sb2, sb295, sb133 # 7642
+xors 4, 1, sb3, sb131, sb294 # 7643
+xors 4, 1, sb198, sb3, sb293 # 7644
+xors 4, 1, sb4, sb293, sb131 # 7645
+xors 4, 1, sb5, sb129, sb292 # 7646
+xors 4, 1, sb196, sb5, sb291 # 7647
+xors 4, 1, sb6, sb291, sb129 # 7648
+xors 4, 1, sb8, sb127, sb290 # 7649
+xors 4, 1, sb194, sb8, sb289 # 7650
+xors 4, 1, sb9, sb289, sb127 # 7651
+xors 4, 1, sb10, sb125, sb288 # 7652
+xors 4, 1, sb192, sb10, sb287 # 7653
+xors 4, 1, sb13, sb287, sb125 # 7654
+xors 4, 1, sb14, sb123, sb286 # 7655
+xors 4, 1, sb190, sb14, sb285 # 7656
+xors 4, 1, sb16, sb285, sb123 # 7657
+xors 4, 1, sb17, sb121, sb284 # 7658
+xors 4, 1, sb188, sb17, sb283 # 7659
+xors 4, 1, sb19, sb283, sb121 # 7660
+xors 4, 1, sb21, sb119, sb156 # 7661
+xors 4, 1, sb186, sb21, sb128 # 7662
+xors 4, 1, sb22, sb128, sb119 # 7663
+xors 4, 1, sb23, sb117, sb154 # 7664
+xors 4, 1, sb184, sb23, sb52 # 7665
+xors 4, 1, sb24, sb52, sb117 # 7666
+xors 4, 1, sb25, sb115, sb152 # 7667
+xors 4, 1, sb182, sb25, sb132 # 7668
+xors 4, 1, sb27, sb132, sb115 # 7669
+xors 4, 1, sb28, sb113, sb150 # 7670
+xors 4, 1, sb180, sb28, sb47 # 7671
+xors 4, 1, sb30, sb47, sb113 # 7672
+xors 4, 1, sb32, sb111, sb148 # 7673
+xors 4, 1, sb178, sb32, sb45 # 7674
+xors 4, 1, sb33, sb45, sb111 # 7675
+xors 4, 1, sb34, sb109, sb146 # 7676
+xors 4, 1, sb176, sb34, sb144 # 7677
+xors 4, 1, sb36, sb144, sb109 # 7678
+xors 4, 1, sb37, sb107, sb41 # 7679
+xors 4, 1, sb174, sb37, sb203 # 7680
+xors 4, 1, sb39, sb203, sb107 # 7681
+xors 4, 1, sb41, sb105, sb199 # 7682
+xors 4, 1, sb45, sb41, sb195 # 7683
+xors 4, 1, sb42, sb195, sb105 # 7684
+xors 4, 1, sb44, sb103, sb140 # 7685
+xors 4, 1, sb43, sb44, sb191 # 7686
+xors 4, 1, sb46, sb191, sb103 # 7687
+xors 4, 1, sb47, sb101, sb187 # 7688
+xors 4, 1, sb40, sb47, sb183 # 7689
+xors 4, 1, sb48, sb183, sb101 # 7690
+xors 4, 1, sb52, sb99, sb179 # 7691
+xors 4, 1, sb35, sb52, sb175 # 7692
+xors 4, 1, sb56, sb175, sb99 # 7693
+xors 4, 1, sb62, sb97, sb172 # 7694
+xors 4, 1, sb31, sb62, sb170 # 7695
+xors 4, 1, sb66, sb170, sb97 # 7696
+xors 4, 1, sb283, sb95, sb168 # 7697
+xors 4, 1, sb29, sb283, sb166 # 7698
+xors 4, 1, sb284, sb166, sb95 # 7699
+xors 4, 1, sb285, sb93, sb164 # 7700
+xors 4, 1, sb26, sb285, sb162 # 7701
+xors 4, 1, sb286, sb162, sb93 # 7702
+xors 4, 1, sb287, sb91, sb160 # 7703
+xors 4, 1, sb20, sb287, sb158 # 7704
+xors 4, 1, sb288, sb158, sb91 # 7705
+xors 4, 1, sb289, sb89, sb134 # 7706
+xors 4, 1, sb18, sb289, sb130 # 7707
+xors 4, 1, sb290, sb130, sb89 # 7708
+xors 4, 1, sb291, sb87, sb142 # 7709
+xors 4, 1, sb12, sb291, sb138 # 7710
+xors 4, 1, sb292, sb138, sb87 # 7711
+xors 4, 1, sb293, sb85, sb136 # 7712
+xors 4, 1, sb11, sb293, sb118 # 7713
+xors 4, 1, sb294, sb118, sb85 # 7714
+xors 4, 1, sb295, sb81, sb104 # 7715
+xors 4, 1, sb7, sb295, sb122 # 7716
+xors 4, 1, sb296, sb122, sb81 # 7717
+xors 4, 1, sb297, sb77, sb100 # 7718
+xors 4, 1, sb1, sb297, sb126 # 7719
+xors 4, 1, sb298, sb126, sb77 # 7720
+xors 4, 1, sb299, sb75, sb98 # 7721
+xors 4, 1, sb84, sb299, sb96 # 7722
+xors 4, 1, sb300, sb96, sb75 # 7723
+xors 4, 1, sb301, sb73, sb94 # 7724
+xors 4, 1, sb82, sb301, sb120 # 7725
+xors 4, 1, sb302, sb120, sb73 # 7726
+xors 4, 1, sb303, sb71, sb92 # 7727
+xors 4, 1, sb80, sb303, sb90 # 7728
+xors 4, 1, sb304, sb90, sb71 # 7729
+xors 4, 1, sb305, sb68, sb88 # 7730
+xors 4, 1, sb78, sb305, sb86 # 7731
+xors 4, 1, sb306, sb86, sb68 # 7732
+xors 4, 1, sb307, sb65, sb83 # 7733
+xors 4, 1, sb15, sb307, sb79 # 7734
+xors 4, 1, sb308, sb79, sb65 # 7735
+xors 4, 1, sb309, sb63, sb116 # 7736
+xors 4, 1, sb70, sb309, sb76 # 7737
+xors 4, 1, sb310, sb76, sb63 # 7738
+xors 4, 1, sb311, sb60, sb74 # 7739
+xors 4, 1, sb38, sb311, sb72 # 7740
+xors 4, 1, sb312, sb72, sb60 # 7741
+xors 4, 1, sb313, sb57, sb67 # 7742
+xors 4, 1, sb58, sb313, sb64 # 7743
+xors 4, 1, sb314, sb64, sb57 # 7744
+xors 4, 1, sb315, sb53, sb69 # 7745
+xors 4, 1, sb54, sb315, sb114 # 7746
+xors 4, 1, sb316, sb114, sb53 # 7747
+xors 4, 1, sb317, sb49, sb61 # 7748
+xors 4, 1, sb50, sb317, sb59 # 7749
+xors 4, 1, sb318, sb59, sb49 # 7750
+ands 256, 1, sb203, sb205, sb207, 1, sb199, sb209, sb211, 1, sb195, sb213, sb215, 1, sb191, sb217, sb219, 1, sb187, sb221, sb223, 1, sb183, sb225, sb227, 1, sb179, sb229, sb231, 1, sb175, sb233, sb235, 1, sb172, sb237, sb239, 1, sb170, sb241, sb243, 1, sb168, sb245, sb247, 1, sb166, sb249, sb252, 1, sb164, sb253, sb254, 1, sb162, sb255, sb256, 1, sb160, sb257, sb258, 1, sb158, sb259, sb260, 1, sb156, sb261, sb262, 1, sb154, sb263, sb264, 1, sb152, sb265, sb266, 1, sb150, sb267, sb268, 1, sb148, sb269, sb270, 1, sb146, sb271, sb272, 1, sb144, sb273, sb274, 1, sb142, sb275, sb276, 1, sb140, sb277, sb278, 1, sb138, sb279, sb280, 1, sb136, sb281, sb282, 1, sb134, sb0, sb2, 1, sb132, sb3, sb4, 1, sb130, sb5, sb6, 1, sb128, sb8, sb9, 1, sb126, sb10, sb13, 1, sb124, sb14, sb16, 1, sb122, sb17, sb19, 1, sb120, sb21, sb22, 1, sb118, sb23, sb24, 1, sb116, sb25, sb27, 1, sb114, sb28, sb30, 1, sb112, sb32, sb33, 1, sb110, sb34, sb36, 1, sb108, sb37, sb39, 1, sb106, sb41, sb42, 1, sb104, sb44, sb46, 1, sb102, sb47, sb48, 1, sb100, sb52, sb56, 1, sb98, sb62, sb66, 1, sb96, sb283, sb284, 1, sb94, sb285, sb286, 1, sb92, sb287, sb288, 1, sb90, sb289, sb290, 1, sb88, sb291, sb292, 1, sb86, sb293, sb294, 1, sb83, sb295, sb296, 1, sb79, sb297, sb298, 1, sb76, sb299, sb300, 1, sb74, sb301, sb302, 1, sb72, sb303, sb304, 1, sb69, sb305, sb306, 1, sb67, sb307, sb308, 1, sb64, sb309, sb310, 1, sb61, sb311, sb312, 1, sb59, sb313, sb314, 1, sb55, sb315, sb316, 1, sb51, sb317, sb318 # 7751
+xors 4, 1, sb4, sb201, sb203 # 7752
+xors 4, 1, sb249, sb197, sb199 # 7753
+xors 4, 1, sb247, sb193, sb195 # 7754
+xors 4, 1, sb245, sb189, sb191 # 7755
+xors 4, 1, sb243, sb185, sb187 # 7756
+xors 4, 1, sb241, sb181, sb183 # 7757
+xors 4, 1, sb239, sb177, sb179 # 7758
+xors 4, 1, sb237, sb173, sb175 # 7759
+xors 4, 1, sb235, sb171, sb172 # 7760
+xors 4, 1, sb233, sb169, sb170 # 7761
+xors 4, 1, sb231, sb167, sb168 # 7762
+xors 4, 1, sb229, sb165, sb166 # 7763
+xors 4, 1, sb227, sb163, sb164 # 7764
+xors 4, 1, sb225, sb161, sb162 # 7765
+xors 4, 1, sb223, sb159, sb160 # 7766
+xors 4, 1, sb221, sb157, sb158 # 7767
+xors 4, 1, sb219, sb155, sb156 # 7768
+xors 4, 1, sb217, sb153, sb154 # 7769
+xors 4, 1, sb215, sb151, sb152 # 7770
+xors 4, 1, sb213, sb149, sb150 # 7771
+xors 4, 1, sb211, sb147, sb148 # 7772
+xors 4, 1, sb209, sb145, sb146 # 7773
+xors 4, 1, sb207, sb143, sb144 # 7774
+xors 4, 1, sb205, sb141, sb142 # 7775
+xors 4, 1, sb203, sb139, sb140 # 7776
+xors 4, 1, sb201, sb137, sb138 # 7777
+xors 4, 1, sb199, sb135, sb136 # 7778
+xors 4, 1, sb197, sb133, sb134 # 7779
+xors 4, 1, sb195, sb131, sb132 # 7780
+xors 4, 1, sb193, sb129, sb130 # 7781
+xors 4, 1, sb191, sb127, sb128 # 7782
+xors 4, 1, sb189, sb125, sb126 # 7783
+xors 4, 1, sb187, sb123, sb124 # 7784
+xors 4, 1, sb185, sb121, sb122 # 7785
+xors 4, 1, sb183, sb119, sb120 # 7786
+xors 4, 1, sb181, sb117, sb118 # 7787
+xors 4, 1, sb179, sb115, sb116 # 7788
+xors 4, 1, sb177, sb113, sb114 # 7789
+xors 4, 1, sb175, sb111, sb112 # 7790
+xors 4, 1, sb46, sb109, sb110 # 7791
+xors 4, 1, sb44, sb107, sb108 # 7792
+xors 4, 1, sb42, sb105, sb106 # 7793
+xors 4, 1, sb36, sb103, sb104 # 7794
+xors 4, 1, sb33, sb101, sb102 # 7795
+xors 4, 1, sb30, sb99, sb100 # 7796
+xors 4, 1, sb27, sb97, sb98 # 7797
+xors 4, 1, sb25, sb95, sb96 # 7798
+xors 4, 1, sb22, sb93, sb94 # 7799
+xors 4, 1, sb17, sb91, sb92 # 7800
+xors 4, 1, sb8, sb89, sb90 # 7801
+xors 4, 1, sb10, sb87, sb88 # 7802
+xors 4, 1, sb5, sb85, sb86 # 7803
+xors 4, 1, sb85, sb81, sb83 # 7804
+xors 4, 1, sb83, sb77, sb79 # 7805
+xors 4, 1, sb81, sb75, sb76 # 7806
+xors 4, 1, sb79, sb73, sb74 # 7807
+xors 4, 1, sb77, sb71, sb72 # 7808
+xors 4, 1, sb74, sb68, sb69 # 7809
+xors 4, 1, sb66, sb65, sb67 # 7810
+xors 4, 1, sb62, sb63, sb64 # 7811
+xors 4, 1, sb56, sb60, sb61 # 7812
+xors 4, 1, sb52, sb57, sb59 # 7813
+xors 4, 1, sb48, sb53, sb55 # 7814
+xors 4, 1, sb3, sb49, sb51 # 7815
+xors 4, 1, sb47, sb48, sb50 # 7816
+xors 4, 1, sb252, sb52, sb54 # 7817
+xors 4, 1, sb97, sb56, sb58 # 7818
+xors 4, 1, sb253, sb62, sb38 # 7819
+xors 4, 1, sb99, sb66, sb70 # 7820
+xors 4, 1, sb254, sb74, sb15 # 7821
+xors 4, 1, sb101, sb77, sb78 # 7822
+xors 4, 1, sb255, sb79, sb80 # 7823
+xors 4, 1, sb103, sb81, sb82 # 7824
+xors 4, 1, sb256, sb83, sb84 # 7825
+xors 4, 1, sb105, sb85, sb1 # 7826
+xors 4, 1, sb257, sb5, sb7 # 7827
+xors 4, 1, sb107, sb10, sb11 # 7828
+xors 4, 1, sb258, sb8, sb12 # 7829
+xors 4, 1, sb109, sb17, sb18 # 7830
+xors 4, 1, sb259, sb22, sb20 # 7831
+xors 4, 1, sb111, sb25, sb26 # 7832
+xors 4, 1, sb260, sb27, sb29 # 7833
+xors 4, 1, sb113, sb30, sb31 # 7834
+xors 4, 1, sb261, sb33, sb35 # 7835
+xors 4, 1, sb115, sb36, sb40 # 7836
+xors 4, 1, sb262, sb42, sb43 # 7837
+xors 4, 1, sb117, sb44, sb45 # 7838
+xors 4, 1, sb263, sb46, sb174 # 7839
+xors 4, 1, sb119, sb175, sb176 # 7840
+xors 4, 1, sb264, sb177, sb178 # 7841
+xors 4, 1, sb121, sb179, sb180 # 7842
+xors 4, 1, sb265, sb181, sb182 # 7843
+xors 4, 1, sb123, sb183, sb184 # 7844
+xors 4, 1, sb266, sb185, sb186 # 7845
+xors 4, 1, sb125, sb187, sb188 # 7846
+xors 4, 1, sb267, sb189, sb190 # 7847
+xors 4, 1, sb127, sb191, sb192 # 7848
+xors 4, 1, sb268, sb193, sb194 # 7849
+xors 4, 1, sb129, sb195, sb196 # 7850
+xors 4, 1, sb269, sb197, sb198 # 7851
+xors 4, 1, sb131, sb199, sb200 # 7852
+xors 4, 1, sb270, sb201, sb202 # 7853
+xors 4, 1, sb133, sb203, sb204 # 7854
+xors 4, 1, sb271, sb205, sb206 # 7855
+xors 4, 1, sb135, sb207, sb208 # 7856
+xors 4, 1, sb272, sb209, sb210 # 7857
+xors 4, 1, sb137, sb211, sb212 # 7858
+xors 4, 1, sb273, sb213, sb214 # 7859
+xors 4, 1, sb139, sb215, sb216 # 7860
+xors 4, 1, sb274, sb217, sb218 # 7861
+xors 4, 1, sb141, sb219, sb220 # 7862
+xors 4, 1, sb275, sb221, sb222 # 7863
+xors 4, 1, sb143, sb223, sb224 # 7864
+xors 4, 1, sb276, sb225, sb226 # 7865
+xors 4, 1, sb145, sb227, sb228 # 7866
+xors 4, 1, sb277, sb229, sb230 # 7867
+xors 4, 1, sb147, sb231, sb232 # 7868
+xors 4, 1, sb278, sb233, sb234 # 7869
+xors 4, 1, sb149, sb235, sb236 # 7870
+xors 4, 1, sb279, sb237, sb238 # 7871
+xors 4, 1, sb151, sb239, sb240 # 7872
+xors 4, 1, sb280, sb241, sb242 # 7873
+xors 4, 1, sb153, sb243, sb244 # 7874
+xors 4, 1, sb281, sb245, sb246 # 7875
+xors 4, 1, sb155, sb247, sb248 # 7876
+xors 4, 1, sb282, sb249, sb250 # 7877
+ands 376, 1, sb95, sb48, sb50, 1, sb96, sb52, sb54, 1, sb94, sb56, sb58, 1, sb98, sb62, sb38, 1, sb93, sb66, sb70, 1, sb100, sb74, sb15, 1, sb92, sb77, sb78, 1, sb102, sb79, sb80, 1, sb91, sb81, sb82, 1, sb104, sb83, sb84, 1, sb90, sb85, sb1, 1, sb106, sb5, sb7, 1, sb89, sb10, sb11, 1, sb108, sb8, sb12, 1, sb88, sb17, sb18, 1, sb110, sb22, sb20, 1, sb87, sb25, sb26, 1, sb112, sb27, sb29, 1, sb86, sb30, sb31, 1, sb114, sb33, sb35, 1, sb60, sb36, sb40, 1, sb116, sb42, sb43, 1, sb32, sb44, sb45, 1, sb118, sb46, sb174, 1, sb68, sb175, sb176, 1, sb120, sb177, sb178, 1, sb64, sb179, sb180, 1, sb122, sb181, sb182, 1, sb34, sb183, sb184, 1, sb124, sb185, sb186, 1, sb14, sb187, sb188, 1, sb126, sb189, sb190, 1, sb9, sb191, sb192, 1, sb128, sb193, sb194, 1, sb6, sb195, sb196, 1, sb130, sb197, sb198, 1, sb2, sb199, sb200, 1, sb132, sb201, sb202, 1, sb0, sb203, sb204, 1, sb134, sb205, sb206, 1, sb76, sb207, sb208, 1, sb136, sb209, sb210, 1, sb72, sb211, sb212, 1, sb138, sb213, sb214, 1, sb41, sb215, sb216, 1, sb140, sb217, sb218, 1, sb39, sb219, sb220, 1, sb142, sb221, sb222, 1, sb37, sb223, sb224, 1, sb144, sb225, sb226, 1, sb28, sb227, sb228, 1, sb146, sb229, sb230, 1, sb24, sb231, sb232, 1, sb148, sb233, sb234, 1, sb21, sb235, sb236, 1, sb150, sb237, sb238, 1, sb19, sb239, sb240, 1, sb152, sb241, sb242, 1, sb16, sb243, sb244, 1, sb154, sb245, sb246, 1, sb13, sb247, sb248, 1, sb156, sb249, sb250, 1, sb173, sb4, sb251, 1, sb23, sb47, sb252, 1, sb157, sb97, sb253, 1, sb49, sb99, sb254, 1, sb158, sb101, sb255, 1, sb51, sb103, sb256, 1, sb159, sb105, sb257, 1, sb53, sb107, sb258, 1, sb160, sb109, sb259, 1, sb55, sb111, sb260, 1, sb161, sb113, sb261, 1, sb57, sb115, sb262, 1, sb162, sb117, sb263, 1, sb59, sb119, sb264, 1, sb163, sb121, sb265, 1, sb61, sb123, sb266, 1, sb164, sb125, sb267, 1, sb63, sb127, sb268, 1, sb165, sb129, sb269, 1, sb65, sb131, sb270, 1, sb166, sb133, sb271, 1, sb67, sb135, sb272, 1, sb167, sb137, sb273, 1, sb69, sb139, sb274, 1, sb168, sb141, sb275, 1, sb71, sb143, sb276, 1, sb169, sb145, sb277, 1, sb73, sb147, sb278, 1, sb170, sb149, sb279, 1, sb75, sb151, sb280, 1, sb171, sb153, sb281, 1, sb172, sb155, sb282 # 7878
+ands 188, 1, sb48, sb47, sb96, 1, sb46, sb97, sb98, 1, sb50, sb99, sb100, 1, sb45, sb101, sb102, 1, sb52, sb103, sb104, 1, sb44, sb105, sb106, 1, sb54, sb107, sb108, 1, sb43, sb109, sb110, 1, sb56, sb111, sb112, 1, sb42, sb113, sb114, 1, sb58, sb115, sb116, 1, sb30, sb117, sb118, 1, sb66, sb119, sb120, 1, sb62, sb121, sb122, 1, sb18, sb123, sb124, 1, sb10, sb125, sb126, 1, sb7, sb127, sb128, 1, sb5, sb129, sb130, 1, sb1, sb131, sb132, 1, sb85, sb133, sb134, 1, sb74, sb135, sb136, 1, sb70, sb137, sb138, 1, sb40, sb139, sb140, 1, sb38, sb141, sb142, 1, sb36, sb143, sb144, 1, sb26, sb145, sb146, 1, sb22, sb147, sb148, 1, sb20, sb149, sb150, 1, sb17, sb151, sb152, 1, sb15, sb153, sb154, 1, sb12, sb155, sb156, 1, sb11, sb23, sb157, 1, sb77, sb49, sb158, 1, sb25, sb51, sb159, 1, sb78, sb53, sb160, 1, sb27, sb55, sb161, 1, sb79, sb57, sb162, 1, sb29, sb59, sb163, 1, sb80, sb61, sb164, 1, sb31, sb63, sb165, 1, sb81, sb65, sb166, 1, sb33, sb67, sb167, 1, sb82, sb69, sb168, 1, sb35, sb71, sb169, 1, sb83, sb73, sb170, 1, sb84, sb75, sb171, 1, sb8, sb172, sb173 # 7879
+xors 4, 1, sb47, sb48, sb95 # 7880
+xors 4, 1, sb48, sb46, sb94 # 7881
+xors 4, 1, sb46, sb50, sb93 # 7882
+xors 4, 1, sb50, sb45, sb92 # 7883
+xors 4, 1, sb45, sb52, sb91 # 7884
+xors 4, 1, sb52, sb44, sb90 # 7885
+xors 4, 1, sb44, sb54, sb89 # 7886
+xors 4, 1, sb54, sb43, sb88 # 7887
+xors 4, 1, sb43, sb56, sb87 # 7888
+xors 4, 1, sb56, sb42, sb86 # 7889
+xors 4, 1, sb42, sb58, sb60 # 7890
+xors 4, 1, sb58, sb30, sb32 # 7891
+xors 4, 1, sb30, sb66, sb68 # 7892
+xors 4, 1, sb60, sb62, sb64 # 7893
+xors 4, 1, sb32, sb18, sb34 # 7894
+xors 4, 1, sb62, sb10, sb14 # 7895
+xors 4, 1, sb34, sb7, sb9 # 7896
+xors 4, 1, sb64, sb5, sb6 # 7897
+xors 4, 1, sb14, sb1, sb2 # 7898
+xors 4, 1, sb66, sb85, sb0 # 7899
+xors 4, 1, sb10, sb74, sb76 # 7900
+xors 4, 1, sb68, sb70, sb72 # 7901
+xors 4, 1, sb7, sb40, sb41 # 7902
+xors 4, 1, sb70, sb38, sb39 # 7903
+xors 4, 1, sb6, sb36, sb37 # 7904
+xors 4, 1, sb72, sb26, sb28 # 7905
+xors 4, 1, sb1, sb22, sb24 # 7906
+xors 4, 1, sb74, sb20, sb21 # 7907
+xors 4, 1, sb18, sb17, sb19 # 7908
+xors 4, 1, sb76, sb15, sb16 # 7909
+xors 4, 1, sb9, sb12, sb13 # 7910
+xors 4, 1, sb85, sb8, sb9 # 7911
+ands 92, 1, sb24, sb23, sb48, 1, sb22, sb49, sb50, 1, sb26, sb51, sb52, 1, sb21, sb53, sb54, 1, sb28, sb55, sb56, 1, sb20, sb57, sb58, 1, sb16, sb59, sb60, 1, sb2, sb61, sb62, 1, sb19, sb63, sb64, 1, sb41, sb65, sb66, 1, sb9, sb67, sb68, 1, sb8, sb69, sb70, 1, sb36, sb71, sb72, 1, sb0, sb73, sb74, 1, sb17, sb75, sb76, 1, sb5, sb11, sb77, 1, sb37, sb25, sb78, 1, sb13, sb27, sb79, 1, sb38, sb29, sb80, 1, sb15, sb31, sb81, 1, sb39, sb33, sb82, 1, sb40, sb35, sb83, 1, sb12, sb84, sb85 # 7912
+xors 4, 1, sb23, sb24, sb47 # 7913
+xors 4, 1, sb24, sb22, sb46 # 7914
+xors 4, 1, sb22, sb26, sb45 # 7915
+xors 4, 1, sb26, sb21, sb44 # 7916
+xors 4, 1, sb21, sb28, sb43 # 7917
+xors 4, 1, sb28, sb20, sb42 # 7918
+xors 4, 1, sb20, sb16, sb30 # 7919
+xors 4, 1, sb30, sb2, sb32 # 7920
+xors 4, 1, sb16, sb19, sb34 # 7921
+xors 4, 1, sb32, sb41, sb14 # 7922
+xors 4, 1, sb2, sb9, sb10 # 7923
+xors 4, 1, sb34, sb8, sb7 # 7924
+xors 4, 1, sb19, sb36, sb6 # 7925
+xors 4, 1, sb36, sb0, sb1 # 7926
+xors 4, 1, sb14, sb17, sb18 # 7927
+xors 4, 1, sb41, sb12, sb14 # 7928
+ands 44, 1, sb12, sb11, sb24, 1, sb10, sb25, sb26, 1, sb14, sb27, sb28, 1, sb9, sb29, sb30, 1, sb7, sb31, sb32, 1, sb0, sb33, sb34, 1, sb8, sb35, sb36, 1, sb1, sb5, sb37, 1, sb17, sb13, sb38, 1, sb18, sb15, sb39, 1, sb6, sb40, sb41 # 7929
+xors 4, 1, sb11, sb12, sb23 # 7930
+xors 4, 1, sb12, sb10, sb22 # 7931
+xors 4, 1, sb10, sb14, sb21 # 7932
+xors 4, 1, sb14, sb9, sb20 # 7933
+xors 4, 1, sb9, sb7, sb16 # 7934
+xors 4, 1, sb16, sb0, sb2 # 7935
+xors 4, 1, sb7, sb8, sb19 # 7936
+xors 4, 1, sb19, sb6, sb7 # 7937
+ands 20, 1, sb6, sb5, sb12, 1, sb2, sb13, sb14, 1, sb8, sb15, sb16, 1, sb7, sb1, sb17, 1, sb0, sb18, sb19 # 7938
+xors 4, 1, sb5, sb6, sb11 # 7939
+xors 4, 1, sb6, sb2, sb10 # 7940
+xors 4, 1, sb2, sb8, sb9 # 7941
+xors 4, 1, sb8, sb0, sb2 # 7942
+ands 8, 1, sb2, sb1, sb6, 1, sb0, sb7, sb8 # 7943
+xors 4, 1, sb1, sb2, sb5 # 7944
+xors 4, 1, sb2, sb0, sb1 # 7945
+dabit s6, sb1 # 7946
+xors 4, 1, sb0, sb1, sb2 # 7947
+mulsi s1, s6, 2 # 7948
+dabit s5, sb2 # 7949
+xors 4, 1, sb1, sb2, sb3 # 7950
+mulsi s0, s5, 2 # 7951
+shrsi s2, s3, 1 # 7952
+dabit s4, sb3 # 7953
+xors 4, 1, sb2, sb3, sb4 # 7954
+reveal 9, 1, cb2, sb0, 1, cb1, sb1, 1, cb0, sb2 # 7955
+convcbitvec 1, ci0, cb2 # 7956
+convint c1, ci0 # 7957
+addm s3, s6, c1 # 7958
+convint c0, ci0 # 7959
+mulm s6, s1, c0 # 7960
+subs s1, s3, s6 # 7961
+movs s3, s1 # 7962
+movs s1, s3 # 7963
+convcbitvec 1, ci0, cb1 # 7964
+convint c1, ci0 # 7965
+addm s3, s5, c1 # 7966
+convint c0, ci0 # 7967
+mulm s5, s0, c0 # 7968
+subs s0, s3, s5 # 7969
+movs s3, s0 # 7970
+adds s0, s1, s3 # 7971
+convcbitvec 1, ci0, cb0 # 7972
+convint c1, ci0 # 7973
+addm s3, s4, c1 # 7974
+mulsi s1, s4, 2 # 7975
+convint c0, ci0 # 7976
+mulm s4, s1, c0 # 7977
+subs s1, s3, s4 # 7978
+movs s3, s1 # 7979
+adds s1, s2, s3 # 7980
+ldi c0, 2 # 7981
+mulci c1, c0, 2147483647 # 7982
+addci c0, c1, 4 # 7983
+mulci c1, c0, 2147483647 # 7984
+addci c0, c1, 2 # 7985
+mulm s2, s0, c0 # 7986
+subs s0, s1, s2 # 7987
+subsi s1, s0, 1073741824 # 7988
+movs s0, s1 # 7989
+use 2, 0, 3970 # 7990
+use 0, 4, 55 # 7991
+use 0, 0, 13 # 7992
+reqbl -64 # 7993
@@ -0,0 +1,5880 @@
+call_arg *103, 4 # 0
+call_arg *90, 4 # 1
+ldi c11, 1 # 2
+shlci c10, c11, 31 # 3
+mulci c0, c10, 2 # 4
+ldi c9, 2 # 5
+mulci c8, c9, 2147483647 # 6
+addci c7, c8, 1963229553 # 7
+ldsi s8, 0 # 8
+addm s111, s8, c7 # 9
+subsi s7, s90, 0 # 10
+split 98, 3, s7, sb1708, sb1709, sb2342, sb1706, sb1707, sb2340, sb1704, sb1705, sb2338, sb1702, sb1703, sb2336, sb1700, sb1701, sb2334, sb1698, sb1699, sb2332, sb1696, sb1697, sb2330, sb1694, sb1695, sb2327, sb1692, sb1693, sb2323, sb1690, sb1691, sb2319, sb1688, sb1689, sb2315, sb1686, sb1687, sb2311, sb1684, sb1685, sb2307, sb1682, sb1683, sb2303, sb1680, sb1681, sb2299, sb1678, sb1679, sb2295, sb1676, sb1677, sb2291, sb1674, sb1675, sb2287, sb1672, sb1673, sb2283, sb1670, sb1671, sb2279, sb1668, sb1669, sb2275, sb1666, sb1667, sb2271, sb1664, sb1665, sb2267, sb1662, sb1663, sb2265, sb1660, sb1661, sb2263, sb1658, sb1659, sb2261, sb1656, sb1657, sb2259, sb1654, sb1655, sb2257, sb1652, sb1653, sb2255, sb1650, sb1651, sb2253, sb1648, sb1649, sb2249, sb1645, sb1647, sb1646 # 11
+xors 4, 1, sb2344, sb2342, sb1709 # 12
+xors 4, 1, sb2346, sb1708, sb2342 # 13
+xors 4, 1, sb2348, sb2340, sb1707 # 14
+xors 4, 1, sb274, sb2348, sb1706 # 15
+xors 4, 1, sb2350, sb1706, sb2340 # 16
+xors 4, 1, sb2352, sb2338, sb1705 # 17
+xors 4, 1, sb271, sb2352, sb1704 # 18
+xors 4, 1, sb2354, sb1704, sb2338 # 19
+xors 4, 1, sb2356, sb2336, sb1703 # 20
+xors 4, 1, sb268, sb2356, sb1702 # 21
+xors 4, 1, sb2358, sb1702, sb2336 # 22
+xors 4, 1, sb2360, sb2334, sb1701 # 23
+xors 4, 1, sb263, sb2360, sb1700 # 24
+xors 4, 1, sb2362, sb1700, sb2334 # 25
+xors 4, 1, sb2364, sb2332, sb1699 # 26
+xors 4, 1, sb260, sb2364, sb1698 # 27
+xors 4, 1, sb2366, sb1698, sb2332 # 28
+xors 4, 1, sb2368, sb2330, sb1697 # 29
+xors 4, 1, sb255, sb2368, sb1696 # 30
+xors 4, 1, sb2370, sb1696, sb2330 # 31
+xors 4, 1, sb2372, sb2327, sb1695 # 32
+xors 4, 1, sb251, sb2372, sb1694 # 33
+xors 4, 1, sb2374, sb1694, sb2327 # 34
+xors 4, 1, sb2376, sb2323, sb1693 # 35
+xors 4, 1, sb245, sb2376, sb1692 # 36
+xors 4, 1, sb2378, sb1692, sb2323 # 37
+xors 4, 1, sb2380, sb2319, sb1691 # 38
+xors 4, 1, sb241, sb2380, sb1690 # 39
+xors 4, 1, sb2382, sb1690, sb2319 # 40
+xors 4, 1, sb2384, sb2315, sb1689 # 41
+xors 4, 1, sb239, sb2384, sb1688 # 42
+xors 4, 1, sb2386, sb1688, sb2315 # 43
+xors 4, 1, sb2388, sb2311, sb1687 # 44
+xors 4, 1, sb235, sb2388, sb1686 # 45
+xors 4, 1, sb2390, sb1686, sb2311 # 46
+xors 4, 1, sb2392, sb2307, sb1685 # 47
+xors 4, 1, sb231, sb2392, sb1684 # 48
+xors 4, 1, sb2394, sb1684, sb2307 # 49
+xors 4, 1, sb2396, sb2303, sb1683 # 50
+xors 4, 1, sb228, sb2396, sb1682 # 51
+xors 4, 1, sb2398, sb1682, sb2303 # 52
+xors 4, 1, sb2400, sb2299, sb1681 # 53
+xors 4, 1, sb224, sb2400, sb1680 # 54
+xors 4, 1, sb2402, sb1680, sb2299 # 55
+xors 4, 1, sb2404, sb2295, sb1679 # 56
+xors 4, 1, sb220, sb2404, sb1678 # 57
+xors 4, 1, sb2405, sb1678, sb2295 # 58
+xors 4, 1, sb2406, sb2291, sb1677 # 59
+xors 4, 1, sb215, sb2406, sb1676 # 60
+xors 4, 1, sb2407, sb1676, sb2291 # 61
+xors 4, 1, sb2408, sb2287, sb1675 # 62
+xors 4, 1, sb212, sb2408, sb1674 # 63
+xors 4, 1, sb2409, sb1674, sb2287 # 64
+xors 4, 1, sb2410, sb2283, sb1673 # 65
+xors 4, 1, sb205, sb2410, sb1672 # 66
+xors 4, 1, sb2411, sb1672, sb2283 # 67
+xors 4, 1, sb2412, sb2279, sb1671 # 68
+xors 4, 1, sb201, sb2412, sb1670 # 69
+xors 4, 1, sb2413, sb1670, sb2279 # 70
+xors 4, 1, sb2414, sb2275, sb1669 # 71
+xors 4, 1, sb197, sb2414, sb1668 # 72
+xors 4, 1, sb2415, sb1668, sb2275 # 73
+xors 4, 1, sb2416, sb2271, sb1667 # 74
+xors 4, 1, sb191, sb2416, sb1666 # 75
+xors 4, 1, sb2417, sb1666, sb2271 # 76
+xors 4, 1, sb2418, sb2267, sb1665 # 77
+xors 4, 1, sb184, sb2418, sb1664 # 78
+xors 4, 1, sb2420, sb1664, sb2267 # 79
+xors 4, 1, sb2422, sb2265, sb1663 # 80
+xors 4, 1, sb181, sb2422, sb1662 # 81
+xors 4, 1, sb2424, sb1662, sb2265 # 82
+xors 4, 1, sb2426, sb2263, sb1661 # 83
+xors 4, 1, sb177, sb2426, sb1660 # 84
+xors 4, 1, sb2428, sb1660, sb2263 # 85
+xors 4, 1, sb2430, sb2261, sb1659 # 86
+xors 4, 1, sb174, sb2430, sb1658 # 87
+xors 4, 1, sb2432, sb1658, sb2261 # 88
+xors 4, 1, sb2434, sb2259, sb1657 # 89
+xors 4, 1, sb165, sb2434, sb1656 # 90
+xors 4, 1, sb2436, sb1656, sb2259 # 91
+xors 4, 1, sb2438, sb2257, sb1655 # 92
+xors 4, 1, sb159, sb2438, sb1654 # 93
+xors 4, 1, sb2440, sb1654, sb2257 # 94
+xors 4, 1, sb2442, sb2255, sb1653 # 95
+xors 4, 1, sb154, sb2442, sb1652 # 96
+xors 4, 1, sb2444, sb1652, sb2255 # 97
+xors 4, 1, sb2446, sb2253, sb1651 # 98
+xors 4, 1, sb150, sb2446, sb1650 # 99
+xors 4, 1, sb2448, sb1650, sb2253 # 100
+xors 4, 1, sb2450, sb2249, sb1649 # 101
+xors 4, 1, sb146, sb2450, sb1648 # 102
+xors 4, 1, sb2452, sb1648, sb2249 # 103
+xors 4, 1, sb1644, sb1646, sb1647 # 104
+xors 4, 1, sb45, sb1644, sb1645 # 105
+dabit s118, sb40 # 106
+mulsi s153, s118, 2 # 107
+randoms s117, 31 # 108
+split 101, 3, s117, sb1642, sb1643, sb2245, sb1640, sb1641, sb2239, sb1638, sb1639, sb2233, sb1636, sb1637, sb2225, sb1634, sb1635, sb2219, sb1632, sb1633, sb2213, sb1630, sb1631, sb2207, sb1628, sb1629, sb2199, sb1626, sb1627, sb2194, sb1624, sb1625, sb2191, sb1622, sb1623, sb2188, sb1620, sb1621, sb2185, sb1618, sb1619, sb2181, sb1616, sb1617, sb2176, sb1614, sb1615, sb2170, sb1612, sb1613, sb2164, sb1610, sb1611, sb2158, sb1608, sb1609, sb2152, sb1606, sb1607, sb2144, sb1604, sb1605, sb2138, sb1602, sb1603, sb2132, sb1600, sb1601, sb2126, sb1598, sb1599, sb2120, sb1596, sb1597, sb2116, sb1594, sb1595, sb2113, sb1592, sb1593, sb2109, sb1590, sb1591, sb2106, sb1588, sb1589, sb2102, sb1586, sb1587, sb2096, sb1584, sb1585, sb2090, sb1582, sb1583, sb2084, sb1580, sb1581, sb2078, sb1577, sb1579, sb1578 # 109
+xors 4, 1, sb2454, sb2245, sb1643 # 110
+xors 4, 1, sb46, sb2454, sb1642 # 111
+xors 4, 1, sb2456, sb1642, sb2245 # 112
+xors 4, 1, sb2458, sb2239, sb1641 # 113
+xors 4, 1, sb2243, sb2458, sb1640 # 114
+xors 4, 1, sb2460, sb1640, sb2239 # 115
+xors 4, 1, sb2462, sb2233, sb1639 # 116
+xors 4, 1, sb2237, sb2462, sb1638 # 117
+xors 4, 1, sb2464, sb1638, sb2233 # 118
+xors 4, 1, sb2466, sb2225, sb1637 # 119
+xors 4, 1, sb2231, sb2466, sb1636 # 120
+xors 4, 1, sb2468, sb1636, sb2225 # 121
+xors 4, 1, sb2470, sb2219, sb1635 # 122
+xors 4, 1, sb2223, sb2470, sb1634 # 123
+xors 4, 1, sb2472, sb1634, sb2219 # 124
+xors 4, 1, sb2474, sb2213, sb1633 # 125
+xors 4, 1, sb2217, sb2474, sb1632 # 126
+xors 4, 1, sb2476, sb1632, sb2213 # 127
+xors 4, 1, sb2478, sb2207, sb1631 # 128
+xors 4, 1, sb2211, sb2478, sb1630 # 129
+xors 4, 1, sb2480, sb1630, sb2207 # 130
+xors 4, 1, sb2481, sb2199, sb1629 # 131
+xors 4, 1, sb2205, sb2481, sb1628 # 132
+xors 4, 1, sb2482, sb1628, sb2199 # 133
+xors 4, 1, sb2483, sb2194, sb1627 # 134
+xors 4, 1, sb2197, sb2483, sb1626 # 135
+xors 4, 1, sb2484, sb1626, sb2194 # 136
+xors 4, 1, sb2485, sb2191, sb1625 # 137
+xors 4, 1, sb2193, sb2485, sb1624 # 138
+xors 4, 1, sb2486, sb1624, sb2191 # 139
+xors 4, 1, sb2487, sb2188, sb1623 # 140
+xors 4, 1, sb2190, sb2487, sb1622 # 141
+xors 4, 1, sb2488, sb1622, sb2188 # 142
+xors 4, 1, sb2489, sb2185, sb1621 # 143
+xors 4, 1, sb2187, sb2489, sb1620 # 144
+xors 4, 1, sb2490, sb1620, sb2185 # 145
+xors 4, 1, sb2491, sb2181, sb1619 # 146
+xors 4, 1, sb2184, sb2491, sb1618 # 147
+xors 4, 1, sb2492, sb1618, sb2181 # 148
+xors 4, 1, sb2493, sb2176, sb1617 # 149
+xors 4, 1, sb2180, sb2493, sb1616 # 150
+xors 4, 1, sb2494, sb1616, sb2176 # 151
+xors 4, 1, sb2495, sb2170, sb1615 # 152
+xors 4, 1, sb2174, sb2495, sb1614 # 153
+xors 4, 1, sb2497, sb1614, sb2170 # 154
+xors 4, 1, sb2499, sb2164, sb1613 # 155
+xors 4, 1, sb2168, sb2499, sb1612 # 156
+xors 4, 1, sb2501, sb1612, sb2164 # 157
+xors 4, 1, sb2503, sb2158, sb1611 # 158
+xors 4, 1, sb2162, sb2503, sb1610 # 159
+xors 4, 1, sb2505, sb1610, sb2158 # 160
+xors 4, 1, sb2507, sb2152, sb1609 # 161
+xors 4, 1, sb2156, sb2507, sb1608 # 162
+xors 4, 1, sb2509, sb1608, sb2152 # 163
+xors 4, 1, sb2511, sb2144, sb1607 # 164
+xors 4, 1, sb2150, sb2511, sb1606 # 165
+xors 4, 1, sb2513, sb1606, sb2144 # 166
+xors 4, 1, sb2515, sb2138, sb1605 # 167
+xors 4, 1, sb2142, sb2515, sb1604 # 168
+xors 4, 1, sb2517, sb1604, sb2138 # 169
+xors 4, 1, sb2519, sb2132, sb1603 # 170
+xors 4, 1, sb2136, sb2519, sb1602 # 171
+xors 4, 1, sb2521, sb1602, sb2132 # 172
+xors 4, 1, sb2523, sb2126, sb1601 # 173
+xors 4, 1, sb2130, sb2523, sb1600 # 174
+xors 4, 1, sb2525, sb1600, sb2126 # 175
+xors 4, 1, sb2527, sb2120, sb1599 # 176
+xors 4, 1, sb2124, sb2527, sb1598 # 177
+xors 4, 1, sb2529, sb1598, sb2120 # 178
+xors 4, 1, sb2531, sb2116, sb1597 # 179
+xors 4, 1, sb2118, sb2531, sb1596 # 180
+xors 4, 1, sb2533, sb1596, sb2116 # 181
+xors 4, 1, sb2535, sb2113, sb1595 # 182
+xors 4, 1, sb2115, sb2535, sb1594 # 183
+xors 4, 1, sb2537, sb1594, sb2113 # 184
+xors 4, 1, sb2539, sb2109, sb1593 # 185
+xors 4, 1, sb2112, sb2539, sb1592 # 186
+xors 4, 1, sb2541, sb1592, sb2109 # 187
+xors 4, 1, sb2543, sb2106, sb1591 # 188
+xors 4, 1, sb2108, sb2543, sb1590 # 189
+xors 4, 1, sb2545, sb1590, sb2106 # 190
+xors 4, 1, sb2547, sb2102, sb1589 # 191
+xors 4, 1, sb2105, sb2547, sb1588 # 192
+xors 4, 1, sb2549, sb1588, sb2102 # 193
+xors 4, 1, sb2551, sb2096, sb1587 # 194
+xors 4, 1, sb2100, sb2551, sb1586 # 195
+xors 4, 1, sb2553, sb1586, sb2096 # 196
+xors 4, 1, sb2554, sb2090, sb1585 # 197
+xors 4, 1, sb2094, sb2554, sb1584 # 198
+xors 4, 1, sb2555, sb1584, sb2090 # 199
+xors 4, 1, sb2556, sb2084, sb1583 # 200
+xors 4, 1, sb2088, sb2556, sb1582 # 201
+xors 4, 1, sb2557, sb1582, sb2084 # 202
+xors 4, 1, sb2558, sb2078, sb1581 # 203
+xors 4, 1, sb2082, sb2558, sb1580 # 204
+xors 4, 1, sb2559, sb1580, sb2078 # 205
+xors 4, 1, sb1576, sb1578, sb1579 # 206
+xors 4, 1, sb2076, sb1576, sb1577 # 207
+dabit s156, sb4 # 208
+mulsi s120, s156, 2 # 209
+dabit s155, sb121 # 210
+mulsi s154, s155, 2 # 211
+ldi c6, 1 # 212
+mulci c5, c6, 2147483647 # 213
+addci c36, c5, 1 # 214
+ldsi s99, 0 # 215
+ldsi s152, 0 # 216
+ldsi s151, 0 # 217
+ldsi s150, 0 # 218
+ldsi s149, 0 # 219
+ldsi s146, 0 # 220
+ldsi s145, 0 # 221
+ldsi s144, 0 # 222
+ldsi s143, 0 # 223
+ldsi s142, 0 # 224
+ldsi s141, 0 # 225
+ldsi s140, 0 # 226
+ldsi s139, 0 # 227
+ldsi s138, 0 # 228
+ldsi s137, 0 # 229
+ldsi s136, 0 # 230
+ldsi s135, 0 # 231
+ldsi s134, 0 # 232
+ldsi s133, 0 # 233
+ldsi s132, 0 # 234
+ldsi s131, 0 # 235
+ldsi s130, 0 # 236
+ldsi s129, 0 # 237
+ldsi s128, 0 # 238
+ldsi s127, 0 # 239
+ldsi s126, 0 # 240
+ldsi s125, 0 # 241
+ldsi s124, 0 # 242
+ldsi s123, 0 # 243
+ldsi s122, 0 # 244
+ldsi s121, 0 # 245
+dabit s119, sb27 # 246
+mulsi s115, s119, 2 # 247
+ldi c4, 1 # 248
+mulci c3, c4, 2147483647 # 249
+addci c32, c3, 1 # 250
+ldi c2, 1 # 251
+mulci c1, c2, 2147483647 # 252
+addci c37, c1, 2 # 253
+mulci c35, c37, 2147483647 # 254
+addci c34, c35, 1 # 255
+randoms s109, 30 # 256
+split 92, 3, s109, sb1574, sb1575, sb2066, sb1572, sb1573, sb2062, sb1570, sb1571, sb2058, sb1568, sb1569, sb2054, sb1566, sb1567, sb2050, sb1564, sb1565, sb2046, sb1562, sb1563, sb2043, sb1560, sb1561, sb2041, sb1558, sb1559, sb2039, sb1556, sb1557, sb2037, sb1554, sb1555, sb2035, sb1552, sb1553, sb2033, sb1550, sb1551, sb2031, sb1548, sb1549, sb2029, sb1546, sb1547, sb2025, sb1544, sb1545, sb2021, sb1542, sb1543, sb2017, sb1540, sb1541, sb2013, sb1538, sb1539, sb2009, sb1536, sb1537, sb2005, sb1534, sb1535, sb2001, sb1532, sb1533, sb1997, sb1530, sb1531, sb1993, sb1528, sb1529, sb1989, sb1526, sb1527, sb1985, sb1524, sb1525, sb1981, sb1522, sb1523, sb1977, sb1520, sb1521, sb1973, sb1518, sb1519, sb1969, sb1516, sb1517, sb1966 # 257
+xors 4, 1, sb2560, sb2066, sb1575 # 258
+xors 4, 1, sb2561, sb1574, sb2066 # 259
+xors 4, 1, sb2562, sb2062, sb1573 # 260
+xors 4, 1, sb421, sb2562, sb1572 # 261
+xors 4, 1, sb2563, sb1572, sb2062 # 262
+xors 4, 1, sb2564, sb2058, sb1571 # 263
+xors 4, 1, sb419, sb2564, sb1570 # 264
+xors 4, 1, sb2565, sb1570, sb2058 # 265
+xors 4, 1, sb2566, sb2054, sb1569 # 266
+xors 4, 1, sb416, sb2566, sb1568 # 267
+xors 4, 1, sb2567, sb1568, sb2054 # 268
+xors 4, 1, sb2569, sb2050, sb1567 # 269
+xors 4, 1, sb413, sb2569, sb1566 # 270
+xors 4, 1, sb2571, sb1566, sb2050 # 271
+xors 4, 1, sb2573, sb2046, sb1565 # 272
+xors 4, 1, sb410, sb2573, sb1564 # 273
+xors 4, 1, sb2575, sb1564, sb2046 # 274
+xors 4, 1, sb2577, sb2043, sb1563 # 275
+xors 4, 1, sb407, sb2577, sb1562 # 276
+xors 4, 1, sb2579, sb1562, sb2043 # 277
+xors 4, 1, sb2581, sb2041, sb1561 # 278
+xors 4, 1, sb404, sb2581, sb1560 # 279
+xors 4, 1, sb2583, sb1560, sb2041 # 280
+xors 4, 1, sb2585, sb2039, sb1559 # 281
+xors 4, 1, sb401, sb2585, sb1558 # 282
+xors 4, 1, sb2587, sb1558, sb2039 # 283
+xors 4, 1, sb2589, sb2037, sb1557 # 284
+xors 4, 1, sb397, sb2589, sb1556 # 285
+xors 4, 1, sb2591, sb1556, sb2037 # 286
+xors 4, 1, sb2593, sb2035, sb1555 # 287
+xors 4, 1, sb392, sb2593, sb1554 # 288
+xors 4, 1, sb2595, sb1554, sb2035 # 289
+xors 4, 1, sb2597, sb2033, sb1553 # 290
+xors 4, 1, sb388, sb2597, sb1552 # 291
+xors 4, 1, sb2599, sb1552, sb2033 # 292
+xors 4, 1, sb2601, sb2031, sb1551 # 293
+xors 4, 1, sb385, sb2601, sb1550 # 294
+xors 4, 1, sb2603, sb1550, sb2031 # 295
+xors 4, 1, sb2605, sb2029, sb1549 # 296
+xors 4, 1, sb383, sb2605, sb1548 # 297
+xors 4, 1, sb2607, sb1548, sb2029 # 298
+xors 4, 1, sb2609, sb2025, sb1547 # 299
+xors 4, 1, sb379, sb2609, sb1546 # 300
+xors 4, 1, sb2611, sb1546, sb2025 # 301
+xors 4, 1, sb2613, sb2021, sb1545 # 302
+xors 4, 1, sb376, sb2613, sb1544 # 303
+xors 4, 1, sb2615, sb1544, sb2021 # 304
+xors 4, 1, sb2617, sb2017, sb1543 # 305
+xors 4, 1, sb373, sb2617, sb1542 # 306
+xors 4, 1, sb2619, sb1542, sb2017 # 307
+xors 4, 1, sb2621, sb2013, sb1541 # 308
+xors 4, 1, sb370, sb2621, sb1540 # 309
+xors 4, 1, sb2623, sb1540, sb2013 # 310
+xors 4, 1, sb2625, sb2009, sb1539 # 311
+xors 4, 1, sb368, sb2625, sb1538 # 312
+xors 4, 1, sb2627, sb1538, sb2009 # 313
+xors 4, 1, sb2629, sb2005, sb1537 # 314
+xors 4, 1, sb366, sb2629, sb1536 # 315
+xors 4, 1, sb2630, sb1536, sb2005 # 316
+xors 4, 1, sb2631, sb2001, sb1535 # 317
+xors 4, 1, sb363, sb2631, sb1534 # 318
+xors 4, 1, sb2632, sb1534, sb2001 # 319
+xors 4, 1, sb2633, sb1997, sb1533 # 320
+xors 4, 1, sb360, sb2633, sb1532 # 321
+xors 4, 1, sb2634, sb1532, sb1997 # 322
+xors 4, 1, sb2635, sb1993, sb1531 # 323
+xors 4, 1, sb358, sb2635, sb1530 # 324
+xors 4, 1, sb2636, sb1530, sb1993 # 325
+xors 4, 1, sb2637, sb1989, sb1529 # 326
+xors 4, 1, sb356, sb2637, sb1528 # 327
+xors 4, 1, sb2638, sb1528, sb1989 # 328
+xors 4, 1, sb2639, sb1985, sb1527 # 329
+xors 4, 1, sb352, sb2639, sb1526 # 330
+xors 4, 1, sb2640, sb1526, sb1985 # 331
+xors 4, 1, sb2641, sb1981, sb1525 # 332
+xors 4, 1, sb348, sb2641, sb1524 # 333
+xors 4, 1, sb2642, sb1524, sb1981 # 334
+xors 4, 1, sb2643, sb1977, sb1523 # 335
+xors 4, 1, sb344, sb2643, sb1522 # 336
+xors 4, 1, sb2644, sb1522, sb1977 # 337
+xors 4, 1, sb2646, sb1973, sb1521 # 338
+xors 4, 1, sb342, sb2646, sb1520 # 339
+xors 4, 1, sb2648, sb1520, sb1973 # 340
+xors 4, 1, sb2650, sb1969, sb1519 # 341
+xors 4, 1, sb340, sb2650, sb1518 # 342
+xors 4, 1, sb2652, sb1518, sb1969 # 343
+xors 4, 1, sb2654, sb1966, sb1517 # 344
+xors 4, 1, sb338, sb2654, sb1516 # 345
+xors 4, 1, sb2656, sb1516, sb1966 # 346
+dabit s114, sb232 # 347
+mulsi s112, s114, 2 # 348
+dabit s113, sb1964 # 349
+mulsi s107, s113, 2 # 350
+randoms s108, 33 # 351
+split 101, 3, s108, sb1514, sb1515, sb1962, sb1512, sb1513, sb1960, sb1510, sb1511, sb1958, sb1508, sb1509, sb1956, sb1506, sb1507, sb1954, sb1504, sb1505, sb1951, sb1502, sb1503, sb1947, sb1500, sb1501, sb1943, sb1498, sb1499, sb1939, sb1496, sb1497, sb1935, sb1494, sb1495, sb1931, sb1492, sb1493, sb1927, sb1490, sb1491, sb1923, sb1488, sb1489, sb1919, sb1486, sb1487, sb1915, sb1484, sb1485, sb1911, sb1482, sb1483, sb1907, sb1480, sb1481, sb1903, sb1478, sb1479, sb1899, sb1476, sb1477, sb1895, sb1474, sb1475, sb1893, sb1472, sb1473, sb1891, sb1470, sb1471, sb1889, sb1468, sb1469, sb1887, sb1466, sb1467, sb1885, sb1464, sb1465, sb1883, sb1462, sb1463, sb1881, sb1460, sb1461, sb1878, sb1458, sb1459, sb1874, sb1456, sb1457, sb1870, sb1454, sb1455, sb1866, sb1452, sb1453, sb1862, sb1450, sb1451, sb1858 # 352
+xors 4, 1, sb2658, sb1962, sb1515 # 353
+xors 4, 1, sb2660, sb1514, sb1962 # 354
+xors 4, 1, sb2662, sb1960, sb1513 # 355
+xors 4, 1, sb527, sb2662, sb1512 # 356
+xors 4, 1, sb2664, sb1512, sb1960 # 357
+xors 4, 1, sb2666, sb1958, sb1511 # 358
+xors 4, 1, sb525, sb2666, sb1510 # 359
+xors 4, 1, sb2668, sb1510, sb1958 # 360
+xors 4, 1, sb2670, sb1956, sb1509 # 361
+xors 4, 1, sb523, sb2670, sb1508 # 362
+xors 4, 1, sb2672, sb1508, sb1956 # 363
+xors 4, 1, sb2674, sb1954, sb1507 # 364
+xors 4, 1, sb521, sb2674, sb1506 # 365
+xors 4, 1, sb2676, sb1506, sb1954 # 366
+xors 4, 1, sb2678, sb1951, sb1505 # 367
+xors 4, 1, sb519, sb2678, sb1504 # 368
+xors 4, 1, sb2680, sb1504, sb1951 # 369
+xors 4, 1, sb2682, sb1947, sb1503 # 370
+xors 4, 1, sb517, sb2682, sb1502 # 371
+xors 4, 1, sb2684, sb1502, sb1947 # 372
+xors 4, 1, sb2686, sb1943, sb1501 # 373
+xors 4, 1, sb515, sb2686, sb1500 # 374
+xors 4, 1, sb2688, sb1500, sb1943 # 375
+xors 4, 1, sb2690, sb1939, sb1499 # 376
+xors 4, 1, sb513, sb2690, sb1498 # 377
+xors 4, 1, sb2692, sb1498, sb1939 # 378
+xors 4, 1, sb2694, sb1935, sb1497 # 379
+xors 4, 1, sb511, sb2694, sb1496 # 380
+xors 4, 1, sb2696, sb1496, sb1935 # 381
+xors 4, 1, sb2698, sb1931, sb1495 # 382
+xors 4, 1, sb509, sb2698, sb1494 # 383
+xors 4, 1, sb2700, sb1494, sb1931 # 384
+xors 4, 1, sb2702, sb1927, sb1493 # 385
+xors 4, 1, sb506, sb2702, sb1492 # 386
+xors 4, 1, sb2704, sb1492, sb1927 # 387
+xors 4, 1, sb2705, sb1923, sb1491 # 388
+xors 4, 1, sb504, sb2705, sb1490 # 389
+xors 4, 1, sb2706, sb1490, sb1923 # 390
+xors 4, 1, sb2707, sb1919, sb1489 # 391
+xors 4, 1, sb502, sb2707, sb1488 # 392
+xors 4, 1, sb2708, sb1488, sb1919 # 393
+xors 4, 1, sb2709, sb1915, sb1487 # 394
+xors 4, 1, sb500, sb2709, sb1486 # 395
+xors 4, 1, sb2710, sb1486, sb1915 # 396
+xors 4, 1, sb2711, sb1911, sb1485 # 397
+xors 4, 1, sb498, sb2711, sb1484 # 398
+xors 4, 1, sb2712, sb1484, sb1911 # 399
+xors 4, 1, sb2713, sb1907, sb1483 # 400
+xors 4, 1, sb495, sb2713, sb1482 # 401
+xors 4, 1, sb2714, sb1482, sb1907 # 402
+xors 4, 1, sb2715, sb1903, sb1481 # 403
+xors 4, 1, sb492, sb2715, sb1480 # 404
+xors 4, 1, sb2716, sb1480, sb1903 # 405
+xors 4, 1, sb2717, sb1899, sb1479 # 406
+xors 4, 1, sb489, sb2717, sb1478 # 407
+xors 4, 1, sb0, sb1478, sb1899 # 408
+xors 4, 1, sb1, sb1895, sb1477 # 409
+xors 4, 1, sb486, sb1, sb1476 # 410
+xors 4, 1, sb2, sb1476, sb1895 # 411
+xors 4, 1, sb3, sb1893, sb1475 # 412
+xors 4, 1, sb483, sb3, sb1474 # 413
+xors 4, 1, sb5, sb1474, sb1893 # 414
+xors 4, 1, sb6, sb1891, sb1473 # 415
+xors 4, 1, sb479, sb6, sb1472 # 416
+xors 4, 1, sb7, sb1472, sb1891 # 417
+xors 4, 1, sb8, sb1889, sb1471 # 418
+xors 4, 1, sb476, sb8, sb1470 # 419
+xors 4, 1, sb9, sb1470, sb1889 # 420
+xors 4, 1, sb10, sb1887, sb1469 # 421
+xors 4, 1, sb474, sb10, sb1468 # 422
+xors 4, 1, sb11, sb1468, sb1887 # 423
+xors 4, 1, sb12, sb1885, sb1467 # 424
+xors 4, 1, sb472, sb12, sb1466 # 425
+xors 4, 1, sb13, sb1466, sb1885 # 426
+xors 4, 1, sb14, sb1883, sb1465 # 427
+xors 4, 1, sb469, sb14, sb1464 # 428
+xors 4, 1, sb15, sb1464, sb1883 # 429
+xors 4, 1, sb16, sb1881, sb1463 # 430
+xors 4, 1, sb466, sb16, sb1462 # 431
+xors 4, 1, sb17, sb1462, sb1881 # 432
+xors 4, 1, sb18, sb1878, sb1461 # 433
+xors 4, 1, sb461, sb18, sb1460 # 434
+xors 4, 1, sb20, sb1460, sb1878 # 435
+xors 4, 1, sb21, sb1874, sb1459 # 436
+xors 4, 1, sb458, sb21, sb1458 # 437
+xors 4, 1, sb22, sb1458, sb1874 # 438
+xors 4, 1, sb24, sb1870, sb1457 # 439
+xors 4, 1, sb456, sb24, sb1456 # 440
+xors 4, 1, sb25, sb1456, sb1870 # 441
+xors 4, 1, sb26, sb1866, sb1455 # 442
+xors 4, 1, sb452, sb26, sb1454 # 443
+xors 4, 1, sb29, sb1454, sb1866 # 444
+xors 4, 1, sb30, sb1862, sb1453 # 445
+xors 4, 1, sb449, sb30, sb1452 # 446
+xors 4, 1, sb31, sb1452, sb1862 # 447
+xors 4, 1, sb32, sb1858, sb1451 # 448
+xors 4, 1, sb447, sb32, sb1450 # 449
+xors 4, 1, sb33, sb1450, sb1858 # 450
+dabit s148, sb111 # 451
+mulsi s68, s148, 2 # 452
+dabit s110, sb1854 # 453
+mulsi s93, s110, 2 # 454
+ldi c33, 4 # 455
+mulci c28, c33, 2147483647 # 456
+addci c35, c28, 4 # 457
+bit s104 # 458
+ldi c33, 2 # 459
+mulci c26, c33, 2147483647 # 460
+addci c31, c26, 4 # 461
+mulci c30, c31, 2147483647 # 462
+addci c29, c30, 2 # 463
+mulm s106, s104, c29 # 464
+mulsi s91, s104, 2 # 465
+ldi c28, 4 # 466
+mulci c27, c28, 2147483647 # 467
+addci c33, c27, 4 # 468
+ldi c26, 2 # 469
+mulci c25, c26, 2147483647 # 470
+addci c30, c25, 2 # 471
+ldi c22, 1 # 472
+mulci c23, c22, 2147483647 # 473
+addci c21, c23, 2 # 474
+mulci c20, c21, 2147483647 # 475
+addci c31, c20, 1 # 476
+randoms s97, 16 # 477
+split 50, 3, s97, sb1448, sb1449, sb1850, sb1446, sb1447, sb1846, sb1444, sb1445, sb1842, sb1442, sb1443, sb1838, sb1440, sb1441, sb1834, sb1438, sb1439, sb1830, sb1436, sb1437, sb1826, sb1434, sb1435, sb1822, sb1432, sb1433, sb1818, sb1430, sb1431, sb1816, sb1428, sb1429, sb1814, sb1426, sb1427, sb1812, sb1424, sb1425, sb1810, sb1422, sb1423, sb1808, sb1420, sb1421, sb1806, sb1418, sb1419, sb1804 # 478
+xors 4, 1, sb34, sb1850, sb1449 # 479
+xors 4, 1, sb36, sb1448, sb1850 # 480
+xors 4, 1, sb37, sb1846, sb1447 # 481
+xors 4, 1, sb609, sb37, sb1446 # 482
+xors 4, 1, sb38, sb1446, sb1846 # 483
+xors 4, 1, sb39, sb1842, sb1445 # 484
+xors 4, 1, sb607, sb39, sb1444 # 485
+xors 4, 1, sb41, sb1444, sb1842 # 486
+xors 4, 1, sb42, sb1838, sb1443 # 487
+xors 4, 1, sb605, sb42, sb1442 # 488
+xors 4, 1, sb44, sb1442, sb1838 # 489
+xors 4, 1, sb47, sb1834, sb1441 # 490
+xors 4, 1, sb602, sb47, sb1440 # 491
+xors 4, 1, sb48, sb1440, sb1834 # 492
+xors 4, 1, sb49, sb1830, sb1439 # 493
+xors 4, 1, sb598, sb49, sb1438 # 494
+xors 4, 1, sb50, sb1438, sb1830 # 495
+xors 4, 1, sb51, sb1826, sb1437 # 496
+xors 4, 1, sb594, sb51, sb1436 # 497
+xors 4, 1, sb52, sb1436, sb1826 # 498
+xors 4, 1, sb53, sb1822, sb1435 # 499
+xors 4, 1, sb590, sb53, sb1434 # 500
+xors 4, 1, sb55, sb1434, sb1822 # 501
+xors 4, 1, sb56, sb1818, sb1433 # 502
+xors 4, 1, sb588, sb56, sb1432 # 503
+xors 4, 1, sb57, sb1432, sb1818 # 504
+xors 4, 1, sb58, sb1816, sb1431 # 505
+xors 4, 1, sb586, sb58, sb1430 # 506
+xors 4, 1, sb59, sb1430, sb1816 # 507
+xors 4, 1, sb61, sb1814, sb1429 # 508
+xors 4, 1, sb583, sb61, sb1428 # 509
+xors 4, 1, sb62, sb1428, sb1814 # 510
+xors 4, 1, sb63, sb1812, sb1427 # 511
+xors 4, 1, sb579, sb63, sb1426 # 512
+xors 4, 1, sb64, sb1426, sb1812 # 513
+xors 4, 1, sb65, sb1810, sb1425 # 514
+xors 4, 1, sb575, sb65, sb1424 # 515
+xors 4, 1, sb66, sb1424, sb1810 # 516
+xors 4, 1, sb67, sb1808, sb1423 # 517
+xors 4, 1, sb571, sb67, sb1422 # 518
+xors 4, 1, sb68, sb1422, sb1808 # 519
+xors 4, 1, sb69, sb1806, sb1421 # 520
+xors 4, 1, sb563, sb69, sb1420 # 521
+xors 4, 1, sb70, sb1420, sb1806 # 522
+xors 4, 1, sb71, sb1804, sb1419 # 523
+xors 4, 1, sb557, sb71, sb1418 # 524
+xors 4, 1, sb72, sb1418, sb1804 # 525
+dabit s102, sb227 # 526
+mulsi s100, s102, 2 # 527
+dabit s101, sb1800 # 528
+mulsi s95, s101, 2 # 529
+randoms s96, 47 # 530
+split 143, 3, s96, sb1416, sb1417, sb1796, sb1414, sb1415, sb1792, sb1412, sb1413, sb1788, sb1410, sb1411, sb1784, sb1408, sb1409, sb1780, sb1406, sb1407, sb1776, sb1404, sb1405, sb1772, sb1402, sb1403, sb1768, sb1400, sb1401, sb1764, sb1398, sb1399, sb1760, sb1396, sb1397, sb1756, sb1394, sb1395, sb1752, sb1392, sb1393, sb1748, sb1390, sb1391, sb1744, sb1388, sb1389, sb1742, sb1386, sb1387, sb1740, sb1384, sb1385, sb1738, sb1382, sb1383, sb1736, sb1380, sb1381, sb1734, sb1378, sb1379, sb1732, sb1376, sb1377, sb1730, sb1374, sb1375, sb1727, sb1372, sb1373, sb1723, sb1370, sb1371, sb1719, sb1368, sb1369, sb1717, sb1366, sb1367, sb1715, sb1364, sb1365, sb1713, sb1362, sb1363, sb1711, sb1360, sb1361, sb1709, sb1358, sb1359, sb1707, sb1356, sb1357, sb1705, sb1354, sb1355, sb1703, sb1352, sb1353, sb1701, sb1350, sb1351, sb1699, sb1348, sb1349, sb1697, sb1346, sb1347, sb1695, sb1344, sb1345, sb1693, sb1342, sb1343, sb1691, sb1340, sb1341, sb1689, sb1338, sb1339, sb1687, sb1336, sb1337, sb1685, sb1334, sb1335, sb1683, sb1332, sb1333, sb1681, sb1330, sb1331, sb1679, sb1328, sb1329, sb1677, sb1326, sb1327, sb1675, sb1324, sb1325, sb1673 # 531
+xors 4, 1, sb74, sb1796, sb1417 # 532
+xors 4, 1, sb75, sb1416, sb1796 # 533
+xors 4, 1, sb76, sb1792, sb1415 # 534
+xors 4, 1, sb841, sb76, sb1414 # 535
+xors 4, 1, sb77, sb1414, sb1792 # 536
+xors 4, 1, sb78, sb1788, sb1413 # 537
+xors 4, 1, sb837, sb78, sb1412 # 538
+xors 4, 1, sb79, sb1412, sb1788 # 539
+xors 4, 1, sb80, sb1784, sb1411 # 540
+xors 4, 1, sb831, sb80, sb1410 # 541
+xors 4, 1, sb81, sb1410, sb1784 # 542
+xors 4, 1, sb82, sb1780, sb1409 # 543
+xors 4, 1, sb829, sb82, sb1408 # 544
+xors 4, 1, sb83, sb1408, sb1780 # 545
+xors 4, 1, sb84, sb1776, sb1407 # 546
+xors 4, 1, sb820, sb84, sb1406 # 547
+xors 4, 1, sb85, sb1406, sb1776 # 548
+xors 4, 1, sb86, sb1772, sb1405 # 549
+xors 4, 1, sb813, sb86, sb1404 # 550
+xors 4, 1, sb87, sb1404, sb1772 # 551
+xors 4, 1, sb88, sb1768, sb1403 # 552
+xors 4, 1, sb811, sb88, sb1402 # 553
+xors 4, 1, sb89, sb1402, sb1768 # 554
+xors 4, 1, sb90, sb1764, sb1401 # 555
+xors 4, 1, sb805, sb90, sb1400 # 556
+xors 4, 1, sb91, sb1400, sb1764 # 557
+xors 4, 1, sb92, sb1760, sb1399 # 558
+xors 4, 1, sb795, sb92, sb1398 # 559
+xors 4, 1, sb93, sb1398, sb1760 # 560
+xors 4, 1, sb94, sb1756, sb1397 # 561
+xors 4, 1, sb793, sb94, sb1396 # 562
+xors 4, 1, sb95, sb1396, sb1756 # 563
+xors 4, 1, sb96, sb1752, sb1395 # 564
+xors 4, 1, sb791, sb96, sb1394 # 565
+xors 4, 1, sb98, sb1394, sb1752 # 566
+xors 4, 1, sb100, sb1748, sb1393 # 567
+xors 4, 1, sb784, sb100, sb1392 # 568
+xors 4, 1, sb101, sb1392, sb1748 # 569
+xors 4, 1, sb102, sb1744, sb1391 # 570
+xors 4, 1, sb777, sb102, sb1390 # 571
+xors 4, 1, sb103, sb1390, sb1744 # 572
+xors 4, 1, sb104, sb1742, sb1389 # 573
+xors 4, 1, sb775, sb104, sb1388 # 574
+xors 4, 1, sb105, sb1388, sb1742 # 575
+xors 4, 1, sb106, sb1740, sb1387 # 576
+xors 4, 1, sb767, sb106, sb1386 # 577
+xors 4, 1, sb107, sb1386, sb1740 # 578
+xors 4, 1, sb108, sb1738, sb1385 # 579
+xors 4, 1, sb758, sb108, sb1384 # 580
+xors 4, 1, sb109, sb1384, sb1738 # 581
+xors 4, 1, sb110, sb1736, sb1383 # 582
+xors 4, 1, sb756, sb110, sb1382 # 583
+xors 4, 1, sb112, sb1382, sb1736 # 584
+xors 4, 1, sb113, sb1734, sb1381 # 585
+xors 4, 1, sb750, sb113, sb1380 # 586
+xors 4, 1, sb115, sb1380, sb1734 # 587
+xors 4, 1, sb116, sb1732, sb1379 # 588
+xors 4, 1, sb739, sb116, sb1378 # 589
+xors 4, 1, sb117, sb1378, sb1732 # 590
+xors 4, 1, sb119, sb1730, sb1377 # 591
+xors 4, 1, sb737, sb119, sb1376 # 592
+xors 4, 1, sb120, sb1376, sb1730 # 593
+xors 4, 1, sb123, sb1727, sb1375 # 594
+xors 4, 1, sb733, sb123, sb1374 # 595
+xors 4, 1, sb124, sb1374, sb1727 # 596
+xors 4, 1, sb125, sb1723, sb1373 # 597
+xors 4, 1, sb725, sb125, sb1372 # 598
+xors 4, 1, sb127, sb1372, sb1723 # 599
+xors 4, 1, sb128, sb1719, sb1371 # 600
+xors 4, 1, sb721, sb128, sb1370 # 601
+xors 4, 1, sb129, sb1370, sb1719 # 602
+xors 4, 1, sb130, sb1717, sb1369 # 603
+xors 4, 1, sb719, sb130, sb1368 # 604
+xors 4, 1, sb131, sb1368, sb1717 # 605
+xors 4, 1, sb133, sb1715, sb1367 # 606
+xors 4, 1, sb717, sb133, sb1366 # 607
+xors 4, 1, sb134, sb1366, sb1715 # 608
+xors 4, 1, sb137, sb1713, sb1365 # 609
+xors 4, 1, sb710, sb137, sb1364 # 610
+xors 4, 1, sb141, sb1364, sb1713 # 611
+xors 4, 1, sb143, sb1711, sb1363 # 612
+xors 4, 1, sb703, sb143, sb1362 # 613
+xors 4, 1, sb147, sb1362, sb1711 # 614
+xors 4, 1, sb152, sb1709, sb1361 # 615
+xors 4, 1, sb701, sb152, sb1360 # 616
+xors 4, 1, sb158, sb1360, sb1709 # 617
+xors 4, 1, sb161, sb1707, sb1359 # 618
+xors 4, 1, sb697, sb161, sb1358 # 619
+xors 4, 1, sb163, sb1358, sb1707 # 620
+xors 4, 1, sb164, sb1705, sb1357 # 621
+xors 4, 1, sb689, sb164, sb1356 # 622
+xors 4, 1, sb166, sb1356, sb1705 # 623
+xors 4, 1, sb167, sb1703, sb1355 # 624
+xors 4, 1, sb684, sb167, sb1354 # 625
+xors 4, 1, sb168, sb1354, sb1703 # 626
+xors 4, 1, sb171, sb1701, sb1353 # 627
+xors 4, 1, sb682, sb171, sb1352 # 628
+xors 4, 1, sb175, sb1352, sb1701 # 629
+xors 4, 1, sb178, sb1699, sb1351 # 630
+xors 4, 1, sb678, sb178, sb1350 # 631
+xors 4, 1, sb180, sb1350, sb1699 # 632
+xors 4, 1, sb182, sb1697, sb1349 # 633
+xors 4, 1, sb670, sb182, sb1348 # 634
+xors 4, 1, sb187, sb1348, sb1697 # 635
+xors 4, 1, sb188, sb1695, sb1347 # 636
+xors 4, 1, sb665, sb188, sb1346 # 637
+xors 4, 1, sb189, sb1346, sb1695 # 638
+xors 4, 1, sb190, sb1693, sb1345 # 639
+xors 4, 1, sb663, sb190, sb1344 # 640
+xors 4, 1, sb192, sb1344, sb1693 # 641
+xors 4, 1, sb194, sb1691, sb1343 # 642
+xors 4, 1, sb659, sb194, sb1342 # 643
+xors 4, 1, sb195, sb1342, sb1691 # 644
+xors 4, 1, sb196, sb1689, sb1341 # 645
+xors 4, 1, sb651, sb196, sb1340 # 646
+xors 4, 1, sb200, sb1340, sb1689 # 647
+xors 4, 1, sb202, sb1687, sb1339 # 648
+xors 4, 1, sb646, sb202, sb1338 # 649
+xors 4, 1, sb209, sb1338, sb1687 # 650
+xors 4, 1, sb213, sb1685, sb1337 # 651
+xors 4, 1, sb644, sb213, sb1336 # 652
+xors 4, 1, sb218, sb1336, sb1685 # 653
+xors 4, 1, sb1672, sb1683, sb1335 # 654
+xors 4, 1, sb642, sb1672, sb1334 # 655
+xors 4, 1, sb222, sb1334, sb1683 # 656
+xors 4, 1, sb225, sb1681, sb1333 # 657
+xors 4, 1, sb640, sb225, sb1332 # 658
+xors 4, 1, sb229, sb1332, sb1681 # 659
+xors 4, 1, sb234, sb1679, sb1331 # 660
+xors 4, 1, sb636, sb234, sb1330 # 661
+xors 4, 1, sb237, sb1330, sb1679 # 662
+xors 4, 1, sb238, sb1677, sb1329 # 663
+xors 4, 1, sb632, sb238, sb1328 # 664
+xors 4, 1, sb240, sb1328, sb1677 # 665
+xors 4, 1, sb242, sb1675, sb1327 # 666
+xors 4, 1, sb628, sb242, sb1326 # 667
+xors 4, 1, sb244, sb1326, sb1675 # 668
+xors 4, 1, sb246, sb1673, sb1325 # 669
+xors 4, 1, sb624, sb246, sb1324 # 670
+xors 4, 1, sb247, sb1324, sb1673 # 671
+dabit s147, sb99 # 672
+mulsi s105, s147, 2 # 673
+dabit s98, sb1671 # 674
+mulsi s86, s98, 2 # 675
+ldi c3, 65536 # 676
+mulci c19, c3, 2147483647 # 677
+addci c28, c19, 65536 # 678
+bit s92 # 679
+ldi c17, 2 # 680
+mulci c16, c17, 2147483647 # 681
+addci c14, c16, 4 # 682
+mulci c15, c14, 2147483647 # 683
+addci c12, c15, 2 # 684
+mulm s94, s92, c12 # 685
+mulsi s76, s92, 2 # 686
+ldi c11, 65536 # 687
+mulci c1, c11, 2147483647 # 688
+addci c29, c1, 65536 # 689
+ldi c10, 32768 # 690
+mulci c13, c10, 2147483647 # 691
+addci c27, c13, 32768 # 692
+ldi c8, 1 # 693
+mulci c2, c8, 2147483647 # 694
+addci c6, c2, 2 # 695
+mulci c5, c6, 2147483647 # 696
+addci c26, c5, 1 # 697
+randoms s82, 32 # 698
+split 98, 3, s82, sb1322, sb1323, sb1669, sb1320, sb1321, sb1667, sb1318, sb1319, sb1665, sb1316, sb1317, sb1663, sb1314, sb1315, sb1661, sb1312, sb1313, sb1659, sb1310, sb1311, sb1657, sb1308, sb1309, sb1655, sb1306, sb1307, sb1653, sb1304, sb1305, sb1651, sb1302, sb1303, sb1649, sb1300, sb1301, sb1647, sb1298, sb1299, sb1645, sb1296, sb1297, sb1643, sb1294, sb1295, sb1641, sb1292, sb1293, sb1639, sb1290, sb1291, sb1637, sb1288, sb1289, sb1635, sb1286, sb1287, sb1633, sb1284, sb1285, sb1631, sb1282, sb1283, sb1629, sb1280, sb1281, sb1627, sb1278, sb1279, sb1625, sb1276, sb1277, sb1623, sb1274, sb1275, sb1621, sb1272, sb1273, sb1619, sb1270, sb1271, sb1617, sb1268, sb1269, sb1615, sb1266, sb1267, sb1613, sb1264, sb1265, sb1611, sb1262, sb1263, sb1609, sb1260, sb1261, sb1607 # 699
+xors 4, 1, sb248, sb1669, sb1323 # 700
+xors 4, 1, sb250, sb1322, sb1669 # 701
+xors 4, 1, sb252, sb1667, sb1321 # 702
+xors 4, 1, sb1728, sb252, sb1320 # 703
+xors 4, 1, sb253, sb1320, sb1667 # 704
+xors 4, 1, sb254, sb1665, sb1319 # 705
+xors 4, 1, sb1726, sb254, sb1318 # 706
+xors 4, 1, sb256, sb1318, sb1665 # 707
+xors 4, 1, sb257, sb1663, sb1317 # 708
+xors 4, 1, sb1724, sb257, sb1316 # 709
+xors 4, 1, sb258, sb1316, sb1663 # 710
+xors 4, 1, sb261, sb1661, sb1315 # 711
+xors 4, 1, sb1722, sb261, sb1314 # 712
+xors 4, 1, sb266, sb1314, sb1661 # 713
+xors 4, 1, sb270, sb1659, sb1313 # 714
+xors 4, 1, sb1720, sb270, sb1312 # 715
+xors 4, 1, sb273, sb1312, sb1659 # 716
+xors 4, 1, sb275, sb1657, sb1311 # 717
+xors 4, 1, sb135, sb275, sb1310 # 718
+xors 4, 1, sb278, sb1310, sb1657 # 719
+xors 4, 1, sb280, sb1655, sb1309 # 720
+xors 4, 1, sb122, sb280, sb1308 # 721
+xors 4, 1, sb282, sb1308, sb1655 # 722
+xors 4, 1, sb285, sb1653, sb1307 # 723
+xors 4, 1, sb114, sb285, sb1306 # 724
+xors 4, 1, sb287, sb1306, sb1653 # 725
+xors 4, 1, sb289, sb1651, sb1305 # 726
+xors 4, 1, sb97, sb289, sb1304 # 727
+xors 4, 1, sb290, sb1304, sb1651 # 728
+xors 4, 1, sb292, sb1649, sb1303 # 729
+xors 4, 1, sb73, sb292, sb1302 # 730
+xors 4, 1, sb294, sb1302, sb1649 # 731
+xors 4, 1, sb296, sb1647, sb1301 # 732
+xors 4, 1, sb60, sb296, sb1300 # 733
+xors 4, 1, sb297, sb1300, sb1647 # 734
+xors 4, 1, sb298, sb1645, sb1299 # 735
+xors 4, 1, sb54, sb298, sb1298 # 736
+xors 4, 1, sb299, sb1298, sb1645 # 737
+xors 4, 1, sb300, sb1643, sb1297 # 738
+xors 4, 1, sb43, sb300, sb1296 # 739
+xors 4, 1, sb302, sb1296, sb1643 # 740
+xors 4, 1, sb303, sb1641, sb1295 # 741
+xors 4, 1, sb35, sb303, sb1294 # 742
+xors 4, 1, sb304, sb1294, sb1641 # 743
+xors 4, 1, sb306, sb1639, sb1293 # 744
+xors 4, 1, sb28, sb306, sb1292 # 745
+xors 4, 1, sb308, sb1292, sb1639 # 746
+xors 4, 1, sb309, sb1637, sb1291 # 747
+xors 4, 1, sb23, sb309, sb1290 # 748
+xors 4, 1, sb311, sb1290, sb1637 # 749
+xors 4, 1, sb312, sb1635, sb1289 # 750
+xors 4, 1, sb19, sb312, sb1288 # 751
+xors 4, 1, sb313, sb1288, sb1635 # 752
+xors 4, 1, sb314, sb1633, sb1287 # 753
+xors 4, 1, sb1038, sb314, sb1286 # 754
+xors 4, 1, sb315, sb1286, sb1633 # 755
+xors 4, 1, sb316, sb1631, sb1285 # 756
+xors 4, 1, sb1036, sb316, sb1284 # 757
+xors 4, 1, sb317, sb1284, sb1631 # 758
+xors 4, 1, sb318, sb1629, sb1283 # 759
+xors 4, 1, sb1032, sb318, sb1282 # 760
+xors 4, 1, sb319, sb1282, sb1629 # 761
+xors 4, 1, sb320, sb1627, sb1281 # 762
+xors 4, 1, sb1030, sb320, sb1280 # 763
+xors 4, 1, sb321, sb1280, sb1627 # 764
+xors 4, 1, sb322, sb1625, sb1279 # 765
+xors 4, 1, sb1028, sb322, sb1278 # 766
+xors 4, 1, sb323, sb1278, sb1625 # 767
+xors 4, 1, sb324, sb1623, sb1277 # 768
+xors 4, 1, sb1026, sb324, sb1276 # 769
+xors 4, 1, sb325, sb1276, sb1623 # 770
+xors 4, 1, sb326, sb1621, sb1275 # 771
+xors 4, 1, sb1022, sb326, sb1274 # 772
+xors 4, 1, sb328, sb1274, sb1621 # 773
+xors 4, 1, sb332, sb1619, sb1273 # 774
+xors 4, 1, sb1018, sb332, sb1272 # 775
+xors 4, 1, sb333, sb1272, sb1619 # 776
+xors 4, 1, sb334, sb1617, sb1271 # 777
+xors 4, 1, sb939, sb334, sb1270 # 778
+xors 4, 1, sb336, sb1270, sb1617 # 779
+xors 4, 1, sb339, sb1615, sb1269 # 780
+xors 4, 1, sb908, sb339, sb1268 # 781
+xors 4, 1, sb341, sb1268, sb1615 # 782
+xors 4, 1, sb343, sb1613, sb1267 # 783
+xors 4, 1, sb906, sb343, sb1266 # 784
+xors 4, 1, sb346, sb1266, sb1613 # 785
+xors 4, 1, sb350, sb1611, sb1265 # 786
+xors 4, 1, sb904, sb350, sb1264 # 787
+xors 4, 1, sb354, sb1264, sb1611 # 788
+xors 4, 1, sb357, sb1609, sb1263 # 789
+xors 4, 1, sb902, sb357, sb1262 # 790
+xors 4, 1, sb359, sb1262, sb1609 # 791
+xors 4, 1, sb361, sb1607, sb1261 # 792
+xors 4, 1, sb894, sb361, sb1260 # 793
+xors 4, 1, sb365, sb1260, sb1607 # 794
+dabit s89, sb216 # 795
+mulsi s87, s89, 2 # 796
+dabit s88, sb1605 # 797
+mulsi s81, s88, 2 # 798
+ldi c4, 2 # 799
+mulci c2, c4, 2147483647 # 800
+addci c24, c2, 2 # 801
+randoms s50, 31 # 802
+split 95, 3, s50, sb1258, sb1259, sb1603, sb1256, sb1257, sb1601, sb1254, sb1255, sb1599, sb1252, sb1253, sb1597, sb1250, sb1251, sb1595, sb1248, sb1249, sb1593, sb1246, sb1247, sb1591, sb1244, sb1245, sb1589, sb1242, sb1243, sb1587, sb1240, sb1241, sb1585, sb1238, sb1239, sb1583, sb1236, sb1237, sb1581, sb1234, sb1235, sb1579, sb1232, sb1233, sb1577, sb1230, sb1231, sb1575, sb1228, sb1229, sb1573, sb1226, sb1227, sb1571, sb1224, sb1225, sb1569, sb1222, sb1223, sb1567, sb1220, sb1221, sb1565, sb1218, sb1219, sb1563, sb1216, sb1217, sb1561, sb1214, sb1215, sb1559, sb1212, sb1213, sb1557, sb1210, sb1211, sb1555, sb1208, sb1209, sb1553, sb1206, sb1207, sb1551, sb1204, sb1205, sb1549, sb1202, sb1203, sb1547, sb1200, sb1201, sb1545, sb1198, sb1199, sb1543 # 803
+xors 4, 1, sb367, sb1603, sb1259 # 804
+xors 4, 1, sb369, sb1258, sb1603 # 805
+xors 4, 1, sb372, sb1601, sb1257 # 806
+xors 4, 1, sb1803, sb372, sb1256 # 807
+xors 4, 1, sb375, sb1256, sb1601 # 808
+xors 4, 1, sb377, sb1599, sb1255 # 809
+xors 4, 1, sb1801, sb377, sb1254 # 810
+xors 4, 1, sb381, sb1254, sb1599 # 811
+xors 4, 1, sb384, sb1597, sb1253 # 812
+xors 4, 1, sb1799, sb384, sb1252 # 813
+xors 4, 1, sb386, sb1252, sb1597 # 814
+xors 4, 1, sb390, sb1595, sb1251 # 815
+xors 4, 1, sb1797, sb390, sb1250 # 816
+xors 4, 1, sb395, sb1250, sb1595 # 817
+xors 4, 1, sb399, sb1593, sb1249 # 818
+xors 4, 1, sb1795, sb399, sb1248 # 819
+xors 4, 1, sb402, sb1248, sb1593 # 820
+xors 4, 1, sb406, sb1591, sb1247 # 821
+xors 4, 1, sb1793, sb406, sb1246 # 822
+xors 4, 1, sb408, sb1246, sb1591 # 823
+xors 4, 1, sb411, sb1589, sb1245 # 824
+xors 4, 1, sb1791, sb411, sb1244 # 825
+xors 4, 1, sb415, sb1244, sb1589 # 826
+xors 4, 1, sb417, sb1587, sb1243 # 827
+xors 4, 1, sb1789, sb417, sb1242 # 828
+xors 4, 1, sb420, sb1242, sb1587 # 829
+xors 4, 1, sb422, sb1585, sb1241 # 830
+xors 4, 1, sb1787, sb422, sb1240 # 831
+xors 4, 1, sb424, sb1240, sb1585 # 832
+xors 4, 1, sb425, sb1583, sb1239 # 833
+xors 4, 1, sb1785, sb425, sb1238 # 834
+xors 4, 1, sb426, sb1238, sb1583 # 835
+xors 4, 1, sb428, sb1581, sb1237 # 836
+xors 4, 1, sb1783, sb428, sb1236 # 837
+xors 4, 1, sb431, sb1236, sb1581 # 838
+xors 4, 1, sb433, sb1579, sb1235 # 839
+xors 4, 1, sb1781, sb433, sb1234 # 840
+xors 4, 1, sb434, sb1234, sb1579 # 841
+xors 4, 1, sb435, sb1577, sb1233 # 842
+xors 4, 1, sb1779, sb435, sb1232 # 843
+xors 4, 1, sb437, sb1232, sb1577 # 844
+xors 4, 1, sb438, sb1575, sb1231 # 845
+xors 4, 1, sb1777, sb438, sb1230 # 846
+xors 4, 1, sb440, sb1230, sb1575 # 847
+xors 4, 1, sb442, sb1573, sb1229 # 848
+xors 4, 1, sb1775, sb442, sb1228 # 849
+xors 4, 1, sb443, sb1228, sb1573 # 850
+xors 4, 1, sb445, sb1571, sb1227 # 851
+xors 4, 1, sb1773, sb445, sb1226 # 852
+xors 4, 1, sb448, sb1226, sb1571 # 853
+xors 4, 1, sb451, sb1569, sb1225 # 854
+xors 4, 1, sb1771, sb451, sb1224 # 855
+xors 4, 1, sb454, sb1224, sb1569 # 856
+xors 4, 1, sb457, sb1567, sb1223 # 857
+xors 4, 1, sb1769, sb457, sb1222 # 858
+xors 4, 1, sb460, sb1222, sb1567 # 859
+xors 4, 1, sb463, sb1565, sb1221 # 860
+xors 4, 1, sb1767, sb463, sb1220 # 861
+xors 4, 1, sb467, sb1220, sb1565 # 862
+xors 4, 1, sb470, sb1563, sb1219 # 863
+xors 4, 1, sb1765, sb470, sb1218 # 864
+xors 4, 1, sb473, sb1218, sb1563 # 865
+xors 4, 1, sb475, sb1561, sb1217 # 866
+xors 4, 1, sb1763, sb475, sb1216 # 867
+xors 4, 1, sb478, sb1216, sb1561 # 868
+xors 4, 1, sb481, sb1559, sb1215 # 869
+xors 4, 1, sb1761, sb481, sb1214 # 870
+xors 4, 1, sb485, sb1214, sb1559 # 871
+xors 4, 1, sb487, sb1557, sb1213 # 872
+xors 4, 1, sb1759, sb487, sb1212 # 873
+xors 4, 1, sb491, sb1212, sb1557 # 874
+xors 4, 1, sb494, sb1555, sb1211 # 875
+xors 4, 1, sb1757, sb494, sb1210 # 876
+xors 4, 1, sb497, sb1210, sb1555 # 877
+xors 4, 1, sb499, sb1553, sb1209 # 878
+xors 4, 1, sb1755, sb499, sb1208 # 879
+xors 4, 1, sb501, sb1208, sb1553 # 880
+xors 4, 1, sb503, sb1551, sb1207 # 881
+xors 4, 1, sb1753, sb503, sb1206 # 882
+xors 4, 1, sb505, sb1206, sb1551 # 883
+xors 4, 1, sb508, sb1549, sb1205 # 884
+xors 4, 1, sb1751, sb508, sb1204 # 885
+xors 4, 1, sb510, sb1204, sb1549 # 886
+xors 4, 1, sb512, sb1547, sb1203 # 887
+xors 4, 1, sb1749, sb512, sb1202 # 888
+xors 4, 1, sb514, sb1202, sb1547 # 889
+xors 4, 1, sb516, sb1545, sb1201 # 890
+xors 4, 1, sb1747, sb516, sb1200 # 891
+xors 4, 1, sb518, sb1200, sb1545 # 892
+xors 4, 1, sb520, sb1543, sb1199 # 893
+xors 4, 1, sb1745, sb520, sb1198 # 894
+xors 4, 1, sb522, sb1198, sb1543 # 895
+dabit s85, sb210 # 896
+mulsi s83, s85, 2 # 897
+dabit s84, sb1541 # 898
+mulsi s66, s84, 2 # 899
+ldi c9, 1 # 900
+mulci c37, c9, 2147483647 # 901
+addci c23, c37, 1 # 902
+bit s67 # 903
+ldi c37, 2 # 904
+mulci c7, c37, 2147483647 # 905
+addci c25, c7, 4 # 906
+mulci c18, c25, 2147483647 # 907
+addci c22, c18, 2 # 908
+mulm s80, s67, c22 # 909
+ldi c13, 2 # 910
+mulci c21, c13, 2147483647 # 911
+addci c20, c21, 2 # 912
+mulsi s64, s67, 2 # 913
+ldi c18, 1 # 914
+mulci c3, c18, 2147483647 # 915
+addci c19, c3, 1 # 916
+ldi c16, 1073741824 # 917
+mulci c17, c16, 2147483647 # 918
+addci c25, c17, 1073741824 # 919
+randoms s69, 32 # 920
+split 98, 3, s69, sb1196, sb1197, sb1539, sb1194, sb1195, sb1537, sb1192, sb1193, sb1535, sb1190, sb1191, sb1533, sb1188, sb1189, sb1531, sb1186, sb1187, sb1529, sb1184, sb1185, sb1527, sb1182, sb1183, sb1525, sb1180, sb1181, sb1523, sb1178, sb1179, sb1521, sb1176, sb1177, sb1519, sb1174, sb1175, sb1517, sb1172, sb1173, sb1515, sb1170, sb1171, sb1513, sb1168, sb1169, sb1511, sb1166, sb1167, sb1509, sb1164, sb1165, sb1507, sb1162, sb1163, sb1505, sb1160, sb1161, sb1503, sb1158, sb1159, sb1501, sb1156, sb1157, sb1499, sb1154, sb1155, sb1497, sb1152, sb1153, sb1495, sb1150, sb1151, sb1493, sb1148, sb1149, sb1491, sb1146, sb1147, sb1489, sb1144, sb1145, sb1487, sb1142, sb1143, sb1485, sb1140, sb1141, sb1483, sb1138, sb1139, sb1481, sb1136, sb1137, sb1479, sb1134, sb1135, sb1477 # 921
+xors 4, 1, sb524, sb1539, sb1197 # 922
+xors 4, 1, sb526, sb1196, sb1539 # 923
+xors 4, 1, sb528, sb1537, sb1195 # 924
+xors 4, 1, sb1879, sb528, sb1194 # 925
+xors 4, 1, sb529, sb1194, sb1537 # 926
+xors 4, 1, sb530, sb1535, sb1193 # 927
+xors 4, 1, sb1877, sb530, sb1192 # 928
+xors 4, 1, sb531, sb1192, sb1535 # 929
+xors 4, 1, sb533, sb1533, sb1191 # 930
+xors 4, 1, sb1875, sb533, sb1190 # 931
+xors 4, 1, sb535, sb1190, sb1533 # 932
+xors 4, 1, sb537, sb1531, sb1189 # 933
+xors 4, 1, sb1873, sb537, sb1188 # 934
+xors 4, 1, sb539, sb1188, sb1531 # 935
+xors 4, 1, sb541, sb1529, sb1187 # 936
+xors 4, 1, sb1871, sb541, sb1186 # 937
+xors 4, 1, sb543, sb1186, sb1529 # 938
+xors 4, 1, sb546, sb1527, sb1185 # 939
+xors 4, 1, sb1869, sb546, sb1184 # 940
+xors 4, 1, sb547, sb1184, sb1527 # 941
+xors 4, 1, sb548, sb1525, sb1183 # 942
+xors 4, 1, sb1867, sb548, sb1182 # 943
+xors 4, 1, sb549, sb1182, sb1525 # 944
+xors 4, 1, sb550, sb1523, sb1181 # 945
+xors 4, 1, sb1865, sb550, sb1180 # 946
+xors 4, 1, sb551, sb1180, sb1523 # 947
+xors 4, 1, sb552, sb1521, sb1179 # 948
+xors 4, 1, sb1863, sb552, sb1178 # 949
+xors 4, 1, sb553, sb1178, sb1521 # 950
+xors 4, 1, sb554, sb1519, sb1177 # 951
+xors 4, 1, sb1861, sb554, sb1176 # 952
+xors 4, 1, sb555, sb1176, sb1519 # 953
+xors 4, 1, sb556, sb1517, sb1175 # 954
+xors 4, 1, sb1859, sb556, sb1174 # 955
+xors 4, 1, sb558, sb1174, sb1517 # 956
+xors 4, 1, sb559, sb1515, sb1173 # 957
+xors 4, 1, sb1857, sb559, sb1172 # 958
+xors 4, 1, sb560, sb1172, sb1515 # 959
+xors 4, 1, sb561, sb1513, sb1171 # 960
+xors 4, 1, sb1855, sb561, sb1170 # 961
+xors 4, 1, sb562, sb1170, sb1513 # 962
+xors 4, 1, sb564, sb1511, sb1169 # 963
+xors 4, 1, sb1853, sb564, sb1168 # 964
+xors 4, 1, sb565, sb1168, sb1511 # 965
+xors 4, 1, sb566, sb1509, sb1167 # 966
+xors 4, 1, sb1851, sb566, sb1166 # 967
+xors 4, 1, sb567, sb1166, sb1509 # 968
+xors 4, 1, sb568, sb1507, sb1165 # 969
+xors 4, 1, sb1849, sb568, sb1164 # 970
+xors 4, 1, sb569, sb1164, sb1507 # 971
+xors 4, 1, sb570, sb1505, sb1163 # 972
+xors 4, 1, sb1847, sb570, sb1162 # 973
+xors 4, 1, sb572, sb1162, sb1505 # 974
+xors 4, 1, sb573, sb1503, sb1161 # 975
+xors 4, 1, sb1845, sb573, sb1160 # 976
+xors 4, 1, sb577, sb1160, sb1503 # 977
+xors 4, 1, sb581, sb1501, sb1159 # 978
+xors 4, 1, sb1843, sb581, sb1158 # 979
+xors 4, 1, sb585, sb1158, sb1501 # 980
+xors 4, 1, sb587, sb1499, sb1157 # 981
+xors 4, 1, sb1841, sb587, sb1156 # 982
+xors 4, 1, sb589, sb1156, sb1499 # 983
+xors 4, 1, sb592, sb1497, sb1155 # 984
+xors 4, 1, sb1839, sb592, sb1154 # 985
+xors 4, 1, sb596, sb1154, sb1497 # 986
+xors 4, 1, sb600, sb1495, sb1153 # 987
+xors 4, 1, sb1837, sb600, sb1152 # 988
+xors 4, 1, sb604, sb1152, sb1495 # 989
+xors 4, 1, sb606, sb1493, sb1151 # 990
+xors 4, 1, sb1835, sb606, sb1150 # 991
+xors 4, 1, sb608, sb1150, sb1493 # 992
+xors 4, 1, sb611, sb1491, sb1149 # 993
+xors 4, 1, sb1833, sb611, sb1148 # 994
+xors 4, 1, sb613, sb1148, sb1491 # 995
+xors 4, 1, sb615, sb1489, sb1147 # 996
+xors 4, 1, sb1831, sb615, sb1146 # 997
+xors 4, 1, sb616, sb1146, sb1489 # 998
+xors 4, 1, sb617, sb1487, sb1145 # 999
+xors 4, 1, sb1829, sb617, sb1144 # 1000
+xors 4, 1, sb618, sb1144, sb1487 # 1001
+xors 4, 1, sb619, sb1485, sb1143 # 1002
+xors 4, 1, sb1827, sb619, sb1142 # 1003
+xors 4, 1, sb620, sb1142, sb1485 # 1004
+xors 4, 1, sb622, sb1483, sb1141 # 1005
+xors 4, 1, sb1825, sb622, sb1140 # 1006
+xors 4, 1, sb626, sb1140, sb1483 # 1007
+xors 4, 1, sb630, sb1481, sb1139 # 1008
+xors 4, 1, sb1823, sb630, sb1138 # 1009
+xors 4, 1, sb634, sb1138, sb1481 # 1010
+xors 4, 1, sb638, sb1479, sb1137 # 1011
+xors 4, 1, sb1821, sb638, sb1136 # 1012
+xors 4, 1, sb641, sb1136, sb1479 # 1013
+xors 4, 1, sb643, sb1477, sb1135 # 1014
+xors 4, 1, sb1819, sb643, sb1134 # 1015
+xors 4, 1, sb645, sb1134, sb1477 # 1016
+dabit s79, sb204 # 1017
+mulsi s77, s79, 2 # 1018
+dabit s78, sb1475 # 1019
+mulsi s71, s78, 2 # 1020
+ldi c15, 2 # 1021
+mulci c14, c15, 2147483647 # 1022
+addci c22, c14, 2 # 1023
+randoms s72, 30 # 1024
+split 92, 3, s72, sb1132, sb1133, sb1473, sb1130, sb1131, sb1471, sb1128, sb1129, sb1469, sb1126, sb1127, sb1467, sb1124, sb1125, sb1465, sb1122, sb1123, sb1463, sb1120, sb1121, sb1461, sb1118, sb1119, sb1459, sb1116, sb1117, sb1457, sb1114, sb1115, sb1455, sb1112, sb1113, sb1453, sb1110, sb1111, sb1451, sb1108, sb1109, sb1449, sb1106, sb1107, sb1447, sb1104, sb1105, sb1445, sb1102, sb1103, sb1443, sb1100, sb1101, sb1441, sb1098, sb1099, sb1439, sb1096, sb1097, sb1437, sb1094, sb1095, sb1435, sb1092, sb1093, sb1433, sb1090, sb1091, sb1431, sb1088, sb1089, sb1429, sb1086, sb1087, sb1427, sb1084, sb1085, sb1425, sb1082, sb1083, sb1423, sb1080, sb1081, sb1421, sb1078, sb1079, sb1419, sb1076, sb1077, sb1417, sb1074, sb1075, sb1415 # 1025
+xors 4, 1, sb647, sb1473, sb1133 # 1026
+xors 4, 1, sb655, sb1132, sb1473 # 1027
+xors 4, 1, sb662, sb1471, sb1131 # 1028
+xors 4, 1, sb1952, sb662, sb1130 # 1029
+xors 4, 1, sb664, sb1130, sb1471 # 1030
+xors 4, 1, sb666, sb1469, sb1129 # 1031
+xors 4, 1, sb1950, sb666, sb1128 # 1032
+xors 4, 1, sb667, sb1128, sb1469 # 1033
+xors 4, 1, sb674, sb1467, sb1127 # 1034
+xors 4, 1, sb1948, sb674, sb1126 # 1035
+xors 4, 1, sb681, sb1126, sb1467 # 1036
+xors 4, 1, sb683, sb1465, sb1125 # 1037
+xors 4, 1, sb1946, sb683, sb1124 # 1038
+xors 4, 1, sb685, sb1124, sb1465 # 1039
+xors 4, 1, sb693, sb1463, sb1123 # 1040
+xors 4, 1, sb1944, sb693, sb1122 # 1041
+xors 4, 1, sb700, sb1122, sb1463 # 1042
+xors 4, 1, sb702, sb1461, sb1121 # 1043
+xors 4, 1, sb1942, sb702, sb1120 # 1044
+xors 4, 1, sb704, sb1120, sb1461 # 1045
+xors 4, 1, sb708, sb1459, sb1119 # 1046
+xors 4, 1, sb1940, sb708, sb1118 # 1047
+xors 4, 1, sb716, sb1118, sb1459 # 1048
+xors 4, 1, sb718, sb1457, sb1117 # 1049
+xors 4, 1, sb1938, sb718, sb1116 # 1050
+xors 4, 1, sb720, sb1116, sb1457 # 1051
+xors 4, 1, sb723, sb1455, sb1115 # 1052
+xors 4, 1, sb1936, sb723, sb1114 # 1053
+xors 4, 1, sb729, sb1114, sb1455 # 1054
+xors 4, 1, sb736, sb1453, sb1113 # 1055
+xors 4, 1, sb1934, sb736, sb1112 # 1056
+xors 4, 1, sb738, sb1112, sb1453 # 1057
+xors 4, 1, sb741, sb1451, sb1111 # 1058
+xors 4, 1, sb1932, sb741, sb1110 # 1059
+xors 4, 1, sb744, sb1110, sb1451 # 1060
+xors 4, 1, sb755, sb1449, sb1109 # 1061
+xors 4, 1, sb1930, sb755, sb1108 # 1062
+xors 4, 1, sb757, sb1108, sb1449 # 1063
+xors 4, 1, sb761, sb1447, sb1107 # 1064
+xors 4, 1, sb1928, sb761, sb1106 # 1065
+xors 4, 1, sb774, sb1106, sb1447 # 1066
+xors 4, 1, sb776, sb1445, sb1105 # 1067
+xors 4, 1, sb1926, sb776, sb1104 # 1068
+xors 4, 1, sb778, sb1104, sb1445 # 1069
+xors 4, 1, sb790, sb1443, sb1103 # 1070
+xors 4, 1, sb1924, sb790, sb1102 # 1071
+xors 4, 1, sb792, sb1102, sb1443 # 1072
+xors 4, 1, sb794, sb1441, sb1101 # 1073
+xors 4, 1, sb1922, sb794, sb1100 # 1074
+xors 4, 1, sb799, sb1100, sb1441 # 1075
+xors 4, 1, sb810, sb1439, sb1099 # 1076
+xors 4, 1, sb1920, sb810, sb1098 # 1077
+xors 4, 1, sb812, sb1098, sb1439 # 1078
+xors 4, 1, sb815, sb1437, sb1097 # 1079
+xors 4, 1, sb1918, sb815, sb1096 # 1080
+xors 4, 1, sb816, sb1096, sb1437 # 1081
+xors 4, 1, sb818, sb1435, sb1095 # 1082
+xors 4, 1, sb1916, sb818, sb1094 # 1083
+xors 4, 1, sb824, sb1094, sb1435 # 1084
+xors 4, 1, sb830, sb1433, sb1093 # 1085
+xors 4, 1, sb1914, sb830, sb1092 # 1086
+xors 4, 1, sb832, sb1092, sb1433 # 1087
+xors 4, 1, sb839, sb1431, sb1091 # 1088
+xors 4, 1, sb1912, sb839, sb1090 # 1089
+xors 4, 1, sb843, sb1090, sb1431 # 1090
+xors 4, 1, sb845, sb1429, sb1089 # 1091
+xors 4, 1, sb1910, sb845, sb1088 # 1092
+xors 4, 1, sb848, sb1088, sb1429 # 1093
+xors 4, 1, sb849, sb1427, sb1087 # 1094
+xors 4, 1, sb1908, sb849, sb1086 # 1095
+xors 4, 1, sb850, sb1086, sb1427 # 1096
+xors 4, 1, sb851, sb1425, sb1085 # 1097
+xors 4, 1, sb1906, sb851, sb1084 # 1098
+xors 4, 1, sb856, sb1084, sb1425 # 1099
+xors 4, 1, sb860, sb1423, sb1083 # 1100
+xors 4, 1, sb1904, sb860, sb1082 # 1101
+xors 4, 1, sb862, sb1082, sb1423 # 1102
+xors 4, 1, sb864, sb1421, sb1081 # 1103
+xors 4, 1, sb1902, sb864, sb1080 # 1104
+xors 4, 1, sb865, sb1080, sb1421 # 1105
+xors 4, 1, sb866, sb1419, sb1079 # 1106
+xors 4, 1, sb1900, sb866, sb1078 # 1107
+xors 4, 1, sb867, sb1078, sb1419 # 1108
+xors 4, 1, sb868, sb1417, sb1077 # 1109
+xors 4, 1, sb1898, sb868, sb1076 # 1110
+xors 4, 1, sb873, sb1076, sb1417 # 1111
+xors 4, 1, sb875, sb1415, sb1075 # 1112
+xors 4, 1, sb1896, sb875, sb1074 # 1113
+xors 4, 1, sb883, sb1074, sb1415 # 1114
+dabit s75, sb198 # 1115
+mulsi s73, s75, 2 # 1116
+dabit s74, sb1413 # 1117
+mulsi s42, s74, 2 # 1118
+bit s65 # 1119
+ldi c13, 1 # 1120
+mulci c12, c13, 2147483647 # 1121
+addci c11, c12, 2 # 1122
+mulci c1, c11, 2147483647 # 1123
+addci c10, c1, 1 # 1124
+mulm s70, s65, c10 # 1125
+ldi c9, 2 # 1126
+mulci c8, c9, 2147483647 # 1127
+addci c21, c8, 2 # 1128
+mulsi s60, s65, 2 # 1129
+ldi c7, 1 # 1130
+mulci c6, c7, 2147483647 # 1131
+addci c5, c6, 2 # 1132
+mulci c4, c5, 2147483647 # 1133
+addci c18, c4, 1 # 1134
+randoms s56, 32 # 1135
+split 98, 3, s56, sb1072, sb1073, sb1411, sb1070, sb1071, sb1409, sb1068, sb1069, sb1407, sb1066, sb1067, sb1405, sb1064, sb1065, sb1403, sb1062, sb1063, sb1401, sb1060, sb1061, sb1399, sb1058, sb1059, sb1397, sb1056, sb1057, sb1395, sb1054, sb1055, sb1393, sb1052, sb1053, sb1391, sb1050, sb1051, sb1389, sb1048, sb1049, sb1387, sb1046, sb1047, sb1385, sb1044, sb1045, sb1383, sb1042, sb1043, sb1381, sb1040, sb1041, sb1379, sb1037, sb1039, sb1377, sb1034, sb1035, sb1375, sb1015, sb1016, sb1373, sb1013, sb1014, sb1371, sb1011, sb1012, sb1368, sb1009, sb1010, sb1364, sb1007, sb1008, sb1360, sb1001, sb1005, sb1356, sb997, sb999, sb1352, sb993, sb995, sb1348, sb989, sb991, sb1344, sb985, sb987, sb1342, sb977, sb983, sb1340, sb980, sb981, sb1338, sb978, sb979, sb1336 # 1136
+xors 4, 1, sb884, sb1411, sb1073 # 1137
+xors 4, 1, sb885, sb1072, sb1411 # 1138
+xors 4, 1, sb886, sb1409, sb1071 # 1139
+xors 4, 1, sb2028, sb886, sb1070 # 1140
+xors 4, 1, sb887, sb1070, sb1409 # 1141
+xors 4, 1, sb888, sb1407, sb1069 # 1142
+xors 4, 1, sb2026, sb888, sb1068 # 1143
+xors 4, 1, sb890, sb1068, sb1407 # 1144
+xors 4, 1, sb900, sb1405, sb1067 # 1145
+xors 4, 1, sb2024, sb900, sb1066 # 1146
+xors 4, 1, sb903, sb1066, sb1405 # 1147
+xors 4, 1, sb905, sb1403, sb1065 # 1148
+xors 4, 1, sb2022, sb905, sb1064 # 1149
+xors 4, 1, sb907, sb1064, sb1403 # 1150
+xors 4, 1, sb923, sb1401, sb1063 # 1151
+xors 4, 1, sb2020, sb923, sb1062 # 1152
+xors 4, 1, sb931, sb1062, sb1401 # 1153
+xors 4, 1, sb955, sb1399, sb1061 # 1154
+xors 4, 1, sb2018, sb955, sb1060 # 1155
+xors 4, 1, sb982, sb1060, sb1399 # 1156
+xors 4, 1, sb984, sb1397, sb1059 # 1157
+xors 4, 1, sb2016, sb984, sb1058 # 1158
+xors 4, 1, sb986, sb1058, sb1397 # 1159
+xors 4, 1, sb988, sb1395, sb1057 # 1160
+xors 4, 1, sb2014, sb988, sb1056 # 1161
+xors 4, 1, sb990, sb1056, sb1395 # 1162
+xors 4, 1, sb992, sb1393, sb1055 # 1163
+xors 4, 1, sb2012, sb992, sb1054 # 1164
+xors 4, 1, sb994, sb1054, sb1393 # 1165
+xors 4, 1, sb996, sb1391, sb1053 # 1166
+xors 4, 1, sb2010, sb996, sb1052 # 1167
+xors 4, 1, sb998, sb1052, sb1391 # 1168
+xors 4, 1, sb1000, sb1389, sb1051 # 1169
+xors 4, 1, sb2008, sb1000, sb1050 # 1170
+xors 4, 1, sb1002, sb1050, sb1389 # 1171
+xors 4, 1, sb1003, sb1387, sb1049 # 1172
+xors 4, 1, sb2006, sb1003, sb1048 # 1173
+xors 4, 1, sb1004, sb1048, sb1387 # 1174
+xors 4, 1, sb1006, sb1385, sb1047 # 1175
+xors 4, 1, sb2004, sb1006, sb1046 # 1176
+xors 4, 1, sb1017, sb1046, sb1385 # 1177
+xors 4, 1, sb1019, sb1383, sb1045 # 1178
+xors 4, 1, sb2002, sb1019, sb1044 # 1179
+xors 4, 1, sb1020, sb1044, sb1383 # 1180
+xors 4, 1, sb1021, sb1381, sb1043 # 1181
+xors 4, 1, sb2000, sb1021, sb1042 # 1182
+xors 4, 1, sb1023, sb1042, sb1381 # 1183
+xors 4, 1, sb1024, sb1379, sb1041 # 1184
+xors 4, 1, sb1998, sb1024, sb1040 # 1185
+xors 4, 1, sb1025, sb1040, sb1379 # 1186
+xors 4, 1, sb1027, sb1377, sb1039 # 1187
+xors 4, 1, sb1996, sb1027, sb1037 # 1188
+xors 4, 1, sb1029, sb1037, sb1377 # 1189
+xors 4, 1, sb1031, sb1375, sb1035 # 1190
+xors 4, 1, sb1994, sb1031, sb1034 # 1191
+xors 4, 1, sb1033, sb1034, sb1375 # 1192
+xors 4, 1, sb1034, sb1373, sb1016 # 1193
+xors 4, 1, sb1992, sb1034, sb1015 # 1194
+xors 4, 1, sb1035, sb1015, sb1373 # 1195
+xors 4, 1, sb1037, sb1371, sb1014 # 1196
+xors 4, 1, sb1990, sb1037, sb1013 # 1197
+xors 4, 1, sb1039, sb1013, sb1371 # 1198
+xors 4, 1, sb1041, sb1368, sb1012 # 1199
+xors 4, 1, sb1988, sb1041, sb1011 # 1200
+xors 4, 1, sb1043, sb1011, sb1368 # 1201
+xors 4, 1, sb1045, sb1364, sb1010 # 1202
+xors 4, 1, sb1986, sb1045, sb1009 # 1203
+xors 4, 1, sb1047, sb1009, sb1364 # 1204
+xors 4, 1, sb1049, sb1360, sb1008 # 1205
+xors 4, 1, sb1984, sb1049, sb1007 # 1206
+xors 4, 1, sb1051, sb1007, sb1360 # 1207
+xors 4, 1, sb1053, sb1356, sb1005 # 1208
+xors 4, 1, sb1982, sb1053, sb1001 # 1209
+xors 4, 1, sb1055, sb1001, sb1356 # 1210
+xors 4, 1, sb1057, sb1352, sb999 # 1211
+xors 4, 1, sb1980, sb1057, sb997 # 1212
+xors 4, 1, sb1059, sb997, sb1352 # 1213
+xors 4, 1, sb1061, sb1348, sb995 # 1214
+xors 4, 1, sb1978, sb1061, sb993 # 1215
+xors 4, 1, sb1063, sb993, sb1348 # 1216
+xors 4, 1, sb1065, sb1344, sb991 # 1217
+xors 4, 1, sb1976, sb1065, sb989 # 1218
+xors 4, 1, sb1075, sb989, sb1344 # 1219
+xors 4, 1, sb1077, sb1342, sb987 # 1220
+xors 4, 1, sb1974, sb1077, sb985 # 1221
+xors 4, 1, sb1079, sb985, sb1342 # 1222
+xors 4, 1, sb1081, sb1340, sb983 # 1223
+xors 4, 1, sb1972, sb1081, sb977 # 1224
+xors 4, 1, sb1083, sb977, sb1340 # 1225
+xors 4, 1, sb1085, sb1338, sb981 # 1226
+xors 4, 1, sb1970, sb1085, sb980 # 1227
+xors 4, 1, sb1087, sb980, sb1338 # 1228
+xors 4, 1, sb1089, sb1336, sb979 # 1229
+xors 4, 1, sb1968, sb1089, sb978 # 1230
+xors 4, 1, sb1091, sb978, sb1336 # 1231
+dabit s63, sb179 # 1232
+mulsi s61, s63, 2 # 1233
+dabit s62, sb1334 # 1234
+mulsi s55, s62, 2 # 1235
+ldi c3, 2 # 1236
+mulci c2, c3, 2147483647 # 1237
+addci c16, c2, 2 # 1238
+randoms s24, 31 # 1239
+split 95, 3, s24, sb976, sb977, sb1332, sb974, sb975, sb1328, sb972, sb973, sb1324, sb970, sb971, sb1320, sb968, sb969, sb1316, sb966, sb967, sb1312, sb964, sb965, sb1308, sb962, sb963, sb1304, sb960, sb961, sb1302, sb958, sb959, sb1300, sb956, sb957, sb1298, sb953, sb954, sb1296, sb951, sb952, sb1293, sb949, sb950, sb1289, sb947, sb948, sb1285, sb945, sb946, sb1281, sb943, sb944, sb1277, sb941, sb942, sb1273, sb938, sb940, sb1269, sb936, sb937, sb1265, sb934, sb935, sb1263, sb932, sb933, sb1261, sb929, sb930, sb1259, sb927, sb928, sb1257, sb925, sb926, sb1254, sb922, sb924, sb1250, sb920, sb921, sb1246, sb918, sb919, sb1242, sb916, sb917, sb1238, sb914, sb915, sb1234, sb912, sb913, sb1230 # 1240
+xors 4, 1, sb1093, sb1332, sb977 # 1241
+xors 4, 1, sb1095, sb976, sb1332 # 1242
+xors 4, 1, sb1097, sb1328, sb975 # 1243
+xors 4, 1, sb2103, sb1097, sb974 # 1244
+xors 4, 1, sb1099, sb974, sb1328 # 1245
+xors 4, 1, sb1101, sb1324, sb973 # 1246
+xors 4, 1, sb2101, sb1101, sb972 # 1247
+xors 4, 1, sb1103, sb972, sb1324 # 1248
+xors 4, 1, sb1114, sb1320, sb971 # 1249
+xors 4, 1, sb2099, sb1114, sb970 # 1250
+xors 4, 1, sb1116, sb970, sb1320 # 1251
+xors 4, 1, sb1118, sb1316, sb969 # 1252
+xors 4, 1, sb2097, sb1118, sb968 # 1253
+xors 4, 1, sb1120, sb968, sb1316 # 1254
+xors 4, 1, sb1122, sb1312, sb967 # 1255
+xors 4, 1, sb2095, sb1122, sb966 # 1256
+xors 4, 1, sb1123, sb966, sb1312 # 1257
+xors 4, 1, sb1124, sb1308, sb965 # 1258
+xors 4, 1, sb2093, sb1124, sb964 # 1259
+xors 4, 1, sb1126, sb964, sb1308 # 1260
+xors 4, 1, sb1133, sb1304, sb963 # 1261
+xors 4, 1, sb2091, sb1133, sb962 # 1262
+xors 4, 1, sb1135, sb962, sb1304 # 1263
+xors 4, 1, sb1137, sb1302, sb961 # 1264
+xors 4, 1, sb2089, sb1137, sb960 # 1265
+xors 4, 1, sb1139, sb960, sb1302 # 1266
+xors 4, 1, sb1141, sb1300, sb959 # 1267
+xors 4, 1, sb2087, sb1141, sb958 # 1268
+xors 4, 1, sb1143, sb958, sb1300 # 1269
+xors 4, 1, sb1145, sb1298, sb957 # 1270
+xors 4, 1, sb2085, sb1145, sb956 # 1271
+xors 4, 1, sb1147, sb956, sb1298 # 1272
+xors 4, 1, sb1149, sb1296, sb954 # 1273
+xors 4, 1, sb2083, sb1149, sb953 # 1274
+xors 4, 1, sb1151, sb953, sb1296 # 1275
+xors 4, 1, sb1153, sb1293, sb952 # 1276
+xors 4, 1, sb2081, sb1153, sb951 # 1277
+xors 4, 1, sb1155, sb951, sb1293 # 1278
+xors 4, 1, sb1157, sb1289, sb950 # 1279
+xors 4, 1, sb2079, sb1157, sb949 # 1280
+xors 4, 1, sb1159, sb949, sb1289 # 1281
+xors 4, 1, sb1161, sb1285, sb948 # 1282
+xors 4, 1, sb2077, sb1161, sb947 # 1283
+xors 4, 1, sb1163, sb947, sb1285 # 1284
+xors 4, 1, sb1165, sb1281, sb946 # 1285
+xors 4, 1, sb2075, sb1165, sb945 # 1286
+xors 4, 1, sb1167, sb945, sb1281 # 1287
+xors 4, 1, sb1169, sb1277, sb944 # 1288
+xors 4, 1, sb2073, sb1169, sb943 # 1289
+xors 4, 1, sb1171, sb943, sb1277 # 1290
+xors 4, 1, sb1173, sb1273, sb942 # 1291
+xors 4, 1, sb2071, sb1173, sb941 # 1292
+xors 4, 1, sb1175, sb941, sb1273 # 1293
+xors 4, 1, sb1190, sb1269, sb940 # 1294
+xors 4, 1, sb2069, sb1190, sb938 # 1295
+xors 4, 1, sb1192, sb938, sb1269 # 1296
+xors 4, 1, sb1194, sb1265, sb937 # 1297
+xors 4, 1, sb2067, sb1194, sb936 # 1298
+xors 4, 1, sb1196, sb936, sb1265 # 1299
+xors 4, 1, sb1198, sb1263, sb935 # 1300
+xors 4, 1, sb2065, sb1198, sb934 # 1301
+xors 4, 1, sb1200, sb934, sb1263 # 1302
+xors 4, 1, sb1202, sb1261, sb933 # 1303
+xors 4, 1, sb2063, sb1202, sb932 # 1304
+xors 4, 1, sb1204, sb932, sb1261 # 1305
+xors 4, 1, sb1206, sb1259, sb930 # 1306
+xors 4, 1, sb2061, sb1206, sb929 # 1307
+xors 4, 1, sb1208, sb929, sb1259 # 1308
+xors 4, 1, sb1210, sb1257, sb928 # 1309
+xors 4, 1, sb2059, sb1210, sb927 # 1310
+xors 4, 1, sb1212, sb927, sb1257 # 1311
+xors 4, 1, sb1214, sb1254, sb926 # 1312
+xors 4, 1, sb2057, sb1214, sb925 # 1313
+xors 4, 1, sb1216, sb925, sb1254 # 1314
+xors 4, 1, sb1218, sb1250, sb924 # 1315
+xors 4, 1, sb2055, sb1218, sb922 # 1316
+xors 4, 1, sb1228, sb922, sb1250 # 1317
+xors 4, 1, sb1229, sb1246, sb921 # 1318
+xors 4, 1, sb2053, sb1229, sb920 # 1319
+xors 4, 1, sb1231, sb920, sb1246 # 1320
+xors 4, 1, sb1233, sb1242, sb919 # 1321
+xors 4, 1, sb2051, sb1233, sb918 # 1322
+xors 4, 1, sb1235, sb918, sb1242 # 1323
+xors 4, 1, sb1237, sb1238, sb917 # 1324
+xors 4, 1, sb2049, sb1237, sb916 # 1325
+xors 4, 1, sb1239, sb916, sb1238 # 1326
+xors 4, 1, sb1241, sb1234, sb915 # 1327
+xors 4, 1, sb2047, sb1241, sb914 # 1328
+xors 4, 1, sb1243, sb914, sb1234 # 1329
+xors 4, 1, sb1245, sb1230, sb913 # 1330
+xors 4, 1, sb2045, sb1245, sb912 # 1331
+xors 4, 1, sb1247, sb912, sb1230 # 1332
+dabit s59, sb172 # 1333
+mulsi s57, s59, 2 # 1334
+dabit s58, sb1227 # 1335
+mulsi s40, s58, 2 # 1336
+ldi c1, 1 # 1337
+mulci c37, c1, 2147483647 # 1338
+addci c15, c37, 1 # 1339
+bit s41 # 1340
+ldi c17, 2 # 1341
+mulci c14, c17, 2147483647 # 1342
+addci c13, c14, 4 # 1343
+mulci c12, c13, 2147483647 # 1344
+addci c11, c12, 2 # 1345
+mulm s54, s41, c11 # 1346
+ldi c10, 2 # 1347
+mulci c7, c10, 2147483647 # 1348
+addci c12, c7, 2 # 1349
+mulsi s39, s41, 2 # 1350
+ldi c5, 1 # 1351
+mulci c37, c5, 2147483647 # 1352
+addci c11, c37, 1 # 1353
+ldi c4, 1073741824 # 1354
+mulci c1, c4, 2147483647 # 1355
+addci c17, c1, 1073741824 # 1356
+randoms s43, 32 # 1357
+split 98, 3, s43, sb910, sb911, sb1225, sb901, sb909, sb1223, sb898, sb899, sb1221, sb896, sb897, sb1219, sb893, sb895, sb1215, sb891, sb892, sb1211, sb882, sb889, sb1207, sb880, sb881, sb1203, sb878, sb879, sb1199, sb876, sb877, sb1195, sb872, sb874, sb1191, sb870, sb871, sb1188, sb863, sb869, sb1186, sb859, sb861, sb1184, sb857, sb858, sb1182, sb854, sb855, sb1180, sb852, sb853, sb1178, sb846, sb847, sb1176, sb842, sb844, sb1172, sb838, sb840, sb1168, sb835, sb836, sb1164, sb833, sb834, sb1160, sb827, sb828, sb1156, sb825, sb826, sb1152, sb822, sb823, sb1148, sb819, sb821, sb1144, sb814, sb817, sb1140, sb808, sb809, sb1136, sb806, sb807, sb1132, sb803, sb804, sb1130, sb801, sb802, sb1128, sb798, sb800, sb1125 # 1358
+xors 4, 1, sb1249, sb1225, sb911 # 1359
+xors 4, 1, sb1251, sb910, sb1225 # 1360
+xors 4, 1, sb1253, sb1223, sb909 # 1361
+xors 4, 1, sb2179, sb1253, sb901 # 1362
+xors 4, 1, sb1255, sb901, sb1223 # 1363
+xors 4, 1, sb1266, sb1221, sb899 # 1364
+xors 4, 1, sb2177, sb1266, sb898 # 1365
+xors 4, 1, sb1268, sb898, sb1221 # 1366
+xors 4, 1, sb1270, sb1219, sb897 # 1367
+xors 4, 1, sb2175, sb1270, sb896 # 1368
+xors 4, 1, sb1272, sb896, sb1219 # 1369
+xors 4, 1, sb1274, sb1215, sb895 # 1370
+xors 4, 1, sb2173, sb1274, sb893 # 1371
+xors 4, 1, sb1276, sb893, sb1215 # 1372
+xors 4, 1, sb1278, sb1211, sb892 # 1373
+xors 4, 1, sb2171, sb1278, sb891 # 1374
+xors 4, 1, sb1280, sb891, sb1211 # 1375
+xors 4, 1, sb1282, sb1207, sb889 # 1376
+xors 4, 1, sb2169, sb1282, sb882 # 1377
+xors 4, 1, sb1284, sb882, sb1207 # 1378
+xors 4, 1, sb1286, sb1203, sb881 # 1379
+xors 4, 1, sb2167, sb1286, sb880 # 1380
+xors 4, 1, sb1288, sb880, sb1203 # 1381
+xors 4, 1, sb1290, sb1199, sb879 # 1382
+xors 4, 1, sb2165, sb1290, sb878 # 1383
+xors 4, 1, sb1292, sb878, sb1199 # 1384
+xors 4, 1, sb1294, sb1195, sb877 # 1385
+xors 4, 1, sb2163, sb1294, sb876 # 1386
+xors 4, 1, sb1305, sb876, sb1195 # 1387
+xors 4, 1, sb1307, sb1191, sb874 # 1388
+xors 4, 1, sb2161, sb1307, sb872 # 1389
+xors 4, 1, sb1309, sb872, sb1191 # 1390
+xors 4, 1, sb1311, sb1188, sb871 # 1391
+xors 4, 1, sb2159, sb1311, sb870 # 1392
+xors 4, 1, sb1313, sb870, sb1188 # 1393
+xors 4, 1, sb1315, sb1186, sb869 # 1394
+xors 4, 1, sb2157, sb1315, sb863 # 1395
+xors 4, 1, sb1317, sb863, sb1186 # 1396
+xors 4, 1, sb1319, sb1184, sb861 # 1397
+xors 4, 1, sb2155, sb1319, sb859 # 1398
+xors 4, 1, sb1321, sb859, sb1184 # 1399
+xors 4, 1, sb1323, sb1182, sb858 # 1400
+xors 4, 1, sb2153, sb1323, sb857 # 1401
+xors 4, 1, sb1325, sb857, sb1182 # 1402
+xors 4, 1, sb1327, sb1180, sb855 # 1403
+xors 4, 1, sb2151, sb1327, sb854 # 1404
+xors 4, 1, sb1329, sb854, sb1180 # 1405
+xors 4, 1, sb1331, sb1178, sb853 # 1406
+xors 4, 1, sb2149, sb1331, sb852 # 1407
+xors 4, 1, sb1335, sb852, sb1178 # 1408
+xors 4, 1, sb1345, sb1176, sb847 # 1409
+xors 4, 1, sb2147, sb1345, sb846 # 1410
+xors 4, 1, sb1347, sb846, sb1176 # 1411
+xors 4, 1, sb1349, sb1172, sb844 # 1412
+xors 4, 1, sb2145, sb1349, sb842 # 1413
+xors 4, 1, sb1351, sb842, sb1172 # 1414
+xors 4, 1, sb1353, sb1168, sb840 # 1415
+xors 4, 1, sb2143, sb1353, sb838 # 1416
+xors 4, 1, sb1355, sb838, sb1168 # 1417
+xors 4, 1, sb1357, sb1164, sb836 # 1418
+xors 4, 1, sb2141, sb1357, sb835 # 1419
+xors 4, 1, sb1359, sb835, sb1164 # 1420
+xors 4, 1, sb1361, sb1160, sb834 # 1421
+xors 4, 1, sb2139, sb1361, sb833 # 1422
+xors 4, 1, sb1363, sb833, sb1160 # 1423
+xors 4, 1, sb1365, sb1156, sb828 # 1424
+xors 4, 1, sb2137, sb1365, sb827 # 1425
+xors 4, 1, sb1367, sb827, sb1156 # 1426
+xors 4, 1, sb1369, sb1152, sb826 # 1427
+xors 4, 1, sb2135, sb1369, sb825 # 1428
+xors 4, 1, sb1414, sb825, sb1152 # 1429
+xors 4, 1, sb1476, sb1148, sb823 # 1430
+xors 4, 1, sb2133, sb1476, sb822 # 1431
+xors 4, 1, sb1542, sb822, sb1148 # 1432
+xors 4, 1, sb1606, sb1144, sb821 # 1433
+xors 4, 1, sb2131, sb1606, sb819 # 1434
+xors 4, 1, sb1802, sb819, sb1144 # 1435
+xors 4, 1, sb1856, sb1140, sb817 # 1436
+xors 4, 1, sb2129, sb1856, sb814 # 1437
+xors 4, 1, sb1965, sb814, sb1140 # 1438
+xors 4, 1, sb2070, sb1136, sb809 # 1439
+xors 4, 1, sb2127, sb2070, sb808 # 1440
+xors 4, 1, sb2074, sb808, sb1136 # 1441
+xors 4, 1, sb2111, sb1132, sb807 # 1442
+xors 4, 1, sb2125, sb2111, sb806 # 1443
+xors 4, 1, sb2148, sb806, sb1132 # 1444
+xors 4, 1, sb2183, sb1130, sb804 # 1445
+xors 4, 1, sb2123, sb2183, sb803 # 1446
+xors 4, 1, sb2203, sb803, sb1130 # 1447
+xors 4, 1, sb2229, sb1128, sb802 # 1448
+xors 4, 1, sb2121, sb2229, sb801 # 1449
+xors 4, 1, sb2718, sb801, sb1128 # 1450
+xors 4, 1, sb2719, sb1125, sb800 # 1451
+xors 4, 1, sb2119, sb2719, sb798 # 1452
+xors 4, 1, sb2720, sb798, sb1125 # 1453
+dabit s53, sb157 # 1454
+mulsi s51, s53, 2 # 1455
+dabit s52, sb1121 # 1456
+mulsi s45, s52, 2 # 1457
+ldi c3, 2 # 1458
+mulci c1, c3, 2147483647 # 1459
+addci c14, c1, 2 # 1460
+randoms s46, 30 # 1461
+split 92, 3, s46, sb797, sb798, sb1117, sb789, sb796, sb1113, sb787, sb788, sb1111, sb785, sb786, sb1109, sb782, sb783, sb1107, sb780, sb781, sb1105, sb773, sb779, sb1102, sb771, sb772, sb1098, sb769, sb770, sb1094, sb766, sb768, sb1090, sb764, sb765, sb1086, sb762, sb763, sb1082, sb759, sb760, sb1078, sb753, sb754, sb1074, sb751, sb752, sb1072, sb748, sb749, sb1070, sb746, sb747, sb1068, sb743, sb745, sb1066, sb740, sb742, sb1062, sb734, sb735, sb1058, sb731, sb732, sb1054, sb728, sb730, sb1050, sb726, sb727, sb1046, sb722, sb724, sb1042, sb714, sb715, sb1016, sb712, sb713, sb1014, sb709, sb711, sb1012, sb706, sb707, sb1010, sb699, sb705, sb1008, sb696, sb698, sb1005 # 1462
+xors 4, 1, sb2721, sb1117, sb798 # 1463
+xors 4, 1, sb2722, sb797, sb1117 # 1464
+xors 4, 1, sb2723, sb1113, sb796 # 1465
+xors 4, 1, sb2252, sb2723, sb789 # 1466
+xors 4, 1, sb2724, sb789, sb1113 # 1467
+xors 4, 1, sb2725, sb1111, sb788 # 1468
+xors 4, 1, sb2250, sb2725, sb787 # 1469
+xors 4, 1, sb2726, sb787, sb1111 # 1470
+xors 4, 1, sb2727, sb1109, sb786 # 1471
+xors 4, 1, sb2248, sb2727, sb785 # 1472
+xors 4, 1, sb2728, sb785, sb1109 # 1473
+xors 4, 1, sb2729, sb1107, sb783 # 1474
+xors 4, 1, sb2246, sb2729, sb782 # 1475
+xors 4, 1, sb2730, sb782, sb1107 # 1476
+xors 4, 1, sb2731, sb1105, sb781 # 1477
+xors 4, 1, sb2244, sb2731, sb780 # 1478
+xors 4, 1, sb2732, sb780, sb1105 # 1479
+xors 4, 1, sb2733, sb1102, sb779 # 1480
+xors 4, 1, sb2242, sb2733, sb773 # 1481
+xors 4, 1, sb2734, sb773, sb1102 # 1482
+xors 4, 1, sb2735, sb1098, sb772 # 1483
+xors 4, 1, sb2240, sb2735, sb771 # 1484
+xors 4, 1, sb2736, sb771, sb1098 # 1485
+xors 4, 1, sb2737, sb1094, sb770 # 1486
+xors 4, 1, sb2238, sb2737, sb769 # 1487
+xors 4, 1, sb2738, sb769, sb1094 # 1488
+xors 4, 1, sb2739, sb1090, sb768 # 1489
+xors 4, 1, sb2236, sb2739, sb766 # 1490
+xors 4, 1, sb2740, sb766, sb1090 # 1491
+xors 4, 1, sb2741, sb1086, sb765 # 1492
+xors 4, 1, sb2234, sb2741, sb764 # 1493
+xors 4, 1, sb2742, sb764, sb1086 # 1494
+xors 4, 1, sb2743, sb1082, sb763 # 1495
+xors 4, 1, sb2232, sb2743, sb762 # 1496
+xors 4, 1, sb2744, sb762, sb1082 # 1497
+xors 4, 1, sb2745, sb1078, sb760 # 1498
+xors 4, 1, sb2230, sb2745, sb759 # 1499
+xors 4, 1, sb2746, sb759, sb1078 # 1500
+xors 4, 1, sb2747, sb1074, sb754 # 1501
+xors 4, 1, sb2228, sb2747, sb753 # 1502
+xors 4, 1, sb2748, sb753, sb1074 # 1503
+xors 4, 1, sb2749, sb1072, sb752 # 1504
+xors 4, 1, sb2226, sb2749, sb751 # 1505
+xors 4, 1, sb2750, sb751, sb1072 # 1506
+xors 4, 1, sb2751, sb1070, sb749 # 1507
+xors 4, 1, sb2224, sb2751, sb748 # 1508
+xors 4, 1, sb2752, sb748, sb1070 # 1509
+xors 4, 1, sb2753, sb1068, sb747 # 1510
+xors 4, 1, sb2222, sb2753, sb746 # 1511
+xors 4, 1, sb2754, sb746, sb1068 # 1512
+xors 4, 1, sb2755, sb1066, sb745 # 1513
+xors 4, 1, sb2220, sb2755, sb743 # 1514
+xors 4, 1, sb2756, sb743, sb1066 # 1515
+xors 4, 1, sb2757, sb1062, sb742 # 1516
+xors 4, 1, sb2218, sb2757, sb740 # 1517
+xors 4, 1, sb2758, sb740, sb1062 # 1518
+xors 4, 1, sb2759, sb1058, sb735 # 1519
+xors 4, 1, sb2216, sb2759, sb734 # 1520
+xors 4, 1, sb2760, sb734, sb1058 # 1521
+xors 4, 1, sb2761, sb1054, sb732 # 1522
+xors 4, 1, sb2214, sb2761, sb731 # 1523
+xors 4, 1, sb2762, sb731, sb1054 # 1524
+xors 4, 1, sb2763, sb1050, sb730 # 1525
+xors 4, 1, sb2212, sb2763, sb728 # 1526
+xors 4, 1, sb2764, sb728, sb1050 # 1527
+xors 4, 1, sb2765, sb1046, sb727 # 1528
+xors 4, 1, sb2210, sb2765, sb726 # 1529
+xors 4, 1, sb2766, sb726, sb1046 # 1530
+xors 4, 1, sb2767, sb1042, sb724 # 1531
+xors 4, 1, sb2208, sb2767, sb722 # 1532
+xors 4, 1, sb2768, sb722, sb1042 # 1533
+xors 4, 1, sb2769, sb1016, sb715 # 1534
+xors 4, 1, sb2206, sb2769, sb714 # 1535
+xors 4, 1, sb2770, sb714, sb1016 # 1536
+xors 4, 1, sb2771, sb1014, sb713 # 1537
+xors 4, 1, sb2204, sb2771, sb712 # 1538
+xors 4, 1, sb2772, sb712, sb1014 # 1539
+xors 4, 1, sb2773, sb1012, sb711 # 1540
+xors 4, 1, sb2202, sb2773, sb709 # 1541
+xors 4, 1, sb2774, sb709, sb1012 # 1542
+xors 4, 1, sb2775, sb1010, sb707 # 1543
+xors 4, 1, sb2200, sb2775, sb706 # 1544
+xors 4, 1, sb2776, sb706, sb1010 # 1545
+xors 4, 1, sb2777, sb1008, sb705 # 1546
+xors 4, 1, sb2198, sb2777, sb699 # 1547
+xors 4, 1, sb2778, sb699, sb1008 # 1548
+xors 4, 1, sb2779, sb1005, sb698 # 1549
+xors 4, 1, sb2196, sb2779, sb696 # 1550
+xors 4, 1, sb2780, sb696, sb1005 # 1551
+dabit s49, sb151 # 1552
+mulsi s47, s49, 2 # 1553
+dabit s48, sb1001 # 1554
+mulsi s16, s48, 2 # 1555
+bit s38 # 1556
+ldi c2, 1 # 1557
+mulci c13, c2, 2147483647 # 1558
+addci c6, c13, 2 # 1559
+mulci c10, c6, 2147483647 # 1560
+addci c8, c10, 1 # 1561
+mulm s44, s38, c8 # 1562
+ldi c7, 2 # 1563
+mulci c9, c7, 2147483647 # 1564
+addci c13, c9, 2 # 1565
+mulsi s34, s38, 2 # 1566
+ldi c6, 1 # 1567
+mulci c5, c6, 2147483647 # 1568
+addci c37, c5, 2 # 1569
+mulci c4, c37, 2147483647 # 1570
+addci c10, c4, 1 # 1571
+randoms s1, 32 # 1572
+split 98, 3, s1, sb695, sb696, sb997, sb692, sb694, sb993, sb690, sb691, sb989, sb687, sb688, sb985, sb680, sb686, sb981, sb677, sb679, sb979, sb675, sb676, sb977, sb672, sb673, sb975, sb669, sb671, sb973, sb661, sb668, sb971, sb658, sb660, sb969, sb656, sb657, sb967, sb653, sb654, sb965, sb650, sb652, sb963, sb648, sb649, sb961, sb637, sb639, sb959, sb633, sb635, sb957, sb629, sb631, sb954, sb625, sb627, sb952, sb621, sb623, sb950, sb612, sb614, sb948, sb603, sb610, sb946, sb599, sb601, sb944, sb595, sb597, sb942, sb591, sb593, sb940, sb582, sb584, sb937, sb578, sb580, sb935, sb574, sb576, sb933, sb544, sb545, sb930, sb540, sb542, sb928, sb536, sb538, sb926, sb532, sb534, sb924 # 1573
+xors 4, 1, sb2781, sb997, sb696 # 1574
+xors 4, 1, sb2782, sb695, sb997 # 1575
+xors 4, 1, sb2783, sb993, sb694 # 1576
+xors 4, 1, sb2328, sb2783, sb692 # 1577
+xors 4, 1, sb2784, sb692, sb993 # 1578
+xors 4, 1, sb2785, sb989, sb691 # 1579
+xors 4, 1, sb2326, sb2785, sb690 # 1580
+xors 4, 1, sb2786, sb690, sb989 # 1581
+xors 4, 1, sb2787, sb985, sb688 # 1582
+xors 4, 1, sb2324, sb2787, sb687 # 1583
+xors 4, 1, sb2788, sb687, sb985 # 1584
+xors 4, 1, sb2789, sb981, sb686 # 1585
+xors 4, 1, sb2322, sb2789, sb680 # 1586
+xors 4, 1, sb2790, sb680, sb981 # 1587
+xors 4, 1, sb2791, sb979, sb679 # 1588
+xors 4, 1, sb2320, sb2791, sb677 # 1589
+xors 4, 1, sb2792, sb677, sb979 # 1590
+xors 4, 1, sb2793, sb977, sb676 # 1591
+xors 4, 1, sb2318, sb2793, sb675 # 1592
+xors 4, 1, sb2794, sb675, sb977 # 1593
+xors 4, 1, sb2795, sb975, sb673 # 1594
+xors 4, 1, sb2316, sb2795, sb672 # 1595
+xors 4, 1, sb2796, sb672, sb975 # 1596
+xors 4, 1, sb2797, sb973, sb671 # 1597
+xors 4, 1, sb2314, sb2797, sb669 # 1598
+xors 4, 1, sb2798, sb669, sb973 # 1599
+xors 4, 1, sb2799, sb971, sb668 # 1600
+xors 4, 1, sb2312, sb2799, sb661 # 1601
+xors 4, 1, sb2800, sb661, sb971 # 1602
+xors 4, 1, sb2801, sb969, sb660 # 1603
+xors 4, 1, sb2310, sb2801, sb658 # 1604
+xors 4, 1, sb2802, sb658, sb969 # 1605
+xors 4, 1, sb2803, sb967, sb657 # 1606
+xors 4, 1, sb2308, sb2803, sb656 # 1607
+xors 4, 1, sb2804, sb656, sb967 # 1608
+xors 4, 1, sb2805, sb965, sb654 # 1609
+xors 4, 1, sb2306, sb2805, sb653 # 1610
+xors 4, 1, sb2806, sb653, sb965 # 1611
+xors 4, 1, sb2807, sb963, sb652 # 1612
+xors 4, 1, sb2304, sb2807, sb650 # 1613
+xors 4, 1, sb2808, sb650, sb963 # 1614
+xors 4, 1, sb2809, sb961, sb649 # 1615
+xors 4, 1, sb2302, sb2809, sb648 # 1616
+xors 4, 1, sb2810, sb648, sb961 # 1617
+xors 4, 1, sb2811, sb959, sb639 # 1618
+xors 4, 1, sb2300, sb2811, sb637 # 1619
+xors 4, 1, sb2812, sb637, sb959 # 1620
+xors 4, 1, sb2813, sb957, sb635 # 1621
+xors 4, 1, sb2298, sb2813, sb633 # 1622
+xors 4, 1, sb2814, sb633, sb957 # 1623
+xors 4, 1, sb2815, sb954, sb631 # 1624
+xors 4, 1, sb2296, sb2815, sb629 # 1625
+xors 4, 1, sb2816, sb629, sb954 # 1626
+xors 4, 1, sb2817, sb952, sb627 # 1627
+xors 4, 1, sb2294, sb2817, sb625 # 1628
+xors 4, 1, sb2818, sb625, sb952 # 1629
+xors 4, 1, sb2819, sb950, sb623 # 1630
+xors 4, 1, sb2292, sb2819, sb621 # 1631
+xors 4, 1, sb2820, sb621, sb950 # 1632
+xors 4, 1, sb2821, sb948, sb614 # 1633
+xors 4, 1, sb2290, sb2821, sb612 # 1634
+xors 4, 1, sb2822, sb612, sb948 # 1635
+xors 4, 1, sb2823, sb946, sb610 # 1636
+xors 4, 1, sb2288, sb2823, sb603 # 1637
+xors 4, 1, sb2824, sb603, sb946 # 1638
+xors 4, 1, sb2825, sb944, sb601 # 1639
+xors 4, 1, sb2286, sb2825, sb599 # 1640
+xors 4, 1, sb2826, sb599, sb944 # 1641
+xors 4, 1, sb2827, sb942, sb597 # 1642
+xors 4, 1, sb2284, sb2827, sb595 # 1643
+xors 4, 1, sb2828, sb595, sb942 # 1644
+xors 4, 1, sb2829, sb940, sb593 # 1645
+xors 4, 1, sb2282, sb2829, sb591 # 1646
+xors 4, 1, sb2830, sb591, sb940 # 1647
+xors 4, 1, sb2831, sb937, sb584 # 1648
+xors 4, 1, sb2280, sb2831, sb582 # 1649
+xors 4, 1, sb2832, sb582, sb937 # 1650
+xors 4, 1, sb2833, sb935, sb580 # 1651
+xors 4, 1, sb2278, sb2833, sb578 # 1652
+xors 4, 1, sb2834, sb578, sb935 # 1653
+xors 4, 1, sb2835, sb933, sb576 # 1654
+xors 4, 1, sb2276, sb2835, sb574 # 1655
+xors 4, 1, sb2836, sb574, sb933 # 1656
+xors 4, 1, sb2837, sb930, sb545 # 1657
+xors 4, 1, sb2274, sb2837, sb544 # 1658
+xors 4, 1, sb2838, sb544, sb930 # 1659
+xors 4, 1, sb2839, sb928, sb542 # 1660
+xors 4, 1, sb2272, sb2839, sb540 # 1661
+xors 4, 1, sb2840, sb540, sb928 # 1662
+xors 4, 1, sb2841, sb926, sb538 # 1663
+xors 4, 1, sb2270, sb2841, sb536 # 1664
+xors 4, 1, sb2842, sb536, sb926 # 1665
+xors 4, 1, sb2843, sb924, sb534 # 1666
+xors 4, 1, sb2268, sb2843, sb532 # 1667
+xors 4, 1, sb2844, sb532, sb924 # 1668
+dabit s37, sb145 # 1669
+mulsi s35, s37, 2 # 1670
+dabit s36, sb922 # 1671
+mulsi s29, s36, 2 # 1672
+ldi c1, 2 # 1673
+mulci c3, c1, 2147483647 # 1674
+addci c8, c3, 2 # 1675
+randoms s30, 31 # 1676
+split 95, 3, s30, sb496, sb507, sb920, sb490, sb493, sb918, sb484, sb488, sb916, sb480, sb482, sb914, sb471, sb477, sb912, sb465, sb468, sb910, sb462, sb464, sb901, sb455, sb459, sb898, sb450, sb453, sb896, sb444, sb446, sb893, sb439, sb441, sb891, sb432, sb436, sb882, sb429, sb430, sb880, sb423, sb427, sb878, sb414, sb418, sb876, sb409, sb412, sb872, sb403, sb405, sb870, sb398, sb400, sb863, sb394, sb396, sb859, sb391, sb393, sb857, sb387, sb389, sb854, sb380, sb382, sb852, sb374, sb378, sb846, sb364, sb371, sb842, sb355, sb362, sb838, sb351, sb353, sb835, sb347, sb349, sb833, sb337, sb345, sb827, sb331, sb335, sb825, sb329, sb330, sb822, sb310, sb327, sb819 # 1677
+xors 4, 1, sb2845, sb920, sb507 # 1678
+xors 4, 1, sb2846, sb496, sb920 # 1679
+xors 4, 1, sb2847, sb918, sb493 # 1680
+xors 4, 1, sb2403, sb2847, sb490 # 1681
+xors 4, 1, sb2848, sb490, sb918 # 1682
+xors 4, 1, sb2849, sb916, sb488 # 1683
+xors 4, 1, sb2401, sb2849, sb484 # 1684
+xors 4, 1, sb2850, sb484, sb916 # 1685
+xors 4, 1, sb2851, sb914, sb482 # 1686
+xors 4, 1, sb2399, sb2851, sb480 # 1687
+xors 4, 1, sb2852, sb480, sb914 # 1688
+xors 4, 1, sb2853, sb912, sb477 # 1689
+xors 4, 1, sb2397, sb2853, sb471 # 1690
+xors 4, 1, sb2854, sb471, sb912 # 1691
+xors 4, 1, sb2855, sb910, sb468 # 1692
+xors 4, 1, sb2395, sb2855, sb465 # 1693
+xors 4, 1, sb2856, sb465, sb910 # 1694
+xors 4, 1, sb2857, sb901, sb464 # 1695
+xors 4, 1, sb2393, sb2857, sb462 # 1696
+xors 4, 1, sb2858, sb462, sb901 # 1697
+xors 4, 1, sb2859, sb898, sb459 # 1698
+xors 4, 1, sb2391, sb2859, sb455 # 1699
+xors 4, 1, sb2860, sb455, sb898 # 1700
+xors 4, 1, sb2861, sb896, sb453 # 1701
+xors 4, 1, sb2389, sb2861, sb450 # 1702
+xors 4, 1, sb2862, sb450, sb896 # 1703
+xors 4, 1, sb2863, sb893, sb446 # 1704
+xors 4, 1, sb2387, sb2863, sb444 # 1705
+xors 4, 1, sb2864, sb444, sb893 # 1706
+xors 4, 1, sb2865, sb891, sb441 # 1707
+xors 4, 1, sb2385, sb2865, sb439 # 1708
+xors 4, 1, sb2866, sb439, sb891 # 1709
+xors 4, 1, sb2867, sb882, sb436 # 1710
+xors 4, 1, sb2383, sb2867, sb432 # 1711
+xors 4, 1, sb2868, sb432, sb882 # 1712
+xors 4, 1, sb2869, sb880, sb430 # 1713
+xors 4, 1, sb2381, sb2869, sb429 # 1714
+xors 4, 1, sb2870, sb429, sb880 # 1715
+xors 4, 1, sb2871, sb878, sb427 # 1716
+xors 4, 1, sb2379, sb2871, sb423 # 1717
+xors 4, 1, sb2872, sb423, sb878 # 1718
+xors 4, 1, sb2873, sb876, sb418 # 1719
+xors 4, 1, sb2377, sb2873, sb414 # 1720
+xors 4, 1, sb2874, sb414, sb876 # 1721
+xors 4, 1, sb2875, sb872, sb412 # 1722
+xors 4, 1, sb2375, sb2875, sb409 # 1723
+xors 4, 1, sb2876, sb409, sb872 # 1724
+xors 4, 1, sb2877, sb870, sb405 # 1725
+xors 4, 1, sb2373, sb2877, sb403 # 1726
+xors 4, 1, sb2878, sb403, sb870 # 1727
+xors 4, 1, sb2879, sb863, sb400 # 1728
+xors 4, 1, sb2371, sb2879, sb398 # 1729
+xors 4, 1, sb2880, sb398, sb863 # 1730
+xors 4, 1, sb2881, sb859, sb396 # 1731
+xors 4, 1, sb2369, sb2881, sb394 # 1732
+xors 4, 1, sb2882, sb394, sb859 # 1733
+xors 4, 1, sb2883, sb857, sb393 # 1734
+xors 4, 1, sb2367, sb2883, sb391 # 1735
+xors 4, 1, sb2884, sb391, sb857 # 1736
+xors 4, 1, sb2885, sb854, sb389 # 1737
+xors 4, 1, sb2365, sb2885, sb387 # 1738
+xors 4, 1, sb2886, sb387, sb854 # 1739
+xors 4, 1, sb2887, sb852, sb382 # 1740
+xors 4, 1, sb2363, sb2887, sb380 # 1741
+xors 4, 1, sb2888, sb380, sb852 # 1742
+xors 4, 1, sb2889, sb846, sb378 # 1743
+xors 4, 1, sb2361, sb2889, sb374 # 1744
+xors 4, 1, sb2890, sb374, sb846 # 1745
+xors 4, 1, sb2891, sb842, sb371 # 1746
+xors 4, 1, sb2359, sb2891, sb364 # 1747
+xors 4, 1, sb2892, sb364, sb842 # 1748
+xors 4, 1, sb2893, sb838, sb362 # 1749
+xors 4, 1, sb2357, sb2893, sb355 # 1750
+xors 4, 1, sb2894, sb355, sb838 # 1751
+xors 4, 1, sb2895, sb835, sb353 # 1752
+xors 4, 1, sb2355, sb2895, sb351 # 1753
+xors 4, 1, sb2896, sb351, sb835 # 1754
+xors 4, 1, sb2897, sb833, sb349 # 1755
+xors 4, 1, sb2353, sb2897, sb347 # 1756
+xors 4, 1, sb2898, sb347, sb833 # 1757
+xors 4, 1, sb2899, sb827, sb345 # 1758
+xors 4, 1, sb2351, sb2899, sb337 # 1759
+xors 4, 1, sb2900, sb337, sb827 # 1760
+xors 4, 1, sb2901, sb825, sb335 # 1761
+xors 4, 1, sb2349, sb2901, sb331 # 1762
+xors 4, 1, sb2902, sb331, sb825 # 1763
+xors 4, 1, sb2903, sb822, sb330 # 1764
+xors 4, 1, sb2347, sb2903, sb329 # 1765
+xors 4, 1, sb2904, sb329, sb822 # 1766
+xors 4, 1, sb2905, sb819, sb327 # 1767
+xors 4, 1, sb2345, sb2905, sb310 # 1768
+xors 4, 1, sb2906, sb310, sb819 # 1769
+dabit s33, sb138 # 1770
+mulsi s31, s33, 2 # 1771
+dabit s32, sb817 # 1772
+mulsi s14, s32, 2 # 1773
+ldi c2, 1 # 1774
+mulci c1, c2, 2147483647 # 1775
+addci c7, c1, 1 # 1776
+bit s15 # 1777
+ldi c9, 2 # 1778
+mulci c6, c9, 2147483647 # 1779
+addci c5, c6, 4 # 1780
+mulci c37, c5, 2147483647 # 1781
+addci c4, c37, 2 # 1782
+mulm s28, s15, c4 # 1783
+ldi c3, 2 # 1784
+mulci c1, c3, 2147483647 # 1785
+addci c4, c1, 2 # 1786
+mulsi s12, s15, 2 # 1787
+ldi c9, 1 # 1788
+mulci c6, c9, 2147483647 # 1789
+addci c3, c6, 1 # 1790
+ldi c37, 1073741824 # 1791
+mulci c5, c37, 2147483647 # 1792
+addci c9, c5, 1073741824 # 1793
+randoms s17, 32 # 1794
+split 98, 3, s17, sb305, sb307, sb809, sb295, sb301, sb807, sb291, sb293, sb804, sb286, sb288, sb802, sb283, sb284, sb800, sb279, sb281, sb797, sb276, sb277, sb789, sb269, sb272, sb787, sb265, sb267, sb785, sb262, sb264, sb782, sb249, sb259, sb780, sb236, sb243, sb773, sb230, sb233, sb771, sb223, sb226, sb769, sb219, sb221, sb766, sb214, sb217, sb764, sb208, sb211, sb762, sb206, sb207, sb759, sb199, sb203, sb753, sb186, sb193, sb751, sb183, sb185, sb748, sb173, sb176, sb746, sb169, sb170, sb743, sb160, sb162, sb740, sb155, sb156, sb734, sb149, sb153, sb731, sb144, sb148, sb728, sb140, sb139, sb726, sb132, sb136, sb722, sb126, sb1654, sb714, sb2671, sb1652, sb712, sb1650, sb118, sb709 # 1795
+xors 4, 1, sb2907, sb809, sb307 # 1796
+xors 4, 1, sb2908, sb305, sb809 # 1797
+xors 4, 1, sb2909, sb807, sb301 # 1798
+xors 4, 1, sb2479, sb2909, sb295 # 1799
+xors 4, 1, sb2910, sb295, sb807 # 1800
+xors 4, 1, sb2911, sb804, sb293 # 1801
+xors 4, 1, sb2477, sb2911, sb291 # 1802
+xors 4, 1, sb2912, sb291, sb804 # 1803
+xors 4, 1, sb2913, sb802, sb288 # 1804
+xors 4, 1, sb2475, sb2913, sb286 # 1805
+xors 4, 1, sb2914, sb286, sb802 # 1806
+xors 4, 1, sb2915, sb800, sb284 # 1807
+xors 4, 1, sb2473, sb2915, sb283 # 1808
+xors 4, 1, sb2916, sb283, sb800 # 1809
+xors 4, 1, sb2917, sb797, sb281 # 1810
+xors 4, 1, sb2471, sb2917, sb279 # 1811
+xors 4, 1, sb2918, sb279, sb797 # 1812
+xors 4, 1, sb2919, sb789, sb277 # 1813
+xors 4, 1, sb2469, sb2919, sb276 # 1814
+xors 4, 1, sb2920, sb276, sb789 # 1815
+xors 4, 1, sb2921, sb787, sb272 # 1816
+xors 4, 1, sb2467, sb2921, sb269 # 1817
+xors 4, 1, sb2922, sb269, sb787 # 1818
+xors 4, 1, sb2923, sb785, sb267 # 1819
+xors 4, 1, sb2465, sb2923, sb265 # 1820
+xors 4, 1, sb2924, sb265, sb785 # 1821
+xors 4, 1, sb2925, sb782, sb264 # 1822
+xors 4, 1, sb2463, sb2925, sb262 # 1823
+xors 4, 1, sb2926, sb262, sb782 # 1824
+xors 4, 1, sb2927, sb780, sb259 # 1825
+xors 4, 1, sb2461, sb2927, sb249 # 1826
+xors 4, 1, sb2928, sb249, sb780 # 1827
+xors 4, 1, sb2929, sb773, sb243 # 1828
+xors 4, 1, sb2459, sb2929, sb236 # 1829
+xors 4, 1, sb2930, sb236, sb773 # 1830
+xors 4, 1, sb2931, sb771, sb233 # 1831
+xors 4, 1, sb2457, sb2931, sb230 # 1832
+xors 4, 1, sb2932, sb230, sb771 # 1833
+xors 4, 1, sb2933, sb769, sb226 # 1834
+xors 4, 1, sb2455, sb2933, sb223 # 1835
+xors 4, 1, sb2934, sb223, sb769 # 1836
+xors 4, 1, sb2935, sb766, sb221 # 1837
+xors 4, 1, sb2453, sb2935, sb219 # 1838
+xors 4, 1, sb2936, sb219, sb766 # 1839
+xors 4, 1, sb2937, sb764, sb217 # 1840
+xors 4, 1, sb2451, sb2937, sb214 # 1841
+xors 4, 1, sb2938, sb214, sb764 # 1842
+xors 4, 1, sb2939, sb762, sb211 # 1843
+xors 4, 1, sb2449, sb2939, sb208 # 1844
+xors 4, 1, sb2940, sb208, sb762 # 1845
+xors 4, 1, sb2941, sb759, sb207 # 1846
+xors 4, 1, sb2447, sb2941, sb206 # 1847
+xors 4, 1, sb2942, sb206, sb759 # 1848
+xors 4, 1, sb2943, sb753, sb203 # 1849
+xors 4, 1, sb2445, sb2943, sb199 # 1850
+xors 4, 1, sb2944, sb199, sb753 # 1851
+xors 4, 1, sb2945, sb751, sb193 # 1852
+xors 4, 1, sb2443, sb2945, sb186 # 1853
+xors 4, 1, sb2946, sb186, sb751 # 1854
+xors 4, 1, sb2947, sb748, sb185 # 1855
+xors 4, 1, sb2441, sb2947, sb183 # 1856
+xors 4, 1, sb2948, sb183, sb748 # 1857
+xors 4, 1, sb2949, sb746, sb176 # 1858
+xors 4, 1, sb2439, sb2949, sb173 # 1859
+xors 4, 1, sb2950, sb173, sb746 # 1860
+xors 4, 1, sb2951, sb743, sb170 # 1861
+xors 4, 1, sb2437, sb2951, sb169 # 1862
+xors 4, 1, sb2952, sb169, sb743 # 1863
+xors 4, 1, sb2953, sb740, sb162 # 1864
+xors 4, 1, sb2435, sb2953, sb160 # 1865
+xors 4, 1, sb2954, sb160, sb740 # 1866
+xors 4, 1, sb2955, sb734, sb156 # 1867
+xors 4, 1, sb2433, sb2955, sb155 # 1868
+xors 4, 1, sb2956, sb155, sb734 # 1869
+xors 4, 1, sb2957, sb731, sb153 # 1870
+xors 4, 1, sb2431, sb2957, sb149 # 1871
+xors 4, 1, sb2958, sb149, sb731 # 1872
+xors 4, 1, sb2959, sb728, sb148 # 1873
+xors 4, 1, sb2429, sb2959, sb144 # 1874
+xors 4, 1, sb2960, sb144, sb728 # 1875
+xors 4, 1, sb2961, sb726, sb139 # 1876
+xors 4, 1, sb2427, sb2961, sb140 # 1877
+xors 4, 1, sb2962, sb140, sb726 # 1878
+xors 4, 1, sb2963, sb722, sb136 # 1879
+xors 4, 1, sb2425, sb2963, sb132 # 1880
+xors 4, 1, sb2964, sb132, sb722 # 1881
+xors 4, 1, sb2965, sb714, sb1654 # 1882
+xors 4, 1, sb2423, sb2965, sb126 # 1883
+xors 4, 1, sb2966, sb126, sb714 # 1884
+xors 4, 1, sb2967, sb712, sb1652 # 1885
+xors 4, 1, sb2421, sb2967, sb2671 # 1886
+xors 4, 1, sb2968, sb2671, sb712 # 1887
+xors 4, 1, sb2969, sb709, sb118 # 1888
+xors 4, 1, sb2419, sb2969, sb1650 # 1889
+xors 4, 1, sb2970, sb1650, sb709 # 1890
+dabit s27, sb132 # 1891
+mulsi s25, s27, 2 # 1892
+dabit s26, sb707 # 1893
+mulsi s19, s26, 2 # 1894
+ldi c1, 2 # 1895
+mulci c2, c1, 2147483647 # 1896
+addci c6, c2, 2 # 1897
+randoms s20, 30 # 1898
+split 92, 3, s20, sb1646, sb1648, sb705, sb1642, sb329, sb698, sb1630, sb1638, sb695, sb1634, sb327, sb692, sb3106, sb1632, sb690, sb3155, sb3156, sb687, sb3153, sb3154, sb680, sb3151, sb3152, sb677, sb3149, sb3150, sb675, sb3147, sb3148, sb672, sb3145, sb3146, sb669, sb3143, sb3144, sb661, sb3141, sb3142, sb658, sb3139, sb3140, sb656, sb3137, sb3138, sb653, sb3135, sb3136, sb650, sb3133, sb3134, sb648, sb3131, sb3132, sb637, sb3129, sb3130, sb633, sb3127, sb3128, sb629, sb3125, sb3126, sb625, sb3123, sb3124, sb621, sb3121, sb3122, sb612, sb3119, sb3120, sb603, sb3117, sb3118, sb599, sb3115, sb3116, sb595, sb3113, sb3114, sb591, sb3111, sb3112, sb582, sb3109, sb3110, sb578, sb3107, sb3108, sb574 # 1899
+xors 4, 1, sb2971, sb705, sb1648 # 1900
+xors 4, 1, sb2972, sb1646, sb705 # 1901
+xors 4, 1, sb2973, sb698, sb329 # 1902
+xors 4, 1, sb2552, sb2973, sb1642 # 1903
+xors 4, 1, sb2974, sb1642, sb698 # 1904
+xors 4, 1, sb2975, sb695, sb1638 # 1905
+xors 4, 1, sb2550, sb2975, sb1630 # 1906
+xors 4, 1, sb2976, sb1630, sb695 # 1907
+xors 4, 1, sb2977, sb692, sb327 # 1908
+xors 4, 1, sb2548, sb2977, sb1634 # 1909
+xors 4, 1, sb2978, sb1634, sb692 # 1910
+xors 4, 1, sb2979, sb690, sb1632 # 1911
+xors 4, 1, sb2546, sb2979, sb3106 # 1912
+xors 4, 1, sb2980, sb3106, sb690 # 1913
+xors 4, 1, sb2981, sb687, sb3156 # 1914
+xors 4, 1, sb2544, sb2981, sb3155 # 1915
+xors 4, 1, sb2982, sb3155, sb687 # 1916
+xors 4, 1, sb2983, sb680, sb3154 # 1917
+xors 4, 1, sb2542, sb2983, sb3153 # 1918
+xors 4, 1, sb2984, sb3153, sb680 # 1919
+xors 4, 1, sb2985, sb677, sb3152 # 1920
+xors 4, 1, sb2540, sb2985, sb3151 # 1921
+xors 4, 1, sb2986, sb3151, sb677 # 1922
+xors 4, 1, sb2987, sb675, sb3150 # 1923
+xors 4, 1, sb2538, sb2987, sb3149 # 1924
+xors 4, 1, sb2988, sb3149, sb675 # 1925
+xors 4, 1, sb2989, sb672, sb3148 # 1926
+xors 4, 1, sb2536, sb2989, sb3147 # 1927
+xors 4, 1, sb2990, sb3147, sb672 # 1928
+xors 4, 1, sb2991, sb669, sb3146 # 1929
+xors 4, 1, sb2534, sb2991, sb3145 # 1930
+xors 4, 1, sb2992, sb3145, sb669 # 1931
+xors 4, 1, sb2993, sb661, sb3144 # 1932
+xors 4, 1, sb2532, sb2993, sb3143 # 1933
+xors 4, 1, sb2994, sb3143, sb661 # 1934
+xors 4, 1, sb2995, sb658, sb3142 # 1935
+xors 4, 1, sb2530, sb2995, sb3141 # 1936
+xors 4, 1, sb2996, sb3141, sb658 # 1937
+xors 4, 1, sb2997, sb656, sb3140 # 1938
+xors 4, 1, sb2528, sb2997, sb3139 # 1939
+xors 4, 1, sb2998, sb3139, sb656 # 1940
+xors 4, 1, sb2999, sb653, sb3138 # 1941
+xors 4, 1, sb2526, sb2999, sb3137 # 1942
+xors 4, 1, sb3000, sb3137, sb653 # 1943
+xors 4, 1, sb3001, sb650, sb3136 # 1944
+xors 4, 1, sb2524, sb3001, sb3135 # 1945
+xors 4, 1, sb3002, sb3135, sb650 # 1946
+xors 4, 1, sb3003, sb648, sb3134 # 1947
+xors 4, 1, sb2522, sb3003, sb3133 # 1948
+xors 4, 1, sb3004, sb3133, sb648 # 1949
+xors 4, 1, sb3005, sb637, sb3132 # 1950
+xors 4, 1, sb2520, sb3005, sb3131 # 1951
+xors 4, 1, sb3006, sb3131, sb637 # 1952
+xors 4, 1, sb3007, sb633, sb3130 # 1953
+xors 4, 1, sb2518, sb3007, sb3129 # 1954
+xors 4, 1, sb3008, sb3129, sb633 # 1955
+xors 4, 1, sb3009, sb629, sb3128 # 1956
+xors 4, 1, sb2516, sb3009, sb3127 # 1957
+xors 4, 1, sb3010, sb3127, sb629 # 1958
+xors 4, 1, sb3011, sb625, sb3126 # 1959
+xors 4, 1, sb2514, sb3011, sb3125 # 1960
+xors 4, 1, sb3012, sb3125, sb625 # 1961
+xors 4, 1, sb3013, sb621, sb3124 # 1962
+xors 4, 1, sb2512, sb3013, sb3123 # 1963
+xors 4, 1, sb3014, sb3123, sb621 # 1964
+xors 4, 1, sb3015, sb612, sb3122 # 1965
+xors 4, 1, sb2510, sb3015, sb3121 # 1966
+xors 4, 1, sb3016, sb3121, sb612 # 1967
+xors 4, 1, sb3017, sb603, sb3120 # 1968
+xors 4, 1, sb2508, sb3017, sb3119 # 1969
+xors 4, 1, sb3018, sb3119, sb603 # 1970
+xors 4, 1, sb3019, sb599, sb3118 # 1971
+xors 4, 1, sb2506, sb3019, sb3117 # 1972
+xors 4, 1, sb3020, sb3117, sb599 # 1973
+xors 4, 1, sb3021, sb595, sb3116 # 1974
+xors 4, 1, sb2504, sb3021, sb3115 # 1975
+xors 4, 1, sb3022, sb3115, sb595 # 1976
+xors 4, 1, sb3023, sb591, sb3114 # 1977
+xors 4, 1, sb2502, sb3023, sb3113 # 1978
+xors 4, 1, sb3024, sb3113, sb591 # 1979
+xors 4, 1, sb3025, sb582, sb3112 # 1980
+xors 4, 1, sb2500, sb3025, sb3111 # 1981
+xors 4, 1, sb3026, sb3111, sb582 # 1982
+xors 4, 1, sb3027, sb578, sb3110 # 1983
+xors 4, 1, sb2498, sb3027, sb3109 # 1984
+xors 4, 1, sb3028, sb3109, sb578 # 1985
+xors 4, 1, sb3029, sb574, sb3108 # 1986
+xors 4, 1, sb2496, sb3029, sb3107 # 1987
+xors 4, 1, sb3030, sb3107, sb574 # 1988
+dabit s23, sb126 # 1989
+mulsi s21, s23, 2 # 1990
+dabit s22, sb545 # 1991
+mulsi s11, s22, 2 # 1992
+bit s13 # 1993
+ldi c5, 1 # 1994
+mulci c37, c5, 2147483647 # 1995
+addci c2, c37, 2 # 1996
+mulci c1, c2, 2147483647 # 1997
+addci c5, c1, 1 # 1998
+mulm s18, s13, c5 # 1999
+ldi c37, 2 # 2000
+mulci c2, c37, 2147483647 # 2001
+addci c5, c2, 2 # 2002
+mulsi s7, s13, 2 # 2003
+ldi c2, 1 # 2004
+mulci c1, c2, 2147483647 # 2005
+addci c37, c1, 2 # 2006
+mulci c2, c37, 2147483647 # 2007
+addci c1, c2, 1 # 2008
+randoms s0, 32 # 2009
+split 98, 3, s0, sb3105, sb3106, sb542, sb3103, sb3104, sb538, sb3101, sb3102, sb534, sb3099, sb3100, sb507, sb3097, sb3098, sb493, sb3095, sb3096, sb488, sb3093, sb3094, sb482, sb3091, sb3092, sb477, sb3089, sb3090, sb468, sb3087, sb3088, sb464, sb3085, sb3086, sb459, sb3083, sb3084, sb453, sb3081, sb3082, sb446, sb3079, sb3080, sb441, sb3077, sb3078, sb436, sb3075, sb3076, sb430, sb3073, sb3074, sb427, sb3071, sb3072, sb418, sb3069, sb3070, sb412, sb2703, sb1354, sb405, sb2699, sb2701, sb400, sb1084, sb2697, sb396, sb2693, sb2695, sb393, sb2691, sb1735, sb389, sb2687, sb2689, sb382, sb2683, sb2685, sb378, sb2679, sb2681, sb371, sb2675, sb2677, sb362, sb2671, sb2673, sb353, sb2667, sb2669, sb349, sb2663, sb2665, sb345, sb2659, sb2661, sb335 # 2010
+xors 4, 1, sb3031, sb542, sb3106 # 2011
+xors 4, 1, sb3032, sb3105, sb542 # 2012
+xors 4, 1, sb3033, sb538, sb3104 # 2013
+xors 4, 1, sb2628, sb3033, sb3103 # 2014
+xors 4, 1, sb3034, sb3103, sb538 # 2015
+xors 4, 1, sb3035, sb534, sb3102 # 2016
+xors 4, 1, sb2626, sb3035, sb3101 # 2017
+xors 4, 1, sb3036, sb3101, sb534 # 2018
+xors 4, 1, sb3037, sb507, sb3100 # 2019
+xors 4, 1, sb2624, sb3037, sb3099 # 2020
+xors 4, 1, sb3038, sb3099, sb507 # 2021
+xors 4, 1, sb3039, sb493, sb3098 # 2022
+xors 4, 1, sb2622, sb3039, sb3097 # 2023
+xors 4, 1, sb3040, sb3097, sb493 # 2024
+xors 4, 1, sb3041, sb488, sb3096 # 2025
+xors 4, 1, sb2620, sb3041, sb3095 # 2026
+xors 4, 1, sb3042, sb3095, sb488 # 2027
+xors 4, 1, sb3043, sb482, sb3094 # 2028
+xors 4, 1, sb2618, sb3043, sb3093 # 2029
+xors 4, 1, sb3044, sb3093, sb482 # 2030
+xors 4, 1, sb3045, sb477, sb3092 # 2031
+xors 4, 1, sb2616, sb3045, sb3091 # 2032
+xors 4, 1, sb3046, sb3091, sb477 # 2033
+xors 4, 1, sb3047, sb468, sb3090 # 2034
+xors 4, 1, sb2614, sb3047, sb3089 # 2035
+xors 4, 1, sb3048, sb3089, sb468 # 2036
+xors 4, 1, sb3049, sb464, sb3088 # 2037
+xors 4, 1, sb2612, sb3049, sb3087 # 2038
+xors 4, 1, sb3050, sb3087, sb464 # 2039
+xors 4, 1, sb3051, sb459, sb3086 # 2040
+xors 4, 1, sb2610, sb3051, sb3085 # 2041
+xors 4, 1, sb3052, sb3085, sb459 # 2042
+xors 4, 1, sb3053, sb453, sb3084 # 2043
+xors 4, 1, sb2608, sb3053, sb3083 # 2044
+xors 4, 1, sb3054, sb3083, sb453 # 2045
+xors 4, 1, sb3055, sb446, sb3082 # 2046
+xors 4, 1, sb2606, sb3055, sb3081 # 2047
+xors 4, 1, sb3056, sb3081, sb446 # 2048
+xors 4, 1, sb3057, sb441, sb3080 # 2049
+xors 4, 1, sb2604, sb3057, sb3079 # 2050
+xors 4, 1, sb3058, sb3079, sb441 # 2051
+xors 4, 1, sb3059, sb436, sb3078 # 2052
+xors 4, 1, sb2602, sb3059, sb3077 # 2053
+xors 4, 1, sb3060, sb3077, sb436 # 2054
+xors 4, 1, sb3061, sb430, sb3076 # 2055
+xors 4, 1, sb2600, sb3061, sb3075 # 2056
+xors 4, 1, sb3062, sb3075, sb430 # 2057
+xors 4, 1, sb3063, sb427, sb3074 # 2058
+xors 4, 1, sb2598, sb3063, sb3073 # 2059
+xors 4, 1, sb3064, sb3073, sb427 # 2060
+xors 4, 1, sb3065, sb418, sb3072 # 2061
+xors 4, 1, sb2596, sb3065, sb3071 # 2062
+xors 4, 1, sb3066, sb3071, sb418 # 2063
+xors 4, 1, sb3067, sb412, sb3070 # 2064
+xors 4, 1, sb2594, sb3067, sb3069 # 2065
+xors 4, 1, sb3068, sb3069, sb412 # 2066
+xors 4, 1, sb3069, sb405, sb1354 # 2067
+xors 4, 1, sb2592, sb3069, sb2703 # 2068
+xors 4, 1, sb3070, sb2703, sb405 # 2069
+xors 4, 1, sb3071, sb400, sb2701 # 2070
+xors 4, 1, sb2590, sb3071, sb2699 # 2071
+xors 4, 1, sb3072, sb2699, sb400 # 2072
+xors 4, 1, sb3073, sb396, sb2697 # 2073
+xors 4, 1, sb2588, sb3073, sb1084 # 2074
+xors 4, 1, sb3074, sb1084, sb396 # 2075
+xors 4, 1, sb3075, sb393, sb2695 # 2076
+xors 4, 1, sb2586, sb3075, sb2693 # 2077
+xors 4, 1, sb3076, sb2693, sb393 # 2078
+xors 4, 1, sb3077, sb389, sb1735 # 2079
+xors 4, 1, sb2584, sb3077, sb2691 # 2080
+xors 4, 1, sb3078, sb2691, sb389 # 2081
+xors 4, 1, sb3079, sb382, sb2689 # 2082
+xors 4, 1, sb2582, sb3079, sb2687 # 2083
+xors 4, 1, sb3080, sb2687, sb382 # 2084
+xors 4, 1, sb3081, sb378, sb2685 # 2085
+xors 4, 1, sb2580, sb3081, sb2683 # 2086
+xors 4, 1, sb3082, sb2683, sb378 # 2087
+xors 4, 1, sb3083, sb371, sb2681 # 2088
+xors 4, 1, sb2578, sb3083, sb2679 # 2089
+xors 4, 1, sb3084, sb2679, sb371 # 2090
+xors 4, 1, sb3085, sb362, sb2677 # 2091
+xors 4, 1, sb2576, sb3085, sb2675 # 2092
+xors 4, 1, sb3086, sb2675, sb362 # 2093
+xors 4, 1, sb3087, sb353, sb2673 # 2094
+xors 4, 1, sb2574, sb3087, sb2671 # 2095
+xors 4, 1, sb3088, sb2671, sb353 # 2096
+xors 4, 1, sb3089, sb349, sb2669 # 2097
+xors 4, 1, sb2572, sb3089, sb2667 # 2098
+xors 4, 1, sb3090, sb2667, sb349 # 2099
+xors 4, 1, sb3091, sb345, sb2665 # 2100
+xors 4, 1, sb2570, sb3091, sb2663 # 2101
+xors 4, 1, sb3092, sb2663, sb345 # 2102
+xors 4, 1, sb3093, sb335, sb2661 # 2103
+xors 4, 1, sb2568, sb3093, sb2659 # 2104
+xors 4, 1, sb3094, sb2659, sb335 # 2105
+dabit s10, sb118 # 2106
+mulsi s8, s10, 2 # 2107
+dabit s9, sb331 # 2108
+mulsi s5, s9, 2 # 2109
+ldi c2, 2 # 2110
+mulci c37, c2, 2147483647 # 2111
+addci c2, c37, 2 # 2112
+randoms s6, 31 # 2113
+split 95, 3, s6, sb2655, sb2657, sb329, sb2651, sb2653, sb310, sb2647, sb2649, sb305, sb1733, sb2645, sb295, sb919, sb1339, sb291, sb1310, sb1333, sb286, sb1301, sb1303, sb283, sb1297, sb1299, sb279, sb2107, sb1295, sb276, sb2104, sb1291, sb269, sb1283, sb1287, sb265, sb2341, sb2343, sb262, sb2337, sb2339, sb249, sb2333, sb2335, sb236, sb2329, sb2331, sb230, sb2321, sb2325, sb223, sb2317, sb1275, sb219, sb2309, sb2313, sb214, sb2301, sb2305, sb208, sb2297, sb1271, sb206, sb1882, sb2293, sb199, sb2285, sb2289, sb186, sb1267, sb2281, sb183, sb2273, sb2277, sb173, sb2269, sb1067, sb169, sb2264, sb2266, sb160, sb2260, sb2262, sb155, sb2256, sb2258, sb149, sb1262, sb2254, sb144, sb2247, sb2251, sb140, sb2235, sb2241, sb136 # 2114
+xors 4, 1, sb3095, sb329, sb2657 # 2115
+xors 4, 1, sb3096, sb2655, sb329 # 2116
+xors 4, 1, sb3097, sb310, sb2653 # 2117
+xors 4, 1, sb2703, sb3097, sb2651 # 2118
+xors 4, 1, sb3098, sb2651, sb310 # 2119
+xors 4, 1, sb3099, sb305, sb2649 # 2120
+xors 4, 1, sb2701, sb3099, sb2647 # 2121
+xors 4, 1, sb3100, sb2647, sb305 # 2122
+xors 4, 1, sb3101, sb295, sb2645 # 2123
+xors 4, 1, sb2699, sb3101, sb1733 # 2124
+xors 4, 1, sb3102, sb1733, sb295 # 2125
+xors 4, 1, sb3103, sb291, sb1339 # 2126
+xors 4, 1, sb2697, sb3103, sb919 # 2127
+xors 4, 1, sb3104, sb919, sb291 # 2128
+xors 4, 1, sb3105, sb286, sb1333 # 2129
+xors 4, 1, sb2695, sb3105, sb1310 # 2130
+xors 4, 1, sb3106, sb1310, sb286 # 2131
+xors 4, 1, sb3107, sb283, sb1303 # 2132
+xors 4, 1, sb2693, sb3107, sb1301 # 2133
+xors 4, 1, sb3108, sb1301, sb283 # 2134
+xors 4, 1, sb3109, sb279, sb1299 # 2135
+xors 4, 1, sb2691, sb3109, sb1297 # 2136
+xors 4, 1, sb3110, sb1297, sb279 # 2137
+xors 4, 1, sb3111, sb276, sb1295 # 2138
+xors 4, 1, sb2689, sb3111, sb2107 # 2139
+xors 4, 1, sb3112, sb2107, sb276 # 2140
+xors 4, 1, sb3113, sb269, sb1291 # 2141
+xors 4, 1, sb2687, sb3113, sb2104 # 2142
+xors 4, 1, sb3114, sb2104, sb269 # 2143
+xors 4, 1, sb3115, sb265, sb1287 # 2144
+xors 4, 1, sb2685, sb3115, sb1283 # 2145
+xors 4, 1, sb3116, sb1283, sb265 # 2146
+xors 4, 1, sb3117, sb262, sb2343 # 2147
+xors 4, 1, sb2683, sb3117, sb2341 # 2148
+xors 4, 1, sb3118, sb2341, sb262 # 2149
+xors 4, 1, sb3119, sb249, sb2339 # 2150
+xors 4, 1, sb2681, sb3119, sb2337 # 2151
+xors 4, 1, sb3120, sb2337, sb249 # 2152
+xors 4, 1, sb3121, sb236, sb2335 # 2153
+xors 4, 1, sb2679, sb3121, sb2333 # 2154
+xors 4, 1, sb3122, sb2333, sb236 # 2155
+xors 4, 1, sb3123, sb230, sb2331 # 2156
+xors 4, 1, sb2677, sb3123, sb2329 # 2157
+xors 4, 1, sb3124, sb2329, sb230 # 2158
+xors 4, 1, sb3125, sb223, sb2325 # 2159
+xors 4, 1, sb2675, sb3125, sb2321 # 2160
+xors 4, 1, sb3126, sb2321, sb223 # 2161
+xors 4, 1, sb3127, sb219, sb1275 # 2162
+xors 4, 1, sb2673, sb3127, sb2317 # 2163
+xors 4, 1, sb3128, sb2317, sb219 # 2164
+xors 4, 1, sb3129, sb214, sb2313 # 2165
+xors 4, 1, sb2671, sb3129, sb2309 # 2166
+xors 4, 1, sb3130, sb2309, sb214 # 2167
+xors 4, 1, sb3131, sb208, sb2305 # 2168
+xors 4, 1, sb2669, sb3131, sb2301 # 2169
+xors 4, 1, sb3132, sb2301, sb208 # 2170
+xors 4, 1, sb3133, sb206, sb1271 # 2171
+xors 4, 1, sb2667, sb3133, sb2297 # 2172
+xors 4, 1, sb3134, sb2297, sb206 # 2173
+xors 4, 1, sb3135, sb199, sb2293 # 2174
+xors 4, 1, sb2665, sb3135, sb1882 # 2175
+xors 4, 1, sb3136, sb1882, sb199 # 2176
+xors 4, 1, sb3137, sb186, sb2289 # 2177
+xors 4, 1, sb2663, sb3137, sb2285 # 2178
+xors 4, 1, sb3138, sb2285, sb186 # 2179
+xors 4, 1, sb3139, sb183, sb2281 # 2180
+xors 4, 1, sb2661, sb3139, sb1267 # 2181
+xors 4, 1, sb3140, sb1267, sb183 # 2182
+xors 4, 1, sb3141, sb173, sb2277 # 2183
+xors 4, 1, sb2659, sb3141, sb2273 # 2184
+xors 4, 1, sb3142, sb2273, sb173 # 2185
+xors 4, 1, sb3143, sb169, sb1067 # 2186
+xors 4, 1, sb2657, sb3143, sb2269 # 2187
+xors 4, 1, sb3144, sb2269, sb169 # 2188
+xors 4, 1, sb3145, sb160, sb2266 # 2189
+xors 4, 1, sb2655, sb3145, sb2264 # 2190
+xors 4, 1, sb3146, sb2264, sb160 # 2191
+xors 4, 1, sb3147, sb155, sb2262 # 2192
+xors 4, 1, sb2653, sb3147, sb2260 # 2193
+xors 4, 1, sb3148, sb2260, sb155 # 2194
+xors 4, 1, sb3149, sb149, sb2258 # 2195
+xors 4, 1, sb2651, sb3149, sb2256 # 2196
+xors 4, 1, sb3150, sb2256, sb149 # 2197
+xors 4, 1, sb3151, sb144, sb2254 # 2198
+xors 4, 1, sb2649, sb3151, sb1262 # 2199
+xors 4, 1, sb3152, sb1262, sb144 # 2200
+xors 4, 1, sb3153, sb140, sb2251 # 2201
+xors 4, 1, sb2647, sb3153, sb2247 # 2202
+xors 4, 1, sb3154, sb2247, sb140 # 2203
+xors 4, 1, sb3155, sb136, sb2241 # 2204
+xors 4, 1, sb2645, sb3155, sb2235 # 2205
+xors 4, 1, sb3156, sb2235, sb136 # 2206
+ands 2512, 1, sb2343, sb2344, sb2346, 1, sb2341, sb2348, sb2350, 1, sb2339, sb2352, sb2354, 1, sb2337, sb2356, sb2358, 1, sb2335, sb2360, sb2362, 1, sb2333, sb2364, sb2366, 1, sb2331, sb2368, sb2370, 1, sb2329, sb2372, sb2374, 1, sb2325, sb2376, sb2378, 1, sb2321, sb2380, sb2382, 1, sb2317, sb2384, sb2386, 1, sb2313, sb2388, sb2390, 1, sb2309, sb2392, sb2394, 1, sb2305, sb2396, sb2398, 1, sb2301, sb2400, sb2402, 1, sb2297, sb2404, sb2405, 1, sb2293, sb2406, sb2407, 1, sb2289, sb2408, sb2409, 1, sb2285, sb2410, sb2411, 1, sb2281, sb2412, sb2413, 1, sb2277, sb2414, sb2415, 1, sb2273, sb2416, sb2417, 1, sb2269, sb2418, sb2420, 1, sb2266, sb2422, sb2424, 1, sb2264, sb2426, sb2428, 1, sb2262, sb2430, sb2432, 1, sb2260, sb2434, sb2436, 1, sb2258, sb2438, sb2440, 1, sb2256, sb2442, sb2444, 1, sb2254, sb2446, sb2448, 1, sb2251, sb2450, sb2452, 1, sb2247, sb2454, sb2456, 1, sb2241, sb2458, sb2460, 1, sb2235, sb2462, sb2464, 1, sb2227, sb2466, sb2468, 1, sb2221, sb2470, sb2472, 1, sb2215, sb2474, sb2476, 1, sb2209, sb2478, sb2480, 1, sb2201, sb2481, sb2482, 1, sb2195, sb2483, sb2484, 1, sb2192, sb2485, sb2486, 1, sb2189, sb2487, sb2488, 1, sb2186, sb2489, sb2490, 1, sb2182, sb2491, sb2492, 1, sb2178, sb2493, sb2494, 1, sb2172, sb2495, sb2497, 1, sb2166, sb2499, sb2501, 1, sb2160, sb2503, sb2505, 1, sb2154, sb2507, sb2509, 1, sb2146, sb2511, sb2513, 1, sb2140, sb2515, sb2517, 1, sb2134, sb2519, sb2521, 1, sb2128, sb2523, sb2525, 1, sb2122, sb2527, sb2529, 1, sb2117, sb2531, sb2533, 1, sb2114, sb2535, sb2537, 1, sb2110, sb2539, sb2541, 1, sb2107, sb2543, sb2545, 1, sb2104, sb2547, sb2549, 1, sb2098, sb2551, sb2553, 1, sb2092, sb2554, sb2555, 1, sb2086, sb2556, sb2557, 1, sb2080, sb2558, sb2559, 1, sb2072, sb46, sb46, 1, sb2068, sb2560, sb2561, 1, sb2064, sb2562, sb2563, 1, sb2060, sb2564, sb2565, 1, sb2056, sb2566, sb2567, 1, sb2052, sb2569, sb2571, 1, sb2048, sb2573, sb2575, 1, sb2044, sb2577, sb2579, 1, sb2042, sb2581, sb2583, 1, sb2040, sb2585, sb2587, 1, sb2038, sb2589, sb2591, 1, sb2036, sb2593, sb2595, 1, sb2034, sb2597, sb2599, 1, sb2032, sb2601, sb2603, 1, sb2030, sb2605, sb2607, 1, sb2027, sb2609, sb2611, 1, sb2023, sb2613, sb2615, 1, sb2019, sb2617, sb2619, 1, sb2015, sb2621, sb2623, 1, sb2011, sb2625, sb2627, 1, sb2007, sb2629, sb2630, 1, sb2003, sb2631, sb2632, 1, sb1999, sb2633, sb2634, 1, sb1995, sb2635, sb2636, 1, sb1991, sb2637, sb2638, 1, sb1987, sb2639, sb2640, 1, sb1983, sb2641, sb2642, 1, sb1979, sb2643, sb2644, 1, sb1975, sb2646, sb2648, 1, sb1971, sb2650, sb2652, 1, sb1967, sb2654, sb2656, 1, sb1963, sb2658, sb2660, 1, sb1961, sb2662, sb2664, 1, sb1959, sb2666, sb2668, 1, sb1957, sb2670, sb2672, 1, sb1955, sb2674, sb2676, 1, sb1953, sb2678, sb2680, 1, sb1949, sb2682, sb2684, 1, sb1945, sb2686, sb2688, 1, sb1941, sb2690, sb2692, 1, sb1937, sb2694, sb2696, 1, sb1933, sb2698, sb2700, 1, sb1929, sb2702, sb2704, 1, sb1925, sb2705, sb2706, 1, sb1921, sb2707, sb2708, 1, sb1917, sb2709, sb2710, 1, sb1913, sb2711, sb2712, 1, sb1909, sb2713, sb2714, 1, sb1905, sb2715, sb2716, 1, sb1901, sb2717, sb0, 1, sb1897, sb1, sb2, 1, sb1894, sb3, sb5, 1, sb1892, sb6, sb7, 1, sb1890, sb8, sb9, 1, sb1888, sb10, sb11, 1, sb1886, sb12, sb13, 1, sb1884, sb14, sb15, 1, sb1882, sb16, sb17, 1, sb1880, sb18, sb20, 1, sb1876, sb21, sb22, 1, sb1872, sb24, sb25, 1, sb1868, sb26, sb29, 1, sb1864, sb30, sb31, 1, sb1860, sb32, sb33, 1, sb1852, sb34, sb36, 1, sb1848, sb37, sb38, 1, sb1844, sb39, sb41, 1, sb1840, sb42, sb44, 1, sb1836, sb47, sb48, 1, sb1832, sb49, sb50, 1, sb1828, sb51, sb52, 1, sb1824, sb53, sb55, 1, sb1820, sb56, sb57, 1, sb1817, sb58, sb59, 1, sb1815, sb61, sb62, 1, sb1813, sb63, sb64, 1, sb1811, sb65, sb66, 1, sb1809, sb67, sb68, 1, sb1807, sb69, sb70, 1, sb1805, sb71, sb72, 1, sb1798, sb74, sb75, 1, sb1794, sb76, sb77, 1, sb1790, sb78, sb79, 1, sb1786, sb80, sb81, 1, sb1782, sb82, sb83, 1, sb1778, sb84, sb85, 1, sb1774, sb86, sb87, 1, sb1770, sb88, sb89, 1, sb1766, sb90, sb91, 1, sb1762, sb92, sb93, 1, sb1758, sb94, sb95, 1, sb1754, sb96, sb98, 1, sb1750, sb100, sb101, 1, sb1746, sb102, sb103, 1, sb1743, sb104, sb105, 1, sb1741, sb106, sb107, 1, sb1739, sb108, sb109, 1, sb1737, sb110, sb112, 1, sb1735, sb113, sb115, 1, sb1733, sb116, sb117, 1, sb1731, sb119, sb120, 1, sb1729, sb123, sb124, 1, sb1725, sb125, sb127, 1, sb1721, sb128, sb129, 1, sb1718, sb130, sb131, 1, sb1716, sb133, sb134, 1, sb1714, sb137, sb141, 1, sb1712, sb143, sb147, 1, sb1710, sb152, sb158, 1, sb1708, sb161, sb163, 1, sb1706, sb164, sb166, 1, sb1704, sb167, sb168, 1, sb1702, sb171, sb175, 1, sb1700, sb178, sb180, 1, sb1698, sb182, sb187, 1, sb1696, sb188, sb189, 1, sb1694, sb190, sb192, 1, sb1692, sb194, sb195, 1, sb1690, sb196, sb200, 1, sb1688, sb202, sb209, 1, sb1686, sb213, sb218, 1, sb1684, sb1672, sb222, 1, sb1682, sb225, sb229, 1, sb1680, sb234, sb237, 1, sb1678, sb238, sb240, 1, sb1676, sb242, sb244, 1, sb1674, sb246, sb247, 1, sb1670, sb248, sb250, 1, sb1668, sb252, sb253, 1, sb1666, sb254, sb256, 1, sb1664, sb257, sb258, 1, sb1662, sb261, sb266, 1, sb1660, sb270, sb273, 1, sb1658, sb275, sb278, 1, sb1656, sb280, sb282, 1, sb1654, sb285, sb287, 1, sb1652, sb289, sb290, 1, sb1650, sb292, sb294, 1, sb1648, sb296, sb297, 1, sb1646, sb298, sb299, 1, sb1644, sb300, sb302, 1, sb1642, sb303, sb304, 1, sb1640, sb306, sb308, 1, sb1638, sb309, sb311, 1, sb1636, sb312, sb313, 1, sb1634, sb314, sb315, 1, sb1632, sb316, sb317, 1, sb1630, sb318, sb319, 1, sb1628, sb320, sb321, 1, sb1626, sb322, sb323, 1, sb1624, sb324, sb325, 1, sb1622, sb326, sb328, 1, sb1620, sb332, sb333, 1, sb1618, sb334, sb336, 1, sb1616, sb339, sb341, 1, sb1614, sb343, sb346, 1, sb1612, sb350, sb354, 1, sb1610, sb357, sb359, 1, sb1608, sb361, sb365, 1, sb1604, sb367, sb369, 1, sb1602, sb372, sb375, 1, sb1600, sb377, sb381, 1, sb1598, sb384, sb386, 1, sb1596, sb390, sb395, 1, sb1594, sb399, sb402, 1, sb1592, sb406, sb408, 1, sb1590, sb411, sb415, 1, sb1588, sb417, sb420, 1, sb1586, sb422, sb424, 1, sb1584, sb425, sb426, 1, sb1582, sb428, sb431, 1, sb1580, sb433, sb434, 1, sb1578, sb435, sb437, 1, sb1576, sb438, sb440, 1, sb1574, sb442, sb443, 1, sb1572, sb445, sb448, 1, sb1570, sb451, sb454, 1, sb1568, sb457, sb460, 1, sb1566, sb463, sb467, 1, sb1564, sb470, sb473, 1, sb1562, sb475, sb478, 1, sb1560, sb481, sb485, 1, sb1558, sb487, sb491, 1, sb1556, sb494, sb497, 1, sb1554, sb499, sb501, 1, sb1552, sb503, sb505, 1, sb1550, sb508, sb510, 1, sb1548, sb512, sb514, 1, sb1546, sb516, sb518, 1, sb1544, sb520, sb522, 1, sb1540, sb524, sb526, 1, sb1538, sb528, sb529, 1, sb1536, sb530, sb531, 1, sb1534, sb533, sb535, 1, sb1532, sb537, sb539, 1, sb1530, sb541, sb543, 1, sb1528, sb546, sb547, 1, sb1526, sb548, sb549, 1, sb1524, sb550, sb551, 1, sb1522, sb552, sb553, 1, sb1520, sb554, sb555, 1, sb1518, sb556, sb558, 1, sb1516, sb559, sb560, 1, sb1514, sb561, sb562, 1, sb1512, sb564, sb565, 1, sb1510, sb566, sb567, 1, sb1508, sb568, sb569, 1, sb1506, sb570, sb572, 1, sb1504, sb573, sb577, 1, sb1502, sb581, sb585, 1, sb1500, sb587, sb589, 1, sb1498, sb592, sb596, 1, sb1496, sb600, sb604, 1, sb1494, sb606, sb608, 1, sb1492, sb611, sb613, 1, sb1490, sb615, sb616, 1, sb1488, sb617, sb618, 1, sb1486, sb619, sb620, 1, sb1484, sb622, sb626, 1, sb1482, sb630, sb634, 1, sb1480, sb638, sb641, 1, sb1478, sb643, sb645, 1, sb1474, sb647, sb655, 1, sb1472, sb662, sb664, 1, sb1470, sb666, sb667, 1, sb1468, sb674, sb681, 1, sb1466, sb683, sb685, 1, sb1464, sb693, sb700, 1, sb1462, sb702, sb704, 1, sb1460, sb708, sb716, 1, sb1458, sb718, sb720, 1, sb1456, sb723, sb729, 1, sb1454, sb736, sb738, 1, sb1452, sb741, sb744, 1, sb1450, sb755, sb757, 1, sb1448, sb761, sb774, 1, sb1446, sb776, sb778, 1, sb1444, sb790, sb792, 1, sb1442, sb794, sb799, 1, sb1440, sb810, sb812, 1, sb1438, sb815, sb816, 1, sb1436, sb818, sb824, 1, sb1434, sb830, sb832, 1, sb1432, sb839, sb843, 1, sb1430, sb845, sb848, 1, sb1428, sb849, sb850, 1, sb1426, sb851, sb856, 1, sb1424, sb860, sb862, 1, sb1422, sb864, sb865, 1, sb1420, sb866, sb867, 1, sb1418, sb868, sb873, 1, sb1416, sb875, sb883, 1, sb1412, sb884, sb885, 1, sb1410, sb886, sb887, 1, sb1408, sb888, sb890, 1, sb1406, sb900, sb903, 1, sb1404, sb905, sb907, 1, sb1402, sb923, sb931, 1, sb1400, sb955, sb982, 1, sb1398, sb984, sb986, 1, sb1396, sb988, sb990, 1, sb1394, sb992, sb994, 1, sb1392, sb996, sb998, 1, sb1390, sb1000, sb1002, 1, sb1388, sb1003, sb1004, 1, sb1386, sb1006, sb1017, 1, sb1384, sb1019, sb1020, 1, sb1382, sb1021, sb1023, 1, sb1380, sb1024, sb1025, 1, sb1378, sb1027, sb1029, 1, sb1376, sb1031, sb1033, 1, sb1374, sb1034, sb1035, 1, sb1372, sb1037, sb1039, 1, sb1370, sb1041, sb1043, 1, sb1366, sb1045, sb1047, 1, sb1362, sb1049, sb1051, 1, sb1358, sb1053, sb1055, 1, sb1354, sb1057, sb1059, 1, sb1350, sb1061, sb1063, 1, sb1346, sb1065, sb1075, 1, sb1343, sb1077, sb1079, 1, sb1341, sb1081, sb1083, 1, sb1339, sb1085, sb1087, 1, sb1337, sb1089, sb1091, 1, sb1333, sb1093, sb1095, 1, sb1330, sb1097, sb1099, 1, sb1326, sb1101, sb1103, 1, sb1322, sb1114, sb1116, 1, sb1318, sb1118, sb1120, 1, sb1314, sb1122, sb1123, 1, sb1310, sb1124, sb1126, 1, sb1306, sb1133, sb1135, 1, sb1303, sb1137, sb1139, 1, sb1301, sb1141, sb1143, 1, sb1299, sb1145, sb1147, 1, sb1297, sb1149, sb1151, 1, sb1295, sb1153, sb1155, 1, sb1291, sb1157, sb1159, 1, sb1287, sb1161, sb1163, 1, sb1283, sb1165, sb1167, 1, sb1279, sb1169, sb1171, 1, sb1275, sb1173, sb1175, 1, sb1271, sb1190, sb1192, 1, sb1267, sb1194, sb1196, 1, sb1264, sb1198, sb1200, 1, sb1262, sb1202, sb1204, 1, sb1260, sb1206, sb1208, 1, sb1258, sb1210, sb1212, 1, sb1256, sb1214, sb1216, 1, sb1252, sb1218, sb1228, 1, sb1248, sb1229, sb1231, 1, sb1244, sb1233, sb1235, 1, sb1240, sb1237, sb1239, 1, sb1236, sb1241, sb1243, 1, sb1232, sb1245, sb1247, 1, sb1226, sb1249, sb1251, 1, sb1224, sb1253, sb1255, 1, sb1222, sb1266, sb1268, 1, sb1220, sb1270, sb1272, 1, sb1217, sb1274, sb1276, 1, sb1213, sb1278, sb1280, 1, sb1209, sb1282, sb1284, 1, sb1205, sb1286, sb1288, 1, sb1201, sb1290, sb1292, 1, sb1197, sb1294, sb1305, 1, sb1193, sb1307, sb1309, 1, sb1189, sb1311, sb1313, 1, sb1187, sb1315, sb1317, 1, sb1185, sb1319, sb1321, 1, sb1183, sb1323, sb1325, 1, sb1181, sb1327, sb1329, 1, sb1179, sb1331, sb1335, 1, sb1177, sb1345, sb1347, 1, sb1174, sb1349, sb1351, 1, sb1170, sb1353, sb1355, 1, sb1166, sb1357, sb1359, 1, sb1162, sb1361, sb1363, 1, sb1158, sb1365, sb1367, 1, sb1154, sb1369, sb1414, 1, sb1150, sb1476, sb1542, 1, sb1146, sb1606, sb1802, 1, sb1142, sb1856, sb1965, 1, sb1138, sb2070, sb2074, 1, sb1134, sb2111, sb2148, 1, sb1131, sb2183, sb2203, 1, sb1129, sb2229, sb2718, 1, sb1127, sb2719, sb2720, 1, sb1119, sb2721, sb2722, 1, sb1115, sb2723, sb2724, 1, sb1112, sb2725, sb2726, 1, sb1110, sb2727, sb2728, 1, sb1108, sb2729, sb2730, 1, sb1106, sb2731, sb2732, 1, sb1104, sb2733, sb2734, 1, sb1100, sb2735, sb2736, 1, sb1096, sb2737, sb2738, 1, sb1092, sb2739, sb2740, 1, sb1088, sb2741, sb2742, 1, sb1084, sb2743, sb2744, 1, sb1080, sb2745, sb2746, 1, sb1076, sb2747, sb2748, 1, sb1073, sb2749, sb2750, 1, sb1071, sb2751, sb2752, 1, sb1069, sb2753, sb2754, 1, sb1067, sb2755, sb2756, 1, sb1064, sb2757, sb2758, 1, sb1060, sb2759, sb2760, 1, sb1056, sb2761, sb2762, 1, sb1052, sb2763, sb2764, 1, sb1048, sb2765, sb2766, 1, sb1044, sb2767, sb2768, 1, sb1040, sb2769, sb2770, 1, sb1015, sb2771, sb2772, 1, sb1013, sb2773, sb2774, 1, sb1011, sb2775, sb2776, 1, sb1009, sb2777, sb2778, 1, sb1007, sb2779, sb2780, 1, sb999, sb2781, sb2782, 1, sb995, sb2783, sb2784, 1, sb991, sb2785, sb2786, 1, sb987, sb2787, sb2788, 1, sb983, sb2789, sb2790, 1, sb980, sb2791, sb2792, 1, sb978, sb2793, sb2794, 1, sb976, sb2795, sb2796, 1, sb974, sb2797, sb2798, 1, sb972, sb2799, sb2800, 1, sb970, sb2801, sb2802, 1, sb968, sb2803, sb2804, 1, sb966, sb2805, sb2806, 1, sb964, sb2807, sb2808, 1, sb962, sb2809, sb2810, 1, sb960, sb2811, sb2812, 1, sb958, sb2813, sb2814, 1, sb956, sb2815, sb2816, 1, sb953, sb2817, sb2818, 1, sb951, sb2819, sb2820, 1, sb949, sb2821, sb2822, 1, sb947, sb2823, sb2824, 1, sb945, sb2825, sb2826, 1, sb943, sb2827, sb2828, 1, sb941, sb2829, sb2830, 1, sb938, sb2831, sb2832, 1, sb936, sb2833, sb2834, 1, sb934, sb2835, sb2836, 1, sb932, sb2837, sb2838, 1, sb929, sb2839, sb2840, 1, sb927, sb2841, sb2842, 1, sb925, sb2843, sb2844, 1, sb921, sb2845, sb2846, 1, sb919, sb2847, sb2848, 1, sb917, sb2849, sb2850, 1, sb915, sb2851, sb2852, 1, sb913, sb2853, sb2854, 1, sb911, sb2855, sb2856, 1, sb909, sb2857, sb2858, 1, sb899, sb2859, sb2860, 1, sb897, sb2861, sb2862, 1, sb895, sb2863, sb2864, 1, sb892, sb2865, sb2866, 1, sb889, sb2867, sb2868, 1, sb881, sb2869, sb2870, 1, sb879, sb2871, sb2872, 1, sb877, sb2873, sb2874, 1, sb874, sb2875, sb2876, 1, sb871, sb2877, sb2878, 1, sb869, sb2879, sb2880, 1, sb861, sb2881, sb2882, 1, sb858, sb2883, sb2884, 1, sb855, sb2885, sb2886, 1, sb853, sb2887, sb2888, 1, sb847, sb2889, sb2890, 1, sb844, sb2891, sb2892, 1, sb840, sb2893, sb2894, 1, sb836, sb2895, sb2896, 1, sb834, sb2897, sb2898, 1, sb828, sb2899, sb2900, 1, sb826, sb2901, sb2902, 1, sb823, sb2903, sb2904, 1, sb821, sb2905, sb2906, 1, sb814, sb2907, sb2908, 1, sb808, sb2909, sb2910, 1, sb806, sb2911, sb2912, 1, sb803, sb2913, sb2914, 1, sb801, sb2915, sb2916, 1, sb798, sb2917, sb2918, 1, sb796, sb2919, sb2920, 1, sb788, sb2921, sb2922, 1, sb786, sb2923, sb2924, 1, sb783, sb2925, sb2926, 1, sb781, sb2927, sb2928, 1, sb779, sb2929, sb2930, 1, sb772, sb2931, sb2932, 1, sb770, sb2933, sb2934, 1, sb768, sb2935, sb2936, 1, sb765, sb2937, sb2938, 1, sb763, sb2939, sb2940, 1, sb760, sb2941, sb2942, 1, sb754, sb2943, sb2944, 1, sb752, sb2945, sb2946, 1, sb749, sb2947, sb2948, 1, sb747, sb2949, sb2950, 1, sb745, sb2951, sb2952, 1, sb742, sb2953, sb2954, 1, sb735, sb2955, sb2956, 1, sb732, sb2957, sb2958, 1, sb730, sb2959, sb2960, 1, sb727, sb2961, sb2962, 1, sb724, sb2963, sb2964, 1, sb715, sb2965, sb2966, 1, sb713, sb2967, sb2968, 1, sb711, sb2969, sb2970, 1, sb706, sb2971, sb2972, 1, sb699, sb2973, sb2974, 1, sb696, sb2975, sb2976, 1, sb694, sb2977, sb2978, 1, sb691, sb2979, sb2980, 1, sb688, sb2981, sb2982, 1, sb686, sb2983, sb2984, 1, sb679, sb2985, sb2986, 1, sb676, sb2987, sb2988, 1, sb673, sb2989, sb2990, 1, sb671, sb2991, sb2992, 1, sb668, sb2993, sb2994, 1, sb660, sb2995, sb2996, 1, sb657, sb2997, sb2998, 1, sb654, sb2999, sb3000, 1, sb652, sb3001, sb3002, 1, sb649, sb3003, sb3004, 1, sb639, sb3005, sb3006, 1, sb635, sb3007, sb3008, 1, sb631, sb3009, sb3010, 1, sb627, sb3011, sb3012, 1, sb623, sb3013, sb3014, 1, sb614, sb3015, sb3016, 1, sb610, sb3017, sb3018, 1, sb601, sb3019, sb3020, 1, sb597, sb3021, sb3022, 1, sb593, sb3023, sb3024, 1, sb584, sb3025, sb3026, 1, sb580, sb3027, sb3028, 1, sb576, sb3029, sb3030, 1, sb544, sb3031, sb3032, 1, sb540, sb3033, sb3034, 1, sb536, sb3035, sb3036, 1, sb532, sb3037, sb3038, 1, sb496, sb3039, sb3040, 1, sb490, sb3041, sb3042, 1, sb484, sb3043, sb3044, 1, sb480, sb3045, sb3046, 1, sb471, sb3047, sb3048, 1, sb465, sb3049, sb3050, 1, sb462, sb3051, sb3052, 1, sb455, sb3053, sb3054, 1, sb450, sb3055, sb3056, 1, sb444, sb3057, sb3058, 1, sb439, sb3059, sb3060, 1, sb432, sb3061, sb3062, 1, sb429, sb3063, sb3064, 1, sb423, sb3065, sb3066, 1, sb414, sb3067, sb3068, 1, sb409, sb3069, sb3070, 1, sb403, sb3071, sb3072, 1, sb398, sb3073, sb3074, 1, sb394, sb3075, sb3076, 1, sb391, sb3077, sb3078, 1, sb387, sb3079, sb3080, 1, sb380, sb3081, sb3082, 1, sb374, sb3083, sb3084, 1, sb364, sb3085, sb3086, 1, sb355, sb3087, sb3088, 1, sb351, sb3089, sb3090, 1, sb347, sb3091, sb3092, 1, sb337, sb3093, sb3094, 1, sb330, sb3095, sb3096, 1, sb327, sb3097, sb3098, 1, sb307, sb3099, sb3100, 1, sb301, sb3101, sb3102, 1, sb293, sb3103, sb3104, 1, sb288, sb3105, sb3106, 1, sb284, sb3107, sb3108, 1, sb281, sb3109, sb3110, 1, sb277, sb3111, sb3112, 1, sb272, sb3113, sb3114, 1, sb267, sb3115, sb3116, 1, sb264, sb3117, sb3118, 1, sb259, sb3119, sb3120, 1, sb243, sb3121, sb3122, 1, sb233, sb3123, sb3124, 1, sb226, sb3125, sb3126, 1, sb221, sb3127, sb3128, 1, sb217, sb3129, sb3130, 1, sb211, sb3131, sb3132, 1, sb207, sb3133, sb3134, 1, sb203, sb3135, sb3136, 1, sb193, sb3137, sb3138, 1, sb185, sb3139, sb3140, 1, sb176, sb3141, sb3142, 1, sb170, sb3143, sb3144, 1, sb162, sb3145, sb3146, 1, sb156, sb3147, sb3148, 1, sb153, sb3149, sb3150, 1, sb148, sb3151, sb3152, 1, sb142, sb3153, sb3154, 1, sb139, sb3155, sb3156 # 2207
+xors 4, 1, sb273, sb2342, sb2343 # 2208
+xors 4, 1, sb270, sb2340, sb2341 # 2209
+xors 4, 1, sb299, sb270, sb271 # 2210
+xors 4, 1, sb266, sb2338, sb2339 # 2211
+xors 4, 1, sb1006, sb266, sb268 # 2212
+xors 4, 1, sb261, sb2336, sb2337 # 2213
+xors 4, 1, sb298, sb261, sb263 # 2214
+xors 4, 1, sb258, sb2334, sb2335 # 2215
+xors 4, 1, sb1004, sb258, sb260 # 2216
+xors 4, 1, sb253, sb2332, sb2333 # 2217
+xors 4, 1, sb297, sb253, sb255 # 2218
+xors 4, 1, sb247, sb2330, sb2331 # 2219
+xors 4, 1, sb1002, sb247, sb251 # 2220
+xors 4, 1, sb242, sb2327, sb2329 # 2221
+xors 4, 1, sb296, sb242, sb245 # 2222
+xors 4, 1, sb240, sb2323, sb2325 # 2223
+xors 4, 1, sb1000, sb240, sb241 # 2224
+xors 4, 1, sb237, sb2319, sb2321 # 2225
+xors 4, 1, sb294, sb237, sb239 # 2226
+xors 4, 1, sb234, sb2315, sb2317 # 2227
+xors 4, 1, sb998, sb234, sb235 # 2228
+xors 4, 1, sb229, sb2311, sb2313 # 2229
+xors 4, 1, sb292, sb229, sb231 # 2230
+xors 4, 1, sb225, sb2307, sb2309 # 2231
+xors 4, 1, sb996, sb225, sb228 # 2232
+xors 4, 1, sb222, sb2303, sb2305 # 2233
+xors 4, 1, sb290, sb222, sb224 # 2234
+xors 4, 1, sb218, sb2299, sb2301 # 2235
+xors 4, 1, sb994, sb218, sb220 # 2236
+xors 4, 1, sb213, sb2295, sb2297 # 2237
+xors 4, 1, sb289, sb213, sb215 # 2238
+xors 4, 1, sb209, sb2291, sb2293 # 2239
+xors 4, 1, sb992, sb209, sb212 # 2240
+xors 4, 1, sb202, sb2287, sb2289 # 2241
+xors 4, 1, sb287, sb202, sb205 # 2242
+xors 4, 1, sb200, sb2283, sb2285 # 2243
+xors 4, 1, sb990, sb200, sb201 # 2244
+xors 4, 1, sb195, sb2279, sb2281 # 2245
+xors 4, 1, sb285, sb195, sb197 # 2246
+xors 4, 1, sb188, sb2275, sb2277 # 2247
+xors 4, 1, sb988, sb188, sb191 # 2248
+xors 4, 1, sb182, sb2271, sb2273 # 2249
+xors 4, 1, sb282, sb182, sb184 # 2250
+xors 4, 1, sb178, sb2267, sb2269 # 2251
+xors 4, 1, sb986, sb178, sb181 # 2252
+xors 4, 1, sb175, sb2265, sb2266 # 2253
+xors 4, 1, sb280, sb175, sb177 # 2254
+xors 4, 1, sb171, sb2263, sb2264 # 2255
+xors 4, 1, sb984, sb171, sb174 # 2256
+xors 4, 1, sb163, sb2261, sb2262 # 2257
+xors 4, 1, sb278, sb163, sb165 # 2258
+xors 4, 1, sb158, sb2259, sb2260 # 2259
+xors 4, 1, sb982, sb158, sb159 # 2260
+xors 4, 1, sb152, sb2257, sb2258 # 2261
+xors 4, 1, sb275, sb152, sb154 # 2262
+xors 4, 1, sb147, sb2255, sb2256 # 2263
+xors 4, 1, sb533, sb147, sb150 # 2264
+xors 4, 1, sb141, sb2253, sb2254 # 2265
+xors 4, 1, sb300, sb141, sb146 # 2266
+xors 4, 1, sb53, sb2249, sb2251 # 2267
+xors 4, 1, sb137, sb2245, sb2247 # 2268
+xors 4, 1, sb302, sb137, sb2243 # 2269
+xors 4, 1, sb565, sb2239, sb2241 # 2270
+xors 4, 1, sb1017, sb565, sb2237 # 2271
+xors 4, 1, sb124, sb2233, sb2235 # 2272
+xors 4, 1, sb68, sb124, sb2231 # 2273
+xors 4, 1, sb304, sb124, sb2231 # 2274
+nots 1, sb2229, sb304 # 2275
+xors 4, 1, sb555, sb2229, sb68 # 2276
+nots 1, sb306, sb124 # 2277
+xors 4, 1, sb12, sb2225, sb2227 # 2278
+xors 4, 1, sb1019, sb12, sb2223 # 2279
+xors 4, 1, sb1021, sb12, sb2223 # 2280
+xors 4, 1, sb313, sb2219, sb2221 # 2281
+xors 4, 1, sb551, sb313, sb2217 # 2282
+xors 4, 1, sb553, sb313, sb2217 # 2283
+xors 4, 1, sb15, sb2213, sb2215 # 2284
+xors 4, 1, sb309, sb15, sb2211 # 2285
+xors 4, 1, sb311, sb15, sb2211 # 2286
+xors 4, 1, sb110, sb2207, sb2209 # 2287
+xors 4, 1, sb189, sb110, sb2205 # 2288
+xors 4, 1, sb308, sb110, sb2205 # 2289
+nots 1, sb2203, sb308 # 2290
+xors 4, 1, sb238, sb2203, sb189 # 2291
+nots 1, sb312, sb110 # 2292
+xors 4, 1, sb561, sb2199, sb2201 # 2293
+xors 4, 1, sb1023, sb561, sb2197 # 2294
+xors 4, 1, sb1025, sb561, sb2197 # 2295
+xors 4, 1, sb319, sb2194, sb2195 # 2296
+xors 4, 1, sb558, sb319, sb2193 # 2297
+xors 4, 1, sb560, sb319, sb2193 # 2298
+xors 4, 1, sb187, sb2191, sb2192 # 2299
+xors 4, 1, sb314, sb187, sb2190 # 2300
+xors 4, 1, sb316, sb187, sb2190 # 2301
+xors 4, 1, sb34, sb2188, sb2189 # 2302
+xors 4, 1, sb75, sb34, sb2187 # 2303
+xors 4, 1, sb78, sb34, sb2187 # 2304
+xors 4, 1, sb72, sb2185, sb2186 # 2305
+xors 4, 1, sb25, sb72, sb2184 # 2306
+xors 4, 1, sb315, sb72, sb2184 # 2307
+nots 1, sb2183, sb315 # 2308
+xors 4, 1, sb161, sb2183, sb25 # 2309
+nots 1, sb317, sb72 # 2310
+xors 4, 1, sb109, sb2181, sb2182 # 2311
+xors 4, 1, sb1027, sb109, sb2180 # 2312
+xors 4, 1, sb1029, sb109, sb2180 # 2313
+xors 4, 1, sb41, sb2176, sb2178 # 2314
+xors 4, 1, sb562, sb41, sb2174 # 2315
+xors 4, 1, sb564, sb41, sb2174 # 2316
+xors 4, 1, sb257, sb2170, sb2172 # 2317
+xors 4, 1, sb318, sb257, sb2168 # 2318
+xors 4, 1, sb320, sb257, sb2168 # 2319
+xors 4, 1, sb21, sb2164, sb2166 # 2320
+xors 4, 1, sb83, sb21, sb2162 # 2321
+xors 4, 1, sb87, sb21, sb2162 # 2322
+xors 4, 1, sb9, sb2158, sb2160 # 2323
+xors 4, 1, sb244, sb9, sb2156 # 2324
+xors 4, 1, sb246, sb9, sb2156 # 2325
+xors 4, 1, sb44, sb2152, sb2154 # 2326
+xors 4, 1, sb49, sb44, sb2150 # 2327
+xors 4, 1, sb321, sb44, sb2150 # 2328
+nots 1, sb2148, sb321 # 2329
+xors 4, 1, sb180, sb2148, sb49 # 2330
+nots 1, sb323, sb44 # 2331
+xors 4, 1, sb569, sb2144, sb2146 # 2332
+xors 4, 1, sb1031, sb569, sb2142 # 2333
+xors 4, 1, sb1033, sb569, sb2142 # 2334
+xors 4, 1, sb325, sb2138, sb2140 # 2335
+xors 4, 1, sb566, sb325, sb2136 # 2336
+xors 4, 1, sb568, sb325, sb2136 # 2337
+xors 4, 1, sb102, sb2132, sb2134 # 2338
+xors 4, 1, sb322, sb102, sb2130 # 2339
+xors 4, 1, sb324, sb102, sb2130 # 2340
+xors 4, 1, sb11, sb2126, sb2128 # 2341
+xors 4, 1, sb91, sb11, sb2124 # 2342
+xors 4, 1, sb98, sb11, sb2124 # 2343
+xors 4, 1, sb103, sb2120, sb2122 # 2344
+xors 4, 1, sb248, sb103, sb2118 # 2345
+xors 4, 1, sb250, sb103, sb2118 # 2346
+xors 4, 1, sb50, sb2116, sb2117 # 2347
+xors 4, 1, sb190, sb50, sb2115 # 2348
+xors 4, 1, sb192, sb50, sb2115 # 2349
+xors 4, 1, sb30, sb2113, sb2114 # 2350
+xors 4, 1, sb51, sb30, sb2112 # 2351
+xors 4, 1, sb332, sb30, sb2112 # 2352
+nots 1, sb2111, sb332 # 2353
+xors 4, 1, sb164, sb2111, sb51 # 2354
+nots 1, sb334, sb30 # 2355
+xors 4, 1, sb166, sb2109, sb2110 # 2356
+xors 4, 1, sb1035, sb166, sb2108 # 2357
+xors 4, 1, sb1037, sb166, sb2108 # 2358
+xors 4, 1, sb167, sb2106, sb2107 # 2359
+xors 4, 1, sb570, sb167, sb2105 # 2360
+xors 4, 1, sb572, sb167, sb2105 # 2361
+xors 4, 1, sb168, sb2102, sb2104 # 2362
+xors 4, 1, sb326, sb168, sb2100 # 2363
+xors 4, 1, sb328, sb168, sb2100 # 2364
+xors 4, 1, sb2, sb2096, sb2098 # 2365
+xors 4, 1, sb105, sb2, sb2094 # 2366
+xors 4, 1, sb107, sb2, sb2094 # 2367
+xors 4, 1, sb56, sb2090, sb2092 # 2368
+xors 4, 1, sb252, sb56, sb2088 # 2369
+xors 4, 1, sb254, sb56, sb2088 # 2370
+xors 4, 1, sb92, sb2084, sb2086 # 2371
+xors 4, 1, sb194, sb92, sb2082 # 2372
+xors 4, 1, sb196, sb92, sb2082 # 2373
+xors 4, 1, sb2074, sb2078, sb2080 # 2374
+xors 4, 1, sb143, sb2074, sb2076 # 2375
+xors 4, 1, sb112, sb2074, sb2076 # 2376
+xors 4, 1, sb2070, sb46, sb2072 # 2377
+xors 4, 1, sb76, sb302, sb2070 # 2378
+xors 4, 1, sb303, sb2070, sb137 # 2379
+xors 4, 1, sb420, sb2066, sb2068 # 2380
+xors 4, 1, sb417, sb2062, sb2064 # 2381
+xors 4, 1, sb443, sb417, sb419 # 2382
+xors 4, 1, sb415, sb2058, sb2060 # 2383
+xors 4, 1, sb1065, sb415, sb416 # 2384
+xors 4, 1, sb411, sb2054, sb2056 # 2385
+xors 4, 1, sb442, sb411, sb413 # 2386
+xors 4, 1, sb408, sb2050, sb2052 # 2387
+xors 4, 1, sb1063, sb408, sb410 # 2388
+xors 4, 1, sb406, sb2046, sb2048 # 2389
+xors 4, 1, sb440, sb406, sb407 # 2390
+xors 4, 1, sb402, sb2043, sb2044 # 2391
+xors 4, 1, sb1061, sb402, sb404 # 2392
+xors 4, 1, sb399, sb2041, sb2042 # 2393
+xors 4, 1, sb438, sb399, sb401 # 2394
+xors 4, 1, sb395, sb2039, sb2040 # 2395
+xors 4, 1, sb1059, sb395, sb397 # 2396
+xors 4, 1, sb390, sb2037, sb2038 # 2397
+xors 4, 1, sb437, sb390, sb392 # 2398
+xors 4, 1, sb386, sb2035, sb2036 # 2399
+xors 4, 1, sb1057, sb386, sb388 # 2400
+xors 4, 1, sb384, sb2033, sb2034 # 2401
+xors 4, 1, sb435, sb384, sb385 # 2402
+xors 4, 1, sb381, sb2031, sb2032 # 2403
+xors 4, 1, sb1055, sb381, sb383 # 2404
+xors 4, 1, sb377, sb2029, sb2030 # 2405
+xors 4, 1, sb434, sb377, sb379 # 2406
+xors 4, 1, sb375, sb2025, sb2027 # 2407
+xors 4, 1, sb1053, sb375, sb376 # 2408
+xors 4, 1, sb372, sb2021, sb2023 # 2409
+xors 4, 1, sb433, sb372, sb373 # 2410
+xors 4, 1, sb369, sb2017, sb2019 # 2411
+xors 4, 1, sb1051, sb369, sb370 # 2412
+xors 4, 1, sb367, sb2013, sb2015 # 2413
+xors 4, 1, sb431, sb367, sb368 # 2414
+xors 4, 1, sb365, sb2009, sb2011 # 2415
+xors 4, 1, sb1049, sb365, sb366 # 2416
+xors 4, 1, sb361, sb2005, sb2007 # 2417
+xors 4, 1, sb428, sb361, sb363 # 2418
+xors 4, 1, sb359, sb2001, sb2003 # 2419
+xors 4, 1, sb1047, sb359, sb360 # 2420
+xors 4, 1, sb357, sb1997, sb1999 # 2421
+xors 4, 1, sb426, sb357, sb358 # 2422
+xors 4, 1, sb354, sb1993, sb1995 # 2423
+xors 4, 1, sb1045, sb354, sb356 # 2424
+xors 4, 1, sb350, sb1989, sb1991 # 2425
+xors 4, 1, sb425, sb350, sb352 # 2426
+xors 4, 1, sb346, sb1985, sb1987 # 2427
+xors 4, 1, sb1043, sb346, sb348 # 2428
+xors 4, 1, sb343, sb1981, sb1983 # 2429
+xors 4, 1, sb424, sb343, sb344 # 2430
+xors 4, 1, sb341, sb1977, sb1979 # 2431
+xors 4, 1, sb1041, sb341, sb342 # 2432
+xors 4, 1, sb339, sb1973, sb1975 # 2433
+xors 4, 1, sb422, sb339, sb340 # 2434
+xors 4, 1, sb336, sb1969, sb1971 # 2435
+xors 4, 1, sb1039, sb336, sb338 # 2436
+xors 4, 1, sb1965, sb1966, sb1967 # 2437
+xors 4, 1, sb62, sb1964, sb1965 # 2438
+xors 4, 1, sb526, sb1962, sb1963 # 2439
+xors 4, 1, sb524, sb1960, sb1961 # 2440
+xors 4, 1, sb554, sb524, sb525 # 2441
+xors 4, 1, sb522, sb1958, sb1959 # 2442
+xors 4, 1, sb1103, sb522, sb523 # 2443
+xors 4, 1, sb520, sb1956, sb1957 # 2444
+xors 4, 1, sb550, sb520, sb521 # 2445
+xors 4, 1, sb518, sb1954, sb1955 # 2446
+xors 4, 1, sb1101, sb518, sb519 # 2447
+xors 4, 1, sb516, sb1951, sb1953 # 2448
+xors 4, 1, sb549, sb516, sb517 # 2449
+xors 4, 1, sb514, sb1947, sb1949 # 2450
+xors 4, 1, sb1099, sb514, sb515 # 2451
+xors 4, 1, sb512, sb1943, sb1945 # 2452
+xors 4, 1, sb548, sb512, sb513 # 2453
+xors 4, 1, sb510, sb1939, sb1941 # 2454
+xors 4, 1, sb1097, sb510, sb511 # 2455
+xors 4, 1, sb508, sb1935, sb1937 # 2456
+xors 4, 1, sb547, sb508, sb509 # 2457
+xors 4, 1, sb505, sb1931, sb1933 # 2458
+xors 4, 1, sb1095, sb505, sb506 # 2459
+xors 4, 1, sb503, sb1927, sb1929 # 2460
+xors 4, 1, sb546, sb503, sb504 # 2461
+xors 4, 1, sb501, sb1923, sb1925 # 2462
+xors 4, 1, sb1093, sb501, sb502 # 2463
+xors 4, 1, sb499, sb1919, sb1921 # 2464
+xors 4, 1, sb543, sb499, sb500 # 2465
+xors 4, 1, sb497, sb1915, sb1917 # 2466
+xors 4, 1, sb1091, sb497, sb498 # 2467
+xors 4, 1, sb494, sb1911, sb1913 # 2468
+xors 4, 1, sb541, sb494, sb495 # 2469
+xors 4, 1, sb491, sb1907, sb1909 # 2470
+xors 4, 1, sb1089, sb491, sb492 # 2471
+xors 4, 1, sb487, sb1903, sb1905 # 2472
+xors 4, 1, sb539, sb487, sb489 # 2473
+xors 4, 1, sb485, sb1899, sb1901 # 2474
+xors 4, 1, sb1087, sb485, sb486 # 2475
+xors 4, 1, sb481, sb1895, sb1897 # 2476
+xors 4, 1, sb537, sb481, sb483 # 2477
+xors 4, 1, sb478, sb1893, sb1894 # 2478
+xors 4, 1, sb1085, sb478, sb479 # 2479
+xors 4, 1, sb475, sb1891, sb1892 # 2480
+xors 4, 1, sb535, sb475, sb476 # 2481
+xors 4, 1, sb473, sb1889, sb1890 # 2482
+xors 4, 1, sb1083, sb473, sb474 # 2483
+xors 4, 1, sb470, sb1887, sb1888 # 2484
+xors 4, 1, sb531, sb470, sb472 # 2485
+xors 4, 1, sb467, sb1885, sb1886 # 2486
+xors 4, 1, sb1081, sb467, sb469 # 2487
+xors 4, 1, sb463, sb1883, sb1884 # 2488
+xors 4, 1, sb530, sb463, sb466 # 2489
+xors 4, 1, sb460, sb1881, sb1882 # 2490
+xors 4, 1, sb1079, sb460, sb461 # 2491
+xors 4, 1, sb457, sb1878, sb1880 # 2492
+xors 4, 1, sb529, sb457, sb458 # 2493
+xors 4, 1, sb454, sb1874, sb1876 # 2494
+xors 4, 1, sb1077, sb454, sb456 # 2495
+xors 4, 1, sb451, sb1870, sb1872 # 2496
+xors 4, 1, sb528, sb451, sb452 # 2497
+xors 4, 1, sb448, sb1866, sb1868 # 2498
+xors 4, 1, sb1075, sb448, sb449 # 2499
+xors 4, 1, sb445, sb1862, sb1864 # 2500
+xors 4, 1, sb256, sb445, sb447 # 2501
+xors 4, 1, sb1856, sb1858, sb1860 # 2502
+xors 4, 1, sb63, sb1854, sb1856 # 2503
+xors 4, 1, sb608, sb1850, sb1852 # 2504
+xors 4, 1, sb606, sb1846, sb1848 # 2505
+xors 4, 1, sb620, sb606, sb607 # 2506
+xors 4, 1, sb604, sb1842, sb1844 # 2507
+xors 4, 1, sb1126, sb604, sb605 # 2508
+xors 4, 1, sb600, sb1838, sb1840 # 2509
+xors 4, 1, sb618, sb600, sb602 # 2510
+xors 4, 1, sb596, sb1834, sb1836 # 2511
+xors 4, 1, sb1124, sb596, sb598 # 2512
+xors 4, 1, sb592, sb1830, sb1832 # 2513
+xors 4, 1, sb617, sb592, sb594 # 2514
+xors 4, 1, sb589, sb1826, sb1828 # 2515
+xors 4, 1, sb1122, sb589, sb590 # 2516
+xors 4, 1, sb587, sb1822, sb1824 # 2517
+xors 4, 1, sb616, sb587, sb588 # 2518
+xors 4, 1, sb585, sb1818, sb1820 # 2519
+xors 4, 1, sb1120, sb585, sb586 # 2520
+xors 4, 1, sb581, sb1816, sb1817 # 2521
+xors 4, 1, sb615, sb581, sb583 # 2522
+xors 4, 1, sb577, sb1814, sb1815 # 2523
+xors 4, 1, sb1118, sb577, sb579 # 2524
+xors 4, 1, sb573, sb1812, sb1813 # 2525
+xors 4, 1, sb613, sb573, sb575 # 2526
+xors 4, 1, sb567, sb1810, sb1811 # 2527
+xors 4, 1, sb1116, sb567, sb571 # 2528
+xors 4, 1, sb559, sb1808, sb1809 # 2529
+xors 4, 1, sb611, sb559, sb563 # 2530
+xors 4, 1, sb556, sb1806, sb1807 # 2531
+xors 4, 1, sb1114, sb556, sb557 # 2532
+xors 4, 1, sb1802, sb1804, sb1805 # 2533
+xors 4, 1, sb65, sb1800, sb1802 # 2534
+xors 4, 1, sb839, sb1796, sb1798 # 2535
+xors 4, 1, sb832, sb1792, sb1794 # 2536
+xors 4, 1, sb888, sb832, sb837 # 2537
+xors 4, 1, sb830, sb1788, sb1790 # 2538
+xors 4, 1, sb1175, sb830, sb831 # 2539
+xors 4, 1, sb824, sb1784, sb1786 # 2540
+xors 4, 1, sb887, sb824, sb829 # 2541
+xors 4, 1, sb816, sb1780, sb1782 # 2542
+xors 4, 1, sb1173, sb816, sb820 # 2543
+xors 4, 1, sb812, sb1776, sb1778 # 2544
+xors 4, 1, sb886, sb812, sb813 # 2545
+xors 4, 1, sb810, sb1772, sb1774 # 2546
+xors 4, 1, sb1171, sb810, sb811 # 2547
+xors 4, 1, sb799, sb1768, sb1770 # 2548
+xors 4, 1, sb885, sb799, sb805 # 2549
+xors 4, 1, sb794, sb1764, sb1766 # 2550
+xors 4, 1, sb1169, sb794, sb795 # 2551
+xors 4, 1, sb792, sb1760, sb1762 # 2552
+xors 4, 1, sb884, sb792, sb793 # 2553
+xors 4, 1, sb790, sb1756, sb1758 # 2554
+xors 4, 1, sb1167, sb790, sb791 # 2555
+xors 4, 1, sb778, sb1752, sb1754 # 2556
+xors 4, 1, sb883, sb778, sb784 # 2557
+xors 4, 1, sb776, sb1748, sb1750 # 2558
+xors 4, 1, sb1165, sb776, sb777 # 2559
+xors 4, 1, sb774, sb1744, sb1746 # 2560
+xors 4, 1, sb875, sb774, sb775 # 2561
+xors 4, 1, sb761, sb1742, sb1743 # 2562
+xors 4, 1, sb1163, sb761, sb767 # 2563
+xors 4, 1, sb757, sb1740, sb1741 # 2564
+xors 4, 1, sb873, sb757, sb758 # 2565
+xors 4, 1, sb755, sb1738, sb1739 # 2566
+xors 4, 1, sb1161, sb755, sb756 # 2567
+xors 4, 1, sb744, sb1736, sb1737 # 2568
+xors 4, 1, sb868, sb744, sb750 # 2569
+xors 4, 1, sb738, sb1734, sb1735 # 2570
+xors 4, 1, sb1159, sb738, sb739 # 2571
+xors 4, 1, sb736, sb1732, sb1733 # 2572
+xors 4, 1, sb867, sb736, sb737 # 2573
+xors 4, 1, sb729, sb1730, sb1731 # 2574
+xors 4, 1, sb1157, sb729, sb733 # 2575
+xors 4, 1, sb723, sb1727, sb1729 # 2576
+xors 4, 1, sb866, sb723, sb725 # 2577
+xors 4, 1, sb720, sb1723, sb1725 # 2578
+xors 4, 1, sb1155, sb720, sb721 # 2579
+xors 4, 1, sb718, sb1719, sb1721 # 2580
+xors 4, 1, sb865, sb718, sb719 # 2581
+xors 4, 1, sb716, sb1717, sb1718 # 2582
+xors 4, 1, sb1153, sb716, sb717 # 2583
+xors 4, 1, sb704, sb1715, sb1716 # 2584
+xors 4, 1, sb864, sb704, sb710 # 2585
+xors 4, 1, sb702, sb1713, sb1714 # 2586
+xors 4, 1, sb1151, sb702, sb703 # 2587
+xors 4, 1, sb700, sb1711, sb1712 # 2588
+xors 4, 1, sb862, sb700, sb701 # 2589
+xors 4, 1, sb693, sb1709, sb1710 # 2590
+xors 4, 1, sb1149, sb693, sb697 # 2591
+xors 4, 1, sb685, sb1707, sb1708 # 2592
+xors 4, 1, sb860, sb685, sb689 # 2593
+xors 4, 1, sb683, sb1705, sb1706 # 2594
+xors 4, 1, sb1147, sb683, sb684 # 2595
+xors 4, 1, sb681, sb1703, sb1704 # 2596
+xors 4, 1, sb856, sb681, sb682 # 2597
+xors 4, 1, sb674, sb1701, sb1702 # 2598
+xors 4, 1, sb1145, sb674, sb678 # 2599
+xors 4, 1, sb666, sb1699, sb1700 # 2600
+xors 4, 1, sb851, sb666, sb670 # 2601
+xors 4, 1, sb664, sb1697, sb1698 # 2602
+xors 4, 1, sb1143, sb664, sb665 # 2603
+xors 4, 1, sb662, sb1695, sb1696 # 2604
+xors 4, 1, sb850, sb662, sb663 # 2605
+xors 4, 1, sb655, sb1693, sb1694 # 2606
+xors 4, 1, sb1141, sb655, sb659 # 2607
+xors 4, 1, sb647, sb1691, sb1692 # 2608
+xors 4, 1, sb849, sb647, sb651 # 2609
+xors 4, 1, sb645, sb1689, sb1690 # 2610
+xors 4, 1, sb1139, sb645, sb646 # 2611
+xors 4, 1, sb643, sb1687, sb1688 # 2612
+xors 4, 1, sb848, sb643, sb644 # 2613
+xors 4, 1, sb641, sb1685, sb1686 # 2614
+xors 4, 1, sb1137, sb641, sb642 # 2615
+xors 4, 1, sb638, sb1683, sb1684 # 2616
+xors 4, 1, sb845, sb638, sb640 # 2617
+xors 4, 1, sb634, sb1681, sb1682 # 2618
+xors 4, 1, sb1135, sb634, sb636 # 2619
+xors 4, 1, sb630, sb1679, sb1680 # 2620
+xors 4, 1, sb843, sb630, sb632 # 2621
+xors 4, 1, sb626, sb1677, sb1678 # 2622
+xors 4, 1, sb1133, sb626, sb628 # 2623
+xors 4, 1, sb622, sb1675, sb1676 # 2624
+xors 4, 1, sb619, sb622, sb624 # 2625
+xors 4, 1, sb1672, sb1673, sb1674 # 2626
+xors 4, 1, sb66, sb1671, sb1672 # 2627
+xors 4, 1, sb1727, sb1669, sb1670 # 2628
+xors 4, 1, sb1725, sb1667, sb1668 # 2629
+xors 4, 1, sb1743, sb1725, sb1726 # 2630
+xors 4, 1, sb1723, sb1665, sb1666 # 2631
+xors 4, 1, sb1218, sb1723, sb1724 # 2632
+xors 4, 1, sb1721, sb1663, sb1664 # 2633
+xors 4, 1, sb1742, sb1721, sb1722 # 2634
+xors 4, 1, sb1719, sb1661, sb1662 # 2635
+xors 4, 1, sb1216, sb1719, sb1720 # 2636
+xors 4, 1, sb130, sb1659, sb1660 # 2637
+xors 4, 1, sb1741, sb130, sb135 # 2638
+xors 4, 1, sb117, sb1657, sb1658 # 2639
+xors 4, 1, sb1214, sb117, sb122 # 2640
+xors 4, 1, sb101, sb1655, sb1656 # 2641
+xors 4, 1, sb1740, sb101, sb114 # 2642
+xors 4, 1, sb89, sb1653, sb1654 # 2643
+xors 4, 1, sb1212, sb89, sb97 # 2644
+xors 4, 1, sb64, sb1651, sb1652 # 2645
+xors 4, 1, sb1739, sb64, sb73 # 2646
+xors 4, 1, sb58, sb1649, sb1650 # 2647
+xors 4, 1, sb1210, sb58, sb60 # 2648
+xors 4, 1, sb47, sb1647, sb1648 # 2649
+xors 4, 1, sb1738, sb47, sb54 # 2650
+xors 4, 1, sb39, sb1645, sb1646 # 2651
+xors 4, 1, sb1208, sb39, sb43 # 2652
+xors 4, 1, sb29, sb1643, sb1644 # 2653
+xors 4, 1, sb1737, sb29, sb35 # 2654
+xors 4, 1, sb26, sb1641, sb1642 # 2655
+xors 4, 1, sb1206, sb26, sb28 # 2656
+xors 4, 1, sb20, sb1639, sb1640 # 2657
+xors 4, 1, sb1736, sb20, sb23 # 2658
+xors 4, 1, sb17, sb1637, sb1638 # 2659
+xors 4, 1, sb1204, sb17, sb19 # 2660
+xors 4, 1, sb14, sb1635, sb1636 # 2661
+xors 4, 1, sb1735, sb14, sb1038 # 2662
+xors 4, 1, sb1034, sb1633, sb1634 # 2663
+xors 4, 1, sb1202, sb1034, sb1036 # 2664
+xors 4, 1, sb7, sb1631, sb1632 # 2665
+xors 4, 1, sb1734, sb7, sb1032 # 2666
+xors 4, 1, sb5, sb1629, sb1630 # 2667
+xors 4, 1, sb1200, sb5, sb1030 # 2668
+xors 4, 1, sb3, sb1627, sb1628 # 2669
+xors 4, 1, sb1733, sb3, sb1028 # 2670
+xors 4, 1, sb1024, sb1625, sb1626 # 2671
+xors 4, 1, sb1198, sb1024, sb1026 # 2672
+xors 4, 1, sb1020, sb1623, sb1624 # 2673
+xors 4, 1, sb1732, sb1020, sb1022 # 2674
+xors 4, 1, sb955, sb1621, sb1622 # 2675
+xors 4, 1, sb1196, sb955, sb1018 # 2676
+xors 4, 1, sb931, sb1619, sb1620 # 2677
+xors 4, 1, sb1731, sb931, sb939 # 2678
+xors 4, 1, sb907, sb1617, sb1618 # 2679
+xors 4, 1, sb1194, sb907, sb908 # 2680
+xors 4, 1, sb905, sb1615, sb1616 # 2681
+xors 4, 1, sb1730, sb905, sb906 # 2682
+xors 4, 1, sb903, sb1613, sb1614 # 2683
+xors 4, 1, sb1192, sb903, sb904 # 2684
+xors 4, 1, sb900, sb1611, sb1612 # 2685
+xors 4, 1, sb1729, sb900, sb902 # 2686
+xors 4, 1, sb890, sb1609, sb1610 # 2687
+xors 4, 1, sb1190, sb890, sb894 # 2688
+xors 4, 1, sb1606, sb1607, sb1608 # 2689
+xors 4, 1, sb69, sb1605, sb1606 # 2690
+xors 4, 1, sb1802, sb1603, sb1604 # 2691
+xors 4, 1, sb1800, sb1601, sb1602 # 2692
+xors 4, 1, sb1817, sb1800, sb1801 # 2693
+xors 4, 1, sb1798, sb1599, sb1600 # 2694
+xors 4, 1, sb1255, sb1798, sb1799 # 2695
+xors 4, 1, sb1796, sb1597, sb1598 # 2696
+xors 4, 1, sb1816, sb1796, sb1797 # 2697
+xors 4, 1, sb1794, sb1595, sb1596 # 2698
+xors 4, 1, sb1253, sb1794, sb1795 # 2699
+xors 4, 1, sb1792, sb1593, sb1594 # 2700
+xors 4, 1, sb1815, sb1792, sb1793 # 2701
+xors 4, 1, sb1790, sb1591, sb1592 # 2702
+xors 4, 1, sb1251, sb1790, sb1791 # 2703
+xors 4, 1, sb1788, sb1589, sb1590 # 2704
+xors 4, 1, sb1814, sb1788, sb1789 # 2705
+xors 4, 1, sb1786, sb1587, sb1588 # 2706
+xors 4, 1, sb1249, sb1786, sb1787 # 2707
+xors 4, 1, sb1784, sb1585, sb1586 # 2708
+xors 4, 1, sb1813, sb1784, sb1785 # 2709
+xors 4, 1, sb1782, sb1583, sb1584 # 2710
+xors 4, 1, sb1247, sb1782, sb1783 # 2711
+xors 4, 1, sb1780, sb1581, sb1582 # 2712
+xors 4, 1, sb1812, sb1780, sb1781 # 2713
+xors 4, 1, sb1778, sb1579, sb1580 # 2714
+xors 4, 1, sb1245, sb1778, sb1779 # 2715
+xors 4, 1, sb1776, sb1577, sb1578 # 2716
+xors 4, 1, sb1811, sb1776, sb1777 # 2717
+xors 4, 1, sb1774, sb1575, sb1576 # 2718
+xors 4, 1, sb1243, sb1774, sb1775 # 2719
+xors 4, 1, sb1772, sb1573, sb1574 # 2720
+xors 4, 1, sb1810, sb1772, sb1773 # 2721
+xors 4, 1, sb1770, sb1571, sb1572 # 2722
+xors 4, 1, sb1241, sb1770, sb1771 # 2723
+xors 4, 1, sb1768, sb1569, sb1570 # 2724
+xors 4, 1, sb1809, sb1768, sb1769 # 2725
+xors 4, 1, sb1766, sb1567, sb1568 # 2726
+xors 4, 1, sb1239, sb1766, sb1767 # 2727
+xors 4, 1, sb1764, sb1565, sb1566 # 2728
+xors 4, 1, sb1808, sb1764, sb1765 # 2729
+xors 4, 1, sb1762, sb1563, sb1564 # 2730
+xors 4, 1, sb1237, sb1762, sb1763 # 2731
+xors 4, 1, sb1760, sb1561, sb1562 # 2732
+xors 4, 1, sb1807, sb1760, sb1761 # 2733
+xors 4, 1, sb1758, sb1559, sb1560 # 2734
+xors 4, 1, sb1235, sb1758, sb1759 # 2735
+xors 4, 1, sb1756, sb1557, sb1558 # 2736
+xors 4, 1, sb1806, sb1756, sb1757 # 2737
+xors 4, 1, sb1754, sb1555, sb1556 # 2738
+xors 4, 1, sb1233, sb1754, sb1755 # 2739
+xors 4, 1, sb1752, sb1553, sb1554 # 2740
+xors 4, 1, sb1805, sb1752, sb1753 # 2741
+xors 4, 1, sb1750, sb1551, sb1552 # 2742
+xors 4, 1, sb1231, sb1750, sb1751 # 2743
+xors 4, 1, sb1748, sb1549, sb1550 # 2744
+xors 4, 1, sb1804, sb1748, sb1749 # 2745
+xors 4, 1, sb1746, sb1547, sb1548 # 2746
+xors 4, 1, sb1229, sb1746, sb1747 # 2747
+xors 4, 1, sb1744, sb1545, sb1546 # 2748
+xors 4, 1, sb667, sb1744, sb1745 # 2749
+xors 4, 1, sb1542, sb1543, sb1544 # 2750
+xors 4, 1, sb71, sb1541, sb1542 # 2751
+xors 4, 1, sb1878, sb1539, sb1540 # 2752
+xors 4, 1, sb1876, sb1537, sb1538 # 2753
+xors 4, 1, sb1894, sb1876, sb1877 # 2754
+xors 4, 1, sb1874, sb1535, sb1536 # 2755
+xors 4, 1, sb1294, sb1874, sb1875 # 2756
+xors 4, 1, sb1872, sb1533, sb1534 # 2757
+xors 4, 1, sb1893, sb1872, sb1873 # 2758
+xors 4, 1, sb1870, sb1531, sb1532 # 2759
+xors 4, 1, sb1292, sb1870, sb1871 # 2760
+xors 4, 1, sb1868, sb1529, sb1530 # 2761
+xors 4, 1, sb1892, sb1868, sb1869 # 2762
+xors 4, 1, sb1866, sb1527, sb1528 # 2763
+xors 4, 1, sb1290, sb1866, sb1867 # 2764
+xors 4, 1, sb1864, sb1525, sb1526 # 2765
+xors 4, 1, sb1891, sb1864, sb1865 # 2766
+xors 4, 1, sb1862, sb1523, sb1524 # 2767
+xors 4, 1, sb1288, sb1862, sb1863 # 2768
+xors 4, 1, sb1860, sb1521, sb1522 # 2769
+xors 4, 1, sb1890, sb1860, sb1861 # 2770
+xors 4, 1, sb1858, sb1519, sb1520 # 2771
+xors 4, 1, sb1286, sb1858, sb1859 # 2772
+xors 4, 1, sb1856, sb1517, sb1518 # 2773
+xors 4, 1, sb1889, sb1856, sb1857 # 2774
+xors 4, 1, sb1854, sb1515, sb1516 # 2775
+xors 4, 1, sb1284, sb1854, sb1855 # 2776
+xors 4, 1, sb1852, sb1513, sb1514 # 2777
+xors 4, 1, sb1888, sb1852, sb1853 # 2778
+xors 4, 1, sb1850, sb1511, sb1512 # 2779
+xors 4, 1, sb1282, sb1850, sb1851 # 2780
+xors 4, 1, sb1848, sb1509, sb1510 # 2781
+xors 4, 1, sb1887, sb1848, sb1849 # 2782
+xors 4, 1, sb1846, sb1507, sb1508 # 2783
+xors 4, 1, sb1280, sb1846, sb1847 # 2784
+xors 4, 1, sb1844, sb1505, sb1506 # 2785
+xors 4, 1, sb1886, sb1844, sb1845 # 2786
+xors 4, 1, sb1842, sb1503, sb1504 # 2787
+xors 4, 1, sb1278, sb1842, sb1843 # 2788
+xors 4, 1, sb1840, sb1501, sb1502 # 2789
+xors 4, 1, sb1885, sb1840, sb1841 # 2790
+xors 4, 1, sb1838, sb1499, sb1500 # 2791
+xors 4, 1, sb1276, sb1838, sb1839 # 2792
+xors 4, 1, sb1836, sb1497, sb1498 # 2793
+xors 4, 1, sb1884, sb1836, sb1837 # 2794
+xors 4, 1, sb1834, sb1495, sb1496 # 2795
+xors 4, 1, sb1274, sb1834, sb1835 # 2796
+xors 4, 1, sb1832, sb1493, sb1494 # 2797
+xors 4, 1, sb1883, sb1832, sb1833 # 2798
+xors 4, 1, sb1830, sb1491, sb1492 # 2799
+xors 4, 1, sb1272, sb1830, sb1831 # 2800
+xors 4, 1, sb1828, sb1489, sb1490 # 2801
+xors 4, 1, sb1882, sb1828, sb1829 # 2802
+xors 4, 1, sb1826, sb1487, sb1488 # 2803
+xors 4, 1, sb1270, sb1826, sb1827 # 2804
+xors 4, 1, sb1824, sb1485, sb1486 # 2805
+xors 4, 1, sb1881, sb1824, sb1825 # 2806
+xors 4, 1, sb1822, sb1483, sb1484 # 2807
+xors 4, 1, sb1268, sb1822, sb1823 # 2808
+xors 4, 1, sb1820, sb1481, sb1482 # 2809
+xors 4, 1, sb1880, sb1820, sb1821 # 2810
+xors 4, 1, sb1818, sb1479, sb1480 # 2811
+xors 4, 1, sb1266, sb1818, sb1819 # 2812
+xors 4, 1, sb1476, sb1477, sb1478 # 2813
+xors 4, 1, sb74, sb1475, sb1476 # 2814
+xors 4, 1, sb1951, sb1473, sb1474 # 2815
+xors 4, 1, sb1949, sb1471, sb1472 # 2816
+xors 4, 1, sb1966, sb1949, sb1950 # 2817
+xors 4, 1, sb1947, sb1469, sb1470 # 2818
+xors 4, 1, sb1331, sb1947, sb1948 # 2819
+xors 4, 1, sb1945, sb1467, sb1468 # 2820
+xors 4, 1, sb1965, sb1945, sb1946 # 2821
+xors 4, 1, sb1943, sb1465, sb1466 # 2822
+xors 4, 1, sb1329, sb1943, sb1944 # 2823
+xors 4, 1, sb1941, sb1463, sb1464 # 2824
+xors 4, 1, sb1964, sb1941, sb1942 # 2825
+xors 4, 1, sb1939, sb1461, sb1462 # 2826
+xors 4, 1, sb1327, sb1939, sb1940 # 2827
+xors 4, 1, sb1937, sb1459, sb1460 # 2828
+xors 4, 1, sb1963, sb1937, sb1938 # 2829
+xors 4, 1, sb1935, sb1457, sb1458 # 2830
+xors 4, 1, sb1325, sb1935, sb1936 # 2831
+xors 4, 1, sb1933, sb1455, sb1456 # 2832
+xors 4, 1, sb1962, sb1933, sb1934 # 2833
+xors 4, 1, sb1931, sb1453, sb1454 # 2834
+xors 4, 1, sb1323, sb1931, sb1932 # 2835
+xors 4, 1, sb1929, sb1451, sb1452 # 2836
+xors 4, 1, sb1961, sb1929, sb1930 # 2837
+xors 4, 1, sb1927, sb1449, sb1450 # 2838
+xors 4, 1, sb1321, sb1927, sb1928 # 2839
+xors 4, 1, sb1925, sb1447, sb1448 # 2840
+xors 4, 1, sb1960, sb1925, sb1926 # 2841
+xors 4, 1, sb1923, sb1445, sb1446 # 2842
+xors 4, 1, sb1319, sb1923, sb1924 # 2843
+xors 4, 1, sb1921, sb1443, sb1444 # 2844
+xors 4, 1, sb1959, sb1921, sb1922 # 2845
+xors 4, 1, sb1919, sb1441, sb1442 # 2846
+xors 4, 1, sb1317, sb1919, sb1920 # 2847
+xors 4, 1, sb1917, sb1439, sb1440 # 2848
+xors 4, 1, sb1958, sb1917, sb1918 # 2849
+xors 4, 1, sb1915, sb1437, sb1438 # 2850
+xors 4, 1, sb1315, sb1915, sb1916 # 2851
+xors 4, 1, sb1913, sb1435, sb1436 # 2852
+xors 4, 1, sb1957, sb1913, sb1914 # 2853
+xors 4, 1, sb1911, sb1433, sb1434 # 2854
+xors 4, 1, sb1313, sb1911, sb1912 # 2855
+xors 4, 1, sb1909, sb1431, sb1432 # 2856
+xors 4, 1, sb1956, sb1909, sb1910 # 2857
+xors 4, 1, sb1907, sb1429, sb1430 # 2858
+xors 4, 1, sb1311, sb1907, sb1908 # 2859
+xors 4, 1, sb1905, sb1427, sb1428 # 2860
+xors 4, 1, sb1955, sb1905, sb1906 # 2861
+xors 4, 1, sb1903, sb1425, sb1426 # 2862
+xors 4, 1, sb1309, sb1903, sb1904 # 2863
+xors 4, 1, sb1901, sb1423, sb1424 # 2864
+xors 4, 1, sb1954, sb1901, sb1902 # 2865
+xors 4, 1, sb1899, sb1421, sb1422 # 2866
+xors 4, 1, sb1307, sb1899, sb1900 # 2867
+xors 4, 1, sb1897, sb1419, sb1420 # 2868
+xors 4, 1, sb1953, sb1897, sb1898 # 2869
+xors 4, 1, sb1895, sb1417, sb1418 # 2870
+xors 4, 1, sb1305, sb1895, sb1896 # 2871
+xors 4, 1, sb1414, sb1415, sb1416 # 2872
+xors 4, 1, sb77, sb1413, sb1414 # 2873
+xors 4, 1, sb2027, sb1411, sb1412 # 2874
+xors 4, 1, sb2025, sb1409, sb1410 # 2875
+xors 4, 1, sb2043, sb2025, sb2026 # 2876
+xors 4, 1, sb2023, sb1407, sb1408 # 2877
+xors 4, 1, sb1369, sb2023, sb2024 # 2878
+xors 4, 1, sb2021, sb1405, sb1406 # 2879
+xors 4, 1, sb2042, sb2021, sb2022 # 2880
+xors 4, 1, sb2019, sb1403, sb1404 # 2881
+xors 4, 1, sb1367, sb2019, sb2020 # 2882
+xors 4, 1, sb2017, sb1401, sb1402 # 2883
+xors 4, 1, sb2041, sb2017, sb2018 # 2884
+xors 4, 1, sb2015, sb1399, sb1400 # 2885
+xors 4, 1, sb1365, sb2015, sb2016 # 2886
+xors 4, 1, sb2013, sb1397, sb1398 # 2887
+xors 4, 1, sb2040, sb2013, sb2014 # 2888
+xors 4, 1, sb2011, sb1395, sb1396 # 2889
+xors 4, 1, sb1363, sb2011, sb2012 # 2890
+xors 4, 1, sb2009, sb1393, sb1394 # 2891
+xors 4, 1, sb2039, sb2009, sb2010 # 2892
+xors 4, 1, sb2007, sb1391, sb1392 # 2893
+xors 4, 1, sb1361, sb2007, sb2008 # 2894
+xors 4, 1, sb2005, sb1389, sb1390 # 2895
+xors 4, 1, sb2038, sb2005, sb2006 # 2896
+xors 4, 1, sb2003, sb1387, sb1388 # 2897
+xors 4, 1, sb1359, sb2003, sb2004 # 2898
+xors 4, 1, sb2001, sb1385, sb1386 # 2899
+xors 4, 1, sb2037, sb2001, sb2002 # 2900
+xors 4, 1, sb1999, sb1383, sb1384 # 2901
+xors 4, 1, sb1357, sb1999, sb2000 # 2902
+xors 4, 1, sb1997, sb1381, sb1382 # 2903
+xors 4, 1, sb2036, sb1997, sb1998 # 2904
+xors 4, 1, sb1995, sb1379, sb1380 # 2905
+xors 4, 1, sb1355, sb1995, sb1996 # 2906
+xors 4, 1, sb1993, sb1377, sb1378 # 2907
+xors 4, 1, sb2035, sb1993, sb1994 # 2908
+xors 4, 1, sb1991, sb1375, sb1376 # 2909
+xors 4, 1, sb1353, sb1991, sb1992 # 2910
+xors 4, 1, sb1989, sb1373, sb1374 # 2911
+xors 4, 1, sb2034, sb1989, sb1990 # 2912
+xors 4, 1, sb1987, sb1371, sb1372 # 2913
+xors 4, 1, sb1351, sb1987, sb1988 # 2914
+xors 4, 1, sb1985, sb1368, sb1370 # 2915
+xors 4, 1, sb2033, sb1985, sb1986 # 2916
+xors 4, 1, sb1983, sb1364, sb1366 # 2917
+xors 4, 1, sb1349, sb1983, sb1984 # 2918
+xors 4, 1, sb1981, sb1360, sb1362 # 2919
+xors 4, 1, sb2032, sb1981, sb1982 # 2920
+xors 4, 1, sb1979, sb1356, sb1358 # 2921
+xors 4, 1, sb1347, sb1979, sb1980 # 2922
+xors 4, 1, sb1977, sb1352, sb1354 # 2923
+xors 4, 1, sb2031, sb1977, sb1978 # 2924
+xors 4, 1, sb1975, sb1348, sb1350 # 2925
+xors 4, 1, sb1345, sb1975, sb1976 # 2926
+xors 4, 1, sb1973, sb1344, sb1346 # 2927
+xors 4, 1, sb2030, sb1973, sb1974 # 2928
+xors 4, 1, sb1971, sb1342, sb1343 # 2929
+xors 4, 1, sb1343, sb1971, sb1972 # 2930
+xors 4, 1, sb1969, sb1340, sb1341 # 2931
+xors 4, 1, sb2029, sb1969, sb1970 # 2932
+xors 4, 1, sb1967, sb1338, sb1339 # 2933
+xors 4, 1, sb1341, sb1967, sb1968 # 2934
+xors 4, 1, sb1335, sb1336, sb1337 # 2935
+xors 4, 1, sb79, sb1334, sb1335 # 2936
+xors 4, 1, sb2102, sb1332, sb1333 # 2937
+xors 4, 1, sb2100, sb1328, sb1330 # 2938
+xors 4, 1, sb2117, sb2100, sb2101 # 2939
+xors 4, 1, sb2098, sb1324, sb1326 # 2940
+xors 4, 1, sb1406, sb2098, sb2099 # 2941
+xors 4, 1, sb2096, sb1320, sb1322 # 2942
+xors 4, 1, sb2116, sb2096, sb2097 # 2943
+xors 4, 1, sb2094, sb1316, sb1318 # 2944
+xors 4, 1, sb1404, sb2094, sb2095 # 2945
+xors 4, 1, sb2092, sb1312, sb1314 # 2946
+xors 4, 1, sb2115, sb2092, sb2093 # 2947
+xors 4, 1, sb2090, sb1308, sb1310 # 2948
+xors 4, 1, sb1402, sb2090, sb2091 # 2949
+xors 4, 1, sb2088, sb1304, sb1306 # 2950
+xors 4, 1, sb2114, sb2088, sb2089 # 2951
+xors 4, 1, sb2086, sb1302, sb1303 # 2952
+xors 4, 1, sb1400, sb2086, sb2087 # 2953
+xors 4, 1, sb2084, sb1300, sb1301 # 2954
+xors 4, 1, sb2113, sb2084, sb2085 # 2955
+xors 4, 1, sb2082, sb1298, sb1299 # 2956
+xors 4, 1, sb1398, sb2082, sb2083 # 2957
+xors 4, 1, sb2080, sb1296, sb1297 # 2958
+xors 4, 1, sb2112, sb2080, sb2081 # 2959
+xors 4, 1, sb2078, sb1293, sb1295 # 2960
+xors 4, 1, sb1396, sb2078, sb2079 # 2961
+xors 4, 1, sb2076, sb1289, sb1291 # 2962
+xors 4, 1, sb2111, sb2076, sb2077 # 2963
+xors 4, 1, sb2074, sb1285, sb1287 # 2964
+xors 4, 1, sb1394, sb2074, sb2075 # 2965
+xors 4, 1, sb2072, sb1281, sb1283 # 2966
+xors 4, 1, sb2110, sb2072, sb2073 # 2967
+xors 4, 1, sb2070, sb1277, sb1279 # 2968
+xors 4, 1, sb1392, sb2070, sb2071 # 2969
+xors 4, 1, sb2068, sb1273, sb1275 # 2970
+xors 4, 1, sb2109, sb2068, sb2069 # 2971
+xors 4, 1, sb2066, sb1269, sb1271 # 2972
+xors 4, 1, sb1390, sb2066, sb2067 # 2973
+xors 4, 1, sb2064, sb1265, sb1267 # 2974
+xors 4, 1, sb2108, sb2064, sb2065 # 2975
+xors 4, 1, sb2062, sb1263, sb1264 # 2976
+xors 4, 1, sb1388, sb2062, sb2063 # 2977
+xors 4, 1, sb2060, sb1261, sb1262 # 2978
+xors 4, 1, sb2107, sb2060, sb2061 # 2979
+xors 4, 1, sb2058, sb1259, sb1260 # 2980
+xors 4, 1, sb1386, sb2058, sb2059 # 2981
+xors 4, 1, sb2056, sb1257, sb1258 # 2982
+xors 4, 1, sb2106, sb2056, sb2057 # 2983
+xors 4, 1, sb2054, sb1254, sb1256 # 2984
+xors 4, 1, sb1384, sb2054, sb2055 # 2985
+xors 4, 1, sb2052, sb1250, sb1252 # 2986
+xors 4, 1, sb2105, sb2052, sb2053 # 2987
+xors 4, 1, sb2050, sb1246, sb1248 # 2988
+xors 4, 1, sb1382, sb2050, sb2051 # 2989
+xors 4, 1, sb2048, sb1242, sb1244 # 2990
+xors 4, 1, sb2104, sb2048, sb2049 # 2991
+xors 4, 1, sb2046, sb1238, sb1240 # 2992
+xors 4, 1, sb1380, sb2046, sb2047 # 2993
+xors 4, 1, sb2044, sb1234, sb1236 # 2994
+xors 4, 1, sb741, sb2044, sb2045 # 2995
+xors 4, 1, sb1228, sb1230, sb1232 # 2996
+xors 4, 1, sb82, sb1227, sb1228 # 2997
+xors 4, 1, sb2178, sb1225, sb1226 # 2998
+xors 4, 1, sb2176, sb1223, sb1224 # 2999
+xors 4, 1, sb2194, sb2176, sb2177 # 3000
+xors 4, 1, sb2174, sb1221, sb1222 # 3001
+xors 4, 1, sb1445, sb2174, sb2175 # 3002
+xors 4, 1, sb2172, sb1219, sb1220 # 3003
+xors 4, 1, sb2193, sb2172, sb2173 # 3004
+xors 4, 1, sb2170, sb1215, sb1217 # 3005
+xors 4, 1, sb1443, sb2170, sb2171 # 3006
+xors 4, 1, sb2168, sb1211, sb1213 # 3007
+xors 4, 1, sb2192, sb2168, sb2169 # 3008
+xors 4, 1, sb2166, sb1207, sb1209 # 3009
+xors 4, 1, sb1441, sb2166, sb2167 # 3010
+xors 4, 1, sb2164, sb1203, sb1205 # 3011
+xors 4, 1, sb2191, sb2164, sb2165 # 3012
+xors 4, 1, sb2162, sb1199, sb1201 # 3013
+xors 4, 1, sb1439, sb2162, sb2163 # 3014
+xors 4, 1, sb2160, sb1195, sb1197 # 3015
+xors 4, 1, sb2190, sb2160, sb2161 # 3016
+xors 4, 1, sb2158, sb1191, sb1193 # 3017
+xors 4, 1, sb1437, sb2158, sb2159 # 3018
+xors 4, 1, sb2156, sb1188, sb1189 # 3019
+xors 4, 1, sb2189, sb2156, sb2157 # 3020
+xors 4, 1, sb2154, sb1186, sb1187 # 3021
+xors 4, 1, sb1435, sb2154, sb2155 # 3022
+xors 4, 1, sb2152, sb1184, sb1185 # 3023
+xors 4, 1, sb2188, sb2152, sb2153 # 3024
+xors 4, 1, sb2150, sb1182, sb1183 # 3025
+xors 4, 1, sb1433, sb2150, sb2151 # 3026
+xors 4, 1, sb2148, sb1180, sb1181 # 3027
+xors 4, 1, sb2187, sb2148, sb2149 # 3028
+xors 4, 1, sb2146, sb1178, sb1179 # 3029
+xors 4, 1, sb1431, sb2146, sb2147 # 3030
+xors 4, 1, sb2144, sb1176, sb1177 # 3031
+xors 4, 1, sb2186, sb2144, sb2145 # 3032
+xors 4, 1, sb2142, sb1172, sb1174 # 3033
+xors 4, 1, sb1429, sb2142, sb2143 # 3034
+xors 4, 1, sb2140, sb1168, sb1170 # 3035
+xors 4, 1, sb2185, sb2140, sb2141 # 3036
+xors 4, 1, sb2138, sb1164, sb1166 # 3037
+xors 4, 1, sb1427, sb2138, sb2139 # 3038
+xors 4, 1, sb2136, sb1160, sb1162 # 3039
+xors 4, 1, sb2184, sb2136, sb2137 # 3040
+xors 4, 1, sb2134, sb1156, sb1158 # 3041
+xors 4, 1, sb1425, sb2134, sb2135 # 3042
+xors 4, 1, sb2132, sb1152, sb1154 # 3043
+xors 4, 1, sb2183, sb2132, sb2133 # 3044
+xors 4, 1, sb2130, sb1148, sb1150 # 3045
+xors 4, 1, sb1423, sb2130, sb2131 # 3046
+xors 4, 1, sb2128, sb1144, sb1146 # 3047
+xors 4, 1, sb2182, sb2128, sb2129 # 3048
+xors 4, 1, sb2126, sb1140, sb1142 # 3049
+xors 4, 1, sb1421, sb2126, sb2127 # 3050
+xors 4, 1, sb2124, sb1136, sb1138 # 3051
+xors 4, 1, sb2181, sb2124, sb2125 # 3052
+xors 4, 1, sb2122, sb1132, sb1134 # 3053
+xors 4, 1, sb1419, sb2122, sb2123 # 3054
+xors 4, 1, sb2120, sb1130, sb1131 # 3055
+xors 4, 1, sb2180, sb2120, sb2121 # 3056
+xors 4, 1, sb2118, sb1128, sb1129 # 3057
+xors 4, 1, sb1417, sb2118, sb2119 # 3058
+xors 4, 1, sb1123, sb1125, sb1127 # 3059
+xors 4, 1, sb84, sb1121, sb1123 # 3060
+xors 4, 1, sb2251, sb1117, sb1119 # 3061
+xors 4, 1, sb2249, sb1113, sb1115 # 3062
+xors 4, 1, sb2266, sb2249, sb2250 # 3063
+xors 4, 1, sb2247, sb1111, sb1112 # 3064
+xors 4, 1, sb1482, sb2247, sb2248 # 3065
+xors 4, 1, sb2245, sb1109, sb1110 # 3066
+xors 4, 1, sb2265, sb2245, sb2246 # 3067
+xors 4, 1, sb2243, sb1107, sb1108 # 3068
+xors 4, 1, sb1480, sb2243, sb2244 # 3069
+xors 4, 1, sb2241, sb1105, sb1106 # 3070
+xors 4, 1, sb2264, sb2241, sb2242 # 3071
+xors 4, 1, sb2239, sb1102, sb1104 # 3072
+xors 4, 1, sb1478, sb2239, sb2240 # 3073
+xors 4, 1, sb2237, sb1098, sb1100 # 3074
+xors 4, 1, sb2263, sb2237, sb2238 # 3075
+xors 4, 1, sb2235, sb1094, sb1096 # 3076
+xors 4, 1, sb1476, sb2235, sb2236 # 3077
+xors 4, 1, sb2233, sb1090, sb1092 # 3078
+xors 4, 1, sb2262, sb2233, sb2234 # 3079
+xors 4, 1, sb2231, sb1086, sb1088 # 3080
+xors 4, 1, sb1474, sb2231, sb2232 # 3081
+xors 4, 1, sb2229, sb1082, sb1084 # 3082
+xors 4, 1, sb2261, sb2229, sb2230 # 3083
+xors 4, 1, sb2227, sb1078, sb1080 # 3084
+xors 4, 1, sb1472, sb2227, sb2228 # 3085
+xors 4, 1, sb2225, sb1074, sb1076 # 3086
+xors 4, 1, sb2260, sb2225, sb2226 # 3087
+xors 4, 1, sb2223, sb1072, sb1073 # 3088
+xors 4, 1, sb1470, sb2223, sb2224 # 3089
+xors 4, 1, sb2221, sb1070, sb1071 # 3090
+xors 4, 1, sb2259, sb2221, sb2222 # 3091
+xors 4, 1, sb2219, sb1068, sb1069 # 3092
+xors 4, 1, sb1468, sb2219, sb2220 # 3093
+xors 4, 1, sb2217, sb1066, sb1067 # 3094
+xors 4, 1, sb2258, sb2217, sb2218 # 3095
+xors 4, 1, sb2215, sb1062, sb1064 # 3096
+xors 4, 1, sb1466, sb2215, sb2216 # 3097
+xors 4, 1, sb2213, sb1058, sb1060 # 3098
+xors 4, 1, sb2257, sb2213, sb2214 # 3099
+xors 4, 1, sb2211, sb1054, sb1056 # 3100
+xors 4, 1, sb1464, sb2211, sb2212 # 3101
+xors 4, 1, sb2209, sb1050, sb1052 # 3102
+xors 4, 1, sb2256, sb2209, sb2210 # 3103
+xors 4, 1, sb2207, sb1046, sb1048 # 3104
+xors 4, 1, sb1462, sb2207, sb2208 # 3105
+xors 4, 1, sb2205, sb1042, sb1044 # 3106
+xors 4, 1, sb2255, sb2205, sb2206 # 3107
+xors 4, 1, sb2203, sb1016, sb1040 # 3108
+xors 4, 1, sb1460, sb2203, sb2204 # 3109
+xors 4, 1, sb2201, sb1014, sb1015 # 3110
+xors 4, 1, sb2254, sb2201, sb2202 # 3111
+xors 4, 1, sb2199, sb1012, sb1013 # 3112
+xors 4, 1, sb1458, sb2199, sb2200 # 3113
+xors 4, 1, sb2197, sb1010, sb1011 # 3114
+xors 4, 1, sb2253, sb2197, sb2198 # 3115
+xors 4, 1, sb2195, sb1008, sb1009 # 3116
+xors 4, 1, sb1456, sb2195, sb2196 # 3117
+xors 4, 1, sb1003, sb1005, sb1007 # 3118
+xors 4, 1, sb86, sb1001, sb1003 # 3119
+xors 4, 1, sb2327, sb997, sb999 # 3120
+xors 4, 1, sb2325, sb993, sb995 # 3121
+xors 4, 1, sb2343, sb2325, sb2326 # 3122
+xors 4, 1, sb2323, sb989, sb991 # 3123
+xors 4, 1, sb1520, sb2323, sb2324 # 3124
+xors 4, 1, sb2321, sb985, sb987 # 3125
+xors 4, 1, sb2342, sb2321, sb2322 # 3126
+xors 4, 1, sb2319, sb981, sb983 # 3127
+xors 4, 1, sb1518, sb2319, sb2320 # 3128
+xors 4, 1, sb2317, sb979, sb980 # 3129
+xors 4, 1, sb2341, sb2317, sb2318 # 3130
+xors 4, 1, sb2315, sb977, sb978 # 3131
+xors 4, 1, sb1516, sb2315, sb2316 # 3132
+xors 4, 1, sb2313, sb975, sb976 # 3133
+xors 4, 1, sb2340, sb2313, sb2314 # 3134
+xors 4, 1, sb2311, sb973, sb974 # 3135
+xors 4, 1, sb1514, sb2311, sb2312 # 3136
+xors 4, 1, sb2309, sb971, sb972 # 3137
+xors 4, 1, sb2339, sb2309, sb2310 # 3138
+xors 4, 1, sb2307, sb969, sb970 # 3139
+xors 4, 1, sb1512, sb2307, sb2308 # 3140
+xors 4, 1, sb2305, sb967, sb968 # 3141
+xors 4, 1, sb2338, sb2305, sb2306 # 3142
+xors 4, 1, sb2303, sb965, sb966 # 3143
+xors 4, 1, sb1510, sb2303, sb2304 # 3144
+xors 4, 1, sb2301, sb963, sb964 # 3145
+xors 4, 1, sb2337, sb2301, sb2302 # 3146
+xors 4, 1, sb2299, sb961, sb962 # 3147
+xors 4, 1, sb1508, sb2299, sb2300 # 3148
+xors 4, 1, sb2297, sb959, sb960 # 3149
+xors 4, 1, sb2336, sb2297, sb2298 # 3150
+xors 4, 1, sb2295, sb957, sb958 # 3151
+xors 4, 1, sb1506, sb2295, sb2296 # 3152
+xors 4, 1, sb2293, sb954, sb956 # 3153
+xors 4, 1, sb2335, sb2293, sb2294 # 3154
+xors 4, 1, sb2291, sb952, sb953 # 3155
+xors 4, 1, sb1504, sb2291, sb2292 # 3156
+xors 4, 1, sb2289, sb950, sb951 # 3157
+xors 4, 1, sb2334, sb2289, sb2290 # 3158
+xors 4, 1, sb2287, sb948, sb949 # 3159
+xors 4, 1, sb1502, sb2287, sb2288 # 3160
+xors 4, 1, sb2285, sb946, sb947 # 3161
+xors 4, 1, sb2333, sb2285, sb2286 # 3162
+xors 4, 1, sb2283, sb944, sb945 # 3163
+xors 4, 1, sb1500, sb2283, sb2284 # 3164
+xors 4, 1, sb2281, sb942, sb943 # 3165
+xors 4, 1, sb2332, sb2281, sb2282 # 3166
+xors 4, 1, sb2279, sb940, sb941 # 3167
+xors 4, 1, sb1498, sb2279, sb2280 # 3168
+xors 4, 1, sb2277, sb937, sb938 # 3169
+xors 4, 1, sb2331, sb2277, sb2278 # 3170
+xors 4, 1, sb2275, sb935, sb936 # 3171
+xors 4, 1, sb1496, sb2275, sb2276 # 3172
+xors 4, 1, sb2273, sb933, sb934 # 3173
+xors 4, 1, sb2330, sb2273, sb2274 # 3174
+xors 4, 1, sb2271, sb930, sb932 # 3175
+xors 4, 1, sb1494, sb2271, sb2272 # 3176
+xors 4, 1, sb2269, sb928, sb929 # 3177
+xors 4, 1, sb2329, sb2269, sb2270 # 3178
+xors 4, 1, sb2267, sb926, sb927 # 3179
+xors 4, 1, sb1492, sb2267, sb2268 # 3180
+xors 4, 1, sb923, sb924, sb925 # 3181
+xors 4, 1, sb88, sb922, sb923 # 3182
+xors 4, 1, sb2402, sb920, sb921 # 3183
+xors 4, 1, sb2400, sb918, sb919 # 3184
+xors 4, 1, sb2417, sb2400, sb2401 # 3185
+xors 4, 1, sb2398, sb916, sb917 # 3186
+xors 4, 1, sb1557, sb2398, sb2399 # 3187
+xors 4, 1, sb2396, sb914, sb915 # 3188
+xors 4, 1, sb2416, sb2396, sb2397 # 3189
+xors 4, 1, sb2394, sb912, sb913 # 3190
+xors 4, 1, sb1555, sb2394, sb2395 # 3191
+xors 4, 1, sb2392, sb910, sb911 # 3192
+xors 4, 1, sb2415, sb2392, sb2393 # 3193
+xors 4, 1, sb2390, sb901, sb909 # 3194
+xors 4, 1, sb1553, sb2390, sb2391 # 3195
+xors 4, 1, sb2388, sb898, sb899 # 3196
+xors 4, 1, sb2414, sb2388, sb2389 # 3197
+xors 4, 1, sb2386, sb896, sb897 # 3198
+xors 4, 1, sb1551, sb2386, sb2387 # 3199
+xors 4, 1, sb2384, sb893, sb895 # 3200
+xors 4, 1, sb2413, sb2384, sb2385 # 3201
+xors 4, 1, sb2382, sb891, sb892 # 3202
+xors 4, 1, sb1549, sb2382, sb2383 # 3203
+xors 4, 1, sb2380, sb882, sb889 # 3204
+xors 4, 1, sb2412, sb2380, sb2381 # 3205
+xors 4, 1, sb2378, sb880, sb881 # 3206
+xors 4, 1, sb1547, sb2378, sb2379 # 3207
+xors 4, 1, sb2376, sb878, sb879 # 3208
+xors 4, 1, sb2411, sb2376, sb2377 # 3209
+xors 4, 1, sb2374, sb876, sb877 # 3210
+xors 4, 1, sb1545, sb2374, sb2375 # 3211
+xors 4, 1, sb2372, sb872, sb874 # 3212
+xors 4, 1, sb2410, sb2372, sb2373 # 3213
+xors 4, 1, sb2370, sb870, sb871 # 3214
+xors 4, 1, sb1543, sb2370, sb2371 # 3215
+xors 4, 1, sb2368, sb863, sb869 # 3216
+xors 4, 1, sb2409, sb2368, sb2369 # 3217
+xors 4, 1, sb2366, sb859, sb861 # 3218
+xors 4, 1, sb1541, sb2366, sb2367 # 3219
+xors 4, 1, sb2364, sb857, sb858 # 3220
+xors 4, 1, sb2408, sb2364, sb2365 # 3221
+xors 4, 1, sb2362, sb854, sb855 # 3222
+xors 4, 1, sb1539, sb2362, sb2363 # 3223
+xors 4, 1, sb2360, sb852, sb853 # 3224
+xors 4, 1, sb2407, sb2360, sb2361 # 3225
+xors 4, 1, sb2358, sb846, sb847 # 3226
+xors 4, 1, sb1537, sb2358, sb2359 # 3227
+xors 4, 1, sb2356, sb842, sb844 # 3228
+xors 4, 1, sb2406, sb2356, sb2357 # 3229
+xors 4, 1, sb2354, sb838, sb840 # 3230
+xors 4, 1, sb1535, sb2354, sb2355 # 3231
+xors 4, 1, sb2352, sb835, sb836 # 3232
+xors 4, 1, sb2405, sb2352, sb2353 # 3233
+xors 4, 1, sb2350, sb833, sb834 # 3234
+xors 4, 1, sb1533, sb2350, sb2351 # 3235
+xors 4, 1, sb2348, sb827, sb828 # 3236
+xors 4, 1, sb2404, sb2348, sb2349 # 3237
+xors 4, 1, sb2346, sb825, sb826 # 3238
+xors 4, 1, sb1531, sb2346, sb2347 # 3239
+xors 4, 1, sb2344, sb822, sb823 # 3240
+xors 4, 1, sb815, sb2344, sb2345 # 3241
+xors 4, 1, sb818, sb819, sb821 # 3242
+xors 4, 1, sb90, sb817, sb818 # 3243
+xors 4, 1, sb2478, sb809, sb814 # 3244
+xors 4, 1, sb2476, sb807, sb808 # 3245
+xors 4, 1, sb2494, sb2476, sb2477 # 3246
+xors 4, 1, sb2474, sb804, sb806 # 3247
+xors 4, 1, sb1596, sb2474, sb2475 # 3248
+xors 4, 1, sb2472, sb802, sb803 # 3249
+xors 4, 1, sb2493, sb2472, sb2473 # 3250
+xors 4, 1, sb2470, sb800, sb801 # 3251
+xors 4, 1, sb1594, sb2470, sb2471 # 3252
+xors 4, 1, sb2468, sb797, sb798 # 3253
+xors 4, 1, sb2492, sb2468, sb2469 # 3254
+xors 4, 1, sb2466, sb789, sb796 # 3255
+xors 4, 1, sb1592, sb2466, sb2467 # 3256
+xors 4, 1, sb2464, sb787, sb788 # 3257
+xors 4, 1, sb2491, sb2464, sb2465 # 3258
+xors 4, 1, sb2462, sb785, sb786 # 3259
+xors 4, 1, sb1590, sb2462, sb2463 # 3260
+xors 4, 1, sb2460, sb782, sb783 # 3261
+xors 4, 1, sb2490, sb2460, sb2461 # 3262
+xors 4, 1, sb2458, sb780, sb781 # 3263
+xors 4, 1, sb1588, sb2458, sb2459 # 3264
+xors 4, 1, sb2456, sb773, sb779 # 3265
+xors 4, 1, sb2489, sb2456, sb2457 # 3266
+xors 4, 1, sb2454, sb771, sb772 # 3267
+xors 4, 1, sb1586, sb2454, sb2455 # 3268
+xors 4, 1, sb2452, sb769, sb770 # 3269
+xors 4, 1, sb2488, sb2452, sb2453 # 3270
+xors 4, 1, sb2450, sb766, sb768 # 3271
+xors 4, 1, sb1584, sb2450, sb2451 # 3272
+xors 4, 1, sb2448, sb764, sb765 # 3273
+xors 4, 1, sb2487, sb2448, sb2449 # 3274
+xors 4, 1, sb2446, sb762, sb763 # 3275
+xors 4, 1, sb1582, sb2446, sb2447 # 3276
+xors 4, 1, sb2444, sb759, sb760 # 3277
+xors 4, 1, sb2486, sb2444, sb2445 # 3278
+xors 4, 1, sb2442, sb753, sb754 # 3279
+xors 4, 1, sb1580, sb2442, sb2443 # 3280
+xors 4, 1, sb2440, sb751, sb752 # 3281
+xors 4, 1, sb2485, sb2440, sb2441 # 3282
+xors 4, 1, sb2438, sb748, sb749 # 3283
+xors 4, 1, sb1578, sb2438, sb2439 # 3284
+xors 4, 1, sb2436, sb746, sb747 # 3285
+xors 4, 1, sb2484, sb2436, sb2437 # 3286
+xors 4, 1, sb2434, sb743, sb745 # 3287
+xors 4, 1, sb1576, sb2434, sb2435 # 3288
+xors 4, 1, sb2432, sb740, sb742 # 3289
+xors 4, 1, sb2483, sb2432, sb2433 # 3290
+xors 4, 1, sb2430, sb734, sb735 # 3291
+xors 4, 1, sb1574, sb2430, sb2431 # 3292
+xors 4, 1, sb2428, sb731, sb732 # 3293
+xors 4, 1, sb2482, sb2428, sb2429 # 3294
+xors 4, 1, sb2426, sb728, sb730 # 3295
+xors 4, 1, sb1572, sb2426, sb2427 # 3296
+xors 4, 1, sb2424, sb726, sb727 # 3297
+xors 4, 1, sb2481, sb2424, sb2425 # 3298
+xors 4, 1, sb2422, sb722, sb724 # 3299
+xors 4, 1, sb1570, sb2422, sb2423 # 3300
+xors 4, 1, sb2420, sb714, sb715 # 3301
+xors 4, 1, sb2480, sb2420, sb2421 # 3302
+xors 4, 1, sb2418, sb712, sb713 # 3303
+xors 4, 1, sb1568, sb2418, sb2419 # 3304
+xors 4, 1, sb708, sb709, sb711 # 3305
+xors 4, 1, sb93, sb707, sb708 # 3306
+xors 4, 1, sb2551, sb705, sb706 # 3307
+xors 4, 1, sb2549, sb698, sb699 # 3308
+xors 4, 1, sb2566, sb2549, sb2550 # 3309
+xors 4, 1, sb2547, sb695, sb696 # 3310
+xors 4, 1, sb1633, sb2547, sb2548 # 3311
+xors 4, 1, sb2545, sb692, sb694 # 3312
+xors 4, 1, sb2565, sb2545, sb2546 # 3313
+xors 4, 1, sb2543, sb690, sb691 # 3314
+xors 4, 1, sb1631, sb2543, sb2544 # 3315
+xors 4, 1, sb2541, sb687, sb688 # 3316
+xors 4, 1, sb2564, sb2541, sb2542 # 3317
+xors 4, 1, sb2539, sb680, sb686 # 3318
+xors 4, 1, sb1629, sb2539, sb2540 # 3319
+xors 4, 1, sb2537, sb677, sb679 # 3320
+xors 4, 1, sb2563, sb2537, sb2538 # 3321
+xors 4, 1, sb2535, sb675, sb676 # 3322
+xors 4, 1, sb1627, sb2535, sb2536 # 3323
+xors 4, 1, sb2533, sb672, sb673 # 3324
+xors 4, 1, sb2562, sb2533, sb2534 # 3325
+xors 4, 1, sb2531, sb669, sb671 # 3326
+xors 4, 1, sb1625, sb2531, sb2532 # 3327
+xors 4, 1, sb2529, sb661, sb668 # 3328
+xors 4, 1, sb2561, sb2529, sb2530 # 3329
+xors 4, 1, sb2527, sb658, sb660 # 3330
+xors 4, 1, sb1623, sb2527, sb2528 # 3331
+xors 4, 1, sb2525, sb656, sb657 # 3332
+xors 4, 1, sb2560, sb2525, sb2526 # 3333
+xors 4, 1, sb2523, sb653, sb654 # 3334
+xors 4, 1, sb1621, sb2523, sb2524 # 3335
+xors 4, 1, sb2521, sb650, sb652 # 3336
+xors 4, 1, sb2559, sb2521, sb2522 # 3337
+xors 4, 1, sb2519, sb648, sb649 # 3338
+xors 4, 1, sb1619, sb2519, sb2520 # 3339
+xors 4, 1, sb2517, sb637, sb639 # 3340
+xors 4, 1, sb2558, sb2517, sb2518 # 3341
+xors 4, 1, sb2515, sb633, sb635 # 3342
+xors 4, 1, sb1617, sb2515, sb2516 # 3343
+xors 4, 1, sb2513, sb629, sb631 # 3344
+xors 4, 1, sb2557, sb2513, sb2514 # 3345
+xors 4, 1, sb2511, sb625, sb627 # 3346
+xors 4, 1, sb1615, sb2511, sb2512 # 3347
+xors 4, 1, sb2509, sb621, sb623 # 3348
+xors 4, 1, sb2556, sb2509, sb2510 # 3349
+xors 4, 1, sb2507, sb612, sb614 # 3350
+xors 4, 1, sb1613, sb2507, sb2508 # 3351
+xors 4, 1, sb2505, sb603, sb610 # 3352
+xors 4, 1, sb2555, sb2505, sb2506 # 3353
+xors 4, 1, sb2503, sb599, sb601 # 3354
+xors 4, 1, sb1611, sb2503, sb2504 # 3355
+xors 4, 1, sb2501, sb595, sb597 # 3356
+xors 4, 1, sb2554, sb2501, sb2502 # 3357
+xors 4, 1, sb2499, sb591, sb593 # 3358
+xors 4, 1, sb1609, sb2499, sb2500 # 3359
+xors 4, 1, sb2497, sb582, sb584 # 3360
+xors 4, 1, sb2553, sb2497, sb2498 # 3361
+xors 4, 1, sb2495, sb578, sb580 # 3362
+xors 4, 1, sb1607, sb2495, sb2496 # 3363
+xors 4, 1, sb552, sb574, sb576 # 3364
+xors 4, 1, sb96, sb545, sb552 # 3365
+xors 4, 1, sb2627, sb542, sb544 # 3366
+xors 4, 1, sb2625, sb538, sb540 # 3367
+xors 4, 1, sb2643, sb2625, sb2626 # 3368
+xors 4, 1, sb2623, sb534, sb536 # 3369
+xors 4, 1, sb1671, sb2623, sb2624 # 3370
+xors 4, 1, sb2621, sb507, sb532 # 3371
+xors 4, 1, sb2642, sb2621, sb2622 # 3372
+xors 4, 1, sb2619, sb493, sb496 # 3373
+xors 4, 1, sb1669, sb2619, sb2620 # 3374
+xors 4, 1, sb2617, sb488, sb490 # 3375
+xors 4, 1, sb2641, sb2617, sb2618 # 3376
+xors 4, 1, sb2615, sb482, sb484 # 3377
+xors 4, 1, sb1667, sb2615, sb2616 # 3378
+xors 4, 1, sb2613, sb477, sb480 # 3379
+xors 4, 1, sb2640, sb2613, sb2614 # 3380
+xors 4, 1, sb2611, sb468, sb471 # 3381
+xors 4, 1, sb1665, sb2611, sb2612 # 3382
+xors 4, 1, sb2609, sb464, sb465 # 3383
+xors 4, 1, sb2639, sb2609, sb2610 # 3384
+xors 4, 1, sb2607, sb459, sb462 # 3385
+xors 4, 1, sb1663, sb2607, sb2608 # 3386
+xors 4, 1, sb2605, sb453, sb455 # 3387
+xors 4, 1, sb2638, sb2605, sb2606 # 3388
+xors 4, 1, sb2603, sb446, sb450 # 3389
+xors 4, 1, sb1661, sb2603, sb2604 # 3390
+xors 4, 1, sb2601, sb441, sb444 # 3391
+xors 4, 1, sb2637, sb2601, sb2602 # 3392
+xors 4, 1, sb2599, sb436, sb439 # 3393
+xors 4, 1, sb1659, sb2599, sb2600 # 3394
+xors 4, 1, sb2597, sb430, sb432 # 3395
+xors 4, 1, sb2636, sb2597, sb2598 # 3396
+xors 4, 1, sb2595, sb427, sb429 # 3397
+xors 4, 1, sb1657, sb2595, sb2596 # 3398
+xors 4, 1, sb2593, sb418, sb423 # 3399
+xors 4, 1, sb2635, sb2593, sb2594 # 3400
+xors 4, 1, sb2591, sb412, sb414 # 3401
+xors 4, 1, sb1655, sb2591, sb2592 # 3402
+xors 4, 1, sb2589, sb405, sb409 # 3403
+xors 4, 1, sb2634, sb2589, sb2590 # 3404
+xors 4, 1, sb2587, sb400, sb403 # 3405
+xors 4, 1, sb1653, sb2587, sb2588 # 3406
+xors 4, 1, sb2585, sb396, sb398 # 3407
+xors 4, 1, sb2633, sb2585, sb2586 # 3408
+xors 4, 1, sb2583, sb393, sb394 # 3409
+xors 4, 1, sb1651, sb2583, sb2584 # 3410
+xors 4, 1, sb2581, sb389, sb391 # 3411
+xors 4, 1, sb2632, sb2581, sb2582 # 3412
+xors 4, 1, sb2579, sb382, sb387 # 3413
+xors 4, 1, sb1649, sb2579, sb2580 # 3414
+xors 4, 1, sb2577, sb378, sb380 # 3415
+xors 4, 1, sb2631, sb2577, sb2578 # 3416
+xors 4, 1, sb2575, sb371, sb374 # 3417
+xors 4, 1, sb1647, sb2575, sb2576 # 3418
+xors 4, 1, sb2573, sb362, sb364 # 3419
+xors 4, 1, sb2630, sb2573, sb2574 # 3420
+xors 4, 1, sb2571, sb353, sb355 # 3421
+xors 4, 1, sb1645, sb2571, sb2572 # 3422
+xors 4, 1, sb2569, sb349, sb351 # 3423
+xors 4, 1, sb2629, sb2569, sb2570 # 3424
+xors 4, 1, sb2567, sb345, sb347 # 3425
+xors 4, 1, sb1643, sb2567, sb2568 # 3426
+xors 4, 1, sb333, sb335, sb337 # 3427
+xors 4, 1, sb100, sb331, sb333 # 3428
+xors 4, 1, sb2702, sb329, sb330 # 3429
+xors 4, 1, sb2700, sb310, sb327 # 3430
+xors 4, 1, sb2698, sb305, sb307 # 3431
+xors 4, 1, sb2696, sb295, sb301 # 3432
+xors 4, 1, sb2694, sb291, sb293 # 3433
+xors 4, 1, sb2692, sb286, sb288 # 3434
+xors 4, 1, sb2690, sb283, sb284 # 3435
+xors 4, 1, sb2688, sb279, sb281 # 3436
+xors 4, 1, sb2686, sb276, sb277 # 3437
+xors 4, 1, sb2684, sb269, sb272 # 3438
+xors 4, 1, sb2682, sb265, sb267 # 3439
+xors 4, 1, sb2680, sb262, sb264 # 3440
+xors 4, 1, sb2678, sb249, sb259 # 3441
+xors 4, 1, sb2676, sb236, sb243 # 3442
+xors 4, 1, sb2674, sb230, sb233 # 3443
+xors 4, 1, sb2672, sb223, sb226 # 3444
+xors 4, 1, sb2670, sb219, sb221 # 3445
+xors 4, 1, sb2668, sb214, sb217 # 3446
+xors 4, 1, sb2666, sb208, sb211 # 3447
+xors 4, 1, sb2664, sb206, sb207 # 3448
+xors 4, 1, sb2662, sb199, sb203 # 3449
+xors 4, 1, sb2660, sb186, sb193 # 3450
+xors 4, 1, sb2658, sb183, sb185 # 3451
+xors 4, 1, sb2656, sb173, sb176 # 3452
+xors 4, 1, sb2654, sb169, sb170 # 3453
+xors 4, 1, sb2652, sb160, sb162 # 3454
+xors 4, 1, sb2650, sb155, sb156 # 3455
+xors 4, 1, sb2648, sb149, sb153 # 3456
+xors 4, 1, sb2646, sb144, sb148 # 3457
+xors 4, 1, sb2644, sb140, sb142 # 3458
+xors 4, 1, sb106, sb136, sb139 # 3459
+xors 4, 1, sb889, sb2644, sb2645 # 3460
+xors 4, 1, sb1682, sb2646, sb2647 # 3461
+xors 4, 1, sb2704, sb2648, sb2649 # 3462
+xors 4, 1, sb1684, sb2650, sb2651 # 3463
+xors 4, 1, sb2705, sb2652, sb2653 # 3464
+xors 4, 1, sb1686, sb2654, sb2655 # 3465
+xors 4, 1, sb2706, sb2656, sb2657 # 3466
+xors 4, 1, sb1688, sb2658, sb2659 # 3467
+xors 4, 1, sb2707, sb2660, sb2661 # 3468
+xors 4, 1, sb1690, sb2662, sb2663 # 3469
+xors 4, 1, sb2708, sb2664, sb2665 # 3470
+xors 4, 1, sb1692, sb2666, sb2667 # 3471
+xors 4, 1, sb2709, sb2668, sb2669 # 3472
+xors 4, 1, sb1694, sb2670, sb2671 # 3473
+xors 4, 1, sb2710, sb2672, sb2673 # 3474
+xors 4, 1, sb1696, sb2674, sb2675 # 3475
+xors 4, 1, sb2711, sb2676, sb2677 # 3476
+xors 4, 1, sb1698, sb2678, sb2679 # 3477
+xors 4, 1, sb2712, sb2680, sb2681 # 3478
+xors 4, 1, sb1700, sb2682, sb2683 # 3479
+xors 4, 1, sb2713, sb2684, sb2685 # 3480
+xors 4, 1, sb1702, sb2686, sb2687 # 3481
+xors 4, 1, sb2714, sb2688, sb2689 # 3482
+xors 4, 1, sb1704, sb2690, sb2691 # 3483
+xors 4, 1, sb2715, sb2692, sb2693 # 3484
+xors 4, 1, sb1706, sb2694, sb2695 # 3485
+xors 4, 1, sb2716, sb2696, sb2697 # 3486
+xors 4, 1, sb1708, sb2698, sb2699 # 3487
+xors 4, 1, sb2717, sb2700, sb2701 # 3488
+ands 3448, 1, sb532, sb141, sb146, 1, sb980, sb147, sb150, 1, sb981, sb152, sb154, 1, sb979, sb158, sb159, 1, sb983, sb163, sb165, 1, sb978, sb171, sb174, 1, sb985, sb175, sb177, 1, sb977, sb178, sb181, 1, sb987, sb182, sb184, 1, sb976, sb188, sb191, 1, sb989, sb195, sb197, 1, sb975, sb200, sb201, 1, sb991, sb202, sb205, 1, sb974, sb209, sb212, 1, sb993, sb213, sb215, 1, sb973, sb218, sb220, 1, sb995, sb222, sb224, 1, sb972, sb225, sb228, 1, sb997, sb229, sb231, 1, sb971, sb234, sb235, 1, sb999, sb237, sb239, 1, sb970, sb240, sb241, 1, sb1001, sb242, sb245, 1, sb545, sb247, sb251, 1, sb1003, sb253, sb255, 1, sb70, sb258, sb260, 1, sb1005, sb261, sb263, 1, sb552, sb266, sb268, 1, sb1007, sb270, sb271, 1, sb1016, sb273, sb274, 1, sb1008, sb533, sb275, 1, sb534, sb982, sb278, 1, sb1009, sb984, sb280, 1, sb536, sb986, sb282, 1, sb1010, sb988, sb285, 1, sb538, sb990, sb287, 1, sb1011, sb992, sb289, 1, sb540, sb994, sb290, 1, sb1012, sb996, sb292, 1, sb542, sb998, sb294, 1, sb1013, sb1000, sb296, 1, sb544, sb1002, sb297, 1, sb1014, sb1004, sb298, 1, sb1015, sb1006, sb299, 1, sb140, sb302, sb303, 1, sb131, sb68, sb124, 1, sb127, sb304, sb306, 1, sb116, sb189, sb110, 1, sb113, sb308, sb312, 1, sb95, sb25, sb72, 1, sb81, sb315, sb317, 1, sb59, sb49, sb44, 1, sb55, sb321, sb323, 1, sb38, sb51, sb30, 1, sb31, sb332, sb334, 1, sb969, sb336, sb338, 1, sb1040, sb339, sb340, 1, sb968, sb341, sb342, 1, sb1042, sb343, sb344, 1, sb967, sb346, sb348, 1, sb1044, sb350, sb352, 1, sb966, sb354, sb356, 1, sb1046, sb357, sb358, 1, sb965, sb359, sb360, 1, sb1048, sb361, sb363, 1, sb964, sb365, sb366, 1, sb1050, sb367, sb368, 1, sb963, sb369, sb370, 1, sb1052, sb372, sb373, 1, sb962, sb375, sb376, 1, sb1054, sb377, sb379, 1, sb961, sb381, sb383, 1, sb1056, sb384, sb385, 1, sb960, sb386, sb388, 1, sb1058, sb390, sb392, 1, sb959, sb395, sb397, 1, sb1060, sb399, sb401, 1, sb958, sb402, sb404, 1, sb1062, sb406, sb407, 1, sb957, sb408, sb410, 1, sb1064, sb411, sb413, 1, sb956, sb415, sb416, 1, sb1066, sb417, sb419, 1, sb1074, sb420, sb421, 1, sb330, sb1039, sb422, 1, sb574, sb1041, sb424, 1, sb1067, sb1043, sb425, 1, sb576, sb1045, sb426, 1, sb1068, sb1047, sb428, 1, sb578, sb1049, sb431, 1, sb1069, sb1051, sb433, 1, sb580, sb1053, sb434, 1, sb1070, sb1055, sb435, 1, sb582, sb1057, sb437, 1, sb1071, sb1059, sb438, 1, sb584, sb1061, sb440, 1, sb1072, sb1063, sb442, 1, sb1073, sb1065, sb443, 1, sb120, sb445, sb447, 1, sb954, sb448, sb449, 1, sb1076, sb451, sb452, 1, sb953, sb454, sb456, 1, sb1078, sb457, sb458, 1, sb952, sb460, sb461, 1, sb1080, sb463, sb466, 1, sb951, sb467, sb469, 1, sb1082, sb470, sb472, 1, sb950, sb473, sb474, 1, sb1084, sb475, sb476, 1, sb949, sb478, sb479, 1, sb1086, sb481, sb483, 1, sb948, sb485, sb486, 1, sb1088, sb487, sb489, 1, sb947, sb491, sb492, 1, sb1090, sb494, sb495, 1, sb946, sb497, sb498, 1, sb1092, sb499, sb500, 1, sb945, sb501, sb502, 1, sb1094, sb503, sb504, 1, sb944, sb505, sb506, 1, sb1096, sb508, sb509, 1, sb943, sb510, sb511, 1, sb1098, sb512, sb513, 1, sb942, sb514, sb515, 1, sb1100, sb516, sb517, 1, sb941, sb518, sb519, 1, sb1102, sb520, sb521, 1, sb940, sb522, sb523, 1, sb1104, sb524, sb525, 1, sb1113, sb526, sb527, 1, sb591, sb1075, sb528, 1, sb1105, sb1077, sb529, 1, sb593, sb1079, sb530, 1, sb1106, sb1081, sb531, 1, sb595, sb1083, sb535, 1, sb1107, sb1085, sb537, 1, sb597, sb1087, sb539, 1, sb1108, sb1089, sb541, 1, sb599, sb1091, sb543, 1, sb1109, sb1093, sb546, 1, sb601, sb1095, sb547, 1, sb1110, sb1097, sb548, 1, sb603, sb1099, sb549, 1, sb1111, sb1101, sb550, 1, sb1112, sb1103, sb554, 1, sb938, sb556, sb557, 1, sb1115, sb559, sb563, 1, sb937, sb567, sb571, 1, sb1117, sb573, sb575, 1, sb936, sb577, sb579, 1, sb1119, sb581, sb583, 1, sb935, sb585, sb586, 1, sb1121, sb587, sb588, 1, sb934, sb589, sb590, 1, sb1123, sb592, sb594, 1, sb933, sb596, sb598, 1, sb1125, sb600, sb602, 1, sb932, sb604, sb605, 1, sb1127, sb606, sb607, 1, sb1132, sb608, sb609, 1, sb610, sb1114, sb611, 1, sb1128, sb1116, sb613, 1, sb612, sb1118, sb615, 1, sb1129, sb1120, sb616, 1, sb614, sb1122, sb617, 1, sb1130, sb1124, sb618, 1, sb1131, sb1126, sb620, 1, sb507, sb622, sb624, 1, sb930, sb626, sb628, 1, sb1134, sb630, sb632, 1, sb929, sb634, sb636, 1, sb1136, sb638, sb640, 1, sb928, sb641, sb642, 1, sb1138, sb643, sb644, 1, sb927, sb645, sb646, 1, sb1140, sb647, sb651, 1, sb926, sb655, sb659, 1, sb1142, sb662, sb663, 1, sb925, sb664, sb665, 1, sb1144, sb666, sb670, 1, sb924, sb674, sb678, 1, sb1146, sb681, sb682, 1, sb923, sb683, sb684, 1, sb1148, sb685, sb689, 1, sb922, sb693, sb697, 1, sb1150, sb700, sb701, 1, sb921, sb702, sb703, 1, sb1152, sb704, sb710, 1, sb920, sb716, sb717, 1, sb1154, sb718, sb719, 1, sb919, sb720, sb721, 1, sb1156, sb723, sb725, 1, sb918, sb729, sb733, 1, sb1158, sb736, sb737, 1, sb917, sb738, sb739, 1, sb1160, sb744, sb750, 1, sb916, sb755, sb756, 1, sb1162, sb757, sb758, 1, sb915, sb761, sb767, 1, sb1164, sb774, sb775, 1, sb914, sb776, sb777, 1, sb1166, sb778, sb784, 1, sb913, sb790, sb791, 1, sb1168, sb792, sb793, 1, sb912, sb794, sb795, 1, sb1170, sb799, sb805, 1, sb911, sb810, sb811, 1, sb1172, sb812, sb813, 1, sb910, sb816, sb820, 1, sb1174, sb824, sb829, 1, sb909, sb830, sb831, 1, sb1176, sb832, sb837, 1, sb1189, sb839, sb841, 1, sb1177, sb1133, sb843, 1, sb621, sb1135, sb845, 1, sb1178, sb1137, sb848, 1, sb623, sb1139, sb849, 1, sb1179, sb1141, sb850, 1, sb625, sb1143, sb851, 1, sb1180, sb1145, sb856, 1, sb627, sb1147, sb860, 1, sb1181, sb1149, sb862, 1, sb629, sb1151, sb864, 1, sb1182, sb1153, sb865, 1, sb631, sb1155, sb866, 1, sb1183, sb1157, sb867, 1, sb633, sb1159, sb868, 1, sb1184, sb1161, sb873, 1, sb635, sb1163, sb875, 1, sb1185, sb1165, sb883, 1, sb637, sb1167, sb884, 1, sb1186, sb1169, sb885, 1, sb639, sb1171, sb886, 1, sb1187, sb1173, sb887, 1, sb1188, sb1175, sb888, 1, sb649, sb890, sb894, 1, sb1191, sb900, sb902, 1, sb657, sb903, sb904, 1, sb1193, sb905, sb906, 1, sb653, sb907, sb908, 1, sb1195, sb931, sb939, 1, sb493, sb955, sb1018, 1, sb1197, sb1020, sb1022, 1, sb380, sb1024, sb1026, 1, sb1199, sb3, sb1028, 1, sb371, sb5, sb1030, 1, sb1201, sb7, sb1032, 1, sb676, sb1034, sb1036, 1, sb1203, sb14, sb1038, 1, sb672, sb17, sb19, 1, sb1205, sb20, sb23, 1, sb668, sb26, sb28, 1, sb1207, sb29, sb35, 1, sb661, sb39, sb43, 1, sb1209, sb47, sb54, 1, sb484, sb58, sb60, 1, sb1211, sb64, sb73, 1, sb396, sb89, sb97, 1, sb1213, sb101, sb114, 1, sb387, sb117, sb122, 1, sb1215, sb130, sb135, 1, sb283, sb1719, sb1720, 1, sb1217, sb1721, sb1722, 1, sb742, sb1723, sb1724, 1, sb1219, sb1725, sb1726, 1, sb1228, sb1727, sb1728, 1, sb648, sb1190, sb1729, 1, sb1220, sb1192, sb1730, 1, sb650, sb1194, sb1731, 1, sb1221, sb1196, sb1732, 1, sb652, sb1198, sb1733, 1, sb1222, sb1200, sb1734, 1, sb654, sb1202, sb1735, 1, sb1223, sb1204, sb1736, 1, sb656, sb1206, sb1737, 1, sb1224, sb1208, sb1738, 1, sb658, sb1210, sb1739, 1, sb1225, sb1212, sb1740, 1, sb660, sb1214, sb1741, 1, sb1226, sb1216, sb1742, 1, sb1227, sb1218, sb1743, 1, sb276, sb1744, sb1745, 1, sb207, sb1746, sb1747, 1, sb1230, sb1748, sb1749, 1, sb714, sb1750, sb1751, 1, sb1232, sb1752, sb1753, 1, sb712, sb1754, sb1755, 1, sb1234, sb1756, sb1757, 1, sb708, sb1758, sb1759, 1, sb1236, sb1760, sb1761, 1, sb706, sb1762, sb1763, 1, sb1238, sb1764, sb1765, 1, sb699, sb1766, sb1767, 1, sb1240, sb1768, sb1769, 1, sb695, sb1770, sb1771, 1, sb1242, sb1772, sb1773, 1, sb691, sb1774, sb1775, 1, sb1244, sb1776, sb1777, 1, sb687, sb1778, sb1779, 1, sb1246, sb1780, sb1781, 1, sb680, sb1782, sb1783, 1, sb1248, sb1784, sb1785, 1, sb162, sb1786, sb1787, 1, sb1250, sb1788, sb1789, 1, sb133, sb1790, sb1791, 1, sb1252, sb1792, sb1793, 1, sb115, sb1794, sb1795, 1, sb1254, sb1796, sb1797, 1, sb32, sb1798, sb1799, 1, sb1256, sb1800, sb1801, 1, sb1265, sb1802, sb1803, 1, sb1257, sb1229, sb1804, 1, sb669, sb1231, sb1805, 1, sb1258, sb1233, sb1806, 1, sb671, sb1235, sb1807, 1, sb1259, sb1237, sb1808, 1, sb673, sb1239, sb1809, 1, sb1260, sb1241, sb1810, 1, sb675, sb1243, sb1811, 1, sb1261, sb1245, sb1812, 1, sb677, sb1247, sb1813, 1, sb1262, sb1249, sb1814, 1, sb679, sb1251, sb1815, 1, sb1263, sb1253, sb1816, 1, sb1264, sb1255, sb1817, 1, sb439, sb1818, sb1819, 1, sb1267, sb1820, sb1821, 1, sb430, sb1822, sb1823, 1, sb1269, sb1824, sb1825, 1, sb418, sb1826, sb1827, 1, sb1271, sb1828, sb1829, 1, sb412, sb1830, sb1831, 1, sb1273, sb1832, sb1833, 1, sb403, sb1834, sb1835, 1, sb1275, sb1836, sb1837, 1, sb858, sb1838, sb1839, 1, sb1277, sb1840, sb1841, 1, sb847, sb1842, sb1843, 1, sb1279, sb1844, sb1845, 1, sb822, sb1846, sb1847, 1, sb1281, sb1848, sb1849, 1, sb818, sb1850, sb1851, 1, sb1283, sb1852, sb1853, 1, sb814, sb1854, sb1855, 1, sb1285, sb1856, sb1857, 1, sb809, sb1858, sb1859, 1, sb1287, sb1860, sb1861, 1, sb807, sb1862, sb1863, 1, sb1289, sb1864, sb1865, 1, sb803, sb1866, sb1867, 1, sb1291, sb1868, sb1869, 1, sb801, sb1870, sb1871, 1, sb1293, sb1872, sb1873, 1, sb797, sb1874, sb1875, 1, sb1295, sb1876, sb1877, 1, sb1304, sb1878, sb1879, 1, sb686, sb1266, sb1880, 1, sb1296, sb1268, sb1881, 1, sb688, sb1270, sb1882, 1, sb1297, sb1272, sb1883, 1, sb690, sb1274, sb1884, 1, sb1298, sb1276, sb1885, 1, sb692, sb1278, sb1886, 1, sb1299, sb1280, sb1887, 1, sb694, sb1282, sb1888, 1, sb1300, sb1284, sb1889, 1, sb696, sb1286, sb1890, 1, sb1301, sb1288, sb1891, 1, sb698, sb1290, sb1892, 1, sb1302, sb1292, sb1893, 1, sb1303, sb1294, sb1894, 1, sb788, sb1895, sb1896, 1, sb1306, sb1897, sb1898, 1, sb786, sb1899, sb1900, 1, sb1308, sb1901, sb1902, 1, sb782, sb1903, sb1904, 1, sb1310, sb1905, sb1906, 1, sb780, sb1907, sb1908, 1, sb1312, sb1909, sb1910, 1, sb773, sb1911, sb1912, 1, sb1314, sb1913, sb1914, 1, sb771, sb1915, sb1916, 1, sb1316, sb1917, sb1918, 1, sb769, sb1919, sb1920, 1, sb1318, sb1921, sb1922, 1, sb765, sb1923, sb1924, 1, sb1320, sb1925, sb1926, 1, sb763, sb1927, sb1928, 1, sb1322, sb1929, sb1930, 1, sb759, sb1931, sb1932, 1, sb1324, sb1933, sb1934, 1, sb754, sb1935, sb1936, 1, sb1326, sb1937, sb1938, 1, sb752, sb1939, sb1940, 1, sb1328, sb1941, sb1942, 1, sb748, sb1943, sb1944, 1, sb1330, sb1945, sb1946, 1, sb746, sb1947, sb1948, 1, sb1332, sb1949, sb1950, 1, sb1340, sb1951, sb1952, 1, sb393, sb1305, sb1953, 1, sb705, sb1307, sb1954, 1, sb1333, sb1309, sb1955, 1, sb707, sb1311, sb1956, 1, sb1334, sb1313, sb1957, 1, sb709, sb1315, sb1958, 1, sb1335, sb1317, sb1959, 1, sb711, sb1319, sb1960, 1, sb1336, sb1321, sb1961, 1, sb713, sb1323, sb1962, 1, sb1337, sb1325, sb1963, 1, sb715, sb1327, sb1964, 1, sb1338, sb1329, sb1965, 1, sb1339, sb1331, sb1966, 1, sb740, sb1967, sb1968, 1, sb1342, sb1969, sb1970, 1, sb735, sb1971, sb1972, 1, sb1344, sb1973, sb1974, 1, sb731, sb1975, sb1976, 1, sb1346, sb1977, sb1978, 1, sb727, sb1979, sb1980, 1, sb1348, sb1981, sb1982, 1, sb214, sb1983, sb1984, 1, sb1350, sb1985, sb1986, 1, sb206, sb1987, sb1988, 1, sb1352, sb1989, sb1990, 1, sb193, sb1991, sb1992, 1, sb1354, sb1993, sb1994, 1, sb186, sb1995, sb1996, 1, sb1356, sb1997, sb1998, 1, sb176, sb1999, sb2000, 1, sb1358, sb2001, sb2002, 1, sb170, sb2003, sb2004, 1, sb1360, sb2005, sb2006, 1, sb156, sb2007, sb2008, 1, sb1362, sb2009, sb2010, 1, sb153, sb2011, sb2012, 1, sb1364, sb2013, sb2014, 1, sb148, sb2015, sb2016, 1, sb1366, sb2017, sb2018, 1, sb142, sb2019, sb2020, 1, sb1368, sb2021, sb2022, 1, sb129, sb2023, sb2024, 1, sb1370, sb2025, sb2026, 1, sb1379, sb2027, sb2028, 1, sb722, sb1341, sb2029, 1, sb1371, sb1343, sb2030, 1, sb724, sb1345, sb2031, 1, sb1372, sb1347, sb2032, 1, sb726, sb1349, sb2033, 1, sb1373, sb1351, sb2034, 1, sb728, sb1353, sb2035, 1, sb1374, sb1355, sb2036, 1, sb730, sb1357, sb2037, 1, sb1375, sb1359, sb2038, 1, sb732, sb1361, sb2039, 1, sb1376, sb1363, sb2040, 1, sb734, sb1365, sb2041, 1, sb1377, sb1367, sb2042, 1, sb1378, sb1369, sb2043, 1, sb13, sb2044, sb2045, 1, sb52, sb2046, sb2047, 1, sb1381, sb2048, sb2049, 1, sb42, sb2050, sb2051, 1, sb1383, sb2052, sb2053, 1, sb36, sb2054, sb2055, 1, sb1385, sb2056, sb2057, 1, sb22, sb2058, sb2059, 1, sb1387, sb2060, sb2061, 1, sb10, sb2062, sb2063, 1, sb1389, sb2064, sb2065, 1, sb6, sb2066, sb2067, 1, sb1391, sb2068, sb2069, 1, sb1, sb2070, sb2071, 1, sb1393, sb2072, sb2073, 1, sb0, sb2074, sb2075, 1, sb1395, sb2076, sb2077, 1, sb496, sb2078, sb2079, 1, sb1397, sb2080, sb2081, 1, sb490, sb2082, sb2083, 1, sb1399, sb2084, sb2085, 1, sb488, sb2086, sb2087, 1, sb1401, sb2088, sb2089, 1, sb482, sb2090, sb2091, 1, sb1403, sb2092, sb2093, 1, sb480, sb2094, sb2095, 1, sb1405, sb2096, sb2097, 1, sb477, sb2098, sb2099, 1, sb1407, sb2100, sb2101, 1, sb1416, sb2102, sb2103, 1, sb1408, sb1380, sb2104, 1, sb743, sb1382, sb2105, 1, sb1409, sb1384, sb2106, 1, sb745, sb1386, sb2107, 1, sb1410, sb1388, sb2108, 1, sb747, sb1390, sb2109, 1, sb1411, sb1392, sb2110, 1, sb749, sb1394, sb2111, 1, sb1412, sb1396, sb2112, 1, sb751, sb1398, sb2113, 1, sb1413, sb1400, sb2114, 1, sb753, sb1402, sb2115, 1, sb1414, sb1404, sb2116, 1, sb1415, sb1406, sb2117, 1, sb471, sb2118, sb2119, 1, sb1418, sb2120, sb2121, 1, sb468, sb2122, sb2123, 1, sb1420, sb2124, sb2125, 1, sb464, sb2126, sb2127, 1, sb1422, sb2128, sb2129, 1, sb462, sb2130, sb2131, 1, sb1424, sb2132, sb2133, 1, sb459, sb2134, sb2135, 1, sb1426, sb2136, sb2137, 1, sb455, sb2138, sb2139, 1, sb1428, sb2140, sb2141, 1, sb453, sb2142, sb2143, 1, sb1430, sb2144, sb2145, 1, sb450, sb2146, sb2147, 1, sb1432, sb2148, sb2149, 1, sb446, sb2150, sb2151, 1, sb1434, sb2152, sb2153, 1, sb444, sb2154, sb2155, 1, sb1436, sb2156, sb2157, 1, sb441, sb2158, sb2159, 1, sb1438, sb2160, sb2161, 1, sb436, sb2162, sb2163, 1, sb1440, sb2164, sb2165, 1, sb432, sb2166, sb2167, 1, sb1442, sb2168, sb2169, 1, sb427, sb2170, sb2171, 1, sb1444, sb2172, sb2173, 1, sb423, sb2174, sb2175, 1, sb1446, sb2176, sb2177, 1, sb1455, sb2178, sb2179, 1, sb760, sb1417, sb2180, 1, sb1447, sb1419, sb2181, 1, sb762, sb1421, sb2182, 1, sb1448, sb1423, sb2183, 1, sb764, sb1425, sb2184, 1, sb1449, sb1427, sb2185, 1, sb766, sb1429, sb2186, 1, sb1450, sb1431, sb2187, 1, sb768, sb1433, sb2188, 1, sb1451, sb1435, sb2189, 1, sb770, sb1437, sb2190, 1, sb1452, sb1439, sb2191, 1, sb772, sb1441, sb2192, 1, sb1453, sb1443, sb2193, 1, sb1454, sb1445, sb2194, 1, sb414, sb2195, sb2196, 1, sb1457, sb2197, sb2198, 1, sb409, sb2199, sb2200, 1, sb1459, sb2201, sb2202, 1, sb405, sb2203, sb2204, 1, sb1461, sb2205, sb2206, 1, sb400, sb2207, sb2208, 1, sb1463, sb2209, sb2210, 1, sb398, sb2211, sb2212, 1, sb1465, sb2213, sb2214, 1, sb394, sb2215, sb2216, 1, sb1467, sb2217, sb2218, 1, sb391, sb2219, sb2220, 1, sb1469, sb2221, sb2222, 1, sb389, sb2223, sb2224, 1, sb1471, sb2225, sb2226, 1, sb898, sb2227, sb2228, 1, sb1473, sb2229, sb2230, 1, sb896, sb2231, sb2232, 1, sb1475, sb2233, sb2234, 1, sb382, sb2235, sb2236, 1, sb1477, sb2237, sb2238, 1, sb892, sb2239, sb2240, 1, sb1479, sb2241, sb2242, 1, sb378, sb2243, sb2244, 1, sb1481, sb2245, sb2246, 1, sb374, sb2247, sb2248, 1, sb1483, sb2249, sb2250, 1, sb1491, sb2251, sb2252, 1, sb429, sb1456, sb2253, 1, sb779, sb1458, sb2254, 1, sb1484, sb1460, sb2255, 1, sb781, sb1462, sb2256, 1, sb1485, sb1464, sb2257, 1, sb783, sb1466, sb2258, 1, sb1486, sb1468, sb2259, 1, sb785, sb1470, sb2260, 1, sb1487, sb1472, sb2261, 1, sb787, sb1474, sb2262, 1, sb1488, sb1476, sb2263, 1, sb789, sb1478, sb2264, 1, sb1489, sb1480, sb2265, 1, sb1490, sb1482, sb2266, 1, sb881, sb2267, sb2268, 1, sb1493, sb2269, sb2270, 1, sb879, sb2271, sb2272, 1, sb1495, sb2273, sb2274, 1, sb877, sb2275, sb2276, 1, sb1497, sb2277, sb2278, 1, sb364, sb2279, sb2280, 1, sb1499, sb2281, sb2282, 1, sb362, sb2283, sb2284, 1, sb1501, sb2285, sb2286, 1, sb871, sb2287, sb2288, 1, sb1503, sb2289, sb2290, 1, sb869, sb2291, sb2292, 1, sb1505, sb2293, sb2294, 1, sb355, sb2295, sb2296, 1, sb1507, sb2297, sb2298, 1, sb353, sb2299, sb2300, 1, sb1509, sb2301, sb2302, 1, sb351, sb2303, sb2304, 1, sb1511, sb2305, sb2306, 1, sb349, sb2307, sb2308, 1, sb1513, sb2309, sb2310, 1, sb347, sb2311, sb2312, 1, sb1515, sb2313, sb2314, 1, sb345, sb2315, sb2316, 1, sb1517, sb2317, sb2318, 1, sb854, sb2319, sb2320, 1, sb1519, sb2321, sb2322, 1, sb852, sb2323, sb2324, 1, sb1521, sb2325, sb2326, 1, sb1530, sb2327, sb2328, 1, sb796, sb1492, sb2329, 1, sb1522, sb1494, sb2330, 1, sb798, sb1496, sb2331, 1, sb1523, sb1498, sb2332, 1, sb800, sb1500, sb2333, 1, sb1524, sb1502, sb2334, 1, sb802, sb1504, sb2335, 1, sb1525, sb1506, sb2336, 1, sb804, sb1508, sb2337, 1, sb1526, sb1510, sb2338, 1, sb806, sb1512, sb2339, 1, sb1527, sb1514, sb2340, 1, sb808, sb1516, sb2341, 1, sb1528, sb1518, sb2342, 1, sb1529, sb1520, sb2343, 1, sb265, sb2344, sb2345, 1, sb337, sb2346, sb2347, 1, sb1532, sb2348, sb2349, 1, sb335, sb2350, sb2351, 1, sb1534, sb2352, sb2353, 1, sb333, sb2354, sb2355, 1, sb1536, sb2356, sb2357, 1, sb331, sb2358, sb2359, 1, sb1538, sb2360, sb2361, 1, sb329, sb2362, sb2363, 1, sb1540, sb2364, sb2365, 1, sb327, sb2366, sb2367, 1, sb1542, sb2368, sb2369, 1, sb835, sb2370, sb2371, 1, sb1544, sb2372, sb2373, 1, sb833, sb2374, sb2375, 1, sb1546, sb2376, sb2377, 1, sb828, sb2378, sb2379, 1, sb1548, sb2380, sb2381, 1, sb826, sb2382, sb2383, 1, sb1550, sb2384, sb2385, 1, sb310, sb2386, sb2387, 1, sb1552, sb2388, sb2389, 1, sb307, sb2390, sb2391, 1, sb1554, sb2392, sb2393, 1, sb305, sb2394, sb2395, 1, sb1556, sb2396, sb2397, 1, sb301, sb2398, sb2399, 1, sb1558, sb2400, sb2401, 1, sb1567, sb2402, sb2403, 1, sb1559, sb1531, sb2404, 1, sb817, sb1533, sb2405, 1, sb1560, sb1535, sb2406, 1, sb819, sb1537, sb2407, 1, sb1561, sb1539, sb2408, 1, sb821, sb1541, sb2409, 1, sb1562, sb1543, sb2410, 1, sb823, sb1545, sb2411, 1, sb1563, sb1547, sb2412, 1, sb825, sb1549, sb2413, 1, sb1564, sb1551, sb2414, 1, sb827, sb1553, sb2415, 1, sb1565, sb1555, sb2416, 1, sb1566, sb1557, sb2417, 1, sb295, sb2418, sb2419, 1, sb1569, sb2420, sb2421, 1, sb293, sb2422, sb2423, 1, sb1571, sb2424, sb2425, 1, sb291, sb2426, sb2427, 1, sb1573, sb2428, sb2429, 1, sb288, sb2430, sb2431, 1, sb1575, sb2432, sb2433, 1, sb286, sb2434, sb2435, 1, sb1577, sb2436, sb2437, 1, sb284, sb2438, sb2439, 1, sb1579, sb2440, sb2441, 1, sb281, sb2442, sb2443, 1, sb1581, sb2444, sb2445, 1, sb279, sb2446, sb2447, 1, sb1583, sb2448, sb2449, 1, sb277, sb2450, sb2451, 1, sb1585, sb2452, sb2453, 1, sb272, sb2454, sb2455, 1, sb1587, sb2456, sb2457, 1, sb269, sb2458, sb2459, 1, sb1589, sb2460, sb2461, 1, sb267, sb2462, sb2463, 1, sb1591, sb2464, sb2465, 1, sb264, sb2466, sb2467, 1, sb1593, sb2468, sb2469, 1, sb262, sb2470, sb2471, 1, sb1595, sb2472, sb2473, 1, sb259, sb2474, sb2475, 1, sb1597, sb2476, sb2477, 1, sb1606, sb2478, sb2479, 1, sb834, sb1568, sb2480, 1, sb1598, sb1570, sb2481, 1, sb836, sb1572, sb2482, 1, sb1599, sb1574, sb2483, 1, sb838, sb1576, sb2484, 1, sb1600, sb1578, sb2485, 1, sb840, sb1580, sb2486, 1, sb1601, sb1582, sb2487, 1, sb842, sb1584, sb2488, 1, sb1602, sb1586, sb2489, 1, sb844, sb1588, sb2490, 1, sb1603, sb1590, sb2491, 1, sb846, sb1592, sb2492, 1, sb1604, sb1594, sb2493, 1, sb1605, sb1596, sb2494, 1, sb249, sb2495, sb2496, 1, sb1608, sb2497, sb2498, 1, sb243, sb2499, sb2500, 1, sb1610, sb2501, sb2502, 1, sb236, sb2503, sb2504, 1, sb1612, sb2505, sb2506, 1, sb233, sb2507, sb2508, 1, sb1614, sb2509, sb2510, 1, sb230, sb2511, sb2512, 1, sb1616, sb2513, sb2514, 1, sb226, sb2515, sb2516, 1, sb1618, sb2517, sb2518, 1, sb223, sb2519, sb2520, 1, sb1620, sb2521, sb2522, 1, sb221, sb2523, sb2524, 1, sb1622, sb2525, sb2526, 1, sb219, sb2527, sb2528, 1, sb1624, sb2529, sb2530, 1, sb217, sb2531, sb2532, 1, sb1626, sb2533, sb2534, 1, sb211, sb2535, sb2536, 1, sb1628, sb2537, sb2538, 1, sb208, sb2539, sb2540, 1, sb1630, sb2541, sb2542, 1, sb203, sb2543, sb2544, 1, sb1632, sb2545, sb2546, 1, sb199, sb2547, sb2548, 1, sb1634, sb2549, sb2550, 1, sb1642, sb2551, sb2552, 1, sb465, sb1607, sb2553, 1, sb853, sb1609, sb2554, 1, sb1635, sb1611, sb2555, 1, sb855, sb1613, sb2556, 1, sb1636, sb1615, sb2557, 1, sb857, sb1617, sb2558, 1, sb1637, sb1619, sb2559, 1, sb859, sb1621, sb2560, 1, sb1638, sb1623, sb2561, 1, sb861, sb1625, sb2562, 1, sb1639, sb1627, sb2563, 1, sb863, sb1629, sb2564, 1, sb1640, sb1631, sb2565, 1, sb1641, sb1633, sb2566, 1, sb185, sb2567, sb2568, 1, sb1644, sb2569, sb2570, 1, sb183, sb2571, sb2572, 1, sb1646, sb2573, sb2574, 1, sb173, sb2575, sb2576, 1, sb1648, sb2577, sb2578, 1, sb169, sb2579, sb2580, 1, sb1650, sb2581, sb2582, 1, sb160, sb2583, sb2584, 1, sb1652, sb2585, sb2586, 1, sb155, sb2587, sb2588, 1, sb1654, sb2589, sb2590, 1, sb149, sb2591, sb2592, 1, sb1656, sb2593, sb2594, 1, sb144, sb2595, sb2596, 1, sb1658, sb2597, sb2598, 1, sb139, sb2599, sb2600, 1, sb1660, sb2601, sb2602, 1, sb136, sb2603, sb2604, 1, sb1662, sb2605, sb2606, 1, sb134, sb2607, sb2608, 1, sb1664, sb2609, sb2610, 1, sb128, sb2611, sb2612, 1, sb1666, sb2613, sb2614, 1, sb125, sb2615, sb2616, 1, sb1668, sb2617, sb2618, 1, sb123, sb2619, sb2620, 1, sb1670, sb2621, sb2622, 1, sb119, sb2623, sb2624, 1, sb1672, sb2625, sb2626, 1, sb1681, sb2627, sb2628, 1, sb870, sb1643, sb2629, 1, sb1673, sb1645, sb2630, 1, sb872, sb1647, sb2631, 1, sb1674, sb1649, sb2632, 1, sb874, sb1651, sb2633, 1, sb1675, sb1653, sb2634, 1, sb876, sb1655, sb2635, 1, sb1676, sb1657, sb2636, 1, sb878, sb1659, sb2637, 1, sb1677, sb1661, sb2638, 1, sb880, sb1663, sb2639, 1, sb1678, sb1665, sb2640, 1, sb882, sb1667, sb2641, 1, sb1679, sb1669, sb2642, 1, sb1680, sb1671, sb2643, 1, sb108, sb2644, sb2645, 1, sb104, sb2646, sb2647, 1, sb1683, sb2648, sb2649, 1, sb94, sb2650, sb2651, 1, sb1685, sb2652, sb2653, 1, sb85, sb2654, sb2655, 1, sb1687, sb2656, sb2657, 1, sb80, sb2658, sb2659, 1, sb1689, sb2660, sb2661, 1, sb67, sb2662, sb2663, 1, sb1691, sb2664, sb2665, 1, sb61, sb2666, sb2667, 1, sb1693, sb2668, sb2669, 1, sb57, sb2670, sb2671, 1, sb1695, sb2672, sb2673, 1, sb48, sb2674, sb2675, 1, sb1697, sb2676, sb2677, 1, sb37, sb2678, sb2679, 1, sb1699, sb2680, sb2681, 1, sb33, sb2682, sb2683, 1, sb1701, sb2684, sb2685, 1, sb24, sb2686, sb2687, 1, sb1703, sb2688, sb2689, 1, sb18, sb2690, sb2691, 1, sb1705, sb2692, sb2693, 1, sb16, sb2694, sb2695, 1, sb1707, sb2696, sb2697, 1, sb8, sb2698, sb2699, 1, sb1709, sb2700, sb2701, 1, sb1718, sb2702, sb2703, 1, sb1710, sb1682, sb2704, 1, sb891, sb1684, sb2705, 1, sb1711, sb1686, sb2706, 1, sb893, sb1688, sb2707, 1, sb1712, sb1690, sb2708, 1, sb895, sb1692, sb2709, 1, sb1713, sb1694, sb2710, 1, sb897, sb1696, sb2711, 1, sb1714, sb1698, sb2712, 1, sb899, sb1700, sb2713, 1, sb1715, sb1702, sb2714, 1, sb901, sb1704, sb2715, 1, sb1716, sb1706, sb2716, 1, sb1717, sb1708, sb2717 # 3489
+xors 4, 1, sb135, sb137, sb140 # 3490
+xors 4, 1, sb28, sb1017, sb135 # 3491
+nots 1, sb73, sb28 # 3492
+xors 4, 1, sb1018, sb135, sb565 # 3493
+xors 4, 1, sb130, sb124, sb131 # 3494
+xors 4, 1, sb317, sb1019, sb130 # 3495
+xors 4, 1, sb1020, sb130, sb12 # 3496
+xors 4, 1, sb117, sb124, sb127 # 3497
+xors 4, 1, sb122, sb1021, sb117 # 3498
+xors 4, 1, sb556, sb122, sb317 # 3499
+xors 4, 1, sb1022, sb117, sb12 # 3500
+xors 4, 1, sb114, sb110, sb116 # 3501
+xors 4, 1, sb54, sb1023, sb114 # 3502
+xors 4, 1, sb1024, sb114, sb561 # 3503
+xors 4, 1, sb97, sb110, sb113 # 3504
+xors 4, 1, sb101, sb1025, sb97 # 3505
+xors 4, 1, sb239, sb101, sb54 # 3506
+xors 4, 1, sb1026, sb97, sb561 # 3507
+xors 4, 1, sb89, sb72, sb95 # 3508
+xors 4, 1, sb26, sb1027, sb89 # 3509
+xors 4, 1, sb1028, sb89, sb109 # 3510
+xors 4, 1, sb60, sb72, sb81 # 3511
+xors 4, 1, sb64, sb1029, sb60 # 3512
+xors 4, 1, sb97, sb64, sb26 # 3513
+xors 4, 1, sb1030, sb60, sb109 # 3514
+xors 4, 1, sb58, sb44, sb59 # 3515
+xors 4, 1, sb47, sb1031, sb58 # 3516
+xors 4, 1, sb1032, sb58, sb569 # 3517
+xors 4, 1, sb39, sb44, sb55 # 3518
+xors 4, 1, sb43, sb1033, sb39 # 3519
+xors 4, 1, sb181, sb43, sb47 # 3520
+xors 4, 1, sb1034, sb39, sb569 # 3521
+xors 4, 1, sb35, sb30, sb38 # 3522
+xors 4, 1, sb44, sb1035, sb35 # 3523
+xors 4, 1, sb1036, sb35, sb166 # 3524
+xors 4, 1, sb23, sb30, sb31 # 3525
+xors 4, 1, sb29, sb1037, sb23 # 3526
+xors 4, 1, sb165, sb29, sb44 # 3527
+xors 4, 1, sb1038, sb23, sb166 # 3528
+ands 1736, 1, sb531, sb533, sb981, 1, sb535, sb982, sb983, 1, sb530, sb984, sb985, 1, sb537, sb986, sb987, 1, sb529, sb988, sb989, 1, sb539, sb990, sb991, 1, sb528, sb992, sb993, 1, sb541, sb994, sb995, 1, sb527, sb996, sb997, 1, sb543, sb998, sb999, 1, sb308, sb1000, sb1001, 1, sb241, sb1002, sb1003, 1, sb557, sb1004, sb1005, 1, sb550, sb1006, sb1007, 1, sb59, sb300, sb1008, 1, sb546, sb534, sb1009, 1, sb302, sb536, sb1010, 1, sb547, sb538, sb1011, 1, sb304, sb540, sb1012, 1, sb548, sb542, sb1013, 1, sb549, sb544, sb1014, 1, sb240, sb1015, sb1016, 1, sb175, sb1017, sb1018, 1, sb559, sb1019, sb1020, 1, sb554, sb1021, sb1022, 1, sb101, sb1023, sb1024, 1, sb563, sb1025, sb1026, 1, sb571, sb1027, sb1028, 1, sb299, sb1029, sb1030, 1, sb567, sb1031, sb1032, 1, sb182, sb1033, sb1034, 1, sb29, sb1035, sb1036, 1, sb573, sb1037, sb1038, 1, sb526, sb1039, sb1040, 1, sb575, sb1041, sb1042, 1, sb525, sb1043, sb1044, 1, sb577, sb1045, sb1046, 1, sb524, sb1047, sb1048, 1, sb579, sb1049, sb1050, 1, sb523, sb1051, sb1052, 1, sb581, sb1053, sb1054, 1, sb522, sb1055, sb1056, 1, sb583, sb1057, sb1058, 1, sb521, sb1059, sb1060, 1, sb585, sb1061, sb1062, 1, sb955, sb1063, sb1064, 1, sb590, sb1065, sb1066, 1, sb586, sb574, sb1067, 1, sb332, sb576, sb1068, 1, sb587, sb578, sb1069, 1, sb334, sb580, sb1070, 1, sb588, sb582, sb1071, 1, sb589, sb584, sb1072, 1, sb519, sb1073, sb1074, 1, sb592, sb1075, sb1076, 1, sb518, sb1077, sb1078, 1, sb594, sb1079, sb1080, 1, sb517, sb1081, sb1082, 1, sb596, sb1083, sb1084, 1, sb516, sb1085, sb1086, 1, sb598, sb1087, sb1088, 1, sb515, sb1089, sb1090, 1, sb600, sb1091, sb1092, 1, sb514, sb1093, sb1094, 1, sb602, sb1095, sb1096, 1, sb513, sb1097, sb1098, 1, sb604, sb1099, sb1100, 1, sb939, sb1101, sb1102, 1, sb609, sb1103, sb1104, 1, sb339, sb591, sb1105, 1, sb605, sb593, sb1106, 1, sb341, sb595, sb1107, 1, sb606, sb597, sb1108, 1, sb343, sb599, sb1109, 1, sb607, sb601, sb1110, 1, sb608, sb603, sb1111, 1, sb511, sb1112, sb1113, 1, sb611, sb1114, sb1115, 1, sb510, sb1116, sb1117, 1, sb613, sb1118, sb1119, 1, sb509, sb1120, sb1121, 1, sb615, sb1122, sb1123, 1, sb931, sb1124, sb1125, 1, sb618, sb1126, sb1127, 1, sb348, sb610, sb1128, 1, sb616, sb612, sb1129, 1, sb617, sb614, sb1130, 1, sb620, sb1131, sb1132, 1, sb506, sb1133, sb1134, 1, sb622, sb1135, sb1136, 1, sb505, sb1137, sb1138, 1, sb624, sb1139, sb1140, 1, sb504, sb1141, sb1142, 1, sb626, sb1143, sb1144, 1, sb503, sb1145, sb1146, 1, sb628, sb1147, sb1148, 1, sb502, sb1149, sb1150, 1, sb630, sb1151, sb1152, 1, sb501, sb1153, sb1154, 1, sb632, sb1155, sb1156, 1, sb500, sb1157, sb1158, 1, sb634, sb1159, sb1160, 1, sb499, sb1161, sb1162, 1, sb636, sb1163, sb1164, 1, sb498, sb1165, sb1166, 1, sb638, sb1167, sb1168, 1, sb497, sb1169, sb1170, 1, sb640, sb1171, sb1172, 1, sb908, sb1173, sb1174, 1, sb647, sb1175, sb1176, 1, sb352, sb619, sb1177, 1, sb641, sb621, sb1178, 1, sb354, sb623, sb1179, 1, sb642, sb625, sb1180, 1, sb356, sb627, sb1181, 1, sb643, sb629, sb1182, 1, sb358, sb631, sb1183, 1, sb644, sb633, sb1184, 1, sb360, sb635, sb1185, 1, sb645, sb637, sb1186, 1, sb646, sb639, sb1187, 1, sb495, sb1188, sb1189, 1, sb494, sb1190, sb1191, 1, sb655, sb1192, sb1193, 1, sb651, sb1194, sb1195, 1, sb492, sb1196, sb1197, 1, sb376, sb1198, sb1199, 1, sb723, sb1200, sb1201, 1, sb674, sb1202, sb1203, 1, sb670, sb1204, sb1205, 1, sb666, sb1206, sb1207, 1, sb659, sb1208, sb1209, 1, sb425, sb1210, sb1211, 1, sb392, sb1212, sb1213, 1, sb383, sb1214, sb1215, 1, sb273, sb1216, sb1217, 1, sb725, sb1218, sb1219, 1, sb366, sb648, sb1220, 1, sb662, sb650, sb1221, 1, sb368, sb652, sb1222, 1, sb663, sb654, sb1223, 1, sb370, sb656, sb1224, 1, sb664, sb658, sb1225, 1, sb665, sb660, sb1226, 1, sb721, sb1227, sb1228, 1, sb716, sb1229, sb1230, 1, sb202, sb1231, sb1232, 1, sb710, sb1233, sb1234, 1, sb195, sb1235, sb1236, 1, sb704, sb1237, sb1238, 1, sb697, sb1239, sb1240, 1, sb693, sb1241, sb1242, 1, sb689, sb1243, sb1244, 1, sb685, sb1245, sb1246, 1, sb678, sb1247, sb1248, 1, sb140, sb1249, sb1250, 1, sb117, sb1251, sb1252, 1, sb58, sb1253, sb1254, 1, sb20, sb1255, sb1256, 1, sb375, sb667, sb1257, 1, sb681, sb669, sb1258, 1, sb377, sb671, sb1259, 1, sb682, sb673, sb1260, 1, sb379, sb675, sb1261, 1, sb683, sb677, sb1262, 1, sb684, sb679, sb1263, 1, sb473, sb1264, sb1265, 1, sb434, sb1266, sb1267, 1, sb421, sb1268, sb1269, 1, sb416, sb1270, sb1271, 1, sb407, sb1272, sb1273, 1, sb372, sb1274, sb1275, 1, sb856, sb1276, sb1277, 1, sb824, sb1278, sb1279, 1, sb820, sb1280, sb1281, 1, sb816, sb1282, sb1283, 1, sb298, sb1284, sb1285, 1, sb296, sb1286, sb1287, 1, sb805, sb1288, sb1289, 1, sb290, sb1290, sb1291, 1, sb799, sb1292, sb1293, 1, sb795, sb1294, sb1295, 1, sb384, sb686, sb1296, 1, sb700, sb688, sb1297, 1, sb386, sb690, sb1298, 1, sb701, sb692, sb1299, 1, sb388, sb694, sb1300, 1, sb702, sb696, sb1301, 1, sb703, sb698, sb1302, 1, sb790, sb1303, sb1304, 1, sb275, sb1305, sb1306, 1, sb784, sb1307, sb1308, 1, sb270, sb1309, sb1310, 1, sb778, sb1311, sb1312, 1, sb261, sb1313, sb1314, 1, sb258, sb1315, sb1316, 1, sb767, sb1317, sb1318, 1, sb253, sb1319, sb1320, 1, sb761, sb1321, sb1322, 1, sb245, sb1323, sb1324, 1, sb242, sb1325, sb1326, 1, sb750, sb1327, sb1328, 1, sb234, sb1329, sb1330, 1, sb744, sb1331, sb1332, 1, sb717, sb705, sb1333, 1, sb395, sb707, sb1334, 1, sb718, sb709, sb1335, 1, sb397, sb711, sb1336, 1, sb719, sb713, sb1337, 1, sb720, sb715, sb1338, 1, sb228, sb1339, sb1340, 1, sb225, sb1341, sb1342, 1, sb733, sb1343, sb1344, 1, sb729, sb1345, sb1346, 1, sb215, sb1347, sb1348, 1, sb212, sb1349, sb1350, 1, sb200, sb1351, sb1352, 1, sb191, sb1353, sb1354, 1, sb177, sb1355, sb1356, 1, sb174, sb1357, sb1358, 1, sb159, sb1359, sb1360, 1, sb154, sb1361, sb1362, 1, sb152, sb1363, sb1364, 1, sb147, sb1365, sb1366, 1, sb130, sb1367, sb1368, 1, sb116, sb1369, sb1370, 1, sb402, sb722, sb1371, 1, sb736, sb724, sb1372, 1, sb404, sb726, sb1373, 1, sb737, sb728, sb1374, 1, sb406, sb730, sb1375, 1, sb738, sb732, sb1376, 1, sb739, sb734, sb1377, 1, sb113, sb1378, sb1379, 1, sb43, sb1380, sb1381, 1, sb38, sb1382, sb1383, 1, sb30, sb1384, sb1385, 1, sb19, sb1386, sb1387, 1, sb7, sb1388, sb1389, 1, sb3, sb1390, sb1391, 1, sb512, sb1392, sb1393, 1, sb508, sb1394, sb1395, 1, sb491, sb1396, sb1397, 1, sb489, sb1398, sb1399, 1, sb486, sb1400, sb1401, 1, sb481, sb1402, sb1403, 1, sb479, sb1404, sb1405, 1, sb475, sb1406, sb1407, 1, sb411, sb741, sb1408, 1, sb755, sb743, sb1409, 1, sb413, sb745, sb1410, 1, sb756, sb747, sb1411, 1, sb415, sb749, sb1412, 1, sb757, sb751, sb1413, 1, sb758, sb753, sb1414, 1, sb472, sb1415, sb1416, 1, sb470, sb1417, sb1418, 1, sb466, sb1419, sb1420, 1, sb463, sb1421, sb1422, 1, sb461, sb1423, sb1424, 1, sb457, sb1425, sb1426, 1, sb454, sb1427, sb1428, 1, sb452, sb1429, sb1430, 1, sb448, sb1431, sb1432, 1, sb445, sb1433, sb1434, 1, sb443, sb1435, sb1436, 1, sb437, sb1437, sb1438, 1, sb435, sb1439, sb1440, 1, sb428, sb1441, sb1442, 1, sb426, sb1443, sb1444, 1, sb419, sb1445, sb1446, 1, sb420, sb760, sb1447, 1, sb774, sb762, sb1448, 1, sb422, sb764, sb1449, 1, sb775, sb766, sb1450, 1, sb424, sb768, sb1451, 1, sb776, sb770, sb1452, 1, sb777, sb772, sb1453, 1, sb417, sb1454, sb1455, 1, sb410, sb1456, sb1457, 1, sb408, sb1458, sb1459, 1, sb401, sb1460, sb1461, 1, sb399, sb1462, sb1463, 1, sb907, sb1464, sb1465, 1, sb902, sb1466, sb1467, 1, sb390, sb1468, sb1469, 1, sb900, sb1470, sb1471, 1, sb385, sb1472, sb1473, 1, sb894, sb1474, sb1475, 1, sb381, sb1476, sb1477, 1, sb890, sb1478, sb1479, 1, sb888, sb1480, sb1481, 1, sb373, sb1482, sb1483, 1, sb791, sb779, sb1484, 1, sb431, sb781, sb1485, 1, sb792, sb783, sb1486, 1, sb433, sb785, sb1487, 1, sb793, sb787, sb1488, 1, sb794, sb789, sb1489, 1, sb883, sb1490, sb1491, 1, sb369, sb1492, sb1493, 1, sb367, sb1494, sb1495, 1, sb365, sb1496, sb1497, 1, sb363, sb1498, sb1499, 1, sb361, sb1500, sb1501, 1, sb359, sb1502, sb1503, 1, sb357, sb1504, sb1505, 1, sb862, sb1506, sb1507, 1, sb864, sb1508, sb1509, 1, sb350, sb1510, sb1511, 1, sb860, sb1512, sb1513, 1, sb346, sb1514, sb1515, 1, sb344, sb1516, sb1517, 1, sb342, sb1518, sb1519, 1, sb340, sb1520, sb1521, 1, sb438, sb796, sb1522, 1, sb810, sb798, sb1523, 1, sb440, sb800, sb1524, 1, sb811, sb802, sb1525, 1, sb442, sb804, sb1526, 1, sb812, sb806, sb1527, 1, sb813, sb808, sb1528, 1, sb338, sb1529, sb1530, 1, sb336, sb1531, sb1532, 1, sb845, sb1533, sb1534, 1, sb843, sb1535, sb1536, 1, sb841, sb1537, sb1538, 1, sb839, sb1539, sb1540, 1, sb837, sb1541, sb1542, 1, sb323, sb1543, sb1544, 1, sb321, sb1545, sb1546, 1, sb315, sb1547, sb1548, 1, sb312, sb1549, sb1550, 1, sb875, sb1551, sb1552, 1, sb306, sb1553, sb1554, 1, sb303, sb1555, sb1556, 1, sb873, sb1557, sb1558, 1, sb447, sb815, sb1559, 1, sb829, sb817, sb1560, 1, sb449, sb819, sb1561, 1, sb830, sb821, sb1562, 1, sb451, sb823, sb1563, 1, sb831, sb825, sb1564, 1, sb832, sb827, sb1565, 1, sb297, sb1566, sb1567, 1, sb294, sb1568, sb1569, 1, sb292, sb1570, sb1571, 1, sb289, sb1572, sb1573, 1, sb287, sb1574, sb1575, 1, sb285, sb1576, sb1577, 1, sb282, sb1578, sb1579, 1, sb280, sb1580, sb1581, 1, sb278, sb1582, sb1583, 1, sb274, sb1584, sb1585, 1, sb271, sb1586, sb1587, 1, sb268, sb1588, sb1589, 1, sb266, sb1590, sb1591, 1, sb263, sb1592, sb1593, 1, sb260, sb1594, sb1595, 1, sb255, sb1596, sb1597, 1, sb456, sb834, sb1598, 1, sb848, sb836, sb1599, 1, sb458, sb838, sb1600, 1, sb849, sb840, sb1601, 1, sb460, sb842, sb1602, 1, sb850, sb844, sb1603, 1, sb851, sb846, sb1604, 1, sb251, sb1605, sb1606, 1, sb247, sb1607, sb1608, 1, sb237, sb1609, sb1610, 1, sb235, sb1611, sb1612, 1, sb231, sb1613, sb1614, 1, sb229, sb1615, sb1616, 1, sb224, sb1617, sb1618, 1, sb222, sb1619, sb1620, 1, sb220, sb1621, sb1622, 1, sb218, sb1623, sb1624, 1, sb213, sb1625, sb1626, 1, sb209, sb1627, sb1628, 1, sb205, sb1629, sb1630, 1, sb201, sb1631, sb1632, 1, sb197, sb1633, sb1634, 1, sb865, sb853, sb1635, 1, sb467, sb855, sb1636, 1, sb866, sb857, sb1637, 1, sb469, sb859, sb1638, 1, sb867, sb861, sb1639, 1, sb868, sb863, sb1640, 1, sb188, sb1641, sb1642, 1, sb184, sb1643, sb1644, 1, sb178, sb1645, sb1646, 1, sb171, sb1647, sb1648, 1, sb163, sb1649, sb1650, 1, sb158, sb1651, sb1652, 1, sb150, sb1653, sb1654, 1, sb146, sb1655, sb1656, 1, sb141, sb1657, sb1658, 1, sb137, sb1659, sb1660, 1, sb135, sb1661, sb1662, 1, sb131, sb1663, sb1664, 1, sb127, sb1665, sb1666, 1, sb124, sb1667, sb1668, 1, sb122, sb1669, sb1670, 1, sb114, sb1671, sb1672, 1, sb474, sb870, sb1673, 1, sb884, sb872, sb1674, 1, sb476, sb874, sb1675, 1, sb885, sb876, sb1676, 1, sb478, sb878, sb1677, 1, sb886, sb880, sb1678, 1, sb887, sb882, sb1679, 1, sb110, sb1680, sb1681, 1, sb95, sb1682, sb1683, 1, sb89, sb1684, sb1685, 1, sb81, sb1686, sb1687, 1, sb72, sb1688, sb1689, 1, sb64, sb1690, sb1691, 1, sb60, sb1692, sb1693, 1, sb55, sb1694, sb1695, 1, sb39, sb1696, sb1697, 1, sb35, sb1698, sb1699, 1, sb31, sb1700, sb1701, 1, sb23, sb1702, sb1703, 1, sb17, sb1704, sb1705, 1, sb14, sb1706, sb1707, 1, sb520, sb1708, sb1709, 1, sb483, sb889, sb1710, 1, sb903, sb891, sb1711, 1, sb485, sb893, sb1712, 1, sb904, sb895, sb1713, 1, sb487, sb897, sb1714, 1, sb905, sb899, sb1715, 1, sb906, sb901, sb1716, 1, sb5, sb1717, sb1718 # 3529
+xors 4, 1, sb533, sb531, sb980 # 3530
+xors 4, 1, sb531, sb535, sb979 # 3531
+xors 4, 1, sb535, sb530, sb978 # 3532
+xors 4, 1, sb530, sb537, sb977 # 3533
+xors 4, 1, sb537, sb529, sb976 # 3534
+xors 4, 1, sb529, sb539, sb975 # 3535
+xors 4, 1, sb539, sb528, sb974 # 3536
+xors 4, 1, sb528, sb541, sb973 # 3537
+xors 4, 1, sb541, sb527, sb972 # 3538
+xors 4, 1, sb527, sb543, sb971 # 3539
+xors 4, 1, sb543, sb308, sb970 # 3540
+xors 4, 1, sb308, sb241, sb545 # 3541
+xors 4, 1, sb545, sb557, sb70 # 3542
+xors 4, 1, sb241, sb550, sb552 # 3543
+xors 4, 1, sb550, sb240, sb241 # 3544
+xors 4, 1, sb70, sb565, sb175 # 3545
+xors 4, 1, sb557, sb12, sb559 # 3546
+xors 4, 1, sb241, sb551, sb557 # 3547
+xors 4, 1, sb552, sb557, sb313 # 3548
+xors 4, 1, sb175, sb12, sb554 # 3549
+xors 4, 1, sb240, sb553, sb175 # 3550
+xors 4, 1, sb557, sb240, sb241 # 3551
+xors 4, 1, sb554, sb175, sb313 # 3552
+xors 4, 1, sb565, sb561, sb101 # 3553
+xors 4, 1, sb175, sb558, sb565 # 3554
+xors 4, 1, sb559, sb565, sb319 # 3555
+xors 4, 1, sb101, sb561, sb563 # 3556
+xors 4, 1, sb12, sb560, sb101 # 3557
+xors 4, 1, sb240, sb12, sb175 # 3558
+xors 4, 1, sb561, sb101, sb319 # 3559
+xors 4, 1, sb565, sb109, sb571 # 3560
+xors 4, 1, sb12, sb562, sb565 # 3561
+xors 4, 1, sb563, sb565, sb41 # 3562
+xors 4, 1, sb571, sb109, sb299 # 3563
+xors 4, 1, sb109, sb564, sb571 # 3564
+xors 4, 1, sb101, sb109, sb12 # 3565
+xors 4, 1, sb565, sb571, sb41 # 3566
+xors 4, 1, sb299, sb569, sb567 # 3567
+xors 4, 1, sb109, sb566, sb299 # 3568
+xors 4, 1, sb567, sb299, sb325 # 3569
+xors 4, 1, sb571, sb569, sb182 # 3570
+xors 4, 1, sb299, sb568, sb571 # 3571
+xors 4, 1, sb182, sb299, sb109 # 3572
+xors 4, 1, sb569, sb571, sb325 # 3573
+xors 4, 1, sb299, sb166, sb29 # 3574
+xors 4, 1, sb29, sb570, sb299 # 3575
+xors 4, 1, sb571, sb299, sb167 # 3576
+xors 4, 1, sb299, sb166, sb573 # 3577
+xors 4, 1, sb573, sb572, sb299 # 3578
+xors 4, 1, sb166, sb573, sb29 # 3579
+xors 4, 1, sb573, sb299, sb167 # 3580
+xors 4, 1, sb299, sb526, sb969 # 3581
+xors 4, 1, sb526, sb575, sb968 # 3582
+xors 4, 1, sb575, sb525, sb967 # 3583
+xors 4, 1, sb525, sb577, sb966 # 3584
+xors 4, 1, sb577, sb524, sb965 # 3585
+xors 4, 1, sb524, sb579, sb964 # 3586
+xors 4, 1, sb579, sb523, sb963 # 3587
+xors 4, 1, sb523, sb581, sb962 # 3588
+xors 4, 1, sb581, sb522, sb961 # 3589
+xors 4, 1, sb522, sb583, sb960 # 3590
+xors 4, 1, sb583, sb521, sb959 # 3591
+xors 4, 1, sb521, sb585, sb958 # 3592
+xors 4, 1, sb585, sb955, sb957 # 3593
+xors 4, 1, sb955, sb590, sb956 # 3594
+xors 4, 1, sb590, sb519, sb955 # 3595
+xors 4, 1, sb519, sb592, sb954 # 3596
+xors 4, 1, sb592, sb518, sb953 # 3597
+xors 4, 1, sb518, sb594, sb952 # 3598
+xors 4, 1, sb594, sb517, sb951 # 3599
+xors 4, 1, sb517, sb596, sb950 # 3600
+xors 4, 1, sb596, sb516, sb949 # 3601
+xors 4, 1, sb516, sb598, sb948 # 3602
+xors 4, 1, sb598, sb515, sb947 # 3603
+xors 4, 1, sb515, sb600, sb946 # 3604
+xors 4, 1, sb600, sb514, sb945 # 3605
+xors 4, 1, sb514, sb602, sb944 # 3606
+xors 4, 1, sb602, sb513, sb943 # 3607
+xors 4, 1, sb513, sb604, sb942 # 3608
+xors 4, 1, sb604, sb939, sb941 # 3609
+xors 4, 1, sb939, sb609, sb940 # 3610
+xors 4, 1, sb609, sb511, sb939 # 3611
+xors 4, 1, sb511, sb611, sb938 # 3612
+xors 4, 1, sb611, sb510, sb937 # 3613
+xors 4, 1, sb510, sb613, sb936 # 3614
+xors 4, 1, sb613, sb509, sb935 # 3615
+xors 4, 1, sb509, sb615, sb934 # 3616
+xors 4, 1, sb615, sb931, sb933 # 3617
+xors 4, 1, sb931, sb618, sb932 # 3618
+xors 4, 1, sb618, sb620, sb931 # 3619
+xors 4, 1, sb620, sb506, sb930 # 3620
+xors 4, 1, sb506, sb622, sb929 # 3621
+xors 4, 1, sb622, sb505, sb928 # 3622
+xors 4, 1, sb505, sb624, sb927 # 3623
+xors 4, 1, sb624, sb504, sb926 # 3624
+xors 4, 1, sb504, sb626, sb925 # 3625
+xors 4, 1, sb626, sb503, sb924 # 3626
+xors 4, 1, sb503, sb628, sb923 # 3627
+xors 4, 1, sb628, sb502, sb922 # 3628
+xors 4, 1, sb502, sb630, sb921 # 3629
+xors 4, 1, sb630, sb501, sb920 # 3630
+xors 4, 1, sb501, sb632, sb919 # 3631
+xors 4, 1, sb632, sb500, sb918 # 3632
+xors 4, 1, sb500, sb634, sb917 # 3633
+xors 4, 1, sb634, sb499, sb916 # 3634
+xors 4, 1, sb499, sb636, sb915 # 3635
+xors 4, 1, sb636, sb498, sb914 # 3636
+xors 4, 1, sb498, sb638, sb913 # 3637
+xors 4, 1, sb638, sb497, sb912 # 3638
+xors 4, 1, sb497, sb640, sb911 # 3639
+xors 4, 1, sb640, sb908, sb910 # 3640
+xors 4, 1, sb908, sb647, sb909 # 3641
+xors 4, 1, sb647, sb495, sb908 # 3642
+xors 4, 1, sb495, sb494, sb649 # 3643
+xors 4, 1, sb649, sb655, sb657 # 3644
+xors 4, 1, sb494, sb651, sb653 # 3645
+xors 4, 1, sb651, sb492, sb493 # 3646
+xors 4, 1, sb493, sb376, sb380 # 3647
+xors 4, 1, sb653, sb723, sb371 # 3648
+xors 4, 1, sb492, sb674, sb676 # 3649
+xors 4, 1, sb655, sb670, sb672 # 3650
+xors 4, 1, sb371, sb666, sb668 # 3651
+xors 4, 1, sb657, sb659, sb661 # 3652
+xors 4, 1, sb380, sb425, sb484 # 3653
+xors 4, 1, sb659, sb392, sb396 # 3654
+xors 4, 1, sb376, sb383, sb387 # 3655
+xors 4, 1, sb661, sb273, sb283 # 3656
+xors 4, 1, sb723, sb725, sb742 # 3657
+xors 4, 1, sb666, sb721, sb723 # 3658
+xors 4, 1, sb668, sb716, sb207 # 3659
+xors 4, 1, sb425, sb202, sb714 # 3660
+xors 4, 1, sb670, sb710, sb712 # 3661
+xors 4, 1, sb396, sb195, sb708 # 3662
+xors 4, 1, sb672, sb704, sb706 # 3663
+xors 4, 1, sb392, sb697, sb699 # 3664
+xors 4, 1, sb674, sb693, sb695 # 3665
+xors 4, 1, sb387, sb689, sb691 # 3666
+xors 4, 1, sb676, sb685, sb687 # 3667
+xors 4, 1, sb383, sb678, sb680 # 3668
+xors 4, 1, sb678, sb140, sb162 # 3669
+xors 4, 1, sb273, sb117, sb133 # 3670
+xors 4, 1, sb680, sb58, sb115 # 3671
+xors 4, 1, sb484, sb20, sb32 # 3672
+xors 4, 1, sb685, sb473, sb484 # 3673
+xors 4, 1, sb32, sb434, sb439 # 3674
+xors 4, 1, sb687, sb421, sb430 # 3675
+xors 4, 1, sb117, sb416, sb418 # 3676
+xors 4, 1, sb689, sb407, sb412 # 3677
+xors 4, 1, sb20, sb372, sb403 # 3678
+xors 4, 1, sb691, sb856, sb858 # 3679
+xors 4, 1, sb484, sb824, sb847 # 3680
+xors 4, 1, sb693, sb820, sb822 # 3681
+xors 4, 1, sb439, sb816, sb818 # 3682
+xors 4, 1, sb695, sb298, sb814 # 3683
+xors 4, 1, sb434, sb296, sb809 # 3684
+xors 4, 1, sb697, sb805, sb807 # 3685
+xors 4, 1, sb430, sb290, sb803 # 3686
+xors 4, 1, sb699, sb799, sb801 # 3687
+xors 4, 1, sb283, sb795, sb797 # 3688
+xors 4, 1, sb704, sb790, sb283 # 3689
+xors 4, 1, sb207, sb275, sb788 # 3690
+xors 4, 1, sb421, sb784, sb786 # 3691
+xors 4, 1, sb706, sb270, sb782 # 3692
+xors 4, 1, sb416, sb778, sb780 # 3693
+xors 4, 1, sb708, sb261, sb773 # 3694
+xors 4, 1, sb412, sb258, sb771 # 3695
+xors 4, 1, sb710, sb767, sb769 # 3696
+xors 4, 1, sb407, sb253, sb765 # 3697
+xors 4, 1, sb712, sb761, sb763 # 3698
+xors 4, 1, sb403, sb245, sb759 # 3699
+xors 4, 1, sb714, sb242, sb754 # 3700
+xors 4, 1, sb58, sb750, sb752 # 3701
+xors 4, 1, sb716, sb234, sb748 # 3702
+xors 4, 1, sb742, sb744, sb746 # 3703
+xors 4, 1, sb721, sb228, sb742 # 3704
+xors 4, 1, sb234, sb225, sb740 # 3705
+xors 4, 1, sb723, sb733, sb735 # 3706
+xors 4, 1, sb202, sb729, sb731 # 3707
+xors 4, 1, sb725, sb215, sb727 # 3708
+xors 4, 1, sb195, sb212, sb214 # 3709
+xors 4, 1, sb727, sb200, sb206 # 3710
+xors 4, 1, sb133, sb191, sb193 # 3711
+xors 4, 1, sb729, sb177, sb186 # 3712
+xors 4, 1, sb162, sb174, sb176 # 3713
+xors 4, 1, sb731, sb159, sb170 # 3714
+xors 4, 1, sb140, sb154, sb156 # 3715
+xors 4, 1, sb733, sb152, sb153 # 3716
+xors 4, 1, sb228, sb147, sb148 # 3717
+xors 4, 1, sb735, sb130, sb142 # 3718
+xors 4, 1, sb115, sb116, sb129 # 3719
+xors 4, 1, sb740, sb113, sb115 # 3720
+xors 4, 1, sb742, sb43, sb52 # 3721
+xors 4, 1, sb215, sb38, sb42 # 3722
+xors 4, 1, sb744, sb30, sb36 # 3723
+xors 4, 1, sb52, sb19, sb22 # 3724
+xors 4, 1, sb746, sb7, sb10 # 3725
+xors 4, 1, sb212, sb3, sb6 # 3726
+xors 4, 1, sb748, sb512, sb1 # 3727
+xors 4, 1, sb43, sb508, sb0 # 3728
+xors 4, 1, sb750, sb491, sb496 # 3729
+xors 4, 1, sb38, sb489, sb490 # 3730
+xors 4, 1, sb752, sb486, sb488 # 3731
+xors 4, 1, sb36, sb481, sb482 # 3732
+xors 4, 1, sb754, sb479, sb480 # 3733
+xors 4, 1, sb473, sb475, sb477 # 3734
+xors 4, 1, sb759, sb472, sb473 # 3735
+xors 4, 1, sb22, sb470, sb471 # 3736
+xors 4, 1, sb761, sb466, sb468 # 3737
+xors 4, 1, sb19, sb463, sb464 # 3738
+xors 4, 1, sb763, sb461, sb462 # 3739
+xors 4, 1, sb206, sb457, sb459 # 3740
+xors 4, 1, sb765, sb454, sb455 # 3741
+xors 4, 1, sb10, sb452, sb453 # 3742
+xors 4, 1, sb767, sb448, sb450 # 3743
+xors 4, 1, sb6, sb445, sb446 # 3744
+xors 4, 1, sb769, sb443, sb444 # 3745
+xors 4, 1, sb1, sb437, sb441 # 3746
+xors 4, 1, sb771, sb435, sb436 # 3747
+xors 4, 1, sb488, sb428, sb432 # 3748
+xors 4, 1, sb773, sb426, sb427 # 3749
+xors 4, 1, sb418, sb419, sb423 # 3750
+xors 4, 1, sb778, sb417, sb418 # 3751
+xors 4, 1, sb42, sb410, sb414 # 3752
+xors 4, 1, sb479, sb408, sb409 # 3753
+xors 4, 1, sb780, sb401, sb405 # 3754
+xors 4, 1, sb475, sb399, sb400 # 3755
+xors 4, 1, sb782, sb907, sb398 # 3756
+xors 4, 1, sb470, sb902, sb394 # 3757
+xors 4, 1, sb784, sb390, sb391 # 3758
+xors 4, 1, sb466, sb900, sb389 # 3759
+xors 4, 1, sb786, sb385, sb898 # 3760
+xors 4, 1, sb461, sb894, sb896 # 3761
+xors 4, 1, sb788, sb381, sb382 # 3762
+xors 4, 1, sb457, sb890, sb892 # 3763
+xors 4, 1, sb790, sb888, sb378 # 3764
+xors 4, 1, sb372, sb373, sb374 # 3765
+xors 4, 1, sb795, sb883, sb372 # 3766
+xors 4, 1, sb448, sb369, sb881 # 3767
+xors 4, 1, sb797, sb367, sb879 # 3768
+xors 4, 1, sb443, sb365, sb877 # 3769
+xors 4, 1, sb799, sb363, sb364 # 3770
+xors 4, 1, sb296, sb361, sb362 # 3771
+xors 4, 1, sb801, sb359, sb871 # 3772
+xors 4, 1, sb290, sb357, sb869 # 3773
+xors 4, 1, sb803, sb862, sb355 # 3774
+xors 4, 1, sb283, sb864, sb353 # 3775
+xors 4, 1, sb805, sb350, sb351 # 3776
+xors 4, 1, sb275, sb860, sb349 # 3777
+xors 4, 1, sb807, sb346, sb347 # 3778
+xors 4, 1, sb270, sb344, sb345 # 3779
+xors 4, 1, sb809, sb342, sb854 # 3780
+xors 4, 1, sb847, sb340, sb852 # 3781
+xors 4, 1, sb814, sb338, sb847 # 3782
+xors 4, 1, sb816, sb336, sb337 # 3783
+xors 4, 1, sb154, sb845, sb335 # 3784
+xors 4, 1, sb818, sb843, sb333 # 3785
+xors 4, 1, sb261, sb841, sb331 # 3786
+xors 4, 1, sb820, sb839, sb329 # 3787
+xors 4, 1, sb258, sb837, sb327 # 3788
+xors 4, 1, sb822, sb323, sb835 # 3789
+xors 4, 1, sb152, sb321, sb833 # 3790
+xors 4, 1, sb824, sb315, sb828 # 3791
+xors 4, 1, sb245, sb312, sb826 # 3792
+xors 4, 1, sb826, sb875, sb310 # 3793
+xors 4, 1, sb242, sb306, sb307 # 3794
+xors 4, 1, sb828, sb303, sb305 # 3795
+xors 4, 1, sb298, sb873, sb301 # 3796
+xors 4, 1, sb833, sb297, sb298 # 3797
+xors 4, 1, sb148, sb294, sb295 # 3798
+xors 4, 1, sb835, sb292, sb293 # 3799
+xors 4, 1, sb225, sb289, sb291 # 3800
+xors 4, 1, sb837, sb287, sb288 # 3801
+xors 4, 1, sb147, sb285, sb286 # 3802
+xors 4, 1, sb839, sb282, sb284 # 3803
+xors 4, 1, sb214, sb280, sb281 # 3804
+xors 4, 1, sb841, sb278, sb279 # 3805
+xors 4, 1, sb130, sb274, sb277 # 3806
+xors 4, 1, sb843, sb271, sb272 # 3807
+xors 4, 1, sb142, sb268, sb269 # 3808
+xors 4, 1, sb845, sb266, sb267 # 3809
+xors 4, 1, sb200, sb263, sb264 # 3810
+xors 4, 1, sb847, sb260, sb262 # 3811
+xors 4, 1, sb253, sb255, sb259 # 3812
+xors 4, 1, sb852, sb251, sb253 # 3813
+xors 4, 1, sb177, sb247, sb249 # 3814
+xors 4, 1, sb191, sb237, sb243 # 3815
+xors 4, 1, sb854, sb235, sb236 # 3816
+xors 4, 1, sb186, sb231, sb233 # 3817
+xors 4, 1, sb856, sb229, sb230 # 3818
+xors 4, 1, sb176, sb224, sb226 # 3819
+xors 4, 1, sb858, sb222, sb223 # 3820
+xors 4, 1, sb174, sb220, sb221 # 3821
+xors 4, 1, sb860, sb218, sb219 # 3822
+xors 4, 1, sb170, sb213, sb217 # 3823
+xors 4, 1, sb862, sb209, sb211 # 3824
+xors 4, 1, sb159, sb205, sb208 # 3825
+xors 4, 1, sb864, sb201, sb203 # 3826
+xors 4, 1, sb193, sb197, sb199 # 3827
+xors 4, 1, sb869, sb188, sb193 # 3828
+xors 4, 1, sb156, sb184, sb185 # 3829
+xors 4, 1, sb871, sb178, sb183 # 3830
+xors 4, 1, sb30, sb171, sb173 # 3831
+xors 4, 1, sb873, sb163, sb169 # 3832
+xors 4, 1, sb153, sb158, sb160 # 3833
+xors 4, 1, sb875, sb150, sb155 # 3834
+xors 4, 1, sb129, sb146, sb149 # 3835
+xors 4, 1, sb877, sb141, sb144 # 3836
+xors 4, 1, sb230, sb137, sb139 # 3837
+xors 4, 1, sb879, sb135, sb136 # 3838
+xors 4, 1, sb116, sb131, sb134 # 3839
+xors 4, 1, sb881, sb127, sb128 # 3840
+xors 4, 1, sb115, sb124, sb125 # 3841
+xors 4, 1, sb883, sb122, sb123 # 3842
+xors 4, 1, sb113, sb114, sb119 # 3843
+xors 4, 1, sb888, sb110, sb113 # 3844
+xors 4, 1, sb890, sb95, sb104 # 3845
+xors 4, 1, sb224, sb89, sb94 # 3846
+xors 4, 1, sb892, sb81, sb85 # 3847
+xors 4, 1, sb95, sb72, sb80 # 3848
+xors 4, 1, sb894, sb64, sb67 # 3849
+xors 4, 1, sb85, sb60, sb61 # 3850
+xors 4, 1, sb896, sb55, sb57 # 3851
+xors 4, 1, sb221, sb39, sb48 # 3852
+xors 4, 1, sb898, sb35, sb37 # 3853
+xors 4, 1, sb219, sb31, sb33 # 3854
+xors 4, 1, sb900, sb23, sb24 # 3855
+xors 4, 1, sb64, sb17, sb18 # 3856
+xors 4, 1, sb902, sb14, sb16 # 3857
+xors 4, 1, sb7, sb520, sb8 # 3858
+xors 4, 1, sb907, sb5, sb7 # 3859
+ands 872, 1, sb301, sb300, sb533, 1, sb80, sb534, sb535, 1, sb303, sb536, sb537, 1, sb39, sb538, sb539, 1, sb305, sb540, sb541, 1, sb104, sb542, sb543, 1, sb81, sb544, sb545, 1, sb57, sb59, sb546, 1, sb306, sb302, sb547, 1, sb307, sb304, sb548, 1, sb312, sb549, sb550, 1, sb310, sb551, sb552, 1, sb94, sb553, sb554, 1, sb321, sb70, sb555, 1, sb315, sb70, sb556, 1, sb171, sb70, sb557, 1, sb327, sb558, sb559, 1, sb0, sb560, sb561, 1, sb323, sb562, sb563, 1, sb331, sb564, sb565, 1, sb113, sb566, sb567, 1, sb183, sb568, sb569, 1, sb23, sb570, sb571, 1, sb329, sb572, sb573, 1, sb298, sb574, sb575, 1, sb333, sb576, sb577, 1, sb297, sb578, sb579, 1, sb335, sb580, sb581, 1, sb520, sb582, sb583, 1, sb338, sb584, sb585, 1, sb110, sb330, sb586, 1, sb336, sb332, sb587, 1, sb337, sb334, sb588, 1, sb295, sb589, sb590, 1, sb340, sb591, sb592, 1, sb294, sb593, sb594, 1, sb342, sb595, sb596, 1, sb293, sb597, sb598, 1, sb344, sb599, sb600, 1, sb512, sb601, sb602, 1, sb347, sb603, sb604, 1, sb127, sb339, sb605, 1, sb345, sb341, sb606, 1, sb346, sb343, sb607, 1, sb291, sb608, sb609, 1, sb349, sb610, sb611, 1, sb508, sb612, sb613, 1, sb351, sb614, sb615, 1, sb350, sb348, sb616, 1, sb288, sb617, sb618, 1, sb353, sb619, sb620, 1, sb287, sb621, sb622, 1, sb355, sb623, sb624, 1, sb286, sb625, sb626, 1, sb357, sb627, sb628, 1, sb285, sb629, sb630, 1, sb359, sb631, sb632, 1, sb284, sb633, sb634, 1, sb361, sb635, sb636, 1, sb496, sb637, sb638, 1, sb365, sb639, sb640, 1, sb139, sb352, sb641, 1, sb362, sb354, sb642, 1, sb146, sb356, sb643, 1, sb363, sb358, sb644, 1, sb364, sb360, sb645, 1, sb282, sb646, sb647, 1, sb367, sb648, sb649, 1, sb281, sb650, sb651, 1, sb369, sb652, sb653, 1, sb280, sb654, sb655, 1, sb278, sb656, sb657, 1, sb378, sb658, sb659, 1, sb374, sb660, sb661, 1, sb158, sb366, sb662, 1, sb372, sb368, sb663, 1, sb373, sb370, sb664, 1, sb277, sb665, sb666, 1, sb249, sb667, sb668, 1, sb398, sb669, sb670, 1, sb394, sb671, sb672, 1, sb389, sb673, sb674, 1, sb385, sb675, sb676, 1, sb274, sb677, sb678, 1, sb272, sb679, sb680, 1, sb173, sb375, sb681, 1, sb381, sb377, sb682, 1, sb382, sb379, sb683, 1, sb237, sb684, sb685, 1, sb223, sb686, sb687, 1, sb213, sb688, sb689, 1, sb5, sb690, sb691, 1, sb452, sb692, sb693, 1, sb437, sb694, sb695, 1, sb432, sb696, sb697, 1, sb428, sb698, sb699, 1, sb188, sb384, sb700, 1, sb390, sb386, sb701, 1, sb391, sb388, sb702, 1, sb423, sb703, sb704, 1, sb419, sb705, sb706, 1, sb414, sb707, sb708, 1, sb410, sb709, sb710, 1, sb405, sb711, sb712, 1, sb401, sb713, sb714, 1, sb267, sb715, sb716, 1, sb205, sb393, sb717, 1, sb399, sb395, sb718, 1, sb400, sb397, sb719, 1, sb150, sb720, sb721, 1, sb208, sb722, sb723, 1, sb197, sb724, sb725, 1, sb137, sb726, sb727, 1, sb155, sb728, sb729, 1, sb128, sb730, sb731, 1, sb134, sb732, sb733, 1, sb131, sb734, sb735, 1, sb217, sb402, sb736, 1, sb408, sb404, sb737, 1, sb409, sb406, sb738, 1, sb125, sb739, sb740, 1, sb60, sb741, sb742, 1, sb55, sb743, sb744, 1, sb48, sb745, sb746, 1, sb144, sb747, sb748, 1, sb37, sb749, sb750, 1, sb211, sb751, sb752, 1, sb35, sb753, sb754, 1, sb235, sb411, sb755, 1, sb417, sb413, sb756, 1, sb418, sb415, sb757, 1, sb24, sb758, sb759, 1, sb14, sb760, sb761, 1, sb17, sb762, sb763, 1, sb16, sb764, sb765, 1, sb8, sb766, sb767, 1, sb3, sb768, sb769, 1, sb491, sb770, sb771, 1, sb486, sb772, sb773, 1, sb247, sb420, sb774, 1, sb426, sb422, sb775, 1, sb427, sb424, sb776, 1, sb482, sb777, sb778, 1, sb477, sb779, sb780, 1, sb473, sb781, sb782, 1, sb468, sb783, sb784, 1, sb464, sb785, sb786, 1, sb459, sb787, sb788, 1, sb455, sb789, sb790, 1, sb255, sb429, sb791, 1, sb435, sb431, sb792, 1, sb436, sb433, sb793, 1, sb450, sb794, sb795, 1, sb446, sb796, sb797, 1, sb441, sb798, sb799, 1, sb292, sb800, sb801, 1, sb289, sb802, sb803, 1, sb279, sb804, sb805, 1, sb271, sb806, sb807, 1, sb269, sb808, sb809, 1, sb7, sb438, sb810, 1, sb444, sb440, sb811, 1, sb445, sb442, sb812, 1, sb266, sb813, sb814, 1, sb263, sb815, sb816, 1, sb262, sb817, sb818, 1, sb259, sb819, sb820, 1, sb253, sb821, sb822, 1, sb251, sb823, sb824, 1, sb243, sb825, sb826, 1, sb236, sb827, sb828, 1, sb18, sb447, sb829, 1, sb453, sb449, sb830, 1, sb454, sb451, sb831, 1, sb231, sb832, sb833, 1, sb233, sb834, sb835, 1, sb229, sb836, sb837, 1, sb218, sb838, sb839, 1, sb209, sb840, sb841, 1, sb203, sb842, sb843, 1, sb201, sb844, sb845, 1, sb199, sb846, sb847, 1, sb33, sb456, sb848, 1, sb462, sb458, sb849, 1, sb463, sb460, sb850, 1, sb193, sb851, sb852, 1, sb184, sb853, sb854, 1, sb185, sb855, sb856, 1, sb178, sb857, sb858, 1, sb136, sb859, sb860, 1, sb169, sb861, sb862, 1, sb163, sb863, sb864, 1, sb260, sb465, sb865, 1, sb471, sb467, sb866, 1, sb472, sb469, sb867, 1, sb160, sb868, sb869, 1, sb31, sb870, sb871, 1, sb149, sb872, sb873, 1, sb141, sb874, sb875, 1, sb135, sb876, sb877, 1, sb124, sb878, sb879, 1, sb119, sb880, sb881, 1, sb226, sb882, sb883, 1, sb264, sb474, sb884, 1, sb480, sb476, sb885, 1, sb481, sb478, sb886, 1, sb114, sb887, sb888, 1, sb123, sb889, sb890, 1, sb122, sb891, sb892, 1, sb222, sb893, sb894, 1, sb89, sb895, sb896, 1, sb220, sb897, sb898, 1, sb72, sb899, sb900, 1, sb61, sb901, sb902, 1, sb268, sb483, sb903, 1, sb489, sb485, sb904, 1, sb490, sb487, sb905, 1, sb67, sb906, sb907 # 3860
+xors 4, 1, sb300, sb301, sb532 # 3861
+xors 4, 1, sb301, sb80, sb531 # 3862
+xors 4, 1, sb80, sb303, sb530 # 3863
+xors 4, 1, sb303, sb39, sb529 # 3864
+xors 4, 1, sb39, sb305, sb528 # 3865
+xors 4, 1, sb305, sb104, sb527 # 3866
+xors 4, 1, sb104, sb81, sb308 # 3867
+xors 4, 1, sb308, sb312, sb104 # 3868
+xors 4, 1, sb81, sb313, sb310 # 3869
+xors 4, 1, sb104, sb309, sb81 # 3870
+xors 4, 1, sb310, sb81, sb15 # 3871
+xors 4, 1, sb81, sb313, sb94 # 3872
+xors 4, 1, sb312, sb311, sb81 # 3873
+xors 4, 1, sb313, sb312, sb104 # 3874
+xors 4, 1, sb312, sb81, sb15 # 3875
+xors 4, 1, sb94, sb321, sb68 # 3876
+xors 4, 1, sb81, sb315, sb317 # 3877
+xors 4, 1, sb68, sb171, sb241 # 3878
+xors 4, 1, sb321, sb319, sb327 # 3879
+xors 4, 1, sb171, sb314, sb321 # 3880
+xors 4, 1, sb315, sb321, sb187 # 3881
+xors 4, 1, sb327, sb319, sb0 # 3882
+xors 4, 1, sb317, sb316, sb327 # 3883
+xors 4, 1, sb241, sb317, sb171 # 3884
+xors 4, 1, sb317, sb327, sb187 # 3885
+xors 4, 1, sb321, sb41, sb323 # 3886
+xors 4, 1, sb0, sb318, sb321 # 3887
+xors 4, 1, sb319, sb321, sb257 # 3888
+xors 4, 1, sb323, sb41, sb331 # 3889
+xors 4, 1, sb327, sb320, sb323 # 3890
+xors 4, 1, sb41, sb327, sb0 # 3891
+xors 4, 1, sb321, sb323, sb257 # 3892
+xors 4, 1, sb331, sb325, sb113 # 3893
+xors 4, 1, sb113, sb322, sb331 # 3894
+xors 4, 1, sb323, sb331, sb102 # 3895
+xors 4, 1, sb327, sb325, sb183 # 3896
+xors 4, 1, sb331, sb324, sb327 # 3897
+xors 4, 1, sb183, sb331, sb113 # 3898
+xors 4, 1, sb325, sb327, sb102 # 3899
+xors 4, 1, sb331, sb167, sb23 # 3900
+xors 4, 1, sb23, sb326, sb331 # 3901
+xors 4, 1, sb327, sb331, sb168 # 3902
+xors 4, 1, sb331, sb167, sb329 # 3903
+xors 4, 1, sb329, sb328, sb331 # 3904
+xors 4, 1, sb167, sb329, sb23 # 3905
+xors 4, 1, sb329, sb331, sb168 # 3906
+xors 4, 1, sb331, sb298, sb526 # 3907
+xors 4, 1, sb298, sb333, sb525 # 3908
+xors 4, 1, sb333, sb297, sb524 # 3909
+xors 4, 1, sb297, sb335, sb523 # 3910
+xors 4, 1, sb335, sb520, sb522 # 3911
+xors 4, 1, sb520, sb338, sb521 # 3912
+xors 4, 1, sb338, sb295, sb520 # 3913
+xors 4, 1, sb295, sb340, sb519 # 3914
+xors 4, 1, sb340, sb294, sb518 # 3915
+xors 4, 1, sb294, sb342, sb517 # 3916
+xors 4, 1, sb342, sb293, sb516 # 3917
+xors 4, 1, sb293, sb344, sb515 # 3918
+xors 4, 1, sb344, sb512, sb514 # 3919
+xors 4, 1, sb512, sb347, sb513 # 3920
+xors 4, 1, sb347, sb291, sb512 # 3921
+xors 4, 1, sb291, sb349, sb511 # 3922
+xors 4, 1, sb349, sb508, sb510 # 3923
+xors 4, 1, sb508, sb351, sb509 # 3924
+xors 4, 1, sb351, sb288, sb508 # 3925
+xors 4, 1, sb288, sb353, sb507 # 3926
+xors 4, 1, sb353, sb287, sb506 # 3927
+xors 4, 1, sb287, sb355, sb505 # 3928
+xors 4, 1, sb355, sb286, sb504 # 3929
+xors 4, 1, sb286, sb357, sb503 # 3930
+xors 4, 1, sb357, sb285, sb502 # 3931
+xors 4, 1, sb285, sb359, sb501 # 3932
+xors 4, 1, sb359, sb284, sb500 # 3933
+xors 4, 1, sb284, sb361, sb499 # 3934
+xors 4, 1, sb361, sb496, sb498 # 3935
+xors 4, 1, sb496, sb365, sb497 # 3936
+xors 4, 1, sb365, sb282, sb496 # 3937
+xors 4, 1, sb282, sb367, sb495 # 3938
+xors 4, 1, sb367, sb281, sb494 # 3939
+xors 4, 1, sb281, sb369, sb493 # 3940
+xors 4, 1, sb369, sb280, sb492 # 3941
+xors 4, 1, sb280, sb278, sb371 # 3942
+xors 4, 1, sb371, sb378, sb380 # 3943
+xors 4, 1, sb278, sb374, sb376 # 3944
+xors 4, 1, sb374, sb277, sb278 # 3945
+xors 4, 1, sb278, sb249, sb276 # 3946
+xors 4, 1, sb376, sb398, sb425 # 3947
+xors 4, 1, sb277, sb394, sb396 # 3948
+xors 4, 1, sb378, sb389, sb392 # 3949
+xors 4, 1, sb276, sb385, sb387 # 3950
+xors 4, 1, sb380, sb274, sb383 # 3951
+xors 4, 1, sb249, sb272, sb273 # 3952
+xors 4, 1, sb383, sb237, sb249 # 3953
+xors 4, 1, sb274, sb223, sb32 # 3954
+xors 4, 1, sb385, sb213, sb117 # 3955
+xors 4, 1, sb273, sb5, sb20 # 3956
+xors 4, 1, sb387, sb452, sb484 # 3957
+xors 4, 1, sb272, sb437, sb439 # 3958
+xors 4, 1, sb389, sb432, sb434 # 3959
+xors 4, 1, sb425, sb428, sb430 # 3960
+xors 4, 1, sb392, sb423, sb425 # 3961
+xors 4, 1, sb394, sb419, sb421 # 3962
+xors 4, 1, sb237, sb414, sb416 # 3963
+xors 4, 1, sb396, sb410, sb412 # 3964
+xors 4, 1, sb213, sb405, sb407 # 3965
+xors 4, 1, sb398, sb401, sb403 # 3966
+xors 4, 1, sb249, sb267, sb58 # 3967
+xors 4, 1, sb401, sb150, sb249 # 3968
+xors 4, 1, sb223, sb208, sb234 # 3969
+xors 4, 1, sb403, sb197, sb202 # 3970
+xors 4, 1, sb32, sb137, sb195 # 3971
+xors 4, 1, sb405, sb155, sb133 # 3972
+xors 4, 1, sb5, sb128, sb162 # 3973
+xors 4, 1, sb407, sb134, sb140 # 3974
+xors 4, 1, sb117, sb131, sb228 # 3975
+xors 4, 1, sb410, sb125, sb117 # 3976
+xors 4, 1, sb249, sb60, sb13 # 3977
+xors 4, 1, sb412, sb55, sb215 # 3978
+xors 4, 1, sb150, sb48, sb52 # 3979
+xors 4, 1, sb414, sb144, sb212 # 3980
+xors 4, 1, sb195, sb37, sb43 # 3981
+xors 4, 1, sb416, sb211, sb38 # 3982
+xors 4, 1, sb20, sb35, sb36 # 3983
+xors 4, 1, sb419, sb24, sb20 # 3984
+xors 4, 1, sb137, sb14, sb22 # 3985
+xors 4, 1, sb421, sb17, sb19 # 3986
+xors 4, 1, sb125, sb16, sb206 # 3987
+xors 4, 1, sb423, sb8, sb10 # 3988
+xors 4, 1, sb58, sb3, sb6 # 3989
+xors 4, 1, sb425, sb491, sb1 # 3990
+xors 4, 1, sb484, sb486, sb488 # 3991
+xors 4, 1, sb428, sb482, sb484 # 3992
+xors 4, 1, sb430, sb477, sb479 # 3993
+xors 4, 1, sb37, sb473, sb475 # 3994
+xors 4, 1, sb432, sb468, sb470 # 3995
+xors 4, 1, sb35, sb464, sb466 # 3996
+xors 4, 1, sb434, sb459, sb461 # 3997
+xors 4, 1, sb452, sb455, sb457 # 3998
+xors 4, 1, sb437, sb450, sb452 # 3999
+xors 4, 1, sb20, sb446, sb448 # 4000
+xors 4, 1, sb439, sb441, sb443 # 4001
+xors 4, 1, sb16, sb292, sb296 # 4002
+xors 4, 1, sb441, sb289, sb290 # 4003
+xors 4, 1, sb6, sb279, sb283 # 4004
+xors 4, 1, sb443, sb271, sb275 # 4005
+xors 4, 1, sb267, sb269, sb270 # 4006
+xors 4, 1, sb446, sb266, sb267 # 4007
+xors 4, 1, sb267, sb263, sb265 # 4008
+xors 4, 1, sb448, sb262, sb154 # 4009
+xors 4, 1, sb263, sb259, sb261 # 4010
+xors 4, 1, sb450, sb253, sb258 # 4011
+xors 4, 1, sb128, sb251, sb152 # 4012
+xors 4, 1, sb452, sb243, sb245 # 4013
+xors 4, 1, sb234, sb236, sb242 # 4014
+xors 4, 1, sb455, sb231, sb234 # 4015
+xors 4, 1, sb131, sb233, sb148 # 4016
+xors 4, 1, sb457, sb229, sb225 # 4017
+xors 4, 1, sb208, sb218, sb147 # 4018
+xors 4, 1, sb459, sb209, sb214 # 4019
+xors 4, 1, sb202, sb203, sb130 # 4020
+xors 4, 1, sb461, sb201, sb142 # 4021
+xors 4, 1, sb197, sb199, sb200 # 4022
+xors 4, 1, sb464, sb193, sb197 # 4023
+xors 4, 1, sb466, sb184, sb191 # 4024
+xors 4, 1, sb162, sb185, sb186 # 4025
+xors 4, 1, sb468, sb178, sb176 # 4026
+xors 4, 1, sb155, sb136, sb174 # 4027
+xors 4, 1, sb470, sb169, sb170 # 4028
+xors 4, 1, sb133, sb163, sb159 # 4029
+xors 4, 1, sb473, sb160, sb133 # 4030
+xors 4, 1, sb140, sb31, sb156 # 4031
+xors 4, 1, sb475, sb149, sb30 # 4032
+xors 4, 1, sb134, sb141, sb153 # 4033
+xors 4, 1, sb477, sb135, sb129 # 4034
+xors 4, 1, sb228, sb124, sb230 # 4035
+xors 4, 1, sb479, sb119, sb116 # 4036
+xors 4, 1, sb117, sb226, sb115 # 4037
+xors 4, 1, sb482, sb114, sb117 # 4038
+xors 4, 1, sb116, sb123, sb108 # 4039
+xors 4, 1, sb484, sb122, sb224 # 4040
+xors 4, 1, sb224, sb222, sb95 # 4041
+xors 4, 1, sb486, sb89, sb85 # 4042
+xors 4, 1, sb222, sb220, sb221 # 4043
+xors 4, 1, sb488, sb72, sb219 # 4044
+xors 4, 1, sb13, sb61, sb64 # 4045
+xors 4, 1, sb491, sb67, sb13 # 4046
+ands 424, 1, sb60, sb59, sb301, 1, sb67, sb302, sb303, 1, sb14, sb304, sb305, 1, sb61, sb57, sb306, 1, sb219, sb307, sb308, 1, sb72, sb309, sb310, 1, sb38, sb311, sb312, 1, sb85, sb70, sb313, 1, sb89, sb314, sb315, 1, sb242, sb316, sb317, 1, sb95, sb318, sb319, 1, sb48, sb320, sb321, 1, sb24, sb322, sb323, 1, sb184, sb324, sb325, 1, sb19, sb326, sb327, 1, sb108, sb328, sb329, 1, sb115, sb330, sb331, 1, sb296, sb332, sb333, 1, sb123, sb334, sb335, 1, sb119, sb110, sb336, 1, sb231, sb337, sb338, 1, sb129, sb339, sb340, 1, sb292, sb341, sb342, 1, sb135, sb343, sb344, 1, sb133, sb127, sb345, 1, sb290, sb346, sb347, 1, sb289, sb348, sb349, 1, sb64, sb350, sb351, 1, sb141, sb352, sb353, 1, sb225, sb354, sb355, 1, sb148, sb356, sb357, 1, sb283, sb358, sb359, 1, sb154, sb360, sb361, 1, sb258, sb139, sb362, 1, sb152, sb146, sb363, 1, sb221, sb364, sb365, 1, sb160, sb366, sb367, 1, sb279, sb368, sb369, 1, sb169, sb370, sb371, 1, sb163, sb158, sb372, 1, sb215, sb373, sb374, 1, sb176, sb375, sb376, 1, sb275, sb377, sb378, 1, sb186, sb379, sb380, 1, sb185, sb173, sb381, 1, sb209, sb382, sb383, 1, sb193, sb384, sb385, 1, sb203, sb386, sb387, 1, sb201, sb388, sb389, 1, sb199, sb188, sb390, 1, sb178, sb391, sb392, 1, sb259, sb393, sb394, 1, sb233, sb395, sb396, 1, sb197, sb397, sb398, 1, sb211, sb205, sb399, 1, sb156, sb400, sb401, 1, sb52, sb402, sb403, 1, sb8, sb404, sb405, 1, sb271, sb406, sb407, 1, sb229, sb217, sb408, 1, sb253, sb409, sb410, 1, sb245, sb411, sb412, 1, sb234, sb413, sb414, 1, sb170, sb415, sb416, 1, sb243, sb235, sb417, 1, sb149, sb418, sb419, 1, sb226, sb420, sb421, 1, sb117, sb422, sb423, 1, sb214, sb424, sb425, 1, sb251, sb247, sb426, 1, sb212, sb427, sb428, 1, sb144, sb429, sb430, 1, sb36, sb431, sb432, 1, sb31, sb433, sb434, 1, sb1, sb255, sb435, 1, sb22, sb436, sb437, 1, sb17, sb438, sb439, 1, sb13, sb440, sb441, 1, sb3, sb442, sb443, 1, sb10, sb7, sb444, 1, sb269, sb445, sb446, 1, sb265, sb447, sb448, 1, sb261, sb449, sb450, 1, sb236, sb451, sb452, 1, sb30, sb18, sb453, 1, sb230, sb454, sb455, 1, sb218, sb456, sb457, 1, sb206, sb458, sb459, 1, sb200, sb460, sb461, 1, sb43, sb33, sb462, 1, sb191, sb463, sb464, 1, sb174, sb465, sb466, 1, sb159, sb467, sb468, 1, sb153, sb469, sb470, 1, sb262, sb260, sb471, 1, sb142, sb472, sb473, 1, sb136, sb474, sb475, 1, sb130, sb476, sb477, 1, sb124, sb478, sb479, 1, sb266, sb264, sb480, 1, sb147, sb481, sb482, 1, sb114, sb483, sb484, 1, sb122, sb485, sb486, 1, sb220, sb487, sb488, 1, sb270, sb268, sb489, 1, sb55, sb490, sb491 # 4047
+xors 4, 1, sb59, sb60, sb300 # 4048
+xors 4, 1, sb60, sb67, sb80 # 4049
+xors 4, 1, sb80, sb14, sb39 # 4050
+xors 4, 1, sb67, sb219, sb80 # 4051
+xors 4, 1, sb39, sb15, sb72 # 4052
+xors 4, 1, sb14, sb15, sb38 # 4053
+xors 4, 1, sb72, sb14, sb39 # 4054
+xors 4, 1, sb14, sb85, sb104 # 4055
+nots 1, sb15, sb14 # 4056
+xors 4, 1, sb80, sb187, sb89 # 4057
+xors 4, 1, sb38, sb75, sb80 # 4058
+xors 4, 1, sb219, sb80, sb34 # 4059
+xors 4, 1, sb104, sb187, sb242 # 4060
+xors 4, 1, sb187, sb78, sb104 # 4061
+xors 4, 1, sb242, sb187, sb38 # 4062
+xors 4, 1, sb80, sb104, sb34 # 4063
+xors 4, 1, sb89, sb257, sb95 # 4064
+xors 4, 1, sb187, sb83, sb89 # 4065
+xors 4, 1, sb85, sb89, sb21 # 4066
+xors 4, 1, sb95, sb257, sb48 # 4067
+xors 4, 1, sb104, sb87, sb95 # 4068
+xors 4, 1, sb48, sb104, sb187 # 4069
+xors 4, 1, sb89, sb95, sb21 # 4070
+xors 4, 1, sb257, sb102, sb24 # 4071
+xors 4, 1, sb24, sb91, sb257 # 4072
+xors 4, 1, sb95, sb257, sb11 # 4073
+xors 4, 1, sb104, sb102, sb184 # 4074
+xors 4, 1, sb257, sb98, sb104 # 4075
+xors 4, 1, sb184, sb257, sb24 # 4076
+xors 4, 1, sb102, sb104, sb11 # 4077
+xors 4, 1, sb257, sb168, sb19 # 4078
+xors 4, 1, sb19, sb105, sb257 # 4079
+xors 4, 1, sb104, sb257, sb2 # 4080
+xors 4, 1, sb257, sb168, sb108 # 4081
+xors 4, 1, sb108, sb107, sb257 # 4082
+xors 4, 1, sb168, sb108, sb19 # 4083
+xors 4, 1, sb108, sb257, sb2 # 4084
+xors 4, 1, sb257, sb115, sb299 # 4085
+xors 4, 1, sb115, sb296, sb298 # 4086
+xors 4, 1, sb296, sb123, sb297 # 4087
+xors 4, 1, sb123, sb231, sb296 # 4088
+xors 4, 1, sb231, sb129, sb295 # 4089
+xors 4, 1, sb129, sb292, sb294 # 4090
+xors 4, 1, sb292, sb135, sb293 # 4091
+xors 4, 1, sb135, sb290, sb292 # 4092
+xors 4, 1, sb290, sb289, sb291 # 4093
+xors 4, 1, sb289, sb64, sb290 # 4094
+xors 4, 1, sb64, sb227, sb289 # 4095
+xors 4, 1, sb227, sb141, sb288 # 4096
+xors 4, 1, sb141, sb225, sb287 # 4097
+xors 4, 1, sb225, sb148, sb286 # 4098
+xors 4, 1, sb148, sb283, sb285 # 4099
+xors 4, 1, sb283, sb154, sb284 # 4100
+xors 4, 1, sb154, sb221, sb283 # 4101
+xors 4, 1, sb221, sb160, sb282 # 4102
+xors 4, 1, sb160, sb279, sb281 # 4103
+xors 4, 1, sb279, sb169, sb280 # 4104
+xors 4, 1, sb169, sb215, sb279 # 4105
+xors 4, 1, sb215, sb176, sb278 # 4106
+xors 4, 1, sb176, sb275, sb277 # 4107
+xors 4, 1, sb275, sb186, sb276 # 4108
+xors 4, 1, sb186, sb209, sb275 # 4109
+xors 4, 1, sb209, sb193, sb274 # 4110
+xors 4, 1, sb193, sb203, sb273 # 4111
+xors 4, 1, sb203, sb201, sb272 # 4112
+xors 4, 1, sb201, sb178, sb203 # 4113
+xors 4, 1, sb203, sb259, sb207 # 4114
+xors 4, 1, sb207, sb233, sb237 # 4115
+xors 4, 1, sb178, sb197, sb213 # 4116
+xors 4, 1, sb213, sb156, sb178 # 4117
+xors 4, 1, sb197, sb52, sb223 # 4118
+xors 4, 1, sb223, sb8, sb32 # 4119
+xors 4, 1, sb259, sb271, sb5 # 4120
+xors 4, 1, sb233, sb253, sb259 # 4121
+xors 4, 1, sb178, sb245, sb249 # 4122
+xors 4, 1, sb237, sb234, sb150 # 4123
+xors 4, 1, sb156, sb170, sb195 # 4124
+xors 4, 1, sb245, sb149, sb156 # 4125
+xors 4, 1, sb170, sb226, sb137 # 4126
+xors 4, 1, sb249, sb117, sb125 # 4127
+xors 4, 1, sb52, sb214, sb58 # 4128
+xors 4, 1, sb253, sb212, sb52 # 4129
+xors 4, 1, sb156, sb144, sb42 # 4130
+xors 4, 1, sb259, sb36, sb37 # 4131
+xors 4, 1, sb32, sb31, sb35 # 4132
+xors 4, 1, sb5, sb22, sb32 # 4133
+xors 4, 1, sb150, sb17, sb20 # 4134
+xors 4, 1, sb8, sb13, sb16 # 4135
+xors 4, 1, sb271, sb3, sb6 # 4136
+xors 4, 1, sb16, sb269, sb271 # 4137
+xors 4, 1, sb144, sb265, sb267 # 4138
+xors 4, 1, sb20, sb261, sb263 # 4139
+xors 4, 1, sb234, sb236, sb128 # 4140
+xors 4, 1, sb32, sb230, sb234 # 4141
+xors 4, 1, sb137, sb218, sb131 # 4142
+xors 4, 1, sb42, sb206, sb208 # 4143
+xors 4, 1, sb195, sb200, sb202 # 4144
+xors 4, 1, sb52, sb191, sb195 # 4145
+xors 4, 1, sb131, sb174, sb177 # 4146
+xors 4, 1, sb261, sb159, sb162 # 4147
+xors 4, 1, sb149, sb153, sb155 # 4148
+xors 4, 1, sb263, sb142, sb149 # 4149
+xors 4, 1, sb125, sb136, sb140 # 4150
+xors 4, 1, sb265, sb130, sb134 # 4151
+xors 4, 1, sb226, sb124, sb228 # 4152
+xors 4, 1, sb267, sb147, sb226 # 4153
+xors 4, 1, sb117, sb114, sb116 # 4154
+xors 4, 1, sb269, sb122, sb224 # 4155
+xors 4, 1, sb58, sb220, sb222 # 4156
+xors 4, 1, sb271, sb55, sb58 # 4157
+ands 184, 1, sb58, sb57, sb60, 1, sb55, sb61, sb67, 1, sb37, sb70, sb72, 1, sb36, sb75, sb219, 1, sb35, sb78, sb80, 1, sb31, sb83, sb85, 1, sb22, sb87, sb89, 1, sb17, sb91, sb95, 1, sb13, sb98, sb102, 1, sb6, sb105, sb104, 1, sb3, sb107, sb108, 1, sb236, sb110, sb115, 1, sb234, sb119, sb123, 1, sb230, sb127, sb129, 1, sb228, sb133, sb135, 1, sb226, sb139, sb141, 1, sb224, sb146, sb148, 1, sb222, sb152, sb154, 1, sb220, sb158, sb160, 1, sb218, sb163, sb169, 1, sb214, sb173, sb176, 1, sb212, sb185, sb186, 1, sb208, sb188, sb193, 1, sb206, sb199, sb201, 1, sb202, sb205, sb207, 1, sb200, sb211, sb213, 1, sb195, sb217, sb223, 1, sb191, sb229, sb233, 1, sb177, sb235, sb237, 1, sb174, sb243, sb245, 1, sb162, sb247, sb249, 1, sb159, sb251, sb253, 1, sb155, sb255, sb259, 1, sb153, sb1, sb5, 1, sb149, sb7, sb8, 1, sb147, sb10, sb16, 1, sb142, sb18, sb20, 1, sb140, sb30, sb32, 1, sb136, sb33, sb42, 1, sb134, sb43, sb52, 1, sb130, sb260, sb261, 1, sb128, sb262, sb263, 1, sb124, sb264, sb265, 1, sb122, sb266, sb267, 1, sb116, sb268, sb269, 1, sb114, sb270, sb271 # 4158
+xors 4, 1, sb57, sb58, sb59 # 4159
+xors 4, 1, sb52, sb55, sb57 # 4160
+xors 4, 1, sb43, sb52, sb53 # 4161
+xors 4, 1, sb42, sb43, sb45 # 4162
+xors 4, 1, sb60, sb40, sb42 # 4163
+xors 4, 1, sb237, sb37, sb39 # 4164
+xors 4, 1, sb32, sb34, sb36 # 4165
+xors 4, 1, sb33, sb34, sb35 # 4166
+xors 4, 1, sb243, sb33, sb32 # 4167
+xors 4, 1, sb30, sb21, sb31 # 4168
+xors 4, 1, sb163, sb244, sb30 # 4169
+xors 4, 1, sb245, sb30, sb9 # 4170
+xors 4, 1, sb18, sb21, sb22 # 4171
+xors 4, 1, sb20, sb246, sb18 # 4172
+xors 4, 1, sb188, sb20, sb163 # 4173
+xors 4, 1, sb247, sb18, sb9 # 4174
+xors 4, 1, sb16, sb11, sb17 # 4175
+xors 4, 1, sb10, sb248, sb16 # 4176
+xors 4, 1, sb249, sb16, sb103 # 4177
+xors 4, 1, sb7, sb11, sb13 # 4178
+xors 4, 1, sb8, sb250, sb7 # 4179
+xors 4, 1, sb185, sb8, sb10 # 4180
+xors 4, 1, sb251, sb7, sb103 # 4181
+xors 4, 1, sb5, sb2, sb6 # 4182
+xors 4, 1, sb11, sb252, sb5 # 4183
+xors 4, 1, sb253, sb5, sb56 # 4184
+xors 4, 1, sb259, sb2, sb3 # 4185
+xors 4, 1, sb1, sb254, sb259 # 4186
+xors 4, 1, sb169, sb1, sb11 # 4187
+xors 4, 1, sb255, sb259, sb56 # 4188
+xors 4, 1, sb235, sb236, sb257 # 4189
+xors 4, 1, sb233, sb234, sb235 # 4190
+xors 4, 1, sb61, sb232, sb233 # 4191
+xors 4, 1, sb229, sb230, sb231 # 4192
+xors 4, 1, sb257, sb228, sb229 # 4193
+xors 4, 1, sb108, sb226, sb227 # 4194
+xors 4, 1, sb223, sb224, sb225 # 4195
+xors 4, 1, sb259, sb222, sb223 # 4196
+xors 4, 1, sb219, sb220, sb221 # 4197
+xors 4, 1, sb217, sb218, sb219 # 4198
+xors 4, 1, sb67, sb216, sb217 # 4199
+xors 4, 1, sb213, sb214, sb215 # 4200
+xors 4, 1, sb211, sb212, sb213 # 4201
+xors 4, 1, sb70, sb210, sb211 # 4202
+xors 4, 1, sb207, sb208, sb209 # 4203
+xors 4, 1, sb205, sb206, sb207 # 4204
+xors 4, 1, sb72, sb204, sb205 # 4205
+xors 4, 1, sb201, sb202, sb203 # 4206
+xors 4, 1, sb199, sb200, sb201 # 4207
+xors 4, 1, sb75, sb198, sb199 # 4208
+xors 4, 1, sb193, sb195, sb197 # 4209
+xors 4, 1, sb186, sb191, sb193 # 4210
+xors 4, 1, sb78, sb179, sb186 # 4211
+xors 4, 1, sb176, sb177, sb178 # 4212
+xors 4, 1, sb173, sb174, sb176 # 4213
+xors 4, 1, sb80, sb172, sb173 # 4214
+xors 4, 1, sb160, sb162, sb170 # 4215
+xors 4, 1, sb158, sb159, sb160 # 4216
+xors 4, 1, sb83, sb157, sb158 # 4217
+xors 4, 1, sb154, sb155, sb156 # 4218
+xors 4, 1, sb152, sb153, sb154 # 4219
+xors 4, 1, sb85, sb151, sb152 # 4220
+xors 4, 1, sb148, sb149, sb150 # 4221
+xors 4, 1, sb146, sb147, sb148 # 4222
+xors 4, 1, sb87, sb145, sb146 # 4223
+xors 4, 1, sb141, sb142, sb144 # 4224
+xors 4, 1, sb139, sb140, sb141 # 4225
+xors 4, 1, sb89, sb138, sb139 # 4226
+xors 4, 1, sb135, sb136, sb137 # 4227
+xors 4, 1, sb133, sb134, sb135 # 4228
+xors 4, 1, sb91, sb132, sb133 # 4229
+xors 4, 1, sb129, sb130, sb131 # 4230
+xors 4, 1, sb127, sb128, sb129 # 4231
+xors 4, 1, sb95, sb126, sb127 # 4232
+xors 4, 1, sb123, sb124, sb125 # 4233
+xors 4, 1, sb119, sb122, sb123 # 4234
+xors 4, 1, sb98, sb118, sb119 # 4235
+xors 4, 1, sb115, sb116, sb117 # 4236
+xors 4, 1, sb110, sb114, sb115 # 4237
+dabit s3, sb107 # 4238
+xors 4, 1, sb102, sb107, sb110 # 4239
+mulsi s2, s3, 2 # 4240
+dabit s4, sb105 # 4241
+xors 4, 1, sb104, sb105, sb106 # 4242
+reveal 105, 1, cb43, sb60, 1, cb33, sb61, 1, cb32, sb62, 1, cb31, sb63, 1, cb30, sb64, 1, cb29, sb65, 1, cb28, sb66, 1, cb27, sb67, 1, cb26, sb69, 1, cb25, sb70, 1, cb24, sb71, 1, cb23, sb72, 1, cb22, sb74, 1, cb21, sb75, 1, cb20, sb77, 1, cb19, sb78, 1, cb18, sb79, 1, cb17, sb80, 1, cb16, sb82, 1, cb15, sb83, 1, cb14, sb84, 1, cb13, sb85, 1, cb12, sb86, 1, cb11, sb87, 1, cb10, sb88, 1, cb9, sb89, 1, cb8, sb90, 1, cb7, sb91, 1, cb6, sb93, 1, cb5, sb95, 1, cb4, sb96, 1, cb3, sb98, 1, cb2, sb100, 1, cb1, sb102, 1, cb0, sb104 # 4243
+convcbitvec 1, ci0, cb43 # 4244
+convint c37, ci0 # 4245
+addm s116, s118, c37 # 4246
+convint c37, ci0 # 4247
+mulm s118, s153, c37 # 4248
+subs s153, s116, s118 # 4249
+movs s118, s153 # 4250
+movs s116, s118 # 4251
+mulsi s153, s116, 2 # 4252
+subsfi s118, s153, 1 # 4253
+muls 4, 1, s116, s118, s90 # 4254
+split 95, 3, s116, sb58, sb59, sb138, sb55, sb57, sb2, sb43, sb45, sb125, sb39, sb42, sb106, sb35, sb37, sb89, sb21, sb31, sb78, sb17, sb20, sb70, sb8, sb13, sb65, sb5, sb7, sb53, sb1, sb3, sb36, sb235, sb236, sb22, sb233, sb234, sb148, sb231, sb232, sb137, sb229, sb230, sb132, sb227, sb228, sb129, sb225, sb226, sb119, sb223, sb224, sb75, sb221, sb222, sb61, sb219, sb220, sb52, sb217, sb218, sb174, sb193, sb195, sb40, sb186, sb191, sb157, sb176, sb179, sb154, sb170, sb173, sb147, sb159, sb160, sb136, sb155, sb158, sb6, sb144, sb150, sb117, sb130, sb139, sb85, sb124, sb126, sb197, sb118, sb123, sb98, sb95, sb90, sb96 # 4255
+xors 4, 1, sb141, sb138, sb59 # 4256
+xors 4, 1, sb162, sb141, sb58 # 4257
+xors 4, 1, sb142, sb58, sb138 # 4258
+xors 4, 1, sb16, sb2, sb57 # 4259
+xors 4, 1, sb134, sb16, sb55 # 4260
+xors 4, 1, sb145, sb55, sb2 # 4261
+xors 4, 1, sb18, sb125, sb45 # 4262
+xors 4, 1, sb128, sb18, sb43 # 4263
+xors 4, 1, sb149, sb43, sb125 # 4264
+xors 4, 1, sb153, sb106, sb42 # 4265
+xors 4, 1, sb122, sb153, sb39 # 4266
+xors 4, 1, sb30, sb39, sb106 # 4267
+xors 4, 1, sb33, sb89, sb37 # 4268
+xors 4, 1, sb102, sb33, sb35 # 4269
+xors 4, 1, sb34, sb35, sb89 # 4270
+xors 4, 1, sb37, sb78, sb31 # 4271
+xors 4, 1, sb86, sb37, sb21 # 4272
+xors 4, 1, sb177, sb21, sb78 # 4273
+xors 4, 1, sb55, sb70, sb20 # 4274
+xors 4, 1, sb72, sb55, sb17 # 4275
+xors 4, 1, sb58, sb17, sb70 # 4276
+xors 4, 1, sb62, sb65, sb13 # 4277
+xors 4, 1, sb69, sb62, sb8 # 4278
+xors 4, 1, sb77, sb8, sb65 # 4279
+xors 4, 1, sb82, sb53, sb7 # 4280
+xors 4, 1, sb64, sb82, sb5 # 4281
+xors 4, 1, sb88, sb5, sb53 # 4282
+xors 4, 1, sb110, sb36, sb3 # 4283
+xors 4, 1, sb172, sb110, sb1 # 4284
+xors 4, 1, sb114, sb1, sb36 # 4285
+xors 4, 1, sb116, sb22, sb236 # 4286
+xors 4, 1, sb35, sb116, sb235 # 4287
+xors 4, 1, sb198, sb235, sb22 # 4288
+xors 4, 1, sb199, sb148, sb234 # 4289
+xors 4, 1, sb151, sb199, sb233 # 4290
+xors 4, 1, sb200, sb233, sb148 # 4291
+xors 4, 1, sb201, sb137, sb232 # 4292
+xors 4, 1, sb146, sb201, sb231 # 4293
+xors 4, 1, sb202, sb231, sb137 # 4294
+xors 4, 1, sb203, sb132, sb230 # 4295
+xors 4, 1, sb8, sb203, sb229 # 4296
+xors 4, 1, sb204, sb229, sb132 # 4297
+xors 4, 1, sb205, sb129, sb228 # 4298
+xors 4, 1, sb131, sb205, sb227 # 4299
+xors 4, 1, sb206, sb227, sb129 # 4300
+xors 4, 1, sb207, sb119, sb226 # 4301
+xors 4, 1, sb127, sb207, sb225 # 4302
+xors 4, 1, sb208, sb225, sb119 # 4303
+xors 4, 1, sb209, sb75, sb224 # 4304
+xors 4, 1, sb104, sb209, sb223 # 4305
+xors 4, 1, sb210, sb223, sb75 # 4306
+xors 4, 1, sb211, sb61, sb222 # 4307
+xors 4, 1, sb66, sb211, sb221 # 4308
+xors 4, 1, sb212, sb221, sb61 # 4309
+xors 4, 1, sb213, sb52, sb220 # 4310
+xors 4, 1, sb59, sb213, sb219 # 4311
+xors 4, 1, sb214, sb219, sb52 # 4312
+xors 4, 1, sb215, sb174, sb218 # 4313
+xors 4, 1, sb178, sb215, sb217 # 4314
+xors 4, 1, sb216, sb217, sb174 # 4315
+xors 4, 1, sb217, sb40, sb195 # 4316
+xors 4, 1, sb45, sb217, sb193 # 4317
+xors 4, 1, sb218, sb193, sb40 # 4318
+xors 4, 1, sb219, sb157, sb191 # 4319
+xors 4, 1, sb39, sb219, sb186 # 4320
+xors 4, 1, sb220, sb186, sb157 # 4321
+xors 4, 1, sb221, sb154, sb179 # 4322
+xors 4, 1, sb156, sb221, sb176 # 4323
+xors 4, 1, sb222, sb176, sb154 # 4324
+xors 4, 1, sb223, sb147, sb173 # 4325
+xors 4, 1, sb152, sb223, sb170 # 4326
+xors 4, 1, sb224, sb170, sb147 # 4327
+xors 4, 1, sb225, sb136, sb160 # 4328
+xors 4, 1, sb140, sb225, sb159 # 4329
+xors 4, 1, sb226, sb159, sb136 # 4330
+xors 4, 1, sb227, sb6, sb158 # 4331
+xors 4, 1, sb135, sb227, sb155 # 4332
+xors 4, 1, sb228, sb155, sb6 # 4333
+xors 4, 1, sb229, sb117, sb150 # 4334
+xors 4, 1, sb133, sb229, sb144 # 4335
+xors 4, 1, sb230, sb144, sb117 # 4336
+xors 4, 1, sb231, sb85, sb139 # 4337
+xors 4, 1, sb91, sb231, sb130 # 4338
+xors 4, 1, sb232, sb130, sb85 # 4339
+xors 4, 1, sb233, sb197, sb126 # 4340
+xors 4, 1, sb83, sb233, sb124 # 4341
+xors 4, 1, sb234, sb124, sb197 # 4342
+xors 4, 1, sb235, sb98, sb123 # 4343
+xors 4, 1, sb195, sb235, sb118 # 4344
+xors 4, 1, sb236, sb118, sb98 # 4345
+ands 180, 1, sb13, sb141, sb142, 1, sb3, sb16, sb145, 1, sb126, sb18, sb149, 1, sb107, sb153, sb30, 1, sb93, sb33, sb34, 1, sb80, sb37, sb177, 1, sb71, sb55, sb58, 1, sb67, sb62, sb77, 1, sb63, sb82, sb88, 1, sb42, sb110, sb114, 1, sb158, sb116, sb198, 1, sb150, sb199, sb200, 1, sb144, sb201, sb202, 1, sb5, sb203, sb204, 1, sb130, sb205, sb206, 1, sb123, sb207, sb208, 1, sb84, sb209, sb210, 1, sb191, sb211, sb212, 1, sb57, sb213, sb214, 1, sb176, sb215, sb216, 1, sb43, sb217, sb218, 1, sb160, sb219, sb220, 1, sb155, sb221, sb222, 1, sb20, sb223, sb224, 1, sb139, sb225, sb226, 1, sb7, sb227, sb228, 1, sb124, sb229, sb230, 1, sb87, sb231, sb232, 1, sb79, sb233, sb234, 1, sb100, sb235, sb236, 1, sb193, sb162, sb162, 1, sb186, sb237, sb238, 1, sb179, sb237, sb239, 1, sb173, sb237, sb240, 1, sb170, sb237, sb241, 1, sb159, sb237, sb242, 1, sb31, sb237, sb243, 1, sb21, sb244, sb245, 1, sb17, sb246, sb247, 1, sb1, sb248, sb249, 1, sb115, sb250, sb251, 1, sb74, sb252, sb253, 1, sb60, sb254, sb255, 1, sb118, sb256, sb257, 1, sb105, sb258, sb259 # 4346
+xors 4, 1, sb177, sb138, sb13 # 4347
+xors 4, 1, sb116, sb177, sb134 # 4348
+xors 4, 1, sb114, sb2, sb3 # 4349
+xors 4, 1, sb88, sb114, sb128 # 4350
+xors 4, 1, sb110, sb125, sb126 # 4351
+xors 4, 1, sb62, sb110, sb122 # 4352
+xors 4, 1, sb149, sb106, sb107 # 4353
+xors 4, 1, sb153, sb149, sb102 # 4354
+xors 4, 1, sb37, sb89, sb93 # 4355
+xors 4, 1, sb77, sb37, sb86 # 4356
+xors 4, 1, sb58, sb37, sb86 # 4357
+nots 1, sb82, sb58 # 4358
+xors 4, 1, sb34, sb82, sb77 # 4359
+nots 1, sb125, sb37 # 4360
+xors 4, 1, sb55, sb78, sb80 # 4361
+xors 4, 1, sb122, sb55, sb72 # 4362
+xors 4, 1, sb145, sb55, sb72 # 4363
+xors 4, 1, sb106, sb70, sb71 # 4364
+xors 4, 1, sb102, sb106, sb69 # 4365
+xors 4, 1, sb128, sb106, sb69 # 4366
+xors 4, 1, sb142, sb65, sb67 # 4367
+xors 4, 1, sb16, sb142, sb64 # 4368
+xors 4, 1, sb18, sb142, sb64 # 4369
+xors 4, 1, sb141, sb53, sb63 # 4370
+xors 4, 1, sb3, sb141, sb172 # 4371
+xors 4, 1, sb30, sb141, sb172 # 4372
+xors 4, 1, sb70, sb36, sb42 # 4373
+xors 4, 1, sb78, sb70, sb35 # 4374
+xors 4, 1, sb126, sb70, sb35 # 4375
+nots 1, sb33, sb126 # 4376
+xors 4, 1, sb86, sb33, sb78 # 4377
+nots 1, sb64, sb70 # 4378
+xors 4, 1, sb93, sb22, sb158 # 4379
+xors 4, 1, sb158, sb93, sb151 # 4380
+xors 4, 1, sb13, sb93, sb151 # 4381
+xors 4, 1, sb134, sb148, sb150 # 4382
+xors 4, 1, sb138, sb134, sb146 # 4383
+xors 4, 1, sb80, sb134, sb146 # 4384
+xors 4, 1, sb107, sb137, sb144 # 4385
+xors 4, 1, sb33, sb107, sb8 # 4386
+xors 4, 1, sb65, sb107, sb8 # 4387
+xors 4, 1, sb8, sb132, sb5 # 4388
+xors 4, 1, sb144, sb8, sb131 # 4389
+xors 4, 1, sb146, sb8, sb131 # 4390
+xors 4, 1, sb5, sb129, sb130 # 4391
+xors 4, 1, sb71, sb5, sb127 # 4392
+xors 4, 1, sb82, sb5, sb127 # 4393
+xors 4, 1, sb53, sb119, sb123 # 4394
+xors 4, 1, sb67, sb53, sb104 # 4395
+xors 4, 1, sb2, sb53, sb104 # 4396
+nots 1, sb89, sb2 # 4397
+xors 4, 1, sb72, sb89, sb67 # 4398
+nots 1, sb69, sb53 # 4399
+xors 4, 1, sb36, sb75, sb84 # 4400
+xors 4, 1, sb35, sb36, sb66 # 4401
+xors 4, 1, sb172, sb36, sb66 # 4402
+xors 4, 1, sb63, sb61, sb191 # 4403
+xors 4, 1, sb104, sb63, sb59 # 4404
+xors 4, 1, sb22, sb63, sb59 # 4405
+xors 4, 1, sb42, sb52, sb57 # 4406
+xors 4, 1, sb61, sb42, sb178 # 4407
+xors 4, 1, sb119, sb42, sb178 # 4408
+xors 4, 1, sb130, sb174, sb176 # 4409
+xors 4, 1, sb148, sb130, sb45 # 4410
+xors 4, 1, sb150, sb130, sb45 # 4411
+xors 4, 1, sb132, sb40, sb43 # 4412
+xors 4, 1, sb75, sb132, sb39 # 4413
+xors 4, 1, sb123, sb132, sb39 # 4414
+xors 4, 1, sb89, sb157, sb160 # 4415
+xors 4, 1, sb129, sb89, sb156 # 4416
+xors 4, 1, sb131, sb89, sb156 # 4417
+xors 4, 1, sb39, sb154, sb155 # 4418
+xors 4, 1, sb57, sb39, sb152 # 4419
+xors 4, 1, sb137, sb39, sb152 # 4420
+nots 1, sb151, sb137 # 4421
+xors 4, 1, sb59, sb151, sb57 # 4422
+nots 1, sb151, sb39 # 4423
+xors 4, 1, sb127, sb147, sb20 # 4424
+xors 4, 1, sb174, sb127, sb140 # 4425
+xors 4, 1, sb176, sb127, sb140 # 4426
+xors 4, 1, sb157, sb136, sb139 # 4427
+xors 4, 1, sb45, sb157, sb135 # 4428
+xors 4, 1, sb160, sb157, sb135 # 4429
+xors 4, 1, sb155, sb6, sb7 # 4430
+xors 4, 1, sb140, sb155, sb133 # 4431
+xors 4, 1, sb156, sb155, sb133 # 4432
+xors 4, 1, sb20, sb117, sb124 # 4433
+xors 4, 1, sb152, sb20, sb91 # 4434
+xors 4, 1, sb154, sb20, sb91 # 4435
+xors 4, 1, sb84, sb85, sb87 # 4436
+xors 4, 1, sb136, sb84, sb83 # 4437
+xors 4, 1, sb139, sb84, sb83 # 4438
+xors 4, 1, sb66, sb197, sb79 # 4439
+xors 4, 1, sb133, sb66, sb195 # 4440
+xors 4, 1, sb135, sb66, sb195 # 4441
+xors 4, 1, sb191, sb162, sb193 # 4442
+xors 4, 1, sb178, sb116, sb191 # 4443
+xors 4, 1, sb52, sb191, sb177 # 4444
+xors 4, 1, sb43, sb186, sb189 # 4445
+xors 4, 1, sb40, sb179, sb54 # 4446
+xors 4, 1, sb83, sb173, sb175 # 4447
+xors 4, 1, sb6, sb170, sb171 # 4448
+xors 4, 1, sb85, sb159, sb38 # 4449
+nots 1, sb124, sb85 # 4450
+xors 4, 1, sb91, sb31, sb32 # 4451
+xors 4, 1, sb147, sb9, sb21 # 4452
+xors 4, 1, sb7, sb9, sb17 # 4453
+xors 4, 1, sb189, sb7, sb147 # 4454
+xors 4, 1, sb117, sb103, sb1 # 4455
+xors 4, 1, sb7, sb190, sb117 # 4456
+xors 4, 1, sb191, sb117, sb50 # 4457
+xors 4, 1, sb79, sb103, sb115 # 4458
+xors 4, 1, sb87, sb192, sb79 # 4459
+xors 4, 1, sb186, sb87, sb7 # 4460
+xors 4, 1, sb193, sb79, sb50 # 4461
+xors 4, 1, sb197, sb56, sb74 # 4462
+xors 4, 1, sb9, sb194, sb197 # 4463
+xors 4, 1, sb195, sb197, sb92 # 4464
+xors 4, 1, sb179, sb56, sb60 # 4465
+xors 4, 1, sb115, sb196, sb179 # 4466
+xors 4, 1, sb170, sb115, sb9 # 4467
+xors 4, 1, sb197, sb179, sb92 # 4468
+ands 80, 1, sb115, sb116, sb52, 1, sb173, sb77, sb37, 1, sb38, sb58, sb125, 1, sb31, sb78, sb70, 1, sb17, sb126, sb64, 1, sb60, sb67, sb53, 1, sb54, sb2, sb69, 1, sb175, sb57, sb39, 1, sb32, sb137, sb151, 1, sb56, sb91, sb161, 1, sb21, sb91, sb97, 1, sb103, sb91, sb101, 1, sb1, sb91, sb41, 1, sb179, sb91, sb48, 1, sb159, sb91, sb188, 1, sb79, sb91, sb189, 1, sb87, sb190, sb191, 1, sb74, sb192, sb193, 1, sb171, sb194, sb195, 1, sb117, sb196, sb197 # 4469
+xors 4, 1, sb48, sb177, sb115 # 4470
+xors 4, 1, sb126, sb88, sb48 # 4471
+xors 4, 1, sb64, sb126, sb178 # 4472
+xors 4, 1, sb97, sb48, sb114 # 4473
+xors 4, 1, sb41, sb37, sb173 # 4474
+xors 4, 1, sb125, sb122, sb41 # 4475
+xors 4, 1, sb137, sb41, sb55 # 4476
+xors 4, 1, sb161, sb37, sb38 # 4477
+xors 4, 1, sb101, sb145, sb161 # 4478
+xors 4, 1, sb52, sb101, sb125 # 4479
+xors 4, 1, sb151, sb161, sb55 # 4480
+xors 4, 1, sb91, sb70, sb31 # 4481
+xors 4, 1, sb115, sb158, sb91 # 4482
+xors 4, 1, sb161, sb91, sb93 # 4483
+xors 4, 1, sb2, sb70, sb17 # 4484
+xors 4, 1, sb69, sb13, sb2 # 4485
+xors 4, 1, sb91, sb69, sb115 # 4486
+xors 4, 1, sb116, sb2, sb93 # 4487
+xors 4, 1, sb58, sb53, sb60 # 4488
+xors 4, 1, sb38, sb35, sb58 # 4489
+xors 4, 1, sb41, sb58, sb36 # 4490
+xors 4, 1, sb48, sb53, sb54 # 4491
+xors 4, 1, sb177, sb172, sb48 # 4492
+xors 4, 1, sb70, sb177, sb38 # 4493
+xors 4, 1, sb173, sb48, sb36 # 4494
+xors 4, 1, sb58, sb39, sb175 # 4495
+xors 4, 1, sb54, sb174, sb58 # 4496
+xors 4, 1, sb175, sb58, sb127 # 4497
+xors 4, 1, sb31, sb39, sb32 # 4498
+xors 4, 1, sb37, sb176, sb31 # 4499
+xors 4, 1, sb60, sb37, sb54 # 4500
+xors 4, 1, sb177, sb31, sb127 # 4501
+xors 4, 1, sb17, sb56, sb25 # 4502
+xors 4, 1, sb2, sb21, sb26 # 4503
+xors 4, 1, sb69, sb103, sb12 # 4504
+xors 4, 1, sb32, sb1, sb0 # 4505
+xors 4, 1, sb25, sb179, sb187 # 4506
+xors 4, 1, sb53, sb159, sb163 # 4507
+nots 1, sb101, sb53 # 4508
+xors 4, 1, sb179, sb79, sb147 # 4509
+xors 4, 1, sb1, sb50, sb87 # 4510
+xors 4, 1, sb48, sb50, sb74 # 4511
+xors 4, 1, sb187, sb48, sb1 # 4512
+ands 72, 1, sb87, sb88, sb97, 1, sb37, sb122, sb137, 1, sb56, sb145, sb151, 1, sb159, sb158, sb161, 1, sb79, sb13, sb116, 1, sb50, sb35, sb41, 1, sb39, sb172, sb173, 1, sb163, sb174, sb175, 1, sb147, sb176, sb177, 1, sb74, sb126, sb178, 1, sb48, sb179, sb180, 1, sb58, sb179, sb181, 1, sb31, sb179, sb182, 1, sb26, sb179, sb183, 1, sb21, sb179, sb184, 1, sb12, sb179, sb185, 1, sb103, sb179, sb186, 1, sb0, sb179, sb187 # 4513
+xors 4, 1, sb41, sb114, sb87 # 4514
+xors 4, 1, sb158, sb62, sb41 # 4515
+xors 4, 1, sb88, sb41, sb110 # 4516
+xors 4, 1, sb35, sb55, sb37 # 4517
+xors 4, 1, sb97, sb102, sb35 # 4518
+xors 4, 1, sb122, sb35, sb106 # 4519
+xors 4, 1, sb161, sb55, sb56 # 4520
+xors 4, 1, sb13, sb128, sb161 # 4521
+xors 4, 1, sb116, sb13, sb97 # 4522
+xors 4, 1, sb137, sb161, sb106 # 4523
+xors 4, 1, sb151, sb93, sb159 # 4524
+xors 4, 1, sb35, sb138, sb151 # 4525
+xors 4, 1, sb145, sb151, sb134 # 4526
+xors 4, 1, sb114, sb93, sb79 # 4527
+xors 4, 1, sb87, sb80, sb114 # 4528
+xors 4, 1, sb93, sb87, sb35 # 4529
+xors 4, 1, sb151, sb114, sb134 # 4530
+xors 4, 1, sb41, sb36, sb50 # 4531
+xors 4, 1, sb37, sb104, sb41 # 4532
+xors 4, 1, sb55, sb41, sb63 # 4533
+xors 4, 1, sb13, sb36, sb39 # 4534
+xors 4, 1, sb56, sb22, sb13 # 4535
+xors 4, 1, sb79, sb56, sb37 # 4536
+xors 4, 1, sb36, sb13, sb63 # 4537
+xors 4, 1, sb161, sb127, sb163 # 4538
+xors 4, 1, sb50, sb45, sb161 # 4539
+xors 4, 1, sb159, sb161, sb157 # 4540
+xors 4, 1, sb87, sb127, sb147 # 4541
+xors 4, 1, sb127, sb160, sb87 # 4542
+xors 4, 1, sb114, sb127, sb50 # 4543
+xors 4, 1, sb161, sb87, sb157 # 4544
+xors 4, 1, sb127, sb64, sb74 # 4545
+xors 4, 1, sb56, sb127, sb162 # 4546
+xors 4, 1, sb39, sb48, sb49 # 4547
+xors 4, 1, sb41, sb58, sb47 # 4548
+xors 4, 1, sb74, sb31, sb109 # 4549
+xors 4, 1, sb49, sb26, sb113 # 4550
+xors 4, 1, sb13, sb21, sb24 # 4551
+xors 4, 1, sb47, sb12, sb10 # 4552
+xors 4, 1, sb87, sb103, sb7 # 4553
+nots 1, sb103, sb87 # 4554
+xors 4, 1, sb163, sb0, sb1 # 4555
+xors 4, 1, sb147, sb92, sb171 # 4556
+xors 4, 1, sb1, sb143, sb147 # 4557
+xors 4, 1, sb64, sb92, sb117 # 4558
+xors 4, 1, sb48, sb112, sb64 # 4559
+xors 4, 1, sb171, sb48, sb1 # 4560
+ands 72, 1, sb112, sb62, sb88, 1, sb113, sb102, sb122, 1, sb24, sb128, sb137, 1, sb147, sb138, sb145, 1, sb143, sb80, sb151, 1, sb92, sb104, sb55, 1, sb64, sb22, sb36, 1, sb58, sb45, sb159, 1, sb0, sb160, sb161, 1, sb109, sb127, sb162, 1, sb48, sb163, sb164, 1, sb31, sb163, sb165, 1, sb26, sb163, sb166, 1, sb21, sb163, sb167, 1, sb10, sb163, sb168, 1, sb12, sb163, sb169, 1, sb7, sb163, sb170, 1, sb117, sb163, sb171 # 4561
+xors 4, 1, sb45, sb110, sb112 # 4562
+xors 4, 1, sb137, sb153, sb45 # 4563
+xors 4, 1, sb36, sb137, sb158 # 4564
+xors 4, 1, sb104, sb45, sb149 # 4565
+xors 4, 1, sb55, sb106, sb113 # 4566
+xors 4, 1, sb80, sb16, sb55 # 4567
+xors 4, 1, sb22, sb55, sb142 # 4568
+xors 4, 1, sb151, sb106, sb24 # 4569
+xors 4, 1, sb55, sb18, sb151 # 4570
+xors 4, 1, sb138, sb55, sb80 # 4571
+xors 4, 1, sb24, sb151, sb142 # 4572
+xors 4, 1, sb145, sb134, sb147 # 4573
+xors 4, 1, sb55, sb33, sb145 # 4574
+xors 4, 1, sb112, sb145, sb107 # 4575
+xors 4, 1, sb122, sb134, sb143 # 4576
+xors 4, 1, sb128, sb65, sb122 # 4577
+xors 4, 1, sb102, sb128, sb55 # 4578
+xors 4, 1, sb62, sb122, sb107 # 4579
+xors 4, 1, sb88, sb63, sb92 # 4580
+xors 4, 1, sb113, sb61, sb88 # 4581
+xors 4, 1, sb92, sb88, sb42 # 4582
+xors 4, 1, sb45, sb63, sb64 # 4583
+xors 4, 1, sb110, sb119, sb45 # 4584
+xors 4, 1, sb88, sb110, sb113 # 4585
+xors 4, 1, sb134, sb45, sb42 # 4586
+xors 4, 1, sb106, sb157, sb58 # 4587
+xors 4, 1, sb45, sb140, sb106 # 4588
+xors 4, 1, sb145, sb106, sb155 # 4589
+xors 4, 1, sb147, sb157, sb0 # 4590
+xors 4, 1, sb151, sb156, sb147 # 4591
+xors 4, 1, sb63, sb151, sb45 # 4592
+xors 4, 1, sb157, sb147, sb155 # 4593
+ands 40, 1, sb151, sb153, sb104, 1, sb147, sb16, sb22, 1, sb143, sb18, sb24, 1, sb128, sb33, sb112, 1, sb122, sb65, sb62, 1, sb64, sb61, sb92, 1, sb110, sb119, sb134, 1, sb106, sb140, sb145, 1, sb0, sb156, sb157, 1, sb58, sb137, sb158 # 4594
+xors 4, 1, sb65, sb149, sb151 # 4595
+xors 4, 1, sb145, sb142, sb147 # 4596
+xors 4, 1, sb112, sb3, sb145 # 4597
+xors 4, 1, sb22, sb145, sb141 # 4598
+xors 4, 1, sb134, sb142, sb143 # 4599
+xors 4, 1, sb140, sb30, sb134 # 4600
+xors 4, 1, sb143, sb140, sb112 # 4601
+xors 4, 1, sb33, sb134, sb141 # 4602
+xors 4, 1, sb119, sb107, sb128 # 4603
+xors 4, 1, sb104, sb144, sb119 # 4604
+xors 4, 1, sb145, sb119, sb8 # 4605
+xors 4, 1, sb61, sb107, sb122 # 4606
+xors 4, 1, sb92, sb146, sb61 # 4607
+xors 4, 1, sb107, sb92, sb104 # 4608
+xors 4, 1, sb147, sb61, sb8 # 4609
+xors 4, 1, sb62, sb42, sb64 # 4610
+xors 4, 1, sb18, sb148, sb62 # 4611
+xors 4, 1, sb149, sb62, sb130 # 4612
+xors 4, 1, sb24, sb42, sb110 # 4613
+xors 4, 1, sb110, sb150, sb24 # 4614
+xors 4, 1, sb122, sb110, sb18 # 4615
+xors 4, 1, sb151, sb24, sb130 # 4616
+xors 4, 1, sb16, sb155, sb106 # 4617
+xors 4, 1, sb42, sb152, sb16 # 4618
+xors 4, 1, sb153, sb16, sb20 # 4619
+xors 4, 1, sb140, sb155, sb0 # 4620
+xors 4, 1, sb142, sb154, sb140 # 4621
+xors 4, 1, sb62, sb142, sb42 # 4622
+xors 4, 1, sb155, sb140, sb20 # 4623
+ands 52, 1, sb0, sb3, sb22, 1, sb142, sb30, sb33, 1, sb128, sb65, sb34, 1, sb119, sb65, sb52, 1, sb92, sb65, sb116, 1, sb61, sb65, sb138, 1, sb24, sb65, sb143, 1, sb106, sb144, sb145, 1, sb16, sb146, sb147, 1, sb140, sb148, sb149, 1, sb134, sb150, sb151, 1, sb64, sb152, sb153, 1, sb110, sb154, sb155 # 4624
+xors 4, 1, sb33, sb141, sb0 # 4625
+xors 4, 1, sb138, sb141, sb142 # 4626
+xors 4, 1, sb116, sb138, sb33 # 4627
+xors 4, 1, sb142, sb128, sb77 # 4628
+xors 4, 1, sb30, sb119, sb125 # 4629
+xors 4, 1, sb34, sb30, sb142 # 4630
+xors 4, 1, sb141, sb92, sb97 # 4631
+xors 4, 1, sb77, sb61, sb80 # 4632
+xors 4, 1, sb52, sb77, sb141 # 4633
+xors 4, 1, sb125, sb24, sb112 # 4634
+xors 4, 1, sb22, sb8, sb106 # 4635
+xors 4, 1, sb128, sb71, sb22 # 4636
+xors 4, 1, sb80, sb22, sb5 # 4637
+xors 4, 1, sb0, sb8, sb16 # 4638
+xors 4, 1, sb3, sb82, sb0 # 4639
+xors 4, 1, sb22, sb3, sb128 # 4640
+xors 4, 1, sb97, sb0, sb5 # 4641
+xors 4, 1, sb138, sb130, sb140 # 4642
+xors 4, 1, sb8, sb75, sb138 # 4643
+xors 4, 1, sb119, sb138, sb132 # 4644
+xors 4, 1, sb61, sb130, sb134 # 4645
+xors 4, 1, sb92, sb123, sb61 # 4646
+xors 4, 1, sb0, sb92, sb8 # 4647
+xors 4, 1, sb130, sb61, sb132 # 4648
+xors 4, 1, sb112, sb20, sb64 # 4649
+xors 4, 1, sb24, sb136, sb112 # 4650
+xors 4, 1, sb3, sb112, sb84 # 4651
+xors 4, 1, sb16, sb20, sb110 # 4652
+xors 4, 1, sb106, sb139, sb16 # 4653
+xors 4, 1, sb64, sb106, sb24 # 4654
+xors 4, 1, sb140, sb16, sb84 # 4655
+ands 36, 1, sb20, sb65, sb116, 1, sb106, sb71, sb80, 1, sb16, sb82, sb97, 1, sb138, sb75, sb119, 1, sb134, sb123, sb130, 1, sb112, sb136, sb3, 1, sb92, sb139, sb140, 1, sb61, sb77, sb141, 1, sb110, sb30, sb142 # 4656
+xors 4, 1, sb80, sb20, sb33 # 4657
+xors 4, 1, sb116, sb5, sb106 # 4658
+xors 4, 1, sb3, sb5, sb16 # 4659
+xors 4, 1, sb106, sb3, sb116 # 4660
+xors 4, 1, sb136, sb132, sb138 # 4661
+xors 4, 1, sb123, sb129, sb136 # 4662
+xors 4, 1, sb130, sb136, sb89 # 4663
+xors 4, 1, sb75, sb132, sb134 # 4664
+xors 4, 1, sb119, sb131, sb75 # 4665
+xors 4, 1, sb3, sb119, sb123 # 4666
+xors 4, 1, sb132, sb75, sb89 # 4667
+xors 4, 1, sb97, sb84, sb112 # 4668
+xors 4, 1, sb20, sb133, sb97 # 4669
+xors 4, 1, sb134, sb97, sb66 # 4670
+xors 4, 1, sb71, sb84, sb92 # 4671
+xors 4, 1, sb82, sb135, sb71 # 4672
+xors 4, 1, sb65, sb82, sb20 # 4673
+xors 4, 1, sb136, sb71, sb66 # 4674
+xors 4, 1, sb75, sb52, sb61 # 4675
+xors 4, 1, sb33, sb34, sb110 # 4676
+xors 4, 1, sb110, sb33, sb137 # 4677
+xors 4, 1, sb138, sb36, sb58 # 4678
+xors 4, 1, sb36, sb33, sb138 # 4679
+ands 52, 1, sb71, sb80, sb86, 1, sb52, sb80, sb91, 1, sb34, sb80, sb93, 1, sb16, sb80, sb102, 1, sb5, sb80, sb107, 1, sb119, sb80, sb22, 1, sb112, sb80, sb106, 1, sb97, sb129, sb130, 1, sb92, sb131, sb132, 1, sb84, sb133, sb134, 1, sb82, sb135, sb136, 1, sb61, sb33, sb137, 1, sb58, sb33, sb138 # 4680
+xors 4, 1, sb107, sb71, sb78 # 4681
+xors 4, 1, sb91, sb107, sb125 # 4682
+xors 4, 1, sb22, sb52, sb115 # 4683
+xors 4, 1, sb78, sb34, sb35 # 4684
+xors 4, 1, sb93, sb78, sb22 # 4685
+xors 4, 1, sb106, sb16, sb55 # 4686
+xors 4, 1, sb52, sb5, sb104 # 4687
+xors 4, 1, sb102, sb52, sb106 # 4688
+xors 4, 1, sb71, sb119, sb128 # 4689
+xors 4, 1, sb115, sb112, sb116 # 4690
+xors 4, 1, sb116, sb89, sb97 # 4691
+xors 4, 1, sb86, sb89, sb92 # 4692
+xors 4, 1, sb104, sb86, sb116 # 4693
+xors 4, 1, sb89, sb66, sb84 # 4694
+xors 4, 1, sb80, sb66, sb82 # 4695
+xors 4, 1, sb34, sb110, sb61 # 4696
+xors 4, 1, sb35, sb36, sb58 # 4697
+xors 4, 1, sb84, sb35, sb126 # 4698
+xors 4, 1, sb61, sb35, sb127 # 4699
+xors 4, 1, sb128, sb56, sb109 # 4700
+xors 4, 1, sb55, sb35, sb128 # 4701
+ands 56, 1, sb110, sb115, sb72, 1, sb58, sb115, sb70, 1, sb36, sb115, sb79, 1, sb56, sb115, sb88, 1, sb16, sb115, sb122, 1, sb5, sb115, sb0, 1, sb119, sb115, sb3, 1, sb112, sb115, sb104, 1, sb109, sb52, sb106, 1, sb97, sb78, sb22, 1, sb92, sb107, sb125, 1, sb86, sb35, sb126, 1, sb82, sb35, sb127, 1, sb66, sb35, sb128 # 4702
+xors 4, 1, sb106, sb110, sb67 # 4703
+xors 4, 1, sb122, sb106, sb71 # 4704
+xors 4, 1, sb72, sb58, sb38 # 4705
+xors 4, 1, sb22, sb36, sb37 # 4706
+xors 4, 1, sb0, sb22, sb72 # 4707
+xors 4, 1, sb70, sb56, sb113 # 4708
+xors 4, 1, sb104, sb16, sb18 # 4709
+xors 4, 1, sb3, sb104, sb70 # 4710
+xors 4, 1, sb67, sb5, sb8 # 4711
+xors 4, 1, sb115, sb119, sb123 # 4712
+xors 4, 1, sb8, sb115, sb67 # 4713
+xors 4, 1, sb56, sb112, sb116 # 4714
+xors 4, 1, sb88, sb102, sb109 # 4715
+xors 4, 1, sb119, sb88, sb78 # 4716
+xors 4, 1, sb79, sb93, sb97 # 4717
+xors 4, 1, sb113, sb88, sb79 # 4718
+xors 4, 1, sb109, sb91, sb92 # 4719
+xors 4, 1, sb112, sb109, sb77 # 4720
+xors 4, 1, sb110, sb109, sb75 # 4721
+xors 4, 1, sb36, sb84, sb86 # 4722
+xors 4, 1, sb37, sb61, sb82 # 4723
+xors 4, 1, sb38, sb55, sb66 # 4724
+xors 4, 1, sb16, sb48, sb51 # 4725
+xors 4, 1, sb58, sb31, sb44 # 4726
+xors 4, 1, sb31, sb26, sb29 # 4727
+xors 4, 1, sb18, sb21, sb23 # 4728
+xors 4, 1, sb29, sb10, sb19 # 4729
+xors 4, 1, sb21, sb12, sb11 # 4730
+xors 4, 1, sb5, sb7, sb9 # 4731
+xors 4, 1, sb66, sb4, sb5 # 4732
+xors 4, 1, sb123, sb117, sb1 # 4733
+xors 4, 1, sb5, sb121, sb123 # 4734
+xors 4, 1, sb116, sb118, sb120 # 4735
+xors 4, 1, sb93, sb111, sb116 # 4736
+xors 4, 1, sb102, sb105, sb108 # 4737
+xors 4, 1, sb97, sb99, sb102 # 4738
+xors 4, 1, sb86, sb98, sb100 # 4739
+xors 4, 1, sb92, sb96, sb90 # 4740
+xors 4, 1, sb91, sb92, sb95 # 4741
+xors 4, 1, sb90, sb86, sb91 # 4742
+xors 4, 1, sb10, sb90, sb89 # 4743
+xors 4, 1, sb84, sb86, sb91 # 4744
+xors 4, 1, sb82, sb84, sb80 # 4745
+xors 4, 1, sb61, sb82, sb10 # 4746
+ands 64, 1, sb55, sb56, sb59, 1, sb51, sb56, sb60, 1, sb48, sb56, sb114, 1, sb44, sb56, sb63, 1, sb26, sb56, sb62, 1, sb23, sb56, sb64, 1, sb12, sb56, sb65, 1, sb9, sb56, sb61, 1, sb7, sb115, sb67, 1, sb4, sb104, sb70, 1, sb1, sb22, sb72, 1, sb123, sb106, sb71, 1, sb121, sb88, sb78, 1, sb120, sb88, sb79, 1, sb118, sb109, sb77, 1, sb116, sb109, sb75 # 4747
+xors 4, 1, sb102, sb55, sb57 # 4748
+xors 4, 1, sb19, sb51, sb54 # 4749
+xors 4, 1, sb78, sb19, sb102 # 4750
+xors 4, 1, sb99, sb48, sb50 # 4751
+xors 4, 1, sb62, sb44, sb45 # 4752
+xors 4, 1, sb80, sb62, sb99 # 4753
+xors 4, 1, sb98, sb26, sb42 # 4754
+xors 4, 1, sb11, sb23, sb24 # 4755
+xors 4, 1, sb86, sb11, sb98 # 4756
+xors 4, 1, sb96, sb12, sb20 # 4757
+xors 4, 1, sb92, sb9, sb10 # 4758
+xors 4, 1, sb91, sb92, sb96 # 4759
+xors 4, 1, sb70, sb46, sb92 # 4760
+xors 4, 1, sb117, sb8, sb7 # 4761
+xors 4, 1, sb79, sb117, sb104 # 4762
+xors 4, 1, sb105, sb3, sb4 # 4763
+xors 4, 1, sb72, sb117, sb105 # 4764
+xors 4, 1, sb23, sb0, sb1 # 4765
+xors 4, 1, sb67, sb23, sb106 # 4766
+xors 4, 1, sb108, sb122, sb123 # 4767
+xors 4, 1, sb61, sb23, sb108 # 4768
+xors 4, 1, sb63, sb119, sb121 # 4769
+xors 4, 1, sb100, sb113, sb120 # 4770
+xors 4, 1, sb59, sb100, sb107 # 4771
+xors 4, 1, sb56, sb100, sb109 # 4772
+xors 4, 1, sb111, sb112, sb118 # 4773
+xors 4, 1, sb54, sb100, sb111 # 4774
+xors 4, 1, sb113, sb110, sb116 # 4775
+xors 4, 1, sb50, sb100, sb113 # 4776
+ands 52, 1, sb95, sb92, sb96, 1, sb89, sb11, sb98, 1, sb84, sb62, sb99, 1, sb82, sb19, sb102, 1, sb75, sb117, sb104, 1, sb77, sb117, sb105, 1, sb71, sb23, sb106, 1, sb65, sb23, sb108, 1, sb60, sb100, sb107, 1, sb57, sb100, sb109, 1, sb55, sb100, sb111, 1, sb51, sb100, sb113, 1, sb48, sb70, sb46 # 4777
+xors 4, 1, sb7, sb91, sb95 # 4778
+xors 4, 1, sb9, sb7, sb11 # 4779
+xors 4, 1, sb90, sb7, sb92 # 4780
+xors 4, 1, sb42, sb76, sb90 # 4781
+xors 4, 1, sb12, sb86, sb89 # 4782
+xors 4, 1, sb0, sb7, sb12 # 4783
+xors 4, 1, sb64, sb80, sb84 # 4784
+xors 4, 1, sb119, sb64, sb19 # 4785
+xors 4, 1, sb20, sb78, sb82 # 4786
+xors 4, 1, sb114, sb64, sb20 # 4787
+xors 4, 1, sb118, sb79, sb75 # 4788
+xors 4, 1, sb120, sb72, sb77 # 4789
+xors 4, 1, sb112, sb120, sb22 # 4790
+xors 4, 1, sb110, sb120, sb23 # 4791
+xors 4, 1, sb24, sb67, sb71 # 4792
+xors 4, 1, sb108, sb120, sb24 # 4793
+xors 4, 1, sb26, sb61, sb65 # 4794
+xors 4, 1, sb102, sb120, sb26 # 4795
+xors 4, 1, sb72, sb59, sb60 # 4796
+xors 4, 1, sb104, sb56, sb57 # 4797
+xors 4, 1, sb105, sb54, sb55 # 4798
+xors 4, 1, sb106, sb50, sb51 # 4799
+xors 4, 1, sb98, sb106, sb30 # 4800
+xors 4, 1, sb95, sb106, sb33 # 4801
+xors 4, 1, sb91, sb106, sb34 # 4802
+xors 4, 1, sb89, sb106, sb35 # 4803
+xors 4, 1, sb84, sb106, sb36 # 4804
+xors 4, 1, sb80, sb106, sb37 # 4805
+xors 4, 1, sb78, sb106, sb38 # 4806
+xors 4, 1, sb45, sb46, sb48 # 4807
+xors 4, 1, sb8, sb42, sb45 # 4808
+xors 4, 1, sb44, sb45, sb76 # 4809
+ands 64, 1, sb10, sb7, sb11, 1, sb1, sb7, sb12, 1, sb121, sb64, sb19, 1, sb116, sb64, sb20, 1, sb113, sb120, sb22, 1, sb111, sb120, sb23, 1, sb109, sb120, sb24, 1, sb107, sb120, sb26, 1, sb99, sb106, sb30, 1, sb96, sb106, sb33, 1, sb92, sb106, sb34, 1, sb90, sb106, sb35, 1, sb86, sb106, sb36, 1, sb82, sb106, sb37, 1, sb79, sb106, sb38, 1, sb77, sb42, sb44 # 4810
+xors 4, 1, sb123, sb9, sb10 # 4811
+xors 4, 1, sb4, sb123, sb7 # 4812
+xors 4, 1, sb20, sb28, sb4 # 4813
+xors 4, 1, sb71, sb28, sb4 # 4814
+nots 1, sb3, sb71 # 4815
+xors 4, 1, sb75, sb3, sb20 # 4816
+xors 4, 1, sb59, sb0, sb1 # 4817
+xors 4, 1, sb60, sb59, sb62 # 4818
+xors 4, 1, sb54, sb59, sb64 # 4819
+xors 4, 1, sb122, sb59, sb123 # 4820
+xors 4, 1, sb4, sb94, sb122 # 4821
+xors 4, 1, sb9, sb94, sb122 # 4822
+xors 4, 1, sb65, sb119, sb121 # 4823
+xors 4, 1, sb44, sb59, sb65 # 4824
+xors 4, 1, sb67, sb114, sb116 # 4825
+xors 4, 1, sb37, sb59, sb67 # 4826
+xors 4, 1, sb122, sb112, sb113 # 4827
+xors 4, 1, sb123, sb110, sb111 # 4828
+xors 4, 1, sb0, sb108, sb109 # 4829
+xors 4, 1, sb1, sb102, sb107 # 4830
+xors 4, 1, sb107, sb98, sb99 # 4831
+xors 4, 1, sb108, sb95, sb96 # 4832
+xors 4, 1, sb109, sb91, sb92 # 4833
+xors 4, 1, sb110, sb89, sb90 # 4834
+xors 4, 1, sb111, sb84, sb86 # 4835
+xors 4, 1, sb112, sb80, sb82 # 4836
+xors 4, 1, sb113, sb78, sb79 # 4837
+xors 4, 1, sb89, sb76, sb77 # 4838
+ands 28, 1, sb61, sb59, sb62, 1, sb57, sb59, sb64, 1, sb48, sb59, sb65, 1, sb38, sb59, sb67, 1, sb34, sb20, sb28, 1, sb30, sb71, sb73, 1, sb19, sb89, sb75 # 4839
+xors 4, 1, sb51, sb60, sb61 # 4840
+xors 4, 1, sb56, sb51, sb59 # 4841
+xors 4, 1, sb114, sb81, sb56 # 4842
+xors 4, 1, sb116, sb81, sb56 # 4843
+xors 4, 1, sb46, sb54, sb57 # 4844
+xors 4, 1, sb50, sb46, sb51 # 4845
+xors 4, 1, sb82, sb68, sb50 # 4846
+xors 4, 1, sb22, sb68, sb50 # 4847
+xors 4, 1, sb36, sb44, sb48 # 4848
+xors 4, 1, sb45, sb36, sb46 # 4849
+xors 4, 1, sb3, sb14, sb45 # 4850
+xors 4, 1, sb12, sb14, sb45 # 4851
+nots 1, sb42, sb12 # 4852
+xors 4, 1, sb79, sb42, sb3 # 4853
+xors 4, 1, sb96, sb37, sb38 # 4854
+xors 4, 1, sb98, sb96, sb115 # 4855
+xors 4, 1, sb90, sb96, sb117 # 4856
+xors 4, 1, sb77, sb96, sb118 # 4857
+xors 4, 1, sb67, sb96, sb120 # 4858
+xors 4, 1, sb60, sb96, sb122 # 4859
+xors 4, 1, sb55, sb96, sb123 # 4860
+xors 4, 1, sb48, sb96, sb0 # 4861
+xors 4, 1, sb42, sb96, sb1 # 4862
+xors 4, 1, sb35, sb96, sb36 # 4863
+xors 4, 1, sb119, sb43, sb35 # 4864
+xors 4, 1, sb121, sb43, sb35 # 4865
+xors 4, 1, sb33, sb28, sb34 # 4866
+xors 4, 1, sb24, sb4, sb33 # 4867
+xors 4, 1, sb7, sb33, sb94 # 4868
+xors 4, 1, sb23, sb28, sb30 # 4869
+xors 4, 1, sb26, sb9, sb23 # 4870
+xors 4, 1, sb11, sb26, sb24 # 4871
+xors 4, 1, sb10, sb23, sb94 # 4872
+xors 4, 1, sb76, sb19, sb20 # 4873
+ands 52, 1, sb102, sb96, sb115, 1, sb91, sb96, sb117, 1, sb78, sb96, sb118, 1, sb71, sb96, sb120, 1, sb61, sb96, sb122, 1, sb56, sb96, sb123, 1, sb50, sb96, sb0, 1, sb44, sb96, sb1, 1, sb99, sb4, sb7, 1, sb95, sb9, sb10, 1, sb23, sb89, sb11, 1, sb20, sb3, sb14, 1, sb80, sb12, sb15 # 4874
+xors 4, 1, sb86, sb98, sb102 # 4875
+xors 4, 1, sb92, sb86, sb96 # 4876
+xors 4, 1, sb33, sb40, sb92 # 4877
+xors 4, 1, sb38, sb40, sb92 # 4878
+xors 4, 1, sb75, sb90, sb91 # 4879
+xors 4, 1, sb84, sb75, sb86 # 4880
+xors 4, 1, sb30, sb83, sb84 # 4881
+xors 4, 1, sb34, sb83, sb84 # 4882
+xors 4, 1, sb65, sb77, sb78 # 4883
+xors 4, 1, sb73, sb65, sb75 # 4884
+xors 4, 1, sb78, sb6, sb73 # 4885
+xors 4, 1, sb1, sb6, sb73 # 4886
+xors 4, 1, sb59, sb67, sb71 # 4887
+xors 4, 1, sb64, sb59, sb65 # 4888
+xors 4, 1, sb10, sb85, sb64 # 4889
+xors 4, 1, sb123, sb85, sb64 # 4890
+nots 1, sb62, sb123 # 4891
+xors 4, 1, sb65, sb62, sb10 # 4892
+xors 4, 1, sb54, sb60, sb61 # 4893
+xors 4, 1, sb57, sb54, sb59 # 4894
+xors 4, 1, sb0, sb17, sb57 # 4895
+xors 4, 1, sb98, sb17, sb57 # 4896
+xors 4, 1, sb46, sb55, sb56 # 4897
+xors 4, 1, sb51, sb46, sb54 # 4898
+xors 4, 1, sb55, sb2, sb51 # 4899
+xors 4, 1, sb60, sb2, sb51 # 4900
+xors 4, 1, sb37, sb48, sb50 # 4901
+xors 4, 1, sb45, sb37, sb46 # 4902
+xors 4, 1, sb84, sb69, sb45 # 4903
+xors 4, 1, sb86, sb69, sb45 # 4904
+xors 4, 1, sb11, sb42, sb44 # 4905
+xors 4, 1, sb45, sb11, sb52 # 4906
+xors 4, 1, sb4, sb11, sb88 # 4907
+xors 4, 1, sb73, sb11, sb63 # 4908
+xors 4, 1, sb26, sb11, sb100 # 4909
+xors 4, 1, sb46, sb11, sb72 # 4910
+xors 4, 1, sb102, sb11, sb104 # 4911
+xors 4, 1, sb50, sb11, sb105 # 4912
+xors 4, 1, sb36, sb11, sb106 # 4913
+xors 4, 1, sb51, sb11, sb107 # 4914
+xors 4, 1, sb28, sb11, sb108 # 4915
+xors 4, 1, sb92, sb11, sb109 # 4916
+xors 4, 1, sb62, sb11, sb110 # 4917
+xors 4, 1, sb77, sb11, sb111 # 4918
+xors 4, 1, sb56, sb11, sb112 # 4919
+xors 4, 1, sb67, sb11, sb113 # 4920
+xors 4, 1, sb35, sb11, sb37 # 4921
+xors 4, 1, sb7, sb32, sb35 # 4922
+xors 4, 1, sb9, sb32, sb35 # 4923
+xors 4, 1, sb96, sb94, sb99 # 4924
+xors 4, 1, sb42, sb114, sb96 # 4925
+xors 4, 1, sb115, sb96, sb81 # 4926
+xors 4, 1, sb90, sb94, sb95 # 4927
+xors 4, 1, sb91, sb116, sb90 # 4928
+xors 4, 1, sb118, sb91, sb42 # 4929
+xors 4, 1, sb117, sb90, sb81 # 4930
+xors 4, 1, sb15, sb23, sb24 # 4931
+xors 4, 1, sb19, sb14, sb20 # 4932
+xors 4, 1, sb57, sb119, sb19 # 4933
+xors 4, 1, sb120, sb19, sb43 # 4934
+xors 4, 1, sb75, sb14, sb80 # 4935
+xors 4, 1, sb12, sb121, sb75 # 4936
+xors 4, 1, sb80, sb12, sb57 # 4937
+xors 4, 1, sb122, sb75, sb43 # 4938
+ands 88, 1, sb48, sb11, sb52, 1, sb90, sb11, sb88, 1, sb12, sb11, sb63, 1, sb94, sb11, sb100, 1, sb14, sb11, sb72, 1, sb71, sb11, sb104, 1, sb19, sb11, sb105, 1, sb37, sb11, sb106, 1, sb75, sb11, sb107, 1, sb96, sb11, sb108, 1, sb61, sb11, sb109, 1, sb23, sb11, sb110, 1, sb95, sb11, sb111, 1, sb59, sb11, sb112, 1, sb24, sb11, sb113, 1, sb44, sb114, sb115, 1, sb91, sb116, sb117, 1, sb99, sb89, sb118, 1, sb64, sb119, sb120, 1, sb54, sb121, sb122, 1, sb35, sb10, sb85, 1, sb20, sb123, sb124 # 4939
+xors 4, 1, sb88, sb45, sb48 # 4940
+xors 4, 1, sb100, sb88, sb11 # 4941
+xors 4, 1, sb11, sb25, sb100 # 4942
+xors 4, 1, sb63, sb25, sb100 # 4943
+xors 4, 1, sb72, sb4, sb90 # 4944
+xors 4, 1, sb52, sb72, sb88 # 4945
+xors 4, 1, sb45, sb53, sb52 # 4946
+xors 4, 1, sb100, sb53, sb52 # 4947
+nots 1, sb48, sb100 # 4948
+xors 4, 1, sb52, sb48, sb45 # 4949
+xors 4, 1, sb88, sb73, sb12 # 4950
+xors 4, 1, sb90, sb88, sb72 # 4951
+xors 4, 1, sb4, sb39, sb90 # 4952
+xors 4, 1, sb72, sb39, sb90 # 4953
+xors 4, 1, sb12, sb26, sb94 # 4954
+xors 4, 1, sb48, sb12, sb88 # 4955
+xors 4, 1, sb88, sb41, sb48 # 4956
+xors 4, 1, sb90, sb41, sb48 # 4957
+xors 4, 1, sb94, sb46, sb14 # 4958
+xors 4, 1, sb73, sb94, sb12 # 4959
+xors 4, 1, sb12, sb74, sb73 # 4960
+xors 4, 1, sb14, sb74, sb73 # 4961
+xors 4, 1, sb48, sb102, sb71 # 4962
+xors 4, 1, sb26, sb48, sb94 # 4963
+xors 4, 1, sb71, sb49, sb26 # 4964
+xors 4, 1, sb73, sb49, sb26 # 4965
+xors 4, 1, sb94, sb50, sb19 # 4966
+xors 4, 1, sb46, sb94, sb48 # 4967
+xors 4, 1, sb26, sb13, sb46 # 4968
+xors 4, 1, sb48, sb13, sb46 # 4969
+xors 4, 1, sb102, sb36, sb37 # 4970
+xors 4, 1, sb19, sb102, sb94 # 4971
+xors 4, 1, sb46, sb47, sb19 # 4972
+xors 4, 1, sb50, sb47, sb19 # 4973
+xors 4, 1, sb19, sb51, sb75 # 4974
+xors 4, 1, sb37, sb19, sb102 # 4975
+xors 4, 1, sb36, sb87, sb37 # 4976
+xors 4, 1, sb102, sb87, sb37 # 4977
+nots 1, sb94, sb102 # 4978
+xors 4, 1, sb37, sb94, sb36 # 4979
+xors 4, 1, sb94, sb28, sb96 # 4980
+xors 4, 1, sb75, sb94, sb19 # 4981
+xors 4, 1, sb19, sb16, sb75 # 4982
+xors 4, 1, sb96, sb16, sb75 # 4983
+xors 4, 1, sb51, sb92, sb61 # 4984
+xors 4, 1, sb28, sb51, sb94 # 4985
+xors 4, 1, sb92, sb58, sb28 # 4986
+xors 4, 1, sb94, sb58, sb28 # 4987
+xors 4, 1, sb75, sb62, sb23 # 4988
+xors 4, 1, sb61, sb75, sb51 # 4989
+xors 4, 1, sb23, sb31, sb61 # 4990
+xors 4, 1, sb28, sb31, sb61 # 4991
+xors 4, 1, sb51, sb77, sb95 # 4992
+xors 4, 1, sb62, sb51, sb75 # 4993
+xors 4, 1, sb75, sb18, sb62 # 4994
+xors 4, 1, sb77, sb18, sb62 # 4995
+xors 4, 1, sb61, sb56, sb59 # 4996
+xors 4, 1, sb95, sb61, sb51 # 4997
+xors 4, 1, sb51, sb29, sb95 # 4998
+xors 4, 1, sb62, sb29, sb95 # 4999
+xors 4, 1, sb59, sb67, sb24 # 5000
+xors 4, 1, sb56, sb59, sb61 # 5001
+xors 4, 1, sb59, sb21, sb56 # 5002
+xors 4, 1, sb61, sb21, sb56 # 5003
+xors 4, 1, sb95, sb81, sb44 # 5004
+xors 4, 1, sb67, sb82, sb95 # 5005
+xors 4, 1, sb24, sb95, sb68 # 5006
+xors 4, 1, sb44, sb81, sb91 # 5007
+xors 4, 1, sb56, sb22, sb44 # 5008
+xors 4, 1, sb95, sb56, sb67 # 5009
+xors 4, 1, sb91, sb44, sb68 # 5010
+xors 4, 1, sb81, sb99, sb42 # 5011
+reveal 27, 1, cb42, sb66, 1, cb41, sb5, 1, cb40, sb70, 1, cb39, sb8, 1, cb38, sb76, 1, cb37, sb15, 1, cb36, sb81, 1, cb35, sb93, 1, cb34, sb97 # 5012
+convcbitvec 1, ci0, cb42 # 5013
+convint c37, ci0 # 5014
+addm s153, s156, c37 # 5015
+convint c37, ci0 # 5016
+mulm s156, s120, c37 # 5017
+subs s120, s153, s156 # 5018
+movs s153, s120 # 5019
+convcbitvec 1, ci0, cb41 # 5020
+convint c37, ci0 # 5021
+addm s120, s155, c37 # 5022
+convint c37, ci0 # 5023
+mulm s155, s154, c37 # 5024
+subs s154, s120, s155 # 5025
+movs s120, s154 # 5026
+mulsi s154, s120, 2 # 5027
+adds s120, s153, s154 # 5028
+mulm s153, s120, c36 # 5029
+subs s120, s117, s153 # 5030
+convcbitvec 1, ci0, cb40 # 5031
+convint c36, ci0 # 5032
+addm s117, s99, c36 # 5033
+convcbitvec 1, ci0, cb39 # 5034
+convint c36, ci0 # 5035
+addm s99, s152, c36 # 5036
+mulsi s152, s99, 2 # 5037
+adds s99, s117, s152 # 5038
+convcbitvec 1, ci0, cb38 # 5039
+convint c36, ci0 # 5040
+addm s117, s151, c36 # 5041
+mulsi s151, s117, 4 # 5042
+adds s117, s99, s151 # 5043
+convcbitvec 1, ci0, cb37 # 5044
+convint c36, ci0 # 5045
+addm s99, s150, c36 # 5046
+mulsi s150, s99, 8 # 5047
+adds s99, s117, s150 # 5048
+convcbitvec 1, ci0, cb36 # 5049
+convint c36, ci0 # 5050
+addm s117, s149, c36 # 5051
+mulsi s149, s117, 16 # 5052
+adds s117, s99, s149 # 5053
+convcbitvec 1, ci0, cb35 # 5054
+convint c36, ci0 # 5055
+addm s99, s148, c36 # 5056
+convint c36, ci0 # 5057
+mulm s148, s68, c36 # 5058
+subs s68, s99, s148 # 5059
+movs s99, s68 # 5060
+convcbitvec 1, ci0, cb34 # 5061
+convint c36, ci0 # 5062
+addm s68, s147, c36 # 5063
+convint c36, ci0 # 5064
+mulm s147, s105, c36 # 5065
+subs s105, s68, s147 # 5066
+movs s68, s105 # 5067
+xors 4, 1, sb56, sb43, sb64 # 5068
+xors 4, 1, sb44, sb33, sb56 # 5069
+xors 4, 1, sb97, sb56, sb40 # 5070
+xors 4, 1, sb99, sb43, sb54 # 5071
+xors 4, 1, sb42, sb38, sb99 # 5072
+xors 4, 1, sb81, sb42, sb44 # 5073
+xors 4, 1, sb43, sb99, sb40 # 5074
+xors 4, 1, sb93, sb85, sb35 # 5075
+xors 4, 1, sb8, sb0, sb93 # 5076
+xors 4, 1, sb5, sb93, sb17 # 5077
+xors 4, 1, sb76, sb85, sb20 # 5078
+xors 4, 1, sb15, sb98, sb76 # 5079
+xors 4, 1, sb66, sb15, sb8 # 5080
+xors 4, 1, sb99, sb76, sb17 # 5081
+ands 44, 1, sb15, sb82, sb24, 1, sb76, sb22, sb91, 1, sb64, sb89, sb95, 1, sb56, sb33, sb97, 1, sb42, sb38, sb43, 1, sb20, sb0, sb5, 1, sb85, sb98, sb99, 1, sb70, sb45, sb53, 1, sb54, sb100, sb101, 1, sb35, sb36, sb87, 1, sb93, sb102, sb103 # 5082
+xors 4, 1, sb24, sb68, sb15 # 5083
+xors 4, 1, sb5, sb68, sb76 # 5084
+xors 4, 1, sb91, sb5, sb24 # 5085
+xors 4, 1, sb0, sb64, sb67 # 5086
+xors 4, 1, sb43, sb40, sb56 # 5087
+xors 4, 1, sb33, sb30, sb43 # 5088
+xors 4, 1, sb95, sb43, sb83 # 5089
+xors 4, 1, sb97, sb40, sb42 # 5090
+xors 4, 1, sb38, sb34, sb97 # 5091
+xors 4, 1, sb82, sb38, sb33 # 5092
+xors 4, 1, sb42, sb97, sb83 # 5093
+xors 4, 1, sb22, sb17, sb20 # 5094
+xors 4, 1, sb43, sb55, sb22 # 5095
+xors 4, 1, sb56, sb22, sb2 # 5096
+xors 4, 1, sb76, sb17, sb85 # 5097
+xors 4, 1, sb15, sb60, sb76 # 5098
+xors 4, 1, sb67, sb15, sb43 # 5099
+xors 4, 1, sb64, sb76, sb2 # 5100
+xors 4, 1, sb68, sb53, sb70 # 5101
+xors 4, 1, sb15, sb4, sb68 # 5102
+xors 4, 1, sb5, sb68, sb39 # 5103
+xors 4, 1, sb38, sb53, sb54 # 5104
+xors 4, 1, sb40, sb72, sb38 # 5105
+xors 4, 1, sb53, sb40, sb15 # 5106
+xors 4, 1, sb76, sb38, sb39 # 5107
+xors 4, 1, sb97, sb87, sb35 # 5108
+xors 4, 1, sb35, sb19, sb97 # 5109
+xors 4, 1, sb85, sb97, sb16 # 5110
+xors 4, 1, sb20, sb87, sb93 # 5111
+xors 4, 1, sb22, sb96, sb20 # 5112
+xors 4, 1, sb38, sb22, sb35 # 5113
+xors 4, 1, sb97, sb20, sb16 # 5114
+ands 36, 1, sb87, sb89, sb91, 1, sb22, sb30, sb95, 1, sb20, sb34, sb42, 1, sb70, sb55, sb56, 1, sb68, sb60, sb64, 1, sb54, sb4, sb5, 1, sb40, sb72, sb76, 1, sb93, sb19, sb85, 1, sb17, sb96, sb97 # 5115
+xors 4, 1, sb64, sb87, sb24 # 5116
+xors 4, 1, sb85, sb83, sb22 # 5117
+xors 4, 1, sb19, sb78, sb85 # 5118
+xors 4, 1, sb60, sb85, sb6 # 5119
+xors 4, 1, sb72, sb83, sb20 # 5120
+xors 4, 1, sb76, sb1, sb72 # 5121
+xors 4, 1, sb83, sb76, sb19 # 5122
+xors 4, 1, sb4, sb72, sb6 # 5123
+xors 4, 1, sb5, sb2, sb70 # 5124
+xors 4, 1, sb30, sb84, sb5 # 5125
+xors 4, 1, sb85, sb5, sb69 # 5126
+xors 4, 1, sb55, sb2, sb68 # 5127
+xors 4, 1, sb56, sb86, sb55 # 5128
+xors 4, 1, sb68, sb56, sb30 # 5129
+xors 4, 1, sb87, sb55, sb69 # 5130
+xors 4, 1, sb42, sb39, sb54 # 5131
+xors 4, 1, sb20, sb88, sb42 # 5132
+xors 4, 1, sb89, sb42, sb41 # 5133
+xors 4, 1, sb95, sb39, sb40 # 5134
+xors 4, 1, sb34, sb90, sb95 # 5135
+xors 4, 1, sb54, sb34, sb20 # 5136
+xors 4, 1, sb91, sb95, sb41 # 5137
+xors 4, 1, sb22, sb16, sb93 # 5138
+xors 4, 1, sb34, sb92, sb22 # 5139
+xors 4, 1, sb93, sb22, sb58 # 5140
+xors 4, 1, sb72, sb16, sb17 # 5141
+xors 4, 1, sb76, sb94, sb72 # 5142
+xors 4, 1, sb39, sb76, sb34 # 5143
+xors 4, 1, sb95, sb72, sb58 # 5144
+ands 52, 1, sb72, sb78, sb60, 1, sb5, sb1, sb4, 1, sb2, sb64, sb79, 1, sb56, sb64, sb80, 1, sb40, sb64, sb81, 1, sb22, sb64, sb82, 1, sb17, sb64, sb83, 1, sb16, sb84, sb85, 1, sb70, sb86, sb87, 1, sb55, sb88, sb89, 1, sb42, sb90, sb91, 1, sb24, sb92, sb93, 1, sb76, sb94, sb95 # 5145
+xors 4, 1, sb60, sb6, sb72 # 5146
+xors 4, 1, sb4, sb6, sb5 # 5147
+xors 4, 1, sb6, sb4, sb60 # 5148
+xors 4, 1, sb1, sb2, sb3 # 5149
+xors 4, 1, sb2, sb56, sb57 # 5150
+xors 4, 1, sb3, sb40, sb44 # 5151
+xors 4, 1, sb4, sb22, sb33 # 5152
+xors 4, 1, sb5, sb17, sb19 # 5153
+xors 4, 1, sb78, sb69, sb16 # 5154
+xors 4, 1, sb22, sb7, sb78 # 5155
+xors 4, 1, sb72, sb78, sb32 # 5156
+xors 4, 1, sb56, sb69, sb70 # 5157
+xors 4, 1, sb57, sb9, sb56 # 5158
+xors 4, 1, sb69, sb57, sb22 # 5159
+xors 4, 1, sb70, sb56, sb32 # 5160
+xors 4, 1, sb44, sb41, sb55 # 5161
+xors 4, 1, sb17, sb12, sb44 # 5162
+xors 4, 1, sb78, sb44, sb74 # 5163
+xors 4, 1, sb33, sb41, sb42 # 5164
+xors 4, 1, sb40, sb14, sb33 # 5165
+xors 4, 1, sb55, sb40, sb17 # 5166
+xors 4, 1, sb19, sb33, sb74 # 5167
+xors 4, 1, sb16, sb58, sb24 # 5168
+xors 4, 1, sb33, sb23, sb16 # 5169
+xors 4, 1, sb24, sb16, sb31 # 5170
+xors 4, 1, sb56, sb58, sb76 # 5171
+xors 4, 1, sb57, sb28, sb56 # 5172
+xors 4, 1, sb40, sb57, sb33 # 5173
+xors 4, 1, sb44, sb56, sb31 # 5174
+ands 28, 1, sb58, sb64, sb6, 1, sb56, sb7, sb72, 1, sb42, sb9, sb70, 1, sb16, sb12, sb78, 1, sb76, sb14, sb19, 1, sb57, sb23, sb24, 1, sb41, sb28, sb44 # 5175
+xors 4, 1, sb24, sb58, sb60 # 5176
+xors 4, 1, sb44, sb32, sb56 # 5177
+xors 4, 1, sb14, sb11, sb44 # 5178
+xors 4, 1, sb23, sb44, sb25 # 5179
+xors 4, 1, sb19, sb32, sb42 # 5180
+xors 4, 1, sb28, sb63, sb19 # 5181
+xors 4, 1, sb70, sb28, sb14 # 5182
+xors 4, 1, sb64, sb19, sb25 # 5183
+xors 4, 1, sb9, sb74, sb16 # 5184
+xors 4, 1, sb44, sb71, sb9 # 5185
+xors 4, 1, sb72, sb9, sb49 # 5186
+xors 4, 1, sb58, sb74, sb76 # 5187
+xors 4, 1, sb60, sb73, sb58 # 5188
+xors 4, 1, sb56, sb60, sb44 # 5189
+xors 4, 1, sb74, sb58, sb49 # 5190
+xors 4, 1, sb42, sb31, sb57 # 5191
+xors 4, 1, sb32, sb75, sb42 # 5192
+xors 4, 1, sb76, sb42, sb18 # 5193
+xors 4, 1, sb28, sb31, sb41 # 5194
+xors 4, 1, sb6, sb77, sb28 # 5195
+xors 4, 1, sb41, sb6, sb32 # 5196
+xors 4, 1, sb78, sb28, sb18 # 5197
+ands 48, 1, sb7, sb11, sb23, 1, sb6, sb63, sb64, 1, sb9, sb24, sb65, 1, sb58, sb24, sb66, 1, sb42, sb24, sb67, 1, sb28, sb24, sb68, 1, sb16, sb24, sb69, 1, sb12, sb24, sb70, 1, sb60, sb71, sb72, 1, sb57, sb73, sb74, 1, sb31, sb75, sb76, 1, sb19, sb77, sb78 # 5198
+xors 4, 1, sb23, sb25, sb7 # 5199
+xors 4, 1, sb11, sb25, sb6 # 5200
+xors 4, 1, sb25, sb11, sb23 # 5201
+xors 4, 1, sb6, sb9, sb10 # 5202
+xors 4, 1, sb7, sb58, sb8 # 5203
+xors 4, 1, sb8, sb42, sb43 # 5204
+xors 4, 1, sb9, sb28, sb30 # 5205
+xors 4, 1, sb10, sb16, sb22 # 5206
+xors 4, 1, sb11, sb12, sb14 # 5207
+xors 4, 1, sb58, sb49, sb60 # 5208
+xors 4, 1, sb28, sb26, sb58 # 5209
+xors 4, 1, sb30, sb58, sb13 # 5210
+xors 4, 1, sb42, sb49, sb57 # 5211
+xors 4, 1, sb43, sb48, sb42 # 5212
+xors 4, 1, sb57, sb43, sb28 # 5213
+xors 4, 1, sb49, sb42, sb13 # 5214
+xors 4, 1, sb22, sb18, sb31 # 5215
+xors 4, 1, sb31, sb51, sb22 # 5216
+xors 4, 1, sb58, sb22, sb29 # 5217
+xors 4, 1, sb14, sb18, sb19 # 5218
+xors 4, 1, sb16, sb62, sb14 # 5219
+xors 4, 1, sb42, sb16, sb31 # 5220
+xors 4, 1, sb12, sb14, sb29 # 5221
+ands 20, 1, sb22, sb24, sb25, 1, sb18, sb26, sb30, 1, sb14, sb48, sb49, 1, sb60, sb51, sb58, 1, sb43, sb62, sb12 # 5222
+xors 4, 1, sb19, sb22, sb23 # 5223
+xors 4, 1, sb16, sb13, sb18 # 5224
+xors 4, 1, sb25, sb46, sb16 # 5225
+xors 4, 1, sb49, sb16, sb47 # 5226
+xors 4, 1, sb62, sb13, sb14 # 5227
+xors 4, 1, sb12, sb50, sb62 # 5228
+xors 4, 1, sb58, sb12, sb25 # 5229
+xors 4, 1, sb51, sb62, sb47 # 5230
+xors 4, 1, sb48, sb29, sb60 # 5231
+xors 4, 1, sb30, sb59, sb48 # 5232
+xors 4, 1, sb60, sb48, sb21 # 5233
+xors 4, 1, sb24, sb29, sb43 # 5234
+xors 4, 1, sb26, sb61, sb24 # 5235
+xors 4, 1, sb43, sb26, sb30 # 5236
+xors 4, 1, sb62, sb24, sb21 # 5237
+ands 44, 1, sb12, sb46, sb49, 1, sb48, sb50, sb51, 1, sb13, sb19, sb52, 1, sb14, sb19, sb53, 1, sb18, sb19, sb54, 1, sb16, sb19, sb55, 1, sb29, sb19, sb56, 1, sb26, sb19, sb57, 1, sb24, sb19, sb58, 1, sb23, sb59, sb60, 1, sb22, sb61, sb62 # 5238
+xors 4, 1, sb46, sb47, sb12 # 5239
+xors 4, 1, sb12, sb47, sb48 # 5240
+xors 4, 1, sb47, sb12, sb46 # 5241
+ands 4, 1, sb12, sb19, sb47 # 5242
+xors 4, 1, sb19, sb12, sb46 # 5243
+xors 4, 1, sb12, sb13, sb45 # 5244
+xors 4, 1, sb13, sb14, sb15 # 5245
+xors 4, 1, sb14, sb18, sb20 # 5246
+xors 4, 1, sb15, sb16, sb17 # 5247
+xors 4, 1, sb16, sb29, sb44 # 5248
+xors 4, 1, sb17, sb26, sb28 # 5249
+xors 4, 1, sb18, sb24, sb25 # 5250
+xors 4, 1, sb29, sb21, sb23 # 5251
+xors 4, 1, sb20, sb21, sb22 # 5252
+xors 4, 1, sb44, sb20, sb29 # 5253
+ands 32, 1, sb20, sb19, sb37, 1, sb21, sb19, sb38, 1, sb22, sb19, sb39, 1, sb23, sb19, sb40, 1, sb24, sb19, sb41, 1, sb25, sb19, sb42, 1, sb28, sb19, sb43, 1, sb26, sb19, sb44 # 5254
+xors 4, 1, sb19, sb20, sb36 # 5255
+xors 4, 1, sb20, sb21, sb35 # 5256
+xors 4, 1, sb21, sb22, sb34 # 5257
+xors 4, 1, sb22, sb23, sb33 # 5258
+xors 4, 1, sb23, sb24, sb32 # 5259
+xors 4, 1, sb24, sb25, sb31 # 5260
+xors 4, 1, sb25, sb28, sb30 # 5261
+xors 4, 1, sb28, sb26, sb29 # 5262
+xors 4, 1, sb26, sb27, sb28 # 5263
+reveal 81, 1, cb60, sb0, 1, cb59, sb1, 1, cb58, sb2, 1, cb57, sb3, 1, cb56, sb4, 1, cb55, sb5, 1, cb54, sb6, 1, cb53, sb7, 1, cb52, sb8, 1, cb51, sb9, 1, cb50, sb10, 1, cb49, sb11, 1, cb48, sb12, 1, cb47, sb13, 1, cb46, sb14, 1, cb45, sb15, 1, cb44, sb16, 1, cb43, sb17, 1, cb42, sb18, 1, cb41, sb19, 1, cb40, sb20, 1, cb39, sb21, 1, cb38, sb22, 1, cb37, sb23, 1, cb36, sb24, 1, cb35, sb25, 1, cb34, sb26 # 5264
+convcbitvec 1, ci0, cb60 # 5265
+convint c36, ci0 # 5266
+addm s105, s146, c36 # 5267
+mulsi s146, s105, 32 # 5268
+adds s105, s117, s146 # 5269
+convcbitvec 1, ci0, cb59 # 5270
+convint c36, ci0 # 5271
+addm s117, s145, c36 # 5272
+mulsi s145, s117, 64 # 5273
+adds s117, s105, s145 # 5274
+convcbitvec 1, ci0, cb58 # 5275
+convint c36, ci0 # 5276
+addm s105, s144, c36 # 5277
+mulsi s144, s105, 128 # 5278
+adds s105, s117, s144 # 5279
+convcbitvec 1, ci0, cb57 # 5280
+convint c36, ci0 # 5281
+addm s117, s143, c36 # 5282
+mulsi s143, s117, 256 # 5283
+adds s117, s105, s143 # 5284
+convcbitvec 1, ci0, cb56 # 5285
+convint c36, ci0 # 5286
+addm s105, s142, c36 # 5287
+mulsi s142, s105, 512 # 5288
+adds s105, s117, s142 # 5289
+convcbitvec 1, ci0, cb55 # 5290
+convint c36, ci0 # 5291
+addm s117, s141, c36 # 5292
+mulsi s141, s117, 1024 # 5293
+adds s117, s105, s141 # 5294
+convcbitvec 1, ci0, cb54 # 5295
+convint c36, ci0 # 5296
+addm s105, s140, c36 # 5297
+mulsi s140, s105, 2048 # 5298
+adds s105, s117, s140 # 5299
+convcbitvec 1, ci0, cb53 # 5300
+convint c36, ci0 # 5301
+addm s117, s139, c36 # 5302
+mulsi s139, s117, 4096 # 5303
+adds s117, s105, s139 # 5304
+convcbitvec 1, ci0, cb52 # 5305
+convint c36, ci0 # 5306
+addm s105, s138, c36 # 5307
+mulsi s138, s105, 8192 # 5308
+adds s105, s117, s138 # 5309
+convcbitvec 1, ci0, cb51 # 5310
+convint c36, ci0 # 5311
+addm s117, s137, c36 # 5312
+mulsi s137, s117, 16384 # 5313
+adds s117, s105, s137 # 5314
+convcbitvec 1, ci0, cb50 # 5315
+convint c36, ci0 # 5316
+addm s105, s136, c36 # 5317
+mulsi s136, s105, 32768 # 5318
+adds s105, s117, s136 # 5319
+convcbitvec 1, ci0, cb49 # 5320
+convint c36, ci0 # 5321
+addm s117, s135, c36 # 5322
+mulsi s135, s117, 65536 # 5323
+adds s117, s105, s135 # 5324
+convcbitvec 1, ci0, cb48 # 5325
+convint c36, ci0 # 5326
+addm s105, s134, c36 # 5327
+mulsi s134, s105, 131072 # 5328
+adds s105, s117, s134 # 5329
+convcbitvec 1, ci0, cb47 # 5330
+convint c36, ci0 # 5331
+addm s117, s133, c36 # 5332
+mulsi s133, s117, 262144 # 5333
+adds s117, s105, s133 # 5334
+convcbitvec 1, ci0, cb46 # 5335
+convint c36, ci0 # 5336
+addm s105, s132, c36 # 5337
+mulsi s132, s105, 524288 # 5338
+adds s105, s117, s132 # 5339
+convcbitvec 1, ci0, cb45 # 5340
+convint c36, ci0 # 5341
+addm s117, s131, c36 # 5342
+mulsi s131, s117, 1048576 # 5343
+adds s117, s105, s131 # 5344
+convcbitvec 1, ci0, cb44 # 5345
+convint c36, ci0 # 5346
+addm s105, s130, c36 # 5347
+mulsi s130, s105, 2097152 # 5348
+adds s105, s117, s130 # 5349
+convcbitvec 1, ci0, cb43 # 5350
+convint c36, ci0 # 5351
+addm s117, s129, c36 # 5352
+mulsi s129, s117, 4194304 # 5353
+adds s117, s105, s129 # 5354
+convcbitvec 1, ci0, cb42 # 5355
+convint c36, ci0 # 5356
+addm s105, s128, c36 # 5357
+mulsi s128, s105, 8388608 # 5358
+adds s105, s117, s128 # 5359
+convcbitvec 1, ci0, cb41 # 5360
+convint c36, ci0 # 5361
+addm s117, s127, c36 # 5362
+mulsi s127, s117, 16777216 # 5363
+adds s117, s105, s127 # 5364
+convcbitvec 1, ci0, cb40 # 5365
+convint c36, ci0 # 5366
+addm s105, s126, c36 # 5367
+mulsi s126, s105, 33554432 # 5368
+adds s105, s117, s126 # 5369
+convcbitvec 1, ci0, cb39 # 5370
+convint c36, ci0 # 5371
+addm s117, s125, c36 # 5372
+mulsi s125, s117, 67108864 # 5373
+adds s117, s105, s125 # 5374
+convcbitvec 1, ci0, cb38 # 5375
+convint c36, ci0 # 5376
+addm s105, s124, c36 # 5377
+mulsi s124, s105, 134217728 # 5378
+adds s105, s117, s124 # 5379
+convcbitvec 1, ci0, cb37 # 5380
+convint c36, ci0 # 5381
+addm s117, s123, c36 # 5382
+mulsi s123, s117, 268435456 # 5383
+adds s117, s105, s123 # 5384
+convcbitvec 1, ci0, cb36 # 5385
+convint c36, ci0 # 5386
+addm s105, s122, c36 # 5387
+mulsi s122, s105, 536870912 # 5388
+adds s105, s117, s122 # 5389
+convcbitvec 1, ci0, cb35 # 5390
+convint c36, ci0 # 5391
+addm s117, s121, c36 # 5392
+mulsi s121, s117, 1073741824 # 5393
+adds s117, s105, s121 # 5394
+subs s105, s117, s120 # 5395
+convcbitvec 1, ci0, cb34 # 5396
+convint c36, ci0 # 5397
+addm s117, s119, c36 # 5398
+convint c36, ci0 # 5399
+mulm s119, s115, c36 # 5400
+subs s115, s117, s119 # 5401
+movs s117, s115 # 5402
+mulm s115, s117, c32 # 5403
+adds s117, s105, s115 # 5404
+muls 8, 1, s105, s116, s117, 1, s115, s118, s117 # 5405
+mulsi s116, s105, 2 # 5406
+subs s105, s111, s116 # 5407
+muls 4, 1, s111, s105, s115 # 5408
+addm s105, s111, c34 # 5409
+convcbitvec 1, ci0, cb33 # 5410
+convint c32, ci0 # 5411
+addm s111, s114, c32 # 5412
+convint c34, ci0 # 5413
+mulm s114, s112, c34 # 5414
+subs s112, s111, s114 # 5415
+movs s111, s112 # 5416
+convcbitvec 1, ci0, cb32 # 5417
+convint c32, ci0 # 5418
+addm s112, s113, c32 # 5419
+convint c34, ci0 # 5420
+mulm s113, s107, c34 # 5421
+subs s107, s112, s113 # 5422
+movs s112, s107 # 5423
+adds s107, s111, s112 # 5424
+mulsi s111, s107, 1073741824 # 5425
+subs s107, s109, s111 # 5426
+convcbitvec 1, ci0, cb31 # 5427
+convint c34, ci0 # 5428
+addm s109, s110, c34 # 5429
+convint c32, ci0 # 5430
+mulm s110, s93, c32 # 5431
+subs s93, s109, s110 # 5432
+movs s109, s93 # 5433
+adds s93, s99, s109 # 5434
+mulm s99, s93, c35 # 5435
+subs s93, s108, s99 # 5436
+mulsi s108, s93, 1073741824 # 5437
+adds s99, s106, s108 # 5438
+adds s106, s99, s107 # 5439
+adds s99, s105, s106 # 5440
+asm_open 3, 0, c35, s99 # 5441
+shlci c34, c35, 1 # 5442
+shrci c32, c34, 31 # 5443
+shrci c34, c35, 63 # 5444
+addm s99, s104, c34 # 5445
+mulm s104, s91, c34 # 5446
+subs s91, s99, s104 # 5447
+mulm s99, s91, c33 # 5448
+submr s91, c32, s93 # 5449
+adds s93, s91, s99 # 5450
+subml s91, s93, c30 # 5451
+muls 8, 1, s93, s90, s91, 1, s99, s103, s91 # 5452
+submr s91, c0, s93 # 5453
+addm s90, s91, c0 # 5454
+addm s93, s99, c31 # 5455
+convcbitvec 1, ci0, cb30 # 5456
+convint c30, ci0 # 5457
+addm s99, s102, c30 # 5458
+convint c31, ci0 # 5459
+mulm s102, s100, c31 # 5460
+subs s100, s99, s102 # 5461
+movs s99, s100 # 5462
+convcbitvec 1, ci0, cb29 # 5463
+convint c30, ci0 # 5464
+addm s100, s101, c30 # 5465
+convint c31, ci0 # 5466
+mulm s101, s95, c31 # 5467
+subs s95, s100, s101 # 5468
+movs s100, s95 # 5469
+adds s95, s99, s100 # 5470
+mulsi s99, s95, 65536 # 5471
+subs s95, s97, s99 # 5472
+convcbitvec 1, ci0, cb28 # 5473
+convint c31, ci0 # 5474
+addm s97, s98, c31 # 5475
+convint c30, ci0 # 5476
+mulm s98, s86, c30 # 5477
+subs s86, s97, s98 # 5478
+movs s97, s86 # 5479
+adds s86, s68, s97 # 5480
+mulm s68, s86, c28 # 5481
+subs s86, s96, s68 # 5482
+mulsi s96, s86, 65536 # 5483
+adds s68, s94, s96 # 5484
+adds s94, s68, s95 # 5485
+adds s68, s93, s94 # 5486
+asm_open 3, 0, c31, s68 # 5487
+shlci c30, c31, 1 # 5488
+shrci c28, c30, 17 # 5489
+shrci c30, c31, 63 # 5490
+addm s68, s92, c30 # 5491
+mulm s92, s76, c30 # 5492
+subs s76, s68, s92 # 5493
+mulm s68, s76, c29 # 5494
+submr s76, c28, s86 # 5495
+adds s86, s76, s68 # 5496
+subml s76, s86, c27 # 5497
+muls 8, 1, s68, s76, s90, 1, s86, s91, s91 # 5498
+addm s76, s68, c26 # 5499
+addm s68, s86, c25 # 5500
+convcbitvec 1, ci0, cb27 # 5501
+convint c25, ci0 # 5502
+addm s86, s89, c25 # 5503
+convint c25, ci0 # 5504
+mulm s89, s87, c25 # 5505
+subs s87, s86, s89 # 5506
+movs s86, s87 # 5507
+convcbitvec 1, ci0, cb26 # 5508
+convint c25, ci0 # 5509
+addm s87, s88, c25 # 5510
+convint c25, ci0 # 5511
+mulm s88, s81, c25 # 5512
+subs s81, s87, s88 # 5513
+movs s87, s81 # 5514
+adds s81, s86, s87 # 5515
+mulm s86, s81, c24 # 5516
+subs s81, s82, s86 # 5517
+convcbitvec 1, ci0, cb25 # 5518
+convint c24, ci0 # 5519
+addm s82, s85, c24 # 5520
+convint c24, ci0 # 5521
+mulm s85, s83, c24 # 5522
+subs s83, s82, s85 # 5523
+movs s82, s83 # 5524
+convcbitvec 1, ci0, cb24 # 5525
+convint c24, ci0 # 5526
+addm s83, s84, c24 # 5527
+convint c24, ci0 # 5528
+mulm s84, s66, c24 # 5529
+subs s66, s83, s84 # 5530
+movs s83, s66 # 5531
+adds s66, s82, s83 # 5532
+mulm s82, s66, c23 # 5533
+subs s66, s50, s82 # 5534
+mulm s82, s66, c20 # 5535
+adds s50, s80, s82 # 5536
+adds s80, s50, s81 # 5537
+adds s50, s76, s80 # 5538
+convcbitvec 1, ci0, cb23 # 5539
+convint c23, ci0 # 5540
+addm s76, s79, c23 # 5541
+convint c20, ci0 # 5542
+mulm s79, s77, c20 # 5543
+subs s77, s76, s79 # 5544
+movs s76, s77 # 5545
+convcbitvec 1, ci0, cb22 # 5546
+convint c20, ci0 # 5547
+addm s77, s78, c20 # 5548
+convint c23, ci0 # 5549
+mulm s78, s71, c23 # 5550
+subs s71, s77, s78 # 5551
+movs s77, s71 # 5552
+adds s71, s76, s77 # 5553
+mulm s76, s71, c22 # 5554
+subs s71, s69, s76 # 5555
+convcbitvec 1, ci0, cb21 # 5556
+convint c20, ci0 # 5557
+addm s69, s75, c20 # 5558
+convint c20, ci0 # 5559
+mulm s75, s73, c20 # 5560
+subs s73, s69, s75 # 5561
+movs s69, s73 # 5562
+convcbitvec 1, ci0, cb20 # 5563
+convint c23, ci0 # 5564
+addm s73, s74, c23 # 5565
+convint c22, ci0 # 5566
+mulm s74, s42, c22 # 5567
+subs s42, s73, s74 # 5568
+movs s73, s42 # 5569
+adds s42, s69, s73 # 5570
+mulsi s69, s42, 1073741824 # 5571
+subs s42, s72, s69 # 5572
+mulm s72, s42, c21 # 5573
+adds s69, s70, s72 # 5574
+adds s70, s69, s71 # 5575
+adds s69, s68, s70 # 5576
+mulsi s68, s69, 2 # 5577
+asm_open 5, 0, c22, s50, c21, s68 # 5578
+shlci c23, c22, 1 # 5579
+shrci c20, c23, 33 # 5580
+submr s50, c20, s66 # 5581
+shrci c20, c22, 63 # 5582
+addm s66, s67, c20 # 5583
+mulm s67, s64, c20 # 5584
+subs s64, s66, s67 # 5585
+mulm s66, s64, c19 # 5586
+adds s64, s50, s66 # 5587
+subsi s50, s64, 1073741824 # 5588
+shlci c20, c21, 1 # 5589
+shrci c19, c20, 34 # 5590
+shrci c20, c21, 63 # 5591
+addm s64, s65, c20 # 5592
+mulm s65, s60, c20 # 5593
+subs s60, s64, s65 # 5594
+mulsi s65, s60, 1073741824 # 5595
+submr s64, c19, s42 # 5596
+adds s60, s64, s65 # 5597
+subsi s65, s60, 536870912 # 5598
+addm s64, s65, c0 # 5599
+muls 8, 1, s42, s50, s64, 1, s60, s65, s65 # 5600
+addm s50, s42, c18 # 5601
+addm s42, s60, c17 # 5602
+convcbitvec 1, ci0, cb19 # 5603
+convint c17, ci0 # 5604
+addm s60, s63, c17 # 5605
+convint c17, ci0 # 5606
+mulm s63, s61, c17 # 5607
+subs s61, s60, s63 # 5608
+movs s60, s61 # 5609
+convcbitvec 1, ci0, cb18 # 5610
+convint c17, ci0 # 5611
+addm s61, s62, c17 # 5612
+convint c17, ci0 # 5613
+mulm s62, s55, c17 # 5614
+subs s55, s61, s62 # 5615
+movs s61, s55 # 5616
+adds s55, s60, s61 # 5617
+mulm s60, s55, c16 # 5618
+subs s55, s56, s60 # 5619
+convcbitvec 1, ci0, cb17 # 5620
+convint c16, ci0 # 5621
+addm s56, s59, c16 # 5622
+convint c16, ci0 # 5623
+mulm s59, s57, c16 # 5624
+subs s57, s56, s59 # 5625
+movs s56, s57 # 5626
+convcbitvec 1, ci0, cb16 # 5627
+convint c16, ci0 # 5628
+addm s57, s58, c16 # 5629
+convint c16, ci0 # 5630
+mulm s58, s40, c16 # 5631
+subs s40, s57, s58 # 5632
+movs s57, s40 # 5633
+adds s40, s56, s57 # 5634
+mulm s56, s40, c15 # 5635
+subs s40, s24, s56 # 5636
+mulm s56, s40, c12 # 5637
+adds s24, s54, s56 # 5638
+adds s54, s24, s55 # 5639
+adds s24, s50, s54 # 5640
+convcbitvec 1, ci0, cb15 # 5641
+convint c15, ci0 # 5642
+addm s50, s53, c15 # 5643
+convint c12, ci0 # 5644
+mulm s53, s51, c12 # 5645
+subs s51, s50, s53 # 5646
+movs s50, s51 # 5647
+convcbitvec 1, ci0, cb14 # 5648
+convint c12, ci0 # 5649
+addm s51, s52, c12 # 5650
+convint c15, ci0 # 5651
+mulm s52, s45, c15 # 5652
+subs s45, s51, s52 # 5653
+movs s51, s45 # 5654
+adds s45, s50, s51 # 5655
+mulm s50, s45, c14 # 5656
+subs s45, s43, s50 # 5657
+convcbitvec 1, ci0, cb13 # 5658
+convint c12, ci0 # 5659
+addm s43, s49, c12 # 5660
+convint c12, ci0 # 5661
+mulm s49, s47, c12 # 5662
+subs s47, s43, s49 # 5663
+movs s43, s47 # 5664
+convcbitvec 1, ci0, cb12 # 5665
+convint c15, ci0 # 5666
+addm s47, s48, c15 # 5667
+convint c14, ci0 # 5668
+mulm s48, s16, c14 # 5669
+subs s16, s47, s48 # 5670
+movs s47, s16 # 5671
+adds s16, s43, s47 # 5672
+mulsi s43, s16, 1073741824 # 5673
+subs s16, s46, s43 # 5674
+mulm s46, s16, c13 # 5675
+adds s43, s44, s46 # 5676
+adds s44, s43, s45 # 5677
+adds s43, s42, s44 # 5678
+mulsi s42, s43, 2 # 5679
+asm_open 5, 0, c14, s24, c13, s42 # 5680
+shlci c15, c14, 1 # 5681
+shrci c12, c15, 33 # 5682
+submr s24, c12, s40 # 5683
+shrci c12, c14, 63 # 5684
+addm s40, s41, c12 # 5685
+mulm s41, s39, c12 # 5686
+subs s39, s40, s41 # 5687
+mulm s40, s39, c11 # 5688
+adds s39, s24, s40 # 5689
+subsi s24, s39, 1073741824 # 5690
+shlci c12, c13, 1 # 5691
+shrci c11, c12, 34 # 5692
+shrci c12, c13, 63 # 5693
+addm s39, s38, c12 # 5694
+mulm s38, s34, c12 # 5695
+subs s34, s39, s38 # 5696
+mulsi s39, s34, 1073741824 # 5697
+submr s38, c11, s16 # 5698
+adds s34, s38, s39 # 5699
+subsi s39, s34, 536870912 # 5700
+addm s38, s39, c0 # 5701
+muls 8, 1, s16, s24, s38, 1, s34, s39, s39 # 5702
+addm s24, s16, c10 # 5703
+addm s16, s34, c9 # 5704
+convcbitvec 1, ci0, cb11 # 5705
+convint c9, ci0 # 5706
+addm s34, s37, c9 # 5707
+convint c9, ci0 # 5708
+mulm s37, s35, c9 # 5709
+subs s35, s34, s37 # 5710
+movs s34, s35 # 5711
+convcbitvec 1, ci0, cb10 # 5712
+convint c9, ci0 # 5713
+addm s35, s36, c9 # 5714
+convint c9, ci0 # 5715
+mulm s36, s29, c9 # 5716
+subs s29, s35, s36 # 5717
+movs s35, s29 # 5718
+adds s29, s34, s35 # 5719
+mulm s34, s29, c8 # 5720
+subs s29, s1, s34 # 5721
+convcbitvec 1, ci0, cb9 # 5722
+convint c8, ci0 # 5723
+addm s1, s33, c8 # 5724
+convint c8, ci0 # 5725
+mulm s33, s31, c8 # 5726
+subs s31, s1, s33 # 5727
+movs s1, s31 # 5728
+convcbitvec 1, ci0, cb8 # 5729
+convint c8, ci0 # 5730
+addm s31, s32, c8 # 5731
+convint c8, ci0 # 5732
+mulm s32, s14, c8 # 5733
+subs s14, s31, s32 # 5734
+movs s31, s14 # 5735
+adds s14, s1, s31 # 5736
+mulm s1, s14, c7 # 5737
+subs s14, s30, s1 # 5738
+mulm s30, s14, c4 # 5739
+adds s1, s28, s30 # 5740
+adds s28, s1, s29 # 5741
+adds s1, s24, s28 # 5742
+convcbitvec 1, ci0, cb7 # 5743
+convint c7, ci0 # 5744
+addm s24, s27, c7 # 5745
+convint c4, ci0 # 5746
+mulm s27, s25, c4 # 5747
+subs s25, s24, s27 # 5748
+movs s24, s25 # 5749
+convcbitvec 1, ci0, cb6 # 5750
+convint c4, ci0 # 5751
+addm s25, s26, c4 # 5752
+convint c7, ci0 # 5753
+mulm s26, s19, c7 # 5754
+subs s19, s25, s26 # 5755
+movs s25, s19 # 5756
+adds s19, s24, s25 # 5757
+mulm s24, s19, c6 # 5758
+subs s19, s17, s24 # 5759
+convcbitvec 1, ci0, cb5 # 5760
+convint c4, ci0 # 5761
+addm s17, s23, c4 # 5762
+convint c4, ci0 # 5763
+mulm s23, s21, c4 # 5764
+subs s21, s17, s23 # 5765
+movs s17, s21 # 5766
+convcbitvec 1, ci0, cb4 # 5767
+convint c7, ci0 # 5768
+addm s21, s22, c7 # 5769
+convint c6, ci0 # 5770
+mulm s22, s11, c6 # 5771
+subs s11, s21, s22 # 5772
+movs s21, s11 # 5773
+adds s11, s17, s21 # 5774
+mulsi s17, s11, 1073741824 # 5775
+subs s11, s20, s17 # 5776
+mulm s20, s11, c5 # 5777
+adds s17, s18, s20 # 5778
+adds s18, s17, s19 # 5779
+adds s17, s16, s18 # 5780
+mulsi s16, s17, 2 # 5781
+asm_open 5, 0, c6, s1, c5, s16 # 5782
+shlci c7, c6, 1 # 5783
+shrci c4, c7, 33 # 5784
+submr s1, c4, s14 # 5785
+shrci c4, c6, 63 # 5786
+addm s14, s15, c4 # 5787
+mulm s15, s12, c4 # 5788
+subs s12, s14, s15 # 5789
+mulm s14, s12, c3 # 5790
+adds s12, s1, s14 # 5791
+subsi s1, s12, 1073741824 # 5792
+shlci c4, c5, 1 # 5793
+shrci c3, c4, 34 # 5794
+shrci c4, c5, 63 # 5795
+addm s12, s13, c4 # 5796
+mulm s13, s7, c4 # 5797
+subs s7, s12, s13 # 5798
+mulsi s12, s7, 1073741824 # 5799
+submr s7, c3, s11 # 5800
+adds s11, s7, s12 # 5801
+subsi s7, s11, 536870912 # 5802
+addm s11, s7, c0 # 5803
+muls 4, 1, s7, s1, s11 # 5804
+addm s1, s7, c1 # 5805
+convcbitvec 1, ci0, cb3 # 5806
+convint c0, ci0 # 5807
+addm s7, s10, c0 # 5808
+convint c1, ci0 # 5809
+mulm s10, s8, c1 # 5810
+subs s8, s7, s10 # 5811
+movs s7, s8 # 5812
+convcbitvec 1, ci0, cb2 # 5813
+convint c0, ci0 # 5814
+addm s8, s9, c0 # 5815
+convint c1, ci0 # 5816
+mulm s9, s5, c1 # 5817
+subs s5, s8, s9 # 5818
+movs s8, s5 # 5819
+adds s5, s7, s8 # 5820
+mulm s7, s5, c2 # 5821
+subs s5, s0, s7 # 5822
+convcbitvec 1, ci0, cb1 # 5823
+convint c0, ci0 # 5824
+addm s0, s3, c0 # 5825
+convint c1, ci0 # 5826
+mulm s3, s2, c1 # 5827
+subs s2, s0, s3 # 5828
+movs s3, s2 # 5829
+convcbitvec 1, ci0, cb0 # 5830
+convint c2, ci0 # 5831
+addm s2, s4, c2 # 5832
+mulsi s0, s4, 2 # 5833
+convint c0, ci0 # 5834
+mulm s4, s0, c0 # 5835
+subs s0, s2, s4 # 5836
+movs s4, s0 # 5837
+adds s2, s3, s4 # 5838
+ldi c1, 1 # 5839
+mulci c2, c1, 2147483647 # 5840
+addci c0, c2, 1 # 5841
+mulm s0, s2, c0 # 5842
+subs s2, s6, s0 # 5843
+bit s3 # 5844
+ldi c1, 2 # 5845
+mulci c2, c1, 2147483647 # 5846
+addci c0, c2, 4 # 5847
+mulci c1, c0, 2147483647 # 5848
+addci c2, c1, 2 # 5849
+mulm s4, s3, c2 # 5850
+ldi c1, 2 # 5851
+mulci c0, c1, 2147483647 # 5852
+addci c2, c0, 2 # 5853
+mulm s6, s2, c2 # 5854
+adds s0, s4, s6 # 5855
+adds s4, s0, s5 # 5856
+adds s0, s1, s4 # 5857
+asm_open 3, 0, c2, s0 # 5858
+shlci c0, c2, 1 # 5859
+shrci c1, c0, 33 # 5860
+shrci c0, c2, 63 # 5861
+addm s1, s3, c0 # 5862
+mulsi s0, s3, 2 # 5863
+mulm s3, s0, c0 # 5864
+subs s0, s1, s3 # 5865
+submr s1, c1, s2 # 5866
+ldi c0, 1 # 5867
+mulci c1, c0, 2147483647 # 5868
+addci c0, c1, 1 # 5869
+mulm s2, s0, c0 # 5870
+adds s0, s1, s2 # 5871
+subsi s1, s0, 1073741824 # 5872
+movs s0, s1 # 5873
+use 2, 0, 2618 # 5874
+use 0, 2, 9 # 5875
+use 0, 4, 40 # 5876
+use 0, 7, 9 # 5877
+use 0, 0, 13 # 5878
+reqbl -64 # 5879
@@ -0,0 +1,208 @@
+vcall_arg 5, *10, 4 # 0
+vsplit 5, 98, 3, s10, sb33, sb35, sb93, sb30, sb32, sb89, sb27, sb28, sb85, sb24, sb26, sb82, sb21, sb22, sb80, sb19, sb20, sb78, sb14, sb16, sb76, sb53, sb12, sb74, sb5, sb7, sb72, sb0, sb51, sb70, sb155, sb156, sb68, sb153, sb154, sb66, sb151, sb152, sb64, sb149, sb150, sb62, sb147, sb148, sb60, sb145, sb146, sb58, sb143, sb144, sb56, sb141, sb142, sb54, sb139, sb140, sb52, sb137, sb138, sb50, sb65, sb136, sb48, sb91, sb95, sb46, sb83, sb87, sb44, sb79, sb81, sb42, sb75, sb77, sb36, sb71, sb73, sb34, sb67, sb69, sb31, sb63, sb61, sb29, sb47, sb49, sb25, sb43, sb45, sb23, sb41, sb59, sb18, sb8, sb11, sb9 # 1
+xors 4, 5, sb97, sb93, sb35 # 2
+xors 4, 5, sb99, sb33, sb93 # 3
+xors 4, 5, sb101, sb89, sb32 # 4
+xors 4, 5, sb120, sb101, sb30 # 5
+xors 4, 5, sb103, sb30, sb89 # 6
+xors 4, 5, sb105, sb85, sb28 # 7
+xors 4, 5, sb118, sb105, sb27 # 8
+xors 4, 5, sb107, sb27, sb85 # 9
+xors 4, 5, sb109, sb82, sb26 # 10
+xors 4, 5, sb116, sb109, sb24 # 11
+xors 4, 5, sb111, sb24, sb82 # 12
+xors 4, 5, sb113, sb80, sb22 # 13
+xors 4, 5, sb114, sb113, sb21 # 14
+xors 4, 5, sb115, sb21, sb80 # 15
+xors 4, 5, sb117, sb78, sb20 # 16
+xors 4, 5, sb112, sb117, sb19 # 17
+xors 4, 5, sb119, sb19, sb78 # 18
+xors 4, 5, sb121, sb76, sb16 # 19
+xors 4, 5, sb110, sb121, sb14 # 20
+xors 4, 5, sb122, sb14, sb76 # 21
+xors 4, 5, sb123, sb74, sb12 # 22
+xors 4, 5, sb108, sb123, sb53 # 23
+xors 4, 5, sb124, sb53, sb74 # 24
+xors 4, 5, sb125, sb72, sb7 # 25
+xors 4, 5, sb106, sb125, sb5 # 26
+xors 4, 5, sb126, sb5, sb72 # 27
+xors 4, 5, sb127, sb70, sb51 # 28
+xors 4, 5, sb104, sb127, sb0 # 29
+xors 4, 5, sb128, sb0, sb70 # 30
+xors 4, 5, sb129, sb68, sb156 # 31
+xors 4, 5, sb102, sb129, sb155 # 32
+xors 4, 5, sb130, sb155, sb68 # 33
+xors 4, 5, sb131, sb66, sb154 # 34
+xors 4, 5, sb100, sb131, sb153 # 35
+xors 4, 5, sb132, sb153, sb66 # 36
+xors 4, 5, sb133, sb64, sb152 # 37
+xors 4, 5, sb98, sb133, sb151 # 38
+xors 4, 5, sb134, sb151, sb64 # 39
+xors 4, 5, sb1, sb62, sb150 # 40
+xors 4, 5, sb96, sb1, sb149 # 41
+xors 4, 5, sb2, sb149, sb62 # 42
+xors 4, 5, sb3, sb60, sb148 # 43
+xors 4, 5, sb94, sb3, sb147 # 44
+xors 4, 5, sb4, sb147, sb60 # 45
+xors 4, 5, sb6, sb58, sb146 # 46
+xors 4, 5, sb92, sb6, sb145 # 47
+xors 4, 5, sb10, sb145, sb58 # 48
+xors 4, 5, sb13, sb56, sb144 # 49
+xors 4, 5, sb90, sb13, sb143 # 50
+xors 4, 5, sb15, sb143, sb56 # 51
+xors 4, 5, sb17, sb54, sb142 # 52
+xors 4, 5, sb88, sb17, sb141 # 53
+xors 4, 5, sb21, sb141, sb54 # 54
+xors 4, 5, sb26, sb52, sb140 # 55
+xors 4, 5, sb86, sb26, sb139 # 56
+xors 4, 5, sb32, sb139, sb52 # 57
+xors 4, 5, sb38, sb50, sb138 # 58
+xors 4, 5, sb84, sb38, sb137 # 59
+xors 4, 5, sb40, sb137, sb50 # 60
+xors 4, 5, sb135, sb48, sb136 # 61
+xors 4, 5, sb0, sb135, sb65 # 62
+xors 4, 5, sb136, sb65, sb48 # 63
+xors 4, 5, sb137, sb46, sb95 # 64
+xors 4, 5, sb39, sb137, sb91 # 65
+xors 4, 5, sb138, sb91, sb46 # 66
+xors 4, 5, sb139, sb44, sb87 # 67
+xors 4, 5, sb37, sb139, sb83 # 68
+xors 4, 5, sb140, sb83, sb44 # 69
+xors 4, 5, sb141, sb42, sb81 # 70
+xors 4, 5, sb28, sb141, sb79 # 71
+xors 4, 5, sb142, sb79, sb42 # 72
+xors 4, 5, sb143, sb36, sb77 # 73
+xors 4, 5, sb22, sb143, sb75 # 74
+xors 4, 5, sb144, sb75, sb36 # 75
+xors 4, 5, sb145, sb34, sb73 # 76
+xors 4, 5, sb20, sb145, sb71 # 77
+xors 4, 5, sb146, sb71, sb34 # 78
+xors 4, 5, sb147, sb31, sb69 # 79
+xors 4, 5, sb16, sb147, sb67 # 80
+xors 4, 5, sb148, sb67, sb31 # 81
+xors 4, 5, sb149, sb29, sb61 # 82
+xors 4, 5, sb14, sb149, sb63 # 83
+xors 4, 5, sb150, sb63, sb29 # 84
+xors 4, 5, sb151, sb25, sb49 # 85
+xors 4, 5, sb12, sb151, sb47 # 86
+xors 4, 5, sb152, sb47, sb25 # 87
+xors 4, 5, sb153, sb23, sb45 # 88
+xors 4, 5, sb7, sb153, sb43 # 89
+xors 4, 5, sb154, sb43, sb23 # 90
+xors 4, 5, sb155, sb18, sb59 # 91
+xors 4, 5, sb5, sb155, sb41 # 92
+xors 4, 5, sb156, sb41, sb18 # 93
+ands 124, 5, sb95, sb97, sb99, 5, sb91, sb101, sb103, 5, sb87, sb105, sb107, 5, sb83, sb109, sb111, 5, sb81, sb113, sb115, 5, sb79, sb117, sb119, 5, sb77, sb121, sb122, 5, sb75, sb123, sb124, 5, sb73, sb125, sb126, 5, sb71, sb127, sb128, 5, sb69, sb129, sb130, 5, sb67, sb131, sb132, 5, sb65, sb133, sb134, 5, sb63, sb1, sb2, 5, sb61, sb3, sb4, 5, sb59, sb6, sb10, 5, sb57, sb13, sb15, 5, sb55, sb17, sb21, 5, sb53, sb26, sb32, 5, sb51, sb38, sb40, 5, sb49, sb135, sb136, 5, sb47, sb137, sb138, 5, sb45, sb139, sb140, 5, sb43, sb141, sb142, 5, sb41, sb143, sb144, 5, sb35, sb145, sb146, 5, sb33, sb147, sb148, 5, sb30, sb149, sb150, 5, sb27, sb151, sb152, 5, sb24, sb153, sb154, 5, sb19, sb155, sb156 # 94
+xors 4, 5, sb119, sb93, sb95 # 95
+xors 4, 5, sb117, sb89, sb91 # 96
+xors 4, 5, sb115, sb85, sb87 # 97
+xors 4, 5, sb113, sb82, sb83 # 98
+xors 4, 5, sb111, sb80, sb81 # 99
+xors 4, 5, sb109, sb78, sb79 # 100
+xors 4, 5, sb107, sb76, sb77 # 101
+xors 4, 5, sb105, sb74, sb75 # 102
+xors 4, 5, sb103, sb72, sb73 # 103
+xors 4, 5, sb101, sb70, sb71 # 104
+xors 4, 5, sb99, sb68, sb69 # 105
+xors 4, 5, sb97, sb66, sb67 # 106
+xors 4, 5, sb95, sb64, sb65 # 107
+xors 4, 5, sb93, sb62, sb63 # 108
+xors 4, 5, sb91, sb60, sb61 # 109
+xors 4, 5, sb89, sb58, sb59 # 110
+xors 4, 5, sb87, sb56, sb57 # 111
+xors 4, 5, sb85, sb54, sb55 # 112
+xors 4, 5, sb83, sb52, sb53 # 113
+xors 4, 5, sb40, sb50, sb51 # 114
+xors 4, 5, sb38, sb48, sb49 # 115
+xors 4, 5, sb32, sb46, sb47 # 116
+xors 4, 5, sb26, sb44, sb45 # 117
+xors 4, 5, sb21, sb42, sb43 # 118
+xors 4, 5, sb17, sb36, sb41 # 119
+xors 4, 5, sb15, sb34, sb35 # 120
+xors 4, 5, sb13, sb31, sb33 # 121
+xors 4, 5, sb10, sb29, sb30 # 122
+xors 4, 5, sb6, sb25, sb27 # 123
+xors 4, 5, sb2, sb23, sb24 # 124
+xors 4, 5, sb3, sb18, sb19 # 125
+xors 4, 5, sb4, sb9, sb11 # 126
+xors 4, 5, sb1, sb4, sb8 # 127
+xors 4, 5, sb11, sb2, sb5 # 128
+xors 4, 5, sb24, sb6, sb7 # 129
+xors 4, 5, sb121, sb10, sb12 # 130
+xors 4, 5, sb48, sb13, sb14 # 131
+xors 4, 5, sb122, sb15, sb16 # 132
+xors 4, 5, sb50, sb17, sb20 # 133
+xors 4, 5, sb123, sb21, sb22 # 134
+xors 4, 5, sb52, sb26, sb28 # 135
+xors 4, 5, sb124, sb32, sb37 # 136
+xors 4, 5, sb54, sb38, sb39 # 137
+xors 4, 5, sb125, sb40, sb0 # 138
+xors 4, 5, sb56, sb83, sb84 # 139
+xors 4, 5, sb126, sb85, sb86 # 140
+xors 4, 5, sb58, sb87, sb88 # 141
+xors 4, 5, sb127, sb89, sb90 # 142
+xors 4, 5, sb60, sb91, sb92 # 143
+xors 4, 5, sb128, sb93, sb94 # 144
+xors 4, 5, sb62, sb95, sb96 # 145
+xors 4, 5, sb129, sb97, sb98 # 146
+xors 4, 5, sb64, sb99, sb100 # 147
+xors 4, 5, sb130, sb101, sb102 # 148
+xors 4, 5, sb66, sb103, sb104 # 149
+xors 4, 5, sb131, sb105, sb106 # 150
+xors 4, 5, sb68, sb107, sb108 # 151
+xors 4, 5, sb132, sb109, sb110 # 152
+xors 4, 5, sb70, sb111, sb112 # 153
+xors 4, 5, sb133, sb113, sb114 # 154
+xors 4, 5, sb72, sb115, sb116 # 155
+xors 4, 5, sb134, sb117, sb118 # 156
+ands 176, 5, sb23, sb2, sb5, 5, sb46, sb6, sb7, 5, sb47, sb10, sb12, 5, sb45, sb13, sb14, 5, sb49, sb15, sb16, 5, sb44, sb17, sb20, 5, sb51, sb21, sb22, 5, sb43, sb26, sb28, 5, sb53, sb32, sb37, 5, sb42, sb38, sb39, 5, sb55, sb40, sb0, 5, sb30, sb83, sb84, 5, sb57, sb85, sb86, 5, sb36, sb87, sb88, 5, sb59, sb89, sb90, 5, sb34, sb91, sb92, 5, sb61, sb93, sb94, 5, sb19, sb95, sb96, 5, sb63, sb97, sb98, 5, sb41, sb99, sb100, 5, sb65, sb101, sb102, 5, sb9, sb103, sb104, 5, sb67, sb105, sb106, 5, sb8, sb107, sb108, 5, sb69, sb109, sb110, 5, sb4, sb111, sb112, 5, sb71, sb113, sb114, 5, sb18, sb115, sb116, 5, sb73, sb117, sb118, 5, sb82, sb119, sb120, 5, sb74, sb24, sb121, 5, sb25, sb48, sb122, 5, sb75, sb50, sb123, 5, sb27, sb52, sb124, 5, sb76, sb54, sb125, 5, sb29, sb56, sb126, 5, sb77, sb58, sb127, 5, sb31, sb60, sb128, 5, sb78, sb62, sb129, 5, sb33, sb64, sb130, 5, sb79, sb66, sb131, 5, sb35, sb68, sb132, 5, sb80, sb70, sb133, 5, sb81, sb72, sb134 # 157
+ands 88, 5, sb22, sb24, sb47, 5, sb26, sb48, sb49, 5, sb21, sb50, sb51, 5, sb28, sb52, sb53, 5, sb20, sb54, sb55, 5, sb16, sb56, sb57, 5, sb2, sb58, sb59, 5, sb32, sb60, sb61, 5, sb14, sb62, sb63, 5, sb10, sb64, sb65, 5, sb7, sb66, sb67, 5, sb6, sb68, sb69, 5, sb0, sb70, sb71, 5, sb17, sb72, sb73, 5, sb5, sb11, sb74, 5, sb37, sb25, sb75, 5, sb13, sb27, sb76, 5, sb38, sb29, sb77, 5, sb15, sb31, sb78, 5, sb39, sb33, sb79, 5, sb40, sb35, sb80, 5, sb12, sb81, sb82 # 158
+xors 4, 5, sb24, sb22, sb46 # 159
+xors 4, 5, sb22, sb26, sb45 # 160
+xors 4, 5, sb26, sb21, sb44 # 161
+xors 4, 5, sb21, sb28, sb43 # 162
+xors 4, 5, sb28, sb20, sb42 # 163
+xors 4, 5, sb20, sb16, sb30 # 164
+xors 4, 5, sb30, sb2, sb36 # 165
+xors 4, 5, sb16, sb32, sb34 # 166
+xors 4, 5, sb32, sb14, sb19 # 167
+xors 4, 5, sb2, sb10, sb41 # 168
+xors 4, 5, sb34, sb7, sb9 # 169
+xors 4, 5, sb19, sb6, sb8 # 170
+xors 4, 5, sb36, sb0, sb4 # 171
+xors 4, 5, sb14, sb17, sb18 # 172
+xors 4, 5, sb41, sb12, sb14 # 173
+ands 44, 5, sb12, sb11, sb24, 5, sb10, sb25, sb26, 5, sb14, sb27, sb28, 5, sb9, sb29, sb30, 5, sb7, sb31, sb32, 5, sb0, sb33, sb34, 5, sb8, sb35, sb36, 5, sb4, sb5, sb37, 5, sb17, sb13, sb38, 5, sb18, sb15, sb39, 5, sb6, sb40, sb41 # 174
+xors 4, 5, sb11, sb12, sb23 # 175
+xors 4, 5, sb12, sb10, sb22 # 176
+xors 4, 5, sb10, sb14, sb21 # 177
+xors 4, 5, sb14, sb9, sb20 # 178
+xors 4, 5, sb9, sb7, sb16 # 179
+xors 4, 5, sb16, sb0, sb2 # 180
+xors 4, 5, sb7, sb8, sb19 # 181
+xors 4, 5, sb19, sb6, sb7 # 182
+ands 20, 5, sb6, sb5, sb12, 5, sb2, sb13, sb14, 5, sb8, sb15, sb16, 5, sb7, sb4, sb17, 5, sb0, sb18, sb19 # 183
+xors 4, 5, sb5, sb6, sb11 # 184
+xors 4, 5, sb6, sb2, sb10 # 185
+xors 4, 5, sb2, sb8, sb9 # 186
+xors 4, 5, sb8, sb0, sb2 # 187
+ands 8, 5, sb2, sb4, sb6, 5, sb0, sb7, sb8 # 188
+xors 4, 5, sb4, sb2, sb5 # 189
+xors 4, 5, sb2, sb0, sb4 # 190
+xors 4, 5, sb0, sb2, sb3 # 191
+xors 4, 5, sb2, sb0, sb1 # 192
+vdabit 5, s10, sb1 # 193
+xors 4, 5, sb0, sb1, sb2 # 194
+reveal 3, 5, cb0, sb0 # 195
+convcbitvec 5, ci0, cb0 # 196
+vconvint 5, c0, ci0 # 197
+vaddm 5, s5, s10, c0 # 198
+vmulsi 5, s0, s10, 2 # 199
+vconvint 5, c0, ci0 # 200
+vmulm 5, s10, s0, c0 # 201
+vsubs 5, s0, s5, s10 # 202
+vmovs 5, s5, s0 # 203
+vmovs 5, s0, s5 # 204
+use 2, 0, 575 # 205
+use 0, 4, 5 # 206
+reqbl -64 # 207
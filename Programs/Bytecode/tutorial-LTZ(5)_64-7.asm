@@ -0,0 +1,401 @@
+vcall_arg 5, *10, 4 # 0
+vsplit 5, 194, 3, s10, sb15, sb21, sb205, sb9, sb10, sb201, sb278, sb5, sb197, sb315, sb316, sb193, sb313, sb314, sb189, sb311, sb312, sb185, sb309, sb310, sb181, sb307, sb308, sb177, sb305, sb306, sb173, sb303, sb304, sb170, sb301, sb302, sb168, sb299, sb300, sb166, sb297, sb298, sb164, sb295, sb296, sb162, sb293, sb294, sb160, sb291, sb292, sb158, sb289, sb290, sb156, sb287, sb288, sb154, sb285, sb286, sb152, sb283, sb284, sb150, sb281, sb282, sb148, sb279, sb280, sb146, sb277, sb54, sb144, sb50, sb276, sb142, sb203, sb207, sb140, sb199, sb200, sb138, sb39, sb198, sb136, sb195, sb196, sb134, sb192, sb194, sb132, sb190, sb191, sb130, sb187, sb188, sb128, sb184, sb186, sb126, sb182, sb183, sb124, sb179, sb180, sb122, sb35, sb178, sb120, sb175, sb176, sb118, sb33, sb174, sb116, sb171, sb172, sb114, sb167, sb169, sb112, sb163, sb165, sb110, sb159, sb161, sb108, sb155, sb157, sb106, sb151, sb153, sb104, sb147, sb149, sb102, sb143, sb145, sb100, sb139, sb141, sb98, sb135, sb137, sb96, sb131, sb133, sb94, sb127, sb129, sb92, sb123, sb125, sb90, sb119, sb121, sb88, sb115, sb117, sb86, sb111, sb113, sb82, sb107, sb109, sb78, sb103, sb105, sb75, sb99, sb101, sb73, sb95, sb97, sb71, sb91, sb93, sb68, sb87, sb89, sb65, sb80, sb84, sb63, sb74, sb76, sb60, sb69, sb72, sb57, sb64, sb67, sb53, sb48, sb51, sb49 # 1
+xors 4, 5, sb209, sb205, sb21 # 2
+xors 4, 5, sb211, sb15, sb205 # 3
+xors 4, 5, sb213, sb201, sb10 # 4
+xors 4, 5, sb248, sb213, sb9 # 5
+xors 4, 5, sb215, sb9, sb201 # 6
+xors 4, 5, sb217, sb197, sb5 # 7
+xors 4, 5, sb246, sb217, sb278 # 8
+xors 4, 5, sb219, sb278, sb197 # 9
+xors 4, 5, sb221, sb193, sb316 # 10
+xors 4, 5, sb244, sb221, sb315 # 11
+xors 4, 5, sb223, sb315, sb193 # 12
+xors 4, 5, sb225, sb189, sb314 # 13
+xors 4, 5, sb242, sb225, sb313 # 14
+xors 4, 5, sb227, sb313, sb189 # 15
+xors 4, 5, sb229, sb185, sb312 # 16
+xors 4, 5, sb240, sb229, sb311 # 17
+xors 4, 5, sb231, sb311, sb185 # 18
+xors 4, 5, sb233, sb181, sb310 # 19
+xors 4, 5, sb238, sb233, sb309 # 20
+xors 4, 5, sb235, sb309, sb181 # 21
+xors 4, 5, sb237, sb177, sb308 # 22
+xors 4, 5, sb236, sb237, sb307 # 23
+xors 4, 5, sb239, sb307, sb177 # 24
+xors 4, 5, sb241, sb173, sb306 # 25
+xors 4, 5, sb234, sb241, sb305 # 26
+xors 4, 5, sb243, sb305, sb173 # 27
+xors 4, 5, sb245, sb170, sb304 # 28
+xors 4, 5, sb232, sb245, sb303 # 29
+xors 4, 5, sb247, sb303, sb170 # 30
+xors 4, 5, sb249, sb168, sb302 # 31
+xors 4, 5, sb230, sb249, sb301 # 32
+xors 4, 5, sb250, sb301, sb168 # 33
+xors 4, 5, sb251, sb166, sb300 # 34
+xors 4, 5, sb228, sb251, sb299 # 35
+xors 4, 5, sb252, sb299, sb166 # 36
+xors 4, 5, sb253, sb164, sb298 # 37
+xors 4, 5, sb226, sb253, sb297 # 38
+xors 4, 5, sb254, sb297, sb164 # 39
+xors 4, 5, sb255, sb162, sb296 # 40
+xors 4, 5, sb224, sb255, sb295 # 41
+xors 4, 5, sb256, sb295, sb162 # 42
+xors 4, 5, sb257, sb160, sb294 # 43
+xors 4, 5, sb222, sb257, sb293 # 44
+xors 4, 5, sb258, sb293, sb160 # 45
+xors 4, 5, sb259, sb158, sb292 # 46
+xors 4, 5, sb220, sb259, sb291 # 47
+xors 4, 5, sb260, sb291, sb158 # 48
+xors 4, 5, sb261, sb156, sb290 # 49
+xors 4, 5, sb218, sb261, sb289 # 50
+xors 4, 5, sb262, sb289, sb156 # 51
+xors 4, 5, sb263, sb154, sb288 # 52
+xors 4, 5, sb216, sb263, sb287 # 53
+xors 4, 5, sb264, sb287, sb154 # 54
+xors 4, 5, sb265, sb152, sb286 # 55
+xors 4, 5, sb214, sb265, sb285 # 56
+xors 4, 5, sb266, sb285, sb152 # 57
+xors 4, 5, sb267, sb150, sb284 # 58
+xors 4, 5, sb212, sb267, sb283 # 59
+xors 4, 5, sb268, sb283, sb150 # 60
+xors 4, 5, sb269, sb148, sb282 # 61
+xors 4, 5, sb210, sb269, sb281 # 62
+xors 4, 5, sb270, sb281, sb148 # 63
+xors 4, 5, sb271, sb146, sb280 # 64
+xors 4, 5, sb208, sb271, sb279 # 65
+xors 4, 5, sb272, sb279, sb146 # 66
+xors 4, 5, sb273, sb144, sb54 # 67
+xors 4, 5, sb206, sb273, sb277 # 68
+xors 4, 5, sb274, sb277, sb144 # 69
+xors 4, 5, sb275, sb142, sb276 # 70
+xors 4, 5, sb204, sb275, sb50 # 71
+xors 4, 5, sb276, sb50, sb142 # 72
+xors 4, 5, sb277, sb140, sb207 # 73
+xors 4, 5, sb202, sb277, sb203 # 74
+xors 4, 5, sb278, sb203, sb140 # 75
+xors 4, 5, sb0, sb138, sb200 # 76
+xors 4, 5, sb200, sb0, sb199 # 77
+xors 4, 5, sb1, sb199, sb138 # 78
+xors 4, 5, sb2, sb136, sb198 # 79
+xors 4, 5, sb198, sb2, sb39 # 80
+xors 4, 5, sb3, sb39, sb136 # 81
+xors 4, 5, sb4, sb134, sb196 # 82
+xors 4, 5, sb196, sb4, sb195 # 83
+xors 4, 5, sb6, sb195, sb134 # 84
+xors 4, 5, sb7, sb132, sb194 # 85
+xors 4, 5, sb194, sb7, sb192 # 86
+xors 4, 5, sb8, sb192, sb132 # 87
+xors 4, 5, sb11, sb130, sb191 # 88
+xors 4, 5, sb192, sb11, sb190 # 89
+xors 4, 5, sb12, sb190, sb130 # 90
+xors 4, 5, sb13, sb128, sb188 # 91
+xors 4, 5, sb190, sb13, sb187 # 92
+xors 4, 5, sb14, sb187, sb128 # 93
+xors 4, 5, sb16, sb126, sb186 # 94
+xors 4, 5, sb188, sb16, sb184 # 95
+xors 4, 5, sb17, sb184, sb126 # 96
+xors 4, 5, sb18, sb124, sb183 # 97
+xors 4, 5, sb186, sb18, sb182 # 98
+xors 4, 5, sb19, sb182, sb124 # 99
+xors 4, 5, sb20, sb122, sb180 # 100
+xors 4, 5, sb184, sb20, sb179 # 101
+xors 4, 5, sb22, sb179, sb122 # 102
+xors 4, 5, sb23, sb120, sb178 # 103
+xors 4, 5, sb182, sb23, sb35 # 104
+xors 4, 5, sb25, sb35, sb120 # 105
+xors 4, 5, sb26, sb118, sb176 # 106
+xors 4, 5, sb180, sb26, sb175 # 107
+xors 4, 5, sb28, sb175, sb118 # 108
+xors 4, 5, sb30, sb116, sb174 # 109
+xors 4, 5, sb178, sb30, sb33 # 110
+xors 4, 5, sb32, sb33, sb116 # 111
+xors 4, 5, sb33, sb114, sb172 # 112
+xors 4, 5, sb176, sb33, sb171 # 113
+xors 4, 5, sb35, sb171, sb114 # 114
+xors 4, 5, sb36, sb112, sb169 # 115
+xors 4, 5, sb174, sb36, sb167 # 116
+xors 4, 5, sb38, sb167, sb112 # 117
+xors 4, 5, sb39, sb110, sb165 # 118
+xors 4, 5, sb172, sb39, sb163 # 119
+xors 4, 5, sb40, sb163, sb110 # 120
+xors 4, 5, sb41, sb108, sb161 # 121
+xors 4, 5, sb46, sb41, sb159 # 122
+xors 4, 5, sb43, sb159, sb108 # 123
+xors 4, 5, sb45, sb106, sb157 # 124
+xors 4, 5, sb44, sb45, sb155 # 125
+xors 4, 5, sb47, sb155, sb106 # 126
+xors 4, 5, sb50, sb104, sb153 # 127
+xors 4, 5, sb42, sb50, sb151 # 128
+xors 4, 5, sb54, sb151, sb104 # 129
+xors 4, 5, sb58, sb102, sb149 # 130
+xors 4, 5, sb37, sb58, sb147 # 131
+xors 4, 5, sb66, sb147, sb102 # 132
+xors 4, 5, sb279, sb100, sb145 # 133
+xors 4, 5, sb34, sb279, sb143 # 134
+xors 4, 5, sb280, sb143, sb100 # 135
+xors 4, 5, sb281, sb98, sb141 # 136
+xors 4, 5, sb31, sb281, sb139 # 137
+xors 4, 5, sb282, sb139, sb98 # 138
+xors 4, 5, sb283, sb96, sb137 # 139
+xors 4, 5, sb29, sb283, sb135 # 140
+xors 4, 5, sb284, sb135, sb96 # 141
+xors 4, 5, sb285, sb94, sb133 # 142
+xors 4, 5, sb27, sb285, sb131 # 143
+xors 4, 5, sb286, sb131, sb94 # 144
+xors 4, 5, sb287, sb92, sb129 # 145
+xors 4, 5, sb24, sb287, sb127 # 146
+xors 4, 5, sb288, sb127, sb92 # 147
+xors 4, 5, sb289, sb90, sb125 # 148
+xors 4, 5, sb21, sb289, sb123 # 149
+xors 4, 5, sb290, sb123, sb90 # 150
+xors 4, 5, sb291, sb88, sb121 # 151
+xors 4, 5, sb15, sb291, sb119 # 152
+xors 4, 5, sb292, sb119, sb88 # 153
+xors 4, 5, sb293, sb86, sb117 # 154
+xors 4, 5, sb10, sb293, sb115 # 155
+xors 4, 5, sb294, sb115, sb86 # 156
+xors 4, 5, sb295, sb82, sb113 # 157
+xors 4, 5, sb9, sb295, sb111 # 158
+xors 4, 5, sb296, sb111, sb82 # 159
+xors 4, 5, sb297, sb78, sb109 # 160
+xors 4, 5, sb5, sb297, sb107 # 161
+xors 4, 5, sb298, sb107, sb78 # 162
+xors 4, 5, sb299, sb75, sb105 # 163
+xors 4, 5, sb85, sb299, sb103 # 164
+xors 4, 5, sb300, sb103, sb75 # 165
+xors 4, 5, sb301, sb73, sb101 # 166
+xors 4, 5, sb83, sb301, sb99 # 167
+xors 4, 5, sb302, sb99, sb73 # 168
+xors 4, 5, sb303, sb71, sb97 # 169
+xors 4, 5, sb81, sb303, sb95 # 170
+xors 4, 5, sb304, sb95, sb71 # 171
+xors 4, 5, sb305, sb68, sb93 # 172
+xors 4, 5, sb79, sb305, sb91 # 173
+xors 4, 5, sb306, sb91, sb68 # 174
+xors 4, 5, sb307, sb65, sb89 # 175
+xors 4, 5, sb77, sb307, sb87 # 176
+xors 4, 5, sb308, sb87, sb65 # 177
+xors 4, 5, sb309, sb63, sb84 # 178
+xors 4, 5, sb70, sb309, sb80 # 179
+xors 4, 5, sb310, sb80, sb63 # 180
+xors 4, 5, sb311, sb60, sb76 # 181
+xors 4, 5, sb62, sb311, sb74 # 182
+xors 4, 5, sb312, sb74, sb60 # 183
+xors 4, 5, sb313, sb57, sb72 # 184
+xors 4, 5, sb56, sb313, sb69 # 185
+xors 4, 5, sb314, sb69, sb57 # 186
+xors 4, 5, sb315, sb53, sb67 # 187
+xors 4, 5, sb52, sb315, sb64 # 188
+xors 4, 5, sb316, sb64, sb53 # 189
+ands 252, 5, sb207, sb209, sb211, 5, sb203, sb213, sb215, 5, sb199, sb217, sb219, 5, sb195, sb221, sb223, 5, sb191, sb225, sb227, 5, sb187, sb229, sb231, 5, sb183, sb233, sb235, 5, sb179, sb237, sb239, 5, sb175, sb241, sb243, 5, sb171, sb245, sb247, 5, sb169, sb249, sb250, 5, sb167, sb251, sb252, 5, sb165, sb253, sb254, 5, sb163, sb255, sb256, 5, sb161, sb257, sb258, 5, sb159, sb259, sb260, 5, sb157, sb261, sb262, 5, sb155, sb263, sb264, 5, sb153, sb265, sb266, 5, sb151, sb267, sb268, 5, sb149, sb269, sb270, 5, sb147, sb271, sb272, 5, sb145, sb273, sb274, 5, sb143, sb275, sb276, 5, sb141, sb277, sb278, 5, sb139, sb0, sb1, 5, sb137, sb2, sb3, 5, sb135, sb4, sb6, 5, sb133, sb7, sb8, 5, sb131, sb11, sb12, 5, sb129, sb13, sb14, 5, sb127, sb16, sb17, 5, sb125, sb18, sb19, 5, sb123, sb20, sb22, 5, sb121, sb23, sb25, 5, sb119, sb26, sb28, 5, sb117, sb30, sb32, 5, sb115, sb33, sb35, 5, sb113, sb36, sb38, 5, sb111, sb39, sb40, 5, sb109, sb41, sb43, 5, sb107, sb45, sb47, 5, sb105, sb50, sb54, 5, sb103, sb58, sb66, 5, sb101, sb279, sb280, 5, sb99, sb281, sb282, 5, sb97, sb283, sb284, 5, sb95, sb285, sb286, 5, sb93, sb287, sb288, 5, sb91, sb289, sb290, 5, sb89, sb291, sb292, 5, sb87, sb293, sb294, 5, sb84, sb295, sb296, 5, sb80, sb297, sb298, 5, sb76, sb299, sb300, 5, sb74, sb301, sb302, 5, sb72, sb303, sb304, 5, sb69, sb305, sb306, 5, sb67, sb307, sb308, 5, sb64, sb309, sb310, 5, sb61, sb311, sb312, 5, sb59, sb313, sb314, 5, sb55, sb315, sb316 # 190
+xors 4, 5, sb247, sb205, sb207 # 191
+xors 4, 5, sb245, sb201, sb203 # 192
+xors 4, 5, sb243, sb197, sb199 # 193
+xors 4, 5, sb241, sb193, sb195 # 194
+xors 4, 5, sb239, sb189, sb191 # 195
+xors 4, 5, sb237, sb185, sb187 # 196
+xors 4, 5, sb235, sb181, sb183 # 197
+xors 4, 5, sb233, sb177, sb179 # 198
+xors 4, 5, sb231, sb173, sb175 # 199
+xors 4, 5, sb229, sb170, sb171 # 200
+xors 4, 5, sb227, sb168, sb169 # 201
+xors 4, 5, sb225, sb166, sb167 # 202
+xors 4, 5, sb223, sb164, sb165 # 203
+xors 4, 5, sb221, sb162, sb163 # 204
+xors 4, 5, sb219, sb160, sb161 # 205
+xors 4, 5, sb217, sb158, sb159 # 206
+xors 4, 5, sb215, sb156, sb157 # 207
+xors 4, 5, sb213, sb154, sb155 # 208
+xors 4, 5, sb211, sb152, sb153 # 209
+xors 4, 5, sb209, sb150, sb151 # 210
+xors 4, 5, sb207, sb148, sb149 # 211
+xors 4, 5, sb205, sb146, sb147 # 212
+xors 4, 5, sb203, sb144, sb145 # 213
+xors 4, 5, sb201, sb142, sb143 # 214
+xors 4, 5, sb199, sb140, sb141 # 215
+xors 4, 5, sb197, sb138, sb139 # 216
+xors 4, 5, sb195, sb136, sb137 # 217
+xors 4, 5, sb193, sb134, sb135 # 218
+xors 4, 5, sb191, sb132, sb133 # 219
+xors 4, 5, sb189, sb130, sb131 # 220
+xors 4, 5, sb187, sb128, sb129 # 221
+xors 4, 5, sb185, sb126, sb127 # 222
+xors 4, 5, sb183, sb124, sb125 # 223
+xors 4, 5, sb181, sb122, sb123 # 224
+xors 4, 5, sb179, sb120, sb121 # 225
+xors 4, 5, sb177, sb118, sb119 # 226
+xors 4, 5, sb175, sb116, sb117 # 227
+xors 4, 5, sb173, sb114, sb115 # 228
+xors 4, 5, sb171, sb112, sb113 # 229
+xors 4, 5, sb45, sb110, sb111 # 230
+xors 4, 5, sb43, sb108, sb109 # 231
+xors 4, 5, sb39, sb106, sb107 # 232
+xors 4, 5, sb35, sb104, sb105 # 233
+xors 4, 5, sb33, sb102, sb103 # 234
+xors 4, 5, sb30, sb100, sb101 # 235
+xors 4, 5, sb28, sb98, sb99 # 236
+xors 4, 5, sb25, sb96, sb97 # 237
+xors 4, 5, sb18, sb94, sb95 # 238
+xors 4, 5, sb17, sb92, sb93 # 239
+xors 4, 5, sb13, sb90, sb91 # 240
+xors 4, 5, sb11, sb88, sb89 # 241
+xors 4, 5, sb7, sb86, sb87 # 242
+xors 4, 5, sb2, sb82, sb84 # 243
+xors 4, 5, sb84, sb78, sb80 # 244
+xors 4, 5, sb82, sb75, sb76 # 245
+xors 4, 5, sb80, sb73, sb74 # 246
+xors 4, 5, sb78, sb71, sb72 # 247
+xors 4, 5, sb74, sb68, sb69 # 248
+xors 4, 5, sb66, sb65, sb67 # 249
+xors 4, 5, sb58, sb63, sb64 # 250
+xors 4, 5, sb54, sb60, sb61 # 251
+xors 4, 5, sb50, sb57, sb59 # 252
+xors 4, 5, sb3, sb53, sb55 # 253
+xors 4, 5, sb47, sb49, sb51 # 254
+xors 4, 5, sb1, sb47, sb48 # 255
+xors 4, 5, sb23, sb50, sb52 # 256
+xors 4, 5, sb48, sb54, sb56 # 257
+xors 4, 5, sb249, sb58, sb62 # 258
+xors 4, 5, sb96, sb66, sb70 # 259
+xors 4, 5, sb250, sb74, sb77 # 260
+xors 4, 5, sb98, sb78, sb79 # 261
+xors 4, 5, sb251, sb80, sb81 # 262
+xors 4, 5, sb100, sb82, sb83 # 263
+xors 4, 5, sb252, sb84, sb85 # 264
+xors 4, 5, sb102, sb2, sb5 # 265
+xors 4, 5, sb253, sb7, sb9 # 266
+xors 4, 5, sb104, sb11, sb10 # 267
+xors 4, 5, sb254, sb13, sb15 # 268
+xors 4, 5, sb106, sb17, sb21 # 269
+xors 4, 5, sb255, sb18, sb24 # 270
+xors 4, 5, sb108, sb25, sb27 # 271
+xors 4, 5, sb256, sb28, sb29 # 272
+xors 4, 5, sb110, sb30, sb31 # 273
+xors 4, 5, sb257, sb33, sb34 # 274
+xors 4, 5, sb112, sb35, sb37 # 275
+xors 4, 5, sb258, sb39, sb42 # 276
+xors 4, 5, sb114, sb43, sb44 # 277
+xors 4, 5, sb259, sb45, sb46 # 278
+xors 4, 5, sb116, sb171, sb172 # 279
+xors 4, 5, sb260, sb173, sb174 # 280
+xors 4, 5, sb118, sb175, sb176 # 281
+xors 4, 5, sb261, sb177, sb178 # 282
+xors 4, 5, sb120, sb179, sb180 # 283
+xors 4, 5, sb262, sb181, sb182 # 284
+xors 4, 5, sb122, sb183, sb184 # 285
+xors 4, 5, sb263, sb185, sb186 # 286
+xors 4, 5, sb124, sb187, sb188 # 287
+xors 4, 5, sb264, sb189, sb190 # 288
+xors 4, 5, sb126, sb191, sb192 # 289
+xors 4, 5, sb265, sb193, sb194 # 290
+xors 4, 5, sb128, sb195, sb196 # 291
+xors 4, 5, sb266, sb197, sb198 # 292
+xors 4, 5, sb130, sb199, sb200 # 293
+xors 4, 5, sb267, sb201, sb202 # 294
+xors 4, 5, sb132, sb203, sb204 # 295
+xors 4, 5, sb268, sb205, sb206 # 296
+xors 4, 5, sb134, sb207, sb208 # 297
+xors 4, 5, sb269, sb209, sb210 # 298
+xors 4, 5, sb136, sb211, sb212 # 299
+xors 4, 5, sb270, sb213, sb214 # 300
+xors 4, 5, sb138, sb215, sb216 # 301
+xors 4, 5, sb271, sb217, sb218 # 302
+xors 4, 5, sb140, sb219, sb220 # 303
+xors 4, 5, sb272, sb221, sb222 # 304
+xors 4, 5, sb142, sb223, sb224 # 305
+xors 4, 5, sb273, sb225, sb226 # 306
+xors 4, 5, sb144, sb227, sb228 # 307
+xors 4, 5, sb274, sb229, sb230 # 308
+xors 4, 5, sb146, sb231, sb232 # 309
+xors 4, 5, sb275, sb233, sb234 # 310
+xors 4, 5, sb148, sb235, sb236 # 311
+xors 4, 5, sb276, sb237, sb238 # 312
+xors 4, 5, sb150, sb239, sb240 # 313
+xors 4, 5, sb277, sb241, sb242 # 314
+xors 4, 5, sb152, sb243, sb244 # 315
+xors 4, 5, sb278, sb245, sb246 # 316
+ands 368, 5, sb47, sb50, sb52, 5, sb94, sb54, sb56, 5, sb95, sb58, sb62, 5, sb93, sb66, sb70, 5, sb97, sb74, sb77, 5, sb92, sb78, sb79, 5, sb99, sb80, sb81, 5, sb91, sb82, sb83, 5, sb101, sb84, sb85, 5, sb90, sb2, sb5, 5, sb103, sb7, sb9, 5, sb89, sb11, sb10, 5, sb105, sb13, sb15, 5, sb88, sb17, sb21, 5, sb107, sb18, sb24, 5, sb87, sb25, sb27, 5, sb109, sb28, sb29, 5, sb86, sb30, sb31, 5, sb111, sb33, sb34, 5, sb60, sb35, sb37, 5, sb113, sb39, sb42, 5, sb36, sb43, sb44, 5, sb115, sb45, sb46, 5, sb68, sb171, sb172, 5, sb117, sb173, sb174, 5, sb64, sb175, sb176, 5, sb119, sb177, sb178, 5, sb41, sb179, sb180, 5, sb121, sb181, sb182, 5, sb19, sb183, sb184, 5, sb123, sb185, sb186, 5, sb12, sb187, sb188, 5, sb125, sb189, sb190, 5, sb8, sb191, sb192, 5, sb127, sb193, sb194, 5, sb6, sb195, sb196, 5, sb129, sb197, sb198, 5, sb4, sb199, sb200, 5, sb131, sb201, sb202, 5, sb0, sb203, sb204, 5, sb133, sb205, sb206, 5, sb76, sb207, sb208, 5, sb135, sb209, sb210, 5, sb72, sb211, sb212, 5, sb137, sb213, sb214, 5, sb40, sb215, sb216, 5, sb139, sb217, sb218, 5, sb38, sb219, sb220, 5, sb141, sb221, sb222, 5, sb32, sb223, sb224, 5, sb143, sb225, sb226, 5, sb26, sb227, sb228, 5, sb145, sb229, sb230, 5, sb22, sb231, sb232, 5, sb147, sb233, sb234, 5, sb20, sb235, sb236, 5, sb149, sb237, sb238, 5, sb16, sb239, sb240, 5, sb151, sb241, sb242, 5, sb14, sb243, sb244, 5, sb153, sb245, sb246, 5, sb170, sb247, sb248, 5, sb154, sb48, sb249, 5, sb49, sb96, sb250, 5, sb155, sb98, sb251, 5, sb51, sb100, sb252, 5, sb156, sb102, sb253, 5, sb53, sb104, sb254, 5, sb157, sb106, sb255, 5, sb55, sb108, sb256, 5, sb158, sb110, sb257, 5, sb57, sb112, sb258, 5, sb159, sb114, sb259, 5, sb59, sb116, sb260, 5, sb160, sb118, sb261, 5, sb61, sb120, sb262, 5, sb161, sb122, sb263, 5, sb63, sb124, sb264, 5, sb162, sb126, sb265, 5, sb65, sb128, sb266, 5, sb163, sb130, sb267, 5, sb67, sb132, sb268, 5, sb164, sb134, sb269, 5, sb69, sb136, sb270, 5, sb165, sb138, sb271, 5, sb71, sb140, sb272, 5, sb166, sb142, sb273, 5, sb73, sb144, sb274, 5, sb167, sb146, sb275, 5, sb75, sb148, sb276, 5, sb168, sb150, sb277, 5, sb169, sb152, sb278 # 317
+ands 184, 5, sb46, sb48, sb95, 5, sb50, sb96, sb97, 5, sb45, sb98, sb99, 5, sb52, sb100, sb101, 5, sb44, sb102, sb103, 5, sb54, sb104, sb105, 5, sb43, sb106, sb107, 5, sb56, sb108, sb109, 5, sb42, sb110, sb111, 5, sb58, sb112, sb113, 5, sb30, sb114, sb115, 5, sb66, sb116, sb117, 5, sb62, sb118, sb119, 5, sb34, sb120, sb121, 5, sb18, sb122, sb123, 5, sb9, sb124, sb125, 5, sb7, sb126, sb127, 5, sb5, sb128, sb129, 5, sb2, sb130, sb131, 5, sb85, sb132, sb133, 5, sb74, sb134, sb135, 5, sb70, sb136, sb137, 5, sb39, sb138, sb139, 5, sb37, sb140, sb141, 5, sb28, sb142, sb143, 5, sb24, sb144, sb145, 5, sb21, sb146, sb147, 5, sb17, sb148, sb149, 5, sb15, sb150, sb151, 5, sb13, sb152, sb153, 5, sb11, sb23, sb154, 5, sb77, sb49, sb155, 5, sb25, sb51, sb156, 5, sb78, sb53, sb157, 5, sb27, sb55, sb158, 5, sb79, sb57, sb159, 5, sb29, sb59, sb160, 5, sb80, sb61, sb161, 5, sb31, sb63, sb162, 5, sb81, sb65, sb163, 5, sb33, sb67, sb164, 5, sb82, sb69, sb165, 5, sb35, sb71, sb166, 5, sb83, sb73, sb167, 5, sb84, sb75, sb168, 5, sb10, sb169, sb170 # 318
+xors 4, 5, sb48, sb46, sb94 # 319
+xors 4, 5, sb46, sb50, sb93 # 320
+xors 4, 5, sb50, sb45, sb92 # 321
+xors 4, 5, sb45, sb52, sb91 # 322
+xors 4, 5, sb52, sb44, sb90 # 323
+xors 4, 5, sb44, sb54, sb89 # 324
+xors 4, 5, sb54, sb43, sb88 # 325
+xors 4, 5, sb43, sb56, sb87 # 326
+xors 4, 5, sb56, sb42, sb86 # 327
+xors 4, 5, sb42, sb58, sb60 # 328
+xors 4, 5, sb58, sb30, sb36 # 329
+xors 4, 5, sb30, sb66, sb68 # 330
+xors 4, 5, sb60, sb62, sb64 # 331
+xors 4, 5, sb36, sb34, sb41 # 332
+xors 4, 5, sb62, sb18, sb19 # 333
+xors 4, 5, sb34, sb9, sb12 # 334
+xors 4, 5, sb64, sb7, sb8 # 335
+xors 4, 5, sb19, sb5, sb6 # 336
+xors 4, 5, sb66, sb2, sb4 # 337
+xors 4, 5, sb41, sb85, sb0 # 338
+xors 4, 5, sb68, sb74, sb76 # 339
+xors 4, 5, sb9, sb70, sb72 # 340
+xors 4, 5, sb70, sb39, sb40 # 341
+xors 4, 5, sb8, sb37, sb38 # 342
+xors 4, 5, sb72, sb28, sb32 # 343
+xors 4, 5, sb4, sb24, sb26 # 344
+xors 4, 5, sb74, sb21, sb22 # 345
+xors 4, 5, sb18, sb17, sb20 # 346
+xors 4, 5, sb76, sb15, sb16 # 347
+xors 4, 5, sb12, sb13, sb14 # 348
+xors 4, 5, sb85, sb10, sb12 # 349
+ands 92, 5, sb24, sb23, sb48, 5, sb22, sb49, sb50, 5, sb26, sb51, sb52, 5, sb21, sb53, sb54, 5, sb28, sb55, sb56, 5, sb20, sb57, sb58, 5, sb16, sb59, sb60, 5, sb2, sb61, sb62, 5, sb32, sb63, sb64, 5, sb14, sb65, sb66, 5, sb10, sb67, sb68, 5, sb7, sb69, sb70, 5, sb6, sb71, sb72, 5, sb0, sb73, sb74, 5, sb17, sb75, sb76, 5, sb5, sb11, sb77, 5, sb37, sb25, sb78, 5, sb13, sb27, sb79, 5, sb38, sb29, sb80, 5, sb15, sb31, sb81, 5, sb39, sb33, sb82, 5, sb40, sb35, sb83, 5, sb12, sb84, sb85 # 350
+xors 4, 5, sb23, sb24, sb47 # 351
+xors 4, 5, sb24, sb22, sb46 # 352
+xors 4, 5, sb22, sb26, sb45 # 353
+xors 4, 5, sb26, sb21, sb44 # 354
+xors 4, 5, sb21, sb28, sb43 # 355
+xors 4, 5, sb28, sb20, sb42 # 356
+xors 4, 5, sb20, sb16, sb30 # 357
+xors 4, 5, sb30, sb2, sb36 # 358
+xors 4, 5, sb16, sb32, sb34 # 359
+xors 4, 5, sb32, sb14, sb19 # 360
+xors 4, 5, sb2, sb10, sb41 # 361
+xors 4, 5, sb34, sb7, sb9 # 362
+xors 4, 5, sb19, sb6, sb8 # 363
+xors 4, 5, sb36, sb0, sb4 # 364
+xors 4, 5, sb14, sb17, sb18 # 365
+xors 4, 5, sb41, sb12, sb14 # 366
+ands 44, 5, sb12, sb11, sb24, 5, sb10, sb25, sb26, 5, sb14, sb27, sb28, 5, sb9, sb29, sb30, 5, sb7, sb31, sb32, 5, sb0, sb33, sb34, 5, sb8, sb35, sb36, 5, sb4, sb5, sb37, 5, sb17, sb13, sb38, 5, sb18, sb15, sb39, 5, sb6, sb40, sb41 # 367
+xors 4, 5, sb11, sb12, sb23 # 368
+xors 4, 5, sb12, sb10, sb22 # 369
+xors 4, 5, sb10, sb14, sb21 # 370
+xors 4, 5, sb14, sb9, sb20 # 371
+xors 4, 5, sb9, sb7, sb16 # 372
+xors 4, 5, sb16, sb0, sb2 # 373
+xors 4, 5, sb7, sb8, sb19 # 374
+xors 4, 5, sb19, sb6, sb7 # 375
+ands 20, 5, sb6, sb5, sb12, 5, sb2, sb13, sb14, 5, sb8, sb15, sb16, 5, sb7, sb4, sb17, 5, sb0, sb18, sb19 # 376
+xors 4, 5, sb5, sb6, sb11 # 377
+xors 4, 5, sb6, sb2, sb10 # 378
+xors 4, 5, sb2, sb8, sb9 # 379
+xors 4, 5, sb8, sb0, sb2 # 380
+ands 8, 5, sb2, sb4, sb6, 5, sb0, sb7, sb8 # 381
+xors 4, 5, sb4, sb2, sb5 # 382
+xors 4, 5, sb2, sb0, sb4 # 383
+xors 4, 5, sb0, sb2, sb3 # 384
+xors 4, 5, sb2, sb0, sb1 # 385
+vdabit 5, s10, sb1 # 386
+xors 4, 5, sb0, sb1, sb2 # 387
+reveal 3, 5, cb0, sb0 # 388
+convcbitvec 5, ci0, cb0 # 389
+vconvint 5, c0, ci0 # 390
+vaddm 5, s5, s10, c0 # 391
+vmulsi 5, s0, s10, 2 # 392
+vconvint 5, c0, ci0 # 393
+vmulm 5, s10, s0, c0 # 394
+vsubs 5, s0, s5, s10 # 395
+vmovs 5, s5, s0 # 396
+vmovs 5, s0, s5 # 397
+use 2, 0, 1210 # 398
+use 0, 4, 5 # 399
+reqbl -64 # 400
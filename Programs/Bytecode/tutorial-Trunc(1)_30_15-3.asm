@@ -0,0 +1,445 @@
+call_arg *2, 4 # 0
+addsi s1, s2, 536870912 # 1
+split 194, 3, s1, sb32, sb33, sb218, sb30, sb31, sb214, sb28, sb29, sb210, sb26, sb27, sb206, sb22, sb24, sb202, sb20, sb21, sb198, sb18, sb19, sb194, sb15, sb16, sb190, sb13, sb14, sb186, sb11, sb12, sb182, sb9, sb10, sb178, sb6, sb7, sb174, sb3, sb5, sb172, sb1, sb2, sb170, sb318, sb0, sb168, sb316, sb317, sb166, sb314, sb315, sb164, sb312, sb313, sb162, sb310, sb311, sb160, sb308, sb309, sb158, sb306, sb307, sb156, sb304, sb305, sb154, sb302, sb303, sb152, sb300, sb301, sb150, sb298, sb299, sb148, sb296, sb297, sb146, sb294, sb295, sb144, sb292, sb293, sb142, sb290, sb291, sb140, sb288, sb289, sb138, sb286, sb287, sb136, sb284, sb285, sb134, sb157, sb283, sb132, sb155, sb133, sb130, sb257, sb153, sb128, sb253, sb255, sb126, sb249, sb251, sb124, sb247, sb151, sb122, sb243, sb245, sb120, sb239, sb241, sb118, sb237, sb149, sb116, sb233, sb235, sb114, sb229, sb231, sb112, sb227, sb147, sb110, sb223, sb225, sb108, sb145, sb220, sb106, sb212, sb216, sb104, sb204, sb208, sb102, sb141, sb200, sb100, sb192, sb196, sb98, sb184, sb188, sb96, sb137, sb180, sb94, sb173, sb176, sb91, sb169, sb171, sb82, sb165, sb167, sb80, sb161, sb163, sb77, sb131, sb159, sb74, sb139, sb143, sb72, sb135, sb129, sb70, sb127, sb119, sb67, sb101, sb105, sb64, sb121, sb99, sb62, sb95, sb97, sb55, sb90, sb93, sb52 # 2
+xors 4, 1, sb222, sb218, sb33 # 3
+xors 4, 1, sb224, sb32, sb218 # 4
+xors 4, 1, sb226, sb214, sb31 # 5
+xors 4, 1, sb25, sb226, sb30 # 6
+xors 4, 1, sb228, sb30, sb214 # 7
+xors 4, 1, sb230, sb210, sb29 # 8
+xors 4, 1, sb23, sb230, sb28 # 9
+xors 4, 1, sb232, sb28, sb210 # 10
+xors 4, 1, sb234, sb206, sb27 # 11
+xors 4, 1, sb17, sb234, sb26 # 12
+xors 4, 1, sb236, sb26, sb206 # 13
+xors 4, 1, sb238, sb202, sb24 # 14
+xors 4, 1, sb8, sb238, sb22 # 15
+xors 4, 1, sb240, sb22, sb202 # 16
+xors 4, 1, sb242, sb198, sb21 # 17
+xors 4, 1, sb4, sb242, sb20 # 18
+xors 4, 1, sb244, sb20, sb198 # 19
+xors 4, 1, sb246, sb194, sb19 # 20
+xors 4, 1, sb89, sb246, sb18 # 21
+xors 4, 1, sb248, sb18, sb194 # 22
+xors 4, 1, sb250, sb190, sb16 # 23
+xors 4, 1, sb87, sb250, sb15 # 24
+xors 4, 1, sb252, sb15, sb190 # 25
+xors 4, 1, sb254, sb186, sb14 # 26
+xors 4, 1, sb85, sb254, sb13 # 27
+xors 4, 1, sb256, sb13, sb186 # 28
+xors 4, 1, sb258, sb182, sb12 # 29
+xors 4, 1, sb83, sb258, sb11 # 30
+xors 4, 1, sb259, sb11, sb182 # 31
+xors 4, 1, sb260, sb178, sb10 # 32
+xors 4, 1, sb75, sb260, sb9 # 33
+xors 4, 1, sb261, sb9, sb178 # 34
+xors 4, 1, sb262, sb174, sb7 # 35
+xors 4, 1, sb69, sb262, sb6 # 36
+xors 4, 1, sb263, sb6, sb174 # 37
+xors 4, 1, sb264, sb172, sb5 # 38
+xors 4, 1, sb12, sb264, sb3 # 39
+xors 4, 1, sb265, sb3, sb172 # 40
+xors 4, 1, sb266, sb170, sb2 # 41
+xors 4, 1, sb58, sb266, sb1 # 42
+xors 4, 1, sb267, sb1, sb170 # 43
+xors 4, 1, sb268, sb168, sb0 # 44
+xors 4, 1, sb56, sb268, sb318 # 45
+xors 4, 1, sb269, sb318, sb168 # 46
+xors 4, 1, sb270, sb166, sb317 # 47
+xors 4, 1, sb34, sb270, sb316 # 48
+xors 4, 1, sb271, sb316, sb166 # 49
+xors 4, 1, sb272, sb164, sb315 # 50
+xors 4, 1, sb36, sb272, sb314 # 51
+xors 4, 1, sb273, sb314, sb164 # 52
+xors 4, 1, sb274, sb162, sb313 # 53
+xors 4, 1, sb39, sb274, sb312 # 54
+xors 4, 1, sb275, sb312, sb162 # 55
+xors 4, 1, sb276, sb160, sb311 # 56
+xors 4, 1, sb42, sb276, sb310 # 57
+xors 4, 1, sb277, sb310, sb160 # 58
+xors 4, 1, sb278, sb158, sb309 # 59
+xors 4, 1, sb46, sb278, sb308 # 60
+xors 4, 1, sb279, sb308, sb158 # 61
+xors 4, 1, sb280, sb156, sb307 # 62
+xors 4, 1, sb49, sb280, sb306 # 63
+xors 4, 1, sb281, sb306, sb156 # 64
+xors 4, 1, sb282, sb154, sb305 # 65
+xors 4, 1, sb175, sb282, sb304 # 66
+xors 4, 1, sb0, sb304, sb154 # 67
+xors 4, 1, sb1, sb152, sb303 # 68
+xors 4, 1, sb177, sb1, sb302 # 69
+xors 4, 1, sb2, sb302, sb152 # 70
+xors 4, 1, sb3, sb150, sb301 # 71
+xors 4, 1, sb179, sb3, sb300 # 72
+xors 4, 1, sb5, sb300, sb150 # 73
+xors 4, 1, sb6, sb148, sb299 # 74
+xors 4, 1, sb181, sb6, sb298 # 75
+xors 4, 1, sb7, sb298, sb148 # 76
+xors 4, 1, sb9, sb146, sb297 # 77
+xors 4, 1, sb183, sb9, sb296 # 78
+xors 4, 1, sb10, sb296, sb146 # 79
+xors 4, 1, sb11, sb144, sb295 # 80
+xors 4, 1, sb185, sb11, sb294 # 81
+xors 4, 1, sb13, sb294, sb144 # 82
+xors 4, 1, sb14, sb142, sb293 # 83
+xors 4, 1, sb187, sb14, sb292 # 84
+xors 4, 1, sb15, sb292, sb142 # 85
+xors 4, 1, sb16, sb140, sb291 # 86
+xors 4, 1, sb189, sb16, sb290 # 87
+xors 4, 1, sb18, sb290, sb140 # 88
+xors 4, 1, sb19, sb138, sb289 # 89
+xors 4, 1, sb191, sb19, sb288 # 90
+xors 4, 1, sb20, sb288, sb138 # 91
+xors 4, 1, sb21, sb136, sb287 # 92
+xors 4, 1, sb193, sb21, sb286 # 93
+xors 4, 1, sb22, sb286, sb136 # 94
+xors 4, 1, sb24, sb134, sb285 # 95
+xors 4, 1, sb195, sb24, sb284 # 96
+xors 4, 1, sb26, sb284, sb134 # 97
+xors 4, 1, sb27, sb132, sb283 # 98
+xors 4, 1, sb197, sb27, sb157 # 99
+xors 4, 1, sb28, sb157, sb132 # 100
+xors 4, 1, sb29, sb130, sb133 # 101
+xors 4, 1, sb199, sb29, sb155 # 102
+xors 4, 1, sb30, sb155, sb130 # 103
+xors 4, 1, sb31, sb128, sb153 # 104
+xors 4, 1, sb201, sb31, sb257 # 105
+xors 4, 1, sb32, sb257, sb128 # 106
+xors 4, 1, sb33, sb126, sb255 # 107
+xors 4, 1, sb203, sb33, sb253 # 108
+xors 4, 1, sb35, sb253, sb126 # 109
+xors 4, 1, sb37, sb124, sb251 # 110
+xors 4, 1, sb205, sb37, sb249 # 111
+xors 4, 1, sb38, sb249, sb124 # 112
+xors 4, 1, sb40, sb122, sb151 # 113
+xors 4, 1, sb207, sb40, sb247 # 114
+xors 4, 1, sb41, sb247, sb122 # 115
+xors 4, 1, sb43, sb120, sb245 # 116
+xors 4, 1, sb209, sb43, sb243 # 117
+xors 4, 1, sb44, sb243, sb120 # 118
+xors 4, 1, sb45, sb118, sb241 # 119
+xors 4, 1, sb211, sb45, sb239 # 120
+xors 4, 1, sb47, sb239, sb118 # 121
+xors 4, 1, sb48, sb116, sb149 # 122
+xors 4, 1, sb213, sb48, sb237 # 123
+xors 4, 1, sb50, sb237, sb116 # 124
+xors 4, 1, sb51, sb114, sb235 # 125
+xors 4, 1, sb215, sb51, sb233 # 126
+xors 4, 1, sb54, sb233, sb114 # 127
+xors 4, 1, sb57, sb112, sb231 # 128
+xors 4, 1, sb217, sb57, sb229 # 129
+xors 4, 1, sb59, sb229, sb112 # 130
+xors 4, 1, sb65, sb110, sb147 # 131
+xors 4, 1, sb219, sb65, sb227 # 132
+xors 4, 1, sb79, sb227, sb110 # 133
+xors 4, 1, sb84, sb108, sb225 # 134
+xors 4, 1, sb221, sb84, sb223 # 135
+xors 4, 1, sb86, sb223, sb108 # 136
+xors 4, 1, sb88, sb106, sb220 # 137
+xors 4, 1, sb223, sb88, sb145 # 138
+xors 4, 1, sb92, sb145, sb106 # 139
+xors 4, 1, sb283, sb104, sb216 # 140
+xors 4, 1, sb225, sb283, sb212 # 141
+xors 4, 1, sb284, sb212, sb104 # 142
+xors 4, 1, sb285, sb102, sb208 # 143
+xors 4, 1, sb227, sb285, sb204 # 144
+xors 4, 1, sb286, sb204, sb102 # 145
+xors 4, 1, sb287, sb100, sb200 # 146
+xors 4, 1, sb229, sb287, sb141 # 147
+xors 4, 1, sb288, sb141, sb100 # 148
+xors 4, 1, sb289, sb98, sb196 # 149
+xors 4, 1, sb231, sb289, sb192 # 150
+xors 4, 1, sb290, sb192, sb98 # 151
+xors 4, 1, sb291, sb96, sb188 # 152
+xors 4, 1, sb233, sb291, sb184 # 153
+xors 4, 1, sb292, sb184, sb96 # 154
+xors 4, 1, sb293, sb94, sb180 # 155
+xors 4, 1, sb235, sb293, sb137 # 156
+xors 4, 1, sb294, sb137, sb94 # 157
+xors 4, 1, sb295, sb91, sb176 # 158
+xors 4, 1, sb237, sb295, sb173 # 159
+xors 4, 1, sb296, sb173, sb91 # 160
+xors 4, 1, sb297, sb82, sb171 # 161
+xors 4, 1, sb239, sb297, sb169 # 162
+xors 4, 1, sb298, sb169, sb82 # 163
+xors 4, 1, sb299, sb80, sb167 # 164
+xors 4, 1, sb241, sb299, sb165 # 165
+xors 4, 1, sb300, sb165, sb80 # 166
+xors 4, 1, sb301, sb77, sb163 # 167
+xors 4, 1, sb243, sb301, sb161 # 168
+xors 4, 1, sb302, sb161, sb77 # 169
+xors 4, 1, sb303, sb74, sb159 # 170
+xors 4, 1, sb245, sb303, sb131 # 171
+xors 4, 1, sb304, sb131, sb74 # 172
+xors 4, 1, sb305, sb72, sb143 # 173
+xors 4, 1, sb247, sb305, sb139 # 174
+xors 4, 1, sb306, sb139, sb72 # 175
+xors 4, 1, sb307, sb70, sb129 # 176
+xors 4, 1, sb249, sb307, sb135 # 177
+xors 4, 1, sb308, sb135, sb70 # 178
+xors 4, 1, sb309, sb67, sb119 # 179
+xors 4, 1, sb251, sb309, sb127 # 180
+xors 4, 1, sb310, sb127, sb67 # 181
+xors 4, 1, sb311, sb64, sb105 # 182
+xors 4, 1, sb253, sb311, sb101 # 183
+xors 4, 1, sb312, sb101, sb64 # 184
+xors 4, 1, sb313, sb62, sb99 # 185
+xors 4, 1, sb255, sb313, sb121 # 186
+xors 4, 1, sb314, sb121, sb62 # 187
+xors 4, 1, sb315, sb55, sb97 # 188
+xors 4, 1, sb257, sb315, sb95 # 189
+xors 4, 1, sb316, sb95, sb55 # 190
+xors 4, 1, sb317, sb52, sb93 # 191
+xors 4, 1, sb61, sb317, sb90 # 192
+xors 4, 1, sb318, sb90, sb52 # 193
+ands 256, 1, sb220, sb222, sb224, 1, sb216, sb226, sb228, 1, sb212, sb230, sb232, 1, sb208, sb234, sb236, 1, sb204, sb238, sb240, 1, sb200, sb242, sb244, 1, sb196, sb246, sb248, 1, sb192, sb250, sb252, 1, sb188, sb254, sb256, 1, sb184, sb258, sb259, 1, sb180, sb260, sb261, 1, sb176, sb262, sb263, 1, sb173, sb264, sb265, 1, sb171, sb266, sb267, 1, sb169, sb268, sb269, 1, sb167, sb270, sb271, 1, sb165, sb272, sb273, 1, sb163, sb274, sb275, 1, sb161, sb276, sb277, 1, sb159, sb278, sb279, 1, sb157, sb280, sb281, 1, sb155, sb282, sb0, 1, sb153, sb1, sb2, 1, sb151, sb3, sb5, 1, sb149, sb6, sb7, 1, sb147, sb9, sb10, 1, sb145, sb11, sb13, 1, sb143, sb14, sb15, 1, sb141, sb16, sb18, 1, sb139, sb19, sb20, 1, sb137, sb21, sb22, 1, sb135, sb24, sb26, 1, sb133, sb27, sb28, 1, sb131, sb29, sb30, 1, sb129, sb31, sb32, 1, sb127, sb33, sb35, 1, sb125, sb37, sb38, 1, sb123, sb40, sb41, 1, sb121, sb43, sb44, 1, sb119, sb45, sb47, 1, sb117, sb48, sb50, 1, sb115, sb51, sb54, 1, sb113, sb57, sb59, 1, sb111, sb65, sb79, 1, sb109, sb84, sb86, 1, sb107, sb88, sb92, 1, sb105, sb283, sb284, 1, sb103, sb285, sb286, 1, sb101, sb287, sb288, 1, sb99, sb289, sb290, 1, sb97, sb291, sb292, 1, sb95, sb293, sb294, 1, sb93, sb295, sb296, 1, sb90, sb297, sb298, 1, sb81, sb299, sb300, 1, sb78, sb301, sb302, 1, sb76, sb303, sb304, 1, sb73, sb305, sb306, 1, sb71, sb307, sb308, 1, sb68, sb309, sb310, 1, sb66, sb311, sb312, 1, sb63, sb313, sb314, 1, sb60, sb315, sb316, 1, sb53, sb317, sb318 # 194
+xors 4, 1, sb26, sb218, sb220 # 195
+xors 4, 1, sb15, sb214, sb216 # 196
+xors 4, 1, sb10, sb210, sb212 # 197
+xors 4, 1, sb7, sb206, sb208 # 198
+xors 4, 1, sb92, sb202, sb204 # 199
+xors 4, 1, sb88, sb198, sb200 # 200
+xors 4, 1, sb86, sb194, sb196 # 201
+xors 4, 1, sb84, sb190, sb192 # 202
+xors 4, 1, sb79, sb186, sb188 # 203
+xors 4, 1, sb14, sb182, sb184 # 204
+xors 4, 1, sb65, sb178, sb180 # 205
+xors 4, 1, sb59, sb174, sb176 # 206
+xors 4, 1, sb57, sb172, sb173 # 207
+xors 4, 1, sb54, sb170, sb171 # 208
+xors 4, 1, sb35, sb168, sb169 # 209
+xors 4, 1, sb37, sb166, sb167 # 210
+xors 4, 1, sb41, sb164, sb165 # 211
+xors 4, 1, sb44, sb162, sb163 # 212
+xors 4, 1, sb48, sb160, sb161 # 213
+xors 4, 1, sb50, sb158, sb159 # 214
+xors 4, 1, sb176, sb156, sb157 # 215
+xors 4, 1, sb178, sb154, sb155 # 216
+xors 4, 1, sb180, sb152, sb153 # 217
+xors 4, 1, sb182, sb150, sb151 # 218
+xors 4, 1, sb184, sb148, sb149 # 219
+xors 4, 1, sb186, sb146, sb147 # 220
+xors 4, 1, sb188, sb144, sb145 # 221
+xors 4, 1, sb190, sb142, sb143 # 222
+xors 4, 1, sb192, sb140, sb141 # 223
+xors 4, 1, sb194, sb138, sb139 # 224
+xors 4, 1, sb196, sb136, sb137 # 225
+xors 4, 1, sb198, sb134, sb135 # 226
+xors 4, 1, sb200, sb132, sb133 # 227
+xors 4, 1, sb202, sb130, sb131 # 228
+xors 4, 1, sb204, sb128, sb129 # 229
+xors 4, 1, sb206, sb126, sb127 # 230
+xors 4, 1, sb208, sb124, sb125 # 231
+xors 4, 1, sb210, sb122, sb123 # 232
+xors 4, 1, sb212, sb120, sb121 # 233
+xors 4, 1, sb214, sb118, sb119 # 234
+xors 4, 1, sb216, sb116, sb117 # 235
+xors 4, 1, sb218, sb114, sb115 # 236
+xors 4, 1, sb220, sb112, sb113 # 237
+xors 4, 1, sb222, sb110, sb111 # 238
+xors 4, 1, sb224, sb108, sb109 # 239
+xors 4, 1, sb226, sb106, sb107 # 240
+xors 4, 1, sb228, sb104, sb105 # 241
+xors 4, 1, sb230, sb102, sb103 # 242
+xors 4, 1, sb232, sb100, sb101 # 243
+xors 4, 1, sb234, sb98, sb99 # 244
+xors 4, 1, sb236, sb96, sb97 # 245
+xors 4, 1, sb238, sb94, sb95 # 246
+xors 4, 1, sb240, sb91, sb93 # 247
+xors 4, 1, sb242, sb82, sb90 # 248
+xors 4, 1, sb244, sb80, sb81 # 249
+xors 4, 1, sb246, sb77, sb78 # 250
+xors 4, 1, sb248, sb74, sb76 # 251
+xors 4, 1, sb250, sb72, sb73 # 252
+xors 4, 1, sb252, sb70, sb71 # 253
+xors 4, 1, sb254, sb67, sb68 # 254
+xors 4, 1, sb256, sb64, sb66 # 255
+xors 4, 1, sb258, sb62, sb63 # 256
+xors 4, 1, sb91, sb55, sb60 # 257
+xors 4, 1, sb5, sb52, sb53 # 258
+xors 4, 1, sb27, sb54, sb56 # 259
+xors 4, 1, sb52, sb57, sb58 # 260
+xors 4, 1, sb19, sb59, sb12 # 261
+xors 4, 1, sb100, sb65, sb69 # 262
+xors 4, 1, sb22, sb14, sb75 # 263
+xors 4, 1, sb102, sb79, sb83 # 264
+xors 4, 1, sb29, sb84, sb85 # 265
+xors 4, 1, sb104, sb86, sb87 # 266
+xors 4, 1, sb31, sb88, sb89 # 267
+xors 4, 1, sb106, sb92, sb4 # 268
+xors 4, 1, sb32, sb7, sb8 # 269
+xors 4, 1, sb108, sb10, sb17 # 270
+xors 4, 1, sb33, sb15, sb23 # 271
+dabit s7, sb3 # 272
+mulsi s4, s7, 2 # 273
+dabit s6, sb51 # 274
+xors 4, 1, sb2, sb51, sb35 # 275
+mulsi s3, s6, 2 # 276
+xors 4, 1, sb259, sb34, sb35 # 277
+xors 4, 1, sb115, sb36, sb37 # 278
+xors 4, 1, sb260, sb39, sb41 # 279
+xors 4, 1, sb117, sb42, sb44 # 280
+xors 4, 1, sb261, sb46, sb48 # 281
+xors 4, 1, sb119, sb49, sb50 # 282
+xors 4, 1, sb262, sb175, sb176 # 283
+xors 4, 1, sb121, sb177, sb178 # 284
+xors 4, 1, sb263, sb179, sb180 # 285
+xors 4, 1, sb123, sb181, sb182 # 286
+xors 4, 1, sb264, sb183, sb184 # 287
+xors 4, 1, sb125, sb185, sb186 # 288
+xors 4, 1, sb265, sb187, sb188 # 289
+xors 4, 1, sb127, sb189, sb190 # 290
+xors 4, 1, sb266, sb191, sb192 # 291
+xors 4, 1, sb129, sb193, sb194 # 292
+xors 4, 1, sb267, sb195, sb196 # 293
+xors 4, 1, sb131, sb197, sb198 # 294
+xors 4, 1, sb268, sb199, sb200 # 295
+xors 4, 1, sb133, sb201, sb202 # 296
+xors 4, 1, sb269, sb203, sb204 # 297
+xors 4, 1, sb135, sb205, sb206 # 298
+xors 4, 1, sb270, sb207, sb208 # 299
+xors 4, 1, sb137, sb209, sb210 # 300
+xors 4, 1, sb271, sb211, sb212 # 301
+xors 4, 1, sb139, sb213, sb214 # 302
+xors 4, 1, sb272, sb215, sb216 # 303
+xors 4, 1, sb141, sb217, sb218 # 304
+xors 4, 1, sb273, sb219, sb220 # 305
+xors 4, 1, sb143, sb221, sb222 # 306
+xors 4, 1, sb274, sb223, sb224 # 307
+xors 4, 1, sb145, sb225, sb226 # 308
+xors 4, 1, sb275, sb227, sb228 # 309
+xors 4, 1, sb147, sb229, sb230 # 310
+xors 4, 1, sb276, sb231, sb232 # 311
+xors 4, 1, sb149, sb233, sb234 # 312
+xors 4, 1, sb277, sb235, sb236 # 313
+xors 4, 1, sb151, sb237, sb238 # 314
+xors 4, 1, sb278, sb239, sb240 # 315
+xors 4, 1, sb153, sb241, sb242 # 316
+xors 4, 1, sb279, sb243, sb244 # 317
+xors 4, 1, sb155, sb245, sb246 # 318
+xors 4, 1, sb280, sb247, sb248 # 319
+xors 4, 1, sb157, sb249, sb250 # 320
+xors 4, 1, sb281, sb251, sb252 # 321
+xors 4, 1, sb159, sb253, sb254 # 322
+xors 4, 1, sb282, sb255, sb256 # 323
+xors 4, 1, sb161, sb257, sb258 # 324
+ands 372, 1, sb51, sb54, sb56, 1, sb98, sb57, sb58, 1, sb99, sb59, sb12, 1, sb97, sb65, sb69, 1, sb101, sb14, sb75, 1, sb96, sb79, sb83, 1, sb103, sb84, sb85, 1, sb95, sb86, sb87, 1, sb105, sb88, sb89, 1, sb94, sb92, sb4, 1, sb107, sb7, sb8, 1, sb93, sb10, sb17, 1, sb109, sb15, sb23, 1, sb114, sb26, sb25, 1, sb110, sb52, sb19, 1, sb53, sb100, sb22, 1, sb111, sb102, sb29, 1, sb55, sb104, sb31, 1, sb112, sb106, sb32, 1, sb113, sb108, sb33, 1, sb116, sb34, sb35, 1, sb90, sb36, sb37, 1, sb118, sb39, sb41, 1, sb63, sb42, sb44, 1, sb120, sb46, sb48, 1, sb71, sb49, sb50, 1, sb122, sb175, sb176, 1, sb67, sb177, sb178, 1, sb124, sb179, sb180, 1, sb38, sb181, sb182, 1, sb126, sb183, sb184, 1, sb21, sb185, sb186, 1, sb128, sb187, sb188, 1, sb13, sb189, sb190, 1, sb130, sb191, sb192, 1, sb9, sb193, sb194, 1, sb132, sb195, sb196, 1, sb1, sb197, sb198, 1, sb134, sb199, sb200, 1, sb81, sb201, sb202, 1, sb136, sb203, sb204, 1, sb77, sb205, sb206, 1, sb138, sb207, sb208, 1, sb73, sb209, sb210, 1, sb140, sb211, sb212, 1, sb45, sb213, sb214, 1, sb142, sb215, sb216, 1, sb43, sb217, sb218, 1, sb144, sb219, sb220, 1, sb40, sb221, sb222, 1, sb146, sb223, sb224, 1, sb30, sb225, sb226, 1, sb148, sb227, sb228, 1, sb28, sb229, sb230, 1, sb150, sb231, sb232, 1, sb24, sb233, sb234, 1, sb152, sb235, sb236, 1, sb20, sb237, sb238, 1, sb154, sb239, sb240, 1, sb18, sb241, sb242, 1, sb156, sb243, sb244, 1, sb16, sb245, sb246, 1, sb158, sb247, sb248, 1, sb11, sb249, sb250, 1, sb160, sb251, sb252, 1, sb6, sb253, sb254, 1, sb162, sb255, sb256, 1, sb47, sb257, sb258, 1, sb0, sb61, sb91, 1, sb163, sb115, sb259, 1, sb60, sb117, sb260, 1, sb164, sb119, sb261, 1, sb62, sb121, sb262, 1, sb165, sb123, sb263, 1, sb64, sb125, sb264, 1, sb166, sb127, sb265, 1, sb66, sb129, sb266, 1, sb167, sb131, sb267, 1, sb68, sb133, sb268, 1, sb168, sb135, sb269, 1, sb70, sb137, sb270, 1, sb169, sb139, sb271, 1, sb72, sb141, sb272, 1, sb170, sb143, sb273, 1, sb74, sb145, sb274, 1, sb171, sb147, sb275, 1, sb76, sb149, sb276, 1, sb172, sb151, sb277, 1, sb78, sb153, sb278, 1, sb173, sb155, sb279, 1, sb80, sb157, sb280, 1, sb174, sb159, sb281, 1, sb82, sb161, sb282 # 325
+ands 184, 1, sb50, sb52, sb99, 1, sb54, sb100, sb101, 1, sb49, sb102, sb103, 1, sb56, sb104, sb105, 1, sb92, sb106, sb107, 1, sb59, sb108, sb109, 1, sb26, sb27, sb110, 1, sb57, sb53, sb111, 1, sb58, sb55, sb112, 1, sb12, sb113, sb114, 1, sb46, sb115, sb116, 1, sb36, sb117, sb118, 1, sb69, sb119, sb120, 1, sb65, sb121, sb122, 1, sb23, sb123, sb124, 1, sb15, sb125, sb126, 1, sb10, sb127, sb128, 1, sb7, sb129, sb130, 1, sb83, sb131, sb132, 1, sb79, sb133, sb134, 1, sb75, sb135, sb136, 1, sb48, sb137, sb138, 1, sb44, sb139, sb140, 1, sb42, sb141, sb142, 1, sb34, sb143, sb144, 1, sb29, sb145, sb146, 1, sb25, sb147, sb148, 1, sb22, sb149, sb150, 1, sb19, sb151, sb152, 1, sb17, sb153, sb154, 1, sb14, sb155, sb156, 1, sb8, sb157, sb158, 1, sb4, sb159, sb160, 1, sb32, sb161, sb162, 1, sb84, sb60, sb163, 1, sb31, sb62, sb164, 1, sb85, sb64, sb165, 1, sb33, sb66, sb166, 1, sb86, sb68, sb167, 1, sb35, sb70, sb168, 1, sb87, sb72, sb169, 1, sb37, sb74, sb170, 1, sb88, sb76, sb171, 1, sb39, sb78, sb172, 1, sb89, sb80, sb173, 1, sb41, sb82, sb174 # 326
+xors 4, 1, sb52, sb50, sb98 # 327
+xors 4, 1, sb50, sb54, sb97 # 328
+xors 4, 1, sb54, sb49, sb96 # 329
+xors 4, 1, sb49, sb56, sb95 # 330
+xors 4, 1, sb56, sb92, sb94 # 331
+xors 4, 1, sb92, sb59, sb93 # 332
+xors 4, 1, sb59, sb12, sb92 # 333
+xors 4, 1, sb12, sb61, sb91 # 334
+xors 4, 1, sb61, sb46, sb90 # 335
+xors 4, 1, sb46, sb36, sb63 # 336
+xors 4, 1, sb63, sb69, sb71 # 337
+xors 4, 1, sb36, sb65, sb67 # 338
+xors 4, 1, sb65, sb23, sb38 # 339
+xors 4, 1, sb23, sb15, sb21 # 340
+xors 4, 1, sb67, sb10, sb13 # 341
+xors 4, 1, sb10, sb7, sb9 # 342
+xors 4, 1, sb69, sb83, sb1 # 343
+xors 4, 1, sb38, sb79, sb81 # 344
+xors 4, 1, sb71, sb75, sb77 # 345
+xors 4, 1, sb1, sb48, sb73 # 346
+xors 4, 1, sb73, sb44, sb45 # 347
+xors 4, 1, sb21, sb42, sb43 # 348
+xors 4, 1, sb75, sb34, sb40 # 349
+xors 4, 1, sb15, sb29, sb30 # 350
+xors 4, 1, sb77, sb25, sb28 # 351
+xors 4, 1, sb13, sb22, sb24 # 352
+xors 4, 1, sb79, sb19, sb20 # 353
+xors 4, 1, sb9, sb17, sb18 # 354
+xors 4, 1, sb81, sb14, sb16 # 355
+xors 4, 1, sb7, sb8, sb11 # 356
+xors 4, 1, sb83, sb4, sb6 # 357
+ands 92, 1, sb28, sb27, sb52, 1, sb48, sb53, sb54, 1, sb30, sb55, sb56, 1, sb29, sb26, sb57, 1, sb25, sb58, sb59, 1, sb24, sb60, sb61, 1, sb34, sb62, sb63, 1, sb20, sb64, sb65, 1, sb40, sb66, sb67, 1, sb6, sb68, sb69, 1, sb22, sb70, sb71, 1, sb18, sb72, sb73, 1, sb14, sb74, sb75, 1, sb42, sb76, sb77, 1, sb8, sb78, sb79, 1, sb4, sb80, sb81, 1, sb16, sb82, sb83, 1, sb43, sb31, sb84, 1, sb11, sb33, sb85, 1, sb44, sb35, sb86, 1, sb17, sb37, sb87, 1, sb45, sb39, sb88, 1, sb19, sb41, sb89 # 358
+xors 4, 1, sb27, sb28, sb51 # 359
+xors 4, 1, sb28, sb48, sb50 # 360
+xors 4, 1, sb48, sb30, sb49 # 361
+xors 4, 1, sb30, sb25, sb48 # 362
+xors 4, 1, sb25, sb32, sb47 # 363
+xors 4, 1, sb32, sb24, sb46 # 364
+xors 4, 1, sb24, sb34, sb36 # 365
+xors 4, 1, sb34, sb20, sb23 # 366
+xors 4, 1, sb23, sb40, sb10 # 367
+xors 4, 1, sb36, sb6, sb38 # 368
+xors 4, 1, sb20, sb22, sb1 # 369
+xors 4, 1, sb38, sb18, sb21 # 370
+xors 4, 1, sb10, sb14, sb15 # 371
+xors 4, 1, sb40, sb42, sb13 # 372
+xors 4, 1, sb6, sb8, sb9 # 373
+xors 4, 1, sb42, sb4, sb7 # 374
+ands 44, 1, sb9, sb26, sb28, 1, sb1, sb29, sb30, 1, sb15, sb31, sb32, 1, sb18, sb33, sb34, 1, sb13, sb35, sb36, 1, sb8, sb37, sb38, 1, sb4, sb39, sb40, 1, sb14, sb41, sb42, 1, sb21, sb11, sb43, 1, sb7, sb17, sb44, 1, sb22, sb19, sb45 # 375
+xors 4, 1, sb26, sb9, sb27 # 376
+xors 4, 1, sb9, sb1, sb26 # 377
+xors 4, 1, sb1, sb3, sb9 # 378
+xors 4, 1, sb3, sb16, sb25 # 379
+xors 4, 1, sb16, sb15, sb24 # 380
+xors 4, 1, sb15, sb18, sb23 # 381
+xors 4, 1, sb18, sb13, sb20 # 382
+xors 4, 1, sb13, sb8, sb10 # 383
+xors 4, 1, sb20, sb4, sb6 # 384
+xors 4, 1, sb4, sb14, sb3 # 385
+ands 20, 1, sb10, sb11, sb16, 1, sb6, sb17, sb18, 1, sb8, sb19, sb20, 1, sb14, sb7, sb21, 1, sb3, sb12, sb22 # 386
+xors 4, 1, sb11, sb10, sb15 # 387
+xors 4, 1, sb10, sb6, sb13 # 388
+xors 4, 1, sb13, sb8, sb4 # 389
+ands 12, 1, sb6, sb7, sb11, 1, sb4, sb12, sb13, 1, sb8, sb3, sb14 # 390
+xors 4, 1, sb7, sb6, sb10 # 391
+xors 4, 1, sb6, sb4, sb0 # 392
+ands 8, 1, sb4, sb3, sb7, 1, sb0, sb8, sb9 # 393
+xors 4, 1, sb3, sb4, sb6 # 394
+xors 4, 1, sb4, sb0, sb3 # 395
+dabit s8, sb3 # 396
+xors 4, 1, sb0, sb3, sb4 # 397
+mulsi s0, s8, 2 # 398
+dabit s5, sb4 # 399
+xors 4, 1, sb3, sb4, sb5 # 400
+reveal 12, 1, cb3, sb0, 1, cb2, sb1, 1, cb1, sb2, 1, cb0, sb3 # 401
+convcbitvec 1, ci0, cb3 # 402
+convint c0, ci0 # 403
+addm s2, s8, c0 # 404
+convint c1, ci0 # 405
+mulm s8, s0, c1 # 406
+subs s0, s2, s8 # 407
+movs s2, s0 # 408
+convcbitvec 1, ci0, cb2 # 409
+convint c0, ci0 # 410
+addm s0, s7, c0 # 411
+convint c1, ci0 # 412
+mulm s7, s4, c1 # 413
+subs s4, s0, s7 # 414
+movs s0, s4 # 415
+convcbitvec 1, ci0, cb1 # 416
+convint c0, ci0 # 417
+addm s4, s6, c0 # 418
+convint c1, ci0 # 419
+mulm s6, s3, c1 # 420
+subs s3, s4, s6 # 421
+movs s4, s3 # 422
+adds s3, s0, s4 # 423
+convcbitvec 1, ci0, cb0 # 424
+convint c0, ci0 # 425
+addm s4, s5, c0 # 426
+mulsi s0, s5, 2 # 427
+convint c1, ci0 # 428
+mulm s5, s0, c1 # 429
+subs s0, s4, s5 # 430
+movs s4, s0 # 431
+adds s0, s2, s4 # 432
+shrsi s2, s1, 15 # 433
+adds s1, s2, s3 # 434
+ldi c0, 262144 # 435
+mulci c1, c0, 2147483647 # 436
+addci c0, c1, 262144 # 437
+mulm s2, s0, c0 # 438
+subs s0, s1, s2 # 439
+subsi s1, s0, 16384 # 440
+movs s0, s1 # 441
+use 2, 0, 247 # 442
+use 0, 4, 4 # 443
+reqbl -64 # 444
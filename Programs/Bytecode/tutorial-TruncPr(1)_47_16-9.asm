@@ -0,0 +1,368 @@
+call_arg *3, 4 # 0
+ldi c1, 32768 # 1
+mulci c2, c1, 2147483647 # 2
+addci c0, c2, 32768 # 3
+addm s0, s3, c0 # 4
+randoms s2, 16 # 5
+split 50, 3, s2, sb163, sb165, sb176, sb161, sb162, sb172, sb158, sb159, sb168, sb155, sb157, sb164, sb153, sb154, sb160, sb150, sb151, sb156, sb147, sb149, sb152, sb145, sb146, sb148, sb142, sb143, sb144, sb139, sb141, sb140, sb137, sb138, sb136, sb134, sb135, sb132, sb131, sb133, sb128, sb129, sb130, sb122, sb126, sb127, sb120, sb124, sb125, sb118 # 6
+xors 4, 1, sb180, sb176, sb165 # 7
+xors 4, 1, sb182, sb163, sb176 # 8
+xors 4, 1, sb184, sb172, sb162 # 9
+xors 4, 1, sb28, sb184, sb161 # 10
+xors 4, 1, sb186, sb161, sb172 # 11
+xors 4, 1, sb188, sb168, sb159 # 12
+xors 4, 1, sb24, sb188, sb158 # 13
+xors 4, 1, sb189, sb158, sb168 # 14
+xors 4, 1, sb190, sb164, sb157 # 15
+xors 4, 1, sb22, sb190, sb155 # 16
+xors 4, 1, sb191, sb155, sb164 # 17
+xors 4, 1, sb192, sb160, sb154 # 18
+xors 4, 1, sb19, sb192, sb153 # 19
+xors 4, 1, sb193, sb153, sb160 # 20
+xors 4, 1, sb194, sb156, sb151 # 21
+xors 4, 1, sb16, sb194, sb150 # 22
+xors 4, 1, sb195, sb150, sb156 # 23
+xors 4, 1, sb196, sb152, sb149 # 24
+xors 4, 1, sb11, sb196, sb147 # 25
+xors 4, 1, sb197, sb147, sb152 # 26
+xors 4, 1, sb198, sb148, sb146 # 27
+xors 4, 1, sb8, sb198, sb145 # 28
+xors 4, 1, sb199, sb145, sb148 # 29
+xors 4, 1, sb200, sb144, sb143 # 30
+xors 4, 1, sb3, sb200, sb142 # 31
+xors 4, 1, sb201, sb142, sb144 # 32
+xors 4, 1, sb0, sb140, sb141 # 33
+xors 4, 1, sb61, sb0, sb139 # 34
+xors 4, 1, sb1, sb139, sb140 # 35
+xors 4, 1, sb2, sb136, sb138 # 36
+xors 4, 1, sb58, sb2, sb137 # 37
+xors 4, 1, sb4, sb137, sb136 # 38
+xors 4, 1, sb5, sb132, sb135 # 39
+xors 4, 1, sb56, sb5, sb134 # 40
+xors 4, 1, sb7, sb134, sb132 # 41
+xors 4, 1, sb9, sb128, sb133 # 42
+xors 4, 1, sb49, sb9, sb131 # 43
+xors 4, 1, sb10, sb131, sb128 # 44
+xors 4, 1, sb12, sb122, sb130 # 45
+xors 4, 1, sb41, sb12, sb129 # 46
+xors 4, 1, sb13, sb129, sb122 # 47
+xors 4, 1, sb14, sb120, sb127 # 48
+xors 4, 1, sb39, sb14, sb126 # 49
+xors 4, 1, sb15, sb126, sb120 # 50
+xors 4, 1, sb17, sb118, sb125 # 51
+xors 4, 1, sb36, sb17, sb124 # 52
+xors 4, 1, sb18, sb124, sb118 # 53
+dabit s9, sb6 # 54
+mulsi s7, s9, 2 # 55
+dabit s8, sb116 # 56
+mulsi s5, s8, 2 # 57
+randoms s6, 31 # 58
+split 95, 3, s6, sb121, sb123, sb114, sb117, sb119, sb112, sb113, sb115, sb110, sb109, sb111, sb108, sb105, sb107, sb106, sb101, sb103, sb104, sb97, sb99, sb102, sb93, sb95, sb100, sb89, sb91, sb98, sb85, sb87, sb96, sb81, sb83, sb94, sb77, sb80, sb92, sb69, sb73, sb90, sb65, sb67, sb88, sb60, sb63, sb86, sb51, sb53, sb84, sb46, sb48, sb82, sb37, sb44, sb79, sb233, sb234, sb75, sb231, sb232, sb71, sb229, sb230, sb68, sb227, sb228, sb66, sb225, sb226, sb64, sb223, sb224, sb62, sb178, sb222, sb54, sb170, sb174, sb52, sb162, sb166, sb50, sb154, sb158, sb47, sb146, sb150, sb45, sb138, sb142, sb42, sb130, sb134, sb35 # 59
+xors 4, 1, sb20, sb114, sb123 # 60
+xors 4, 1, sb21, sb121, sb114 # 61
+xors 4, 1, sb23, sb112, sb119 # 62
+xors 4, 1, sb187, sb23, sb117 # 63
+xors 4, 1, sb25, sb117, sb112 # 64
+xors 4, 1, sb26, sb110, sb115 # 65
+xors 4, 1, sb185, sb26, sb113 # 66
+xors 4, 1, sb27, sb113, sb110 # 67
+xors 4, 1, sb29, sb108, sb111 # 68
+xors 4, 1, sb183, sb29, sb109 # 69
+xors 4, 1, sb30, sb109, sb108 # 70
+xors 4, 1, sb31, sb106, sb107 # 71
+xors 4, 1, sb181, sb31, sb105 # 72
+xors 4, 1, sb32, sb105, sb106 # 73
+xors 4, 1, sb33, sb104, sb103 # 74
+xors 4, 1, sb179, sb33, sb101 # 75
+xors 4, 1, sb34, sb101, sb104 # 76
+xors 4, 1, sb38, sb102, sb99 # 77
+xors 4, 1, sb177, sb38, sb97 # 78
+xors 4, 1, sb40, sb97, sb102 # 79
+xors 4, 1, sb43, sb100, sb95 # 80
+xors 4, 1, sb175, sb43, sb93 # 81
+xors 4, 1, sb55, sb93, sb100 # 82
+xors 4, 1, sb57, sb98, sb91 # 83
+xors 4, 1, sb173, sb57, sb89 # 84
+xors 4, 1, sb59, sb89, sb98 # 85
+xors 4, 1, sb70, sb96, sb87 # 86
+xors 4, 1, sb171, sb70, sb85 # 87
+xors 4, 1, sb72, sb85, sb96 # 88
+xors 4, 1, sb74, sb94, sb83 # 89
+xors 4, 1, sb169, sb74, sb81 # 90
+xors 4, 1, sb76, sb81, sb94 # 91
+xors 4, 1, sb78, sb92, sb80 # 92
+xors 4, 1, sb167, sb78, sb77 # 93
+xors 4, 1, sb80, sb77, sb92 # 94
+xors 4, 1, sb117, sb90, sb73 # 95
+xors 4, 1, sb165, sb117, sb69 # 96
+xors 4, 1, sb124, sb69, sb90 # 97
+xors 4, 1, sb125, sb88, sb67 # 98
+xors 4, 1, sb163, sb125, sb65 # 99
+xors 4, 1, sb126, sb65, sb88 # 100
+xors 4, 1, sb127, sb86, sb63 # 101
+xors 4, 1, sb161, sb127, sb60 # 102
+xors 4, 1, sb202, sb60, sb86 # 103
+xors 4, 1, sb203, sb84, sb53 # 104
+xors 4, 1, sb159, sb203, sb51 # 105
+xors 4, 1, sb204, sb51, sb84 # 106
+xors 4, 1, sb205, sb82, sb48 # 107
+xors 4, 1, sb157, sb205, sb46 # 108
+xors 4, 1, sb206, sb46, sb82 # 109
+xors 4, 1, sb207, sb79, sb44 # 110
+xors 4, 1, sb155, sb207, sb37 # 111
+xors 4, 1, sb208, sb37, sb79 # 112
+xors 4, 1, sb209, sb75, sb234 # 113
+xors 4, 1, sb153, sb209, sb233 # 114
+xors 4, 1, sb210, sb233, sb75 # 115
+xors 4, 1, sb211, sb71, sb232 # 116
+xors 4, 1, sb151, sb211, sb231 # 117
+xors 4, 1, sb212, sb231, sb71 # 118
+xors 4, 1, sb213, sb68, sb230 # 119
+xors 4, 1, sb149, sb213, sb229 # 120
+xors 4, 1, sb214, sb229, sb68 # 121
+xors 4, 1, sb215, sb66, sb228 # 122
+xors 4, 1, sb147, sb215, sb227 # 123
+xors 4, 1, sb216, sb227, sb66 # 124
+xors 4, 1, sb217, sb64, sb226 # 125
+xors 4, 1, sb145, sb217, sb225 # 126
+xors 4, 1, sb218, sb225, sb64 # 127
+xors 4, 1, sb219, sb62, sb224 # 128
+xors 4, 1, sb143, sb219, sb223 # 129
+xors 4, 1, sb220, sb223, sb62 # 130
+xors 4, 1, sb221, sb54, sb222 # 131
+xors 4, 1, sb141, sb221, sb178 # 132
+xors 4, 1, sb222, sb178, sb54 # 133
+xors 4, 1, sb223, sb52, sb174 # 134
+xors 4, 1, sb139, sb223, sb170 # 135
+xors 4, 1, sb224, sb170, sb52 # 136
+xors 4, 1, sb225, sb50, sb166 # 137
+xors 4, 1, sb137, sb225, sb162 # 138
+xors 4, 1, sb226, sb162, sb50 # 139
+xors 4, 1, sb227, sb47, sb158 # 140
+xors 4, 1, sb135, sb227, sb154 # 141
+xors 4, 1, sb228, sb154, sb47 # 142
+xors 4, 1, sb229, sb45, sb150 # 143
+xors 4, 1, sb133, sb229, sb146 # 144
+xors 4, 1, sb230, sb146, sb45 # 145
+xors 4, 1, sb231, sb42, sb142 # 146
+xors 4, 1, sb131, sb231, sb138 # 147
+xors 4, 1, sb232, sb138, sb42 # 148
+xors 4, 1, sb233, sb35, sb134 # 149
+xors 4, 1, sb129, sb233, sb130 # 150
+xors 4, 1, sb234, sb130, sb35 # 151
+ands 188, 1, sb178, sb180, sb182, 1, sb174, sb184, sb186, 1, sb170, sb188, sb189, 1, sb166, sb190, sb191, 1, sb162, sb192, sb193, 1, sb158, sb194, sb195, 1, sb154, sb196, sb197, 1, sb150, sb198, sb199, 1, sb146, sb200, sb201, 1, sb142, sb0, sb1, 1, sb138, sb2, sb4, 1, sb134, sb5, sb7, 1, sb130, sb9, sb10, 1, sb123, sb12, sb13, 1, sb121, sb14, sb15, 1, sb119, sb17, sb18, 1, sb115, sb20, sb21, 1, sb113, sb23, sb25, 1, sb111, sb26, sb27, 1, sb109, sb29, sb30, 1, sb107, sb31, sb32, 1, sb105, sb33, sb34, 1, sb103, sb38, sb40, 1, sb101, sb43, sb55, 1, sb99, sb57, sb59, 1, sb97, sb70, sb72, 1, sb95, sb74, sb76, 1, sb93, sb78, sb80, 1, sb91, sb117, sb124, 1, sb89, sb125, sb126, 1, sb87, sb127, sb202, 1, sb85, sb203, sb204, 1, sb83, sb205, sb206, 1, sb81, sb207, sb208, 1, sb77, sb209, sb210, 1, sb73, sb211, sb212, 1, sb69, sb213, sb214, 1, sb67, sb215, sb216, 1, sb65, sb217, sb218, 1, sb63, sb219, sb220, 1, sb60, sb221, sb222, 1, sb53, sb223, sb224, 1, sb51, sb225, sb226, 1, sb48, sb227, sb228, 1, sb46, sb229, sb230, 1, sb44, sb231, sb232, 1, sb37, sb233, sb234 # 152
+xors 4, 1, sb26, sb176, sb178 # 153
+xors 4, 1, sb23, sb172, sb174 # 154
+xors 4, 1, sb127, sb23, sb24 # 155
+xors 4, 1, sb21, sb168, sb170 # 156
+xors 4, 1, sb80, sb21, sb22 # 157
+xors 4, 1, sb18, sb164, sb166 # 158
+xors 4, 1, sb126, sb18, sb19 # 159
+xors 4, 1, sb14, sb160, sb162 # 160
+xors 4, 1, sb78, sb14, sb16 # 161
+xors 4, 1, sb10, sb156, sb158 # 162
+xors 4, 1, sb125, sb10, sb11 # 163
+xors 4, 1, sb7, sb152, sb154 # 164
+xors 4, 1, sb76, sb7, sb8 # 165
+xors 4, 1, sb0, sb148, sb150 # 166
+xors 4, 1, sb124, sb0, sb3 # 167
+xors 4, 1, sb59, sb144, sb146 # 168
+xors 4, 1, sb74, sb59, sb61 # 169
+xors 4, 1, sb57, sb140, sb142 # 170
+xors 4, 1, sb32, sb57, sb58 # 171
+xors 4, 1, sb55, sb136, sb138 # 172
+xors 4, 1, sb72, sb55, sb56 # 173
+xors 4, 1, sb43, sb132, sb134 # 174
+xors 4, 1, sb31, sb43, sb49 # 175
+xors 4, 1, sb40, sb128, sb130 # 176
+xors 4, 1, sb70, sb40, sb41 # 177
+xors 4, 1, sb38, sb122, sb123 # 178
+xors 4, 1, sb30, sb38, sb39 # 179
+xors 4, 1, sb34, sb120, sb121 # 180
+xors 4, 1, sb33, sb34, sb36 # 181
+xors 4, 1, sb117, sb118, sb119 # 182
+xors 4, 1, sb2, sb116, sb117 # 183
+xors 4, 1, sb186, sb114, sb115 # 184
+xors 4, 1, sb184, sb112, sb113 # 185
+xors 4, 1, sb182, sb110, sb111 # 186
+xors 4, 1, sb180, sb108, sb109 # 187
+xors 4, 1, sb178, sb106, sb107 # 188
+xors 4, 1, sb176, sb104, sb105 # 189
+xors 4, 1, sb174, sb102, sb103 # 190
+xors 4, 1, sb172, sb100, sb101 # 191
+xors 4, 1, sb170, sb98, sb99 # 192
+xors 4, 1, sb168, sb96, sb97 # 193
+xors 4, 1, sb166, sb94, sb95 # 194
+xors 4, 1, sb164, sb92, sb93 # 195
+xors 4, 1, sb162, sb90, sb91 # 196
+xors 4, 1, sb160, sb88, sb89 # 197
+xors 4, 1, sb158, sb86, sb87 # 198
+xors 4, 1, sb156, sb84, sb85 # 199
+xors 4, 1, sb154, sb82, sb83 # 200
+xors 4, 1, sb152, sb79, sb81 # 201
+xors 4, 1, sb150, sb75, sb77 # 202
+xors 4, 1, sb148, sb71, sb73 # 203
+xors 4, 1, sb146, sb68, sb69 # 204
+xors 4, 1, sb144, sb66, sb67 # 205
+xors 4, 1, sb142, sb64, sb65 # 206
+xors 4, 1, sb140, sb62, sb63 # 207
+xors 4, 1, sb138, sb54, sb60 # 208
+xors 4, 1, sb136, sb52, sb53 # 209
+xors 4, 1, sb134, sb50, sb51 # 210
+xors 4, 1, sb132, sb47, sb48 # 211
+xors 4, 1, sb130, sb45, sb46 # 212
+xors 4, 1, sb128, sb42, sb44 # 213
+xors 4, 1, sb5, sb35, sb37 # 214
+xors 4, 1, sb42, sb128, sb129 # 215
+xors 4, 1, sb87, sb130, sb131 # 216
+xors 4, 1, sb188, sb132, sb133 # 217
+xors 4, 1, sb89, sb134, sb135 # 218
+xors 4, 1, sb189, sb136, sb137 # 219
+xors 4, 1, sb91, sb138, sb139 # 220
+xors 4, 1, sb190, sb140, sb141 # 221
+xors 4, 1, sb93, sb142, sb143 # 222
+xors 4, 1, sb191, sb144, sb145 # 223
+xors 4, 1, sb95, sb146, sb147 # 224
+xors 4, 1, sb192, sb148, sb149 # 225
+xors 4, 1, sb97, sb150, sb151 # 226
+xors 4, 1, sb193, sb152, sb153 # 227
+xors 4, 1, sb99, sb154, sb155 # 228
+xors 4, 1, sb194, sb156, sb157 # 229
+xors 4, 1, sb101, sb158, sb159 # 230
+xors 4, 1, sb195, sb160, sb161 # 231
+xors 4, 1, sb103, sb162, sb163 # 232
+xors 4, 1, sb196, sb164, sb165 # 233
+xors 4, 1, sb105, sb166, sb167 # 234
+xors 4, 1, sb197, sb168, sb169 # 235
+xors 4, 1, sb107, sb170, sb171 # 236
+xors 4, 1, sb198, sb172, sb173 # 237
+xors 4, 1, sb109, sb174, sb175 # 238
+xors 4, 1, sb199, sb176, sb177 # 239
+xors 4, 1, sb111, sb178, sb179 # 240
+xors 4, 1, sb200, sb180, sb181 # 241
+xors 4, 1, sb113, sb182, sb183 # 242
+xors 4, 1, sb201, sb184, sb185 # 243
+ands 264, 1, sb68, sb34, sb36, 1, sb69, sb38, sb39, 1, sb67, sb40, sb41, 1, sb71, sb43, sb49, 1, sb66, sb55, sb56, 1, sb73, sb57, sb58, 1, sb65, sb59, sb61, 1, sb75, sb0, sb3, 1, sb64, sb7, sb8, 1, sb77, sb10, sb11, 1, sb63, sb14, sb16, 1, sb79, sb18, sb19, 1, sb62, sb21, sb22, 1, sb81, sb23, sb24, 1, sb86, sb26, sb28, 1, sb15, sb33, sb30, 1, sb82, sb70, sb31, 1, sb35, sb72, sb32, 1, sb83, sb74, sb124, 1, sb37, sb76, sb125, 1, sb84, sb78, sb126, 1, sb85, sb80, sb127, 1, sb29, sb128, sb129, 1, sb45, sb130, sb131, 1, sb88, sb132, sb133, 1, sb51, sb134, sb135, 1, sb90, sb136, sb137, 1, sb47, sb138, sb139, 1, sb92, sb140, sb141, 1, sb13, sb142, sb143, 1, sb94, sb144, sb145, 1, sb9, sb146, sb147, 1, sb96, sb148, sb149, 1, sb4, sb150, sb151, 1, sb98, sb152, sb153, 1, sb1, sb154, sb155, 1, sb100, sb156, sb157, 1, sb60, sb158, sb159, 1, sb102, sb160, sb161, 1, sb53, sb162, sb163, 1, sb104, sb164, sb165, 1, sb27, sb166, sb167, 1, sb106, sb168, sb169, 1, sb25, sb170, sb171, 1, sb108, sb172, sb173, 1, sb20, sb174, sb175, 1, sb110, sb176, sb177, 1, sb17, sb178, sb179, 1, sb112, sb180, sb181, 1, sb12, sb182, sb183, 1, sb114, sb184, sb185, 1, sb123, sb186, sb187, 1, sb115, sb87, sb188, 1, sb44, sb89, sb189, 1, sb116, sb91, sb190, 1, sb46, sb93, sb191, 1, sb117, sb95, sb192, 1, sb48, sb97, sb193, 1, sb118, sb99, sb194, 1, sb50, sb101, sb195, 1, sb119, sb103, sb196, 1, sb52, sb105, sb197, 1, sb120, sb107, sb198, 1, sb54, sb109, sb199, 1, sb121, sb111, sb200, 1, sb122, sb113, sb201 # 244
+ands 132, 1, sb34, sb33, sb69, 1, sb32, sb70, sb71, 1, sb36, sb72, sb73, 1, sb31, sb74, sb75, 1, sb38, sb76, sb77, 1, sb61, sb78, sb79, 1, sb41, sb80, sb81, 1, sb14, sb15, sb82, 1, sb39, sb35, sb83, 1, sb40, sb37, sb84, 1, sb43, sb85, sb86, 1, sb28, sb87, sb88, 1, sb49, sb89, sb90, 1, sb22, sb91, sb92, 1, sb10, sb93, sb94, 1, sb7, sb95, sb96, 1, sb3, sb97, sb98, 1, sb0, sb99, sb100, 1, sb55, sb101, sb102, 1, sb30, sb103, sb104, 1, sb26, sb105, sb106, 1, sb24, sb107, sb108, 1, sb18, sb109, sb110, 1, sb16, sb111, sb112, 1, sb11, sb113, sb114, 1, sb19, sb42, sb115, 1, sb56, sb44, sb116, 1, sb21, sb46, sb117, 1, sb57, sb48, sb118, 1, sb23, sb50, sb119, 1, sb58, sb52, sb120, 1, sb59, sb54, sb121, 1, sb8, sb122, sb123 # 245
+xors 4, 1, sb33, sb34, sb68 # 246
+xors 4, 1, sb34, sb32, sb67 # 247
+xors 4, 1, sb32, sb36, sb66 # 248
+xors 4, 1, sb36, sb31, sb65 # 249
+xors 4, 1, sb31, sb38, sb64 # 250
+xors 4, 1, sb38, sb61, sb63 # 251
+xors 4, 1, sb61, sb41, sb62 # 252
+xors 4, 1, sb41, sb43, sb61 # 253
+xors 4, 1, sb43, sb28, sb45 # 254
+xors 4, 1, sb28, sb49, sb51 # 255
+xors 4, 1, sb45, sb22, sb47 # 256
+xors 4, 1, sb22, sb10, sb13 # 257
+xors 4, 1, sb47, sb7, sb9 # 258
+xors 4, 1, sb9, sb3, sb4 # 259
+xors 4, 1, sb49, sb0, sb1 # 260
+xors 4, 1, sb7, sb55, sb60 # 261
+xors 4, 1, sb51, sb30, sb53 # 262
+xors 4, 1, sb1, sb26, sb27 # 263
+xors 4, 1, sb53, sb24, sb25 # 264
+xors 4, 1, sb13, sb18, sb20 # 265
+xors 4, 1, sb55, sb16, sb17 # 266
+xors 4, 1, sb10, sb11, sb12 # 267
+xors 4, 1, sb60, sb8, sb10 # 268
+ands 64, 1, sb16, sb15, sb34, 1, sb30, sb35, sb36, 1, sb18, sb37, sb38, 1, sb17, sb14, sb39, 1, sb12, sb40, sb41, 1, sb20, sb42, sb43, 1, sb11, sb44, sb45, 1, sb10, sb46, sb47, 1, sb24, sb48, sb49, 1, sb4, sb50, sb51, 1, sb0, sb52, sb53, 1, sb27, sb54, sb55, 1, sb3, sb19, sb56, 1, sb25, sb21, sb57, 1, sb26, sb23, sb58, 1, sb8, sb59, sb60 # 269
+xors 4, 1, sb15, sb16, sb33 # 270
+xors 4, 1, sb16, sb30, sb32 # 271
+xors 4, 1, sb30, sb18, sb31 # 272
+xors 4, 1, sb18, sb12, sb30 # 273
+xors 4, 1, sb12, sb20, sb29 # 274
+xors 4, 1, sb20, sb11, sb28 # 275
+xors 4, 1, sb11, sb10, sb22 # 276
+xors 4, 1, sb22, sb24, sb9 # 277
+xors 4, 1, sb10, sb4, sb7 # 278
+xors 4, 1, sb24, sb0, sb1 # 279
+xors 4, 1, sb9, sb27, sb13 # 280
+xors 4, 1, sb27, sb8, sb9 # 281
+ands 28, 1, sb13, sb14, sb16, 1, sb1, sb17, sb18, 1, sb7, sb19, sb20, 1, sb0, sb21, sb22, 1, sb9, sb23, sb24, 1, sb8, sb3, sb25, 1, sb4, sb26, sb27 # 282
+xors 4, 1, sb14, sb13, sb15 # 283
+xors 4, 1, sb13, sb1, sb14 # 284
+xors 4, 1, sb1, sb6, sb13 # 285
+xors 4, 1, sb6, sb7, sb12 # 286
+xors 4, 1, sb7, sb0, sb11 # 287
+xors 4, 1, sb0, sb9, sb10 # 288
+xors 4, 1, sb9, sb4, sb0 # 289
+ands 8, 1, sb4, sb3, sb7, 1, sb0, sb8, sb9 # 290
+xors 4, 1, sb3, sb4, sb6 # 291
+xors 4, 1, sb4, sb0, sb3 # 292
+dabit s10, sb3 # 293
+xors 4, 1, sb0, sb3, sb4 # 294
+mulsi s1, s10, 2 # 295
+dabit s4, sb4 # 296
+xors 4, 1, sb3, sb4, sb5 # 297
+reveal 12, 1, cb3, sb0, 1, cb2, sb1, 1, cb1, sb2, 1, cb0, sb3 # 298
+convcbitvec 1, ci0, cb3 # 299
+convint c1, ci0 # 300
+addm s3, s10, c1 # 301
+convint c2, ci0 # 302
+mulm s10, s1, c2 # 303
+subs s1, s3, s10 # 304
+movs s3, s1 # 305
+convcbitvec 1, ci0, cb2 # 306
+convint c0, ci0 # 307
+addm s1, s9, c0 # 308
+convint c1, ci0 # 309
+mulm s9, s7, c1 # 310
+subs s7, s1, s9 # 311
+movs s1, s7 # 312
+convcbitvec 1, ci0, cb1 # 313
+convint c2, ci0 # 314
+addm s7, s8, c2 # 315
+convint c0, ci0 # 316
+mulm s8, s5, c0 # 317
+subs s5, s7, s8 # 318
+movs s7, s5 # 319
+adds s5, s1, s7 # 320
+mulsi s1, s5, 65536 # 321
+subs s5, s2, s1 # 322
+convcbitvec 1, ci0, cb0 # 323
+convint c1, ci0 # 324
+addm s2, s4, c1 # 325
+mulsi s1, s4, 2 # 326
+convint c2, ci0 # 327
+mulm s4, s1, c2 # 328
+subs s1, s2, s4 # 329
+movs s4, s1 # 330
+adds s2, s3, s4 # 331
+ldi c0, 1 # 332
+mulci c1, c0, 2147483647 # 333
+addci c2, c1, 1 # 334
+mulm s1, s2, c2 # 335
+subs s2, s6, s1 # 336
+bit s3 # 337
+ldi c1, 65536 # 338
+mulci c0, c1, 2147483647 # 339
+addci c2, c0, 65536 # 340
+mulm s4, s3, c2 # 341
+mulsi s6, s2, 65536 # 342
+adds s1, s4, s6 # 343
+adds s4, s1, s5 # 344
+adds s1, s0, s4 # 345
+mulsi s0, s1, 65536 # 346
+asm_open 3, 0, c2, s0 # 347
+shlci c0, c2, 1 # 348
+shrci c1, c0, 33 # 349
+shrci c0, c2, 63 # 350
+addm s1, s3, c0 # 351
+mulsi s0, s3, 2 # 352
+mulm s3, s0, c0 # 353
+subs s0, s1, s3 # 354
+submr s1, c1, s2 # 355
+ldi c0, 1 # 356
+mulci c1, c0, 2147483647 # 357
+addci c0, c1, 1 # 358
+mulm s2, s0, c0 # 359
+adds s0, s1, s2 # 360
+subsi s1, s0, 1073741824 # 361
+movs s0, s1 # 362
+use 2, 0, 171 # 363
+use 0, 2, 1 # 364
+use 0, 4, 4 # 365
+use 0, 7, 1 # 366
+reqbl -64 # 367
@@ -0,0 +1,367 @@
+vcall_arg 3, *9, 4 # 0
+vldi 3, c6, 32768 # 1
+vmulci 3, c3, c6, 2147483647 # 2
+vaddci 3, c0, c3, 32768 # 3
+vaddm 3, s0, s9, c0 # 4
+vrandoms 3, s18, 16 # 5
+vsplit 3, 50, 3, s18, sb163, sb165, sb176, sb161, sb162, sb172, sb158, sb159, sb168, sb155, sb157, sb164, sb153, sb154, sb160, sb150, sb151, sb156, sb147, sb149, sb152, sb145, sb146, sb148, sb142, sb143, sb144, sb139, sb141, sb140, sb137, sb138, sb136, sb134, sb135, sb132, sb131, sb133, sb128, sb129, sb130, sb122, sb126, sb127, sb120, sb124, sb125, sb118 # 6
+xors 4, 3, sb180, sb176, sb165 # 7
+xors 4, 3, sb182, sb163, sb176 # 8
+xors 4, 3, sb184, sb172, sb162 # 9
+xors 4, 3, sb28, sb184, sb161 # 10
+xors 4, 3, sb186, sb161, sb172 # 11
+xors 4, 3, sb188, sb168, sb159 # 12
+xors 4, 3, sb24, sb188, sb158 # 13
+xors 4, 3, sb189, sb158, sb168 # 14
+xors 4, 3, sb190, sb164, sb157 # 15
+xors 4, 3, sb22, sb190, sb155 # 16
+xors 4, 3, sb191, sb155, sb164 # 17
+xors 4, 3, sb192, sb160, sb154 # 18
+xors 4, 3, sb19, sb192, sb153 # 19
+xors 4, 3, sb193, sb153, sb160 # 20
+xors 4, 3, sb194, sb156, sb151 # 21
+xors 4, 3, sb16, sb194, sb150 # 22
+xors 4, 3, sb195, sb150, sb156 # 23
+xors 4, 3, sb196, sb152, sb149 # 24
+xors 4, 3, sb11, sb196, sb147 # 25
+xors 4, 3, sb197, sb147, sb152 # 26
+xors 4, 3, sb198, sb148, sb146 # 27
+xors 4, 3, sb8, sb198, sb145 # 28
+xors 4, 3, sb199, sb145, sb148 # 29
+xors 4, 3, sb200, sb144, sb143 # 30
+xors 4, 3, sb3, sb200, sb142 # 31
+xors 4, 3, sb201, sb142, sb144 # 32
+xors 4, 3, sb0, sb140, sb141 # 33
+xors 4, 3, sb61, sb0, sb139 # 34
+xors 4, 3, sb1, sb139, sb140 # 35
+xors 4, 3, sb2, sb136, sb138 # 36
+xors 4, 3, sb58, sb2, sb137 # 37
+xors 4, 3, sb4, sb137, sb136 # 38
+xors 4, 3, sb5, sb132, sb135 # 39
+xors 4, 3, sb56, sb5, sb134 # 40
+xors 4, 3, sb7, sb134, sb132 # 41
+xors 4, 3, sb9, sb128, sb133 # 42
+xors 4, 3, sb49, sb9, sb131 # 43
+xors 4, 3, sb10, sb131, sb128 # 44
+xors 4, 3, sb12, sb122, sb130 # 45
+xors 4, 3, sb41, sb12, sb129 # 46
+xors 4, 3, sb13, sb129, sb122 # 47
+xors 4, 3, sb14, sb120, sb127 # 48
+xors 4, 3, sb39, sb14, sb126 # 49
+xors 4, 3, sb15, sb126, sb120 # 50
+xors 4, 3, sb17, sb118, sb125 # 51
+xors 4, 3, sb36, sb17, sb124 # 52
+xors 4, 3, sb18, sb124, sb118 # 53
+vdabit 3, s27, sb6 # 54
+vmulsi 3, s21, s27, 2 # 55
+vdabit 3, s24, sb116 # 56
+vmulsi 3, s15, s24, 2 # 57
+vrandoms 3, s9, 31 # 58
+vsplit 3, 95, 3, s9, sb121, sb123, sb114, sb117, sb119, sb112, sb113, sb115, sb110, sb109, sb111, sb108, sb105, sb107, sb106, sb101, sb103, sb104, sb97, sb99, sb102, sb93, sb95, sb100, sb89, sb91, sb98, sb85, sb87, sb96, sb81, sb83, sb94, sb77, sb80, sb92, sb69, sb73, sb90, sb65, sb67, sb88, sb60, sb63, sb86, sb51, sb53, sb84, sb46, sb48, sb82, sb37, sb44, sb79, sb233, sb234, sb75, sb231, sb232, sb71, sb229, sb230, sb68, sb227, sb228, sb66, sb225, sb226, sb64, sb223, sb224, sb62, sb178, sb222, sb54, sb170, sb174, sb52, sb162, sb166, sb50, sb154, sb158, sb47, sb146, sb150, sb45, sb138, sb142, sb42, sb130, sb134, sb35 # 59
+xors 4, 3, sb20, sb114, sb123 # 60
+xors 4, 3, sb21, sb121, sb114 # 61
+xors 4, 3, sb23, sb112, sb119 # 62
+xors 4, 3, sb187, sb23, sb117 # 63
+xors 4, 3, sb25, sb117, sb112 # 64
+xors 4, 3, sb26, sb110, sb115 # 65
+xors 4, 3, sb185, sb26, sb113 # 66
+xors 4, 3, sb27, sb113, sb110 # 67
+xors 4, 3, sb29, sb108, sb111 # 68
+xors 4, 3, sb183, sb29, sb109 # 69
+xors 4, 3, sb30, sb109, sb108 # 70
+xors 4, 3, sb31, sb106, sb107 # 71
+xors 4, 3, sb181, sb31, sb105 # 72
+xors 4, 3, sb32, sb105, sb106 # 73
+xors 4, 3, sb33, sb104, sb103 # 74
+xors 4, 3, sb179, sb33, sb101 # 75
+xors 4, 3, sb34, sb101, sb104 # 76
+xors 4, 3, sb38, sb102, sb99 # 77
+xors 4, 3, sb177, sb38, sb97 # 78
+xors 4, 3, sb40, sb97, sb102 # 79
+xors 4, 3, sb43, sb100, sb95 # 80
+xors 4, 3, sb175, sb43, sb93 # 81
+xors 4, 3, sb55, sb93, sb100 # 82
+xors 4, 3, sb57, sb98, sb91 # 83
+xors 4, 3, sb173, sb57, sb89 # 84
+xors 4, 3, sb59, sb89, sb98 # 85
+xors 4, 3, sb70, sb96, sb87 # 86
+xors 4, 3, sb171, sb70, sb85 # 87
+xors 4, 3, sb72, sb85, sb96 # 88
+xors 4, 3, sb74, sb94, sb83 # 89
+xors 4, 3, sb169, sb74, sb81 # 90
+xors 4, 3, sb76, sb81, sb94 # 91
+xors 4, 3, sb78, sb92, sb80 # 92
+xors 4, 3, sb167, sb78, sb77 # 93
+xors 4, 3, sb80, sb77, sb92 # 94
+xors 4, 3, sb117, sb90, sb73 # 95
+xors 4, 3, sb165, sb117, sb69 # 96
+xors 4, 3, sb124, sb69, sb90 # 97
+xors 4, 3, sb125, sb88, sb67 # 98
+xors 4, 3, sb163, sb125, sb65 # 99
+xors 4, 3, sb126, sb65, sb88 # 100
+xors 4, 3, sb127, sb86, sb63 # 101
+xors 4, 3, sb161, sb127, sb60 # 102
+xors 4, 3, sb202, sb60, sb86 # 103
+xors 4, 3, sb203, sb84, sb53 # 104
+xors 4, 3, sb159, sb203, sb51 # 105
+xors 4, 3, sb204, sb51, sb84 # 106
+xors 4, 3, sb205, sb82, sb48 # 107
+xors 4, 3, sb157, sb205, sb46 # 108
+xors 4, 3, sb206, sb46, sb82 # 109
+xors 4, 3, sb207, sb79, sb44 # 110
+xors 4, 3, sb155, sb207, sb37 # 111
+xors 4, 3, sb208, sb37, sb79 # 112
+xors 4, 3, sb209, sb75, sb234 # 113
+xors 4, 3, sb153, sb209, sb233 # 114
+xors 4, 3, sb210, sb233, sb75 # 115
+xors 4, 3, sb211, sb71, sb232 # 116
+xors 4, 3, sb151, sb211, sb231 # 117
+xors 4, 3, sb212, sb231, sb71 # 118
+xors 4, 3, sb213, sb68, sb230 # 119
+xors 4, 3, sb149, sb213, sb229 # 120
+xors 4, 3, sb214, sb229, sb68 # 121
+xors 4, 3, sb215, sb66, sb228 # 122
+xors 4, 3, sb147, sb215, sb227 # 123
+xors 4, 3, sb216, sb227, sb66 # 124
+xors 4, 3, sb217, sb64, sb226 # 125
+xors 4, 3, sb145, sb217, sb225 # 126
+xors 4, 3, sb218, sb225, sb64 # 127
+xors 4, 3, sb219, sb62, sb224 # 128
+xors 4, 3, sb143, sb219, sb223 # 129
+xors 4, 3, sb220, sb223, sb62 # 130
+xors 4, 3, sb221, sb54, sb222 # 131
+xors 4, 3, sb141, sb221, sb178 # 132
+xors 4, 3, sb222, sb178, sb54 # 133
+xors 4, 3, sb223, sb52, sb174 # 134
+xors 4, 3, sb139, sb223, sb170 # 135
+xors 4, 3, sb224, sb170, sb52 # 136
+xors 4, 3, sb225, sb50, sb166 # 137
+xors 4, 3, sb137, sb225, sb162 # 138
+xors 4, 3, sb226, sb162, sb50 # 139
+xors 4, 3, sb227, sb47, sb158 # 140
+xors 4, 3, sb135, sb227, sb154 # 141
+xors 4, 3, sb228, sb154, sb47 # 142
+xors 4, 3, sb229, sb45, sb150 # 143
+xors 4, 3, sb133, sb229, sb146 # 144
+xors 4, 3, sb230, sb146, sb45 # 145
+xors 4, 3, sb231, sb42, sb142 # 146
+xors 4, 3, sb131, sb231, sb138 # 147
+xors 4, 3, sb232, sb138, sb42 # 148
+xors 4, 3, sb233, sb35, sb134 # 149
+xors 4, 3, sb129, sb233, sb130 # 150
+xors 4, 3, sb234, sb130, sb35 # 151
+ands 188, 3, sb178, sb180, sb182, 3, sb174, sb184, sb186, 3, sb170, sb188, sb189, 3, sb166, sb190, sb191, 3, sb162, sb192, sb193, 3, sb158, sb194, sb195, 3, sb154, sb196, sb197, 3, sb150, sb198, sb199, 3, sb146, sb200, sb201, 3, sb142, sb0, sb1, 3, sb138, sb2, sb4, 3, sb134, sb5, sb7, 3, sb130, sb9, sb10, 3, sb123, sb12, sb13, 3, sb121, sb14, sb15, 3, sb119, sb17, sb18, 3, sb115, sb20, sb21, 3, sb113, sb23, sb25, 3, sb111, sb26, sb27, 3, sb109, sb29, sb30, 3, sb107, sb31, sb32, 3, sb105, sb33, sb34, 3, sb103, sb38, sb40, 3, sb101, sb43, sb55, 3, sb99, sb57, sb59, 3, sb97, sb70, sb72, 3, sb95, sb74, sb76, 3, sb93, sb78, sb80, 3, sb91, sb117, sb124, 3, sb89, sb125, sb126, 3, sb87, sb127, sb202, 3, sb85, sb203, sb204, 3, sb83, sb205, sb206, 3, sb81, sb207, sb208, 3, sb77, sb209, sb210, 3, sb73, sb211, sb212, 3, sb69, sb213, sb214, 3, sb67, sb215, sb216, 3, sb65, sb217, sb218, 3, sb63, sb219, sb220, 3, sb60, sb221, sb222, 3, sb53, sb223, sb224, 3, sb51, sb225, sb226, 3, sb48, sb227, sb228, 3, sb46, sb229, sb230, 3, sb44, sb231, sb232, 3, sb37, sb233, sb234 # 152
+xors 4, 3, sb26, sb176, sb178 # 153
+xors 4, 3, sb23, sb172, sb174 # 154
+xors 4, 3, sb127, sb23, sb24 # 155
+xors 4, 3, sb21, sb168, sb170 # 156
+xors 4, 3, sb80, sb21, sb22 # 157
+xors 4, 3, sb18, sb164, sb166 # 158
+xors 4, 3, sb126, sb18, sb19 # 159
+xors 4, 3, sb14, sb160, sb162 # 160
+xors 4, 3, sb78, sb14, sb16 # 161
+xors 4, 3, sb10, sb156, sb158 # 162
+xors 4, 3, sb125, sb10, sb11 # 163
+xors 4, 3, sb7, sb152, sb154 # 164
+xors 4, 3, sb76, sb7, sb8 # 165
+xors 4, 3, sb0, sb148, sb150 # 166
+xors 4, 3, sb124, sb0, sb3 # 167
+xors 4, 3, sb59, sb144, sb146 # 168
+xors 4, 3, sb74, sb59, sb61 # 169
+xors 4, 3, sb57, sb140, sb142 # 170
+xors 4, 3, sb32, sb57, sb58 # 171
+xors 4, 3, sb55, sb136, sb138 # 172
+xors 4, 3, sb72, sb55, sb56 # 173
+xors 4, 3, sb43, sb132, sb134 # 174
+xors 4, 3, sb31, sb43, sb49 # 175
+xors 4, 3, sb40, sb128, sb130 # 176
+xors 4, 3, sb70, sb40, sb41 # 177
+xors 4, 3, sb38, sb122, sb123 # 178
+xors 4, 3, sb30, sb38, sb39 # 179
+xors 4, 3, sb34, sb120, sb121 # 180
+xors 4, 3, sb33, sb34, sb36 # 181
+xors 4, 3, sb117, sb118, sb119 # 182
+xors 4, 3, sb2, sb116, sb117 # 183
+xors 4, 3, sb186, sb114, sb115 # 184
+xors 4, 3, sb184, sb112, sb113 # 185
+xors 4, 3, sb182, sb110, sb111 # 186
+xors 4, 3, sb180, sb108, sb109 # 187
+xors 4, 3, sb178, sb106, sb107 # 188
+xors 4, 3, sb176, sb104, sb105 # 189
+xors 4, 3, sb174, sb102, sb103 # 190
+xors 4, 3, sb172, sb100, sb101 # 191
+xors 4, 3, sb170, sb98, sb99 # 192
+xors 4, 3, sb168, sb96, sb97 # 193
+xors 4, 3, sb166, sb94, sb95 # 194
+xors 4, 3, sb164, sb92, sb93 # 195
+xors 4, 3, sb162, sb90, sb91 # 196
+xors 4, 3, sb160, sb88, sb89 # 197
+xors 4, 3, sb158, sb86, sb87 # 198
+xors 4, 3, sb156, sb84, sb85 # 199
+xors 4, 3, sb154, sb82, sb83 # 200
+xors 4, 3, sb152, sb79, sb81 # 201
+xors 4, 3, sb150, sb75, sb77 # 202
+xors 4, 3, sb148, sb71, sb73 # 203
+xors 4, 3, sb146, sb68, sb69 # 204
+xors 4, 3, sb144, sb66, sb67 # 205
+xors 4, 3, sb142, sb64, sb65 # 206
+xors 4, 3, sb140, sb62, sb63 # 207
+xors 4, 3, sb138, sb54, sb60 # 208
+xors 4, 3, sb136, sb52, sb53 # 209
+xors 4, 3, sb134, sb50, sb51 # 210
+xors 4, 3, sb132, sb47, sb48 # 211
+xors 4, 3, sb130, sb45, sb46 # 212
+xors 4, 3, sb128, sb42, sb44 # 213
+xors 4, 3, sb5, sb35, sb37 # 214
+xors 4, 3, sb42, sb128, sb129 # 215
+xors 4, 3, sb87, sb130, sb131 # 216
+xors 4, 3, sb188, sb132, sb133 # 217
+xors 4, 3, sb89, sb134, sb135 # 218
+xors 4, 3, sb189, sb136, sb137 # 219
+xors 4, 3, sb91, sb138, sb139 # 220
+xors 4, 3, sb190, sb140, sb141 # 221
+xors 4, 3, sb93, sb142, sb143 # 222
+xors 4, 3, sb191, sb144, sb145 # 223
+xors 4, 3, sb95, sb146, sb147 # 224
+xors 4, 3, sb192, sb148, sb149 # 225
+xors 4, 3, sb97, sb150, sb151 # 226
+xors 4, 3, sb193, sb152, sb153 # 227
+xors 4, 3, sb99, sb154, sb155 # 228
+xors 4, 3, sb194, sb156, sb157 # 229
+xors 4, 3, sb101, sb158, sb159 # 230
+xors 4, 3, sb195, sb160, sb161 # 231
+xors 4, 3, sb103, sb162, sb163 # 232
+xors 4, 3, sb196, sb164, sb165 # 233
+xors 4, 3, sb105, sb166, sb167 # 234
+xors 4, 3, sb197, sb168, sb169 # 235
+xors 4, 3, sb107, sb170, sb171 # 236
+xors 4, 3, sb198, sb172, sb173 # 237
+xors 4, 3, sb109, sb174, sb175 # 238
+xors 4, 3, sb199, sb176, sb177 # 239
+xors 4, 3, sb111, sb178, sb179 # 240
+xors 4, 3, sb200, sb180, sb181 # 241
+xors 4, 3, sb113, sb182, sb183 # 242
+xors 4, 3, sb201, sb184, sb185 # 243
+ands 264, 3, sb68, sb34, sb36, 3, sb69, sb38, sb39, 3, sb67, sb40, sb41, 3, sb71, sb43, sb49, 3, sb66, sb55, sb56, 3, sb73, sb57, sb58, 3, sb65, sb59, sb61, 3, sb75, sb0, sb3, 3, sb64, sb7, sb8, 3, sb77, sb10, sb11, 3, sb63, sb14, sb16, 3, sb79, sb18, sb19, 3, sb62, sb21, sb22, 3, sb81, sb23, sb24, 3, sb86, sb26, sb28, 3, sb15, sb33, sb30, 3, sb82, sb70, sb31, 3, sb35, sb72, sb32, 3, sb83, sb74, sb124, 3, sb37, sb76, sb125, 3, sb84, sb78, sb126, 3, sb85, sb80, sb127, 3, sb29, sb128, sb129, 3, sb45, sb130, sb131, 3, sb88, sb132, sb133, 3, sb51, sb134, sb135, 3, sb90, sb136, sb137, 3, sb47, sb138, sb139, 3, sb92, sb140, sb141, 3, sb13, sb142, sb143, 3, sb94, sb144, sb145, 3, sb9, sb146, sb147, 3, sb96, sb148, sb149, 3, sb4, sb150, sb151, 3, sb98, sb152, sb153, 3, sb1, sb154, sb155, 3, sb100, sb156, sb157, 3, sb60, sb158, sb159, 3, sb102, sb160, sb161, 3, sb53, sb162, sb163, 3, sb104, sb164, sb165, 3, sb27, sb166, sb167, 3, sb106, sb168, sb169, 3, sb25, sb170, sb171, 3, sb108, sb172, sb173, 3, sb20, sb174, sb175, 3, sb110, sb176, sb177, 3, sb17, sb178, sb179, 3, sb112, sb180, sb181, 3, sb12, sb182, sb183, 3, sb114, sb184, sb185, 3, sb123, sb186, sb187, 3, sb115, sb87, sb188, 3, sb44, sb89, sb189, 3, sb116, sb91, sb190, 3, sb46, sb93, sb191, 3, sb117, sb95, sb192, 3, sb48, sb97, sb193, 3, sb118, sb99, sb194, 3, sb50, sb101, sb195, 3, sb119, sb103, sb196, 3, sb52, sb105, sb197, 3, sb120, sb107, sb198, 3, sb54, sb109, sb199, 3, sb121, sb111, sb200, 3, sb122, sb113, sb201 # 244
+ands 132, 3, sb34, sb33, sb69, 3, sb32, sb70, sb71, 3, sb36, sb72, sb73, 3, sb31, sb74, sb75, 3, sb38, sb76, sb77, 3, sb61, sb78, sb79, 3, sb41, sb80, sb81, 3, sb14, sb15, sb82, 3, sb39, sb35, sb83, 3, sb40, sb37, sb84, 3, sb43, sb85, sb86, 3, sb28, sb87, sb88, 3, sb49, sb89, sb90, 3, sb22, sb91, sb92, 3, sb10, sb93, sb94, 3, sb7, sb95, sb96, 3, sb3, sb97, sb98, 3, sb0, sb99, sb100, 3, sb55, sb101, sb102, 3, sb30, sb103, sb104, 3, sb26, sb105, sb106, 3, sb24, sb107, sb108, 3, sb18, sb109, sb110, 3, sb16, sb111, sb112, 3, sb11, sb113, sb114, 3, sb19, sb42, sb115, 3, sb56, sb44, sb116, 3, sb21, sb46, sb117, 3, sb57, sb48, sb118, 3, sb23, sb50, sb119, 3, sb58, sb52, sb120, 3, sb59, sb54, sb121, 3, sb8, sb122, sb123 # 245
+xors 4, 3, sb33, sb34, sb68 # 246
+xors 4, 3, sb34, sb32, sb67 # 247
+xors 4, 3, sb32, sb36, sb66 # 248
+xors 4, 3, sb36, sb31, sb65 # 249
+xors 4, 3, sb31, sb38, sb64 # 250
+xors 4, 3, sb38, sb61, sb63 # 251
+xors 4, 3, sb61, sb41, sb62 # 252
+xors 4, 3, sb41, sb43, sb61 # 253
+xors 4, 3, sb43, sb28, sb45 # 254
+xors 4, 3, sb28, sb49, sb51 # 255
+xors 4, 3, sb45, sb22, sb47 # 256
+xors 4, 3, sb22, sb10, sb13 # 257
+xors 4, 3, sb47, sb7, sb9 # 258
+xors 4, 3, sb9, sb3, sb4 # 259
+xors 4, 3, sb49, sb0, sb1 # 260
+xors 4, 3, sb7, sb55, sb60 # 261
+xors 4, 3, sb51, sb30, sb53 # 262
+xors 4, 3, sb1, sb26, sb27 # 263
+xors 4, 3, sb53, sb24, sb25 # 264
+xors 4, 3, sb13, sb18, sb20 # 265
+xors 4, 3, sb55, sb16, sb17 # 266
+xors 4, 3, sb10, sb11, sb12 # 267
+xors 4, 3, sb60, sb8, sb10 # 268
+ands 64, 3, sb16, sb15, sb34, 3, sb30, sb35, sb36, 3, sb18, sb37, sb38, 3, sb17, sb14, sb39, 3, sb12, sb40, sb41, 3, sb20, sb42, sb43, 3, sb11, sb44, sb45, 3, sb10, sb46, sb47, 3, sb24, sb48, sb49, 3, sb4, sb50, sb51, 3, sb0, sb52, sb53, 3, sb27, sb54, sb55, 3, sb3, sb19, sb56, 3, sb25, sb21, sb57, 3, sb26, sb23, sb58, 3, sb8, sb59, sb60 # 269
+xors 4, 3, sb15, sb16, sb33 # 270
+xors 4, 3, sb16, sb30, sb32 # 271
+xors 4, 3, sb30, sb18, sb31 # 272
+xors 4, 3, sb18, sb12, sb30 # 273
+xors 4, 3, sb12, sb20, sb29 # 274
+xors 4, 3, sb20, sb11, sb28 # 275
+xors 4, 3, sb11, sb10, sb22 # 276
+xors 4, 3, sb22, sb24, sb9 # 277
+xors 4, 3, sb10, sb4, sb7 # 278
+xors 4, 3, sb24, sb0, sb1 # 279
+xors 4, 3, sb9, sb27, sb13 # 280
+xors 4, 3, sb27, sb8, sb9 # 281
+ands 28, 3, sb13, sb14, sb16, 3, sb1, sb17, sb18, 3, sb7, sb19, sb20, 3, sb0, sb21, sb22, 3, sb9, sb23, sb24, 3, sb8, sb3, sb25, 3, sb4, sb26, sb27 # 282
+xors 4, 3, sb14, sb13, sb15 # 283
+xors 4, 3, sb13, sb1, sb14 # 284
+xors 4, 3, sb1, sb6, sb13 # 285
+xors 4, 3, sb6, sb7, sb12 # 286
+xors 4, 3, sb7, sb0, sb11 # 287
+xors 4, 3, sb0, sb9, sb10 # 288
+xors 4, 3, sb9, sb4, sb0 # 289
+ands 8, 3, sb4, sb3, sb7, 3, sb0, sb8, sb9 # 290
+xors 4, 3, sb3, sb4, sb6 # 291
+xors 4, 3, sb4, sb0, sb3 # 292
+vdabit 3, s30, sb3 # 293
+xors 4, 3, sb0, sb3, sb4 # 294
+vmulsi 3, s3, s30, 2 # 295
+vdabit 3, s12, sb4 # 296
+xors 4, 3, sb3, sb4, sb5 # 297
+reveal 12, 3, cb3, sb0, 3, cb2, sb1, 3, cb1, sb2, 3, cb0, sb3 # 298
+convcbitvec 3, ci0, cb3 # 299
+vconvint 3, c6, ci0 # 300
+vaddm 3, s6, s30, c6 # 301
+vconvint 3, c3, ci0 # 302
+vmulm 3, s30, s3, c3 # 303
+vsubs 3, s3, s6, s30 # 304
+vmovs 3, s6, s3 # 305
+convcbitvec 3, ci0, cb2 # 306
+vconvint 3, c0, ci0 # 307
+vaddm 3, s3, s27, c0 # 308
+vconvint 3, c6, ci0 # 309
+vmulm 3, s27, s21, c6 # 310
+vsubs 3, s21, s3, s27 # 311
+vmovs 3, s3, s21 # 312
+convcbitvec 3, ci0, cb1 # 313
+vconvint 3, c3, ci0 # 314
+vaddm 3, s21, s24, c3 # 315
+vconvint 3, c0, ci0 # 316
+vmulm 3, s24, s15, c0 # 317
+vsubs 3, s15, s21, s24 # 318
+vmovs 3, s21, s15 # 319
+vadds 3, s15, s3, s21 # 320
+vmulsi 3, s3, s15, 65536 # 321
+vsubs 3, s15, s18, s3 # 322
+convcbitvec 3, ci0, cb0 # 323
+vconvint 3, c6, ci0 # 324
+vaddm 3, s3, s12, c6 # 325
+vmulsi 3, s18, s12, 2 # 326
+vconvint 3, c3, ci0 # 327
+vmulm 3, s12, s18, c3 # 328
+vsubs 3, s18, s3, s12 # 329
+vmovs 3, s12, s18 # 330
+vadds 3, s3, s6, s12 # 331
+vldi 3, c0, 1 # 332
+vmulci 3, c6, c0, 2147483647 # 333
+vaddci 3, c3, c6, 1 # 334
+vmulm 3, s18, s3, c3 # 335
+vsubs 3, s6, s9, s18 # 336
+vbit 3, s9 # 337
+vldi 3, c3, 65536 # 338
+vmulci 3, c6, c3, 2147483647 # 339
+vaddci 3, c0, c6, 65536 # 340
+vmulm 3, s12, s9, c0 # 341
+vmulsi 3, s18, s6, 65536 # 342
+vadds 3, s3, s12, s18 # 343
+vadds 3, s12, s3, s15 # 344
+vadds 3, s3, s0, s12 # 345
+vmulsi 3, s0, s3, 65536 # 346
+vasm_open 3, 3, 0, c6, s0 # 347
+vshlci 3, c0, c6, 1 # 348
+vshrci 3, c3, c0, 33 # 349
+vshrci 3, c0, c6, 63 # 350
+vaddm 3, s3, s9, c0 # 351
+vmulsi 3, s0, s9, 2 # 352
+vmulm 3, s9, s0, c0 # 353
+vsubs 3, s0, s3, s9 # 354
+vsubmr 3, s3, c3, s6 # 355
+vldi 3, c0, 1 # 356
+vmulci 3, c3, c0, 2147483647 # 357
+vaddci 3, c0, c3, 1 # 358
+vmulm 3, s6, s0, c0 # 359
+vadds 3, s0, s3, s6 # 360
+vsubsi 3, s3, s0, 1073741824 # 361
+vmovs 3, s0, s3 # 362
+use 2, 0, 513 # 363
+use 0, 2, 3 # 364
+use 0, 4, 12 # 365
+use 0, 7, 3 # 366
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Compares the throughput of the memory-mapped bytecode reader used by
+# the analysis scripts with reading the bytecode sequentially.
+# Usage: Scripts/bytecode-benchmark.py <program> [<repetitions>]
+
+import sys, os, time
+
+sys.path.append('.')
+
+from Compiler.program import *
+from Compiler.instructions_base import ParsedInstruction
+from Compiler.bytecode import read_tape
+
+if len(sys.argv) <= 1:
+    print('Usage: %s <program> [<repetitions>]' % sys.argv[0])
+    exit(1)
+
+n_reps = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+def read_sequential(tapename):
+    with open('Programs/Bytecode/%s.bc' % tapename, 'rb') as tape:
+        while tape.peek():
+            yield ParsedInstruction(tape)
+
+def run(reader, tapenames):
+    n = 0
+    start = time.perf_counter()
+    for tapename in tapenames:
+        for inst in reader(tapename):
+            n += 1
+    return n, time.perf_counter() - start
+
+tapenames = list(Program.read_tapes(sys.argv[1]))
+n_bytes = sum(os.path.getsize('Programs/Bytecode/%s.bc' % tapename)
+              for tapename in tapenames)
+
+for tapename in tapenames:
+    for a, b in zip(read_sequential(tapename), read_tape(tapename)):
+        if str(a) != str(b):
+            print('Mismatch in %s: %s vs %s' % (tapename, a, b))
+            exit(1)
+
+print('%d tapes, %d bytes' % (len(tapenames), n_bytes))
+
+results = {}
+for name, reader in ('sequential', read_sequential), ('mmap', read_tape):
+    n, t = min(run(reader, tapenames) for i in range(n_reps))
+    results[name] = t
+    print('%-10s %10d instructions in %.3f s, %.0f instructions/s, %.1f MB/s'
+          % (name, n, t, n / t, n_bytes / t * 1e-6))
+
+print('Speedup: %.2f' % (results['sequential'] / results['mmap']))
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+# Benchmark the compiler on a set of programs in Programs/Source with
+# representative options. For every entry, the wall time, the peak
+# resident memory, the number of instructions, the number of rounds,
+# the requirements, and the hash of the output are recorded. The
+# results can be written to a JSON file and compared to an earlier
+# one to track regressions, for example:
+#
+# Scripts/compile-benchmark.py -o before.json
+# (change the compiler)
+# Scripts/compile-benchmark.py -b before.json
+#
+# Entries depending on files not in the repository are skipped if the
+# files are missing, so the benchmark runs offline. The numbers of
+# instructions and rounds and the requirements come from an additional
+# compilation with --metadata after the timed ones. This overwrites
+# the output of the programs in Programs/Bytecode and
+# Programs/Schedules.
+# Linux is needed for measuring the peak memory.
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.curdir)
+
+from Compiler.program import Program
+
+def module(name):
+    def check():
+        try:
+            __import__(name)
+        except ImportError:
+            return '%s not installed' % name
+    return check
+
+def path(name):
+    return lambda: None if os.path.exists(name) else '%s not found' % name
+
+# name, compile.py arguments, optional check returning reason to skip
+suite = [
+    ('tutorial', 'tutorial'),
+    ('tutorial-ring', '-R 64 tutorial'),
+    ('tutorial-binary', '-B 32 tutorial'),
+    ('tutorial-optimize-hard', '-O tutorial'),
+    ('bankers_bonus-edabit', '-Y -R 64 bankers_bonus 1'),
+    ('keras_mnist_dense', '-R 64 keras_mnist_dense'),
+    ('oram_tutorial', '-R 64 oram_tutorial'),
+    ('benchmark_net', '-R 64 benchmark_net A'),
+    ('bench-dt', '-R 64 bench-dt 100 10 3'),
+    ('aes-gf2n', 'aes'),
+    ('aes_circuit', '-B 32 aes_circuit',
+     path('Programs/Circuits/aes_128.txt')),
+    ('torch_mnist_lenet', '-R 64 torch_mnist_lenet',
+     lambda: module('torchvision')() or path('/tmp/MNIST')()),
+]
+
+parser = argparse.ArgumentParser(
+    description='Benchmark the compilation of example programs')
+parser.add_argument('names', nargs='*',
+                    help='entries to run (default: all), see --list')
+parser.add_argument('-l', '--list', action='store_true',
+                    help='list the entries and exit')
+parser.add_argument('-o', '--output', metavar='FILE',
+                    help='write the results to the given file as JSON')
+parser.add_argument('-b', '--baseline', metavar='FILE',
+                    help='compare to results written with --output')
+parser.add_argument('-r', '--repeat', type=int, default=1,
+                    help='compilations per entry, the minimum is reported '
+                    '(default: 1)')
+parser.add_argument('-t', '--threshold', type=float, default=None,
+                    help='exit with an error if the time or the memory '
+                    'of an entry increases by more than the given '
+                    'percentage compared to the baseline')
+parser.add_argument('--phases', action='store_true',
+                    help='record the time of the compilation phases '
+                    '(see compile.py --profile-phases)')
+parser.add_argument('--compile-option', action='append', default=[],
+                    metavar='OPTION', dest='compile_options',
+                    help='add an option for all compilations, e.g., '
+                    '--compile-option=--compile-jobs=4')
+args = parser.parse_args()
+
+if args.list:
+    for entry in suite:
+        print('%-25s %s' % entry[:2])
+    exit(0)
+
+unknown = set(args.names) - set(entry[0] for entry in suite)
+if unknown:
+    parser.error('unknown entries: %s' % ', '.join(sorted(unknown)))
+
+def compile(arguments):
+    """ Run compile.py and return the output, the wall time in
+    seconds, and the peak resident memory in bytes. """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, 'compile.py'] + arguments,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    output = process.stdout.read()
+    _, status, usage = os.wait4(process.pid, 0)
+    duration = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, arguments,
+                                            output)
+    # kilobytes on Linux
+    return output, duration, usage.ru_maxrss * 1024
+
+def run(name, spec):
+    arguments = args.compile_options + spec.split()
+    timed = arguments
+    if args.phases:
+        fd, profile = tempfile.mkstemp(prefix='compile-benchmark-',
+                                       suffix='.json')
+        os.close(fd)
+        timed = ['--profile-phases=' + profile] + arguments
+    times = []
+    memory = []
+    try:
+        for i in range(args.repeat):
+            _, duration, peak = compile(timed)
+            if args.phases:
+                with open(profile) as f:
+                    report = json.load(f)
+                # the profiler resets the peak of the process
+                peak = report['peak_memory']
+                phases = dict((x['phase'], x['time'])
+                              for x in report['phases'])
+            times.append(duration)
+            memory.append(peak)
+    finally:
+        if args.phases:
+            os.unlink(profile)
+    # not timed because writing the metadata takes extra time
+    output, _, _ = compile(['--metadata'] + arguments)
+    schedule = re.search('Writing to Programs/Schedules/(.*)\\.sch',
+                         output).group(1)
+    metadata = Program.read_metadata(schedule)
+    res = dict(name=name, arguments=spec, time=min(times), times=times,
+               peak_memory=min(memory), hash=metadata['hash'],
+               instructions=sum(tape['size'] for tape in metadata['tapes']),
+               tapes=len(metadata['tapes']), rounds=None,
+               req_num=Program.encode_req_num(metadata['req_num']))
+    rounds = metadata['req_num'].get(('all', 'round'))
+    if rounds is not None and rounds != float('inf'):
+        res['rounds'] = rounds
+    if args.phases:
+        res['phases'] = phases
+    return res
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+results = []
+for entry in suite:
+    name, spec = entry[:2]
+    if args.names and name not in args.names:
+        continue
+    reason = entry[2]() if len(entry) > 2 else None
+    if reason:
+        print('%-25s skipped (%s)' % (name, reason))
+        results.append(dict(name=name, arguments=spec, skipped=reason))
+        continue
+    try:
+        res = run(name, spec)
+    except subprocess.CalledProcessError as e:
+        lines = e.output.strip().splitlines() or ['']
+        print('%-25s failed: %s' % (name, lines[-1]))
+        results.append(dict(name=name, arguments=spec, error=lines[-1]))
+        continue
+    print('%-25s %8.2f s %8.1f MB %10d instructions %10s rounds' %
+          (name, res['time'], res['peak_memory'] / 2 ** 20,
+           res['instructions'], res['rounds']))
+    results.append(res)
+
+if args.output:
+    print('Writing results to', args.output)
+    with open(args.output, 'w') as f:
+        json.dump(dict(
+            revision=git_revision(), date=time.strftime('%Y-%m-%d %H:%M:%S'),
+            python=platform.python_version(), machine=platform.machine(),
+            processor=platform.processor(), cpus=os.cpu_count(),
+            options=args.compile_options, repeat=args.repeat,
+            results=results), f, indent=1)
+
+if args.baseline:
+    with open(args.baseline) as f:
+        baseline = dict((x['name'], x) for x in json.load(f)['results'])
+    regressions = []
+
+    def change(old, new):
+        return (new - old) / old * 100 if old else 0
+
+    print()
+    print('%-25s %18s %18s  %s' % ('Entry', 'time', 'memory', 'output'))
+    for res in results:
+        old = baseline.get(res['name'])
+        if 'time' not in res or not old or 'time' not in old:
+            continue
+        changes = [change(old[x], res[x]) for x in ('time', 'peak_memory')]
+        notes = [x for x in ('instructions', 'rounds', 'req_num', 'hash')
+                 if old[x] != res[x]]
+        print('%-25s %8.2f s %+6.1f%% %8.1f MB %+6.1f%%  %s' %
+              (res['name'], res['time'], changes[0],
+               res['peak_memory'] / 2 ** 20, changes[1],
+               ', '.join('%s changed' % x for x in notes) or 'same'))
+        if args.threshold is not None and max(changes) > args.threshold:
+            regressions.append(res['name'])
+    if regressions:
+        print('Regressions above %s%%: %s' %
+              (args.threshold, ', '.join(regressions)))
+        exit(1)
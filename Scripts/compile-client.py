@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Drop-in replacement for compile.py using the server started by
+# Scripts/compile-server.py. Falls back to running compile.py if no
+# server is running. This deliberately doesn't import the compiler.
+
+import array
+import json
+import os
+import socket
+import sys
+import zlib
+
+root = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+
+# has to match Compiler.server.default_socket()
+path = os.environ.get('COMPILE_SERVER_SOCKET') or os.path.join(
+    os.environ.get('TMPDIR', '/tmp'), 'mp-spdz-compile-%d-%08x.sock' %
+    (os.getuid(), zlib.crc32(root.encode())))
+
+def compile_directly():
+    compile_py = os.path.join(root, 'compile.py')
+    sys.stdout.flush()
+    os.execv(sys.executable, [sys.executable, compile_py] + sys.argv[1:])
+
+request = json.dumps(dict(args=sys.argv, cwd=os.getcwd(),
+                          env=dict(os.environ))).encode() + b'\n'
+
+try:
+    server = socket.socket(socket.AF_UNIX)
+    server.connect(path)
+    sys.stdout.flush()
+    sent = server.sendmsg([request], [(socket.SOL_SOCKET, socket.SCM_RIGHTS,
+                                       array.array('i', [0, 1, 2]))])
+except (AttributeError, OSError):
+    print('No compile server running on %s, compiling directly' % path,
+          file=sys.stderr)
+    compile_directly()
+
+server.sendall(request[sent:])
+status = b''
+while not status.endswith(b'\n'):
+    chunk = server.recv(16)
+    if not chunk:
+        print('Compile server failed', file=sys.stderr)
+        exit(1)
+    status += chunk
+exit(int(status))
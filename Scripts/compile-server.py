@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+# Keep the compiler loaded to speed up compiling many small programs
+# or variants of a program. Use Scripts/compile-client.py instead of
+# compile.py to compile with the server.
+
+import argparse
+import os
+import sys
+
+# same module search path as compile.py
+sys.path[0] = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+
+from Compiler.server import CompileServer, default_socket
+
+parser = argparse.ArgumentParser(
+    description='Compile programs requested by Scripts/compile-client.py')
+parser.add_argument('--socket', default=default_socket(),
+                    help='socket path (default: %(default)s)')
+parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                    help='maximal number of concurrent compilations '
+                    '(default: %(default)s)')
+parser.add_argument('--preload', default=','.join(CompileServer.preload),
+                    help='comma-separated modules to load in advance '
+                    '(default: %(default)s)')
+parser.add_argument('--cache-dir',
+                    help='compilation cache for requests not specifying '
+                    'one, which shares optimized tapes between requests')
+args = parser.parse_args()
+
+CompileServer(args.socket, args.jobs,
+              [x for x in args.preload.split(',') if x],
+              args.cache_dir).serve()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# Measure how long compile.py takes for a tiny program, which is
+# dominated by starting Python and importing the compiler. The
+# interpreter start and the import are measured separately to show
+# what is left for the compilation itself. Run from the main directory.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+parser = argparse.ArgumentParser(
+    description='Measure the startup time of the compiler')
+parser.add_argument('-n', type=int, default=20,
+                    help='number of repetitions (default: 20)')
+parser.add_argument('--source', default='print_ln("%s", 1)',
+                    help='program to compile (default: a single print)')
+parser.add_argument('--imports', type=int, default=0, metavar='N',
+                    help='list the N modules taking longest to import')
+parser.add_argument('options', nargs=argparse.REMAINDER,
+                    help='options for compile.py (after --)')
+args = parser.parse_args()
+
+options = [x for x in args.options if x != '--']
+name = 'compile-startup'
+directory = tempfile.mkdtemp()
+source = os.path.join(directory, name + '.mpc')
+with open(source, 'w') as f:
+    print(args.source, file=f)
+
+def measure(command):
+    res = []
+    for i in range(args.n):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        res.append(time.perf_counter() - start)
+    return res
+
+try:
+    results = [
+        ('Interpreter', measure([sys.executable, '-c', 'pass'])),
+        ('Import', measure([sys.executable, '-c',
+                            'import Compiler.compilerLib'])),
+        ('Compilation', measure([sys.executable, 'compile.py'] + options +
+                                [source])),
+    ]
+finally:
+    os.unlink(source)
+    os.rmdir(directory)
+    for filename in ('Programs/Schedules/%s.sch' % name,
+                     'Programs/Bytecode/%s-0.bc' % name):
+        if os.path.exists(filename):
+            os.unlink(filename)
+
+print('%-12s %8s %8s %8s' % ('', 'min', 'median', 'max'))
+for label, times in results:
+    print('%-12s %7.1fms %7.1fms %7.1fms' %
+          (label, min(times) * 1e3, statistics.median(times) * 1e3,
+           max(times) * 1e3))
+
+if args.imports:
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                          'import Compiler.compilerLib'],
+                         check=True, stderr=subprocess.PIPE, text=True).stderr
+    modules = []
+    for line in out.splitlines()[1:]:
+        self_time, total, module = line.split(':', 1)[1].split('|')
+        modules.append((int(self_time), int(total), module.strip()))
+    print()
+    print('%-30s %8s %8s' % ('Module', 'self', 'total'))
+    for self_time, total, module in sorted(modules,
+                                           reverse=True)[:args.imports]:
+        print('%-30s %6.1fms %6.1fms' % (module, self_time / 1e3,
+                                         total / 1e3))
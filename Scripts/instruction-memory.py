@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Measure the memory used by the compiler per instruction and register
+# for typical arithmetic code. Compare the output between versions of
+# the compiler to see the effect of changes in the representation.
+
+import argparse
+import gc
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.append(os.curdir)
+
+from Compiler.program import Program, defaults
+
+parser = argparse.ArgumentParser(
+    description='Measure the compile-time memory usage per instruction')
+parser.add_argument('-n', type=int, default=2000,
+                    help='number of repetitions (default: 2000)')
+parser.add_argument('--debug', action='store_true',
+                    help='keep call stacks (like compile.py --debug)')
+parser.add_argument('--ring', type=int, default=64,
+                    help='ring size (default: 64)')
+args = parser.parse_args()
+
+opts = defaults()
+opts.ring = args.ring
+opts.debug = args.debug
+
+prog = Program(['instruction-memory'], opts, name='instruction-memory')
+
+from Compiler.instructions_base import Instruction
+from Compiler.types import sint, cint, regint, sfix
+
+def body(i):
+    a = sint(i)
+    b = a * a + a
+    c = b.reveal() * cint(i)
+    d = regint(i) + i
+    e = sfix(i) * sfix(i + 1)
+    return b, c, d, e
+
+gc.collect()
+tracemalloc.start()
+start_memory = tracemalloc.get_traced_memory()[0]
+start_instructions = Instruction.count
+start_registers = sum(prog.curr_tape.reg_counter.values())
+start = time.time()
+res = [body(i) for i in range(args.n)]
+duration = time.time() - start
+gc.collect()
+memory = tracemalloc.get_traced_memory()[0] - start_memory
+n_instructions = Instruction.count - start_instructions
+n_registers = sum(prog.curr_tape.reg_counter.values()) - start_registers
+tracemalloc.stop()
+
+print('Instructions: %d' % n_instructions)
+print('Registers: %d' % n_registers)
+print('Memory: %.1f MB' % (memory / 2 ** 20))
+print('Bytes per instruction (including registers): %.1f' %
+      (memory / n_instructions))
+print('Time per instruction (while tracing): %.2f us' %
+      (duration / n_instructions * 1e6))
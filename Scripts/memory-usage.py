@@ -1,73 +1,182 @@
 #!/usr/bin/env python3
 
-import sys, os
+# Estimates the RAM per party needed to run a compiled program.
+# Usage: Scripts/memory-usage.py <program-with-args> [<protocol>|<shares>]
+#
+# The estimate covers the memory of the virtual machine and the
+# registers of all threads. The sizes are taken from the metadata
+# written by compile.py --metadata if available and from the bytecode
+# otherwise. Registers are counted per element, so vectors count with
+# their width. A tape called from another one keeps the registers of
+# the caller, and every thread keeps the registers of the largest tape
+# it runs.
+#
+# The size of a secret value depends on the protocol, which can be
+# given by its name as for compile.py -E (e.g., semi2k or mascot) or
+# as the number of elements stored per party (e.g., 2 for replicated
+# secret sharing or shares with MACs). Without either, the output is a
+# range for one to three elements. Clear values take the size of the
+# computation domain, integers and clear bits 8 bytes, and elements of
+# GF(2^n) 16 bytes. A protocol not supporting the computation domain
+# of the program, as found in the compilation command in the schedule,
+# leads to an error.
+#
+# The output contains the RAM in MB (10^6 bytes) while only the main
+# thread runs and the peak with all threads running the largest of
+# their tapes. The register numbers from the metadata are exact while
+# those from the bytecode are an approximation, see doc/utils.rst.
+
+import sys
 import collections
+import contextlib
+import io
 
 sys.path.append('.')
 
 from Compiler.program import *
 from Compiler.instructions_base import *
+from Compiler.instructions import run_tape, call_tape
+# only imported for registering the instructions and the argument
+# formats of binary registers, which are needed to read the bytecode
+import Compiler.GC.instructions
+from Compiler import estimate
+from Compiler.compilerLib import Compiler
 
 if len(sys.argv) <= 1:
-    print('Usage: %s <program>' % sys.argv[0])
-
-res = collections.defaultdict(lambda: 0)
-regs = collections.defaultdict(lambda: 0)
-thread_regs = collections.defaultdict(lambda: 0)
-
-def process(tapename, res, regs):
+    print('Usage: %s <program> [<protocol>|<shares>]' % sys.argv[0])
+    exit(1)
+
+def scan(tapename, memory):
+    """ Register usage and tapes run from the bytecode of a tape. """
+    regs = collections.defaultdict(lambda: 0)
+    threads = set()
+    calls = set()
     for inst in Tape.read_instructions(tapename):
         t = inst.type
+        # size 0 in the bytecode means no vector
+        size = inst.size or 1
         if issubclass(t, DirectMemoryInstruction):
-            res[type(inst.args[0])] = max(inst.args[1].i + inst.size,
-                                       res[type(inst.args[0])]) + 1
+            mem_type = inst.args[0].reg_type
+            memory[mem_type] = max(inst.args[1].i + size, memory[mem_type])
+        elif t is run_tape:
+            threads.update(arg.i for arg in inst.args[1::3])
+        elif t is call_tape:
+            calls.add(inst.args[0].i)
         for arg in inst.args:
-            if isinstance(arg, RegisterArgFormat):
-                regs[type(arg)] = max(regs[type(arg)], arg.i + inst.size)
-
-tapes = Program.read_tapes(sys.argv[1])
+            if isinstance(arg, RegisterArgFormat) and arg.reg_type != '*':
+                regs[arg.reg_type] = max(regs[arg.reg_type], arg.i + size)
+    return dict(registers=regs, threads=sorted(threads), calls=sorted(calls))
+
+metadata = Program.read_metadata(sys.argv[1])
+if metadata:
+    tapes = metadata['tapes']
+    memory = metadata['allocated_mem']
+else:
+    memory = collections.defaultdict(lambda: 0)
+    tapes = [scan(tapename, memory)
+             for tapename in Program.read_tapes(sys.argv[1])]
 n_threads = Program.read_n_threads(sys.argv[1])
 domain_size = Program.read_domain_size(sys.argv[1]) or 8
 
-process(next(tapes), res, regs)
-
-for tapename in tapes:
-    process(tapename, res, thread_regs)
-
-reverse_formats = dict((v, k) for k, v in ArgFormats.items())
-
-regout = lambda regs: dict((reverse_formats[t], n) for t, n in regs.items())
+def stack(i, running=()):
+    """ Registers of a tape including the tapes it calls. """
+    res = collections.defaultdict(lambda: 0, tapes[i]['registers'])
+    for j in tapes[i]['calls']:
+        if j not in running:
+            for t, n in stack(j, running + (i,)).items():
+                res[t] = max(res[t], tapes[i]['registers'].get(t, 0) + n)
+    return res
+
+def combine(usages):
+    res = collections.defaultdict(lambda: 0)
+    for usage in usages:
+        for t, n in usage.items():
+            res[t] = max(res[t], n)
+    return res
+
+main_regs = stack(0)
+thread_tapes = set(j for tape in tapes for j in tape['threads'])
+thread_regs = combine(stack(j) for j in thread_tapes)
 
 def output(data):
-    for t, n in data.items():
+    for t, n in sorted(data.items(), key=lambda x: -x[1]):
         if n:
             try:
-                print('%10d %s' % (n, ArgFormats[t.removesuffix('w')].name))
-            except:
+                print('%10d %s' % (n, ArgFormats[t].name))
+            except KeyError:
                 pass
 
-total = 0
-for x in res, regs:
-    total += sum(x.values())
-
-thread_total = sum(thread_regs.values())
-
 print ('Memory:')
-output(regout(res))
+output(memory)
 
 print ('Registers in main thread:')
-output(regout(regs))
+output(main_regs)
 
 if thread_regs:
     print ('Registers in other threads:')
-    output(regout(thread_regs))
+    output(thread_regs)
+
+def compile_options():
+    """ Options of the compilation parsed from the command line stored
+    in the schedule or None if they cannot be parsed. """
+    args = Program.read_schedule(sys.argv[1])[5].split()
+    # compile-run.py takes the protocol as argument
+    compiler = Compiler(args, split_args=True, execute=bool(args) and
+                        args[0].endswith('compile-run.py'))
+    try:
+        # the parser outputs errors before exiting
+        with contextlib.redirect_stderr(io.StringIO()):
+            compiler.parse_args()
+    except (SystemExit, CompilerError):
+        return None
+    return compiler.options
 
 if len(sys.argv) > 2:
-    min = max = int(sys.argv[2]) * domain_size
+    try:
+        models = [(sys.argv[2] + ' shares', int(sys.argv[2]), 0)]
+    except ValueError:
+        try:
+            protocol = estimate.get_protocol(sys.argv[2])
+            options = compile_options()
+            if options:
+                estimate.check_domain(sys.argv[2], options)
+            else:
+                print('Cannot determine the computation domain from '
+                      'the schedule, not checking the protocol')
+        except CompilerError as e:
+            print(e)
+            exit(1)
+        models = [(sys.argv[2], protocol.shares, protocol.extra)]
 else:
-    min = 1 * domain_size
-    max = 3 * domain_size
-
-print ('The program requires at least an estimated %f-%f GB of RAM per party.'
-       % (min * (total + thread_total) * 1e-9,
-          max * ((total + (n_threads - 1) * thread_total) * 1e-9)))
+    models = [('1 share', 1, 0), ('3 shares', 3, 0)]
+
+def element_sizes(shares, extra):
+    secret = (domain_size * 8 + extra + 63) // 64 * 8
+    return {'s': shares * secret, 'c': domain_size,
+            'sg': shares * 16, 'cg': 16,
+            'sb': shares * 8, 'cb': 8, 'ci': 8}
+
+def size(usage, sizes):
+    return sum(n * sizes.get(t, 8) for t, n in usage.items())
+
+results = []
+for name, shares, extra in models:
+    sizes = element_sizes(shares, extra)
+    mem = size(memory, sizes)
+    main = size(main_regs, sizes)
+    thread = size(thread_regs, sizes)
+    results.append(dict(
+        name=name, memory=mem, main=main, thread=thread,
+        steady=mem + main, peak=mem + main + (n_threads - 1) * thread))
+
+def mb(key):
+    return '-'.join('%.2f' % (x[key] * 1e-6) for x in results)
+
+print('Estimated RAM per party in MB for %s:' %
+      ' to '.join(x['name'] for x in results))
+print('%25s %s' % ('memory', mb('memory')))
+print('%25s %s' % ('registers in main thread', mb('main')))
+if thread_regs:
+    print('%25s %s' % ('registers per thread', mb('thread')))
+print('%25s %s' % ('main thread only', mb('steady')))
+print('%25s %s (%d threads)' % ('peak', mb('peak'), n_threads))
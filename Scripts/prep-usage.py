@@ -1,23 +1,148 @@
 #!/usr/bin/env python3
 
-import sys, os
-import collections
+# Plans the preprocessing of a compiled program. The plan lists the
+# requirements of the main thread and, in order of execution, of every
+# start of tapes in threads, so that preprocessing can be generated
+# ahead of each start while the online phase runs. Runs in loops are
+# multiplied by the number of iterations, and --loop-bound sets the
+# number assumed for loops with a number of iterations only known at
+# run time or the depth of recursion. Both branches of run-time
+# conditions are included.
+#
+# This needs the metadata written by compile.py --metadata. Otherwise,
+# only the total requirements as stored in the bytecode are output.
+
+import argparse
+import json
+import sys
+from functools import reduce
 
 sys.path.append('.')
 
 from Compiler.program import *
 from Compiler.instructions_base import *
 
-if len(sys.argv) <= 1:
-    print('Usage: %s <program>' % sys.argv[0])
+parser = argparse.ArgumentParser(
+    description='Plan the preprocessing of a compiled program')
+parser.add_argument('program', help='program with arguments')
+parser.add_argument('--loop-bound', type=int, default=None,
+                    help='number of iterations assumed for loops with '
+                    'unknown number of iterations')
+parser.add_argument('--json', metavar='FILE',
+                    help='write the plan to the given file as JSON')
+args = parser.parse_args()
+
+metadata = Program.read_metadata(args.program)
+
+if metadata is None or None in (x.get('req_tree') for x in metadata['tapes']):
+    print('No metadata found, compile with --metadata for a plan',
+          file=sys.stderr)
+    tapename = next(Program.read_tapes(args.program))
+    res = Tape.ReqNum()
+    for inst in Tape.read_instructions(tapename):
+        res.update(inst.get_usage())
+    for x in res.pretty():
+        print(x)
+    exit(0)
+
+tapes = metadata['tapes']
+unknown = float('inf') if args.loop_bound is None else args.loop_bound
+
+def mul(n, req_num):
+    # avoid 0 * inf
+    return Tape.ReqNum((k, n * v) for k, v in req_num.items() if v)
+
+evaluated = {}
+running = set()
+recursive = set()
+
+def evaluate(tape, node=0, runs=True):
+    """ Requirements of a node in the tree of a tape. """
+    key = tape, node, runs
+    if key in evaluated:
+        return evaluated[key]
+    if key in running:
+        recursive.add(key)
+        return Tape.ReqNum()
+    running.add(key)
+    data = tapes[tape]['req_tree'][node]
+    res = Program.decode_req_num(data['req'])
+    for child in data['children']:
+        if 'run' in child:
+            if runs:
+                for t in child['run']:
+                    res += evaluate(t)
+        elif 'max' in child:
+            branches = [evaluate(tape, i, runs) for i in child['max']]
+            res += reduce(lambda x, y: x.max(y), branches)
+        else:
+            n = child.get('loop', 1)
+            res += mul(unknown if n is None else n,
+                       evaluate(tape, child['node'], runs))
+    running.remove(key)
+    if key in recursive:
+        # unknown depth as in the compiler
+        res = mul(unknown, res)
+    evaluated[key] = res
+    return res
+
+def launches(tape, node=0, n=1, running=()):
+    """ Starts of tapes in threads in order of execution with the
+    number of repetitions. """
+    if node in running:
+        return
+    data = tapes[tape]['req_tree'][node]
+    for child in data['children']:
+        if 'run' in child:
+            yield child['run'], n
+        elif 'max' in child:
+            for i in child['max']:
+                yield from launches(tape, i, n, running + (node,))
+        else:
+            m = child.get('loop', 1)
+            yield from launches(tape, child['node'],
+                                n * (unknown if m is None else m),
+                                running + (node,))
+
+def output(req_num, indent='  '):
+    lines = req_num.pretty() or ['nothing']
+    for x in lines:
+        print(indent + x.strip())
+
+def number(n):
+    return 'an unknown number of' if n == float('inf') else '%d' % n
+
+plan = []
+
+main = evaluate(0, runs=False)
+print('Main thread (%s):' % tapes[0]['name'])
+output(main)
+plan.append(dict(phase='main', tape=tapes[0]['name'], runs=1,
+                 req_num=Program.encode_req_num(main)))
 
-res = collections.defaultdict(lambda: 0)
-m = 0
+for i, (run, n) in enumerate(launches(0)):
+    per_run = Tape.ReqNum()
+    for t in run:
+        per_run += evaluate(t)
+    print('Phase %d: %s in %d thread(s) started %s time(s), per start:' %
+          (i + 1, ', '.join(sorted(set(tapes[t]['name'] for t in run))),
+           len(run), number(n)))
+    output(per_run)
+    for t in sorted(set(run)):
+        print('  per thread running %s:' % tapes[t]['name'])
+        output(evaluate(t), '    ')
+    plan.append(dict(
+        phase=i + 1, tapes=[tapes[t]['name'] for t in run],
+        runs=None if n == float('inf') else n,
+        req_num=Program.encode_req_num(per_run),
+        total=Program.encode_req_num(mul(n, per_run))))
 
-tapename = next(Program.read_tapes(sys.argv[1]))
-res = Tape.ReqNum()
-for inst in Tape.read_instructions(tapename):
-    res.update(inst.get_usage())
+total = evaluate(0)
+print('Total:')
+output(total)
 
-for x in res.pretty():
-    print(x)
+if args.json:
+    print('Writing plan to', args.json)
+    with open(args.json, 'w') as f:
+        json.dump(dict(program=metadata['program'], phases=plan,
+                       total=Program.encode_req_num(total)), f, indent=1)
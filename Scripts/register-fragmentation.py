@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Compare the number of registers per tape between the default
+# register allocation and --interval-allocation. The live column is
+# the maximal number of registers in use at the same time, which is a
+# lower bound for both. Run from the main directory with the arguments
+# for compile.py, for example:
+#
+# Scripts/register-fragmentation.py -R 64 tutorial
+
+import collections
+import subprocess
+import sys
+
+prefix = 'Register fragmentation in '
+
+def compile(*options):
+    res = collections.OrderedDict()
+    out = subprocess.run(
+        [sys.executable, 'compile.py', '--register-report'] +
+        list(options) + sys.argv[1:], stdout=subprocess.PIPE, text=True)
+    if out.returncode:
+        sys.stdout.write(out.stdout)
+        sys.exit(out.returncode)
+    for line in out.stdout.splitlines():
+        if line.startswith(prefix):
+            tape, info = line[len(prefix):].split(': ', 1)
+            reg_type, allocated, _, live = info.split(' ')[:4]
+            res[tape, reg_type] = int(allocated), int(live)
+    return res
+
+if len(sys.argv) < 2:
+    print('usage: %s <compile.py arguments>' % sys.argv[0], file=sys.stderr)
+    sys.exit(1)
+
+before = compile()
+after = compile('--interval-allocation')
+
+print('%-30s %4s %12s %12s %12s %7s' %
+      ('Tape', 'type', 'default', 'interval', 'live', 'saved'))
+totals = collections.defaultdict(lambda: [0, 0])
+for key in before:
+    tape, reg_type = key
+    old, live = before[key]
+    new = after.get(key, (0, 0))[0]
+    totals[reg_type][0] += old
+    totals[reg_type][1] += new
+    print('%-30s %4s %12d %12d %12d %6.1f%%' %
+          (tape, reg_type, old, new, live, 100 * (old - new) / old))
+print()
+for reg_type, (old, new) in sorted(totals.items()):
+    print('%-30s %4s %12d %12d %12s %6.1f%%' %
+          ('Total', reg_type, old, new, '', 100 * (old - new) / old))
@@ -0,0 +1,62 @@
+#!/bin/bash
+
+# Compiles a program twice with the compilation cache and checks that
+# the second compilation is a hit with the same output. Changing an
+# option that affects the output has to cause a miss.
+
+dir=$(mktemp -d)
+trap "rm -rf $dir" EXIT
+prog=tutorial
+
+function compile
+{
+    ./compile.py --cache-dir=$dir/cache $* $prog > $dir/out || exit 1
+    status=$(grep -o 'Compilation cache: .*' $dir/out)
+    hash=$(grep -o 'Hash: .*' $dir/out)
+}
+
+function check
+{
+    if test "$status" != "Compilation cache: $1"; then
+	echo "$status instead of $1 with '$2'"
+	exit 1
+    fi
+}
+
+compile
+check miss
+first=$hash
+sed -n 's/^Writing to //p' $dir/out > $dir/files
+mkdir $dir/first
+i=0
+while read file; do
+    cp "$file" $dir/first/$i && rm "$file" || exit 1
+    i=$[i+1]
+done < $dir/files
+
+# files have to be restored
+compile
+check hit
+if test "$hash" != "$first"; then
+    echo "$hash instead of $first"
+    exit 1
+fi
+i=0
+while read file; do
+    cmp $dir/first/$i "$file" || exit 1
+    i=$[i+1]
+done < $dir/files
+
+# no effect on output
+compile --compile-jobs=2
+check hit --compile-jobs=2
+
+# the estimate on a hit has to match the one without cache
+compile --estimate=mascot --estimate-file=$dir/hit.json
+check hit --estimate
+./compile.py --estimate=mascot --estimate-file=$dir/miss.json $prog \
+	     > /dev/null || exit 1
+cmp $dir/hit.json $dir/miss.json || exit 1
+
+compile -D
+check miss -D
@@ -0,0 +1,68 @@
+#!/bin/bash
+
+# Checks that the options for parallel and memory-saving compilation
+# do not change the output. The options changing the register
+# allocation and the order of instructions have to keep the
+# requirements and the instructions apart from register numbers and
+# order, and the result is run with the emulator.
+
+dir=$(mktemp -d)
+trap "rm -rf $dir" EXIT
+
+function compile
+{
+    # options and program with arguments
+    ./compile.py $* > $dir/out || exit 1
+    hash=$(grep -o 'Hash: .*' $dir/out)
+}
+
+function same
+{
+    # reference options, options, program with arguments
+    compile $1 ${@: -1}
+    reference=$hash
+    for opts in "${@:2:$#-2}"; do
+	compile $opts ${@: -1}
+	if test "$hash" != "$reference"; then
+	    echo "${@: -1}: different output with '$opts' and '$1'"
+	    exit 1
+	fi
+    done
+}
+
+for prog in tutorial "-R 64 oram_tutorial" test_large_block; do
+    same "" --compile-jobs=4 --compact-graph --stream-bytecode \
+	"--compact-graph --compile-jobs=4" \
+	"--stream-bytecode --compile-jobs=4" "$prog"
+    same -D "-D --compile-jobs=4" \
+	"-D --compact-graph --stream-bytecode --compile-jobs=4" "$prog"
+done
+
+prog=test_register_pressure
+
+function output
+{
+    compile -R 64 $1 $prog
+    sed -n '/requires at most/,$p' $dir/out > $dir/$2.req
+    Scripts/decompile.py $prog || exit 1
+    cp Programs/Bytecode/$prog-0.asm $dir/$2.asm
+    sed 's/ .*//' $dir/$2.asm > $dir/$2.seq
+    sort $dir/$2.seq > $dir/$2.set
+}
+
+output "" default
+
+for opt in --interval-allocation --pressure-scheduling; do
+    output $opt new
+    if cmp -s $dir/default.asm $dir/new.asm; then
+	echo "$opt has no effect on $prog"
+	exit 1
+    fi
+    for x in req set; do
+	cmp $dir/default.$x $dir/new.$x || exit 1
+    done
+    if test $opt = --interval-allocation; then
+	cmp $dir/default.seq $dir/new.seq || exit 1
+    fi
+    ./emulate.x $prog || exit 1
+done
@@ -0,0 +1,56 @@
+#!/bin/bash
+
+# Compiles the test programs of the optimizations on clear values
+# with and without the respective option and checks the number of
+# certain instructions in the main tape or its last loop before
+# running them.
+
+function compile
+{
+    ./compile.py $2 $1 > /dev/null || exit 1
+    Scripts/decompile.py $1 || exit 1
+}
+
+function check
+{
+    # program, option, instruction, expected number
+    compile $1 "$2"
+    n=$(grep -c "^$3 " Programs/Bytecode/$1-0.asm)
+    if test $n != $4; then
+	echo "$1 with '$2': $n instead of $4 $3"
+	exit 1
+    fi
+}
+
+function check_loop
+{
+    # program, option, pattern, expected number in the last loop
+    compile $1 "$2"
+    asm=Programs/Bytecode/$1-0.asm
+    n=$(awk -v pattern="^$3" '
+	NR == FNR { if (/^jmpnz/) { end = $NF; start = end + 1 + $3 }; next }
+	$NF >= start && $NF <= end && $0 ~ pattern { n++ }
+	END { print n + 0 }' $asm $asm)
+    if test $n != $4; then
+	echo "$1 with '$2': $n instead of $4 '$3' in loop"
+	exit 1
+    fi
+}
+
+check test_cse "" convint 2
+check test_cse --cse convint 1
+check test_cse --cse gconvint 1
+Scripts/rep-field.sh test_cse || exit 1
+
+check test_constant_propagation "" gtc 1
+check test_constant_propagation --constant-propagation gtc 0
+check test_constant_propagation --constant-propagation divint 1
+check test_constant_propagation --constant-propagation gconvint 1
+check test_constant_propagation --constant-propagation convmodp 1
+check test_constant_propagation --constant-propagation gldi 1
+Scripts/rep-field.sh test_constant_propagation || exit 1
+
+check_loop test_licm "" mulci 2
+check_loop test_licm --licm "mulci .*, 5 " 0
+check_loop test_licm --licm "mulci .*, 7 " 1
+Scripts/rep-field.sh test_licm || exit 1